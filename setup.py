@@ -19,12 +19,17 @@ setup(
     author_email="help@twilio.com",
     url="https://github.com/twilio/twilio-python/",
     keywords=["twilio", "twiml"],
-    python_requires='>=3.6.0',
+    python_requires='>=3.7.0',
     install_requires=[
         "pytz",
         "requests >= 2.0.0",
         "PyJWT >= 2.0.0, < 3.0.0",
     ],
+    extras_require={
+        "async": ["aiohttp >= 3.8.0"],
+        "brotli": ["brotli"],
+        "opentelemetry": ["opentelemetry-api"],
+    },
     packages=find_packages(exclude=['tests', 'tests.*']),
     include_package_data=True,
     classifiers=[
@@ -33,7 +38,6 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
         "Programming Language :: Python",
-        "Programming Language :: Python :: 3.6",
         "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
@@ -1,9 +1,21 @@
+import asyncio
 import unittest
 
-from tests.holodeck import Holodeck
+from tests.holodeck import AsyncHolodeck, Holodeck
 from twilio.rest import Client
 
 
+def run_async(coroutine):
+    """
+    Run a coroutine to completion on a fresh event loop.
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
 class IntegrationTestCase(unittest.TestCase):
     def setUp(self):
         super(IntegrationTestCase, self).setUp()
@@ -13,3 +25,14 @@ class IntegrationTestCase(unittest.TestCase):
         self.client = Client(username=self.account_sid,
                              password=self.auth_token,
                              http_client=self.holodeck)
+
+
+class AsyncIntegrationTestCase(unittest.TestCase):
+    def setUp(self):
+        super(AsyncIntegrationTestCase, self).setUp()
+        self.account_sid = 'AC' + 'a' * 32
+        self.auth_token = 'AUTHTOKEN'
+        self.holodeck = AsyncHolodeck()
+        self.client = Client(username=self.account_sid,
+                             password=self.auth_token,
+                             http_client=self.holodeck)
@@ -1,5 +1,5 @@
 from twilio.base.exceptions import TwilioRestException
-from twilio.http import HttpClient
+from twilio.http import AsyncHttpClient, HttpClient
 from twilio.http.request import Request
 import platform
 from twilio import __version__
@@ -86,3 +86,17 @@ class Holodeck(HttpClient):
 
         raise TwilioRestException(404, url, message, method=method)
 
+
+class AsyncHolodeck(Holodeck, AsyncHttpClient):
+
+    async def request(self,
+                      method,
+                      url,
+                      params=None,
+                      data=None,
+                      headers=None,
+                      auth=None,
+                      timeout=None,
+                      allow_redirects=False):
+        return super(AsyncHolodeck, self).request(
+            method, url, params, data, headers, auth, timeout, allow_redirects)
@@ -0,0 +1,173 @@
+import json
+import time
+import unittest
+from datetime import datetime, timedelta
+
+from mock import Mock
+
+from tests import IntegrationTestCase, AsyncIntegrationTestCase, run_async
+from tests.holodeck import Request
+from twilio.base.deadline import Deadline, current_deadline
+from twilio.base.exceptions import DeadlineExceededException
+from twilio.http.response import Response
+from twilio.rest import Client
+
+ACCOUNTS_URL = 'https://api.twilio.com/2010-04-01/Accounts'
+MESSAGES_URL = ACCOUNTS_URL + '/ACaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa/Messages.json'
+
+
+def expire(deadline):
+    deadline._expires = time.monotonic() - 1
+
+
+class DeadlineTestCase(unittest.TestCase):
+
+    def test_budget(self):
+        deadline = Deadline(5)
+
+        self.assertLessEqual(deadline.remaining(), 5)
+        self.assertFalse(deadline.expired)
+        self.assertEqual(1, deadline.timeout(1))
+        self.assertLessEqual(deadline.timeout(30), 5)
+        self.assertLessEqual(deadline.timeout(), 5)
+        self.assertTrue(deadline.allows(1))
+        self.assertFalse(deadline.allows(10))
+
+    def test_datetime(self):
+        self.assertAlmostEqual(60, Deadline(datetime.now() + timedelta(seconds=60)).remaining(), delta=1)
+
+    def test_no_deadline(self):
+        deadline = Deadline()
+
+        self.assertIsNone(deadline.remaining())
+        self.assertEqual(30, deadline.timeout(30))
+        self.assertTrue(deadline.allows(3600))
+
+    def test_expired(self):
+        deadline = Deadline(5)
+        expire(deadline)
+
+        self.assertTrue(deadline.expired)
+        with self.assertRaises(DeadlineExceededException) as context:
+            deadline.timeout(30)
+        self.assertEqual(5, context.exception.budget)
+        with self.assertRaises(DeadlineExceededException):
+            with deadline:
+                pass
+
+    def test_nested_deadlines_never_extend(self):
+        outer, inner, loose = Deadline(5), Deadline(1), Deadline(60)
+
+        with outer:
+            self.assertIs(outer, current_deadline())
+            with inner:
+                self.assertIs(inner, current_deadline())
+            with loose, Deadline():
+                self.assertIs(outer, current_deadline())
+            self.assertIs(outer, current_deadline())
+        self.assertIsNone(current_deadline())
+
+    def test_run(self):
+        deadline = Deadline(5)
+
+        self.assertIs(deadline, deadline.run(current_deadline))
+        self.assertIsNone(current_deadline())
+
+
+class ClientDeadlineTestCase(unittest.TestCase):
+
+    def test_request_timeout_is_shrunk(self):
+        http_client = Mock(is_async=False)
+        client = Client('username', 'password', http_client=http_client)
+
+        with Deadline(5):
+            client.request('GET', ACCOUNTS_URL + '.json', timeout=30)
+
+        self.assertLessEqual(http_client.request.call_args[1]['timeout'], 5)
+
+    def test_request_after_deadline(self):
+        http_client = Mock(is_async=False)
+        client = Client('username', 'password', http_client=http_client)
+        deadline = Deadline(5)
+
+        with deadline:
+            expire(deadline)
+            with self.assertRaises(DeadlineExceededException):
+                client.request('GET', ACCOUNTS_URL + '.json')
+
+        http_client.request.assert_not_called()
+
+
+class ResourceDeadlineTestCase(IntegrationTestCase):
+
+    def setUp(self):
+        super(ResourceDeadlineTestCase, self).setUp()
+        self.holodeck.mock(Response(200, json.dumps({
+            'accounts': [{'sid': 'AC1'}],
+            'next_page_uri': '/2010-04-01/Accounts.json?Page=1',
+        })), Request(url=ACCOUNTS_URL + '.json'))
+        self.holodeck.mock(Response(200, json.dumps({'accounts': [{'sid': 'AC2'}], 'next_page_uri': None})),
+                           Request(url=ACCOUNTS_URL + '.json?Page=1'))
+
+    def test_list(self):
+        accounts = self.client.api.v2010.accounts.list(deadline=5)
+
+        self.assertEqual(['AC1', 'AC2'], [a.sid for a in accounts])
+        self.assertIsNone(current_deadline())
+
+    def test_stream_stops_at_deadline(self):
+        deadline = Deadline(5)
+        accounts = self.client.api.v2010.accounts.stream(deadline=deadline)
+
+        self.assertEqual('AC1', next(accounts).sid)
+        expire(deadline)
+        with self.assertRaises(DeadlineExceededException):
+            next(accounts)
+        self.assertEqual(1, len(self.holodeck.requests))
+
+    def test_prefetched_pages_use_deadline(self):
+        deadline = Deadline(5)
+        seen = []
+        request = self.holodeck.request
+
+        def record(*args, **kwargs):
+            seen.append(current_deadline())
+            return request(*args, **kwargs)
+
+        self.holodeck.request = record
+
+        self.assertEqual(2, len(self.client.api.v2010.accounts.list(deadline=deadline, prefetch=1)))
+        self.assertEqual([deadline, deadline], seen)
+
+    def test_create(self):
+        self.holodeck.mock(Response(201, json.dumps({'sid': 'SM123'})), Request('POST', MESSAGES_URL))
+        deadline = Deadline(5)
+        expire(deadline)
+
+        with self.assertRaises(DeadlineExceededException):
+            self.client.api.v2010.accounts('ACaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa').messages.create(
+                to='+15558675310', body='Hello', deadline=deadline)
+
+        self.assertEqual('SM123', self.client.api.v2010.accounts('ACaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa').messages.create(
+            to='+15558675310', body='Hello', deadline=5).sid)
+
+
+class AsyncResourceDeadlineTestCase(AsyncIntegrationTestCase):
+
+    def test_list_async_stops_at_deadline(self):
+        self.holodeck.mock(Response(200, json.dumps({
+            'accounts': [{'sid': 'AC1'}],
+            'next_page_uri': '/2010-04-01/Accounts.json?Page=1',
+        })), Request(url=ACCOUNTS_URL + '.json'))
+        deadline = Deadline(5)
+
+        async def go():
+            accounts = await self.client.api.v2010.accounts.stream_async(deadline=deadline)
+            first = await accounts.__anext__()
+            expire(deadline)
+            await accounts.__anext__()
+            return first
+
+        with self.assertRaises(DeadlineExceededException):
+            run_async(go())
+        self.assertEqual(1, len(self.holodeck.requests))
@@ -85,5 +85,46 @@ class IntegerTestCase(unittest.TestCase):
         self.assertEqual(1, deserialize.integer(1))
 
 
+class PropertiesTestCase(unittest.TestCase):
 
+    def setUp(self):
+        self.calls = []
 
+        def integer(i):
+            self.calls.append(i)
+            return deserialize.integer(i)
+
+        self.schema = deserialize.Schema(
+            {'sid': 'sid', 'from_': 'from', 'error_code': 'error_code', 'num_media': 'num_media'},
+            {'error_code': integer, 'num_media': integer},
+        )
+        self.properties = self.schema.load({'sid': 'SM123', 'from': '+1555', 'error_code': '30001'})
+
+    def test_plain_property(self):
+        self.assertEqual('SM123', self.properties['sid'])
+        self.assertEqual('+1555', self.properties['from_'])
+        self.assertEqual([], self.calls)
+
+    def test_deserialized_on_first_access_only(self):
+        self.assertEqual(30001, self.properties['error_code'])
+        self.assertEqual(30001, self.properties['error_code'])
+        self.assertEqual(['30001'], self.calls)
+
+    def test_missing_payload_value(self):
+        self.assertIsNone(self.properties['num_media'])
+
+    def test_unknown_property(self):
+        self.assertRaises(KeyError, lambda: self.properties['unknown'])
+
+    def test_mapping(self):
+        self.assertEqual(
+            {'sid': 'SM123', 'from_': '+1555', 'error_code': 30001, 'num_media': None},
+            dict(self.properties),
+        )
+
+    def test_read_only(self):
+        with self.assertRaises(TypeError):
+            self.properties['sid'] = 'SM456'
+
+        with self.assertRaises(AttributeError):
+            self.properties.extra = True
@@ -0,0 +1,190 @@
+import copy
+import json
+import pickle
+import unittest
+
+from mock import patch
+
+from tests import IntegrationTestCase, AsyncIntegrationTestCase, run_async
+from tests.holodeck import Request
+from twilio.base import values
+from twilio.base.exceptions import TwilioRestException
+from twilio.base.instrumentation import Instrumentation, Span, current_span, record_phase
+from twilio.http.http_client import TimedHTTPSConnection, TimedHTTPSConnectionPool, TwilioHttpClient
+from twilio.http.response import Response
+
+try:
+    import opentelemetry
+except ImportError:
+    opentelemetry = None
+
+ACCOUNTS_URL = 'https://api.twilio.com/2010-04-01/Accounts'
+
+
+class RecordingInstrumentation(Instrumentation):
+
+    def __init__(self):
+        self.started = []
+        self.ended = []
+        self.instances = []
+
+    def on_start(self, span):
+        self.started.append(span)
+
+    def on_end(self, span):
+        self.ended.append(span)
+
+    def on_instances(self, span, count, seconds):
+        self.instances.append((span, count))
+
+
+class SpanTestCase(unittest.TestCase):
+
+    def test_phases(self):
+        instrumentation = RecordingInstrumentation()
+        span = instrumentation.start_span('GET', {'twilio.operation': 'request'})
+
+        with span:
+            self.assertIs(span, current_span())
+            record_phase('read', 0.5)
+            record_phase('read', 0.25)
+        record_phase('read', 1)
+
+        self.assertIsNone(current_span())
+        self.assertEqual({'read': 0.75}, span.phases)
+        self.assertEqual([span], instrumentation.started)
+        self.assertEqual([], instrumentation.ended)
+
+    def test_end_once(self):
+        instrumentation = RecordingInstrumentation()
+        span = instrumentation.start_span('GET')
+
+        span.end(TwilioRestException(404, ACCOUNTS_URL, code=20404))
+        span.end()
+
+        self.assertTrue(span.ended)
+        self.assertEqual([span], instrumentation.ended)
+        self.assertEqual('TwilioRestException', span.attributes['error.type'])
+        self.assertEqual(20404, span.attributes['twilio.error_code'])
+
+    def test_resource_uri(self):
+        uri = values.ResourceUri('/Accounts/{account_sid}/Messages/{sid}.json', {'account_sid': 'AC1', 'sid': 'SM1'})
+
+        self.assertEqual('/Accounts/AC1/Messages/SM1.json', uri)
+        self.assertEqual('/Accounts/{account_sid}/Messages/{sid}.json', uri.template)
+
+        for copied in (copy.deepcopy(uri), pickle.loads(pickle.dumps(uri))):
+            self.assertIsInstance(copied, values.ResourceUri)
+            self.assertEqual(uri, copied)
+            self.assertEqual(uri.template, copied.template)
+
+    def test_timed_connection(self):
+        span = RecordingInstrumentation().start_span('GET')
+
+        with patch('urllib3.connection.HTTPSConnection.connect'):
+            with span:
+                TimedHTTPSConnection('api.twilio.com').connect()
+
+        self.assertIn('connect', span.phases)
+
+    def test_adapter_uses_timed_connections(self):
+        adapter = TwilioHttpClient().session.get_adapter('https://api.twilio.com')
+
+        self.assertIs(TimedHTTPSConnectionPool, adapter.poolmanager.pool_classes_by_scheme['https'])
+
+
+class InstrumentedClientTestCase(IntegrationTestCase):
+
+    def setUp(self):
+        super(InstrumentedClientTestCase, self).setUp()
+        self.instrumentation = self.client.instrumentation = RecordingInstrumentation()
+
+    def test_fetch(self):
+        self.holodeck.mock(Response(200, json.dumps({'sid': 'AC123'}), {'Twilio-Request-Id': 'RQ123'}),
+                           Request(url=ACCOUNTS_URL + '/AC123.json'))
+
+        self.client.api.v2010.accounts('AC123').fetch()
+
+        span, = self.instrumentation.ended
+        self.assertEqual('GET /2010-04-01/Accounts/{sid}.json', span.name)
+        self.assertEqual('fetch', span.attributes['twilio.operation'])
+        self.assertEqual('GET', span.attributes['http.request.method'])
+        self.assertEqual(ACCOUNTS_URL + '/AC123.json', span.attributes['url.full'])
+        self.assertEqual('api.twilio.com', span.attributes['server.address'])
+        self.assertEqual('api', span.attributes['twilio.domain'])
+        self.assertEqual(200, span.attributes['http.response.status_code'])
+        self.assertEqual('RQ123', span.attributes['twilio.request_id'])
+        self.assertEqual({'headers', 'hostname', 'throttle', 'parse'}, set(span.phases))
+        self.assertIsNone(current_span())
+
+    def test_fetch_error(self):
+        self.holodeck.mock(Response(404, json.dumps({'code': 20404, 'message': 'Not found'})),
+                           Request(url=ACCOUNTS_URL + '/AC404.json'))
+
+        with self.assertRaises(TwilioRestException):
+            self.client.api.v2010.accounts('AC404').fetch()
+
+        span, = self.instrumentation.ended
+        self.assertIsInstance(span.error, TwilioRestException)
+        self.assertEqual(20404, span.attributes['twilio.error_code'])
+
+    def test_pages(self):
+        self.holodeck.mock(Response(200, json.dumps({
+            'accounts': [{'sid': 'AC1'}, {'sid': 'AC2'}],
+            'next_page_uri': '/2010-04-01/Accounts.json?Page=1',
+        })), Request(url=ACCOUNTS_URL + '.json'))
+        self.holodeck.mock(Response(200, json.dumps({'accounts': [{'sid': 'AC3'}], 'next_page_uri': None})),
+                           Request(url=ACCOUNTS_URL + '.json?Page=1'))
+
+        self.assertEqual(['AC1', 'AC2', 'AC3'], [a.sid for a in self.client.api.v2010.accounts.list()])
+
+        first, second = self.instrumentation.ended
+        self.assertEqual('GET /2010-04-01/Accounts.json', first.name)
+        self.assertEqual('GET /2010-04-01/Accounts.json', second.name)
+        self.assertIn('parse', second.phases)
+        self.assertEqual([(first, 2), (second, 1)], self.instrumentation.instances)
+
+    def test_request(self):
+        self.holodeck.mock(Response(204, ''), Request(url=ACCOUNTS_URL + '.json'))
+
+        self.client.request('DELETE', ACCOUNTS_URL + '.json')
+
+        span, = self.instrumentation.ended
+        self.assertEqual('DELETE', span.name)
+        self.assertEqual('request', span.attributes['twilio.operation'])
+        self.assertEqual(204, span.attributes['http.response.status_code'])
+
+    def test_not_instrumented(self):
+        self.client.instrumentation = None
+        self.holodeck.mock(Response(200, json.dumps({'sid': 'AC123'})), Request(url=ACCOUNTS_URL + '/AC123.json'))
+
+        self.client.api.v2010.accounts('AC123').fetch()
+
+        self.assertEqual([], self.instrumentation.started)
+
+
+class InstrumentedAsyncClientTestCase(AsyncIntegrationTestCase):
+
+    def test_fetch_async(self):
+        instrumentation = self.client.instrumentation = RecordingInstrumentation()
+        self.holodeck.mock(Response(200, json.dumps({'sid': 'AC123'})), Request(url=ACCOUNTS_URL + '/AC123.json'))
+
+        run_async(self.client.api.v2010.accounts('AC123').fetch_async())
+
+        span, = instrumentation.ended
+        self.assertEqual('GET /2010-04-01/Accounts/{sid}.json', span.name)
+        self.assertIn('parse', span.phases)
+
+
+@unittest.skipIf(opentelemetry is None, 'opentelemetry is not installed')
+class OpenTelemetryInstrumentationTestCase(unittest.TestCase):
+
+    def test_on_end(self):
+        from twilio.base.instrumentation import OpenTelemetryInstrumentation
+        instrumentation = OpenTelemetryInstrumentation()
+        span = instrumentation.start_span('GET /v1/Services', {'http.request.method': 'GET'})
+        span.add_phase('ttfb', 0.1)
+
+        span.end()
+
+        self.assertIsInstance(span, Span)
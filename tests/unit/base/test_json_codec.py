@@ -0,0 +1,107 @@
+import unittest
+
+from tests import IntegrationTestCase
+from tests.holodeck import Request
+from twilio.base import json_codec, serialize
+from twilio.base.exceptions import TwilioRestException
+from twilio.http.response import Response
+from twilio.rest import Client
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class CountingCodec(json_codec.JSONCodec):
+    def __init__(self):
+        self.loaded = []
+        self.dumped = []
+
+    def loads(self, data):
+        self.loaded.append(data)
+        return super(CountingCodec, self).loads(data)
+
+    def dumps(self, obj):
+        self.dumped.append(obj)
+        return super(CountingCodec, self).dumps(obj)
+
+
+class CodecTestCase(unittest.TestCase):
+
+    def assert_round_trip(self, codec):
+        document = {'sid': 'SM123', 'unicode': 'Ω≈ç√', 'nested': [1, 2.5, None, True]}
+
+        self.assertEqual(document, codec.loads(codec.dumps(document)))
+        self.assertEqual(document, codec.loads(codec.dumps(document).encode('utf-8')))
+        self.assertIsInstance(codec.dumps(document), str)
+
+    def test_stdlib(self):
+        self.assert_round_trip(json_codec.JSONCodec())
+
+    @unittest.skipIf(orjson is None, 'orjson is not installed')
+    def test_orjson(self):
+        self.assert_round_trip(json_codec.OrjsonCodec())
+
+    @unittest.skipIf(orjson is None, 'orjson is not installed')
+    def test_fastest(self):
+        self.assertEqual('orjson', json_codec.fastest().name)
+
+    def test_default_is_stdlib(self):
+        self.assertEqual('json', json_codec.get_default().name)
+
+
+class DefaultCodecTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.codec = CountingCodec()
+        json_codec.set_default(self.codec)
+
+    def tearDown(self):
+        json_codec.set_default(None)
+
+    def test_serialize_object(self):
+        self.assertEqual('{"a": 1}', serialize.object({'a': 1}))
+        self.assertEqual([{'a': 1}], self.codec.dumped)
+
+    def test_restore_default(self):
+        json_codec.set_default(None)
+
+        self.assertEqual('json', json_codec.get_default().name)
+
+
+class ClientCodecTestCase(IntegrationTestCase):
+
+    def setUp(self):
+        super(ClientCodecTestCase, self).setUp()
+        self.codec = CountingCodec()
+        self.client = Client(username=self.account_sid, password=self.auth_token,
+                             http_client=self.holodeck, json_codec=self.codec)
+
+    def test_fetch(self):
+        self.holodeck.mock(Response(200, '{"sid": "SM123"}'),
+                           Request(url='https://api.twilio.com/2010-04-01/Accounts/AC123/Messages/SM123.json'))
+
+        message = self.client.api.v2010.accounts('AC123').messages('SM123').fetch()
+
+        self.assertEqual('SM123', message.sid)
+        self.assertEqual(['{"sid": "SM123"}'], self.codec.loaded)
+
+    def test_page(self):
+        self.holodeck.mock(Response(200, '{"next_page_uri": null, "messages": [{"sid": "SM123"}]}'),
+                           Request(url='https://api.twilio.com/2010-04-01/Accounts/AC123/Messages.json'))
+
+        messages = self.client.api.v2010.accounts('AC123').messages.list()
+
+        self.assertEqual(['SM123'], [m.sid for m in messages])
+        self.assertEqual(1, len(self.codec.loaded))
+
+    def test_exception(self):
+        self.holodeck.mock(Response(404, '{"code": 20404, "message": "Not found"}'),
+                           Request(url='https://api.twilio.com/2010-04-01/Accounts/AC123/Messages/SM123.json'))
+
+        with self.assertRaises(TwilioRestException) as context:
+            self.client.api.v2010.accounts('AC123').messages('SM123').fetch()
+
+        self.assertEqual(20404, context.exception.code)
+        self.assertEqual(1, len(self.codec.loaded))
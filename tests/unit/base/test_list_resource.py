@@ -0,0 +1,120 @@
+import json
+from datetime import datetime
+
+import pytz
+
+from tests import IntegrationTestCase
+from tests.holodeck import Request
+from twilio.base.exceptions import TwilioRestException
+from twilio.http.response import Response
+
+MESSAGES_URL = 'https://api.twilio.com/2010-04-01/Accounts/AC123/Messages.json'
+
+
+def message(sid, date_sent):
+    return {'sid': sid, 'date_sent': date_sent}
+
+
+class StreamShardedTestCase(IntegrationTestCase):
+    def setUp(self):
+        super(StreamShardedTestCase, self).setUp()
+        self.messages = self.client.api.v2010.accounts('AC123').messages
+        self.after = datetime(2020, 1, 1, tzinfo=pytz.utc)
+        self.before = datetime(2020, 1, 3, tzinfo=pytz.utc)
+
+    def mock_shard(self, after, before, records, to=None):
+        params = {'DateSent>': after, 'DateSent<': before, 'PageSize': 50}
+        if to:
+            params['To'] = to
+        self.holodeck.mock(Response(200, json.dumps({
+            'next_page_uri': None,
+            'messages': records,
+        })), Request(url=MESSAGES_URL, params=params))
+
+    def mock_shards(self, to=None):
+        self.mock_shard('2020-01-01T00:00:00Z', '2020-01-02T00:00:00Z', [
+            message('SM3', 'Wed, 01 Jan 2020 20:00:00 +0000'),
+            message('SM1', 'Wed, 01 Jan 2020 08:00:00 +0000'),
+        ], to)
+        self.mock_shard('2020-01-02T00:00:00Z', '2020-01-03T00:00:00Z', [
+            message('SM4', 'Thu, 02 Jan 2020 20:00:00 +0000'),
+            message('SM2', 'Thu, 02 Jan 2020 00:00:00 +0000'),
+        ], to)
+
+    def test_stream_sharded_ordered(self):
+        # The record stamped on the shared boundary is returned by both shards
+        self.mock_shard('2020-01-01T00:00:00Z', '2020-01-02T00:00:00Z', [
+            message('SM2', 'Thu, 02 Jan 2020 00:00:00 +0000'),
+            message('SM3', 'Wed, 01 Jan 2020 20:00:00 +0000'),
+            message('SM1', 'Wed, 01 Jan 2020 08:00:00 +0000'),
+        ])
+        self.mock_shard('2020-01-02T00:00:00Z', '2020-01-03T00:00:00Z', [
+            message('SM4', 'Thu, 02 Jan 2020 20:00:00 +0000'),
+            message('SM2', 'Thu, 02 Jan 2020 00:00:00 +0000'),
+        ])
+
+        records = self.messages.list_sharded(shards=2, page_size=50, ordered=True,
+                                             date_sent_after=self.after, date_sent_before=self.before)
+
+        self.assertEqual(['SM4', 'SM2', 'SM3', 'SM1'], [r.sid for r in records])
+
+    def test_stream_sharded_unordered(self):
+        self.mock_shards(to='+15555555555')
+
+        records = self.messages.list_sharded(shards=2, page_size=50, to='+15555555555',
+                                             date_sent_after=self.after, date_sent_before=self.before)
+
+        self.assertEqual({'SM1', 'SM2', 'SM3', 'SM4'}, {r.sid for r in records})
+        self.assertEqual(2, len(self.holodeck.requests))
+
+    def test_stream_sharded_naive_window(self):
+        self.mock_shards()
+        after, before = datetime(2020, 1, 1), datetime(2020, 1, 3)
+
+        records = self.messages.list_sharded(shards=2, page_size=50, ordered=True,
+                                             date_sent_after=after, date_sent_before=before)
+        self.assertEqual(['SM4', 'SM2', 'SM3', 'SM1'], [r.sid for r in records])
+
+        records = self.messages.list_sharded(shards=2, page_size=50, date_sent_after=after,
+                                             date_sent_before=self.before)
+        self.assertEqual({'SM1', 'SM2', 'SM3', 'SM4'}, {r.sid for r in records})
+
+    def test_stream_sharded_raw(self):
+        self.mock_shard('2020-01-01T00:00:00Z', '2020-01-02T00:00:00Z', [
+            message('SM2', 'Thu, 02 Jan 2020 00:00:00 +0000'),
+            message('SM1', 'Wed, 01 Jan 2020 08:00:00 +0000'),
+        ])
+        self.mock_shard('2020-01-02T00:00:00Z', '2020-01-03T00:00:00Z', [
+            message('SM3', 'Thu, 02 Jan 2020 20:00:00 +0000'),
+            message('SM2', 'Thu, 02 Jan 2020 00:00:00 +0000'),
+        ])
+
+        records = self.messages.list_sharded(shards=2, page_size=50, ordered=True, raw=True,
+                                             date_sent_after=self.after, date_sent_before=self.before)
+
+        self.assertEqual(['SM3', 'SM2', 'SM1'], [r['sid'] for r in records])
+
+    def test_stream_sharded_limit(self):
+        self.mock_shards()
+
+        records = self.messages.list_sharded(shards=2, limit=3, page_size=50, ordered=True,
+                                             date_sent_after=self.after, date_sent_before=self.before)
+
+        self.assertEqual(['SM4', 'SM2', 'SM3'], [r.sid for r in records])
+
+    def test_stream_sharded_error(self):
+        self.mock_shard('2020-01-01T00:00:00Z', '2020-01-02T00:00:00Z', [])
+
+        with self.assertRaises(TwilioRestException):
+            self.messages.list_sharded(shards=2, page_size=50,
+                                       date_sent_after=self.after, date_sent_before=self.before)
+
+    def test_stream_sharded_requires_window(self):
+        with self.assertRaises(ValueError):
+            self.messages.list_sharded(shards=2, date_sent_after=self.after)
+
+        with self.assertRaises(ValueError):
+            self.messages.list_sharded(shards=2, date_sent_after='2020-01-01', date_sent_before='2020-01-03')
+
+        with self.assertRaises(ValueError):
+            self.messages.list_sharded(shards=2, date_sent_after=self.before, date_sent_before=self.after)
@@ -0,0 +1,166 @@
+import json
+import threading
+import unittest
+
+from mock import Mock
+
+from tests import IntegrationTestCase
+from tests.holodeck import Request
+from twilio.base.exceptions import TwilioRestException
+from twilio.base.instrumentation import CompositeInstrumentation, Instrumentation, Span
+from twilio.base.metrics import MetricsRegistry, to_prometheus
+from twilio.base.response_cache import CacheRule, ResponseCache
+from twilio.http.response import Response
+
+ACCOUNTS_URL = 'https://api.twilio.com/2010-04-01/Accounts'
+MESSAGES_TEMPLATE = '/2010-04-01/Accounts/{account_sid}/Messages.json'
+
+
+def record(registry, duration, status=200, template=MESSAGES_TEMPLATE, error=None, retries=None):
+    attributes = {'twilio.domain': 'api', 'url.template': template, 'http.request.method': 'GET',
+                  'http.response.status_code': status}
+    if retries is not None:
+        attributes['http.request.resend_count'] = retries
+    span = Span(registry, 'GET ' + template, attributes)
+    span._started -= duration
+    span.end(error)
+
+
+class MetricsRegistryTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = MetricsRegistry(buckets=(1.0, 0.1))
+
+    def test_snapshot(self):
+        record(self.registry, 0.05)
+        record(self.registry, 0.5, retries=2)
+        record(self.registry, 5, status=404, error=TwilioRestException(404, ACCOUNTS_URL, code=20404))
+
+        series, = self.registry.snapshot()
+
+        self.assertEqual('api', series['domain'])
+        self.assertEqual(MESSAGES_TEMPLATE, series['resource'])
+        self.assertEqual('GET', series['method'])
+        self.assertEqual(3, series['count'])
+        self.assertEqual({200: 2, 404: 1}, series['statuses'])
+        self.assertEqual({20404: 1}, series['errors'])
+        self.assertEqual(2, series['retries'])
+        self.assertEqual([(0.1, 1), (1.0, 2), (float('inf'), 3)], series['buckets'])
+
+    def test_errors_without_code(self):
+        record(self.registry, 0.01, status=500)
+        record(self.registry, 0.01, status=None, error=ValueError())
+
+        series, = self.registry.snapshot()
+
+        self.assertEqual({500: 1, 'ValueError': 1}, series['errors'])
+
+    def test_series_by_resource(self):
+        record(self.registry, 0.01)
+        record(self.registry, 0.01, template='/2010-04-01/Accounts/{sid}.json')
+
+        self.assertEqual([MESSAGES_TEMPLATE, '/2010-04-01/Accounts/{sid}.json'],
+                         [s['resource'] for s in self.registry.snapshot()])
+
+        self.registry.reset()
+        self.assertEqual([], self.registry.snapshot())
+
+    def test_concurrent_recording(self):
+        def worker():
+            for _ in range(500):
+                record(self.registry, 0.01)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(4000, sum(s['count'] for s in self.registry.snapshot()))
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            MetricsRegistry(buckets=())
+        with self.assertRaises(ValueError):
+            MetricsRegistry(stripes=0)
+
+    def test_to_prometheus(self):
+        record(self.registry, 0.05, retries=1)
+        record(self.registry, 0.05, status=404, error=TwilioRestException(404, ACCOUNTS_URL, code=20404),
+               template='/v1/Services/{sid}"')
+
+        lines = to_prometheus(self.registry).splitlines()
+
+        labels = 'domain="api",resource="{}",method="GET"'.format(MESSAGES_TEMPLATE)
+        self.assertIn('# TYPE twilio_requests_total counter', lines)
+        self.assertIn('twilio_requests_total{' + labels + ',status="200"} 1', lines)
+        self.assertIn('twilio_errors_total{domain="api",resource="/v1/Services/{sid}\\"",method="GET",'
+                      'code="20404"} 1', lines)
+        self.assertIn('twilio_retries_total{' + labels + '} 1', lines)
+        self.assertIn('# TYPE twilio_request_duration_seconds histogram', lines)
+        self.assertIn('twilio_request_duration_seconds_bucket{' + labels + ',le="0.1"} 1', lines)
+        self.assertIn('twilio_request_duration_seconds_bucket{' + labels + ',le="+Inf"} 1', lines)
+        self.assertIn('twilio_request_duration_seconds_count{' + labels + '} 1', lines)
+
+
+class CompositeInstrumentationTestCase(unittest.TestCase):
+
+    def test_reports_to_every_instrumentation(self):
+        ended = []
+
+        class Recording(Instrumentation):
+            def on_end(self, span):
+                ended.append(span)
+
+        registry = MetricsRegistry()
+        span = CompositeInstrumentation(registry, Recording()).start_span('GET', {'twilio.domain': 'api'})
+        span.end()
+
+        self.assertEqual([span], ended)
+        self.assertEqual(1, registry.snapshot()[0]['count'])
+
+
+class ClientMetricsTestCase(IntegrationTestCase):
+
+    def test_fetch(self):
+        registry = self.client.instrumentation = MetricsRegistry()
+        self.holodeck.mock(Response(200, json.dumps({'sid': 'AC123'})), Request(url=ACCOUNTS_URL + '/AC123.json'))
+        self.holodeck.mock(Response(404, json.dumps({'code': 20404, 'message': 'Not found'})),
+                           Request(url=ACCOUNTS_URL + '/AC404.json'))
+
+        self.client.api.v2010.accounts('AC123').fetch()
+        with self.assertRaises(TwilioRestException):
+            self.client.api.v2010.accounts('AC404').fetch()
+
+        series, = registry.snapshot()
+        self.assertEqual('api', series['domain'])
+        self.assertEqual('/2010-04-01/Accounts/{sid}.json', series['resource'])
+        self.assertEqual(2, series['count'])
+        self.assertEqual({200: 1, 404: 1}, series['statuses'])
+        self.assertEqual({20404: 1}, series['errors'])
+
+    def test_cached_fetch(self):
+        registry = self.client.instrumentation = MetricsRegistry()
+        self.client.response_cache = ResponseCache([CacheRule(60)])
+        self.holodeck.mock(Response(200, json.dumps({'sid': 'AC123'})), Request(url=ACCOUNTS_URL + '/AC123.json'))
+
+        for _ in range(3):
+            self.client.api.v2010.accounts('AC123').fetch()
+
+        series, = registry.snapshot()
+        self.assertEqual(('api', 'GET'), (series['domain'], series['method']))
+        self.assertEqual(3, series['count'])
+        self.assertEqual({200: 1, 'cached': 2}, series['statuses'])
+
+    def test_failed_without_response(self):
+        registry = self.client.instrumentation = MetricsRegistry()
+        self.holodeck.request = Mock(side_effect=IOError('reset'))
+
+        with self.assertRaises(IOError):
+            self.client.api.v2010.accounts('AC123').fetch()
+
+        series, = registry.snapshot()
+        self.assertEqual({'error': 1}, series['statuses'])
+        self.assertEqual({'OSError': 1}, series['errors'])
+        self.assertIn('twilio_requests_total{domain="api",resource="/2010-04-01/Accounts/{sid}.json",'
+                      'method="GET",status="error"} 1', to_prometheus(registry).splitlines())
@@ -0,0 +1,104 @@
+import json
+import unittest
+
+from tests import IntegrationTestCase
+from tests.holodeck import Request
+from twilio.base import json_codec
+from twilio.base.page import Page
+from twilio.base.page_parser import LazyRecords, parse_page
+from twilio.http.response import Response
+
+MESSAGES_URL = 'https://api.twilio.com/2010-04-01/Accounts/AC123/Messages.json'
+
+
+class StreamedPage(Page):
+    STREAM_THRESHOLD = 0
+
+    def __init__(self, version, response, *_args, **_kwargs):
+        super(StreamedPage, self).__init__(version, response)
+
+    def get_instance(self, payload):
+        return payload
+
+
+class ParsePageTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.codec = json_codec.JSONCodec()
+
+    def test_records_are_lazy(self):
+        payload = parse_page('{"messages": [{"sid": "SM1"}, {"sid": "SM2"}], "page": 0}', self.codec)
+
+        self.assertIsInstance(payload['messages'], LazyRecords)
+        self.assertEqual(2, len(payload['messages']))
+        self.assertEqual([{'sid': 'SM1'}, {'sid': 'SM2'}], list(payload['messages']))
+        self.assertEqual(0, payload['page'])
+
+    def test_metadata_after_records(self):
+        body = {
+            'services': [{'sid': 'IS1', 'links': {'a': '/b'}, 'tags': [[1], {}]}],
+            'meta': {'key': 'services', 'next_page_url': None, 'page_size': 1},
+        }
+
+        payload = parse_page(json.dumps(body).encode('utf-8'), self.codec)
+
+        self.assertEqual(body['meta'], payload['meta'])
+        self.assertEqual(body['services'], list(payload['services']))
+
+    def test_strings_with_json_syntax(self):
+        body = {
+            'messages': [{'body': 'a "quoted" [x], {y}: z \\', 'to': 'Ω 💩'}, {'body': ']}'}],
+            'next_page_uri': '/Messages.json?Page=1&To=[x]',
+        }
+
+        for encoded in (json.dumps(body), json.dumps(body, ensure_ascii=False).encode('utf-8')):
+            payload = parse_page(encoded, self.codec)
+
+            self.assertEqual(body['messages'], list(payload['messages']))
+            self.assertEqual(body['next_page_uri'], payload['next_page_uri'])
+
+    def test_empty_records(self):
+        payload = parse_page('{"messages": [ ], "end": -1}', self.codec)
+
+        self.assertEqual([], list(payload['messages']))
+        self.assertEqual(-1, payload['end'])
+
+    def test_malformed(self):
+        with self.assertRaises(ValueError):
+            parse_page('{"messages": [{"sid": "SM1"}', self.codec)
+
+        with self.assertRaises(ValueError):
+            parse_page('not json', self.codec)
+
+
+class StreamedPageTestCase(IntegrationTestCase):
+
+    def setUp(self):
+        super(StreamedPageTestCase, self).setUp()
+
+        self.holodeck.mock(Response(200, json.dumps({
+            'messages': [{'body': 'payload0'}, {'body': 'payload1'}],
+            'next_page_uri': '/2010-04-01/Accounts/AC123/Messages.json?Page=1',
+        }).encode('utf-8'), encoding='utf-8'), Request(url=MESSAGES_URL))
+        self.holodeck.mock(Response(200, json.dumps({
+            'messages': [{'body': 'payload2'}],
+            'next_page_uri': None,
+        }).encode('utf-8'), encoding='utf-8'), Request(url=MESSAGES_URL + '?Page=1'))
+
+        self.version = self.client.api.v2010
+        self.page = StreamedPage(self.version, self.version.page(method='GET', uri='/Accounts/AC123/Messages.json'))
+
+    def test_page_keeps_only_metadata(self):
+        self.assertEqual(['next_page_uri'], list(self.page._payload))
+        self.assertEqual(MESSAGES_URL + '?Page=1', self.page.next_page_url)
+
+    def test_stream(self):
+        messages = list(self.version.stream(self.page))
+
+        self.assertEqual(['payload0', 'payload1', 'payload2'], [m['body'] for m in messages])
+
+    def test_streaming_is_opt_in(self):
+        response = Response(200, json.dumps({'messages': [{'body': 'x' * 1024}] * 512, 'next_page_uri': None}))
+
+        self.assertIsNone(Page.STREAM_THRESHOLD)
+        self.assertIsInstance(Page.process_response(response)['messages'], list)
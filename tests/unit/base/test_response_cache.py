@@ -0,0 +1,232 @@
+import json
+import pickle
+import unittest
+
+from mock import Mock
+
+from tests import IntegrationTestCase, AsyncIntegrationTestCase, run_async
+from tests.holodeck import Request
+from twilio.base.response_cache import CacheEntry, CacheRule, LRUCacheBackend, ResponseCache
+from twilio.http.response import Response
+
+COUNTRIES_URL = 'https://pricing.twilio.com/v2/Voice/Countries'
+SERVICE_URL = 'https://messaging.twilio.com/v1/Services/MG123'
+
+
+class CacheRuleTestCase(unittest.TestCase):
+
+    def test_matches(self):
+        rule = CacheRule(60, domain='pricing', path='/Voice/Countries*')
+
+        self.assertTrue(rule.matches('pricing', '/v2/Voice/Countries'))
+        self.assertTrue(rule.matches('pricing', '/v2/Voice/Countries/US'))
+        self.assertFalse(rule.matches('pricing', '/v2/Voice/Numbers/+15017122661'))
+        self.assertFalse(rule.matches('api', '/v2/Voice/Countries'))
+        self.assertTrue(CacheRule(60).matches('api', '/2010-04-01/Accounts.json'))
+
+    def test_invalid_ttl(self):
+        with self.assertRaises(ValueError):
+            CacheRule(0)
+
+
+class LRUCacheBackendTestCase(unittest.TestCase):
+
+    def test_evicts_least_recently_used(self):
+        backend = LRUCacheBackend(max_entries=2)
+        backend.set('a', 1)
+        backend.set('b', 2)
+        backend.get('a')
+        backend.set('c', 3)
+
+        self.assertEqual(2, len(backend))
+        self.assertEqual(1, backend.get('a'))
+        self.assertIsNone(backend.get('b'))
+
+        backend.delete('a')
+        self.assertIsNone(backend.get('a'))
+
+    def test_entries_can_be_pickled(self):
+        entry = CacheEntry(200, b'{}', {'ETag': '"1"'}, 'utf-8', 10.0, '"1"')
+
+        response = pickle.loads(pickle.dumps(entry)).to_response()
+
+        self.assertEqual(b'{}', response.body)
+        self.assertTrue(response.cached)
+
+
+class ResponseCacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = ResponseCache([CacheRule(60, domain='pricing')])
+        self.send = Mock(return_value=Response(200, '{"countries": []}', {'ETag': '"v1"'}))
+
+    def request(self, method='GET', url=COUNTRIES_URL, params=None, account='AC123'):
+        return self.cache.request(self.send, method, url, params, None, account)
+
+    def expire(self):
+        for entry in self.cache.backend._entries.values():
+            if isinstance(entry, CacheEntry):
+                entry.expires = 0
+
+    def test_fresh_response_is_served_from_cache(self):
+        first = self.request()
+        second = self.request()
+
+        self.assertFalse(first.cached)
+        self.assertTrue(second.cached)
+        self.assertEqual(first.text, second.text)
+        self.assertEqual(1, self.send.call_count)
+        self.assertEqual({'hits': 1, 'misses': 1, 'revalidations': 0}, self.cache.stats())
+
+    def test_stale_response_is_revalidated(self):
+        self.request()
+        self.expire()
+        self.send.return_value = Response(304, '')
+
+        response = self.request()
+
+        self.send.assert_called_with({'If-None-Match': '"v1"'})
+        self.assertEqual(200, response.status_code)
+        self.assertEqual('{"countries": []}', response.text)
+        self.assertEqual(1, self.cache.stats()['revalidations'])
+        self.assertTrue(self.request().cached)
+
+    def test_stale_response_is_replaced(self):
+        self.request()
+        self.expire()
+        self.send.return_value = Response(200, '{"countries": [{}]}', {'Last-Modified': 'Tue, 01 Jun 2021 00:00:00 GMT'})
+
+        self.assertEqual('{"countries": [{}]}', self.request().text)
+        self.expire()
+        self.request()
+        self.send.assert_called_with({'If-Modified-Since': 'Tue, 01 Jun 2021 00:00:00 GMT'})
+
+    def test_keys(self):
+        self.request(params={'PageSize': 50})
+        self.request(params={'PageSize': 20})
+        self.request(account='AC456')
+        self.request(params={'PageSize': 50})
+
+        self.assertEqual(3, self.send.call_count)
+
+    def test_errors_are_not_cached(self):
+        self.send.return_value = Response(500, '{}')
+
+        self.request()
+        self.request()
+
+        self.assertEqual(2, self.send.call_count)
+
+    def test_uncached_resources(self):
+        self.request(url='https://api.twilio.com/2010-04-01/Accounts/AC123.json')
+        self.request(url='https://api.twilio.com/2010-04-01/Accounts/AC123.json')
+
+        self.send.assert_called_with(None)
+        self.assertEqual(2, self.send.call_count)
+        self.assertEqual({'hits': 0, 'misses': 0, 'revalidations': 0}, self.cache.stats())
+
+    def test_other_methods_evict(self):
+        self.request()
+        self.request(method='POST')
+        self.request()
+
+        self.assertEqual(3, self.send.call_count)
+
+    def test_other_methods_evict_every_query(self):
+        self.request(params={'PageSize': 50})
+        self.request(params={'PageSize': 20})
+        self.request(method='POST')
+        self.request(params={'PageSize': 50})
+        self.request(params={'PageSize': 20})
+
+        self.assertEqual(5, self.send.call_count)
+        self.assertEqual(0, self.cache.stats()['hits'])
+
+    def test_entries_missing_from_index_are_not_served(self):
+        self.request(params={'PageSize': 50})
+        self.cache.backend.delete('AC123 ' + COUNTRIES_URL)
+
+        self.assertFalse(self.request(params={'PageSize': 50}).cached)
+        self.assertTrue(self.request(params={'PageSize': 50}).cached)
+
+    def test_request_async(self):
+        async def send(headers):
+            return self.send(headers)
+
+        async def go():
+            await self.cache.request_async(send, 'GET', COUNTRIES_URL)
+            return await self.cache.request_async(send, 'GET', COUNTRIES_URL)
+
+        self.assertTrue(run_async(go()).cached)
+        self.assertEqual(1, self.send.call_count)
+
+
+class VersionResponseCacheTestCase(IntegrationTestCase):
+
+    def setUp(self):
+        super(VersionResponseCacheTestCase, self).setUp()
+        self.client.response_cache = ResponseCache([CacheRule(300, domain='messaging', path='/Services/*')])
+        self.holodeck.mock(Response(200, json.dumps({'sid': 'MG123', 'friendly_name': 'a'}), {'ETag': '"1"'}),
+                           Request(url=SERVICE_URL))
+
+    def test_fetch_is_cached(self):
+        first = self.client.messaging.v1.services('MG123').fetch()
+        second = self.client.messaging.v1.services('MG123').fetch()
+
+        self.assertEqual('a', first.friendly_name)
+        self.assertEqual('a', second.friendly_name)
+        self.assertEqual(1, len(self.holodeck.requests))
+
+    def test_fetch_is_revalidated(self):
+        self.client.messaging.v1.services('MG123').fetch()
+        for entry in self.client.response_cache.backend._entries.values():
+            if isinstance(entry, CacheEntry):
+                entry.expires = 0
+        self.holodeck._holograms = []
+        self.holodeck.mock(Response(304, ''), Request(url=SERVICE_URL))
+
+        self.assertEqual('a', self.client.messaging.v1.services('MG123').fetch().friendly_name)
+        self.assertEqual('"1"', self.holodeck.requests[-1].headers['If-None-Match'])
+
+    def test_update_evicts(self):
+        self.holodeck.mock(Response(200, json.dumps({'sid': 'MG123', 'friendly_name': 'b'})),
+                           Request('POST', SERVICE_URL))
+
+        self.client.messaging.v1.services('MG123').fetch()
+        self.client.messaging.v1.services('MG123').update(friendly_name='b')
+        self.client.messaging.v1.services('MG123').fetch()
+
+        self.assertEqual(3, len(self.holodeck.requests))
+
+    def test_next_pages_are_cached(self):
+        self.client.response_cache = ResponseCache([CacheRule(300, domain='pricing')])
+        self.holodeck.mock(Response(200, json.dumps({
+            'countries': [{'country': 'Andorra'}],
+            'meta': {'key': 'countries', 'next_page_url': COUNTRIES_URL + '?Page=1'},
+        })), Request(url=COUNTRIES_URL))
+        self.holodeck.mock(Response(200, json.dumps({
+            'countries': [{'country': 'Belgium'}],
+            'meta': {'key': 'countries', 'next_page_url': None},
+        })), Request(url=COUNTRIES_URL + '?Page=1'))
+
+        for _ in range(2):
+            countries = self.client.pricing.v2.voice.countries.list()
+            self.assertEqual(['Andorra', 'Belgium'], [c.country for c in countries])
+
+        self.assertEqual(2, len(self.holodeck.requests))
+        self.assertEqual({'hits': 2, 'misses': 2, 'revalidations': 0}, self.client.response_cache.stats())
+
+
+class AsyncVersionResponseCacheTestCase(AsyncIntegrationTestCase):
+
+    def test_fetch_async_is_cached(self):
+        self.client.response_cache = ResponseCache([CacheRule(300, domain='messaging')])
+        self.holodeck.mock(Response(200, json.dumps({'sid': 'MG123'})), Request(url=SERVICE_URL))
+        service = self.client.messaging.v1.services('MG123')
+
+        async def go():
+            await service.fetch_async()
+            return await service.fetch_async()
+
+        self.assertEqual('MG123', run_async(go()).sid)
+        self.assertEqual(1, len(self.holodeck.requests))
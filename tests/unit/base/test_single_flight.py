@@ -0,0 +1,185 @@
+import asyncio
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+
+from tests import IntegrationTestCase, AsyncIntegrationTestCase, run_async
+from tests.holodeck import Request
+from twilio.base.deadline import Deadline
+from twilio.base.exceptions import DeadlineExceededException, TwilioRestException
+from twilio.base.single_flight import SingleFlight
+from twilio.http.response import Response
+
+ACCOUNT_URL = 'https://api.twilio.com/2010-04-01/Accounts/AC123.json'
+
+
+class SingleFlightTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.single_flight = SingleFlight()
+        self.release = Event()
+        self.calls = []
+
+    def fetch(self, result):
+        def fetch():
+            self.calls.append(result)
+            self.release.wait(5)
+            if isinstance(result, Exception):
+                raise result
+            return result
+        return fetch
+
+    def run_concurrently(self, fetches):
+        with ThreadPoolExecutor(max_workers=len(fetches)) as executor:
+            futures = [executor.submit(self.single_flight.do, key, fetch) for key, fetch in fetches]
+            time.sleep(0.1)
+            self.release.set()
+        return futures
+
+    def test_identical_fetches_are_coalesced(self):
+        futures = self.run_concurrently([('a', self.fetch({'sid': 'AC123'}))] * 5)
+
+        self.assertEqual(1, len(self.calls))
+        results = [future.result() for future in futures]
+        self.assertEqual([{'sid': 'AC123'}] * 5, results)
+        self.assertTrue(all(result is results[0] for result in results))
+
+    def test_different_keys_are_not_coalesced(self):
+        futures = self.run_concurrently([('a', self.fetch('a')), ('b', self.fetch('b'))])
+
+        self.assertEqual(['a', 'b'], [future.result() for future in futures])
+        self.assertEqual(2, len(self.calls))
+
+    def test_errors_are_shared(self):
+        error = ValueError('boom')
+        futures = self.run_concurrently([('a', self.fetch(error))] * 3)
+
+        self.assertEqual(1, len(self.calls))
+        for future in futures:
+            self.assertIs(error, future.exception())
+
+    def test_waiting_stops_at_deadline(self):
+        def follow():
+            with Deadline(0.05):
+                return self.single_flight.do('a', self.fetch('follower'))
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(self.single_flight.do, 'a', self.fetch('leader'))
+            time.sleep(0.01)
+            with self.assertRaises(DeadlineExceededException):
+                executor.submit(follow).result(5)
+            self.release.set()
+
+        self.assertEqual('leader', leader.result())
+        self.assertEqual(['leader'], self.calls)
+
+    def test_completed_fetches_are_not_kept(self):
+        self.release.set()
+
+        self.assertEqual(1, self.single_flight.do('a', self.fetch(1)))
+        self.assertEqual(2, self.single_flight.do('a', self.fetch(2)))
+        self.assertEqual({}, self.single_flight._calls)
+
+    def test_do_async(self):
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {'sid': 'AC123'}
+
+        async def go():
+            waiter = asyncio.ensure_future(self.single_flight.do_async('a', fetch))
+            await asyncio.sleep(0)
+            waiter.cancel()
+            return await asyncio.gather(*[self.single_flight.do_async('a', fetch) for _ in range(3)])
+
+        self.assertEqual([{'sid': 'AC123'}] * 3, run_async(go()))
+        self.assertEqual(1, len(calls))
+        self.assertEqual({}, self.single_flight._futures)
+
+    def test_do_async_waiting_stops_at_deadline(self):
+        async def fetch():
+            await asyncio.sleep(0.2)
+            return 'leader'
+
+        async def go():
+            leader = asyncio.ensure_future(self.single_flight.do_async('a', fetch))
+            await asyncio.sleep(0)
+            with self.assertRaises(DeadlineExceededException):
+                await Deadline(0.01).run_async(self.single_flight.do_async, 'a', fetch)
+            return await leader
+
+        self.assertEqual('leader', run_async(go()))
+
+
+class VersionSingleFlightTestCase(IntegrationTestCase):
+
+    def setUp(self):
+        super(VersionSingleFlightTestCase, self).setUp()
+        self.client.single_flight = SingleFlight()
+        self.holodeck.mock(Response(200, '{"sid": "AC123"}'), Request(url=ACCOUNT_URL))
+        self.holodeck.mock(Response(404, '{"message": "not found"}'),
+                           Request(url=ACCOUNT_URL.replace('AC123', 'AC404')))
+
+        request = self.holodeck.request
+        self.release = Event()
+
+        def slow_request(*args, **kwargs):
+            self.release.wait(5)
+            return request(*args, **kwargs)
+
+        self.holodeck.request = slow_request
+
+    def fetch_concurrently(self, sid, times=5):
+        with ThreadPoolExecutor(max_workers=times) as executor:
+            futures = [executor.submit(self.client.api.v2010.accounts(sid).fetch) for _ in range(times)]
+            time.sleep(0.1)
+            self.release.set()
+        return futures
+
+    def test_fetch_is_coalesced(self):
+        futures = self.fetch_concurrently('AC123')
+
+        self.assertEqual(['AC123'] * 5, [future.result().sid for future in futures])
+        self.assertEqual(1, len(self.holodeck.requests))
+
+    def test_fetch_error_is_shared(self):
+        futures = self.fetch_concurrently('AC404', times=2)
+
+        for future in futures:
+            self.assertIsInstance(future.exception(), TwilioRestException)
+        self.assertEqual(1, len(self.holodeck.requests))
+
+    def test_other_methods_are_not_coalesced(self):
+        self.release.set()
+
+        self.assertIsNone(self.client.api.v2010._fetch_key('POST', '/Accounts/AC123.json', None, None,
+                                                           None, None))
+        self.assertIsNotNone(self.client.api.v2010._fetch_key('GET', '/Accounts/AC123.json',
+                                                              {'Tag': ['a', 'b']}, None, None, None))
+
+    def test_disabled_by_default(self):
+        self.client.single_flight = None
+
+        futures = self.fetch_concurrently('AC123', times=2)
+
+        self.assertEqual(['AC123'] * 2, [future.result().sid for future in futures])
+        self.assertEqual(2, len(self.holodeck.requests))
+
+
+class AsyncVersionSingleFlightTestCase(AsyncIntegrationTestCase):
+
+    def test_fetch_async_is_coalesced(self):
+        self.client.single_flight = SingleFlight()
+        self.holodeck.mock(Response(200, '{"sid": "AC123"}'), Request(url=ACCOUNT_URL))
+        fetch = self.client.api.v2010.accounts('AC123').fetch_async
+
+        async def go():
+            return await asyncio.gather(fetch(), fetch(), fetch())
+
+        accounts = run_async(go())
+
+        self.assertEqual(['AC123'] * 3, [account.sid for account in accounts])
+        self.assertEqual(1, len(self.holodeck.requests))
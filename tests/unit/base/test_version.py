@@ -1,7 +1,9 @@
-from tests import IntegrationTestCase
-from tests.holodeck import Request
+from tests import AsyncIntegrationTestCase, IntegrationTestCase, run_async
+from tests.holodeck import Holodeck, Request
+from twilio.base.exceptions import TwilioException, TwilioRestException
 from twilio.base.page import Page
 from twilio.http.response import Response
+from twilio.rest import Client
 
 
 class TestPage(Page):
@@ -65,6 +67,33 @@ class StreamTestCase(IntegrationTestCase):
 
         self.assertEqual(len(messages), 2)
 
+    def test_stream_raw(self):
+        messages = list(self.version.stream(self.page, limit=3, raw=True))
+
+        self.assertEqual([{'body': 'payload0'}, {'body': 'payload1'}, {'body': 'payload2'}], messages)
+
+    def test_stream_prefetch(self):
+        messages = list(self.version.stream(self.page, prefetch=2))
+
+        self.assertEqual([m['body'] for m in messages], ['payload{}'.format(i) for i in range(5)])
+
+    def test_stream_prefetch_limit(self):
+        messages = list(self.version.stream(self.page, limit=3, prefetch=1))
+
+        self.assertEqual(len(messages), 3)
+
+    def test_stream_prefetch_page_limit(self):
+        messages = list(self.version.stream(self.page, page_limit=2, prefetch=2))
+
+        self.assertEqual(len(messages), 4)
+        self.assertEqual(len(self.holodeck.requests), 2)
+
+    def test_stream_prefetch_error(self):
+        self.holodeck._holograms.pop()
+
+        with self.assertRaises(TwilioRestException):
+            list(self.version.stream(self.page, prefetch=2))
+
 
 class VersionTestCase(IntegrationTestCase):
     def test_fetch_redirect(self):
@@ -78,3 +107,119 @@ class VersionTestCase(IntegrationTestCase):
         )
 
         self.assertIsNotNone(response)
+
+    def test_list_raw(self):
+        self.holodeck.mock(Response(
+            200,
+            '{"next_page_uri": null, "messages": [{"sid": "SM1", "date_sent": "Wed, 01 Jan 2020 08:00:00 +0000"}]}'
+        ), Request(url='https://api.twilio.com/2010-04-01/Accounts/AC123/Messages.json'))
+
+        messages = self.client.api.v2010.accounts('AC123').messages.list(raw=True)
+
+        self.assertEqual([{'sid': 'SM1', 'date_sent': 'Wed, 01 Jan 2020 08:00:00 +0000'}], messages)
+
+
+class AsyncStreamTestCase(AsyncIntegrationTestCase):
+    def setUp(self):
+        super(AsyncStreamTestCase, self).setUp()
+
+        self.holodeck.mock(Response(
+            200,
+            '''
+            {
+                "next_page_uri": "/2010-04-01/Accounts/AC123/Messages.json?Page=1",
+                "messages": [{"body": "payload0"}, {"body": "payload1"}]
+            }
+            '''
+        ), Request(url='https://api.twilio.com/2010-04-01/Accounts/AC123/Messages.json'))
+
+        self.holodeck.mock(Response(
+            200,
+            '''
+            {
+                "next_page_uri": null,
+                "messages": [{"body": "payload2"}]
+            }
+            '''
+        ), Request(url='https://api.twilio.com/2010-04-01/Accounts/AC123/Messages.json?Page=1'))
+
+        self.version = self.client.api.v2010
+
+    async def _stream(self, **kwargs):
+        response = await self.version.page_async(method='GET', uri='/Accounts/AC123/Messages.json')
+        page = TestPage(self.version, response)
+        return [record async for record in self.version.stream_async(page, **kwargs)]
+
+    def test_stream_async(self):
+        messages = run_async(self._stream())
+
+        self.assertEqual([m['body'] for m in messages], ['payload0', 'payload1', 'payload2'])
+
+    def test_stream_async_limit(self):
+        messages = run_async(self._stream(limit=1))
+
+        self.assertEqual(len(messages), 1)
+
+    def test_stream_async_page_limit(self):
+        messages = run_async(self._stream(page_limit=1))
+
+        self.assertEqual(len(messages), 2)
+
+    def test_stream_async_prefetch(self):
+        messages = run_async(self._stream(prefetch=2))
+
+        self.assertEqual([m['body'] for m in messages], ['payload0', 'payload1', 'payload2'])
+
+    def test_stream_async_prefetch_limit(self):
+        messages = run_async(self._stream(limit=1, prefetch=1))
+
+        self.assertEqual(len(messages), 1)
+
+
+class AsyncVersionTestCase(AsyncIntegrationTestCase):
+    def test_fetch_async(self):
+        self.holodeck.mock(Response(
+            200,
+            '{"sid": "SM123"}'
+        ), Request(url='https://api.twilio.com/2010-04-01/Accounts/AC123/Messages/SM123.json'))
+
+        message = run_async(self.client.api.v2010.accounts('AC123').messages('SM123').fetch_async())
+
+        self.assertEqual(message.sid, 'SM123')
+
+    def test_create_async_raises_on_error(self):
+        self.holodeck.mock(Response(
+            400,
+            '{"code": 21211, "message": "Invalid To"}'
+        ), Request(method='POST', url='https://api.twilio.com/2010-04-01/Accounts/AC123/Messages.json'))
+
+        with self.assertRaises(TwilioRestException) as context:
+            run_async(self.client.api.v2010.accounts('AC123').messages.create_async(to='+1', body='hi'))
+
+        self.assertEqual(context.exception.code, 21211)
+
+    def test_list_async(self):
+        self.holodeck.mock(Response(
+            200,
+            '{"next_page_uri": null, "messages": [{"sid": "SM1"}, {"sid": "SM2"}]}'
+        ), Request(url='https://api.twilio.com/2010-04-01/Accounts/AC123/Messages.json'))
+
+        messages = run_async(self.client.api.v2010.accounts('AC123').messages.list_async())
+
+        self.assertEqual([m.sid for m in messages], ['SM1', 'SM2'])
+
+    def test_list_async_raw(self):
+        self.holodeck.mock(Response(
+            200,
+            '{"next_page_uri": null, "messages": [{"sid": "SM1"}, {"sid": "SM2"}]}'
+        ), Request(url='https://api.twilio.com/2010-04-01/Accounts/AC123/Messages.json'))
+
+        messages = run_async(self.client.api.v2010.accounts('AC123').messages.list_async(raw=True))
+
+        self.assertEqual([{'sid': 'SM1'}, {'sid': 'SM2'}], messages)
+
+    def test_sync_client_rejects_async_request(self):
+        client = Client('username', 'password', http_client=Holodeck())
+
+        with self.assertRaises(TwilioException):
+            run_async(client.api.v2010.accounts('AC123').fetch_async())
@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import json
+import pickle
+import random
+import unittest
+
+from aiohttp import ClientConnectionError, web
+from aiohttp.test_utils import TestServer
+
+from tests import run_async
+from twilio.base.instrumentation import Instrumentation
+from twilio.http.async_http_client import AsyncTwilioHttpClient
+from twilio.http.compression import CompressionRule
+from twilio.http.retry import RetryPolicy
+
+
+async def echo(request):
+    form = await request.post()
+    return web.json_response({
+        'method': request.method,
+        'query': sorted(request.query.items()),
+        'form': sorted(form.items()),
+        'authorization': request.headers.get('Authorization'),
+        'unicode': 'testing-unicode: Ω≈ç√, 💩',
+    })
+
+
+async def compressed(request):
+    form = await request.post()
+    response = web.json_response({
+        'content_encoding': request.headers.get('Content-Encoding'),
+        'form': sorted(form.items()),
+        'padding': 'x' * 4096,
+    })
+    response.enable_compression(web.ContentCoding.gzip)
+    return response
+
+
+def record_peers(peers):
+    async def handler(request):
+        peers.add(request.transport.get_extra_info('peername'))
+        return web.Response(headers={'Content-Length': '0'})
+
+    return handler
+
+
+async def delayed_echo(request):
+    await asyncio.sleep(random.random() / 50)
+    return await echo(request)
+
+
+def throttle(times):
+    remaining = [times]
+
+    async def handler(request):
+        if remaining[0]:
+            remaining[0] -= 1
+            return web.Response(status=429, headers={'Retry-After': '0'})
+        return await echo(request)
+
+    return handler
+
+
+class TestAsyncHttpClientRequest(unittest.TestCase):
+
+    def _request(self, client, *args, **kwargs):
+        handler = kwargs.pop('handler', echo)
+
+        async def go():
+            app = web.Application()
+            app.router.add_route('*', '/echo', handler)
+            server = TestServer(app)
+            await server.start_server()
+            try:
+                return await client.request(args[0], str(server.make_url('/echo')), *args[1:], **kwargs)
+            finally:
+                await client.close()
+                await server.close()
+
+        return run_async(go())
+
+    def test_request(self):
+        client = AsyncTwilioHttpClient()
+
+        response = self._request(client, 'get', params={'PageSize': 5, 'Flag': True}, auth=('AC123', 'token'))
+
+        self.assertEqual(200, response.status_code)
+        payload = json.loads(response.text)
+        self.assertEqual('GET', payload['method'])
+        self.assertEqual([['Flag', 'True'], ['PageSize', '5']], payload['query'])
+        self.assertTrue(payload['authorization'].startswith('Basic '))
+        self.assertEqual('testing-unicode: Ω≈ç√, 💩', payload['unicode'])
+
+    def test_concurrent_requests(self):
+        client = AsyncTwilioHttpClient(pool_connections=False)
+
+        async def go():
+            app = web.Application()
+            app.router.add_route('*', '/echo', delayed_echo)
+            server = TestServer(app)
+            await server.start_server()
+
+            async def fetch(index):
+                response = await client.request('GET', str(server.make_url('/echo')), params={'Index': index})
+                return index, response, client.last_request, client.last_response
+
+            try:
+                return await asyncio.gather(*[fetch(i) for i in range(30)])
+            finally:
+                await client.close()
+                await server.close()
+
+        for index, response, last_request, last_response in run_async(go()):
+            self.assertEqual([['Index', str(index)]], json.loads(response.text)['query'])
+            self.assertEqual({'Index': index}, last_request.params)
+            self.assertIs(response, last_response)
+
+    def test_request_retries(self):
+        attempts = []
+        client = AsyncTwilioHttpClient(retry_policy=RetryPolicy(
+            on_retry=lambda method, url, attempt, delay, response, error: attempts.append(attempt)))
+
+        response = self._request(client, 'GET', handler=throttle(2))
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual([1, 2], attempts)
+
+    def test_request_compression(self):
+        client = AsyncTwilioHttpClient(compression_rules=[CompressionRule(min_size=1024, methods=['POST'])])
+
+        response = self._request(client, 'POST', data={'Body': 'a' * 2000}, handler=compressed)
+
+        payload = json.loads(response.text)
+        self.assertEqual('gzip', payload['content_encoding'])
+        self.assertEqual([['Body', 'a' * 2000]], payload['form'])
+        self.assertEqual('gzip', response.headers['Content-Encoding'])
+        self.assertLess(response.wire_size, len(response.body))
+
+    def test_warmup(self):
+        client = AsyncTwilioHttpClient()
+        peers = set()
+
+        async def go():
+            app = web.Application()
+            app.router.add_route('HEAD', '/', record_peers(peers))
+            server = TestServer(app)
+            await server.start_server()
+            try:
+                await client.warmup([str(server.make_url('/'))], connections=3)
+                await client.request('HEAD', str(server.make_url('/')))
+            finally:
+                await client.close()
+                await server.close()
+
+        run_async(go())
+        self.assertEqual(3, len(peers))
+
+    def test_request_phases(self):
+        span = Instrumentation().start_span('POST')
+
+        with span:
+            self._request(AsyncTwilioHttpClient(), 'POST', data={'Body': 'a'})
+
+        self.assertEqual({'connect', 'ttfb', 'read'}, set(span.phases))
+        self.assertEqual(6, span.attributes['http.request.body.size'])
+
+    def test_request_expands_list_values(self):
+        client = AsyncTwilioHttpClient(pool_connections=False)
+
+        response = self._request(client, 'POST', data={'To': '+1555', 'MediaUrl': ['a', 'b'], 'Skip': None})
+
+        self.assertEqual([['MediaUrl', 'a'], ['MediaUrl', 'b'], ['To', '+1555']], json.loads(response.text)['form'])
+
+    def test_request_logs_failure(self):
+        client = AsyncTwilioHttpClient(pool_connections=False)
+
+        with self.assertLogs('twilio.async_http_client', 'INFO') as logs:
+            with self.assertRaises(ClientConnectionError):
+                run_async(client.request('GET', 'http://127.0.0.1:1/echo'))
+
+        record, = logs.records
+        self.assertIsNone(record.http_status)
+        self.assertEqual('ClientConnectorError', record.error_type)
+
+    def test_request_where_method_timeout_equals_zero(self):
+        client = AsyncTwilioHttpClient()
+
+        with self.assertRaises(ValueError):
+            run_async(client.request('GET', 'https://api.twilio.com', timeout=0))
+
+    def test_class_timeout_equals_zero(self):
+        with self.assertRaises(ValueError):
+            AsyncTwilioHttpClient(timeout=0)
+
+    def test_pickle(self):
+        client = AsyncTwilioHttpClient(pool_connections=False, timeout=5)
+        client.last_request = 'request'
+
+        copied = pickle.loads(pickle.dumps(client))
+
+        self.assertEqual(5, copied.timeout)
+        self.assertFalse(copied.pool_connections)
+        self.assertIsNone(copied.last_request)
+        self.assertIsNone(copied.session)
+
+    def test_is_async(self):
+        self.assertTrue(AsyncTwilioHttpClient().is_async)
@@ -0,0 +1,147 @@
+import time
+import unittest
+
+from mock import Mock, patch
+from requests import Session
+from requests.exceptions import ReadTimeout
+
+from twilio.base.deadline import Deadline
+from twilio.base.exceptions import CircuitOpenException, DeadlineExceededException
+from twilio.http.circuit_breaker import CircuitBreaker
+from twilio.http.http_client import TwilioHttpClient
+from twilio.http.response import Response
+
+VERIFY = 'verify.twilio.com'
+API = 'api.twilio.com'
+
+
+class Clock(object):
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class CircuitBreakerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = Clock()
+        self.patcher = patch('twilio.http.circuit_breaker.time.monotonic', self.clock)
+        self.patcher.start()
+        self.breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10)
+
+    def tearDown(self):
+        self.patcher.stop()
+
+    def fail_requests(self, host, times=1):
+        for _ in range(times):
+            self.breaker.before(host)
+            self.breaker.after(host, response=Response(503, ''))
+
+    def test_opens_after_consecutive_failures(self):
+        self.fail_requests(VERIFY)
+        self.breaker.before(VERIFY)
+        self.breaker.after(VERIFY, response=Response(200, ''))
+        self.fail_requests(VERIFY)
+        self.assertEqual('closed', self.breaker.state(VERIFY))
+
+        self.fail_requests(VERIFY)
+        self.assertEqual('open', self.breaker.state(VERIFY))
+
+        with self.assertRaises(CircuitOpenException) as context:
+            self.breaker.before(VERIFY)
+        self.assertEqual(VERIFY, context.exception.host)
+        self.assertEqual(10, context.exception.retry_in)
+
+    def test_circuits_per_host(self):
+        self.fail_requests(VERIFY, 2)
+
+        self.breaker.before(API)
+        self.assertEqual('closed', self.breaker.state(API))
+
+    def test_client_errors_are_not_failures(self):
+        for status in (400, 404, 429):
+            self.breaker.before(VERIFY)
+            self.breaker.after(VERIFY, response=Response(status, ''))
+
+        self.assertEqual('closed', self.breaker.state(VERIFY))
+
+    def test_half_open_probe_closes(self):
+        self.fail_requests(VERIFY, 2)
+        self.clock.now += 10
+
+        self.breaker.before(VERIFY)
+        self.assertEqual('half-open', self.breaker.state(VERIFY))
+        with self.assertRaises(CircuitOpenException):
+            self.breaker.before(VERIFY)
+
+        self.breaker.after(VERIFY, response=Response(200, ''))
+        self.assertEqual('closed', self.breaker.state(VERIFY))
+
+    def test_half_open_probe_reopens(self):
+        self.fail_requests(VERIFY, 2)
+        self.clock.now += 10
+
+        self.breaker.before(VERIFY)
+        self.breaker.after(VERIFY, error=ReadTimeout())
+
+        self.assertEqual('open', self.breaker.state(VERIFY))
+        with self.assertRaises(CircuitOpenException):
+            self.breaker.before(VERIFY)
+
+    def test_release_frees_probe(self):
+        self.fail_requests(VERIFY, 2)
+        self.clock.now += 10
+
+        self.breaker.before(VERIFY)
+        self.breaker.release(VERIFY)
+        self.breaker.before(VERIFY)
+
+        self.assertEqual('half-open', self.breaker.state(VERIFY))
+
+    def test_invalid_breaker(self):
+        with self.assertRaises(ValueError):
+            CircuitBreaker(failure_threshold=0)
+
+
+class HttpClientCircuitBreakerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.session_patcher = patch('twilio.http.http_client.Session')
+        self.session_mock = Mock(wraps=Session())
+        self.session_mock.prepare_request.return_value = Mock(headers={})
+        self.session_patcher.start().return_value = self.session_mock
+
+        self.client = TwilioHttpClient(circuit_breaker=CircuitBreaker(failure_threshold=2))
+
+    def tearDown(self):
+        self.session_patcher.stop()
+
+    def test_fails_fast_once_open(self):
+        self.session_mock.send.side_effect = ReadTimeout()
+
+        for _ in range(2):
+            with self.assertRaises(ReadTimeout):
+                self.client.request('GET', 'https://verify.twilio.com/v2/Services')
+
+        with self.assertRaises(CircuitOpenException):
+            self.client.request('GET', 'https://verify.twilio.com/v2/Services')
+        self.assertEqual(2, self.session_mock.send.call_count)
+
+        self.session_mock.send.side_effect = None
+        self.session_mock.send.return_value = Response(200, '{}')
+        self.assertEqual(200, self.client.request('GET', 'https://api.twilio.com/2010-04-01/Accounts.json').status_code)
+
+    def test_deadline_timeouts_are_not_failures(self):
+        def send(request, **kwargs):
+            time.sleep(0.02)
+            raise ReadTimeout()
+        self.session_mock.send.side_effect = send
+
+        for _ in range(3):
+            with self.assertRaises(DeadlineExceededException):
+                with Deadline(0.01):
+                    self.client.request('GET', 'https://api.twilio.com/2010-04-01/Accounts.json')
+
+        self.assertEqual('closed', self.client.circuit_breaker.state('api.twilio.com'))
@@ -0,0 +1,139 @@
+import asyncio
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from threading import Event, Thread, current_thread
+
+from mock import Mock
+
+from tests import run_async
+from twilio.http.hedging import HedgingPolicy
+
+HOST = 'lookups.twilio.com'
+
+variable = ContextVar('variable', default=None)
+
+
+class HedgingPolicyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.policy = HedgingPolicy(percentile=90, min_delay=0.01, max_delay=0.5, min_samples=10)
+        self.executor = ThreadPoolExecutor(max_workers=4)
+
+    def tearDown(self):
+        self.executor.shutdown(wait=True)
+
+    def test_delay(self):
+        self.assertEqual(0.5, self.policy.delay(HOST))
+
+        for i in range(1, 11):
+            self.policy.record(HOST, i / 100.0)
+
+        self.assertEqual(0.1, self.policy.delay(HOST))
+        self.assertEqual(0.5, self.policy.delay('api.twilio.com'))
+
+    def test_delay_is_clamped(self):
+        for _ in range(10):
+            self.policy.record(HOST, 0.001)
+            self.policy.record('verify.twilio.com', 10)
+
+        self.assertEqual(0.01, self.policy.delay(HOST))
+        self.assertEqual(0.5, self.policy.delay('verify.twilio.com'))
+
+    def test_applies_to_get(self):
+        self.assertTrue(self.policy.applies('get'))
+        self.assertFalse(self.policy.applies('POST'))
+
+    def test_fast_request_is_not_hedged(self):
+        send = Mock(return_value='response')
+
+        self.assertEqual('response', self.policy.send(self.executor, HOST, send))
+        self.assertEqual(1, send.call_count)
+
+    def test_slow_request_is_hedged(self):
+        self.policy = HedgingPolicy(max_delay=0.01)
+        release = Event()
+        slow, fast = Mock(), Mock()
+
+        def send():
+            if send.calls == 0:
+                send.calls += 1
+                release.wait(5)
+                return slow
+            return fast
+        send.calls = 0
+
+        self.assertIs(fast, self.policy.send(self.executor, HOST, send))
+
+        release.set()
+        self.executor.shutdown(wait=True)
+        slow.close.assert_called_once_with()
+        fast.close.assert_not_called()
+
+    def test_busy_workers_send_on_calling_thread(self):
+        self.policy = HedgingPolicy(max_delay=0.01, max_workers=1)
+        started, release = Event(), Event()
+        threads = []
+
+        def blocking():
+            started.set()
+            release.wait(5)
+            return 'slow'
+
+        def send():
+            threads.append(current_thread())
+            return 'response'
+
+        first = Thread(target=self.policy.send, args=(self.executor, HOST, blocking))
+        first.start()
+        started.wait(5)
+
+        self.assertEqual('response', self.policy.send(self.executor, HOST, send))
+        self.assertEqual([current_thread()], threads)
+        release.set()
+        first.join()
+
+    def test_requests_keep_context(self):
+        seen = []
+
+        def send():
+            seen.append(variable.get())
+            return 'response'
+
+        variable.set('caller')
+        self.policy.send(self.executor, HOST, send)
+
+        self.assertEqual(['caller'], seen)
+
+    def test_all_requests_fail(self):
+        self.policy = HedgingPolicy(max_delay=0.01)
+
+        def send():
+            raise IOError('reset')
+
+        with self.assertRaises(IOError):
+            self.policy.send(self.executor, HOST, send)
+
+    def test_slow_request_is_hedged_async(self):
+        self.policy = HedgingPolicy(max_delay=0.01)
+        started = []
+        cancelled = []
+
+        async def send():
+            started.append(len(started))
+            if len(started) == 1:
+                try:
+                    await asyncio.sleep(5)
+                except asyncio.CancelledError:
+                    cancelled.append(True)
+                    raise
+                return 'slow'
+            return 'fast'
+
+        async def go():
+            response = await self.policy.send_async(HOST, send)
+            await asyncio.sleep(0)
+            return response
+
+        self.assertEqual('fast', run_async(go()))
+        self.assertEqual([True], cancelled)
@@ -1,13 +1,26 @@
 # -*- coding: utf-8 -*-
+import gzip
+import pickle
+import time
 import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Barrier, Thread, current_thread
 
 from mock import patch, Mock
 from requests import Session
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError as RequestsConnectionError, ReadTimeout
+from urllib3.util.request import ACCEPT_ENCODING
 
+from twilio.base.deadline import Deadline
+from twilio.base.instrumentation import Instrumentation
 from twilio.base.version import Version
-from twilio.base.exceptions import TwilioRestException
+from twilio.base.exceptions import DeadlineExceededException, TwilioRestException
+from twilio.http.compression import CompressionRule
+from twilio.http.hedging import HedgingPolicy
 from twilio.http.http_client import TwilioHttpClient
 from twilio.http.response import Response
+from twilio.http.retry import RetryPolicy
 
 
 class TestHttpClientRequest(unittest.TestCase):
@@ -145,6 +158,180 @@ class TestHttpClientRequest(unittest.TestCase):
         self.client.request('doesnt matter', 'doesnt matter')
         self.assertEqual(proxies, self.session_mock.proxies)
 
+    def test_proxy_set_at_construction(self):
+        proxies = {'https': 'https://proxy.twilio.com'}
+        self.client = TwilioHttpClient(proxy=proxies)
+
+        self.assertEqual(proxies, self.session_mock.proxies)
+
+    def test_last_response_per_thread(self):
+        self.request_mock.url = 'https://api.twilio.com/'
+        self.session_mock.send.side_effect = lambda request, **kwargs: Response(200, current_thread().name)
+        barrier = Barrier(4)
+        seen = {}
+
+        def request():
+            barrier.wait()
+            self.client.request('GET', current_thread().name)
+            seen[current_thread().name] = (self.client.last_request.url, self.client.last_response.text)
+
+        threads = [Thread(target=request, name='worker-{}'.format(i)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual({t.name: (t.name, t.name) for t in threads}, seen)
+        self.assertIsNone(self.client.last_response)
+
+    @patch('twilio.http.http_client.time.sleep')
+    def test_retry_policy(self, sleep_mock):
+        self.session_mock.send.side_effect = [
+            Response(429, 'slow down', {'Retry-After': '2'}),
+            RequestsConnectionError('reset'),
+            Response(200, 'ok'),
+        ]
+        retries = []
+        self.client.retry_policy = RetryPolicy(
+            on_retry=lambda method, url, attempt, delay, response, error: retries.append((attempt, delay, error)))
+
+        response = self.client.request('GET', 'https://api.twilio.com/2010-04-01/Accounts.json')
+
+        self.assertEqual('ok', response.text)
+        self.assertEqual(3, self.session_mock.send.call_count)
+        self.assertEqual(2, sleep_mock.call_count)
+        self.assertEqual((1, 2.0, None), retries[0])
+        self.assertEqual(2, retries[1][0])
+        self.assertIsInstance(retries[1][2], RequestsConnectionError)
+
+    @patch('twilio.http.http_client.time.sleep')
+    def test_retry_policy_skips_post(self, sleep_mock):
+        self.session_mock.send.return_value = Response(503, 'unavailable')
+        self.client.retry_policy = RetryPolicy()
+
+        response = self.client.request('POST', 'https://api.twilio.com/2010-04-01/Accounts.json')
+
+        self.assertEqual(503, response.status_code)
+        self.assertEqual(1, self.session_mock.send.call_count)
+        sleep_mock.assert_not_called()
+
+    def test_deadline_shrinks_timeout(self):
+        with Deadline(5):
+            self.client.request('GET', 'https://api.twilio.com/2010-04-01/Accounts.json', timeout=30)
+
+        self.assertLessEqual(self.session_mock.send.call_args[1]['timeout'], 5)
+
+    @patch('twilio.http.http_client.time.sleep')
+    def test_deadline_skips_retries_outlasting_it(self, sleep_mock):
+        self.session_mock.send.return_value = Response(429, 'slow down', {'Retry-After': '10'})
+        self.client.retry_policy = RetryPolicy()
+
+        with Deadline(5):
+            response = self.client.request('GET', 'https://api.twilio.com/2010-04-01/Accounts.json')
+
+        self.assertEqual(429, response.status_code)
+        self.assertEqual(1, self.session_mock.send.call_count)
+        sleep_mock.assert_not_called()
+
+    def test_deadline_exceeded(self):
+        deadline = Deadline(5)
+
+        def send(request, **kwargs):
+            deadline._expires = time.monotonic()
+            raise ReadTimeout('read timed out')
+
+        self.session_mock.send.side_effect = send
+
+        with deadline, self.assertRaises(DeadlineExceededException) as context:
+            self.client.request('GET', 'https://api.twilio.com/2010-04-01/Accounts.json')
+
+        self.assertIsInstance(context.exception.__cause__, ReadTimeout)
+
+    def test_request_logs_one_record(self):
+        self.session_mock.send.return_value = Response(201, '{}', {'Twilio-Request-Id': 'RQ123'})
+
+        with self.assertLogs('twilio.http_client', 'INFO') as logs:
+            self.client.request('POST', 'https://api.twilio.com/2010-04-01/Accounts.json',
+                                params={'PageSize': 5}, headers={'Authorization': 'Basic secret', 'Accept': '*/*'})
+
+        self.assertEqual(1, len(logs.records))
+        record = logs.records[0]
+        self.assertEqual('POST', record.http_method)
+        self.assertEqual('https://api.twilio.com/2010-04-01/Accounts.json?PageSize=5', record.http_url)
+        self.assertEqual(201, record.http_status)
+        self.assertEqual('RQ123', record.twilio_request_id)
+        self.assertEqual({'Authorization': '[REDACTED]', 'Accept': '*/*'}, record.request_headers)
+        self.assertGreaterEqual(record.duration_ms, 0)
+        self.assertNotIn('secret', logs.output[0])
+
+    def test_request_logs_failure(self):
+        self.session_mock.send.side_effect = ReadTimeout()
+
+        with self.assertLogs('twilio.http_client', 'INFO') as logs:
+            with self.assertRaises(ReadTimeout):
+                self.client.request('GET', 'https://api.twilio.com/2010-04-01/Accounts.json')
+
+        self.assertEqual(1, len(logs.records))
+        record = logs.records[0]
+        self.assertIsNone(record.http_status)
+        self.assertIsNone(record.twilio_request_id)
+        self.assertEqual('ReadTimeout', record.error_type)
+        self.assertIn('ReadTimeout', logs.output[0])
+
+    @patch('twilio.http.http_client.log_exchange')
+    def test_request_skips_disabled_logging(self, log_mock):
+        self.client.logger = Mock(isEnabledFor=Mock(return_value=False))
+
+        self.client.request('GET', 'https://api.twilio.com/2010-04-01/Accounts.json', params={'PageSize': 5})
+
+        log_mock.assert_not_called()
+        self.client.logger.info.assert_not_called()
+
+    def test_advertises_compression(self):
+        self.session_mock.headers.update.assert_called_once_with({'Accept-Encoding': ACCEPT_ENCODING})
+
+    def test_compress_large_body(self):
+        self.request_mock.body = 'Body=' + 'a' * 2000
+        self.client.compression_rules = [CompressionRule(min_size=1024, domain='api', path='/Messages.json')]
+
+        self.client.request('POST', 'https://api.twilio.com/2010-04-01/Accounts/AC123/Messages.json')
+
+        self.assertEqual('gzip', self.request_mock.headers['Content-Encoding'])
+        self.assertEqual('Body=' + 'a' * 2000, gzip.decompress(self.request_mock.body).decode('utf-8'))
+        self.assertEqual(str(len(self.request_mock.body)), self.request_mock.headers['Content-Length'])
+
+    def test_compress_skips_small_body(self):
+        self.request_mock.body = 'Body=a'
+        self.client.compression_rules = [CompressionRule(min_size=1024)]
+
+        self.client.request('POST', 'https://api.twilio.com/2010-04-01/Accounts/AC123/Messages.json')
+
+        self.assertEqual('Body=a', self.request_mock.body)
+        self.assertNotIn('Content-Encoding', self.request_mock.headers)
+
+    def test_compress_skips_unmatched_endpoints(self):
+        self.request_mock.body = 'Body=' + 'a' * 2000
+        self.client.compression_rules = [CompressionRule(min_size=1024, domain='api', path='/Messages.json',
+                                                         methods=['POST'])]
+
+        self.client.request('POST', 'https://verify.twilio.com/v2/Services/VA123/Verifications')
+        self.client.request('POST', 'https://api.twilio.com/2010-04-01/Accounts/AC123/Calls.json')
+        self.client.request('PUT', 'https://api.twilio.com/2010-04-01/Accounts/AC123/Messages.json')
+
+        self.assertEqual('Body=' + 'a' * 2000, self.request_mock.body)
+        self.assertNotIn('Content-Encoding', self.request_mock.headers)
+
+    def test_hedging_policy(self):
+        self.client.hedging_policy = HedgingPolicy()
+
+        self.client.request('POST', 'https://lookups.twilio.com/v1/PhoneNumbers/+15555555555')
+        self.assertIsNone(self.client._hedging_executor)
+
+        response = self.client.request('GET', 'https://lookups.twilio.com/v1/PhoneNumbers/+15555555555')
+        self.assertEqual(200, response.status_code)
+        self.assertIsNotNone(self.client._hedging_executor)
+        self.assertEqual(1.0, self.client.hedging_policy.delay('lookups.twilio.com'))
+
     def test_exception_with_details(self):
         v1 = MyVersion(self.client)
         error_text = """{   
@@ -167,6 +354,23 @@ class TestHttpClientRequest(unittest.TestCase):
             self.assertEqual("Unable to fetch record: Bad request", err.msg)
             self.assertEqual({"foo": "bar"}, err.details)
 
+    def test_response_keeps_bytes(self):
+        body = '{"sid": "SM123", "body": "Ω≈ç√, 💩"}'.encode('utf-8')
+        self.session_mock.send.return_value = Mock(status_code=200, content=body, headers={},
+                                                   encoding='utf-8')
+
+        response = self.client.request('GET', 'https://api.twilio.com')
+
+        self.assertIs(body, response.body)
+        self.assertEqual(body.decode('utf-8'), response.text)
+        self.assertEqual({"sid": "SM123", "body": "Ω≈ç√, 💩"}, MyVersion(self.client).fetch('GET', 'none'))
+
+    def test_response_decodes_other_charsets(self):
+        response = Response(200, '{"body": "ñ"}'.encode('latin-1'), encoding='ISO-8859-1')
+
+        self.assertEqual('{"body": "ñ"}', response.body)
+        self.assertEqual('{"body": "ñ"}', response.text)
+
 
 class TestHttpClientSession(unittest.TestCase):
 
@@ -212,6 +416,170 @@ class TestHttpClientSession(unittest.TestCase):
         self.assertEqual(response_2.content, 'response_2')
 
 
+class TestHttpClientPool(unittest.TestCase):
+
+    def adapter(self, client):
+        return client.session.get_adapter('https://api.twilio.com/2010-04-01')
+
+    def test_default_pool(self):
+        adapter = self.adapter(TwilioHttpClient())
+
+        self.assertEqual(10, adapter.poolmanager.connection_pool_kw['maxsize'])
+        self.assertFalse(adapter.poolmanager.connection_pool_kw['block'])
+        self.assertEqual(TwilioHttpClient.POOL_HOSTS, adapter._pool_connections)
+
+    def test_pool_size(self):
+        adapter = self.adapter(TwilioHttpClient(pool_maxsize=64, pool_block=True, max_retries=3))
+
+        self.assertEqual(64, adapter.poolmanager.connection_pool_kw['maxsize'])
+        self.assertTrue(adapter.poolmanager.connection_pool_kw['block'])
+        self.assertEqual(3, adapter.max_retries.total)
+
+    def test_invalid_pool(self):
+        with self.assertRaises(ValueError):
+            TwilioHttpClient(pool_maxsize=0)
+
+        with self.assertRaises(ValueError):
+            TwilioHttpClient(keep_alive_timeout=0)
+
+    @patch('requests.adapters.HTTPAdapter.send')
+    def test_keep_alive_timeout(self, send_mock):
+        adapter = self.adapter(TwilioHttpClient(keep_alive_timeout=30))
+        adapter.poolmanager = Mock()
+        request = Mock()
+
+        adapter.send(request)
+        adapter.send(request)
+        adapter.poolmanager.clear.assert_not_called()
+
+        adapter._last_used -= 31
+        adapter.send(request)
+        adapter.poolmanager.clear.assert_called_once_with()
+        self.assertEqual(3, send_mock.call_count)
+
+    def test_pickle(self):
+        client = TwilioHttpClient(pool_maxsize=64, keep_alive_timeout=30, timeout=5)
+        client.last_request = Mock()
+
+        copied = pickle.loads(pickle.dumps(client))
+
+        self.assertEqual(5, copied.timeout)
+        self.assertIsNone(copied.last_request)
+        adapter = self.adapter(copied)
+        self.assertEqual(64, adapter.poolmanager.connection_pool_kw['maxsize'])
+        self.assertEqual(30, adapter.keep_alive_timeout)
+        self.assertIsNone(adapter._last_used)
+        self.assertIsNot(client._lock, copied._lock)
+
+
+class WarmupHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.do_HEAD()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers['Content-Length']))
+        self.do_HEAD()
+
+    def do_HEAD(self):
+        self.server.clients.add(self.client_address)
+        self.server.requests += 1
+        self.send_response(200)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+class TestHttpClientWarmup(unittest.TestCase):
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), WarmupHandler)
+        self.server.clients = set()
+        self.server.requests = 0
+        self.url = 'http://127.0.0.1:{}'.format(self.server.server_port)
+        Thread(target=self.server.serve_forever, daemon=True).start()
+        self.client = TwilioHttpClient()
+
+    def tearDown(self):
+        self.client.stop_keep_alive()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_warmup_opens_connections(self):
+        self.client.warmup([self.url], connections=3)
+
+        self.assertEqual(3, len(self.server.clients))
+
+        self.client.request('GET', self.url)
+        self.assertEqual(3, len(self.server.clients))
+
+    def test_warmup_is_capped_at_pool_size(self):
+        self.client = TwilioHttpClient(pool_maxsize=2)
+        self.client.session.mount('http://', HTTPAdapter(pool_maxsize=2))
+
+        self.client.warmup([self.url], connections=5)
+
+        self.assertEqual(2, len(self.server.clients))
+
+    def test_warmup_ignores_failures(self):
+        closed = ThreadingHTTPServer(('127.0.0.1', 0), WarmupHandler)
+        closed.server_close()
+
+        with self.assertLogs('twilio.http_client', 'WARNING'):
+            self.client.warmup(['http://127.0.0.1:{}'.format(closed.server_port)])
+
+    def test_keep_alive(self):
+        self.client.warmup([self.url], keep_alive=0.01)
+
+        for _ in range(500):
+            if self.server.requests >= 3:
+                break
+            time.sleep(0.01)
+        self.client.stop_keep_alive()
+
+        self.assertGreaterEqual(self.server.requests, 3)
+        self.assertEqual(1, len(self.server.clients))
+
+    def test_invalid_warmup(self):
+        with self.assertRaises(ValueError):
+            self.client.warmup([self.url], connections=0)
+
+        with self.assertRaises(ValueError):
+            self.client.warmup([self.url], keep_alive=0)
+
+    def test_warmup_without_pool(self):
+        TwilioHttpClient(pool_connections=False).warmup([self.url])
+
+        self.assertEqual(set(), self.server.clients)
+
+
+class TestHttpClientInstrumentation(unittest.TestCase):
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), WarmupHandler)
+        self.server.clients = set()
+        self.server.requests = 0
+        self.url = 'http://127.0.0.1:{}'.format(self.server.server_port)
+        Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_phases(self):
+        span = Instrumentation().start_span('POST')
+
+        with span:
+            TwilioHttpClient().request('POST', self.url, data={'Body': 'a'})
+
+        self.assertEqual({'prepare', 'ttfb', 'read'}, set(span.phases))
+        self.assertEqual(6, span.attributes['http.request.body.size'])
+        self.assertEqual(0, span.attributes['http.response.body.size'])
+
+
 class MyVersion(Version):
     def __init__(self, domain):
         super(MyVersion, self).__init__(domain)
@@ -0,0 +1,124 @@
+import unittest
+
+from mock import patch
+
+from tests import IntegrationTestCase, run_async
+from tests.holodeck import Request
+from twilio.base.deadline import Deadline
+from twilio.base.exceptions import DeadlineExceededException
+from twilio.http.rate_limiter import RateLimit, RateLimiter, TokenBucket
+from twilio.http.response import Response
+from twilio.rest import Client
+
+ACCOUNT_SID = 'AC' + 'a' * 32
+OTHER_ACCOUNT_SID = 'AC' + 'b' * 32
+MESSAGES_URL = 'https://api.twilio.com/2010-04-01/Accounts/{}/Messages.json'
+
+
+class Clock(object):
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TokenBucketTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = Clock()
+        self.patcher = patch('twilio.http.rate_limiter.time.monotonic', self.clock)
+        self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+
+    def test_burst_then_pace(self):
+        bucket = TokenBucket(rate=2, burst=2)
+
+        self.assertEqual([0, 0, 0.5, 1.0], [bucket.reserve() for _ in range(4)])
+
+    def test_refill(self):
+        bucket = TokenBucket(rate=2, burst=2)
+        bucket.reserve()
+        bucket.reserve()
+
+        self.clock.now += 10
+
+        self.assertEqual([0, 0, 0.5], [bucket.reserve() for _ in range(3)])
+
+
+class RateLimiterTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.limiter = RateLimiter([
+            RateLimit(1, domain='api', path='/Messages.json', methods=['POST']),
+            RateLimit(5, domain='verify'),
+        ])
+
+    def test_first_matching_limit(self):
+        url = MESSAGES_URL.format(ACCOUNT_SID)
+
+        self.assertEqual(0, self.limiter.reserve('POST', url))
+        self.assertGreater(self.limiter.reserve('post', url), 0)
+        self.assertEqual(0, self.limiter.reserve('GET', url))
+        self.assertEqual(0, self.limiter.reserve('POST', 'https://api.twilio.com/2010-04-01/Accounts/{}/Calls.json'
+                                                 .format(ACCOUNT_SID)))
+
+    def test_buckets_per_account(self):
+        self.assertEqual(0, self.limiter.reserve('POST', MESSAGES_URL.format(ACCOUNT_SID)))
+        self.assertEqual(0, self.limiter.reserve('POST', MESSAGES_URL.format(OTHER_ACCOUNT_SID)))
+
+    def test_buckets_per_domain(self):
+        verifications = 'https://verify.twilio.com/v2/Services/VA123/Verifications'
+
+        for _ in range(5):
+            self.assertEqual(0, self.limiter.reserve('POST', verifications, ACCOUNT_SID))
+        self.assertGreater(self.limiter.reserve('POST', verifications, ACCOUNT_SID), 0)
+        self.assertEqual(0, self.limiter.reserve('POST', verifications, OTHER_ACCOUNT_SID))
+
+    @patch('twilio.http.rate_limiter.asyncio.sleep')
+    def test_acquire_async(self, sleep_mock):
+        async def no_wait(delay):
+            pass
+        sleep_mock.side_effect = no_wait
+        url = MESSAGES_URL.format(ACCOUNT_SID)
+
+        run_async(self.limiter.acquire_async('POST', url))
+        run_async(self.limiter.acquire_async('POST', url))
+
+        self.assertEqual(1, sleep_mock.call_count)
+
+    @patch('twilio.http.rate_limiter.time.sleep')
+    def test_acquire_stops_at_deadline(self, sleep_mock):
+        url = MESSAGES_URL.format(ACCOUNT_SID)
+        self.limiter.acquire('POST', url)
+
+        with self.assertRaises(DeadlineExceededException):
+            with Deadline(0.5):
+                self.limiter.acquire('POST', url)
+
+        self.assertLessEqual(sleep_mock.call_args[0][0], 0.5)
+
+    def test_invalid_rate(self):
+        with self.assertRaises(ValueError):
+            RateLimit(0)
+
+
+class ClientRateLimiterTestCase(IntegrationTestCase):
+
+    def setUp(self):
+        super(ClientRateLimiterTestCase, self).setUp()
+        self.client = Client(username=ACCOUNT_SID, password=self.auth_token, http_client=self.holodeck,
+                             rate_limiter=RateLimiter([RateLimit(1, path='/Messages.json')]))
+        self.holodeck.mock(Response(200, '{"next_page_uri": null, "messages": []}'),
+                           Request(url=MESSAGES_URL.format(ACCOUNT_SID)))
+
+    @patch('twilio.http.rate_limiter.time.sleep')
+    def test_request_waits(self, sleep_mock):
+        self.client.messages.list()
+        sleep_mock.assert_not_called()
+
+        self.client.messages.list()
+        self.assertEqual(1, sleep_mock.call_count)
+        self.assertGreater(sleep_mock.call_args[0][0], 0.9)
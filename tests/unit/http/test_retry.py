@@ -0,0 +1,88 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+from mock import patch
+
+from twilio.base.exceptions import TwilioException
+from twilio.http import HttpClient
+from twilio.http.http_client import TwilioHttpClient
+from twilio.http.response import Response
+from twilio.http.retry import RetryPolicy
+from twilio.rest import Client
+
+
+class RetryPolicyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.policy = RetryPolicy(retries=3, backoff=1, max_delay=5)
+
+    def test_retries_throttled_get(self):
+        with patch('twilio.http.retry.random.uniform', side_effect=lambda low, high: high):
+            delays = [self.policy.next_delay(attempt, 'GET', response=Response(429, ''))
+                      for attempt in range(1, 5)]
+
+        self.assertEqual([1, 2, 4, None], delays)
+
+    def test_backoff_is_capped(self):
+        policy = RetryPolicy(retries=10, backoff=1, max_delay=5)
+
+        with patch('twilio.http.retry.random.uniform', side_effect=lambda low, high: high):
+            self.assertEqual(5, policy.next_delay(8, 'GET', response=Response(503, '')))
+
+    def test_does_not_retry_other_statuses(self):
+        self.assertIsNone(self.policy.next_delay(1, 'GET', response=Response(500, '')))
+        self.assertIsNone(self.policy.next_delay(1, 'GET', response=Response(200, '')))
+
+    def test_post_requires_idempotency_token(self):
+        self.assertIsNone(self.policy.next_delay(1, 'POST', {'Accept': 'application/json'},
+                                                 response=Response(503, '')))
+        self.assertIsNotNone(self.policy.next_delay(1, 'post', {'I-Twilio-Idempotency-Token': 'abc'},
+                                                    response=Response(503, '')))
+
+    def test_throttled_post_is_retried(self):
+        self.assertIsNotNone(self.policy.next_delay(1, 'POST', {'Accept': 'application/json'},
+                                                    response=Response(429, '')))
+        self.assertIsNone(self.policy.next_delay(4, 'POST', response=Response(429, '')))
+
+    def test_connection_error(self):
+        self.assertIsNotNone(self.policy.next_delay(1, 'DELETE', error=IOError()))
+        self.assertIsNone(self.policy.next_delay(1, 'POST', error=IOError()))
+
+    def test_retry_after_seconds(self):
+        response = Response(429, '', {'Retry-After': '3'})
+
+        self.assertEqual(3, self.policy.next_delay(1, 'GET', response=response))
+
+    def test_retry_after_date(self):
+        when = datetime.now(timezone.utc) + timedelta(seconds=30)
+        response = Response(503, '', {'Retry-After': format_datetime(when, usegmt=True)})
+
+        self.assertGreater(RetryPolicy.retry_after(response), 28)
+
+    def test_retry_after_longer_than_max_delay(self):
+        response = Response(429, '', {'Retry-After': '60'})
+
+        self.assertIsNone(self.policy.next_delay(1, 'GET', response=response))
+
+    def test_invalid_policy(self):
+        with self.assertRaises(ValueError):
+            RetryPolicy(retries=-1)
+
+        with self.assertRaises(ValueError):
+            RetryPolicy(backoff=-1)
+
+
+class ClientRetryPolicyTestCase(unittest.TestCase):
+
+    def test_applied_to_http_client(self):
+        policy = RetryPolicy()
+        http_client = TwilioHttpClient()
+
+        self.assertIs(policy, Client('username', 'password', retry_policy=policy).http_client.retry_policy)
+        self.assertIs(policy, Client('username', 'password', http_client=http_client,
+                                     retry_policy=policy).http_client.retry_policy)
+
+    def test_http_client_without_retries(self):
+        with self.assertRaises(TwilioException):
+            Client('username', 'password', http_client=HttpClient(), retry_policy=RetryPolicy())
@@ -1,6 +1,11 @@
+import timeit
 import unittest
 import platform
+from urllib.parse import urlparse, urlunparse
 
+from mock import Mock
+
+from tests import run_async
 from twilio import __version__
 from twilio.rest import (
     Client,
@@ -13,7 +18,9 @@ from twilio.rest import (
     TwilioTaskRouterClient,
     TwilioTrunkingClient,
 )
+from twilio.base.exceptions import TwilioException
 from twilio.base.obsolete import ObsoleteException
+from twilio.http.async_http_client import AsyncTwilioHttpClient
 
 
 class TestDummyClients(unittest.TestCase):
@@ -99,6 +106,142 @@ class TestRegionEdgeClients(unittest.TestCase):
         self.assertEqual(self.client.get_hostname('https://api.twilio.com/path/to/something.json?foo=12.34'),
                          'https://api.edge.region.twilio.com/path/to/something.json?foo=12.34')
 
+    def test_hostname_follows_edge_and_region_changes(self):
+        self.client.edge = 'edge'
+        self.assertEqual(self.client.get_hostname('https://api.twilio.com/v1'), 'https://api.edge.us1.twilio.com/v1')
+
+        self.client.edge = 'other'
+        self.client.region = 'region'
+        self.assertEqual(self.client.get_hostname('https://api.twilio.com/v1'),
+                         'https://api.other.region.twilio.com/v1')
+
+        self.client.edge = self.client.region = None
+        self.assertEqual(self.client.get_hostname('https://api.twilio.com/v1'), 'https://api.twilio.com/v1')
+
+    def test_hostname_cache_is_bounded(self):
+        self.client.HOSTNAME_CACHE_SIZE = 2
+        self.client.region = 'region'
+
+        for domain in ('api', 'verify', 'video'):
+            self.assertEqual('https://{}.region.twilio.com/v1'.format(domain),
+                             self.client.get_hostname('https://{}.twilio.com/v1'.format(domain)))
+
+        self.assertLessEqual(len(self.client._hostnames), 2)
+
+
+class TestClientHeaders(unittest.TestCase):
+    def setUp(self):
+        self.client = Client('username', 'password')
+        self.user_agent = 'twilio-python/{} ({} {}) Python/{}'.format(
+            __version__, platform.system(), platform.machine(), platform.python_version())
+
+    def test_standard_headers(self):
+        self.assertEqual({
+            'User-Agent': self.user_agent,
+            'X-Twilio-Client': 'python-{}'.format(__version__),
+            'Accept-Charset': 'utf-8',
+            'Accept': 'application/json',
+            'Content-Type': 'application/x-www-form-urlencoded',
+        }, self.client._get_headers('POST', None))
+        self.assertNotIn('Content-Type', self.client._get_headers('GET', None))
+
+    def test_request_headers_are_merged(self):
+        headers = self.client._get_headers('POST', {'Accept': '*/*', 'User-Agent': 'other'})
+
+        self.assertEqual('*/*', headers['Accept'])
+        self.assertEqual(self.user_agent, headers['User-Agent'])
+        self.assertEqual('application/x-www-form-urlencoded', headers['Content-Type'])
+
+    def test_returned_headers_are_not_shared(self):
+        self.client._get_headers('GET', None)['Accept'] = '*/*'
+
+        self.assertEqual('application/json', self.client._get_headers('GET', None)['Accept'])
+
+    def test_user_agent_extensions_changes(self):
+        self.client._get_headers('GET', None)
+        self.client.user_agent_extensions = ['twilio-run/2.0.0-test']
+        self.assertEqual(self.user_agent + ' twilio-run/2.0.0-test',
+                         self.client._get_headers('GET', None)['User-Agent'])
+
+        self.client.user_agent_extensions.append('flex-plugin/3.4.0')
+        self.assertEqual(self.user_agent + ' twilio-run/2.0.0-test flex-plugin/3.4.0',
+                         self.client._get_headers('GET', None)['User-Agent'])
+
+    def test_request_overhead(self):
+        self.client.edge = 'sydney'
+        url = 'https://api.twilio.com/2010-04-01/Accounts/AC123/Messages.json'
+
+        def before():
+            # Building the headers and hostname of a request without the templates and cache
+            headers = {'User-Agent': 'twilio-python/{} ({} {}) Python/{}'.format(
+                __version__, platform.system(), platform.machine(), platform.python_version())}
+            for extension in self.client.user_agent_extensions:
+                headers['User-Agent'] += ' {}'.format(extension)
+            headers['X-Twilio-Client'] = 'python-{}'.format(__version__)
+            headers['Accept-Charset'] = 'utf-8'
+            headers['Accept'] = 'application/json'
+            parsed_url = urlparse(url)
+            pieces = parsed_url.netloc.split('.')
+            netloc = '.'.join([pieces[0], 'sydney', 'us1', '.'.join(pieces[-2:])])
+            return headers, urlunparse(parsed_url._replace(netloc=netloc))
+
+        def after():
+            return self.client._get_headers('GET', None), self.client.get_hostname(url)
+
+        self.assertEqual(before(), after())
+        self.assertLess(min(timeit.repeat(after, number=2000, repeat=3)),
+                        min(timeit.repeat(before, number=2000, repeat=3)))
+
+
+class TestWarmupClients(unittest.TestCase):
+    def setUp(self):
+        self.http_client = Mock(is_async=False)
+        self.client = Client('username', 'password', http_client=self.http_client)
+
+    def test_warmup_default_domain(self):
+        self.assertEqual(['https://api.twilio.com'], self.client.warmup())
+        self.http_client.warmup.assert_called_once_with(['https://api.twilio.com'], connections=1,
+                                                        keep_alive=None)
+
+    def test_warmup_resolves_hostnames(self):
+        self.client.edge = 'sydney'
+        urls = self.client.warmup(['api', 'verify', 'api'], connections=4, keep_alive=60)
+
+        self.assertEqual(['https://api.sydney.us1.twilio.com', 'https://verify.sydney.us1.twilio.com'], urls)
+        self.http_client.warmup.assert_called_once_with(urls, connections=4, keep_alive=60)
+
+    def test_warmup_unknown_domain(self):
+        for domain in ('nope', 'messages', 'request'):
+            with self.assertRaises(TwilioException):
+                self.client.warmup([domain])
+
+    def test_warmup_async(self):
+        http_client = AsyncTwilioHttpClient()
+        http_client.warmup = Mock(side_effect=lambda urls, connections: noop())
+        client = Client('username', 'password', http_client=http_client, region='ie1')
+
+        self.assertEqual(['https://messaging.ie1.twilio.com'], run_async(client.warmup_async(['messaging'])))
+        http_client.warmup.assert_called_once_with(['https://messaging.ie1.twilio.com'], connections=1)
+
+        with self.assertRaises(TwilioException):
+            client.warmup()
+        with self.assertRaises(TwilioException):
+            run_async(self.client.warmup_async())
+
+
+async def noop():
+    pass
+
+
+class TestAsyncHttpClientClients(unittest.TestCase):
+    def test_sync_request_with_async_http_client(self):
+        client = Client('username', 'password', http_client=AsyncTwilioHttpClient())
+
+        with self.assertRaises(TwilioException):
+            client.request('GET', 'https://api.twilio.com/2010-04-01/Accounts.json')
+        with self.assertRaises(TwilioException):
+            client.api.v2010.accounts('AC123').fetch()
+
 
 class TestUserAgentClients(unittest.TestCase):
     def setUp(self):
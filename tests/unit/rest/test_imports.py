@@ -0,0 +1,62 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+import twilio
+
+LAZY = '''
+import json, sys, time
+from twilio.rest import Client
+started = time.perf_counter()
+Client('ACaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa', 'token').api.v2010.account.messages
+print(json.dumps({'seconds': time.perf_counter() - started,
+                  'modules': sorted(m for m in sys.modules if m.startswith('twilio.rest.'))}))
+'''
+
+EAGER = '''
+import json, pkgutil, sys, time
+from twilio.rest import Client
+started = time.perf_counter()
+import twilio.rest.api
+for module in pkgutil.walk_packages(twilio.rest.api.__path__, 'twilio.rest.api.'):
+    __import__(module.name)
+Client('ACaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa', 'token').api.v2010.account.messages
+print(json.dumps({'seconds': time.perf_counter() - started,
+                  'modules': sorted(m for m in sys.modules if m.startswith('twilio.rest.'))}))
+'''
+
+
+def measure(script):
+    """
+    Runs `script` in a fresh interpreter, so nothing is imported yet.
+    """
+    env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(twilio.__file__)))
+    output = subprocess.check_output([sys.executable, '-c', script], env=env)
+    return json.loads(output.decode('utf-8'))
+
+
+class ImportTimeTestCase(unittest.TestCase):
+
+    def test_only_used_resources_are_imported(self):
+        self.assertEqual([
+            'twilio.rest.api',
+            'twilio.rest.api.v2010',
+            'twilio.rest.api.v2010.account',
+            'twilio.rest.api.v2010.account.message',
+        ], measure(LAZY)['modules'])
+
+    def test_resources_import_from_parent_modules(self):
+        from twilio.rest.api.v2010.account import MessageList
+        from twilio.rest.api.v2010.account.message import MessageList as message_list
+
+        self.assertIs(message_list, MessageList)
+        with self.assertRaises(ImportError):
+            from twilio.rest.api.v2010.account import UnknownList  # noqa
+
+    def test_import_time(self):
+        lazy = min(measure(LAZY)['seconds'] for _ in range(3))
+        eager = min(measure(EAGER)['seconds'] for _ in range(3))
+
+        self.assertLess(lazy, eager)
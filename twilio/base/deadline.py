@@ -0,0 +1,127 @@
+import time
+from contextvars import ContextVar
+from datetime import datetime
+
+from twilio.base.exceptions import DeadlineExceededException
+
+# Holds (deadline, outer) pairs, so leaving a deadline restores the outer one of the same context
+_current = ContextVar('twilio_deadline', default=None)
+
+
+class Deadline(object):
+    """
+    Bounds the total time of the API calls made within it: every page fetch and retry of the
+    calls shares the deadline, and the timeout of each request is shrunk to the time left.
+    A request attempted once it has passed, or timing out because of it, raises a
+    DeadlineExceededException, and retries whose backoff would outlast it are not made.
+
+    Pass it as the `deadline` of `create()`, `stream()` or `list()`, or make any calls within it:
+
+        with Deadline(5):
+            client.messages('SM123').fetch()
+
+    Nested deadlines never extend the enclosing one.
+    """
+
+    def __init__(self, deadline=None):
+        """
+        :param float|datetime deadline: Seconds from now, or the time the deadline passes.
+                                        Default is no deadline
+        """
+        if isinstance(deadline, datetime):
+            budget = (deadline - datetime.now(deadline.tzinfo)).total_seconds()
+        else:
+            budget = deadline
+        self.budget = budget
+        self._expires = time.monotonic() + budget if budget is not None else None
+
+    def remaining(self):
+        """
+        :return float: Seconds until the deadline passes, negative once it has, or None when
+                       there is no deadline
+        """
+        if self._expires is None:
+            return None
+        return self._expires - time.monotonic()
+
+    @property
+    def expired(self):
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0
+
+    def allows(self, delay):
+        """
+        :return bool: Whether the deadline passes in more than `delay` seconds
+        """
+        remaining = self.remaining()
+        return remaining is None or remaining > delay
+
+    def timeout(self, timeout=None):
+        """
+        :param float timeout: The timeout of a request, if any
+        :return float: `timeout` shrunk to the time left
+        :raises DeadlineExceededException: The deadline has passed
+        """
+        remaining = self.remaining()
+        if remaining is None:
+            return timeout
+        if remaining <= 0:
+            raise DeadlineExceededException(self.budget, -remaining)
+        return remaining if timeout is None else min(timeout, remaining)
+
+    def exceeded(self):
+        """
+        :return DeadlineExceededException: The exception to raise once the deadline has passed
+        """
+        return DeadlineExceededException(self.budget, max(0.0, -self.remaining()))
+
+    def run(self, call, *args):
+        """
+        :return: The result of `call(*args)`, made within the deadline
+        """
+        token = self._enter()
+        try:
+            return call(*args)
+        finally:
+            _current.reset(token)
+
+    async def run_async(self, call, *args):
+        """
+        :return: The result of awaiting `call(*args)`, made within the deadline
+        """
+        token = self._enter()
+        try:
+            return await call(*args)
+        finally:
+            _current.reset(token)
+
+    def _enter(self):
+        """
+        Makes the tighter of this deadline and the current one current.
+        """
+        outer = _current.get()
+        deadline = outer[0] if outer is not None else None
+        if deadline is None or deadline._expires is None:
+            deadline = self
+        elif self._expires is not None and self._expires < deadline._expires:
+            deadline = self
+        deadline.timeout()
+        return _current.set((deadline, outer))
+
+    def __enter__(self):
+        self._enter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _current.set(_current.get()[1])
+
+    def __repr__(self):
+        return '<Deadline remaining={}>'.format(self.remaining())
+
+
+def current_deadline():
+    """
+    :return Deadline: The deadline of the calls made on this thread or task, if any
+    """
+    current = _current.get()
+    return current[0] if current is not None else None
@@ -1,4 +1,5 @@
 import datetime
+from collections.abc import Mapping
 from decimal import Decimal, BasicContext
 from email.utils import parsedate
 import pytz
@@ -67,3 +68,65 @@ def integer(i):
         return int(i)
     except (TypeError, ValueError):
         return i
+
+
+class Schema(object):
+    """
+    The layout of the marshaled properties of an instance resource, shared by every
+    record of that resource so that each record only has to store its values.
+
+    :param dict fields: Maps each property to its key in the JSON payload
+    :param dict deserializers: Maps properties to the function deserializing their payload
+                               value, deserialization happens on first access
+    """
+
+    def __init__(self, fields, deserializers=None):
+        deserializers = deserializers or {}
+        self.fields = tuple(fields)
+        self.payload_keys = tuple(fields.values())
+        self.index = {field: i for i, field in enumerate(self.fields)}
+        self.deserializers = tuple(deserializers.get(field) for field in self.fields)
+
+    def load(self, payload):
+        """
+        :param dict payload: JSON-loaded representation of an instance record
+        :return Properties: The marshaled properties of the record
+        """
+        return Properties(self, tuple(payload.get(key) for key in self.payload_keys))
+
+
+class Properties(Mapping):
+    """
+    Read-only, tuple-backed marshaled properties of an instance resource. Values that need
+    deserialization are converted the first time they are read, then cached.
+    """
+    __slots__ = ('_schema', '_values', '_deserialized')
+
+    def __init__(self, schema, values):
+        self._schema = schema
+        self._values = values
+        self._deserialized = None
+
+    def __getitem__(self, key):
+        i = self._schema.index[key]
+        deserializer = self._schema.deserializers[i]
+        if deserializer is None:
+            return self._values[i]
+
+        deserialized = self._deserialized
+        if deserialized is None:
+            deserialized = self._deserialized = {}
+        try:
+            return deserialized[i]
+        except KeyError:
+            value = deserialized[i] = deserializer(self._values[i])
+            return value
+
+    def __iter__(self):
+        return iter(self._schema.fields)
+
+    def __len__(self):
+        return len(self._schema.fields)
+
+    def __repr__(self):
+        return repr(dict(self))
@@ -6,6 +6,35 @@ class TwilioException(Exception):
     pass
 
 
+class CircuitOpenException(TwilioException):
+    """ Raised instead of sending a request while the circuit breaker of its host is open
+
+    :param str host: The host whose requests are failing
+    :param float retry_in: Seconds until a request to the host is attempted again
+    """
+
+    def __init__(self, host, retry_in):
+        super(CircuitOpenException, self).__init__(
+            'Circuit open for {}, retrying in {:.1f}s'.format(host, retry_in))
+        self.host = host
+        self.retry_in = retry_in
+
+
+class DeadlineExceededException(TwilioException):
+    """ Raised instead of sending a request, or when a request timed out, once the deadline of
+    the call has passed
+
+    :param float budget: Seconds the call was given
+    :param float overrun: Seconds since the deadline passed
+    """
+
+    def __init__(self, budget, overrun):
+        super(DeadlineExceededException, self).__init__(
+            'Deadline of {:.1f}s exceeded by {:.1f}s'.format(budget, overrun))
+        self.budget = budget
+        self.overrun = overrun
+
+
 class TwilioRestException(TwilioException):
     """ A generic 400 or 500 level exception from the Twilio API
 
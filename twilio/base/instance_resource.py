@@ -1,8 +1,9 @@
 class InstanceResource(object):
+    __slots__ = ('_version',)
+
     def __init__(self, version):
         """
         :param Version version:
         """
         self._version = version
         """ :type: Version """
-
@@ -0,0 +1,178 @@
+import time
+from contextvars import ContextVar
+
+_current = ContextVar('twilio_span', default=None)
+
+
+class Span(object):
+    """
+    The timings and attributes of one call to the Twilio API.
+
+    Attribute names follow the OpenTelemetry HTTP client semantic conventions, such as
+    `http.request.method`, `server.address`, `url.template` and `http.response.status_code`,
+    plus `twilio.request_id`, `twilio.domain`, `twilio.operation`, and `twilio.cached` for
+    calls answered from the response cache.
+
+    `phases` holds the seconds spent in each phase of the call, summed over retries:
+
+    - `headers`: building the request headers
+    - `hostname`: applying the edge and region to the url
+    - `throttle`: waiting for the client-side rate limiter
+    - `prepare`: encoding the request
+    - `connect`: opening a connection, including the TLS handshake, when no pooled one was free
+    - `ttfb`: waiting for the response headers once connected
+    - `read`: reading the response body
+    - `parse`: decoding the JSON payload
+    """
+
+    def __init__(self, instrumentation, name, attributes=None):
+        """
+        :param Instrumentation instrumentation: Receives the span when it ends
+        :param str name: The span name, such as 'GET /2010-04-01/Accounts/{account_sid}/Messages.json'
+        :param dict attributes: The initial attributes
+        """
+        self.instrumentation = instrumentation
+        self.name = name
+        self.attributes = attributes or {}
+        self.phases = {}
+        self.error = None
+        self.start_time = time.time()
+        self.duration = None
+        self._started = time.monotonic()
+
+    @property
+    def ended(self):
+        return self.duration is not None
+
+    def add_phase(self, name, seconds):
+        """
+        Adds `seconds` to the time spent in phase `name`.
+        """
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def end(self, error=None):
+        """
+        Ends the span and reports it, only the first call has an effect.
+
+        :param Exception error: The exception the call failed with, if any
+        """
+        if self.ended:
+            return
+        self.duration = time.monotonic() - self._started
+        if error is not None:
+            self.error = error
+            self.attributes['error.type'] = type(error).__name__
+            code = getattr(error, 'code', None)
+            if code is not None:
+                self.attributes['twilio.error_code'] = code
+        self.instrumentation.on_end(self)
+
+    def __enter__(self):
+        self._token = _current.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _current.reset(self._token)
+
+    def __repr__(self):
+        return '<Span {}>'.format(self.name)
+
+
+class Instrumentation(object):
+    """
+    Receives a Span for every call to the Twilio API. Subclass it and override the callbacks,
+    which run on the thread (or task) making the call, so keep them fast.
+    """
+
+    def start_span(self, name, attributes=None):
+        """
+        :return Span: A new span, reported to `on_start`
+        """
+        span = Span(self, name, attributes)
+        self.on_start(span)
+        return span
+
+    def on_start(self, span):
+        """
+        Called when a call starts, with its request attributes.
+        """
+
+    def on_end(self, span):
+        """
+        Called when a call completed or failed, with its timings.
+        """
+
+    def on_instances(self, span, count, seconds):
+        """
+        Called once the records of a page are exhausted, with the number of instances built from
+        them and the seconds spent building them.
+        """
+
+
+class CompositeInstrumentation(Instrumentation):
+    """
+    Reports every call to several instrumentations, in order, such as a MetricsRegistry and an
+    OpenTelemetryInstrumentation.
+    """
+
+    def __init__(self, *instrumentations):
+        self.instrumentations = instrumentations
+
+    def on_start(self, span):
+        for instrumentation in self.instrumentations:
+            instrumentation.on_start(span)
+
+    def on_end(self, span):
+        for instrumentation in self.instrumentations:
+            instrumentation.on_end(span)
+
+    def on_instances(self, span, count, seconds):
+        for instrumentation in self.instrumentations:
+            instrumentation.on_instances(span, count, seconds)
+
+
+class OpenTelemetryInstrumentation(Instrumentation):
+    """
+    Reports every call as an OpenTelemetry client span, with its phases as `twilio.phase.<name>`
+    attributes in milliseconds. Raises ImportError if `opentelemetry-api` is not installed.
+    """
+
+    def __init__(self, tracer=None):
+        """
+        :param opentelemetry.trace.Tracer tracer: The tracer to use, defaults to the tracer of the
+                                                  global tracer provider
+        """
+        from opentelemetry import trace
+        self._trace = trace
+        self.tracer = tracer or trace.get_tracer('twilio')
+
+    def on_end(self, span):
+        attributes = {k: v for k, v in span.attributes.items() if v is not None}
+        for name, seconds in span.phases.items():
+            attributes['twilio.phase.{}'.format(name)] = seconds * 1000
+
+        otel_span = self.tracer.start_span(span.name, kind=self._trace.SpanKind.CLIENT, attributes=attributes,
+                                           start_time=int(span.start_time * 1e9))
+        if span.error is not None:
+            otel_span.record_exception(span.error)
+            otel_span.set_status(self._trace.Status(self._trace.StatusCode.ERROR))
+        otel_span.end(end_time=int((span.start_time + span.duration) * 1e9))
+
+
+def current_span():
+    """
+    :return Span: The span of the call in progress on this thread or task, if any
+    """
+    return _current.get()
+
+
+def record_phase(name, seconds):
+    """
+    Adds `seconds` to phase `name` of the current span, if any.
+    """
+    span = _current.get()
+    if span is not None:
+        span.add_phase(name, seconds)
@@ -0,0 +1,90 @@
+import json
+
+
+class JSONCodec(object):
+    """
+    Encodes and decodes JSON with the standard library `json` module.
+    """
+    name = 'json'
+
+    def loads(self, data):
+        """
+        :param str|bytes data: A JSON document
+        :return: The decoded document
+        """
+        return json.loads(data)
+
+    def dumps(self, obj):
+        """
+        :param obj: A JSON-serializable object
+        :return str: The encoded document
+        """
+        return json.dumps(obj)
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    Encodes and decodes JSON with `orjson`, raises ImportError if it is not installed.
+    """
+    name = 'orjson'
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+
+    def loads(self, data):
+        return self._orjson.loads(data)
+
+    def dumps(self, obj):
+        return self._orjson.dumps(obj).decode('utf-8')
+
+
+class UjsonCodec(JSONCodec):
+    """
+    Encodes and decodes JSON with `ujson`, raises ImportError if it is not installed.
+    """
+    name = 'ujson'
+
+    def __init__(self):
+        import ujson
+        self._ujson = ujson
+
+    def loads(self, data):
+        return self._ujson.loads(data)
+
+    def dumps(self, obj):
+        return self._ujson.dumps(obj, ensure_ascii=False)
+
+
+def fastest():
+    """
+    :return JSONCodec: The fastest codec whose library is installed, in order orjson, ujson
+                       and the standard library.
+    """
+    for codec in (OrjsonCodec, UjsonCodec):
+        try:
+            return codec()
+        except ImportError:
+            continue
+    return JSONCodec()
+
+
+_default = JSONCodec()
+
+
+def get_default():
+    """
+    :return JSONCodec: The codec used when a client does not configure one, and to
+                       serialize JSON request parameters.
+    """
+    return _default
+
+
+def set_default(codec):
+    """
+    Swap the process-wide JSON codec, e.g. `set_default(fastest())`.
+
+    :param JSONCodec codec: The codec to use, or None to restore the standard library codec
+    """
+    global _default
+    _default = codec or JSONCodec()
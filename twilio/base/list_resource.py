@@ -1,3 +1,12 @@
+import datetime
+import heapq
+from collections.abc import Mapping
+from queue import Full, Queue
+from threading import Event, Thread
+
+from twilio.base import deserialize, values
+
+
 class ListResource(object):
     def __init__(self, version):
         """
@@ -5,3 +14,175 @@ class ListResource(object):
         """
         self._version = version
         """ :type: Version """
+
+    def stream_sharded(self, shards=4, limit=None, page_size=None, ordered=False, **filters):
+        """
+        Streams records from the API by splitting a time window into `shards` sub-windows and
+        reading each one concurrently through its own pagination chain.
+
+        The window is given as a `<field>_after` / `<field>_before` pair of datetimes among
+        the filters accepted by `stream()`, e.g. `date_sent_after`/`date_sent_before` for
+        Messages or `start_time_after`/`start_time_before` for Calls. All other filters are
+        passed to every shard unchanged. Naive datetimes are taken to be in UTC.
+
+        :param int shards: Number of sub-windows to read concurrently
+        :param int limit: Upper limit for the number of records to return across all shards.
+                          Default is no limit
+        :param int page_size: Number of records to fetch per request in each shard
+        :param bool ordered: Yield records newest first by `<field>`, like the API orders a
+                             single listing, instead of as soon as any shard produces them
+        :param filters: Filters for `stream()`, including the window pair, and `raw`
+
+        :returns: Generator that will yield up to limit results
+        """
+        field, after, before = self._shard_window(filters)
+        if shards < 1:
+            raise ValueError(shards)
+
+        step = (before - after) / shards
+        bounds = [after + step * i for i in range(shards)] + [before]
+        windows = [dict(filters, **{
+            field + '_after': bounds[i],
+            field + '_before': bounds[i + 1],
+        }) for i in range(shards)]
+
+        stopped = Event()
+        buffers = [Queue(maxsize=page_size or 50) for _ in windows]
+
+        def put(buffer, item):
+            while not stopped.is_set():
+                try:
+                    return buffer.put(item, timeout=0.1)
+                except Full:
+                    continue
+
+        def produce(buffer, window):
+            try:
+                for record in self.stream(limit=limit, page_size=page_size, **window):
+                    if stopped.is_set():
+                        return
+                    put(buffer, (record, None))
+            except Exception as e:
+                put(buffer, (None, e))
+            put(buffer, (None, None))
+
+        def drain(buffer):
+            while True:
+                record, error = buffer.get()
+                if error is not None:
+                    raise error
+                if record is None:
+                    return
+                yield record
+
+        if ordered:
+            # Records without a timestamp yet (e.g. queued messages) sort last
+            earliest = datetime.datetime.min.replace(tzinfo=after.tzinfo)
+            records = heapq.merge(*[drain(b) for b in buffers],
+                                  key=lambda r: self._shard_stamp(r, field) or earliest, reverse=True)
+        else:
+            merged = Queue(maxsize=page_size or 50)
+            buffers = [merged] * len(windows)
+            records = self._drain_unordered(merged, len(windows))
+
+        workers = [Thread(target=produce, args=(buffers[i], window),
+                          name='twilio-shard-{}'.format(i), daemon=True)
+                   for i, window in enumerate(windows)]
+        for worker in workers:
+            worker.start()
+
+        # Windows share their boundary instant, so a record stamped on a boundary can be
+        # returned by both neighbouring shards; remember those to only yield them once.
+        edges = bounds[1:-1]
+        boundary_sids = set()
+        count = 0
+        try:
+            for record in records:
+                stamp = self._shard_stamp(record, field)
+                if isinstance(stamp, datetime.datetime) and \
+                        any(abs(stamp - edge) <= datetime.timedelta(seconds=1) for edge in edges):
+                    sid = record['sid'] if isinstance(record, Mapping) else record.sid
+                    if sid in boundary_sids:
+                        continue
+                    boundary_sids.add(sid)
+
+                yield record
+                count += 1
+                if limit and limit is not values.unset and count >= limit:
+                    return
+        finally:
+            stopped.set()
+
+    def list_sharded(self, shards=4, limit=None, page_size=None, ordered=False, **filters):
+        """
+        Lists records from the API by reading `shards` sub-windows of a time window
+        concurrently. Unlike stream_sharded(), this operation is eager and will load
+        `limit` records into memory before returning.
+
+        :param int shards: Number of sub-windows to read concurrently
+        :param int limit: Upper limit for the number of records to return across all shards.
+                          Default is no limit
+        :param int page_size: Number of records to fetch per request in each shard
+        :param bool ordered: Return records newest first by `<field>`
+        :param filters: Filters for `stream()`, including the window pair
+
+        :returns: list of up to limit results
+        """
+        return list(self.stream_sharded(
+            shards=shards,
+            limit=limit,
+            page_size=page_size,
+            ordered=ordered,
+            **filters
+        ))
+
+    @staticmethod
+    def _shard_window(filters):
+        """
+        Finds the `<field>_after` / `<field>_before` pair in `filters`.
+
+        :return tuple: (field, after, before)
+        """
+        pairs = [key[:-len('_after')] for key in filters
+                 if key.endswith('_after') and key[:-len('_after')] + '_before' in filters]
+        if len(pairs) != 1:
+            raise ValueError('stream_sharded() requires exactly one <field>_after/<field>_before filter pair')
+
+        field = pairs[0]
+        after, before = filters.pop(field + '_after'), filters.pop(field + '_before')
+        if not isinstance(after, datetime.datetime) or not isinstance(before, datetime.datetime):
+            raise ValueError('{0}_after and {0}_before must be datetimes'.format(field))
+        # Records are stamped in UTC, so naive bounds are taken to be UTC to compare with them
+        if after.tzinfo is None:
+            after = after.replace(tzinfo=datetime.timezone.utc)
+        if before.tzinfo is None:
+            before = before.replace(tzinfo=datetime.timezone.utc)
+        if after >= before:
+            raise ValueError('{0}_after must be earlier than {0}_before'.format(field))
+
+        return field, after, before
+
+    @staticmethod
+    def _shard_stamp(record, field):
+        """
+        :return datetime: The `field` timestamp of an instance or of a raw record, if any
+        """
+        if not isinstance(record, Mapping):
+            return getattr(record, field)
+        value = record.get(field)
+        stamp = deserialize.iso8601_datetime(value)
+        return stamp if isinstance(stamp, datetime.datetime) else deserialize.rfc2822_datetime(value)
+
+    @staticmethod
+    def _drain_unordered(buffer, producers):
+        """
+        Generates records from a buffer shared by `producers` until each of them is done.
+        """
+        while producers:
+            record, error = buffer.get()
+            if error is not None:
+                raise error
+            if record is None:
+                producers -= 1
+                continue
+            yield record
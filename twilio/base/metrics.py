@@ -0,0 +1,155 @@
+from bisect import bisect_left
+from threading import Lock
+
+from twilio.base.instrumentation import Instrumentation
+
+
+class _Series(object):
+    """
+    The aggregates of the calls to one resource with one method.
+    """
+    __slots__ = ('count', 'statuses', 'errors', 'retries', 'duration_sum', 'buckets')
+
+    def __init__(self, buckets):
+        self.count = 0
+        self.statuses = {}
+        self.errors = {}
+        self.retries = 0
+        self.duration_sum = 0.0
+        self.buckets = [0] * (buckets + 1)
+
+
+class MetricsRegistry(Instrumentation):
+    """
+    Aggregates request counts, error counts by Twilio error code, retries and latency histograms
+    per domain, resource path template and method.
+
+    Recording a call costs a bisect and a few additions under one of `stripes` locks, chosen by
+    the resource, so threads calling different resources rarely contend. Pass the registry as
+    the `instrumentation` of a Client and read it with `snapshot()` or `to_prometheus()`.
+    """
+    DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    """ Upper bounds in seconds of the latency histogram buckets """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS, stripes=16):
+        """
+        :param tuple buckets: Upper bounds in seconds of the latency histogram buckets
+        :param int stripes: Number of locks the series are spread over
+        """
+        if not buckets:
+            raise ValueError(buckets)
+        if stripes <= 0:
+            raise ValueError(stripes)
+
+        self.buckets = tuple(sorted(buckets))
+        self._stripes = [(Lock(), {}) for _ in range(stripes)]
+
+    def on_end(self, span):
+        attributes = span.attributes
+        key = (attributes.get('twilio.domain'), attributes.get('url.template'),
+               attributes.get('http.request.method'))
+        status = attributes.get('http.response.status_code')
+        error = attributes.get('twilio.error_code') or attributes.get('error.type')
+        if error is None and status is not None and status >= 400:
+            error = status
+        if status is None:
+            # no response came back: the call was answered from the cache, or failed before
+            status = 'cached' if attributes.get('twilio.cached') else 'error'
+        retries = attributes.get('http.request.resend_count', 0)
+        bucket = bisect_left(self.buckets, span.duration)
+
+        lock, series = self._stripes[hash(key) % len(self._stripes)]
+        with lock:
+            aggregate = series.get(key)
+            if aggregate is None:
+                aggregate = series[key] = _Series(len(self.buckets))
+            aggregate.count += 1
+            aggregate.duration_sum += span.duration
+            aggregate.buckets[bucket] += 1
+            aggregate.retries += retries
+            aggregate.statuses[status] = aggregate.statuses.get(status, 0) + 1
+            if error is not None:
+                aggregate.errors[error] = aggregate.errors.get(error, 0) + 1
+
+    def snapshot(self):
+        """
+        :return list[dict]: One dict per domain, resource and method, with the number of calls
+                            (`count`) and their `statuses` ('cached' for cache hits, 'error' for
+                            calls failing without a response), `errors` by Twilio error code (or
+                            exception type, or status), `retries`, `duration_sum` and
+                            cumulative `buckets` as (upper bound, count) pairs
+        """
+        snapshot = []
+        for lock, series in self._stripes:
+            with lock:
+                for (domain, resource, method), aggregate in series.items():
+                    cumulative, buckets = 0, []
+                    for bound, count in zip(self.buckets + (float('inf'),), aggregate.buckets):
+                        cumulative += count
+                        buckets.append((bound, cumulative))
+                    snapshot.append({
+                        'domain': domain,
+                        'resource': resource,
+                        'method': method,
+                        'count': aggregate.count,
+                        'statuses': dict(aggregate.statuses),
+                        'errors': dict(aggregate.errors),
+                        'retries': aggregate.retries,
+                        'duration_sum': aggregate.duration_sum,
+                        'buckets': buckets,
+                    })
+        return sorted(snapshot, key=lambda s: (s['domain'] or '', s['resource'] or '', s['method'] or ''))
+
+    def reset(self):
+        """
+        Discards every recorded call.
+        """
+        for lock, series in self._stripes:
+            with lock:
+                series.clear()
+
+
+def to_prometheus(registry, prefix='twilio'):
+    """
+    Exports a registry in the Prometheus text exposition format.
+
+    :param MetricsRegistry registry: The registry to export
+    :param str prefix: Prefix of the metric names
+    :return str: The metrics `<prefix>_requests_total`, `<prefix>_errors_total`,
+                 `<prefix>_retries_total` and the `<prefix>_request_duration_seconds` histogram
+    """
+    requests, errors, retries, durations = [], [], [], []
+    for series in registry.snapshot():
+        labels = 'domain="{}",resource="{}",method="{}"'.format(
+            _escape(series['domain']), _escape(series['resource']), _escape(series['method']))
+        for status, count in sorted(series['statuses'].items(), key=lambda item: str(item[0])):
+            requests.append('{}_requests_total{{{},status="{}"}} {}'.format(prefix, labels, status, count))
+        for code, count in sorted(series['errors'].items(), key=lambda item: str(item[0])):
+            errors.append('{}_errors_total{{{},code="{}"}} {}'.format(prefix, labels, _escape(code), count))
+        retries.append('{}_retries_total{{{}}} {}'.format(prefix, labels, series['retries']))
+        for bound, count in series['buckets']:
+            durations.append('{}_request_duration_seconds_bucket{{{},le="{}"}} {}'.format(
+                prefix, labels, '+Inf' if bound == float('inf') else repr(bound), count))
+        durations.append('{}_request_duration_seconds_sum{{{}}} {!r}'.format(prefix, labels, series['duration_sum']))
+        durations.append('{}_request_duration_seconds_count{{{}}} {}'.format(prefix, labels, series['count']))
+
+    lines = []
+    for name, kind, help_text, samples in (
+        ('requests_total', 'counter', 'Completed Twilio API calls', requests),
+        ('errors_total', 'counter', 'Failed Twilio API calls by error code', errors),
+        ('retries_total', 'counter', 'Retried Twilio API requests', retries),
+        ('request_duration_seconds', 'histogram', 'Duration of Twilio API calls', durations),
+    ):
+        lines.append('# HELP {}_{} {}'.format(prefix, name, help_text))
+        lines.append('# TYPE {}_{} {}'.format(prefix, name, kind))
+        lines.extend(samples)
+    return '\n'.join(lines) + '\n'
+
+
+def _escape(value):
+    """
+    :return str: `value` escaped for a Prometheus label
+    """
+    if value is None:
+        return ''
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
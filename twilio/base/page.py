@@ -1,6 +1,9 @@
-import json
+import time
 
+from twilio.base import json_codec
 from twilio.base.exceptions import TwilioException
+from twilio.base.instrumentation import Span
+from twilio.base.page_parser import LazyRecords, parse_page
 
 
 class Page(object):
@@ -23,14 +26,33 @@ class Page(object):
         'start',
         'uri'
     }
+    STREAM_THRESHOLD = None
+    """
+    Bodies larger than this many bytes have their records decoded one at a time as the page is
+    iterated, instead of all at once, e.g. set `Page.STREAM_THRESHOLD = 256 * 1024`. Only the
+    decoded records are saved: the body is still read whole and stays in memory while the page is
+    iterated, and the http client's `last_response` keeps it until the next request. Streamed
+    pages parse several times slower. Default is to decode every body at once
+    """
 
     def __init__(self, version, response):
-        payload = self.process_response(response)
+        span = getattr(response, 'span', None)
+        if isinstance(span, Span) and not span.ended:
+            response.span = None
+            payload = self._process_traced_response(span, response, version.codec)
+        else:
+            span = None
+            payload = self.process_response(response, version.codec)
 
         self._version = version
-        self._payload = payload
         self._solution = {}
         self._records = iter(self.load_page(payload))
+        # Only keep the page metadata, lazily parsed records are owned by `_records`
+        self._payload = {k: v for k, v in payload.items() if not isinstance(v, LazyRecords)}
+        self._span = span
+        self._template = span.attributes.get('url.template') if span is not None else None
+        self._instances = 0
+        self._instances_time = 0.0
 
     def __iter__(self):
         """
@@ -45,20 +67,60 @@ class Page(object):
         """
         Returns the next record in the `Page`.
         """
-        return self.get_instance(next(self._records))
+        if self._span is None:
+            return self.get_instance(next(self._records))
+
+        try:
+            record = next(self._records)
+        except StopIteration:
+            span, self._span = self._span, None
+            span.instrumentation.on_instances(span, self._instances, self._instances_time)
+            raise
+
+        started = time.monotonic()
+        instance = self.get_instance(record)
+        self._instances += 1
+        self._instances_time += time.monotonic() - started
+        return instance
+
+    def raw_records(self):
+        """
+        Returns an iterator over the remaining records of the `Page` as JSON-loaded
+        dicts, without building instances.
+        """
+        return self._records
 
     @classmethod
-    def process_response(cls, response):
+    def process_response(cls, response, codec=None):
         """
         Load a JSON response.
 
         :param Response response: The HTTP response.
-        :return dict: The JSON-loaded content.
+        :param JSONCodec codec: The codec decoding the response, defaults to json_codec.get_default()
+        :return dict: The JSON-loaded content. Bodies over STREAM_THRESHOLD are loaded with
+                      their record arrays left as LazyRecords.
         """
         if response.status_code != 200:
             raise TwilioException('Unable to fetch page', response)
 
-        return json.loads(response.text)
+        codec = codec or json_codec.get_default()
+        if cls.STREAM_THRESHOLD is not None and len(response.body) > cls.STREAM_THRESHOLD:
+            return parse_page(response.body, codec)
+        return codec.loads(response.body)
+
+    def _process_traced_response(self, span, response, codec):
+        """
+        Loads a JSON response, timing it as the `parse` phase of `span`, and ends `span`.
+        """
+        started = time.monotonic()
+        try:
+            payload = self.process_response(response, codec)
+        except Exception as e:
+            span.end(e)
+            raise
+        span.add_phase('parse', time.monotonic() - started)
+        span.end()
+        return payload
 
     def load_page(self, payload):
         """
@@ -116,7 +178,19 @@ class Page(object):
         if not self.next_page_url:
             return None
 
-        response = self._version.domain.twilio.request('GET', self.next_page_url)
+        response = self._get(self.next_page_url)
+        cls = type(self)
+        return cls(self._version, response, self._solution)
+
+    async def next_page_async(self):
+        """
+        Asynchronously return the `Page` after this one.
+        :return Page: The next page.
+        """
+        if not self.next_page_url:
+            return None
+
+        response = await self._get_async(self.next_page_url)
         cls = type(self)
         return cls(self._version, response, self._solution)
 
@@ -128,9 +202,59 @@ class Page(object):
         if not self.previous_page_url:
             return None
 
-        response = self._version.domain.twilio.request('GET', self.previous_page_url)
+        response = self._get(self.previous_page_url)
         cls = type(self)
         return cls(self._version, response, self._solution)
 
+    async def previous_page_async(self):
+        """
+        Asynchronously return the `Page` before this one.
+        :return Page: The previous page.
+        """
+        if not self.previous_page_url:
+            return None
+
+        response = await self._get_async(self.previous_page_url)
+        cls = type(self)
+        return cls(self._version, response, self._solution)
+
+    def _get(self, url):
+        """
+        Requests another page, under a span of its own when the client is instrumented.
+        """
+        span = self._version._start_span('page', 'GET', template=self._template)
+        return self._version._traced_page(span, lambda: self._request(url))
+
+    async def _get_async(self, url):
+        """
+        Asynchronously requests another page, under a span of its own when the client is
+        instrumented.
+        """
+        span = self._version._start_span('page', 'GET', template=self._template)
+        return await self._version._traced_page_async(span, lambda: self._request_async(url))
+
+    def _request(self, url):
+        """
+        Requests another page, through the response cache of the client when it has one.
+        """
+        twilio = self._version.domain.twilio
+        cache = getattr(twilio, 'response_cache', None)
+        if cache is None:
+            return twilio.request('GET', url)
+        return cache.request(lambda headers: twilio.request('GET', url, headers=headers), 'GET', url,
+                             account=twilio.username)
+
+    async def _request_async(self, url):
+        """
+        Asynchronously requests another page, through the response cache of the client when it
+        has one.
+        """
+        twilio = self._version.domain.twilio
+        cache = getattr(twilio, 'response_cache', None)
+        if cache is None:
+            return await twilio.request_async('GET', url)
+        return await cache.request_async(lambda headers: twilio.request_async('GET', url, headers=headers),
+                                         'GET', url, account=twilio.username)
+
     def __repr__(self):
         return '<Page>'
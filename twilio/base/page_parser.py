@@ -0,0 +1,101 @@
+import re
+
+_STRING = r'"[^"\\]*(?:\\.[^"\\]*)*"'
+_BRACKET = r'(?P<object>\{)|(?P<array>\[)|(?P<close>[\]}])'
+# Any structural token, for the page object and its top-level arrays
+_TOKEN = r'(?P<string>' + _STRING + r')|' + _BRACKET + r'|(?P<comma>,)|(?P<colon>:)'
+# Everything up to and including the next bracket, for skipping over records
+_SKIP = r'[^"\[\]{}]*(?:' + _STRING + r'[^"\[\]{}]*)*(?:' + _BRACKET + r')'
+
+_PATTERNS = {
+    str: (re.compile(_TOKEN, re.DOTALL), re.compile(_SKIP, re.DOTALL)),
+    bytes: (re.compile(_TOKEN.encode('ascii'), re.DOTALL), re.compile(_SKIP.encode('ascii'), re.DOTALL)),
+}
+
+
+class LazyRecords(object):
+    """
+    The records of a top-level array in a page body, each one decoded only when it is reached.
+    """
+
+    def __init__(self, body, spans, codec):
+        """
+        :param str|bytes body: The page body
+        :param list spans: (start, end) offsets of every record in `body`
+        :param JSONCodec codec: The codec decoding each record
+        """
+        self._body = body
+        self._spans = spans
+        self._codec = codec
+
+    def __iter__(self):
+        body, codec = self._body, self._codec
+        for start, end in self._spans:
+            yield codec.loads(body[start:end])
+
+    def __len__(self):
+        return len(self._spans)
+
+    def __repr__(self):
+        return '<LazyRecords ({})>'.format(len(self._spans))
+
+
+def parse_page(body, codec):
+    """
+    Parses a list page without decoding its records: every top-level member is decoded
+    except arrays, which are returned as LazyRecords that decode one record at a time.
+
+    :param str|bytes body: The page body, a JSON object
+    :param JSONCodec codec: The codec decoding the members and records
+    :return dict: The page payload
+    """
+    token_pattern, skip_pattern = _PATTERNS[type(body)]
+    first = token_pattern.search(body)
+    if first is None or first.lastgroup != 'object' or body[:first.start()].strip():
+        return codec.loads(body)
+
+    payload = {}
+    depth = 1
+    position = first.end()
+    key = start = spans = element = None
+
+    while True:
+        # Inside a record only brackets matter, skip straight to the next one
+        token = (skip_pattern.match if depth > 2 else token_pattern.search)(body, position)
+        if token is None:
+            break
+        position = token.end()
+        kind = token.lastgroup
+
+        if kind == 'object' or kind == 'array':
+            depth += 1
+            if depth == 2 and kind == 'array':
+                spans, element = [], token.end()
+        elif kind == 'close':
+            if depth == 2 and spans is not None and body[element:token.start()].strip():
+                spans.append((element, token.start()))
+            depth -= 1
+            if depth == 0:
+                if key is not None:
+                    payload[key] = _member(body, start, token.start(), spans, codec)
+                return payload
+        elif depth == 1:
+            if kind == 'string' and start is None:
+                key = codec.loads(token.group())
+            elif kind == 'colon':
+                start = token.end()
+            elif kind == 'comma':
+                payload[key] = _member(body, start, token.start(), spans, codec)
+                key = start = spans = None
+        elif depth == 2 and kind == 'comma' and spans is not None:
+            spans.append((element, token.start()))
+            element = token.end()
+
+    # Truncated or malformed, let the codec raise its usual error
+    return codec.loads(body)
+
+
+def _member(body, start, end, spans, codec):
+    if spans is not None:
+        return LazyRecords(body, spans, codec)
+    return codec.loads(body[start:end])
@@ -0,0 +1,272 @@
+import re
+import time
+from collections import OrderedDict
+from fnmatch import translate
+from threading import Lock
+from urllib.parse import urlencode, urlsplit
+
+from twilio.base.instrumentation import current_span
+from twilio.http.response import Response
+
+
+class CacheRule(object):
+    """
+    How long GET responses of the matching resources are served from the cache.
+    """
+
+    def __init__(self, ttl, domain=None, path=None):
+        """
+        :param float ttl: Seconds a response is fresh. Once stale it is revalidated with the API
+                          when it carries an `ETag` or `Last-Modified` header
+        :param str domain: Twilio domain the rule applies to, such as 'pricing' or 'messaging'.
+                           Default is every domain
+        :param str path: Pattern the end of the request path must match, such as
+                         '/Voice/Countries/*' or '/Services/*'. Default is every path
+        """
+        if ttl <= 0:
+            raise ValueError(ttl)
+
+        self.ttl = ttl
+        self.domain = domain
+        self.path = path
+        self._path = re.compile(translate('*' + path)) if path else None
+
+    def matches(self, domain, path):
+        """
+        :return bool: Whether the rule applies to a request
+        """
+        return (self.domain is None or self.domain == domain) and \
+            (self._path is None or self._path.match(path) is not None)
+
+
+class CacheEntry(object):
+    """
+    A cached response. Entries only hold plain values so shared backends can pickle them.
+    """
+    __slots__ = ('status_code', 'body', 'headers', 'encoding', 'expires', 'etag', 'last_modified')
+
+    def __init__(self, status_code, body, headers, encoding, expires, etag=None, last_modified=None):
+        self.status_code = status_code
+        self.body = body
+        self.headers = headers
+        self.encoding = encoding
+        self.expires = expires
+        self.etag = etag
+        self.last_modified = last_modified
+
+    @classmethod
+    def from_response(cls, response, expires):
+        headers = response.headers or {}
+        return cls(response.status_code, response.body, dict(headers), response.encoding, expires,
+                   headers.get('ETag'), headers.get('Last-Modified'))
+
+    def to_response(self):
+        response = Response(self.status_code, self.body, self.headers, self.encoding)
+        response.cached = True
+        return response
+
+
+class LRUCacheBackend(object):
+    """
+    An in-memory backend keeping the `max_entries` most recently used responses.
+
+    A backend shared between processes, such as one storing entries in Redis or memcached, only
+    needs the same `get`, `set` and `delete` methods.
+    """
+
+    def __init__(self, max_entries=1024):
+        """
+        :param int max_entries: Maximum number of responses kept
+        """
+        if max_entries <= 0:
+            raise ValueError(max_entries)
+
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key):
+        """
+        :return CacheEntry: The entry stored under `key`, or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key, entry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class ResponseCache(object):
+    """
+    Serves GET responses of the resources matching a CacheRule from a cache while they are
+    fresh, and revalidates stale responses that carry an `ETag` or `Last-Modified` header with a
+    conditional request, so an unchanged resource costs a `304 Not Modified` instead of a full
+    response. Any other method sent to a cached url evicts every response cached for it, whatever
+    their query strings, so a POST to a list also evicts its cached pages.
+
+    Responses are cached per account, so a cache may be shared by clients of different accounts.
+    """
+
+    def __init__(self, rules, backend=None):
+        """
+        :param list[CacheRule] rules: The rules, the first one matching a request applies
+        :param backend: Stores the responses, defaults to an LRUCacheBackend
+        """
+        self.rules = list(rules)
+        self.backend = backend if backend is not None else LRUCacheBackend()
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self._lock = Lock()
+
+    def stats(self):
+        """
+        :return dict: Number of responses served fresh from the cache (hits), fetched from the
+                      API (misses) and confirmed unchanged by a 304 (revalidations)
+        """
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'revalidations': self.revalidations}
+
+    def request(self, send, method, url, params=None, headers=None, account=None):
+        """
+        Makes a request through the cache.
+
+        :param callable send: Called as send(headers) to request `url` from the API
+        :param str method: The HTTP method
+        :param str url: The fully qualified url
+        :param dict params: Query parameters
+        :param dict headers: The request headers
+        :param str account: The account making the request
+        :return Response: The response
+        """
+        key, rule, entry, response = self._lookup(method, url, params, account)
+        if response is not None:
+            return response
+        if rule is None:
+            return send(headers)
+        return self._store(key, rule, entry, send(self._conditional_headers(entry, headers)))
+
+    async def request_async(self, send, method, url, params=None, headers=None, account=None):
+        """
+        Makes an asynchronous request through the cache.
+
+        :param callable send: Called as send(headers), returns a coroutine requesting `url`
+        """
+        key, rule, entry, response = self._lookup(method, url, params, account)
+        if response is not None:
+            return response
+        if rule is None:
+            return await send(headers)
+        return self._store(key, rule, entry, await send(self._conditional_headers(entry, headers)))
+
+    def _lookup(self, method, url, params, account):
+        """
+        :return tuple: The key, rule and entry of a cacheable request, along with the cached
+                       response when it is fresh
+        """
+        parts = urlsplit(url)
+        domain = parts.netloc.split('.', 1)[0]
+        for rule in self.rules:
+            if rule.matches(domain, parts.path):
+                break
+        else:
+            return None, None, None, None
+
+        if method.upper() != 'GET':
+            self._evict(self._index_key(self._key(url, None, account)))
+            return None, None, None, None
+
+        key = self._key(url, params, account)
+        entry = self.backend.get(key)
+        if entry is not None and key not in (self.backend.get(self._index_key(key)) or ()):
+            entry = None
+        if entry is not None and entry.expires > time.time():
+            self._count('hits')
+            span = current_span()
+            if span is not None:
+                span.set_attribute('twilio.cached', True)
+            return key, rule, entry, entry.to_response()
+        return key, rule, entry, None
+
+    def _store(self, key, rule, entry, response):
+        """
+        Caches a response, or refreshes `entry` when the response confirms it is unchanged.
+
+        :return Response: The response to return to the caller
+        """
+        expires = time.time() + rule.ttl
+        if response.status_code == 304 and entry is not None:
+            self._count('revalidations')
+            entry.expires = expires
+            self.backend.set(key, entry)
+            return entry.to_response()
+
+        self._count('misses')
+        if response.status_code == 200:
+            self.backend.set(key, CacheEntry.from_response(response, expires))
+            index = self._index_key(key)
+            keys = self.backend.get(index) or frozenset()
+            if key not in keys:
+                self.backend.set(index, keys | {key})
+        return response
+
+    def _evict(self, index):
+        """
+        Evicts the responses listed in a url's index, along with the index.
+        """
+        for key in self.backend.get(index) or ():
+            self.backend.delete(key)
+        self.backend.delete(index)
+
+    @staticmethod
+    def _conditional_headers(entry, headers):
+        """
+        :return dict: `headers` along with the validators of a stale entry
+        """
+        if entry is None or (entry.etag is None and entry.last_modified is None):
+            return headers
+
+        headers = dict(headers or {})
+        if entry.etag is not None:
+            headers['If-None-Match'] = entry.etag
+        if entry.last_modified is not None:
+            headers['If-Modified-Since'] = entry.last_modified
+        return headers
+
+    @staticmethod
+    def _key(url, params, account):
+        """
+        :return str: The cache key of a request, a string so any backend can store it
+        """
+        query = urlencode(sorted((k, v) for k, v in params.items() if v is not None), doseq=True) \
+            if params else ''
+        return '{} {}?{}'.format(account or '', url, query)
+
+    @staticmethod
+    def _index_key(key):
+        """
+        The index of a url lists the keys of its cached responses, so they can all be evicted
+        together. Entries missing from their index, because the backend dropped the index or
+        two responses were stored at once, are treated as not cached.
+
+        :return str: The key of the index of the url of the cache key `key`
+        """
+        return key.partition('?')[0]
+
+    def _count(self, name):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
@@ -1,7 +1,6 @@
 import datetime
-import json
 
-from twilio.base import values
+from twilio.base import json_codec, values
 
 
 def iso8601_date(d):
@@ -68,7 +67,7 @@ def object(obj):
     return obj untouched
     """
     if isinstance(obj, dict) or isinstance(obj, list):
-        return json.dumps(obj)
+        return json_codec.get_default().dumps(obj)
     return obj
 
 
@@ -0,0 +1,101 @@
+import asyncio
+from threading import Event, Lock
+
+from twilio.base.deadline import current_deadline
+
+
+class _Call(object):
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight(object):
+    """
+    Coalesces identical concurrent fetches: while a fetch is in flight, callers making the same
+    fetch wait for its result instead of sending their own request.
+
+    Every waiter receives the same parsed payload, or the same exception. Only fetches already
+    in flight are shared, nothing is kept once a fetch completes.
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._futures = {}
+        self._lock = Lock()
+
+    def do(self, key, fetch):
+        """
+        Calls `fetch`, unless a call for `key` is in flight, in which case its result is waited for.
+
+        :param key: Identifies identical fetches
+        :param callable fetch: Makes the fetch and returns its payload
+        :return: The payload
+        :raises DeadlineExceededException: The current deadline passes while waiting for another call
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            deadline = current_deadline()
+            remaining = deadline.remaining() if deadline is not None else None
+            if not call.done.wait(max(0.0, remaining) if remaining is not None else None):
+                raise deadline.exceeded()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fetch()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    async def do_async(self, key, fetch):
+        """
+        Awaits `fetch()`, unless a call for `key` is in flight on the running event loop, in which
+        case its result is awaited.
+
+        :param key: Identifies identical fetches
+        :param callable fetch: Returns a coroutine making the fetch and returning its payload
+        :return: The payload
+        :raises DeadlineExceededException: The current deadline passes while waiting for another call
+        """
+        key = (asyncio.get_running_loop(), key)
+        future = self._futures.get(key)
+        if future is not None:
+            deadline = current_deadline()
+            remaining = deadline.remaining() if deadline is not None else None
+            try:
+                # shielded so a cancelled caller does not cancel the fetch of the others
+                return await asyncio.wait_for(asyncio.shield(future),
+                                              max(0.0, remaining) if remaining is not None else None)
+            except asyncio.TimeoutError:
+                if future.done():
+                    raise
+                raise deadline.exceeded() from None
+
+        future = self._futures[key] = asyncio.ensure_future(fetch())
+        future.add_done_callback(lambda _: self._done(key, future))
+        return await asyncio.shield(future)
+
+    def _done(self, key, future):
+        """
+        Forgets a completed fetch, marking its error as retrieved for when every caller waiting
+        on it was cancelled.
+        """
+        if self._futures.get(key) is future:
+            del self._futures[key]
+        if not future.cancelled():
+            future.exception()
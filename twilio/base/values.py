@@ -9,3 +9,29 @@ def of(d):
     :return dict: A dict with unset values removed.
     """
     return {k: v for k, v in d.items() if v != unset}
+
+
+class ResourceUri(str):
+    """
+    A resource uri that remembers the template it was formatted from, such as
+    '/Accounts/{account_sid}/Messages.json', so requests can be grouped by resource.
+    """
+
+    def __new__(cls, template, solution):
+        """
+        :param str template: The uri template
+        :param dict solution: The values of the template parameters
+        """
+        return _resource_uri(template.format(**solution), template)
+
+    def __reduce__(self):
+        return _resource_uri, (str(self), self.template)
+
+
+def _resource_uri(uri, template):
+    """
+    :return ResourceUri: `uri`, already formatted from `template`
+    """
+    resource_uri = str.__new__(ResourceUri, uri)
+    resource_uri.template = template
+    return resource_uri
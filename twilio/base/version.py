@@ -1,8 +1,14 @@
-import json
+import asyncio
+import time
 from math import ceil
+from queue import Queue
+from threading import Event, Thread
+from urllib.parse import urlsplit
 
-from twilio.base import values
+from twilio.base import json_codec, values
+from twilio.base.deadline import Deadline
 from twilio.base.exceptions import TwilioRestException
+from twilio.base.instrumentation import current_span
 
 
 class Version(object):
@@ -18,6 +24,35 @@ class Version(object):
         self.domain = domain
         self.version = None
 
+    @property
+    def codec(self):
+        """
+        :return JSONCodec: The codec decoding responses, as configured on the client
+        """
+        twilio = getattr(self.domain, 'twilio', None)
+        return getattr(twilio, 'json_codec', None) or json_codec.get_default()
+
+    @property
+    def single_flight(self):
+        """
+        :return SingleFlight: Coalesces identical concurrent fetches, as configured on the client
+        """
+        return getattr(getattr(self.domain, 'twilio', None), 'single_flight', None)
+
+    @property
+    def response_cache(self):
+        """
+        :return ResponseCache: Caches GET responses, as configured on the client
+        """
+        return getattr(getattr(self.domain, 'twilio', None), 'response_cache', None)
+
+    @property
+    def instrumentation(self):
+        """
+        :return Instrumentation: Receives the timings of API calls, as configured on the client
+        """
+        return getattr(getattr(self.domain, 'twilio', None), 'instrumentation', None)
+
     def absolute_url(self, uri):
         """
         Turns a relative uri into an absolute url.
@@ -36,25 +71,64 @@ class Version(object):
         Make an HTTP request.
         """
         url = self.relative_uri(uri)
-        return self.domain.request(
-            method,
-            url,
-            params=params,
-            data=data,
-            headers=headers,
-            auth=auth,
-            timeout=timeout,
-            allow_redirects=allow_redirects
-        )
+
+        def send(headers):
+            return self.domain.request(
+                method,
+                url,
+                params=params,
+                data=data,
+                headers=headers,
+                auth=auth,
+                timeout=timeout,
+                allow_redirects=allow_redirects
+            )
+
+        cache = self.response_cache
+        if cache is None:
+            return send(headers)
+        return cache.request(send, method, self.domain.absolute_url(url), params, headers,
+                             self._cache_account(auth))
+
+    async def request_async(self, method, uri, params=None, data=None, headers=None,
+                            auth=None, timeout=None, allow_redirects=False):
+        """
+        Make an asynchronous HTTP request.
+        """
+        url = self.relative_uri(uri)
+
+        async def send(headers):
+            return await self.domain.request_async(
+                method,
+                url,
+                params=params,
+                data=data,
+                headers=headers,
+                auth=auth,
+                timeout=timeout,
+                allow_redirects=allow_redirects
+            )
+
+        cache = self.response_cache
+        if cache is None:
+            return await send(headers)
+        return await cache.request_async(send, method, self.domain.absolute_url(url), params, headers,
+                                         self._cache_account(auth))
+
+    def _cache_account(self, auth):
+        """
+        :return str: The credentials a request is made with, responses are cached per account
+        """
+        return auth[0] if auth else getattr(self.domain.twilio, 'username', None)
 
     @classmethod
-    def exception(cls, method, uri, response, message):
+    def exception(cls, method, uri, response, message, codec=None):
         """
         Wraps an exceptional response in a `TwilioRestException`.
         """
         # noinspection PyBroadException
         try:
-            error_payload = json.loads(response.text)
+            error_payload = (codec or json_codec.get_default()).loads(response.body)
             if 'message' in error_payload:
                 message = '{}: {}'.format(message, error_payload['message'])
             details = error_payload.get('details')
@@ -64,69 +138,282 @@ class Version(object):
             return TwilioRestException(response.status_code, uri, message, response.status_code,
                                        method)
 
+    def _loads(self, body):
+        """
+        Decodes a response body, timing it as the `parse` phase of the current span.
+        """
+        span = current_span()
+        if span is None:
+            return self.codec.loads(body)
+
+        started = time.monotonic()
+        payload = self.codec.loads(body)
+        span.add_phase('parse', time.monotonic() - started)
+        return payload
+
+    def _start_span(self, operation, method, uri=None, template=None):
+        """
+        :param str operation: The Version method making the call, such as 'fetch'
+        :param str uri: The uri of the call, used for `template` when it is not given
+        :param str template: The path template of the resource
+        :return Span: A span for an API call, or None when the client is not instrumented or the
+                      call is part of another one
+        """
+        instrumentation = self.instrumentation
+        if instrumentation is None or current_span() is not None:
+            return None
+
+        if template is None and uri is not None:
+            template = '/' + self.relative_uri(getattr(uri, 'template', uri))
+        name = '{} {}'.format(method.upper(), template) if template else method.upper()
+        # set up front so calls that never reach the client, such as cache hits, are attributed
+        domain = urlsplit(self.domain.base_url).netloc.split('.', 1)[0] if self.domain.base_url else None
+        return instrumentation.start_span(name, {
+            'twilio.operation': operation,
+            'twilio.domain': domain,
+            'http.request.method': method.upper(),
+            'url.template': template,
+        })
+
+    def _traced(self, operation, method, uri, call):
+        """
+        Makes `call()` under a span covering the request and the parsing of its response.
+        """
+        span = self._start_span(operation, method, uri)
+        if span is None:
+            return call()
+
+        try:
+            with span:
+                result = call()
+        except Exception as e:
+            span.end(e)
+            raise
+        span.end()
+        return result
+
+    async def _traced_async(self, operation, method, uri, call):
+        """
+        Awaits `call()` under a span covering the request and the parsing of its response.
+        """
+        span = self._start_span(operation, method, uri)
+        if span is None:
+            return await call()
+
+        try:
+            with span:
+                result = await call()
+        except Exception as e:
+            span.end(e)
+            raise
+        span.end()
+        return result
+
+    @staticmethod
+    def _traced_page(span, request):
+        """
+        Makes `request()` under `span`, which is left open for the Page parsing the response.
+        """
+        if span is None:
+            return request()
+
+        try:
+            with span:
+                response = request()
+        except Exception as e:
+            span.end(e)
+            raise
+        response.span = span
+        return response
+
+    @staticmethod
+    async def _traced_page_async(span, request):
+        """
+        Awaits `request()` under `span`, which is left open for the Page parsing the response.
+        """
+        if span is None:
+            return await request()
+
+        try:
+            with span:
+                response = await request()
+        except Exception as e:
+            span.end(e)
+            raise
+        response.span = span
+        return response
+
+    def _parse_fetch(self, method, uri, response):
+        """
+        Parses fetch response JSON
+        """
+        # Note that 3XX response codes are allowed for fetches.
+        if response.status_code < 200 or response.status_code >= 400:
+            raise self.exception(method, uri, response, 'Unable to fetch record', self.codec)
+
+        return self._loads(response.body)
+
+    def _fetch_key(self, method, uri, params, data, headers, auth):
+        """
+        :return: The key identical concurrent fetches share, or None when the fetch is not coalesced
+        """
+        if self.single_flight is None or method.upper() != 'GET' or data:
+            return None
+
+        try:
+            key = (self.domain.twilio, self.absolute_url(uri), _freeze(params), _freeze(headers), auth)
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
     def fetch(self, method, uri, params=None, data=None, headers=None, auth=None, timeout=None,
               allow_redirects=False):
         """
         Fetch a resource instance.
         """
-        response = self.request(
-            method,
-            uri,
-            params=params,
-            data=data,
-            headers=headers,
-            auth=auth,
-            timeout=timeout,
-            allow_redirects=allow_redirects,
-        )
+        def fetch():
+            response = self.request(
+                method,
+                uri,
+                params=params,
+                data=data,
+                headers=headers,
+                auth=auth,
+                timeout=timeout,
+                allow_redirects=allow_redirects,
+            )
 
-        # Note that 3XX response codes are allowed for fetches.
-        if response.status_code < 200 or response.status_code >= 400:
-            raise self.exception(method, uri, response, 'Unable to fetch record')
+            return self._parse_fetch(method, uri, response)
+
+        key = self._fetch_key(method, uri, params, data, headers, auth)
+        return self._traced('fetch', method, uri,
+                            fetch if key is None else lambda: self.single_flight.do(key, fetch))
+
+    async def fetch_async(self, method, uri, params=None, data=None, headers=None, auth=None,
+                          timeout=None, allow_redirects=False):
+        """
+        Asynchronously fetch a resource instance.
+        """
+        async def fetch():
+            response = await self.request_async(
+                method,
+                uri,
+                params=params,
+                data=data,
+                headers=headers,
+                auth=auth,
+                timeout=timeout,
+                allow_redirects=allow_redirects,
+            )
+
+            return self._parse_fetch(method, uri, response)
+
+        key = self._fetch_key(method, uri, params, data, headers, auth)
+        return await self._traced_async('fetch', method, uri,
+                                        fetch if key is None else lambda: self.single_flight.do_async(key, fetch))
+
+    def _parse_update(self, method, uri, response):
+        """
+        Parses update response JSON
+        """
+        if response.status_code < 200 or response.status_code >= 300:
+            raise self.exception(method, uri, response, 'Unable to update record', self.codec)
 
-        return json.loads(response.text)
+        return self._loads(response.body)
 
     def update(self, method, uri, params=None, data=None, headers=None, auth=None, timeout=None,
                allow_redirects=False):
         """
         Update a resource instance.
         """
-        response = self.request(
-            method,
-            uri,
-            params=params,
-            data=data,
-            headers=headers,
-            auth=auth,
-            timeout=timeout,
-            allow_redirects=allow_redirects,
-        )
+        def update():
+            response = self.request(
+                method,
+                uri,
+                params=params,
+                data=data,
+                headers=headers,
+                auth=auth,
+                timeout=timeout,
+                allow_redirects=allow_redirects,
+            )
+
+            return self._parse_update(method, uri, response)
+
+        return self._traced('update', method, uri, update)
+
+    async def update_async(self, method, uri, params=None, data=None, headers=None, auth=None,
+                           timeout=None, allow_redirects=False):
+        """
+        Asynchronously update a resource instance.
+        """
+        async def update():
+            response = await self.request_async(
+                method,
+                uri,
+                params=params,
+                data=data,
+                headers=headers,
+                auth=auth,
+                timeout=timeout,
+                allow_redirects=allow_redirects,
+            )
+
+            return self._parse_update(method, uri, response)
 
+        return await self._traced_async('update', method, uri, update)
+
+    def _parse_delete(self, method, uri, response):
+        """
+        Parses delete response JSON
+        """
         if response.status_code < 200 or response.status_code >= 300:
-            raise self.exception(method, uri, response, 'Unable to update record')
+            raise self.exception(method, uri, response, 'Unable to delete record', self.codec)
 
-        return json.loads(response.text)
+        return response.status_code == 204
 
     def delete(self, method, uri, params=None, data=None, headers=None, auth=None, timeout=None,
                allow_redirects=False):
         """
         Delete a resource.
         """
-        response = self.request(
-            method,
-            uri,
-            params=params,
-            data=data,
-            headers=headers,
-            auth=auth,
-            timeout=timeout,
-            allow_redirects=allow_redirects,
-        )
+        def delete():
+            response = self.request(
+                method,
+                uri,
+                params=params,
+                data=data,
+                headers=headers,
+                auth=auth,
+                timeout=timeout,
+                allow_redirects=allow_redirects,
+            )
 
-        if response.status_code < 200 or response.status_code >= 300:
-            raise self.exception(method, uri, response, 'Unable to delete record')
+            return self._parse_delete(method, uri, response)
 
-        return response.status_code == 204
+        return self._traced('delete', method, uri, delete)
+
+    async def delete_async(self, method, uri, params=None, data=None, headers=None, auth=None,
+                           timeout=None, allow_redirects=False):
+        """
+        Asynchronously delete a resource.
+        """
+        async def delete():
+            response = await self.request_async(
+                method,
+                uri,
+                params=params,
+                data=data,
+                headers=headers,
+                auth=auth,
+                timeout=timeout,
+                allow_redirects=allow_redirects,
+            )
+
+            return self._parse_delete(method, uri, response)
+
+        return await self._traced_async('delete', method, uri, delete)
 
     def read_limits(self, limit=None, page_size=None):
         """
@@ -145,12 +432,36 @@ class Version(object):
             'page_size': page_size or values.unset,
         }
 
+    def read_deadline(self, deadline=None):
+        """
+        :param float|datetime|Deadline deadline: Seconds from now, the time the deadline passes,
+                                                 or a Deadline. Default is no deadline
+        :return Deadline: The deadline of a call
+        """
+        return deadline if isinstance(deadline, Deadline) else Deadline(deadline)
+
     def page(self, method, uri, params=None, data=None, headers=None, auth=None, timeout=None,
              allow_redirects=False):
         """
         Makes an HTTP request.
         """
-        return self.request(
+        return self._traced_page(self._start_span('page', method, uri), lambda: self.request(
+            method,
+            uri,
+            params=params,
+            data=data,
+            headers=headers,
+            auth=auth,
+            timeout=timeout,
+            allow_redirects=allow_redirects,
+        ))
+
+    async def page_async(self, method, uri, params=None, data=None, headers=None, auth=None,
+                         timeout=None, allow_redirects=False):
+        """
+        Makes an asynchronous HTTP request.
+        """
+        return await self._traced_page_async(self._start_span('page', method, uri), lambda: self.request_async(
             method,
             uri,
             params=params,
@@ -159,49 +470,242 @@ class Version(object):
             auth=auth,
             timeout=timeout,
             allow_redirects=allow_redirects,
-        )
+        ))
 
-    def stream(self, page, limit=None, page_limit=None):
+    def stream(self, page, limit=None, page_limit=None, prefetch=None,
+               raw=False, deadline=None):
         """
         Generates records one a time from a page, stopping at prescribed limits.
 
         :param Page page: The page to stream.
         :param int limit: The max number of records to read.
         :param int page_limit: The max number of pages to read.
+        :param int prefetch: The number of pages to fetch ahead in the background while the
+                             current page is consumed. Defaults to no prefetching.
+        :param bool raw: Generate the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization.
+        :param Deadline deadline: The deadline the following pages are fetched within.
         """
         current_record = 1
         current_page = 1
+        pages = self._prefetch_pages(page, prefetch, page_limit, deadline) if prefetch else None
 
-        while page is not None:
-            for record in page:
-                yield record
-                current_record += 1
-                if limit and limit is not values.unset and limit < current_record:
+        try:
+            while page is not None:
+                for record in (page.raw_records() if raw else page):
+                    yield record
+                    current_record += 1
+                    if limit and limit is not values.unset and limit < current_record:
+                        return
+
+                current_page += 1
+                if page_limit and page_limit is not values.unset and page_limit < current_page:
                     return
 
-            current_page += 1
-            if page_limit and page_limit is not values.unset and page_limit < current_page:
-                return
+                page = next(pages) if pages else self._next_page(page, deadline)
+        finally:
+            if pages:
+                pages.close()
 
-            page = page.next_page()
+    @staticmethod
+    def _next_page(page, deadline=None):
+        """
+        :return Page: The page following `page`, fetched within `deadline`
+        """
+        if deadline is None:
+            return page.next_page()
+        return deadline.run(page.next_page)
 
-    def create(self, method, uri, params=None, data=None, headers=None, auth=None, timeout=None,
-               allow_redirects=False):
+    @staticmethod
+    async def _next_page_async(page, deadline=None):
         """
-        Create a resource instance.
+        :return Page: The page following `page`, fetched within `deadline`
         """
-        response = self.request(
-            method,
-            uri,
-            params=params,
-            data=data,
-            headers=headers,
-            auth=auth,
-            timeout=timeout,
-            allow_redirects=allow_redirects,
-        )
+        if deadline is None:
+            return await page.next_page_async()
+        return await deadline.run_async(page.next_page_async)
+
+    @classmethod
+    def _prefetch_pages(cls, page, prefetch, page_limit=None, deadline=None):
+        """
+        Generates the pages following `page`, fetching up to `prefetch` of them ahead of the
+        consumer in a background thread. The buffer is bounded so memory stays flat no matter
+        how many pages are read, and closing the generator stops the background fetches.
+
+        :param Page page: The page to start from, it is not generated itself.
+        :param int prefetch: The max number of fetched pages waiting to be consumed.
+        :param int page_limit: The max number of pages to read, including `page`.
+        :param Deadline deadline: The deadline the pages are fetched within.
+        """
+        buffer = Queue(maxsize=prefetch)
+        stopped = Event()
+
+        def produce(current):
+            fetched = 1
+            try:
+                while current is not None and not stopped.is_set():
+                    if page_limit and page_limit is not values.unset and fetched >= page_limit:
+                        current = None
+                    else:
+                        current = cls._next_page(current, deadline)
+                        fetched += 1
+                    buffer.put((current, None))
+            except Exception as e:
+                buffer.put((None, e))
+
+        worker = Thread(target=produce, args=(page,), name='twilio-page-prefetch', daemon=True)
+        worker.start()
+
+        try:
+            while True:
+                page, error = buffer.get()
+                if error is not None:
+                    raise error
+                yield page
+                if page is None:
+                    return
+        finally:
+            stopped.set()
+            # Unblock a producer waiting on a full buffer so it can observe `stopped`
+            while not buffer.empty():
+                buffer.get_nowait()
+
+    async def stream_async(self, page, limit=None, page_limit=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously generates records one a time from a page, stopping at prescribed limits.
+
+        :param Page page: The page to stream.
+        :param int limit: The max number of records to read.
+        :param int page_limit: The max number of pages to read.
+        :param int prefetch: The number of pages to fetch ahead while the current page is
+                             consumed. Defaults to no prefetching.
+        :param bool raw: Generate the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization.
+        :param Deadline deadline: The deadline the following pages are fetched within.
+        """
+        current_record = 1
+        current_page = 1
+        pages = self._prefetch_pages_async(page, prefetch, page_limit, deadline) if prefetch else None
+
+        try:
+            while page is not None:
+                for record in (page.raw_records() if raw else page):
+                    yield record
+                    current_record += 1
+                    if limit and limit is not values.unset and limit < current_record:
+                        return
+
+                current_page += 1
+                if page_limit and page_limit is not values.unset and page_limit < current_page:
+                    return
+
+                page = await pages.__anext__() if pages else await self._next_page_async(page, deadline)
+        finally:
+            if pages:
+                await pages.aclose()
+
+    @classmethod
+    async def _prefetch_pages_async(cls, page, prefetch, page_limit=None, deadline=None):
+        """
+        Asynchronously generates the pages following `page`, fetching up to `prefetch` of them
+        ahead of the consumer in a background task.
+
+        :param Page page: The page to start from, it is not generated itself.
+        :param int prefetch: The max number of fetched pages waiting to be consumed.
+        :param int page_limit: The max number of pages to read, including `page`.
+        :param Deadline deadline: The deadline the pages are fetched within.
+        """
+        buffer = asyncio.Queue(maxsize=prefetch)
+
+        async def produce(current):
+            fetched = 1
+            try:
+                while current is not None:
+                    if page_limit and page_limit is not values.unset and fetched >= page_limit:
+                        current = None
+                    else:
+                        current = await cls._next_page_async(current, deadline)
+                        fetched += 1
+                    await buffer.put((current, None))
+            except Exception as e:
+                await buffer.put((None, e))
 
+        worker = asyncio.ensure_future(produce(page))
+
+        try:
+            while True:
+                page, error = await buffer.get()
+                if error is not None:
+                    raise error
+                yield page
+                if page is None:
+                    return
+        finally:
+            worker.cancel()
+
+    def _parse_create(self, method, uri, response):
+        """
+        Parses create response JSON
+        """
         if response.status_code < 200 or response.status_code >= 300:
-            raise self.exception(method, uri, response, 'Unable to create record')
+            raise self.exception(method, uri, response, 'Unable to create record', self.codec)
 
-        return json.loads(response.text)
+        return self._loads(response.body)
+
+    def create(self, method, uri, params=None, data=None, headers=None, auth=None, timeout=None,
+               allow_redirects=False, deadline=None):
+        """
+        Create a resource instance, within `deadline` if given.
+        """
+        def create():
+            response = self.request(
+                method,
+                uri,
+                params=params,
+                data=data,
+                headers=headers,
+                auth=auth,
+                timeout=timeout,
+                allow_redirects=allow_redirects,
+            )
+
+            return self._parse_create(method, uri, response)
+
+        if deadline is not None:
+            return self.read_deadline(deadline).run(self._traced, 'create', method, uri, create)
+        return self._traced('create', method, uri, create)
+
+    async def create_async(self, method, uri, params=None, data=None, headers=None, auth=None,
+                           timeout=None, allow_redirects=False, deadline=None):
+        """
+        Asynchronously create a resource instance, within `deadline` if given.
+        """
+        async def create():
+            response = await self.request_async(
+                method,
+                uri,
+                params=params,
+                data=data,
+                headers=headers,
+                auth=auth,
+                timeout=timeout,
+                allow_redirects=allow_redirects,
+            )
+
+            return self._parse_create(method, uri, response)
+
+        if deadline is not None:
+            return await self.read_deadline(deadline).run_async(self._traced_async, 'create', method, uri, create)
+        return await self._traced_async('create', method, uri, create)
+
+
+def _freeze(values):
+    """
+    :param dict values: Query parameters or headers
+    :return tuple: The items of `values` in a hashable form
+    """
+    if not values:
+        return None
+    return tuple(sorted((key, tuple(value) if isinstance(value, list) else value)
+                        for key, value in values.items()))
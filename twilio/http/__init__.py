@@ -5,9 +5,25 @@ class HttpClient(object):
     """
     An abstract class representing an HTTP client.
     """
+    is_async = False
+
     def request(self, method, url, params=None, data=None, headers=None, auth=None,
                 timeout=None, allow_redirects=False):
         """
         Make an HTTP request.
         """
         raise TwilioException('HttpClient is an abstract class')
+
+
+class AsyncHttpClient(HttpClient):
+    """
+    An abstract class representing an asynchronous HTTP client.
+    """
+    is_async = True
+
+    async def request(self, method, url, params=None, data=None, headers=None, auth=None,
+                      timeout=None, allow_redirects=False):
+        """
+        Make an asynchronous HTTP request.
+        """
+        raise TwilioException('AsyncHttpClient is an abstract class')
@@ -0,0 +1,400 @@
+import asyncio
+import gzip
+import logging
+import time
+from base64 import b64encode
+from contextvars import ContextVar
+
+from aiohttp import ClientConnectionError, ClientError, ClientSession, ClientTimeout, TCPConnector, TraceConfig
+from urllib.parse import urlencode, urlsplit
+from twilio.base.deadline import current_deadline
+from twilio.base.instrumentation import current_span, record_phase
+from twilio.http import AsyncHttpClient
+from twilio.http.compression import compress_min_size
+from twilio.http.request import Request as TwilioRequest
+from twilio.http.request_log import log_exchange
+from twilio.http.response import Response
+
+_logger = logging.getLogger('twilio.async_http_client')
+
+
+class AsyncTwilioHttpClient(AsyncHttpClient):
+    """
+    General purpose asynchronous HTTP Client for interacting with the Twilio API,
+    built on top of aiohttp.
+
+    A single instance can be shared by every coroutine running on one event loop;
+    close it with `await client.close()` (or use it as an async context manager)
+    once it is no longer needed.
+    """
+    WARMUP_TIMEOUT = 10
+    """ Seconds a warm-up request may take when the client has no timeout """
+
+    def __init__(self, pool_connections=True, trace_configs=None, timeout=None, logger=_logger,
+                 proxy_url=None, max_connections=100, retry_policy=None, compression_rules=None,
+                 circuit_breaker=None, hedging_policy=None):
+        """
+        Constructor for the AsyncTwilioHttpClient
+
+        :param bool pool_connections: Reuse one aiohttp session (and its connections) for every request
+        :param list trace_configs: aiohttp TraceConfig objects to attach to the session
+        :param int timeout: Timeout for the requests.
+                            Timeout should never be zero (0) or less.
+        :param logger
+        :param str proxy_url: Http proxy url for the requests
+        :param int max_connections: Maximum number of simultaneous connections in the pool
+        :param RetryPolicy retry_policy: Retries 429/503 responses and connection errors of
+                                         idempotent requests. Default is no retries
+        :param list[CompressionRule] compression_rules: Gzips the bodies of the requests matching
+                                                       a rule, the first matching rule applies.
+                                                       Default is to never compress requests
+        :param CircuitBreaker circuit_breaker: Fails requests fast while their host keeps failing
+        :param HedgingPolicy hedging_policy: Sends a second copy of GETs that are slower than
+                                             usual and uses the first response
+        """
+        if timeout is not None and timeout <= 0:
+            raise ValueError(timeout)
+
+        self.pool_connections = pool_connections
+        self.trace_configs = trace_configs
+        self.timeout = timeout
+        self.logger = logger
+        self.proxy_url = proxy_url
+        self.max_connections = max_connections
+        self.retry_policy = retry_policy
+        self.compression_rules = compression_rules
+        self.circuit_breaker = circuit_breaker
+        self.hedging_policy = hedging_policy
+        self.session = None
+        self._last_request = ContextVar('twilio_last_request', default=None)
+        self._last_response = ContextVar('twilio_last_response', default=None)
+
+    def __getstate__(self):
+        # Per-task state and the session are not copied, the copy opens its own
+        state = dict(self.__dict__)
+        for name in ('_last_request', '_last_response', 'session'):
+            del state[name]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.session = None
+        self._last_request = ContextVar('twilio_last_request', default=None)
+        self._last_response = ContextVar('twilio_last_response', default=None)
+
+    @property
+    def last_request(self):
+        """
+        :return TwilioRequest: The last request made by the current task
+        """
+        return self._last_request.get()
+
+    @last_request.setter
+    def last_request(self, request):
+        self._last_request.set(request)
+
+    @property
+    def last_response(self):
+        """
+        :return Response: The response to the last request made by the current task
+        """
+        return self._last_response.get()
+
+    @last_response.setter
+    def last_response(self, response):
+        self._last_response.set(response)
+
+    async def request(self, method, url, params=None, data=None, headers=None, auth=None, timeout=None,
+                      allow_redirects=False):
+        """
+        Make an asynchronous HTTP Request with parameters provided.
+
+        :param str method: The HTTP method to use
+        :param str url: The URL to request
+        :param dict params: Query parameters to append to the URL
+        :param dict data: Parameters to go in the body of the HTTP request
+        :param dict headers: HTTP Headers to send with the request
+        :param tuple auth: Basic Auth arguments
+        :param float timeout: Socket/Read timeout for the request
+        :param boolean allow_redirects: Whether or not to allow redirects
+        See the aiohttp documentation for explanation of all these parameters
+
+        :return: An http response
+        :rtype: A :class:`Response <twilio.rest.http.response.Response>` object
+        """
+        if timeout is not None and timeout <= 0:
+            raise ValueError(timeout)
+
+        kwargs = {
+            'method': method.upper(),
+            'url': url,
+            'params': params,
+            'data': data,
+            'headers': headers,
+            'auth': auth,
+        }
+
+        log = self.logger.isEnabledFor(logging.INFO)
+
+        self.last_response = None
+        self.last_request = TwilioRequest(**kwargs)
+
+        timeout = timeout if timeout is not None else self.timeout
+        headers = self._auth_headers(headers, auth)
+        data = self._encode(data)
+        if self.compression_rules:
+            headers, data = self._compress(method, url, headers, data)
+
+        breaker = self.circuit_breaker
+        hedging = self.hedging_policy if self.hedging_policy and self.hedging_policy.applies(method) else None
+        host = urlsplit(url).netloc if breaker is not None or hedging is not None else None
+
+        session = await self._get_session()
+        span = current_span()
+        if span is not None:
+            encoded = data if isinstance(data, bytes) or not data else urlencode(data)
+            span.set_attribute('http.request.body.size', len(encoded or b''))
+
+        async def send():
+            sent = time.monotonic()
+            connect = span.phases.get('connect', 0.0) if span is not None else 0.0
+            async with session.request(
+                kwargs['method'],
+                url,
+                params=self._encode(params),
+                data=data,
+                headers=headers,
+                timeout=ClientTimeout(total=attempt_timeout) if attempt_timeout is not None else None,
+                allow_redirects=allow_redirects,
+                proxy=self.proxy_url,
+            ) as response:
+                received = time.monotonic()
+                body = await response.read()
+                wire_size = self._wire_size(response, body)
+                if span is not None:
+                    span.add_phase('ttfb', max(0.0, received - sent - (span.phases.get('connect', 0.0) - connect)))
+                    span.add_phase('read', time.monotonic() - received)
+                    span.set_attribute('http.response.body.size', wire_size)
+                return Response(int(response.status), body, response.headers, response.charset, wire_size)
+
+        deadline = current_deadline()
+        attempt_timeout = timeout
+        response = None
+        try:
+            attempt = 1
+            while True:
+                if deadline is not None:
+                    attempt_timeout = deadline.timeout(timeout)
+                if breaker is not None:
+                    breaker.before(host)
+                started = time.monotonic()
+                try:
+                    if hedging is not None:
+                        response = await hedging.send_async(host, send)
+                    else:
+                        response = await send()
+                except asyncio.CancelledError:
+                    if breaker is not None:
+                        breaker.release(host)
+                    raise
+                except Exception as e:
+                    if log:
+                        self._log_response(kwargs, None, started, attempt, e)
+                    expired = deadline is not None and deadline.expired
+                    if breaker is not None:
+                        # a timeout of the caller's own deadline says nothing about the host
+                        if expired:
+                            breaker.release(host)
+                        else:
+                            breaker.after(host, error=e)
+                    if expired:
+                        raise deadline.exceeded() from e
+                    delay = self._retry_delay(attempt, kwargs, error=e) \
+                        if isinstance(e, ClientConnectionError) else None
+                    if delay is None:
+                        raise
+                else:
+                    self.last_response = response
+                    if breaker is not None:
+                        breaker.after(host, response=response)
+                    if span is not None and attempt > 1:
+                        span.set_attribute('http.request.resend_count', attempt - 1)
+                    if log:
+                        self._log_response(kwargs, response, started, attempt)
+                    delay = self._retry_delay(attempt, kwargs, response=response)
+                    if delay is None:
+                        break
+
+                await asyncio.sleep(delay)
+                attempt += 1
+        finally:
+            if not self.pool_connections:
+                await session.close()
+
+        return response
+
+    async def warmup(self, urls, connections=1):
+        """
+        Opens pooled keep-alive connections ahead of the first requests by sending `connections`
+        concurrent HEAD requests to each url. Failures are logged and ignored.
+
+        :param list[str] urls: Urls of the hosts to connect to
+        :param int connections: Connections to open per host, at most `max_connections` in total
+        """
+        if connections <= 0:
+            raise ValueError(connections)
+        if not self.pool_connections or not urls:
+            return
+
+        session = await self._get_session()
+        timeout = ClientTimeout(total=self.timeout or self.WARMUP_TIMEOUT)
+
+        async def ping(url):
+            try:
+                async with session.head(url, timeout=timeout, allow_redirects=False,
+                                        proxy=self.proxy_url) as response:
+                    await response.read()
+            except (ClientError, asyncio.TimeoutError) as e:
+                self.logger.warning('Could not warm up connection to %s: %s', url, e)
+
+        await asyncio.gather(*[ping(url) for url in urls for _ in range(connections)])
+
+    async def close(self):
+        """
+        Close the underlying aiohttp session and release its pooled connections.
+        """
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *excinfo):
+        await self.close()
+
+    async def _get_session(self):
+        """
+        aiohttp sessions are bound to the running event loop, so they are created on first use.
+        """
+        if not self.pool_connections:
+            return self._new_session()
+
+        if self.session is None or self.session.closed:
+            self.session = self._new_session()
+        return self.session
+
+    def _new_session(self):
+        return ClientSession(
+            connector=TCPConnector(limit=self.max_connections),
+            trace_configs=(self.trace_configs or []) + [_connect_trace_config()],
+        )
+
+    @staticmethod
+    def _auth_headers(headers, auth):
+        """
+        Build the request headers, adding a Basic Authorization header when auth is provided.
+        """
+        if not auth:
+            return headers
+
+        headers = dict(headers or {})
+        credentials = '{}:{}'.format(*auth).encode('latin1')
+        headers['Authorization'] = 'Basic {}'.format(b64encode(credentials).decode('ascii'))
+        return headers
+
+    def _compress(self, method, url, headers, data):
+        """
+        Gzips a form body when a compression rule matches the request and the body is at least
+        the rule's `min_size` bytes.
+
+        :return tuple: The headers and data to send
+        """
+        if not data or not isinstance(data, list) or 'Content-Encoding' in (headers or {}):
+            return headers, data
+
+        min_size = compress_min_size(self.compression_rules, method, url)
+        if min_size is None:
+            return headers, data
+
+        body = urlencode(data).encode('utf-8')
+        if len(body) < min_size:
+            return headers, data
+
+        headers = dict(headers or {})
+        headers['Content-Type'] = 'application/x-www-form-urlencoded'
+        headers['Content-Encoding'] = 'gzip'
+        return headers, gzip.compress(body)
+
+    @staticmethod
+    def _wire_size(response, body):
+        """
+        aiohttp decompresses bodies as they are read, so the encoded size is only known from
+        `Content-Length`.
+        """
+        if 'Content-Encoding' not in response.headers:
+            return len(body)
+        length = response.headers.get('Content-Length')
+        return int(length) if length and length.isdigit() else None
+
+    @staticmethod
+    def _encode(values):
+        """
+        aiohttp does not expand list values nor stringify booleans the way requests does,
+        so flatten a params/data dict into a list of string pairs.
+
+        :param dict values: Query parameters or form fields
+        :return list: (key, value) tuples, or None when there is nothing to send
+        """
+        if not values:
+            return None
+        if not isinstance(values, dict):
+            return values
+
+        encoded = []
+        for key, value in values.items():
+            for item in (value if isinstance(value, (list, tuple)) else [value]):
+                if item is not None:
+                    encoded.append((key, item if isinstance(item, str) else str(item)))
+        return encoded
+
+    def _retry_delay(self, attempt, kwargs, response=None, error=None):
+        """
+        :return float: Seconds to wait before retrying the request, or None to not retry
+        """
+        if self.retry_policy is None:
+            return None
+
+        delay = self.retry_policy.next_delay(attempt, kwargs['method'], kwargs['headers'],
+                                             response=response, error=error)
+        deadline = current_deadline()
+        if delay is not None and deadline is not None and not deadline.allows(delay):
+            self.logger.info('Not retrying %s %s, the deadline passes in %.2fs',
+                             kwargs['method'], kwargs['url'], deadline.remaining())
+            return None
+        if delay is not None:
+            self.logger.info('Retrying %s %s in %.2fs (attempt %d)',
+                             kwargs['method'], kwargs['url'], delay, attempt + 1)
+            self.retry_policy.notify(kwargs['method'], kwargs['url'], attempt, delay, response, error)
+        return delay
+
+    def _log_response(self, kwargs, response, started, attempt, error=None):
+        log_exchange(self.logger, kwargs['method'], kwargs['url'], kwargs['params'], kwargs['headers'],
+                     response, time.monotonic() - started, attempt, error)
+
+
+def _connect_trace_config():
+    """
+    :return TraceConfig: Records the time spent opening connections, TLS handshake included, as
+                         the `connect` phase of the current span
+    """
+    async def on_connection_create_start(session, context, params):
+        context.started = time.monotonic()
+
+    async def on_connection_create_end(session, context, params):
+        record_phase('connect', time.monotonic() - context.started)
+
+    trace_config = TraceConfig()
+    trace_config.on_connection_create_start.append(on_connection_create_start)
+    trace_config.on_connection_create_end.append(on_connection_create_end)
+    return trace_config
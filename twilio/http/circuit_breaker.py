@@ -0,0 +1,116 @@
+import time
+from threading import Lock
+
+from twilio.base.exceptions import CircuitOpenException
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half-open'
+
+
+class _Circuit(object):
+    __slots__ = ('state', 'failures', 'opened_at', 'probes')
+
+    def __init__(self):
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self.probes = 0
+
+
+class CircuitBreaker(object):
+    """
+    Fails requests to a host fast once it keeps failing, instead of letting every caller wait for
+    a timeout.
+
+    Each host has its own circuit. After `failure_threshold` consecutive failures, meaning
+    connection errors, timeouts or `failure_statuses` responses, the circuit opens and requests
+    to the host raise CircuitOpenException without being sent. Once `recovery_timeout` seconds
+    have passed, up to `half_open_probes` requests are let through: the circuit closes again
+    when one succeeds and reopens when one fails.
+    """
+
+    def __init__(self, failure_threshold=5, recovery_timeout=30.0, half_open_probes=1,
+                 failure_statuses=(500, 502, 503, 504)):
+        """
+        :param int failure_threshold: Consecutive failures that open a circuit
+        :param float recovery_timeout: Seconds a circuit stays open before probing the host
+        :param int half_open_probes: Concurrent requests allowed to probe a recovering host
+        :param tuple failure_statuses: HTTP status codes counted as failures
+        """
+        if failure_threshold < 1:
+            raise ValueError(failure_threshold)
+        if recovery_timeout <= 0:
+            raise ValueError(recovery_timeout)
+        if half_open_probes < 1:
+            raise ValueError(half_open_probes)
+
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_probes = half_open_probes
+        self.failure_statuses = frozenset(failure_statuses)
+        self._circuits = {}
+        self._lock = Lock()
+
+    def state(self, host):
+        """
+        :param str host: A host, such as 'verify.twilio.com'
+        :return str: 'closed', 'open' or 'half-open'
+        """
+        circuit = self._circuits.get(host)
+        return circuit.state if circuit else CLOSED
+
+    def before(self, host):
+        """
+        Called before sending a request to `host`.
+
+        :raises CircuitOpenException: When the request must not be sent
+        """
+        with self._lock:
+            circuit = self._circuits.get(host)
+            if circuit is None:
+                circuit = self._circuits[host] = _Circuit()
+            if circuit.state == CLOSED:
+                return
+
+            if circuit.state == OPEN:
+                retry_in = circuit.opened_at + self.recovery_timeout - time.monotonic()
+                if retry_in > 0:
+                    raise CircuitOpenException(host, retry_in)
+                circuit.state = HALF_OPEN
+                circuit.probes = 0
+
+            if circuit.probes >= self.half_open_probes:
+                raise CircuitOpenException(host, 0.0)
+            circuit.probes += 1
+
+    def after(self, host, response=None, error=None):
+        """
+        Called once a request allowed by `before` returned `response` or raised `error`.
+        """
+        failed = error is not None or response.status_code in self.failure_statuses
+
+        with self._lock:
+            circuit = self._circuits[host]
+            if circuit.state == HALF_OPEN:
+                circuit.probes = max(0, circuit.probes - 1)
+
+            if not failed:
+                circuit.state = CLOSED
+                circuit.failures = 0
+                return
+
+            circuit.failures += 1
+            if circuit.state == HALF_OPEN or circuit.failures >= self.failure_threshold:
+                circuit.state = OPEN
+                circuit.opened_at = time.monotonic()
+
+    def release(self, host):
+        """
+        Called instead of `after` when a request allowed by `before` was abandoned without an
+        outcome, e.g. cancelled.
+        """
+        with self._lock:
+            circuit = self._circuits[host]
+            if circuit.state == HALF_OPEN:
+                circuit.probes = max(0, circuit.probes - 1)
@@ -0,0 +1,52 @@
+import re
+from fnmatch import translate
+from urllib.parse import urlsplit
+
+
+class CompressionRule(object):
+    """
+    Gzips the bodies of the requests matching a domain, path and method. Only point it at
+    endpoints that accept `Content-Encoding: gzip`.
+    """
+
+    def __init__(self, min_size=1024, domain=None, path=None, methods=None):
+        """
+        :param int min_size: Bodies of at least this many bytes are compressed
+        :param str domain: Twilio domain the rule applies to, such as 'api' or 'conversations'.
+                           Default is every domain
+        :param str path: Pattern the end of the request path must match, such as
+                         '/Messages.json' or '/Services/*/Messages'. Default is every path
+        :param list[str] methods: HTTP methods the rule applies to. Default is every method
+        """
+        if min_size < 0:
+            raise ValueError(min_size)
+
+        self.min_size = min_size
+        self.domain = domain
+        self.path = path
+        self.methods = frozenset(m.upper() for m in methods) if methods else None
+        self._path = re.compile(translate('*' + path)) if path else None
+
+    def matches(self, method, domain, path):
+        """
+        :return bool: Whether the rule applies to a request
+        """
+        return (self.domain is None or self.domain == domain) and \
+            (self.methods is None or method in self.methods) and \
+            (self._path is None or self._path.match(path) is not None)
+
+
+def compress_min_size(rules, method, url):
+    """
+    :param list[CompressionRule] rules: The rules, the first one matching the request applies
+    :param str method: The HTTP method
+    :param str url: The fully qualified url
+    :return int: The smallest body to compress for the request, None when it is never compressed
+    """
+    parts = urlsplit(url)
+    domain = parts.netloc.split('.', 1)[0]
+    method = method.upper()
+    for rule in rules:
+        if rule.matches(method, domain, parts.path):
+            return rule.min_size
+    return None
@@ -0,0 +1,167 @@
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, wait
+from contextvars import copy_context
+from threading import BoundedSemaphore, Event, Lock
+
+
+class HedgingPolicy(object):
+    """
+    Sends a second copy of a slow GET and uses whichever response arrives first.
+
+    A GET that has not completed after the `percentile` latency of recent GETs to the same host
+    is hedged: a duplicate is sent over another pooled connection, the first successful response
+    wins and the other request is cancelled (or discarded once it completes when it cannot be
+    interrupted). Only GETs are hedged since they are free of side effects.
+    """
+    METHODS = frozenset(['GET'])
+
+    def __init__(self, percentile=95, min_delay=0.01, max_delay=1.0, window=200, min_samples=20,
+                 max_workers=16):
+        """
+        :param float percentile: Latency percentile of recent requests after which to hedge
+        :param float min_delay: Lower bound in seconds for the hedging delay
+        :param float max_delay: Upper bound in seconds for the hedging delay, also used until
+                                `min_samples` latencies of a host are known
+        :param int window: Number of recent latencies kept per host
+        :param int min_samples: Latencies needed before the percentile is used
+        :param int max_workers: Threads TwilioHttpClient uses to send hedged requests. GETs sent
+                                while all of them are busy go out unhedged on the calling thread
+        """
+        if not 0 < percentile < 100:
+            raise ValueError(percentile)
+        if min_delay < 0 or max_delay < min_delay:
+            raise ValueError(max_delay)
+
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.window = window
+        self.min_samples = max(1, min_samples)
+        self.max_workers = max_workers
+        self._latencies = {}
+        self._lock = Lock()
+        self._slots = BoundedSemaphore(max_workers)
+
+    def applies(self, method):
+        """
+        :param str method: The HTTP method
+        :return bool: Whether requests with `method` may be hedged
+        """
+        return method.upper() in self.METHODS
+
+    def record(self, host, latency):
+        """
+        Adds the latency of a completed request to `host`.
+        """
+        with self._lock:
+            latencies = self._latencies.get(host)
+            if latencies is None:
+                latencies = self._latencies[host] = deque(maxlen=self.window)
+            latencies.append(latency)
+
+    def delay(self, host):
+        """
+        :param str host: The host of the request
+        :return float: Seconds to wait for a response before hedging
+        """
+        with self._lock:
+            latencies = sorted(self._latencies.get(host, ()))
+        if len(latencies) < self.min_samples:
+            return self.max_delay
+
+        index = min(len(latencies) - 1, int(len(latencies) * self.percentile / 100))
+        return min(self.max_delay, max(self.min_delay, latencies[index]))
+
+    def send(self, executor, host, send):
+        """
+        Calls `send` on `executor`, hedging it with a second call when it is slow. The delay
+        runs from when a worker starts the call, and the calls run in a copy of the caller's
+        context, so they keep its span and deadline. When every worker is busy the call is made
+        on the calling thread instead of being queued, and is not hedged.
+
+        :param concurrent.futures.Executor executor: Runs the requests
+        :param str host: The host of the request
+        :param callable send: Sends the request and returns its response
+        :return: The first response
+        """
+        def timed(running=None):
+            started = time.monotonic()
+            if running is not None:
+                running.set()
+            response = send()
+            self.record(host, time.monotonic() - started)
+            return response
+
+        def submit(running=None):
+            if not self._slots.acquire(blocking=False):
+                return None
+            future = executor.submit(copy_context().run, timed, running)
+            future.add_done_callback(lambda _: self._slots.release())
+            return future
+
+        running = Event()
+        primary = submit(running)
+        if primary is None:
+            return timed()
+
+        running.wait()
+        done, _ = wait([primary], timeout=self.delay(host))
+        hedge = submit() if not done else None
+        if hedge is None:
+            return primary.result()
+
+        pending = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    for loser in pending:
+                        if not loser.cancel():
+                            loser.add_done_callback(_close_response)
+                    return future.result()
+        return future.result()
+
+    async def send_async(self, host, send):
+        """
+        Awaits `send()`, hedging it with a second call when it is slow. The slower call is
+        cancelled.
+
+        :param str host: The host of the request
+        :param callable send: Returns a coroutine sending the request
+        :return: The first response
+        """
+        async def timed():
+            started = time.monotonic()
+            response = await send()
+            self.record(host, time.monotonic() - started)
+            return response
+
+        primary = asyncio.ensure_future(timed())
+        pending = {primary}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=self.delay(host))
+            if done:
+                return primary.result()
+
+            pending.add(asyncio.ensure_future(timed()))
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+            return task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+
+def _close_response(future):
+    """
+    Releases the connection of a hedged request that lost.
+    """
+    if not future.cancelled() and future.exception() is None:
+        close = getattr(future.result(), 'close', None)
+        if close is not None:
+            close()
@@ -1,22 +1,109 @@
+import gzip
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier, BrokenBarrierError, Event, Lock, Thread, local
 
 from requests import Request, Session, hooks
-from requests.adapters import HTTPAdapter
-from urllib.parse import urlencode
+from requests.adapters import DEFAULT_POOLSIZE, DEFAULT_RETRIES, HTTPAdapter
+from requests.exceptions import ConnectionError as RequestsConnectionError, RequestException
+from urllib.parse import urlsplit
+from urllib3.connection import HTTPSConnection
+from urllib3.connectionpool import HTTPSConnectionPool
+from urllib3.response import HTTPResponse
+from urllib3.util.request import ACCEPT_ENCODING
+from twilio.base.deadline import current_deadline
+from twilio.base.instrumentation import current_span, record_phase
 from twilio.http import HttpClient
+from twilio.http.compression import compress_min_size
 from twilio.http.request import Request as TwilioRequest
+from twilio.http.request_log import log_exchange
 from twilio.http.response import Response
 
 _logger = logging.getLogger('twilio.http_client')
 
 
+def _wire_size(response):
+    """
+    :return int: The number of body bytes urllib3 read off the socket, before content decoding
+    """
+    raw = getattr(response, 'raw', None)
+    return raw.tell() if isinstance(raw, HTTPResponse) else None
+
+
+class TimedHTTPSConnection(HTTPSConnection):
+    """
+    Records the time spent opening the connection, TLS handshake included, as the `connect`
+    phase of the current span.
+    """
+
+    def connect(self):
+        started = time.monotonic()
+        try:
+            super(TimedHTTPSConnection, self).connect()
+        finally:
+            record_phase('connect', time.monotonic() - started)
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class KeepAliveAdapter(HTTPAdapter):
+    """
+    An HTTPAdapter that discards its pooled connections after they have sat idle for
+    `keep_alive_timeout` seconds, instead of reusing a connection the server has likely closed.
+    """
+    __attrs__ = HTTPAdapter.__attrs__ + ['keep_alive_timeout']
+
+    def __init__(self, keep_alive_timeout=None, **kwargs):
+        """
+        :param float keep_alive_timeout: Seconds a pooled connection may be idle before it is
+                                         discarded. Default is to keep connections indefinitely
+        :param kwargs: Arguments for HTTPAdapter
+        """
+        self.keep_alive_timeout = keep_alive_timeout
+        self._last_used = None
+        self._lock = Lock()
+        super(KeepAliveAdapter, self).__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super(KeepAliveAdapter, self).init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = dict(self.poolmanager.pool_classes_by_scheme,
+                                                       https=TimedHTTPSConnectionPool)
+
+    def send(self, request, **kwargs):
+        if self.keep_alive_timeout is not None:
+            now = time.monotonic()
+            with self._lock:
+                idle = self._last_used is not None and now - self._last_used > self.keep_alive_timeout
+                self._last_used = now
+            if idle:
+                self.poolmanager.clear()
+
+        return super(KeepAliveAdapter, self).send(request, **kwargs)
+
+    def __setstate__(self, state):
+        super(KeepAliveAdapter, self).__setstate__(state)
+        self._last_used = None
+        self._lock = Lock()
+
+
 class TwilioHttpClient(HttpClient):
     """
     General purpose HTTP Client for interacting with the Twilio API
+
+    A client can be shared between threads: its session is configured once at construction, and
+    `last_request` / `last_response` are kept per thread.
     """
+    POOL_HOSTS = 32
+    """ Number of hosts (Twilio domains, edges and regions) to keep connection pools for """
+    WARMUP_TIMEOUT = 10
+    """ Seconds a warm-up request may take when the client has no timeout """
 
     def __init__(self, pool_connections=True, request_hooks=None, timeout=None, logger=_logger, proxy=None,
-                 max_retries=None):
+                 max_retries=None, pool_maxsize=None, pool_block=False, keep_alive_timeout=None,
+                 retry_policy=None, compression_rules=None, circuit_breaker=None, hedging_policy=None):
         """
         Constructor for the TwilioHttpClient
 
@@ -27,12 +114,40 @@ class TwilioHttpClient(HttpClient):
         :param logger
         :param dict proxy: Http proxy for the requests session
         :param int max_retries: Maximum number of retries each request should attempt
+        :param int pool_maxsize: Maximum number of connections kept open to each host, size it to
+                                 the number of threads sharing the client. Default is 10
+        :param bool pool_block: Wait for a free connection when all `pool_maxsize` connections to
+                                a host are in use, instead of opening one that is discarded after
+                                the request
+        :param float keep_alive_timeout: Seconds an idle pooled connection is kept before it is
+                                         discarded. Default is to keep connections indefinitely
+        :param RetryPolicy retry_policy: Retries 429/503 responses and connection errors of
+                                         idempotent requests. Default is no retries
+        :param list[CompressionRule] compression_rules: Gzips the bodies of the requests matching
+                                                       a rule, the first matching rule applies.
+                                                       Default is to never compress requests
+        :param CircuitBreaker circuit_breaker: Fails requests fast while their host keeps failing
+        :param HedgingPolicy hedging_policy: Sends a second copy of GETs that are slower than
+                                             usual and uses the first response
         """
-        self.session = Session() if pool_connections else None
-        if self.session and max_retries is not None:
-            self.session.mount('https://', HTTPAdapter(max_retries=max_retries))
-        self.last_request = None
-        self.last_response = None
+        if pool_maxsize is not None and pool_maxsize <= 0:
+            raise ValueError(pool_maxsize)
+        if keep_alive_timeout is not None and keep_alive_timeout <= 0:
+            raise ValueError(keep_alive_timeout)
+
+        self.pool_maxsize = pool_maxsize or DEFAULT_POOLSIZE
+        self.session = self._new_session() if pool_connections else None
+        if self.session:
+            adapter = KeepAliveAdapter(
+                keep_alive_timeout=keep_alive_timeout,
+                pool_connections=self.POOL_HOSTS,
+                pool_maxsize=self.pool_maxsize,
+                pool_block=pool_block,
+                max_retries=max_retries if max_retries is not None else DEFAULT_RETRIES,
+            )
+            self.session.mount('https://', adapter)
+        self._local = local()
+        self._lock = Lock()
         self.logger = logger
         self.request_hooks = request_hooks or hooks.default_hooks()
 
@@ -40,6 +155,61 @@ class TwilioHttpClient(HttpClient):
             raise ValueError(timeout)
         self.timeout = timeout
         self.proxy = proxy
+        self.retry_policy = retry_policy
+        self.compression_rules = compression_rules
+        self.circuit_breaker = circuit_breaker
+        self.hedging_policy = hedging_policy
+        self._hedging_executor = None
+        self._keep_alive = None
+
+    @property
+    def last_request(self):
+        """
+        :return TwilioRequest: The last request made by the current thread
+        """
+        return getattr(self._local, 'last_request', None)
+
+    @last_request.setter
+    def last_request(self, request):
+        self._local.last_request = request
+
+    @property
+    def last_response(self):
+        """
+        :return Response: The response to the last request made by the current thread
+        """
+        return getattr(self._local, 'last_response', None)
+
+    @last_response.setter
+    def last_response(self, response):
+        self._local.last_response = response
+
+    def __getstate__(self):
+        # Per-thread state, locks and threads are not copied, the copy starts its own
+        state = dict(self.__dict__)
+        for name in ('_local', '_lock', '_hedging_executor', '_keep_alive'):
+            del state[name]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._local = local()
+        self._lock = Lock()
+        self._hedging_executor = None
+        self._keep_alive = None
+
+    @property
+    def proxy(self):
+        """
+        :return dict: Http proxy for the requests session
+        """
+        return self._proxy
+
+    @proxy.setter
+    def proxy(self, proxy):
+        self._proxy = proxy
+        if self.session is not None and proxy:
+            self.session.proxies = proxy
 
     def request(self, method, url, params=None, data=None, headers=None, auth=None, timeout=None,
                 allow_redirects=False):
@@ -72,46 +242,233 @@ class TwilioHttpClient(HttpClient):
             'hooks': self.request_hooks
         }
 
-        self._log_request(kwargs)
+        log = self.logger.isEnabledFor(logging.INFO)
 
         self.last_response = None
-        session = self.session or Session()
-        if self.proxy:
-            session.proxies = self.proxy
+        session = self.session
+        if session is None:
+            session = self._new_session()
+            if self.proxy:
+                session.proxies = self.proxy
         request = Request(**kwargs)
         self.last_request = TwilioRequest(**kwargs)
 
+        span = current_span()
+        prepare_started = time.monotonic()
         prepped_request = session.prepare_request(request)
-        response = session.send(
-            prepped_request,
-            allow_redirects=allow_redirects,
-            timeout=timeout if timeout is not None else self.timeout,
-        )
+        if self.compression_rules:
+            self._compress(method, url, prepped_request)
+        if span is not None:
+            span.add_phase('prepare', time.monotonic() - prepare_started)
+            body = prepped_request.body
+            span.set_attribute('http.request.body.size', len(body) if isinstance(body, (bytes, str)) else None)
+
+        breaker = self.circuit_breaker
+        hedging = self.hedging_policy if self.hedging_policy and self.hedging_policy.applies(method) else None
+        host = urlsplit(url).netloc if breaker is not None or hedging is not None else None
+        send_kwargs = {
+            'allow_redirects': allow_redirects,
+            'timeout': timeout if timeout is not None else self.timeout,
+        }
 
-        self._log_response(response)
+        deadline = current_deadline()
+        attempt = 1
+        while True:
+            if deadline is not None:
+                send_kwargs['timeout'] = deadline.timeout(timeout if timeout is not None else self.timeout)
+            if breaker is not None:
+                breaker.before(host)
+            started = time.monotonic()
+            connect = span.phases.get('connect', 0.0) if span is not None else 0.0
+            try:
+                if hedging is not None:
+                    response = hedging.send(self._get_hedging_executor(), host,
+                                            lambda: session.send(prepped_request, **send_kwargs))
+                else:
+                    response = session.send(prepped_request, **send_kwargs)
+            except Exception as e:
+                if log:
+                    self._log_response(kwargs, None, started, attempt, e)
+                expired = deadline is not None and deadline.expired
+                if breaker is not None:
+                    # a timeout of the caller's own deadline says nothing about the host
+                    if expired:
+                        breaker.release(host)
+                    else:
+                        breaker.after(host, error=e)
+                if expired:
+                    raise deadline.exceeded() from e
+                delay = self._retry_delay(attempt, kwargs, error=e) \
+                    if isinstance(e, RequestsConnectionError) else None
+                if delay is None:
+                    raise
+            else:
+                self.last_response = Response(
+                    int(response.status_code),
+                    response.content,
+                    response.headers,
+                    response.encoding,
+                    _wire_size(response),
+                )
+                if breaker is not None:
+                    breaker.after(host, response=self.last_response)
+                if span is not None:
+                    self._trace_response(span, response, started, connect, attempt)
+                if log:
+                    self._log_response(kwargs, self.last_response, started, attempt)
+                delay = self._retry_delay(attempt, kwargs, response=self.last_response)
+                if delay is None:
+                    break
 
-        self.last_response = Response(int(response.status_code), response.text, response.headers)
+            time.sleep(delay)
+            attempt += 1
 
         return self.last_response
 
-    def _log_request(self, kwargs):
-        self.logger.info('-- BEGIN Twilio API Request --')
+    def _retry_delay(self, attempt, kwargs, response=None, error=None):
+        """
+        :return float: Seconds to wait before retrying the request, or None to not retry
+        """
+        if self.retry_policy is None:
+            return None
+
+        delay = self.retry_policy.next_delay(attempt, kwargs['method'], kwargs['headers'],
+                                             response=response, error=error)
+        deadline = current_deadline()
+        if delay is not None and deadline is not None and not deadline.allows(delay):
+            self.logger.info('Not retrying %s %s, the deadline passes in %.2fs',
+                             kwargs['method'], kwargs['url'], deadline.remaining())
+            return None
+        if delay is not None:
+            self.logger.info('Retrying %s %s in %.2fs (attempt %d)',
+                             kwargs['method'], kwargs['url'], delay, attempt + 1)
+            self.retry_policy.notify(kwargs['method'], kwargs['url'], attempt, delay, response, error)
+        return delay
+
+    def warmup(self, urls, connections=1, keep_alive=None):
+        """
+        Opens pooled keep-alive connections ahead of the first requests, so that those requests
+        do not wait for DNS, TCP and TLS setup. The connections are opened by sending
+        `connections` concurrent HEAD requests to each url. Failures are logged and ignored.
+
+        :param list[str] urls: Urls of the hosts to connect to
+        :param int connections: Connections to open per host, at most `pool_maxsize`
+        :param float keep_alive: Repeat the warm-up every `keep_alive` seconds from a daemon thread,
+                                 so idle connections are not closed by the server or by
+                                 `keep_alive_timeout`. Stopped by `stop_keep_alive()`
+        """
+        if connections <= 0:
+            raise ValueError(connections)
+        if keep_alive is not None and keep_alive <= 0:
+            raise ValueError(keep_alive)
+
+        self.stop_keep_alive()
+        if self.session is None or not urls:
+            return
+
+        connections = min(connections, self.pool_maxsize)
+        self._warm(urls, connections)
+
+        if keep_alive is not None:
+            stopped = Event()
+            thread = Thread(target=self._keep_alive_loop, args=(urls, connections, keep_alive, stopped),
+                            name='twilio-keep-alive', daemon=True)
+            self._keep_alive = stopped
+            thread.start()
+
+    def stop_keep_alive(self):
+        """
+        Stops the periodic warm-up started by `warmup(keep_alive=...)`, if any.
+        """
+        stopped, self._keep_alive = self._keep_alive, None
+        if stopped is not None:
+            stopped.set()
 
-        if kwargs['params']:
-            self.logger.info('{} Request: {}?{}'.format(kwargs['method'], kwargs['url'], urlencode(kwargs['params'])))
-            self.logger.info('Query Params: {}'.format(kwargs['params']))
-        else:
-            self.logger.info('{} Request: {}'.format(kwargs['method'], kwargs['url']))
+    def _keep_alive_loop(self, urls, connections, interval, stopped):
+        while not stopped.wait(interval):
+            self._warm(urls, connections)
 
-        if kwargs['headers']:
-            self.logger.info('Headers:')
-            for key, value in kwargs['headers'].items():
-                # Do not log authorization headers
-                if 'authorization' not in key.lower():
-                    self.logger.info('{} : {}'.format(key, value))
+    def _warm(self, urls, connections):
+        """
+        Sends `connections` HEAD requests to each url at once. A barrier holds them back until
+        all are ready, so that each one checks out its own connection rather than reusing one
+        another request already returned to the pool.
+        """
+        timeout = self.timeout or self.WARMUP_TIMEOUT
+
+        def ping(url, barrier):
+            try:
+                barrier.wait(timeout)
+            except BrokenBarrierError:
+                pass
+            try:
+                # sent like request() does, so the connection lands in the pool it will use
+                self.session.send(self.session.prepare_request(Request('HEAD', url)),
+                                  timeout=timeout, allow_redirects=False)
+            except RequestException as e:
+                self.logger.warning('Could not warm up connection to %s: %s', url, e)
+
+        with ThreadPoolExecutor(max_workers=connections * len(urls),
+                                thread_name_prefix='twilio-warmup') as executor:
+            for url in urls:
+                barrier = Barrier(connections)
+                for _ in range(connections):
+                    executor.submit(ping, url, barrier)
+
+    @staticmethod
+    def _trace_response(span, response, started, connect, attempt):
+        """
+        Splits the time spent on an attempt into the `ttfb` and `read` phases of `span`.
+
+        :param float connect: The `connect` phase of `span` before the attempt
+        """
+        total = time.monotonic() - started
+        elapsed = getattr(response, 'elapsed', None)
+        to_headers = elapsed.total_seconds() if elapsed is not None else total
+        span.add_phase('ttfb', max(0.0, to_headers - (span.phases.get('connect', 0.0) - connect)))
+        span.add_phase('read', max(0.0, total - to_headers))
+        span.set_attribute('http.response.body.size', _wire_size(response))
+        if attempt > 1:
+            span.set_attribute('http.request.resend_count', attempt - 1)
+
+    def _get_hedging_executor(self):
+        """
+        :return ThreadPoolExecutor: The threads sending hedged requests, started on first use
+        """
+        if self._hedging_executor is None:
+            with self._lock:
+                if self._hedging_executor is None:
+                    self._hedging_executor = ThreadPoolExecutor(max_workers=self.hedging_policy.max_workers,
+                                                                thread_name_prefix='twilio-hedge')
+        return self._hedging_executor
+
+    @staticmethod
+    def _new_session():
+        """
+        :return Session: A session advertising every content encoding urllib3 can decode, which
+                         includes brotli when the `brotli` package is installed
+        """
+        session = Session()
+        session.headers.update({'Accept-Encoding': ACCEPT_ENCODING})
+        return session
+
+    def _compress(self, method, url, prepped_request):
+        """
+        Gzips the body of a prepared request when a compression rule matches it and it is at
+        least the rule's `min_size` bytes.
+        """
+        body = prepped_request.body
+        if not body or 'Content-Encoding' in prepped_request.headers:
+            return
+        min_size = compress_min_size(self.compression_rules, method, url)
+        if min_size is None or len(body) < min_size:
+            return
 
-        self.logger.info('-- END Twilio API Request --')
+        body = gzip.compress(body.encode('utf-8') if isinstance(body, str) else body)
+        prepped_request.body = body
+        prepped_request.headers['Content-Encoding'] = 'gzip'
+        prepped_request.headers['Content-Length'] = str(len(body))
 
-    def _log_response(self, response):
-        self.logger.info('Response Status Code: {}'.format(response.status_code))
-        self.logger.info('Response Headers: {}'.format(response.headers))
+    def _log_response(self, kwargs, response, started, attempt, error=None):
+        log_exchange(self.logger, kwargs['method'], kwargs['url'], kwargs['params'], kwargs['headers'],
+                     response, time.monotonic() - started, attempt, error)
@@ -0,0 +1,149 @@
+import asyncio
+import re
+import time
+from fnmatch import translate
+from threading import Lock
+from urllib.parse import urlsplit
+
+from twilio.base.deadline import current_deadline
+
+_ACCOUNT = re.compile(r'/Accounts/(AC[0-9a-fA-F]{32})')
+
+
+class TokenBucket(object):
+    """
+    A thread-safe token bucket refilling at `rate` tokens per second, up to `burst` tokens.
+    """
+
+    def __init__(self, rate, burst):
+        """
+        :param float rate: Tokens added per second
+        :param float burst: Maximum number of tokens held
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = Lock()
+
+    def reserve(self):
+        """
+        Takes a token, borrowing against future refills when the bucket is empty so that
+        concurrent callers are served in order.
+
+        :return float: Seconds to wait before the reserved token may be used
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+
+class RateLimit(object):
+    """
+    A request rate for the requests matching a domain, path and method.
+    """
+
+    def __init__(self, rate, burst=None, domain=None, path=None, methods=None):
+        """
+        :param float rate: Requests per second
+        :param float burst: Requests allowed back to back after an idle period, defaults to
+                            one second worth of requests
+        :param str domain: Twilio domain the limit applies to, such as 'api' or 'verify'.
+                           Default is every domain
+        :param str path: Pattern the end of the request path must match, such as
+                         '/Messages.json' or '/Services/*/Verifications'. Default is every path
+        :param list[str] methods: HTTP methods the limit applies to. Default is every method
+        """
+        if rate <= 0:
+            raise ValueError(rate)
+
+        self.rate = rate
+        self.burst = max(1, burst if burst is not None else rate)
+        self.domain = domain
+        self.path = path
+        self.methods = frozenset(m.upper() for m in methods) if methods else None
+        self._path = re.compile(translate('*' + path)) if path else None
+
+    def matches(self, method, domain, path):
+        """
+        :return bool: Whether the limit applies to a request
+        """
+        return (self.domain is None or self.domain == domain) and \
+            (self.methods is None or method in self.methods) and \
+            (self._path is None or self._path.match(path) is not None)
+
+
+class RateLimiter(object):
+    """
+    Paces requests to stay under client-side rate limits instead of running into 429s.
+
+    Each request is held to the first matching RateLimit. Every account and domain gets its own
+    bucket per limit, so a limit of 10/s on '/Messages.json' allows 10 messages per second per
+    account. A limiter may be shared by any number of clients and threads.
+    """
+
+    def __init__(self, limits):
+        """
+        :param list[RateLimit] limits: The limits, the first one matching a request applies
+        """
+        self.limits = list(limits)
+        self._buckets = {}
+        self._lock = Lock()
+
+    def reserve(self, method, uri, account_sid=None):
+        """
+        Reserves a slot for a request.
+
+        :param str method: The HTTP method
+        :param str uri: The fully qualified url
+        :param str account_sid: The account making the request, used when `uri` names none
+        :return float: Seconds to wait before sending the request
+        """
+        method = method.upper()
+        parts = urlsplit(uri)
+        domain = parts.netloc.split('.', 1)[0]
+
+        for limit in self.limits:
+            if limit.matches(method, domain, parts.path):
+                break
+        else:
+            return 0.0
+
+        account = _ACCOUNT.search(parts.path)
+        key = (account.group(1) if account else account_sid, domain, limit)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.setdefault(key, TokenBucket(limit.rate, limit.burst))
+        return bucket.reserve()
+
+    def acquire(self, method, uri, account_sid=None):
+        """
+        Blocks until a request may be sent.
+
+        :raises DeadlineExceededException: The current deadline passes first
+        """
+        delay = self.reserve(method, uri, account_sid)
+        deadline = current_deadline()
+        if deadline is not None and not deadline.allows(delay):
+            time.sleep(max(0.0, deadline.remaining()))
+            raise deadline.exceeded()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, method, uri, account_sid=None):
+        """
+        Waits until a request may be sent without blocking the event loop.
+
+        :raises DeadlineExceededException: The current deadline passes first
+        """
+        delay = self.reserve(method, uri, account_sid)
+        deadline = current_deadline()
+        if deadline is not None and not deadline.allows(delay):
+            await asyncio.sleep(max(0.0, deadline.remaining()))
+            raise deadline.exceeded()
+        if delay > 0:
+            await asyncio.sleep(delay)
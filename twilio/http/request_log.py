@@ -0,0 +1,58 @@
+from urllib.parse import urlencode
+
+REDACTED = '[REDACTED]'
+
+
+def redact(headers):
+    """
+    :param dict headers: HTTP headers
+    :return dict: A copy of `headers` with credentials replaced by REDACTED
+    """
+    return {
+        key: REDACTED if 'authorization' in key.lower() else value
+        for key, value in (headers or {}).items()
+    }
+
+
+def log_exchange(logger, method, url, params, headers, response, duration, attempt=1, error=None):
+    """
+    Emits a single INFO record describing a request and its response, or the error it failed
+    with. The fields are also set on the record as `http_method`, `http_url`, `http_status`,
+    `duration_ms`, `twilio_request_id`, `attempt`, `bytes_received`, `bytes_decoded`,
+    `error_type` and `request_headers` for structured log handlers.
+
+    Building the record is not free, callers check `logger.isEnabledFor(logging.INFO)` first.
+
+    :param logging.Logger logger: The logger to emit to
+    :param str method: The HTTP method
+    :param str url: The URL, without query string
+    :param dict params: Query parameters
+    :param dict headers: Request headers, credentials are redacted
+    :param Response response: The response, None when the request failed
+    :param float duration: Seconds from sending the request to receiving the response or error
+    :param int attempt: The attempt number when the request was retried
+    :param Exception error: The error the request failed with, if any
+    """
+    if params:
+        url = '{}?{}'.format(url, urlencode(params, doseq=True))
+    duration_ms = duration * 1000
+    error_type = type(error).__name__ if error is not None else None
+    if response is not None:
+        status = response.status_code
+        request_id = response.headers.get('Twilio-Request-Id') if response.headers else None
+        received, decoded = response.wire_size, len(response.body)
+    else:
+        status = request_id = received = decoded = None
+
+    logger.info('%s %s %s %.1fms %s', method, url, status, duration_ms, request_id or error_type, extra={
+        'http_method': method,
+        'http_url': url,
+        'http_status': status,
+        'duration_ms': duration_ms,
+        'twilio_request_id': request_id,
+        'attempt': attempt,
+        'bytes_received': received,
+        'bytes_decoded': decoded,
+        'error_type': error_type,
+        'request_headers': redact(headers),
+    })
@@ -1,14 +1,46 @@
+import codecs
+
+
 class Response(object):
-    def __init__(self, status_code, text, headers=None):
-        self.content = text
+    def __init__(self, status_code, text, headers=None, encoding=None, wire_size=None):
+        """
+        :param int status_code: The HTTP status code
+        :param str|bytes text: The response body, bytes are kept as received and only
+                               decoded when `text` is read
+        :param headers: The response headers
+        :param str encoding: The charset of a bytes body, UTF-8 when not given
+        :param int wire_size: Number of body bytes received before content decoding, when known
+        """
+        if isinstance(text, bytes) and encoding and not _is_utf(encoding):
+            # JSON decoders only read UTF bytes, decode anything else up front
+            text = text.decode(encoding, errors='replace')
+
+        self.body = text
+        self.encoding = encoding
+        self.wire_size = wire_size
         self.headers = headers
         self.cached = False
+        self.span = None
         self.status_code = status_code
         self.ok = self.status_code < 400
+        self._text = None
 
     @property
     def text(self):
-        return self.content
+        if self._text is None:
+            body = self.body
+            self._text = body.decode(self.encoding or 'utf-8', errors='replace') \
+                if isinstance(body, bytes) else body
+        return self._text
+
+    content = text
 
     def __repr__(self):
-        return 'HTTP {} {}'.format(self.status_code, self.content)
+        return 'HTTP {} {}'.format(self.status_code, self.text)
+
+
+def _is_utf(encoding):
+    try:
+        return codecs.lookup(encoding).name.startswith('utf')
+    except LookupError:
+        return False
@@ -0,0 +1,109 @@
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+IDEMPOTENCY_HEADER = 'I-Twilio-Idempotency-Token'
+
+
+class RetryPolicy(object):
+    """
+    Decides whether a request is retried after a retryable response or connection error, and how
+    long to wait first.
+
+    Waits follow capped exponential backoff with full jitter, unless the response carries a
+    `Retry-After` header, which is honoured. Only idempotent methods are retried, plus POSTs that
+    carry an `I-Twilio-Idempotency-Token` header, so a retry can never create a record twice.
+    429 responses are retried for every method, since the API throttled the request without
+    acting on it.
+    """
+    IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'])
+    REJECTED_STATUSES = frozenset([429])
+    """ Statuses the API answers without acting on the request """
+
+    def __init__(self, retries=3, backoff=0.5, max_delay=20.0, statuses=(429, 503), on_retry=None):
+        """
+        :param int retries: Maximum number of retries after the first attempt
+        :param float backoff: Base delay in seconds, doubled on every retry
+        :param float max_delay: Upper bound in seconds for a backoff delay. A `Retry-After` longer
+                                than this is not waited for and the response is returned instead
+        :param tuple statuses: HTTP status codes to retry
+        :param callable on_retry: Called as on_retry(method, url, attempt, delay, response, error)
+                                  before waiting for each retry
+        """
+        if retries < 0:
+            raise ValueError(retries)
+        if backoff < 0 or max_delay < 0:
+            raise ValueError(backoff if backoff < 0 else max_delay)
+
+        self.retries = retries
+        self.backoff = backoff
+        self.max_delay = max_delay
+        self.statuses = frozenset(statuses)
+        self.on_retry = on_retry
+
+    def is_retryable(self, method, headers=None):
+        """
+        :param str method: The HTTP method
+        :param dict headers: The request headers
+        :return bool: Whether a request may be sent again without side effects
+        """
+        method = method.upper()
+        if method in self.IDEMPOTENT_METHODS:
+            return True
+        return method == 'POST' and bool(headers) and \
+            any(key.lower() == IDEMPOTENCY_HEADER.lower() for key in headers)
+
+    def next_delay(self, attempt, method, headers=None, response=None, error=None):
+        """
+        Decides on a retry after an attempt returned `response` or raised `error`.
+
+        :param int attempt: The number of the attempt that just completed, starting at 1
+        :param str method: The HTTP method
+        :param dict headers: The request headers
+        :param Response response: The response of the attempt, if any
+        :param Exception error: The connection error raised by the attempt, if any
+        :return float: Seconds to wait before retrying, or None to not retry
+        """
+        if attempt > self.retries:
+            return None
+        if response is not None and response.status_code not in self.statuses:
+            return None
+        rejected = response is not None and response.status_code in self.REJECTED_STATUSES
+        if not rejected and not self.is_retryable(method, headers):
+            return None
+
+        retry_after = self.retry_after(response)
+        if retry_after is not None:
+            return retry_after if retry_after <= self.max_delay else None
+
+        return random.uniform(0, min(self.max_delay, self.backoff * 2 ** (attempt - 1)))
+
+    @staticmethod
+    def retry_after(response):
+        """
+        :param Response response: A response
+        :return float: The delay requested by its `Retry-After` header in seconds, or None
+        """
+        value = response.headers.get('Retry-After') if response is not None and response.headers else None
+        if not value:
+            return None
+
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+    def notify(self, method, url, attempt, delay, response=None, error=None):
+        """
+        Reports an upcoming retry to `on_retry`.
+        """
+        if self.on_retry is not None:
+            self.on_retry(method, url, attempt, delay, response, error)
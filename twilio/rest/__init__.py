@@ -8,22 +8,35 @@ This code was generated by
 
 import os
 import platform
+import re
+import time
 from twilio import __version__
+from twilio.base.domain import Domain
 from twilio.base.exceptions import TwilioException
+from twilio.base.deadline import current_deadline
+from twilio.base.instrumentation import current_span
 from twilio.base.obsolete import obsolete_client
 from twilio.http.http_client import TwilioHttpClient
-from urllib.parse import (
-    urlparse,
-    urlunparse,
+from urllib.parse import urlparse
+
+_USER_AGENT = 'twilio-python/{} ({} {}) Python/{}'.format(
+    __version__,
+    platform.system(),
+    platform.machine(),
+    platform.python_version(),
 )
+_URL = re.compile(r'([a-zA-Z][a-zA-Z0-9+.-]*://)([^/?#]*)(.*)', re.DOTALL)
 
 
 class Client(object):
     """ A client for accessing the Twilio API. """
+    HOSTNAME_CACHE_SIZE = 256
+    """ Number of hosts whose edge and region rewrite is remembered """
 
     def __init__(self, username=None, password=None, account_sid=None, region=None,
                  http_client=None, environment=None, edge=None,
-                 user_agent_extensions=None):
+                 user_agent_extensions=None, json_codec=None, retry_policy=None, rate_limiter=None,
+                 single_flight=None, response_cache=None, instrumentation=None):
         """
         Initializes the Twilio Client
 
@@ -31,10 +44,22 @@ class Client(object):
         :param str password: Password to authenticate with
         :param str account_sid: Account SID, defaults to Username
         :param str region: Twilio Region to make requests to, defaults to 'us1' if an edge is provided
-        :param HttpClient http_client: HttpClient, defaults to TwilioHttpClient
+        :param HttpClient http_client: HttpClient, defaults to TwilioHttpClient. Pass an AsyncHttpClient
+                                       such as AsyncTwilioHttpClient to use the *_async methods
         :param dict environment: Environment to look for auth details, defaults to os.environ
         :param str edge: Twilio Edge to make requests to, defaults to None
         :param list[str] user_agent_extensions: Additions to the user agent string
+        :param JSONCodec json_codec: Codec decoding API responses, defaults to the
+                                     process-wide codec of twilio.base.json_codec
+        :param RetryPolicy retry_policy: Retries throttled (429) and unavailable (503) responses,
+                                         applied to http_client or the default TwilioHttpClient.
+                                         Raises TwilioException for an http_client without retries
+        :param RateLimiter rate_limiter: Paces requests to stay under client-side rate limits
+        :param SingleFlight single_flight: Coalesces identical concurrent fetches into one request
+        :param ResponseCache response_cache: Serves GET responses of rarely changing resources
+                                             from a cache
+        :param Instrumentation instrumentation: Receives the timings of every API call, such as a
+                                                MetricsRegistry
 
         :returns: Twilio Client
         :rtype: twilio.rest.Client
@@ -59,8 +84,26 @@ class Client(object):
 
         self.auth = (self.username, self.password)
         """ :type : tuple(str, str) """
-        self.http_client = http_client or TwilioHttpClient()
+        if http_client is not None and retry_policy is not None:
+            if not hasattr(http_client, 'retry_policy'):
+                raise TwilioException("retry_policy requires an http_client that supports retries, "
+                                      "such as TwilioHttpClient or AsyncTwilioHttpClient")
+            http_client.retry_policy = retry_policy
+        self.http_client = http_client or TwilioHttpClient(retry_policy=retry_policy)
         """ :type : HttpClient """
+        self.json_codec = json_codec
+        """ :type : JSONCodec """
+        self.rate_limiter = rate_limiter
+        """ :type : RateLimiter """
+        self.single_flight = single_flight
+        """ :type : SingleFlight """
+        self.response_cache = response_cache
+        """ :type : ResponseCache """
+        self.instrumentation = instrumentation
+        """ :type : Instrumentation """
+        self._header_templates = None
+        self._header_extensions = None
+        self._hostnames = {}
 
         # Domains
         self._accounts = None
@@ -114,33 +157,99 @@ class Client(object):
         :returns: Response from the Twilio API
         :rtype: twilio.http.response.Response
         """
+        if getattr(self.http_client, 'is_async', False):
+            raise TwilioException('http_client is asynchronous, use the *_async methods to make API requests')
+
+        span = current_span()
+        if span is None and self.instrumentation is not None:
+            span = self._start_span(method)
+            try:
+                with span:
+                    response = self.request(method, uri, params, data, headers, auth, timeout, allow_redirects)
+            except Exception as e:
+                span.end(e)
+                raise
+            span.end()
+            return response
+
         auth = auth or self.auth
-        headers = headers or {}
-
-        pkg_version = __version__
-        os_name = platform.system()
-        os_arch = platform.machine()
-        python_version = platform.python_version()
-        headers['User-Agent'] = 'twilio-python/{} ({} {}) Python/{}'.format(
-            pkg_version,
-            os_name,
-            os_arch,
-            python_version,
+        started = time.monotonic()
+        headers = self._get_headers(method, headers)
+        headers_built = time.monotonic()
+        uri = self.get_hostname(uri)
+        hostname_applied = time.monotonic()
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(method, uri, self.account_sid)
+        if span is not None:
+            self._trace_request(span, method, uri, started, headers_built, hostname_applied)
+        deadline = current_deadline()
+        if deadline is not None:
+            timeout = deadline.timeout(timeout)
+
+        response = self.http_client.request(
+            method,
+            uri,
+            params=params,
+            data=data,
+            headers=headers,
+            auth=auth,
+            timeout=timeout,
+            allow_redirects=allow_redirects
         )
-        for extension in self.user_agent_extensions:
-            headers['User-Agent'] += ' {}'.format(extension)
-        headers['X-Twilio-Client'] = 'python-{}'.format(__version__)
-        headers['Accept-Charset'] = 'utf-8'
+        if span is not None:
+            self._trace_response(span, response)
+        return response
 
-        if method == 'POST' and 'Content-Type' not in headers:
-            headers['Content-Type'] = 'application/x-www-form-urlencoded'
+    async def request_async(self, method, uri, params=None, data=None, headers=None, auth=None,
+                            timeout=None, allow_redirects=False):
+        """
+        Asynchronously makes a request to the Twilio API using the configured http client
+        The configured http client must be an asynchronous http client
+        Authentication information is automatically added if none is provided
 
-        if 'Accept' not in headers:
-            headers['Accept'] = 'application/json'
+        :param str method: HTTP Method
+        :param str uri: Fully qualified url
+        :param dict[str, str] params: Query string parameters
+        :param dict[str, str] data: POST body data
+        :param dict[str, str] headers: HTTP Headers
+        :param tuple(str, str) auth: Authentication
+        :param int timeout: Timeout in seconds
+        :param bool allow_redirects: Should the client follow redirects
 
-        uri = self.get_hostname(uri)
+        :returns: Response from the Twilio API
+        :rtype: twilio.http.response.Response
+        """
+        if not getattr(self.http_client, 'is_async', False):
+            raise TwilioException('http_client must be asynchronous to support async API requests')
+
+        span = current_span()
+        if span is None and self.instrumentation is not None:
+            span = self._start_span(method)
+            try:
+                with span:
+                    response = await self.request_async(method, uri, params, data, headers, auth, timeout,
+                                                        allow_redirects)
+            except Exception as e:
+                span.end(e)
+                raise
+            span.end()
+            return response
 
-        return self.http_client.request(
+        auth = auth or self.auth
+        started = time.monotonic()
+        headers = self._get_headers(method, headers)
+        headers_built = time.monotonic()
+        uri = self.get_hostname(uri)
+        hostname_applied = time.monotonic()
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async(method, uri, self.account_sid)
+        if span is not None:
+            self._trace_request(span, method, uri, started, headers_built, hostname_applied)
+        deadline = current_deadline()
+        if deadline is not None:
+            timeout = deadline.timeout(timeout)
+
+        response = await self.http_client.request(
             method,
             uri,
             params=params,
@@ -150,6 +259,142 @@ class Client(object):
             timeout=timeout,
             allow_redirects=allow_redirects
         )
+        if span is not None:
+            self._trace_response(span, response)
+        return response
+
+    def _start_span(self, method):
+        """
+        :return Span: A span for a request made directly through the client
+        """
+        return self.instrumentation.start_span(method.upper(), {'twilio.operation': 'request'})
+
+    @staticmethod
+    def _trace_request(span, method, uri, started, headers_built, hostname_applied):
+        """
+        Records the request attributes and the time spent preparing the request on `span`.
+        """
+        span.add_phase('headers', headers_built - started)
+        span.add_phase('hostname', hostname_applied - headers_built)
+        span.add_phase('throttle', time.monotonic() - hostname_applied)
+
+        parsed_url = urlparse(uri)
+        span.set_attribute('http.request.method', method.upper())
+        span.set_attribute('url.full', uri)
+        span.set_attribute('server.address', parsed_url.hostname)
+        span.set_attribute('twilio.domain', parsed_url.netloc.split('.', 1)[0])
+
+    @staticmethod
+    def _trace_response(span, response):
+        """
+        Records the response attributes on `span`.
+        """
+        span.set_attribute('http.response.status_code', response.status_code)
+        span.set_attribute('twilio.request_id',
+                           response.headers.get('Twilio-Request-Id') if response.headers else None)
+
+    def warmup(self, domains=None, connections=1, keep_alive=None):
+        """
+        Pre-opens pooled keep-alive connections to the hosts of `domains`, after applying the
+        edge and region of the client, so that the first requests skip connection setup
+
+        :param list[str] domains: Domains to connect to, such as ['api', 'verify'], defaults to ['api']
+        :param int connections: Connections to open per host
+        :param float keep_alive: Repeat the warm-up every `keep_alive` seconds so the connections
+                                 are not closed while idle, until `http_client.stop_keep_alive()`
+
+        :returns: The urls of the hosts connected to
+        :rtype: list[str]
+        """
+        if not callable(getattr(self.http_client, 'warmup', None)) or \
+                getattr(self.http_client, 'is_async', False):
+            raise TwilioException('http_client does not support warming up connections')
+
+        urls = self._warmup_urls(domains)
+        self.http_client.warmup(urls, connections=connections, keep_alive=keep_alive)
+        return urls
+
+    async def warmup_async(self, domains=None, connections=1):
+        """
+        Asynchronously pre-opens pooled keep-alive connections to the hosts of `domains`
+        The configured http client must be an asynchronous http client
+
+        :param list[str] domains: Domains to connect to, such as ['api', 'verify'], defaults to ['api']
+        :param int connections: Connections to open per host
+
+        :returns: The urls of the hosts connected to
+        :rtype: list[str]
+        """
+        if not getattr(self.http_client, 'is_async', False) or \
+                not callable(getattr(self.http_client, 'warmup', None)):
+            raise TwilioException('http_client must be asynchronous to support async API requests')
+
+        urls = self._warmup_urls(domains)
+        await self.http_client.warmup(urls, connections=connections)
+        return urls
+
+    def _warmup_urls(self, domains):
+        """
+        :param list[str] domains: Domain names, such as 'api' or 'verify'
+        :returns: The final url of each domain, without duplicates
+        :rtype: list[str]
+        """
+        urls = []
+        for name in domains or ['api']:
+            domain = getattr(self, name, None)
+            if not isinstance(domain, Domain):
+                raise TwilioException('Unknown domain: {}'.format(name))
+            url = self.get_hostname(domain.base_url)
+            if url not in urls:
+                urls.append(url)
+        return urls
+
+    def _get_headers(self, method, headers):
+        """
+        Adds the standard Twilio headers to the headers of a request.
+
+        :param str method: HTTP Method
+        :param dict[str, str] headers: HTTP Headers
+
+        :returns: The headers to send with the request
+        :rtype: dict[str, str]
+        """
+        if self._header_extensions != self.user_agent_extensions:
+            extensions = list(self.user_agent_extensions)
+            self._header_templates = self._build_header_templates(extensions)
+            self._header_extensions = extensions
+
+        if not headers:
+            return dict(self._header_templates[method == 'POST'])
+
+        headers.update(self._header_templates[None])
+        if method == 'POST' and 'Content-Type' not in headers:
+            headers['Content-Type'] = 'application/x-www-form-urlencoded'
+
+        if 'Accept' not in headers:
+            headers['Accept'] = 'application/json'
+
+        return headers
+
+    @staticmethod
+    def _build_header_templates(extensions):
+        """
+        Computes the standard Twilio headers once per set of user agent extensions.
+
+        :param list[str] extensions: The user agent extensions
+
+        :returns: The headers always sent, under None, and the full headers of a request without
+                  headers of its own, under whether it is a POST
+        :rtype: dict
+        """
+        standard = {
+            'User-Agent': ' '.join([_USER_AGENT] + extensions),
+            'X-Twilio-Client': 'python-{}'.format(__version__),
+            'Accept-Charset': 'utf-8',
+        }
+        other = dict(standard, Accept='application/json')
+        post = dict(other, **{'Content-Type': 'application/x-www-form-urlencoded'})
+        return {None: standard, False: other, True: post}
 
     def get_hostname(self, uri):
         """
@@ -164,8 +409,26 @@ class Client(object):
         if not self.edge and not self.region:
             return uri
 
-        parsed_url = urlparse(uri)
-        pieces = parsed_url.netloc.split('.')
+        match = _URL.match(uri)
+        if match is None:
+            return uri
+        scheme, netloc, rest = match.groups()
+
+        key = (netloc, self.edge, self.region)
+        hostname = self._hostnames.get(key)
+        if hostname is None:
+            if len(self._hostnames) >= self.HOSTNAME_CACHE_SIZE:
+                self._hostnames.clear()
+            hostname = self._hostnames[key] = self._rewrite_hostname(netloc)
+        return scheme + hostname + rest
+
+    def _rewrite_hostname(self, netloc):
+        """
+        :param str netloc: The host of a url
+        :returns: `netloc` with the edge and region of the client
+        :rtype: str
+        """
+        pieces = netloc.split('.')
         prefix = pieces[0]
         suffix = '.'.join(pieces[-2:])
         region = None
@@ -181,10 +444,7 @@ class Client(object):
         edge = self.edge or edge
         region = self.region or region or (edge and 'us1')
 
-        parsed_url = parsed_url._replace(
-            netloc='.'.join([part for part in [prefix, edge, region, suffix] if part])
-        )
-        return urlunparse(parsed_url)
+        return '.'.join([part for part in [prefix, edge, region, suffix] if part])
 
     @property
     def accounts(self):
@@ -6,10 +6,9 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base.version import Version
-from twilio.rest.accounts.v1.auth_token_promotion import AuthTokenPromotionList
-from twilio.rest.accounts.v1.credential import CredentialList
-from twilio.rest.accounts.v1.secondary_auth_token import SecondaryAuthTokenList
 
 
 class V1(Version):
@@ -33,6 +32,7 @@ class V1(Version):
         :rtype: twilio.rest.accounts.v1.auth_token_promotion.AuthTokenPromotionList
         """
         if self._auth_token_promotion is None:
+            from twilio.rest.accounts.v1.auth_token_promotion import AuthTokenPromotionList
             self._auth_token_promotion = AuthTokenPromotionList(self)
         return self._auth_token_promotion
 
@@ -42,6 +42,7 @@ class V1(Version):
         :rtype: twilio.rest.accounts.v1.credential.CredentialList
         """
         if self._credentials is None:
+            from twilio.rest.accounts.v1.credential import CredentialList
             self._credentials = CredentialList(self)
         return self._credentials
 
@@ -51,6 +52,7 @@ class V1(Version):
         :rtype: twilio.rest.accounts.v1.secondary_auth_token.SecondaryAuthTokenList
         """
         if self._secondary_auth_token is None:
+            from twilio.rest.accounts.v1.secondary_auth_token import SecondaryAuthTokenList
             self._secondary_auth_token = SecondaryAuthTokenList(self)
         return self._secondary_auth_token
 
@@ -62,3 +64,21 @@ class V1(Version):
         :rtype: str
         """
         return '<Twilio.Accounts.V1>'
+
+
+_LAZY_IMPORTS = {
+    'AuthTokenPromotionList': 'twilio.rest.accounts.v1.auth_token_promotion',
+    'CredentialList': 'twilio.rest.accounts.v1.credential',
+    'SecondaryAuthTokenList': 'twilio.rest.accounts.v1.secondary_auth_token',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -111,7 +111,7 @@ class AuthTokenPromotionContext(InstanceContext):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/AuthTokens/Promote'.format(**self._solution)
+        self._uri = values.ResourceUri('/AuthTokens/Promote', self._solution)
 
     def update(self):
         """
@@ -124,6 +124,17 @@ class AuthTokenPromotionContext(InstanceContext):
 
         return AuthTokenPromotionInstance(self._version, payload, )
 
+    async def update_async(self):
+        """
+        Asynchronous coroutine that updates the AuthTokenPromotionInstance
+
+        :returns: The updated AuthTokenPromotionInstance
+        :rtype: twilio.rest.accounts.v1.auth_token_promotion.AuthTokenPromotionInstance
+        """
+        payload = await self._version.update_async(method='POST', uri=self._uri, )
+
+        return AuthTokenPromotionInstance(self._version, payload, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -137,6 +148,23 @@ class AuthTokenPromotionContext(InstanceContext):
 
 class AuthTokenPromotionInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'auth_token': 'auth_token',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload):
         """
         Initialize the AuthTokenPromotionInstance
@@ -147,13 +175,7 @@ class AuthTokenPromotionInstance(InstanceResource):
         super(AuthTokenPromotionInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'auth_token': payload.get('auth_token'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -221,6 +243,15 @@ class AuthTokenPromotionInstance(InstanceResource):
         """
         return self._proxy.update()
 
+    async def update_async(self):
+        """
+        Asynchronous coroutine that updates the AuthTokenPromotionInstance
+
+        :returns: The updated AuthTokenPromotionInstance
+        :rtype: twilio.rest.accounts.v1.auth_token_promotion.AuthTokenPromotionInstance
+        """
+        return await self._proxy.update_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
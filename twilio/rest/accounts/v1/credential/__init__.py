@@ -6,11 +6,11 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.accounts.v1.credential.aws import AwsList
-from twilio.rest.accounts.v1.credential.public_key import PublicKeyList
 
 
 class CredentialList(ListResource):
@@ -42,6 +42,7 @@ class CredentialList(ListResource):
         :rtype: twilio.rest.accounts.v1.credential.public_key.PublicKeyList
         """
         if self._public_key is None:
+            from twilio.rest.accounts.v1.credential.public_key import PublicKeyList
             self._public_key = PublicKeyList(self._version, )
         return self._public_key
 
@@ -54,6 +55,7 @@ class CredentialList(ListResource):
         :rtype: twilio.rest.accounts.v1.credential.aws.AwsList
         """
         if self._aws is None:
+            from twilio.rest.accounts.v1.credential.aws import AwsList
             self._aws = AwsList(self._version, )
         return self._aws
 
@@ -107,6 +109,8 @@ class CredentialPage(Page):
 
 class CredentialInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
     def __init__(self, version, payload):
         """
         Initialize the CredentialInstance
@@ -128,3 +132,20 @@ class CredentialInstance(InstanceResource):
         :rtype: str
         """
         return '<Twilio.Accounts.V1.CredentialInstance>'
+
+
+_LAZY_IMPORTS = {
+    'AwsList': 'twilio.rest.accounts.v1.credential.aws',
+    'PublicKeyList': 'twilio.rest.accounts.v1.credential.public_key',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -29,9 +29,9 @@ class AwsList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Credentials/AWS'.format(**self._solution)
+        self._uri = values.ResourceUri('/Credentials/AWS', self._solution)
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams AwsInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -44,17 +44,57 @@ class AwsList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.accounts.v1.credential.aws.AwsInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams AwsInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.accounts.v1.credential.aws.AwsInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists AwsInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -66,11 +106,42 @@ class AwsList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.accounts.v1.credential.aws.AwsInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists AwsInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.accounts.v1.credential.aws.AwsInstance]
+        """
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -91,6 +162,25 @@ class AwsList(ListResource):
 
         return AwsPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of AwsInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of AwsInstance
+        :rtype: twilio.rest.accounts.v1.credential.aws.AwsPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return AwsPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of AwsInstance records from the API.
@@ -108,14 +198,33 @@ class AwsList(ListResource):
 
         return AwsPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of AwsInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of AwsInstance
+        :rtype: twilio.rest.accounts.v1.credential.aws.AwsPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return AwsPage(self._version, response, self._solution)
+
     def create(self, credentials, friendly_name=values.unset,
-               account_sid=values.unset):
+               account_sid=values.unset, deadline=None):
         """
         Create the AwsInstance
 
         :param unicode credentials: A string that contains the AWS access credentials in the format <AWS_ACCESS_KEY_ID>:<AWS_SECRET_ACCESS_KEY>
         :param unicode friendly_name: A string to describe the resource
         :param unicode account_sid: The Subaccount this Credential should be associated with.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created AwsInstance
         :rtype: twilio.rest.accounts.v1.credential.aws.AwsInstance
@@ -126,7 +235,31 @@ class AwsList(ListResource):
             'AccountSid': account_sid,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return AwsInstance(self._version, payload, )
+
+    async def create_async(self, credentials, friendly_name=values.unset,
+                           account_sid=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the AwsInstance
+
+        :param unicode credentials: A string that contains the AWS access credentials in the format <AWS_ACCESS_KEY_ID>:<AWS_SECRET_ACCESS_KEY>
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode account_sid: The Subaccount this Credential should be associated with.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created AwsInstance
+        :rtype: twilio.rest.accounts.v1.credential.aws.AwsInstance
+        """
+        data = values.of({
+            'Credentials': credentials,
+            'FriendlyName': friendly_name,
+            'AccountSid': account_sid,
+        })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return AwsInstance(self._version, payload, )
 
@@ -216,7 +349,7 @@ class AwsContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/Credentials/AWS/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Credentials/AWS/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -229,6 +362,17 @@ class AwsContext(InstanceContext):
 
         return AwsInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the AwsInstance
+
+        :returns: The fetched AwsInstance
+        :rtype: twilio.rest.accounts.v1.credential.aws.AwsInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return AwsInstance(self._version, payload, sid=self._solution['sid'], )
+
     def update(self, friendly_name=values.unset):
         """
         Update the AwsInstance
@@ -244,6 +388,21 @@ class AwsContext(InstanceContext):
 
         return AwsInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def update_async(self, friendly_name=values.unset):
+        """
+        Asynchronous coroutine that updates the AwsInstance
+
+        :param unicode friendly_name: A string to describe the resource
+
+        :returns: The updated AwsInstance
+        :rtype: twilio.rest.accounts.v1.credential.aws.AwsInstance
+        """
+        data = values.of({'FriendlyName': friendly_name, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return AwsInstance(self._version, payload, sid=self._solution['sid'], )
+
     def delete(self):
         """
         Deletes the AwsInstance
@@ -253,6 +412,15 @@ class AwsContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the AwsInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -266,6 +434,24 @@ class AwsContext(InstanceContext):
 
 class AwsInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'friendly_name': 'friendly_name',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the AwsInstance
@@ -276,14 +462,7 @@ class AwsInstance(InstanceResource):
         super(AwsInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'friendly_name': payload.get('friendly_name'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -359,6 +538,15 @@ class AwsInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the AwsInstance
+
+        :returns: The fetched AwsInstance
+        :rtype: twilio.rest.accounts.v1.credential.aws.AwsInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, friendly_name=values.unset):
         """
         Update the AwsInstance
@@ -370,6 +558,17 @@ class AwsInstance(InstanceResource):
         """
         return self._proxy.update(friendly_name=friendly_name, )
 
+    async def update_async(self, friendly_name=values.unset):
+        """
+        Asynchronous coroutine that updates the AwsInstance
+
+        :param unicode friendly_name: A string to describe the resource
+
+        :returns: The updated AwsInstance
+        :rtype: twilio.rest.accounts.v1.credential.aws.AwsInstance
+        """
+        return await self._proxy.update_async(friendly_name=friendly_name, )
+
     def delete(self):
         """
         Deletes the AwsInstance
@@ -379,6 +578,15 @@ class AwsInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the AwsInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
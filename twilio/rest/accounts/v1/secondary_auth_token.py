@@ -111,16 +111,33 @@ class SecondaryAuthTokenContext(InstanceContext):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/AuthTokens/Secondary'.format(**self._solution)
+        self._uri = values.ResourceUri('/AuthTokens/Secondary', self._solution)
 
-    def create(self):
+    def create(self, deadline=None):
         """
         Create the SecondaryAuthTokenInstance
 
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
         :returns: The created SecondaryAuthTokenInstance
         :rtype: twilio.rest.accounts.v1.secondary_auth_token.SecondaryAuthTokenInstance
         """
-        payload = self._version.create(method='POST', uri=self._uri, )
+        payload = self._version.create(method='POST', uri=self._uri, deadline=deadline, )
+
+        return SecondaryAuthTokenInstance(self._version, payload, )
+
+    async def create_async(self, deadline=None):
+        """
+        Asynchronous coroutine that creates the SecondaryAuthTokenInstance
+
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created SecondaryAuthTokenInstance
+        :rtype: twilio.rest.accounts.v1.secondary_auth_token.SecondaryAuthTokenInstance
+        """
+        payload = await self._version.create_async(method='POST', uri=self._uri, deadline=deadline, )
 
         return SecondaryAuthTokenInstance(self._version, payload, )
 
@@ -133,6 +150,15 @@ class SecondaryAuthTokenContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the SecondaryAuthTokenInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -146,6 +172,23 @@ class SecondaryAuthTokenContext(InstanceContext):
 
 class SecondaryAuthTokenInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'secondary_auth_token': 'secondary_auth_token',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload):
         """
         Initialize the SecondaryAuthTokenInstance
@@ -156,13 +199,7 @@ class SecondaryAuthTokenInstance(InstanceResource):
         super(SecondaryAuthTokenInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'secondary_auth_token': payload.get('secondary_auth_token'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -221,14 +258,29 @@ class SecondaryAuthTokenInstance(InstanceResource):
         """
         return self._properties['url']
 
-    def create(self):
+    def create(self, deadline=None):
         """
         Create the SecondaryAuthTokenInstance
 
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created SecondaryAuthTokenInstance
+        :rtype: twilio.rest.accounts.v1.secondary_auth_token.SecondaryAuthTokenInstance
+        """
+        return self._proxy.create(deadline=deadline, )
+
+    async def create_async(self, deadline=None):
+        """
+        Asynchronous coroutine that creates the SecondaryAuthTokenInstance
+
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
         :returns: The created SecondaryAuthTokenInstance
         :rtype: twilio.rest.accounts.v1.secondary_auth_token.SecondaryAuthTokenInstance
         """
-        return self._proxy.create()
+        return await self._proxy.create_async(deadline=deadline, )
 
     def delete(self):
         """
@@ -239,6 +291,15 @@ class SecondaryAuthTokenInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the SecondaryAuthTokenInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -6,8 +6,9 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base.domain import Domain
-from twilio.rest.api.v2010 import V2010
 
 
 class Api(Domain):
@@ -33,6 +34,7 @@ class Api(Domain):
         :rtype: twilio.rest.api.v2010.V2010
         """
         if self._v2010 is None:
+            from twilio.rest.api.v2010 import V2010
             self._v2010 = V2010(self)
         return self._v2010
 
@@ -227,3 +229,19 @@ class Api(Domain):
         :rtype: str
         """
         return '<Twilio.Api>'
+
+
+_LAZY_IMPORTS = {
+    'V2010': 'twilio.rest.api.v2010',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
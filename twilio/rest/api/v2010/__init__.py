@@ -6,9 +6,9 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base.version import Version
-from twilio.rest.api.v2010.account import AccountContext
-from twilio.rest.api.v2010.account import AccountList
 
 
 class V2010(Version):
@@ -31,6 +31,7 @@ class V2010(Version):
         :rtype: twilio.rest.api.v2010.account.AccountList
         """
         if self._accounts is None:
+            from twilio.rest.api.v2010.account import AccountList
             self._accounts = AccountList(self)
         return self._accounts
 
@@ -41,6 +42,7 @@ class V2010(Version):
         :rtype: AccountContext
         """
         if self._account is None:
+            from twilio.rest.api.v2010.account import AccountContext
             self._account = AccountContext(self, self.domain.twilio.account_sid)
         return self._account
 
@@ -229,3 +231,20 @@ class V2010(Version):
         :rtype: str
         """
         return '<Twilio.Api.V2010>'
+
+
+_LAZY_IMPORTS = {
+    'AccountContext': 'twilio.rest.api.v2010.account',
+    'AccountList': 'twilio.rest.api.v2010.account',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -6,36 +6,14 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.api.v2010.account.address import AddressList
-from twilio.rest.api.v2010.account.application import ApplicationList
-from twilio.rest.api.v2010.account.authorized_connect_app import AuthorizedConnectAppList
-from twilio.rest.api.v2010.account.available_phone_number import AvailablePhoneNumberCountryList
-from twilio.rest.api.v2010.account.balance import BalanceList
-from twilio.rest.api.v2010.account.call import CallList
-from twilio.rest.api.v2010.account.conference import ConferenceList
-from twilio.rest.api.v2010.account.connect_app import ConnectAppList
-from twilio.rest.api.v2010.account.incoming_phone_number import IncomingPhoneNumberList
-from twilio.rest.api.v2010.account.key import KeyList
-from twilio.rest.api.v2010.account.message import MessageList
-from twilio.rest.api.v2010.account.new_key import NewKeyList
-from twilio.rest.api.v2010.account.new_signing_key import NewSigningKeyList
-from twilio.rest.api.v2010.account.notification import NotificationList
-from twilio.rest.api.v2010.account.outgoing_caller_id import OutgoingCallerIdList
-from twilio.rest.api.v2010.account.queue import QueueList
-from twilio.rest.api.v2010.account.recording import RecordingList
-from twilio.rest.api.v2010.account.short_code import ShortCodeList
-from twilio.rest.api.v2010.account.signing_key import SigningKeyList
-from twilio.rest.api.v2010.account.sip import SipList
-from twilio.rest.api.v2010.account.token import TokenList
-from twilio.rest.api.v2010.account.transcription import TranscriptionList
-from twilio.rest.api.v2010.account.usage import UsageList
-from twilio.rest.api.v2010.account.validation_request import ValidationRequestList
 
 
 class AccountList(ListResource):
@@ -53,25 +31,44 @@ class AccountList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Accounts.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts.json', self._solution)
 
-    def create(self, friendly_name=values.unset):
+    def create(self, friendly_name=values.unset, deadline=None):
         """
         Create the AccountInstance
 
         :param unicode friendly_name: A human readable description of the account
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created AccountInstance
+        :rtype: twilio.rest.api.v2010.account.AccountInstance
+        """
+        data = values.of({'FriendlyName': friendly_name, })
+
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return AccountInstance(self._version, payload, )
+
+    async def create_async(self, friendly_name=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the AccountInstance
+
+        :param unicode friendly_name: A human readable description of the account
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created AccountInstance
         :rtype: twilio.rest.api.v2010.account.AccountInstance
         """
         data = values.of({'FriendlyName': friendly_name, })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return AccountInstance(self._version, payload, )
 
     def stream(self, friendly_name=values.unset, status=values.unset, limit=None,
-               page_size=None):
+               page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams AccountInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -86,18 +83,60 @@ class AccountList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.AccountInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(friendly_name=friendly_name, status=status, page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(friendly_name=friendly_name, status=status, page_size=limits['page_size'], )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, friendly_name=values.unset, status=values.unset, limit=None,
+                           page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams AccountInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param unicode friendly_name: FriendlyName to filter on
+        :param AccountInstance.Status status: Status to filter on
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.AccountInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(friendly_name=friendly_name, status=status, page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, friendly_name=values.unset, status=values.unset, limit=None,
-             page_size=None):
+             page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists AccountInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -111,6 +150,12 @@ class AccountList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.AccountInstance]
@@ -120,8 +165,46 @@ class AccountList(ListResource):
             status=status,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, friendly_name=values.unset, status=values.unset, limit=None,
+                         page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists AccountInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param unicode friendly_name: FriendlyName to filter on
+        :param AccountInstance.Status status: Status to filter on
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.AccountInstance]
+        """
+        return [record async for record in await self.stream_async(
+            friendly_name=friendly_name,
+            status=status,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, friendly_name=values.unset, status=values.unset,
              page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -150,6 +233,34 @@ class AccountList(ListResource):
 
         return AccountPage(self._version, response, self._solution)
 
+    async def page_async(self, friendly_name=values.unset, status=values.unset,
+                         page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of AccountInstance records from the API.
+        Request is executed immediately
+
+        :param unicode friendly_name: FriendlyName to filter on
+        :param AccountInstance.Status status: Status to filter on
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of AccountInstance
+        :rtype: twilio.rest.api.v2010.account.AccountPage
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'Status': status,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return AccountPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of AccountInstance records from the API.
@@ -167,6 +278,23 @@ class AccountList(ListResource):
 
         return AccountPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of AccountInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of AccountInstance
+        :rtype: twilio.rest.api.v2010.account.AccountPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return AccountPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a AccountContext
@@ -253,7 +381,7 @@ class AccountContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/Accounts/{sid}.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{sid}.json', self._solution)
 
         # Dependents
         self._addresses = None
@@ -292,6 +420,17 @@ class AccountContext(InstanceContext):
 
         return AccountInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the AccountInstance
+
+        :returns: The fetched AccountInstance
+        :rtype: twilio.rest.api.v2010.account.AccountInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return AccountInstance(self._version, payload, sid=self._solution['sid'], )
+
     def update(self, friendly_name=values.unset, status=values.unset):
         """
         Update the AccountInstance
@@ -308,6 +447,22 @@ class AccountContext(InstanceContext):
 
         return AccountInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def update_async(self, friendly_name=values.unset, status=values.unset):
+        """
+        Asynchronous coroutine that updates the AccountInstance
+
+        :param unicode friendly_name: FriendlyName to update
+        :param AccountInstance.Status status: Status to update the Account with
+
+        :returns: The updated AccountInstance
+        :rtype: twilio.rest.api.v2010.account.AccountInstance
+        """
+        data = values.of({'FriendlyName': friendly_name, 'Status': status, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return AccountInstance(self._version, payload, sid=self._solution['sid'], )
+
     @property
     def addresses(self):
         """
@@ -317,6 +472,7 @@ class AccountContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.address.AddressList
         """
         if self._addresses is None:
+            from twilio.rest.api.v2010.account.address import AddressList
             self._addresses = AddressList(self._version, account_sid=self._solution['sid'], )
         return self._addresses
 
@@ -329,6 +485,7 @@ class AccountContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.application.ApplicationList
         """
         if self._applications is None:
+            from twilio.rest.api.v2010.account.application import ApplicationList
             self._applications = ApplicationList(self._version, account_sid=self._solution['sid'], )
         return self._applications
 
@@ -341,6 +498,7 @@ class AccountContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.authorized_connect_app.AuthorizedConnectAppList
         """
         if self._authorized_connect_apps is None:
+            from twilio.rest.api.v2010.account.authorized_connect_app import AuthorizedConnectAppList
             self._authorized_connect_apps = AuthorizedConnectAppList(
                 self._version,
                 account_sid=self._solution['sid'],
@@ -356,6 +514,7 @@ class AccountContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.available_phone_number.AvailablePhoneNumberCountryList
         """
         if self._available_phone_numbers is None:
+            from twilio.rest.api.v2010.account.available_phone_number import AvailablePhoneNumberCountryList
             self._available_phone_numbers = AvailablePhoneNumberCountryList(
                 self._version,
                 account_sid=self._solution['sid'],
@@ -371,6 +530,7 @@ class AccountContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.balance.BalanceList
         """
         if self._balance is None:
+            from twilio.rest.api.v2010.account.balance import BalanceList
             self._balance = BalanceList(self._version, account_sid=self._solution['sid'], )
         return self._balance
 
@@ -383,6 +543,7 @@ class AccountContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.call.CallList
         """
         if self._calls is None:
+            from twilio.rest.api.v2010.account.call import CallList
             self._calls = CallList(self._version, account_sid=self._solution['sid'], )
         return self._calls
 
@@ -395,6 +556,7 @@ class AccountContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.conference.ConferenceList
         """
         if self._conferences is None:
+            from twilio.rest.api.v2010.account.conference import ConferenceList
             self._conferences = ConferenceList(self._version, account_sid=self._solution['sid'], )
         return self._conferences
 
@@ -407,6 +569,7 @@ class AccountContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.connect_app.ConnectAppList
         """
         if self._connect_apps is None:
+            from twilio.rest.api.v2010.account.connect_app import ConnectAppList
             self._connect_apps = ConnectAppList(self._version, account_sid=self._solution['sid'], )
         return self._connect_apps
 
@@ -419,6 +582,7 @@ class AccountContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.incoming_phone_number.IncomingPhoneNumberList
         """
         if self._incoming_phone_numbers is None:
+            from twilio.rest.api.v2010.account.incoming_phone_number import IncomingPhoneNumberList
             self._incoming_phone_numbers = IncomingPhoneNumberList(
                 self._version,
                 account_sid=self._solution['sid'],
@@ -434,6 +598,7 @@ class AccountContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.key.KeyList
         """
         if self._keys is None:
+            from twilio.rest.api.v2010.account.key import KeyList
             self._keys = KeyList(self._version, account_sid=self._solution['sid'], )
         return self._keys
 
@@ -446,6 +611,7 @@ class AccountContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.message.MessageList
         """
         if self._messages is None:
+            from twilio.rest.api.v2010.account.message import MessageList
             self._messages = MessageList(self._version, account_sid=self._solution['sid'], )
         return self._messages
 
@@ -458,6 +624,7 @@ class AccountContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.new_key.NewKeyList
         """
         if self._new_keys is None:
+            from twilio.rest.api.v2010.account.new_key import NewKeyList
             self._new_keys = NewKeyList(self._version, account_sid=self._solution['sid'], )
         return self._new_keys
 
@@ -470,6 +637,7 @@ class AccountContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.new_signing_key.NewSigningKeyList
         """
         if self._new_signing_keys is None:
+            from twilio.rest.api.v2010.account.new_signing_key import NewSigningKeyList
             self._new_signing_keys = NewSigningKeyList(self._version, account_sid=self._solution['sid'], )
         return self._new_signing_keys
 
@@ -482,6 +650,7 @@ class AccountContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.notification.NotificationList
         """
         if self._notifications is None:
+            from twilio.rest.api.v2010.account.notification import NotificationList
             self._notifications = NotificationList(self._version, account_sid=self._solution['sid'], )
         return self._notifications
 
@@ -494,6 +663,7 @@ class AccountContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.outgoing_caller_id.OutgoingCallerIdList
         """
         if self._outgoing_caller_ids is None:
+            from twilio.rest.api.v2010.account.outgoing_caller_id import OutgoingCallerIdList
             self._outgoing_caller_ids = OutgoingCallerIdList(self._version, account_sid=self._solution['sid'], )
         return self._outgoing_caller_ids
 
@@ -506,6 +676,7 @@ class AccountContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.queue.QueueList
         """
         if self._queues is None:
+            from twilio.rest.api.v2010.account.queue import QueueList
             self._queues = QueueList(self._version, account_sid=self._solution['sid'], )
         return self._queues
 
@@ -518,6 +689,7 @@ class AccountContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.recording.RecordingList
         """
         if self._recordings is None:
+            from twilio.rest.api.v2010.account.recording import RecordingList
             self._recordings = RecordingList(self._version, account_sid=self._solution['sid'], )
         return self._recordings
 
@@ -530,6 +702,7 @@ class AccountContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.signing_key.SigningKeyList
         """
         if self._signing_keys is None:
+            from twilio.rest.api.v2010.account.signing_key import SigningKeyList
             self._signing_keys = SigningKeyList(self._version, account_sid=self._solution['sid'], )
         return self._signing_keys
 
@@ -542,6 +715,7 @@ class AccountContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.sip.SipList
         """
         if self._sip is None:
+            from twilio.rest.api.v2010.account.sip import SipList
             self._sip = SipList(self._version, account_sid=self._solution['sid'], )
         return self._sip
 
@@ -554,6 +728,7 @@ class AccountContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.short_code.ShortCodeList
         """
         if self._short_codes is None:
+            from twilio.rest.api.v2010.account.short_code import ShortCodeList
             self._short_codes = ShortCodeList(self._version, account_sid=self._solution['sid'], )
         return self._short_codes
 
@@ -566,6 +741,7 @@ class AccountContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.token.TokenList
         """
         if self._tokens is None:
+            from twilio.rest.api.v2010.account.token import TokenList
             self._tokens = TokenList(self._version, account_sid=self._solution['sid'], )
         return self._tokens
 
@@ -578,6 +754,7 @@ class AccountContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.transcription.TranscriptionList
         """
         if self._transcriptions is None:
+            from twilio.rest.api.v2010.account.transcription import TranscriptionList
             self._transcriptions = TranscriptionList(self._version, account_sid=self._solution['sid'], )
         return self._transcriptions
 
@@ -590,6 +767,7 @@ class AccountContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.usage.UsageList
         """
         if self._usage is None:
+            from twilio.rest.api.v2010.account.usage import UsageList
             self._usage = UsageList(self._version, account_sid=self._solution['sid'], )
         return self._usage
 
@@ -602,6 +780,7 @@ class AccountContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.validation_request.ValidationRequestList
         """
         if self._validation_requests is None:
+            from twilio.rest.api.v2010.account.validation_request import ValidationRequestList
             self._validation_requests = ValidationRequestList(self._version, account_sid=self._solution['sid'], )
         return self._validation_requests
 
@@ -627,6 +806,28 @@ class AccountInstance(InstanceResource):
         TRIAL = "Trial"
         FULL = "Full"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.rfc2822_datetime,
+        'date_updated': deserialize.rfc2822_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'auth_token': 'auth_token',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'friendly_name': 'friendly_name',
+        'owner_account_sid': 'owner_account_sid',
+        'sid': 'sid',
+        'status': 'status',
+        'subresource_uris': 'subresource_uris',
+        'type': 'type',
+        'uri': 'uri',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the AccountInstance
@@ -637,18 +838,7 @@ class AccountInstance(InstanceResource):
         super(AccountInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'auth_token': payload.get('auth_token'),
-            'date_created': deserialize.rfc2822_datetime(payload.get('date_created')),
-            'date_updated': deserialize.rfc2822_datetime(payload.get('date_updated')),
-            'friendly_name': payload.get('friendly_name'),
-            'owner_account_sid': payload.get('owner_account_sid'),
-            'sid': payload.get('sid'),
-            'status': payload.get('status'),
-            'subresource_uris': payload.get('subresource_uris'),
-            'type': payload.get('type'),
-            'uri': payload.get('uri'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -756,6 +946,15 @@ class AccountInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the AccountInstance
+
+        :returns: The fetched AccountInstance
+        :rtype: twilio.rest.api.v2010.account.AccountInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, friendly_name=values.unset, status=values.unset):
         """
         Update the AccountInstance
@@ -768,6 +967,18 @@ class AccountInstance(InstanceResource):
         """
         return self._proxy.update(friendly_name=friendly_name, status=status, )
 
+    async def update_async(self, friendly_name=values.unset, status=values.unset):
+        """
+        Asynchronous coroutine that updates the AccountInstance
+
+        :param unicode friendly_name: FriendlyName to update
+        :param AccountInstance.Status status: Status to update the Account with
+
+        :returns: The updated AccountInstance
+        :rtype: twilio.rest.api.v2010.account.AccountInstance
+        """
+        return await self._proxy.update_async(friendly_name=friendly_name, status=status, )
+
     @property
     def addresses(self):
         """
@@ -1017,3 +1228,42 @@ class AccountInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Api.V2010.AccountInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'AddressList': 'twilio.rest.api.v2010.account.address',
+    'ApplicationList': 'twilio.rest.api.v2010.account.application',
+    'AuthorizedConnectAppList': 'twilio.rest.api.v2010.account.authorized_connect_app',
+    'AvailablePhoneNumberCountryList': 'twilio.rest.api.v2010.account.available_phone_number',
+    'BalanceList': 'twilio.rest.api.v2010.account.balance',
+    'CallList': 'twilio.rest.api.v2010.account.call',
+    'ConferenceList': 'twilio.rest.api.v2010.account.conference',
+    'ConnectAppList': 'twilio.rest.api.v2010.account.connect_app',
+    'IncomingPhoneNumberList': 'twilio.rest.api.v2010.account.incoming_phone_number',
+    'KeyList': 'twilio.rest.api.v2010.account.key',
+    'MessageList': 'twilio.rest.api.v2010.account.message',
+    'NewKeyList': 'twilio.rest.api.v2010.account.new_key',
+    'NewSigningKeyList': 'twilio.rest.api.v2010.account.new_signing_key',
+    'NotificationList': 'twilio.rest.api.v2010.account.notification',
+    'OutgoingCallerIdList': 'twilio.rest.api.v2010.account.outgoing_caller_id',
+    'QueueList': 'twilio.rest.api.v2010.account.queue',
+    'RecordingList': 'twilio.rest.api.v2010.account.recording',
+    'ShortCodeList': 'twilio.rest.api.v2010.account.short_code',
+    'SigningKeyList': 'twilio.rest.api.v2010.account.signing_key',
+    'SipList': 'twilio.rest.api.v2010.account.sip',
+    'TokenList': 'twilio.rest.api.v2010.account.token',
+    'TranscriptionList': 'twilio.rest.api.v2010.account.transcription',
+    'UsageList': 'twilio.rest.api.v2010.account.usage',
+    'ValidationRequestList': 'twilio.rest.api.v2010.account.validation_request',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
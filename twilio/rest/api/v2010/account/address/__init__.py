@@ -6,13 +6,14 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.api.v2010.account.address.dependent_phone_number import DependentPhoneNumberList
 
 
 class AddressList(ListResource):
@@ -31,11 +32,11 @@ class AddressList(ListResource):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, }
-        self._uri = '/Accounts/{account_sid}/Addresses.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/Addresses.json', self._solution)
 
     def create(self, customer_name, street, city, region, postal_code, iso_country,
                friendly_name=values.unset, emergency_enabled=values.unset,
-               auto_correct_address=values.unset):
+               auto_correct_address=values.unset, deadline=None):
         """
         Create the AddressInstance
 
@@ -48,6 +49,8 @@ class AddressList(ListResource):
         :param unicode friendly_name: A string to describe the new resource
         :param bool emergency_enabled: Whether to enable emergency calling on the new address
         :param bool auto_correct_address: Whether we should automatically correct the address
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created AddressInstance
         :rtype: twilio.rest.api.v2010.account.address.AddressInstance
@@ -64,12 +67,50 @@ class AddressList(ListResource):
             'AutoCorrectAddress': auto_correct_address,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return AddressInstance(self._version, payload, account_sid=self._solution['account_sid'], )
+
+    async def create_async(self, customer_name, street, city, region, postal_code, iso_country,
+                           friendly_name=values.unset, emergency_enabled=values.unset,
+                           auto_correct_address=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the AddressInstance
+
+        :param unicode customer_name: The name to associate with the new address
+        :param unicode street: The number and street address of the new address
+        :param unicode city: The city of the new address
+        :param unicode region: The state or region of the new address
+        :param unicode postal_code: The postal code of the new address
+        :param unicode iso_country: The ISO country code of the new address
+        :param unicode friendly_name: A string to describe the new resource
+        :param bool emergency_enabled: Whether to enable emergency calling on the new address
+        :param bool auto_correct_address: Whether we should automatically correct the address
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created AddressInstance
+        :rtype: twilio.rest.api.v2010.account.address.AddressInstance
+        """
+        data = values.of({
+            'CustomerName': customer_name,
+            'Street': street,
+            'City': city,
+            'Region': region,
+            'PostalCode': postal_code,
+            'IsoCountry': iso_country,
+            'FriendlyName': friendly_name,
+            'EmergencyEnabled': emergency_enabled,
+            'AutoCorrectAddress': auto_correct_address,
+        })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return AddressInstance(self._version, payload, account_sid=self._solution['account_sid'], )
 
     def stream(self, customer_name=values.unset, friendly_name=values.unset,
-               iso_country=values.unset, limit=None, page_size=None):
+               iso_country=values.unset, limit=None, page_size=None,
+               prefetch=None, raw=False, deadline=None):
         """
         Streams AddressInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -85,23 +126,73 @@ class AddressList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.address.AddressInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
-            customer_name=customer_name,
-            friendly_name=friendly_name,
-            iso_country=iso_country,
-            page_size=limits['page_size'],
-        )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                customer_name=customer_name,
+                friendly_name=friendly_name,
+                iso_country=iso_country,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, customer_name=values.unset, friendly_name=values.unset,
+                           iso_country=values.unset, limit=None, page_size=None,
+                           prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams AddressInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param unicode customer_name: The `customer_name` of the Address resources to read
+        :param unicode friendly_name: The string that identifies the Address resources to read
+        :param unicode iso_country: The ISO country code of the Address resources to read
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.address.AddressInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                customer_name=customer_name,
+                friendly_name=friendly_name,
+                iso_country=iso_country,
+                page_size=limits['page_size'],
+            )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, customer_name=values.unset, friendly_name=values.unset,
-             iso_country=values.unset, limit=None, page_size=None):
+             iso_country=values.unset, limit=None, page_size=None,
+             prefetch=None, raw=False, deadline=None):
         """
         Lists AddressInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -116,6 +207,12 @@ class AddressList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.address.AddressInstance]
@@ -126,8 +223,49 @@ class AddressList(ListResource):
             iso_country=iso_country,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, customer_name=values.unset, friendly_name=values.unset,
+                         iso_country=values.unset, limit=None, page_size=None,
+                         prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists AddressInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param unicode customer_name: The `customer_name` of the Address resources to read
+        :param unicode friendly_name: The string that identifies the Address resources to read
+        :param unicode iso_country: The ISO country code of the Address resources to read
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.address.AddressInstance]
+        """
+        return [record async for record in await self.stream_async(
+            customer_name=customer_name,
+            friendly_name=friendly_name,
+            iso_country=iso_country,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, customer_name=values.unset, friendly_name=values.unset,
              iso_country=values.unset, page_token=values.unset,
              page_number=values.unset, page_size=values.unset):
@@ -158,6 +296,36 @@ class AddressList(ListResource):
 
         return AddressPage(self._version, response, self._solution)
 
+    async def page_async(self, customer_name=values.unset, friendly_name=values.unset,
+                         iso_country=values.unset, page_token=values.unset,
+                         page_number=values.unset, page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of AddressInstance records from the API.
+        Request is executed immediately
+
+        :param unicode customer_name: The `customer_name` of the Address resources to read
+        :param unicode friendly_name: The string that identifies the Address resources to read
+        :param unicode iso_country: The ISO country code of the Address resources to read
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of AddressInstance
+        :rtype: twilio.rest.api.v2010.account.address.AddressPage
+        """
+        data = values.of({
+            'CustomerName': customer_name,
+            'FriendlyName': friendly_name,
+            'IsoCountry': iso_country,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return AddressPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of AddressInstance records from the API.
@@ -175,6 +343,23 @@ class AddressList(ListResource):
 
         return AddressPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of AddressInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of AddressInstance
+        :rtype: twilio.rest.api.v2010.account.address.AddressPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return AddressPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a AddressContext
@@ -263,7 +448,7 @@ class AddressContext(InstanceContext):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, 'sid': sid, }
-        self._uri = '/Accounts/{account_sid}/Addresses/{sid}.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/Addresses/{sid}.json', self._solution)
 
         # Dependents
         self._dependent_phone_numbers = None
@@ -277,6 +462,15 @@ class AddressContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the AddressInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def fetch(self):
         """
         Fetch the AddressInstance
@@ -293,6 +487,22 @@ class AddressContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the AddressInstance
+
+        :returns: The fetched AddressInstance
+        :rtype: twilio.rest.api.v2010.account.address.AddressInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return AddressInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            sid=self._solution['sid'],
+        )
+
     def update(self, friendly_name=values.unset, customer_name=values.unset,
                street=values.unset, city=values.unset, region=values.unset,
                postal_code=values.unset, emergency_enabled=values.unset,
@@ -332,6 +542,45 @@ class AddressContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, friendly_name=values.unset, customer_name=values.unset,
+                           street=values.unset, city=values.unset, region=values.unset,
+                           postal_code=values.unset, emergency_enabled=values.unset,
+                           auto_correct_address=values.unset):
+        """
+        Asynchronous coroutine that updates the AddressInstance
+
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode customer_name: The name to associate with the address
+        :param unicode street: The number and street address of the address
+        :param unicode city: The city of the address
+        :param unicode region: The state or region of the address
+        :param unicode postal_code: The postal code of the address
+        :param bool emergency_enabled: Whether to enable emergency calling on the address
+        :param bool auto_correct_address: Whether we should automatically correct the address
+
+        :returns: The updated AddressInstance
+        :rtype: twilio.rest.api.v2010.account.address.AddressInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'CustomerName': customer_name,
+            'Street': street,
+            'City': city,
+            'Region': region,
+            'PostalCode': postal_code,
+            'EmergencyEnabled': emergency_enabled,
+            'AutoCorrectAddress': auto_correct_address,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return AddressInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            sid=self._solution['sid'],
+        )
+
     @property
     def dependent_phone_numbers(self):
         """
@@ -341,6 +590,7 @@ class AddressContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.address.dependent_phone_number.DependentPhoneNumberList
         """
         if self._dependent_phone_numbers is None:
+            from twilio.rest.api.v2010.account.address.dependent_phone_number import DependentPhoneNumberList
             self._dependent_phone_numbers = DependentPhoneNumberList(
                 self._version,
                 account_sid=self._solution['account_sid'],
@@ -361,6 +611,33 @@ class AddressContext(InstanceContext):
 
 class AddressInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.rfc2822_datetime,
+        'date_updated': deserialize.rfc2822_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'city': 'city',
+        'customer_name': 'customer_name',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'friendly_name': 'friendly_name',
+        'iso_country': 'iso_country',
+        'postal_code': 'postal_code',
+        'region': 'region',
+        'sid': 'sid',
+        'street': 'street',
+        'uri': 'uri',
+        'emergency_enabled': 'emergency_enabled',
+        'validated': 'validated',
+        'verified': 'verified',
+    }, _deserializers)
+
     def __init__(self, version, payload, account_sid, sid=None):
         """
         Initialize the AddressInstance
@@ -371,23 +648,7 @@ class AddressInstance(InstanceResource):
         super(AddressInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'city': payload.get('city'),
-            'customer_name': payload.get('customer_name'),
-            'date_created': deserialize.rfc2822_datetime(payload.get('date_created')),
-            'date_updated': deserialize.rfc2822_datetime(payload.get('date_updated')),
-            'friendly_name': payload.get('friendly_name'),
-            'iso_country': payload.get('iso_country'),
-            'postal_code': payload.get('postal_code'),
-            'region': payload.get('region'),
-            'sid': payload.get('sid'),
-            'street': payload.get('street'),
-            'uri': payload.get('uri'),
-            'emergency_enabled': payload.get('emergency_enabled'),
-            'validated': payload.get('validated'),
-            'verified': payload.get('verified'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -539,6 +800,15 @@ class AddressInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the AddressInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def fetch(self):
         """
         Fetch the AddressInstance
@@ -548,6 +818,15 @@ class AddressInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the AddressInstance
+
+        :returns: The fetched AddressInstance
+        :rtype: twilio.rest.api.v2010.account.address.AddressInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, friendly_name=values.unset, customer_name=values.unset,
                street=values.unset, city=values.unset, region=values.unset,
                postal_code=values.unset, emergency_enabled=values.unset,
@@ -578,6 +857,36 @@ class AddressInstance(InstanceResource):
             auto_correct_address=auto_correct_address,
         )
 
+    async def update_async(self, friendly_name=values.unset, customer_name=values.unset,
+                           street=values.unset, city=values.unset, region=values.unset,
+                           postal_code=values.unset, emergency_enabled=values.unset,
+                           auto_correct_address=values.unset):
+        """
+        Asynchronous coroutine that updates the AddressInstance
+
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode customer_name: The name to associate with the address
+        :param unicode street: The number and street address of the address
+        :param unicode city: The city of the address
+        :param unicode region: The state or region of the address
+        :param unicode postal_code: The postal code of the address
+        :param bool emergency_enabled: Whether to enable emergency calling on the address
+        :param bool auto_correct_address: Whether we should automatically correct the address
+
+        :returns: The updated AddressInstance
+        :rtype: twilio.rest.api.v2010.account.address.AddressInstance
+        """
+        return await self._proxy.update_async(
+            friendly_name=friendly_name,
+            customer_name=customer_name,
+            street=street,
+            city=city,
+            region=region,
+            postal_code=postal_code,
+            emergency_enabled=emergency_enabled,
+            auto_correct_address=auto_correct_address,
+        )
+
     @property
     def dependent_phone_numbers(self):
         """
@@ -597,3 +906,19 @@ class AddressInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Api.V2010.AddressInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'DependentPhoneNumberList': 'twilio.rest.api.v2010.account.address.dependent_phone_number',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
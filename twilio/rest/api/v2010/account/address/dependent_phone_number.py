@@ -30,9 +30,9 @@ class DependentPhoneNumberList(ListResource):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, 'address_sid': address_sid, }
-        self._uri = '/Accounts/{account_sid}/Addresses/{address_sid}/DependentPhoneNumbers.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/Addresses/{address_sid}/DependentPhoneNumbers.json', self._solution)
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams DependentPhoneNumberInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -45,17 +45,57 @@ class DependentPhoneNumberList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.address.dependent_phone_number.DependentPhoneNumberInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams DependentPhoneNumberInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.address.dependent_phone_number.DependentPhoneNumberInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists DependentPhoneNumberInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -67,11 +107,42 @@ class DependentPhoneNumberList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.address.dependent_phone_number.DependentPhoneNumberInstance]
+        """
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists DependentPhoneNumberInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.address.dependent_phone_number.DependentPhoneNumberInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -92,6 +163,25 @@ class DependentPhoneNumberList(ListResource):
 
         return DependentPhoneNumberPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of DependentPhoneNumberInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of DependentPhoneNumberInstance
+        :rtype: twilio.rest.api.v2010.account.address.dependent_phone_number.DependentPhoneNumberPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return DependentPhoneNumberPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of DependentPhoneNumberInstance records from the API.
@@ -109,6 +199,23 @@ class DependentPhoneNumberList(ListResource):
 
         return DependentPhoneNumberPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of DependentPhoneNumberInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of DependentPhoneNumberInstance
+        :rtype: twilio.rest.api.v2010.account.address.dependent_phone_number.DependentPhoneNumberPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return DependentPhoneNumberPage(self._version, response, self._solution)
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -176,6 +283,44 @@ class DependentPhoneNumberInstance(InstanceResource):
         ACTIVE = "Active"
         INACTIVE = "Inactive"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.rfc2822_datetime,
+        'date_updated': deserialize.rfc2822_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'friendly_name': 'friendly_name',
+        'phone_number': 'phone_number',
+        'voice_url': 'voice_url',
+        'voice_method': 'voice_method',
+        'voice_fallback_method': 'voice_fallback_method',
+        'voice_fallback_url': 'voice_fallback_url',
+        'voice_caller_id_lookup': 'voice_caller_id_lookup',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'sms_fallback_method': 'sms_fallback_method',
+        'sms_fallback_url': 'sms_fallback_url',
+        'sms_method': 'sms_method',
+        'sms_url': 'sms_url',
+        'address_requirements': 'address_requirements',
+        'capabilities': 'capabilities',
+        'status_callback': 'status_callback',
+        'status_callback_method': 'status_callback_method',
+        'api_version': 'api_version',
+        'sms_application_sid': 'sms_application_sid',
+        'voice_application_sid': 'voice_application_sid',
+        'trunk_sid': 'trunk_sid',
+        'emergency_status': 'emergency_status',
+        'emergency_address_sid': 'emergency_address_sid',
+        'uri': 'uri',
+    }, _deserializers)
+
     def __init__(self, version, payload, account_sid, address_sid):
         """
         Initialize the DependentPhoneNumberInstance
@@ -186,34 +331,7 @@ class DependentPhoneNumberInstance(InstanceResource):
         super(DependentPhoneNumberInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'friendly_name': payload.get('friendly_name'),
-            'phone_number': payload.get('phone_number'),
-            'voice_url': payload.get('voice_url'),
-            'voice_method': payload.get('voice_method'),
-            'voice_fallback_method': payload.get('voice_fallback_method'),
-            'voice_fallback_url': payload.get('voice_fallback_url'),
-            'voice_caller_id_lookup': payload.get('voice_caller_id_lookup'),
-            'date_created': deserialize.rfc2822_datetime(payload.get('date_created')),
-            'date_updated': deserialize.rfc2822_datetime(payload.get('date_updated')),
-            'sms_fallback_method': payload.get('sms_fallback_method'),
-            'sms_fallback_url': payload.get('sms_fallback_url'),
-            'sms_method': payload.get('sms_method'),
-            'sms_url': payload.get('sms_url'),
-            'address_requirements': payload.get('address_requirements'),
-            'capabilities': payload.get('capabilities'),
-            'status_callback': payload.get('status_callback'),
-            'status_callback_method': payload.get('status_callback_method'),
-            'api_version': payload.get('api_version'),
-            'sms_application_sid': payload.get('sms_application_sid'),
-            'voice_application_sid': payload.get('voice_application_sid'),
-            'trunk_sid': payload.get('trunk_sid'),
-            'emergency_status': payload.get('emergency_status'),
-            'emergency_address_sid': payload.get('emergency_address_sid'),
-            'uri': payload.get('uri'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -30,7 +30,7 @@ class ApplicationList(ListResource):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, }
-        self._uri = '/Accounts/{account_sid}/Applications.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/Applications.json', self._solution)
 
     def create(self, api_version=values.unset, voice_url=values.unset,
                voice_method=values.unset, voice_fallback_url=values.unset,
@@ -39,7 +39,7 @@ class ApplicationList(ListResource):
                voice_caller_id_lookup=values.unset, sms_url=values.unset,
                sms_method=values.unset, sms_fallback_url=values.unset,
                sms_fallback_method=values.unset, sms_status_callback=values.unset,
-               message_status_callback=values.unset, friendly_name=values.unset):
+               message_status_callback=values.unset, friendly_name=values.unset, deadline=None):
         """
         Create the ApplicationInstance
 
@@ -58,6 +58,8 @@ class ApplicationList(ListResource):
         :param unicode sms_status_callback: The URL to send status information to your application
         :param unicode message_status_callback: The URL to send message status information to your application
         :param unicode friendly_name: A string to describe the new resource
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created ApplicationInstance
         :rtype: twilio.rest.api.v2010.account.application.ApplicationInstance
@@ -80,11 +82,67 @@ class ApplicationList(ListResource):
             'FriendlyName': friendly_name,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return ApplicationInstance(self._version, payload, account_sid=self._solution['account_sid'], )
 
-    def stream(self, friendly_name=values.unset, limit=None, page_size=None):
+    async def create_async(self, api_version=values.unset, voice_url=values.unset,
+                           voice_method=values.unset, voice_fallback_url=values.unset,
+                           voice_fallback_method=values.unset, status_callback=values.unset,
+                           status_callback_method=values.unset,
+                           voice_caller_id_lookup=values.unset, sms_url=values.unset,
+                           sms_method=values.unset, sms_fallback_url=values.unset,
+                           sms_fallback_method=values.unset, sms_status_callback=values.unset,
+                           message_status_callback=values.unset, friendly_name=values.unset,
+                           deadline=None):
+        """
+        Asynchronous coroutine that creates the ApplicationInstance
+
+        :param unicode api_version: The API version to use to start a new TwiML session
+        :param unicode voice_url: The URL to call when the phone number receives a call
+        :param unicode voice_method: The HTTP method to use with the voice_url
+        :param unicode voice_fallback_url: The URL to call when a TwiML error occurs
+        :param unicode voice_fallback_method: The HTTP method to use with voice_fallback_url
+        :param unicode status_callback: The URL to send status information to your application
+        :param unicode status_callback_method: The HTTP method to use to call status_callback
+        :param bool voice_caller_id_lookup: Whether to lookup the caller's name
+        :param unicode sms_url: The URL to call when the phone number receives an incoming SMS message
+        :param unicode sms_method: The HTTP method to use with sms_url
+        :param unicode sms_fallback_url: The URL to call when an error occurs while retrieving or executing the TwiML
+        :param unicode sms_fallback_method: The HTTP method to use with sms_fallback_url
+        :param unicode sms_status_callback: The URL to send status information to your application
+        :param unicode message_status_callback: The URL to send message status information to your application
+        :param unicode friendly_name: A string to describe the new resource
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created ApplicationInstance
+        :rtype: twilio.rest.api.v2010.account.application.ApplicationInstance
+        """
+        data = values.of({
+            'ApiVersion': api_version,
+            'VoiceUrl': voice_url,
+            'VoiceMethod': voice_method,
+            'VoiceFallbackUrl': voice_fallback_url,
+            'VoiceFallbackMethod': voice_fallback_method,
+            'StatusCallback': status_callback,
+            'StatusCallbackMethod': status_callback_method,
+            'VoiceCallerIdLookup': voice_caller_id_lookup,
+            'SmsUrl': sms_url,
+            'SmsMethod': sms_method,
+            'SmsFallbackUrl': sms_fallback_url,
+            'SmsFallbackMethod': sms_fallback_method,
+            'SmsStatusCallback': sms_status_callback,
+            'MessageStatusCallback': message_status_callback,
+            'FriendlyName': friendly_name,
+        })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return ApplicationInstance(self._version, payload, account_sid=self._solution['account_sid'], )
+
+    def stream(self, friendly_name=values.unset, limit=None, page_size=None,
+               prefetch=None, raw=False, deadline=None):
         """
         Streams ApplicationInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -98,17 +156,59 @@ class ApplicationList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.application.ApplicationInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(friendly_name=friendly_name, page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(friendly_name=friendly_name, page_size=limits['page_size'], )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, friendly_name=values.unset, limit=None, page_size=None,
+                           prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams ApplicationInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param unicode friendly_name: The string that identifies the Application resources to read
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.application.ApplicationInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(friendly_name=friendly_name, page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, friendly_name=values.unset, limit=None, page_size=None):
+    def list(self, friendly_name=values.unset, limit=None, page_size=None,
+             prefetch=None, raw=False, deadline=None):
         """
         Lists ApplicationInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -121,11 +221,43 @@ class ApplicationList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.application.ApplicationInstance]
         """
-        return list(self.stream(friendly_name=friendly_name, limit=limit, page_size=page_size, ))
+        return list(self.stream(friendly_name=friendly_name, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, friendly_name=values.unset, limit=None, page_size=None,
+                         prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists ApplicationInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param unicode friendly_name: The string that identifies the Application resources to read
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.application.ApplicationInstance]
+        """
+        return [record async for record in await self.stream_async(friendly_name=friendly_name, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, friendly_name=values.unset, page_token=values.unset,
              page_number=values.unset, page_size=values.unset):
@@ -152,6 +284,31 @@ class ApplicationList(ListResource):
 
         return ApplicationPage(self._version, response, self._solution)
 
+    async def page_async(self, friendly_name=values.unset, page_token=values.unset,
+                         page_number=values.unset, page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of ApplicationInstance records from the API.
+        Request is executed immediately
+
+        :param unicode friendly_name: The string that identifies the Application resources to read
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of ApplicationInstance
+        :rtype: twilio.rest.api.v2010.account.application.ApplicationPage
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return ApplicationPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of ApplicationInstance records from the API.
@@ -169,6 +326,23 @@ class ApplicationList(ListResource):
 
         return ApplicationPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of ApplicationInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of ApplicationInstance
+        :rtype: twilio.rest.api.v2010.account.application.ApplicationPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return ApplicationPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a ApplicationContext
@@ -257,7 +431,7 @@ class ApplicationContext(InstanceContext):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, 'sid': sid, }
-        self._uri = '/Accounts/{account_sid}/Applications/{sid}.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/Applications/{sid}.json', self._solution)
 
     def delete(self):
         """
@@ -268,6 +442,15 @@ class ApplicationContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the ApplicationInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def fetch(self):
         """
         Fetch the ApplicationInstance
@@ -284,6 +467,22 @@ class ApplicationContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ApplicationInstance
+
+        :returns: The fetched ApplicationInstance
+        :rtype: twilio.rest.api.v2010.account.application.ApplicationInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return ApplicationInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            sid=self._solution['sid'],
+        )
+
     def update(self, friendly_name=values.unset, api_version=values.unset,
                voice_url=values.unset, voice_method=values.unset,
                voice_fallback_url=values.unset, voice_fallback_method=values.unset,
@@ -341,6 +540,63 @@ class ApplicationContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, friendly_name=values.unset, api_version=values.unset,
+                           voice_url=values.unset, voice_method=values.unset,
+                           voice_fallback_url=values.unset, voice_fallback_method=values.unset,
+                           status_callback=values.unset, status_callback_method=values.unset,
+                           voice_caller_id_lookup=values.unset, sms_url=values.unset,
+                           sms_method=values.unset, sms_fallback_url=values.unset,
+                           sms_fallback_method=values.unset, sms_status_callback=values.unset,
+                           message_status_callback=values.unset):
+        """
+        Asynchronous coroutine that updates the ApplicationInstance
+
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode api_version: The API version to use to start a new TwiML session
+        :param unicode voice_url: The URL to call when the phone number receives a call
+        :param unicode voice_method: The HTTP method to use with the voice_url
+        :param unicode voice_fallback_url: The URL to call when a TwiML error occurs
+        :param unicode voice_fallback_method: The HTTP method to use with voice_fallback_url
+        :param unicode status_callback: The URL to send status information to your application
+        :param unicode status_callback_method: The HTTP method to use to call status_callback
+        :param bool voice_caller_id_lookup: Whether to lookup the caller's name
+        :param unicode sms_url: The URL to call when the phone number receives an incoming SMS message
+        :param unicode sms_method: The HTTP method to use with sms_url
+        :param unicode sms_fallback_url: The URL to call when an error occurs while retrieving or executing the TwiML
+        :param unicode sms_fallback_method: The HTTP method to use with sms_fallback_url
+        :param unicode sms_status_callback: Same as message_status_callback. Deprecated, included for backwards compatibility.
+        :param unicode message_status_callback: The URL to send message status information to your application
+
+        :returns: The updated ApplicationInstance
+        :rtype: twilio.rest.api.v2010.account.application.ApplicationInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'ApiVersion': api_version,
+            'VoiceUrl': voice_url,
+            'VoiceMethod': voice_method,
+            'VoiceFallbackUrl': voice_fallback_url,
+            'VoiceFallbackMethod': voice_fallback_method,
+            'StatusCallback': status_callback,
+            'StatusCallbackMethod': status_callback_method,
+            'VoiceCallerIdLookup': voice_caller_id_lookup,
+            'SmsUrl': sms_url,
+            'SmsMethod': sms_method,
+            'SmsFallbackUrl': sms_fallback_url,
+            'SmsFallbackMethod': sms_fallback_method,
+            'SmsStatusCallback': sms_status_callback,
+            'MessageStatusCallback': message_status_callback,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return ApplicationInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            sid=self._solution['sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -354,6 +610,38 @@ class ApplicationContext(InstanceContext):
 
 class ApplicationInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.rfc2822_datetime,
+        'date_updated': deserialize.rfc2822_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'api_version': 'api_version',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'friendly_name': 'friendly_name',
+        'message_status_callback': 'message_status_callback',
+        'sid': 'sid',
+        'sms_fallback_method': 'sms_fallback_method',
+        'sms_fallback_url': 'sms_fallback_url',
+        'sms_method': 'sms_method',
+        'sms_status_callback': 'sms_status_callback',
+        'sms_url': 'sms_url',
+        'status_callback': 'status_callback',
+        'status_callback_method': 'status_callback_method',
+        'uri': 'uri',
+        'voice_caller_id_lookup': 'voice_caller_id_lookup',
+        'voice_fallback_method': 'voice_fallback_method',
+        'voice_fallback_url': 'voice_fallback_url',
+        'voice_method': 'voice_method',
+        'voice_url': 'voice_url',
+    }, _deserializers)
+
     def __init__(self, version, payload, account_sid, sid=None):
         """
         Initialize the ApplicationInstance
@@ -364,28 +652,7 @@ class ApplicationInstance(InstanceResource):
         super(ApplicationInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'api_version': payload.get('api_version'),
-            'date_created': deserialize.rfc2822_datetime(payload.get('date_created')),
-            'date_updated': deserialize.rfc2822_datetime(payload.get('date_updated')),
-            'friendly_name': payload.get('friendly_name'),
-            'message_status_callback': payload.get('message_status_callback'),
-            'sid': payload.get('sid'),
-            'sms_fallback_method': payload.get('sms_fallback_method'),
-            'sms_fallback_url': payload.get('sms_fallback_url'),
-            'sms_method': payload.get('sms_method'),
-            'sms_status_callback': payload.get('sms_status_callback'),
-            'sms_url': payload.get('sms_url'),
-            'status_callback': payload.get('status_callback'),
-            'status_callback_method': payload.get('status_callback_method'),
-            'uri': payload.get('uri'),
-            'voice_caller_id_lookup': payload.get('voice_caller_id_lookup'),
-            'voice_fallback_method': payload.get('voice_fallback_method'),
-            'voice_fallback_url': payload.get('voice_fallback_url'),
-            'voice_method': payload.get('voice_method'),
-            'voice_url': payload.get('voice_url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -577,6 +844,15 @@ class ApplicationInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the ApplicationInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def fetch(self):
         """
         Fetch the ApplicationInstance
@@ -586,6 +862,15 @@ class ApplicationInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ApplicationInstance
+
+        :returns: The fetched ApplicationInstance
+        :rtype: twilio.rest.api.v2010.account.application.ApplicationInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, friendly_name=values.unset, api_version=values.unset,
                voice_url=values.unset, voice_method=values.unset,
                voice_fallback_url=values.unset, voice_fallback_method=values.unset,
@@ -634,6 +919,54 @@ class ApplicationInstance(InstanceResource):
             message_status_callback=message_status_callback,
         )
 
+    async def update_async(self, friendly_name=values.unset, api_version=values.unset,
+                           voice_url=values.unset, voice_method=values.unset,
+                           voice_fallback_url=values.unset, voice_fallback_method=values.unset,
+                           status_callback=values.unset, status_callback_method=values.unset,
+                           voice_caller_id_lookup=values.unset, sms_url=values.unset,
+                           sms_method=values.unset, sms_fallback_url=values.unset,
+                           sms_fallback_method=values.unset, sms_status_callback=values.unset,
+                           message_status_callback=values.unset):
+        """
+        Asynchronous coroutine that updates the ApplicationInstance
+
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode api_version: The API version to use to start a new TwiML session
+        :param unicode voice_url: The URL to call when the phone number receives a call
+        :param unicode voice_method: The HTTP method to use with the voice_url
+        :param unicode voice_fallback_url: The URL to call when a TwiML error occurs
+        :param unicode voice_fallback_method: The HTTP method to use with voice_fallback_url
+        :param unicode status_callback: The URL to send status information to your application
+        :param unicode status_callback_method: The HTTP method to use to call status_callback
+        :param bool voice_caller_id_lookup: Whether to lookup the caller's name
+        :param unicode sms_url: The URL to call when the phone number receives an incoming SMS message
+        :param unicode sms_method: The HTTP method to use with sms_url
+        :param unicode sms_fallback_url: The URL to call when an error occurs while retrieving or executing the TwiML
+        :param unicode sms_fallback_method: The HTTP method to use with sms_fallback_url
+        :param unicode sms_status_callback: Same as message_status_callback. Deprecated, included for backwards compatibility.
+        :param unicode message_status_callback: The URL to send message status information to your application
+
+        :returns: The updated ApplicationInstance
+        :rtype: twilio.rest.api.v2010.account.application.ApplicationInstance
+        """
+        return await self._proxy.update_async(
+            friendly_name=friendly_name,
+            api_version=api_version,
+            voice_url=voice_url,
+            voice_method=voice_method,
+            voice_fallback_url=voice_fallback_url,
+            voice_fallback_method=voice_fallback_method,
+            status_callback=status_callback,
+            status_callback_method=status_callback_method,
+            voice_caller_id_lookup=voice_caller_id_lookup,
+            sms_url=sms_url,
+            sms_method=sms_method,
+            sms_fallback_url=sms_fallback_url,
+            sms_fallback_method=sms_fallback_method,
+            sms_status_callback=sms_status_callback,
+            message_status_callback=message_status_callback,
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
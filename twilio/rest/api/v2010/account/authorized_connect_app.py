@@ -30,9 +30,9 @@ class AuthorizedConnectAppList(ListResource):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, }
-        self._uri = '/Accounts/{account_sid}/AuthorizedConnectApps.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/AuthorizedConnectApps.json', self._solution)
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams AuthorizedConnectAppInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -45,17 +45,57 @@ class AuthorizedConnectAppList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.authorized_connect_app.AuthorizedConnectAppInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams AuthorizedConnectAppInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.authorized_connect_app.AuthorizedConnectAppInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists AuthorizedConnectAppInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -67,11 +107,42 @@ class AuthorizedConnectAppList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.authorized_connect_app.AuthorizedConnectAppInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists AuthorizedConnectAppInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.authorized_connect_app.AuthorizedConnectAppInstance]
+        """
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -92,6 +163,25 @@ class AuthorizedConnectAppList(ListResource):
 
         return AuthorizedConnectAppPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of AuthorizedConnectAppInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of AuthorizedConnectAppInstance
+        :rtype: twilio.rest.api.v2010.account.authorized_connect_app.AuthorizedConnectAppPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return AuthorizedConnectAppPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of AuthorizedConnectAppInstance records from the API.
@@ -109,6 +199,23 @@ class AuthorizedConnectAppList(ListResource):
 
         return AuthorizedConnectAppPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of AuthorizedConnectAppInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of AuthorizedConnectAppInstance
+        :rtype: twilio.rest.api.v2010.account.authorized_connect_app.AuthorizedConnectAppPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return AuthorizedConnectAppPage(self._version, response, self._solution)
+
     def get(self, connect_app_sid):
         """
         Constructs a AuthorizedConnectAppContext
@@ -209,7 +316,7 @@ class AuthorizedConnectAppContext(InstanceContext):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, 'connect_app_sid': connect_app_sid, }
-        self._uri = '/Accounts/{account_sid}/AuthorizedConnectApps/{connect_app_sid}.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/AuthorizedConnectApps/{connect_app_sid}.json', self._solution)
 
     def fetch(self):
         """
@@ -227,6 +334,22 @@ class AuthorizedConnectAppContext(InstanceContext):
             connect_app_sid=self._solution['connect_app_sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the AuthorizedConnectAppInstance
+
+        :returns: The fetched AuthorizedConnectAppInstance
+        :rtype: twilio.rest.api.v2010.account.authorized_connect_app.AuthorizedConnectAppInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return AuthorizedConnectAppInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            connect_app_sid=self._solution['connect_app_sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -244,6 +367,28 @@ class AuthorizedConnectAppInstance(InstanceResource):
         GET_ALL = "get-all"
         POST_ALL = "post-all"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.rfc2822_datetime,
+        'date_updated': deserialize.rfc2822_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'connect_app_company_name': 'connect_app_company_name',
+        'connect_app_description': 'connect_app_description',
+        'connect_app_friendly_name': 'connect_app_friendly_name',
+        'connect_app_homepage_url': 'connect_app_homepage_url',
+        'connect_app_sid': 'connect_app_sid',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'permissions': 'permissions',
+        'uri': 'uri',
+    }, _deserializers)
+
     def __init__(self, version, payload, account_sid, connect_app_sid=None):
         """
         Initialize the AuthorizedConnectAppInstance
@@ -254,18 +399,7 @@ class AuthorizedConnectAppInstance(InstanceResource):
         super(AuthorizedConnectAppInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'connect_app_company_name': payload.get('connect_app_company_name'),
-            'connect_app_description': payload.get('connect_app_description'),
-            'connect_app_friendly_name': payload.get('connect_app_friendly_name'),
-            'connect_app_homepage_url': payload.get('connect_app_homepage_url'),
-            'connect_app_sid': payload.get('connect_app_sid'),
-            'date_created': deserialize.rfc2822_datetime(payload.get('date_created')),
-            'date_updated': deserialize.rfc2822_datetime(payload.get('date_updated')),
-            'permissions': payload.get('permissions'),
-            'uri': payload.get('uri'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -380,6 +514,15 @@ class AuthorizedConnectAppInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the AuthorizedConnectAppInstance
+
+        :returns: The fetched AuthorizedConnectAppInstance
+        :rtype: twilio.rest.api.v2010.account.authorized_connect_app.AuthorizedConnectAppInstance
+        """
+        return await self._proxy.fetch_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
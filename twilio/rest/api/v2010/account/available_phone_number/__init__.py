@@ -6,18 +6,14 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.api.v2010.account.available_phone_number.local import LocalList
-from twilio.rest.api.v2010.account.available_phone_number.machine_to_machine import MachineToMachineList
-from twilio.rest.api.v2010.account.available_phone_number.mobile import MobileList
-from twilio.rest.api.v2010.account.available_phone_number.national import NationalList
-from twilio.rest.api.v2010.account.available_phone_number.shared_cost import SharedCostList
-from twilio.rest.api.v2010.account.available_phone_number.toll_free import TollFreeList
-from twilio.rest.api.v2010.account.available_phone_number.voip import VoipList
 
 
 class AvailablePhoneNumberCountryList(ListResource):
@@ -36,9 +32,9 @@ class AvailablePhoneNumberCountryList(ListResource):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, }
-        self._uri = '/Accounts/{account_sid}/AvailablePhoneNumbers.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/AvailablePhoneNumbers.json', self._solution)
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams AvailablePhoneNumberCountryInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -51,17 +47,57 @@ class AvailablePhoneNumberCountryList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.available_phone_number.AvailablePhoneNumberCountryInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams AvailablePhoneNumberCountryInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.available_phone_number.AvailablePhoneNumberCountryInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists AvailablePhoneNumberCountryInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -73,11 +109,42 @@ class AvailablePhoneNumberCountryList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.available_phone_number.AvailablePhoneNumberCountryInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists AvailablePhoneNumberCountryInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.available_phone_number.AvailablePhoneNumberCountryInstance]
+        """
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -98,6 +165,25 @@ class AvailablePhoneNumberCountryList(ListResource):
 
         return AvailablePhoneNumberCountryPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of AvailablePhoneNumberCountryInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of AvailablePhoneNumberCountryInstance
+        :rtype: twilio.rest.api.v2010.account.available_phone_number.AvailablePhoneNumberCountryPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return AvailablePhoneNumberCountryPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of AvailablePhoneNumberCountryInstance records from the API.
@@ -115,6 +201,23 @@ class AvailablePhoneNumberCountryList(ListResource):
 
         return AvailablePhoneNumberCountryPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of AvailablePhoneNumberCountryInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of AvailablePhoneNumberCountryInstance
+        :rtype: twilio.rest.api.v2010.account.available_phone_number.AvailablePhoneNumberCountryPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return AvailablePhoneNumberCountryPage(self._version, response, self._solution)
+
     def get(self, country_code):
         """
         Constructs a AvailablePhoneNumberCountryContext
@@ -215,7 +318,7 @@ class AvailablePhoneNumberCountryContext(InstanceContext):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, 'country_code': country_code, }
-        self._uri = '/Accounts/{account_sid}/AvailablePhoneNumbers/{country_code}.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/AvailablePhoneNumbers/{country_code}.json', self._solution)
 
         # Dependents
         self._local = None
@@ -242,6 +345,22 @@ class AvailablePhoneNumberCountryContext(InstanceContext):
             country_code=self._solution['country_code'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the AvailablePhoneNumberCountryInstance
+
+        :returns: The fetched AvailablePhoneNumberCountryInstance
+        :rtype: twilio.rest.api.v2010.account.available_phone_number.AvailablePhoneNumberCountryInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return AvailablePhoneNumberCountryInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            country_code=self._solution['country_code'],
+        )
+
     @property
     def local(self):
         """
@@ -251,6 +370,7 @@ class AvailablePhoneNumberCountryContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.available_phone_number.local.LocalList
         """
         if self._local is None:
+            from twilio.rest.api.v2010.account.available_phone_number.local import LocalList
             self._local = LocalList(
                 self._version,
                 account_sid=self._solution['account_sid'],
@@ -267,6 +387,7 @@ class AvailablePhoneNumberCountryContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.available_phone_number.toll_free.TollFreeList
         """
         if self._toll_free is None:
+            from twilio.rest.api.v2010.account.available_phone_number.toll_free import TollFreeList
             self._toll_free = TollFreeList(
                 self._version,
                 account_sid=self._solution['account_sid'],
@@ -283,6 +404,7 @@ class AvailablePhoneNumberCountryContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.available_phone_number.mobile.MobileList
         """
         if self._mobile is None:
+            from twilio.rest.api.v2010.account.available_phone_number.mobile import MobileList
             self._mobile = MobileList(
                 self._version,
                 account_sid=self._solution['account_sid'],
@@ -299,6 +421,7 @@ class AvailablePhoneNumberCountryContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.available_phone_number.national.NationalList
         """
         if self._national is None:
+            from twilio.rest.api.v2010.account.available_phone_number.national import NationalList
             self._national = NationalList(
                 self._version,
                 account_sid=self._solution['account_sid'],
@@ -315,6 +438,7 @@ class AvailablePhoneNumberCountryContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.available_phone_number.voip.VoipList
         """
         if self._voip is None:
+            from twilio.rest.api.v2010.account.available_phone_number.voip import VoipList
             self._voip = VoipList(
                 self._version,
                 account_sid=self._solution['account_sid'],
@@ -331,6 +455,7 @@ class AvailablePhoneNumberCountryContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.available_phone_number.shared_cost.SharedCostList
         """
         if self._shared_cost is None:
+            from twilio.rest.api.v2010.account.available_phone_number.shared_cost import SharedCostList
             self._shared_cost = SharedCostList(
                 self._version,
                 account_sid=self._solution['account_sid'],
@@ -347,6 +472,7 @@ class AvailablePhoneNumberCountryContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.available_phone_number.machine_to_machine.MachineToMachineList
         """
         if self._machine_to_machine is None:
+            from twilio.rest.api.v2010.account.available_phone_number.machine_to_machine import MachineToMachineList
             self._machine_to_machine = MachineToMachineList(
                 self._version,
                 account_sid=self._solution['account_sid'],
@@ -367,6 +493,17 @@ class AvailablePhoneNumberCountryContext(InstanceContext):
 
 class AvailablePhoneNumberCountryInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'country_code': 'country_code',
+        'country': 'country',
+        'uri': 'uri',
+        'beta': 'beta',
+        'subresource_uris': 'subresource_uris',
+    })
+
     def __init__(self, version, payload, account_sid, country_code=None):
         """
         Initialize the AvailablePhoneNumberCountryInstance
@@ -377,13 +514,7 @@ class AvailablePhoneNumberCountryInstance(InstanceResource):
         super(AvailablePhoneNumberCountryInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'country_code': payload.get('country_code'),
-            'country': payload.get('country'),
-            'uri': payload.get('uri'),
-            'beta': payload.get('beta'),
-            'subresource_uris': payload.get('subresource_uris'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -458,6 +589,15 @@ class AvailablePhoneNumberCountryInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the AvailablePhoneNumberCountryInstance
+
+        :returns: The fetched AvailablePhoneNumberCountryInstance
+        :rtype: twilio.rest.api.v2010.account.available_phone_number.AvailablePhoneNumberCountryInstance
+        """
+        return await self._proxy.fetch_async()
+
     @property
     def local(self):
         """
@@ -537,3 +677,25 @@ class AvailablePhoneNumberCountryInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Api.V2010.AvailablePhoneNumberCountryInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'LocalList': 'twilio.rest.api.v2010.account.available_phone_number.local',
+    'MachineToMachineList': 'twilio.rest.api.v2010.account.available_phone_number.machine_to_machine',
+    'MobileList': 'twilio.rest.api.v2010.account.available_phone_number.mobile',
+    'NationalList': 'twilio.rest.api.v2010.account.available_phone_number.national',
+    'SharedCostList': 'twilio.rest.api.v2010.account.available_phone_number.shared_cost',
+    'TollFreeList': 'twilio.rest.api.v2010.account.available_phone_number.toll_free',
+    'VoipList': 'twilio.rest.api.v2010.account.available_phone_number.voip',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -30,7 +30,7 @@ class SharedCostList(ListResource):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, 'country_code': country_code, }
-        self._uri = '/Accounts/{account_sid}/AvailablePhoneNumbers/{country_code}/SharedCost.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/AvailablePhoneNumbers/{country_code}/SharedCost.json', self._solution)
 
     def stream(self, area_code=values.unset, contains=values.unset,
                sms_enabled=values.unset, mms_enabled=values.unset,
@@ -42,7 +42,8 @@ class SharedCostList(ListResource):
                distance=values.unset, in_postal_code=values.unset,
                in_region=values.unset, in_rate_center=values.unset,
                in_lata=values.unset, in_locality=values.unset,
-               fax_enabled=values.unset, limit=None, page_size=None):
+               fax_enabled=values.unset, limit=None, page_size=None,
+               prefetch=None, raw=False, deadline=None):
         """
         Streams SharedCostInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -73,13 +74,175 @@ class SharedCostList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.available_phone_number.shared_cost.SharedCostInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                area_code=area_code,
+                contains=contains,
+                sms_enabled=sms_enabled,
+                mms_enabled=mms_enabled,
+                voice_enabled=voice_enabled,
+                exclude_all_address_required=exclude_all_address_required,
+                exclude_local_address_required=exclude_local_address_required,
+                exclude_foreign_address_required=exclude_foreign_address_required,
+                beta=beta,
+                near_number=near_number,
+                near_lat_long=near_lat_long,
+                distance=distance,
+                in_postal_code=in_postal_code,
+                in_region=in_region,
+                in_rate_center=in_rate_center,
+                in_lata=in_lata,
+                in_locality=in_locality,
+                fax_enabled=fax_enabled,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, area_code=values.unset, contains=values.unset,
+                           sms_enabled=values.unset, mms_enabled=values.unset,
+                           voice_enabled=values.unset,
+                           exclude_all_address_required=values.unset,
+                           exclude_local_address_required=values.unset,
+                           exclude_foreign_address_required=values.unset, beta=values.unset,
+                           near_number=values.unset, near_lat_long=values.unset,
+                           distance=values.unset, in_postal_code=values.unset,
+                           in_region=values.unset, in_rate_center=values.unset,
+                           in_lata=values.unset, in_locality=values.unset,
+                           fax_enabled=values.unset, limit=None, page_size=None,
+                           prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams SharedCostInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param unicode area_code: The area code of the phone numbers to read
+        :param unicode contains: The pattern on which to match phone numbers
+        :param bool sms_enabled: Whether the phone numbers can receive text messages
+        :param bool mms_enabled: Whether the phone numbers can receive MMS messages
+        :param bool voice_enabled: Whether the phone numbers can receive calls.
+        :param bool exclude_all_address_required: Whether to exclude phone numbers that require an Address
+        :param bool exclude_local_address_required: Whether to exclude phone numbers that require a local address
+        :param bool exclude_foreign_address_required: Whether to exclude phone numbers that require a foreign address
+        :param bool beta: Whether to read phone numbers new to the Twilio platform
+        :param unicode near_number: Given a phone number, find a geographically close number within distance miles. (US/Canada only)
+        :param unicode near_lat_long: Given a latitude/longitude pair lat,long find geographically close numbers within distance miles. (US/Canada only)
+        :param unicode distance: The search radius, in miles, for a near_ query. (US/Canada only)
+        :param unicode in_postal_code: Limit results to a particular postal code. (US/Canada only)
+        :param unicode in_region: Limit results to a particular region. (US/Canada only)
+        :param unicode in_rate_center: Limit results to a specific rate center, or given a phone number search within the same rate center as that number. (US/Canada only)
+        :param unicode in_lata: Limit results to a specific local access and transport area. (US/Canada only)
+        :param unicode in_locality: Limit results to a particular locality
+        :param bool fax_enabled: Whether the phone numbers can receive faxes
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.available_phone_number.shared_cost.SharedCostInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                area_code=area_code,
+                contains=contains,
+                sms_enabled=sms_enabled,
+                mms_enabled=mms_enabled,
+                voice_enabled=voice_enabled,
+                exclude_all_address_required=exclude_all_address_required,
+                exclude_local_address_required=exclude_local_address_required,
+                exclude_foreign_address_required=exclude_foreign_address_required,
+                beta=beta,
+                near_number=near_number,
+                near_lat_long=near_lat_long,
+                distance=distance,
+                in_postal_code=in_postal_code,
+                in_region=in_region,
+                in_rate_center=in_rate_center,
+                in_lata=in_lata,
+                in_locality=in_locality,
+                fax_enabled=fax_enabled,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, area_code=values.unset, contains=values.unset,
+             sms_enabled=values.unset, mms_enabled=values.unset,
+             voice_enabled=values.unset, exclude_all_address_required=values.unset,
+             exclude_local_address_required=values.unset,
+             exclude_foreign_address_required=values.unset, beta=values.unset,
+             near_number=values.unset, near_lat_long=values.unset,
+             distance=values.unset, in_postal_code=values.unset,
+             in_region=values.unset, in_rate_center=values.unset,
+             in_lata=values.unset, in_locality=values.unset,
+             fax_enabled=values.unset, limit=None, page_size=None,
+             prefetch=None, raw=False, deadline=None):
+        """
+        Lists SharedCostInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param unicode area_code: The area code of the phone numbers to read
+        :param unicode contains: The pattern on which to match phone numbers
+        :param bool sms_enabled: Whether the phone numbers can receive text messages
+        :param bool mms_enabled: Whether the phone numbers can receive MMS messages
+        :param bool voice_enabled: Whether the phone numbers can receive calls.
+        :param bool exclude_all_address_required: Whether to exclude phone numbers that require an Address
+        :param bool exclude_local_address_required: Whether to exclude phone numbers that require a local address
+        :param bool exclude_foreign_address_required: Whether to exclude phone numbers that require a foreign address
+        :param bool beta: Whether to read phone numbers new to the Twilio platform
+        :param unicode near_number: Given a phone number, find a geographically close number within distance miles. (US/Canada only)
+        :param unicode near_lat_long: Given a latitude/longitude pair lat,long find geographically close numbers within distance miles. (US/Canada only)
+        :param unicode distance: The search radius, in miles, for a near_ query. (US/Canada only)
+        :param unicode in_postal_code: Limit results to a particular postal code. (US/Canada only)
+        :param unicode in_region: Limit results to a particular region. (US/Canada only)
+        :param unicode in_rate_center: Limit results to a specific rate center, or given a phone number search within the same rate center as that number. (US/Canada only)
+        :param unicode in_lata: Limit results to a specific local access and transport area. (US/Canada only)
+        :param unicode in_locality: Limit results to a particular locality
+        :param bool fax_enabled: Whether the phone numbers can receive faxes
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.available_phone_number.shared_cost.SharedCostInstance]
+        """
+        return list(self.stream(
             area_code=area_code,
             contains=contains,
             sms_enabled=sms_enabled,
@@ -98,23 +261,26 @@ class SharedCostList(ListResource):
             in_lata=in_lata,
             in_locality=in_locality,
             fax_enabled=fax_enabled,
-            page_size=limits['page_size'],
-        )
-
-        return self._version.stream(page, limits['limit'])
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        ))
 
-    def list(self, area_code=values.unset, contains=values.unset,
-             sms_enabled=values.unset, mms_enabled=values.unset,
-             voice_enabled=values.unset, exclude_all_address_required=values.unset,
-             exclude_local_address_required=values.unset,
-             exclude_foreign_address_required=values.unset, beta=values.unset,
-             near_number=values.unset, near_lat_long=values.unset,
-             distance=values.unset, in_postal_code=values.unset,
-             in_region=values.unset, in_rate_center=values.unset,
-             in_lata=values.unset, in_locality=values.unset,
-             fax_enabled=values.unset, limit=None, page_size=None):
-        """
-        Lists SharedCostInstance records from the API as a list.
+    async def list_async(self, area_code=values.unset, contains=values.unset,
+                         sms_enabled=values.unset, mms_enabled=values.unset,
+                         voice_enabled=values.unset, exclude_all_address_required=values.unset,
+                         exclude_local_address_required=values.unset,
+                         exclude_foreign_address_required=values.unset, beta=values.unset,
+                         near_number=values.unset, near_lat_long=values.unset,
+                         distance=values.unset, in_postal_code=values.unset,
+                         in_region=values.unset, in_rate_center=values.unset,
+                         in_lata=values.unset, in_locality=values.unset,
+                         fax_enabled=values.unset, limit=None, page_size=None,
+                         prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists SharedCostInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
         memory before returning.
 
@@ -142,11 +308,17 @@ class SharedCostList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.available_phone_number.shared_cost.SharedCostInstance]
         """
-        return list(self.stream(
+        return [record async for record in await self.stream_async(
             area_code=area_code,
             contains=contains,
             sms_enabled=sms_enabled,
@@ -167,7 +339,10 @@ class SharedCostList(ListResource):
             fax_enabled=fax_enabled,
             limit=limit,
             page_size=page_size,
-        ))
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
 
     def page(self, area_code=values.unset, contains=values.unset,
              sms_enabled=values.unset, mms_enabled=values.unset,
@@ -237,6 +412,74 @@ class SharedCostList(ListResource):
 
         return SharedCostPage(self._version, response, self._solution)
 
+    async def page_async(self, area_code=values.unset, contains=values.unset,
+                         sms_enabled=values.unset, mms_enabled=values.unset,
+                         voice_enabled=values.unset, exclude_all_address_required=values.unset,
+                         exclude_local_address_required=values.unset,
+                         exclude_foreign_address_required=values.unset, beta=values.unset,
+                         near_number=values.unset, near_lat_long=values.unset,
+                         distance=values.unset, in_postal_code=values.unset,
+                         in_region=values.unset, in_rate_center=values.unset,
+                         in_lata=values.unset, in_locality=values.unset,
+                         fax_enabled=values.unset, page_token=values.unset,
+                         page_number=values.unset, page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of SharedCostInstance records from the API.
+        Request is executed immediately
+
+        :param unicode area_code: The area code of the phone numbers to read
+        :param unicode contains: The pattern on which to match phone numbers
+        :param bool sms_enabled: Whether the phone numbers can receive text messages
+        :param bool mms_enabled: Whether the phone numbers can receive MMS messages
+        :param bool voice_enabled: Whether the phone numbers can receive calls.
+        :param bool exclude_all_address_required: Whether to exclude phone numbers that require an Address
+        :param bool exclude_local_address_required: Whether to exclude phone numbers that require a local address
+        :param bool exclude_foreign_address_required: Whether to exclude phone numbers that require a foreign address
+        :param bool beta: Whether to read phone numbers new to the Twilio platform
+        :param unicode near_number: Given a phone number, find a geographically close number within distance miles. (US/Canada only)
+        :param unicode near_lat_long: Given a latitude/longitude pair lat,long find geographically close numbers within distance miles. (US/Canada only)
+        :param unicode distance: The search radius, in miles, for a near_ query. (US/Canada only)
+        :param unicode in_postal_code: Limit results to a particular postal code. (US/Canada only)
+        :param unicode in_region: Limit results to a particular region. (US/Canada only)
+        :param unicode in_rate_center: Limit results to a specific rate center, or given a phone number search within the same rate center as that number. (US/Canada only)
+        :param unicode in_lata: Limit results to a specific local access and transport area. (US/Canada only)
+        :param unicode in_locality: Limit results to a particular locality
+        :param bool fax_enabled: Whether the phone numbers can receive faxes
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of SharedCostInstance
+        :rtype: twilio.rest.api.v2010.account.available_phone_number.shared_cost.SharedCostPage
+        """
+        data = values.of({
+            'AreaCode': area_code,
+            'Contains': contains,
+            'SmsEnabled': sms_enabled,
+            'MmsEnabled': mms_enabled,
+            'VoiceEnabled': voice_enabled,
+            'ExcludeAllAddressRequired': exclude_all_address_required,
+            'ExcludeLocalAddressRequired': exclude_local_address_required,
+            'ExcludeForeignAddressRequired': exclude_foreign_address_required,
+            'Beta': beta,
+            'NearNumber': near_number,
+            'NearLatLong': near_lat_long,
+            'Distance': distance,
+            'InPostalCode': in_postal_code,
+            'InRegion': in_region,
+            'InRateCenter': in_rate_center,
+            'InLata': in_lata,
+            'InLocality': in_locality,
+            'FaxEnabled': fax_enabled,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return SharedCostPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of SharedCostInstance records from the API.
@@ -254,6 +497,23 @@ class SharedCostList(ListResource):
 
         return SharedCostPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of SharedCostInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of SharedCostInstance
+        :rtype: twilio.rest.api.v2010.account.available_phone_number.shared_cost.SharedCostPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return SharedCostPage(self._version, response, self._solution)
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -311,6 +571,31 @@ class SharedCostPage(Page):
 
 class SharedCostInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'latitude': deserialize.decimal,
+        'longitude': deserialize.decimal,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'friendly_name': 'friendly_name',
+        'phone_number': 'phone_number',
+        'lata': 'lata',
+        'locality': 'locality',
+        'rate_center': 'rate_center',
+        'latitude': 'latitude',
+        'longitude': 'longitude',
+        'region': 'region',
+        'postal_code': 'postal_code',
+        'iso_country': 'iso_country',
+        'address_requirements': 'address_requirements',
+        'beta': 'beta',
+        'capabilities': 'capabilities',
+    }, _deserializers)
+
     def __init__(self, version, payload, account_sid, country_code):
         """
         Initialize the SharedCostInstance
@@ -321,21 +606,7 @@ class SharedCostInstance(InstanceResource):
         super(SharedCostInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'friendly_name': payload.get('friendly_name'),
-            'phone_number': payload.get('phone_number'),
-            'lata': payload.get('lata'),
-            'locality': payload.get('locality'),
-            'rate_center': payload.get('rate_center'),
-            'latitude': deserialize.decimal(payload.get('latitude')),
-            'longitude': deserialize.decimal(payload.get('longitude')),
-            'region': payload.get('region'),
-            'postal_code': payload.get('postal_code'),
-            'iso_country': payload.get('iso_country'),
-            'address_requirements': payload.get('address_requirements'),
-            'beta': payload.get('beta'),
-            'capabilities': payload.get('capabilities'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -6,6 +6,7 @@ This code was generated by
       /       /
 """
 
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
@@ -28,7 +29,7 @@ class BalanceList(ListResource):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, }
-        self._uri = '/Accounts/{account_sid}/Balance.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/Balance.json', self._solution)
 
     def fetch(self):
         """
@@ -41,6 +42,17 @@ class BalanceList(ListResource):
 
         return BalanceInstance(self._version, payload, account_sid=self._solution['account_sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the BalanceInstance
+
+        :returns: The fetched BalanceInstance
+        :rtype: twilio.rest.api.v2010.account.balance.BalanceInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return BalanceInstance(self._version, payload, account_sid=self._solution['account_sid'], )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -92,6 +104,15 @@ class BalancePage(Page):
 
 class BalanceInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'balance': 'balance',
+        'currency': 'currency',
+    })
+
     def __init__(self, version, payload, account_sid):
         """
         Initialize the BalanceInstance
@@ -102,11 +123,7 @@ class BalanceInstance(InstanceResource):
         super(BalanceInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'balance': payload.get('balance'),
-            'currency': payload.get('currency'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -6,6 +6,8 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import serialize
 from twilio.base import values
@@ -13,14 +15,6 @@ from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.api.v2010.account.call.event import EventList
-from twilio.rest.api.v2010.account.call.feedback import FeedbackList
-from twilio.rest.api.v2010.account.call.feedback_summary import FeedbackSummaryList
-from twilio.rest.api.v2010.account.call.notification import NotificationList
-from twilio.rest.api.v2010.account.call.payment import PaymentList
-from twilio.rest.api.v2010.account.call.recording import RecordingList
-from twilio.rest.api.v2010.account.call.siprec import SiprecList
-from twilio.rest.api.v2010.account.call.stream import StreamList
 
 
 class CallList(ListResource):
@@ -39,7 +33,7 @@ class CallList(ListResource):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, }
-        self._uri = '/Accounts/{account_sid}/Calls.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/Calls.json', self._solution)
 
         # Components
         self._feedback_summaries = None
@@ -64,7 +58,7 @@ class CallList(ListResource):
                async_amd_status_callback_method=values.unset, byoc=values.unset,
                call_reason=values.unset, call_token=values.unset,
                recording_track=values.unset, time_limit=values.unset,
-               url=values.unset, twiml=values.unset, application_sid=values.unset):
+               url=values.unset, twiml=values.unset, application_sid=values.unset, deadline=None):
         """
         Create the CallInstance
 
@@ -103,6 +97,116 @@ class CallList(ListResource):
         :param unicode url: The absolute URL that returns TwiML for this call
         :param unicode twiml: TwiML instructions for the call
         :param unicode application_sid: The SID of the Application resource that will handle the call
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created CallInstance
+        :rtype: twilio.rest.api.v2010.account.call.CallInstance
+        """
+        data = values.of({
+            'To': to,
+            'From': from_,
+            'Url': url,
+            'Twiml': twiml,
+            'ApplicationSid': application_sid,
+            'Method': method,
+            'FallbackUrl': fallback_url,
+            'FallbackMethod': fallback_method,
+            'StatusCallback': status_callback,
+            'StatusCallbackEvent': serialize.map(status_callback_event, lambda e: e),
+            'StatusCallbackMethod': status_callback_method,
+            'SendDigits': send_digits,
+            'Timeout': timeout,
+            'Record': record,
+            'RecordingChannels': recording_channels,
+            'RecordingStatusCallback': recording_status_callback,
+            'RecordingStatusCallbackMethod': recording_status_callback_method,
+            'SipAuthUsername': sip_auth_username,
+            'SipAuthPassword': sip_auth_password,
+            'MachineDetection': machine_detection,
+            'MachineDetectionTimeout': machine_detection_timeout,
+            'RecordingStatusCallbackEvent': serialize.map(recording_status_callback_event, lambda e: e),
+            'Trim': trim,
+            'CallerId': caller_id,
+            'MachineDetectionSpeechThreshold': machine_detection_speech_threshold,
+            'MachineDetectionSpeechEndThreshold': machine_detection_speech_end_threshold,
+            'MachineDetectionSilenceTimeout': machine_detection_silence_timeout,
+            'AsyncAmd': async_amd,
+            'AsyncAmdStatusCallback': async_amd_status_callback,
+            'AsyncAmdStatusCallbackMethod': async_amd_status_callback_method,
+            'Byoc': byoc,
+            'CallReason': call_reason,
+            'CallToken': call_token,
+            'RecordingTrack': recording_track,
+            'TimeLimit': time_limit,
+        })
+
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return CallInstance(self._version, payload, account_sid=self._solution['account_sid'], )
+
+    async def create_async(self, to, from_, method=values.unset, fallback_url=values.unset,
+                           fallback_method=values.unset, status_callback=values.unset,
+                           status_callback_event=values.unset,
+                           status_callback_method=values.unset, send_digits=values.unset,
+                           timeout=values.unset, record=values.unset,
+                           recording_channels=values.unset,
+                           recording_status_callback=values.unset,
+                           recording_status_callback_method=values.unset,
+                           sip_auth_username=values.unset, sip_auth_password=values.unset,
+                           machine_detection=values.unset,
+                           machine_detection_timeout=values.unset,
+                           recording_status_callback_event=values.unset, trim=values.unset,
+                           caller_id=values.unset,
+                           machine_detection_speech_threshold=values.unset,
+                           machine_detection_speech_end_threshold=values.unset,
+                           machine_detection_silence_timeout=values.unset,
+                           async_amd=values.unset, async_amd_status_callback=values.unset,
+                           async_amd_status_callback_method=values.unset, byoc=values.unset,
+                           call_reason=values.unset, call_token=values.unset,
+                           recording_track=values.unset, time_limit=values.unset,
+                           url=values.unset, twiml=values.unset, application_sid=values.unset,
+                           deadline=None):
+        """
+        Asynchronous coroutine that creates the CallInstance
+
+        :param unicode to: Phone number, SIP address, or client identifier to call
+        :param unicode from_: Twilio number from which to originate the call
+        :param unicode method: HTTP method to use to fetch TwiML
+        :param unicode fallback_url: Fallback URL in case of error
+        :param unicode fallback_method: HTTP Method to use with fallback_url
+        :param unicode status_callback: The URL we should call to send status information to your application
+        :param list[unicode] status_callback_event: The call progress events that we send to the `status_callback` URL.
+        :param unicode status_callback_method: HTTP Method to use with status_callback
+        :param unicode send_digits: The digits to dial after connecting to the number
+        :param unicode timeout: Number of seconds to wait for an answer
+        :param bool record: Whether to record the call
+        :param unicode recording_channels: The number of channels in the final recording
+        :param unicode recording_status_callback: The URL that we call when the recording is available to be accessed
+        :param unicode recording_status_callback_method: The HTTP method we should use when calling the `recording_status_callback` URL
+        :param unicode sip_auth_username: The username used to authenticate the caller making a SIP call
+        :param unicode sip_auth_password: The password required to authenticate the user account specified in `sip_auth_username`.
+        :param unicode machine_detection: Enable machine detection or end of greeting detection
+        :param unicode machine_detection_timeout: Number of seconds to wait for machine detection
+        :param list[unicode] recording_status_callback_event: The recording status events that will trigger calls to the URL specified in `recording_status_callback`
+        :param unicode trim: Set this parameter to control trimming of silence on the recording.
+        :param unicode caller_id: The phone number, SIP address, or Client identifier that made this call. Phone numbers are in E.164 format (e.g., +16175551212). SIP addresses are formatted as `name@company.com`.
+        :param unicode machine_detection_speech_threshold: Number of milliseconds for measuring stick for the length of the speech activity
+        :param unicode machine_detection_speech_end_threshold: Number of milliseconds of silence after speech activity
+        :param unicode machine_detection_silence_timeout: Number of milliseconds of initial silence
+        :param unicode async_amd: Enable asynchronous AMD
+        :param unicode async_amd_status_callback: The URL we should call to send amd status information to your application
+        :param unicode async_amd_status_callback_method: HTTP Method to use with async_amd_status_callback
+        :param unicode byoc: BYOC trunk SID (Beta)
+        :param unicode call_reason: Reason for the call (Branded Calls Beta)
+        :param unicode call_token: A token string needed to invoke a forwarded call with a CallerId recieved on a previous incoming call
+        :param unicode recording_track: Which track(s) to record
+        :param unicode time_limit: The maximum duration of the call in seconds.
+        :param unicode url: The absolute URL that returns TwiML for this call
+        :param unicode twiml: TwiML instructions for the call
+        :param unicode application_sid: The SID of the Application resource that will handle the call
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created CallInstance
         :rtype: twilio.rest.api.v2010.account.call.CallInstance
@@ -145,7 +249,7 @@ class CallList(ListResource):
             'TimeLimit': time_limit,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return CallInstance(self._version, payload, account_sid=self._solution['account_sid'], )
 
@@ -154,7 +258,7 @@ class CallList(ListResource):
                start_time_before=values.unset, start_time=values.unset,
                start_time_after=values.unset, end_time_before=values.unset,
                end_time=values.unset, end_time_after=values.unset, limit=None,
-               page_size=None):
+               page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams CallInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -177,13 +281,132 @@ class CallList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.call.CallInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                to=to,
+                from_=from_,
+                parent_call_sid=parent_call_sid,
+                status=status,
+                start_time_before=start_time_before,
+                start_time=start_time,
+                start_time_after=start_time_after,
+                end_time_before=end_time_before,
+                end_time=end_time,
+                end_time_after=end_time_after,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, to=values.unset, from_=values.unset,
+                           parent_call_sid=values.unset, status=values.unset,
+                           start_time_before=values.unset, start_time=values.unset,
+                           start_time_after=values.unset, end_time_before=values.unset,
+                           end_time=values.unset, end_time_after=values.unset, limit=None,
+                           page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams CallInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param unicode to: Phone number or Client identifier of calls to include
+        :param unicode from_: Phone number or Client identifier to filter `from` on
+        :param unicode parent_call_sid: Parent call SID to filter on
+        :param CallInstance.Status status: The status of the resources to read
+        :param datetime start_time_before: Only include calls that started on this date
+        :param datetime start_time: Only include calls that started on this date
+        :param datetime start_time_after: Only include calls that started on this date
+        :param datetime end_time_before: Only include calls that ended on this date
+        :param datetime end_time: Only include calls that ended on this date
+        :param datetime end_time_after: Only include calls that ended on this date
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.call.CallInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                to=to,
+                from_=from_,
+                parent_call_sid=parent_call_sid,
+                status=status,
+                start_time_before=start_time_before,
+                start_time=start_time,
+                start_time_after=start_time_after,
+                end_time_before=end_time_before,
+                end_time=end_time,
+                end_time_after=end_time_after,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, to=values.unset, from_=values.unset,
+             parent_call_sid=values.unset, status=values.unset,
+             start_time_before=values.unset, start_time=values.unset,
+             start_time_after=values.unset, end_time_before=values.unset,
+             end_time=values.unset, end_time_after=values.unset, limit=None,
+             page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Lists CallInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param unicode to: Phone number or Client identifier of calls to include
+        :param unicode from_: Phone number or Client identifier to filter `from` on
+        :param unicode parent_call_sid: Parent call SID to filter on
+        :param CallInstance.Status status: The status of the resources to read
+        :param datetime start_time_before: Only include calls that started on this date
+        :param datetime start_time: Only include calls that started on this date
+        :param datetime start_time_after: Only include calls that started on this date
+        :param datetime end_time_before: Only include calls that ended on this date
+        :param datetime end_time: Only include calls that ended on this date
+        :param datetime end_time_after: Only include calls that ended on this date
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.call.CallInstance]
+        """
+        return list(self.stream(
             to=to,
             from_=from_,
             parent_call_sid=parent_call_sid,
@@ -194,19 +417,21 @@ class CallList(ListResource):
             end_time_before=end_time_before,
             end_time=end_time,
             end_time_after=end_time_after,
-            page_size=limits['page_size'],
-        )
-
-        return self._version.stream(page, limits['limit'])
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        ))
 
-    def list(self, to=values.unset, from_=values.unset,
-             parent_call_sid=values.unset, status=values.unset,
-             start_time_before=values.unset, start_time=values.unset,
-             start_time_after=values.unset, end_time_before=values.unset,
-             end_time=values.unset, end_time_after=values.unset, limit=None,
-             page_size=None):
+    async def list_async(self, to=values.unset, from_=values.unset,
+                         parent_call_sid=values.unset, status=values.unset,
+                         start_time_before=values.unset, start_time=values.unset,
+                         start_time_after=values.unset, end_time_before=values.unset,
+                         end_time=values.unset, end_time_after=values.unset, limit=None,
+                         page_size=None, prefetch=None, raw=False, deadline=None):
         """
-        Lists CallInstance records from the API as a list.
+        Asynchronously lists CallInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
         memory before returning.
 
@@ -226,11 +451,17 @@ class CallList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.call.CallInstance]
         """
-        return list(self.stream(
+        return [record async for record in await self.stream_async(
             to=to,
             from_=from_,
             parent_call_sid=parent_call_sid,
@@ -243,7 +474,10 @@ class CallList(ListResource):
             end_time_after=end_time_after,
             limit=limit,
             page_size=page_size,
-        ))
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
 
     def page(self, to=values.unset, from_=values.unset,
              parent_call_sid=values.unset, status=values.unset,
@@ -293,6 +527,54 @@ class CallList(ListResource):
 
         return CallPage(self._version, response, self._solution)
 
+    async def page_async(self, to=values.unset, from_=values.unset,
+                         parent_call_sid=values.unset, status=values.unset,
+                         start_time_before=values.unset, start_time=values.unset,
+                         start_time_after=values.unset, end_time_before=values.unset,
+                         end_time=values.unset, end_time_after=values.unset,
+                         page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of CallInstance records from the API.
+        Request is executed immediately
+
+        :param unicode to: Phone number or Client identifier of calls to include
+        :param unicode from_: Phone number or Client identifier to filter `from` on
+        :param unicode parent_call_sid: Parent call SID to filter on
+        :param CallInstance.Status status: The status of the resources to read
+        :param datetime start_time_before: Only include calls that started on this date
+        :param datetime start_time: Only include calls that started on this date
+        :param datetime start_time_after: Only include calls that started on this date
+        :param datetime end_time_before: Only include calls that ended on this date
+        :param datetime end_time: Only include calls that ended on this date
+        :param datetime end_time_after: Only include calls that ended on this date
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of CallInstance
+        :rtype: twilio.rest.api.v2010.account.call.CallPage
+        """
+        data = values.of({
+            'To': to,
+            'From': from_,
+            'ParentCallSid': parent_call_sid,
+            'Status': status,
+            'StartTime<': serialize.iso8601_datetime(start_time_before),
+            'StartTime': serialize.iso8601_datetime(start_time),
+            'StartTime>': serialize.iso8601_datetime(start_time_after),
+            'EndTime<': serialize.iso8601_datetime(end_time_before),
+            'EndTime': serialize.iso8601_datetime(end_time),
+            'EndTime>': serialize.iso8601_datetime(end_time_after),
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return CallPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of CallInstance records from the API.
@@ -310,6 +592,23 @@ class CallList(ListResource):
 
         return CallPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of CallInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of CallInstance
+        :rtype: twilio.rest.api.v2010.account.call.CallPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return CallPage(self._version, response, self._solution)
+
     @property
     def feedback_summaries(self):
         """
@@ -319,6 +618,7 @@ class CallList(ListResource):
         :rtype: twilio.rest.api.v2010.account.call.feedback_summary.FeedbackSummaryList
         """
         if self._feedback_summaries is None:
+            from twilio.rest.api.v2010.account.call.feedback_summary import FeedbackSummaryList
             self._feedback_summaries = FeedbackSummaryList(
                 self._version,
                 account_sid=self._solution['account_sid'],
@@ -413,7 +713,7 @@ class CallContext(InstanceContext):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, 'sid': sid, }
-        self._uri = '/Accounts/{account_sid}/Calls/{sid}.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/Calls/{sid}.json', self._solution)
 
         # Dependents
         self._recordings = None
@@ -433,6 +733,15 @@ class CallContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the CallInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def fetch(self):
         """
         Fetch the CallInstance
@@ -449,6 +758,22 @@ class CallContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the CallInstance
+
+        :returns: The fetched CallInstance
+        :rtype: twilio.rest.api.v2010.account.call.CallInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return CallInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            sid=self._solution['sid'],
+        )
+
     def update(self, url=values.unset, method=values.unset, status=values.unset,
                fallback_url=values.unset, fallback_method=values.unset,
                status_callback=values.unset, status_callback_method=values.unset,
@@ -490,6 +815,47 @@ class CallContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, url=values.unset, method=values.unset, status=values.unset,
+                           fallback_url=values.unset, fallback_method=values.unset,
+                           status_callback=values.unset, status_callback_method=values.unset,
+                           twiml=values.unset, time_limit=values.unset):
+        """
+        Asynchronous coroutine that updates the CallInstance
+
+        :param unicode url: The absolute URL that returns TwiML for this call
+        :param unicode method: HTTP method to use to fetch TwiML
+        :param CallInstance.UpdateStatus status: The new status to update the call with.
+        :param unicode fallback_url: Fallback URL in case of error
+        :param unicode fallback_method: HTTP Method to use with fallback_url
+        :param unicode status_callback: The URL we should call to send status information to your application
+        :param unicode status_callback_method: HTTP Method to use to call status_callback
+        :param unicode twiml: TwiML instructions for the call
+        :param unicode time_limit: The maximum duration of the call in seconds.
+
+        :returns: The updated CallInstance
+        :rtype: twilio.rest.api.v2010.account.call.CallInstance
+        """
+        data = values.of({
+            'Url': url,
+            'Method': method,
+            'Status': status,
+            'FallbackUrl': fallback_url,
+            'FallbackMethod': fallback_method,
+            'StatusCallback': status_callback,
+            'StatusCallbackMethod': status_callback_method,
+            'Twiml': twiml,
+            'TimeLimit': time_limit,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return CallInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            sid=self._solution['sid'],
+        )
+
     @property
     def recordings(self):
         """
@@ -499,6 +865,7 @@ class CallContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.call.recording.RecordingList
         """
         if self._recordings is None:
+            from twilio.rest.api.v2010.account.call.recording import RecordingList
             self._recordings = RecordingList(
                 self._version,
                 account_sid=self._solution['account_sid'],
@@ -515,6 +882,7 @@ class CallContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.call.notification.NotificationList
         """
         if self._notifications is None:
+            from twilio.rest.api.v2010.account.call.notification import NotificationList
             self._notifications = NotificationList(
                 self._version,
                 account_sid=self._solution['account_sid'],
@@ -531,6 +899,7 @@ class CallContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.call.feedback.FeedbackList
         """
         if self._feedback is None:
+            from twilio.rest.api.v2010.account.call.feedback import FeedbackList
             self._feedback = FeedbackList(
                 self._version,
                 account_sid=self._solution['account_sid'],
@@ -547,6 +916,7 @@ class CallContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.call.event.EventList
         """
         if self._events is None:
+            from twilio.rest.api.v2010.account.call.event import EventList
             self._events = EventList(
                 self._version,
                 account_sid=self._solution['account_sid'],
@@ -563,6 +933,7 @@ class CallContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.call.payment.PaymentList
         """
         if self._payments is None:
+            from twilio.rest.api.v2010.account.call.payment import PaymentList
             self._payments = PaymentList(
                 self._version,
                 account_sid=self._solution['account_sid'],
@@ -579,6 +950,7 @@ class CallContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.call.siprec.SiprecList
         """
         if self._siprec is None:
+            from twilio.rest.api.v2010.account.call.siprec import SiprecList
             self._siprec = SiprecList(
                 self._version,
                 account_sid=self._solution['account_sid'],
@@ -595,6 +967,7 @@ class CallContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.call.stream.StreamList
         """
         if self._streams is None:
+            from twilio.rest.api.v2010.account.call.stream import StreamList
             self._streams = StreamList(
                 self._version,
                 account_sid=self._solution['account_sid'],
@@ -635,6 +1008,46 @@ class CallInstance(InstanceResource):
         CANCELED = "canceled"
         COMPLETED = "completed"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.rfc2822_datetime,
+        'date_updated': deserialize.rfc2822_datetime,
+        'start_time': deserialize.rfc2822_datetime,
+        'end_time': deserialize.rfc2822_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'parent_call_sid': 'parent_call_sid',
+        'account_sid': 'account_sid',
+        'to': 'to',
+        'to_formatted': 'to_formatted',
+        'from_': 'from',
+        'from_formatted': 'from_formatted',
+        'phone_number_sid': 'phone_number_sid',
+        'status': 'status',
+        'start_time': 'start_time',
+        'end_time': 'end_time',
+        'duration': 'duration',
+        'price': 'price',
+        'price_unit': 'price_unit',
+        'direction': 'direction',
+        'answered_by': 'answered_by',
+        'api_version': 'api_version',
+        'forwarded_from': 'forwarded_from',
+        'group_sid': 'group_sid',
+        'caller_name': 'caller_name',
+        'queue_time': 'queue_time',
+        'trunk_sid': 'trunk_sid',
+        'uri': 'uri',
+        'subresource_uris': 'subresource_uris',
+    }, _deserializers)
+
     def __init__(self, version, payload, account_sid, sid=None):
         """
         Initialize the CallInstance
@@ -645,34 +1058,7 @@ class CallInstance(InstanceResource):
         super(CallInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'date_created': deserialize.rfc2822_datetime(payload.get('date_created')),
-            'date_updated': deserialize.rfc2822_datetime(payload.get('date_updated')),
-            'parent_call_sid': payload.get('parent_call_sid'),
-            'account_sid': payload.get('account_sid'),
-            'to': payload.get('to'),
-            'to_formatted': payload.get('to_formatted'),
-            'from_': payload.get('from'),
-            'from_formatted': payload.get('from_formatted'),
-            'phone_number_sid': payload.get('phone_number_sid'),
-            'status': payload.get('status'),
-            'start_time': deserialize.rfc2822_datetime(payload.get('start_time')),
-            'end_time': deserialize.rfc2822_datetime(payload.get('end_time')),
-            'duration': payload.get('duration'),
-            'price': payload.get('price'),
-            'price_unit': payload.get('price_unit'),
-            'direction': payload.get('direction'),
-            'answered_by': payload.get('answered_by'),
-            'api_version': payload.get('api_version'),
-            'forwarded_from': payload.get('forwarded_from'),
-            'group_sid': payload.get('group_sid'),
-            'caller_name': payload.get('caller_name'),
-            'queue_time': payload.get('queue_time'),
-            'trunk_sid': payload.get('trunk_sid'),
-            'uri': payload.get('uri'),
-            'subresource_uris': payload.get('subresource_uris'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -912,6 +1298,15 @@ class CallInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the CallInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def fetch(self):
         """
         Fetch the CallInstance
@@ -921,6 +1316,15 @@ class CallInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the CallInstance
+
+        :returns: The fetched CallInstance
+        :rtype: twilio.rest.api.v2010.account.call.CallInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, url=values.unset, method=values.unset, status=values.unset,
                fallback_url=values.unset, fallback_method=values.unset,
                status_callback=values.unset, status_callback_method=values.unset,
@@ -953,6 +1357,38 @@ class CallInstance(InstanceResource):
             time_limit=time_limit,
         )
 
+    async def update_async(self, url=values.unset, method=values.unset, status=values.unset,
+                           fallback_url=values.unset, fallback_method=values.unset,
+                           status_callback=values.unset, status_callback_method=values.unset,
+                           twiml=values.unset, time_limit=values.unset):
+        """
+        Asynchronous coroutine that updates the CallInstance
+
+        :param unicode url: The absolute URL that returns TwiML for this call
+        :param unicode method: HTTP method to use to fetch TwiML
+        :param CallInstance.UpdateStatus status: The new status to update the call with.
+        :param unicode fallback_url: Fallback URL in case of error
+        :param unicode fallback_method: HTTP Method to use with fallback_url
+        :param unicode status_callback: The URL we should call to send status information to your application
+        :param unicode status_callback_method: HTTP Method to use to call status_callback
+        :param unicode twiml: TwiML instructions for the call
+        :param unicode time_limit: The maximum duration of the call in seconds.
+
+        :returns: The updated CallInstance
+        :rtype: twilio.rest.api.v2010.account.call.CallInstance
+        """
+        return await self._proxy.update_async(
+            url=url,
+            method=method,
+            status=status,
+            fallback_url=fallback_url,
+            fallback_method=fallback_method,
+            status_callback=status_callback,
+            status_callback_method=status_callback_method,
+            twiml=twiml,
+            time_limit=time_limit,
+        )
+
     @property
     def recordings(self):
         """
@@ -1032,3 +1468,26 @@ class CallInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Api.V2010.CallInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'EventList': 'twilio.rest.api.v2010.account.call.event',
+    'FeedbackList': 'twilio.rest.api.v2010.account.call.feedback',
+    'FeedbackSummaryList': 'twilio.rest.api.v2010.account.call.feedback_summary',
+    'NotificationList': 'twilio.rest.api.v2010.account.call.notification',
+    'PaymentList': 'twilio.rest.api.v2010.account.call.payment',
+    'RecordingList': 'twilio.rest.api.v2010.account.call.recording',
+    'SiprecList': 'twilio.rest.api.v2010.account.call.siprec',
+    'StreamList': 'twilio.rest.api.v2010.account.call.stream',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -131,7 +131,7 @@ class FeedbackContext(InstanceContext):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, 'call_sid': call_sid, }
-        self._uri = '/Accounts/{account_sid}/Calls/{call_sid}/Feedback.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/Calls/{call_sid}/Feedback.json', self._solution)
 
     def fetch(self):
         """
@@ -149,19 +149,60 @@ class FeedbackContext(InstanceContext):
             call_sid=self._solution['call_sid'],
         )
 
-    def create(self, quality_score, issue=values.unset):
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the FeedbackInstance
+
+        :returns: The fetched FeedbackInstance
+        :rtype: twilio.rest.api.v2010.account.call.feedback.FeedbackInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return FeedbackInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            call_sid=self._solution['call_sid'],
+        )
+
+    def create(self, quality_score, issue=values.unset, deadline=None):
         """
         Create the FeedbackInstance
 
         :param unicode quality_score: The call quality expressed as an integer from 1 to 5
         :param list[FeedbackInstance.Issues] issue: Issues experienced during the call
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created FeedbackInstance
         :rtype: twilio.rest.api.v2010.account.call.feedback.FeedbackInstance
         """
         data = values.of({'QualityScore': quality_score, 'Issue': serialize.map(issue, lambda e: e), })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return FeedbackInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            call_sid=self._solution['call_sid'],
+        )
+
+    async def create_async(self, quality_score, issue=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the FeedbackInstance
+
+        :param unicode quality_score: The call quality expressed as an integer from 1 to 5
+        :param list[FeedbackInstance.Issues] issue: Issues experienced during the call
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created FeedbackInstance
+        :rtype: twilio.rest.api.v2010.account.call.feedback.FeedbackInstance
+        """
+        data = values.of({'QualityScore': quality_score, 'Issue': serialize.map(issue, lambda e: e), })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return FeedbackInstance(
             self._version,
@@ -191,6 +232,27 @@ class FeedbackContext(InstanceContext):
             call_sid=self._solution['call_sid'],
         )
 
+    async def update_async(self, quality_score=values.unset, issue=values.unset):
+        """
+        Asynchronous coroutine that updates the FeedbackInstance
+
+        :param unicode quality_score: The call quality expressed as an integer from 1 to 5
+        :param list[FeedbackInstance.Issues] issue: Issues experienced during the call
+
+        :returns: The updated FeedbackInstance
+        :rtype: twilio.rest.api.v2010.account.call.feedback.FeedbackInstance
+        """
+        data = values.of({'QualityScore': quality_score, 'Issue': serialize.map(issue, lambda e: e), })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return FeedbackInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            call_sid=self._solution['call_sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -214,6 +276,25 @@ class FeedbackInstance(InstanceResource):
         POST_DIAL_DELAY = "post-dial-delay"
         UNSOLICITED_CALL = "unsolicited-call"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.rfc2822_datetime,
+        'date_updated': deserialize.rfc2822_datetime,
+        'quality_score': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'issues': 'issues',
+        'quality_score': 'quality_score',
+        'sid': 'sid',
+    }, _deserializers)
+
     def __init__(self, version, payload, account_sid, call_sid):
         """
         Initialize the FeedbackInstance
@@ -224,14 +305,7 @@ class FeedbackInstance(InstanceResource):
         super(FeedbackInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'date_created': deserialize.rfc2822_datetime(payload.get('date_created')),
-            'date_updated': deserialize.rfc2822_datetime(payload.get('date_updated')),
-            'issues': payload.get('issues'),
-            'quality_score': deserialize.integer(payload.get('quality_score')),
-            'sid': payload.get('sid'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -311,17 +385,42 @@ class FeedbackInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
-    def create(self, quality_score, issue=values.unset):
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the FeedbackInstance
+
+        :returns: The fetched FeedbackInstance
+        :rtype: twilio.rest.api.v2010.account.call.feedback.FeedbackInstance
+        """
+        return await self._proxy.fetch_async()
+
+    def create(self, quality_score, issue=values.unset, deadline=None):
         """
         Create the FeedbackInstance
 
         :param unicode quality_score: The call quality expressed as an integer from 1 to 5
         :param list[FeedbackInstance.Issues] issue: Issues experienced during the call
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created FeedbackInstance
         :rtype: twilio.rest.api.v2010.account.call.feedback.FeedbackInstance
         """
-        return self._proxy.create(quality_score, issue=issue, )
+        return self._proxy.create(quality_score, issue=issue, deadline=deadline, )
+
+    async def create_async(self, quality_score, issue=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the FeedbackInstance
+
+        :param unicode quality_score: The call quality expressed as an integer from 1 to 5
+        :param list[FeedbackInstance.Issues] issue: Issues experienced during the call
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created FeedbackInstance
+        :rtype: twilio.rest.api.v2010.account.call.feedback.FeedbackInstance
+        """
+        return await self._proxy.create_async(quality_score, issue=issue, deadline=deadline, )
 
     def update(self, quality_score=values.unset, issue=values.unset):
         """
@@ -335,6 +434,18 @@ class FeedbackInstance(InstanceResource):
         """
         return self._proxy.update(quality_score=quality_score, issue=issue, )
 
+    async def update_async(self, quality_score=values.unset, issue=values.unset):
+        """
+        Asynchronous coroutine that updates the FeedbackInstance
+
+        :param unicode quality_score: The call quality expressed as an integer from 1 to 5
+        :param list[FeedbackInstance.Issues] issue: Issues experienced during the call
+
+        :returns: The updated FeedbackInstance
+        :rtype: twilio.rest.api.v2010.account.call.feedback.FeedbackInstance
+        """
+        return await self._proxy.update_async(quality_score=quality_score, issue=issue, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -31,10 +31,10 @@ class FeedbackSummaryList(ListResource):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, }
-        self._uri = '/Accounts/{account_sid}/Calls/FeedbackSummary.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/Calls/FeedbackSummary.json', self._solution)
 
     def create(self, start_date, end_date, include_subaccounts=values.unset,
-               status_callback=values.unset, status_callback_method=values.unset):
+               status_callback=values.unset, status_callback_method=values.unset, deadline=None):
         """
         Create the FeedbackSummaryInstance
 
@@ -43,6 +43,8 @@ class FeedbackSummaryList(ListResource):
         :param bool include_subaccounts: `true` includes feedback from the specified account and its subaccounts
         :param unicode status_callback: The URL that we will request when the feedback summary is complete
         :param unicode status_callback_method: The HTTP method we use to make requests to the StatusCallback URL
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created FeedbackSummaryInstance
         :rtype: twilio.rest.api.v2010.account.call.feedback_summary.FeedbackSummaryInstance
@@ -55,7 +57,36 @@ class FeedbackSummaryList(ListResource):
             'StatusCallbackMethod': status_callback_method,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return FeedbackSummaryInstance(self._version, payload, account_sid=self._solution['account_sid'], )
+
+    async def create_async(self, start_date, end_date, include_subaccounts=values.unset,
+                           status_callback=values.unset, status_callback_method=values.unset,
+                           deadline=None):
+        """
+        Asynchronous coroutine that creates the FeedbackSummaryInstance
+
+        :param date start_date: Only include feedback given on or after this date
+        :param date end_date: Only include feedback given on or before this date
+        :param bool include_subaccounts: `true` includes feedback from the specified account and its subaccounts
+        :param unicode status_callback: The URL that we will request when the feedback summary is complete
+        :param unicode status_callback_method: The HTTP method we use to make requests to the StatusCallback URL
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created FeedbackSummaryInstance
+        :rtype: twilio.rest.api.v2010.account.call.feedback_summary.FeedbackSummaryInstance
+        """
+        data = values.of({
+            'StartDate': serialize.iso8601_date(start_date),
+            'EndDate': serialize.iso8601_date(end_date),
+            'IncludeSubaccounts': include_subaccounts,
+            'StatusCallback': status_callback,
+            'StatusCallbackMethod': status_callback_method,
+        })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return FeedbackSummaryInstance(self._version, payload, account_sid=self._solution['account_sid'], )
 
@@ -147,7 +178,7 @@ class FeedbackSummaryContext(InstanceContext):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, 'sid': sid, }
-        self._uri = '/Accounts/{account_sid}/Calls/FeedbackSummary/{sid}.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/Calls/FeedbackSummary/{sid}.json', self._solution)
 
     def fetch(self):
         """
@@ -165,6 +196,22 @@ class FeedbackSummaryContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the FeedbackSummaryInstance
+
+        :returns: The fetched FeedbackSummaryInstance
+        :rtype: twilio.rest.api.v2010.account.call.feedback_summary.FeedbackSummaryInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return FeedbackSummaryInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self):
         """
         Deletes the FeedbackSummaryInstance
@@ -174,6 +221,15 @@ class FeedbackSummaryContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the FeedbackSummaryInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -193,6 +249,39 @@ class FeedbackSummaryInstance(InstanceResource):
         COMPLETED = "completed"
         FAILED = "failed"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'call_count': deserialize.integer,
+        'call_feedback_count': deserialize.integer,
+        'date_created': deserialize.rfc2822_datetime,
+        'date_updated': deserialize.rfc2822_datetime,
+        'end_date': deserialize.iso8601_date,
+        'quality_score_average': deserialize.decimal,
+        'quality_score_median': deserialize.decimal,
+        'quality_score_standard_deviation': deserialize.decimal,
+        'start_date': deserialize.iso8601_date,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'call_count': 'call_count',
+        'call_feedback_count': 'call_feedback_count',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'end_date': 'end_date',
+        'include_subaccounts': 'include_subaccounts',
+        'issues': 'issues',
+        'quality_score_average': 'quality_score_average',
+        'quality_score_median': 'quality_score_median',
+        'quality_score_standard_deviation': 'quality_score_standard_deviation',
+        'sid': 'sid',
+        'start_date': 'start_date',
+        'status': 'status',
+    }, _deserializers)
+
     def __init__(self, version, payload, account_sid, sid=None):
         """
         Initialize the FeedbackSummaryInstance
@@ -203,22 +292,7 @@ class FeedbackSummaryInstance(InstanceResource):
         super(FeedbackSummaryInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'call_count': deserialize.integer(payload.get('call_count')),
-            'call_feedback_count': deserialize.integer(payload.get('call_feedback_count')),
-            'date_created': deserialize.rfc2822_datetime(payload.get('date_created')),
-            'date_updated': deserialize.rfc2822_datetime(payload.get('date_updated')),
-            'end_date': deserialize.iso8601_date(payload.get('end_date')),
-            'include_subaccounts': payload.get('include_subaccounts'),
-            'issues': payload.get('issues'),
-            'quality_score_average': deserialize.decimal(payload.get('quality_score_average')),
-            'quality_score_median': deserialize.decimal(payload.get('quality_score_median')),
-            'quality_score_standard_deviation': deserialize.decimal(payload.get('quality_score_standard_deviation')),
-            'sid': payload.get('sid'),
-            'start_date': deserialize.iso8601_date(payload.get('start_date')),
-            'status': payload.get('status'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -362,6 +436,15 @@ class FeedbackSummaryInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the FeedbackSummaryInstance
+
+        :returns: The fetched FeedbackSummaryInstance
+        :rtype: twilio.rest.api.v2010.account.call.feedback_summary.FeedbackSummaryInstance
+        """
+        return await self._proxy.fetch_async()
+
     def delete(self):
         """
         Deletes the FeedbackSummaryInstance
@@ -371,6 +454,15 @@ class FeedbackSummaryInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the FeedbackSummaryInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
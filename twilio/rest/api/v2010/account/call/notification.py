@@ -32,11 +32,11 @@ class NotificationList(ListResource):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, 'call_sid': call_sid, }
-        self._uri = '/Accounts/{account_sid}/Calls/{call_sid}/Notifications.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/Calls/{call_sid}/Notifications.json', self._solution)
 
     def stream(self, log=values.unset, message_date_before=values.unset,
                message_date=values.unset, message_date_after=values.unset,
-               limit=None, page_size=None):
+               limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams NotificationInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -53,25 +53,77 @@ class NotificationList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.call.notification.NotificationInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
-            log=log,
-            message_date_before=message_date_before,
-            message_date=message_date,
-            message_date_after=message_date_after,
-            page_size=limits['page_size'],
-        )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                log=log,
+                message_date_before=message_date_before,
+                message_date=message_date,
+                message_date_after=message_date_after,
+                page_size=limits['page_size'],
+            )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, log=values.unset, message_date_before=values.unset,
+                           message_date=values.unset, message_date_after=values.unset,
+                           limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams NotificationInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param unicode log: Filter by log level
+        :param date message_date_before: Filter by date
+        :param date message_date: Filter by date
+        :param date message_date_after: Filter by date
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.call.notification.NotificationInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                log=log,
+                message_date_before=message_date_before,
+                message_date=message_date,
+                message_date_after=message_date_after,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, log=values.unset, message_date_before=values.unset,
              message_date=values.unset, message_date_after=values.unset, limit=None,
-             page_size=None):
+             page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists NotificationInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -87,6 +139,12 @@ class NotificationList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.call.notification.NotificationInstance]
@@ -98,8 +156,51 @@ class NotificationList(ListResource):
             message_date_after=message_date_after,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, log=values.unset, message_date_before=values.unset,
+                         message_date=values.unset, message_date_after=values.unset, limit=None,
+                         page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists NotificationInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param unicode log: Filter by log level
+        :param date message_date_before: Filter by date
+        :param date message_date: Filter by date
+        :param date message_date_after: Filter by date
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.call.notification.NotificationInstance]
+        """
+        return [record async for record in await self.stream_async(
+            log=log,
+            message_date_before=message_date_before,
+            message_date=message_date,
+            message_date_after=message_date_after,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, log=values.unset, message_date_before=values.unset,
              message_date=values.unset, message_date_after=values.unset,
              page_token=values.unset, page_number=values.unset,
@@ -133,6 +234,39 @@ class NotificationList(ListResource):
 
         return NotificationPage(self._version, response, self._solution)
 
+    async def page_async(self, log=values.unset, message_date_before=values.unset,
+                         message_date=values.unset, message_date_after=values.unset,
+                         page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of NotificationInstance records from the API.
+        Request is executed immediately
+
+        :param unicode log: Filter by log level
+        :param date message_date_before: Filter by date
+        :param date message_date: Filter by date
+        :param date message_date_after: Filter by date
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of NotificationInstance
+        :rtype: twilio.rest.api.v2010.account.call.notification.NotificationPage
+        """
+        data = values.of({
+            'Log': log,
+            'MessageDate<': serialize.iso8601_date(message_date_before),
+            'MessageDate': serialize.iso8601_date(message_date),
+            'MessageDate>': serialize.iso8601_date(message_date_after),
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return NotificationPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of NotificationInstance records from the API.
@@ -150,6 +284,23 @@ class NotificationList(ListResource):
 
         return NotificationPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of NotificationInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of NotificationInstance
+        :rtype: twilio.rest.api.v2010.account.call.notification.NotificationPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return NotificationPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a NotificationContext
@@ -255,7 +406,7 @@ class NotificationContext(InstanceContext):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, 'call_sid': call_sid, 'sid': sid, }
-        self._uri = '/Accounts/{account_sid}/Calls/{call_sid}/Notifications/{sid}.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/Calls/{call_sid}/Notifications/{sid}.json', self._solution)
 
     def fetch(self):
         """
@@ -274,6 +425,23 @@ class NotificationContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the NotificationInstance
+
+        :returns: The fetched NotificationInstance
+        :rtype: twilio.rest.api.v2010.account.call.notification.NotificationInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return NotificationInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            call_sid=self._solution['call_sid'],
+            sid=self._solution['sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -287,6 +455,36 @@ class NotificationContext(InstanceContext):
 
 class NotificationInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.rfc2822_datetime,
+        'date_updated': deserialize.rfc2822_datetime,
+        'message_date': deserialize.rfc2822_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'api_version': 'api_version',
+        'call_sid': 'call_sid',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'error_code': 'error_code',
+        'log': 'log',
+        'message_date': 'message_date',
+        'message_text': 'message_text',
+        'more_info': 'more_info',
+        'request_method': 'request_method',
+        'request_url': 'request_url',
+        'request_variables': 'request_variables',
+        'response_body': 'response_body',
+        'response_headers': 'response_headers',
+        'sid': 'sid',
+        'uri': 'uri',
+    }, _deserializers)
+
     def __init__(self, version, payload, account_sid, call_sid, sid=None):
         """
         Initialize the NotificationInstance
@@ -297,25 +495,7 @@ class NotificationInstance(InstanceResource):
         super(NotificationInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'api_version': payload.get('api_version'),
-            'call_sid': payload.get('call_sid'),
-            'date_created': deserialize.rfc2822_datetime(payload.get('date_created')),
-            'date_updated': deserialize.rfc2822_datetime(payload.get('date_updated')),
-            'error_code': payload.get('error_code'),
-            'log': payload.get('log'),
-            'message_date': deserialize.rfc2822_datetime(payload.get('message_date')),
-            'message_text': payload.get('message_text'),
-            'more_info': payload.get('more_info'),
-            'request_method': payload.get('request_method'),
-            'request_url': payload.get('request_url'),
-            'request_variables': payload.get('request_variables'),
-            'response_body': payload.get('response_body'),
-            'response_headers': payload.get('response_headers'),
-            'sid': payload.get('sid'),
-            'uri': payload.get('uri'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -488,6 +668,15 @@ class NotificationInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the NotificationInstance
+
+        :returns: The fetched NotificationInstance
+        :rtype: twilio.rest.api.v2010.account.call.notification.NotificationInstance
+        """
+        return await self._proxy.fetch_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -35,7 +35,7 @@ class PaymentList(ListResource):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, 'call_sid': call_sid, }
-        self._uri = '/Accounts/{account_sid}/Calls/{call_sid}/Payments.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/Calls/{call_sid}/Payments.json', self._solution)
 
     def create(self, idempotency_key, status_callback,
                bank_account_type=values.unset, charge_amount=values.unset,
@@ -44,7 +44,7 @@ class PaymentList(ListResource):
                payment_connector=values.unset, payment_method=values.unset,
                postal_code=values.unset, security_code=values.unset,
                timeout=values.unset, token_type=values.unset,
-               valid_card_types=values.unset):
+               valid_card_types=values.unset, deadline=None):
         """
         Create the PaymentInstance
 
@@ -64,6 +64,8 @@ class PaymentList(ListResource):
         :param unicode timeout: The number of seconds that <Pay> should wait for the caller to press a digit between each subsequent digit, after the first one, before moving on to validate the digits captured.
         :param PaymentInstance.TokenType token_type: Indicates whether the payment method should be tokenized as a `one-time` or `reusable` token.
         :param unicode valid_card_types: Credit card types separated by space that Pay should accept.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created PaymentInstance
         :rtype: twilio.rest.api.v2010.account.call.payment.PaymentInstance
@@ -87,7 +89,68 @@ class PaymentList(ListResource):
             'ValidCardTypes': valid_card_types,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return PaymentInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            call_sid=self._solution['call_sid'],
+        )
+
+    async def create_async(self, idempotency_key, status_callback,
+                           bank_account_type=values.unset, charge_amount=values.unset,
+                           currency=values.unset, description=values.unset, input=values.unset,
+                           min_postal_code_length=values.unset, parameter=values.unset,
+                           payment_connector=values.unset, payment_method=values.unset,
+                           postal_code=values.unset, security_code=values.unset,
+                           timeout=values.unset, token_type=values.unset,
+                           valid_card_types=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the PaymentInstance
+
+        :param unicode idempotency_key: A unique token that will be used to ensure that multiple API calls with the same information do not result in multiple transactions.
+        :param unicode status_callback: Provide an absolute or relative URL to receive status updates regarding your Pay session..
+        :param PaymentInstance.BankAccountType bank_account_type: Type of bank account if payment source is ACH.
+        :param unicode charge_amount: A positive decimal value less than 1,000,000 to charge against the credit card or bank account.
+        :param unicode currency: The currency of the `charge_amount`.
+        :param unicode description: The description can be used to provide more details regarding the transaction.
+        :param unicode input: A list of inputs that should be accepted. Currently only `dtmf` is supported.
+        :param unicode min_postal_code_length: A positive integer that is used to validate the length of the `PostalCode` inputted by the user.
+        :param dict parameter: A single-level JSON object used to pass custom parameters to payment processors. (Required for ACH payments)
+        :param unicode payment_connector: This is the unique name corresponding to the Payment Gateway Connector installed in the Twilio Add-ons.
+        :param PaymentInstance.PaymentMethod payment_method: Type of payment being captured.
+        :param bool postal_code: Indicates whether the credit card PostalCode (zip code) is a required piece of payment information that must be provided by the caller.
+        :param bool security_code: Indicates whether the credit card security code is a required piece of payment information that must be provided by the caller.
+        :param unicode timeout: The number of seconds that <Pay> should wait for the caller to press a digit between each subsequent digit, after the first one, before moving on to validate the digits captured.
+        :param PaymentInstance.TokenType token_type: Indicates whether the payment method should be tokenized as a `one-time` or `reusable` token.
+        :param unicode valid_card_types: Credit card types separated by space that Pay should accept.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created PaymentInstance
+        :rtype: twilio.rest.api.v2010.account.call.payment.PaymentInstance
+        """
+        data = values.of({
+            'IdempotencyKey': idempotency_key,
+            'StatusCallback': status_callback,
+            'BankAccountType': bank_account_type,
+            'ChargeAmount': charge_amount,
+            'Currency': currency,
+            'Description': description,
+            'Input': input,
+            'MinPostalCodeLength': min_postal_code_length,
+            'Parameter': serialize.object(parameter),
+            'PaymentConnector': payment_connector,
+            'PaymentMethod': payment_method,
+            'PostalCode': postal_code,
+            'SecurityCode': security_code,
+            'Timeout': timeout,
+            'TokenType': token_type,
+            'ValidCardTypes': valid_card_types,
+        })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return PaymentInstance(
             self._version,
@@ -207,7 +270,7 @@ class PaymentContext(InstanceContext):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, 'call_sid': call_sid, 'sid': sid, }
-        self._uri = '/Accounts/{account_sid}/Calls/{call_sid}/Payments/{sid}.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/Calls/{call_sid}/Payments/{sid}.json', self._solution)
 
     def update(self, idempotency_key, status_callback, capture=values.unset,
                status=values.unset):
@@ -239,6 +302,36 @@ class PaymentContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, idempotency_key, status_callback, capture=values.unset,
+                           status=values.unset):
+        """
+        Asynchronous coroutine that updates the PaymentInstance
+
+        :param unicode idempotency_key: A unique token that will be used to ensure that multiple API calls with the same information do not result in multiple transactions.
+        :param unicode status_callback: Provide an absolute or relative URL to receive status updates regarding your Pay session.
+        :param PaymentInstance.Capture capture: The piece of payment information that you wish the caller to enter.
+        :param PaymentInstance.Status status: Indicates whether the current payment session should be cancelled or completed.
+
+        :returns: The updated PaymentInstance
+        :rtype: twilio.rest.api.v2010.account.call.payment.PaymentInstance
+        """
+        data = values.of({
+            'IdempotencyKey': idempotency_key,
+            'StatusCallback': status_callback,
+            'Capture': capture,
+            'Status': status,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return PaymentInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            call_sid=self._solution['call_sid'],
+            sid=self._solution['sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -280,6 +373,24 @@ class PaymentInstance(InstanceResource):
         COMPLETE = "complete"
         CANCEL = "cancel"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.rfc2822_datetime,
+        'date_updated': deserialize.rfc2822_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'call_sid': 'call_sid',
+        'sid': 'sid',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'uri': 'uri',
+    }, _deserializers)
+
     def __init__(self, version, payload, account_sid, call_sid, sid=None):
         """
         Initialize the PaymentInstance
@@ -290,14 +401,7 @@ class PaymentInstance(InstanceResource):
         super(PaymentInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'call_sid': payload.get('call_sid'),
-            'sid': payload.get('sid'),
-            'date_created': deserialize.rfc2822_datetime(payload.get('date_created')),
-            'date_updated': deserialize.rfc2822_datetime(payload.get('date_updated')),
-            'uri': payload.get('uri'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -388,6 +492,21 @@ class PaymentInstance(InstanceResource):
         """
         return self._proxy.update(idempotency_key, status_callback, capture=capture, status=status, )
 
+    async def update_async(self, idempotency_key, status_callback, capture=values.unset,
+                           status=values.unset):
+        """
+        Asynchronous coroutine that updates the PaymentInstance
+
+        :param unicode idempotency_key: A unique token that will be used to ensure that multiple API calls with the same information do not result in multiple transactions.
+        :param unicode status_callback: Provide an absolute or relative URL to receive status updates regarding your Pay session.
+        :param PaymentInstance.Capture capture: The piece of payment information that you wish the caller to enter.
+        :param PaymentInstance.Status status: Indicates whether the current payment session should be cancelled or completed.
+
+        :returns: The updated PaymentInstance
+        :rtype: twilio.rest.api.v2010.account.call.payment.PaymentInstance
+        """
+        return await self._proxy.update_async(idempotency_key, status_callback, capture=capture, status=status, )
+
     def __repr__(self):
         """
         Provide a friendly representation
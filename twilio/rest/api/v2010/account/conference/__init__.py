@@ -6,6 +6,8 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import serialize
 from twilio.base import values
@@ -13,8 +15,6 @@ from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.api.v2010.account.conference.participant import ParticipantList
-from twilio.rest.api.v2010.account.conference.recording import RecordingList
 
 
 class ConferenceList(ListResource):
@@ -33,13 +33,13 @@ class ConferenceList(ListResource):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, }
-        self._uri = '/Accounts/{account_sid}/Conferences.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/Conferences.json', self._solution)
 
     def stream(self, date_created_before=values.unset, date_created=values.unset,
                date_created_after=values.unset, date_updated_before=values.unset,
                date_updated=values.unset, date_updated_after=values.unset,
                friendly_name=values.unset, status=values.unset, limit=None,
-               page_size=None):
+               page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams ConferenceInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -60,31 +60,92 @@ class ConferenceList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.conference.ConferenceInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
-            date_created_before=date_created_before,
-            date_created=date_created,
-            date_created_after=date_created_after,
-            date_updated_before=date_updated_before,
-            date_updated=date_updated,
-            date_updated_after=date_updated_after,
-            friendly_name=friendly_name,
-            status=status,
-            page_size=limits['page_size'],
-        )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                date_created_before=date_created_before,
+                date_created=date_created,
+                date_created_after=date_created_after,
+                date_updated_before=date_updated_before,
+                date_updated=date_updated,
+                date_updated_after=date_updated_after,
+                friendly_name=friendly_name,
+                status=status,
+                page_size=limits['page_size'],
+            )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, date_created_before=values.unset, date_created=values.unset,
+                           date_created_after=values.unset, date_updated_before=values.unset,
+                           date_updated=values.unset, date_updated_after=values.unset,
+                           friendly_name=values.unset, status=values.unset, limit=None,
+                           page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams ConferenceInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param date date_created_before: The `YYYY-MM-DD` value of the resources to read
+        :param date date_created: The `YYYY-MM-DD` value of the resources to read
+        :param date date_created_after: The `YYYY-MM-DD` value of the resources to read
+        :param date date_updated_before: The `YYYY-MM-DD` value of the resources to read
+        :param date date_updated: The `YYYY-MM-DD` value of the resources to read
+        :param date date_updated_after: The `YYYY-MM-DD` value of the resources to read
+        :param unicode friendly_name: The string that identifies the Conference resources to read
+        :param ConferenceInstance.Status status: The status of the resources to read
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.conference.ConferenceInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                date_created_before=date_created_before,
+                date_created=date_created,
+                date_created_after=date_created_after,
+                date_updated_before=date_updated_before,
+                date_updated=date_updated,
+                date_updated_after=date_updated_after,
+                friendly_name=friendly_name,
+                status=status,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, date_created_before=values.unset, date_created=values.unset,
              date_created_after=values.unset, date_updated_before=values.unset,
              date_updated=values.unset, date_updated_after=values.unset,
              friendly_name=values.unset, status=values.unset, limit=None,
-             page_size=None):
+             page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists ConferenceInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -104,6 +165,12 @@ class ConferenceList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.conference.ConferenceInstance]
@@ -119,8 +186,61 @@ class ConferenceList(ListResource):
             status=status,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, date_created_before=values.unset, date_created=values.unset,
+                         date_created_after=values.unset, date_updated_before=values.unset,
+                         date_updated=values.unset, date_updated_after=values.unset,
+                         friendly_name=values.unset, status=values.unset, limit=None,
+                         page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists ConferenceInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param date date_created_before: The `YYYY-MM-DD` value of the resources to read
+        :param date date_created: The `YYYY-MM-DD` value of the resources to read
+        :param date date_created_after: The `YYYY-MM-DD` value of the resources to read
+        :param date date_updated_before: The `YYYY-MM-DD` value of the resources to read
+        :param date date_updated: The `YYYY-MM-DD` value of the resources to read
+        :param date date_updated_after: The `YYYY-MM-DD` value of the resources to read
+        :param unicode friendly_name: The string that identifies the Conference resources to read
+        :param ConferenceInstance.Status status: The status of the resources to read
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.conference.ConferenceInstance]
+        """
+        return [record async for record in await self.stream_async(
+            date_created_before=date_created_before,
+            date_created=date_created,
+            date_created_after=date_created_after,
+            date_updated_before=date_updated_before,
+            date_updated=date_updated,
+            date_updated_after=date_updated_after,
+            friendly_name=friendly_name,
+            status=status,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, date_created_before=values.unset, date_created=values.unset,
              date_created_after=values.unset, date_updated_before=values.unset,
              date_updated=values.unset, date_updated_after=values.unset,
@@ -164,6 +284,49 @@ class ConferenceList(ListResource):
 
         return ConferencePage(self._version, response, self._solution)
 
+    async def page_async(self, date_created_before=values.unset, date_created=values.unset,
+                         date_created_after=values.unset, date_updated_before=values.unset,
+                         date_updated=values.unset, date_updated_after=values.unset,
+                         friendly_name=values.unset, status=values.unset,
+                         page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of ConferenceInstance records from the API.
+        Request is executed immediately
+
+        :param date date_created_before: The `YYYY-MM-DD` value of the resources to read
+        :param date date_created: The `YYYY-MM-DD` value of the resources to read
+        :param date date_created_after: The `YYYY-MM-DD` value of the resources to read
+        :param date date_updated_before: The `YYYY-MM-DD` value of the resources to read
+        :param date date_updated: The `YYYY-MM-DD` value of the resources to read
+        :param date date_updated_after: The `YYYY-MM-DD` value of the resources to read
+        :param unicode friendly_name: The string that identifies the Conference resources to read
+        :param ConferenceInstance.Status status: The status of the resources to read
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of ConferenceInstance
+        :rtype: twilio.rest.api.v2010.account.conference.ConferencePage
+        """
+        data = values.of({
+            'DateCreated<': serialize.iso8601_date(date_created_before),
+            'DateCreated': serialize.iso8601_date(date_created),
+            'DateCreated>': serialize.iso8601_date(date_created_after),
+            'DateUpdated<': serialize.iso8601_date(date_updated_before),
+            'DateUpdated': serialize.iso8601_date(date_updated),
+            'DateUpdated>': serialize.iso8601_date(date_updated_after),
+            'FriendlyName': friendly_name,
+            'Status': status,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return ConferencePage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of ConferenceInstance records from the API.
@@ -181,6 +344,23 @@ class ConferenceList(ListResource):
 
         return ConferencePage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of ConferenceInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of ConferenceInstance
+        :rtype: twilio.rest.api.v2010.account.conference.ConferencePage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return ConferencePage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a ConferenceContext
@@ -269,7 +449,7 @@ class ConferenceContext(InstanceContext):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, 'sid': sid, }
-        self._uri = '/Accounts/{account_sid}/Conferences/{sid}.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/Conferences/{sid}.json', self._solution)
 
         # Dependents
         self._participants = None
@@ -291,6 +471,22 @@ class ConferenceContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ConferenceInstance
+
+        :returns: The fetched ConferenceInstance
+        :rtype: twilio.rest.api.v2010.account.conference.ConferenceInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return ConferenceInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            sid=self._solution['sid'],
+        )
+
     def update(self, status=values.unset, announce_url=values.unset,
                announce_method=values.unset):
         """
@@ -314,6 +510,29 @@ class ConferenceContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, status=values.unset, announce_url=values.unset,
+                           announce_method=values.unset):
+        """
+        Asynchronous coroutine that updates the ConferenceInstance
+
+        :param ConferenceInstance.UpdateStatus status: The new status of the resource
+        :param unicode announce_url: The URL we should call to announce something into the conference
+        :param unicode announce_method: he HTTP method used to call announce_url
+
+        :returns: The updated ConferenceInstance
+        :rtype: twilio.rest.api.v2010.account.conference.ConferenceInstance
+        """
+        data = values.of({'Status': status, 'AnnounceUrl': announce_url, 'AnnounceMethod': announce_method, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return ConferenceInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            sid=self._solution['sid'],
+        )
+
     @property
     def participants(self):
         """
@@ -323,6 +542,7 @@ class ConferenceContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.conference.participant.ParticipantList
         """
         if self._participants is None:
+            from twilio.rest.api.v2010.account.conference.participant import ParticipantList
             self._participants = ParticipantList(
                 self._version,
                 account_sid=self._solution['account_sid'],
@@ -339,6 +559,7 @@ class ConferenceContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.conference.recording.RecordingList
         """
         if self._recordings is None:
+            from twilio.rest.api.v2010.account.conference.recording import RecordingList
             self._recordings = RecordingList(
                 self._version,
                 account_sid=self._solution['account_sid'],
@@ -374,6 +595,30 @@ class ConferenceInstance(InstanceResource):
         LAST_PARTICIPANT_KICKED = "last-participant-kicked"
         LAST_PARTICIPANT_LEFT = "last-participant-left"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.rfc2822_datetime,
+        'date_updated': deserialize.rfc2822_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'api_version': 'api_version',
+        'friendly_name': 'friendly_name',
+        'region': 'region',
+        'sid': 'sid',
+        'status': 'status',
+        'uri': 'uri',
+        'subresource_uris': 'subresource_uris',
+        'reason_conference_ended': 'reason_conference_ended',
+        'call_sid_ending_conference': 'call_sid_ending_conference',
+    }, _deserializers)
+
     def __init__(self, version, payload, account_sid, sid=None):
         """
         Initialize the ConferenceInstance
@@ -384,20 +629,7 @@ class ConferenceInstance(InstanceResource):
         super(ConferenceInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'date_created': deserialize.rfc2822_datetime(payload.get('date_created')),
-            'date_updated': deserialize.rfc2822_datetime(payload.get('date_updated')),
-            'api_version': payload.get('api_version'),
-            'friendly_name': payload.get('friendly_name'),
-            'region': payload.get('region'),
-            'sid': payload.get('sid'),
-            'status': payload.get('status'),
-            'uri': payload.get('uri'),
-            'subresource_uris': payload.get('subresource_uris'),
-            'reason_conference_ended': payload.get('reason_conference_ended'),
-            'call_sid_ending_conference': payload.get('call_sid_ending_conference'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -525,6 +757,15 @@ class ConferenceInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ConferenceInstance
+
+        :returns: The fetched ConferenceInstance
+        :rtype: twilio.rest.api.v2010.account.conference.ConferenceInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, status=values.unset, announce_url=values.unset,
                announce_method=values.unset):
         """
@@ -539,6 +780,20 @@ class ConferenceInstance(InstanceResource):
         """
         return self._proxy.update(status=status, announce_url=announce_url, announce_method=announce_method, )
 
+    async def update_async(self, status=values.unset, announce_url=values.unset,
+                           announce_method=values.unset):
+        """
+        Asynchronous coroutine that updates the ConferenceInstance
+
+        :param ConferenceInstance.UpdateStatus status: The new status of the resource
+        :param unicode announce_url: The URL we should call to announce something into the conference
+        :param unicode announce_method: he HTTP method used to call announce_url
+
+        :returns: The updated ConferenceInstance
+        :rtype: twilio.rest.api.v2010.account.conference.ConferenceInstance
+        """
+        return await self._proxy.update_async(status=status, announce_url=announce_url, announce_method=announce_method, )
+
     @property
     def participants(self):
         """
@@ -568,3 +823,20 @@ class ConferenceInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Api.V2010.ConferenceInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'ParticipantList': 'twilio.rest.api.v2010.account.conference.participant',
+    'RecordingList': 'twilio.rest.api.v2010.account.conference.recording',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
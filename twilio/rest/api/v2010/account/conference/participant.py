@@ -32,7 +32,7 @@ class ParticipantList(ListResource):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, 'conference_sid': conference_sid, }
-        self._uri = '/Accounts/{account_sid}/Conferences/{conference_sid}/Participants.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/Conferences/{conference_sid}/Participants.json', self._solution)
 
     def create(self, from_, to, status_callback=values.unset,
                status_callback_method=values.unset,
@@ -58,7 +58,7 @@ class ParticipantList(ListResource):
                coaching=values.unset, call_sid_to_coach=values.unset,
                jitter_buffer_size=values.unset, byoc=values.unset,
                caller_id=values.unset, call_reason=values.unset,
-               recording_track=values.unset, time_limit=values.unset):
+               recording_track=values.unset, time_limit=values.unset, deadline=None):
         """
         Create the ParticipantInstance
 
@@ -101,6 +101,8 @@ class ParticipantList(ListResource):
         :param unicode call_reason: Reason for the call (Branded Calls Beta)
         :param unicode recording_track: The track(s) to record
         :param unicode time_limit: The maximum duration of the call in seconds.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created ParticipantInstance
         :rtype: twilio.rest.api.v2010.account.conference.participant.ParticipantInstance
@@ -147,7 +149,131 @@ class ParticipantList(ListResource):
             'TimeLimit': time_limit,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return ParticipantInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            conference_sid=self._solution['conference_sid'],
+        )
+
+    async def create_async(self, from_, to, status_callback=values.unset,
+                           status_callback_method=values.unset,
+                           status_callback_event=values.unset, label=values.unset,
+                           timeout=values.unset, record=values.unset, muted=values.unset,
+                           beep=values.unset, start_conference_on_enter=values.unset,
+                           end_conference_on_exit=values.unset, wait_url=values.unset,
+                           wait_method=values.unset, early_media=values.unset,
+                           max_participants=values.unset, conference_record=values.unset,
+                           conference_trim=values.unset,
+                           conference_status_callback=values.unset,
+                           conference_status_callback_method=values.unset,
+                           conference_status_callback_event=values.unset,
+                           recording_channels=values.unset,
+                           recording_status_callback=values.unset,
+                           recording_status_callback_method=values.unset,
+                           sip_auth_username=values.unset, sip_auth_password=values.unset,
+                           region=values.unset,
+                           conference_recording_status_callback=values.unset,
+                           conference_recording_status_callback_method=values.unset,
+                           recording_status_callback_event=values.unset,
+                           conference_recording_status_callback_event=values.unset,
+                           coaching=values.unset, call_sid_to_coach=values.unset,
+                           jitter_buffer_size=values.unset, byoc=values.unset,
+                           caller_id=values.unset, call_reason=values.unset,
+                           recording_track=values.unset, time_limit=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the ParticipantInstance
+
+        :param unicode from_: The phone number, Client identifier, or username portion of SIP address that made this call.
+        :param unicode to: The phone number, SIP address or Client identifier that received this call.
+        :param unicode status_callback: The URL we should call to send status information to your application
+        :param unicode status_callback_method: The HTTP method we should use to call `status_callback`
+        :param list[unicode] status_callback_event: Set state change events that will trigger a callback
+        :param unicode label: The label of this participant
+        :param unicode timeout: he number of seconds that we should wait for an answer
+        :param bool record: Whether to record the participant and their conferences
+        :param bool muted: Whether to mute the agent
+        :param unicode beep: Whether to play a notification beep to the conference when the participant joins
+        :param bool start_conference_on_enter: Whether the conference starts when the participant joins the conference
+        :param bool end_conference_on_exit: Whether to end the conference when the participant leaves
+        :param unicode wait_url: URL that hosts pre-conference hold music
+        :param unicode wait_method: The HTTP method we should use to call `wait_url`
+        :param bool early_media: Whether agents can hear the state of the outbound call
+        :param unicode max_participants: The maximum number of agent conference participants
+        :param unicode conference_record: Whether to record the conference the participant is joining
+        :param unicode conference_trim: Whether to trim leading and trailing silence from your recorded conference audio files
+        :param unicode conference_status_callback: The callback URL for conference events
+        :param unicode conference_status_callback_method: HTTP method for requesting `conference_status_callback` URL
+        :param list[unicode] conference_status_callback_event: The conference state changes that should generate a call to `conference_status_callback`
+        :param unicode recording_channels: Specify `mono` or `dual` recording channels
+        :param unicode recording_status_callback: The URL that we should call using the `recording_status_callback_method` when the recording status changes
+        :param unicode recording_status_callback_method: The HTTP method we should use when we call `recording_status_callback`
+        :param unicode sip_auth_username: The SIP username used for authentication
+        :param unicode sip_auth_password: The SIP password for authentication
+        :param unicode region: The region where we should mix the conference audio
+        :param unicode conference_recording_status_callback: The URL we should call using the `conference_recording_status_callback_method` when the conference recording is available
+        :param unicode conference_recording_status_callback_method: The HTTP method we should use to call `conference_recording_status_callback`
+        :param list[unicode] recording_status_callback_event: The recording state changes that should generate a call to `recording_status_callback`
+        :param list[unicode] conference_recording_status_callback_event: The conference recording state changes that should generate a call to `conference_recording_status_callback`
+        :param bool coaching: Indicates if the participant changed to coach
+        :param unicode call_sid_to_coach: The SID of the participant who is being `coached`
+        :param unicode jitter_buffer_size: Jitter Buffer size for the connecting participant
+        :param unicode byoc: BYOC trunk SID (Beta)
+        :param unicode caller_id: The phone number, Client identifier, or username portion of SIP address that made this call.
+        :param unicode call_reason: Reason for the call (Branded Calls Beta)
+        :param unicode recording_track: The track(s) to record
+        :param unicode time_limit: The maximum duration of the call in seconds.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created ParticipantInstance
+        :rtype: twilio.rest.api.v2010.account.conference.participant.ParticipantInstance
+        """
+        data = values.of({
+            'From': from_,
+            'To': to,
+            'StatusCallback': status_callback,
+            'StatusCallbackMethod': status_callback_method,
+            'StatusCallbackEvent': serialize.map(status_callback_event, lambda e: e),
+            'Label': label,
+            'Timeout': timeout,
+            'Record': record,
+            'Muted': muted,
+            'Beep': beep,
+            'StartConferenceOnEnter': start_conference_on_enter,
+            'EndConferenceOnExit': end_conference_on_exit,
+            'WaitUrl': wait_url,
+            'WaitMethod': wait_method,
+            'EarlyMedia': early_media,
+            'MaxParticipants': max_participants,
+            'ConferenceRecord': conference_record,
+            'ConferenceTrim': conference_trim,
+            'ConferenceStatusCallback': conference_status_callback,
+            'ConferenceStatusCallbackMethod': conference_status_callback_method,
+            'ConferenceStatusCallbackEvent': serialize.map(conference_status_callback_event, lambda e: e),
+            'RecordingChannels': recording_channels,
+            'RecordingStatusCallback': recording_status_callback,
+            'RecordingStatusCallbackMethod': recording_status_callback_method,
+            'SipAuthUsername': sip_auth_username,
+            'SipAuthPassword': sip_auth_password,
+            'Region': region,
+            'ConferenceRecordingStatusCallback': conference_recording_status_callback,
+            'ConferenceRecordingStatusCallbackMethod': conference_recording_status_callback_method,
+            'RecordingStatusCallbackEvent': serialize.map(recording_status_callback_event, lambda e: e),
+            'ConferenceRecordingStatusCallbackEvent': serialize.map(conference_recording_status_callback_event, lambda e: e),
+            'Coaching': coaching,
+            'CallSidToCoach': call_sid_to_coach,
+            'JitterBufferSize': jitter_buffer_size,
+            'Byoc': byoc,
+            'CallerId': caller_id,
+            'CallReason': call_reason,
+            'RecordingTrack': recording_track,
+            'TimeLimit': time_limit,
+        })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return ParticipantInstance(
             self._version,
@@ -157,7 +283,7 @@ class ParticipantList(ListResource):
         )
 
     def stream(self, muted=values.unset, hold=values.unset, coaching=values.unset,
-               limit=None, page_size=None):
+               limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams ParticipantInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -173,18 +299,62 @@ class ParticipantList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.conference.participant.ParticipantInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(muted=muted, hold=hold, coaching=coaching, page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(muted=muted, hold=hold, coaching=coaching, page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, muted=values.unset, hold=values.unset, coaching=values.unset,
+                           limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams ParticipantInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param bool muted: Whether to return only participants that are muted
+        :param bool hold: Whether to return only participants that are on hold
+        :param bool coaching: Whether to return only participants who are coaching another call
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.conference.participant.ParticipantInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(muted=muted, hold=hold, coaching=coaching, page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, muted=values.unset, hold=values.unset, coaching=values.unset,
-             limit=None, page_size=None):
+             limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists ParticipantInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -199,6 +369,12 @@ class ParticipantList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.conference.participant.ParticipantInstance]
@@ -209,8 +385,48 @@ class ParticipantList(ListResource):
             coaching=coaching,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, muted=values.unset, hold=values.unset, coaching=values.unset,
+                         limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists ParticipantInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param bool muted: Whether to return only participants that are muted
+        :param bool hold: Whether to return only participants that are on hold
+        :param bool coaching: Whether to return only participants who are coaching another call
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.conference.participant.ParticipantInstance]
+        """
+        return [record async for record in await self.stream_async(
+            muted=muted,
+            hold=hold,
+            coaching=coaching,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, muted=values.unset, hold=values.unset, coaching=values.unset,
              page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -241,6 +457,36 @@ class ParticipantList(ListResource):
 
         return ParticipantPage(self._version, response, self._solution)
 
+    async def page_async(self, muted=values.unset, hold=values.unset, coaching=values.unset,
+                         page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of ParticipantInstance records from the API.
+        Request is executed immediately
+
+        :param bool muted: Whether to return only participants that are muted
+        :param bool hold: Whether to return only participants that are on hold
+        :param bool coaching: Whether to return only participants who are coaching another call
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of ParticipantInstance
+        :rtype: twilio.rest.api.v2010.account.conference.participant.ParticipantPage
+        """
+        data = values.of({
+            'Muted': muted,
+            'Hold': hold,
+            'Coaching': coaching,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return ParticipantPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of ParticipantInstance records from the API.
@@ -258,6 +504,23 @@ class ParticipantList(ListResource):
 
         return ParticipantPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of ParticipantInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of ParticipantInstance
+        :rtype: twilio.rest.api.v2010.account.conference.participant.ParticipantPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return ParticipantPage(self._version, response, self._solution)
+
     def get(self, call_sid):
         """
         Constructs a ParticipantContext
@@ -367,7 +630,7 @@ class ParticipantContext(InstanceContext):
             'conference_sid': conference_sid,
             'call_sid': call_sid,
         }
-        self._uri = '/Accounts/{account_sid}/Conferences/{conference_sid}/Participants/{call_sid}.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/Conferences/{conference_sid}/Participants/{call_sid}.json', self._solution)
 
     def fetch(self):
         """
@@ -386,6 +649,23 @@ class ParticipantContext(InstanceContext):
             call_sid=self._solution['call_sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ParticipantInstance
+
+        :returns: The fetched ParticipantInstance
+        :rtype: twilio.rest.api.v2010.account.conference.participant.ParticipantInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return ParticipantInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            conference_sid=self._solution['conference_sid'],
+            call_sid=self._solution['call_sid'],
+        )
+
     def update(self, muted=values.unset, hold=values.unset, hold_url=values.unset,
                hold_method=values.unset, announce_url=values.unset,
                announce_method=values.unset, wait_url=values.unset,
@@ -436,6 +716,56 @@ class ParticipantContext(InstanceContext):
             call_sid=self._solution['call_sid'],
         )
 
+    async def update_async(self, muted=values.unset, hold=values.unset, hold_url=values.unset,
+                           hold_method=values.unset, announce_url=values.unset,
+                           announce_method=values.unset, wait_url=values.unset,
+                           wait_method=values.unset, beep_on_exit=values.unset,
+                           end_conference_on_exit=values.unset, coaching=values.unset,
+                           call_sid_to_coach=values.unset):
+        """
+        Asynchronous coroutine that updates the ParticipantInstance
+
+        :param bool muted: Whether the participant should be muted
+        :param bool hold: Whether the participant should be on hold
+        :param unicode hold_url: The URL we call using the `hold_method` for  music that plays when the participant is on hold
+        :param unicode hold_method: The HTTP method we should use to call hold_url
+        :param unicode announce_url: The URL we call using the `announce_method` for an announcement to the participant
+        :param unicode announce_method: The HTTP method we should use to call announce_url
+        :param unicode wait_url: URL that hosts pre-conference hold music
+        :param unicode wait_method: The HTTP method we should use to call `wait_url`
+        :param bool beep_on_exit: Whether to play a notification beep to the conference when the participant exit
+        :param bool end_conference_on_exit: Whether to end the conference when the participant leaves
+        :param bool coaching: Indicates if the participant changed to coach
+        :param unicode call_sid_to_coach: The SID of the participant who is being `coached`
+
+        :returns: The updated ParticipantInstance
+        :rtype: twilio.rest.api.v2010.account.conference.participant.ParticipantInstance
+        """
+        data = values.of({
+            'Muted': muted,
+            'Hold': hold,
+            'HoldUrl': hold_url,
+            'HoldMethod': hold_method,
+            'AnnounceUrl': announce_url,
+            'AnnounceMethod': announce_method,
+            'WaitUrl': wait_url,
+            'WaitMethod': wait_method,
+            'BeepOnExit': beep_on_exit,
+            'EndConferenceOnExit': end_conference_on_exit,
+            'Coaching': coaching,
+            'CallSidToCoach': call_sid_to_coach,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return ParticipantInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            conference_sid=self._solution['conference_sid'],
+            call_sid=self._solution['call_sid'],
+        )
+
     def delete(self):
         """
         Deletes the ParticipantInstance
@@ -445,6 +775,15 @@ class ParticipantContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the ParticipantInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -466,6 +805,32 @@ class ParticipantInstance(InstanceResource):
         COMPLETE = "complete"
         FAILED = "failed"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.rfc2822_datetime,
+        'date_updated': deserialize.rfc2822_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'call_sid': 'call_sid',
+        'label': 'label',
+        'call_sid_to_coach': 'call_sid_to_coach',
+        'coaching': 'coaching',
+        'conference_sid': 'conference_sid',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'end_conference_on_exit': 'end_conference_on_exit',
+        'muted': 'muted',
+        'hold': 'hold',
+        'start_conference_on_enter': 'start_conference_on_enter',
+        'status': 'status',
+        'uri': 'uri',
+    }, _deserializers)
+
     def __init__(self, version, payload, account_sid, conference_sid,
                  call_sid=None):
         """
@@ -477,22 +842,7 @@ class ParticipantInstance(InstanceResource):
         super(ParticipantInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'call_sid': payload.get('call_sid'),
-            'label': payload.get('label'),
-            'call_sid_to_coach': payload.get('call_sid_to_coach'),
-            'coaching': payload.get('coaching'),
-            'conference_sid': payload.get('conference_sid'),
-            'date_created': deserialize.rfc2822_datetime(payload.get('date_created')),
-            'date_updated': deserialize.rfc2822_datetime(payload.get('date_updated')),
-            'end_conference_on_exit': payload.get('end_conference_on_exit'),
-            'muted': payload.get('muted'),
-            'hold': payload.get('hold'),
-            'start_conference_on_enter': payload.get('start_conference_on_enter'),
-            'status': payload.get('status'),
-            'uri': payload.get('uri'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -641,6 +991,15 @@ class ParticipantInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ParticipantInstance
+
+        :returns: The fetched ParticipantInstance
+        :rtype: twilio.rest.api.v2010.account.conference.participant.ParticipantInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, muted=values.unset, hold=values.unset, hold_url=values.unset,
                hold_method=values.unset, announce_url=values.unset,
                announce_method=values.unset, wait_url=values.unset,
@@ -681,6 +1040,46 @@ class ParticipantInstance(InstanceResource):
             call_sid_to_coach=call_sid_to_coach,
         )
 
+    async def update_async(self, muted=values.unset, hold=values.unset, hold_url=values.unset,
+                           hold_method=values.unset, announce_url=values.unset,
+                           announce_method=values.unset, wait_url=values.unset,
+                           wait_method=values.unset, beep_on_exit=values.unset,
+                           end_conference_on_exit=values.unset, coaching=values.unset,
+                           call_sid_to_coach=values.unset):
+        """
+        Asynchronous coroutine that updates the ParticipantInstance
+
+        :param bool muted: Whether the participant should be muted
+        :param bool hold: Whether the participant should be on hold
+        :param unicode hold_url: The URL we call using the `hold_method` for  music that plays when the participant is on hold
+        :param unicode hold_method: The HTTP method we should use to call hold_url
+        :param unicode announce_url: The URL we call using the `announce_method` for an announcement to the participant
+        :param unicode announce_method: The HTTP method we should use to call announce_url
+        :param unicode wait_url: URL that hosts pre-conference hold music
+        :param unicode wait_method: The HTTP method we should use to call `wait_url`
+        :param bool beep_on_exit: Whether to play a notification beep to the conference when the participant exit
+        :param bool end_conference_on_exit: Whether to end the conference when the participant leaves
+        :param bool coaching: Indicates if the participant changed to coach
+        :param unicode call_sid_to_coach: The SID of the participant who is being `coached`
+
+        :returns: The updated ParticipantInstance
+        :rtype: twilio.rest.api.v2010.account.conference.participant.ParticipantInstance
+        """
+        return await self._proxy.update_async(
+            muted=muted,
+            hold=hold,
+            hold_url=hold_url,
+            hold_method=hold_method,
+            announce_url=announce_url,
+            announce_method=announce_method,
+            wait_url=wait_url,
+            wait_method=wait_method,
+            beep_on_exit=beep_on_exit,
+            end_conference_on_exit=end_conference_on_exit,
+            coaching=coaching,
+            call_sid_to_coach=call_sid_to_coach,
+        )
+
     def delete(self):
         """
         Deletes the ParticipantInstance
@@ -690,6 +1089,15 @@ class ParticipantInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the ParticipantInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
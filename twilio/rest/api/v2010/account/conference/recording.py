@@ -32,10 +32,11 @@ class RecordingList(ListResource):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, 'conference_sid': conference_sid, }
-        self._uri = '/Accounts/{account_sid}/Conferences/{conference_sid}/Recordings.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/Conferences/{conference_sid}/Recordings.json', self._solution)
 
     def stream(self, date_created_before=values.unset, date_created=values.unset,
-               date_created_after=values.unset, limit=None, page_size=None):
+               date_created_after=values.unset, limit=None, page_size=None,
+               prefetch=None, raw=False, deadline=None):
         """
         Streams RecordingInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -51,23 +52,73 @@ class RecordingList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.conference.recording.RecordingInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
-            date_created_before=date_created_before,
-            date_created=date_created,
-            date_created_after=date_created_after,
-            page_size=limits['page_size'],
-        )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                date_created_before=date_created_before,
+                date_created=date_created,
+                date_created_after=date_created_after,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, date_created_before=values.unset, date_created=values.unset,
+                           date_created_after=values.unset, limit=None, page_size=None,
+                           prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams RecordingInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param date date_created_before: The `YYYY-MM-DD` value of the resources to read
+        :param date date_created: The `YYYY-MM-DD` value of the resources to read
+        :param date date_created_after: The `YYYY-MM-DD` value of the resources to read
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.conference.recording.RecordingInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                date_created_before=date_created_before,
+                date_created=date_created,
+                date_created_after=date_created_after,
+                page_size=limits['page_size'],
+            )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, date_created_before=values.unset, date_created=values.unset,
-             date_created_after=values.unset, limit=None, page_size=None):
+             date_created_after=values.unset, limit=None, page_size=None,
+             prefetch=None, raw=False, deadline=None):
         """
         Lists RecordingInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -82,6 +133,12 @@ class RecordingList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.conference.recording.RecordingInstance]
@@ -92,8 +149,49 @@ class RecordingList(ListResource):
             date_created_after=date_created_after,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, date_created_before=values.unset, date_created=values.unset,
+                         date_created_after=values.unset, limit=None, page_size=None,
+                         prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists RecordingInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param date date_created_before: The `YYYY-MM-DD` value of the resources to read
+        :param date date_created: The `YYYY-MM-DD` value of the resources to read
+        :param date date_created_after: The `YYYY-MM-DD` value of the resources to read
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.conference.recording.RecordingInstance]
+        """
+        return [record async for record in await self.stream_async(
+            date_created_before=date_created_before,
+            date_created=date_created,
+            date_created_after=date_created_after,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, date_created_before=values.unset, date_created=values.unset,
              date_created_after=values.unset, page_token=values.unset,
              page_number=values.unset, page_size=values.unset):
@@ -124,6 +222,36 @@ class RecordingList(ListResource):
 
         return RecordingPage(self._version, response, self._solution)
 
+    async def page_async(self, date_created_before=values.unset, date_created=values.unset,
+                         date_created_after=values.unset, page_token=values.unset,
+                         page_number=values.unset, page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of RecordingInstance records from the API.
+        Request is executed immediately
+
+        :param date date_created_before: The `YYYY-MM-DD` value of the resources to read
+        :param date date_created: The `YYYY-MM-DD` value of the resources to read
+        :param date date_created_after: The `YYYY-MM-DD` value of the resources to read
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of RecordingInstance
+        :rtype: twilio.rest.api.v2010.account.conference.recording.RecordingPage
+        """
+        data = values.of({
+            'DateCreated<': serialize.iso8601_date(date_created_before),
+            'DateCreated': serialize.iso8601_date(date_created),
+            'DateCreated>': serialize.iso8601_date(date_created_after),
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return RecordingPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of RecordingInstance records from the API.
@@ -141,6 +269,23 @@ class RecordingList(ListResource):
 
         return RecordingPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of RecordingInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of RecordingInstance
+        :rtype: twilio.rest.api.v2010.account.conference.recording.RecordingPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return RecordingPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a RecordingContext
@@ -246,7 +391,7 @@ class RecordingContext(InstanceContext):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, 'conference_sid': conference_sid, 'sid': sid, }
-        self._uri = '/Accounts/{account_sid}/Conferences/{conference_sid}/Recordings/{sid}.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/Conferences/{conference_sid}/Recordings/{sid}.json', self._solution)
 
     def update(self, status, pause_behavior=values.unset):
         """
@@ -270,6 +415,28 @@ class RecordingContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, status, pause_behavior=values.unset):
+        """
+        Asynchronous coroutine that updates the RecordingInstance
+
+        :param RecordingInstance.Status status: The new status of the recording
+        :param unicode pause_behavior: Whether to record during a pause
+
+        :returns: The updated RecordingInstance
+        :rtype: twilio.rest.api.v2010.account.conference.recording.RecordingInstance
+        """
+        data = values.of({'Status': status, 'PauseBehavior': pause_behavior, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return RecordingInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            conference_sid=self._solution['conference_sid'],
+            sid=self._solution['sid'],
+        )
+
     def fetch(self):
         """
         Fetch the RecordingInstance
@@ -287,6 +454,23 @@ class RecordingContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the RecordingInstance
+
+        :returns: The fetched RecordingInstance
+        :rtype: twilio.rest.api.v2010.account.conference.recording.RecordingInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return RecordingInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            conference_sid=self._solution['conference_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self):
         """
         Deletes the RecordingInstance
@@ -296,6 +480,15 @@ class RecordingContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the RecordingInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -326,6 +519,38 @@ class RecordingInstance(InstanceResource):
         STARTCALLRECORDINGAPI = "StartCallRecordingAPI"
         STARTCONFERENCERECORDINGAPI = "StartConferenceRecordingAPI"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.rfc2822_datetime,
+        'date_updated': deserialize.rfc2822_datetime,
+        'start_time': deserialize.rfc2822_datetime,
+        'channels': deserialize.integer,
+        'error_code': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'api_version': 'api_version',
+        'call_sid': 'call_sid',
+        'conference_sid': 'conference_sid',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'start_time': 'start_time',
+        'duration': 'duration',
+        'sid': 'sid',
+        'price': 'price',
+        'price_unit': 'price_unit',
+        'status': 'status',
+        'channels': 'channels',
+        'source': 'source',
+        'error_code': 'error_code',
+        'encryption_details': 'encryption_details',
+        'uri': 'uri',
+    }, _deserializers)
+
     def __init__(self, version, payload, account_sid, conference_sid, sid=None):
         """
         Initialize the RecordingInstance
@@ -336,25 +561,7 @@ class RecordingInstance(InstanceResource):
         super(RecordingInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'api_version': payload.get('api_version'),
-            'call_sid': payload.get('call_sid'),
-            'conference_sid': payload.get('conference_sid'),
-            'date_created': deserialize.rfc2822_datetime(payload.get('date_created')),
-            'date_updated': deserialize.rfc2822_datetime(payload.get('date_updated')),
-            'start_time': deserialize.rfc2822_datetime(payload.get('start_time')),
-            'duration': payload.get('duration'),
-            'sid': payload.get('sid'),
-            'price': payload.get('price'),
-            'price_unit': payload.get('price_unit'),
-            'status': payload.get('status'),
-            'channels': deserialize.integer(payload.get('channels')),
-            'source': payload.get('source'),
-            'error_code': deserialize.integer(payload.get('error_code')),
-            'encryption_details': payload.get('encryption_details'),
-            'uri': payload.get('uri'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -530,6 +737,18 @@ class RecordingInstance(InstanceResource):
         """
         return self._proxy.update(status, pause_behavior=pause_behavior, )
 
+    async def update_async(self, status, pause_behavior=values.unset):
+        """
+        Asynchronous coroutine that updates the RecordingInstance
+
+        :param RecordingInstance.Status status: The new status of the recording
+        :param unicode pause_behavior: Whether to record during a pause
+
+        :returns: The updated RecordingInstance
+        :rtype: twilio.rest.api.v2010.account.conference.recording.RecordingInstance
+        """
+        return await self._proxy.update_async(status, pause_behavior=pause_behavior, )
+
     def fetch(self):
         """
         Fetch the RecordingInstance
@@ -539,6 +758,15 @@ class RecordingInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the RecordingInstance
+
+        :returns: The fetched RecordingInstance
+        :rtype: twilio.rest.api.v2010.account.conference.recording.RecordingInstance
+        """
+        return await self._proxy.fetch_async()
+
     def delete(self):
         """
         Deletes the RecordingInstance
@@ -548,6 +776,15 @@ class RecordingInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the RecordingInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
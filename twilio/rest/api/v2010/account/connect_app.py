@@ -7,6 +7,7 @@ This code was generated by
 """
 
 from twilio.base import serialize
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
@@ -30,9 +31,9 @@ class ConnectAppList(ListResource):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, }
-        self._uri = '/Accounts/{account_sid}/ConnectApps.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/ConnectApps.json', self._solution)
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams ConnectAppInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -45,17 +46,57 @@ class ConnectAppList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.connect_app.ConnectAppInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams ConnectAppInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.connect_app.ConnectAppInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists ConnectAppInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -67,11 +108,42 @@ class ConnectAppList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.connect_app.ConnectAppInstance]
+        """
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists ConnectAppInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.connect_app.ConnectAppInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -92,6 +164,25 @@ class ConnectAppList(ListResource):
 
         return ConnectAppPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of ConnectAppInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of ConnectAppInstance
+        :rtype: twilio.rest.api.v2010.account.connect_app.ConnectAppPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return ConnectAppPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of ConnectAppInstance records from the API.
@@ -109,6 +200,23 @@ class ConnectAppList(ListResource):
 
         return ConnectAppPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of ConnectAppInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of ConnectAppInstance
+        :rtype: twilio.rest.api.v2010.account.connect_app.ConnectAppPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return ConnectAppPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a ConnectAppContext
@@ -197,7 +305,7 @@ class ConnectAppContext(InstanceContext):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, 'sid': sid, }
-        self._uri = '/Accounts/{account_sid}/ConnectApps/{sid}.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/ConnectApps/{sid}.json', self._solution)
 
     def fetch(self):
         """
@@ -215,6 +323,22 @@ class ConnectAppContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ConnectAppInstance
+
+        :returns: The fetched ConnectAppInstance
+        :rtype: twilio.rest.api.v2010.account.connect_app.ConnectAppInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return ConnectAppInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            sid=self._solution['sid'],
+        )
+
     def update(self, authorize_redirect_url=values.unset, company_name=values.unset,
                deauthorize_callback_method=values.unset,
                deauthorize_callback_url=values.unset, description=values.unset,
@@ -255,6 +379,46 @@ class ConnectAppContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, authorize_redirect_url=values.unset, company_name=values.unset,
+                           deauthorize_callback_method=values.unset,
+                           deauthorize_callback_url=values.unset, description=values.unset,
+                           friendly_name=values.unset, homepage_url=values.unset,
+                           permissions=values.unset):
+        """
+        Asynchronous coroutine that updates the ConnectAppInstance
+
+        :param unicode authorize_redirect_url: The URL to redirect the user to after authorization
+        :param unicode company_name: The company name to set for the Connect App
+        :param unicode deauthorize_callback_method: The HTTP method to use when calling deauthorize_callback_url
+        :param unicode deauthorize_callback_url: The URL to call to de-authorize the Connect App
+        :param unicode description: A description of the Connect App
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode homepage_url: A public URL where users can obtain more information
+        :param list[ConnectAppInstance.Permission] permissions: The set of permissions that your ConnectApp will request
+
+        :returns: The updated ConnectAppInstance
+        :rtype: twilio.rest.api.v2010.account.connect_app.ConnectAppInstance
+        """
+        data = values.of({
+            'AuthorizeRedirectUrl': authorize_redirect_url,
+            'CompanyName': company_name,
+            'DeauthorizeCallbackMethod': deauthorize_callback_method,
+            'DeauthorizeCallbackUrl': deauthorize_callback_url,
+            'Description': description,
+            'FriendlyName': friendly_name,
+            'HomepageUrl': homepage_url,
+            'Permissions': serialize.map(permissions, lambda e: e),
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return ConnectAppInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self):
         """
         Deletes the ConnectAppInstance
@@ -264,6 +428,15 @@ class ConnectAppContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the ConnectAppInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -281,6 +454,23 @@ class ConnectAppInstance(InstanceResource):
         GET_ALL = "get-all"
         POST_ALL = "post-all"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'authorize_redirect_url': 'authorize_redirect_url',
+        'company_name': 'company_name',
+        'deauthorize_callback_method': 'deauthorize_callback_method',
+        'deauthorize_callback_url': 'deauthorize_callback_url',
+        'description': 'description',
+        'friendly_name': 'friendly_name',
+        'homepage_url': 'homepage_url',
+        'permissions': 'permissions',
+        'sid': 'sid',
+        'uri': 'uri',
+    })
+
     def __init__(self, version, payload, account_sid, sid=None):
         """
         Initialize the ConnectAppInstance
@@ -291,19 +481,7 @@ class ConnectAppInstance(InstanceResource):
         super(ConnectAppInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'authorize_redirect_url': payload.get('authorize_redirect_url'),
-            'company_name': payload.get('company_name'),
-            'deauthorize_callback_method': payload.get('deauthorize_callback_method'),
-            'deauthorize_callback_url': payload.get('deauthorize_callback_url'),
-            'description': payload.get('description'),
-            'friendly_name': payload.get('friendly_name'),
-            'homepage_url': payload.get('homepage_url'),
-            'permissions': payload.get('permissions'),
-            'sid': payload.get('sid'),
-            'uri': payload.get('uri'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -423,6 +601,15 @@ class ConnectAppInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ConnectAppInstance
+
+        :returns: The fetched ConnectAppInstance
+        :rtype: twilio.rest.api.v2010.account.connect_app.ConnectAppInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, authorize_redirect_url=values.unset, company_name=values.unset,
                deauthorize_callback_method=values.unset,
                deauthorize_callback_url=values.unset, description=values.unset,
@@ -454,6 +641,37 @@ class ConnectAppInstance(InstanceResource):
             permissions=permissions,
         )
 
+    async def update_async(self, authorize_redirect_url=values.unset, company_name=values.unset,
+                           deauthorize_callback_method=values.unset,
+                           deauthorize_callback_url=values.unset, description=values.unset,
+                           friendly_name=values.unset, homepage_url=values.unset,
+                           permissions=values.unset):
+        """
+        Asynchronous coroutine that updates the ConnectAppInstance
+
+        :param unicode authorize_redirect_url: The URL to redirect the user to after authorization
+        :param unicode company_name: The company name to set for the Connect App
+        :param unicode deauthorize_callback_method: The HTTP method to use when calling deauthorize_callback_url
+        :param unicode deauthorize_callback_url: The URL to call to de-authorize the Connect App
+        :param unicode description: A description of the Connect App
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode homepage_url: A public URL where users can obtain more information
+        :param list[ConnectAppInstance.Permission] permissions: The set of permissions that your ConnectApp will request
+
+        :returns: The updated ConnectAppInstance
+        :rtype: twilio.rest.api.v2010.account.connect_app.ConnectAppInstance
+        """
+        return await self._proxy.update_async(
+            authorize_redirect_url=authorize_redirect_url,
+            company_name=company_name,
+            deauthorize_callback_method=deauthorize_callback_method,
+            deauthorize_callback_url=deauthorize_callback_url,
+            description=description,
+            friendly_name=friendly_name,
+            homepage_url=homepage_url,
+            permissions=permissions,
+        )
+
     def delete(self):
         """
         Deletes the ConnectAppInstance
@@ -463,6 +681,15 @@ class ConnectAppInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the ConnectAppInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
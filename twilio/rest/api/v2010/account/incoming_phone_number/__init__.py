@@ -6,16 +6,14 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.api.v2010.account.incoming_phone_number.assigned_add_on import AssignedAddOnList
-from twilio.rest.api.v2010.account.incoming_phone_number.local import LocalList
-from twilio.rest.api.v2010.account.incoming_phone_number.mobile import MobileList
-from twilio.rest.api.v2010.account.incoming_phone_number.toll_free import TollFreeList
 
 
 class IncomingPhoneNumberList(ListResource):
@@ -34,7 +32,7 @@ class IncomingPhoneNumberList(ListResource):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, }
-        self._uri = '/Accounts/{account_sid}/IncomingPhoneNumbers.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/IncomingPhoneNumbers.json', self._solution)
 
         # Components
         self._local = None
@@ -43,7 +41,7 @@ class IncomingPhoneNumberList(ListResource):
 
     def stream(self, beta=values.unset, friendly_name=values.unset,
                phone_number=values.unset, origin=values.unset, limit=None,
-               page_size=None):
+               page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams IncomingPhoneNumberInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -60,25 +58,76 @@ class IncomingPhoneNumberList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.incoming_phone_number.IncomingPhoneNumberInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
-            beta=beta,
-            friendly_name=friendly_name,
-            phone_number=phone_number,
-            origin=origin,
-            page_size=limits['page_size'],
-        )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                beta=beta,
+                friendly_name=friendly_name,
+                phone_number=phone_number,
+                origin=origin,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-        return self._version.stream(page, limits['limit'])
+    async def stream_async(self, beta=values.unset, friendly_name=values.unset,
+                           phone_number=values.unset, origin=values.unset, limit=None,
+                           page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams IncomingPhoneNumberInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param bool beta: Whether to include new phone numbers
+        :param unicode friendly_name: A string that identifies the IncomingPhoneNumber resources to read
+        :param unicode phone_number: The phone numbers of the IncomingPhoneNumber resources to read
+        :param unicode origin: Include phone numbers based on their origin. By default, phone numbers of all origin are included.
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.incoming_phone_number.IncomingPhoneNumberInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                beta=beta,
+                friendly_name=friendly_name,
+                phone_number=phone_number,
+                origin=origin,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, beta=values.unset, friendly_name=values.unset,
              phone_number=values.unset, origin=values.unset, limit=None,
-             page_size=None):
+             page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists IncomingPhoneNumberInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -94,6 +143,12 @@ class IncomingPhoneNumberList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.incoming_phone_number.IncomingPhoneNumberInstance]
@@ -105,8 +160,51 @@ class IncomingPhoneNumberList(ListResource):
             origin=origin,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, beta=values.unset, friendly_name=values.unset,
+                         phone_number=values.unset, origin=values.unset, limit=None,
+                         page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists IncomingPhoneNumberInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param bool beta: Whether to include new phone numbers
+        :param unicode friendly_name: A string that identifies the IncomingPhoneNumber resources to read
+        :param unicode phone_number: The phone numbers of the IncomingPhoneNumber resources to read
+        :param unicode origin: Include phone numbers based on their origin. By default, phone numbers of all origin are included.
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.incoming_phone_number.IncomingPhoneNumberInstance]
+        """
+        return [record async for record in await self.stream_async(
+            beta=beta,
+            friendly_name=friendly_name,
+            phone_number=phone_number,
+            origin=origin,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, beta=values.unset, friendly_name=values.unset,
              phone_number=values.unset, origin=values.unset,
              page_token=values.unset, page_number=values.unset,
@@ -140,6 +238,39 @@ class IncomingPhoneNumberList(ListResource):
 
         return IncomingPhoneNumberPage(self._version, response, self._solution)
 
+    async def page_async(self, beta=values.unset, friendly_name=values.unset,
+                         phone_number=values.unset, origin=values.unset,
+                         page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of IncomingPhoneNumberInstance records from the API.
+        Request is executed immediately
+
+        :param bool beta: Whether to include new phone numbers
+        :param unicode friendly_name: A string that identifies the IncomingPhoneNumber resources to read
+        :param unicode phone_number: The phone numbers of the IncomingPhoneNumber resources to read
+        :param unicode origin: Include phone numbers based on their origin. By default, phone numbers of all origin are included.
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of IncomingPhoneNumberInstance
+        :rtype: twilio.rest.api.v2010.account.incoming_phone_number.IncomingPhoneNumberPage
+        """
+        data = values.of({
+            'Beta': beta,
+            'FriendlyName': friendly_name,
+            'PhoneNumber': phone_number,
+            'Origin': origin,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return IncomingPhoneNumberPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of IncomingPhoneNumberInstance records from the API.
@@ -157,6 +288,23 @@ class IncomingPhoneNumberList(ListResource):
 
         return IncomingPhoneNumberPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of IncomingPhoneNumberInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of IncomingPhoneNumberInstance
+        :rtype: twilio.rest.api.v2010.account.incoming_phone_number.IncomingPhoneNumberPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return IncomingPhoneNumberPage(self._version, response, self._solution)
+
     def create(self, api_version=values.unset, friendly_name=values.unset,
                sms_application_sid=values.unset, sms_fallback_method=values.unset,
                sms_fallback_url=values.unset, sms_method=values.unset,
@@ -170,7 +318,7 @@ class IncomingPhoneNumberList(ListResource):
                trunk_sid=values.unset, identity_sid=values.unset,
                address_sid=values.unset, voice_receive_mode=values.unset,
                bundle_sid=values.unset, phone_number=values.unset,
-               area_code=values.unset):
+               area_code=values.unset, deadline=None):
         """
         Create the IncomingPhoneNumberInstance
 
@@ -198,6 +346,90 @@ class IncomingPhoneNumberList(ListResource):
         :param unicode bundle_sid: The SID of the Bundle resource associated with number
         :param unicode phone_number: The phone number to purchase in E.164 format
         :param unicode area_code: The desired area code for the new phone number
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created IncomingPhoneNumberInstance
+        :rtype: twilio.rest.api.v2010.account.incoming_phone_number.IncomingPhoneNumberInstance
+        """
+        data = values.of({
+            'PhoneNumber': phone_number,
+            'AreaCode': area_code,
+            'ApiVersion': api_version,
+            'FriendlyName': friendly_name,
+            'SmsApplicationSid': sms_application_sid,
+            'SmsFallbackMethod': sms_fallback_method,
+            'SmsFallbackUrl': sms_fallback_url,
+            'SmsMethod': sms_method,
+            'SmsUrl': sms_url,
+            'StatusCallback': status_callback,
+            'StatusCallbackMethod': status_callback_method,
+            'VoiceApplicationSid': voice_application_sid,
+            'VoiceCallerIdLookup': voice_caller_id_lookup,
+            'VoiceFallbackMethod': voice_fallback_method,
+            'VoiceFallbackUrl': voice_fallback_url,
+            'VoiceMethod': voice_method,
+            'VoiceUrl': voice_url,
+            'EmergencyStatus': emergency_status,
+            'EmergencyAddressSid': emergency_address_sid,
+            'TrunkSid': trunk_sid,
+            'IdentitySid': identity_sid,
+            'AddressSid': address_sid,
+            'VoiceReceiveMode': voice_receive_mode,
+            'BundleSid': bundle_sid,
+        })
+
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return IncomingPhoneNumberInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+        )
+
+    async def create_async(self, api_version=values.unset, friendly_name=values.unset,
+                           sms_application_sid=values.unset, sms_fallback_method=values.unset,
+                           sms_fallback_url=values.unset, sms_method=values.unset,
+                           sms_url=values.unset, status_callback=values.unset,
+                           status_callback_method=values.unset,
+                           voice_application_sid=values.unset,
+                           voice_caller_id_lookup=values.unset,
+                           voice_fallback_method=values.unset, voice_fallback_url=values.unset,
+                           voice_method=values.unset, voice_url=values.unset,
+                           emergency_status=values.unset, emergency_address_sid=values.unset,
+                           trunk_sid=values.unset, identity_sid=values.unset,
+                           address_sid=values.unset, voice_receive_mode=values.unset,
+                           bundle_sid=values.unset, phone_number=values.unset,
+                           area_code=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the IncomingPhoneNumberInstance
+
+        :param unicode api_version: The API version to use for incoming calls made to the new phone number
+        :param unicode friendly_name: A string to describe the new phone number
+        :param unicode sms_application_sid: The SID of the application to handle SMS messages
+        :param unicode sms_fallback_method: HTTP method used with sms_fallback_url
+        :param unicode sms_fallback_url: The URL we call when an error occurs while executing TwiML
+        :param unicode sms_method: The HTTP method to use with sms url
+        :param unicode sms_url: The URL we should call when the new phone number receives an incoming SMS message
+        :param unicode status_callback: The URL we should call to send status information to your application
+        :param unicode status_callback_method: HTTP method we should use to call status_callback
+        :param unicode voice_application_sid: The SID of the application to handle the new phone number
+        :param bool voice_caller_id_lookup: Whether to lookup the caller's name
+        :param unicode voice_fallback_method: The HTTP method used with voice_fallback_url
+        :param unicode voice_fallback_url: The URL we will call when an error occurs in TwiML
+        :param unicode voice_method: The HTTP method used with the voice_url
+        :param unicode voice_url: The URL we should call when the phone number receives a call
+        :param IncomingPhoneNumberInstance.EmergencyStatus emergency_status: Displays if emergency calling is enabled for this number.
+        :param unicode emergency_address_sid: The emergency address configuration to use for emergency calling
+        :param unicode trunk_sid: SID of the trunk to handle calls to the new phone number
+        :param unicode identity_sid: The SID of the Identity resource to associate with the new phone number
+        :param unicode address_sid: The SID of the Address resource associated with the phone number
+        :param IncomingPhoneNumberInstance.VoiceReceiveMode voice_receive_mode: Incoming call type: fax or voice
+        :param unicode bundle_sid: The SID of the Bundle resource associated with number
+        :param unicode phone_number: The phone number to purchase in E.164 format
+        :param unicode area_code: The desired area code for the new phone number
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created IncomingPhoneNumberInstance
         :rtype: twilio.rest.api.v2010.account.incoming_phone_number.IncomingPhoneNumberInstance
@@ -229,7 +461,7 @@ class IncomingPhoneNumberList(ListResource):
             'BundleSid': bundle_sid,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return IncomingPhoneNumberInstance(
             self._version,
@@ -246,6 +478,7 @@ class IncomingPhoneNumberList(ListResource):
         :rtype: twilio.rest.api.v2010.account.incoming_phone_number.local.LocalList
         """
         if self._local is None:
+            from twilio.rest.api.v2010.account.incoming_phone_number.local import LocalList
             self._local = LocalList(self._version, account_sid=self._solution['account_sid'], )
         return self._local
 
@@ -258,6 +491,7 @@ class IncomingPhoneNumberList(ListResource):
         :rtype: twilio.rest.api.v2010.account.incoming_phone_number.mobile.MobileList
         """
         if self._mobile is None:
+            from twilio.rest.api.v2010.account.incoming_phone_number.mobile import MobileList
             self._mobile = MobileList(self._version, account_sid=self._solution['account_sid'], )
         return self._mobile
 
@@ -270,6 +504,7 @@ class IncomingPhoneNumberList(ListResource):
         :rtype: twilio.rest.api.v2010.account.incoming_phone_number.toll_free.TollFreeList
         """
         if self._toll_free is None:
+            from twilio.rest.api.v2010.account.incoming_phone_number.toll_free import TollFreeList
             self._toll_free = TollFreeList(self._version, account_sid=self._solution['account_sid'], )
         return self._toll_free
 
@@ -365,7 +600,7 @@ class IncomingPhoneNumberContext(InstanceContext):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, 'sid': sid, }
-        self._uri = '/Accounts/{account_sid}/IncomingPhoneNumbers/{sid}.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/IncomingPhoneNumbers/{sid}.json', self._solution)
 
         # Dependents
         self._assigned_add_ons = None
@@ -448,6 +683,84 @@ class IncomingPhoneNumberContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, account_sid=values.unset, api_version=values.unset,
+                           friendly_name=values.unset, sms_application_sid=values.unset,
+                           sms_fallback_method=values.unset, sms_fallback_url=values.unset,
+                           sms_method=values.unset, sms_url=values.unset,
+                           status_callback=values.unset, status_callback_method=values.unset,
+                           voice_application_sid=values.unset,
+                           voice_caller_id_lookup=values.unset,
+                           voice_fallback_method=values.unset, voice_fallback_url=values.unset,
+                           voice_method=values.unset, voice_url=values.unset,
+                           emergency_status=values.unset, emergency_address_sid=values.unset,
+                           trunk_sid=values.unset, voice_receive_mode=values.unset,
+                           identity_sid=values.unset, address_sid=values.unset,
+                           bundle_sid=values.unset):
+        """
+        Asynchronous coroutine that updates the IncomingPhoneNumberInstance
+
+        :param unicode account_sid: The SID of the Account that created the resource to update
+        :param unicode api_version: The API version to use for incoming calls made to the phone number
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode sms_application_sid: Unique string that identifies the application
+        :param unicode sms_fallback_method: HTTP method used with sms_fallback_url
+        :param unicode sms_fallback_url: The URL we call when an error occurs while executing TwiML
+        :param unicode sms_method: The HTTP method to use with sms_url
+        :param unicode sms_url: The URL we should call when the phone number receives an incoming SMS message
+        :param unicode status_callback: The URL we should call to send status information to your application
+        :param unicode status_callback_method: The HTTP method we should use to call status_callback
+        :param unicode voice_application_sid: The SID of the application to handle the phone number
+        :param bool voice_caller_id_lookup: Whether to lookup the caller's name
+        :param unicode voice_fallback_method: The HTTP method used with fallback_url
+        :param unicode voice_fallback_url: The URL we will call when an error occurs in TwiML
+        :param unicode voice_method: The HTTP method used with the voice_url
+        :param unicode voice_url: The URL we should call when the phone number receives a call
+        :param IncomingPhoneNumberInstance.EmergencyStatus emergency_status: Displays if emergency calling is enabled for this number.
+        :param unicode emergency_address_sid: The emergency address configuration to use for emergency calling
+        :param unicode trunk_sid: SID of the trunk to handle phone calls to the phone number
+        :param IncomingPhoneNumberInstance.VoiceReceiveMode voice_receive_mode: Incoming call type: fax or voice
+        :param unicode identity_sid: Unique string that identifies the identity associated with number
+        :param unicode address_sid: The SID of the Address resource associated with the phone number
+        :param unicode bundle_sid: The SID of the Bundle resource associated with number
+
+        :returns: The updated IncomingPhoneNumberInstance
+        :rtype: twilio.rest.api.v2010.account.incoming_phone_number.IncomingPhoneNumberInstance
+        """
+        data = values.of({
+            'AccountSid': account_sid,
+            'ApiVersion': api_version,
+            'FriendlyName': friendly_name,
+            'SmsApplicationSid': sms_application_sid,
+            'SmsFallbackMethod': sms_fallback_method,
+            'SmsFallbackUrl': sms_fallback_url,
+            'SmsMethod': sms_method,
+            'SmsUrl': sms_url,
+            'StatusCallback': status_callback,
+            'StatusCallbackMethod': status_callback_method,
+            'VoiceApplicationSid': voice_application_sid,
+            'VoiceCallerIdLookup': voice_caller_id_lookup,
+            'VoiceFallbackMethod': voice_fallback_method,
+            'VoiceFallbackUrl': voice_fallback_url,
+            'VoiceMethod': voice_method,
+            'VoiceUrl': voice_url,
+            'EmergencyStatus': emergency_status,
+            'EmergencyAddressSid': emergency_address_sid,
+            'TrunkSid': trunk_sid,
+            'VoiceReceiveMode': voice_receive_mode,
+            'IdentitySid': identity_sid,
+            'AddressSid': address_sid,
+            'BundleSid': bundle_sid,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return IncomingPhoneNumberInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            sid=self._solution['sid'],
+        )
+
     def fetch(self):
         """
         Fetch the IncomingPhoneNumberInstance
@@ -464,6 +777,22 @@ class IncomingPhoneNumberContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the IncomingPhoneNumberInstance
+
+        :returns: The fetched IncomingPhoneNumberInstance
+        :rtype: twilio.rest.api.v2010.account.incoming_phone_number.IncomingPhoneNumberInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return IncomingPhoneNumberInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self):
         """
         Deletes the IncomingPhoneNumberInstance
@@ -473,6 +802,15 @@ class IncomingPhoneNumberContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the IncomingPhoneNumberInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     @property
     def assigned_add_ons(self):
         """
@@ -482,6 +820,7 @@ class IncomingPhoneNumberContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.incoming_phone_number.assigned_add_on.AssignedAddOnList
         """
         if self._assigned_add_ons is None:
+            from twilio.rest.api.v2010.account.incoming_phone_number.assigned_add_on import AssignedAddOnList
             self._assigned_add_ons = AssignedAddOnList(
                 self._version,
                 account_sid=self._solution['account_sid'],
@@ -524,6 +863,52 @@ class IncomingPhoneNumberInstance(InstanceResource):
         VOICE = "voice"
         FAX = "fax"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.rfc2822_datetime,
+        'date_updated': deserialize.rfc2822_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'address_sid': 'address_sid',
+        'address_requirements': 'address_requirements',
+        'api_version': 'api_version',
+        'beta': 'beta',
+        'capabilities': 'capabilities',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'friendly_name': 'friendly_name',
+        'identity_sid': 'identity_sid',
+        'phone_number': 'phone_number',
+        'origin': 'origin',
+        'sid': 'sid',
+        'sms_application_sid': 'sms_application_sid',
+        'sms_fallback_method': 'sms_fallback_method',
+        'sms_fallback_url': 'sms_fallback_url',
+        'sms_method': 'sms_method',
+        'sms_url': 'sms_url',
+        'status_callback': 'status_callback',
+        'status_callback_method': 'status_callback_method',
+        'trunk_sid': 'trunk_sid',
+        'uri': 'uri',
+        'voice_receive_mode': 'voice_receive_mode',
+        'voice_application_sid': 'voice_application_sid',
+        'voice_caller_id_lookup': 'voice_caller_id_lookup',
+        'voice_fallback_method': 'voice_fallback_method',
+        'voice_fallback_url': 'voice_fallback_url',
+        'voice_method': 'voice_method',
+        'voice_url': 'voice_url',
+        'emergency_status': 'emergency_status',
+        'emergency_address_sid': 'emergency_address_sid',
+        'emergency_address_status': 'emergency_address_status',
+        'bundle_sid': 'bundle_sid',
+        'status': 'status',
+    }, _deserializers)
+
     def __init__(self, version, payload, account_sid, sid=None):
         """
         Initialize the IncomingPhoneNumberInstance
@@ -534,42 +919,7 @@ class IncomingPhoneNumberInstance(InstanceResource):
         super(IncomingPhoneNumberInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'address_sid': payload.get('address_sid'),
-            'address_requirements': payload.get('address_requirements'),
-            'api_version': payload.get('api_version'),
-            'beta': payload.get('beta'),
-            'capabilities': payload.get('capabilities'),
-            'date_created': deserialize.rfc2822_datetime(payload.get('date_created')),
-            'date_updated': deserialize.rfc2822_datetime(payload.get('date_updated')),
-            'friendly_name': payload.get('friendly_name'),
-            'identity_sid': payload.get('identity_sid'),
-            'phone_number': payload.get('phone_number'),
-            'origin': payload.get('origin'),
-            'sid': payload.get('sid'),
-            'sms_application_sid': payload.get('sms_application_sid'),
-            'sms_fallback_method': payload.get('sms_fallback_method'),
-            'sms_fallback_url': payload.get('sms_fallback_url'),
-            'sms_method': payload.get('sms_method'),
-            'sms_url': payload.get('sms_url'),
-            'status_callback': payload.get('status_callback'),
-            'status_callback_method': payload.get('status_callback_method'),
-            'trunk_sid': payload.get('trunk_sid'),
-            'uri': payload.get('uri'),
-            'voice_receive_mode': payload.get('voice_receive_mode'),
-            'voice_application_sid': payload.get('voice_application_sid'),
-            'voice_caller_id_lookup': payload.get('voice_caller_id_lookup'),
-            'voice_fallback_method': payload.get('voice_fallback_method'),
-            'voice_fallback_url': payload.get('voice_fallback_url'),
-            'voice_method': payload.get('voice_method'),
-            'voice_url': payload.get('voice_url'),
-            'emergency_status': payload.get('emergency_status'),
-            'emergency_address_sid': payload.get('emergency_address_sid'),
-            'emergency_address_status': payload.get('emergency_address_status'),
-            'bundle_sid': payload.get('bundle_sid'),
-            'status': payload.get('status'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -933,6 +1283,75 @@ class IncomingPhoneNumberInstance(InstanceResource):
             bundle_sid=bundle_sid,
         )
 
+    async def update_async(self, account_sid=values.unset, api_version=values.unset,
+                           friendly_name=values.unset, sms_application_sid=values.unset,
+                           sms_fallback_method=values.unset, sms_fallback_url=values.unset,
+                           sms_method=values.unset, sms_url=values.unset,
+                           status_callback=values.unset, status_callback_method=values.unset,
+                           voice_application_sid=values.unset,
+                           voice_caller_id_lookup=values.unset,
+                           voice_fallback_method=values.unset, voice_fallback_url=values.unset,
+                           voice_method=values.unset, voice_url=values.unset,
+                           emergency_status=values.unset, emergency_address_sid=values.unset,
+                           trunk_sid=values.unset, voice_receive_mode=values.unset,
+                           identity_sid=values.unset, address_sid=values.unset,
+                           bundle_sid=values.unset):
+        """
+        Asynchronous coroutine that updates the IncomingPhoneNumberInstance
+
+        :param unicode account_sid: The SID of the Account that created the resource to update
+        :param unicode api_version: The API version to use for incoming calls made to the phone number
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode sms_application_sid: Unique string that identifies the application
+        :param unicode sms_fallback_method: HTTP method used with sms_fallback_url
+        :param unicode sms_fallback_url: The URL we call when an error occurs while executing TwiML
+        :param unicode sms_method: The HTTP method to use with sms_url
+        :param unicode sms_url: The URL we should call when the phone number receives an incoming SMS message
+        :param unicode status_callback: The URL we should call to send status information to your application
+        :param unicode status_callback_method: The HTTP method we should use to call status_callback
+        :param unicode voice_application_sid: The SID of the application to handle the phone number
+        :param bool voice_caller_id_lookup: Whether to lookup the caller's name
+        :param unicode voice_fallback_method: The HTTP method used with fallback_url
+        :param unicode voice_fallback_url: The URL we will call when an error occurs in TwiML
+        :param unicode voice_method: The HTTP method used with the voice_url
+        :param unicode voice_url: The URL we should call when the phone number receives a call
+        :param IncomingPhoneNumberInstance.EmergencyStatus emergency_status: Displays if emergency calling is enabled for this number.
+        :param unicode emergency_address_sid: The emergency address configuration to use for emergency calling
+        :param unicode trunk_sid: SID of the trunk to handle phone calls to the phone number
+        :param IncomingPhoneNumberInstance.VoiceReceiveMode voice_receive_mode: Incoming call type: fax or voice
+        :param unicode identity_sid: Unique string that identifies the identity associated with number
+        :param unicode address_sid: The SID of the Address resource associated with the phone number
+        :param unicode bundle_sid: The SID of the Bundle resource associated with number
+
+        :returns: The updated IncomingPhoneNumberInstance
+        :rtype: twilio.rest.api.v2010.account.incoming_phone_number.IncomingPhoneNumberInstance
+        """
+        return await self._proxy.update_async(
+            account_sid=account_sid,
+            api_version=api_version,
+            friendly_name=friendly_name,
+            sms_application_sid=sms_application_sid,
+            sms_fallback_method=sms_fallback_method,
+            sms_fallback_url=sms_fallback_url,
+            sms_method=sms_method,
+            sms_url=sms_url,
+            status_callback=status_callback,
+            status_callback_method=status_callback_method,
+            voice_application_sid=voice_application_sid,
+            voice_caller_id_lookup=voice_caller_id_lookup,
+            voice_fallback_method=voice_fallback_method,
+            voice_fallback_url=voice_fallback_url,
+            voice_method=voice_method,
+            voice_url=voice_url,
+            emergency_status=emergency_status,
+            emergency_address_sid=emergency_address_sid,
+            trunk_sid=trunk_sid,
+            voice_receive_mode=voice_receive_mode,
+            identity_sid=identity_sid,
+            address_sid=address_sid,
+            bundle_sid=bundle_sid,
+        )
+
     def fetch(self):
         """
         Fetch the IncomingPhoneNumberInstance
@@ -942,6 +1361,15 @@ class IncomingPhoneNumberInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the IncomingPhoneNumberInstance
+
+        :returns: The fetched IncomingPhoneNumberInstance
+        :rtype: twilio.rest.api.v2010.account.incoming_phone_number.IncomingPhoneNumberInstance
+        """
+        return await self._proxy.fetch_async()
+
     def delete(self):
         """
         Deletes the IncomingPhoneNumberInstance
@@ -951,6 +1379,15 @@ class IncomingPhoneNumberInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the IncomingPhoneNumberInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     @property
     def assigned_add_ons(self):
         """
@@ -970,3 +1407,22 @@ class IncomingPhoneNumberInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Api.V2010.IncomingPhoneNumberInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'AssignedAddOnList': 'twilio.rest.api.v2010.account.incoming_phone_number.assigned_add_on',
+    'LocalList': 'twilio.rest.api.v2010.account.incoming_phone_number.local',
+    'MobileList': 'twilio.rest.api.v2010.account.incoming_phone_number.mobile',
+    'TollFreeList': 'twilio.rest.api.v2010.account.incoming_phone_number.toll_free',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -29,11 +29,11 @@ class LocalList(ListResource):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, }
-        self._uri = '/Accounts/{account_sid}/IncomingPhoneNumbers/Local.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/IncomingPhoneNumbers/Local.json', self._solution)
 
     def stream(self, beta=values.unset, friendly_name=values.unset,
                phone_number=values.unset, origin=values.unset, limit=None,
-               page_size=None):
+               page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams LocalInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -50,25 +50,76 @@ class LocalList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.incoming_phone_number.local.LocalInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
-            beta=beta,
-            friendly_name=friendly_name,
-            phone_number=phone_number,
-            origin=origin,
-            page_size=limits['page_size'],
-        )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                beta=beta,
+                friendly_name=friendly_name,
+                phone_number=phone_number,
+                origin=origin,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, beta=values.unset, friendly_name=values.unset,
+                           phone_number=values.unset, origin=values.unset, limit=None,
+                           page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams LocalInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param bool beta: Whether to include new phone numbers
+        :param unicode friendly_name: A string that identifies the resources to read
+        :param unicode phone_number: The phone numbers of the resources to read
+        :param unicode origin: Include phone numbers based on their origin. By default, phone numbers of all origin are included.
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.incoming_phone_number.local.LocalInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
 
-        return self._version.stream(page, limits['limit'])
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                beta=beta,
+                friendly_name=friendly_name,
+                phone_number=phone_number,
+                origin=origin,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, beta=values.unset, friendly_name=values.unset,
              phone_number=values.unset, origin=values.unset, limit=None,
-             page_size=None):
+             page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists LocalInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -84,6 +135,12 @@ class LocalList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.incoming_phone_number.local.LocalInstance]
@@ -95,8 +152,51 @@ class LocalList(ListResource):
             origin=origin,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, beta=values.unset, friendly_name=values.unset,
+                         phone_number=values.unset, origin=values.unset, limit=None,
+                         page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists LocalInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param bool beta: Whether to include new phone numbers
+        :param unicode friendly_name: A string that identifies the resources to read
+        :param unicode phone_number: The phone numbers of the resources to read
+        :param unicode origin: Include phone numbers based on their origin. By default, phone numbers of all origin are included.
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.incoming_phone_number.local.LocalInstance]
+        """
+        return [record async for record in await self.stream_async(
+            beta=beta,
+            friendly_name=friendly_name,
+            phone_number=phone_number,
+            origin=origin,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, beta=values.unset, friendly_name=values.unset,
              phone_number=values.unset, origin=values.unset,
              page_token=values.unset, page_number=values.unset,
@@ -130,6 +230,39 @@ class LocalList(ListResource):
 
         return LocalPage(self._version, response, self._solution)
 
+    async def page_async(self, beta=values.unset, friendly_name=values.unset,
+                         phone_number=values.unset, origin=values.unset,
+                         page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of LocalInstance records from the API.
+        Request is executed immediately
+
+        :param bool beta: Whether to include new phone numbers
+        :param unicode friendly_name: A string that identifies the resources to read
+        :param unicode phone_number: The phone numbers of the resources to read
+        :param unicode origin: Include phone numbers based on their origin. By default, phone numbers of all origin are included.
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of LocalInstance
+        :rtype: twilio.rest.api.v2010.account.incoming_phone_number.local.LocalPage
+        """
+        data = values.of({
+            'Beta': beta,
+            'FriendlyName': friendly_name,
+            'PhoneNumber': phone_number,
+            'Origin': origin,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return LocalPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of LocalInstance records from the API.
@@ -147,6 +280,23 @@ class LocalList(ListResource):
 
         return LocalPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of LocalInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of LocalInstance
+        :rtype: twilio.rest.api.v2010.account.incoming_phone_number.local.LocalPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return LocalPage(self._version, response, self._solution)
+
     def create(self, phone_number, api_version=values.unset,
                friendly_name=values.unset, sms_application_sid=values.unset,
                sms_fallback_method=values.unset, sms_fallback_url=values.unset,
@@ -159,7 +309,7 @@ class LocalList(ListResource):
                identity_sid=values.unset, address_sid=values.unset,
                emergency_status=values.unset, emergency_address_sid=values.unset,
                trunk_sid=values.unset, voice_receive_mode=values.unset,
-               bundle_sid=values.unset):
+               bundle_sid=values.unset, deadline=None):
         """
         Create the LocalInstance
 
@@ -186,6 +336,83 @@ class LocalList(ListResource):
         :param unicode trunk_sid: SID of the trunk to handle calls to the new phone number
         :param LocalInstance.VoiceReceiveMode voice_receive_mode: Incoming call type: fax or voice
         :param unicode bundle_sid: The SID of the Bundle resource associated with number
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created LocalInstance
+        :rtype: twilio.rest.api.v2010.account.incoming_phone_number.local.LocalInstance
+        """
+        data = values.of({
+            'PhoneNumber': phone_number,
+            'ApiVersion': api_version,
+            'FriendlyName': friendly_name,
+            'SmsApplicationSid': sms_application_sid,
+            'SmsFallbackMethod': sms_fallback_method,
+            'SmsFallbackUrl': sms_fallback_url,
+            'SmsMethod': sms_method,
+            'SmsUrl': sms_url,
+            'StatusCallback': status_callback,
+            'StatusCallbackMethod': status_callback_method,
+            'VoiceApplicationSid': voice_application_sid,
+            'VoiceCallerIdLookup': voice_caller_id_lookup,
+            'VoiceFallbackMethod': voice_fallback_method,
+            'VoiceFallbackUrl': voice_fallback_url,
+            'VoiceMethod': voice_method,
+            'VoiceUrl': voice_url,
+            'IdentitySid': identity_sid,
+            'AddressSid': address_sid,
+            'EmergencyStatus': emergency_status,
+            'EmergencyAddressSid': emergency_address_sid,
+            'TrunkSid': trunk_sid,
+            'VoiceReceiveMode': voice_receive_mode,
+            'BundleSid': bundle_sid,
+        })
+
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return LocalInstance(self._version, payload, account_sid=self._solution['account_sid'], )
+
+    async def create_async(self, phone_number, api_version=values.unset,
+                           friendly_name=values.unset, sms_application_sid=values.unset,
+                           sms_fallback_method=values.unset, sms_fallback_url=values.unset,
+                           sms_method=values.unset, sms_url=values.unset,
+                           status_callback=values.unset, status_callback_method=values.unset,
+                           voice_application_sid=values.unset,
+                           voice_caller_id_lookup=values.unset,
+                           voice_fallback_method=values.unset, voice_fallback_url=values.unset,
+                           voice_method=values.unset, voice_url=values.unset,
+                           identity_sid=values.unset, address_sid=values.unset,
+                           emergency_status=values.unset, emergency_address_sid=values.unset,
+                           trunk_sid=values.unset, voice_receive_mode=values.unset,
+                           bundle_sid=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the LocalInstance
+
+        :param unicode phone_number: The phone number to purchase in E.164 format
+        :param unicode api_version: The API version to use for incoming calls made to the new phone number
+        :param unicode friendly_name: A string to describe the new phone number
+        :param unicode sms_application_sid: The SID of the application to handle SMS messages
+        :param unicode sms_fallback_method: The HTTP method we use to call status_callback
+        :param unicode sms_fallback_url: The URL we call when an error occurs while executing TwiML
+        :param unicode sms_method: The HTTP method to use with sms url
+        :param unicode sms_url: The URL we should call when the new phone number receives an incoming SMS message
+        :param unicode status_callback: The URL we should call to send status information to your application
+        :param unicode status_callback_method: HTTP method we should use to call status_callback
+        :param unicode voice_application_sid: The SID of the application to handle the new phone number
+        :param bool voice_caller_id_lookup: Whether to lookup the caller's name
+        :param unicode voice_fallback_method: The HTTP method used with voice_fallback_url
+        :param unicode voice_fallback_url: The URL we will call when an error occurs in TwiML
+        :param unicode voice_method: The HTTP method used with the voice_url
+        :param unicode voice_url: The URL we should call when the phone number receives a call
+        :param unicode identity_sid: The SID of the Identity resource to associate with the new phone number
+        :param unicode address_sid: The SID of the Address resource associated with the phone number
+        :param LocalInstance.EmergencyStatus emergency_status: Displays if emergency calling is enabled for this number.
+        :param unicode emergency_address_sid: The emergency address configuration to use for emergency calling
+        :param unicode trunk_sid: SID of the trunk to handle calls to the new phone number
+        :param LocalInstance.VoiceReceiveMode voice_receive_mode: Incoming call type: fax or voice
+        :param unicode bundle_sid: The SID of the Bundle resource associated with number
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created LocalInstance
         :rtype: twilio.rest.api.v2010.account.incoming_phone_number.local.LocalInstance
@@ -216,7 +443,7 @@ class LocalList(ListResource):
             'BundleSid': bundle_sid,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return LocalInstance(self._version, payload, account_sid=self._solution['account_sid'], )
 
@@ -293,6 +520,52 @@ class LocalInstance(InstanceResource):
         VOICE = "voice"
         FAX = "fax"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.rfc2822_datetime,
+        'date_updated': deserialize.rfc2822_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'address_sid': 'address_sid',
+        'address_requirements': 'address_requirements',
+        'api_version': 'api_version',
+        'beta': 'beta',
+        'capabilities': 'capabilities',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'friendly_name': 'friendly_name',
+        'identity_sid': 'identity_sid',
+        'phone_number': 'phone_number',
+        'origin': 'origin',
+        'sid': 'sid',
+        'sms_application_sid': 'sms_application_sid',
+        'sms_fallback_method': 'sms_fallback_method',
+        'sms_fallback_url': 'sms_fallback_url',
+        'sms_method': 'sms_method',
+        'sms_url': 'sms_url',
+        'status_callback': 'status_callback',
+        'status_callback_method': 'status_callback_method',
+        'trunk_sid': 'trunk_sid',
+        'uri': 'uri',
+        'voice_receive_mode': 'voice_receive_mode',
+        'voice_application_sid': 'voice_application_sid',
+        'voice_caller_id_lookup': 'voice_caller_id_lookup',
+        'voice_fallback_method': 'voice_fallback_method',
+        'voice_fallback_url': 'voice_fallback_url',
+        'voice_method': 'voice_method',
+        'voice_url': 'voice_url',
+        'emergency_status': 'emergency_status',
+        'emergency_address_sid': 'emergency_address_sid',
+        'emergency_address_status': 'emergency_address_status',
+        'bundle_sid': 'bundle_sid',
+        'status': 'status',
+    }, _deserializers)
+
     def __init__(self, version, payload, account_sid):
         """
         Initialize the LocalInstance
@@ -303,42 +576,7 @@ class LocalInstance(InstanceResource):
         super(LocalInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'address_sid': payload.get('address_sid'),
-            'address_requirements': payload.get('address_requirements'),
-            'api_version': payload.get('api_version'),
-            'beta': payload.get('beta'),
-            'capabilities': payload.get('capabilities'),
-            'date_created': deserialize.rfc2822_datetime(payload.get('date_created')),
-            'date_updated': deserialize.rfc2822_datetime(payload.get('date_updated')),
-            'friendly_name': payload.get('friendly_name'),
-            'identity_sid': payload.get('identity_sid'),
-            'phone_number': payload.get('phone_number'),
-            'origin': payload.get('origin'),
-            'sid': payload.get('sid'),
-            'sms_application_sid': payload.get('sms_application_sid'),
-            'sms_fallback_method': payload.get('sms_fallback_method'),
-            'sms_fallback_url': payload.get('sms_fallback_url'),
-            'sms_method': payload.get('sms_method'),
-            'sms_url': payload.get('sms_url'),
-            'status_callback': payload.get('status_callback'),
-            'status_callback_method': payload.get('status_callback_method'),
-            'trunk_sid': payload.get('trunk_sid'),
-            'uri': payload.get('uri'),
-            'voice_receive_mode': payload.get('voice_receive_mode'),
-            'voice_application_sid': payload.get('voice_application_sid'),
-            'voice_caller_id_lookup': payload.get('voice_caller_id_lookup'),
-            'voice_fallback_method': payload.get('voice_fallback_method'),
-            'voice_fallback_url': payload.get('voice_fallback_url'),
-            'voice_method': payload.get('voice_method'),
-            'voice_url': payload.get('voice_url'),
-            'emergency_status': payload.get('emergency_status'),
-            'emergency_address_sid': payload.get('emergency_address_sid'),
-            'emergency_address_status': payload.get('emergency_address_status'),
-            'bundle_sid': payload.get('bundle_sid'),
-            'status': payload.get('status'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
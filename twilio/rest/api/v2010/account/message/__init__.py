@@ -6,6 +6,8 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import serialize
 from twilio.base import values
@@ -13,8 +15,6 @@ from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.api.v2010.account.message.feedback import FeedbackList
-from twilio.rest.api.v2010.account.message.media import MediaList
 
 
 class MessageList(ListResource):
@@ -33,7 +33,7 @@ class MessageList(ListResource):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, }
-        self._uri = '/Accounts/{account_sid}/Messages.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/Messages.json', self._solution)
 
     def create(self, to, status_callback=values.unset, application_sid=values.unset,
                max_price=values.unset, provide_feedback=values.unset,
@@ -43,7 +43,7 @@ class MessageList(ListResource):
                persistent_action=values.unset, schedule_type=values.unset,
                send_at=values.unset, send_as_mms=values.unset, from_=values.unset,
                messaging_service_sid=values.unset, body=values.unset,
-               media_url=values.unset):
+               media_url=values.unset, deadline=None):
         """
         Create the MessageInstance
 
@@ -66,6 +66,71 @@ class MessageList(ListResource):
         :param unicode messaging_service_sid: The SID of the Messaging Service you want to associate with the message.
         :param unicode body: The text of the message you want to send. Can be up to 1,600 characters in length.
         :param list[unicode] media_url: The URL of the media to send with the message
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created MessageInstance
+        :rtype: twilio.rest.api.v2010.account.message.MessageInstance
+        """
+        data = values.of({
+            'To': to,
+            'From': from_,
+            'MessagingServiceSid': messaging_service_sid,
+            'Body': body,
+            'MediaUrl': serialize.map(media_url, lambda e: e),
+            'StatusCallback': status_callback,
+            'ApplicationSid': application_sid,
+            'MaxPrice': max_price,
+            'ProvideFeedback': provide_feedback,
+            'Attempt': attempt,
+            'ValidityPeriod': validity_period,
+            'ForceDelivery': force_delivery,
+            'ContentRetention': content_retention,
+            'AddressRetention': address_retention,
+            'SmartEncoded': smart_encoded,
+            'PersistentAction': serialize.map(persistent_action, lambda e: e),
+            'ScheduleType': schedule_type,
+            'SendAt': serialize.iso8601_datetime(send_at),
+            'SendAsMms': send_as_mms,
+        })
+
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return MessageInstance(self._version, payload, account_sid=self._solution['account_sid'], )
+
+    async def create_async(self, to, status_callback=values.unset, application_sid=values.unset,
+                           max_price=values.unset, provide_feedback=values.unset,
+                           attempt=values.unset, validity_period=values.unset,
+                           force_delivery=values.unset, content_retention=values.unset,
+                           address_retention=values.unset, smart_encoded=values.unset,
+                           persistent_action=values.unset, schedule_type=values.unset,
+                           send_at=values.unset, send_as_mms=values.unset, from_=values.unset,
+                           messaging_service_sid=values.unset, body=values.unset,
+                           media_url=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the MessageInstance
+
+        :param unicode to: The destination phone number
+        :param unicode status_callback: The URL we should call to send status information to your application
+        :param unicode application_sid: The application to use for callbacks
+        :param unicode max_price: The total maximum price up to 4 decimal places in US dollars acceptable for the message to be delivered.
+        :param bool provide_feedback: Whether to confirm delivery of the message
+        :param unicode attempt: Total numer of attempts made , this inclusive to send out the message
+        :param unicode validity_period: The number of seconds that the message can remain in our outgoing queue.
+        :param bool force_delivery: Reserved
+        :param MessageInstance.ContentRetention content_retention: Determines if the message content can be stored or redacted based on privacy settings
+        :param MessageInstance.AddressRetention address_retention: Determines if the address can be stored or obfuscated based on privacy settings
+        :param bool smart_encoded: Whether to detect Unicode characters that have a similar GSM-7 character and replace them
+        :param list[unicode] persistent_action: Rich actions for Channels Messages.
+        :param MessageInstance.ScheduleType schedule_type: Pass the value `fixed` to schedule a message at a fixed time.
+        :param datetime send_at: The time that Twilio will send the message. Must be in ISO 8601 format.
+        :param bool send_as_mms: If set to True, Twilio will deliver the message as a single MMS message, regardless of the presence of media
+        :param unicode from_: The phone number that initiated the message
+        :param unicode messaging_service_sid: The SID of the Messaging Service you want to associate with the message.
+        :param unicode body: The text of the message you want to send. Can be up to 1,600 characters in length.
+        :param list[unicode] media_url: The URL of the media to send with the message
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created MessageInstance
         :rtype: twilio.rest.api.v2010.account.message.MessageInstance
@@ -92,13 +157,14 @@ class MessageList(ListResource):
             'SendAsMms': send_as_mms,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return MessageInstance(self._version, payload, account_sid=self._solution['account_sid'], )
 
     def stream(self, to=values.unset, from_=values.unset,
                date_sent_before=values.unset, date_sent=values.unset,
-               date_sent_after=values.unset, limit=None, page_size=None):
+               date_sent_after=values.unset, limit=None, page_size=None,
+               prefetch=None, raw=False, deadline=None):
         """
         Streams MessageInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -116,26 +182,81 @@ class MessageList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.message.MessageInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
-            to=to,
-            from_=from_,
-            date_sent_before=date_sent_before,
-            date_sent=date_sent,
-            date_sent_after=date_sent_after,
-            page_size=limits['page_size'],
-        )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                to=to,
+                from_=from_,
+                date_sent_before=date_sent_before,
+                date_sent=date_sent,
+                date_sent_after=date_sent_after,
+                page_size=limits['page_size'],
+            )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, to=values.unset, from_=values.unset,
+                           date_sent_before=values.unset, date_sent=values.unset,
+                           date_sent_after=values.unset, limit=None, page_size=None,
+                           prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams MessageInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param unicode to: Filter by messages sent to this number
+        :param unicode from_: Filter by from number
+        :param datetime date_sent_before: Filter by date sent
+        :param datetime date_sent: Filter by date sent
+        :param datetime date_sent_after: Filter by date sent
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.message.MessageInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                to=to,
+                from_=from_,
+                date_sent_before=date_sent_before,
+                date_sent=date_sent,
+                date_sent_after=date_sent_after,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, to=values.unset, from_=values.unset,
              date_sent_before=values.unset, date_sent=values.unset,
-             date_sent_after=values.unset, limit=None, page_size=None):
+             date_sent_after=values.unset, limit=None, page_size=None,
+             prefetch=None, raw=False, deadline=None):
         """
         Lists MessageInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -152,6 +273,12 @@ class MessageList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.message.MessageInstance]
@@ -164,8 +291,54 @@ class MessageList(ListResource):
             date_sent_after=date_sent_after,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, to=values.unset, from_=values.unset,
+                         date_sent_before=values.unset, date_sent=values.unset,
+                         date_sent_after=values.unset, limit=None, page_size=None,
+                         prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists MessageInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param unicode to: Filter by messages sent to this number
+        :param unicode from_: Filter by from number
+        :param datetime date_sent_before: Filter by date sent
+        :param datetime date_sent: Filter by date sent
+        :param datetime date_sent_after: Filter by date sent
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.message.MessageInstance]
+        """
+        return [record async for record in await self.stream_async(
+            to=to,
+            from_=from_,
+            date_sent_before=date_sent_before,
+            date_sent=date_sent,
+            date_sent_after=date_sent_after,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, to=values.unset, from_=values.unset,
              date_sent_before=values.unset, date_sent=values.unset,
              date_sent_after=values.unset, page_token=values.unset,
@@ -201,6 +374,41 @@ class MessageList(ListResource):
 
         return MessagePage(self._version, response, self._solution)
 
+    async def page_async(self, to=values.unset, from_=values.unset,
+                         date_sent_before=values.unset, date_sent=values.unset,
+                         date_sent_after=values.unset, page_token=values.unset,
+                         page_number=values.unset, page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of MessageInstance records from the API.
+        Request is executed immediately
+
+        :param unicode to: Filter by messages sent to this number
+        :param unicode from_: Filter by from number
+        :param datetime date_sent_before: Filter by date sent
+        :param datetime date_sent: Filter by date sent
+        :param datetime date_sent_after: Filter by date sent
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of MessageInstance
+        :rtype: twilio.rest.api.v2010.account.message.MessagePage
+        """
+        data = values.of({
+            'To': to,
+            'From': from_,
+            'DateSent<': serialize.iso8601_datetime(date_sent_before),
+            'DateSent': serialize.iso8601_datetime(date_sent),
+            'DateSent>': serialize.iso8601_datetime(date_sent_after),
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return MessagePage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of MessageInstance records from the API.
@@ -218,6 +426,23 @@ class MessageList(ListResource):
 
         return MessagePage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of MessageInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of MessageInstance
+        :rtype: twilio.rest.api.v2010.account.message.MessagePage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return MessagePage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a MessageContext
@@ -306,7 +531,7 @@ class MessageContext(InstanceContext):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, 'sid': sid, }
-        self._uri = '/Accounts/{account_sid}/Messages/{sid}.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/Messages/{sid}.json', self._solution)
 
         # Dependents
         self._media = None
@@ -321,6 +546,15 @@ class MessageContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the MessageInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def fetch(self):
         """
         Fetch the MessageInstance
@@ -337,6 +571,22 @@ class MessageContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the MessageInstance
+
+        :returns: The fetched MessageInstance
+        :rtype: twilio.rest.api.v2010.account.message.MessageInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return MessageInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            sid=self._solution['sid'],
+        )
+
     def update(self, body=values.unset, status=values.unset):
         """
         Update the MessageInstance
@@ -358,6 +608,27 @@ class MessageContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, body=values.unset, status=values.unset):
+        """
+        Asynchronous coroutine that updates the MessageInstance
+
+        :param unicode body: The text of the message you want to send
+        :param MessageInstance.UpdateStatus status: Set as `canceled` to cancel a message from being sent.
+
+        :returns: The updated MessageInstance
+        :rtype: twilio.rest.api.v2010.account.message.MessageInstance
+        """
+        data = values.of({'Body': body, 'Status': status, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return MessageInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            sid=self._solution['sid'],
+        )
+
     @property
     def media(self):
         """
@@ -367,6 +638,7 @@ class MessageContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.message.media.MediaList
         """
         if self._media is None:
+            from twilio.rest.api.v2010.account.message.media import MediaList
             self._media = MediaList(
                 self._version,
                 account_sid=self._solution['account_sid'],
@@ -383,6 +655,7 @@ class MessageContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.message.feedback.FeedbackList
         """
         if self._feedback is None:
+            from twilio.rest.api.v2010.account.message.feedback import FeedbackList
             self._feedback = FeedbackList(
                 self._version,
                 account_sid=self._solution['account_sid'],
@@ -439,6 +712,40 @@ class MessageInstance(InstanceResource):
     class ScheduleType(object):
         FIXED = "fixed"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_updated': deserialize.rfc2822_datetime,
+        'date_sent': deserialize.rfc2822_datetime,
+        'date_created': deserialize.rfc2822_datetime,
+        'error_code': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'body': 'body',
+        'num_segments': 'num_segments',
+        'direction': 'direction',
+        'from_': 'from',
+        'to': 'to',
+        'date_updated': 'date_updated',
+        'price': 'price',
+        'error_message': 'error_message',
+        'uri': 'uri',
+        'account_sid': 'account_sid',
+        'num_media': 'num_media',
+        'status': 'status',
+        'messaging_service_sid': 'messaging_service_sid',
+        'sid': 'sid',
+        'date_sent': 'date_sent',
+        'date_created': 'date_created',
+        'error_code': 'error_code',
+        'price_unit': 'price_unit',
+        'api_version': 'api_version',
+        'subresource_uris': 'subresource_uris',
+    }, _deserializers)
+
     def __init__(self, version, payload, account_sid, sid=None):
         """
         Initialize the MessageInstance
@@ -449,28 +756,7 @@ class MessageInstance(InstanceResource):
         super(MessageInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'body': payload.get('body'),
-            'num_segments': payload.get('num_segments'),
-            'direction': payload.get('direction'),
-            'from_': payload.get('from'),
-            'to': payload.get('to'),
-            'date_updated': deserialize.rfc2822_datetime(payload.get('date_updated')),
-            'price': payload.get('price'),
-            'error_message': payload.get('error_message'),
-            'uri': payload.get('uri'),
-            'account_sid': payload.get('account_sid'),
-            'num_media': payload.get('num_media'),
-            'status': payload.get('status'),
-            'messaging_service_sid': payload.get('messaging_service_sid'),
-            'sid': payload.get('sid'),
-            'date_sent': deserialize.rfc2822_datetime(payload.get('date_sent')),
-            'date_created': deserialize.rfc2822_datetime(payload.get('date_created')),
-            'error_code': deserialize.integer(payload.get('error_code')),
-            'price_unit': payload.get('price_unit'),
-            'api_version': payload.get('api_version'),
-            'subresource_uris': payload.get('subresource_uris'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -662,6 +948,15 @@ class MessageInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the MessageInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def fetch(self):
         """
         Fetch the MessageInstance
@@ -671,6 +966,15 @@ class MessageInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the MessageInstance
+
+        :returns: The fetched MessageInstance
+        :rtype: twilio.rest.api.v2010.account.message.MessageInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, body=values.unset, status=values.unset):
         """
         Update the MessageInstance
@@ -683,6 +987,18 @@ class MessageInstance(InstanceResource):
         """
         return self._proxy.update(body=body, status=status, )
 
+    async def update_async(self, body=values.unset, status=values.unset):
+        """
+        Asynchronous coroutine that updates the MessageInstance
+
+        :param unicode body: The text of the message you want to send
+        :param MessageInstance.UpdateStatus status: Set as `canceled` to cancel a message from being sent.
+
+        :returns: The updated MessageInstance
+        :rtype: twilio.rest.api.v2010.account.message.MessageInstance
+        """
+        return await self._proxy.update_async(body=body, status=status, )
+
     @property
     def media(self):
         """
@@ -712,3 +1028,20 @@ class MessageInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Api.V2010.MessageInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'FeedbackList': 'twilio.rest.api.v2010.account.message.feedback',
+    'MediaList': 'twilio.rest.api.v2010.account.message.media',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -30,20 +30,44 @@ class FeedbackList(ListResource):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, 'message_sid': message_sid, }
-        self._uri = '/Accounts/{account_sid}/Messages/{message_sid}/Feedback.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/Messages/{message_sid}/Feedback.json', self._solution)
 
-    def create(self, outcome=values.unset):
+    def create(self, outcome=values.unset, deadline=None):
         """
         Create the FeedbackInstance
 
         :param FeedbackInstance.Outcome outcome: Whether the feedback has arrived
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created FeedbackInstance
         :rtype: twilio.rest.api.v2010.account.message.feedback.FeedbackInstance
         """
         data = values.of({'Outcome': outcome, })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return FeedbackInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            message_sid=self._solution['message_sid'],
+        )
+
+    async def create_async(self, outcome=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the FeedbackInstance
+
+        :param FeedbackInstance.Outcome outcome: Whether the feedback has arrived
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created FeedbackInstance
+        :rtype: twilio.rest.api.v2010.account.message.feedback.FeedbackInstance
+        """
+        data = values.of({'Outcome': outcome, })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return FeedbackInstance(
             self._version,
@@ -113,6 +137,24 @@ class FeedbackInstance(InstanceResource):
         CONFIRMED = "confirmed"
         UNCONFIRMED = "unconfirmed"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.rfc2822_datetime,
+        'date_updated': deserialize.rfc2822_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'message_sid': 'message_sid',
+        'outcome': 'outcome',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'uri': 'uri',
+    }, _deserializers)
+
     def __init__(self, version, payload, account_sid, message_sid):
         """
         Initialize the FeedbackInstance
@@ -123,14 +165,7 @@ class FeedbackInstance(InstanceResource):
         super(FeedbackInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'message_sid': payload.get('message_sid'),
-            'outcome': payload.get('outcome'),
-            'date_created': deserialize.rfc2822_datetime(payload.get('date_created')),
-            'date_updated': deserialize.rfc2822_datetime(payload.get('date_updated')),
-            'uri': payload.get('uri'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -32,10 +32,11 @@ class MediaList(ListResource):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, 'message_sid': message_sid, }
-        self._uri = '/Accounts/{account_sid}/Messages/{message_sid}/Media.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/Messages/{message_sid}/Media.json', self._solution)
 
     def stream(self, date_created_before=values.unset, date_created=values.unset,
-               date_created_after=values.unset, limit=None, page_size=None):
+               date_created_after=values.unset, limit=None, page_size=None,
+               prefetch=None, raw=False, deadline=None):
         """
         Streams MediaInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -51,23 +52,73 @@ class MediaList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.message.media.MediaInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
-            date_created_before=date_created_before,
-            date_created=date_created,
-            date_created_after=date_created_after,
-            page_size=limits['page_size'],
-        )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                date_created_before=date_created_before,
+                date_created=date_created,
+                date_created_after=date_created_after,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-        return self._version.stream(page, limits['limit'])
+    async def stream_async(self, date_created_before=values.unset, date_created=values.unset,
+                           date_created_after=values.unset, limit=None, page_size=None,
+                           prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams MediaInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param datetime date_created_before: Only include media that was created on this date
+        :param datetime date_created: Only include media that was created on this date
+        :param datetime date_created_after: Only include media that was created on this date
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.message.media.MediaInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                date_created_before=date_created_before,
+                date_created=date_created,
+                date_created_after=date_created_after,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, date_created_before=values.unset, date_created=values.unset,
-             date_created_after=values.unset, limit=None, page_size=None):
+             date_created_after=values.unset, limit=None, page_size=None,
+             prefetch=None, raw=False, deadline=None):
         """
         Lists MediaInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -82,6 +133,12 @@ class MediaList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.message.media.MediaInstance]
@@ -92,8 +149,49 @@ class MediaList(ListResource):
             date_created_after=date_created_after,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, date_created_before=values.unset, date_created=values.unset,
+                         date_created_after=values.unset, limit=None, page_size=None,
+                         prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists MediaInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param datetime date_created_before: Only include media that was created on this date
+        :param datetime date_created: Only include media that was created on this date
+        :param datetime date_created_after: Only include media that was created on this date
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.message.media.MediaInstance]
+        """
+        return [record async for record in await self.stream_async(
+            date_created_before=date_created_before,
+            date_created=date_created,
+            date_created_after=date_created_after,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, date_created_before=values.unset, date_created=values.unset,
              date_created_after=values.unset, page_token=values.unset,
              page_number=values.unset, page_size=values.unset):
@@ -124,6 +222,36 @@ class MediaList(ListResource):
 
         return MediaPage(self._version, response, self._solution)
 
+    async def page_async(self, date_created_before=values.unset, date_created=values.unset,
+                         date_created_after=values.unset, page_token=values.unset,
+                         page_number=values.unset, page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of MediaInstance records from the API.
+        Request is executed immediately
+
+        :param datetime date_created_before: Only include media that was created on this date
+        :param datetime date_created: Only include media that was created on this date
+        :param datetime date_created_after: Only include media that was created on this date
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of MediaInstance
+        :rtype: twilio.rest.api.v2010.account.message.media.MediaPage
+        """
+        data = values.of({
+            'DateCreated<': serialize.iso8601_datetime(date_created_before),
+            'DateCreated': serialize.iso8601_datetime(date_created),
+            'DateCreated>': serialize.iso8601_datetime(date_created_after),
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return MediaPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of MediaInstance records from the API.
@@ -141,6 +269,23 @@ class MediaList(ListResource):
 
         return MediaPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of MediaInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of MediaInstance
+        :rtype: twilio.rest.api.v2010.account.message.media.MediaPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return MediaPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a MediaContext
@@ -246,7 +391,7 @@ class MediaContext(InstanceContext):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, 'message_sid': message_sid, 'sid': sid, }
-        self._uri = '/Accounts/{account_sid}/Messages/{message_sid}/Media/{sid}.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/Messages/{message_sid}/Media/{sid}.json', self._solution)
 
     def delete(self):
         """
@@ -257,6 +402,15 @@ class MediaContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the MediaInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def fetch(self):
         """
         Fetch the MediaInstance
@@ -274,6 +428,23 @@ class MediaContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the MediaInstance
+
+        :returns: The fetched MediaInstance
+        :rtype: twilio.rest.api.v2010.account.message.media.MediaInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return MediaInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            message_sid=self._solution['message_sid'],
+            sid=self._solution['sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -287,6 +458,25 @@ class MediaContext(InstanceContext):
 
 class MediaInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.rfc2822_datetime,
+        'date_updated': deserialize.rfc2822_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'content_type': 'content_type',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'parent_sid': 'parent_sid',
+        'sid': 'sid',
+        'uri': 'uri',
+    }, _deserializers)
+
     def __init__(self, version, payload, account_sid, message_sid, sid=None):
         """
         Initialize the MediaInstance
@@ -297,15 +487,7 @@ class MediaInstance(InstanceResource):
         super(MediaInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'content_type': payload.get('content_type'),
-            'date_created': deserialize.rfc2822_datetime(payload.get('date_created')),
-            'date_updated': deserialize.rfc2822_datetime(payload.get('date_updated')),
-            'parent_sid': payload.get('parent_sid'),
-            'sid': payload.get('sid'),
-            'uri': payload.get('uri'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -398,6 +580,15 @@ class MediaInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the MediaInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def fetch(self):
         """
         Fetch the MediaInstance
@@ -407,6 +598,15 @@ class MediaInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the MediaInstance
+
+        :returns: The fetched MediaInstance
+        :rtype: twilio.rest.api.v2010.account.message.media.MediaInstance
+        """
+        return await self._proxy.fetch_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
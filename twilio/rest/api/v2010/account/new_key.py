@@ -29,20 +29,39 @@ class NewKeyList(ListResource):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, }
-        self._uri = '/Accounts/{account_sid}/Keys.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/Keys.json', self._solution)
 
-    def create(self, friendly_name=values.unset):
+    def create(self, friendly_name=values.unset, deadline=None):
         """
         Create the NewKeyInstance
 
         :param unicode friendly_name: A string to describe the resource
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created NewKeyInstance
         :rtype: twilio.rest.api.v2010.account.new_key.NewKeyInstance
         """
         data = values.of({'FriendlyName': friendly_name, })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return NewKeyInstance(self._version, payload, account_sid=self._solution['account_sid'], )
+
+    async def create_async(self, friendly_name=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the NewKeyInstance
+
+        :param unicode friendly_name: A string to describe the resource
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created NewKeyInstance
+        :rtype: twilio.rest.api.v2010.account.new_key.NewKeyInstance
+        """
+        data = values.of({'FriendlyName': friendly_name, })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return NewKeyInstance(self._version, payload, account_sid=self._solution['account_sid'], )
 
@@ -97,6 +116,23 @@ class NewKeyPage(Page):
 
 class NewKeyInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.rfc2822_datetime,
+        'date_updated': deserialize.rfc2822_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'friendly_name': 'friendly_name',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'secret': 'secret',
+    }, _deserializers)
+
     def __init__(self, version, payload, account_sid):
         """
         Initialize the NewKeyInstance
@@ -107,13 +143,7 @@ class NewKeyInstance(InstanceResource):
         super(NewKeyInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'friendly_name': payload.get('friendly_name'),
-            'date_created': deserialize.rfc2822_datetime(payload.get('date_created')),
-            'date_updated': deserialize.rfc2822_datetime(payload.get('date_updated')),
-            'secret': payload.get('secret'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
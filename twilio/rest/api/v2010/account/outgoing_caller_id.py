@@ -30,10 +30,10 @@ class OutgoingCallerIdList(ListResource):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, }
-        self._uri = '/Accounts/{account_sid}/OutgoingCallerIds.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/OutgoingCallerIds.json', self._solution)
 
     def stream(self, phone_number=values.unset, friendly_name=values.unset,
-               limit=None, page_size=None):
+               limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams OutgoingCallerIdInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -48,22 +48,69 @@ class OutgoingCallerIdList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.outgoing_caller_id.OutgoingCallerIdInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
-            phone_number=phone_number,
-            friendly_name=friendly_name,
-            page_size=limits['page_size'],
-        )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                phone_number=phone_number,
+                friendly_name=friendly_name,
+                page_size=limits['page_size'],
+            )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, phone_number=values.unset, friendly_name=values.unset,
+                           limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams OutgoingCallerIdInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param unicode phone_number: The phone number of the OutgoingCallerId resources to read
+        :param unicode friendly_name: The string that identifies the OutgoingCallerId resources to read
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.outgoing_caller_id.OutgoingCallerIdInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                phone_number=phone_number,
+                friendly_name=friendly_name,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, phone_number=values.unset, friendly_name=values.unset,
-             limit=None, page_size=None):
+             limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists OutgoingCallerIdInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -77,6 +124,12 @@ class OutgoingCallerIdList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.outgoing_caller_id.OutgoingCallerIdInstance]
@@ -86,8 +139,46 @@ class OutgoingCallerIdList(ListResource):
             friendly_name=friendly_name,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, phone_number=values.unset, friendly_name=values.unset,
+                         limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists OutgoingCallerIdInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param unicode phone_number: The phone number of the OutgoingCallerId resources to read
+        :param unicode friendly_name: The string that identifies the OutgoingCallerId resources to read
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.outgoing_caller_id.OutgoingCallerIdInstance]
+        """
+        return [record async for record in await self.stream_async(
+            phone_number=phone_number,
+            friendly_name=friendly_name,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, phone_number=values.unset, friendly_name=values.unset,
              page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -116,6 +207,34 @@ class OutgoingCallerIdList(ListResource):
 
         return OutgoingCallerIdPage(self._version, response, self._solution)
 
+    async def page_async(self, phone_number=values.unset, friendly_name=values.unset,
+                         page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of OutgoingCallerIdInstance records from the API.
+        Request is executed immediately
+
+        :param unicode phone_number: The phone number of the OutgoingCallerId resources to read
+        :param unicode friendly_name: The string that identifies the OutgoingCallerId resources to read
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of OutgoingCallerIdInstance
+        :rtype: twilio.rest.api.v2010.account.outgoing_caller_id.OutgoingCallerIdPage
+        """
+        data = values.of({
+            'PhoneNumber': phone_number,
+            'FriendlyName': friendly_name,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return OutgoingCallerIdPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of OutgoingCallerIdInstance records from the API.
@@ -133,6 +252,23 @@ class OutgoingCallerIdList(ListResource):
 
         return OutgoingCallerIdPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of OutgoingCallerIdInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of OutgoingCallerIdInstance
+        :rtype: twilio.rest.api.v2010.account.outgoing_caller_id.OutgoingCallerIdPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return OutgoingCallerIdPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a OutgoingCallerIdContext
@@ -221,7 +357,7 @@ class OutgoingCallerIdContext(InstanceContext):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, 'sid': sid, }
-        self._uri = '/Accounts/{account_sid}/OutgoingCallerIds/{sid}.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/OutgoingCallerIds/{sid}.json', self._solution)
 
     def fetch(self):
         """
@@ -239,6 +375,22 @@ class OutgoingCallerIdContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the OutgoingCallerIdInstance
+
+        :returns: The fetched OutgoingCallerIdInstance
+        :rtype: twilio.rest.api.v2010.account.outgoing_caller_id.OutgoingCallerIdInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return OutgoingCallerIdInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            sid=self._solution['sid'],
+        )
+
     def update(self, friendly_name=values.unset):
         """
         Update the OutgoingCallerIdInstance
@@ -259,6 +411,26 @@ class OutgoingCallerIdContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, friendly_name=values.unset):
+        """
+        Asynchronous coroutine that updates the OutgoingCallerIdInstance
+
+        :param unicode friendly_name: A string to describe the resource
+
+        :returns: The updated OutgoingCallerIdInstance
+        :rtype: twilio.rest.api.v2010.account.outgoing_caller_id.OutgoingCallerIdInstance
+        """
+        data = values.of({'FriendlyName': friendly_name, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return OutgoingCallerIdInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self):
         """
         Deletes the OutgoingCallerIdInstance
@@ -268,6 +440,15 @@ class OutgoingCallerIdContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the OutgoingCallerIdInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -281,6 +462,25 @@ class OutgoingCallerIdContext(InstanceContext):
 
 class OutgoingCallerIdInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.rfc2822_datetime,
+        'date_updated': deserialize.rfc2822_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'friendly_name': 'friendly_name',
+        'account_sid': 'account_sid',
+        'phone_number': 'phone_number',
+        'uri': 'uri',
+    }, _deserializers)
+
     def __init__(self, version, payload, account_sid, sid=None):
         """
         Initialize the OutgoingCallerIdInstance
@@ -291,15 +491,7 @@ class OutgoingCallerIdInstance(InstanceResource):
         super(OutgoingCallerIdInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'date_created': deserialize.rfc2822_datetime(payload.get('date_created')),
-            'date_updated': deserialize.rfc2822_datetime(payload.get('date_updated')),
-            'friendly_name': payload.get('friendly_name'),
-            'account_sid': payload.get('account_sid'),
-            'phone_number': payload.get('phone_number'),
-            'uri': payload.get('uri'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -387,6 +579,15 @@ class OutgoingCallerIdInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the OutgoingCallerIdInstance
+
+        :returns: The fetched OutgoingCallerIdInstance
+        :rtype: twilio.rest.api.v2010.account.outgoing_caller_id.OutgoingCallerIdInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, friendly_name=values.unset):
         """
         Update the OutgoingCallerIdInstance
@@ -398,6 +599,17 @@ class OutgoingCallerIdInstance(InstanceResource):
         """
         return self._proxy.update(friendly_name=friendly_name, )
 
+    async def update_async(self, friendly_name=values.unset):
+        """
+        Asynchronous coroutine that updates the OutgoingCallerIdInstance
+
+        :param unicode friendly_name: A string to describe the resource
+
+        :returns: The updated OutgoingCallerIdInstance
+        :rtype: twilio.rest.api.v2010.account.outgoing_caller_id.OutgoingCallerIdInstance
+        """
+        return await self._proxy.update_async(friendly_name=friendly_name, )
+
     def delete(self):
         """
         Deletes the OutgoingCallerIdInstance
@@ -407,6 +619,15 @@ class OutgoingCallerIdInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the OutgoingCallerIdInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
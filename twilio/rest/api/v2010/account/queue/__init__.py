@@ -6,13 +6,14 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.api.v2010.account.queue.member import MemberList
 
 
 class QueueList(ListResource):
@@ -31,9 +32,9 @@ class QueueList(ListResource):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, }
-        self._uri = '/Accounts/{account_sid}/Queues.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/Queues.json', self._solution)
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams QueueInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -46,17 +47,57 @@ class QueueList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.queue.QueueInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams QueueInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.queue.QueueInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists QueueInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -68,11 +109,42 @@ class QueueList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.queue.QueueInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists QueueInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.queue.QueueInstance]
+        """
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -93,6 +165,25 @@ class QueueList(ListResource):
 
         return QueuePage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of QueueInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of QueueInstance
+        :rtype: twilio.rest.api.v2010.account.queue.QueuePage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return QueuePage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of QueueInstance records from the API.
@@ -110,19 +201,56 @@ class QueueList(ListResource):
 
         return QueuePage(self._version, response, self._solution)
 
-    def create(self, friendly_name, max_size=values.unset):
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of QueueInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of QueueInstance
+        :rtype: twilio.rest.api.v2010.account.queue.QueuePage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return QueuePage(self._version, response, self._solution)
+
+    def create(self, friendly_name, max_size=values.unset, deadline=None):
         """
         Create the QueueInstance
 
         :param unicode friendly_name: A string to describe this resource
         :param unicode max_size: The max number of calls allowed in the queue
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created QueueInstance
         :rtype: twilio.rest.api.v2010.account.queue.QueueInstance
         """
         data = values.of({'FriendlyName': friendly_name, 'MaxSize': max_size, })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return QueueInstance(self._version, payload, account_sid=self._solution['account_sid'], )
+
+    async def create_async(self, friendly_name, max_size=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the QueueInstance
+
+        :param unicode friendly_name: A string to describe this resource
+        :param unicode max_size: The max number of calls allowed in the queue
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created QueueInstance
+        :rtype: twilio.rest.api.v2010.account.queue.QueueInstance
+        """
+        data = values.of({'FriendlyName': friendly_name, 'MaxSize': max_size, })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return QueueInstance(self._version, payload, account_sid=self._solution['account_sid'], )
 
@@ -214,7 +342,7 @@ class QueueContext(InstanceContext):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, 'sid': sid, }
-        self._uri = '/Accounts/{account_sid}/Queues/{sid}.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/Queues/{sid}.json', self._solution)
 
         # Dependents
         self._members = None
@@ -235,6 +363,22 @@ class QueueContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the QueueInstance
+
+        :returns: The fetched QueueInstance
+        :rtype: twilio.rest.api.v2010.account.queue.QueueInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return QueueInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            sid=self._solution['sid'],
+        )
+
     def update(self, friendly_name=values.unset, max_size=values.unset):
         """
         Update the QueueInstance
@@ -256,6 +400,27 @@ class QueueContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, friendly_name=values.unset, max_size=values.unset):
+        """
+        Asynchronous coroutine that updates the QueueInstance
+
+        :param unicode friendly_name: A string to describe this resource
+        :param unicode max_size: The max number of calls allowed in the queue
+
+        :returns: The updated QueueInstance
+        :rtype: twilio.rest.api.v2010.account.queue.QueueInstance
+        """
+        data = values.of({'FriendlyName': friendly_name, 'MaxSize': max_size, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return QueueInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self):
         """
         Deletes the QueueInstance
@@ -265,6 +430,15 @@ class QueueContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the QueueInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     @property
     def members(self):
         """
@@ -274,6 +448,7 @@ class QueueContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.queue.member.MemberList
         """
         if self._members is None:
+            from twilio.rest.api.v2010.account.queue.member import MemberList
             self._members = MemberList(
                 self._version,
                 account_sid=self._solution['account_sid'],
@@ -294,6 +469,30 @@ class QueueContext(InstanceContext):
 
 class QueueInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_updated': deserialize.rfc2822_datetime,
+        'current_size': deserialize.integer,
+        'average_wait_time': deserialize.integer,
+        'date_created': deserialize.rfc2822_datetime,
+        'max_size': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'date_updated': 'date_updated',
+        'current_size': 'current_size',
+        'friendly_name': 'friendly_name',
+        'uri': 'uri',
+        'account_sid': 'account_sid',
+        'average_wait_time': 'average_wait_time',
+        'sid': 'sid',
+        'date_created': 'date_created',
+        'max_size': 'max_size',
+    }, _deserializers)
+
     def __init__(self, version, payload, account_sid, sid=None):
         """
         Initialize the QueueInstance
@@ -304,17 +503,7 @@ class QueueInstance(InstanceResource):
         super(QueueInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'date_updated': deserialize.rfc2822_datetime(payload.get('date_updated')),
-            'current_size': deserialize.integer(payload.get('current_size')),
-            'friendly_name': payload.get('friendly_name'),
-            'uri': payload.get('uri'),
-            'account_sid': payload.get('account_sid'),
-            'average_wait_time': deserialize.integer(payload.get('average_wait_time')),
-            'sid': payload.get('sid'),
-            'date_created': deserialize.rfc2822_datetime(payload.get('date_created')),
-            'max_size': deserialize.integer(payload.get('max_size')),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -418,6 +607,15 @@ class QueueInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the QueueInstance
+
+        :returns: The fetched QueueInstance
+        :rtype: twilio.rest.api.v2010.account.queue.QueueInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, friendly_name=values.unset, max_size=values.unset):
         """
         Update the QueueInstance
@@ -430,6 +628,18 @@ class QueueInstance(InstanceResource):
         """
         return self._proxy.update(friendly_name=friendly_name, max_size=max_size, )
 
+    async def update_async(self, friendly_name=values.unset, max_size=values.unset):
+        """
+        Asynchronous coroutine that updates the QueueInstance
+
+        :param unicode friendly_name: A string to describe this resource
+        :param unicode max_size: The max number of calls allowed in the queue
+
+        :returns: The updated QueueInstance
+        :rtype: twilio.rest.api.v2010.account.queue.QueueInstance
+        """
+        return await self._proxy.update_async(friendly_name=friendly_name, max_size=max_size, )
+
     def delete(self):
         """
         Deletes the QueueInstance
@@ -439,6 +649,15 @@ class QueueInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the QueueInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     @property
     def members(self):
         """
@@ -458,3 +677,19 @@ class QueueInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Api.V2010.QueueInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'MemberList': 'twilio.rest.api.v2010.account.queue.member',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
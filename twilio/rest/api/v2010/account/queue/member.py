@@ -31,9 +31,9 @@ class MemberList(ListResource):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, 'queue_sid': queue_sid, }
-        self._uri = '/Accounts/{account_sid}/Queues/{queue_sid}/Members.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/Queues/{queue_sid}/Members.json', self._solution)
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams MemberInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -46,17 +46,57 @@ class MemberList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.queue.member.MemberInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams MemberInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.queue.member.MemberInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists MemberInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -68,11 +108,42 @@ class MemberList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.queue.member.MemberInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists MemberInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.queue.member.MemberInstance]
+        """
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -93,6 +164,25 @@ class MemberList(ListResource):
 
         return MemberPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of MemberInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of MemberInstance
+        :rtype: twilio.rest.api.v2010.account.queue.member.MemberPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return MemberPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of MemberInstance records from the API.
@@ -110,6 +200,23 @@ class MemberList(ListResource):
 
         return MemberPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of MemberInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of MemberInstance
+        :rtype: twilio.rest.api.v2010.account.queue.member.MemberPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return MemberPage(self._version, response, self._solution)
+
     def get(self, call_sid):
         """
         Constructs a MemberContext
@@ -215,7 +322,7 @@ class MemberContext(InstanceContext):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, 'queue_sid': queue_sid, 'call_sid': call_sid, }
-        self._uri = '/Accounts/{account_sid}/Queues/{queue_sid}/Members/{call_sid}.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/Queues/{queue_sid}/Members/{call_sid}.json', self._solution)
 
     def fetch(self):
         """
@@ -234,6 +341,23 @@ class MemberContext(InstanceContext):
             call_sid=self._solution['call_sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the MemberInstance
+
+        :returns: The fetched MemberInstance
+        :rtype: twilio.rest.api.v2010.account.queue.member.MemberInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return MemberInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            queue_sid=self._solution['queue_sid'],
+            call_sid=self._solution['call_sid'],
+        )
+
     def update(self, url, method=values.unset):
         """
         Update the MemberInstance
@@ -256,6 +380,28 @@ class MemberContext(InstanceContext):
             call_sid=self._solution['call_sid'],
         )
 
+    async def update_async(self, url, method=values.unset):
+        """
+        Asynchronous coroutine that updates the MemberInstance
+
+        :param unicode url: The absolute URL of the Queue resource
+        :param unicode method: How to pass the update request data
+
+        :returns: The updated MemberInstance
+        :rtype: twilio.rest.api.v2010.account.queue.member.MemberInstance
+        """
+        data = values.of({'Url': url, 'Method': method, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return MemberInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            queue_sid=self._solution['queue_sid'],
+            call_sid=self._solution['call_sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -269,6 +415,25 @@ class MemberContext(InstanceContext):
 
 class MemberInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_enqueued': deserialize.rfc2822_datetime,
+        'position': deserialize.integer,
+        'wait_time': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'call_sid': 'call_sid',
+        'date_enqueued': 'date_enqueued',
+        'position': 'position',
+        'uri': 'uri',
+        'wait_time': 'wait_time',
+        'queue_sid': 'queue_sid',
+    }, _deserializers)
+
     def __init__(self, version, payload, account_sid, queue_sid, call_sid=None):
         """
         Initialize the MemberInstance
@@ -279,14 +444,7 @@ class MemberInstance(InstanceResource):
         super(MemberInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'call_sid': payload.get('call_sid'),
-            'date_enqueued': deserialize.rfc2822_datetime(payload.get('date_enqueued')),
-            'position': deserialize.integer(payload.get('position')),
-            'uri': payload.get('uri'),
-            'wait_time': deserialize.integer(payload.get('wait_time')),
-            'queue_sid': payload.get('queue_sid'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -371,6 +529,15 @@ class MemberInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the MemberInstance
+
+        :returns: The fetched MemberInstance
+        :rtype: twilio.rest.api.v2010.account.queue.member.MemberInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, url, method=values.unset):
         """
         Update the MemberInstance
@@ -383,6 +550,18 @@ class MemberInstance(InstanceResource):
         """
         return self._proxy.update(url, method=method, )
 
+    async def update_async(self, url, method=values.unset):
+        """
+        Asynchronous coroutine that updates the MemberInstance
+
+        :param unicode url: The absolute URL of the Queue resource
+        :param unicode method: How to pass the update request data
+
+        :returns: The updated MemberInstance
+        :rtype: twilio.rest.api.v2010.account.queue.member.MemberInstance
+        """
+        return await self._proxy.update_async(url, method=method, )
+
     def __repr__(self):
         """
         Provide a friendly representation
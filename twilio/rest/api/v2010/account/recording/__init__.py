@@ -6,6 +6,8 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import serialize
 from twilio.base import values
@@ -13,8 +15,6 @@ from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.api.v2010.account.recording.add_on_result import AddOnResultList
-from twilio.rest.api.v2010.account.recording.transcription import TranscriptionList
 
 
 class RecordingList(ListResource):
@@ -33,12 +33,12 @@ class RecordingList(ListResource):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, }
-        self._uri = '/Accounts/{account_sid}/Recordings.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/Recordings.json', self._solution)
 
     def stream(self, date_created_before=values.unset, date_created=values.unset,
                date_created_after=values.unset, call_sid=values.unset,
                conference_sid=values.unset, include_soft_deleted=values.unset,
-               limit=None, page_size=None):
+               limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams RecordingInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -57,28 +57,85 @@ class RecordingList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.recording.RecordingInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
-            date_created_before=date_created_before,
-            date_created=date_created,
-            date_created_after=date_created_after,
-            call_sid=call_sid,
-            conference_sid=conference_sid,
-            include_soft_deleted=include_soft_deleted,
-            page_size=limits['page_size'],
-        )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                date_created_before=date_created_before,
+                date_created=date_created,
+                date_created_after=date_created_after,
+                call_sid=call_sid,
+                conference_sid=conference_sid,
+                include_soft_deleted=include_soft_deleted,
+                page_size=limits['page_size'],
+            )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, date_created_before=values.unset, date_created=values.unset,
+                           date_created_after=values.unset, call_sid=values.unset,
+                           conference_sid=values.unset, include_soft_deleted=values.unset,
+                           limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams RecordingInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param datetime date_created_before: Only include recordings that were created on this date
+        :param datetime date_created: Only include recordings that were created on this date
+        :param datetime date_created_after: Only include recordings that were created on this date
+        :param unicode call_sid: The Call SID of the resources to read
+        :param unicode conference_sid: Read by unique Conference SID for the recording
+        :param bool include_soft_deleted: A boolean parameter indicating whether to retrieve soft deleted recordings or not.
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.recording.RecordingInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                date_created_before=date_created_before,
+                date_created=date_created,
+                date_created_after=date_created_after,
+                call_sid=call_sid,
+                conference_sid=conference_sid,
+                include_soft_deleted=include_soft_deleted,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, date_created_before=values.unset, date_created=values.unset,
              date_created_after=values.unset, call_sid=values.unset,
              conference_sid=values.unset, include_soft_deleted=values.unset,
-             limit=None, page_size=None):
+             limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists RecordingInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -96,6 +153,12 @@ class RecordingList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.recording.RecordingInstance]
@@ -109,8 +172,56 @@ class RecordingList(ListResource):
             include_soft_deleted=include_soft_deleted,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, date_created_before=values.unset, date_created=values.unset,
+                         date_created_after=values.unset, call_sid=values.unset,
+                         conference_sid=values.unset, include_soft_deleted=values.unset,
+                         limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists RecordingInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param datetime date_created_before: Only include recordings that were created on this date
+        :param datetime date_created: Only include recordings that were created on this date
+        :param datetime date_created_after: Only include recordings that were created on this date
+        :param unicode call_sid: The Call SID of the resources to read
+        :param unicode conference_sid: Read by unique Conference SID for the recording
+        :param bool include_soft_deleted: A boolean parameter indicating whether to retrieve soft deleted recordings or not.
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.recording.RecordingInstance]
+        """
+        return [record async for record in await self.stream_async(
+            date_created_before=date_created_before,
+            date_created=date_created,
+            date_created_after=date_created_after,
+            call_sid=call_sid,
+            conference_sid=conference_sid,
+            include_soft_deleted=include_soft_deleted,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, date_created_before=values.unset, date_created=values.unset,
              date_created_after=values.unset, call_sid=values.unset,
              conference_sid=values.unset, include_soft_deleted=values.unset,
@@ -149,6 +260,44 @@ class RecordingList(ListResource):
 
         return RecordingPage(self._version, response, self._solution)
 
+    async def page_async(self, date_created_before=values.unset, date_created=values.unset,
+                         date_created_after=values.unset, call_sid=values.unset,
+                         conference_sid=values.unset, include_soft_deleted=values.unset,
+                         page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of RecordingInstance records from the API.
+        Request is executed immediately
+
+        :param datetime date_created_before: Only include recordings that were created on this date
+        :param datetime date_created: Only include recordings that were created on this date
+        :param datetime date_created_after: Only include recordings that were created on this date
+        :param unicode call_sid: The Call SID of the resources to read
+        :param unicode conference_sid: Read by unique Conference SID for the recording
+        :param bool include_soft_deleted: A boolean parameter indicating whether to retrieve soft deleted recordings or not.
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of RecordingInstance
+        :rtype: twilio.rest.api.v2010.account.recording.RecordingPage
+        """
+        data = values.of({
+            'DateCreated<': serialize.iso8601_datetime(date_created_before),
+            'DateCreated': serialize.iso8601_datetime(date_created),
+            'DateCreated>': serialize.iso8601_datetime(date_created_after),
+            'CallSid': call_sid,
+            'ConferenceSid': conference_sid,
+            'IncludeSoftDeleted': include_soft_deleted,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return RecordingPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of RecordingInstance records from the API.
@@ -166,6 +315,23 @@ class RecordingList(ListResource):
 
         return RecordingPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of RecordingInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of RecordingInstance
+        :rtype: twilio.rest.api.v2010.account.recording.RecordingPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return RecordingPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a RecordingContext
@@ -254,7 +420,7 @@ class RecordingContext(InstanceContext):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, 'sid': sid, }
-        self._uri = '/Accounts/{account_sid}/Recordings/{sid}.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/Recordings/{sid}.json', self._solution)
 
         # Dependents
         self._transcriptions = None
@@ -280,6 +446,26 @@ class RecordingContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self, include_soft_deleted=values.unset):
+        """
+        Asynchronous coroutine that fetches the RecordingInstance
+
+        :param bool include_soft_deleted: A boolean parameter indicating whether to retrieve soft deleted recordings or not.
+
+        :returns: The fetched RecordingInstance
+        :rtype: twilio.rest.api.v2010.account.recording.RecordingInstance
+        """
+        data = values.of({'IncludeSoftDeleted': include_soft_deleted, })
+
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, params=data, )
+
+        return RecordingInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self):
         """
         Deletes the RecordingInstance
@@ -289,6 +475,15 @@ class RecordingContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the RecordingInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     @property
     def transcriptions(self):
         """
@@ -298,6 +493,7 @@ class RecordingContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.recording.transcription.TranscriptionList
         """
         if self._transcriptions is None:
+            from twilio.rest.api.v2010.account.recording.transcription import TranscriptionList
             self._transcriptions = TranscriptionList(
                 self._version,
                 account_sid=self._solution['account_sid'],
@@ -314,6 +510,7 @@ class RecordingContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.recording.add_on_result.AddOnResultList
         """
         if self._add_on_results is None:
+            from twilio.rest.api.v2010.account.recording.add_on_result import AddOnResultList
             self._add_on_results = AddOnResultList(
                 self._version,
                 account_sid=self._solution['account_sid'],
@@ -352,6 +549,39 @@ class RecordingInstance(InstanceResource):
         STARTCALLRECORDINGAPI = "StartCallRecordingAPI"
         STARTCONFERENCERECORDINGAPI = "StartConferenceRecordingAPI"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.rfc2822_datetime,
+        'date_updated': deserialize.rfc2822_datetime,
+        'start_time': deserialize.rfc2822_datetime,
+        'channels': deserialize.integer,
+        'error_code': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'api_version': 'api_version',
+        'call_sid': 'call_sid',
+        'conference_sid': 'conference_sid',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'start_time': 'start_time',
+        'duration': 'duration',
+        'sid': 'sid',
+        'price': 'price',
+        'price_unit': 'price_unit',
+        'status': 'status',
+        'channels': 'channels',
+        'source': 'source',
+        'error_code': 'error_code',
+        'uri': 'uri',
+        'encryption_details': 'encryption_details',
+        'subresource_uris': 'subresource_uris',
+    }, _deserializers)
+
     def __init__(self, version, payload, account_sid, sid=None):
         """
         Initialize the RecordingInstance
@@ -362,26 +592,7 @@ class RecordingInstance(InstanceResource):
         super(RecordingInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'api_version': payload.get('api_version'),
-            'call_sid': payload.get('call_sid'),
-            'conference_sid': payload.get('conference_sid'),
-            'date_created': deserialize.rfc2822_datetime(payload.get('date_created')),
-            'date_updated': deserialize.rfc2822_datetime(payload.get('date_updated')),
-            'start_time': deserialize.rfc2822_datetime(payload.get('start_time')),
-            'duration': payload.get('duration'),
-            'sid': payload.get('sid'),
-            'price': payload.get('price'),
-            'price_unit': payload.get('price_unit'),
-            'status': payload.get('status'),
-            'channels': deserialize.integer(payload.get('channels')),
-            'source': payload.get('source'),
-            'error_code': deserialize.integer(payload.get('error_code')),
-            'uri': payload.get('uri'),
-            'encryption_details': payload.get('encryption_details'),
-            'subresource_uris': payload.get('subresource_uris'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -559,6 +770,17 @@ class RecordingInstance(InstanceResource):
         """
         return self._proxy.fetch(include_soft_deleted=include_soft_deleted, )
 
+    async def fetch_async(self, include_soft_deleted=values.unset):
+        """
+        Asynchronous coroutine that fetches the RecordingInstance
+
+        :param bool include_soft_deleted: A boolean parameter indicating whether to retrieve soft deleted recordings or not.
+
+        :returns: The fetched RecordingInstance
+        :rtype: twilio.rest.api.v2010.account.recording.RecordingInstance
+        """
+        return await self._proxy.fetch_async(include_soft_deleted=include_soft_deleted, )
+
     def delete(self):
         """
         Deletes the RecordingInstance
@@ -568,6 +790,15 @@ class RecordingInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the RecordingInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     @property
     def transcriptions(self):
         """
@@ -597,3 +828,20 @@ class RecordingInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Api.V2010.RecordingInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'AddOnResultList': 'twilio.rest.api.v2010.account.recording.add_on_result',
+    'TranscriptionList': 'twilio.rest.api.v2010.account.recording.transcription',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
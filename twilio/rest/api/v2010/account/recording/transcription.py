@@ -31,9 +31,9 @@ class TranscriptionList(ListResource):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, 'recording_sid': recording_sid, }
-        self._uri = '/Accounts/{account_sid}/Recordings/{recording_sid}/Transcriptions.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/Recordings/{recording_sid}/Transcriptions.json', self._solution)
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams TranscriptionInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -46,17 +46,57 @@ class TranscriptionList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.recording.transcription.TranscriptionInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams TranscriptionInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.recording.transcription.TranscriptionInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists TranscriptionInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -68,11 +108,42 @@ class TranscriptionList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.recording.transcription.TranscriptionInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists TranscriptionInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.recording.transcription.TranscriptionInstance]
+        """
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -93,6 +164,25 @@ class TranscriptionList(ListResource):
 
         return TranscriptionPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of TranscriptionInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of TranscriptionInstance
+        :rtype: twilio.rest.api.v2010.account.recording.transcription.TranscriptionPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return TranscriptionPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of TranscriptionInstance records from the API.
@@ -110,6 +200,23 @@ class TranscriptionList(ListResource):
 
         return TranscriptionPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of TranscriptionInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of TranscriptionInstance
+        :rtype: twilio.rest.api.v2010.account.recording.transcription.TranscriptionPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return TranscriptionPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a TranscriptionContext
@@ -215,7 +322,7 @@ class TranscriptionContext(InstanceContext):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, 'recording_sid': recording_sid, 'sid': sid, }
-        self._uri = '/Accounts/{account_sid}/Recordings/{recording_sid}/Transcriptions/{sid}.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/Recordings/{recording_sid}/Transcriptions/{sid}.json', self._solution)
 
     def fetch(self):
         """
@@ -234,6 +341,23 @@ class TranscriptionContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the TranscriptionInstance
+
+        :returns: The fetched TranscriptionInstance
+        :rtype: twilio.rest.api.v2010.account.recording.transcription.TranscriptionInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return TranscriptionInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            recording_sid=self._solution['recording_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self):
         """
         Deletes the TranscriptionInstance
@@ -243,6 +367,15 @@ class TranscriptionContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the TranscriptionInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -261,6 +394,32 @@ class TranscriptionInstance(InstanceResource):
         COMPLETED = "completed"
         FAILED = "failed"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.rfc2822_datetime,
+        'date_updated': deserialize.rfc2822_datetime,
+        'price': deserialize.decimal,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'api_version': 'api_version',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'duration': 'duration',
+        'price': 'price',
+        'price_unit': 'price_unit',
+        'recording_sid': 'recording_sid',
+        'sid': 'sid',
+        'status': 'status',
+        'transcription_text': 'transcription_text',
+        'type': 'type',
+        'uri': 'uri',
+    }, _deserializers)
+
     def __init__(self, version, payload, account_sid, recording_sid, sid=None):
         """
         Initialize the TranscriptionInstance
@@ -271,21 +430,7 @@ class TranscriptionInstance(InstanceResource):
         super(TranscriptionInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'api_version': payload.get('api_version'),
-            'date_created': deserialize.rfc2822_datetime(payload.get('date_created')),
-            'date_updated': deserialize.rfc2822_datetime(payload.get('date_updated')),
-            'duration': payload.get('duration'),
-            'price': deserialize.decimal(payload.get('price')),
-            'price_unit': payload.get('price_unit'),
-            'recording_sid': payload.get('recording_sid'),
-            'sid': payload.get('sid'),
-            'status': payload.get('status'),
-            'transcription_text': payload.get('transcription_text'),
-            'type': payload.get('type'),
-            'uri': payload.get('uri'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -426,6 +571,15 @@ class TranscriptionInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the TranscriptionInstance
+
+        :returns: The fetched TranscriptionInstance
+        :rtype: twilio.rest.api.v2010.account.recording.transcription.TranscriptionInstance
+        """
+        return await self._proxy.fetch_async()
+
     def delete(self):
         """
         Deletes the TranscriptionInstance
@@ -435,6 +589,15 @@ class TranscriptionInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the TranscriptionInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -30,10 +30,10 @@ class ShortCodeList(ListResource):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, }
-        self._uri = '/Accounts/{account_sid}/SMS/ShortCodes.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/SMS/ShortCodes.json', self._solution)
 
     def stream(self, friendly_name=values.unset, short_code=values.unset,
-               limit=None, page_size=None):
+               limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams ShortCodeInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -48,18 +48,61 @@ class ShortCodeList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.short_code.ShortCodeInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(friendly_name=friendly_name, short_code=short_code, page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(friendly_name=friendly_name, short_code=short_code, page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, friendly_name=values.unset, short_code=values.unset,
+                           limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams ShortCodeInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param unicode friendly_name: The string that identifies the ShortCode resources to read
+        :param unicode short_code: Filter by ShortCode
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.short_code.ShortCodeInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(friendly_name=friendly_name, short_code=short_code, page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, friendly_name=values.unset, short_code=values.unset, limit=None,
-             page_size=None):
+             page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists ShortCodeInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -73,6 +116,12 @@ class ShortCodeList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.short_code.ShortCodeInstance]
@@ -82,8 +131,46 @@ class ShortCodeList(ListResource):
             short_code=short_code,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, friendly_name=values.unset, short_code=values.unset, limit=None,
+                         page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists ShortCodeInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param unicode friendly_name: The string that identifies the ShortCode resources to read
+        :param unicode short_code: Filter by ShortCode
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.short_code.ShortCodeInstance]
+        """
+        return [record async for record in await self.stream_async(
+            friendly_name=friendly_name,
+            short_code=short_code,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, friendly_name=values.unset, short_code=values.unset,
              page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -112,6 +199,34 @@ class ShortCodeList(ListResource):
 
         return ShortCodePage(self._version, response, self._solution)
 
+    async def page_async(self, friendly_name=values.unset, short_code=values.unset,
+                         page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of ShortCodeInstance records from the API.
+        Request is executed immediately
+
+        :param unicode friendly_name: The string that identifies the ShortCode resources to read
+        :param unicode short_code: Filter by ShortCode
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of ShortCodeInstance
+        :rtype: twilio.rest.api.v2010.account.short_code.ShortCodePage
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'ShortCode': short_code,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return ShortCodePage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of ShortCodeInstance records from the API.
@@ -129,6 +244,23 @@ class ShortCodeList(ListResource):
 
         return ShortCodePage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of ShortCodeInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of ShortCodeInstance
+        :rtype: twilio.rest.api.v2010.account.short_code.ShortCodePage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return ShortCodePage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a ShortCodeContext
@@ -217,7 +349,7 @@ class ShortCodeContext(InstanceContext):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, 'sid': sid, }
-        self._uri = '/Accounts/{account_sid}/SMS/ShortCodes/{sid}.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/SMS/ShortCodes/{sid}.json', self._solution)
 
     def fetch(self):
         """
@@ -235,6 +367,22 @@ class ShortCodeContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ShortCodeInstance
+
+        :returns: The fetched ShortCodeInstance
+        :rtype: twilio.rest.api.v2010.account.short_code.ShortCodeInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return ShortCodeInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            sid=self._solution['sid'],
+        )
+
     def update(self, friendly_name=values.unset, api_version=values.unset,
                sms_url=values.unset, sms_method=values.unset,
                sms_fallback_url=values.unset, sms_fallback_method=values.unset):
@@ -269,6 +417,40 @@ class ShortCodeContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, friendly_name=values.unset, api_version=values.unset,
+                           sms_url=values.unset, sms_method=values.unset,
+                           sms_fallback_url=values.unset, sms_fallback_method=values.unset):
+        """
+        Asynchronous coroutine that updates the ShortCodeInstance
+
+        :param unicode friendly_name: A string to describe this resource
+        :param unicode api_version: The API version to use to start a new TwiML session
+        :param unicode sms_url: URL Twilio will request when receiving an SMS
+        :param unicode sms_method: HTTP method to use when requesting the sms url
+        :param unicode sms_fallback_url: URL Twilio will request if an error occurs in executing TwiML
+        :param unicode sms_fallback_method: HTTP method Twilio will use with sms_fallback_url
+
+        :returns: The updated ShortCodeInstance
+        :rtype: twilio.rest.api.v2010.account.short_code.ShortCodeInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'ApiVersion': api_version,
+            'SmsUrl': sms_url,
+            'SmsMethod': sms_method,
+            'SmsFallbackUrl': sms_fallback_url,
+            'SmsFallbackMethod': sms_fallback_method,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return ShortCodeInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            sid=self._solution['sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -282,6 +464,30 @@ class ShortCodeContext(InstanceContext):
 
 class ShortCodeInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.rfc2822_datetime,
+        'date_updated': deserialize.rfc2822_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'api_version': 'api_version',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'friendly_name': 'friendly_name',
+        'short_code': 'short_code',
+        'sid': 'sid',
+        'sms_fallback_method': 'sms_fallback_method',
+        'sms_fallback_url': 'sms_fallback_url',
+        'sms_method': 'sms_method',
+        'sms_url': 'sms_url',
+        'uri': 'uri',
+    }, _deserializers)
+
     def __init__(self, version, payload, account_sid, sid=None):
         """
         Initialize the ShortCodeInstance
@@ -292,20 +498,7 @@ class ShortCodeInstance(InstanceResource):
         super(ShortCodeInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'api_version': payload.get('api_version'),
-            'date_created': deserialize.rfc2822_datetime(payload.get('date_created')),
-            'date_updated': deserialize.rfc2822_datetime(payload.get('date_updated')),
-            'friendly_name': payload.get('friendly_name'),
-            'short_code': payload.get('short_code'),
-            'sid': payload.get('sid'),
-            'sms_fallback_method': payload.get('sms_fallback_method'),
-            'sms_fallback_url': payload.get('sms_fallback_url'),
-            'sms_method': payload.get('sms_method'),
-            'sms_url': payload.get('sms_url'),
-            'uri': payload.get('uri'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -433,6 +626,15 @@ class ShortCodeInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ShortCodeInstance
+
+        :returns: The fetched ShortCodeInstance
+        :rtype: twilio.rest.api.v2010.account.short_code.ShortCodeInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, friendly_name=values.unset, api_version=values.unset,
                sms_url=values.unset, sms_method=values.unset,
                sms_fallback_url=values.unset, sms_fallback_method=values.unset):
@@ -458,6 +660,31 @@ class ShortCodeInstance(InstanceResource):
             sms_fallback_method=sms_fallback_method,
         )
 
+    async def update_async(self, friendly_name=values.unset, api_version=values.unset,
+                           sms_url=values.unset, sms_method=values.unset,
+                           sms_fallback_url=values.unset, sms_fallback_method=values.unset):
+        """
+        Asynchronous coroutine that updates the ShortCodeInstance
+
+        :param unicode friendly_name: A string to describe this resource
+        :param unicode api_version: The API version to use to start a new TwiML session
+        :param unicode sms_url: URL Twilio will request when receiving an SMS
+        :param unicode sms_method: HTTP method to use when requesting the sms url
+        :param unicode sms_fallback_url: URL Twilio will request if an error occurs in executing TwiML
+        :param unicode sms_fallback_method: HTTP method Twilio will use with sms_fallback_url
+
+        :returns: The updated ShortCodeInstance
+        :rtype: twilio.rest.api.v2010.account.short_code.ShortCodeInstance
+        """
+        return await self._proxy.update_async(
+            friendly_name=friendly_name,
+            api_version=api_version,
+            sms_url=sms_url,
+            sms_method=sms_method,
+            sms_fallback_url=sms_fallback_url,
+            sms_fallback_method=sms_fallback_method,
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -30,9 +30,9 @@ class SigningKeyList(ListResource):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, }
-        self._uri = '/Accounts/{account_sid}/SigningKeys.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/SigningKeys.json', self._solution)
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams SigningKeyInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -45,17 +45,57 @@ class SigningKeyList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.signing_key.SigningKeyInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams SigningKeyInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.signing_key.SigningKeyInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists SigningKeyInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -67,11 +107,42 @@ class SigningKeyList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.signing_key.SigningKeyInstance]
+        """
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists SigningKeyInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.signing_key.SigningKeyInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -92,6 +163,25 @@ class SigningKeyList(ListResource):
 
         return SigningKeyPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of SigningKeyInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of SigningKeyInstance
+        :rtype: twilio.rest.api.v2010.account.signing_key.SigningKeyPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return SigningKeyPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of SigningKeyInstance records from the API.
@@ -109,6 +199,23 @@ class SigningKeyList(ListResource):
 
         return SigningKeyPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of SigningKeyInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of SigningKeyInstance
+        :rtype: twilio.rest.api.v2010.account.signing_key.SigningKeyPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return SigningKeyPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a SigningKeyContext
@@ -197,7 +304,7 @@ class SigningKeyContext(InstanceContext):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, 'sid': sid, }
-        self._uri = '/Accounts/{account_sid}/SigningKeys/{sid}.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/SigningKeys/{sid}.json', self._solution)
 
     def fetch(self):
         """
@@ -215,6 +322,22 @@ class SigningKeyContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the SigningKeyInstance
+
+        :returns: The fetched SigningKeyInstance
+        :rtype: twilio.rest.api.v2010.account.signing_key.SigningKeyInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return SigningKeyInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            sid=self._solution['sid'],
+        )
+
     def update(self, friendly_name=values.unset):
         """
         Update the SigningKeyInstance
@@ -235,6 +358,26 @@ class SigningKeyContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, friendly_name=values.unset):
+        """
+        Asynchronous coroutine that updates the SigningKeyInstance
+
+        :param unicode friendly_name: The friendly_name
+
+        :returns: The updated SigningKeyInstance
+        :rtype: twilio.rest.api.v2010.account.signing_key.SigningKeyInstance
+        """
+        data = values.of({'FriendlyName': friendly_name, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return SigningKeyInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self):
         """
         Deletes the SigningKeyInstance
@@ -244,6 +387,15 @@ class SigningKeyContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the SigningKeyInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -257,6 +409,22 @@ class SigningKeyContext(InstanceContext):
 
 class SigningKeyInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.rfc2822_datetime,
+        'date_updated': deserialize.rfc2822_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'friendly_name': 'friendly_name',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+    }, _deserializers)
+
     def __init__(self, version, payload, account_sid, sid=None):
         """
         Initialize the SigningKeyInstance
@@ -267,12 +435,7 @@ class SigningKeyInstance(InstanceResource):
         super(SigningKeyInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'friendly_name': payload.get('friendly_name'),
-            'date_created': deserialize.rfc2822_datetime(payload.get('date_created')),
-            'date_updated': deserialize.rfc2822_datetime(payload.get('date_updated')),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -336,6 +499,15 @@ class SigningKeyInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the SigningKeyInstance
+
+        :returns: The fetched SigningKeyInstance
+        :rtype: twilio.rest.api.v2010.account.signing_key.SigningKeyInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, friendly_name=values.unset):
         """
         Update the SigningKeyInstance
@@ -347,6 +519,17 @@ class SigningKeyInstance(InstanceResource):
         """
         return self._proxy.update(friendly_name=friendly_name, )
 
+    async def update_async(self, friendly_name=values.unset):
+        """
+        Asynchronous coroutine that updates the SigningKeyInstance
+
+        :param unicode friendly_name: The friendly_name
+
+        :returns: The updated SigningKeyInstance
+        :rtype: twilio.rest.api.v2010.account.signing_key.SigningKeyInstance
+        """
+        return await self._proxy.update_async(friendly_name=friendly_name, )
+
     def delete(self):
         """
         Deletes the SigningKeyInstance
@@ -356,6 +539,15 @@ class SigningKeyInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the SigningKeyInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
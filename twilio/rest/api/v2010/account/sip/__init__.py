@@ -6,12 +6,11 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.api.v2010.account.sip.credential_list import CredentialListList
-from twilio.rest.api.v2010.account.sip.domain import DomainList
-from twilio.rest.api.v2010.account.sip.ip_access_control_list import IpAccessControlListList
 
 
 class SipList(ListResource):
@@ -46,6 +45,7 @@ class SipList(ListResource):
         :rtype: twilio.rest.api.v2010.account.sip.domain.DomainList
         """
         if self._domains is None:
+            from twilio.rest.api.v2010.account.sip.domain import DomainList
             self._domains = DomainList(self._version, account_sid=self._solution['account_sid'], )
         return self._domains
 
@@ -58,6 +58,7 @@ class SipList(ListResource):
         :rtype: twilio.rest.api.v2010.account.sip.ip_access_control_list.IpAccessControlListList
         """
         if self._ip_access_control_lists is None:
+            from twilio.rest.api.v2010.account.sip.ip_access_control_list import IpAccessControlListList
             self._ip_access_control_lists = IpAccessControlListList(
                 self._version,
                 account_sid=self._solution['account_sid'],
@@ -73,6 +74,7 @@ class SipList(ListResource):
         :rtype: twilio.rest.api.v2010.account.sip.credential_list.CredentialListList
         """
         if self._credential_lists is None:
+            from twilio.rest.api.v2010.account.sip.credential_list import CredentialListList
             self._credential_lists = CredentialListList(
                 self._version,
                 account_sid=self._solution['account_sid'],
@@ -130,6 +132,8 @@ class SipPage(Page):
 
 class SipInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
     def __init__(self, version, payload, account_sid):
         """
         Initialize the SipInstance
@@ -151,3 +155,21 @@ class SipInstance(InstanceResource):
         :rtype: str
         """
         return '<Twilio.Api.V2010.SipInstance>'
+
+
+_LAZY_IMPORTS = {
+    'CredentialListList': 'twilio.rest.api.v2010.account.sip.credential_list',
+    'DomainList': 'twilio.rest.api.v2010.account.sip.domain',
+    'IpAccessControlListList': 'twilio.rest.api.v2010.account.sip.ip_access_control_list',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
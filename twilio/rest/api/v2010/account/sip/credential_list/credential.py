@@ -31,9 +31,9 @@ class CredentialList(ListResource):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, 'credential_list_sid': credential_list_sid, }
-        self._uri = '/Accounts/{account_sid}/SIP/CredentialLists/{credential_list_sid}/Credentials.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/SIP/CredentialLists/{credential_list_sid}/Credentials.json', self._solution)
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams CredentialInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -46,17 +46,57 @@ class CredentialList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.sip.credential_list.credential.CredentialInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams CredentialInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.sip.credential_list.credential.CredentialInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists CredentialInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -68,11 +108,42 @@ class CredentialList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.sip.credential_list.credential.CredentialInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists CredentialInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.sip.credential_list.credential.CredentialInstance]
+        """
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -93,6 +164,25 @@ class CredentialList(ListResource):
 
         return CredentialPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of CredentialInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of CredentialInstance
+        :rtype: twilio.rest.api.v2010.account.sip.credential_list.credential.CredentialPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return CredentialPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of CredentialInstance records from the API.
@@ -110,19 +200,61 @@ class CredentialList(ListResource):
 
         return CredentialPage(self._version, response, self._solution)
 
-    def create(self, username, password):
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of CredentialInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of CredentialInstance
+        :rtype: twilio.rest.api.v2010.account.sip.credential_list.credential.CredentialPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return CredentialPage(self._version, response, self._solution)
+
+    def create(self, username, password, deadline=None):
         """
         Create the CredentialInstance
 
         :param unicode username: The username for this credential.
         :param unicode password: The password will not be returned in the response.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created CredentialInstance
+        :rtype: twilio.rest.api.v2010.account.sip.credential_list.credential.CredentialInstance
+        """
+        data = values.of({'Username': username, 'Password': password, })
+
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return CredentialInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            credential_list_sid=self._solution['credential_list_sid'],
+        )
+
+    async def create_async(self, username, password, deadline=None):
+        """
+        Asynchronous coroutine that creates the CredentialInstance
+
+        :param unicode username: The username for this credential.
+        :param unicode password: The password will not be returned in the response.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created CredentialInstance
         :rtype: twilio.rest.api.v2010.account.sip.credential_list.credential.CredentialInstance
         """
         data = values.of({'Username': username, 'Password': password, })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return CredentialInstance(
             self._version,
@@ -240,7 +372,7 @@ class CredentialContext(InstanceContext):
             'credential_list_sid': credential_list_sid,
             'sid': sid,
         }
-        self._uri = '/Accounts/{account_sid}/SIP/CredentialLists/{credential_list_sid}/Credentials/{sid}.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/SIP/CredentialLists/{credential_list_sid}/Credentials/{sid}.json', self._solution)
 
     def fetch(self):
         """
@@ -259,6 +391,23 @@ class CredentialContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the CredentialInstance
+
+        :returns: The fetched CredentialInstance
+        :rtype: twilio.rest.api.v2010.account.sip.credential_list.credential.CredentialInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return CredentialInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            credential_list_sid=self._solution['credential_list_sid'],
+            sid=self._solution['sid'],
+        )
+
     def update(self, password=values.unset):
         """
         Update the CredentialInstance
@@ -280,6 +429,27 @@ class CredentialContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, password=values.unset):
+        """
+        Asynchronous coroutine that updates the CredentialInstance
+
+        :param unicode password: The password will not be returned in the response
+
+        :returns: The updated CredentialInstance
+        :rtype: twilio.rest.api.v2010.account.sip.credential_list.credential.CredentialInstance
+        """
+        data = values.of({'Password': password, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return CredentialInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            credential_list_sid=self._solution['credential_list_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self):
         """
         Deletes the CredentialInstance
@@ -289,6 +459,15 @@ class CredentialContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the CredentialInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -302,6 +481,25 @@ class CredentialContext(InstanceContext):
 
 class CredentialInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.rfc2822_datetime,
+        'date_updated': deserialize.rfc2822_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'credential_list_sid': 'credential_list_sid',
+        'username': 'username',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'uri': 'uri',
+    }, _deserializers)
+
     def __init__(self, version, payload, account_sid, credential_list_sid,
                  sid=None):
         """
@@ -313,15 +511,7 @@ class CredentialInstance(InstanceResource):
         super(CredentialInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'credential_list_sid': payload.get('credential_list_sid'),
-            'username': payload.get('username'),
-            'date_created': deserialize.rfc2822_datetime(payload.get('date_created')),
-            'date_updated': deserialize.rfc2822_datetime(payload.get('date_updated')),
-            'uri': payload.get('uri'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -414,6 +604,15 @@ class CredentialInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the CredentialInstance
+
+        :returns: The fetched CredentialInstance
+        :rtype: twilio.rest.api.v2010.account.sip.credential_list.credential.CredentialInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, password=values.unset):
         """
         Update the CredentialInstance
@@ -425,6 +624,17 @@ class CredentialInstance(InstanceResource):
         """
         return self._proxy.update(password=password, )
 
+    async def update_async(self, password=values.unset):
+        """
+        Asynchronous coroutine that updates the CredentialInstance
+
+        :param unicode password: The password will not be returned in the response
+
+        :returns: The updated CredentialInstance
+        :rtype: twilio.rest.api.v2010.account.sip.credential_list.credential.CredentialInstance
+        """
+        return await self._proxy.update_async(password=password, )
+
     def delete(self):
         """
         Deletes the CredentialInstance
@@ -434,6 +644,15 @@ class CredentialInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the CredentialInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -6,15 +6,14 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.api.v2010.account.sip.domain.auth_types import AuthTypesList
-from twilio.rest.api.v2010.account.sip.domain.credential_list_mapping import CredentialListMappingList
-from twilio.rest.api.v2010.account.sip.domain.ip_access_control_list_mapping import IpAccessControlListMappingList
 
 
 class DomainList(ListResource):
@@ -33,9 +32,9 @@ class DomainList(ListResource):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, }
-        self._uri = '/Accounts/{account_sid}/SIP/Domains.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/SIP/Domains.json', self._solution)
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams DomainInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -48,17 +47,57 @@ class DomainList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.sip.domain.DomainInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams DomainInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.sip.domain.DomainInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists DomainInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -70,11 +109,42 @@ class DomainList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.sip.domain.DomainInstance]
+        """
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists DomainInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.sip.domain.DomainInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -95,6 +165,25 @@ class DomainList(ListResource):
 
         return DomainPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of DomainInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of DomainInstance
+        :rtype: twilio.rest.api.v2010.account.sip.domain.DomainPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return DomainPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of DomainInstance records from the API.
@@ -112,6 +201,23 @@ class DomainList(ListResource):
 
         return DomainPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of DomainInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of DomainInstance
+        :rtype: twilio.rest.api.v2010.account.sip.domain.DomainPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return DomainPage(self._version, response, self._solution)
+
     def create(self, domain_name, friendly_name=values.unset,
                voice_url=values.unset, voice_method=values.unset,
                voice_fallback_url=values.unset, voice_fallback_method=values.unset,
@@ -119,7 +225,7 @@ class DomainList(ListResource):
                voice_status_callback_method=values.unset,
                sip_registration=values.unset,
                emergency_calling_enabled=values.unset, secure=values.unset,
-               byoc_trunk_sid=values.unset, emergency_caller_sid=values.unset):
+               byoc_trunk_sid=values.unset, emergency_caller_sid=values.unset, deadline=None):
         """
         Create the DomainInstance
 
@@ -136,6 +242,8 @@ class DomainList(ListResource):
         :param bool secure: Whether secure SIP is enabled for the domain
         :param unicode byoc_trunk_sid: The SID of the BYOC Trunk resource.
         :param unicode emergency_caller_sid: Whether an emergency caller sid is configured for the domain.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created DomainInstance
         :rtype: twilio.rest.api.v2010.account.sip.domain.DomainInstance
@@ -156,7 +264,58 @@ class DomainList(ListResource):
             'EmergencyCallerSid': emergency_caller_sid,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return DomainInstance(self._version, payload, account_sid=self._solution['account_sid'], )
+
+    async def create_async(self, domain_name, friendly_name=values.unset,
+                           voice_url=values.unset, voice_method=values.unset,
+                           voice_fallback_url=values.unset, voice_fallback_method=values.unset,
+                           voice_status_callback_url=values.unset,
+                           voice_status_callback_method=values.unset,
+                           sip_registration=values.unset,
+                           emergency_calling_enabled=values.unset, secure=values.unset,
+                           byoc_trunk_sid=values.unset, emergency_caller_sid=values.unset,
+                           deadline=None):
+        """
+        Asynchronous coroutine that creates the DomainInstance
+
+        :param unicode domain_name: The unique address on Twilio to route SIP traffic
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode voice_url: The URL we should call when receiving a call
+        :param unicode voice_method: The HTTP method to use with voice_url
+        :param unicode voice_fallback_url: The URL we should call when an error occurs in executing TwiML
+        :param unicode voice_fallback_method: The HTTP method to use with voice_fallback_url
+        :param unicode voice_status_callback_url: The URL that we should call to pass status updates
+        :param unicode voice_status_callback_method: The HTTP method we should use to call `voice_status_callback_url`
+        :param bool sip_registration: Whether SIP registration is allowed
+        :param bool emergency_calling_enabled: Whether emergency calling is enabled for the domain.
+        :param bool secure: Whether secure SIP is enabled for the domain
+        :param unicode byoc_trunk_sid: The SID of the BYOC Trunk resource.
+        :param unicode emergency_caller_sid: Whether an emergency caller sid is configured for the domain.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created DomainInstance
+        :rtype: twilio.rest.api.v2010.account.sip.domain.DomainInstance
+        """
+        data = values.of({
+            'DomainName': domain_name,
+            'FriendlyName': friendly_name,
+            'VoiceUrl': voice_url,
+            'VoiceMethod': voice_method,
+            'VoiceFallbackUrl': voice_fallback_url,
+            'VoiceFallbackMethod': voice_fallback_method,
+            'VoiceStatusCallbackUrl': voice_status_callback_url,
+            'VoiceStatusCallbackMethod': voice_status_callback_method,
+            'SipRegistration': sip_registration,
+            'EmergencyCallingEnabled': emergency_calling_enabled,
+            'Secure': secure,
+            'ByocTrunkSid': byoc_trunk_sid,
+            'EmergencyCallerSid': emergency_caller_sid,
+        })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return DomainInstance(self._version, payload, account_sid=self._solution['account_sid'], )
 
@@ -248,7 +407,7 @@ class DomainContext(InstanceContext):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, 'sid': sid, }
-        self._uri = '/Accounts/{account_sid}/SIP/Domains/{sid}.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/SIP/Domains/{sid}.json', self._solution)
 
         # Dependents
         self._ip_access_control_list_mappings = None
@@ -271,6 +430,22 @@ class DomainContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the DomainInstance
+
+        :returns: The fetched DomainInstance
+        :rtype: twilio.rest.api.v2010.account.sip.domain.DomainInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return DomainInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            sid=self._solution['sid'],
+        )
+
     def update(self, friendly_name=values.unset, voice_fallback_method=values.unset,
                voice_fallback_url=values.unset, voice_method=values.unset,
                voice_status_callback_method=values.unset,
@@ -323,6 +498,58 @@ class DomainContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, friendly_name=values.unset, voice_fallback_method=values.unset,
+                           voice_fallback_url=values.unset, voice_method=values.unset,
+                           voice_status_callback_method=values.unset,
+                           voice_status_callback_url=values.unset, voice_url=values.unset,
+                           sip_registration=values.unset, domain_name=values.unset,
+                           emergency_calling_enabled=values.unset, secure=values.unset,
+                           byoc_trunk_sid=values.unset, emergency_caller_sid=values.unset):
+        """
+        Asynchronous coroutine that updates the DomainInstance
+
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode voice_fallback_method: The HTTP method used with voice_fallback_url
+        :param unicode voice_fallback_url: The URL we should call when an error occurs in executing TwiML
+        :param unicode voice_method: The HTTP method we should use with voice_url
+        :param unicode voice_status_callback_method: The HTTP method we should use to call voice_status_callback_url
+        :param unicode voice_status_callback_url: The URL that we should call to pass status updates
+        :param unicode voice_url: The URL we should call when receiving a call
+        :param bool sip_registration: Whether SIP registration is allowed
+        :param unicode domain_name: The unique address on Twilio to route SIP traffic
+        :param bool emergency_calling_enabled: Whether emergency calling is enabled for the domain.
+        :param bool secure: Whether secure SIP is enabled for the domain
+        :param unicode byoc_trunk_sid: The SID of the BYOC Trunk resource.
+        :param unicode emergency_caller_sid: Whether an emergency caller sid is configured for the domain.
+
+        :returns: The updated DomainInstance
+        :rtype: twilio.rest.api.v2010.account.sip.domain.DomainInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'VoiceFallbackMethod': voice_fallback_method,
+            'VoiceFallbackUrl': voice_fallback_url,
+            'VoiceMethod': voice_method,
+            'VoiceStatusCallbackMethod': voice_status_callback_method,
+            'VoiceStatusCallbackUrl': voice_status_callback_url,
+            'VoiceUrl': voice_url,
+            'SipRegistration': sip_registration,
+            'DomainName': domain_name,
+            'EmergencyCallingEnabled': emergency_calling_enabled,
+            'Secure': secure,
+            'ByocTrunkSid': byoc_trunk_sid,
+            'EmergencyCallerSid': emergency_caller_sid,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return DomainInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self):
         """
         Deletes the DomainInstance
@@ -332,6 +559,15 @@ class DomainContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the DomainInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     @property
     def ip_access_control_list_mappings(self):
         """
@@ -341,6 +577,7 @@ class DomainContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.sip.domain.ip_access_control_list_mapping.IpAccessControlListMappingList
         """
         if self._ip_access_control_list_mappings is None:
+            from twilio.rest.api.v2010.account.sip.domain.ip_access_control_list_mapping import IpAccessControlListMappingList
             self._ip_access_control_list_mappings = IpAccessControlListMappingList(
                 self._version,
                 account_sid=self._solution['account_sid'],
@@ -357,6 +594,7 @@ class DomainContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.sip.domain.credential_list_mapping.CredentialListMappingList
         """
         if self._credential_list_mappings is None:
+            from twilio.rest.api.v2010.account.sip.domain.credential_list_mapping import CredentialListMappingList
             self._credential_list_mappings = CredentialListMappingList(
                 self._version,
                 account_sid=self._solution['account_sid'],
@@ -373,6 +611,7 @@ class DomainContext(InstanceContext):
         :rtype: twilio.rest.api.v2010.account.sip.domain.auth_types.AuthTypesList
         """
         if self._auth is None:
+            from twilio.rest.api.v2010.account.sip.domain.auth_types import AuthTypesList
             self._auth = AuthTypesList(
                 self._version,
                 account_sid=self._solution['account_sid'],
@@ -393,6 +632,39 @@ class DomainContext(InstanceContext):
 
 class DomainInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.rfc2822_datetime,
+        'date_updated': deserialize.rfc2822_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'api_version': 'api_version',
+        'auth_type': 'auth_type',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'domain_name': 'domain_name',
+        'friendly_name': 'friendly_name',
+        'sid': 'sid',
+        'uri': 'uri',
+        'voice_fallback_method': 'voice_fallback_method',
+        'voice_fallback_url': 'voice_fallback_url',
+        'voice_method': 'voice_method',
+        'voice_status_callback_method': 'voice_status_callback_method',
+        'voice_status_callback_url': 'voice_status_callback_url',
+        'voice_url': 'voice_url',
+        'subresource_uris': 'subresource_uris',
+        'sip_registration': 'sip_registration',
+        'emergency_calling_enabled': 'emergency_calling_enabled',
+        'secure': 'secure',
+        'byoc_trunk_sid': 'byoc_trunk_sid',
+        'emergency_caller_sid': 'emergency_caller_sid',
+    }, _deserializers)
+
     def __init__(self, version, payload, account_sid, sid=None):
         """
         Initialize the DomainInstance
@@ -403,29 +675,7 @@ class DomainInstance(InstanceResource):
         super(DomainInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'api_version': payload.get('api_version'),
-            'auth_type': payload.get('auth_type'),
-            'date_created': deserialize.rfc2822_datetime(payload.get('date_created')),
-            'date_updated': deserialize.rfc2822_datetime(payload.get('date_updated')),
-            'domain_name': payload.get('domain_name'),
-            'friendly_name': payload.get('friendly_name'),
-            'sid': payload.get('sid'),
-            'uri': payload.get('uri'),
-            'voice_fallback_method': payload.get('voice_fallback_method'),
-            'voice_fallback_url': payload.get('voice_fallback_url'),
-            'voice_method': payload.get('voice_method'),
-            'voice_status_callback_method': payload.get('voice_status_callback_method'),
-            'voice_status_callback_url': payload.get('voice_status_callback_url'),
-            'voice_url': payload.get('voice_url'),
-            'subresource_uris': payload.get('subresource_uris'),
-            'sip_registration': payload.get('sip_registration'),
-            'emergency_calling_enabled': payload.get('emergency_calling_enabled'),
-            'secure': payload.get('secure'),
-            'byoc_trunk_sid': payload.get('byoc_trunk_sid'),
-            'emergency_caller_sid': payload.get('emergency_caller_sid'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -625,6 +875,15 @@ class DomainInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the DomainInstance
+
+        :returns: The fetched DomainInstance
+        :rtype: twilio.rest.api.v2010.account.sip.domain.DomainInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, friendly_name=values.unset, voice_fallback_method=values.unset,
                voice_fallback_url=values.unset, voice_method=values.unset,
                voice_status_callback_method=values.unset,
@@ -668,6 +927,49 @@ class DomainInstance(InstanceResource):
             emergency_caller_sid=emergency_caller_sid,
         )
 
+    async def update_async(self, friendly_name=values.unset, voice_fallback_method=values.unset,
+                           voice_fallback_url=values.unset, voice_method=values.unset,
+                           voice_status_callback_method=values.unset,
+                           voice_status_callback_url=values.unset, voice_url=values.unset,
+                           sip_registration=values.unset, domain_name=values.unset,
+                           emergency_calling_enabled=values.unset, secure=values.unset,
+                           byoc_trunk_sid=values.unset, emergency_caller_sid=values.unset):
+        """
+        Asynchronous coroutine that updates the DomainInstance
+
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode voice_fallback_method: The HTTP method used with voice_fallback_url
+        :param unicode voice_fallback_url: The URL we should call when an error occurs in executing TwiML
+        :param unicode voice_method: The HTTP method we should use with voice_url
+        :param unicode voice_status_callback_method: The HTTP method we should use to call voice_status_callback_url
+        :param unicode voice_status_callback_url: The URL that we should call to pass status updates
+        :param unicode voice_url: The URL we should call when receiving a call
+        :param bool sip_registration: Whether SIP registration is allowed
+        :param unicode domain_name: The unique address on Twilio to route SIP traffic
+        :param bool emergency_calling_enabled: Whether emergency calling is enabled for the domain.
+        :param bool secure: Whether secure SIP is enabled for the domain
+        :param unicode byoc_trunk_sid: The SID of the BYOC Trunk resource.
+        :param unicode emergency_caller_sid: Whether an emergency caller sid is configured for the domain.
+
+        :returns: The updated DomainInstance
+        :rtype: twilio.rest.api.v2010.account.sip.domain.DomainInstance
+        """
+        return await self._proxy.update_async(
+            friendly_name=friendly_name,
+            voice_fallback_method=voice_fallback_method,
+            voice_fallback_url=voice_fallback_url,
+            voice_method=voice_method,
+            voice_status_callback_method=voice_status_callback_method,
+            voice_status_callback_url=voice_status_callback_url,
+            voice_url=voice_url,
+            sip_registration=sip_registration,
+            domain_name=domain_name,
+            emergency_calling_enabled=emergency_calling_enabled,
+            secure=secure,
+            byoc_trunk_sid=byoc_trunk_sid,
+            emergency_caller_sid=emergency_caller_sid,
+        )
+
     def delete(self):
         """
         Deletes the DomainInstance
@@ -677,6 +979,15 @@ class DomainInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the DomainInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     @property
     def ip_access_control_list_mappings(self):
         """
@@ -716,3 +1027,21 @@ class DomainInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Api.V2010.DomainInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'AuthTypesList': 'twilio.rest.api.v2010.account.sip.domain.auth_types',
+    'CredentialListMappingList': 'twilio.rest.api.v2010.account.sip.domain.credential_list_mapping',
+    'IpAccessControlListMappingList': 'twilio.rest.api.v2010.account.sip.domain.ip_access_control_list_mapping',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
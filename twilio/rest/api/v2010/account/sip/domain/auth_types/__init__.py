@@ -6,11 +6,11 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.api.v2010.account.sip.domain.auth_types.auth_calls_mapping import AuthTypeCallsList
-from twilio.rest.api.v2010.account.sip.domain.auth_types.auth_registrations_mapping import AuthTypeRegistrationsList
 
 
 class AuthTypesList(ListResource):
@@ -44,6 +44,7 @@ class AuthTypesList(ListResource):
         :rtype: twilio.rest.api.v2010.account.sip.domain.auth_types.auth_calls_mapping.AuthTypeCallsList
         """
         if self._calls is None:
+            from twilio.rest.api.v2010.account.sip.domain.auth_types.auth_calls_mapping import AuthTypeCallsList
             self._calls = AuthTypeCallsList(
                 self._version,
                 account_sid=self._solution['account_sid'],
@@ -60,6 +61,7 @@ class AuthTypesList(ListResource):
         :rtype: twilio.rest.api.v2010.account.sip.domain.auth_types.auth_registrations_mapping.AuthTypeRegistrationsList
         """
         if self._registrations is None:
+            from twilio.rest.api.v2010.account.sip.domain.auth_types.auth_registrations_mapping import AuthTypeRegistrationsList
             self._registrations = AuthTypeRegistrationsList(
                 self._version,
                 account_sid=self._solution['account_sid'],
@@ -124,6 +126,8 @@ class AuthTypesPage(Page):
 
 class AuthTypesInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
     def __init__(self, version, payload, account_sid, domain_sid):
         """
         Initialize the AuthTypesInstance
@@ -145,3 +149,20 @@ class AuthTypesInstance(InstanceResource):
         :rtype: str
         """
         return '<Twilio.Api.V2010.AuthTypesInstance>'
+
+
+_LAZY_IMPORTS = {
+    'AuthTypeCallsList': 'twilio.rest.api.v2010.account.sip.domain.auth_types.auth_calls_mapping',
+    'AuthTypeRegistrationsList': 'twilio.rest.api.v2010.account.sip.domain.auth_types.auth_registrations_mapping',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
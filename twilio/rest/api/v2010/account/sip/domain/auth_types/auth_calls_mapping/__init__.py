@@ -6,11 +6,11 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.api.v2010.account.sip.domain.auth_types.auth_calls_mapping.auth_calls_credential_list_mapping import AuthCallsCredentialListMappingList
-from twilio.rest.api.v2010.account.sip.domain.auth_types.auth_calls_mapping.auth_calls_ip_access_control_list_mapping import AuthCallsIpAccessControlListMappingList
 
 
 class AuthTypeCallsList(ListResource):
@@ -44,6 +44,7 @@ class AuthTypeCallsList(ListResource):
         :rtype: twilio.rest.api.v2010.account.sip.domain.auth_types.auth_calls_mapping.auth_calls_credential_list_mapping.AuthCallsCredentialListMappingList
         """
         if self._credential_list_mappings is None:
+            from twilio.rest.api.v2010.account.sip.domain.auth_types.auth_calls_mapping.auth_calls_credential_list_mapping import AuthCallsCredentialListMappingList
             self._credential_list_mappings = AuthCallsCredentialListMappingList(
                 self._version,
                 account_sid=self._solution['account_sid'],
@@ -60,6 +61,7 @@ class AuthTypeCallsList(ListResource):
         :rtype: twilio.rest.api.v2010.account.sip.domain.auth_types.auth_calls_mapping.auth_calls_ip_access_control_list_mapping.AuthCallsIpAccessControlListMappingList
         """
         if self._ip_access_control_list_mappings is None:
+            from twilio.rest.api.v2010.account.sip.domain.auth_types.auth_calls_mapping.auth_calls_ip_access_control_list_mapping import AuthCallsIpAccessControlListMappingList
             self._ip_access_control_list_mappings = AuthCallsIpAccessControlListMappingList(
                 self._version,
                 account_sid=self._solution['account_sid'],
@@ -124,6 +126,8 @@ class AuthTypeCallsPage(Page):
 
 class AuthTypeCallsInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
     def __init__(self, version, payload, account_sid, domain_sid):
         """
         Initialize the AuthTypeCallsInstance
@@ -145,3 +149,20 @@ class AuthTypeCallsInstance(InstanceResource):
         :rtype: str
         """
         return '<Twilio.Api.V2010.AuthTypeCallsInstance>'
+
+
+_LAZY_IMPORTS = {
+    'AuthCallsCredentialListMappingList': 'twilio.rest.api.v2010.account.sip.domain.auth_types.auth_calls_mapping.auth_calls_credential_list_mapping',
+    'AuthCallsIpAccessControlListMappingList': 'twilio.rest.api.v2010.account.sip.domain.auth_types.auth_calls_mapping.auth_calls_ip_access_control_list_mapping',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
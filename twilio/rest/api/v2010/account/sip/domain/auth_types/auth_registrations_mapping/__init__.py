@@ -6,10 +6,11 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.api.v2010.account.sip.domain.auth_types.auth_registrations_mapping.auth_registrations_credential_list_mapping import AuthRegistrationsCredentialListMappingList
 
 
 class AuthTypeRegistrationsList(ListResource):
@@ -42,6 +43,7 @@ class AuthTypeRegistrationsList(ListResource):
         :rtype: twilio.rest.api.v2010.account.sip.domain.auth_types.auth_registrations_mapping.auth_registrations_credential_list_mapping.AuthRegistrationsCredentialListMappingList
         """
         if self._credential_list_mappings is None:
+            from twilio.rest.api.v2010.account.sip.domain.auth_types.auth_registrations_mapping.auth_registrations_credential_list_mapping import AuthRegistrationsCredentialListMappingList
             self._credential_list_mappings = AuthRegistrationsCredentialListMappingList(
                 self._version,
                 account_sid=self._solution['account_sid'],
@@ -106,6 +108,8 @@ class AuthTypeRegistrationsPage(Page):
 
 class AuthTypeRegistrationsInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
     def __init__(self, version, payload, account_sid, domain_sid):
         """
         Initialize the AuthTypeRegistrationsInstance
@@ -127,3 +131,19 @@ class AuthTypeRegistrationsInstance(InstanceResource):
         :rtype: str
         """
         return '<Twilio.Api.V2010.AuthTypeRegistrationsInstance>'
+
+
+_LAZY_IMPORTS = {
+    'AuthRegistrationsCredentialListMappingList': 'twilio.rest.api.v2010.account.sip.domain.auth_types.auth_registrations_mapping.auth_registrations_credential_list_mapping',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -34,9 +34,9 @@ class IpAddressList(ListResource):
             'account_sid': account_sid,
             'ip_access_control_list_sid': ip_access_control_list_sid,
         }
-        self._uri = '/Accounts/{account_sid}/SIP/IpAccessControlLists/{ip_access_control_list_sid}/IpAddresses.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/SIP/IpAccessControlLists/{ip_access_control_list_sid}/IpAddresses.json', self._solution)
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams IpAddressInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -49,17 +49,57 @@ class IpAddressList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.sip.ip_access_control_list.ip_address.IpAddressInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams IpAddressInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.sip.ip_access_control_list.ip_address.IpAddressInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists IpAddressInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -71,11 +111,42 @@ class IpAddressList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.sip.ip_access_control_list.ip_address.IpAddressInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists IpAddressInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.sip.ip_access_control_list.ip_address.IpAddressInstance]
+        """
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -96,6 +167,25 @@ class IpAddressList(ListResource):
 
         return IpAddressPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of IpAddressInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of IpAddressInstance
+        :rtype: twilio.rest.api.v2010.account.sip.ip_access_control_list.ip_address.IpAddressPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return IpAddressPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of IpAddressInstance records from the API.
@@ -113,13 +203,32 @@ class IpAddressList(ListResource):
 
         return IpAddressPage(self._version, response, self._solution)
 
-    def create(self, friendly_name, ip_address, cidr_prefix_length=values.unset):
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of IpAddressInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of IpAddressInstance
+        :rtype: twilio.rest.api.v2010.account.sip.ip_access_control_list.ip_address.IpAddressPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return IpAddressPage(self._version, response, self._solution)
+
+    def create(self, friendly_name, ip_address, cidr_prefix_length=values.unset, deadline=None):
         """
         Create the IpAddressInstance
 
         :param unicode friendly_name: A human readable descriptive text for this resource, up to 64 characters long.
         :param unicode ip_address: An IP address in dotted decimal notation from which you want to accept traffic. Any SIP requests from this IP address will be allowed by Twilio. IPv4 only supported today.
         :param unicode cidr_prefix_length: An integer representing the length of the CIDR prefix to use with this IP address when accepting traffic. By default the entire IP address is used.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created IpAddressInstance
         :rtype: twilio.rest.api.v2010.account.sip.ip_access_control_list.ip_address.IpAddressInstance
@@ -130,7 +239,36 @@ class IpAddressList(ListResource):
             'CidrPrefixLength': cidr_prefix_length,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return IpAddressInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            ip_access_control_list_sid=self._solution['ip_access_control_list_sid'],
+        )
+
+    async def create_async(self, friendly_name, ip_address, cidr_prefix_length=values.unset,
+                           deadline=None):
+        """
+        Asynchronous coroutine that creates the IpAddressInstance
+
+        :param unicode friendly_name: A human readable descriptive text for this resource, up to 64 characters long.
+        :param unicode ip_address: An IP address in dotted decimal notation from which you want to accept traffic. Any SIP requests from this IP address will be allowed by Twilio. IPv4 only supported today.
+        :param unicode cidr_prefix_length: An integer representing the length of the CIDR prefix to use with this IP address when accepting traffic. By default the entire IP address is used.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created IpAddressInstance
+        :rtype: twilio.rest.api.v2010.account.sip.ip_access_control_list.ip_address.IpAddressInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'IpAddress': ip_address,
+            'CidrPrefixLength': cidr_prefix_length,
+        })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return IpAddressInstance(
             self._version,
@@ -248,7 +386,7 @@ class IpAddressContext(InstanceContext):
             'ip_access_control_list_sid': ip_access_control_list_sid,
             'sid': sid,
         }
-        self._uri = '/Accounts/{account_sid}/SIP/IpAccessControlLists/{ip_access_control_list_sid}/IpAddresses/{sid}.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/SIP/IpAccessControlLists/{ip_access_control_list_sid}/IpAddresses/{sid}.json', self._solution)
 
     def fetch(self):
         """
@@ -267,6 +405,23 @@ class IpAddressContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the IpAddressInstance
+
+        :returns: The fetched IpAddressInstance
+        :rtype: twilio.rest.api.v2010.account.sip.ip_access_control_list.ip_address.IpAddressInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return IpAddressInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            ip_access_control_list_sid=self._solution['ip_access_control_list_sid'],
+            sid=self._solution['sid'],
+        )
+
     def update(self, ip_address=values.unset, friendly_name=values.unset,
                cidr_prefix_length=values.unset):
         """
@@ -295,6 +450,34 @@ class IpAddressContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, ip_address=values.unset, friendly_name=values.unset,
+                           cidr_prefix_length=values.unset):
+        """
+        Asynchronous coroutine that updates the IpAddressInstance
+
+        :param unicode ip_address: An IP address in dotted decimal notation from which you want to accept traffic. Any SIP requests from this IP address will be allowed by Twilio. IPv4 only supported today.
+        :param unicode friendly_name: A human readable descriptive text for this resource, up to 64 characters long.
+        :param unicode cidr_prefix_length: An integer representing the length of the CIDR prefix to use with this IP address when accepting traffic. By default the entire IP address is used.
+
+        :returns: The updated IpAddressInstance
+        :rtype: twilio.rest.api.v2010.account.sip.ip_access_control_list.ip_address.IpAddressInstance
+        """
+        data = values.of({
+            'IpAddress': ip_address,
+            'FriendlyName': friendly_name,
+            'CidrPrefixLength': cidr_prefix_length,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return IpAddressInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            ip_access_control_list_sid=self._solution['ip_access_control_list_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self):
         """
         Deletes the IpAddressInstance
@@ -304,6 +487,15 @@ class IpAddressContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the IpAddressInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -317,6 +509,28 @@ class IpAddressContext(InstanceContext):
 
 class IpAddressInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'cidr_prefix_length': deserialize.integer,
+        'date_created': deserialize.rfc2822_datetime,
+        'date_updated': deserialize.rfc2822_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'friendly_name': 'friendly_name',
+        'ip_address': 'ip_address',
+        'cidr_prefix_length': 'cidr_prefix_length',
+        'ip_access_control_list_sid': 'ip_access_control_list_sid',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'uri': 'uri',
+    }, _deserializers)
+
     def __init__(self, version, payload, account_sid, ip_access_control_list_sid,
                  sid=None):
         """
@@ -328,17 +542,7 @@ class IpAddressInstance(InstanceResource):
         super(IpAddressInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'friendly_name': payload.get('friendly_name'),
-            'ip_address': payload.get('ip_address'),
-            'cidr_prefix_length': deserialize.integer(payload.get('cidr_prefix_length')),
-            'ip_access_control_list_sid': payload.get('ip_access_control_list_sid'),
-            'date_created': deserialize.rfc2822_datetime(payload.get('date_created')),
-            'date_updated': deserialize.rfc2822_datetime(payload.get('date_updated')),
-            'uri': payload.get('uri'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -447,6 +651,15 @@ class IpAddressInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the IpAddressInstance
+
+        :returns: The fetched IpAddressInstance
+        :rtype: twilio.rest.api.v2010.account.sip.ip_access_control_list.ip_address.IpAddressInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, ip_address=values.unset, friendly_name=values.unset,
                cidr_prefix_length=values.unset):
         """
@@ -465,6 +678,24 @@ class IpAddressInstance(InstanceResource):
             cidr_prefix_length=cidr_prefix_length,
         )
 
+    async def update_async(self, ip_address=values.unset, friendly_name=values.unset,
+                           cidr_prefix_length=values.unset):
+        """
+        Asynchronous coroutine that updates the IpAddressInstance
+
+        :param unicode ip_address: An IP address in dotted decimal notation from which you want to accept traffic. Any SIP requests from this IP address will be allowed by Twilio. IPv4 only supported today.
+        :param unicode friendly_name: A human readable descriptive text for this resource, up to 64 characters long.
+        :param unicode cidr_prefix_length: An integer representing the length of the CIDR prefix to use with this IP address when accepting traffic. By default the entire IP address is used.
+
+        :returns: The updated IpAddressInstance
+        :rtype: twilio.rest.api.v2010.account.sip.ip_access_control_list.ip_address.IpAddressInstance
+        """
+        return await self._proxy.update_async(
+            ip_address=ip_address,
+            friendly_name=friendly_name,
+            cidr_prefix_length=cidr_prefix_length,
+        )
+
     def delete(self):
         """
         Deletes the IpAddressInstance
@@ -474,6 +705,15 @@ class IpAddressInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the IpAddressInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -29,20 +29,39 @@ class TokenList(ListResource):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, }
-        self._uri = '/Accounts/{account_sid}/Tokens.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/Tokens.json', self._solution)
 
-    def create(self, ttl=values.unset):
+    def create(self, ttl=values.unset, deadline=None):
         """
         Create the TokenInstance
 
         :param unicode ttl: The duration in seconds the credentials are valid
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created TokenInstance
         :rtype: twilio.rest.api.v2010.account.token.TokenInstance
         """
         data = values.of({'Ttl': ttl, })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return TokenInstance(self._version, payload, account_sid=self._solution['account_sid'], )
+
+    async def create_async(self, ttl=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the TokenInstance
+
+        :param unicode ttl: The duration in seconds the credentials are valid
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created TokenInstance
+        :rtype: twilio.rest.api.v2010.account.token.TokenInstance
+        """
+        data = values.of({'Ttl': ttl, })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return TokenInstance(self._version, payload, account_sid=self._solution['account_sid'], )
 
@@ -97,6 +116,25 @@ class TokenPage(Page):
 
 class TokenInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.rfc2822_datetime,
+        'date_updated': deserialize.rfc2822_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'ice_servers': 'ice_servers',
+        'password': 'password',
+        'ttl': 'ttl',
+        'username': 'username',
+    }, _deserializers)
+
     def __init__(self, version, payload, account_sid):
         """
         Initialize the TokenInstance
@@ -107,15 +145,7 @@ class TokenInstance(InstanceResource):
         super(TokenInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'date_created': deserialize.rfc2822_datetime(payload.get('date_created')),
-            'date_updated': deserialize.rfc2822_datetime(payload.get('date_updated')),
-            'ice_servers': payload.get('ice_servers'),
-            'password': payload.get('password'),
-            'ttl': payload.get('ttl'),
-            'username': payload.get('username'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
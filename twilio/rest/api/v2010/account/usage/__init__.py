@@ -6,11 +6,11 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.api.v2010.account.usage.record import RecordList
-from twilio.rest.api.v2010.account.usage.trigger import TriggerList
 
 
 class UsageList(ListResource):
@@ -43,6 +43,7 @@ class UsageList(ListResource):
         :rtype: twilio.rest.api.v2010.account.usage.record.RecordList
         """
         if self._records is None:
+            from twilio.rest.api.v2010.account.usage.record import RecordList
             self._records = RecordList(self._version, account_sid=self._solution['account_sid'], )
         return self._records
 
@@ -55,6 +56,7 @@ class UsageList(ListResource):
         :rtype: twilio.rest.api.v2010.account.usage.trigger.TriggerList
         """
         if self._triggers is None:
+            from twilio.rest.api.v2010.account.usage.trigger import TriggerList
             self._triggers = TriggerList(self._version, account_sid=self._solution['account_sid'], )
         return self._triggers
 
@@ -109,6 +111,8 @@ class UsagePage(Page):
 
 class UsageInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
     def __init__(self, version, payload, account_sid):
         """
         Initialize the UsageInstance
@@ -130,3 +134,20 @@ class UsageInstance(InstanceResource):
         :rtype: str
         """
         return '<Twilio.Api.V2010.UsageInstance>'
+
+
+_LAZY_IMPORTS = {
+    'RecordList': 'twilio.rest.api.v2010.account.usage.record',
+    'TriggerList': 'twilio.rest.api.v2010.account.usage.trigger',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -30,11 +30,11 @@ class AllTimeList(ListResource):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, }
-        self._uri = '/Accounts/{account_sid}/Usage/Records/AllTime.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/Usage/Records/AllTime.json', self._solution)
 
     def stream(self, category=values.unset, start_date=values.unset,
                end_date=values.unset, include_subaccounts=values.unset, limit=None,
-               page_size=None):
+               page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams AllTimeInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -51,25 +51,76 @@ class AllTimeList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.usage.record.all_time.AllTimeInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
-            category=category,
-            start_date=start_date,
-            end_date=end_date,
-            include_subaccounts=include_subaccounts,
-            page_size=limits['page_size'],
-        )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                category=category,
+                start_date=start_date,
+                end_date=end_date,
+                include_subaccounts=include_subaccounts,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, category=values.unset, start_date=values.unset,
+                           end_date=values.unset, include_subaccounts=values.unset, limit=None,
+                           page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams AllTimeInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param AllTimeInstance.Category category: The usage category of the UsageRecord resources to read
+        :param date start_date: Only include usage that has occurred on or after this date
+        :param date end_date: Only include usage that occurred on or before this date
+        :param bool include_subaccounts: Whether to include usage from the master account and all its subaccounts
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.usage.record.all_time.AllTimeInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                category=category,
+                start_date=start_date,
+                end_date=end_date,
+                include_subaccounts=include_subaccounts,
+                page_size=limits['page_size'],
+            )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, category=values.unset, start_date=values.unset,
              end_date=values.unset, include_subaccounts=values.unset, limit=None,
-             page_size=None):
+             page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists AllTimeInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -85,6 +136,12 @@ class AllTimeList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.usage.record.all_time.AllTimeInstance]
@@ -96,8 +153,51 @@ class AllTimeList(ListResource):
             include_subaccounts=include_subaccounts,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, category=values.unset, start_date=values.unset,
+                         end_date=values.unset, include_subaccounts=values.unset, limit=None,
+                         page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists AllTimeInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param AllTimeInstance.Category category: The usage category of the UsageRecord resources to read
+        :param date start_date: Only include usage that has occurred on or after this date
+        :param date end_date: Only include usage that occurred on or before this date
+        :param bool include_subaccounts: Whether to include usage from the master account and all its subaccounts
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.usage.record.all_time.AllTimeInstance]
+        """
+        return [record async for record in await self.stream_async(
+            category=category,
+            start_date=start_date,
+            end_date=end_date,
+            include_subaccounts=include_subaccounts,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, category=values.unset, start_date=values.unset,
              end_date=values.unset, include_subaccounts=values.unset,
              page_token=values.unset, page_number=values.unset,
@@ -131,6 +231,39 @@ class AllTimeList(ListResource):
 
         return AllTimePage(self._version, response, self._solution)
 
+    async def page_async(self, category=values.unset, start_date=values.unset,
+                         end_date=values.unset, include_subaccounts=values.unset,
+                         page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of AllTimeInstance records from the API.
+        Request is executed immediately
+
+        :param AllTimeInstance.Category category: The usage category of the UsageRecord resources to read
+        :param date start_date: Only include usage that has occurred on or after this date
+        :param date end_date: Only include usage that occurred on or before this date
+        :param bool include_subaccounts: Whether to include usage from the master account and all its subaccounts
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of AllTimeInstance
+        :rtype: twilio.rest.api.v2010.account.usage.record.all_time.AllTimePage
+        """
+        data = values.of({
+            'Category': category,
+            'StartDate': serialize.iso8601_date(start_date),
+            'EndDate': serialize.iso8601_date(end_date),
+            'IncludeSubaccounts': include_subaccounts,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return AllTimePage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of AllTimeInstance records from the API.
@@ -148,6 +281,23 @@ class AllTimeList(ListResource):
 
         return AllTimePage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of AllTimeInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of AllTimeInstance
+        :rtype: twilio.rest.api.v2010.account.usage.record.all_time.AllTimePage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return AllTimePage(self._version, response, self._solution)
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -444,6 +594,34 @@ class AllTimeInstance(InstanceResource):
         WIRELESS_USAGE_SMS = "wireless-usage-sms"
         WIRELESS_USAGE_VOICE = "wireless-usage-voice"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'end_date': deserialize.iso8601_date,
+        'price': deserialize.decimal,
+        'start_date': deserialize.iso8601_date,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'api_version': 'api_version',
+        'as_of': 'as_of',
+        'category': 'category',
+        'count': 'count',
+        'count_unit': 'count_unit',
+        'description': 'description',
+        'end_date': 'end_date',
+        'price': 'price',
+        'price_unit': 'price_unit',
+        'start_date': 'start_date',
+        'subresource_uris': 'subresource_uris',
+        'uri': 'uri',
+        'usage': 'usage',
+        'usage_unit': 'usage_unit',
+    }, _deserializers)
+
     def __init__(self, version, payload, account_sid):
         """
         Initialize the AllTimeInstance
@@ -454,23 +632,7 @@ class AllTimeInstance(InstanceResource):
         super(AllTimeInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'api_version': payload.get('api_version'),
-            'as_of': payload.get('as_of'),
-            'category': payload.get('category'),
-            'count': payload.get('count'),
-            'count_unit': payload.get('count_unit'),
-            'description': payload.get('description'),
-            'end_date': deserialize.iso8601_date(payload.get('end_date')),
-            'price': deserialize.decimal(payload.get('price')),
-            'price_unit': payload.get('price_unit'),
-            'start_date': deserialize.iso8601_date(payload.get('start_date')),
-            'subresource_uris': payload.get('subresource_uris'),
-            'uri': payload.get('uri'),
-            'usage': payload.get('usage'),
-            'usage_unit': payload.get('usage_unit'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
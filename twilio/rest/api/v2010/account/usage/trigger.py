@@ -30,11 +30,11 @@ class TriggerList(ListResource):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, }
-        self._uri = '/Accounts/{account_sid}/Usage/Triggers.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/Usage/Triggers.json', self._solution)
 
     def create(self, callback_url, trigger_value, usage_category,
                callback_method=values.unset, friendly_name=values.unset,
-               recurring=values.unset, trigger_by=values.unset):
+               recurring=values.unset, trigger_by=values.unset, deadline=None):
         """
         Create the TriggerInstance
 
@@ -45,6 +45,8 @@ class TriggerList(ListResource):
         :param unicode friendly_name: A string to describe the resource
         :param TriggerInstance.Recurring recurring: The frequency of a recurring UsageTrigger
         :param TriggerInstance.TriggerField trigger_by: The field in the UsageRecord resource that fires the trigger
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created TriggerInstance
         :rtype: twilio.rest.api.v2010.account.usage.trigger.TriggerInstance
@@ -59,12 +61,46 @@ class TriggerList(ListResource):
             'TriggerBy': trigger_by,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return TriggerInstance(self._version, payload, account_sid=self._solution['account_sid'], )
+
+    async def create_async(self, callback_url, trigger_value, usage_category,
+                           callback_method=values.unset, friendly_name=values.unset,
+                           recurring=values.unset, trigger_by=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the TriggerInstance
+
+        :param unicode callback_url: The URL we call when the trigger fires
+        :param unicode trigger_value: The usage value at which the trigger should fire
+        :param TriggerInstance.UsageCategory usage_category: The usage category the trigger watches
+        :param unicode callback_method: The HTTP method to use to call callback_url
+        :param unicode friendly_name: A string to describe the resource
+        :param TriggerInstance.Recurring recurring: The frequency of a recurring UsageTrigger
+        :param TriggerInstance.TriggerField trigger_by: The field in the UsageRecord resource that fires the trigger
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created TriggerInstance
+        :rtype: twilio.rest.api.v2010.account.usage.trigger.TriggerInstance
+        """
+        data = values.of({
+            'CallbackUrl': callback_url,
+            'TriggerValue': trigger_value,
+            'UsageCategory': usage_category,
+            'CallbackMethod': callback_method,
+            'FriendlyName': friendly_name,
+            'Recurring': recurring,
+            'TriggerBy': trigger_by,
+        })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return TriggerInstance(self._version, payload, account_sid=self._solution['account_sid'], )
 
     def stream(self, recurring=values.unset, trigger_by=values.unset,
-               usage_category=values.unset, limit=None, page_size=None):
+               usage_category=values.unset, limit=None, page_size=None,
+               prefetch=None, raw=False, deadline=None):
         """
         Streams TriggerInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -80,23 +116,73 @@ class TriggerList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.usage.trigger.TriggerInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
-            recurring=recurring,
-            trigger_by=trigger_by,
-            usage_category=usage_category,
-            page_size=limits['page_size'],
-        )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                recurring=recurring,
+                trigger_by=trigger_by,
+                usage_category=usage_category,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-        return self._version.stream(page, limits['limit'])
+    async def stream_async(self, recurring=values.unset, trigger_by=values.unset,
+                           usage_category=values.unset, limit=None, page_size=None,
+                           prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams TriggerInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param TriggerInstance.Recurring recurring: The frequency of recurring UsageTriggers to read
+        :param TriggerInstance.TriggerField trigger_by: The trigger field of the UsageTriggers to read
+        :param TriggerInstance.UsageCategory usage_category: The usage category of the UsageTriggers to read
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.usage.trigger.TriggerInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                recurring=recurring,
+                trigger_by=trigger_by,
+                usage_category=usage_category,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, recurring=values.unset, trigger_by=values.unset,
-             usage_category=values.unset, limit=None, page_size=None):
+             usage_category=values.unset, limit=None, page_size=None,
+             prefetch=None, raw=False, deadline=None):
         """
         Lists TriggerInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -111,6 +197,12 @@ class TriggerList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.api.v2010.account.usage.trigger.TriggerInstance]
@@ -121,8 +213,49 @@ class TriggerList(ListResource):
             usage_category=usage_category,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, recurring=values.unset, trigger_by=values.unset,
+                         usage_category=values.unset, limit=None, page_size=None,
+                         prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists TriggerInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param TriggerInstance.Recurring recurring: The frequency of recurring UsageTriggers to read
+        :param TriggerInstance.TriggerField trigger_by: The trigger field of the UsageTriggers to read
+        :param TriggerInstance.UsageCategory usage_category: The usage category of the UsageTriggers to read
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.api.v2010.account.usage.trigger.TriggerInstance]
+        """
+        return [record async for record in await self.stream_async(
+            recurring=recurring,
+            trigger_by=trigger_by,
+            usage_category=usage_category,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, recurring=values.unset, trigger_by=values.unset,
              usage_category=values.unset, page_token=values.unset,
              page_number=values.unset, page_size=values.unset):
@@ -153,6 +286,36 @@ class TriggerList(ListResource):
 
         return TriggerPage(self._version, response, self._solution)
 
+    async def page_async(self, recurring=values.unset, trigger_by=values.unset,
+                         usage_category=values.unset, page_token=values.unset,
+                         page_number=values.unset, page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of TriggerInstance records from the API.
+        Request is executed immediately
+
+        :param TriggerInstance.Recurring recurring: The frequency of recurring UsageTriggers to read
+        :param TriggerInstance.TriggerField trigger_by: The trigger field of the UsageTriggers to read
+        :param TriggerInstance.UsageCategory usage_category: The usage category of the UsageTriggers to read
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of TriggerInstance
+        :rtype: twilio.rest.api.v2010.account.usage.trigger.TriggerPage
+        """
+        data = values.of({
+            'Recurring': recurring,
+            'TriggerBy': trigger_by,
+            'UsageCategory': usage_category,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return TriggerPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of TriggerInstance records from the API.
@@ -170,6 +333,23 @@ class TriggerList(ListResource):
 
         return TriggerPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of TriggerInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of TriggerInstance
+        :rtype: twilio.rest.api.v2010.account.usage.trigger.TriggerPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return TriggerPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a TriggerContext
@@ -258,7 +438,7 @@ class TriggerContext(InstanceContext):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, 'sid': sid, }
-        self._uri = '/Accounts/{account_sid}/Usage/Triggers/{sid}.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/Usage/Triggers/{sid}.json', self._solution)
 
     def fetch(self):
         """
@@ -276,6 +456,22 @@ class TriggerContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the TriggerInstance
+
+        :returns: The fetched TriggerInstance
+        :rtype: twilio.rest.api.v2010.account.usage.trigger.TriggerInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return TriggerInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            sid=self._solution['sid'],
+        )
+
     def update(self, callback_method=values.unset, callback_url=values.unset,
                friendly_name=values.unset):
         """
@@ -303,6 +499,33 @@ class TriggerContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, callback_method=values.unset, callback_url=values.unset,
+                           friendly_name=values.unset):
+        """
+        Asynchronous coroutine that updates the TriggerInstance
+
+        :param unicode callback_method: The HTTP method to use to call callback_url
+        :param unicode callback_url: The URL we call when the trigger fires
+        :param unicode friendly_name: A string to describe the resource
+
+        :returns: The updated TriggerInstance
+        :rtype: twilio.rest.api.v2010.account.usage.trigger.TriggerInstance
+        """
+        data = values.of({
+            'CallbackMethod': callback_method,
+            'CallbackUrl': callback_url,
+            'FriendlyName': friendly_name,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return TriggerInstance(
+            self._version,
+            payload,
+            account_sid=self._solution['account_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self):
         """
         Deletes the TriggerInstance
@@ -312,6 +535,15 @@ class TriggerContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the TriggerInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -581,6 +813,35 @@ class TriggerInstance(InstanceResource):
         USAGE = "usage"
         PRICE = "price"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.rfc2822_datetime,
+        'date_fired': deserialize.rfc2822_datetime,
+        'date_updated': deserialize.rfc2822_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'api_version': 'api_version',
+        'callback_method': 'callback_method',
+        'callback_url': 'callback_url',
+        'current_value': 'current_value',
+        'date_created': 'date_created',
+        'date_fired': 'date_fired',
+        'date_updated': 'date_updated',
+        'friendly_name': 'friendly_name',
+        'recurring': 'recurring',
+        'sid': 'sid',
+        'trigger_by': 'trigger_by',
+        'trigger_value': 'trigger_value',
+        'uri': 'uri',
+        'usage_category': 'usage_category',
+        'usage_record_uri': 'usage_record_uri',
+    }, _deserializers)
+
     def __init__(self, version, payload, account_sid, sid=None):
         """
         Initialize the TriggerInstance
@@ -591,24 +852,7 @@ class TriggerInstance(InstanceResource):
         super(TriggerInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'api_version': payload.get('api_version'),
-            'callback_method': payload.get('callback_method'),
-            'callback_url': payload.get('callback_url'),
-            'current_value': payload.get('current_value'),
-            'date_created': deserialize.rfc2822_datetime(payload.get('date_created')),
-            'date_fired': deserialize.rfc2822_datetime(payload.get('date_fired')),
-            'date_updated': deserialize.rfc2822_datetime(payload.get('date_updated')),
-            'friendly_name': payload.get('friendly_name'),
-            'recurring': payload.get('recurring'),
-            'sid': payload.get('sid'),
-            'trigger_by': payload.get('trigger_by'),
-            'trigger_value': payload.get('trigger_value'),
-            'uri': payload.get('uri'),
-            'usage_category': payload.get('usage_category'),
-            'usage_record_uri': payload.get('usage_record_uri'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -768,6 +1012,15 @@ class TriggerInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the TriggerInstance
+
+        :returns: The fetched TriggerInstance
+        :rtype: twilio.rest.api.v2010.account.usage.trigger.TriggerInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, callback_method=values.unset, callback_url=values.unset,
                friendly_name=values.unset):
         """
@@ -786,6 +1039,24 @@ class TriggerInstance(InstanceResource):
             friendly_name=friendly_name,
         )
 
+    async def update_async(self, callback_method=values.unset, callback_url=values.unset,
+                           friendly_name=values.unset):
+        """
+        Asynchronous coroutine that updates the TriggerInstance
+
+        :param unicode callback_method: The HTTP method to use to call callback_url
+        :param unicode callback_url: The URL we call when the trigger fires
+        :param unicode friendly_name: A string to describe the resource
+
+        :returns: The updated TriggerInstance
+        :rtype: twilio.rest.api.v2010.account.usage.trigger.TriggerInstance
+        """
+        return await self._proxy.update_async(
+            callback_method=callback_method,
+            callback_url=callback_url,
+            friendly_name=friendly_name,
+        )
+
     def delete(self):
         """
         Deletes the TriggerInstance
@@ -795,6 +1066,15 @@ class TriggerInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the TriggerInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -6,6 +6,7 @@ This code was generated by
       /       /
 """
 
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
@@ -28,11 +29,11 @@ class ValidationRequestList(ListResource):
 
         # Path Solution
         self._solution = {'account_sid': account_sid, }
-        self._uri = '/Accounts/{account_sid}/OutgoingCallerIds.json'.format(**self._solution)
+        self._uri = values.ResourceUri('/Accounts/{account_sid}/OutgoingCallerIds.json', self._solution)
 
     def create(self, phone_number, friendly_name=values.unset,
                call_delay=values.unset, extension=values.unset,
-               status_callback=values.unset, status_callback_method=values.unset):
+               status_callback=values.unset, status_callback_method=values.unset, deadline=None):
         """
         Create the ValidationRequestInstance
 
@@ -42,6 +43,8 @@ class ValidationRequestList(ListResource):
         :param unicode extension: The digits to dial after connecting the verification call
         :param unicode status_callback: The URL we should call to send status information to your application
         :param unicode status_callback_method: The HTTP method we should use to call status_callback
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created ValidationRequestInstance
         :rtype: twilio.rest.api.v2010.account.validation_request.ValidationRequestInstance
@@ -55,7 +58,39 @@ class ValidationRequestList(ListResource):
             'StatusCallbackMethod': status_callback_method,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return ValidationRequestInstance(self._version, payload, account_sid=self._solution['account_sid'], )
+
+    async def create_async(self, phone_number, friendly_name=values.unset,
+                           call_delay=values.unset, extension=values.unset,
+                           status_callback=values.unset, status_callback_method=values.unset,
+                           deadline=None):
+        """
+        Asynchronous coroutine that creates the ValidationRequestInstance
+
+        :param unicode phone_number: The phone number to verify in E.164 format
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode call_delay: The number of seconds to delay before initiating the verification call
+        :param unicode extension: The digits to dial after connecting the verification call
+        :param unicode status_callback: The URL we should call to send status information to your application
+        :param unicode status_callback_method: The HTTP method we should use to call status_callback
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created ValidationRequestInstance
+        :rtype: twilio.rest.api.v2010.account.validation_request.ValidationRequestInstance
+        """
+        data = values.of({
+            'PhoneNumber': phone_number,
+            'FriendlyName': friendly_name,
+            'CallDelay': call_delay,
+            'Extension': extension,
+            'StatusCallback': status_callback,
+            'StatusCallbackMethod': status_callback_method,
+        })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return ValidationRequestInstance(self._version, payload, account_sid=self._solution['account_sid'], )
 
@@ -110,6 +145,17 @@ class ValidationRequestPage(Page):
 
 class ValidationRequestInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'call_sid': 'call_sid',
+        'friendly_name': 'friendly_name',
+        'phone_number': 'phone_number',
+        'validation_code': 'validation_code',
+    })
+
     def __init__(self, version, payload, account_sid):
         """
         Initialize the ValidationRequestInstance
@@ -120,13 +166,7 @@ class ValidationRequestInstance(InstanceResource):
         super(ValidationRequestInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'call_sid': payload.get('call_sid'),
-            'friendly_name': payload.get('friendly_name'),
-            'phone_number': payload.get('phone_number'),
-            'validation_code': payload.get('validation_code'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -6,9 +6,9 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base.version import Version
-from twilio.rest.autopilot.v1.assistant import AssistantList
-from twilio.rest.autopilot.v1.restore_assistant import RestoreAssistantList
 
 
 class V1(Version):
@@ -31,6 +31,7 @@ class V1(Version):
         :rtype: twilio.rest.autopilot.v1.assistant.AssistantList
         """
         if self._assistants is None:
+            from twilio.rest.autopilot.v1.assistant import AssistantList
             self._assistants = AssistantList(self)
         return self._assistants
 
@@ -40,6 +41,7 @@ class V1(Version):
         :rtype: twilio.rest.autopilot.v1.restore_assistant.RestoreAssistantList
         """
         if self._restore_assistant is None:
+            from twilio.rest.autopilot.v1.restore_assistant import RestoreAssistantList
             self._restore_assistant = RestoreAssistantList(self)
         return self._restore_assistant
 
@@ -51,3 +53,20 @@ class V1(Version):
         :rtype: str
         """
         return '<Twilio.Autopilot.V1>'
+
+
+_LAZY_IMPORTS = {
+    'AssistantList': 'twilio.rest.autopilot.v1.assistant',
+    'RestoreAssistantList': 'twilio.rest.autopilot.v1.restore_assistant',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
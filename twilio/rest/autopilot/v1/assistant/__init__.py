@@ -6,6 +6,8 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import serialize
 from twilio.base import values
@@ -13,14 +15,6 @@ from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.autopilot.v1.assistant.defaults import DefaultsList
-from twilio.rest.autopilot.v1.assistant.dialogue import DialogueList
-from twilio.rest.autopilot.v1.assistant.field_type import FieldTypeList
-from twilio.rest.autopilot.v1.assistant.model_build import ModelBuildList
-from twilio.rest.autopilot.v1.assistant.query import QueryList
-from twilio.rest.autopilot.v1.assistant.style_sheet import StyleSheetList
-from twilio.rest.autopilot.v1.assistant.task import TaskList
-from twilio.rest.autopilot.v1.assistant.webhook import WebhookList
 
 
 class AssistantList(ListResource):
@@ -41,9 +35,9 @@ class AssistantList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Assistants'.format(**self._solution)
+        self._uri = values.ResourceUri('/Assistants', self._solution)
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams AssistantInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -56,17 +50,57 @@ class AssistantList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.autopilot.v1.assistant.AssistantInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams AssistantInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.autopilot.v1.assistant.AssistantInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists AssistantInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -78,11 +112,42 @@ class AssistantList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.autopilot.v1.assistant.AssistantInstance]
+        """
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists AssistantInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.autopilot.v1.assistant.AssistantInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -103,6 +168,25 @@ class AssistantList(ListResource):
 
         return AssistantPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of AssistantInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of AssistantInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.AssistantPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return AssistantPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of AssistantInstance records from the API.
@@ -120,10 +204,27 @@ class AssistantList(ListResource):
 
         return AssistantPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of AssistantInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of AssistantInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.AssistantPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return AssistantPage(self._version, response, self._solution)
+
     def create(self, friendly_name=values.unset, log_queries=values.unset,
                unique_name=values.unset, callback_url=values.unset,
                callback_events=values.unset, style_sheet=values.unset,
-               defaults=values.unset):
+               defaults=values.unset, deadline=None):
         """
         Create the AssistantInstance
 
@@ -134,6 +235,42 @@ class AssistantList(ListResource):
         :param unicode callback_events: Reserved
         :param dict style_sheet: A JSON string that defines the Assistant's style sheet
         :param dict defaults: A JSON object that defines the Assistant's default tasks for various scenarios
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created AssistantInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.AssistantInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'LogQueries': log_queries,
+            'UniqueName': unique_name,
+            'CallbackUrl': callback_url,
+            'CallbackEvents': callback_events,
+            'StyleSheet': serialize.object(style_sheet),
+            'Defaults': serialize.object(defaults),
+        })
+
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return AssistantInstance(self._version, payload, )
+
+    async def create_async(self, friendly_name=values.unset, log_queries=values.unset,
+                           unique_name=values.unset, callback_url=values.unset,
+                           callback_events=values.unset, style_sheet=values.unset,
+                           defaults=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the AssistantInstance
+
+        :param unicode friendly_name: A string to describe the new resource
+        :param bool log_queries: Whether queries should be logged and kept after training
+        :param unicode unique_name: An application-defined string that uniquely identifies the new resource
+        :param unicode callback_url: Reserved
+        :param unicode callback_events: Reserved
+        :param dict style_sheet: A JSON string that defines the Assistant's style sheet
+        :param dict defaults: A JSON object that defines the Assistant's default tasks for various scenarios
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created AssistantInstance
         :rtype: twilio.rest.autopilot.v1.assistant.AssistantInstance
@@ -148,7 +285,7 @@ class AssistantList(ListResource):
             'Defaults': serialize.object(defaults),
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return AssistantInstance(self._version, payload, )
 
@@ -244,7 +381,7 @@ class AssistantContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/Assistants/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Assistants/{sid}', self._solution)
 
         # Dependents
         self._field_types = None
@@ -267,6 +404,17 @@ class AssistantContext(InstanceContext):
 
         return AssistantInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the AssistantInstance
+
+        :returns: The fetched AssistantInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.AssistantInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return AssistantInstance(self._version, payload, sid=self._solution['sid'], )
+
     def update(self, friendly_name=values.unset, log_queries=values.unset,
                unique_name=values.unset, callback_url=values.unset,
                callback_events=values.unset, style_sheet=values.unset,
@@ -301,6 +449,40 @@ class AssistantContext(InstanceContext):
 
         return AssistantInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def update_async(self, friendly_name=values.unset, log_queries=values.unset,
+                           unique_name=values.unset, callback_url=values.unset,
+                           callback_events=values.unset, style_sheet=values.unset,
+                           defaults=values.unset, development_stage=values.unset):
+        """
+        Asynchronous coroutine that updates the AssistantInstance
+
+        :param unicode friendly_name: A string to describe the resource
+        :param bool log_queries: Whether queries should be logged and kept after training
+        :param unicode unique_name: An application-defined string that uniquely identifies the resource
+        :param unicode callback_url: Reserved
+        :param unicode callback_events: Reserved
+        :param dict style_sheet: A JSON string that defines the Assistant's style sheet
+        :param dict defaults: A JSON object that defines the Assistant's `default tasks <https://www.twilio.com/docs/autopilot/api/assistant/defaults>`_ for various scenarios
+        :param unicode development_stage: A string describing the state of the assistant.
+
+        :returns: The updated AssistantInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.AssistantInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'LogQueries': log_queries,
+            'UniqueName': unique_name,
+            'CallbackUrl': callback_url,
+            'CallbackEvents': callback_events,
+            'StyleSheet': serialize.object(style_sheet),
+            'Defaults': serialize.object(defaults),
+            'DevelopmentStage': development_stage,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return AssistantInstance(self._version, payload, sid=self._solution['sid'], )
+
     def delete(self):
         """
         Deletes the AssistantInstance
@@ -310,6 +492,15 @@ class AssistantContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the AssistantInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     @property
     def field_types(self):
         """
@@ -319,6 +510,7 @@ class AssistantContext(InstanceContext):
         :rtype: twilio.rest.autopilot.v1.assistant.field_type.FieldTypeList
         """
         if self._field_types is None:
+            from twilio.rest.autopilot.v1.assistant.field_type import FieldTypeList
             self._field_types = FieldTypeList(self._version, assistant_sid=self._solution['sid'], )
         return self._field_types
 
@@ -331,6 +523,7 @@ class AssistantContext(InstanceContext):
         :rtype: twilio.rest.autopilot.v1.assistant.task.TaskList
         """
         if self._tasks is None:
+            from twilio.rest.autopilot.v1.assistant.task import TaskList
             self._tasks = TaskList(self._version, assistant_sid=self._solution['sid'], )
         return self._tasks
 
@@ -343,6 +536,7 @@ class AssistantContext(InstanceContext):
         :rtype: twilio.rest.autopilot.v1.assistant.model_build.ModelBuildList
         """
         if self._model_builds is None:
+            from twilio.rest.autopilot.v1.assistant.model_build import ModelBuildList
             self._model_builds = ModelBuildList(self._version, assistant_sid=self._solution['sid'], )
         return self._model_builds
 
@@ -355,6 +549,7 @@ class AssistantContext(InstanceContext):
         :rtype: twilio.rest.autopilot.v1.assistant.query.QueryList
         """
         if self._queries is None:
+            from twilio.rest.autopilot.v1.assistant.query import QueryList
             self._queries = QueryList(self._version, assistant_sid=self._solution['sid'], )
         return self._queries
 
@@ -367,6 +562,7 @@ class AssistantContext(InstanceContext):
         :rtype: twilio.rest.autopilot.v1.assistant.style_sheet.StyleSheetList
         """
         if self._style_sheet is None:
+            from twilio.rest.autopilot.v1.assistant.style_sheet import StyleSheetList
             self._style_sheet = StyleSheetList(self._version, assistant_sid=self._solution['sid'], )
         return self._style_sheet
 
@@ -379,6 +575,7 @@ class AssistantContext(InstanceContext):
         :rtype: twilio.rest.autopilot.v1.assistant.defaults.DefaultsList
         """
         if self._defaults is None:
+            from twilio.rest.autopilot.v1.assistant.defaults import DefaultsList
             self._defaults = DefaultsList(self._version, assistant_sid=self._solution['sid'], )
         return self._defaults
 
@@ -391,6 +588,7 @@ class AssistantContext(InstanceContext):
         :rtype: twilio.rest.autopilot.v1.assistant.dialogue.DialogueList
         """
         if self._dialogues is None:
+            from twilio.rest.autopilot.v1.assistant.dialogue import DialogueList
             self._dialogues = DialogueList(self._version, assistant_sid=self._solution['sid'], )
         return self._dialogues
 
@@ -403,6 +601,7 @@ class AssistantContext(InstanceContext):
         :rtype: twilio.rest.autopilot.v1.assistant.webhook.WebhookList
         """
         if self._webhooks is None:
+            from twilio.rest.autopilot.v1.assistant.webhook import WebhookList
             self._webhooks = WebhookList(self._version, assistant_sid=self._solution['sid'], )
         return self._webhooks
 
@@ -422,6 +621,32 @@ class AssistantInstance(InstanceResource):
     to change. Use them with caution. If you currently do not have developer
     preview access, please contact help@twilio.com. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'friendly_name': 'friendly_name',
+        'latest_model_build_sid': 'latest_model_build_sid',
+        'links': 'links',
+        'log_queries': 'log_queries',
+        'development_stage': 'development_stage',
+        'needs_model_build': 'needs_model_build',
+        'sid': 'sid',
+        'unique_name': 'unique_name',
+        'url': 'url',
+        'callback_url': 'callback_url',
+        'callback_events': 'callback_events',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the AssistantInstance
@@ -432,22 +657,7 @@ class AssistantInstance(InstanceResource):
         super(AssistantInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'friendly_name': payload.get('friendly_name'),
-            'latest_model_build_sid': payload.get('latest_model_build_sid'),
-            'links': payload.get('links'),
-            'log_queries': payload.get('log_queries'),
-            'development_stage': payload.get('development_stage'),
-            'needs_model_build': payload.get('needs_model_build'),
-            'sid': payload.get('sid'),
-            'unique_name': payload.get('unique_name'),
-            'url': payload.get('url'),
-            'callback_url': payload.get('callback_url'),
-            'callback_events': payload.get('callback_events'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -587,6 +797,15 @@ class AssistantInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the AssistantInstance
+
+        :returns: The fetched AssistantInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.AssistantInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, friendly_name=values.unset, log_queries=values.unset,
                unique_name=values.unset, callback_url=values.unset,
                callback_events=values.unset, style_sheet=values.unset,
@@ -617,6 +836,36 @@ class AssistantInstance(InstanceResource):
             development_stage=development_stage,
         )
 
+    async def update_async(self, friendly_name=values.unset, log_queries=values.unset,
+                           unique_name=values.unset, callback_url=values.unset,
+                           callback_events=values.unset, style_sheet=values.unset,
+                           defaults=values.unset, development_stage=values.unset):
+        """
+        Asynchronous coroutine that updates the AssistantInstance
+
+        :param unicode friendly_name: A string to describe the resource
+        :param bool log_queries: Whether queries should be logged and kept after training
+        :param unicode unique_name: An application-defined string that uniquely identifies the resource
+        :param unicode callback_url: Reserved
+        :param unicode callback_events: Reserved
+        :param dict style_sheet: A JSON string that defines the Assistant's style sheet
+        :param dict defaults: A JSON object that defines the Assistant's `default tasks <https://www.twilio.com/docs/autopilot/api/assistant/defaults>`_ for various scenarios
+        :param unicode development_stage: A string describing the state of the assistant.
+
+        :returns: The updated AssistantInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.AssistantInstance
+        """
+        return await self._proxy.update_async(
+            friendly_name=friendly_name,
+            log_queries=log_queries,
+            unique_name=unique_name,
+            callback_url=callback_url,
+            callback_events=callback_events,
+            style_sheet=style_sheet,
+            defaults=defaults,
+            development_stage=development_stage,
+        )
+
     def delete(self):
         """
         Deletes the AssistantInstance
@@ -626,6 +875,15 @@ class AssistantInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the AssistantInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     @property
     def field_types(self):
         """
@@ -715,3 +973,26 @@ class AssistantInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Autopilot.V1.AssistantInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'DefaultsList': 'twilio.rest.autopilot.v1.assistant.defaults',
+    'DialogueList': 'twilio.rest.autopilot.v1.assistant.dialogue',
+    'FieldTypeList': 'twilio.rest.autopilot.v1.assistant.field_type',
+    'ModelBuildList': 'twilio.rest.autopilot.v1.assistant.model_build',
+    'QueryList': 'twilio.rest.autopilot.v1.assistant.query',
+    'StyleSheetList': 'twilio.rest.autopilot.v1.assistant.style_sheet',
+    'TaskList': 'twilio.rest.autopilot.v1.assistant.task',
+    'WebhookList': 'twilio.rest.autopilot.v1.assistant.webhook',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -7,6 +7,7 @@ This code was generated by
 """
 
 from twilio.base import serialize
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
@@ -123,7 +124,7 @@ class DefaultsContext(InstanceContext):
 
         # Path Solution
         self._solution = {'assistant_sid': assistant_sid, }
-        self._uri = '/Assistants/{assistant_sid}/Defaults'.format(**self._solution)
+        self._uri = values.ResourceUri('/Assistants/{assistant_sid}/Defaults', self._solution)
 
     def fetch(self):
         """
@@ -136,6 +137,17 @@ class DefaultsContext(InstanceContext):
 
         return DefaultsInstance(self._version, payload, assistant_sid=self._solution['assistant_sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the DefaultsInstance
+
+        :returns: The fetched DefaultsInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.defaults.DefaultsInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return DefaultsInstance(self._version, payload, assistant_sid=self._solution['assistant_sid'], )
+
     def update(self, defaults=values.unset):
         """
         Update the DefaultsInstance
@@ -151,6 +163,21 @@ class DefaultsContext(InstanceContext):
 
         return DefaultsInstance(self._version, payload, assistant_sid=self._solution['assistant_sid'], )
 
+    async def update_async(self, defaults=values.unset):
+        """
+        Asynchronous coroutine that updates the DefaultsInstance
+
+        :param dict defaults: A JSON string that describes the default task links.
+
+        :returns: The updated DefaultsInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.defaults.DefaultsInstance
+        """
+        data = values.of({'Defaults': serialize.object(defaults), })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return DefaultsInstance(self._version, payload, assistant_sid=self._solution['assistant_sid'], )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -167,6 +194,16 @@ class DefaultsInstance(InstanceResource):
     to change. Use them with caution. If you currently do not have developer
     preview access, please contact help@twilio.com. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'assistant_sid': 'assistant_sid',
+        'url': 'url',
+        'data': 'data',
+    })
+
     def __init__(self, version, payload, assistant_sid):
         """
         Initialize the DefaultsInstance
@@ -177,12 +214,7 @@ class DefaultsInstance(InstanceResource):
         super(DefaultsInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'assistant_sid': payload.get('assistant_sid'),
-            'url': payload.get('url'),
-            'data': payload.get('data'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -242,6 +274,15 @@ class DefaultsInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the DefaultsInstance
+
+        :returns: The fetched DefaultsInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.defaults.DefaultsInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, defaults=values.unset):
         """
         Update the DefaultsInstance
@@ -253,6 +294,17 @@ class DefaultsInstance(InstanceResource):
         """
         return self._proxy.update(defaults=defaults, )
 
+    async def update_async(self, defaults=values.unset):
+        """
+        Asynchronous coroutine that updates the DefaultsInstance
+
+        :param dict defaults: A JSON string that describes the default task links.
+
+        :returns: The updated DefaultsInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.defaults.DefaultsInstance
+        """
+        return await self._proxy.update_async(defaults=defaults, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -6,6 +6,7 @@ This code was generated by
       /       /
 """
 
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
@@ -127,7 +128,7 @@ class DialogueContext(InstanceContext):
 
         # Path Solution
         self._solution = {'assistant_sid': assistant_sid, 'sid': sid, }
-        self._uri = '/Assistants/{assistant_sid}/Dialogues/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Assistants/{assistant_sid}/Dialogues/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -145,6 +146,22 @@ class DialogueContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the DialogueInstance
+
+        :returns: The fetched DialogueInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.dialogue.DialogueInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return DialogueInstance(
+            self._version,
+            payload,
+            assistant_sid=self._solution['assistant_sid'],
+            sid=self._solution['sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -161,6 +178,17 @@ class DialogueInstance(InstanceResource):
     to change. Use them with caution. If you currently do not have developer
     preview access, please contact help@twilio.com. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'assistant_sid': 'assistant_sid',
+        'sid': 'sid',
+        'data': 'data',
+        'url': 'url',
+    })
+
     def __init__(self, version, payload, assistant_sid, sid=None):
         """
         Initialize the DialogueInstance
@@ -171,13 +199,7 @@ class DialogueInstance(InstanceResource):
         super(DialogueInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'assistant_sid': payload.get('assistant_sid'),
-            'sid': payload.get('sid'),
-            'data': payload.get('data'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -249,6 +271,15 @@ class DialogueInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the DialogueInstance
+
+        :returns: The fetched DialogueInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.dialogue.DialogueInstance
+        """
+        return await self._proxy.fetch_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
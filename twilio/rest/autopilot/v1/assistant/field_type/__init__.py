@@ -6,13 +6,14 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.autopilot.v1.assistant.field_type.field_value import FieldValueList
 
 
 class FieldTypeList(ListResource):
@@ -34,9 +35,9 @@ class FieldTypeList(ListResource):
 
         # Path Solution
         self._solution = {'assistant_sid': assistant_sid, }
-        self._uri = '/Assistants/{assistant_sid}/FieldTypes'.format(**self._solution)
+        self._uri = values.ResourceUri('/Assistants/{assistant_sid}/FieldTypes', self._solution)
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams FieldTypeInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -49,17 +50,57 @@ class FieldTypeList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.autopilot.v1.assistant.field_type.FieldTypeInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams FieldTypeInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.autopilot.v1.assistant.field_type.FieldTypeInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists FieldTypeInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -71,11 +112,42 @@ class FieldTypeList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.autopilot.v1.assistant.field_type.FieldTypeInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists FieldTypeInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.autopilot.v1.assistant.field_type.FieldTypeInstance]
+        """
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -96,6 +168,25 @@ class FieldTypeList(ListResource):
 
         return FieldTypePage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of FieldTypeInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of FieldTypeInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.field_type.FieldTypePage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return FieldTypePage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of FieldTypeInstance records from the API.
@@ -113,19 +204,56 @@ class FieldTypeList(ListResource):
 
         return FieldTypePage(self._version, response, self._solution)
 
-    def create(self, unique_name, friendly_name=values.unset):
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of FieldTypeInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of FieldTypeInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.field_type.FieldTypePage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return FieldTypePage(self._version, response, self._solution)
+
+    def create(self, unique_name, friendly_name=values.unset, deadline=None):
         """
         Create the FieldTypeInstance
 
         :param unicode unique_name: An application-defined string that uniquely identifies the new resource
         :param unicode friendly_name: A string to describe the new resource
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created FieldTypeInstance
         :rtype: twilio.rest.autopilot.v1.assistant.field_type.FieldTypeInstance
         """
         data = values.of({'UniqueName': unique_name, 'FriendlyName': friendly_name, })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return FieldTypeInstance(self._version, payload, assistant_sid=self._solution['assistant_sid'], )
+
+    async def create_async(self, unique_name, friendly_name=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the FieldTypeInstance
+
+        :param unicode unique_name: An application-defined string that uniquely identifies the new resource
+        :param unicode friendly_name: A string to describe the new resource
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created FieldTypeInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.field_type.FieldTypeInstance
+        """
+        data = values.of({'UniqueName': unique_name, 'FriendlyName': friendly_name, })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return FieldTypeInstance(self._version, payload, assistant_sid=self._solution['assistant_sid'], )
 
@@ -223,7 +351,7 @@ class FieldTypeContext(InstanceContext):
 
         # Path Solution
         self._solution = {'assistant_sid': assistant_sid, 'sid': sid, }
-        self._uri = '/Assistants/{assistant_sid}/FieldTypes/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Assistants/{assistant_sid}/FieldTypes/{sid}', self._solution)
 
         # Dependents
         self._field_values = None
@@ -244,6 +372,22 @@ class FieldTypeContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the FieldTypeInstance
+
+        :returns: The fetched FieldTypeInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.field_type.FieldTypeInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return FieldTypeInstance(
+            self._version,
+            payload,
+            assistant_sid=self._solution['assistant_sid'],
+            sid=self._solution['sid'],
+        )
+
     def update(self, friendly_name=values.unset, unique_name=values.unset):
         """
         Update the FieldTypeInstance
@@ -265,6 +409,27 @@ class FieldTypeContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, friendly_name=values.unset, unique_name=values.unset):
+        """
+        Asynchronous coroutine that updates the FieldTypeInstance
+
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode unique_name: An application-defined string that uniquely identifies the resource
+
+        :returns: The updated FieldTypeInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.field_type.FieldTypeInstance
+        """
+        data = values.of({'FriendlyName': friendly_name, 'UniqueName': unique_name, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return FieldTypeInstance(
+            self._version,
+            payload,
+            assistant_sid=self._solution['assistant_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self):
         """
         Deletes the FieldTypeInstance
@@ -274,6 +439,15 @@ class FieldTypeContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the FieldTypeInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     @property
     def field_values(self):
         """
@@ -283,6 +457,7 @@ class FieldTypeContext(InstanceContext):
         :rtype: twilio.rest.autopilot.v1.assistant.field_type.field_value.FieldValueList
         """
         if self._field_values is None:
+            from twilio.rest.autopilot.v1.assistant.field_type.field_value import FieldValueList
             self._field_values = FieldValueList(
                 self._version,
                 assistant_sid=self._solution['assistant_sid'],
@@ -306,6 +481,27 @@ class FieldTypeInstance(InstanceResource):
     to change. Use them with caution. If you currently do not have developer
     preview access, please contact help@twilio.com. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'friendly_name': 'friendly_name',
+        'links': 'links',
+        'assistant_sid': 'assistant_sid',
+        'sid': 'sid',
+        'unique_name': 'unique_name',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload, assistant_sid, sid=None):
         """
         Initialize the FieldTypeInstance
@@ -316,17 +512,7 @@ class FieldTypeInstance(InstanceResource):
         super(FieldTypeInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'friendly_name': payload.get('friendly_name'),
-            'links': payload.get('links'),
-            'assistant_sid': payload.get('assistant_sid'),
-            'sid': payload.get('sid'),
-            'unique_name': payload.get('unique_name'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -430,6 +616,15 @@ class FieldTypeInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the FieldTypeInstance
+
+        :returns: The fetched FieldTypeInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.field_type.FieldTypeInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, friendly_name=values.unset, unique_name=values.unset):
         """
         Update the FieldTypeInstance
@@ -442,6 +637,18 @@ class FieldTypeInstance(InstanceResource):
         """
         return self._proxy.update(friendly_name=friendly_name, unique_name=unique_name, )
 
+    async def update_async(self, friendly_name=values.unset, unique_name=values.unset):
+        """
+        Asynchronous coroutine that updates the FieldTypeInstance
+
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode unique_name: An application-defined string that uniquely identifies the resource
+
+        :returns: The updated FieldTypeInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.field_type.FieldTypeInstance
+        """
+        return await self._proxy.update_async(friendly_name=friendly_name, unique_name=unique_name, )
+
     def delete(self):
         """
         Deletes the FieldTypeInstance
@@ -451,6 +658,15 @@ class FieldTypeInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the FieldTypeInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     @property
     def field_values(self):
         """
@@ -470,3 +686,19 @@ class FieldTypeInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Autopilot.V1.FieldTypeInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'FieldValueList': 'twilio.rest.autopilot.v1.assistant.field_type.field_value',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -33,9 +33,9 @@ class ModelBuildList(ListResource):
 
         # Path Solution
         self._solution = {'assistant_sid': assistant_sid, }
-        self._uri = '/Assistants/{assistant_sid}/ModelBuilds'.format(**self._solution)
+        self._uri = values.ResourceUri('/Assistants/{assistant_sid}/ModelBuilds', self._solution)
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams ModelBuildInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -48,17 +48,57 @@ class ModelBuildList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.autopilot.v1.assistant.model_build.ModelBuildInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams ModelBuildInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.autopilot.v1.assistant.model_build.ModelBuildInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists ModelBuildInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -70,11 +110,42 @@ class ModelBuildList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.autopilot.v1.assistant.model_build.ModelBuildInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists ModelBuildInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.autopilot.v1.assistant.model_build.ModelBuildInstance]
+        """
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -95,6 +166,25 @@ class ModelBuildList(ListResource):
 
         return ModelBuildPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of ModelBuildInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of ModelBuildInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.model_build.ModelBuildPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return ModelBuildPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of ModelBuildInstance records from the API.
@@ -112,19 +202,57 @@ class ModelBuildList(ListResource):
 
         return ModelBuildPage(self._version, response, self._solution)
 
-    def create(self, status_callback=values.unset, unique_name=values.unset):
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of ModelBuildInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of ModelBuildInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.model_build.ModelBuildPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return ModelBuildPage(self._version, response, self._solution)
+
+    def create(self, status_callback=values.unset, unique_name=values.unset, deadline=None):
         """
         Create the ModelBuildInstance
 
         :param unicode status_callback: The URL we should call using a POST method to send status information to your application
         :param unicode unique_name: An application-defined string that uniquely identifies the new resource
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created ModelBuildInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.model_build.ModelBuildInstance
+        """
+        data = values.of({'StatusCallback': status_callback, 'UniqueName': unique_name, })
+
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return ModelBuildInstance(self._version, payload, assistant_sid=self._solution['assistant_sid'], )
+
+    async def create_async(self, status_callback=values.unset, unique_name=values.unset,
+                           deadline=None):
+        """
+        Asynchronous coroutine that creates the ModelBuildInstance
+
+        :param unicode status_callback: The URL we should call using a POST method to send status information to your application
+        :param unicode unique_name: An application-defined string that uniquely identifies the new resource
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created ModelBuildInstance
         :rtype: twilio.rest.autopilot.v1.assistant.model_build.ModelBuildInstance
         """
         data = values.of({'StatusCallback': status_callback, 'UniqueName': unique_name, })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return ModelBuildInstance(self._version, payload, assistant_sid=self._solution['assistant_sid'], )
 
@@ -222,7 +350,7 @@ class ModelBuildContext(InstanceContext):
 
         # Path Solution
         self._solution = {'assistant_sid': assistant_sid, 'sid': sid, }
-        self._uri = '/Assistants/{assistant_sid}/ModelBuilds/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Assistants/{assistant_sid}/ModelBuilds/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -240,6 +368,22 @@ class ModelBuildContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ModelBuildInstance
+
+        :returns: The fetched ModelBuildInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.model_build.ModelBuildInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return ModelBuildInstance(
+            self._version,
+            payload,
+            assistant_sid=self._solution['assistant_sid'],
+            sid=self._solution['sid'],
+        )
+
     def update(self, unique_name=values.unset):
         """
         Update the ModelBuildInstance
@@ -260,6 +404,26 @@ class ModelBuildContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, unique_name=values.unset):
+        """
+        Asynchronous coroutine that updates the ModelBuildInstance
+
+        :param unicode unique_name: An application-defined string that uniquely identifies the resource
+
+        :returns: The updated ModelBuildInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.model_build.ModelBuildInstance
+        """
+        data = values.of({'UniqueName': unique_name, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return ModelBuildInstance(
+            self._version,
+            payload,
+            assistant_sid=self._solution['assistant_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self):
         """
         Deletes the ModelBuildInstance
@@ -269,6 +433,15 @@ class ModelBuildContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the ModelBuildInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -292,6 +465,30 @@ class ModelBuildInstance(InstanceResource):
         FAILED = "failed"
         CANCELED = "canceled"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+        'build_duration': deserialize.integer,
+        'error_code': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'assistant_sid': 'assistant_sid',
+        'sid': 'sid',
+        'status': 'status',
+        'unique_name': 'unique_name',
+        'url': 'url',
+        'build_duration': 'build_duration',
+        'error_code': 'error_code',
+    }, _deserializers)
+
     def __init__(self, version, payload, assistant_sid, sid=None):
         """
         Initialize the ModelBuildInstance
@@ -302,18 +499,7 @@ class ModelBuildInstance(InstanceResource):
         super(ModelBuildInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'assistant_sid': payload.get('assistant_sid'),
-            'sid': payload.get('sid'),
-            'status': payload.get('status'),
-            'unique_name': payload.get('unique_name'),
-            'url': payload.get('url'),
-            'build_duration': deserialize.integer(payload.get('build_duration')),
-            'error_code': deserialize.integer(payload.get('error_code')),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -425,6 +611,15 @@ class ModelBuildInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ModelBuildInstance
+
+        :returns: The fetched ModelBuildInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.model_build.ModelBuildInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, unique_name=values.unset):
         """
         Update the ModelBuildInstance
@@ -436,6 +631,17 @@ class ModelBuildInstance(InstanceResource):
         """
         return self._proxy.update(unique_name=unique_name, )
 
+    async def update_async(self, unique_name=values.unset):
+        """
+        Asynchronous coroutine that updates the ModelBuildInstance
+
+        :param unicode unique_name: An application-defined string that uniquely identifies the resource
+
+        :returns: The updated ModelBuildInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.model_build.ModelBuildInstance
+        """
+        return await self._proxy.update_async(unique_name=unique_name, )
+
     def delete(self):
         """
         Deletes the ModelBuildInstance
@@ -445,6 +651,15 @@ class ModelBuildInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the ModelBuildInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -33,11 +33,11 @@ class QueryList(ListResource):
 
         # Path Solution
         self._solution = {'assistant_sid': assistant_sid, }
-        self._uri = '/Assistants/{assistant_sid}/Queries'.format(**self._solution)
+        self._uri = values.ResourceUri('/Assistants/{assistant_sid}/Queries', self._solution)
 
     def stream(self, language=values.unset, model_build=values.unset,
                status=values.unset, dialogue_sid=values.unset, limit=None,
-               page_size=None):
+               page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams QueryInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -54,25 +54,76 @@ class QueryList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.autopilot.v1.assistant.query.QueryInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
-            language=language,
-            model_build=model_build,
-            status=status,
-            dialogue_sid=dialogue_sid,
-            page_size=limits['page_size'],
-        )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                language=language,
+                model_build=model_build,
+                status=status,
+                dialogue_sid=dialogue_sid,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, language=values.unset, model_build=values.unset,
+                           status=values.unset, dialogue_sid=values.unset, limit=None,
+                           page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams QueryInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param unicode language: The ISO language-country string that specifies the language used by the Query resources to read
+        :param unicode model_build: The SID or unique name of the Model Build to be queried
+        :param unicode status: The status of the resources to read
+        :param unicode dialogue_sid: The SID of the `Dialogue <https://www.twilio.com/docs/autopilot/api/dialogue>`_.
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.autopilot.v1.assistant.query.QueryInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                language=language,
+                model_build=model_build,
+                status=status,
+                dialogue_sid=dialogue_sid,
+                page_size=limits['page_size'],
+            )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, language=values.unset, model_build=values.unset,
              status=values.unset, dialogue_sid=values.unset, limit=None,
-             page_size=None):
+             page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists QueryInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -88,6 +139,12 @@ class QueryList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.autopilot.v1.assistant.query.QueryInstance]
@@ -99,8 +156,51 @@ class QueryList(ListResource):
             dialogue_sid=dialogue_sid,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, language=values.unset, model_build=values.unset,
+                         status=values.unset, dialogue_sid=values.unset, limit=None,
+                         page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists QueryInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param unicode language: The ISO language-country string that specifies the language used by the Query resources to read
+        :param unicode model_build: The SID or unique name of the Model Build to be queried
+        :param unicode status: The status of the resources to read
+        :param unicode dialogue_sid: The SID of the `Dialogue <https://www.twilio.com/docs/autopilot/api/dialogue>`_.
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.autopilot.v1.assistant.query.QueryInstance]
+        """
+        return [record async for record in await self.stream_async(
+            language=language,
+            model_build=model_build,
+            status=status,
+            dialogue_sid=dialogue_sid,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, language=values.unset, model_build=values.unset,
              status=values.unset, dialogue_sid=values.unset,
              page_token=values.unset, page_number=values.unset,
@@ -134,6 +234,39 @@ class QueryList(ListResource):
 
         return QueryPage(self._version, response, self._solution)
 
+    async def page_async(self, language=values.unset, model_build=values.unset,
+                         status=values.unset, dialogue_sid=values.unset,
+                         page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of QueryInstance records from the API.
+        Request is executed immediately
+
+        :param unicode language: The ISO language-country string that specifies the language used by the Query resources to read
+        :param unicode model_build: The SID or unique name of the Model Build to be queried
+        :param unicode status: The status of the resources to read
+        :param unicode dialogue_sid: The SID of the `Dialogue <https://www.twilio.com/docs/autopilot/api/dialogue>`_.
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of QueryInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.query.QueryPage
+        """
+        data = values.of({
+            'Language': language,
+            'ModelBuild': model_build,
+            'Status': status,
+            'DialogueSid': dialogue_sid,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return QueryPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of QueryInstance records from the API.
@@ -151,7 +284,24 @@ class QueryList(ListResource):
 
         return QueryPage(self._version, response, self._solution)
 
-    def create(self, language, query, tasks=values.unset, model_build=values.unset):
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of QueryInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of QueryInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.query.QueryPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return QueryPage(self._version, response, self._solution)
+
+    def create(self, language, query, tasks=values.unset, model_build=values.unset, deadline=None):
         """
         Create the QueryInstance
 
@@ -159,13 +309,36 @@ class QueryList(ListResource):
         :param unicode query: The end-user's natural language input
         :param unicode tasks: The list of tasks to limit the new query to
         :param unicode model_build: The SID or unique name of the Model Build to be queried
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created QueryInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.query.QueryInstance
+        """
+        data = values.of({'Language': language, 'Query': query, 'Tasks': tasks, 'ModelBuild': model_build, })
+
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return QueryInstance(self._version, payload, assistant_sid=self._solution['assistant_sid'], )
+
+    async def create_async(self, language, query, tasks=values.unset, model_build=values.unset,
+                           deadline=None):
+        """
+        Asynchronous coroutine that creates the QueryInstance
+
+        :param unicode language: The ISO language-country string that specifies the language used for the new query
+        :param unicode query: The end-user's natural language input
+        :param unicode tasks: The list of tasks to limit the new query to
+        :param unicode model_build: The SID or unique name of the Model Build to be queried
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created QueryInstance
         :rtype: twilio.rest.autopilot.v1.assistant.query.QueryInstance
         """
         data = values.of({'Language': language, 'Query': query, 'Tasks': tasks, 'ModelBuild': model_build, })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return QueryInstance(self._version, payload, assistant_sid=self._solution['assistant_sid'], )
 
@@ -263,7 +436,7 @@ class QueryContext(InstanceContext):
 
         # Path Solution
         self._solution = {'assistant_sid': assistant_sid, 'sid': sid, }
-        self._uri = '/Assistants/{assistant_sid}/Queries/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Assistants/{assistant_sid}/Queries/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -281,6 +454,22 @@ class QueryContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the QueryInstance
+
+        :returns: The fetched QueryInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.query.QueryInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return QueryInstance(
+            self._version,
+            payload,
+            assistant_sid=self._solution['assistant_sid'],
+            sid=self._solution['sid'],
+        )
+
     def update(self, sample_sid=values.unset, status=values.unset):
         """
         Update the QueryInstance
@@ -302,6 +491,27 @@ class QueryContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, sample_sid=values.unset, status=values.unset):
+        """
+        Asynchronous coroutine that updates the QueryInstance
+
+        :param unicode sample_sid: The SID of an optional reference to the Sample created from the query
+        :param unicode status: The new status of the resource
+
+        :returns: The updated QueryInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.query.QueryInstance
+        """
+        data = values.of({'SampleSid': sample_sid, 'Status': status, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return QueryInstance(
+            self._version,
+            payload,
+            assistant_sid=self._solution['assistant_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self):
         """
         Deletes the QueryInstance
@@ -311,6 +521,15 @@ class QueryContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the QueryInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -327,6 +546,32 @@ class QueryInstance(InstanceResource):
     to change. Use them with caution. If you currently do not have developer
     preview access, please contact help@twilio.com. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'results': 'results',
+        'language': 'language',
+        'model_build_sid': 'model_build_sid',
+        'query': 'query',
+        'sample_sid': 'sample_sid',
+        'assistant_sid': 'assistant_sid',
+        'sid': 'sid',
+        'status': 'status',
+        'url': 'url',
+        'source_channel': 'source_channel',
+        'dialogue_sid': 'dialogue_sid',
+    }, _deserializers)
+
     def __init__(self, version, payload, assistant_sid, sid=None):
         """
         Initialize the QueryInstance
@@ -337,22 +582,7 @@ class QueryInstance(InstanceResource):
         super(QueryInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'results': payload.get('results'),
-            'language': payload.get('language'),
-            'model_build_sid': payload.get('model_build_sid'),
-            'query': payload.get('query'),
-            'sample_sid': payload.get('sample_sid'),
-            'assistant_sid': payload.get('assistant_sid'),
-            'sid': payload.get('sid'),
-            'status': payload.get('status'),
-            'url': payload.get('url'),
-            'source_channel': payload.get('source_channel'),
-            'dialogue_sid': payload.get('dialogue_sid'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -496,6 +726,15 @@ class QueryInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the QueryInstance
+
+        :returns: The fetched QueryInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.query.QueryInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, sample_sid=values.unset, status=values.unset):
         """
         Update the QueryInstance
@@ -508,6 +747,18 @@ class QueryInstance(InstanceResource):
         """
         return self._proxy.update(sample_sid=sample_sid, status=status, )
 
+    async def update_async(self, sample_sid=values.unset, status=values.unset):
+        """
+        Asynchronous coroutine that updates the QueryInstance
+
+        :param unicode sample_sid: The SID of an optional reference to the Sample created from the query
+        :param unicode status: The new status of the resource
+
+        :returns: The updated QueryInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.query.QueryInstance
+        """
+        return await self._proxy.update_async(sample_sid=sample_sid, status=status, )
+
     def delete(self):
         """
         Deletes the QueryInstance
@@ -517,6 +768,15 @@ class QueryInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the QueryInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
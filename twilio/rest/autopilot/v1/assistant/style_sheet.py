@@ -7,6 +7,7 @@ This code was generated by
 """
 
 from twilio.base import serialize
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
@@ -123,7 +124,7 @@ class StyleSheetContext(InstanceContext):
 
         # Path Solution
         self._solution = {'assistant_sid': assistant_sid, }
-        self._uri = '/Assistants/{assistant_sid}/StyleSheet'.format(**self._solution)
+        self._uri = values.ResourceUri('/Assistants/{assistant_sid}/StyleSheet', self._solution)
 
     def fetch(self):
         """
@@ -136,6 +137,17 @@ class StyleSheetContext(InstanceContext):
 
         return StyleSheetInstance(self._version, payload, assistant_sid=self._solution['assistant_sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the StyleSheetInstance
+
+        :returns: The fetched StyleSheetInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.style_sheet.StyleSheetInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return StyleSheetInstance(self._version, payload, assistant_sid=self._solution['assistant_sid'], )
+
     def update(self, style_sheet=values.unset):
         """
         Update the StyleSheetInstance
@@ -151,6 +163,21 @@ class StyleSheetContext(InstanceContext):
 
         return StyleSheetInstance(self._version, payload, assistant_sid=self._solution['assistant_sid'], )
 
+    async def update_async(self, style_sheet=values.unset):
+        """
+        Asynchronous coroutine that updates the StyleSheetInstance
+
+        :param dict style_sheet: The JSON string that describes the style sheet object
+
+        :returns: The updated StyleSheetInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.style_sheet.StyleSheetInstance
+        """
+        data = values.of({'StyleSheet': serialize.object(style_sheet), })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return StyleSheetInstance(self._version, payload, assistant_sid=self._solution['assistant_sid'], )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -167,6 +194,16 @@ class StyleSheetInstance(InstanceResource):
     to change. Use them with caution. If you currently do not have developer
     preview access, please contact help@twilio.com. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'assistant_sid': 'assistant_sid',
+        'url': 'url',
+        'data': 'data',
+    })
+
     def __init__(self, version, payload, assistant_sid):
         """
         Initialize the StyleSheetInstance
@@ -177,12 +214,7 @@ class StyleSheetInstance(InstanceResource):
         super(StyleSheetInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'assistant_sid': payload.get('assistant_sid'),
-            'url': payload.get('url'),
-            'data': payload.get('data'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -242,6 +274,15 @@ class StyleSheetInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the StyleSheetInstance
+
+        :returns: The fetched StyleSheetInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.style_sheet.StyleSheetInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, style_sheet=values.unset):
         """
         Update the StyleSheetInstance
@@ -253,6 +294,17 @@ class StyleSheetInstance(InstanceResource):
         """
         return self._proxy.update(style_sheet=style_sheet, )
 
+    async def update_async(self, style_sheet=values.unset):
+        """
+        Asynchronous coroutine that updates the StyleSheetInstance
+
+        :param dict style_sheet: The JSON string that describes the style sheet object
+
+        :returns: The updated StyleSheetInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.style_sheet.StyleSheetInstance
+        """
+        return await self._proxy.update_async(style_sheet=style_sheet, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -6,6 +6,8 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import serialize
 from twilio.base import values
@@ -13,10 +15,6 @@ from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.autopilot.v1.assistant.task.field import FieldList
-from twilio.rest.autopilot.v1.assistant.task.sample import SampleList
-from twilio.rest.autopilot.v1.assistant.task.task_actions import TaskActionsList
-from twilio.rest.autopilot.v1.assistant.task.task_statistics import TaskStatisticsList
 
 
 class TaskList(ListResource):
@@ -38,9 +36,9 @@ class TaskList(ListResource):
 
         # Path Solution
         self._solution = {'assistant_sid': assistant_sid, }
-        self._uri = '/Assistants/{assistant_sid}/Tasks'.format(**self._solution)
+        self._uri = values.ResourceUri('/Assistants/{assistant_sid}/Tasks', self._solution)
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams TaskInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -53,17 +51,57 @@ class TaskList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.autopilot.v1.assistant.task.TaskInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams TaskInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.autopilot.v1.assistant.task.TaskInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists TaskInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -75,11 +113,42 @@ class TaskList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.autopilot.v1.assistant.task.TaskInstance]
+        """
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists TaskInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.autopilot.v1.assistant.task.TaskInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -100,6 +169,25 @@ class TaskList(ListResource):
 
         return TaskPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of TaskInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of TaskInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.task.TaskPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return TaskPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of TaskInstance records from the API.
@@ -117,8 +205,25 @@ class TaskList(ListResource):
 
         return TaskPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of TaskInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of TaskInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.task.TaskPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return TaskPage(self._version, response, self._solution)
+
     def create(self, unique_name, friendly_name=values.unset, actions=values.unset,
-               actions_url=values.unset):
+               actions_url=values.unset, deadline=None):
         """
         Create the TaskInstance
 
@@ -126,6 +231,34 @@ class TaskList(ListResource):
         :param unicode friendly_name:  descriptive string that you create to describe the new resource
         :param dict actions: The JSON string that specifies the actions that instruct the Assistant on how to perform the task
         :param unicode actions_url: The URL from which the Assistant can fetch actions
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created TaskInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.task.TaskInstance
+        """
+        data = values.of({
+            'UniqueName': unique_name,
+            'FriendlyName': friendly_name,
+            'Actions': serialize.object(actions),
+            'ActionsUrl': actions_url,
+        })
+
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return TaskInstance(self._version, payload, assistant_sid=self._solution['assistant_sid'], )
+
+    async def create_async(self, unique_name, friendly_name=values.unset, actions=values.unset,
+                           actions_url=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the TaskInstance
+
+        :param unicode unique_name: An application-defined string that uniquely identifies the resource
+        :param unicode friendly_name:  descriptive string that you create to describe the new resource
+        :param dict actions: The JSON string that specifies the actions that instruct the Assistant on how to perform the task
+        :param unicode actions_url: The URL from which the Assistant can fetch actions
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created TaskInstance
         :rtype: twilio.rest.autopilot.v1.assistant.task.TaskInstance
@@ -137,7 +270,7 @@ class TaskList(ListResource):
             'ActionsUrl': actions_url,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return TaskInstance(self._version, payload, assistant_sid=self._solution['assistant_sid'], )
 
@@ -235,7 +368,7 @@ class TaskContext(InstanceContext):
 
         # Path Solution
         self._solution = {'assistant_sid': assistant_sid, 'sid': sid, }
-        self._uri = '/Assistants/{assistant_sid}/Tasks/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Assistants/{assistant_sid}/Tasks/{sid}', self._solution)
 
         # Dependents
         self._fields = None
@@ -259,6 +392,22 @@ class TaskContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the TaskInstance
+
+        :returns: The fetched TaskInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.task.TaskInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return TaskInstance(
+            self._version,
+            payload,
+            assistant_sid=self._solution['assistant_sid'],
+            sid=self._solution['sid'],
+        )
+
     def update(self, friendly_name=values.unset, unique_name=values.unset,
                actions=values.unset, actions_url=values.unset):
         """
@@ -288,6 +437,35 @@ class TaskContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, friendly_name=values.unset, unique_name=values.unset,
+                           actions=values.unset, actions_url=values.unset):
+        """
+        Asynchronous coroutine that updates the TaskInstance
+
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode unique_name: An application-defined string that uniquely identifies the resource
+        :param dict actions: The JSON string that specifies the actions that instruct the Assistant on how to perform the task
+        :param unicode actions_url: The URL from which the Assistant can fetch actions
+
+        :returns: The updated TaskInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.task.TaskInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'UniqueName': unique_name,
+            'Actions': serialize.object(actions),
+            'ActionsUrl': actions_url,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return TaskInstance(
+            self._version,
+            payload,
+            assistant_sid=self._solution['assistant_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self):
         """
         Deletes the TaskInstance
@@ -297,6 +475,15 @@ class TaskContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the TaskInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     @property
     def fields(self):
         """
@@ -306,6 +493,7 @@ class TaskContext(InstanceContext):
         :rtype: twilio.rest.autopilot.v1.assistant.task.field.FieldList
         """
         if self._fields is None:
+            from twilio.rest.autopilot.v1.assistant.task.field import FieldList
             self._fields = FieldList(
                 self._version,
                 assistant_sid=self._solution['assistant_sid'],
@@ -322,6 +510,7 @@ class TaskContext(InstanceContext):
         :rtype: twilio.rest.autopilot.v1.assistant.task.sample.SampleList
         """
         if self._samples is None:
+            from twilio.rest.autopilot.v1.assistant.task.sample import SampleList
             self._samples = SampleList(
                 self._version,
                 assistant_sid=self._solution['assistant_sid'],
@@ -338,6 +527,7 @@ class TaskContext(InstanceContext):
         :rtype: twilio.rest.autopilot.v1.assistant.task.task_actions.TaskActionsList
         """
         if self._task_actions is None:
+            from twilio.rest.autopilot.v1.assistant.task.task_actions import TaskActionsList
             self._task_actions = TaskActionsList(
                 self._version,
                 assistant_sid=self._solution['assistant_sid'],
@@ -354,6 +544,7 @@ class TaskContext(InstanceContext):
         :rtype: twilio.rest.autopilot.v1.assistant.task.task_statistics.TaskStatisticsList
         """
         if self._statistics is None:
+            from twilio.rest.autopilot.v1.assistant.task.task_statistics import TaskStatisticsList
             self._statistics = TaskStatisticsList(
                 self._version,
                 assistant_sid=self._solution['assistant_sid'],
@@ -377,6 +568,28 @@ class TaskInstance(InstanceResource):
     to change. Use them with caution. If you currently do not have developer
     preview access, please contact help@twilio.com. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'friendly_name': 'friendly_name',
+        'links': 'links',
+        'assistant_sid': 'assistant_sid',
+        'sid': 'sid',
+        'unique_name': 'unique_name',
+        'actions_url': 'actions_url',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload, assistant_sid, sid=None):
         """
         Initialize the TaskInstance
@@ -387,18 +600,7 @@ class TaskInstance(InstanceResource):
         super(TaskInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'friendly_name': payload.get('friendly_name'),
-            'links': payload.get('links'),
-            'assistant_sid': payload.get('assistant_sid'),
-            'sid': payload.get('sid'),
-            'unique_name': payload.get('unique_name'),
-            'actions_url': payload.get('actions_url'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -510,6 +712,15 @@ class TaskInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the TaskInstance
+
+        :returns: The fetched TaskInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.task.TaskInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, friendly_name=values.unset, unique_name=values.unset,
                actions=values.unset, actions_url=values.unset):
         """
@@ -530,6 +741,26 @@ class TaskInstance(InstanceResource):
             actions_url=actions_url,
         )
 
+    async def update_async(self, friendly_name=values.unset, unique_name=values.unset,
+                           actions=values.unset, actions_url=values.unset):
+        """
+        Asynchronous coroutine that updates the TaskInstance
+
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode unique_name: An application-defined string that uniquely identifies the resource
+        :param dict actions: The JSON string that specifies the actions that instruct the Assistant on how to perform the task
+        :param unicode actions_url: The URL from which the Assistant can fetch actions
+
+        :returns: The updated TaskInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.task.TaskInstance
+        """
+        return await self._proxy.update_async(
+            friendly_name=friendly_name,
+            unique_name=unique_name,
+            actions=actions,
+            actions_url=actions_url,
+        )
+
     def delete(self):
         """
         Deletes the TaskInstance
@@ -539,6 +770,15 @@ class TaskInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the TaskInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     @property
     def fields(self):
         """
@@ -588,3 +828,22 @@ class TaskInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Autopilot.V1.TaskInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'FieldList': 'twilio.rest.autopilot.v1.assistant.task.field',
+    'SampleList': 'twilio.rest.autopilot.v1.assistant.task.sample',
+    'TaskActionsList': 'twilio.rest.autopilot.v1.assistant.task.task_actions',
+    'TaskStatisticsList': 'twilio.rest.autopilot.v1.assistant.task.task_statistics',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -7,6 +7,7 @@ This code was generated by
 """
 
 from twilio.base import serialize
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
@@ -139,7 +140,7 @@ class TaskActionsContext(InstanceContext):
 
         # Path Solution
         self._solution = {'assistant_sid': assistant_sid, 'task_sid': task_sid, }
-        self._uri = '/Assistants/{assistant_sid}/Tasks/{task_sid}/Actions'.format(**self._solution)
+        self._uri = values.ResourceUri('/Assistants/{assistant_sid}/Tasks/{task_sid}/Actions', self._solution)
 
     def fetch(self):
         """
@@ -157,6 +158,22 @@ class TaskActionsContext(InstanceContext):
             task_sid=self._solution['task_sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the TaskActionsInstance
+
+        :returns: The fetched TaskActionsInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.task.task_actions.TaskActionsInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return TaskActionsInstance(
+            self._version,
+            payload,
+            assistant_sid=self._solution['assistant_sid'],
+            task_sid=self._solution['task_sid'],
+        )
+
     def update(self, actions=values.unset):
         """
         Update the TaskActionsInstance
@@ -177,6 +194,26 @@ class TaskActionsContext(InstanceContext):
             task_sid=self._solution['task_sid'],
         )
 
+    async def update_async(self, actions=values.unset):
+        """
+        Asynchronous coroutine that updates the TaskActionsInstance
+
+        :param dict actions: The JSON string that specifies the actions that instruct the Assistant on how to perform the task
+
+        :returns: The updated TaskActionsInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.task.task_actions.TaskActionsInstance
+        """
+        data = values.of({'Actions': serialize.object(actions), })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return TaskActionsInstance(
+            self._version,
+            payload,
+            assistant_sid=self._solution['assistant_sid'],
+            task_sid=self._solution['task_sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -193,6 +230,17 @@ class TaskActionsInstance(InstanceResource):
     to change. Use them with caution. If you currently do not have developer
     preview access, please contact help@twilio.com. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'assistant_sid': 'assistant_sid',
+        'task_sid': 'task_sid',
+        'url': 'url',
+        'data': 'data',
+    })
+
     def __init__(self, version, payload, assistant_sid, task_sid):
         """
         Initialize the TaskActionsInstance
@@ -203,13 +251,7 @@ class TaskActionsInstance(InstanceResource):
         super(TaskActionsInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'assistant_sid': payload.get('assistant_sid'),
-            'task_sid': payload.get('task_sid'),
-            'url': payload.get('url'),
-            'data': payload.get('data'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -281,6 +323,15 @@ class TaskActionsInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the TaskActionsInstance
+
+        :returns: The fetched TaskActionsInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.task.task_actions.TaskActionsInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, actions=values.unset):
         """
         Update the TaskActionsInstance
@@ -292,6 +343,17 @@ class TaskActionsInstance(InstanceResource):
         """
         return self._proxy.update(actions=actions, )
 
+    async def update_async(self, actions=values.unset):
+        """
+        Asynchronous coroutine that updates the TaskActionsInstance
+
+        :param dict actions: The JSON string that specifies the actions that instruct the Assistant on how to perform the task
+
+        :returns: The updated TaskActionsInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.task.task_actions.TaskActionsInstance
+        """
+        return await self._proxy.update_async(actions=actions, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -33,9 +33,9 @@ class WebhookList(ListResource):
 
         # Path Solution
         self._solution = {'assistant_sid': assistant_sid, }
-        self._uri = '/Assistants/{assistant_sid}/Webhooks'.format(**self._solution)
+        self._uri = values.ResourceUri('/Assistants/{assistant_sid}/Webhooks', self._solution)
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams WebhookInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -48,17 +48,57 @@ class WebhookList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.autopilot.v1.assistant.webhook.WebhookInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams WebhookInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.autopilot.v1.assistant.webhook.WebhookInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists WebhookInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -70,11 +110,42 @@ class WebhookList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.autopilot.v1.assistant.webhook.WebhookInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists WebhookInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.autopilot.v1.assistant.webhook.WebhookInstance]
+        """
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -95,6 +166,25 @@ class WebhookList(ListResource):
 
         return WebhookPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of WebhookInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of WebhookInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.webhook.WebhookPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return WebhookPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of WebhookInstance records from the API.
@@ -112,7 +202,24 @@ class WebhookList(ListResource):
 
         return WebhookPage(self._version, response, self._solution)
 
-    def create(self, unique_name, events, webhook_url, webhook_method=values.unset):
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of WebhookInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of WebhookInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.webhook.WebhookPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return WebhookPage(self._version, response, self._solution)
+
+    def create(self, unique_name, events, webhook_url, webhook_method=values.unset, deadline=None):
         """
         Create the WebhookInstance
 
@@ -120,6 +227,8 @@ class WebhookList(ListResource):
         :param unicode events: The list of space-separated events that this Webhook will subscribe to.
         :param unicode webhook_url: The URL associated with this Webhook.
         :param unicode webhook_method: The method to be used when calling the webhook's URL.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created WebhookInstance
         :rtype: twilio.rest.autopilot.v1.assistant.webhook.WebhookInstance
@@ -131,7 +240,33 @@ class WebhookList(ListResource):
             'WebhookMethod': webhook_method,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return WebhookInstance(self._version, payload, assistant_sid=self._solution['assistant_sid'], )
+
+    async def create_async(self, unique_name, events, webhook_url, webhook_method=values.unset,
+                           deadline=None):
+        """
+        Asynchronous coroutine that creates the WebhookInstance
+
+        :param unicode unique_name: An application-defined string that uniquely identifies the resource
+        :param unicode events: The list of space-separated events that this Webhook will subscribe to.
+        :param unicode webhook_url: The URL associated with this Webhook.
+        :param unicode webhook_method: The method to be used when calling the webhook's URL.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created WebhookInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.webhook.WebhookInstance
+        """
+        data = values.of({
+            'UniqueName': unique_name,
+            'Events': events,
+            'WebhookUrl': webhook_url,
+            'WebhookMethod': webhook_method,
+        })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return WebhookInstance(self._version, payload, assistant_sid=self._solution['assistant_sid'], )
 
@@ -229,7 +364,7 @@ class WebhookContext(InstanceContext):
 
         # Path Solution
         self._solution = {'assistant_sid': assistant_sid, 'sid': sid, }
-        self._uri = '/Assistants/{assistant_sid}/Webhooks/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Assistants/{assistant_sid}/Webhooks/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -247,6 +382,22 @@ class WebhookContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the WebhookInstance
+
+        :returns: The fetched WebhookInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.webhook.WebhookInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return WebhookInstance(
+            self._version,
+            payload,
+            assistant_sid=self._solution['assistant_sid'],
+            sid=self._solution['sid'],
+        )
+
     def update(self, unique_name=values.unset, events=values.unset,
                webhook_url=values.unset, webhook_method=values.unset):
         """
@@ -276,6 +427,35 @@ class WebhookContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, unique_name=values.unset, events=values.unset,
+                           webhook_url=values.unset, webhook_method=values.unset):
+        """
+        Asynchronous coroutine that updates the WebhookInstance
+
+        :param unicode unique_name: An application-defined string that uniquely identifies the resource
+        :param unicode events: The list of space-separated events that this Webhook will subscribe to.
+        :param unicode webhook_url: The URL associated with this Webhook.
+        :param unicode webhook_method: The method to be used when calling the webhook's URL.
+
+        :returns: The updated WebhookInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.webhook.WebhookInstance
+        """
+        data = values.of({
+            'UniqueName': unique_name,
+            'Events': events,
+            'WebhookUrl': webhook_url,
+            'WebhookMethod': webhook_method,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return WebhookInstance(
+            self._version,
+            payload,
+            assistant_sid=self._solution['assistant_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self):
         """
         Deletes the WebhookInstance
@@ -285,6 +465,15 @@ class WebhookContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the WebhookInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -301,6 +490,28 @@ class WebhookInstance(InstanceResource):
     to change. Use them with caution. If you currently do not have developer
     preview access, please contact help@twilio.com. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'url': 'url',
+        'account_sid': 'account_sid',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'assistant_sid': 'assistant_sid',
+        'sid': 'sid',
+        'unique_name': 'unique_name',
+        'events': 'events',
+        'webhook_url': 'webhook_url',
+        'webhook_method': 'webhook_method',
+    }, _deserializers)
+
     def __init__(self, version, payload, assistant_sid, sid=None):
         """
         Initialize the WebhookInstance
@@ -311,18 +522,7 @@ class WebhookInstance(InstanceResource):
         super(WebhookInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'url': payload.get('url'),
-            'account_sid': payload.get('account_sid'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'assistant_sid': payload.get('assistant_sid'),
-            'sid': payload.get('sid'),
-            'unique_name': payload.get('unique_name'),
-            'events': payload.get('events'),
-            'webhook_url': payload.get('webhook_url'),
-            'webhook_method': payload.get('webhook_method'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -434,6 +634,15 @@ class WebhookInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the WebhookInstance
+
+        :returns: The fetched WebhookInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.webhook.WebhookInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, unique_name=values.unset, events=values.unset,
                webhook_url=values.unset, webhook_method=values.unset):
         """
@@ -454,6 +663,26 @@ class WebhookInstance(InstanceResource):
             webhook_method=webhook_method,
         )
 
+    async def update_async(self, unique_name=values.unset, events=values.unset,
+                           webhook_url=values.unset, webhook_method=values.unset):
+        """
+        Asynchronous coroutine that updates the WebhookInstance
+
+        :param unicode unique_name: An application-defined string that uniquely identifies the resource
+        :param unicode events: The list of space-separated events that this Webhook will subscribe to.
+        :param unicode webhook_url: The URL associated with this Webhook.
+        :param unicode webhook_method: The method to be used when calling the webhook's URL.
+
+        :returns: The updated WebhookInstance
+        :rtype: twilio.rest.autopilot.v1.assistant.webhook.WebhookInstance
+        """
+        return await self._proxy.update_async(
+            unique_name=unique_name,
+            events=events,
+            webhook_url=webhook_url,
+            webhook_method=webhook_method,
+        )
+
     def delete(self):
         """
         Deletes the WebhookInstance
@@ -463,6 +692,15 @@ class WebhookInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the WebhookInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -31,7 +31,7 @@ class RestoreAssistantList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Assistants/Restore'.format(**self._solution)
+        self._uri = values.ResourceUri('/Assistants/Restore', self._solution)
 
     def update(self, assistant):
         """
@@ -48,6 +48,21 @@ class RestoreAssistantList(ListResource):
 
         return RestoreAssistantInstance(self._version, payload, )
 
+    async def update_async(self, assistant):
+        """
+        Asynchronous coroutine that updates the RestoreAssistantInstance
+
+        :param unicode assistant: The unique string that identifies the resource
+
+        :returns: The updated RestoreAssistantInstance
+        :rtype: twilio.rest.autopilot.v1.restore_assistant.RestoreAssistantInstance
+        """
+        data = values.of({'Assistant': assistant, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return RestoreAssistantInstance(self._version, payload, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -104,6 +119,30 @@ class RestoreAssistantInstance(InstanceResource):
     to change. Use them with caution. If you currently do not have developer
     preview access, please contact help@twilio.com. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'sid': 'sid',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'unique_name': 'unique_name',
+        'friendly_name': 'friendly_name',
+        'needs_model_build': 'needs_model_build',
+        'latest_model_build_sid': 'latest_model_build_sid',
+        'log_queries': 'log_queries',
+        'development_stage': 'development_stage',
+        'callback_url': 'callback_url',
+        'callback_events': 'callback_events',
+    }, _deserializers)
+
     def __init__(self, version, payload):
         """
         Initialize the RestoreAssistantInstance
@@ -114,20 +153,7 @@ class RestoreAssistantInstance(InstanceResource):
         super(RestoreAssistantInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'sid': payload.get('sid'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'unique_name': payload.get('unique_name'),
-            'friendly_name': payload.get('friendly_name'),
-            'needs_model_build': payload.get('needs_model_build'),
-            'latest_model_build_sid': payload.get('latest_model_build_sid'),
-            'log_queries': payload.get('log_queries'),
-            'development_stage': payload.get('development_stage'),
-            'callback_url': payload.get('callback_url'),
-            'callback_events': payload.get('callback_events'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
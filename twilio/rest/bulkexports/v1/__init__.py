@@ -6,9 +6,9 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base.version import Version
-from twilio.rest.bulkexports.v1.export import ExportList
-from twilio.rest.bulkexports.v1.export_configuration import ExportConfigurationList
 
 
 class V1(Version):
@@ -31,6 +31,7 @@ class V1(Version):
         :rtype: twilio.rest.bulkexports.v1.export.ExportList
         """
         if self._exports is None:
+            from twilio.rest.bulkexports.v1.export import ExportList
             self._exports = ExportList(self)
         return self._exports
 
@@ -40,6 +41,7 @@ class V1(Version):
         :rtype: twilio.rest.bulkexports.v1.export_configuration.ExportConfigurationList
         """
         if self._export_configuration is None:
+            from twilio.rest.bulkexports.v1.export_configuration import ExportConfigurationList
             self._export_configuration = ExportConfigurationList(self)
         return self._export_configuration
 
@@ -51,3 +53,20 @@ class V1(Version):
         :rtype: str
         """
         return '<Twilio.Bulkexports.V1>'
+
+
+_LAZY_IMPORTS = {
+    'ExportConfigurationList': 'twilio.rest.bulkexports.v1.export_configuration',
+    'ExportList': 'twilio.rest.bulkexports.v1.export',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -30,9 +30,9 @@ class DayList(ListResource):
 
         # Path Solution
         self._solution = {'resource_type': resource_type, }
-        self._uri = '/Exports/{resource_type}/Days'.format(**self._solution)
+        self._uri = values.ResourceUri('/Exports/{resource_type}/Days', self._solution)
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams DayInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -45,17 +45,57 @@ class DayList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.bulkexports.v1.export.day.DayInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams DayInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.bulkexports.v1.export.day.DayInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists DayInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -67,11 +107,42 @@ class DayList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.bulkexports.v1.export.day.DayInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists DayInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.bulkexports.v1.export.day.DayInstance]
+        """
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -92,6 +163,25 @@ class DayList(ListResource):
 
         return DayPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of DayInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of DayInstance
+        :rtype: twilio.rest.bulkexports.v1.export.day.DayPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return DayPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of DayInstance records from the API.
@@ -109,6 +199,23 @@ class DayList(ListResource):
 
         return DayPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of DayInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of DayInstance
+        :rtype: twilio.rest.bulkexports.v1.export.day.DayPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return DayPage(self._version, response, self._solution)
+
     def get(self, day):
         """
         Constructs a DayContext
@@ -197,7 +304,7 @@ class DayContext(InstanceContext):
 
         # Path Solution
         self._solution = {'resource_type': resource_type, 'day': day, }
-        self._uri = '/Exports/{resource_type}/Days/{day}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Exports/{resource_type}/Days/{day}', self._solution)
 
     def fetch(self):
         """
@@ -215,6 +322,22 @@ class DayContext(InstanceContext):
             day=self._solution['day'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the DayInstance
+
+        :returns: The fetched DayInstance
+        :rtype: twilio.rest.bulkexports.v1.export.day.DayInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return DayInstance(
+            self._version,
+            payload,
+            resource_type=self._solution['resource_type'],
+            day=self._solution['day'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -228,6 +351,23 @@ class DayContext(InstanceContext):
 
 class DayInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'size': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'redirect_to': 'redirect_to',
+        'day': 'day',
+        'size': 'size',
+        'create_date': 'create_date',
+        'friendly_name': 'friendly_name',
+        'resource_type': 'resource_type',
+    }, _deserializers)
+
     def __init__(self, version, payload, resource_type, day=None):
         """
         Initialize the DayInstance
@@ -238,14 +378,7 @@ class DayInstance(InstanceResource):
         super(DayInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'redirect_to': payload.get('redirect_to'),
-            'day': payload.get('day'),
-            'size': deserialize.integer(payload.get('size')),
-            'create_date': payload.get('create_date'),
-            'friendly_name': payload.get('friendly_name'),
-            'resource_type': payload.get('resource_type'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -325,6 +458,15 @@ class DayInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the DayInstance
+
+        :returns: The fetched DayInstance
+        :rtype: twilio.rest.bulkexports.v1.export.day.DayInstance
+        """
+        return await self._proxy.fetch_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -6,6 +6,7 @@ This code was generated by
       /       /
 """
 
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
@@ -28,9 +29,9 @@ class ExportCustomJobList(ListResource):
 
         # Path Solution
         self._solution = {'resource_type': resource_type, }
-        self._uri = '/Exports/{resource_type}/Jobs'.format(**self._solution)
+        self._uri = values.ResourceUri('/Exports/{resource_type}/Jobs', self._solution)
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams ExportCustomJobInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -43,17 +44,57 @@ class ExportCustomJobList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.bulkexports.v1.export.export_custom_job.ExportCustomJobInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams ExportCustomJobInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.bulkexports.v1.export.export_custom_job.ExportCustomJobInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists ExportCustomJobInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -65,11 +106,42 @@ class ExportCustomJobList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.bulkexports.v1.export.export_custom_job.ExportCustomJobInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists ExportCustomJobInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.bulkexports.v1.export.export_custom_job.ExportCustomJobInstance]
+        """
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -90,6 +162,25 @@ class ExportCustomJobList(ListResource):
 
         return ExportCustomJobPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of ExportCustomJobInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of ExportCustomJobInstance
+        :rtype: twilio.rest.bulkexports.v1.export.export_custom_job.ExportCustomJobPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return ExportCustomJobPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of ExportCustomJobInstance records from the API.
@@ -107,8 +198,25 @@ class ExportCustomJobList(ListResource):
 
         return ExportCustomJobPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of ExportCustomJobInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of ExportCustomJobInstance
+        :rtype: twilio.rest.bulkexports.v1.export.export_custom_job.ExportCustomJobPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return ExportCustomJobPage(self._version, response, self._solution)
+
     def create(self, start_day, end_day, friendly_name, webhook_url=values.unset,
-               webhook_method=values.unset, email=values.unset):
+               webhook_method=values.unset, email=values.unset, deadline=None):
         """
         Create the ExportCustomJobInstance
 
@@ -118,6 +226,42 @@ class ExportCustomJobList(ListResource):
         :param unicode webhook_url: The optional webhook url called on completion of the job. If this is supplied, `WebhookMethod` must also be supplied.
         :param unicode webhook_method: This is the method used to call the webhook on completion of the job. If this is supplied, `WebhookUrl` must also be supplied.
         :param unicode email: The optional email to send the completion notification to
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created ExportCustomJobInstance
+        :rtype: twilio.rest.bulkexports.v1.export.export_custom_job.ExportCustomJobInstance
+        """
+        data = values.of({
+            'StartDay': start_day,
+            'EndDay': end_day,
+            'FriendlyName': friendly_name,
+            'WebhookUrl': webhook_url,
+            'WebhookMethod': webhook_method,
+            'Email': email,
+        })
+
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return ExportCustomJobInstance(
+            self._version,
+            payload,
+            resource_type=self._solution['resource_type'],
+        )
+
+    async def create_async(self, start_day, end_day, friendly_name, webhook_url=values.unset,
+                           webhook_method=values.unset, email=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the ExportCustomJobInstance
+
+        :param unicode start_day: The start day for the custom export specified as a string in the format of yyyy-mm-dd
+        :param unicode end_day: The end day for the custom export specified as a string in the format of yyyy-mm-dd. End day is inclusive and must be 2 days earlier than the current UTC day.
+        :param unicode friendly_name: The friendly name specified when creating the job
+        :param unicode webhook_url: The optional webhook url called on completion of the job. If this is supplied, `WebhookMethod` must also be supplied.
+        :param unicode webhook_method: This is the method used to call the webhook on completion of the job. If this is supplied, `WebhookUrl` must also be supplied.
+        :param unicode email: The optional email to send the completion notification to
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created ExportCustomJobInstance
         :rtype: twilio.rest.bulkexports.v1.export.export_custom_job.ExportCustomJobInstance
@@ -131,7 +275,7 @@ class ExportCustomJobList(ListResource):
             'Email': email,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return ExportCustomJobInstance(
             self._version,
@@ -204,6 +348,23 @@ class ExportCustomJobInstance(InstanceResource):
         RUNNINGTOBEDELETED = "RunningToBeDeleted"
         DELETEDBYUSERREQUEST = "DeletedByUserRequest"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'friendly_name': 'friendly_name',
+        'resource_type': 'resource_type',
+        'start_day': 'start_day',
+        'end_day': 'end_day',
+        'webhook_url': 'webhook_url',
+        'webhook_method': 'webhook_method',
+        'email': 'email',
+        'job_sid': 'job_sid',
+        'details': 'details',
+        'job_queue_position': 'job_queue_position',
+        'estimated_completion_time': 'estimated_completion_time',
+    })
+
     def __init__(self, version, payload, resource_type):
         """
         Initialize the ExportCustomJobInstance
@@ -214,19 +375,7 @@ class ExportCustomJobInstance(InstanceResource):
         super(ExportCustomJobInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'friendly_name': payload.get('friendly_name'),
-            'resource_type': payload.get('resource_type'),
-            'start_day': payload.get('start_day'),
-            'end_day': payload.get('end_day'),
-            'webhook_url': payload.get('webhook_url'),
-            'webhook_method': payload.get('webhook_method'),
-            'email': payload.get('email'),
-            'job_sid': payload.get('job_sid'),
-            'details': payload.get('details'),
-            'job_queue_position': payload.get('job_queue_position'),
-            'estimated_completion_time': payload.get('estimated_completion_time'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -6,10 +6,9 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base.domain import Domain
-from twilio.rest.chat.v1 import V1
-from twilio.rest.chat.v2 import V2
-from twilio.rest.chat.v3 import V3
 
 
 class Chat(Domain):
@@ -37,6 +36,7 @@ class Chat(Domain):
         :rtype: twilio.rest.chat.v1.V1
         """
         if self._v1 is None:
+            from twilio.rest.chat.v1 import V1
             self._v1 = V1(self)
         return self._v1
 
@@ -47,6 +47,7 @@ class Chat(Domain):
         :rtype: twilio.rest.chat.v2.V2
         """
         if self._v2 is None:
+            from twilio.rest.chat.v2 import V2
             self._v2 = V2(self)
         return self._v2
 
@@ -57,6 +58,7 @@ class Chat(Domain):
         :rtype: twilio.rest.chat.v3.V3
         """
         if self._v3 is None:
+            from twilio.rest.chat.v3 import V3
             self._v3 = V3(self)
         return self._v3
 
@@ -89,3 +91,21 @@ class Chat(Domain):
         :rtype: str
         """
         return '<Twilio.Chat>'
+
+
+_LAZY_IMPORTS = {
+    'V1': 'twilio.rest.chat.v1',
+    'V2': 'twilio.rest.chat.v2',
+    'V3': 'twilio.rest.chat.v3',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -6,6 +6,8 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import serialize
 from twilio.base import values
@@ -13,9 +15,6 @@ from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.chat.v1.service.channel import ChannelList
-from twilio.rest.chat.v1.service.role import RoleList
-from twilio.rest.chat.v1.service.user import UserList
 
 
 class ServiceList(ListResource):
@@ -33,24 +32,43 @@ class ServiceList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Services'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services', self._solution)
 
-    def create(self, friendly_name):
+    def create(self, friendly_name, deadline=None):
         """
         Create the ServiceInstance
 
         :param unicode friendly_name: A string to describe the resource
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created ServiceInstance
+        :rtype: twilio.rest.chat.v1.service.ServiceInstance
+        """
+        data = values.of({'FriendlyName': friendly_name, })
+
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return ServiceInstance(self._version, payload, )
+
+    async def create_async(self, friendly_name, deadline=None):
+        """
+        Asynchronous coroutine that creates the ServiceInstance
+
+        :param unicode friendly_name: A string to describe the resource
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created ServiceInstance
         :rtype: twilio.rest.chat.v1.service.ServiceInstance
         """
         data = values.of({'FriendlyName': friendly_name, })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return ServiceInstance(self._version, payload, )
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams ServiceInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -63,17 +81,57 @@ class ServiceList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.chat.v1.service.ServiceInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams ServiceInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.chat.v1.service.ServiceInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists ServiceInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -85,11 +143,42 @@ class ServiceList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.chat.v1.service.ServiceInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists ServiceInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.chat.v1.service.ServiceInstance]
+        """
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -110,6 +199,25 @@ class ServiceList(ListResource):
 
         return ServicePage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of ServiceInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of ServiceInstance
+        :rtype: twilio.rest.chat.v1.service.ServicePage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return ServicePage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of ServiceInstance records from the API.
@@ -127,6 +235,23 @@ class ServiceList(ListResource):
 
         return ServicePage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of ServiceInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of ServiceInstance
+        :rtype: twilio.rest.chat.v1.service.ServicePage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return ServicePage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a ServiceContext
@@ -213,7 +338,7 @@ class ServiceContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/Services/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{sid}', self._solution)
 
         # Dependents
         self._channels = None
@@ -231,6 +356,17 @@ class ServiceContext(InstanceContext):
 
         return ServiceInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ServiceInstance
+
+        :returns: The fetched ServiceInstance
+        :rtype: twilio.rest.chat.v1.service.ServiceInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return ServiceInstance(self._version, payload, sid=self._solution['sid'], )
+
     def delete(self):
         """
         Deletes the ServiceInstance
@@ -240,6 +376,15 @@ class ServiceContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the ServiceInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def update(self, friendly_name=values.unset,
                default_service_role_sid=values.unset,
                default_channel_role_sid=values.unset,
@@ -413,6 +558,179 @@ class ServiceContext(InstanceContext):
 
         return ServiceInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def update_async(self, friendly_name=values.unset,
+                           default_service_role_sid=values.unset,
+                           default_channel_role_sid=values.unset,
+                           default_channel_creator_role_sid=values.unset,
+                           read_status_enabled=values.unset, reachability_enabled=values.unset,
+                           typing_indicator_timeout=values.unset,
+                           consumption_report_interval=values.unset,
+                           notifications_new_message_enabled=values.unset,
+                           notifications_new_message_template=values.unset,
+                           notifications_added_to_channel_enabled=values.unset,
+                           notifications_added_to_channel_template=values.unset,
+                           notifications_removed_from_channel_enabled=values.unset,
+                           notifications_removed_from_channel_template=values.unset,
+                           notifications_invited_to_channel_enabled=values.unset,
+                           notifications_invited_to_channel_template=values.unset,
+                           pre_webhook_url=values.unset, post_webhook_url=values.unset,
+                           webhook_method=values.unset, webhook_filters=values.unset,
+                           webhooks_on_message_send_url=values.unset,
+                           webhooks_on_message_send_method=values.unset,
+                           webhooks_on_message_update_url=values.unset,
+                           webhooks_on_message_update_method=values.unset,
+                           webhooks_on_message_remove_url=values.unset,
+                           webhooks_on_message_remove_method=values.unset,
+                           webhooks_on_channel_add_url=values.unset,
+                           webhooks_on_channel_add_method=values.unset,
+                           webhooks_on_channel_destroy_url=values.unset,
+                           webhooks_on_channel_destroy_method=values.unset,
+                           webhooks_on_channel_update_url=values.unset,
+                           webhooks_on_channel_update_method=values.unset,
+                           webhooks_on_member_add_url=values.unset,
+                           webhooks_on_member_add_method=values.unset,
+                           webhooks_on_member_remove_url=values.unset,
+                           webhooks_on_member_remove_method=values.unset,
+                           webhooks_on_message_sent_url=values.unset,
+                           webhooks_on_message_sent_method=values.unset,
+                           webhooks_on_message_updated_url=values.unset,
+                           webhooks_on_message_updated_method=values.unset,
+                           webhooks_on_message_removed_url=values.unset,
+                           webhooks_on_message_removed_method=values.unset,
+                           webhooks_on_channel_added_url=values.unset,
+                           webhooks_on_channel_added_method=values.unset,
+                           webhooks_on_channel_destroyed_url=values.unset,
+                           webhooks_on_channel_destroyed_method=values.unset,
+                           webhooks_on_channel_updated_url=values.unset,
+                           webhooks_on_channel_updated_method=values.unset,
+                           webhooks_on_member_added_url=values.unset,
+                           webhooks_on_member_added_method=values.unset,
+                           webhooks_on_member_removed_url=values.unset,
+                           webhooks_on_member_removed_method=values.unset,
+                           limits_channel_members=values.unset,
+                           limits_user_channels=values.unset):
+        """
+        Asynchronous coroutine that updates the ServiceInstance
+
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode default_service_role_sid: The service role assigned to users when they are added to the service
+        :param unicode default_channel_role_sid: The channel role assigned to users when they are added to a channel
+        :param unicode default_channel_creator_role_sid: The channel role assigned to a channel creator when they join a new channel
+        :param bool read_status_enabled: Whether to enable the Message Consumption Horizon feature
+        :param bool reachability_enabled: Whether to enable the Reachability Indicator feature for this Service instance
+        :param unicode typing_indicator_timeout: How long in seconds to wait before assuming the user is no longer typing
+        :param unicode consumption_report_interval: DEPRECATED
+        :param bool notifications_new_message_enabled: Whether to send a notification when a new message is added to a channel
+        :param unicode notifications_new_message_template: The template to use to create the notification text displayed when a new message is added to a channel
+        :param bool notifications_added_to_channel_enabled: Whether to send a notification when a member is added to a channel
+        :param unicode notifications_added_to_channel_template: The template to use to create the notification text displayed when a member is added to a channel
+        :param bool notifications_removed_from_channel_enabled: Whether to send a notification to a user when they are removed from a channel
+        :param unicode notifications_removed_from_channel_template: The template to use to create the notification text displayed to a user when they are removed
+        :param bool notifications_invited_to_channel_enabled: Whether to send a notification when a user is invited to a channel
+        :param unicode notifications_invited_to_channel_template: The template to use to create the notification text displayed when a user is invited to a channel
+        :param unicode pre_webhook_url: The webhook URL for pre-event webhooks
+        :param unicode post_webhook_url: The URL for post-event webhooks
+        :param unicode webhook_method: The HTTP method  to use for both PRE and POST webhooks
+        :param list[unicode] webhook_filters: The list of WebHook events that are enabled for this Service instance
+        :param unicode webhooks_on_message_send_url: The URL of the webhook to call in response to the on_message_send event
+        :param unicode webhooks_on_message_send_method: The HTTP method to use when calling the webhooks.on_message_send.url
+        :param unicode webhooks_on_message_update_url: The URL of the webhook to call in response to the on_message_update event
+        :param unicode webhooks_on_message_update_method: The HTTP method to use when calling the webhooks.on_message_update.url
+        :param unicode webhooks_on_message_remove_url: The URL of the webhook to call in response to the on_message_remove event
+        :param unicode webhooks_on_message_remove_method: The HTTP method to use when calling the webhooks.on_message_remove.url
+        :param unicode webhooks_on_channel_add_url: The URL of the webhook to call in response to the on_channel_add event
+        :param unicode webhooks_on_channel_add_method: The HTTP method to use when calling the webhooks.on_channel_add.url
+        :param unicode webhooks_on_channel_destroy_url: The URL of the webhook to call in response to the on_channel_destroy event
+        :param unicode webhooks_on_channel_destroy_method: The HTTP method to use when calling the webhooks.on_channel_destroy.url
+        :param unicode webhooks_on_channel_update_url: The URL of the webhook to call in response to the on_channel_update event
+        :param unicode webhooks_on_channel_update_method: The HTTP method to use when calling the webhooks.on_channel_update.url
+        :param unicode webhooks_on_member_add_url: The URL of the webhook to call in response to the on_member_add event
+        :param unicode webhooks_on_member_add_method: The HTTP method to use when calling the webhooks.on_member_add.url
+        :param unicode webhooks_on_member_remove_url: The URL of the webhook to call in response to the on_member_remove event
+        :param unicode webhooks_on_member_remove_method: The HTTP method to use when calling the webhooks.on_member_remove.url
+        :param unicode webhooks_on_message_sent_url: The URL of the webhook to call in response to the on_message_sent event
+        :param unicode webhooks_on_message_sent_method: The URL of the webhook to call in response to the on_message_sent event
+        :param unicode webhooks_on_message_updated_url: The URL of the webhook to call in response to the on_message_updated event
+        :param unicode webhooks_on_message_updated_method: The HTTP method to use when calling the webhooks.on_message_updated.url
+        :param unicode webhooks_on_message_removed_url: The URL of the webhook to call in response to the on_message_removed event
+        :param unicode webhooks_on_message_removed_method: The HTTP method to use when calling the webhooks.on_message_removed.url
+        :param unicode webhooks_on_channel_added_url: The URL of the webhook to call in response to the on_channel_added event
+        :param unicode webhooks_on_channel_added_method: The URL of the webhook to call in response to the on_channel_added event
+        :param unicode webhooks_on_channel_destroyed_url: The URL of the webhook to call in response to the on_channel_added event
+        :param unicode webhooks_on_channel_destroyed_method: The HTTP method to use when calling the webhooks.on_channel_destroyed.url
+        :param unicode webhooks_on_channel_updated_url: he URL of the webhook to call in response to the on_channel_updated event
+        :param unicode webhooks_on_channel_updated_method: The HTTP method to use when calling the webhooks.on_channel_updated.url
+        :param unicode webhooks_on_member_added_url: The URL of the webhook to call in response to the on_channel_updated event
+        :param unicode webhooks_on_member_added_method: he HTTP method to use when calling the webhooks.on_channel_updated.url
+        :param unicode webhooks_on_member_removed_url: The URL of the webhook to call in response to the on_member_removed event
+        :param unicode webhooks_on_member_removed_method: The HTTP method to use when calling the webhooks.on_member_removed.url
+        :param unicode limits_channel_members: The maximum number of Members that can be added to Channels within this Service
+        :param unicode limits_user_channels: The maximum number of Channels Users can be a Member of within this Service
+
+        :returns: The updated ServiceInstance
+        :rtype: twilio.rest.chat.v1.service.ServiceInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'DefaultServiceRoleSid': default_service_role_sid,
+            'DefaultChannelRoleSid': default_channel_role_sid,
+            'DefaultChannelCreatorRoleSid': default_channel_creator_role_sid,
+            'ReadStatusEnabled': read_status_enabled,
+            'ReachabilityEnabled': reachability_enabled,
+            'TypingIndicatorTimeout': typing_indicator_timeout,
+            'ConsumptionReportInterval': consumption_report_interval,
+            'Notifications.NewMessage.Enabled': notifications_new_message_enabled,
+            'Notifications.NewMessage.Template': notifications_new_message_template,
+            'Notifications.AddedToChannel.Enabled': notifications_added_to_channel_enabled,
+            'Notifications.AddedToChannel.Template': notifications_added_to_channel_template,
+            'Notifications.RemovedFromChannel.Enabled': notifications_removed_from_channel_enabled,
+            'Notifications.RemovedFromChannel.Template': notifications_removed_from_channel_template,
+            'Notifications.InvitedToChannel.Enabled': notifications_invited_to_channel_enabled,
+            'Notifications.InvitedToChannel.Template': notifications_invited_to_channel_template,
+            'PreWebhookUrl': pre_webhook_url,
+            'PostWebhookUrl': post_webhook_url,
+            'WebhookMethod': webhook_method,
+            'WebhookFilters': serialize.map(webhook_filters, lambda e: e),
+            'Webhooks.OnMessageSend.Url': webhooks_on_message_send_url,
+            'Webhooks.OnMessageSend.Method': webhooks_on_message_send_method,
+            'Webhooks.OnMessageUpdate.Url': webhooks_on_message_update_url,
+            'Webhooks.OnMessageUpdate.Method': webhooks_on_message_update_method,
+            'Webhooks.OnMessageRemove.Url': webhooks_on_message_remove_url,
+            'Webhooks.OnMessageRemove.Method': webhooks_on_message_remove_method,
+            'Webhooks.OnChannelAdd.Url': webhooks_on_channel_add_url,
+            'Webhooks.OnChannelAdd.Method': webhooks_on_channel_add_method,
+            'Webhooks.OnChannelDestroy.Url': webhooks_on_channel_destroy_url,
+            'Webhooks.OnChannelDestroy.Method': webhooks_on_channel_destroy_method,
+            'Webhooks.OnChannelUpdate.Url': webhooks_on_channel_update_url,
+            'Webhooks.OnChannelUpdate.Method': webhooks_on_channel_update_method,
+            'Webhooks.OnMemberAdd.Url': webhooks_on_member_add_url,
+            'Webhooks.OnMemberAdd.Method': webhooks_on_member_add_method,
+            'Webhooks.OnMemberRemove.Url': webhooks_on_member_remove_url,
+            'Webhooks.OnMemberRemove.Method': webhooks_on_member_remove_method,
+            'Webhooks.OnMessageSent.Url': webhooks_on_message_sent_url,
+            'Webhooks.OnMessageSent.Method': webhooks_on_message_sent_method,
+            'Webhooks.OnMessageUpdated.Url': webhooks_on_message_updated_url,
+            'Webhooks.OnMessageUpdated.Method': webhooks_on_message_updated_method,
+            'Webhooks.OnMessageRemoved.Url': webhooks_on_message_removed_url,
+            'Webhooks.OnMessageRemoved.Method': webhooks_on_message_removed_method,
+            'Webhooks.OnChannelAdded.Url': webhooks_on_channel_added_url,
+            'Webhooks.OnChannelAdded.Method': webhooks_on_channel_added_method,
+            'Webhooks.OnChannelDestroyed.Url': webhooks_on_channel_destroyed_url,
+            'Webhooks.OnChannelDestroyed.Method': webhooks_on_channel_destroyed_method,
+            'Webhooks.OnChannelUpdated.Url': webhooks_on_channel_updated_url,
+            'Webhooks.OnChannelUpdated.Method': webhooks_on_channel_updated_method,
+            'Webhooks.OnMemberAdded.Url': webhooks_on_member_added_url,
+            'Webhooks.OnMemberAdded.Method': webhooks_on_member_added_method,
+            'Webhooks.OnMemberRemoved.Url': webhooks_on_member_removed_url,
+            'Webhooks.OnMemberRemoved.Method': webhooks_on_member_removed_method,
+            'Limits.ChannelMembers': limits_channel_members,
+            'Limits.UserChannels': limits_user_channels,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return ServiceInstance(self._version, payload, sid=self._solution['sid'], )
+
     @property
     def channels(self):
         """
@@ -422,6 +740,7 @@ class ServiceContext(InstanceContext):
         :rtype: twilio.rest.chat.v1.service.channel.ChannelList
         """
         if self._channels is None:
+            from twilio.rest.chat.v1.service.channel import ChannelList
             self._channels = ChannelList(self._version, service_sid=self._solution['sid'], )
         return self._channels
 
@@ -434,6 +753,7 @@ class ServiceContext(InstanceContext):
         :rtype: twilio.rest.chat.v1.service.role.RoleList
         """
         if self._roles is None:
+            from twilio.rest.chat.v1.service.role import RoleList
             self._roles = RoleList(self._version, service_sid=self._solution['sid'], )
         return self._roles
 
@@ -446,6 +766,7 @@ class ServiceContext(InstanceContext):
         :rtype: twilio.rest.chat.v1.service.user.UserList
         """
         if self._users is None:
+            from twilio.rest.chat.v1.service.user import UserList
             self._users = UserList(self._version, service_sid=self._solution['sid'], )
         return self._users
 
@@ -462,6 +783,41 @@ class ServiceContext(InstanceContext):
 
 class ServiceInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+        'typing_indicator_timeout': deserialize.integer,
+        'consumption_report_interval': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'friendly_name': 'friendly_name',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'default_service_role_sid': 'default_service_role_sid',
+        'default_channel_role_sid': 'default_channel_role_sid',
+        'default_channel_creator_role_sid': 'default_channel_creator_role_sid',
+        'read_status_enabled': 'read_status_enabled',
+        'reachability_enabled': 'reachability_enabled',
+        'typing_indicator_timeout': 'typing_indicator_timeout',
+        'consumption_report_interval': 'consumption_report_interval',
+        'limits': 'limits',
+        'webhooks': 'webhooks',
+        'pre_webhook_url': 'pre_webhook_url',
+        'post_webhook_url': 'post_webhook_url',
+        'webhook_method': 'webhook_method',
+        'webhook_filters': 'webhook_filters',
+        'notifications': 'notifications',
+        'url': 'url',
+        'links': 'links',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the ServiceInstance
@@ -472,29 +828,7 @@ class ServiceInstance(InstanceResource):
         super(ServiceInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'friendly_name': payload.get('friendly_name'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'default_service_role_sid': payload.get('default_service_role_sid'),
-            'default_channel_role_sid': payload.get('default_channel_role_sid'),
-            'default_channel_creator_role_sid': payload.get('default_channel_creator_role_sid'),
-            'read_status_enabled': payload.get('read_status_enabled'),
-            'reachability_enabled': payload.get('reachability_enabled'),
-            'typing_indicator_timeout': deserialize.integer(payload.get('typing_indicator_timeout')),
-            'consumption_report_interval': deserialize.integer(payload.get('consumption_report_interval')),
-            'limits': payload.get('limits'),
-            'webhooks': payload.get('webhooks'),
-            'pre_webhook_url': payload.get('pre_webhook_url'),
-            'post_webhook_url': payload.get('post_webhook_url'),
-            'webhook_method': payload.get('webhook_method'),
-            'webhook_filters': payload.get('webhook_filters'),
-            'notifications': payload.get('notifications'),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -690,6 +1024,15 @@ class ServiceInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ServiceInstance
+
+        :returns: The fetched ServiceInstance
+        :rtype: twilio.rest.chat.v1.service.ServiceInstance
+        """
+        return await self._proxy.fetch_async()
+
     def delete(self):
         """
         Deletes the ServiceInstance
@@ -699,6 +1042,15 @@ class ServiceInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the ServiceInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def update(self, friendly_name=values.unset,
                default_service_role_sid=values.unset,
                default_channel_role_sid=values.unset,
@@ -868,6 +1220,175 @@ class ServiceInstance(InstanceResource):
             limits_user_channels=limits_user_channels,
         )
 
+    async def update_async(self, friendly_name=values.unset,
+                           default_service_role_sid=values.unset,
+                           default_channel_role_sid=values.unset,
+                           default_channel_creator_role_sid=values.unset,
+                           read_status_enabled=values.unset, reachability_enabled=values.unset,
+                           typing_indicator_timeout=values.unset,
+                           consumption_report_interval=values.unset,
+                           notifications_new_message_enabled=values.unset,
+                           notifications_new_message_template=values.unset,
+                           notifications_added_to_channel_enabled=values.unset,
+                           notifications_added_to_channel_template=values.unset,
+                           notifications_removed_from_channel_enabled=values.unset,
+                           notifications_removed_from_channel_template=values.unset,
+                           notifications_invited_to_channel_enabled=values.unset,
+                           notifications_invited_to_channel_template=values.unset,
+                           pre_webhook_url=values.unset, post_webhook_url=values.unset,
+                           webhook_method=values.unset, webhook_filters=values.unset,
+                           webhooks_on_message_send_url=values.unset,
+                           webhooks_on_message_send_method=values.unset,
+                           webhooks_on_message_update_url=values.unset,
+                           webhooks_on_message_update_method=values.unset,
+                           webhooks_on_message_remove_url=values.unset,
+                           webhooks_on_message_remove_method=values.unset,
+                           webhooks_on_channel_add_url=values.unset,
+                           webhooks_on_channel_add_method=values.unset,
+                           webhooks_on_channel_destroy_url=values.unset,
+                           webhooks_on_channel_destroy_method=values.unset,
+                           webhooks_on_channel_update_url=values.unset,
+                           webhooks_on_channel_update_method=values.unset,
+                           webhooks_on_member_add_url=values.unset,
+                           webhooks_on_member_add_method=values.unset,
+                           webhooks_on_member_remove_url=values.unset,
+                           webhooks_on_member_remove_method=values.unset,
+                           webhooks_on_message_sent_url=values.unset,
+                           webhooks_on_message_sent_method=values.unset,
+                           webhooks_on_message_updated_url=values.unset,
+                           webhooks_on_message_updated_method=values.unset,
+                           webhooks_on_message_removed_url=values.unset,
+                           webhooks_on_message_removed_method=values.unset,
+                           webhooks_on_channel_added_url=values.unset,
+                           webhooks_on_channel_added_method=values.unset,
+                           webhooks_on_channel_destroyed_url=values.unset,
+                           webhooks_on_channel_destroyed_method=values.unset,
+                           webhooks_on_channel_updated_url=values.unset,
+                           webhooks_on_channel_updated_method=values.unset,
+                           webhooks_on_member_added_url=values.unset,
+                           webhooks_on_member_added_method=values.unset,
+                           webhooks_on_member_removed_url=values.unset,
+                           webhooks_on_member_removed_method=values.unset,
+                           limits_channel_members=values.unset,
+                           limits_user_channels=values.unset):
+        """
+        Asynchronous coroutine that updates the ServiceInstance
+
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode default_service_role_sid: The service role assigned to users when they are added to the service
+        :param unicode default_channel_role_sid: The channel role assigned to users when they are added to a channel
+        :param unicode default_channel_creator_role_sid: The channel role assigned to a channel creator when they join a new channel
+        :param bool read_status_enabled: Whether to enable the Message Consumption Horizon feature
+        :param bool reachability_enabled: Whether to enable the Reachability Indicator feature for this Service instance
+        :param unicode typing_indicator_timeout: How long in seconds to wait before assuming the user is no longer typing
+        :param unicode consumption_report_interval: DEPRECATED
+        :param bool notifications_new_message_enabled: Whether to send a notification when a new message is added to a channel
+        :param unicode notifications_new_message_template: The template to use to create the notification text displayed when a new message is added to a channel
+        :param bool notifications_added_to_channel_enabled: Whether to send a notification when a member is added to a channel
+        :param unicode notifications_added_to_channel_template: The template to use to create the notification text displayed when a member is added to a channel
+        :param bool notifications_removed_from_channel_enabled: Whether to send a notification to a user when they are removed from a channel
+        :param unicode notifications_removed_from_channel_template: The template to use to create the notification text displayed to a user when they are removed
+        :param bool notifications_invited_to_channel_enabled: Whether to send a notification when a user is invited to a channel
+        :param unicode notifications_invited_to_channel_template: The template to use to create the notification text displayed when a user is invited to a channel
+        :param unicode pre_webhook_url: The webhook URL for pre-event webhooks
+        :param unicode post_webhook_url: The URL for post-event webhooks
+        :param unicode webhook_method: The HTTP method  to use for both PRE and POST webhooks
+        :param list[unicode] webhook_filters: The list of WebHook events that are enabled for this Service instance
+        :param unicode webhooks_on_message_send_url: The URL of the webhook to call in response to the on_message_send event
+        :param unicode webhooks_on_message_send_method: The HTTP method to use when calling the webhooks.on_message_send.url
+        :param unicode webhooks_on_message_update_url: The URL of the webhook to call in response to the on_message_update event
+        :param unicode webhooks_on_message_update_method: The HTTP method to use when calling the webhooks.on_message_update.url
+        :param unicode webhooks_on_message_remove_url: The URL of the webhook to call in response to the on_message_remove event
+        :param unicode webhooks_on_message_remove_method: The HTTP method to use when calling the webhooks.on_message_remove.url
+        :param unicode webhooks_on_channel_add_url: The URL of the webhook to call in response to the on_channel_add event
+        :param unicode webhooks_on_channel_add_method: The HTTP method to use when calling the webhooks.on_channel_add.url
+        :param unicode webhooks_on_channel_destroy_url: The URL of the webhook to call in response to the on_channel_destroy event
+        :param unicode webhooks_on_channel_destroy_method: The HTTP method to use when calling the webhooks.on_channel_destroy.url
+        :param unicode webhooks_on_channel_update_url: The URL of the webhook to call in response to the on_channel_update event
+        :param unicode webhooks_on_channel_update_method: The HTTP method to use when calling the webhooks.on_channel_update.url
+        :param unicode webhooks_on_member_add_url: The URL of the webhook to call in response to the on_member_add event
+        :param unicode webhooks_on_member_add_method: The HTTP method to use when calling the webhooks.on_member_add.url
+        :param unicode webhooks_on_member_remove_url: The URL of the webhook to call in response to the on_member_remove event
+        :param unicode webhooks_on_member_remove_method: The HTTP method to use when calling the webhooks.on_member_remove.url
+        :param unicode webhooks_on_message_sent_url: The URL of the webhook to call in response to the on_message_sent event
+        :param unicode webhooks_on_message_sent_method: The URL of the webhook to call in response to the on_message_sent event
+        :param unicode webhooks_on_message_updated_url: The URL of the webhook to call in response to the on_message_updated event
+        :param unicode webhooks_on_message_updated_method: The HTTP method to use when calling the webhooks.on_message_updated.url
+        :param unicode webhooks_on_message_removed_url: The URL of the webhook to call in response to the on_message_removed event
+        :param unicode webhooks_on_message_removed_method: The HTTP method to use when calling the webhooks.on_message_removed.url
+        :param unicode webhooks_on_channel_added_url: The URL of the webhook to call in response to the on_channel_added event
+        :param unicode webhooks_on_channel_added_method: The URL of the webhook to call in response to the on_channel_added event
+        :param unicode webhooks_on_channel_destroyed_url: The URL of the webhook to call in response to the on_channel_added event
+        :param unicode webhooks_on_channel_destroyed_method: The HTTP method to use when calling the webhooks.on_channel_destroyed.url
+        :param unicode webhooks_on_channel_updated_url: he URL of the webhook to call in response to the on_channel_updated event
+        :param unicode webhooks_on_channel_updated_method: The HTTP method to use when calling the webhooks.on_channel_updated.url
+        :param unicode webhooks_on_member_added_url: The URL of the webhook to call in response to the on_channel_updated event
+        :param unicode webhooks_on_member_added_method: he HTTP method to use when calling the webhooks.on_channel_updated.url
+        :param unicode webhooks_on_member_removed_url: The URL of the webhook to call in response to the on_member_removed event
+        :param unicode webhooks_on_member_removed_method: The HTTP method to use when calling the webhooks.on_member_removed.url
+        :param unicode limits_channel_members: The maximum number of Members that can be added to Channels within this Service
+        :param unicode limits_user_channels: The maximum number of Channels Users can be a Member of within this Service
+
+        :returns: The updated ServiceInstance
+        :rtype: twilio.rest.chat.v1.service.ServiceInstance
+        """
+        return await self._proxy.update_async(
+            friendly_name=friendly_name,
+            default_service_role_sid=default_service_role_sid,
+            default_channel_role_sid=default_channel_role_sid,
+            default_channel_creator_role_sid=default_channel_creator_role_sid,
+            read_status_enabled=read_status_enabled,
+            reachability_enabled=reachability_enabled,
+            typing_indicator_timeout=typing_indicator_timeout,
+            consumption_report_interval=consumption_report_interval,
+            notifications_new_message_enabled=notifications_new_message_enabled,
+            notifications_new_message_template=notifications_new_message_template,
+            notifications_added_to_channel_enabled=notifications_added_to_channel_enabled,
+            notifications_added_to_channel_template=notifications_added_to_channel_template,
+            notifications_removed_from_channel_enabled=notifications_removed_from_channel_enabled,
+            notifications_removed_from_channel_template=notifications_removed_from_channel_template,
+            notifications_invited_to_channel_enabled=notifications_invited_to_channel_enabled,
+            notifications_invited_to_channel_template=notifications_invited_to_channel_template,
+            pre_webhook_url=pre_webhook_url,
+            post_webhook_url=post_webhook_url,
+            webhook_method=webhook_method,
+            webhook_filters=webhook_filters,
+            webhooks_on_message_send_url=webhooks_on_message_send_url,
+            webhooks_on_message_send_method=webhooks_on_message_send_method,
+            webhooks_on_message_update_url=webhooks_on_message_update_url,
+            webhooks_on_message_update_method=webhooks_on_message_update_method,
+            webhooks_on_message_remove_url=webhooks_on_message_remove_url,
+            webhooks_on_message_remove_method=webhooks_on_message_remove_method,
+            webhooks_on_channel_add_url=webhooks_on_channel_add_url,
+            webhooks_on_channel_add_method=webhooks_on_channel_add_method,
+            webhooks_on_channel_destroy_url=webhooks_on_channel_destroy_url,
+            webhooks_on_channel_destroy_method=webhooks_on_channel_destroy_method,
+            webhooks_on_channel_update_url=webhooks_on_channel_update_url,
+            webhooks_on_channel_update_method=webhooks_on_channel_update_method,
+            webhooks_on_member_add_url=webhooks_on_member_add_url,
+            webhooks_on_member_add_method=webhooks_on_member_add_method,
+            webhooks_on_member_remove_url=webhooks_on_member_remove_url,
+            webhooks_on_member_remove_method=webhooks_on_member_remove_method,
+            webhooks_on_message_sent_url=webhooks_on_message_sent_url,
+            webhooks_on_message_sent_method=webhooks_on_message_sent_method,
+            webhooks_on_message_updated_url=webhooks_on_message_updated_url,
+            webhooks_on_message_updated_method=webhooks_on_message_updated_method,
+            webhooks_on_message_removed_url=webhooks_on_message_removed_url,
+            webhooks_on_message_removed_method=webhooks_on_message_removed_method,
+            webhooks_on_channel_added_url=webhooks_on_channel_added_url,
+            webhooks_on_channel_added_method=webhooks_on_channel_added_method,
+            webhooks_on_channel_destroyed_url=webhooks_on_channel_destroyed_url,
+            webhooks_on_channel_destroyed_method=webhooks_on_channel_destroyed_method,
+            webhooks_on_channel_updated_url=webhooks_on_channel_updated_url,
+            webhooks_on_channel_updated_method=webhooks_on_channel_updated_method,
+            webhooks_on_member_added_url=webhooks_on_member_added_url,
+            webhooks_on_member_added_method=webhooks_on_member_added_method,
+            webhooks_on_member_removed_url=webhooks_on_member_removed_url,
+            webhooks_on_member_removed_method=webhooks_on_member_removed_method,
+            limits_channel_members=limits_channel_members,
+            limits_user_channels=limits_user_channels,
+        )
+
     @property
     def channels(self):
         """
@@ -907,3 +1428,21 @@ class ServiceInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Chat.V1.ServiceInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'ChannelList': 'twilio.rest.chat.v1.service.channel',
+    'RoleList': 'twilio.rest.chat.v1.service.role',
+    'UserList': 'twilio.rest.chat.v1.service.user',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -32,21 +32,23 @@ class InviteList(ListResource):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, 'channel_sid': channel_sid, }
-        self._uri = '/Services/{service_sid}/Channels/{channel_sid}/Invites'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/Channels/{channel_sid}/Invites', self._solution)
 
-    def create(self, identity, role_sid=values.unset):
+    def create(self, identity, role_sid=values.unset, deadline=None):
         """
         Create the InviteInstance
 
         :param unicode identity: The `identity` value that identifies the new resource's User
         :param unicode role_sid: The Role assigned to the new member
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created InviteInstance
         :rtype: twilio.rest.chat.v1.service.channel.invite.InviteInstance
         """
         data = values.of({'Identity': identity, 'RoleSid': role_sid, })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return InviteInstance(
             self._version,
@@ -55,7 +57,31 @@ class InviteList(ListResource):
             channel_sid=self._solution['channel_sid'],
         )
 
-    def stream(self, identity=values.unset, limit=None, page_size=None):
+    async def create_async(self, identity, role_sid=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the InviteInstance
+
+        :param unicode identity: The `identity` value that identifies the new resource's User
+        :param unicode role_sid: The Role assigned to the new member
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created InviteInstance
+        :rtype: twilio.rest.chat.v1.service.channel.invite.InviteInstance
+        """
+        data = values.of({'Identity': identity, 'RoleSid': role_sid, })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return InviteInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            channel_sid=self._solution['channel_sid'],
+        )
+
+    def stream(self, identity=values.unset, limit=None, page_size=None,
+               prefetch=None, raw=False, deadline=None):
         """
         Streams InviteInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -69,17 +95,59 @@ class InviteList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.chat.v1.service.channel.invite.InviteInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(identity=identity, page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(identity=identity, page_size=limits['page_size'], )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, identity=values.unset, limit=None, page_size=None,
+                           prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams InviteInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param list[unicode] identity: The `identity` value of the resources to read
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.chat.v1.service.channel.invite.InviteInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(identity=identity, page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, identity=values.unset, limit=None, page_size=None):
+    def list(self, identity=values.unset, limit=None, page_size=None,
+             prefetch=None, raw=False, deadline=None):
         """
         Lists InviteInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -92,11 +160,43 @@ class InviteList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.chat.v1.service.channel.invite.InviteInstance]
+        """
+        return list(self.stream(identity=identity, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, identity=values.unset, limit=None, page_size=None,
+                         prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists InviteInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param list[unicode] identity: The `identity` value of the resources to read
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.chat.v1.service.channel.invite.InviteInstance]
         """
-        return list(self.stream(identity=identity, limit=limit, page_size=page_size, ))
+        return [record async for record in await self.stream_async(identity=identity, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, identity=values.unset, page_token=values.unset,
              page_number=values.unset, page_size=values.unset):
@@ -123,6 +223,31 @@ class InviteList(ListResource):
 
         return InvitePage(self._version, response, self._solution)
 
+    async def page_async(self, identity=values.unset, page_token=values.unset,
+                         page_number=values.unset, page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of InviteInstance records from the API.
+        Request is executed immediately
+
+        :param list[unicode] identity: The `identity` value of the resources to read
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of InviteInstance
+        :rtype: twilio.rest.chat.v1.service.channel.invite.InvitePage
+        """
+        data = values.of({
+            'Identity': serialize.map(identity, lambda e: e),
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return InvitePage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of InviteInstance records from the API.
@@ -140,6 +265,23 @@ class InviteList(ListResource):
 
         return InvitePage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of InviteInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of InviteInstance
+        :rtype: twilio.rest.chat.v1.service.channel.invite.InvitePage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return InvitePage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a InviteContext
@@ -245,7 +387,7 @@ class InviteContext(InstanceContext):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, 'channel_sid': channel_sid, 'sid': sid, }
-        self._uri = '/Services/{service_sid}/Channels/{channel_sid}/Invites/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/Channels/{channel_sid}/Invites/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -264,6 +406,23 @@ class InviteContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the InviteInstance
+
+        :returns: The fetched InviteInstance
+        :rtype: twilio.rest.chat.v1.service.channel.invite.InviteInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return InviteInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            channel_sid=self._solution['channel_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self):
         """
         Deletes the InviteInstance
@@ -273,6 +432,15 @@ class InviteContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the InviteInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -286,6 +454,28 @@ class InviteContext(InstanceContext):
 
 class InviteInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'channel_sid': 'channel_sid',
+        'service_sid': 'service_sid',
+        'identity': 'identity',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'role_sid': 'role_sid',
+        'created_by': 'created_by',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload, service_sid, channel_sid, sid=None):
         """
         Initialize the InviteInstance
@@ -296,18 +486,7 @@ class InviteInstance(InstanceResource):
         super(InviteInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'channel_sid': payload.get('channel_sid'),
-            'service_sid': payload.get('service_sid'),
-            'identity': payload.get('identity'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'role_sid': payload.get('role_sid'),
-            'created_by': payload.get('created_by'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -424,6 +603,15 @@ class InviteInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the InviteInstance
+
+        :returns: The fetched InviteInstance
+        :rtype: twilio.rest.chat.v1.service.channel.invite.InviteInstance
+        """
+        return await self._proxy.fetch_async()
+
     def delete(self):
         """
         Deletes the InviteInstance
@@ -433,6 +621,15 @@ class InviteInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the InviteInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
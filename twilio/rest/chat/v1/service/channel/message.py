@@ -31,22 +31,24 @@ class MessageList(ListResource):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, 'channel_sid': channel_sid, }
-        self._uri = '/Services/{service_sid}/Channels/{channel_sid}/Messages'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/Channels/{channel_sid}/Messages', self._solution)
 
-    def create(self, body, from_=values.unset, attributes=values.unset):
+    def create(self, body, from_=values.unset, attributes=values.unset, deadline=None):
         """
         Create the MessageInstance
 
         :param unicode body: The message to send to the channel
         :param unicode from_: The identity of the new message's author
         :param unicode attributes: A valid JSON string that contains application-specific data
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created MessageInstance
         :rtype: twilio.rest.chat.v1.service.channel.message.MessageInstance
         """
         data = values.of({'Body': body, 'From': from_, 'Attributes': attributes, })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return MessageInstance(
             self._version,
@@ -55,7 +57,32 @@ class MessageList(ListResource):
             channel_sid=self._solution['channel_sid'],
         )
 
-    def stream(self, order=values.unset, limit=None, page_size=None):
+    async def create_async(self, body, from_=values.unset, attributes=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the MessageInstance
+
+        :param unicode body: The message to send to the channel
+        :param unicode from_: The identity of the new message's author
+        :param unicode attributes: A valid JSON string that contains application-specific data
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created MessageInstance
+        :rtype: twilio.rest.chat.v1.service.channel.message.MessageInstance
+        """
+        data = values.of({'Body': body, 'From': from_, 'Attributes': attributes, })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return MessageInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            channel_sid=self._solution['channel_sid'],
+        )
+
+    def stream(self, order=values.unset, limit=None, page_size=None,
+               prefetch=None, raw=False, deadline=None):
         """
         Streams MessageInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -69,17 +96,59 @@ class MessageList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.chat.v1.service.channel.message.MessageInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(order=order, page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(order=order, page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, order=values.unset, limit=None, page_size=None):
+    async def stream_async(self, order=values.unset, limit=None, page_size=None,
+                           prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams MessageInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param MessageInstance.OrderType order: The sort order of the returned messages
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.chat.v1.service.channel.message.MessageInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(order=order, page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, order=values.unset, limit=None, page_size=None,
+             prefetch=None, raw=False, deadline=None):
         """
         Lists MessageInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -92,11 +161,43 @@ class MessageList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.chat.v1.service.channel.message.MessageInstance]
         """
-        return list(self.stream(order=order, limit=limit, page_size=page_size, ))
+        return list(self.stream(order=order, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, order=values.unset, limit=None, page_size=None,
+                         prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists MessageInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param MessageInstance.OrderType order: The sort order of the returned messages
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.chat.v1.service.channel.message.MessageInstance]
+        """
+        return [record async for record in await self.stream_async(order=order, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, order=values.unset, page_token=values.unset,
              page_number=values.unset, page_size=values.unset):
@@ -123,6 +224,31 @@ class MessageList(ListResource):
 
         return MessagePage(self._version, response, self._solution)
 
+    async def page_async(self, order=values.unset, page_token=values.unset,
+                         page_number=values.unset, page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of MessageInstance records from the API.
+        Request is executed immediately
+
+        :param MessageInstance.OrderType order: The sort order of the returned messages
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of MessageInstance
+        :rtype: twilio.rest.chat.v1.service.channel.message.MessagePage
+        """
+        data = values.of({
+            'Order': order,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return MessagePage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of MessageInstance records from the API.
@@ -140,6 +266,23 @@ class MessageList(ListResource):
 
         return MessagePage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of MessageInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of MessageInstance
+        :rtype: twilio.rest.chat.v1.service.channel.message.MessagePage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return MessagePage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a MessageContext
@@ -245,7 +388,7 @@ class MessageContext(InstanceContext):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, 'channel_sid': channel_sid, 'sid': sid, }
-        self._uri = '/Services/{service_sid}/Channels/{channel_sid}/Messages/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/Channels/{channel_sid}/Messages/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -264,6 +407,23 @@ class MessageContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the MessageInstance
+
+        :returns: The fetched MessageInstance
+        :rtype: twilio.rest.chat.v1.service.channel.message.MessageInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return MessageInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            channel_sid=self._solution['channel_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self):
         """
         Deletes the MessageInstance
@@ -273,6 +433,15 @@ class MessageContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the MessageInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def update(self, body=values.unset, attributes=values.unset):
         """
         Update the MessageInstance
@@ -295,6 +464,28 @@ class MessageContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, body=values.unset, attributes=values.unset):
+        """
+        Asynchronous coroutine that updates the MessageInstance
+
+        :param unicode body: The message to send to the channel
+        :param unicode attributes: A valid JSON string that contains application-specific data
+
+        :returns: The updated MessageInstance
+        :rtype: twilio.rest.chat.v1.service.channel.message.MessageInstance
+        """
+        data = values.of({'Body': body, 'Attributes': attributes, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return MessageInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            channel_sid=self._solution['channel_sid'],
+            sid=self._solution['sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -312,6 +503,32 @@ class MessageInstance(InstanceResource):
         ASC = "asc"
         DESC = "desc"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+        'index': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'attributes': 'attributes',
+        'service_sid': 'service_sid',
+        'to': 'to',
+        'channel_sid': 'channel_sid',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'was_edited': 'was_edited',
+        'from_': 'from',
+        'body': 'body',
+        'index': 'index',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload, service_sid, channel_sid, sid=None):
         """
         Initialize the MessageInstance
@@ -322,21 +539,7 @@ class MessageInstance(InstanceResource):
         super(MessageInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'attributes': payload.get('attributes'),
-            'service_sid': payload.get('service_sid'),
-            'to': payload.get('to'),
-            'channel_sid': payload.get('channel_sid'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'was_edited': payload.get('was_edited'),
-            'from_': payload.get('from'),
-            'body': payload.get('body'),
-            'index': deserialize.integer(payload.get('index')),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -477,6 +680,15 @@ class MessageInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the MessageInstance
+
+        :returns: The fetched MessageInstance
+        :rtype: twilio.rest.chat.v1.service.channel.message.MessageInstance
+        """
+        return await self._proxy.fetch_async()
+
     def delete(self):
         """
         Deletes the MessageInstance
@@ -486,6 +698,15 @@ class MessageInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the MessageInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def update(self, body=values.unset, attributes=values.unset):
         """
         Update the MessageInstance
@@ -498,6 +719,18 @@ class MessageInstance(InstanceResource):
         """
         return self._proxy.update(body=body, attributes=attributes, )
 
+    async def update_async(self, body=values.unset, attributes=values.unset):
+        """
+        Asynchronous coroutine that updates the MessageInstance
+
+        :param unicode body: The message to send to the channel
+        :param unicode attributes: A valid JSON string that contains application-specific data
+
+        :returns: The updated MessageInstance
+        :rtype: twilio.rest.chat.v1.service.channel.message.MessageInstance
+        """
+        return await self._proxy.update_async(body=body, attributes=attributes, )
+
     def __repr__(self):
         """
         Provide a friendly representation
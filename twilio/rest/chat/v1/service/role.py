@@ -31,15 +31,17 @@ class RoleList(ListResource):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, }
-        self._uri = '/Services/{service_sid}/Roles'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/Roles', self._solution)
 
-    def create(self, friendly_name, type, permission):
+    def create(self, friendly_name, type, permission, deadline=None):
         """
         Create the RoleInstance
 
         :param unicode friendly_name: A string to describe the new resource
         :param RoleInstance.RoleType type: The type of role
         :param list[unicode] permission: A permission the role should have
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created RoleInstance
         :rtype: twilio.rest.chat.v1.service.role.RoleInstance
@@ -50,11 +52,34 @@ class RoleList(ListResource):
             'Permission': serialize.map(permission, lambda e: e),
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return RoleInstance(self._version, payload, service_sid=self._solution['service_sid'], )
 
-    def stream(self, limit=None, page_size=None):
+    async def create_async(self, friendly_name, type, permission, deadline=None):
+        """
+        Asynchronous coroutine that creates the RoleInstance
+
+        :param unicode friendly_name: A string to describe the new resource
+        :param RoleInstance.RoleType type: The type of role
+        :param list[unicode] permission: A permission the role should have
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created RoleInstance
+        :rtype: twilio.rest.chat.v1.service.role.RoleInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'Type': type,
+            'Permission': serialize.map(permission, lambda e: e),
+        })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return RoleInstance(self._version, payload, service_sid=self._solution['service_sid'], )
+
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams RoleInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -67,17 +92,57 @@ class RoleList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.chat.v1.service.role.RoleInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams RoleInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.chat.v1.service.role.RoleInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists RoleInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -89,11 +154,42 @@ class RoleList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.chat.v1.service.role.RoleInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists RoleInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.chat.v1.service.role.RoleInstance]
+        """
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -114,6 +210,25 @@ class RoleList(ListResource):
 
         return RolePage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of RoleInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of RoleInstance
+        :rtype: twilio.rest.chat.v1.service.role.RolePage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return RolePage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of RoleInstance records from the API.
@@ -131,6 +246,23 @@ class RoleList(ListResource):
 
         return RolePage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of RoleInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of RoleInstance
+        :rtype: twilio.rest.chat.v1.service.role.RolePage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return RolePage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a RoleContext
@@ -219,7 +351,7 @@ class RoleContext(InstanceContext):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, 'sid': sid, }
-        self._uri = '/Services/{service_sid}/Roles/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/Roles/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -237,6 +369,22 @@ class RoleContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the RoleInstance
+
+        :returns: The fetched RoleInstance
+        :rtype: twilio.rest.chat.v1.service.role.RoleInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return RoleInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self):
         """
         Deletes the RoleInstance
@@ -246,6 +394,15 @@ class RoleContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the RoleInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def update(self, permission):
         """
         Update the RoleInstance
@@ -266,6 +423,26 @@ class RoleContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, permission):
+        """
+        Asynchronous coroutine that updates the RoleInstance
+
+        :param list[unicode] permission: A permission the role should have
+
+        :returns: The updated RoleInstance
+        :rtype: twilio.rest.chat.v1.service.role.RoleInstance
+        """
+        data = values.of({'Permission': serialize.map(permission, lambda e: e), })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return RoleInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            sid=self._solution['sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -283,6 +460,27 @@ class RoleInstance(InstanceResource):
         CHANNEL = "channel"
         DEPLOYMENT = "deployment"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'service_sid': 'service_sid',
+        'friendly_name': 'friendly_name',
+        'type': 'type',
+        'permissions': 'permissions',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload, service_sid, sid=None):
         """
         Initialize the RoleInstance
@@ -293,17 +491,7 @@ class RoleInstance(InstanceResource):
         super(RoleInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'service_sid': payload.get('service_sid'),
-            'friendly_name': payload.get('friendly_name'),
-            'type': payload.get('type'),
-            'permissions': payload.get('permissions'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -407,6 +595,15 @@ class RoleInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the RoleInstance
+
+        :returns: The fetched RoleInstance
+        :rtype: twilio.rest.chat.v1.service.role.RoleInstance
+        """
+        return await self._proxy.fetch_async()
+
     def delete(self):
         """
         Deletes the RoleInstance
@@ -416,6 +613,15 @@ class RoleInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the RoleInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def update(self, permission):
         """
         Update the RoleInstance
@@ -427,6 +633,17 @@ class RoleInstance(InstanceResource):
         """
         return self._proxy.update(permission, )
 
+    async def update_async(self, permission):
+        """
+        Asynchronous coroutine that updates the RoleInstance
+
+        :param list[unicode] permission: A permission the role should have
+
+        :returns: The updated RoleInstance
+        :rtype: twilio.rest.chat.v1.service.role.RoleInstance
+        """
+        return await self._proxy.update_async(permission, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -32,12 +32,12 @@ class MessageList(ListResource):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, 'channel_sid': channel_sid, }
-        self._uri = '/Services/{service_sid}/Channels/{channel_sid}/Messages'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/Channels/{channel_sid}/Messages', self._solution)
 
     def create(self, from_=values.unset, attributes=values.unset,
                date_created=values.unset, date_updated=values.unset,
                last_updated_by=values.unset, body=values.unset,
-               media_sid=values.unset, x_twilio_webhook_enabled=values.unset):
+               media_sid=values.unset, x_twilio_webhook_enabled=values.unset, deadline=None):
         """
         Create the MessageInstance
 
@@ -49,6 +49,8 @@ class MessageList(ListResource):
         :param unicode body: The message to send to the channel
         :param unicode media_sid:  The Media Sid to be attached to the new Message
         :param MessageInstance.WebhookEnabledType x_twilio_webhook_enabled: The X-Twilio-Webhook-Enabled HTTP request header
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created MessageInstance
         :rtype: twilio.rest.chat.v2.service.channel.message.MessageInstance
@@ -64,7 +66,7 @@ class MessageList(ListResource):
         })
         headers = values.of({'X-Twilio-Webhook-Enabled': x_twilio_webhook_enabled, })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, headers=headers, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, headers=headers, deadline=deadline, )
 
         return MessageInstance(
             self._version,
@@ -73,7 +75,50 @@ class MessageList(ListResource):
             channel_sid=self._solution['channel_sid'],
         )
 
-    def stream(self, order=values.unset, limit=None, page_size=None):
+    async def create_async(self, from_=values.unset, attributes=values.unset,
+                           date_created=values.unset, date_updated=values.unset,
+                           last_updated_by=values.unset, body=values.unset,
+                           media_sid=values.unset, x_twilio_webhook_enabled=values.unset,
+                           deadline=None):
+        """
+        Asynchronous coroutine that creates the MessageInstance
+
+        :param unicode from_: The Identity of the new message's author
+        :param unicode attributes: A valid JSON string that contains application-specific data
+        :param datetime date_created: The ISO 8601 date and time in GMT when the resource was created
+        :param datetime date_updated: The ISO 8601 date and time in GMT when the resource was updated
+        :param unicode last_updated_by: The Identity of the User who last updated the Message
+        :param unicode body: The message to send to the channel
+        :param unicode media_sid:  The Media Sid to be attached to the new Message
+        :param MessageInstance.WebhookEnabledType x_twilio_webhook_enabled: The X-Twilio-Webhook-Enabled HTTP request header
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created MessageInstance
+        :rtype: twilio.rest.chat.v2.service.channel.message.MessageInstance
+        """
+        data = values.of({
+            'From': from_,
+            'Attributes': attributes,
+            'DateCreated': serialize.iso8601_datetime(date_created),
+            'DateUpdated': serialize.iso8601_datetime(date_updated),
+            'LastUpdatedBy': last_updated_by,
+            'Body': body,
+            'MediaSid': media_sid,
+        })
+        headers = values.of({'X-Twilio-Webhook-Enabled': x_twilio_webhook_enabled, })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, headers=headers, deadline=deadline, )
+
+        return MessageInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            channel_sid=self._solution['channel_sid'],
+        )
+
+    def stream(self, order=values.unset, limit=None, page_size=None,
+               prefetch=None, raw=False, deadline=None):
         """
         Streams MessageInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -87,17 +132,59 @@ class MessageList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.chat.v2.service.channel.message.MessageInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(order=order, page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(order=order, page_size=limits['page_size'], )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, order=values.unset, limit=None, page_size=None,
+                           prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams MessageInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param MessageInstance.OrderType order: The sort order of the returned messages
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.chat.v2.service.channel.message.MessageInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(order=order, page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, order=values.unset, limit=None, page_size=None):
+    def list(self, order=values.unset, limit=None, page_size=None,
+             prefetch=None, raw=False, deadline=None):
         """
         Lists MessageInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -110,11 +197,43 @@ class MessageList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.chat.v2.service.channel.message.MessageInstance]
         """
-        return list(self.stream(order=order, limit=limit, page_size=page_size, ))
+        return list(self.stream(order=order, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, order=values.unset, limit=None, page_size=None,
+                         prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists MessageInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param MessageInstance.OrderType order: The sort order of the returned messages
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.chat.v2.service.channel.message.MessageInstance]
+        """
+        return [record async for record in await self.stream_async(order=order, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, order=values.unset, page_token=values.unset,
              page_number=values.unset, page_size=values.unset):
@@ -141,6 +260,31 @@ class MessageList(ListResource):
 
         return MessagePage(self._version, response, self._solution)
 
+    async def page_async(self, order=values.unset, page_token=values.unset,
+                         page_number=values.unset, page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of MessageInstance records from the API.
+        Request is executed immediately
+
+        :param MessageInstance.OrderType order: The sort order of the returned messages
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of MessageInstance
+        :rtype: twilio.rest.chat.v2.service.channel.message.MessagePage
+        """
+        data = values.of({
+            'Order': order,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return MessagePage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of MessageInstance records from the API.
@@ -158,6 +302,23 @@ class MessageList(ListResource):
 
         return MessagePage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of MessageInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of MessageInstance
+        :rtype: twilio.rest.chat.v2.service.channel.message.MessagePage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return MessagePage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a MessageContext
@@ -263,7 +424,7 @@ class MessageContext(InstanceContext):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, 'channel_sid': channel_sid, 'sid': sid, }
-        self._uri = '/Services/{service_sid}/Channels/{channel_sid}/Messages/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/Channels/{channel_sid}/Messages/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -282,6 +443,23 @@ class MessageContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the MessageInstance
+
+        :returns: The fetched MessageInstance
+        :rtype: twilio.rest.chat.v2.service.channel.message.MessageInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return MessageInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            channel_sid=self._solution['channel_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self, x_twilio_webhook_enabled=values.unset):
         """
         Deletes the MessageInstance
@@ -295,6 +473,19 @@ class MessageContext(InstanceContext):
 
         return self._version.delete(method='DELETE', uri=self._uri, headers=headers, )
 
+    async def delete_async(self, x_twilio_webhook_enabled=values.unset):
+        """
+        Asynchronous coroutine that deletes the MessageInstance
+
+        :param MessageInstance.WebhookEnabledType x_twilio_webhook_enabled: The X-Twilio-Webhook-Enabled HTTP request header
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        headers = values.of({'X-Twilio-Webhook-Enabled': x_twilio_webhook_enabled, })
+
+        return await self._version.delete_async(method='DELETE', uri=self._uri, headers=headers, )
+
     def update(self, body=values.unset, attributes=values.unset,
                date_created=values.unset, date_updated=values.unset,
                last_updated_by=values.unset, from_=values.unset,
@@ -333,6 +524,44 @@ class MessageContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, body=values.unset, attributes=values.unset,
+                           date_created=values.unset, date_updated=values.unset,
+                           last_updated_by=values.unset, from_=values.unset,
+                           x_twilio_webhook_enabled=values.unset):
+        """
+        Asynchronous coroutine that updates the MessageInstance
+
+        :param unicode body: The message to send to the channel
+        :param unicode attributes: A valid JSON string that contains application-specific data
+        :param datetime date_created: The ISO 8601 date and time in GMT when the resource was created
+        :param datetime date_updated: The ISO 8601 date and time in GMT when the resource was updated
+        :param unicode last_updated_by: The Identity of the User who last updated the Message, if applicable
+        :param unicode from_: The Identity of the message's author
+        :param MessageInstance.WebhookEnabledType x_twilio_webhook_enabled: The X-Twilio-Webhook-Enabled HTTP request header
+
+        :returns: The updated MessageInstance
+        :rtype: twilio.rest.chat.v2.service.channel.message.MessageInstance
+        """
+        data = values.of({
+            'Body': body,
+            'Attributes': attributes,
+            'DateCreated': serialize.iso8601_datetime(date_created),
+            'DateUpdated': serialize.iso8601_datetime(date_updated),
+            'LastUpdatedBy': last_updated_by,
+            'From': from_,
+        })
+        headers = values.of({'X-Twilio-Webhook-Enabled': x_twilio_webhook_enabled, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, headers=headers, )
+
+        return MessageInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            channel_sid=self._solution['channel_sid'],
+            sid=self._solution['sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -354,6 +583,35 @@ class MessageInstance(InstanceResource):
         TRUE = "true"
         FALSE = "false"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+        'index': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'attributes': 'attributes',
+        'service_sid': 'service_sid',
+        'to': 'to',
+        'channel_sid': 'channel_sid',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'last_updated_by': 'last_updated_by',
+        'was_edited': 'was_edited',
+        'from_': 'from',
+        'body': 'body',
+        'index': 'index',
+        'type': 'type',
+        'media': 'media',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload, service_sid, channel_sid, sid=None):
         """
         Initialize the MessageInstance
@@ -364,24 +622,7 @@ class MessageInstance(InstanceResource):
         super(MessageInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'attributes': payload.get('attributes'),
-            'service_sid': payload.get('service_sid'),
-            'to': payload.get('to'),
-            'channel_sid': payload.get('channel_sid'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'last_updated_by': payload.get('last_updated_by'),
-            'was_edited': payload.get('was_edited'),
-            'from_': payload.get('from'),
-            'body': payload.get('body'),
-            'index': deserialize.integer(payload.get('index')),
-            'type': payload.get('type'),
-            'media': payload.get('media'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -546,6 +787,15 @@ class MessageInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the MessageInstance
+
+        :returns: The fetched MessageInstance
+        :rtype: twilio.rest.chat.v2.service.channel.message.MessageInstance
+        """
+        return await self._proxy.fetch_async()
+
     def delete(self, x_twilio_webhook_enabled=values.unset):
         """
         Deletes the MessageInstance
@@ -557,6 +807,17 @@ class MessageInstance(InstanceResource):
         """
         return self._proxy.delete(x_twilio_webhook_enabled=x_twilio_webhook_enabled, )
 
+    async def delete_async(self, x_twilio_webhook_enabled=values.unset):
+        """
+        Asynchronous coroutine that deletes the MessageInstance
+
+        :param MessageInstance.WebhookEnabledType x_twilio_webhook_enabled: The X-Twilio-Webhook-Enabled HTTP request header
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async(x_twilio_webhook_enabled=x_twilio_webhook_enabled, )
+
     def update(self, body=values.unset, attributes=values.unset,
                date_created=values.unset, date_updated=values.unset,
                last_updated_by=values.unset, from_=values.unset,
@@ -585,6 +846,34 @@ class MessageInstance(InstanceResource):
             x_twilio_webhook_enabled=x_twilio_webhook_enabled,
         )
 
+    async def update_async(self, body=values.unset, attributes=values.unset,
+                           date_created=values.unset, date_updated=values.unset,
+                           last_updated_by=values.unset, from_=values.unset,
+                           x_twilio_webhook_enabled=values.unset):
+        """
+        Asynchronous coroutine that updates the MessageInstance
+
+        :param unicode body: The message to send to the channel
+        :param unicode attributes: A valid JSON string that contains application-specific data
+        :param datetime date_created: The ISO 8601 date and time in GMT when the resource was created
+        :param datetime date_updated: The ISO 8601 date and time in GMT when the resource was updated
+        :param unicode last_updated_by: The Identity of the User who last updated the Message, if applicable
+        :param unicode from_: The Identity of the message's author
+        :param MessageInstance.WebhookEnabledType x_twilio_webhook_enabled: The X-Twilio-Webhook-Enabled HTTP request header
+
+        :returns: The updated MessageInstance
+        :rtype: twilio.rest.chat.v2.service.channel.message.MessageInstance
+        """
+        return await self._proxy.update_async(
+            body=body,
+            attributes=attributes,
+            date_created=date_created,
+            date_updated=date_updated,
+            last_updated_by=last_updated_by,
+            from_=from_,
+            x_twilio_webhook_enabled=x_twilio_webhook_enabled,
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
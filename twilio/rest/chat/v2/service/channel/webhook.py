@@ -32,9 +32,9 @@ class WebhookList(ListResource):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, 'channel_sid': channel_sid, }
-        self._uri = '/Services/{service_sid}/Channels/{channel_sid}/Webhooks'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/Channels/{channel_sid}/Webhooks', self._solution)
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams WebhookInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -47,17 +47,57 @@ class WebhookList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.chat.v2.service.channel.webhook.WebhookInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams WebhookInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.chat.v2.service.channel.webhook.WebhookInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists WebhookInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -69,11 +109,42 @@ class WebhookList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.chat.v2.service.channel.webhook.WebhookInstance]
+        """
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists WebhookInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.chat.v2.service.channel.webhook.WebhookInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -94,6 +165,25 @@ class WebhookList(ListResource):
 
         return WebhookPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of WebhookInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of WebhookInstance
+        :rtype: twilio.rest.chat.v2.service.channel.webhook.WebhookPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return WebhookPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of WebhookInstance records from the API.
@@ -111,12 +201,29 @@ class WebhookList(ListResource):
 
         return WebhookPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of WebhookInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of WebhookInstance
+        :rtype: twilio.rest.chat.v2.service.channel.webhook.WebhookPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return WebhookPage(self._version, response, self._solution)
+
     def create(self, type, configuration_url=values.unset,
                configuration_method=values.unset,
                configuration_filters=values.unset,
                configuration_triggers=values.unset,
                configuration_flow_sid=values.unset,
-               configuration_retry_count=values.unset):
+               configuration_retry_count=values.unset, deadline=None):
         """
         Create the WebhookInstance
 
@@ -127,6 +234,49 @@ class WebhookList(ListResource):
         :param list[unicode] configuration_triggers: A string that will cause us to call the webhook when it is found in a message body
         :param unicode configuration_flow_sid: The SID of the Studio Flow to call when an event occurs
         :param unicode configuration_retry_count: The number of times to retry the webhook if the first attempt fails
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created WebhookInstance
+        :rtype: twilio.rest.chat.v2.service.channel.webhook.WebhookInstance
+        """
+        data = values.of({
+            'Type': type,
+            'Configuration.Url': configuration_url,
+            'Configuration.Method': configuration_method,
+            'Configuration.Filters': serialize.map(configuration_filters, lambda e: e),
+            'Configuration.Triggers': serialize.map(configuration_triggers, lambda e: e),
+            'Configuration.FlowSid': configuration_flow_sid,
+            'Configuration.RetryCount': configuration_retry_count,
+        })
+
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return WebhookInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            channel_sid=self._solution['channel_sid'],
+        )
+
+    async def create_async(self, type, configuration_url=values.unset,
+                           configuration_method=values.unset,
+                           configuration_filters=values.unset,
+                           configuration_triggers=values.unset,
+                           configuration_flow_sid=values.unset,
+                           configuration_retry_count=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the WebhookInstance
+
+        :param WebhookInstance.Type type: The type of webhook
+        :param unicode configuration_url: The URL of the webhook to call
+        :param WebhookInstance.Method configuration_method: The HTTP method used to call `configuration.url`
+        :param list[unicode] configuration_filters: The events that cause us to call the Channel Webhook
+        :param list[unicode] configuration_triggers: A string that will cause us to call the webhook when it is found in a message body
+        :param unicode configuration_flow_sid: The SID of the Studio Flow to call when an event occurs
+        :param unicode configuration_retry_count: The number of times to retry the webhook if the first attempt fails
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created WebhookInstance
         :rtype: twilio.rest.chat.v2.service.channel.webhook.WebhookInstance
@@ -141,7 +291,7 @@ class WebhookList(ListResource):
             'Configuration.RetryCount': configuration_retry_count,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return WebhookInstance(
             self._version,
@@ -255,7 +405,7 @@ class WebhookContext(InstanceContext):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, 'channel_sid': channel_sid, 'sid': sid, }
-        self._uri = '/Services/{service_sid}/Channels/{channel_sid}/Webhooks/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/Channels/{channel_sid}/Webhooks/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -274,6 +424,23 @@ class WebhookContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the WebhookInstance
+
+        :returns: The fetched WebhookInstance
+        :rtype: twilio.rest.chat.v2.service.channel.webhook.WebhookInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return WebhookInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            channel_sid=self._solution['channel_sid'],
+            sid=self._solution['sid'],
+        )
+
     def update(self, configuration_url=values.unset,
                configuration_method=values.unset,
                configuration_filters=values.unset,
@@ -312,6 +479,44 @@ class WebhookContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, configuration_url=values.unset,
+                           configuration_method=values.unset,
+                           configuration_filters=values.unset,
+                           configuration_triggers=values.unset,
+                           configuration_flow_sid=values.unset,
+                           configuration_retry_count=values.unset):
+        """
+        Asynchronous coroutine that updates the WebhookInstance
+
+        :param unicode configuration_url: The URL of the webhook to call
+        :param WebhookInstance.Method configuration_method: The HTTP method used to call `configuration.url`
+        :param list[unicode] configuration_filters: The events that cause us to call the Channel Webhook
+        :param list[unicode] configuration_triggers: A string that will cause us to call the webhook when it is found in a message body
+        :param unicode configuration_flow_sid: The SID of the Studio Flow to call when an event occurs
+        :param unicode configuration_retry_count: The number of times to retry the webhook if the first attempt fails
+
+        :returns: The updated WebhookInstance
+        :rtype: twilio.rest.chat.v2.service.channel.webhook.WebhookInstance
+        """
+        data = values.of({
+            'Configuration.Url': configuration_url,
+            'Configuration.Method': configuration_method,
+            'Configuration.Filters': serialize.map(configuration_filters, lambda e: e),
+            'Configuration.Triggers': serialize.map(configuration_triggers, lambda e: e),
+            'Configuration.FlowSid': configuration_flow_sid,
+            'Configuration.RetryCount': configuration_retry_count,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return WebhookInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            channel_sid=self._solution['channel_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self):
         """
         Deletes the WebhookInstance
@@ -321,6 +526,15 @@ class WebhookContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the WebhookInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -343,6 +557,27 @@ class WebhookInstance(InstanceResource):
         GET = "GET"
         POST = "POST"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'service_sid': 'service_sid',
+        'channel_sid': 'channel_sid',
+        'type': 'type',
+        'url': 'url',
+        'configuration': 'configuration',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+    }, _deserializers)
+
     def __init__(self, version, payload, service_sid, channel_sid, sid=None):
         """
         Initialize the WebhookInstance
@@ -353,17 +588,7 @@ class WebhookInstance(InstanceResource):
         super(WebhookInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'service_sid': payload.get('service_sid'),
-            'channel_sid': payload.get('channel_sid'),
-            'type': payload.get('type'),
-            'url': payload.get('url'),
-            'configuration': payload.get('configuration'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -472,6 +697,15 @@ class WebhookInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the WebhookInstance
+
+        :returns: The fetched WebhookInstance
+        :rtype: twilio.rest.chat.v2.service.channel.webhook.WebhookInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, configuration_url=values.unset,
                configuration_method=values.unset,
                configuration_filters=values.unset,
@@ -500,6 +734,34 @@ class WebhookInstance(InstanceResource):
             configuration_retry_count=configuration_retry_count,
         )
 
+    async def update_async(self, configuration_url=values.unset,
+                           configuration_method=values.unset,
+                           configuration_filters=values.unset,
+                           configuration_triggers=values.unset,
+                           configuration_flow_sid=values.unset,
+                           configuration_retry_count=values.unset):
+        """
+        Asynchronous coroutine that updates the WebhookInstance
+
+        :param unicode configuration_url: The URL of the webhook to call
+        :param WebhookInstance.Method configuration_method: The HTTP method used to call `configuration.url`
+        :param list[unicode] configuration_filters: The events that cause us to call the Channel Webhook
+        :param list[unicode] configuration_triggers: A string that will cause us to call the webhook when it is found in a message body
+        :param unicode configuration_flow_sid: The SID of the Studio Flow to call when an event occurs
+        :param unicode configuration_retry_count: The number of times to retry the webhook if the first attempt fails
+
+        :returns: The updated WebhookInstance
+        :rtype: twilio.rest.chat.v2.service.channel.webhook.WebhookInstance
+        """
+        return await self._proxy.update_async(
+            configuration_url=configuration_url,
+            configuration_method=configuration_method,
+            configuration_filters=configuration_filters,
+            configuration_triggers=configuration_triggers,
+            configuration_flow_sid=configuration_flow_sid,
+            configuration_retry_count=configuration_retry_count,
+        )
+
     def delete(self):
         """
         Deletes the WebhookInstance
@@ -509,6 +771,15 @@ class WebhookInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the WebhookInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -32,9 +32,9 @@ class UserChannelList(ListResource):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, 'user_sid': user_sid, }
-        self._uri = '/Services/{service_sid}/Users/{user_sid}/Channels'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/Users/{user_sid}/Channels', self._solution)
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams UserChannelInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -47,17 +47,57 @@ class UserChannelList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.chat.v2.service.user.user_channel.UserChannelInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams UserChannelInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.chat.v2.service.user.user_channel.UserChannelInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists UserChannelInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -69,11 +109,42 @@ class UserChannelList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.chat.v2.service.user.user_channel.UserChannelInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists UserChannelInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.chat.v2.service.user.user_channel.UserChannelInstance]
+        """
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -94,6 +165,25 @@ class UserChannelList(ListResource):
 
         return UserChannelPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of UserChannelInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of UserChannelInstance
+        :rtype: twilio.rest.chat.v2.service.user.user_channel.UserChannelPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return UserChannelPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of UserChannelInstance records from the API.
@@ -111,6 +201,23 @@ class UserChannelList(ListResource):
 
         return UserChannelPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of UserChannelInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of UserChannelInstance
+        :rtype: twilio.rest.chat.v2.service.user.user_channel.UserChannelPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return UserChannelPage(self._version, response, self._solution)
+
     def get(self, channel_sid):
         """
         Constructs a UserChannelContext
@@ -216,7 +323,7 @@ class UserChannelContext(InstanceContext):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, 'user_sid': user_sid, 'channel_sid': channel_sid, }
-        self._uri = '/Services/{service_sid}/Users/{user_sid}/Channels/{channel_sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/Users/{user_sid}/Channels/{channel_sid}', self._solution)
 
     def fetch(self):
         """
@@ -235,6 +342,23 @@ class UserChannelContext(InstanceContext):
             channel_sid=self._solution['channel_sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the UserChannelInstance
+
+        :returns: The fetched UserChannelInstance
+        :rtype: twilio.rest.chat.v2.service.user.user_channel.UserChannelInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return UserChannelInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            user_sid=self._solution['user_sid'],
+            channel_sid=self._solution['channel_sid'],
+        )
+
     def delete(self, x_twilio_webhook_enabled=values.unset):
         """
         Deletes the UserChannelInstance
@@ -248,6 +372,19 @@ class UserChannelContext(InstanceContext):
 
         return self._version.delete(method='DELETE', uri=self._uri, headers=headers, )
 
+    async def delete_async(self, x_twilio_webhook_enabled=values.unset):
+        """
+        Asynchronous coroutine that deletes the UserChannelInstance
+
+        :param UserChannelInstance.WebhookEnabledType x_twilio_webhook_enabled: The X-Twilio-Webhook-Enabled HTTP request header
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        headers = values.of({'X-Twilio-Webhook-Enabled': x_twilio_webhook_enabled, })
+
+        return await self._version.delete_async(method='DELETE', uri=self._uri, headers=headers, )
+
     def update(self, notification_level=values.unset,
                last_consumed_message_index=values.unset,
                last_consumption_timestamp=values.unset):
@@ -277,6 +414,35 @@ class UserChannelContext(InstanceContext):
             channel_sid=self._solution['channel_sid'],
         )
 
+    async def update_async(self, notification_level=values.unset,
+                           last_consumed_message_index=values.unset,
+                           last_consumption_timestamp=values.unset):
+        """
+        Asynchronous coroutine that updates the UserChannelInstance
+
+        :param UserChannelInstance.NotificationLevel notification_level: The push notification level to assign to the User Channel
+        :param unicode last_consumed_message_index: The index of the last Message that the Member has read within the Channel
+        :param datetime last_consumption_timestamp: The ISO 8601 based timestamp string that represents the datetime of the last Message read event for the Member within the Channel
+
+        :returns: The updated UserChannelInstance
+        :rtype: twilio.rest.chat.v2.service.user.user_channel.UserChannelInstance
+        """
+        data = values.of({
+            'NotificationLevel': notification_level,
+            'LastConsumedMessageIndex': last_consumed_message_index,
+            'LastConsumptionTimestamp': serialize.iso8601_datetime(last_consumption_timestamp),
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return UserChannelInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            user_sid=self._solution['user_sid'],
+            channel_sid=self._solution['channel_sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -303,6 +469,29 @@ class UserChannelInstance(InstanceResource):
         TRUE = "true"
         FALSE = "false"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'last_consumed_message_index': deserialize.integer,
+        'unread_messages_count': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'service_sid': 'service_sid',
+        'channel_sid': 'channel_sid',
+        'user_sid': 'user_sid',
+        'member_sid': 'member_sid',
+        'status': 'status',
+        'last_consumed_message_index': 'last_consumed_message_index',
+        'unread_messages_count': 'unread_messages_count',
+        'links': 'links',
+        'url': 'url',
+        'notification_level': 'notification_level',
+    }, _deserializers)
+
     def __init__(self, version, payload, service_sid, user_sid, channel_sid=None):
         """
         Initialize the UserChannelInstance
@@ -313,19 +502,7 @@ class UserChannelInstance(InstanceResource):
         super(UserChannelInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'service_sid': payload.get('service_sid'),
-            'channel_sid': payload.get('channel_sid'),
-            'user_sid': payload.get('user_sid'),
-            'member_sid': payload.get('member_sid'),
-            'status': payload.get('status'),
-            'last_consumed_message_index': deserialize.integer(payload.get('last_consumed_message_index')),
-            'unread_messages_count': deserialize.integer(payload.get('unread_messages_count')),
-            'links': payload.get('links'),
-            'url': payload.get('url'),
-            'notification_level': payload.get('notification_level'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -450,6 +627,15 @@ class UserChannelInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the UserChannelInstance
+
+        :returns: The fetched UserChannelInstance
+        :rtype: twilio.rest.chat.v2.service.user.user_channel.UserChannelInstance
+        """
+        return await self._proxy.fetch_async()
+
     def delete(self, x_twilio_webhook_enabled=values.unset):
         """
         Deletes the UserChannelInstance
@@ -461,6 +647,17 @@ class UserChannelInstance(InstanceResource):
         """
         return self._proxy.delete(x_twilio_webhook_enabled=x_twilio_webhook_enabled, )
 
+    async def delete_async(self, x_twilio_webhook_enabled=values.unset):
+        """
+        Asynchronous coroutine that deletes the UserChannelInstance
+
+        :param UserChannelInstance.WebhookEnabledType x_twilio_webhook_enabled: The X-Twilio-Webhook-Enabled HTTP request header
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async(x_twilio_webhook_enabled=x_twilio_webhook_enabled, )
+
     def update(self, notification_level=values.unset,
                last_consumed_message_index=values.unset,
                last_consumption_timestamp=values.unset):
@@ -480,6 +677,25 @@ class UserChannelInstance(InstanceResource):
             last_consumption_timestamp=last_consumption_timestamp,
         )
 
+    async def update_async(self, notification_level=values.unset,
+                           last_consumed_message_index=values.unset,
+                           last_consumption_timestamp=values.unset):
+        """
+        Asynchronous coroutine that updates the UserChannelInstance
+
+        :param UserChannelInstance.NotificationLevel notification_level: The push notification level to assign to the User Channel
+        :param unicode last_consumed_message_index: The index of the last Message that the Member has read within the Channel
+        :param datetime last_consumption_timestamp: The ISO 8601 based timestamp string that represents the datetime of the last Message read event for the Member within the Channel
+
+        :returns: The updated UserChannelInstance
+        :rtype: twilio.rest.chat.v2.service.user.user_channel.UserChannelInstance
+        """
+        return await self._proxy.update_async(
+            notification_level=notification_level,
+            last_consumed_message_index=last_consumed_message_index,
+            last_consumption_timestamp=last_consumption_timestamp,
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -6,8 +6,9 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base.version import Version
-from twilio.rest.chat.v3.channel import ChannelList
 
 
 class V3(Version):
@@ -29,6 +30,7 @@ class V3(Version):
         :rtype: twilio.rest.chat.v3.channel.ChannelList
         """
         if self._channels is None:
+            from twilio.rest.chat.v3.channel import ChannelList
             self._channels = ChannelList(self)
         return self._channels
 
@@ -40,3 +42,19 @@ class V3(Version):
         :rtype: str
         """
         return '<Twilio.Chat.V3>'
+
+
+_LAZY_IMPORTS = {
+    'ChannelList': 'twilio.rest.chat.v3.channel',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
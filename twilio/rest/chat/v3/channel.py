@@ -119,7 +119,7 @@ class ChannelContext(InstanceContext):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, 'sid': sid, }
-        self._uri = '/Services/{service_sid}/Channels/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/Channels/{sid}', self._solution)
 
     def update(self, type=values.unset, messaging_service_sid=values.unset,
                x_twilio_webhook_enabled=values.unset):
@@ -145,6 +145,30 @@ class ChannelContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, type=values.unset, messaging_service_sid=values.unset,
+                           x_twilio_webhook_enabled=values.unset):
+        """
+        Asynchronous coroutine that updates the ChannelInstance
+
+        :param ChannelInstance.ChannelType type: The Type for this Channel to migrate to.
+        :param unicode messaging_service_sid: The unique ID of the Messaging Service this channel belongs to.
+        :param ChannelInstance.WebhookEnabledType x_twilio_webhook_enabled: The X-Twilio-Webhook-Enabled HTTP request header
+
+        :returns: The updated ChannelInstance
+        :rtype: twilio.rest.chat.v3.channel.ChannelInstance
+        """
+        data = values.of({'Type': type, 'MessagingServiceSid': messaging_service_sid, })
+        headers = values.of({'X-Twilio-Webhook-Enabled': x_twilio_webhook_enabled, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, headers=headers, )
+
+        return ChannelInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            sid=self._solution['sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -166,6 +190,34 @@ class ChannelInstance(InstanceResource):
         TRUE = "true"
         FALSE = "false"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+        'members_count': deserialize.integer,
+        'messages_count': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'service_sid': 'service_sid',
+        'friendly_name': 'friendly_name',
+        'unique_name': 'unique_name',
+        'attributes': 'attributes',
+        'type': 'type',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'created_by': 'created_by',
+        'members_count': 'members_count',
+        'messages_count': 'messages_count',
+        'messaging_service_sid': 'messaging_service_sid',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload, service_sid=None, sid=None):
         """
         Initialize the ChannelInstance
@@ -176,22 +228,7 @@ class ChannelInstance(InstanceResource):
         super(ChannelInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'service_sid': payload.get('service_sid'),
-            'friendly_name': payload.get('friendly_name'),
-            'unique_name': payload.get('unique_name'),
-            'attributes': payload.get('attributes'),
-            'type': payload.get('type'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'created_by': payload.get('created_by'),
-            'members_count': deserialize.integer(payload.get('members_count')),
-            'messages_count': deserialize.integer(payload.get('messages_count')),
-            'messaging_service_sid': payload.get('messaging_service_sid'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -347,6 +384,24 @@ class ChannelInstance(InstanceResource):
             x_twilio_webhook_enabled=x_twilio_webhook_enabled,
         )
 
+    async def update_async(self, type=values.unset, messaging_service_sid=values.unset,
+                           x_twilio_webhook_enabled=values.unset):
+        """
+        Asynchronous coroutine that updates the ChannelInstance
+
+        :param ChannelInstance.ChannelType type: The Type for this Channel to migrate to.
+        :param unicode messaging_service_sid: The unique ID of the Messaging Service this channel belongs to.
+        :param ChannelInstance.WebhookEnabledType x_twilio_webhook_enabled: The X-Twilio-Webhook-Enabled HTTP request header
+
+        :returns: The updated ChannelInstance
+        :rtype: twilio.rest.chat.v3.channel.ChannelInstance
+        """
+        return await self._proxy.update_async(
+            type=type,
+            messaging_service_sid=messaging_service_sid,
+            x_twilio_webhook_enabled=x_twilio_webhook_enabled,
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -6,15 +6,9 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base.version import Version
-from twilio.rest.conversations.v1.address_configuration import AddressConfigurationList
-from twilio.rest.conversations.v1.configuration import ConfigurationList
-from twilio.rest.conversations.v1.conversation import ConversationList
-from twilio.rest.conversations.v1.credential import CredentialList
-from twilio.rest.conversations.v1.participant_conversation import ParticipantConversationList
-from twilio.rest.conversations.v1.role import RoleList
-from twilio.rest.conversations.v1.service import ServiceList
-from twilio.rest.conversations.v1.user import UserList
 
 
 class V1(Version):
@@ -43,6 +37,7 @@ class V1(Version):
         :rtype: twilio.rest.conversations.v1.configuration.ConfigurationList
         """
         if self._configuration is None:
+            from twilio.rest.conversations.v1.configuration import ConfigurationList
             self._configuration = ConfigurationList(self)
         return self._configuration
 
@@ -52,6 +47,7 @@ class V1(Version):
         :rtype: twilio.rest.conversations.v1.address_configuration.AddressConfigurationList
         """
         if self._address_configurations is None:
+            from twilio.rest.conversations.v1.address_configuration import AddressConfigurationList
             self._address_configurations = AddressConfigurationList(self)
         return self._address_configurations
 
@@ -61,6 +57,7 @@ class V1(Version):
         :rtype: twilio.rest.conversations.v1.conversation.ConversationList
         """
         if self._conversations is None:
+            from twilio.rest.conversations.v1.conversation import ConversationList
             self._conversations = ConversationList(self)
         return self._conversations
 
@@ -70,6 +67,7 @@ class V1(Version):
         :rtype: twilio.rest.conversations.v1.credential.CredentialList
         """
         if self._credentials is None:
+            from twilio.rest.conversations.v1.credential import CredentialList
             self._credentials = CredentialList(self)
         return self._credentials
 
@@ -79,6 +77,7 @@ class V1(Version):
         :rtype: twilio.rest.conversations.v1.participant_conversation.ParticipantConversationList
         """
         if self._participant_conversations is None:
+            from twilio.rest.conversations.v1.participant_conversation import ParticipantConversationList
             self._participant_conversations = ParticipantConversationList(self)
         return self._participant_conversations
 
@@ -88,6 +87,7 @@ class V1(Version):
         :rtype: twilio.rest.conversations.v1.role.RoleList
         """
         if self._roles is None:
+            from twilio.rest.conversations.v1.role import RoleList
             self._roles = RoleList(self)
         return self._roles
 
@@ -97,6 +97,7 @@ class V1(Version):
         :rtype: twilio.rest.conversations.v1.service.ServiceList
         """
         if self._services is None:
+            from twilio.rest.conversations.v1.service import ServiceList
             self._services = ServiceList(self)
         return self._services
 
@@ -106,6 +107,7 @@ class V1(Version):
         :rtype: twilio.rest.conversations.v1.user.UserList
         """
         if self._users is None:
+            from twilio.rest.conversations.v1.user import UserList
             self._users = UserList(self)
         return self._users
 
@@ -117,3 +119,26 @@ class V1(Version):
         :rtype: str
         """
         return '<Twilio.Conversations.V1>'
+
+
+_LAZY_IMPORTS = {
+    'AddressConfigurationList': 'twilio.rest.conversations.v1.address_configuration',
+    'ConfigurationList': 'twilio.rest.conversations.v1.configuration',
+    'ConversationList': 'twilio.rest.conversations.v1.conversation',
+    'CredentialList': 'twilio.rest.conversations.v1.credential',
+    'ParticipantConversationList': 'twilio.rest.conversations.v1.participant_conversation',
+    'RoleList': 'twilio.rest.conversations.v1.role',
+    'ServiceList': 'twilio.rest.conversations.v1.service',
+    'UserList': 'twilio.rest.conversations.v1.user',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -30,9 +30,9 @@ class AddressConfigurationList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Configuration/Addresses'.format(**self._solution)
+        self._uri = values.ResourceUri('/Configuration/Addresses', self._solution)
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams AddressConfigurationInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -45,17 +45,57 @@ class AddressConfigurationList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.conversations.v1.address_configuration.AddressConfigurationInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams AddressConfigurationInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.conversations.v1.address_configuration.AddressConfigurationInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists AddressConfigurationInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -67,11 +107,42 @@ class AddressConfigurationList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.conversations.v1.address_configuration.AddressConfigurationInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists AddressConfigurationInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.conversations.v1.address_configuration.AddressConfigurationInstance]
+        """
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -92,6 +163,25 @@ class AddressConfigurationList(ListResource):
 
         return AddressConfigurationPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of AddressConfigurationInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of AddressConfigurationInstance
+        :rtype: twilio.rest.conversations.v1.address_configuration.AddressConfigurationPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return AddressConfigurationPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of AddressConfigurationInstance records from the API.
@@ -109,6 +199,23 @@ class AddressConfigurationList(ListResource):
 
         return AddressConfigurationPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of AddressConfigurationInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of AddressConfigurationInstance
+        :rtype: twilio.rest.conversations.v1.address_configuration.AddressConfigurationPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return AddressConfigurationPage(self._version, response, self._solution)
+
     def create(self, type, address, friendly_name=values.unset,
                auto_creation_enabled=values.unset, auto_creation_type=values.unset,
                auto_creation_conversation_service_sid=values.unset,
@@ -116,7 +223,7 @@ class AddressConfigurationList(ListResource):
                auto_creation_webhook_method=values.unset,
                auto_creation_webhook_filters=values.unset,
                auto_creation_studio_flow_sid=values.unset,
-               auto_creation_studio_retry_count=values.unset):
+               auto_creation_studio_retry_count=values.unset, deadline=None):
         """
         Create the AddressConfigurationInstance
 
@@ -131,6 +238,54 @@ class AddressConfigurationList(ListResource):
         :param list[unicode] auto_creation_webhook_filters: The list of events, firing webhook event for this Conversation.
         :param unicode auto_creation_studio_flow_sid: For type `studio`, the studio flow SID where the webhook should be sent to.
         :param unicode auto_creation_studio_retry_count: For type `studio`, number of times to retry the webhook request
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created AddressConfigurationInstance
+        :rtype: twilio.rest.conversations.v1.address_configuration.AddressConfigurationInstance
+        """
+        data = values.of({
+            'Type': type,
+            'Address': address,
+            'FriendlyName': friendly_name,
+            'AutoCreation.Enabled': auto_creation_enabled,
+            'AutoCreation.Type': auto_creation_type,
+            'AutoCreation.ConversationServiceSid': auto_creation_conversation_service_sid,
+            'AutoCreation.WebhookUrl': auto_creation_webhook_url,
+            'AutoCreation.WebhookMethod': auto_creation_webhook_method,
+            'AutoCreation.WebhookFilters': serialize.map(auto_creation_webhook_filters, lambda e: e),
+            'AutoCreation.StudioFlowSid': auto_creation_studio_flow_sid,
+            'AutoCreation.StudioRetryCount': auto_creation_studio_retry_count,
+        })
+
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return AddressConfigurationInstance(self._version, payload, )
+
+    async def create_async(self, type, address, friendly_name=values.unset,
+                           auto_creation_enabled=values.unset, auto_creation_type=values.unset,
+                           auto_creation_conversation_service_sid=values.unset,
+                           auto_creation_webhook_url=values.unset,
+                           auto_creation_webhook_method=values.unset,
+                           auto_creation_webhook_filters=values.unset,
+                           auto_creation_studio_flow_sid=values.unset,
+                           auto_creation_studio_retry_count=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the AddressConfigurationInstance
+
+        :param AddressConfigurationInstance.Type type: Type of Address.
+        :param unicode address: The unique address to be configured.
+        :param unicode friendly_name: The human-readable name of this configuration.
+        :param bool auto_creation_enabled: Enable/Disable auto-creating conversations for messages to this address
+        :param AddressConfigurationInstance.AutoCreationType auto_creation_type: Type of Auto Creation.
+        :param unicode auto_creation_conversation_service_sid: Conversation Service for the auto-created conversation.
+        :param unicode auto_creation_webhook_url: For type `webhook`, the url for the webhook request.
+        :param AddressConfigurationInstance.Method auto_creation_webhook_method: For type `webhook`, the HTTP method to be used when sending a webhook request.
+        :param list[unicode] auto_creation_webhook_filters: The list of events, firing webhook event for this Conversation.
+        :param unicode auto_creation_studio_flow_sid: For type `studio`, the studio flow SID where the webhook should be sent to.
+        :param unicode auto_creation_studio_retry_count: For type `studio`, number of times to retry the webhook request
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created AddressConfigurationInstance
         :rtype: twilio.rest.conversations.v1.address_configuration.AddressConfigurationInstance
@@ -149,7 +304,7 @@ class AddressConfigurationList(ListResource):
             'AutoCreation.StudioRetryCount': auto_creation_studio_retry_count,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return AddressConfigurationInstance(self._version, payload, )
 
@@ -239,7 +394,7 @@ class AddressConfigurationContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/Configuration/Addresses/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Configuration/Addresses/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -252,6 +407,17 @@ class AddressConfigurationContext(InstanceContext):
 
         return AddressConfigurationInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the AddressConfigurationInstance
+
+        :returns: The fetched AddressConfigurationInstance
+        :rtype: twilio.rest.conversations.v1.address_configuration.AddressConfigurationInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return AddressConfigurationInstance(self._version, payload, sid=self._solution['sid'], )
+
     def update(self, friendly_name=values.unset, auto_creation_enabled=values.unset,
                auto_creation_type=values.unset,
                auto_creation_conversation_service_sid=values.unset,
@@ -292,6 +458,46 @@ class AddressConfigurationContext(InstanceContext):
 
         return AddressConfigurationInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def update_async(self, friendly_name=values.unset, auto_creation_enabled=values.unset,
+                           auto_creation_type=values.unset,
+                           auto_creation_conversation_service_sid=values.unset,
+                           auto_creation_webhook_url=values.unset,
+                           auto_creation_webhook_method=values.unset,
+                           auto_creation_webhook_filters=values.unset,
+                           auto_creation_studio_flow_sid=values.unset,
+                           auto_creation_studio_retry_count=values.unset):
+        """
+        Asynchronous coroutine that updates the AddressConfigurationInstance
+
+        :param unicode friendly_name: The human-readable name of this configuration.
+        :param bool auto_creation_enabled: Enable/Disable auto-creating conversations for messages to this address
+        :param AddressConfigurationInstance.AutoCreationType auto_creation_type: Type of Auto Creation.
+        :param unicode auto_creation_conversation_service_sid: Conversation Service for the auto-created conversation.
+        :param unicode auto_creation_webhook_url: For type `webhook`, the url for the webhook request.
+        :param AddressConfigurationInstance.Method auto_creation_webhook_method: For type `webhook`, the HTTP method to be used when sending a webhook request.
+        :param list[unicode] auto_creation_webhook_filters: The list of events, firing webhook event for this Conversation.
+        :param unicode auto_creation_studio_flow_sid: For type `studio`, the studio flow SID where the webhook should be sent to.
+        :param unicode auto_creation_studio_retry_count: For type `studio`, number of times to retry the webhook request
+
+        :returns: The updated AddressConfigurationInstance
+        :rtype: twilio.rest.conversations.v1.address_configuration.AddressConfigurationInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'AutoCreation.Enabled': auto_creation_enabled,
+            'AutoCreation.Type': auto_creation_type,
+            'AutoCreation.ConversationServiceSid': auto_creation_conversation_service_sid,
+            'AutoCreation.WebhookUrl': auto_creation_webhook_url,
+            'AutoCreation.WebhookMethod': auto_creation_webhook_method,
+            'AutoCreation.WebhookFilters': serialize.map(auto_creation_webhook_filters, lambda e: e),
+            'AutoCreation.StudioFlowSid': auto_creation_studio_flow_sid,
+            'AutoCreation.StudioRetryCount': auto_creation_studio_retry_count,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return AddressConfigurationInstance(self._version, payload, sid=self._solution['sid'], )
+
     def delete(self):
         """
         Deletes the AddressConfigurationInstance
@@ -301,6 +507,15 @@ class AddressConfigurationContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the AddressConfigurationInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -329,6 +544,27 @@ class AddressConfigurationInstance(InstanceResource):
         GET = "GET"
         POST = "POST"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'type': 'type',
+        'address': 'address',
+        'friendly_name': 'friendly_name',
+        'auto_creation': 'auto_creation',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the AddressConfigurationInstance
@@ -339,17 +575,7 @@ class AddressConfigurationInstance(InstanceResource):
         super(AddressConfigurationInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'type': payload.get('type'),
-            'address': payload.get('address'),
-            'friendly_name': payload.get('friendly_name'),
-            'auto_creation': payload.get('auto_creation'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -449,6 +675,15 @@ class AddressConfigurationInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the AddressConfigurationInstance
+
+        :returns: The fetched AddressConfigurationInstance
+        :rtype: twilio.rest.conversations.v1.address_configuration.AddressConfigurationInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, friendly_name=values.unset, auto_creation_enabled=values.unset,
                auto_creation_type=values.unset,
                auto_creation_conversation_service_sid=values.unset,
@@ -485,6 +720,42 @@ class AddressConfigurationInstance(InstanceResource):
             auto_creation_studio_retry_count=auto_creation_studio_retry_count,
         )
 
+    async def update_async(self, friendly_name=values.unset, auto_creation_enabled=values.unset,
+                           auto_creation_type=values.unset,
+                           auto_creation_conversation_service_sid=values.unset,
+                           auto_creation_webhook_url=values.unset,
+                           auto_creation_webhook_method=values.unset,
+                           auto_creation_webhook_filters=values.unset,
+                           auto_creation_studio_flow_sid=values.unset,
+                           auto_creation_studio_retry_count=values.unset):
+        """
+        Asynchronous coroutine that updates the AddressConfigurationInstance
+
+        :param unicode friendly_name: The human-readable name of this configuration.
+        :param bool auto_creation_enabled: Enable/Disable auto-creating conversations for messages to this address
+        :param AddressConfigurationInstance.AutoCreationType auto_creation_type: Type of Auto Creation.
+        :param unicode auto_creation_conversation_service_sid: Conversation Service for the auto-created conversation.
+        :param unicode auto_creation_webhook_url: For type `webhook`, the url for the webhook request.
+        :param AddressConfigurationInstance.Method auto_creation_webhook_method: For type `webhook`, the HTTP method to be used when sending a webhook request.
+        :param list[unicode] auto_creation_webhook_filters: The list of events, firing webhook event for this Conversation.
+        :param unicode auto_creation_studio_flow_sid: For type `studio`, the studio flow SID where the webhook should be sent to.
+        :param unicode auto_creation_studio_retry_count: For type `studio`, number of times to retry the webhook request
+
+        :returns: The updated AddressConfigurationInstance
+        :rtype: twilio.rest.conversations.v1.address_configuration.AddressConfigurationInstance
+        """
+        return await self._proxy.update_async(
+            friendly_name=friendly_name,
+            auto_creation_enabled=auto_creation_enabled,
+            auto_creation_type=auto_creation_type,
+            auto_creation_conversation_service_sid=auto_creation_conversation_service_sid,
+            auto_creation_webhook_url=auto_creation_webhook_url,
+            auto_creation_webhook_method=auto_creation_webhook_method,
+            auto_creation_webhook_filters=auto_creation_webhook_filters,
+            auto_creation_studio_flow_sid=auto_creation_studio_flow_sid,
+            auto_creation_studio_retry_count=auto_creation_studio_retry_count,
+        )
+
     def delete(self):
         """
         Deletes the AddressConfigurationInstance
@@ -494,6 +765,15 @@ class AddressConfigurationInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the AddressConfigurationInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -6,12 +6,14 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.conversations.v1.configuration.webhook import WebhookList
 
 
 class ConfigurationList(ListResource):
@@ -42,6 +44,7 @@ class ConfigurationList(ListResource):
         :rtype: twilio.rest.conversations.v1.configuration.webhook.WebhookList
         """
         if self._webhooks is None:
+            from twilio.rest.conversations.v1.configuration.webhook import WebhookList
             self._webhooks = WebhookList(self._version, )
         return self._webhooks
 
@@ -126,7 +129,7 @@ class ConfigurationContext(InstanceContext):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Configuration'.format(**self._solution)
+        self._uri = values.ResourceUri('/Configuration', self._solution)
 
     def fetch(self):
         """
@@ -139,6 +142,17 @@ class ConfigurationContext(InstanceContext):
 
         return ConfigurationInstance(self._version, payload, )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ConfigurationInstance
+
+        :returns: The fetched ConfigurationInstance
+        :rtype: twilio.rest.conversations.v1.configuration.ConfigurationInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return ConfigurationInstance(self._version, payload, )
+
     def update(self, default_chat_service_sid=values.unset,
                default_messaging_service_sid=values.unset,
                default_inactive_timer=values.unset,
@@ -165,6 +179,32 @@ class ConfigurationContext(InstanceContext):
 
         return ConfigurationInstance(self._version, payload, )
 
+    async def update_async(self, default_chat_service_sid=values.unset,
+                           default_messaging_service_sid=values.unset,
+                           default_inactive_timer=values.unset,
+                           default_closed_timer=values.unset):
+        """
+        Asynchronous coroutine that updates the ConfigurationInstance
+
+        :param unicode default_chat_service_sid: The SID of the default Conversation Service that every new conversation will be associated with.
+        :param unicode default_messaging_service_sid: The SID of the default Messaging Service that every new conversation will be associated with.
+        :param unicode default_inactive_timer: Default ISO8601 duration when conversation will be switched to `inactive` state.
+        :param unicode default_closed_timer: Default ISO8601 duration when conversation will be switched to `closed` state.
+
+        :returns: The updated ConfigurationInstance
+        :rtype: twilio.rest.conversations.v1.configuration.ConfigurationInstance
+        """
+        data = values.of({
+            'DefaultChatServiceSid': default_chat_service_sid,
+            'DefaultMessagingServiceSid': default_messaging_service_sid,
+            'DefaultInactiveTimer': default_inactive_timer,
+            'DefaultClosedTimer': default_closed_timer,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return ConfigurationInstance(self._version, payload, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -178,6 +218,19 @@ class ConfigurationContext(InstanceContext):
 
 class ConfigurationInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'default_chat_service_sid': 'default_chat_service_sid',
+        'default_messaging_service_sid': 'default_messaging_service_sid',
+        'default_inactive_timer': 'default_inactive_timer',
+        'default_closed_timer': 'default_closed_timer',
+        'url': 'url',
+        'links': 'links',
+    })
+
     def __init__(self, version, payload):
         """
         Initialize the ConfigurationInstance
@@ -188,15 +241,7 @@ class ConfigurationInstance(InstanceResource):
         super(ConfigurationInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'default_chat_service_sid': payload.get('default_chat_service_sid'),
-            'default_messaging_service_sid': payload.get('default_messaging_service_sid'),
-            'default_inactive_timer': payload.get('default_inactive_timer'),
-            'default_closed_timer': payload.get('default_closed_timer'),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -280,6 +325,15 @@ class ConfigurationInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ConfigurationInstance
+
+        :returns: The fetched ConfigurationInstance
+        :rtype: twilio.rest.conversations.v1.configuration.ConfigurationInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, default_chat_service_sid=values.unset,
                default_messaging_service_sid=values.unset,
                default_inactive_timer=values.unset,
@@ -302,6 +356,28 @@ class ConfigurationInstance(InstanceResource):
             default_closed_timer=default_closed_timer,
         )
 
+    async def update_async(self, default_chat_service_sid=values.unset,
+                           default_messaging_service_sid=values.unset,
+                           default_inactive_timer=values.unset,
+                           default_closed_timer=values.unset):
+        """
+        Asynchronous coroutine that updates the ConfigurationInstance
+
+        :param unicode default_chat_service_sid: The SID of the default Conversation Service that every new conversation will be associated with.
+        :param unicode default_messaging_service_sid: The SID of the default Messaging Service that every new conversation will be associated with.
+        :param unicode default_inactive_timer: Default ISO8601 duration when conversation will be switched to `inactive` state.
+        :param unicode default_closed_timer: Default ISO8601 duration when conversation will be switched to `closed` state.
+
+        :returns: The updated ConfigurationInstance
+        :rtype: twilio.rest.conversations.v1.configuration.ConfigurationInstance
+        """
+        return await self._proxy.update_async(
+            default_chat_service_sid=default_chat_service_sid,
+            default_messaging_service_sid=default_messaging_service_sid,
+            default_inactive_timer=default_inactive_timer,
+            default_closed_timer=default_closed_timer,
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -311,3 +387,19 @@ class ConfigurationInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Conversations.V1.ConfigurationInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'WebhookList': 'twilio.rest.conversations.v1.configuration.webhook',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -7,6 +7,7 @@ This code was generated by
 """
 
 from twilio.base import serialize
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
@@ -111,7 +112,7 @@ class WebhookContext(InstanceContext):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Configuration/Webhooks'.format(**self._solution)
+        self._uri = values.ResourceUri('/Configuration/Webhooks', self._solution)
 
     def fetch(self):
         """
@@ -124,6 +125,17 @@ class WebhookContext(InstanceContext):
 
         return WebhookInstance(self._version, payload, )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the WebhookInstance
+
+        :returns: The fetched WebhookInstance
+        :rtype: twilio.rest.conversations.v1.configuration.webhook.WebhookInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return WebhookInstance(self._version, payload, )
+
     def update(self, method=values.unset, filters=values.unset,
                pre_webhook_url=values.unset, post_webhook_url=values.unset,
                target=values.unset):
@@ -151,6 +163,33 @@ class WebhookContext(InstanceContext):
 
         return WebhookInstance(self._version, payload, )
 
+    async def update_async(self, method=values.unset, filters=values.unset,
+                           pre_webhook_url=values.unset, post_webhook_url=values.unset,
+                           target=values.unset):
+        """
+        Asynchronous coroutine that updates the WebhookInstance
+
+        :param unicode method: The HTTP method to be used when sending a webhook request.
+        :param list[unicode] filters: The list of webhook event triggers that are enabled for this Service.
+        :param unicode pre_webhook_url: The absolute url the pre-event webhook request should be sent to.
+        :param unicode post_webhook_url: The absolute url the post-event webhook request should be sent to.
+        :param WebhookInstance.Target target: The routing target of the webhook.
+
+        :returns: The updated WebhookInstance
+        :rtype: twilio.rest.conversations.v1.configuration.webhook.WebhookInstance
+        """
+        data = values.of({
+            'Method': method,
+            'Filters': serialize.map(filters, lambda e: e),
+            'PreWebhookUrl': pre_webhook_url,
+            'PostWebhookUrl': post_webhook_url,
+            'Target': target,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return WebhookInstance(self._version, payload, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -172,6 +211,19 @@ class WebhookInstance(InstanceResource):
         GET = "GET"
         POST = "POST"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'method': 'method',
+        'filters': 'filters',
+        'pre_webhook_url': 'pre_webhook_url',
+        'post_webhook_url': 'post_webhook_url',
+        'target': 'target',
+        'url': 'url',
+    })
+
     def __init__(self, version, payload):
         """
         Initialize the WebhookInstance
@@ -182,15 +234,7 @@ class WebhookInstance(InstanceResource):
         super(WebhookInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'method': payload.get('method'),
-            'filters': payload.get('filters'),
-            'pre_webhook_url': payload.get('pre_webhook_url'),
-            'post_webhook_url': payload.get('post_webhook_url'),
-            'target': payload.get('target'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -274,6 +318,15 @@ class WebhookInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the WebhookInstance
+
+        :returns: The fetched WebhookInstance
+        :rtype: twilio.rest.conversations.v1.configuration.webhook.WebhookInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, method=values.unset, filters=values.unset,
                pre_webhook_url=values.unset, post_webhook_url=values.unset,
                target=values.unset):
@@ -297,6 +350,29 @@ class WebhookInstance(InstanceResource):
             target=target,
         )
 
+    async def update_async(self, method=values.unset, filters=values.unset,
+                           pre_webhook_url=values.unset, post_webhook_url=values.unset,
+                           target=values.unset):
+        """
+        Asynchronous coroutine that updates the WebhookInstance
+
+        :param unicode method: The HTTP method to be used when sending a webhook request.
+        :param list[unicode] filters: The list of webhook event triggers that are enabled for this Service.
+        :param unicode pre_webhook_url: The absolute url the pre-event webhook request should be sent to.
+        :param unicode post_webhook_url: The absolute url the post-event webhook request should be sent to.
+        :param WebhookInstance.Target target: The routing target of the webhook.
+
+        :returns: The updated WebhookInstance
+        :rtype: twilio.rest.conversations.v1.configuration.webhook.WebhookInstance
+        """
+        return await self._proxy.update_async(
+            method=method,
+            filters=filters,
+            pre_webhook_url=pre_webhook_url,
+            post_webhook_url=post_webhook_url,
+            target=target,
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
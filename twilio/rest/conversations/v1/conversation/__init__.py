@@ -6,6 +6,8 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import serialize
 from twilio.base import values
@@ -13,9 +15,6 @@ from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.conversations.v1.conversation.message import MessageList
-from twilio.rest.conversations.v1.conversation.participant import ParticipantList
-from twilio.rest.conversations.v1.conversation.webhook import WebhookList
 
 
 class ConversationList(ListResource):
@@ -33,13 +32,13 @@ class ConversationList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Conversations'.format(**self._solution)
+        self._uri = values.ResourceUri('/Conversations', self._solution)
 
     def create(self, friendly_name=values.unset, unique_name=values.unset,
                date_created=values.unset, date_updated=values.unset,
                messaging_service_sid=values.unset, attributes=values.unset,
                state=values.unset, timers_inactive=values.unset,
-               timers_closed=values.unset, x_twilio_webhook_enabled=values.unset):
+               timers_closed=values.unset, x_twilio_webhook_enabled=values.unset, deadline=None):
         """
         Create the ConversationInstance
 
@@ -53,6 +52,50 @@ class ConversationList(ListResource):
         :param unicode timers_inactive: ISO8601 duration when conversation will be switched to `inactive` state.
         :param unicode timers_closed: ISO8601 duration when conversation will be switched to `closed` state.
         :param ConversationInstance.WebhookEnabledType x_twilio_webhook_enabled: The X-Twilio-Webhook-Enabled HTTP request header
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created ConversationInstance
+        :rtype: twilio.rest.conversations.v1.conversation.ConversationInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'UniqueName': unique_name,
+            'DateCreated': serialize.iso8601_datetime(date_created),
+            'DateUpdated': serialize.iso8601_datetime(date_updated),
+            'MessagingServiceSid': messaging_service_sid,
+            'Attributes': attributes,
+            'State': state,
+            'Timers.Inactive': timers_inactive,
+            'Timers.Closed': timers_closed,
+        })
+        headers = values.of({'X-Twilio-Webhook-Enabled': x_twilio_webhook_enabled, })
+
+        payload = self._version.create(method='POST', uri=self._uri, data=data, headers=headers, deadline=deadline, )
+
+        return ConversationInstance(self._version, payload, )
+
+    async def create_async(self, friendly_name=values.unset, unique_name=values.unset,
+                           date_created=values.unset, date_updated=values.unset,
+                           messaging_service_sid=values.unset, attributes=values.unset,
+                           state=values.unset, timers_inactive=values.unset,
+                           timers_closed=values.unset, x_twilio_webhook_enabled=values.unset,
+                           deadline=None):
+        """
+        Asynchronous coroutine that creates the ConversationInstance
+
+        :param unicode friendly_name: The human-readable name of this conversation.
+        :param unicode unique_name: An application-defined string that uniquely identifies the resource
+        :param datetime date_created: The date that this resource was created.
+        :param datetime date_updated: The date that this resource was last updated.
+        :param unicode messaging_service_sid: The unique ID of the Messaging Service this conversation belongs to.
+        :param unicode attributes: An optional string metadata field you can use to store any data you wish.
+        :param ConversationInstance.State state: Current state of this conversation.
+        :param unicode timers_inactive: ISO8601 duration when conversation will be switched to `inactive` state.
+        :param unicode timers_closed: ISO8601 duration when conversation will be switched to `closed` state.
+        :param ConversationInstance.WebhookEnabledType x_twilio_webhook_enabled: The X-Twilio-Webhook-Enabled HTTP request header
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created ConversationInstance
         :rtype: twilio.rest.conversations.v1.conversation.ConversationInstance
@@ -70,11 +113,11 @@ class ConversationList(ListResource):
         })
         headers = values.of({'X-Twilio-Webhook-Enabled': x_twilio_webhook_enabled, })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, headers=headers, )
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, headers=headers, deadline=deadline, )
 
         return ConversationInstance(self._version, payload, )
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams ConversationInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -87,17 +130,57 @@ class ConversationList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.conversations.v1.conversation.ConversationInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams ConversationInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
 
-    def list(self, limit=None, page_size=None):
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.conversations.v1.conversation.ConversationInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists ConversationInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -109,11 +192,42 @@ class ConversationList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.conversations.v1.conversation.ConversationInstance]
+        """
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists ConversationInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.conversations.v1.conversation.ConversationInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -134,6 +248,25 @@ class ConversationList(ListResource):
 
         return ConversationPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of ConversationInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of ConversationInstance
+        :rtype: twilio.rest.conversations.v1.conversation.ConversationPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return ConversationPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of ConversationInstance records from the API.
@@ -151,6 +284,23 @@ class ConversationList(ListResource):
 
         return ConversationPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of ConversationInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of ConversationInstance
+        :rtype: twilio.rest.conversations.v1.conversation.ConversationPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return ConversationPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a ConversationContext
@@ -237,7 +387,7 @@ class ConversationContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/Conversations/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Conversations/{sid}', self._solution)
 
         # Dependents
         self._participants = None
@@ -283,6 +433,45 @@ class ConversationContext(InstanceContext):
 
         return ConversationInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def update_async(self, friendly_name=values.unset, date_created=values.unset,
+                           date_updated=values.unset, attributes=values.unset,
+                           messaging_service_sid=values.unset, state=values.unset,
+                           timers_inactive=values.unset, timers_closed=values.unset,
+                           unique_name=values.unset, x_twilio_webhook_enabled=values.unset):
+        """
+        Asynchronous coroutine that updates the ConversationInstance
+
+        :param unicode friendly_name: The human-readable name of this conversation.
+        :param datetime date_created: The date that this resource was created.
+        :param datetime date_updated: The date that this resource was last updated.
+        :param unicode attributes: An optional string metadata field you can use to store any data you wish.
+        :param unicode messaging_service_sid: The unique ID of the Messaging Service this conversation belongs to.
+        :param ConversationInstance.State state: Current state of this conversation.
+        :param unicode timers_inactive: ISO8601 duration when conversation will be switched to `inactive` state.
+        :param unicode timers_closed: ISO8601 duration when conversation will be switched to `closed` state.
+        :param unicode unique_name: An application-defined string that uniquely identifies the resource
+        :param ConversationInstance.WebhookEnabledType x_twilio_webhook_enabled: The X-Twilio-Webhook-Enabled HTTP request header
+
+        :returns: The updated ConversationInstance
+        :rtype: twilio.rest.conversations.v1.conversation.ConversationInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'DateCreated': serialize.iso8601_datetime(date_created),
+            'DateUpdated': serialize.iso8601_datetime(date_updated),
+            'Attributes': attributes,
+            'MessagingServiceSid': messaging_service_sid,
+            'State': state,
+            'Timers.Inactive': timers_inactive,
+            'Timers.Closed': timers_closed,
+            'UniqueName': unique_name,
+        })
+        headers = values.of({'X-Twilio-Webhook-Enabled': x_twilio_webhook_enabled, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, headers=headers, )
+
+        return ConversationInstance(self._version, payload, sid=self._solution['sid'], )
+
     def delete(self, x_twilio_webhook_enabled=values.unset):
         """
         Deletes the ConversationInstance
@@ -296,6 +485,19 @@ class ConversationContext(InstanceContext):
 
         return self._version.delete(method='DELETE', uri=self._uri, headers=headers, )
 
+    async def delete_async(self, x_twilio_webhook_enabled=values.unset):
+        """
+        Asynchronous coroutine that deletes the ConversationInstance
+
+        :param ConversationInstance.WebhookEnabledType x_twilio_webhook_enabled: The X-Twilio-Webhook-Enabled HTTP request header
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        headers = values.of({'X-Twilio-Webhook-Enabled': x_twilio_webhook_enabled, })
+
+        return await self._version.delete_async(method='DELETE', uri=self._uri, headers=headers, )
+
     def fetch(self):
         """
         Fetch the ConversationInstance
@@ -307,6 +509,17 @@ class ConversationContext(InstanceContext):
 
         return ConversationInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ConversationInstance
+
+        :returns: The fetched ConversationInstance
+        :rtype: twilio.rest.conversations.v1.conversation.ConversationInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return ConversationInstance(self._version, payload, sid=self._solution['sid'], )
+
     @property
     def participants(self):
         """
@@ -316,6 +529,7 @@ class ConversationContext(InstanceContext):
         :rtype: twilio.rest.conversations.v1.conversation.participant.ParticipantList
         """
         if self._participants is None:
+            from twilio.rest.conversations.v1.conversation.participant import ParticipantList
             self._participants = ParticipantList(self._version, conversation_sid=self._solution['sid'], )
         return self._participants
 
@@ -328,6 +542,7 @@ class ConversationContext(InstanceContext):
         :rtype: twilio.rest.conversations.v1.conversation.message.MessageList
         """
         if self._messages is None:
+            from twilio.rest.conversations.v1.conversation.message import MessageList
             self._messages = MessageList(self._version, conversation_sid=self._solution['sid'], )
         return self._messages
 
@@ -340,6 +555,7 @@ class ConversationContext(InstanceContext):
         :rtype: twilio.rest.conversations.v1.conversation.webhook.WebhookList
         """
         if self._webhooks is None:
+            from twilio.rest.conversations.v1.conversation.webhook import WebhookList
             self._webhooks = WebhookList(self._version, conversation_sid=self._solution['sid'], )
         return self._webhooks
 
@@ -365,6 +581,32 @@ class ConversationInstance(InstanceResource):
         ACTIVE = "active"
         CLOSED = "closed"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'chat_service_sid': 'chat_service_sid',
+        'messaging_service_sid': 'messaging_service_sid',
+        'sid': 'sid',
+        'friendly_name': 'friendly_name',
+        'unique_name': 'unique_name',
+        'attributes': 'attributes',
+        'state': 'state',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'timers': 'timers',
+        'url': 'url',
+        'links': 'links',
+        'bindings': 'bindings',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the ConversationInstance
@@ -375,22 +617,7 @@ class ConversationInstance(InstanceResource):
         super(ConversationInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'chat_service_sid': payload.get('chat_service_sid'),
-            'messaging_service_sid': payload.get('messaging_service_sid'),
-            'sid': payload.get('sid'),
-            'friendly_name': payload.get('friendly_name'),
-            'unique_name': payload.get('unique_name'),
-            'attributes': payload.get('attributes'),
-            'state': payload.get('state'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'timers': payload.get('timers'),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-            'bindings': payload.get('bindings'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -556,6 +783,41 @@ class ConversationInstance(InstanceResource):
             x_twilio_webhook_enabled=x_twilio_webhook_enabled,
         )
 
+    async def update_async(self, friendly_name=values.unset, date_created=values.unset,
+                           date_updated=values.unset, attributes=values.unset,
+                           messaging_service_sid=values.unset, state=values.unset,
+                           timers_inactive=values.unset, timers_closed=values.unset,
+                           unique_name=values.unset, x_twilio_webhook_enabled=values.unset):
+        """
+        Asynchronous coroutine that updates the ConversationInstance
+
+        :param unicode friendly_name: The human-readable name of this conversation.
+        :param datetime date_created: The date that this resource was created.
+        :param datetime date_updated: The date that this resource was last updated.
+        :param unicode attributes: An optional string metadata field you can use to store any data you wish.
+        :param unicode messaging_service_sid: The unique ID of the Messaging Service this conversation belongs to.
+        :param ConversationInstance.State state: Current state of this conversation.
+        :param unicode timers_inactive: ISO8601 duration when conversation will be switched to `inactive` state.
+        :param unicode timers_closed: ISO8601 duration when conversation will be switched to `closed` state.
+        :param unicode unique_name: An application-defined string that uniquely identifies the resource
+        :param ConversationInstance.WebhookEnabledType x_twilio_webhook_enabled: The X-Twilio-Webhook-Enabled HTTP request header
+
+        :returns: The updated ConversationInstance
+        :rtype: twilio.rest.conversations.v1.conversation.ConversationInstance
+        """
+        return await self._proxy.update_async(
+            friendly_name=friendly_name,
+            date_created=date_created,
+            date_updated=date_updated,
+            attributes=attributes,
+            messaging_service_sid=messaging_service_sid,
+            state=state,
+            timers_inactive=timers_inactive,
+            timers_closed=timers_closed,
+            unique_name=unique_name,
+            x_twilio_webhook_enabled=x_twilio_webhook_enabled,
+        )
+
     def delete(self, x_twilio_webhook_enabled=values.unset):
         """
         Deletes the ConversationInstance
@@ -567,6 +829,17 @@ class ConversationInstance(InstanceResource):
         """
         return self._proxy.delete(x_twilio_webhook_enabled=x_twilio_webhook_enabled, )
 
+    async def delete_async(self, x_twilio_webhook_enabled=values.unset):
+        """
+        Asynchronous coroutine that deletes the ConversationInstance
+
+        :param ConversationInstance.WebhookEnabledType x_twilio_webhook_enabled: The X-Twilio-Webhook-Enabled HTTP request header
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async(x_twilio_webhook_enabled=x_twilio_webhook_enabled, )
+
     def fetch(self):
         """
         Fetch the ConversationInstance
@@ -576,6 +849,15 @@ class ConversationInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ConversationInstance
+
+        :returns: The fetched ConversationInstance
+        :rtype: twilio.rest.conversations.v1.conversation.ConversationInstance
+        """
+        return await self._proxy.fetch_async()
+
     @property
     def participants(self):
         """
@@ -615,3 +897,21 @@ class ConversationInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Conversations.V1.ConversationInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'MessageList': 'twilio.rest.conversations.v1.conversation.message',
+    'ParticipantList': 'twilio.rest.conversations.v1.conversation.participant',
+    'WebhookList': 'twilio.rest.conversations.v1.conversation.webhook',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
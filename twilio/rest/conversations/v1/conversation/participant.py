@@ -31,14 +31,14 @@ class ParticipantList(ListResource):
 
         # Path Solution
         self._solution = {'conversation_sid': conversation_sid, }
-        self._uri = '/Conversations/{conversation_sid}/Participants'.format(**self._solution)
+        self._uri = values.ResourceUri('/Conversations/{conversation_sid}/Participants', self._solution)
 
     def create(self, identity=values.unset, messaging_binding_address=values.unset,
                messaging_binding_proxy_address=values.unset,
                date_created=values.unset, date_updated=values.unset,
                attributes=values.unset,
                messaging_binding_projected_address=values.unset,
-               role_sid=values.unset, x_twilio_webhook_enabled=values.unset):
+               role_sid=values.unset, x_twilio_webhook_enabled=values.unset, deadline=None):
         """
         Create the ParticipantInstance
 
@@ -51,6 +51,8 @@ class ParticipantList(ListResource):
         :param unicode messaging_binding_projected_address: The address of the Twilio phone number that is used in Group MMS.
         :param unicode role_sid: The SID of a conversation-level Role to assign to the participant
         :param ParticipantInstance.WebhookEnabledType x_twilio_webhook_enabled: The X-Twilio-Webhook-Enabled HTTP request header
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created ParticipantInstance
         :rtype: twilio.rest.conversations.v1.conversation.participant.ParticipantInstance
@@ -67,7 +69,7 @@ class ParticipantList(ListResource):
         })
         headers = values.of({'X-Twilio-Webhook-Enabled': x_twilio_webhook_enabled, })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, headers=headers, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, headers=headers, deadline=deadline, )
 
         return ParticipantInstance(
             self._version,
@@ -75,7 +77,52 @@ class ParticipantList(ListResource):
             conversation_sid=self._solution['conversation_sid'],
         )
 
-    def stream(self, limit=None, page_size=None):
+    async def create_async(self, identity=values.unset, messaging_binding_address=values.unset,
+                           messaging_binding_proxy_address=values.unset,
+                           date_created=values.unset, date_updated=values.unset,
+                           attributes=values.unset,
+                           messaging_binding_projected_address=values.unset,
+                           role_sid=values.unset, x_twilio_webhook_enabled=values.unset,
+                           deadline=None):
+        """
+        Asynchronous coroutine that creates the ParticipantInstance
+
+        :param unicode identity: A unique string identifier for the conversation participant as Conversation User.
+        :param unicode messaging_binding_address: The address of the participant's device.
+        :param unicode messaging_binding_proxy_address: The address of the Twilio phone number that the participant is in contact with.
+        :param datetime date_created: The date that this resource was created.
+        :param datetime date_updated: The date that this resource was last updated.
+        :param unicode attributes: An optional string metadata field you can use to store any data you wish.
+        :param unicode messaging_binding_projected_address: The address of the Twilio phone number that is used in Group MMS.
+        :param unicode role_sid: The SID of a conversation-level Role to assign to the participant
+        :param ParticipantInstance.WebhookEnabledType x_twilio_webhook_enabled: The X-Twilio-Webhook-Enabled HTTP request header
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created ParticipantInstance
+        :rtype: twilio.rest.conversations.v1.conversation.participant.ParticipantInstance
+        """
+        data = values.of({
+            'Identity': identity,
+            'MessagingBinding.Address': messaging_binding_address,
+            'MessagingBinding.ProxyAddress': messaging_binding_proxy_address,
+            'DateCreated': serialize.iso8601_datetime(date_created),
+            'DateUpdated': serialize.iso8601_datetime(date_updated),
+            'Attributes': attributes,
+            'MessagingBinding.ProjectedAddress': messaging_binding_projected_address,
+            'RoleSid': role_sid,
+        })
+        headers = values.of({'X-Twilio-Webhook-Enabled': x_twilio_webhook_enabled, })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, headers=headers, deadline=deadline, )
+
+        return ParticipantInstance(
+            self._version,
+            payload,
+            conversation_sid=self._solution['conversation_sid'],
+        )
+
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams ParticipantInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -88,17 +135,57 @@ class ParticipantList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.conversations.v1.conversation.participant.ParticipantInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams ParticipantInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.conversations.v1.conversation.participant.ParticipantInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists ParticipantInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -110,11 +197,42 @@ class ParticipantList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.conversations.v1.conversation.participant.ParticipantInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists ParticipantInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.conversations.v1.conversation.participant.ParticipantInstance]
+        """
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -135,6 +253,25 @@ class ParticipantList(ListResource):
 
         return ParticipantPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of ParticipantInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of ParticipantInstance
+        :rtype: twilio.rest.conversations.v1.conversation.participant.ParticipantPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return ParticipantPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of ParticipantInstance records from the API.
@@ -152,6 +289,23 @@ class ParticipantList(ListResource):
 
         return ParticipantPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of ParticipantInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of ParticipantInstance
+        :rtype: twilio.rest.conversations.v1.conversation.participant.ParticipantPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return ParticipantPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a ParticipantContext
@@ -252,7 +406,7 @@ class ParticipantContext(InstanceContext):
 
         # Path Solution
         self._solution = {'conversation_sid': conversation_sid, 'sid': sid, }
-        self._uri = '/Conversations/{conversation_sid}/Participants/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Conversations/{conversation_sid}/Participants/{sid}', self._solution)
 
     def update(self, date_created=values.unset, date_updated=values.unset,
                attributes=values.unset, role_sid=values.unset,
@@ -300,6 +454,52 @@ class ParticipantContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, date_created=values.unset, date_updated=values.unset,
+                           attributes=values.unset, role_sid=values.unset,
+                           messaging_binding_proxy_address=values.unset,
+                           messaging_binding_projected_address=values.unset,
+                           identity=values.unset, last_read_message_index=values.unset,
+                           last_read_timestamp=values.unset,
+                           x_twilio_webhook_enabled=values.unset):
+        """
+        Asynchronous coroutine that updates the ParticipantInstance
+
+        :param datetime date_created: The date that this resource was created.
+        :param datetime date_updated: The date that this resource was last updated.
+        :param unicode attributes: An optional string metadata field you can use to store any data you wish.
+        :param unicode role_sid: The SID of a conversation-level Role to assign to the participant
+        :param unicode messaging_binding_proxy_address: The address of the Twilio phone number that the participant is in contact with.
+        :param unicode messaging_binding_projected_address: The address of the Twilio phone number that is used in Group MMS.
+        :param unicode identity: A unique string identifier for the conversation participant as Conversation User.
+        :param unicode last_read_message_index: Index of last “read” message in the Conversation for the Participant.
+        :param unicode last_read_timestamp: Timestamp of last “read” message in the Conversation for the Participant.
+        :param ParticipantInstance.WebhookEnabledType x_twilio_webhook_enabled: The X-Twilio-Webhook-Enabled HTTP request header
+
+        :returns: The updated ParticipantInstance
+        :rtype: twilio.rest.conversations.v1.conversation.participant.ParticipantInstance
+        """
+        data = values.of({
+            'DateCreated': serialize.iso8601_datetime(date_created),
+            'DateUpdated': serialize.iso8601_datetime(date_updated),
+            'Attributes': attributes,
+            'RoleSid': role_sid,
+            'MessagingBinding.ProxyAddress': messaging_binding_proxy_address,
+            'MessagingBinding.ProjectedAddress': messaging_binding_projected_address,
+            'Identity': identity,
+            'LastReadMessageIndex': last_read_message_index,
+            'LastReadTimestamp': last_read_timestamp,
+        })
+        headers = values.of({'X-Twilio-Webhook-Enabled': x_twilio_webhook_enabled, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, headers=headers, )
+
+        return ParticipantInstance(
+            self._version,
+            payload,
+            conversation_sid=self._solution['conversation_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self, x_twilio_webhook_enabled=values.unset):
         """
         Deletes the ParticipantInstance
@@ -313,6 +513,19 @@ class ParticipantContext(InstanceContext):
 
         return self._version.delete(method='DELETE', uri=self._uri, headers=headers, )
 
+    async def delete_async(self, x_twilio_webhook_enabled=values.unset):
+        """
+        Asynchronous coroutine that deletes the ParticipantInstance
+
+        :param ParticipantInstance.WebhookEnabledType x_twilio_webhook_enabled: The X-Twilio-Webhook-Enabled HTTP request header
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        headers = values.of({'X-Twilio-Webhook-Enabled': x_twilio_webhook_enabled, })
+
+        return await self._version.delete_async(method='DELETE', uri=self._uri, headers=headers, )
+
     def fetch(self):
         """
         Fetch the ParticipantInstance
@@ -329,6 +542,22 @@ class ParticipantContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ParticipantInstance
+
+        :returns: The fetched ParticipantInstance
+        :rtype: twilio.rest.conversations.v1.conversation.participant.ParticipantInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return ParticipantInstance(
+            self._version,
+            payload,
+            conversation_sid=self._solution['conversation_sid'],
+            sid=self._solution['sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -346,6 +575,31 @@ class ParticipantInstance(InstanceResource):
         TRUE = "true"
         FALSE = "false"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+        'last_read_message_index': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'conversation_sid': 'conversation_sid',
+        'sid': 'sid',
+        'identity': 'identity',
+        'attributes': 'attributes',
+        'messaging_binding': 'messaging_binding',
+        'role_sid': 'role_sid',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'url': 'url',
+        'last_read_message_index': 'last_read_message_index',
+        'last_read_timestamp': 'last_read_timestamp',
+    }, _deserializers)
+
     def __init__(self, version, payload, conversation_sid, sid=None):
         """
         Initialize the ParticipantInstance
@@ -356,20 +610,7 @@ class ParticipantInstance(InstanceResource):
         super(ParticipantInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'conversation_sid': payload.get('conversation_sid'),
-            'sid': payload.get('sid'),
-            'identity': payload.get('identity'),
-            'attributes': payload.get('attributes'),
-            'messaging_binding': payload.get('messaging_binding'),
-            'role_sid': payload.get('role_sid'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'url': payload.get('url'),
-            'last_read_message_index': deserialize.integer(payload.get('last_read_message_index')),
-            'last_read_timestamp': payload.get('last_read_timestamp'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -525,6 +766,43 @@ class ParticipantInstance(InstanceResource):
             x_twilio_webhook_enabled=x_twilio_webhook_enabled,
         )
 
+    async def update_async(self, date_created=values.unset, date_updated=values.unset,
+                           attributes=values.unset, role_sid=values.unset,
+                           messaging_binding_proxy_address=values.unset,
+                           messaging_binding_projected_address=values.unset,
+                           identity=values.unset, last_read_message_index=values.unset,
+                           last_read_timestamp=values.unset,
+                           x_twilio_webhook_enabled=values.unset):
+        """
+        Asynchronous coroutine that updates the ParticipantInstance
+
+        :param datetime date_created: The date that this resource was created.
+        :param datetime date_updated: The date that this resource was last updated.
+        :param unicode attributes: An optional string metadata field you can use to store any data you wish.
+        :param unicode role_sid: The SID of a conversation-level Role to assign to the participant
+        :param unicode messaging_binding_proxy_address: The address of the Twilio phone number that the participant is in contact with.
+        :param unicode messaging_binding_projected_address: The address of the Twilio phone number that is used in Group MMS.
+        :param unicode identity: A unique string identifier for the conversation participant as Conversation User.
+        :param unicode last_read_message_index: Index of last “read” message in the Conversation for the Participant.
+        :param unicode last_read_timestamp: Timestamp of last “read” message in the Conversation for the Participant.
+        :param ParticipantInstance.WebhookEnabledType x_twilio_webhook_enabled: The X-Twilio-Webhook-Enabled HTTP request header
+
+        :returns: The updated ParticipantInstance
+        :rtype: twilio.rest.conversations.v1.conversation.participant.ParticipantInstance
+        """
+        return await self._proxy.update_async(
+            date_created=date_created,
+            date_updated=date_updated,
+            attributes=attributes,
+            role_sid=role_sid,
+            messaging_binding_proxy_address=messaging_binding_proxy_address,
+            messaging_binding_projected_address=messaging_binding_projected_address,
+            identity=identity,
+            last_read_message_index=last_read_message_index,
+            last_read_timestamp=last_read_timestamp,
+            x_twilio_webhook_enabled=x_twilio_webhook_enabled,
+        )
+
     def delete(self, x_twilio_webhook_enabled=values.unset):
         """
         Deletes the ParticipantInstance
@@ -536,6 +814,17 @@ class ParticipantInstance(InstanceResource):
         """
         return self._proxy.delete(x_twilio_webhook_enabled=x_twilio_webhook_enabled, )
 
+    async def delete_async(self, x_twilio_webhook_enabled=values.unset):
+        """
+        Asynchronous coroutine that deletes the ParticipantInstance
+
+        :param ParticipantInstance.WebhookEnabledType x_twilio_webhook_enabled: The X-Twilio-Webhook-Enabled HTTP request header
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async(x_twilio_webhook_enabled=x_twilio_webhook_enabled, )
+
     def fetch(self):
         """
         Fetch the ParticipantInstance
@@ -545,6 +834,15 @@ class ParticipantInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ParticipantInstance
+
+        :returns: The fetched ParticipantInstance
+        :rtype: twilio.rest.conversations.v1.conversation.participant.ParticipantInstance
+        """
+        return await self._proxy.fetch_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -31,9 +31,9 @@ class WebhookList(ListResource):
 
         # Path Solution
         self._solution = {'conversation_sid': conversation_sid, }
-        self._uri = '/Conversations/{conversation_sid}/Webhooks'.format(**self._solution)
+        self._uri = values.ResourceUri('/Conversations/{conversation_sid}/Webhooks', self._solution)
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams WebhookInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -46,17 +46,57 @@ class WebhookList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.conversations.v1.conversation.webhook.WebhookInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams WebhookInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.conversations.v1.conversation.webhook.WebhookInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists WebhookInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -68,11 +108,42 @@ class WebhookList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.conversations.v1.conversation.webhook.WebhookInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists WebhookInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.conversations.v1.conversation.webhook.WebhookInstance]
+        """
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -93,6 +164,25 @@ class WebhookList(ListResource):
 
         return WebhookPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of WebhookInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of WebhookInstance
+        :rtype: twilio.rest.conversations.v1.conversation.webhook.WebhookPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return WebhookPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of WebhookInstance records from the API.
@@ -110,12 +200,29 @@ class WebhookList(ListResource):
 
         return WebhookPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of WebhookInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of WebhookInstance
+        :rtype: twilio.rest.conversations.v1.conversation.webhook.WebhookPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return WebhookPage(self._version, response, self._solution)
+
     def create(self, target, configuration_url=values.unset,
                configuration_method=values.unset,
                configuration_filters=values.unset,
                configuration_triggers=values.unset,
                configuration_flow_sid=values.unset,
-               configuration_replay_after=values.unset):
+               configuration_replay_after=values.unset, deadline=None):
         """
         Create the WebhookInstance
 
@@ -126,6 +233,8 @@ class WebhookList(ListResource):
         :param list[unicode] configuration_triggers: The list of keywords, firing webhook event for this Conversation.
         :param unicode configuration_flow_sid: The studio flow SID, where the webhook should be sent to.
         :param unicode configuration_replay_after: The message index for which and it's successors the webhook will be replayed.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created WebhookInstance
         :rtype: twilio.rest.conversations.v1.conversation.webhook.WebhookInstance
@@ -140,7 +249,43 @@ class WebhookList(ListResource):
             'Configuration.ReplayAfter': configuration_replay_after,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return WebhookInstance(self._version, payload, conversation_sid=self._solution['conversation_sid'], )
+
+    async def create_async(self, target, configuration_url=values.unset,
+                           configuration_method=values.unset,
+                           configuration_filters=values.unset,
+                           configuration_triggers=values.unset,
+                           configuration_flow_sid=values.unset,
+                           configuration_replay_after=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the WebhookInstance
+
+        :param WebhookInstance.Target target: The target of this webhook.
+        :param unicode configuration_url: The absolute url the webhook request should be sent to.
+        :param WebhookInstance.Method configuration_method: The HTTP method to be used when sending a webhook request.
+        :param list[unicode] configuration_filters: The list of events, firing webhook event for this Conversation.
+        :param list[unicode] configuration_triggers: The list of keywords, firing webhook event for this Conversation.
+        :param unicode configuration_flow_sid: The studio flow SID, where the webhook should be sent to.
+        :param unicode configuration_replay_after: The message index for which and it's successors the webhook will be replayed.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created WebhookInstance
+        :rtype: twilio.rest.conversations.v1.conversation.webhook.WebhookInstance
+        """
+        data = values.of({
+            'Target': target,
+            'Configuration.Url': configuration_url,
+            'Configuration.Method': configuration_method,
+            'Configuration.Filters': serialize.map(configuration_filters, lambda e: e),
+            'Configuration.Triggers': serialize.map(configuration_triggers, lambda e: e),
+            'Configuration.FlowSid': configuration_flow_sid,
+            'Configuration.ReplayAfter': configuration_replay_after,
+        })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return WebhookInstance(self._version, payload, conversation_sid=self._solution['conversation_sid'], )
 
@@ -232,7 +377,7 @@ class WebhookContext(InstanceContext):
 
         # Path Solution
         self._solution = {'conversation_sid': conversation_sid, 'sid': sid, }
-        self._uri = '/Conversations/{conversation_sid}/Webhooks/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Conversations/{conversation_sid}/Webhooks/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -250,6 +395,22 @@ class WebhookContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the WebhookInstance
+
+        :returns: The fetched WebhookInstance
+        :rtype: twilio.rest.conversations.v1.conversation.webhook.WebhookInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return WebhookInstance(
+            self._version,
+            payload,
+            conversation_sid=self._solution['conversation_sid'],
+            sid=self._solution['sid'],
+        )
+
     def update(self, configuration_url=values.unset,
                configuration_method=values.unset,
                configuration_filters=values.unset,
@@ -284,6 +445,40 @@ class WebhookContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, configuration_url=values.unset,
+                           configuration_method=values.unset,
+                           configuration_filters=values.unset,
+                           configuration_triggers=values.unset,
+                           configuration_flow_sid=values.unset):
+        """
+        Asynchronous coroutine that updates the WebhookInstance
+
+        :param unicode configuration_url: The absolute url the webhook request should be sent to.
+        :param WebhookInstance.Method configuration_method: The HTTP method to be used when sending a webhook request.
+        :param list[unicode] configuration_filters: The list of events, firing webhook event for this Conversation.
+        :param list[unicode] configuration_triggers: The list of keywords, firing webhook event for this Conversation.
+        :param unicode configuration_flow_sid: The studio flow SID, where the webhook should be sent to.
+
+        :returns: The updated WebhookInstance
+        :rtype: twilio.rest.conversations.v1.conversation.webhook.WebhookInstance
+        """
+        data = values.of({
+            'Configuration.Url': configuration_url,
+            'Configuration.Method': configuration_method,
+            'Configuration.Filters': serialize.map(configuration_filters, lambda e: e),
+            'Configuration.Triggers': serialize.map(configuration_triggers, lambda e: e),
+            'Configuration.FlowSid': configuration_flow_sid,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return WebhookInstance(
+            self._version,
+            payload,
+            conversation_sid=self._solution['conversation_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self):
         """
         Deletes the WebhookInstance
@@ -293,6 +488,15 @@ class WebhookContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the WebhookInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -315,6 +519,26 @@ class WebhookInstance(InstanceResource):
         GET = "GET"
         POST = "POST"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'conversation_sid': 'conversation_sid',
+        'target': 'target',
+        'url': 'url',
+        'configuration': 'configuration',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+    }, _deserializers)
+
     def __init__(self, version, payload, conversation_sid, sid=None):
         """
         Initialize the WebhookInstance
@@ -325,16 +549,7 @@ class WebhookInstance(InstanceResource):
         super(WebhookInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'conversation_sid': payload.get('conversation_sid'),
-            'target': payload.get('target'),
-            'url': payload.get('url'),
-            'configuration': payload.get('configuration'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -430,6 +645,15 @@ class WebhookInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the WebhookInstance
+
+        :returns: The fetched WebhookInstance
+        :rtype: twilio.rest.conversations.v1.conversation.webhook.WebhookInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, configuration_url=values.unset,
                configuration_method=values.unset,
                configuration_filters=values.unset,
@@ -455,6 +679,31 @@ class WebhookInstance(InstanceResource):
             configuration_flow_sid=configuration_flow_sid,
         )
 
+    async def update_async(self, configuration_url=values.unset,
+                           configuration_method=values.unset,
+                           configuration_filters=values.unset,
+                           configuration_triggers=values.unset,
+                           configuration_flow_sid=values.unset):
+        """
+        Asynchronous coroutine that updates the WebhookInstance
+
+        :param unicode configuration_url: The absolute url the webhook request should be sent to.
+        :param WebhookInstance.Method configuration_method: The HTTP method to be used when sending a webhook request.
+        :param list[unicode] configuration_filters: The list of events, firing webhook event for this Conversation.
+        :param list[unicode] configuration_triggers: The list of keywords, firing webhook event for this Conversation.
+        :param unicode configuration_flow_sid: The studio flow SID, where the webhook should be sent to.
+
+        :returns: The updated WebhookInstance
+        :rtype: twilio.rest.conversations.v1.conversation.webhook.WebhookInstance
+        """
+        return await self._proxy.update_async(
+            configuration_url=configuration_url,
+            configuration_method=configuration_method,
+            configuration_filters=configuration_filters,
+            configuration_triggers=configuration_triggers,
+            configuration_flow_sid=configuration_flow_sid,
+        )
+
     def delete(self):
         """
         Deletes the WebhookInstance
@@ -464,6 +713,15 @@ class WebhookInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the WebhookInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
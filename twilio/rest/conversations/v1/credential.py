@@ -29,11 +29,11 @@ class CredentialList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Credentials'.format(**self._solution)
+        self._uri = values.ResourceUri('/Credentials', self._solution)
 
     def create(self, type, friendly_name=values.unset, certificate=values.unset,
                private_key=values.unset, sandbox=values.unset, api_key=values.unset,
-               secret=values.unset):
+               secret=values.unset, deadline=None):
         """
         Create the CredentialInstance
 
@@ -44,6 +44,8 @@ class CredentialList(ListResource):
         :param bool sandbox: [APN only] Whether to send the credential to sandbox APNs.
         :param unicode api_key: [GCM only] The API key for the project that was obtained from the Google Developer console for your GCM Service application credential.
         :param unicode secret: [FCM only] The Server key of your project from Firebase console.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created CredentialInstance
         :rtype: twilio.rest.conversations.v1.credential.CredentialInstance
@@ -58,11 +60,44 @@ class CredentialList(ListResource):
             'Secret': secret,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return CredentialInstance(self._version, payload, )
 
-    def stream(self, limit=None, page_size=None):
+    async def create_async(self, type, friendly_name=values.unset, certificate=values.unset,
+                           private_key=values.unset, sandbox=values.unset, api_key=values.unset,
+                           secret=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the CredentialInstance
+
+        :param CredentialInstance.PushType type: The type of push-notification service the credential is for.
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode certificate: [APN only] The URL encoded representation of the certificate.
+        :param unicode private_key: [APN only] The URL encoded representation of the private key.
+        :param bool sandbox: [APN only] Whether to send the credential to sandbox APNs.
+        :param unicode api_key: [GCM only] The API key for the project that was obtained from the Google Developer console for your GCM Service application credential.
+        :param unicode secret: [FCM only] The Server key of your project from Firebase console.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created CredentialInstance
+        :rtype: twilio.rest.conversations.v1.credential.CredentialInstance
+        """
+        data = values.of({
+            'Type': type,
+            'FriendlyName': friendly_name,
+            'Certificate': certificate,
+            'PrivateKey': private_key,
+            'Sandbox': sandbox,
+            'ApiKey': api_key,
+            'Secret': secret,
+        })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return CredentialInstance(self._version, payload, )
+
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams CredentialInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -75,17 +110,57 @@ class CredentialList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.conversations.v1.credential.CredentialInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams CredentialInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.conversations.v1.credential.CredentialInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists CredentialInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -97,11 +172,42 @@ class CredentialList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.conversations.v1.credential.CredentialInstance]
+        """
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists CredentialInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.conversations.v1.credential.CredentialInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -122,6 +228,25 @@ class CredentialList(ListResource):
 
         return CredentialPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of CredentialInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of CredentialInstance
+        :rtype: twilio.rest.conversations.v1.credential.CredentialPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return CredentialPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of CredentialInstance records from the API.
@@ -139,6 +264,23 @@ class CredentialList(ListResource):
 
         return CredentialPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of CredentialInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of CredentialInstance
+        :rtype: twilio.rest.conversations.v1.credential.CredentialPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return CredentialPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a CredentialContext
@@ -225,7 +367,7 @@ class CredentialContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/Credentials/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Credentials/{sid}', self._solution)
 
     def update(self, type=values.unset, friendly_name=values.unset,
                certificate=values.unset, private_key=values.unset,
@@ -258,6 +400,37 @@ class CredentialContext(InstanceContext):
 
         return CredentialInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def update_async(self, type=values.unset, friendly_name=values.unset,
+                           certificate=values.unset, private_key=values.unset,
+                           sandbox=values.unset, api_key=values.unset, secret=values.unset):
+        """
+        Asynchronous coroutine that updates the CredentialInstance
+
+        :param CredentialInstance.PushType type: The type of push-notification service the credential is for.
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode certificate: [APN only] The URL encoded representation of the certificate.
+        :param unicode private_key: [APN only] The URL encoded representation of the private key.
+        :param bool sandbox: [APN only] Whether to send the credential to sandbox APNs.
+        :param unicode api_key: [GCM only] The API key for the project that was obtained from the Google Developer console for your GCM Service application credential.
+        :param unicode secret: [FCM only] The Server key of your project from Firebase console.
+
+        :returns: The updated CredentialInstance
+        :rtype: twilio.rest.conversations.v1.credential.CredentialInstance
+        """
+        data = values.of({
+            'Type': type,
+            'FriendlyName': friendly_name,
+            'Certificate': certificate,
+            'PrivateKey': private_key,
+            'Sandbox': sandbox,
+            'ApiKey': api_key,
+            'Secret': secret,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return CredentialInstance(self._version, payload, sid=self._solution['sid'], )
+
     def delete(self):
         """
         Deletes the CredentialInstance
@@ -267,6 +440,15 @@ class CredentialContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the CredentialInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def fetch(self):
         """
         Fetch the CredentialInstance
@@ -278,6 +460,17 @@ class CredentialContext(InstanceContext):
 
         return CredentialInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the CredentialInstance
+
+        :returns: The fetched CredentialInstance
+        :rtype: twilio.rest.conversations.v1.credential.CredentialInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return CredentialInstance(self._version, payload, sid=self._solution['sid'], )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -296,6 +489,26 @@ class CredentialInstance(InstanceResource):
         GCM = "gcm"
         FCM = "fcm"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'friendly_name': 'friendly_name',
+        'type': 'type',
+        'sandbox': 'sandbox',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the CredentialInstance
@@ -306,16 +519,7 @@ class CredentialInstance(InstanceResource):
         super(CredentialInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'friendly_name': payload.get('friendly_name'),
-            'type': payload.get('type'),
-            'sandbox': payload.get('sandbox'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -425,6 +629,33 @@ class CredentialInstance(InstanceResource):
             secret=secret,
         )
 
+    async def update_async(self, type=values.unset, friendly_name=values.unset,
+                           certificate=values.unset, private_key=values.unset,
+                           sandbox=values.unset, api_key=values.unset, secret=values.unset):
+        """
+        Asynchronous coroutine that updates the CredentialInstance
+
+        :param CredentialInstance.PushType type: The type of push-notification service the credential is for.
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode certificate: [APN only] The URL encoded representation of the certificate.
+        :param unicode private_key: [APN only] The URL encoded representation of the private key.
+        :param bool sandbox: [APN only] Whether to send the credential to sandbox APNs.
+        :param unicode api_key: [GCM only] The API key for the project that was obtained from the Google Developer console for your GCM Service application credential.
+        :param unicode secret: [FCM only] The Server key of your project from Firebase console.
+
+        :returns: The updated CredentialInstance
+        :rtype: twilio.rest.conversations.v1.credential.CredentialInstance
+        """
+        return await self._proxy.update_async(
+            type=type,
+            friendly_name=friendly_name,
+            certificate=certificate,
+            private_key=private_key,
+            sandbox=sandbox,
+            api_key=api_key,
+            secret=secret,
+        )
+
     def delete(self):
         """
         Deletes the CredentialInstance
@@ -434,6 +665,15 @@ class CredentialInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the CredentialInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def fetch(self):
         """
         Fetch the CredentialInstance
@@ -443,6 +683,15 @@ class CredentialInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the CredentialInstance
+
+        :returns: The fetched CredentialInstance
+        :rtype: twilio.rest.conversations.v1.credential.CredentialInstance
+        """
+        return await self._proxy.fetch_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -28,10 +28,10 @@ class ParticipantConversationList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/ParticipantConversations'.format(**self._solution)
+        self._uri = values.ResourceUri('/ParticipantConversations', self._solution)
 
     def stream(self, identity=values.unset, address=values.unset, limit=None,
-               page_size=None):
+               page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams ParticipantConversationInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -46,18 +46,60 @@ class ParticipantConversationList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.conversations.v1.participant_conversation.ParticipantConversationInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(identity=identity, address=address, page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(identity=identity, address=address, page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, identity=values.unset, address=values.unset, limit=None,
+                           page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams ParticipantConversationInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param unicode identity: A unique string identifier for the conversation participant as Conversation User.
+        :param unicode address: A unique string identifier for the conversation participant who's not a Conversation User.
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.conversations.v1.participant_conversation.ParticipantConversationInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(identity=identity, address=address, page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, identity=values.unset, address=values.unset, limit=None,
-             page_size=None):
+             page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists ParticipantConversationInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -71,11 +113,44 @@ class ParticipantConversationList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.conversations.v1.participant_conversation.ParticipantConversationInstance]
         """
-        return list(self.stream(identity=identity, address=address, limit=limit, page_size=page_size, ))
+        return list(self.stream(identity=identity, address=address, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, identity=values.unset, address=values.unset, limit=None,
+                         page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists ParticipantConversationInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param unicode identity: A unique string identifier for the conversation participant as Conversation User.
+        :param unicode address: A unique string identifier for the conversation participant who's not a Conversation User.
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.conversations.v1.participant_conversation.ParticipantConversationInstance]
+        """
+        return [record async for record in await self.stream_async(identity=identity, address=address, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, identity=values.unset, address=values.unset,
              page_token=values.unset, page_number=values.unset,
@@ -105,6 +180,34 @@ class ParticipantConversationList(ListResource):
 
         return ParticipantConversationPage(self._version, response, self._solution)
 
+    async def page_async(self, identity=values.unset, address=values.unset,
+                         page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of ParticipantConversationInstance records from the API.
+        Request is executed immediately
+
+        :param unicode identity: A unique string identifier for the conversation participant as Conversation User.
+        :param unicode address: A unique string identifier for the conversation participant who's not a Conversation User.
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of ParticipantConversationInstance
+        :rtype: twilio.rest.conversations.v1.participant_conversation.ParticipantConversationPage
+        """
+        data = values.of({
+            'Identity': identity,
+            'Address': address,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return ParticipantConversationPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of ParticipantConversationInstance records from the API.
@@ -122,6 +225,23 @@ class ParticipantConversationList(ListResource):
 
         return ParticipantConversationPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of ParticipantConversationInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of ParticipantConversationInstance
+        :rtype: twilio.rest.conversations.v1.participant_conversation.ParticipantConversationPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return ParticipantConversationPage(self._version, response, self._solution)
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -177,6 +297,34 @@ class ParticipantConversationInstance(InstanceResource):
         ACTIVE = "active"
         CLOSED = "closed"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'conversation_date_created': deserialize.iso8601_datetime,
+        'conversation_date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'chat_service_sid': 'chat_service_sid',
+        'participant_sid': 'participant_sid',
+        'participant_user_sid': 'participant_user_sid',
+        'participant_identity': 'participant_identity',
+        'participant_messaging_binding': 'participant_messaging_binding',
+        'conversation_sid': 'conversation_sid',
+        'conversation_unique_name': 'conversation_unique_name',
+        'conversation_friendly_name': 'conversation_friendly_name',
+        'conversation_attributes': 'conversation_attributes',
+        'conversation_date_created': 'conversation_date_created',
+        'conversation_date_updated': 'conversation_date_updated',
+        'conversation_created_by': 'conversation_created_by',
+        'conversation_state': 'conversation_state',
+        'conversation_timers': 'conversation_timers',
+        'links': 'links',
+    }, _deserializers)
+
     def __init__(self, version, payload):
         """
         Initialize the ParticipantConversationInstance
@@ -187,24 +335,7 @@ class ParticipantConversationInstance(InstanceResource):
         super(ParticipantConversationInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'chat_service_sid': payload.get('chat_service_sid'),
-            'participant_sid': payload.get('participant_sid'),
-            'participant_user_sid': payload.get('participant_user_sid'),
-            'participant_identity': payload.get('participant_identity'),
-            'participant_messaging_binding': payload.get('participant_messaging_binding'),
-            'conversation_sid': payload.get('conversation_sid'),
-            'conversation_unique_name': payload.get('conversation_unique_name'),
-            'conversation_friendly_name': payload.get('conversation_friendly_name'),
-            'conversation_attributes': payload.get('conversation_attributes'),
-            'conversation_date_created': deserialize.iso8601_datetime(payload.get('conversation_date_created')),
-            'conversation_date_updated': deserialize.iso8601_datetime(payload.get('conversation_date_updated')),
-            'conversation_created_by': payload.get('conversation_created_by'),
-            'conversation_state': payload.get('conversation_state'),
-            'conversation_timers': payload.get('conversation_timers'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
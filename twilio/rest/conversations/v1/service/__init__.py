@@ -6,18 +6,14 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.conversations.v1.service.binding import BindingList
-from twilio.rest.conversations.v1.service.configuration import ConfigurationList
-from twilio.rest.conversations.v1.service.conversation import ConversationList
-from twilio.rest.conversations.v1.service.participant_conversation import ParticipantConversationList
-from twilio.rest.conversations.v1.service.role import RoleList
-from twilio.rest.conversations.v1.service.user import UserList
 
 
 class ServiceList(ListResource):
@@ -35,24 +31,43 @@ class ServiceList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Services'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services', self._solution)
 
-    def create(self, friendly_name):
+    def create(self, friendly_name, deadline=None):
         """
         Create the ServiceInstance
 
         :param unicode friendly_name: The human-readable name of this service.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created ServiceInstance
+        :rtype: twilio.rest.conversations.v1.service.ServiceInstance
+        """
+        data = values.of({'FriendlyName': friendly_name, })
+
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return ServiceInstance(self._version, payload, )
+
+    async def create_async(self, friendly_name, deadline=None):
+        """
+        Asynchronous coroutine that creates the ServiceInstance
+
+        :param unicode friendly_name: The human-readable name of this service.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created ServiceInstance
         :rtype: twilio.rest.conversations.v1.service.ServiceInstance
         """
         data = values.of({'FriendlyName': friendly_name, })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return ServiceInstance(self._version, payload, )
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams ServiceInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -65,17 +80,57 @@ class ServiceList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.conversations.v1.service.ServiceInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams ServiceInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.conversations.v1.service.ServiceInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists ServiceInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -87,11 +142,42 @@ class ServiceList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.conversations.v1.service.ServiceInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists ServiceInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.conversations.v1.service.ServiceInstance]
+        """
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -112,6 +198,25 @@ class ServiceList(ListResource):
 
         return ServicePage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of ServiceInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of ServiceInstance
+        :rtype: twilio.rest.conversations.v1.service.ServicePage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return ServicePage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of ServiceInstance records from the API.
@@ -129,6 +234,23 @@ class ServiceList(ListResource):
 
         return ServicePage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of ServiceInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of ServiceInstance
+        :rtype: twilio.rest.conversations.v1.service.ServicePage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return ServicePage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a ServiceContext
@@ -215,7 +337,7 @@ class ServiceContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/Services/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{sid}', self._solution)
 
         # Dependents
         self._conversations = None
@@ -234,6 +356,15 @@ class ServiceContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the ServiceInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def fetch(self):
         """
         Fetch the ServiceInstance
@@ -245,6 +376,17 @@ class ServiceContext(InstanceContext):
 
         return ServiceInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ServiceInstance
+
+        :returns: The fetched ServiceInstance
+        :rtype: twilio.rest.conversations.v1.service.ServiceInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return ServiceInstance(self._version, payload, sid=self._solution['sid'], )
+
     @property
     def conversations(self):
         """
@@ -254,6 +396,7 @@ class ServiceContext(InstanceContext):
         :rtype: twilio.rest.conversations.v1.service.conversation.ConversationList
         """
         if self._conversations is None:
+            from twilio.rest.conversations.v1.service.conversation import ConversationList
             self._conversations = ConversationList(self._version, chat_service_sid=self._solution['sid'], )
         return self._conversations
 
@@ -266,6 +409,7 @@ class ServiceContext(InstanceContext):
         :rtype: twilio.rest.conversations.v1.service.binding.BindingList
         """
         if self._bindings is None:
+            from twilio.rest.conversations.v1.service.binding import BindingList
             self._bindings = BindingList(self._version, chat_service_sid=self._solution['sid'], )
         return self._bindings
 
@@ -278,6 +422,7 @@ class ServiceContext(InstanceContext):
         :rtype: twilio.rest.conversations.v1.service.user.UserList
         """
         if self._users is None:
+            from twilio.rest.conversations.v1.service.user import UserList
             self._users = UserList(self._version, chat_service_sid=self._solution['sid'], )
         return self._users
 
@@ -290,6 +435,7 @@ class ServiceContext(InstanceContext):
         :rtype: twilio.rest.conversations.v1.service.role.RoleList
         """
         if self._roles is None:
+            from twilio.rest.conversations.v1.service.role import RoleList
             self._roles = RoleList(self._version, chat_service_sid=self._solution['sid'], )
         return self._roles
 
@@ -302,6 +448,7 @@ class ServiceContext(InstanceContext):
         :rtype: twilio.rest.conversations.v1.service.configuration.ConfigurationList
         """
         if self._configuration is None:
+            from twilio.rest.conversations.v1.service.configuration import ConfigurationList
             self._configuration = ConfigurationList(self._version, chat_service_sid=self._solution['sid'], )
         return self._configuration
 
@@ -314,6 +461,7 @@ class ServiceContext(InstanceContext):
         :rtype: twilio.rest.conversations.v1.service.participant_conversation.ParticipantConversationList
         """
         if self._participant_conversations is None:
+            from twilio.rest.conversations.v1.service.participant_conversation import ParticipantConversationList
             self._participant_conversations = ParticipantConversationList(
                 self._version,
                 chat_service_sid=self._solution['sid'],
@@ -333,6 +481,25 @@ class ServiceContext(InstanceContext):
 
 class ServiceInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'sid': 'sid',
+        'friendly_name': 'friendly_name',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'url': 'url',
+        'links': 'links',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the ServiceInstance
@@ -343,15 +510,7 @@ class ServiceInstance(InstanceResource):
         super(ServiceInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'sid': payload.get('sid'),
-            'friendly_name': payload.get('friendly_name'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -435,6 +594,15 @@ class ServiceInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the ServiceInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def fetch(self):
         """
         Fetch the ServiceInstance
@@ -444,6 +612,15 @@ class ServiceInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ServiceInstance
+
+        :returns: The fetched ServiceInstance
+        :rtype: twilio.rest.conversations.v1.service.ServiceInstance
+        """
+        return await self._proxy.fetch_async()
+
     @property
     def conversations(self):
         """
@@ -513,3 +690,24 @@ class ServiceInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Conversations.V1.ServiceInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'BindingList': 'twilio.rest.conversations.v1.service.binding',
+    'ConfigurationList': 'twilio.rest.conversations.v1.service.configuration',
+    'ConversationList': 'twilio.rest.conversations.v1.service.conversation',
+    'ParticipantConversationList': 'twilio.rest.conversations.v1.service.participant_conversation',
+    'RoleList': 'twilio.rest.conversations.v1.service.role',
+    'UserList': 'twilio.rest.conversations.v1.service.user',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
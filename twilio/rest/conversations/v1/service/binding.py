@@ -31,10 +31,10 @@ class BindingList(ListResource):
 
         # Path Solution
         self._solution = {'chat_service_sid': chat_service_sid, }
-        self._uri = '/Services/{chat_service_sid}/Bindings'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{chat_service_sid}/Bindings', self._solution)
 
     def stream(self, binding_type=values.unset, identity=values.unset, limit=None,
-               page_size=None):
+               page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams BindingInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -49,18 +49,60 @@ class BindingList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.conversations.v1.service.binding.BindingInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(binding_type=binding_type, identity=identity, page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(binding_type=binding_type, identity=identity, page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, binding_type=values.unset, identity=values.unset, limit=None,
+                           page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams BindingInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param list[BindingInstance.BindingType] binding_type: The push technology used by the Binding resources to read.
+        :param list[unicode] identity: The identity of Conversation User associated with this binding.
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.conversations.v1.service.binding.BindingInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(binding_type=binding_type, identity=identity, page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, binding_type=values.unset, identity=values.unset, limit=None,
-             page_size=None):
+             page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists BindingInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -74,6 +116,12 @@ class BindingList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.conversations.v1.service.binding.BindingInstance]
@@ -83,8 +131,46 @@ class BindingList(ListResource):
             identity=identity,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, binding_type=values.unset, identity=values.unset, limit=None,
+                         page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists BindingInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param list[BindingInstance.BindingType] binding_type: The push technology used by the Binding resources to read.
+        :param list[unicode] identity: The identity of Conversation User associated with this binding.
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.conversations.v1.service.binding.BindingInstance]
+        """
+        return [record async for record in await self.stream_async(
+            binding_type=binding_type,
+            identity=identity,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, binding_type=values.unset, identity=values.unset,
              page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -113,6 +199,34 @@ class BindingList(ListResource):
 
         return BindingPage(self._version, response, self._solution)
 
+    async def page_async(self, binding_type=values.unset, identity=values.unset,
+                         page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of BindingInstance records from the API.
+        Request is executed immediately
+
+        :param list[BindingInstance.BindingType] binding_type: The push technology used by the Binding resources to read.
+        :param list[unicode] identity: The identity of Conversation User associated with this binding.
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of BindingInstance
+        :rtype: twilio.rest.conversations.v1.service.binding.BindingPage
+        """
+        data = values.of({
+            'BindingType': serialize.map(binding_type, lambda e: e),
+            'Identity': serialize.map(identity, lambda e: e),
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return BindingPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of BindingInstance records from the API.
@@ -130,6 +244,23 @@ class BindingList(ListResource):
 
         return BindingPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of BindingInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of BindingInstance
+        :rtype: twilio.rest.conversations.v1.service.binding.BindingPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return BindingPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a BindingContext
@@ -218,7 +349,7 @@ class BindingContext(InstanceContext):
 
         # Path Solution
         self._solution = {'chat_service_sid': chat_service_sid, 'sid': sid, }
-        self._uri = '/Services/{chat_service_sid}/Bindings/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{chat_service_sid}/Bindings/{sid}', self._solution)
 
     def delete(self):
         """
@@ -229,6 +360,15 @@ class BindingContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the BindingInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def fetch(self):
         """
         Fetch the BindingInstance
@@ -245,6 +385,22 @@ class BindingContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the BindingInstance
+
+        :returns: The fetched BindingInstance
+        :rtype: twilio.rest.conversations.v1.service.binding.BindingInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return BindingInstance(
+            self._version,
+            payload,
+            chat_service_sid=self._solution['chat_service_sid'],
+            sid=self._solution['sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -263,6 +419,29 @@ class BindingInstance(InstanceResource):
         GCM = "gcm"
         FCM = "fcm"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'chat_service_sid': 'chat_service_sid',
+        'credential_sid': 'credential_sid',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'endpoint': 'endpoint',
+        'identity': 'identity',
+        'binding_type': 'binding_type',
+        'message_types': 'message_types',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload, chat_service_sid, sid=None):
         """
         Initialize the BindingInstance
@@ -273,19 +452,7 @@ class BindingInstance(InstanceResource):
         super(BindingInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'chat_service_sid': payload.get('chat_service_sid'),
-            'credential_sid': payload.get('credential_sid'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'endpoint': payload.get('endpoint'),
-            'identity': payload.get('identity'),
-            'binding_type': payload.get('binding_type'),
-            'message_types': payload.get('message_types'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -405,6 +572,15 @@ class BindingInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the BindingInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def fetch(self):
         """
         Fetch the BindingInstance
@@ -414,6 +590,15 @@ class BindingInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the BindingInstance
+
+        :returns: The fetched BindingInstance
+        :rtype: twilio.rest.conversations.v1.service.binding.BindingInstance
+        """
+        return await self._proxy.fetch_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -6,13 +6,14 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.conversations.v1.service.configuration.notification import NotificationList
-from twilio.rest.conversations.v1.service.configuration.webhook import WebhookList
 
 
 class ConfigurationList(ListResource):
@@ -45,6 +46,7 @@ class ConfigurationList(ListResource):
         :rtype: twilio.rest.conversations.v1.service.configuration.notification.NotificationList
         """
         if self._notifications is None:
+            from twilio.rest.conversations.v1.service.configuration.notification import NotificationList
             self._notifications = NotificationList(
                 self._version,
                 chat_service_sid=self._solution['chat_service_sid'],
@@ -60,6 +62,7 @@ class ConfigurationList(ListResource):
         :rtype: twilio.rest.conversations.v1.service.configuration.webhook.WebhookList
         """
         if self._webhooks is None:
+            from twilio.rest.conversations.v1.service.configuration.webhook import WebhookList
             self._webhooks = WebhookList(self._version, chat_service_sid=self._solution['chat_service_sid'], )
         return self._webhooks
 
@@ -150,7 +153,7 @@ class ConfigurationContext(InstanceContext):
 
         # Path Solution
         self._solution = {'chat_service_sid': chat_service_sid, }
-        self._uri = '/Services/{chat_service_sid}/Configuration'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{chat_service_sid}/Configuration', self._solution)
 
     def fetch(self):
         """
@@ -167,6 +170,21 @@ class ConfigurationContext(InstanceContext):
             chat_service_sid=self._solution['chat_service_sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ConfigurationInstance
+
+        :returns: The fetched ConfigurationInstance
+        :rtype: twilio.rest.conversations.v1.service.configuration.ConfigurationInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return ConfigurationInstance(
+            self._version,
+            payload,
+            chat_service_sid=self._solution['chat_service_sid'],
+        )
+
     def update(self, default_conversation_creator_role_sid=values.unset,
                default_conversation_role_sid=values.unset,
                default_chat_service_role_sid=values.unset,
@@ -197,6 +215,36 @@ class ConfigurationContext(InstanceContext):
             chat_service_sid=self._solution['chat_service_sid'],
         )
 
+    async def update_async(self, default_conversation_creator_role_sid=values.unset,
+                           default_conversation_role_sid=values.unset,
+                           default_chat_service_role_sid=values.unset,
+                           reachability_enabled=values.unset):
+        """
+        Asynchronous coroutine that updates the ConfigurationInstance
+
+        :param unicode default_conversation_creator_role_sid: The role assigned to a conversation creator when they join a new conversation
+        :param unicode default_conversation_role_sid: The role assigned to users when they are added to a conversation
+        :param unicode default_chat_service_role_sid: The service role assigned to users when they are added to the service
+        :param bool reachability_enabled: Whether the Reachability Indicator feature is enabled for this Conversations Service
+
+        :returns: The updated ConfigurationInstance
+        :rtype: twilio.rest.conversations.v1.service.configuration.ConfigurationInstance
+        """
+        data = values.of({
+            'DefaultConversationCreatorRoleSid': default_conversation_creator_role_sid,
+            'DefaultConversationRoleSid': default_conversation_role_sid,
+            'DefaultChatServiceRoleSid': default_chat_service_role_sid,
+            'ReachabilityEnabled': reachability_enabled,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return ConfigurationInstance(
+            self._version,
+            payload,
+            chat_service_sid=self._solution['chat_service_sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -210,6 +258,19 @@ class ConfigurationContext(InstanceContext):
 
 class ConfigurationInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'chat_service_sid': 'chat_service_sid',
+        'default_conversation_creator_role_sid': 'default_conversation_creator_role_sid',
+        'default_conversation_role_sid': 'default_conversation_role_sid',
+        'default_chat_service_role_sid': 'default_chat_service_role_sid',
+        'url': 'url',
+        'links': 'links',
+        'reachability_enabled': 'reachability_enabled',
+    })
+
     def __init__(self, version, payload, chat_service_sid):
         """
         Initialize the ConfigurationInstance
@@ -220,15 +281,7 @@ class ConfigurationInstance(InstanceResource):
         super(ConfigurationInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'chat_service_sid': payload.get('chat_service_sid'),
-            'default_conversation_creator_role_sid': payload.get('default_conversation_creator_role_sid'),
-            'default_conversation_role_sid': payload.get('default_conversation_role_sid'),
-            'default_chat_service_role_sid': payload.get('default_chat_service_role_sid'),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-            'reachability_enabled': payload.get('reachability_enabled'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -315,6 +368,15 @@ class ConfigurationInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ConfigurationInstance
+
+        :returns: The fetched ConfigurationInstance
+        :rtype: twilio.rest.conversations.v1.service.configuration.ConfigurationInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, default_conversation_creator_role_sid=values.unset,
                default_conversation_role_sid=values.unset,
                default_chat_service_role_sid=values.unset,
@@ -337,6 +399,28 @@ class ConfigurationInstance(InstanceResource):
             reachability_enabled=reachability_enabled,
         )
 
+    async def update_async(self, default_conversation_creator_role_sid=values.unset,
+                           default_conversation_role_sid=values.unset,
+                           default_chat_service_role_sid=values.unset,
+                           reachability_enabled=values.unset):
+        """
+        Asynchronous coroutine that updates the ConfigurationInstance
+
+        :param unicode default_conversation_creator_role_sid: The role assigned to a conversation creator when they join a new conversation
+        :param unicode default_conversation_role_sid: The role assigned to users when they are added to a conversation
+        :param unicode default_chat_service_role_sid: The service role assigned to users when they are added to the service
+        :param bool reachability_enabled: Whether the Reachability Indicator feature is enabled for this Conversations Service
+
+        :returns: The updated ConfigurationInstance
+        :rtype: twilio.rest.conversations.v1.service.configuration.ConfigurationInstance
+        """
+        return await self._proxy.update_async(
+            default_conversation_creator_role_sid=default_conversation_creator_role_sid,
+            default_conversation_role_sid=default_conversation_role_sid,
+            default_chat_service_role_sid=default_chat_service_role_sid,
+            reachability_enabled=reachability_enabled,
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -346,3 +430,20 @@ class ConfigurationInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Conversations.V1.ConfigurationInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'NotificationList': 'twilio.rest.conversations.v1.service.configuration.notification',
+    'WebhookList': 'twilio.rest.conversations.v1.service.configuration.webhook',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -6,6 +6,7 @@ This code was generated by
       /       /
 """
 
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
@@ -117,7 +118,7 @@ class NotificationContext(InstanceContext):
 
         # Path Solution
         self._solution = {'chat_service_sid': chat_service_sid, }
-        self._uri = '/Services/{chat_service_sid}/Configuration/Notifications'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{chat_service_sid}/Configuration/Notifications', self._solution)
 
     def update(self, log_enabled=values.unset, new_message_enabled=values.unset,
                new_message_template=values.unset, new_message_sound=values.unset,
@@ -174,6 +175,61 @@ class NotificationContext(InstanceContext):
             chat_service_sid=self._solution['chat_service_sid'],
         )
 
+    async def update_async(self, log_enabled=values.unset, new_message_enabled=values.unset,
+                           new_message_template=values.unset, new_message_sound=values.unset,
+                           new_message_badge_count_enabled=values.unset,
+                           added_to_conversation_enabled=values.unset,
+                           added_to_conversation_template=values.unset,
+                           added_to_conversation_sound=values.unset,
+                           removed_from_conversation_enabled=values.unset,
+                           removed_from_conversation_template=values.unset,
+                           removed_from_conversation_sound=values.unset,
+                           new_message_with_media_enabled=values.unset,
+                           new_message_with_media_template=values.unset):
+        """
+        Asynchronous coroutine that updates the NotificationInstance
+
+        :param bool log_enabled: Weather the notification logging is enabled.
+        :param bool new_message_enabled: Whether to send a notification when a new message is added to a conversation.
+        :param unicode new_message_template: The template to use to create the notification text displayed when a new message is added to a conversation.
+        :param unicode new_message_sound: The name of the sound to play when a new message is added to a conversation.
+        :param bool new_message_badge_count_enabled: Whether the new message badge is enabled.
+        :param bool added_to_conversation_enabled: Whether to send a notification when a participant is added to a conversation.
+        :param unicode added_to_conversation_template: The template to use to create the notification text displayed when a participant is added to a conversation.
+        :param unicode added_to_conversation_sound: The name of the sound to play when a participant is added to a conversation.
+        :param bool removed_from_conversation_enabled: Whether to send a notification to a user when they are removed from a conversation.
+        :param unicode removed_from_conversation_template: The template to use to create the notification text displayed to a user when they are removed.
+        :param unicode removed_from_conversation_sound: The name of the sound to play to a user when they are removed from a conversation.
+        :param bool new_message_with_media_enabled: Whether to send a notification when a new message with media/file attachments is added to a conversation.
+        :param unicode new_message_with_media_template: The template to use to create the notification text displayed when a new message with media/file attachments is added to a conversation.
+
+        :returns: The updated NotificationInstance
+        :rtype: twilio.rest.conversations.v1.service.configuration.notification.NotificationInstance
+        """
+        data = values.of({
+            'LogEnabled': log_enabled,
+            'NewMessage.Enabled': new_message_enabled,
+            'NewMessage.Template': new_message_template,
+            'NewMessage.Sound': new_message_sound,
+            'NewMessage.BadgeCountEnabled': new_message_badge_count_enabled,
+            'AddedToConversation.Enabled': added_to_conversation_enabled,
+            'AddedToConversation.Template': added_to_conversation_template,
+            'AddedToConversation.Sound': added_to_conversation_sound,
+            'RemovedFromConversation.Enabled': removed_from_conversation_enabled,
+            'RemovedFromConversation.Template': removed_from_conversation_template,
+            'RemovedFromConversation.Sound': removed_from_conversation_sound,
+            'NewMessage.WithMedia.Enabled': new_message_with_media_enabled,
+            'NewMessage.WithMedia.Template': new_message_with_media_template,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return NotificationInstance(
+            self._version,
+            payload,
+            chat_service_sid=self._solution['chat_service_sid'],
+        )
+
     def fetch(self):
         """
         Fetch the NotificationInstance
@@ -189,6 +245,21 @@ class NotificationContext(InstanceContext):
             chat_service_sid=self._solution['chat_service_sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the NotificationInstance
+
+        :returns: The fetched NotificationInstance
+        :rtype: twilio.rest.conversations.v1.service.configuration.notification.NotificationInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return NotificationInstance(
+            self._version,
+            payload,
+            chat_service_sid=self._solution['chat_service_sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -202,6 +273,19 @@ class NotificationContext(InstanceContext):
 
 class NotificationInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'chat_service_sid': 'chat_service_sid',
+        'new_message': 'new_message',
+        'added_to_conversation': 'added_to_conversation',
+        'removed_from_conversation': 'removed_from_conversation',
+        'log_enabled': 'log_enabled',
+        'url': 'url',
+    })
+
     def __init__(self, version, payload, chat_service_sid):
         """
         Initialize the NotificationInstance
@@ -212,15 +296,7 @@ class NotificationInstance(InstanceResource):
         super(NotificationInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'chat_service_sid': payload.get('chat_service_sid'),
-            'new_message': payload.get('new_message'),
-            'added_to_conversation': payload.get('added_to_conversation'),
-            'removed_from_conversation': payload.get('removed_from_conversation'),
-            'log_enabled': payload.get('log_enabled'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -345,6 +421,53 @@ class NotificationInstance(InstanceResource):
             new_message_with_media_template=new_message_with_media_template,
         )
 
+    async def update_async(self, log_enabled=values.unset, new_message_enabled=values.unset,
+                           new_message_template=values.unset, new_message_sound=values.unset,
+                           new_message_badge_count_enabled=values.unset,
+                           added_to_conversation_enabled=values.unset,
+                           added_to_conversation_template=values.unset,
+                           added_to_conversation_sound=values.unset,
+                           removed_from_conversation_enabled=values.unset,
+                           removed_from_conversation_template=values.unset,
+                           removed_from_conversation_sound=values.unset,
+                           new_message_with_media_enabled=values.unset,
+                           new_message_with_media_template=values.unset):
+        """
+        Asynchronous coroutine that updates the NotificationInstance
+
+        :param bool log_enabled: Weather the notification logging is enabled.
+        :param bool new_message_enabled: Whether to send a notification when a new message is added to a conversation.
+        :param unicode new_message_template: The template to use to create the notification text displayed when a new message is added to a conversation.
+        :param unicode new_message_sound: The name of the sound to play when a new message is added to a conversation.
+        :param bool new_message_badge_count_enabled: Whether the new message badge is enabled.
+        :param bool added_to_conversation_enabled: Whether to send a notification when a participant is added to a conversation.
+        :param unicode added_to_conversation_template: The template to use to create the notification text displayed when a participant is added to a conversation.
+        :param unicode added_to_conversation_sound: The name of the sound to play when a participant is added to a conversation.
+        :param bool removed_from_conversation_enabled: Whether to send a notification to a user when they are removed from a conversation.
+        :param unicode removed_from_conversation_template: The template to use to create the notification text displayed to a user when they are removed.
+        :param unicode removed_from_conversation_sound: The name of the sound to play to a user when they are removed from a conversation.
+        :param bool new_message_with_media_enabled: Whether to send a notification when a new message with media/file attachments is added to a conversation.
+        :param unicode new_message_with_media_template: The template to use to create the notification text displayed when a new message with media/file attachments is added to a conversation.
+
+        :returns: The updated NotificationInstance
+        :rtype: twilio.rest.conversations.v1.service.configuration.notification.NotificationInstance
+        """
+        return await self._proxy.update_async(
+            log_enabled=log_enabled,
+            new_message_enabled=new_message_enabled,
+            new_message_template=new_message_template,
+            new_message_sound=new_message_sound,
+            new_message_badge_count_enabled=new_message_badge_count_enabled,
+            added_to_conversation_enabled=added_to_conversation_enabled,
+            added_to_conversation_template=added_to_conversation_template,
+            added_to_conversation_sound=added_to_conversation_sound,
+            removed_from_conversation_enabled=removed_from_conversation_enabled,
+            removed_from_conversation_template=removed_from_conversation_template,
+            removed_from_conversation_sound=removed_from_conversation_sound,
+            new_message_with_media_enabled=new_message_with_media_enabled,
+            new_message_with_media_template=new_message_with_media_template,
+        )
+
     def fetch(self):
         """
         Fetch the NotificationInstance
@@ -354,6 +477,15 @@ class NotificationInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the NotificationInstance
+
+        :returns: The fetched NotificationInstance
+        :rtype: twilio.rest.conversations.v1.service.configuration.notification.NotificationInstance
+        """
+        return await self._proxy.fetch_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -7,6 +7,7 @@ This code was generated by
 """
 
 from twilio.base import serialize
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
@@ -114,7 +115,7 @@ class WebhookContext(InstanceContext):
 
         # Path Solution
         self._solution = {'chat_service_sid': chat_service_sid, }
-        self._uri = '/Services/{chat_service_sid}/Configuration/Webhooks'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{chat_service_sid}/Configuration/Webhooks', self._solution)
 
     def update(self, pre_webhook_url=values.unset, post_webhook_url=values.unset,
                filters=values.unset, method=values.unset):
@@ -140,6 +141,30 @@ class WebhookContext(InstanceContext):
 
         return WebhookInstance(self._version, payload, chat_service_sid=self._solution['chat_service_sid'], )
 
+    async def update_async(self, pre_webhook_url=values.unset, post_webhook_url=values.unset,
+                           filters=values.unset, method=values.unset):
+        """
+        Asynchronous coroutine that updates the WebhookInstance
+
+        :param unicode pre_webhook_url: The absolute url the pre-event webhook request should be sent to.
+        :param unicode post_webhook_url: The absolute url the post-event webhook request should be sent to.
+        :param list[unicode] filters: The list of events that your configured webhook targets will receive. Events not configured here will not fire.
+        :param unicode method: The HTTP method to be used when sending a webhook request
+
+        :returns: The updated WebhookInstance
+        :rtype: twilio.rest.conversations.v1.service.configuration.webhook.WebhookInstance
+        """
+        data = values.of({
+            'PreWebhookUrl': pre_webhook_url,
+            'PostWebhookUrl': post_webhook_url,
+            'Filters': serialize.map(filters, lambda e: e),
+            'Method': method,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return WebhookInstance(self._version, payload, chat_service_sid=self._solution['chat_service_sid'], )
+
     def fetch(self):
         """
         Fetch the WebhookInstance
@@ -151,6 +176,17 @@ class WebhookContext(InstanceContext):
 
         return WebhookInstance(self._version, payload, chat_service_sid=self._solution['chat_service_sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the WebhookInstance
+
+        :returns: The fetched WebhookInstance
+        :rtype: twilio.rest.conversations.v1.service.configuration.webhook.WebhookInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return WebhookInstance(self._version, payload, chat_service_sid=self._solution['chat_service_sid'], )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -168,6 +204,19 @@ class WebhookInstance(InstanceResource):
         GET = "GET"
         POST = "POST"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'chat_service_sid': 'chat_service_sid',
+        'pre_webhook_url': 'pre_webhook_url',
+        'post_webhook_url': 'post_webhook_url',
+        'filters': 'filters',
+        'method': 'method',
+        'url': 'url',
+    })
+
     def __init__(self, version, payload, chat_service_sid):
         """
         Initialize the WebhookInstance
@@ -178,15 +227,7 @@ class WebhookInstance(InstanceResource):
         super(WebhookInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'chat_service_sid': payload.get('chat_service_sid'),
-            'pre_webhook_url': payload.get('pre_webhook_url'),
-            'post_webhook_url': payload.get('post_webhook_url'),
-            'filters': payload.get('filters'),
-            'method': payload.get('method'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -281,6 +322,26 @@ class WebhookInstance(InstanceResource):
             method=method,
         )
 
+    async def update_async(self, pre_webhook_url=values.unset, post_webhook_url=values.unset,
+                           filters=values.unset, method=values.unset):
+        """
+        Asynchronous coroutine that updates the WebhookInstance
+
+        :param unicode pre_webhook_url: The absolute url the pre-event webhook request should be sent to.
+        :param unicode post_webhook_url: The absolute url the post-event webhook request should be sent to.
+        :param list[unicode] filters: The list of events that your configured webhook targets will receive. Events not configured here will not fire.
+        :param unicode method: The HTTP method to be used when sending a webhook request
+
+        :returns: The updated WebhookInstance
+        :rtype: twilio.rest.conversations.v1.service.configuration.webhook.WebhookInstance
+        """
+        return await self._proxy.update_async(
+            pre_webhook_url=pre_webhook_url,
+            post_webhook_url=post_webhook_url,
+            filters=filters,
+            method=method,
+        )
+
     def fetch(self):
         """
         Fetch the WebhookInstance
@@ -290,6 +351,15 @@ class WebhookInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the WebhookInstance
+
+        :returns: The fetched WebhookInstance
+        :rtype: twilio.rest.conversations.v1.service.configuration.webhook.WebhookInstance
+        """
+        return await self._proxy.fetch_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -6,6 +6,8 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import serialize
 from twilio.base import values
@@ -13,7 +15,6 @@ from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.conversations.v1.service.conversation.message.delivery_receipt import DeliveryReceiptList
 
 
 class MessageList(ListResource):
@@ -33,12 +34,12 @@ class MessageList(ListResource):
 
         # Path Solution
         self._solution = {'chat_service_sid': chat_service_sid, 'conversation_sid': conversation_sid, }
-        self._uri = '/Services/{chat_service_sid}/Conversations/{conversation_sid}/Messages'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{chat_service_sid}/Conversations/{conversation_sid}/Messages', self._solution)
 
     def create(self, author=values.unset, body=values.unset,
                date_created=values.unset, date_updated=values.unset,
                attributes=values.unset, media_sid=values.unset,
-               x_twilio_webhook_enabled=values.unset):
+               x_twilio_webhook_enabled=values.unset, deadline=None):
         """
         Create the MessageInstance
 
@@ -49,6 +50,8 @@ class MessageList(ListResource):
         :param unicode attributes: A string metadata field you can use to store any data you wish.
         :param unicode media_sid: The Media SID to be attached to the new Message.
         :param MessageInstance.WebhookEnabledType x_twilio_webhook_enabled: The X-Twilio-Webhook-Enabled HTTP request header
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created MessageInstance
         :rtype: twilio.rest.conversations.v1.service.conversation.message.MessageInstance
@@ -63,7 +66,7 @@ class MessageList(ListResource):
         })
         headers = values.of({'X-Twilio-Webhook-Enabled': x_twilio_webhook_enabled, })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, headers=headers, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, headers=headers, deadline=deadline, )
 
         return MessageInstance(
             self._version,
@@ -72,7 +75,47 @@ class MessageList(ListResource):
             conversation_sid=self._solution['conversation_sid'],
         )
 
-    def stream(self, order=values.unset, limit=None, page_size=None):
+    async def create_async(self, author=values.unset, body=values.unset,
+                           date_created=values.unset, date_updated=values.unset,
+                           attributes=values.unset, media_sid=values.unset,
+                           x_twilio_webhook_enabled=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the MessageInstance
+
+        :param unicode author: The channel specific identifier of the message's author.
+        :param unicode body: The content of the message.
+        :param datetime date_created: The date that this resource was created.
+        :param datetime date_updated: The date that this resource was last updated.
+        :param unicode attributes: A string metadata field you can use to store any data you wish.
+        :param unicode media_sid: The Media SID to be attached to the new Message.
+        :param MessageInstance.WebhookEnabledType x_twilio_webhook_enabled: The X-Twilio-Webhook-Enabled HTTP request header
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created MessageInstance
+        :rtype: twilio.rest.conversations.v1.service.conversation.message.MessageInstance
+        """
+        data = values.of({
+            'Author': author,
+            'Body': body,
+            'DateCreated': serialize.iso8601_datetime(date_created),
+            'DateUpdated': serialize.iso8601_datetime(date_updated),
+            'Attributes': attributes,
+            'MediaSid': media_sid,
+        })
+        headers = values.of({'X-Twilio-Webhook-Enabled': x_twilio_webhook_enabled, })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, headers=headers, deadline=deadline, )
+
+        return MessageInstance(
+            self._version,
+            payload,
+            chat_service_sid=self._solution['chat_service_sid'],
+            conversation_sid=self._solution['conversation_sid'],
+        )
+
+    def stream(self, order=values.unset, limit=None, page_size=None,
+               prefetch=None, raw=False, deadline=None):
         """
         Streams MessageInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -86,17 +129,59 @@ class MessageList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.conversations.v1.service.conversation.message.MessageInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(order=order, page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(order=order, page_size=limits['page_size'], )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, order=values.unset, limit=None, page_size=None,
+                           prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams MessageInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param MessageInstance.OrderType order: The sort order of the returned messages
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.conversations.v1.service.conversation.message.MessageInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(order=order, page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, order=values.unset, limit=None, page_size=None):
+    def list(self, order=values.unset, limit=None, page_size=None,
+             prefetch=None, raw=False, deadline=None):
         """
         Lists MessageInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -109,11 +194,43 @@ class MessageList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.conversations.v1.service.conversation.message.MessageInstance]
         """
-        return list(self.stream(order=order, limit=limit, page_size=page_size, ))
+        return list(self.stream(order=order, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, order=values.unset, limit=None, page_size=None,
+                         prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists MessageInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param MessageInstance.OrderType order: The sort order of the returned messages
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.conversations.v1.service.conversation.message.MessageInstance]
+        """
+        return [record async for record in await self.stream_async(order=order, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, order=values.unset, page_token=values.unset,
              page_number=values.unset, page_size=values.unset):
@@ -140,6 +257,31 @@ class MessageList(ListResource):
 
         return MessagePage(self._version, response, self._solution)
 
+    async def page_async(self, order=values.unset, page_token=values.unset,
+                         page_number=values.unset, page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of MessageInstance records from the API.
+        Request is executed immediately
+
+        :param MessageInstance.OrderType order: The sort order of the returned messages
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of MessageInstance
+        :rtype: twilio.rest.conversations.v1.service.conversation.message.MessagePage
+        """
+        data = values.of({
+            'Order': order,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return MessagePage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of MessageInstance records from the API.
@@ -157,6 +299,23 @@ class MessageList(ListResource):
 
         return MessagePage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of MessageInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of MessageInstance
+        :rtype: twilio.rest.conversations.v1.service.conversation.message.MessagePage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return MessagePage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a MessageContext
@@ -266,7 +425,7 @@ class MessageContext(InstanceContext):
             'conversation_sid': conversation_sid,
             'sid': sid,
         }
-        self._uri = '/Services/{chat_service_sid}/Conversations/{conversation_sid}/Messages/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{chat_service_sid}/Conversations/{conversation_sid}/Messages/{sid}', self._solution)
 
         # Dependents
         self._delivery_receipts = None
@@ -306,6 +465,41 @@ class MessageContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, author=values.unset, body=values.unset,
+                           date_created=values.unset, date_updated=values.unset,
+                           attributes=values.unset, x_twilio_webhook_enabled=values.unset):
+        """
+        Asynchronous coroutine that updates the MessageInstance
+
+        :param unicode author: The channel specific identifier of the message's author.
+        :param unicode body: The content of the message.
+        :param datetime date_created: The date that this resource was created.
+        :param datetime date_updated: The date that this resource was last updated.
+        :param unicode attributes: A string metadata field you can use to store any data you wish.
+        :param MessageInstance.WebhookEnabledType x_twilio_webhook_enabled: The X-Twilio-Webhook-Enabled HTTP request header
+
+        :returns: The updated MessageInstance
+        :rtype: twilio.rest.conversations.v1.service.conversation.message.MessageInstance
+        """
+        data = values.of({
+            'Author': author,
+            'Body': body,
+            'DateCreated': serialize.iso8601_datetime(date_created),
+            'DateUpdated': serialize.iso8601_datetime(date_updated),
+            'Attributes': attributes,
+        })
+        headers = values.of({'X-Twilio-Webhook-Enabled': x_twilio_webhook_enabled, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, headers=headers, )
+
+        return MessageInstance(
+            self._version,
+            payload,
+            chat_service_sid=self._solution['chat_service_sid'],
+            conversation_sid=self._solution['conversation_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self, x_twilio_webhook_enabled=values.unset):
         """
         Deletes the MessageInstance
@@ -319,6 +513,19 @@ class MessageContext(InstanceContext):
 
         return self._version.delete(method='DELETE', uri=self._uri, headers=headers, )
 
+    async def delete_async(self, x_twilio_webhook_enabled=values.unset):
+        """
+        Asynchronous coroutine that deletes the MessageInstance
+
+        :param MessageInstance.WebhookEnabledType x_twilio_webhook_enabled: The X-Twilio-Webhook-Enabled HTTP request header
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        headers = values.of({'X-Twilio-Webhook-Enabled': x_twilio_webhook_enabled, })
+
+        return await self._version.delete_async(method='DELETE', uri=self._uri, headers=headers, )
+
     def fetch(self):
         """
         Fetch the MessageInstance
@@ -336,6 +543,23 @@ class MessageContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the MessageInstance
+
+        :returns: The fetched MessageInstance
+        :rtype: twilio.rest.conversations.v1.service.conversation.message.MessageInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return MessageInstance(
+            self._version,
+            payload,
+            chat_service_sid=self._solution['chat_service_sid'],
+            conversation_sid=self._solution['conversation_sid'],
+            sid=self._solution['sid'],
+        )
+
     @property
     def delivery_receipts(self):
         """
@@ -345,6 +569,7 @@ class MessageContext(InstanceContext):
         :rtype: twilio.rest.conversations.v1.service.conversation.message.delivery_receipt.DeliveryReceiptList
         """
         if self._delivery_receipts is None:
+            from twilio.rest.conversations.v1.service.conversation.message.delivery_receipt import DeliveryReceiptList
             self._delivery_receipts = DeliveryReceiptList(
                 self._version,
                 chat_service_sid=self._solution['chat_service_sid'],
@@ -374,6 +599,34 @@ class MessageInstance(InstanceResource):
         TRUE = "true"
         FALSE = "false"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'index': deserialize.integer,
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'chat_service_sid': 'chat_service_sid',
+        'conversation_sid': 'conversation_sid',
+        'sid': 'sid',
+        'index': 'index',
+        'author': 'author',
+        'body': 'body',
+        'media': 'media',
+        'attributes': 'attributes',
+        'participant_sid': 'participant_sid',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'delivery': 'delivery',
+        'url': 'url',
+        'links': 'links',
+    }, _deserializers)
+
     def __init__(self, version, payload, chat_service_sid, conversation_sid,
                  sid=None):
         """
@@ -385,23 +638,7 @@ class MessageInstance(InstanceResource):
         super(MessageInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'chat_service_sid': payload.get('chat_service_sid'),
-            'conversation_sid': payload.get('conversation_sid'),
-            'sid': payload.get('sid'),
-            'index': deserialize.integer(payload.get('index')),
-            'author': payload.get('author'),
-            'body': payload.get('body'),
-            'media': payload.get('media'),
-            'attributes': payload.get('attributes'),
-            'participant_sid': payload.get('participant_sid'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'delivery': payload.get('delivery'),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -574,6 +811,31 @@ class MessageInstance(InstanceResource):
             x_twilio_webhook_enabled=x_twilio_webhook_enabled,
         )
 
+    async def update_async(self, author=values.unset, body=values.unset,
+                           date_created=values.unset, date_updated=values.unset,
+                           attributes=values.unset, x_twilio_webhook_enabled=values.unset):
+        """
+        Asynchronous coroutine that updates the MessageInstance
+
+        :param unicode author: The channel specific identifier of the message's author.
+        :param unicode body: The content of the message.
+        :param datetime date_created: The date that this resource was created.
+        :param datetime date_updated: The date that this resource was last updated.
+        :param unicode attributes: A string metadata field you can use to store any data you wish.
+        :param MessageInstance.WebhookEnabledType x_twilio_webhook_enabled: The X-Twilio-Webhook-Enabled HTTP request header
+
+        :returns: The updated MessageInstance
+        :rtype: twilio.rest.conversations.v1.service.conversation.message.MessageInstance
+        """
+        return await self._proxy.update_async(
+            author=author,
+            body=body,
+            date_created=date_created,
+            date_updated=date_updated,
+            attributes=attributes,
+            x_twilio_webhook_enabled=x_twilio_webhook_enabled,
+        )
+
     def delete(self, x_twilio_webhook_enabled=values.unset):
         """
         Deletes the MessageInstance
@@ -585,6 +847,17 @@ class MessageInstance(InstanceResource):
         """
         return self._proxy.delete(x_twilio_webhook_enabled=x_twilio_webhook_enabled, )
 
+    async def delete_async(self, x_twilio_webhook_enabled=values.unset):
+        """
+        Asynchronous coroutine that deletes the MessageInstance
+
+        :param MessageInstance.WebhookEnabledType x_twilio_webhook_enabled: The X-Twilio-Webhook-Enabled HTTP request header
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async(x_twilio_webhook_enabled=x_twilio_webhook_enabled, )
+
     def fetch(self):
         """
         Fetch the MessageInstance
@@ -594,6 +867,15 @@ class MessageInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the MessageInstance
+
+        :returns: The fetched MessageInstance
+        :rtype: twilio.rest.conversations.v1.service.conversation.message.MessageInstance
+        """
+        return await self._proxy.fetch_async()
+
     @property
     def delivery_receipts(self):
         """
@@ -613,3 +895,19 @@ class MessageInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Conversations.V1.MessageInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'DeliveryReceiptList': 'twilio.rest.conversations.v1.service.conversation.message.delivery_receipt',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
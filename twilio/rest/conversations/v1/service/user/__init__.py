@@ -6,13 +6,14 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.conversations.v1.service.user.user_conversation import UserConversationList
 
 
 class UserList(ListResource):
@@ -31,10 +32,10 @@ class UserList(ListResource):
 
         # Path Solution
         self._solution = {'chat_service_sid': chat_service_sid, }
-        self._uri = '/Services/{chat_service_sid}/Users'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{chat_service_sid}/Users', self._solution)
 
     def create(self, identity, friendly_name=values.unset, attributes=values.unset,
-               role_sid=values.unset, x_twilio_webhook_enabled=values.unset):
+               role_sid=values.unset, x_twilio_webhook_enabled=values.unset, deadline=None):
         """
         Create the UserInstance
 
@@ -43,6 +44,8 @@ class UserList(ListResource):
         :param unicode attributes: The JSON Object string that stores application-specific data
         :param unicode role_sid: The SID of a service-level Role to assign to the user
         :param UserInstance.WebhookEnabledType x_twilio_webhook_enabled: The X-Twilio-Webhook-Enabled HTTP request header
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created UserInstance
         :rtype: twilio.rest.conversations.v1.service.user.UserInstance
@@ -55,11 +58,40 @@ class UserList(ListResource):
         })
         headers = values.of({'X-Twilio-Webhook-Enabled': x_twilio_webhook_enabled, })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, headers=headers, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, headers=headers, deadline=deadline, )
 
         return UserInstance(self._version, payload, chat_service_sid=self._solution['chat_service_sid'], )
 
-    def stream(self, limit=None, page_size=None):
+    async def create_async(self, identity, friendly_name=values.unset, attributes=values.unset,
+                           role_sid=values.unset, x_twilio_webhook_enabled=values.unset,
+                           deadline=None):
+        """
+        Asynchronous coroutine that creates the UserInstance
+
+        :param unicode identity: The string that identifies the resource's User
+        :param unicode friendly_name: The string that you assigned to describe the resource
+        :param unicode attributes: The JSON Object string that stores application-specific data
+        :param unicode role_sid: The SID of a service-level Role to assign to the user
+        :param UserInstance.WebhookEnabledType x_twilio_webhook_enabled: The X-Twilio-Webhook-Enabled HTTP request header
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created UserInstance
+        :rtype: twilio.rest.conversations.v1.service.user.UserInstance
+        """
+        data = values.of({
+            'Identity': identity,
+            'FriendlyName': friendly_name,
+            'Attributes': attributes,
+            'RoleSid': role_sid,
+        })
+        headers = values.of({'X-Twilio-Webhook-Enabled': x_twilio_webhook_enabled, })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, headers=headers, deadline=deadline, )
+
+        return UserInstance(self._version, payload, chat_service_sid=self._solution['chat_service_sid'], )
+
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams UserInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -72,17 +104,57 @@ class UserList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.conversations.v1.service.user.UserInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams UserInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.conversations.v1.service.user.UserInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists UserInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -94,11 +166,42 @@ class UserList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.conversations.v1.service.user.UserInstance]
+        """
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists UserInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.conversations.v1.service.user.UserInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -119,6 +222,25 @@ class UserList(ListResource):
 
         return UserPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of UserInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of UserInstance
+        :rtype: twilio.rest.conversations.v1.service.user.UserPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return UserPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of UserInstance records from the API.
@@ -136,6 +258,23 @@ class UserList(ListResource):
 
         return UserPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of UserInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of UserInstance
+        :rtype: twilio.rest.conversations.v1.service.user.UserPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return UserPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a UserContext
@@ -224,7 +363,7 @@ class UserContext(InstanceContext):
 
         # Path Solution
         self._solution = {'chat_service_sid': chat_service_sid, 'sid': sid, }
-        self._uri = '/Services/{chat_service_sid}/Users/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{chat_service_sid}/Users/{sid}', self._solution)
 
         # Dependents
         self._user_conversations = None
@@ -254,6 +393,31 @@ class UserContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, friendly_name=values.unset, attributes=values.unset,
+                           role_sid=values.unset, x_twilio_webhook_enabled=values.unset):
+        """
+        Asynchronous coroutine that updates the UserInstance
+
+        :param unicode friendly_name: The string that you assigned to describe the resource
+        :param unicode attributes: The JSON Object string that stores application-specific data
+        :param unicode role_sid: The SID of a service-level Role to assign to the user
+        :param UserInstance.WebhookEnabledType x_twilio_webhook_enabled: The X-Twilio-Webhook-Enabled HTTP request header
+
+        :returns: The updated UserInstance
+        :rtype: twilio.rest.conversations.v1.service.user.UserInstance
+        """
+        data = values.of({'FriendlyName': friendly_name, 'Attributes': attributes, 'RoleSid': role_sid, })
+        headers = values.of({'X-Twilio-Webhook-Enabled': x_twilio_webhook_enabled, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, headers=headers, )
+
+        return UserInstance(
+            self._version,
+            payload,
+            chat_service_sid=self._solution['chat_service_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self, x_twilio_webhook_enabled=values.unset):
         """
         Deletes the UserInstance
@@ -267,6 +431,19 @@ class UserContext(InstanceContext):
 
         return self._version.delete(method='DELETE', uri=self._uri, headers=headers, )
 
+    async def delete_async(self, x_twilio_webhook_enabled=values.unset):
+        """
+        Asynchronous coroutine that deletes the UserInstance
+
+        :param UserInstance.WebhookEnabledType x_twilio_webhook_enabled: The X-Twilio-Webhook-Enabled HTTP request header
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        headers = values.of({'X-Twilio-Webhook-Enabled': x_twilio_webhook_enabled, })
+
+        return await self._version.delete_async(method='DELETE', uri=self._uri, headers=headers, )
+
     def fetch(self):
         """
         Fetch the UserInstance
@@ -283,6 +460,22 @@ class UserContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the UserInstance
+
+        :returns: The fetched UserInstance
+        :rtype: twilio.rest.conversations.v1.service.user.UserInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return UserInstance(
+            self._version,
+            payload,
+            chat_service_sid=self._solution['chat_service_sid'],
+            sid=self._solution['sid'],
+        )
+
     @property
     def user_conversations(self):
         """
@@ -292,6 +485,7 @@ class UserContext(InstanceContext):
         :rtype: twilio.rest.conversations.v1.service.user.user_conversation.UserConversationList
         """
         if self._user_conversations is None:
+            from twilio.rest.conversations.v1.service.user.user_conversation import UserConversationList
             self._user_conversations = UserConversationList(
                 self._version,
                 chat_service_sid=self._solution['chat_service_sid'],
@@ -316,6 +510,31 @@ class UserInstance(InstanceResource):
         TRUE = "true"
         FALSE = "false"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'chat_service_sid': 'chat_service_sid',
+        'role_sid': 'role_sid',
+        'identity': 'identity',
+        'friendly_name': 'friendly_name',
+        'attributes': 'attributes',
+        'is_online': 'is_online',
+        'is_notifiable': 'is_notifiable',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'url': 'url',
+        'links': 'links',
+    }, _deserializers)
+
     def __init__(self, version, payload, chat_service_sid, sid=None):
         """
         Initialize the UserInstance
@@ -326,21 +545,7 @@ class UserInstance(InstanceResource):
         super(UserInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'chat_service_sid': payload.get('chat_service_sid'),
-            'role_sid': payload.get('role_sid'),
-            'identity': payload.get('identity'),
-            'friendly_name': payload.get('friendly_name'),
-            'attributes': payload.get('attributes'),
-            'is_online': payload.get('is_online'),
-            'is_notifiable': payload.get('is_notifiable'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -487,6 +692,26 @@ class UserInstance(InstanceResource):
             x_twilio_webhook_enabled=x_twilio_webhook_enabled,
         )
 
+    async def update_async(self, friendly_name=values.unset, attributes=values.unset,
+                           role_sid=values.unset, x_twilio_webhook_enabled=values.unset):
+        """
+        Asynchronous coroutine that updates the UserInstance
+
+        :param unicode friendly_name: The string that you assigned to describe the resource
+        :param unicode attributes: The JSON Object string that stores application-specific data
+        :param unicode role_sid: The SID of a service-level Role to assign to the user
+        :param UserInstance.WebhookEnabledType x_twilio_webhook_enabled: The X-Twilio-Webhook-Enabled HTTP request header
+
+        :returns: The updated UserInstance
+        :rtype: twilio.rest.conversations.v1.service.user.UserInstance
+        """
+        return await self._proxy.update_async(
+            friendly_name=friendly_name,
+            attributes=attributes,
+            role_sid=role_sid,
+            x_twilio_webhook_enabled=x_twilio_webhook_enabled,
+        )
+
     def delete(self, x_twilio_webhook_enabled=values.unset):
         """
         Deletes the UserInstance
@@ -498,6 +723,17 @@ class UserInstance(InstanceResource):
         """
         return self._proxy.delete(x_twilio_webhook_enabled=x_twilio_webhook_enabled, )
 
+    async def delete_async(self, x_twilio_webhook_enabled=values.unset):
+        """
+        Asynchronous coroutine that deletes the UserInstance
+
+        :param UserInstance.WebhookEnabledType x_twilio_webhook_enabled: The X-Twilio-Webhook-Enabled HTTP request header
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async(x_twilio_webhook_enabled=x_twilio_webhook_enabled, )
+
     def fetch(self):
         """
         Fetch the UserInstance
@@ -507,6 +743,15 @@ class UserInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the UserInstance
+
+        :returns: The fetched UserInstance
+        :rtype: twilio.rest.conversations.v1.service.user.UserInstance
+        """
+        return await self._proxy.fetch_async()
+
     @property
     def user_conversations(self):
         """
@@ -526,3 +771,19 @@ class UserInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Conversations.V1.UserInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'UserConversationList': 'twilio.rest.conversations.v1.service.user.user_conversation',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
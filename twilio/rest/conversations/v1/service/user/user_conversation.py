@@ -32,9 +32,9 @@ class UserConversationList(ListResource):
 
         # Path Solution
         self._solution = {'chat_service_sid': chat_service_sid, 'user_sid': user_sid, }
-        self._uri = '/Services/{chat_service_sid}/Users/{user_sid}/Conversations'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{chat_service_sid}/Users/{user_sid}/Conversations', self._solution)
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams UserConversationInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -47,17 +47,57 @@ class UserConversationList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.conversations.v1.service.user.user_conversation.UserConversationInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams UserConversationInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.conversations.v1.service.user.user_conversation.UserConversationInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists UserConversationInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -69,11 +109,42 @@ class UserConversationList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.conversations.v1.service.user.user_conversation.UserConversationInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists UserConversationInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.conversations.v1.service.user.user_conversation.UserConversationInstance]
+        """
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -94,6 +165,25 @@ class UserConversationList(ListResource):
 
         return UserConversationPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of UserConversationInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of UserConversationInstance
+        :rtype: twilio.rest.conversations.v1.service.user.user_conversation.UserConversationPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return UserConversationPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of UserConversationInstance records from the API.
@@ -111,6 +201,23 @@ class UserConversationList(ListResource):
 
         return UserConversationPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of UserConversationInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of UserConversationInstance
+        :rtype: twilio.rest.conversations.v1.service.user.user_conversation.UserConversationPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return UserConversationPage(self._version, response, self._solution)
+
     def get(self, conversation_sid):
         """
         Constructs a UserConversationContext
@@ -220,7 +327,7 @@ class UserConversationContext(InstanceContext):
             'user_sid': user_sid,
             'conversation_sid': conversation_sid,
         }
-        self._uri = '/Services/{chat_service_sid}/Users/{user_sid}/Conversations/{conversation_sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{chat_service_sid}/Users/{user_sid}/Conversations/{conversation_sid}', self._solution)
 
     def update(self, notification_level=values.unset,
                last_read_timestamp=values.unset,
@@ -251,6 +358,35 @@ class UserConversationContext(InstanceContext):
             conversation_sid=self._solution['conversation_sid'],
         )
 
+    async def update_async(self, notification_level=values.unset,
+                           last_read_timestamp=values.unset,
+                           last_read_message_index=values.unset):
+        """
+        Asynchronous coroutine that updates the UserConversationInstance
+
+        :param UserConversationInstance.NotificationLevel notification_level: The Notification Level of this User Conversation.
+        :param datetime last_read_timestamp: The date of the last message read in conversation by the user.
+        :param unicode last_read_message_index: The index of the last read Message.
+
+        :returns: The updated UserConversationInstance
+        :rtype: twilio.rest.conversations.v1.service.user.user_conversation.UserConversationInstance
+        """
+        data = values.of({
+            'NotificationLevel': notification_level,
+            'LastReadTimestamp': serialize.iso8601_datetime(last_read_timestamp),
+            'LastReadMessageIndex': last_read_message_index,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return UserConversationInstance(
+            self._version,
+            payload,
+            chat_service_sid=self._solution['chat_service_sid'],
+            user_sid=self._solution['user_sid'],
+            conversation_sid=self._solution['conversation_sid'],
+        )
+
     def delete(self):
         """
         Deletes the UserConversationInstance
@@ -260,6 +396,15 @@ class UserConversationContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the UserConversationInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def fetch(self):
         """
         Fetch the UserConversationInstance
@@ -277,6 +422,23 @@ class UserConversationContext(InstanceContext):
             conversation_sid=self._solution['conversation_sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the UserConversationInstance
+
+        :returns: The fetched UserConversationInstance
+        :rtype: twilio.rest.conversations.v1.service.user.user_conversation.UserConversationInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return UserConversationInstance(
+            self._version,
+            payload,
+            chat_service_sid=self._solution['chat_service_sid'],
+            user_sid=self._solution['user_sid'],
+            conversation_sid=self._solution['conversation_sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -299,6 +461,38 @@ class UserConversationInstance(InstanceResource):
         ACTIVE = "active"
         CLOSED = "closed"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'unread_messages_count': deserialize.integer,
+        'last_read_message_index': deserialize.integer,
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'chat_service_sid': 'chat_service_sid',
+        'conversation_sid': 'conversation_sid',
+        'unread_messages_count': 'unread_messages_count',
+        'last_read_message_index': 'last_read_message_index',
+        'participant_sid': 'participant_sid',
+        'user_sid': 'user_sid',
+        'friendly_name': 'friendly_name',
+        'conversation_state': 'conversation_state',
+        'timers': 'timers',
+        'attributes': 'attributes',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'created_by': 'created_by',
+        'notification_level': 'notification_level',
+        'unique_name': 'unique_name',
+        'url': 'url',
+        'links': 'links',
+    }, _deserializers)
+
     def __init__(self, version, payload, chat_service_sid, user_sid,
                  conversation_sid=None):
         """
@@ -310,26 +504,7 @@ class UserConversationInstance(InstanceResource):
         super(UserConversationInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'chat_service_sid': payload.get('chat_service_sid'),
-            'conversation_sid': payload.get('conversation_sid'),
-            'unread_messages_count': deserialize.integer(payload.get('unread_messages_count')),
-            'last_read_message_index': deserialize.integer(payload.get('last_read_message_index')),
-            'participant_sid': payload.get('participant_sid'),
-            'user_sid': payload.get('user_sid'),
-            'friendly_name': payload.get('friendly_name'),
-            'conversation_state': payload.get('conversation_state'),
-            'timers': payload.get('timers'),
-            'attributes': payload.get('attributes'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'created_by': payload.get('created_by'),
-            'notification_level': payload.get('notification_level'),
-            'unique_name': payload.get('unique_name'),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -520,6 +695,25 @@ class UserConversationInstance(InstanceResource):
             last_read_message_index=last_read_message_index,
         )
 
+    async def update_async(self, notification_level=values.unset,
+                           last_read_timestamp=values.unset,
+                           last_read_message_index=values.unset):
+        """
+        Asynchronous coroutine that updates the UserConversationInstance
+
+        :param UserConversationInstance.NotificationLevel notification_level: The Notification Level of this User Conversation.
+        :param datetime last_read_timestamp: The date of the last message read in conversation by the user.
+        :param unicode last_read_message_index: The index of the last read Message.
+
+        :returns: The updated UserConversationInstance
+        :rtype: twilio.rest.conversations.v1.service.user.user_conversation.UserConversationInstance
+        """
+        return await self._proxy.update_async(
+            notification_level=notification_level,
+            last_read_timestamp=last_read_timestamp,
+            last_read_message_index=last_read_message_index,
+        )
+
     def delete(self):
         """
         Deletes the UserConversationInstance
@@ -529,6 +723,15 @@ class UserConversationInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the UserConversationInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def fetch(self):
         """
         Fetch the UserConversationInstance
@@ -538,6 +741,15 @@ class UserConversationInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the UserConversationInstance
+
+        :returns: The fetched UserConversationInstance
+        :rtype: twilio.rest.conversations.v1.service.user.user_conversation.UserConversationInstance
+        """
+        return await self._proxy.fetch_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
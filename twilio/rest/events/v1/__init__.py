@@ -6,11 +6,9 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base.version import Version
-from twilio.rest.events.v1.event_type import EventTypeList
-from twilio.rest.events.v1.schema import SchemaList
-from twilio.rest.events.v1.sink import SinkList
-from twilio.rest.events.v1.subscription import SubscriptionList
 
 
 class V1(Version):
@@ -35,6 +33,7 @@ class V1(Version):
         :rtype: twilio.rest.events.v1.event_type.EventTypeList
         """
         if self._event_types is None:
+            from twilio.rest.events.v1.event_type import EventTypeList
             self._event_types = EventTypeList(self)
         return self._event_types
 
@@ -44,6 +43,7 @@ class V1(Version):
         :rtype: twilio.rest.events.v1.schema.SchemaList
         """
         if self._schemas is None:
+            from twilio.rest.events.v1.schema import SchemaList
             self._schemas = SchemaList(self)
         return self._schemas
 
@@ -53,6 +53,7 @@ class V1(Version):
         :rtype: twilio.rest.events.v1.sink.SinkList
         """
         if self._sinks is None:
+            from twilio.rest.events.v1.sink import SinkList
             self._sinks = SinkList(self)
         return self._sinks
 
@@ -62,6 +63,7 @@ class V1(Version):
         :rtype: twilio.rest.events.v1.subscription.SubscriptionList
         """
         if self._subscriptions is None:
+            from twilio.rest.events.v1.subscription import SubscriptionList
             self._subscriptions = SubscriptionList(self)
         return self._subscriptions
 
@@ -73,3 +75,22 @@ class V1(Version):
         :rtype: str
         """
         return '<Twilio.Events.V1>'
+
+
+_LAZY_IMPORTS = {
+    'EventTypeList': 'twilio.rest.events.v1.event_type',
+    'SchemaList': 'twilio.rest.events.v1.schema',
+    'SinkList': 'twilio.rest.events.v1.sink',
+    'SubscriptionList': 'twilio.rest.events.v1.subscription',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -31,9 +31,10 @@ class EventTypeList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Types'.format(**self._solution)
+        self._uri = values.ResourceUri('/Types', self._solution)
 
-    def stream(self, schema_id=values.unset, limit=None, page_size=None):
+    def stream(self, schema_id=values.unset, limit=None, page_size=None,
+               prefetch=None, raw=False, deadline=None):
         """
         Streams EventTypeInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -47,17 +48,59 @@ class EventTypeList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.events.v1.event_type.EventTypeInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(schema_id=schema_id, page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(schema_id=schema_id, page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, schema_id=values.unset, limit=None, page_size=None):
+    async def stream_async(self, schema_id=values.unset, limit=None, page_size=None,
+                           prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams EventTypeInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param unicode schema_id: A string to filter Event Types by schema.
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.events.v1.event_type.EventTypeInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(schema_id=schema_id, page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, schema_id=values.unset, limit=None, page_size=None,
+             prefetch=None, raw=False, deadline=None):
         """
         Lists EventTypeInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -70,11 +113,43 @@ class EventTypeList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.events.v1.event_type.EventTypeInstance]
+        """
+        return list(self.stream(schema_id=schema_id, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, schema_id=values.unset, limit=None, page_size=None,
+                         prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists EventTypeInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param unicode schema_id: A string to filter Event Types by schema.
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.events.v1.event_type.EventTypeInstance]
         """
-        return list(self.stream(schema_id=schema_id, limit=limit, page_size=page_size, ))
+        return [record async for record in await self.stream_async(schema_id=schema_id, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, schema_id=values.unset, page_token=values.unset,
              page_number=values.unset, page_size=values.unset):
@@ -101,6 +176,31 @@ class EventTypeList(ListResource):
 
         return EventTypePage(self._version, response, self._solution)
 
+    async def page_async(self, schema_id=values.unset, page_token=values.unset,
+                         page_number=values.unset, page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of EventTypeInstance records from the API.
+        Request is executed immediately
+
+        :param unicode schema_id: A string to filter Event Types by schema.
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of EventTypeInstance
+        :rtype: twilio.rest.events.v1.event_type.EventTypePage
+        """
+        data = values.of({
+            'SchemaId': schema_id,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return EventTypePage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of EventTypeInstance records from the API.
@@ -118,6 +218,23 @@ class EventTypeList(ListResource):
 
         return EventTypePage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of EventTypeInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of EventTypeInstance
+        :rtype: twilio.rest.events.v1.event_type.EventTypePage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return EventTypePage(self._version, response, self._solution)
+
     def get(self, type):
         """
         Constructs a EventTypeContext
@@ -208,7 +325,7 @@ class EventTypeContext(InstanceContext):
 
         # Path Solution
         self._solution = {'type': type, }
-        self._uri = '/Types/{type}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Types/{type}', self._solution)
 
     def fetch(self):
         """
@@ -221,6 +338,17 @@ class EventTypeContext(InstanceContext):
 
         return EventTypeInstance(self._version, payload, type=self._solution['type'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the EventTypeInstance
+
+        :returns: The fetched EventTypeInstance
+        :rtype: twilio.rest.events.v1.event_type.EventTypeInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return EventTypeInstance(self._version, payload, type=self._solution['type'], )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -236,6 +364,25 @@ class EventTypeInstance(InstanceResource):
     """ PLEASE NOTE that this class contains beta products that are subject to
     change. Use them with caution. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'type': 'type',
+        'schema_id': 'schema_id',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'description': 'description',
+        'url': 'url',
+        'links': 'links',
+    }, _deserializers)
+
     def __init__(self, version, payload, type=None):
         """
         Initialize the EventTypeInstance
@@ -246,15 +393,7 @@ class EventTypeInstance(InstanceResource):
         super(EventTypeInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'type': payload.get('type'),
-            'schema_id': payload.get('schema_id'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'description': payload.get('description'),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -338,6 +477,15 @@ class EventTypeInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the EventTypeInstance
+
+        :returns: The fetched EventTypeInstance
+        :rtype: twilio.rest.events.v1.event_type.EventTypeInstance
+        """
+        return await self._proxy.fetch_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
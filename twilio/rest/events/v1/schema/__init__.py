@@ -6,13 +6,14 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.events.v1.schema.version import SchemaVersionList
 
 
 class SchemaList(ListResource):
@@ -123,7 +124,7 @@ class SchemaContext(InstanceContext):
 
         # Path Solution
         self._solution = {'id': id, }
-        self._uri = '/Schemas/{id}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Schemas/{id}', self._solution)
 
         # Dependents
         self._versions = None
@@ -139,6 +140,17 @@ class SchemaContext(InstanceContext):
 
         return SchemaInstance(self._version, payload, id=self._solution['id'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the SchemaInstance
+
+        :returns: The fetched SchemaInstance
+        :rtype: twilio.rest.events.v1.schema.SchemaInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return SchemaInstance(self._version, payload, id=self._solution['id'], )
+
     @property
     def versions(self):
         """
@@ -148,6 +160,7 @@ class SchemaContext(InstanceContext):
         :rtype: twilio.rest.events.v1.schema.version.SchemaVersionList
         """
         if self._versions is None:
+            from twilio.rest.events.v1.schema.version import SchemaVersionList
             self._versions = SchemaVersionList(self._version, id=self._solution['id'], )
         return self._versions
 
@@ -166,6 +179,23 @@ class SchemaInstance(InstanceResource):
     """ PLEASE NOTE that this class contains beta products that are subject to
     change. Use them with caution. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'latest_version_date_created': deserialize.iso8601_datetime,
+        'latest_version': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'id': 'id',
+        'url': 'url',
+        'links': 'links',
+        'latest_version_date_created': 'latest_version_date_created',
+        'latest_version': 'latest_version',
+    }, _deserializers)
+
     def __init__(self, version, payload, id=None):
         """
         Initialize the SchemaInstance
@@ -176,13 +206,7 @@ class SchemaInstance(InstanceResource):
         super(SchemaInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'id': payload.get('id'),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-            'latest_version_date_created': deserialize.iso8601_datetime(payload.get('latest_version_date_created')),
-            'latest_version': deserialize.integer(payload.get('latest_version')),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -250,6 +274,15 @@ class SchemaInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the SchemaInstance
+
+        :returns: The fetched SchemaInstance
+        :rtype: twilio.rest.events.v1.schema.SchemaInstance
+        """
+        return await self._proxy.fetch_async()
+
     @property
     def versions(self):
         """
@@ -269,3 +302,19 @@ class SchemaInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Events.V1.SchemaInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'SchemaVersionList': 'twilio.rest.events.v1.schema.version',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -32,9 +32,9 @@ class SchemaVersionList(ListResource):
 
         # Path Solution
         self._solution = {'id': id, }
-        self._uri = '/Schemas/{id}/Versions'.format(**self._solution)
+        self._uri = values.ResourceUri('/Schemas/{id}/Versions', self._solution)
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams SchemaVersionInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -47,17 +47,57 @@ class SchemaVersionList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.events.v1.schema.version.SchemaVersionInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams SchemaVersionInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.events.v1.schema.version.SchemaVersionInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists SchemaVersionInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -69,11 +109,42 @@ class SchemaVersionList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.events.v1.schema.version.SchemaVersionInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists SchemaVersionInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.events.v1.schema.version.SchemaVersionInstance]
+        """
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -94,6 +165,25 @@ class SchemaVersionList(ListResource):
 
         return SchemaVersionPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of SchemaVersionInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of SchemaVersionInstance
+        :rtype: twilio.rest.events.v1.schema.version.SchemaVersionPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return SchemaVersionPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of SchemaVersionInstance records from the API.
@@ -111,6 +201,23 @@ class SchemaVersionList(ListResource):
 
         return SchemaVersionPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of SchemaVersionInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of SchemaVersionInstance
+        :rtype: twilio.rest.events.v1.schema.version.SchemaVersionPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return SchemaVersionPage(self._version, response, self._solution)
+
     def get(self, schema_version):
         """
         Constructs a SchemaVersionContext
@@ -203,7 +310,7 @@ class SchemaVersionContext(InstanceContext):
 
         # Path Solution
         self._solution = {'id': id, 'schema_version': schema_version, }
-        self._uri = '/Schemas/{id}/Versions/{schema_version}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Schemas/{id}/Versions/{schema_version}', self._solution)
 
     def fetch(self):
         """
@@ -221,6 +328,22 @@ class SchemaVersionContext(InstanceContext):
             schema_version=self._solution['schema_version'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the SchemaVersionInstance
+
+        :returns: The fetched SchemaVersionInstance
+        :rtype: twilio.rest.events.v1.schema.version.SchemaVersionInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return SchemaVersionInstance(
+            self._version,
+            payload,
+            id=self._solution['id'],
+            schema_version=self._solution['schema_version'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -236,6 +359,23 @@ class SchemaVersionInstance(InstanceResource):
     """ PLEASE NOTE that this class contains beta products that are subject to
     change. Use them with caution. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'schema_version': deserialize.integer,
+        'date_created': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'id': 'id',
+        'schema_version': 'schema_version',
+        'date_created': 'date_created',
+        'url': 'url',
+        'raw': 'raw',
+    }, _deserializers)
+
     def __init__(self, version, payload, id, schema_version=None):
         """
         Initialize the SchemaVersionInstance
@@ -246,13 +386,7 @@ class SchemaVersionInstance(InstanceResource):
         super(SchemaVersionInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'id': payload.get('id'),
-            'schema_version': deserialize.integer(payload.get('schema_version')),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'url': payload.get('url'),
-            'raw': payload.get('raw'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -324,6 +458,15 @@ class SchemaVersionInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the SchemaVersionInstance
+
+        :returns: The fetched SchemaVersionInstance
+        :rtype: twilio.rest.events.v1.schema.version.SchemaVersionInstance
+        """
+        return await self._proxy.fetch_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
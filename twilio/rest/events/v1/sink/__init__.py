@@ -6,6 +6,8 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import serialize
 from twilio.base import values
@@ -13,8 +15,6 @@ from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.events.v1.sink.sink_test import SinkTestList
-from twilio.rest.events.v1.sink.sink_validate import SinkValidateList
 
 
 class SinkList(ListResource):
@@ -34,15 +34,40 @@ class SinkList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Sinks'.format(**self._solution)
+        self._uri = values.ResourceUri('/Sinks', self._solution)
 
-    def create(self, description, sink_configuration, sink_type):
+    def create(self, description, sink_configuration, sink_type, deadline=None):
         """
         Create the SinkInstance
 
         :param unicode description: Sink Description.
         :param dict sink_configuration: JSON Sink configuration.
         :param SinkInstance.SinkType sink_type: Sink type.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created SinkInstance
+        :rtype: twilio.rest.events.v1.sink.SinkInstance
+        """
+        data = values.of({
+            'Description': description,
+            'SinkConfiguration': serialize.object(sink_configuration),
+            'SinkType': sink_type,
+        })
+
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return SinkInstance(self._version, payload, )
+
+    async def create_async(self, description, sink_configuration, sink_type, deadline=None):
+        """
+        Asynchronous coroutine that creates the SinkInstance
+
+        :param unicode description: Sink Description.
+        :param dict sink_configuration: JSON Sink configuration.
+        :param SinkInstance.SinkType sink_type: Sink type.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created SinkInstance
         :rtype: twilio.rest.events.v1.sink.SinkInstance
@@ -53,12 +78,12 @@ class SinkList(ListResource):
             'SinkType': sink_type,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return SinkInstance(self._version, payload, )
 
     def stream(self, in_use=values.unset, status=values.unset, limit=None,
-               page_size=None):
+               page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams SinkInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -73,18 +98,60 @@ class SinkList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.events.v1.sink.SinkInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(in_use=in_use, status=status, page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(in_use=in_use, status=status, page_size=limits['page_size'], )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, in_use=values.unset, status=values.unset, limit=None,
+                           page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams SinkInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param bool in_use: A boolean to return sinks used/not used by a subscription.
+        :param unicode status: A string to filter sinks by status.
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.events.v1.sink.SinkInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
 
-        return self._version.stream(page, limits['limit'])
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(in_use=in_use, status=status, page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, in_use=values.unset, status=values.unset, limit=None,
-             page_size=None):
+             page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists SinkInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -98,11 +165,44 @@ class SinkList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.events.v1.sink.SinkInstance]
+        """
+        return list(self.stream(in_use=in_use, status=status, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, in_use=values.unset, status=values.unset, limit=None,
+                         page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists SinkInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param bool in_use: A boolean to return sinks used/not used by a subscription.
+        :param unicode status: A string to filter sinks by status.
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.events.v1.sink.SinkInstance]
         """
-        return list(self.stream(in_use=in_use, status=status, limit=limit, page_size=page_size, ))
+        return [record async for record in await self.stream_async(in_use=in_use, status=status, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, in_use=values.unset, status=values.unset,
              page_token=values.unset, page_number=values.unset,
@@ -132,6 +232,34 @@ class SinkList(ListResource):
 
         return SinkPage(self._version, response, self._solution)
 
+    async def page_async(self, in_use=values.unset, status=values.unset,
+                         page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of SinkInstance records from the API.
+        Request is executed immediately
+
+        :param bool in_use: A boolean to return sinks used/not used by a subscription.
+        :param unicode status: A string to filter sinks by status.
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of SinkInstance
+        :rtype: twilio.rest.events.v1.sink.SinkPage
+        """
+        data = values.of({
+            'InUse': in_use,
+            'Status': status,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return SinkPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of SinkInstance records from the API.
@@ -149,6 +277,23 @@ class SinkList(ListResource):
 
         return SinkPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of SinkInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of SinkInstance
+        :rtype: twilio.rest.events.v1.sink.SinkPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return SinkPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a SinkContext
@@ -239,7 +384,7 @@ class SinkContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/Sinks/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Sinks/{sid}', self._solution)
 
         # Dependents
         self._sink_test = None
@@ -256,6 +401,17 @@ class SinkContext(InstanceContext):
 
         return SinkInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the SinkInstance
+
+        :returns: The fetched SinkInstance
+        :rtype: twilio.rest.events.v1.sink.SinkInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return SinkInstance(self._version, payload, sid=self._solution['sid'], )
+
     def delete(self):
         """
         Deletes the SinkInstance
@@ -265,6 +421,15 @@ class SinkContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the SinkInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def update(self, description):
         """
         Update the SinkInstance
@@ -280,6 +445,21 @@ class SinkContext(InstanceContext):
 
         return SinkInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def update_async(self, description):
+        """
+        Asynchronous coroutine that updates the SinkInstance
+
+        :param unicode description: Sink Description
+
+        :returns: The updated SinkInstance
+        :rtype: twilio.rest.events.v1.sink.SinkInstance
+        """
+        data = values.of({'Description': description, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return SinkInstance(self._version, payload, sid=self._solution['sid'], )
+
     @property
     def sink_test(self):
         """
@@ -289,6 +469,7 @@ class SinkContext(InstanceContext):
         :rtype: twilio.rest.events.v1.sink.sink_test.SinkTestList
         """
         if self._sink_test is None:
+            from twilio.rest.events.v1.sink.sink_test import SinkTestList
             self._sink_test = SinkTestList(self._version, sid=self._solution['sid'], )
         return self._sink_test
 
@@ -301,6 +482,7 @@ class SinkContext(InstanceContext):
         :rtype: twilio.rest.events.v1.sink.sink_validate.SinkValidateList
         """
         if self._sink_validate is None:
+            from twilio.rest.events.v1.sink.sink_validate import SinkValidateList
             self._sink_validate = SinkValidateList(self._version, sid=self._solution['sid'], )
         return self._sink_validate
 
@@ -330,6 +512,27 @@ class SinkInstance(InstanceResource):
         WEBHOOK = "webhook"
         SEGMENT = "segment"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'description': 'description',
+        'sid': 'sid',
+        'sink_configuration': 'sink_configuration',
+        'sink_type': 'sink_type',
+        'status': 'status',
+        'url': 'url',
+        'links': 'links',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the SinkInstance
@@ -340,17 +543,7 @@ class SinkInstance(InstanceResource):
         super(SinkInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'description': payload.get('description'),
-            'sid': payload.get('sid'),
-            'sink_configuration': payload.get('sink_configuration'),
-            'sink_type': payload.get('sink_type'),
-            'status': payload.get('status'),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -450,6 +643,15 @@ class SinkInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the SinkInstance
+
+        :returns: The fetched SinkInstance
+        :rtype: twilio.rest.events.v1.sink.SinkInstance
+        """
+        return await self._proxy.fetch_async()
+
     def delete(self):
         """
         Deletes the SinkInstance
@@ -459,6 +661,15 @@ class SinkInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the SinkInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def update(self, description):
         """
         Update the SinkInstance
@@ -470,6 +681,17 @@ class SinkInstance(InstanceResource):
         """
         return self._proxy.update(description, )
 
+    async def update_async(self, description):
+        """
+        Asynchronous coroutine that updates the SinkInstance
+
+        :param unicode description: Sink Description
+
+        :returns: The updated SinkInstance
+        :rtype: twilio.rest.events.v1.sink.SinkInstance
+        """
+        return await self._proxy.update_async(description, )
+
     @property
     def sink_test(self):
         """
@@ -499,3 +721,20 @@ class SinkInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Events.V1.SinkInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'SinkTestList': 'twilio.rest.events.v1.sink.sink_test',
+    'SinkValidateList': 'twilio.rest.events.v1.sink.sink_validate',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
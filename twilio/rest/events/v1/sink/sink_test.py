@@ -6,6 +6,7 @@ This code was generated by
       /       /
 """
 
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
@@ -30,16 +31,33 @@ class SinkTestList(ListResource):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/Sinks/{sid}/Test'.format(**self._solution)
+        self._uri = values.ResourceUri('/Sinks/{sid}/Test', self._solution)
 
-    def create(self):
+    def create(self, deadline=None):
         """
         Create the SinkTestInstance
 
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created SinkTestInstance
+        :rtype: twilio.rest.events.v1.sink.sink_test.SinkTestInstance
+        """
+        payload = self._version.create(method='POST', uri=self._uri, deadline=deadline, )
+
+        return SinkTestInstance(self._version, payload, sid=self._solution['sid'], )
+
+    async def create_async(self, deadline=None):
+        """
+        Asynchronous coroutine that creates the SinkTestInstance
+
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
         :returns: The created SinkTestInstance
         :rtype: twilio.rest.events.v1.sink.sink_test.SinkTestInstance
         """
-        payload = self._version.create(method='POST', uri=self._uri, )
+        payload = await self._version.create_async(method='POST', uri=self._uri, deadline=deadline, )
 
         return SinkTestInstance(self._version, payload, sid=self._solution['sid'], )
 
@@ -98,6 +116,13 @@ class SinkTestInstance(InstanceResource):
     """ PLEASE NOTE that this class contains beta products that are subject to
     change. Use them with caution. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'result': 'result',
+    })
+
     def __init__(self, version, payload, sid):
         """
         Initialize the SinkTestInstance
@@ -108,7 +133,7 @@ class SinkTestInstance(InstanceResource):
         super(SinkTestInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {'result': payload.get('result'), }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
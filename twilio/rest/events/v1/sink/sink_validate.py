@@ -6,6 +6,7 @@ This code was generated by
       /       /
 """
 
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
@@ -30,20 +31,39 @@ class SinkValidateList(ListResource):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/Sinks/{sid}/Validate'.format(**self._solution)
+        self._uri = values.ResourceUri('/Sinks/{sid}/Validate', self._solution)
 
-    def create(self, test_id):
+    def create(self, test_id, deadline=None):
         """
         Create the SinkValidateInstance
 
         :param unicode test_id: A string that uniquely identifies the test event for a Sink being validated.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created SinkValidateInstance
         :rtype: twilio.rest.events.v1.sink.sink_validate.SinkValidateInstance
         """
         data = values.of({'TestId': test_id, })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return SinkValidateInstance(self._version, payload, sid=self._solution['sid'], )
+
+    async def create_async(self, test_id, deadline=None):
+        """
+        Asynchronous coroutine that creates the SinkValidateInstance
+
+        :param unicode test_id: A string that uniquely identifies the test event for a Sink being validated.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created SinkValidateInstance
+        :rtype: twilio.rest.events.v1.sink.sink_validate.SinkValidateInstance
+        """
+        data = values.of({'TestId': test_id, })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return SinkValidateInstance(self._version, payload, sid=self._solution['sid'], )
 
@@ -102,6 +122,13 @@ class SinkValidateInstance(InstanceResource):
     """ PLEASE NOTE that this class contains beta products that are subject to
     change. Use them with caution. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'result': 'result',
+    })
+
     def __init__(self, version, payload, sid):
         """
         Initialize the SinkValidateInstance
@@ -112,7 +139,7 @@ class SinkValidateInstance(InstanceResource):
         super(SinkValidateInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {'result': payload.get('result'), }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
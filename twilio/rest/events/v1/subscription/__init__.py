@@ -6,6 +6,8 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import serialize
 from twilio.base import values
@@ -13,7 +15,6 @@ from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.events.v1.subscription.subscribed_event import SubscribedEventList
 
 
 class SubscriptionList(ListResource):
@@ -33,9 +34,10 @@ class SubscriptionList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Subscriptions'.format(**self._solution)
+        self._uri = values.ResourceUri('/Subscriptions', self._solution)
 
-    def stream(self, sink_sid=values.unset, limit=None, page_size=None):
+    def stream(self, sink_sid=values.unset, limit=None, page_size=None,
+               prefetch=None, raw=False, deadline=None):
         """
         Streams SubscriptionInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -49,17 +51,59 @@ class SubscriptionList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.events.v1.subscription.SubscriptionInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(sink_sid=sink_sid, page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(sink_sid=sink_sid, page_size=limits['page_size'], )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, sink_sid=values.unset, limit=None, page_size=None,
+                           prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams SubscriptionInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param unicode sink_sid: Sink SID.
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.events.v1.subscription.SubscriptionInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(sink_sid=sink_sid, page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, sink_sid=values.unset, limit=None, page_size=None):
+    def list(self, sink_sid=values.unset, limit=None, page_size=None,
+             prefetch=None, raw=False, deadline=None):
         """
         Lists SubscriptionInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -72,11 +116,43 @@ class SubscriptionList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.events.v1.subscription.SubscriptionInstance]
         """
-        return list(self.stream(sink_sid=sink_sid, limit=limit, page_size=page_size, ))
+        return list(self.stream(sink_sid=sink_sid, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, sink_sid=values.unset, limit=None, page_size=None,
+                         prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists SubscriptionInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param unicode sink_sid: Sink SID.
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.events.v1.subscription.SubscriptionInstance]
+        """
+        return [record async for record in await self.stream_async(sink_sid=sink_sid, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, sink_sid=values.unset, page_token=values.unset,
              page_number=values.unset, page_size=values.unset):
@@ -103,6 +179,31 @@ class SubscriptionList(ListResource):
 
         return SubscriptionPage(self._version, response, self._solution)
 
+    async def page_async(self, sink_sid=values.unset, page_token=values.unset,
+                         page_number=values.unset, page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of SubscriptionInstance records from the API.
+        Request is executed immediately
+
+        :param unicode sink_sid: Sink SID.
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of SubscriptionInstance
+        :rtype: twilio.rest.events.v1.subscription.SubscriptionPage
+        """
+        data = values.of({
+            'SinkSid': sink_sid,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return SubscriptionPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of SubscriptionInstance records from the API.
@@ -120,13 +221,55 @@ class SubscriptionList(ListResource):
 
         return SubscriptionPage(self._version, response, self._solution)
 
-    def create(self, description, sink_sid, types):
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of SubscriptionInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of SubscriptionInstance
+        :rtype: twilio.rest.events.v1.subscription.SubscriptionPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return SubscriptionPage(self._version, response, self._solution)
+
+    def create(self, description, sink_sid, types, deadline=None):
         """
         Create the SubscriptionInstance
 
         :param unicode description: Subscription description
         :param unicode sink_sid: Sink SID.
         :param list[dict] types: Subscribed Event Types
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created SubscriptionInstance
+        :rtype: twilio.rest.events.v1.subscription.SubscriptionInstance
+        """
+        data = values.of({
+            'Description': description,
+            'SinkSid': sink_sid,
+            'Types': serialize.map(types, lambda e: serialize.object(e)),
+        })
+
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return SubscriptionInstance(self._version, payload, )
+
+    async def create_async(self, description, sink_sid, types, deadline=None):
+        """
+        Asynchronous coroutine that creates the SubscriptionInstance
+
+        :param unicode description: Subscription description
+        :param unicode sink_sid: Sink SID.
+        :param list[dict] types: Subscribed Event Types
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created SubscriptionInstance
         :rtype: twilio.rest.events.v1.subscription.SubscriptionInstance
@@ -137,7 +280,7 @@ class SubscriptionList(ListResource):
             'Types': serialize.map(types, lambda e: serialize.object(e)),
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return SubscriptionInstance(self._version, payload, )
 
@@ -231,7 +374,7 @@ class SubscriptionContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/Subscriptions/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Subscriptions/{sid}', self._solution)
 
         # Dependents
         self._subscribed_events = None
@@ -247,6 +390,17 @@ class SubscriptionContext(InstanceContext):
 
         return SubscriptionInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the SubscriptionInstance
+
+        :returns: The fetched SubscriptionInstance
+        :rtype: twilio.rest.events.v1.subscription.SubscriptionInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return SubscriptionInstance(self._version, payload, sid=self._solution['sid'], )
+
     def update(self, description=values.unset, sink_sid=values.unset):
         """
         Update the SubscriptionInstance
@@ -263,6 +417,22 @@ class SubscriptionContext(InstanceContext):
 
         return SubscriptionInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def update_async(self, description=values.unset, sink_sid=values.unset):
+        """
+        Asynchronous coroutine that updates the SubscriptionInstance
+
+        :param unicode description: Subscription description.
+        :param unicode sink_sid: Sink SID.
+
+        :returns: The updated SubscriptionInstance
+        :rtype: twilio.rest.events.v1.subscription.SubscriptionInstance
+        """
+        data = values.of({'Description': description, 'SinkSid': sink_sid, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return SubscriptionInstance(self._version, payload, sid=self._solution['sid'], )
+
     def delete(self):
         """
         Deletes the SubscriptionInstance
@@ -272,6 +442,15 @@ class SubscriptionContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the SubscriptionInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     @property
     def subscribed_events(self):
         """
@@ -281,6 +460,7 @@ class SubscriptionContext(InstanceContext):
         :rtype: twilio.rest.events.v1.subscription.subscribed_event.SubscribedEventList
         """
         if self._subscribed_events is None:
+            from twilio.rest.events.v1.subscription.subscribed_event import SubscribedEventList
             self._subscribed_events = SubscribedEventList(self._version, subscription_sid=self._solution['sid'], )
         return self._subscribed_events
 
@@ -299,6 +479,26 @@ class SubscriptionInstance(InstanceResource):
     """ PLEASE NOTE that this class contains beta products that are subject to
     change. Use them with caution. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'sid': 'sid',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'description': 'description',
+        'sink_sid': 'sink_sid',
+        'url': 'url',
+        'links': 'links',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the SubscriptionInstance
@@ -309,16 +509,7 @@ class SubscriptionInstance(InstanceResource):
         super(SubscriptionInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'sid': payload.get('sid'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'description': payload.get('description'),
-            'sink_sid': payload.get('sink_sid'),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -410,6 +601,15 @@ class SubscriptionInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the SubscriptionInstance
+
+        :returns: The fetched SubscriptionInstance
+        :rtype: twilio.rest.events.v1.subscription.SubscriptionInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, description=values.unset, sink_sid=values.unset):
         """
         Update the SubscriptionInstance
@@ -422,6 +622,18 @@ class SubscriptionInstance(InstanceResource):
         """
         return self._proxy.update(description=description, sink_sid=sink_sid, )
 
+    async def update_async(self, description=values.unset, sink_sid=values.unset):
+        """
+        Asynchronous coroutine that updates the SubscriptionInstance
+
+        :param unicode description: Subscription description.
+        :param unicode sink_sid: Sink SID.
+
+        :returns: The updated SubscriptionInstance
+        :rtype: twilio.rest.events.v1.subscription.SubscriptionInstance
+        """
+        return await self._proxy.update_async(description=description, sink_sid=sink_sid, )
+
     def delete(self):
         """
         Deletes the SubscriptionInstance
@@ -431,6 +643,15 @@ class SubscriptionInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the SubscriptionInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     @property
     def subscribed_events(self):
         """
@@ -450,3 +671,19 @@ class SubscriptionInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Events.V1.SubscriptionInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'SubscribedEventList': 'twilio.rest.events.v1.subscription.subscribed_event',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
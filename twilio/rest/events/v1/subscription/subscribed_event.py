@@ -32,9 +32,9 @@ class SubscribedEventList(ListResource):
 
         # Path Solution
         self._solution = {'subscription_sid': subscription_sid, }
-        self._uri = '/Subscriptions/{subscription_sid}/SubscribedEvents'.format(**self._solution)
+        self._uri = values.ResourceUri('/Subscriptions/{subscription_sid}/SubscribedEvents', self._solution)
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams SubscribedEventInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -47,17 +47,57 @@ class SubscribedEventList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.events.v1.subscription.subscribed_event.SubscribedEventInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams SubscribedEventInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.events.v1.subscription.subscribed_event.SubscribedEventInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists SubscribedEventInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -69,11 +109,42 @@ class SubscribedEventList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.events.v1.subscription.subscribed_event.SubscribedEventInstance]
+        """
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists SubscribedEventInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.events.v1.subscription.subscribed_event.SubscribedEventInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -94,6 +165,25 @@ class SubscribedEventList(ListResource):
 
         return SubscribedEventPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of SubscribedEventInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of SubscribedEventInstance
+        :rtype: twilio.rest.events.v1.subscription.subscribed_event.SubscribedEventPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return SubscribedEventPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of SubscribedEventInstance records from the API.
@@ -111,19 +201,60 @@ class SubscribedEventList(ListResource):
 
         return SubscribedEventPage(self._version, response, self._solution)
 
-    def create(self, type, schema_version=values.unset):
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of SubscribedEventInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of SubscribedEventInstance
+        :rtype: twilio.rest.events.v1.subscription.subscribed_event.SubscribedEventPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return SubscribedEventPage(self._version, response, self._solution)
+
+    def create(self, type, schema_version=values.unset, deadline=None):
         """
         Create the SubscribedEventInstance
 
         :param unicode type: Type of event being subscribed to.
         :param unicode schema_version: The schema version that the subscription should use.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created SubscribedEventInstance
+        :rtype: twilio.rest.events.v1.subscription.subscribed_event.SubscribedEventInstance
+        """
+        data = values.of({'Type': type, 'SchemaVersion': schema_version, })
+
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return SubscribedEventInstance(
+            self._version,
+            payload,
+            subscription_sid=self._solution['subscription_sid'],
+        )
+
+    async def create_async(self, type, schema_version=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the SubscribedEventInstance
+
+        :param unicode type: Type of event being subscribed to.
+        :param unicode schema_version: The schema version that the subscription should use.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created SubscribedEventInstance
         :rtype: twilio.rest.events.v1.subscription.subscribed_event.SubscribedEventInstance
         """
         data = values.of({'Type': type, 'SchemaVersion': schema_version, })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return SubscribedEventInstance(
             self._version,
@@ -235,7 +366,7 @@ class SubscribedEventContext(InstanceContext):
 
         # Path Solution
         self._solution = {'subscription_sid': subscription_sid, 'type': type, }
-        self._uri = '/Subscriptions/{subscription_sid}/SubscribedEvents/{type}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Subscriptions/{subscription_sid}/SubscribedEvents/{type}', self._solution)
 
     def fetch(self):
         """
@@ -253,6 +384,22 @@ class SubscribedEventContext(InstanceContext):
             type=self._solution['type'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the SubscribedEventInstance
+
+        :returns: The fetched SubscribedEventInstance
+        :rtype: twilio.rest.events.v1.subscription.subscribed_event.SubscribedEventInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return SubscribedEventInstance(
+            self._version,
+            payload,
+            subscription_sid=self._solution['subscription_sid'],
+            type=self._solution['type'],
+        )
+
     def update(self, schema_version=values.unset):
         """
         Update the SubscribedEventInstance
@@ -273,6 +420,26 @@ class SubscribedEventContext(InstanceContext):
             type=self._solution['type'],
         )
 
+    async def update_async(self, schema_version=values.unset):
+        """
+        Asynchronous coroutine that updates the SubscribedEventInstance
+
+        :param unicode schema_version: The schema version that the subscription should use.
+
+        :returns: The updated SubscribedEventInstance
+        :rtype: twilio.rest.events.v1.subscription.subscribed_event.SubscribedEventInstance
+        """
+        data = values.of({'SchemaVersion': schema_version, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return SubscribedEventInstance(
+            self._version,
+            payload,
+            subscription_sid=self._solution['subscription_sid'],
+            type=self._solution['type'],
+        )
+
     def delete(self):
         """
         Deletes the SubscribedEventInstance
@@ -282,6 +449,15 @@ class SubscribedEventContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the SubscribedEventInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -297,6 +473,22 @@ class SubscribedEventInstance(InstanceResource):
     """ PLEASE NOTE that this class contains beta products that are subject to
     change. Use them with caution. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'schema_version': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'type': 'type',
+        'schema_version': 'schema_version',
+        'subscription_sid': 'subscription_sid',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload, subscription_sid, type=None):
         """
         Initialize the SubscribedEventInstance
@@ -307,13 +499,7 @@ class SubscribedEventInstance(InstanceResource):
         super(SubscribedEventInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'type': payload.get('type'),
-            'schema_version': deserialize.integer(payload.get('schema_version')),
-            'subscription_sid': payload.get('subscription_sid'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -385,6 +571,15 @@ class SubscribedEventInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the SubscribedEventInstance
+
+        :returns: The fetched SubscribedEventInstance
+        :rtype: twilio.rest.events.v1.subscription.subscribed_event.SubscribedEventInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, schema_version=values.unset):
         """
         Update the SubscribedEventInstance
@@ -396,6 +591,17 @@ class SubscribedEventInstance(InstanceResource):
         """
         return self._proxy.update(schema_version=schema_version, )
 
+    async def update_async(self, schema_version=values.unset):
+        """
+        Asynchronous coroutine that updates the SubscribedEventInstance
+
+        :param unicode schema_version: The schema version that the subscription should use.
+
+        :returns: The updated SubscribedEventInstance
+        :rtype: twilio.rest.events.v1.subscription.subscribed_event.SubscribedEventInstance
+        """
+        return await self._proxy.update_async(schema_version=schema_version, )
+
     def delete(self):
         """
         Deletes the SubscribedEventInstance
@@ -405,6 +611,15 @@ class SubscribedEventInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the SubscribedEventInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -6,6 +6,8 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import serialize
 from twilio.base import values
@@ -13,7 +15,6 @@ from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.fax.v1.fax.fax_media import FaxMediaList
 
 
 class FaxList(ListResource):
@@ -33,11 +34,12 @@ class FaxList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Faxes'.format(**self._solution)
+        self._uri = values.ResourceUri('/Faxes', self._solution)
 
     def stream(self, from_=values.unset, to=values.unset,
                date_created_on_or_before=values.unset,
-               date_created_after=values.unset, limit=None, page_size=None):
+               date_created_after=values.unset, limit=None, page_size=None,
+               prefetch=None, raw=False, deadline=None):
         """
         Streams FaxInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -54,25 +56,78 @@ class FaxList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.fax.v1.fax.FaxInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
-            from_=from_,
-            to=to,
-            date_created_on_or_before=date_created_on_or_before,
-            date_created_after=date_created_after,
-            page_size=limits['page_size'],
-        )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                from_=from_,
+                to=to,
+                date_created_on_or_before=date_created_on_or_before,
+                date_created_after=date_created_after,
+                page_size=limits['page_size'],
+            )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, from_=values.unset, to=values.unset,
+                           date_created_on_or_before=values.unset,
+                           date_created_after=values.unset, limit=None, page_size=None,
+                           prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams FaxInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param unicode from_: Retrieve only those faxes sent from this phone number
+        :param unicode to: Retrieve only those faxes sent to this phone number
+        :param datetime date_created_on_or_before: Retrieve only faxes created on or before this date
+        :param datetime date_created_after: Retrieve only faxes created after this date
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.fax.v1.fax.FaxInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                from_=from_,
+                to=to,
+                date_created_on_or_before=date_created_on_or_before,
+                date_created_after=date_created_after,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, from_=values.unset, to=values.unset,
              date_created_on_or_before=values.unset,
-             date_created_after=values.unset, limit=None, page_size=None):
+             date_created_after=values.unset, limit=None, page_size=None,
+             prefetch=None, raw=False, deadline=None):
         """
         Lists FaxInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -88,6 +143,12 @@ class FaxList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.fax.v1.fax.FaxInstance]
@@ -99,8 +160,52 @@ class FaxList(ListResource):
             date_created_after=date_created_after,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, from_=values.unset, to=values.unset,
+                         date_created_on_or_before=values.unset,
+                         date_created_after=values.unset, limit=None, page_size=None,
+                         prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists FaxInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param unicode from_: Retrieve only those faxes sent from this phone number
+        :param unicode to: Retrieve only those faxes sent to this phone number
+        :param datetime date_created_on_or_before: Retrieve only faxes created on or before this date
+        :param datetime date_created_after: Retrieve only faxes created after this date
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.fax.v1.fax.FaxInstance]
+        """
+        return [record async for record in await self.stream_async(
+            from_=from_,
+            to=to,
+            date_created_on_or_before=date_created_on_or_before,
+            date_created_after=date_created_after,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, from_=values.unset, to=values.unset,
              date_created_on_or_before=values.unset,
              date_created_after=values.unset, page_token=values.unset,
@@ -134,6 +239,39 @@ class FaxList(ListResource):
 
         return FaxPage(self._version, response, self._solution)
 
+    async def page_async(self, from_=values.unset, to=values.unset,
+                         date_created_on_or_before=values.unset,
+                         date_created_after=values.unset, page_token=values.unset,
+                         page_number=values.unset, page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of FaxInstance records from the API.
+        Request is executed immediately
+
+        :param unicode from_: Retrieve only those faxes sent from this phone number
+        :param unicode to: Retrieve only those faxes sent to this phone number
+        :param datetime date_created_on_or_before: Retrieve only faxes created on or before this date
+        :param datetime date_created_after: Retrieve only faxes created after this date
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of FaxInstance
+        :rtype: twilio.rest.fax.v1.fax.FaxPage
+        """
+        data = values.of({
+            'From': from_,
+            'To': to,
+            'DateCreatedOnOrBefore': serialize.iso8601_datetime(date_created_on_or_before),
+            'DateCreatedAfter': serialize.iso8601_datetime(date_created_after),
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return FaxPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of FaxInstance records from the API.
@@ -151,6 +289,23 @@ class FaxList(ListResource):
 
         return FaxPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of FaxInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of FaxInstance
+        :rtype: twilio.rest.fax.v1.fax.FaxPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return FaxPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a FaxContext
@@ -241,7 +396,7 @@ class FaxContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/Faxes/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Faxes/{sid}', self._solution)
 
         # Dependents
         self._media = None
@@ -257,6 +412,17 @@ class FaxContext(InstanceContext):
 
         return FaxInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the FaxInstance
+
+        :returns: The fetched FaxInstance
+        :rtype: twilio.rest.fax.v1.fax.FaxInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return FaxInstance(self._version, payload, sid=self._solution['sid'], )
+
     def delete(self):
         """
         Deletes the FaxInstance
@@ -266,6 +432,15 @@ class FaxContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the FaxInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     @property
     def media(self):
         """
@@ -275,6 +450,7 @@ class FaxContext(InstanceContext):
         :rtype: twilio.rest.fax.v1.fax.fax_media.FaxMediaList
         """
         if self._media is None:
+            from twilio.rest.fax.v1.fax.fax_media import FaxMediaList
             self._media = FaxMediaList(self._version, fax_sid=self._solution['sid'], )
         return self._media
 
@@ -317,6 +493,39 @@ class FaxInstance(InstanceResource):
     class UpdateStatus(object):
         CANCELED = "canceled"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'num_pages': deserialize.integer,
+        'duration': deserialize.integer,
+        'price': deserialize.decimal,
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'from_': 'from',
+        'to': 'to',
+        'quality': 'quality',
+        'media_sid': 'media_sid',
+        'media_url': 'media_url',
+        'num_pages': 'num_pages',
+        'duration': 'duration',
+        'status': 'status',
+        'direction': 'direction',
+        'api_version': 'api_version',
+        'price': 'price',
+        'price_unit': 'price_unit',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'links': 'links',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the FaxInstance
@@ -327,26 +536,7 @@ class FaxInstance(InstanceResource):
         super(FaxInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'from_': payload.get('from'),
-            'to': payload.get('to'),
-            'quality': payload.get('quality'),
-            'media_sid': payload.get('media_sid'),
-            'media_url': payload.get('media_url'),
-            'num_pages': deserialize.integer(payload.get('num_pages')),
-            'duration': deserialize.integer(payload.get('duration')),
-            'status': payload.get('status'),
-            'direction': payload.get('direction'),
-            'api_version': payload.get('api_version'),
-            'price': deserialize.decimal(payload.get('price')),
-            'price_unit': payload.get('price_unit'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'links': payload.get('links'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -518,6 +708,15 @@ class FaxInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the FaxInstance
+
+        :returns: The fetched FaxInstance
+        :rtype: twilio.rest.fax.v1.fax.FaxInstance
+        """
+        return await self._proxy.fetch_async()
+
     def delete(self):
         """
         Deletes the FaxInstance
@@ -527,6 +726,15 @@ class FaxInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the FaxInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     @property
     def media(self):
         """
@@ -546,3 +754,19 @@ class FaxInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Fax.V1.FaxInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'FaxMediaList': 'twilio.rest.fax.v1.fax.fax_media',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -6,12 +6,9 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base.version import Version
-from twilio.rest.flex_api.v1.channel import ChannelList
-from twilio.rest.flex_api.v1.configuration import ConfigurationList
-from twilio.rest.flex_api.v1.flex_flow import FlexFlowList
-from twilio.rest.flex_api.v1.interaction import InteractionList
-from twilio.rest.flex_api.v1.web_channel import WebChannelList
 
 
 class V1(Version):
@@ -37,6 +34,7 @@ class V1(Version):
         :rtype: twilio.rest.flex_api.v1.channel.ChannelList
         """
         if self._channel is None:
+            from twilio.rest.flex_api.v1.channel import ChannelList
             self._channel = ChannelList(self)
         return self._channel
 
@@ -46,6 +44,7 @@ class V1(Version):
         :rtype: twilio.rest.flex_api.v1.configuration.ConfigurationList
         """
         if self._configuration is None:
+            from twilio.rest.flex_api.v1.configuration import ConfigurationList
             self._configuration = ConfigurationList(self)
         return self._configuration
 
@@ -55,6 +54,7 @@ class V1(Version):
         :rtype: twilio.rest.flex_api.v1.flex_flow.FlexFlowList
         """
         if self._flex_flow is None:
+            from twilio.rest.flex_api.v1.flex_flow import FlexFlowList
             self._flex_flow = FlexFlowList(self)
         return self._flex_flow
 
@@ -64,6 +64,7 @@ class V1(Version):
         :rtype: twilio.rest.flex_api.v1.interaction.InteractionList
         """
         if self._interaction is None:
+            from twilio.rest.flex_api.v1.interaction import InteractionList
             self._interaction = InteractionList(self)
         return self._interaction
 
@@ -73,6 +74,7 @@ class V1(Version):
         :rtype: twilio.rest.flex_api.v1.web_channel.WebChannelList
         """
         if self._web_channel is None:
+            from twilio.rest.flex_api.v1.web_channel import WebChannelList
             self._web_channel = WebChannelList(self)
         return self._web_channel
 
@@ -84,3 +86,23 @@ class V1(Version):
         :rtype: str
         """
         return '<Twilio.FlexApi.V1>'
+
+
+_LAZY_IMPORTS = {
+    'ChannelList': 'twilio.rest.flex_api.v1.channel',
+    'ConfigurationList': 'twilio.rest.flex_api.v1.configuration',
+    'FlexFlowList': 'twilio.rest.flex_api.v1.flex_flow',
+    'InteractionList': 'twilio.rest.flex_api.v1.interaction',
+    'WebChannelList': 'twilio.rest.flex_api.v1.web_channel',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
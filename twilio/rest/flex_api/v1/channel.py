@@ -29,9 +29,9 @@ class ChannelList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Channels'.format(**self._solution)
+        self._uri = values.ResourceUri('/Channels', self._solution)
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams ChannelInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -44,17 +44,57 @@ class ChannelList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.flex_api.v1.channel.ChannelInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams ChannelInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.flex_api.v1.channel.ChannelInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists ChannelInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -66,11 +106,42 @@ class ChannelList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.flex_api.v1.channel.ChannelInstance]
+        """
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists ChannelInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.flex_api.v1.channel.ChannelInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -91,6 +162,25 @@ class ChannelList(ListResource):
 
         return ChannelPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of ChannelInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of ChannelInstance
+        :rtype: twilio.rest.flex_api.v1.channel.ChannelPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return ChannelPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of ChannelInstance records from the API.
@@ -108,11 +198,28 @@ class ChannelList(ListResource):
 
         return ChannelPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of ChannelInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of ChannelInstance
+        :rtype: twilio.rest.flex_api.v1.channel.ChannelPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return ChannelPage(self._version, response, self._solution)
+
     def create(self, flex_flow_sid, identity, chat_user_friendly_name,
                chat_friendly_name, target=values.unset,
                chat_unique_name=values.unset, pre_engagement_data=values.unset,
                task_sid=values.unset, task_attributes=values.unset,
-               long_lived=values.unset):
+               long_lived=values.unset, deadline=None):
         """
         Create the ChannelInstance
 
@@ -126,6 +233,8 @@ class ChannelList(ListResource):
         :param unicode task_sid: The SID of the TaskRouter Task
         :param unicode task_attributes: The Task attributes to be added for the TaskRouter Task
         :param bool long_lived: Whether to create the channel as long-lived
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created ChannelInstance
         :rtype: twilio.rest.flex_api.v1.channel.ChannelInstance
@@ -143,7 +252,48 @@ class ChannelList(ListResource):
             'LongLived': long_lived,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return ChannelInstance(self._version, payload, )
+
+    async def create_async(self, flex_flow_sid, identity, chat_user_friendly_name,
+                           chat_friendly_name, target=values.unset,
+                           chat_unique_name=values.unset, pre_engagement_data=values.unset,
+                           task_sid=values.unset, task_attributes=values.unset,
+                           long_lived=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the ChannelInstance
+
+        :param unicode flex_flow_sid: The SID of the Flex Flow
+        :param unicode identity: The identity value that identifies the new resource's chat User
+        :param unicode chat_user_friendly_name: The chat participant's friendly name
+        :param unicode chat_friendly_name: The chat channel's friendly name
+        :param unicode target: The Target Contact Identity
+        :param unicode chat_unique_name: The chat channel's unique name
+        :param unicode pre_engagement_data: The pre-engagement data
+        :param unicode task_sid: The SID of the TaskRouter Task
+        :param unicode task_attributes: The Task attributes to be added for the TaskRouter Task
+        :param bool long_lived: Whether to create the channel as long-lived
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created ChannelInstance
+        :rtype: twilio.rest.flex_api.v1.channel.ChannelInstance
+        """
+        data = values.of({
+            'FlexFlowSid': flex_flow_sid,
+            'Identity': identity,
+            'ChatUserFriendlyName': chat_user_friendly_name,
+            'ChatFriendlyName': chat_friendly_name,
+            'Target': target,
+            'ChatUniqueName': chat_unique_name,
+            'PreEngagementData': pre_engagement_data,
+            'TaskSid': task_sid,
+            'TaskAttributes': task_attributes,
+            'LongLived': long_lived,
+        })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return ChannelInstance(self._version, payload, )
 
@@ -233,7 +383,7 @@ class ChannelContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/Channels/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Channels/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -246,6 +396,17 @@ class ChannelContext(InstanceContext):
 
         return ChannelInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ChannelInstance
+
+        :returns: The fetched ChannelInstance
+        :rtype: twilio.rest.flex_api.v1.channel.ChannelInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return ChannelInstance(self._version, payload, sid=self._solution['sid'], )
+
     def delete(self):
         """
         Deletes the ChannelInstance
@@ -255,6 +416,15 @@ class ChannelContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the ChannelInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -268,6 +438,26 @@ class ChannelContext(InstanceContext):
 
 class ChannelInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'flex_flow_sid': 'flex_flow_sid',
+        'sid': 'sid',
+        'user_sid': 'user_sid',
+        'task_sid': 'task_sid',
+        'url': 'url',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the ChannelInstance
@@ -278,16 +468,7 @@ class ChannelInstance(InstanceResource):
         super(ChannelInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'flex_flow_sid': payload.get('flex_flow_sid'),
-            'sid': payload.get('sid'),
-            'user_sid': payload.get('user_sid'),
-            'task_sid': payload.get('task_sid'),
-            'url': payload.get('url'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -379,6 +560,15 @@ class ChannelInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ChannelInstance
+
+        :returns: The fetched ChannelInstance
+        :rtype: twilio.rest.flex_api.v1.channel.ChannelInstance
+        """
+        return await self._proxy.fetch_async()
+
     def delete(self):
         """
         Deletes the ChannelInstance
@@ -388,6 +578,15 @@ class ChannelInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the ChannelInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -111,7 +111,7 @@ class ConfigurationContext(InstanceContext):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Configuration'.format(**self._solution)
+        self._uri = values.ResourceUri('/Configuration', self._solution)
 
     def fetch(self, ui_version=values.unset):
         """
@@ -128,14 +128,46 @@ class ConfigurationContext(InstanceContext):
 
         return ConfigurationInstance(self._version, payload, )
 
-    def create(self):
+    async def fetch_async(self, ui_version=values.unset):
+        """
+        Asynchronous coroutine that fetches the ConfigurationInstance
+
+        :param unicode ui_version: The Pinned UI version of the Configuration resource to fetch
+
+        :returns: The fetched ConfigurationInstance
+        :rtype: twilio.rest.flex_api.v1.configuration.ConfigurationInstance
+        """
+        data = values.of({'UiVersion': ui_version, })
+
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, params=data, )
+
+        return ConfigurationInstance(self._version, payload, )
+
+    def create(self, deadline=None):
         """
         Create the ConfigurationInstance
 
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
         :returns: The created ConfigurationInstance
         :rtype: twilio.rest.flex_api.v1.configuration.ConfigurationInstance
         """
-        payload = self._version.create(method='POST', uri=self._uri, )
+        payload = self._version.create(method='POST', uri=self._uri, deadline=deadline, )
+
+        return ConfigurationInstance(self._version, payload, )
+
+    async def create_async(self, deadline=None):
+        """
+        Asynchronous coroutine that creates the ConfigurationInstance
+
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created ConfigurationInstance
+        :rtype: twilio.rest.flex_api.v1.configuration.ConfigurationInstance
+        """
+        payload = await self._version.create_async(method='POST', uri=self._uri, deadline=deadline, )
 
         return ConfigurationInstance(self._version, payload, )
 
@@ -150,6 +182,17 @@ class ConfigurationContext(InstanceContext):
 
         return ConfigurationInstance(self._version, payload, )
 
+    async def update_async(self):
+        """
+        Asynchronous coroutine that updates the ConfigurationInstance
+
+        :returns: The updated ConfigurationInstance
+        :rtype: twilio.rest.flex_api.v1.configuration.ConfigurationInstance
+        """
+        payload = await self._version.update_async(method='POST', uri=self._uri, )
+
+        return ConfigurationInstance(self._version, payload, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -168,6 +211,61 @@ class ConfigurationInstance(InstanceResource):
         INPROGRESS = "inprogress"
         NOTSTARTED = "notstarted"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'attributes': 'attributes',
+        'status': 'status',
+        'taskrouter_workspace_sid': 'taskrouter_workspace_sid',
+        'taskrouter_target_workflow_sid': 'taskrouter_target_workflow_sid',
+        'taskrouter_target_taskqueue_sid': 'taskrouter_target_taskqueue_sid',
+        'taskrouter_taskqueues': 'taskrouter_taskqueues',
+        'taskrouter_skills': 'taskrouter_skills',
+        'taskrouter_worker_channels': 'taskrouter_worker_channels',
+        'taskrouter_worker_attributes': 'taskrouter_worker_attributes',
+        'taskrouter_offline_activity_sid': 'taskrouter_offline_activity_sid',
+        'runtime_domain': 'runtime_domain',
+        'messaging_service_instance_sid': 'messaging_service_instance_sid',
+        'chat_service_instance_sid': 'chat_service_instance_sid',
+        'flex_service_instance_sid': 'flex_service_instance_sid',
+        'ui_language': 'ui_language',
+        'ui_attributes': 'ui_attributes',
+        'ui_dependencies': 'ui_dependencies',
+        'ui_version': 'ui_version',
+        'service_version': 'service_version',
+        'call_recording_enabled': 'call_recording_enabled',
+        'call_recording_webhook_url': 'call_recording_webhook_url',
+        'crm_enabled': 'crm_enabled',
+        'crm_type': 'crm_type',
+        'crm_callback_url': 'crm_callback_url',
+        'crm_fallback_url': 'crm_fallback_url',
+        'crm_attributes': 'crm_attributes',
+        'public_attributes': 'public_attributes',
+        'plugin_service_enabled': 'plugin_service_enabled',
+        'plugin_service_attributes': 'plugin_service_attributes',
+        'integrations': 'integrations',
+        'outbound_call_flows': 'outbound_call_flows',
+        'serverless_service_sids': 'serverless_service_sids',
+        'queue_stats_configuration': 'queue_stats_configuration',
+        'notifications': 'notifications',
+        'markdown': 'markdown',
+        'url': 'url',
+        'flex_insights_hr': 'flex_insights_hr',
+        'flex_insights_drilldown': 'flex_insights_drilldown',
+        'flex_url': 'flex_url',
+        'channel_configs': 'channel_configs',
+    }, _deserializers)
+
     def __init__(self, version, payload):
         """
         Initialize the ConfigurationInstance
@@ -178,51 +276,7 @@ class ConfigurationInstance(InstanceResource):
         super(ConfigurationInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'attributes': payload.get('attributes'),
-            'status': payload.get('status'),
-            'taskrouter_workspace_sid': payload.get('taskrouter_workspace_sid'),
-            'taskrouter_target_workflow_sid': payload.get('taskrouter_target_workflow_sid'),
-            'taskrouter_target_taskqueue_sid': payload.get('taskrouter_target_taskqueue_sid'),
-            'taskrouter_taskqueues': payload.get('taskrouter_taskqueues'),
-            'taskrouter_skills': payload.get('taskrouter_skills'),
-            'taskrouter_worker_channels': payload.get('taskrouter_worker_channels'),
-            'taskrouter_worker_attributes': payload.get('taskrouter_worker_attributes'),
-            'taskrouter_offline_activity_sid': payload.get('taskrouter_offline_activity_sid'),
-            'runtime_domain': payload.get('runtime_domain'),
-            'messaging_service_instance_sid': payload.get('messaging_service_instance_sid'),
-            'chat_service_instance_sid': payload.get('chat_service_instance_sid'),
-            'flex_service_instance_sid': payload.get('flex_service_instance_sid'),
-            'ui_language': payload.get('ui_language'),
-            'ui_attributes': payload.get('ui_attributes'),
-            'ui_dependencies': payload.get('ui_dependencies'),
-            'ui_version': payload.get('ui_version'),
-            'service_version': payload.get('service_version'),
-            'call_recording_enabled': payload.get('call_recording_enabled'),
-            'call_recording_webhook_url': payload.get('call_recording_webhook_url'),
-            'crm_enabled': payload.get('crm_enabled'),
-            'crm_type': payload.get('crm_type'),
-            'crm_callback_url': payload.get('crm_callback_url'),
-            'crm_fallback_url': payload.get('crm_fallback_url'),
-            'crm_attributes': payload.get('crm_attributes'),
-            'public_attributes': payload.get('public_attributes'),
-            'plugin_service_enabled': payload.get('plugin_service_enabled'),
-            'plugin_service_attributes': payload.get('plugin_service_attributes'),
-            'integrations': payload.get('integrations'),
-            'outbound_call_flows': payload.get('outbound_call_flows'),
-            'serverless_service_sids': payload.get('serverless_service_sids'),
-            'queue_stats_configuration': payload.get('queue_stats_configuration'),
-            'notifications': payload.get('notifications'),
-            'markdown': payload.get('markdown'),
-            'url': payload.get('url'),
-            'flex_insights_hr': payload.get('flex_insights_hr'),
-            'flex_insights_drilldown': payload.get('flex_insights_drilldown'),
-            'flex_url': payload.get('flex_url'),
-            'channel_configs': payload.get('channel_configs'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -596,14 +650,40 @@ class ConfigurationInstance(InstanceResource):
         """
         return self._proxy.fetch(ui_version=ui_version, )
 
-    def create(self):
+    async def fetch_async(self, ui_version=values.unset):
+        """
+        Asynchronous coroutine that fetches the ConfigurationInstance
+
+        :param unicode ui_version: The Pinned UI version of the Configuration resource to fetch
+
+        :returns: The fetched ConfigurationInstance
+        :rtype: twilio.rest.flex_api.v1.configuration.ConfigurationInstance
+        """
+        return await self._proxy.fetch_async(ui_version=ui_version, )
+
+    def create(self, deadline=None):
         """
         Create the ConfigurationInstance
 
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
         :returns: The created ConfigurationInstance
         :rtype: twilio.rest.flex_api.v1.configuration.ConfigurationInstance
         """
-        return self._proxy.create()
+        return self._proxy.create(deadline=deadline, )
+
+    async def create_async(self, deadline=None):
+        """
+        Asynchronous coroutine that creates the ConfigurationInstance
+
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created ConfigurationInstance
+        :rtype: twilio.rest.flex_api.v1.configuration.ConfigurationInstance
+        """
+        return await self._proxy.create_async(deadline=deadline, )
 
     def update(self):
         """
@@ -614,6 +694,15 @@ class ConfigurationInstance(InstanceResource):
         """
         return self._proxy.update()
 
+    async def update_async(self):
+        """
+        Asynchronous coroutine that updates the ConfigurationInstance
+
+        :returns: The updated ConfigurationInstance
+        :rtype: twilio.rest.flex_api.v1.configuration.ConfigurationInstance
+        """
+        return await self._proxy.update_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -29,9 +29,10 @@ class FlexFlowList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/FlexFlows'.format(**self._solution)
+        self._uri = values.ResourceUri('/FlexFlows', self._solution)
 
-    def stream(self, friendly_name=values.unset, limit=None, page_size=None):
+    def stream(self, friendly_name=values.unset, limit=None, page_size=None,
+               prefetch=None, raw=False, deadline=None):
         """
         Streams FlexFlowInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -45,17 +46,59 @@ class FlexFlowList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.flex_api.v1.flex_flow.FlexFlowInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(friendly_name=friendly_name, page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(friendly_name=friendly_name, page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, friendly_name=values.unset, limit=None, page_size=None):
+    async def stream_async(self, friendly_name=values.unset, limit=None, page_size=None,
+                           prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams FlexFlowInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param unicode friendly_name: The `friendly_name` of the Flex Flow resources to read
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.flex_api.v1.flex_flow.FlexFlowInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(friendly_name=friendly_name, page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, friendly_name=values.unset, limit=None, page_size=None,
+             prefetch=None, raw=False, deadline=None):
         """
         Lists FlexFlowInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -68,11 +111,43 @@ class FlexFlowList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.flex_api.v1.flex_flow.FlexFlowInstance]
+        """
+        return list(self.stream(friendly_name=friendly_name, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, friendly_name=values.unset, limit=None, page_size=None,
+                         prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists FlexFlowInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param unicode friendly_name: The `friendly_name` of the Flex Flow resources to read
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.flex_api.v1.flex_flow.FlexFlowInstance]
         """
-        return list(self.stream(friendly_name=friendly_name, limit=limit, page_size=page_size, ))
+        return [record async for record in await self.stream_async(friendly_name=friendly_name, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, friendly_name=values.unset, page_token=values.unset,
              page_number=values.unset, page_size=values.unset):
@@ -99,6 +174,31 @@ class FlexFlowList(ListResource):
 
         return FlexFlowPage(self._version, response, self._solution)
 
+    async def page_async(self, friendly_name=values.unset, page_token=values.unset,
+                         page_number=values.unset, page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of FlexFlowInstance records from the API.
+        Request is executed immediately
+
+        :param unicode friendly_name: The `friendly_name` of the Flex Flow resources to read
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of FlexFlowInstance
+        :rtype: twilio.rest.flex_api.v1.flex_flow.FlexFlowPage
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return FlexFlowPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of FlexFlowInstance records from the API.
@@ -116,6 +216,23 @@ class FlexFlowList(ListResource):
 
         return FlexFlowPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of FlexFlowInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of FlexFlowInstance
+        :rtype: twilio.rest.flex_api.v1.flex_flow.FlexFlowPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return FlexFlowPage(self._version, response, self._solution)
+
     def create(self, friendly_name, chat_service_sid, channel_type,
                contact_identity=values.unset, enabled=values.unset,
                integration_type=values.unset, integration_flow_sid=values.unset,
@@ -125,7 +242,7 @@ class FlexFlowList(ListResource):
                integration_priority=values.unset,
                integration_creation_on_message=values.unset,
                long_lived=values.unset, janitor_enabled=values.unset,
-               integration_retry_count=values.unset):
+               integration_retry_count=values.unset, deadline=None):
         """
         Create the FlexFlowInstance
 
@@ -146,6 +263,68 @@ class FlexFlowList(ListResource):
         :param bool long_lived: Reuse this chat channel for future interactions with a contact
         :param bool janitor_enabled: Remove active Proxy sessions if the corresponding Task is deleted
         :param unicode integration_retry_count: The number of times to retry the Studio Flow or webhook in case of failure
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created FlexFlowInstance
+        :rtype: twilio.rest.flex_api.v1.flex_flow.FlexFlowInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'ChatServiceSid': chat_service_sid,
+            'ChannelType': channel_type,
+            'ContactIdentity': contact_identity,
+            'Enabled': enabled,
+            'IntegrationType': integration_type,
+            'Integration.FlowSid': integration_flow_sid,
+            'Integration.Url': integration_url,
+            'Integration.WorkspaceSid': integration_workspace_sid,
+            'Integration.WorkflowSid': integration_workflow_sid,
+            'Integration.Channel': integration_channel,
+            'Integration.Timeout': integration_timeout,
+            'Integration.Priority': integration_priority,
+            'Integration.CreationOnMessage': integration_creation_on_message,
+            'LongLived': long_lived,
+            'JanitorEnabled': janitor_enabled,
+            'Integration.RetryCount': integration_retry_count,
+        })
+
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return FlexFlowInstance(self._version, payload, )
+
+    async def create_async(self, friendly_name, chat_service_sid, channel_type,
+                           contact_identity=values.unset, enabled=values.unset,
+                           integration_type=values.unset, integration_flow_sid=values.unset,
+                           integration_url=values.unset, integration_workspace_sid=values.unset,
+                           integration_workflow_sid=values.unset,
+                           integration_channel=values.unset, integration_timeout=values.unset,
+                           integration_priority=values.unset,
+                           integration_creation_on_message=values.unset,
+                           long_lived=values.unset, janitor_enabled=values.unset,
+                           integration_retry_count=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the FlexFlowInstance
+
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode chat_service_sid: The SID of the chat service
+        :param FlexFlowInstance.ChannelType channel_type: The channel type
+        :param unicode contact_identity: The channel contact's Identity
+        :param bool enabled: Whether the new Flex Flow is enabled
+        :param FlexFlowInstance.IntegrationType integration_type: The software that will handle inbound messages.
+        :param unicode integration_flow_sid: The SID of the Studio Flow
+        :param unicode integration_url: The External Webhook URL
+        :param unicode integration_workspace_sid: The Workspace SID for a new Task
+        :param unicode integration_workflow_sid: The Workflow SID for a new Task
+        :param unicode integration_channel: The Task Channel for a new Task
+        :param unicode integration_timeout: The Task timeout in seconds for a new Task
+        :param unicode integration_priority: The Task priority of a new Task
+        :param bool integration_creation_on_message: Whether to create a Task when the first message arrives
+        :param bool long_lived: Reuse this chat channel for future interactions with a contact
+        :param bool janitor_enabled: Remove active Proxy sessions if the corresponding Task is deleted
+        :param unicode integration_retry_count: The number of times to retry the Studio Flow or webhook in case of failure
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created FlexFlowInstance
         :rtype: twilio.rest.flex_api.v1.flex_flow.FlexFlowInstance
@@ -170,7 +349,7 @@ class FlexFlowList(ListResource):
             'Integration.RetryCount': integration_retry_count,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return FlexFlowInstance(self._version, payload, )
 
@@ -260,7 +439,7 @@ class FlexFlowContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/FlexFlows/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/FlexFlows/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -273,6 +452,17 @@ class FlexFlowContext(InstanceContext):
 
         return FlexFlowInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the FlexFlowInstance
+
+        :returns: The fetched FlexFlowInstance
+        :rtype: twilio.rest.flex_api.v1.flex_flow.FlexFlowInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return FlexFlowInstance(self._version, payload, sid=self._solution['sid'], )
+
     def update(self, friendly_name=values.unset, chat_service_sid=values.unset,
                channel_type=values.unset, contact_identity=values.unset,
                enabled=values.unset, integration_type=values.unset,
@@ -332,6 +522,65 @@ class FlexFlowContext(InstanceContext):
 
         return FlexFlowInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def update_async(self, friendly_name=values.unset, chat_service_sid=values.unset,
+                           channel_type=values.unset, contact_identity=values.unset,
+                           enabled=values.unset, integration_type=values.unset,
+                           integration_flow_sid=values.unset, integration_url=values.unset,
+                           integration_workspace_sid=values.unset,
+                           integration_workflow_sid=values.unset,
+                           integration_channel=values.unset, integration_timeout=values.unset,
+                           integration_priority=values.unset,
+                           integration_creation_on_message=values.unset,
+                           long_lived=values.unset, janitor_enabled=values.unset,
+                           integration_retry_count=values.unset):
+        """
+        Asynchronous coroutine that updates the FlexFlowInstance
+
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode chat_service_sid: The SID of the chat service
+        :param FlexFlowInstance.ChannelType channel_type: The channel type
+        :param unicode contact_identity: The channel contact's Identity
+        :param bool enabled: Whether the new Flex Flow is enabled
+        :param FlexFlowInstance.IntegrationType integration_type: The software that will handle inbound messages.
+        :param unicode integration_flow_sid: The SID of the Studio Flow
+        :param unicode integration_url: The External Webhook URL
+        :param unicode integration_workspace_sid: The Workspace SID for a new Task
+        :param unicode integration_workflow_sid: The Workflow SID for a new Task
+        :param unicode integration_channel: The Task Channel for a new Task
+        :param unicode integration_timeout: The Task timeout in seconds for a new Task
+        :param unicode integration_priority: The Task priority of a new Task
+        :param bool integration_creation_on_message: Whether to create a Task when the first message arrives
+        :param bool long_lived: Reuse this chat channel for future interactions with a contact
+        :param bool janitor_enabled: Remove active Proxy sessions if the corresponding Task is deleted
+        :param unicode integration_retry_count: The number of times to retry the Studio Flow or webhook in case of failure
+
+        :returns: The updated FlexFlowInstance
+        :rtype: twilio.rest.flex_api.v1.flex_flow.FlexFlowInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'ChatServiceSid': chat_service_sid,
+            'ChannelType': channel_type,
+            'ContactIdentity': contact_identity,
+            'Enabled': enabled,
+            'IntegrationType': integration_type,
+            'Integration.FlowSid': integration_flow_sid,
+            'Integration.Url': integration_url,
+            'Integration.WorkspaceSid': integration_workspace_sid,
+            'Integration.WorkflowSid': integration_workflow_sid,
+            'Integration.Channel': integration_channel,
+            'Integration.Timeout': integration_timeout,
+            'Integration.Priority': integration_priority,
+            'Integration.CreationOnMessage': integration_creation_on_message,
+            'LongLived': long_lived,
+            'JanitorEnabled': janitor_enabled,
+            'Integration.RetryCount': integration_retry_count,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return FlexFlowInstance(self._version, payload, sid=self._solution['sid'], )
+
     def delete(self):
         """
         Deletes the FlexFlowInstance
@@ -341,6 +590,15 @@ class FlexFlowContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the FlexFlowInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -367,6 +625,32 @@ class FlexFlowInstance(InstanceResource):
         EXTERNAL = "external"
         TASK = "task"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'sid': 'sid',
+        'friendly_name': 'friendly_name',
+        'chat_service_sid': 'chat_service_sid',
+        'channel_type': 'channel_type',
+        'contact_identity': 'contact_identity',
+        'enabled': 'enabled',
+        'integration_type': 'integration_type',
+        'integration': 'integration',
+        'long_lived': 'long_lived',
+        'janitor_enabled': 'janitor_enabled',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the FlexFlowInstance
@@ -377,22 +661,7 @@ class FlexFlowInstance(InstanceResource):
         super(FlexFlowInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'sid': payload.get('sid'),
-            'friendly_name': payload.get('friendly_name'),
-            'chat_service_sid': payload.get('chat_service_sid'),
-            'channel_type': payload.get('channel_type'),
-            'contact_identity': payload.get('contact_identity'),
-            'enabled': payload.get('enabled'),
-            'integration_type': payload.get('integration_type'),
-            'integration': payload.get('integration'),
-            'long_lived': payload.get('long_lived'),
-            'janitor_enabled': payload.get('janitor_enabled'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -532,6 +801,15 @@ class FlexFlowInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the FlexFlowInstance
+
+        :returns: The fetched FlexFlowInstance
+        :rtype: twilio.rest.flex_api.v1.flex_flow.FlexFlowInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, friendly_name=values.unset, chat_service_sid=values.unset,
                channel_type=values.unset, contact_identity=values.unset,
                enabled=values.unset, integration_type=values.unset,
@@ -587,6 +865,61 @@ class FlexFlowInstance(InstanceResource):
             integration_retry_count=integration_retry_count,
         )
 
+    async def update_async(self, friendly_name=values.unset, chat_service_sid=values.unset,
+                           channel_type=values.unset, contact_identity=values.unset,
+                           enabled=values.unset, integration_type=values.unset,
+                           integration_flow_sid=values.unset, integration_url=values.unset,
+                           integration_workspace_sid=values.unset,
+                           integration_workflow_sid=values.unset,
+                           integration_channel=values.unset, integration_timeout=values.unset,
+                           integration_priority=values.unset,
+                           integration_creation_on_message=values.unset,
+                           long_lived=values.unset, janitor_enabled=values.unset,
+                           integration_retry_count=values.unset):
+        """
+        Asynchronous coroutine that updates the FlexFlowInstance
+
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode chat_service_sid: The SID of the chat service
+        :param FlexFlowInstance.ChannelType channel_type: The channel type
+        :param unicode contact_identity: The channel contact's Identity
+        :param bool enabled: Whether the new Flex Flow is enabled
+        :param FlexFlowInstance.IntegrationType integration_type: The software that will handle inbound messages.
+        :param unicode integration_flow_sid: The SID of the Studio Flow
+        :param unicode integration_url: The External Webhook URL
+        :param unicode integration_workspace_sid: The Workspace SID for a new Task
+        :param unicode integration_workflow_sid: The Workflow SID for a new Task
+        :param unicode integration_channel: The Task Channel for a new Task
+        :param unicode integration_timeout: The Task timeout in seconds for a new Task
+        :param unicode integration_priority: The Task priority of a new Task
+        :param bool integration_creation_on_message: Whether to create a Task when the first message arrives
+        :param bool long_lived: Reuse this chat channel for future interactions with a contact
+        :param bool janitor_enabled: Remove active Proxy sessions if the corresponding Task is deleted
+        :param unicode integration_retry_count: The number of times to retry the Studio Flow or webhook in case of failure
+
+        :returns: The updated FlexFlowInstance
+        :rtype: twilio.rest.flex_api.v1.flex_flow.FlexFlowInstance
+        """
+        return await self._proxy.update_async(
+            friendly_name=friendly_name,
+            chat_service_sid=chat_service_sid,
+            channel_type=channel_type,
+            contact_identity=contact_identity,
+            enabled=enabled,
+            integration_type=integration_type,
+            integration_flow_sid=integration_flow_sid,
+            integration_url=integration_url,
+            integration_workspace_sid=integration_workspace_sid,
+            integration_workflow_sid=integration_workflow_sid,
+            integration_channel=integration_channel,
+            integration_timeout=integration_timeout,
+            integration_priority=integration_priority,
+            integration_creation_on_message=integration_creation_on_message,
+            long_lived=long_lived,
+            janitor_enabled=janitor_enabled,
+            integration_retry_count=integration_retry_count,
+        )
+
     def delete(self):
         """
         Deletes the FlexFlowInstance
@@ -596,6 +929,15 @@ class FlexFlowInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the FlexFlowInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -6,13 +6,15 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import serialize
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.flex_api.v1.interaction.interaction_channel import InteractionChannelList
 
 
 class InteractionList(ListResource):
@@ -30,21 +32,41 @@ class InteractionList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Interactions'.format(**self._solution)
+        self._uri = values.ResourceUri('/Interactions', self._solution)
 
-    def create(self, channel, routing):
+    def create(self, channel, routing, deadline=None):
         """
         Create the InteractionInstance
 
         :param dict channel: The Interaction's channel
         :param dict routing: The Interaction's routing logic
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created InteractionInstance
         :rtype: twilio.rest.flex_api.v1.interaction.InteractionInstance
         """
         data = values.of({'Channel': serialize.object(channel), 'Routing': serialize.object(routing), })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return InteractionInstance(self._version, payload, )
+
+    async def create_async(self, channel, routing, deadline=None):
+        """
+        Asynchronous coroutine that creates the InteractionInstance
+
+        :param dict channel: The Interaction's channel
+        :param dict routing: The Interaction's routing logic
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created InteractionInstance
+        :rtype: twilio.rest.flex_api.v1.interaction.InteractionInstance
+        """
+        data = values.of({'Channel': serialize.object(channel), 'Routing': serialize.object(routing), })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return InteractionInstance(self._version, payload, )
 
@@ -134,7 +156,7 @@ class InteractionContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/Interactions/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Interactions/{sid}', self._solution)
 
         # Dependents
         self._channels = None
@@ -150,6 +172,17 @@ class InteractionContext(InstanceContext):
 
         return InteractionInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the InteractionInstance
+
+        :returns: The fetched InteractionInstance
+        :rtype: twilio.rest.flex_api.v1.interaction.InteractionInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return InteractionInstance(self._version, payload, sid=self._solution['sid'], )
+
     @property
     def channels(self):
         """
@@ -159,6 +192,7 @@ class InteractionContext(InstanceContext):
         :rtype: twilio.rest.flex_api.v1.interaction.interaction_channel.InteractionChannelList
         """
         if self._channels is None:
+            from twilio.rest.flex_api.v1.interaction.interaction_channel import InteractionChannelList
             self._channels = InteractionChannelList(self._version, interaction_sid=self._solution['sid'], )
         return self._channels
 
@@ -180,6 +214,17 @@ class InteractionInstance(InstanceResource):
         CLOSED = "closed"
         WRAPUP = "wrapup"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'channel': 'channel',
+        'routing': 'routing',
+        'url': 'url',
+        'links': 'links',
+    })
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the InteractionInstance
@@ -190,13 +235,7 @@ class InteractionInstance(InstanceResource):
         super(InteractionInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'channel': payload.get('channel'),
-            'routing': payload.get('routing'),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -264,6 +303,15 @@ class InteractionInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the InteractionInstance
+
+        :returns: The fetched InteractionInstance
+        :rtype: twilio.rest.flex_api.v1.interaction.InteractionInstance
+        """
+        return await self._proxy.fetch_async()
+
     @property
     def channels(self):
         """
@@ -283,3 +331,19 @@ class InteractionInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.FlexApi.V1.InteractionInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'InteractionChannelList': 'twilio.rest.flex_api.v1.interaction.interaction_channel',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -6,14 +6,15 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import serialize
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.flex_api.v1.interaction.interaction_channel.interaction_channel_invite import InteractionChannelInviteList
-from twilio.rest.flex_api.v1.interaction.interaction_channel.interaction_channel_participant import InteractionChannelParticipantList
 
 
 class InteractionChannelList(ListResource):
@@ -32,9 +33,9 @@ class InteractionChannelList(ListResource):
 
         # Path Solution
         self._solution = {'interaction_sid': interaction_sid, }
-        self._uri = '/Interactions/{interaction_sid}/Channels'.format(**self._solution)
+        self._uri = values.ResourceUri('/Interactions/{interaction_sid}/Channels', self._solution)
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams InteractionChannelInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -47,17 +48,57 @@ class InteractionChannelList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.flex_api.v1.interaction.interaction_channel.InteractionChannelInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams InteractionChannelInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.flex_api.v1.interaction.interaction_channel.InteractionChannelInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists InteractionChannelInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -69,11 +110,42 @@ class InteractionChannelList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.flex_api.v1.interaction.interaction_channel.InteractionChannelInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists InteractionChannelInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.flex_api.v1.interaction.interaction_channel.InteractionChannelInstance]
+        """
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -94,6 +166,25 @@ class InteractionChannelList(ListResource):
 
         return InteractionChannelPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of InteractionChannelInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of InteractionChannelInstance
+        :rtype: twilio.rest.flex_api.v1.interaction.interaction_channel.InteractionChannelPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return InteractionChannelPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of InteractionChannelInstance records from the API.
@@ -111,6 +202,23 @@ class InteractionChannelList(ListResource):
 
         return InteractionChannelPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of InteractionChannelInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of InteractionChannelInstance
+        :rtype: twilio.rest.flex_api.v1.interaction.interaction_channel.InteractionChannelPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return InteractionChannelPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a InteractionChannelContext
@@ -211,7 +319,7 @@ class InteractionChannelContext(InstanceContext):
 
         # Path Solution
         self._solution = {'interaction_sid': interaction_sid, 'sid': sid, }
-        self._uri = '/Interactions/{interaction_sid}/Channels/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Interactions/{interaction_sid}/Channels/{sid}', self._solution)
 
         # Dependents
         self._invites = None
@@ -233,6 +341,22 @@ class InteractionChannelContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the InteractionChannelInstance
+
+        :returns: The fetched InteractionChannelInstance
+        :rtype: twilio.rest.flex_api.v1.interaction.interaction_channel.InteractionChannelInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return InteractionChannelInstance(
+            self._version,
+            payload,
+            interaction_sid=self._solution['interaction_sid'],
+            sid=self._solution['sid'],
+        )
+
     def update(self, status, routing=values.unset):
         """
         Update the InteractionChannelInstance
@@ -254,6 +378,27 @@ class InteractionChannelContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, status, routing=values.unset):
+        """
+        Asynchronous coroutine that updates the InteractionChannelInstance
+
+        :param InteractionChannelInstance.Status status: The Interaction Channels's status
+        :param dict routing: The Interaction Channels's optional routing parameters
+
+        :returns: The updated InteractionChannelInstance
+        :rtype: twilio.rest.flex_api.v1.interaction.interaction_channel.InteractionChannelInstance
+        """
+        data = values.of({'Status': status, 'Routing': serialize.object(routing), })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return InteractionChannelInstance(
+            self._version,
+            payload,
+            interaction_sid=self._solution['interaction_sid'],
+            sid=self._solution['sid'],
+        )
+
     @property
     def invites(self):
         """
@@ -263,6 +408,7 @@ class InteractionChannelContext(InstanceContext):
         :rtype: twilio.rest.flex_api.v1.interaction.interaction_channel.interaction_channel_invite.InteractionChannelInviteList
         """
         if self._invites is None:
+            from twilio.rest.flex_api.v1.interaction.interaction_channel.interaction_channel_invite import InteractionChannelInviteList
             self._invites = InteractionChannelInviteList(
                 self._version,
                 interaction_sid=self._solution['interaction_sid'],
@@ -279,6 +425,7 @@ class InteractionChannelContext(InstanceContext):
         :rtype: twilio.rest.flex_api.v1.interaction.interaction_channel.interaction_channel_participant.InteractionChannelParticipantList
         """
         if self._participants is None:
+            from twilio.rest.flex_api.v1.interaction.interaction_channel.interaction_channel_participant import InteractionChannelParticipantList
             self._participants = InteractionChannelParticipantList(
                 self._version,
                 interaction_sid=self._solution['interaction_sid'],
@@ -312,6 +459,17 @@ class InteractionChannelInstance(InstanceResource):
         WHATSAPP = "whatsapp"
         CHAT = "chat"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'interaction_sid': 'interaction_sid',
+        'type': 'type',
+        'url': 'url',
+        'links': 'links',
+    })
+
     def __init__(self, version, payload, interaction_sid, sid=None):
         """
         Initialize the InteractionChannelInstance
@@ -322,13 +480,7 @@ class InteractionChannelInstance(InstanceResource):
         super(InteractionChannelInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'interaction_sid': payload.get('interaction_sid'),
-            'type': payload.get('type'),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -400,6 +552,15 @@ class InteractionChannelInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the InteractionChannelInstance
+
+        :returns: The fetched InteractionChannelInstance
+        :rtype: twilio.rest.flex_api.v1.interaction.interaction_channel.InteractionChannelInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, status, routing=values.unset):
         """
         Update the InteractionChannelInstance
@@ -412,6 +573,18 @@ class InteractionChannelInstance(InstanceResource):
         """
         return self._proxy.update(status, routing=routing, )
 
+    async def update_async(self, status, routing=values.unset):
+        """
+        Asynchronous coroutine that updates the InteractionChannelInstance
+
+        :param InteractionChannelInstance.Status status: The Interaction Channels's status
+        :param dict routing: The Interaction Channels's optional routing parameters
+
+        :returns: The updated InteractionChannelInstance
+        :rtype: twilio.rest.flex_api.v1.interaction.interaction_channel.InteractionChannelInstance
+        """
+        return await self._proxy.update_async(status, routing=routing, )
+
     @property
     def invites(self):
         """
@@ -441,3 +614,20 @@ class InteractionChannelInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.FlexApi.V1.InteractionChannelInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'InteractionChannelInviteList': 'twilio.rest.flex_api.v1.interaction.interaction_channel.interaction_channel_invite',
+    'InteractionChannelParticipantList': 'twilio.rest.flex_api.v1.interaction.interaction_channel.interaction_channel_participant',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
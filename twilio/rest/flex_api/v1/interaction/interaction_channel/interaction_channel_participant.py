@@ -7,6 +7,7 @@ This code was generated by
 """
 
 from twilio.base import serialize
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
@@ -31,21 +32,23 @@ class InteractionChannelParticipantList(ListResource):
 
         # Path Solution
         self._solution = {'interaction_sid': interaction_sid, 'channel_sid': channel_sid, }
-        self._uri = '/Interactions/{interaction_sid}/Channels/{channel_sid}/Participants'.format(**self._solution)
+        self._uri = values.ResourceUri('/Interactions/{interaction_sid}/Channels/{channel_sid}/Participants', self._solution)
 
-    def create(self, type, media_properties):
+    def create(self, type, media_properties, deadline=None):
         """
         Create the InteractionChannelParticipantInstance
 
         :param InteractionChannelParticipantInstance.Type type: Participant type.
         :param dict media_properties: JSON representing the Media Properties for the new Participant.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created InteractionChannelParticipantInstance
         :rtype: twilio.rest.flex_api.v1.interaction.interaction_channel.interaction_channel_participant.InteractionChannelParticipantInstance
         """
         data = values.of({'Type': type, 'MediaProperties': serialize.object(media_properties), })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return InteractionChannelParticipantInstance(
             self._version,
@@ -54,7 +57,30 @@ class InteractionChannelParticipantList(ListResource):
             channel_sid=self._solution['channel_sid'],
         )
 
-    def stream(self, limit=None, page_size=None):
+    async def create_async(self, type, media_properties, deadline=None):
+        """
+        Asynchronous coroutine that creates the InteractionChannelParticipantInstance
+
+        :param InteractionChannelParticipantInstance.Type type: Participant type.
+        :param dict media_properties: JSON representing the Media Properties for the new Participant.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created InteractionChannelParticipantInstance
+        :rtype: twilio.rest.flex_api.v1.interaction.interaction_channel.interaction_channel_participant.InteractionChannelParticipantInstance
+        """
+        data = values.of({'Type': type, 'MediaProperties': serialize.object(media_properties), })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return InteractionChannelParticipantInstance(
+            self._version,
+            payload,
+            interaction_sid=self._solution['interaction_sid'],
+            channel_sid=self._solution['channel_sid'],
+        )
+
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams InteractionChannelParticipantInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -67,17 +93,57 @@ class InteractionChannelParticipantList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.flex_api.v1.interaction.interaction_channel.interaction_channel_participant.InteractionChannelParticipantInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams InteractionChannelParticipantInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.flex_api.v1.interaction.interaction_channel.interaction_channel_participant.InteractionChannelParticipantInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists InteractionChannelParticipantInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -89,11 +155,42 @@ class InteractionChannelParticipantList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.flex_api.v1.interaction.interaction_channel.interaction_channel_participant.InteractionChannelParticipantInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists InteractionChannelParticipantInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.flex_api.v1.interaction.interaction_channel.interaction_channel_participant.InteractionChannelParticipantInstance]
+        """
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -114,6 +211,25 @@ class InteractionChannelParticipantList(ListResource):
 
         return InteractionChannelParticipantPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of InteractionChannelParticipantInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of InteractionChannelParticipantInstance
+        :rtype: twilio.rest.flex_api.v1.interaction.interaction_channel.interaction_channel_participant.InteractionChannelParticipantPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return InteractionChannelParticipantPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of InteractionChannelParticipantInstance records from the API.
@@ -131,6 +247,23 @@ class InteractionChannelParticipantList(ListResource):
 
         return InteractionChannelParticipantPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of InteractionChannelParticipantInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of InteractionChannelParticipantInstance
+        :rtype: twilio.rest.flex_api.v1.interaction.interaction_channel.interaction_channel_participant.InteractionChannelParticipantPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return InteractionChannelParticipantPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a InteractionChannelParticipantContext
@@ -236,7 +369,7 @@ class InteractionChannelParticipantContext(InstanceContext):
 
         # Path Solution
         self._solution = {'interaction_sid': interaction_sid, 'channel_sid': channel_sid, 'sid': sid, }
-        self._uri = '/Interactions/{interaction_sid}/Channels/{channel_sid}/Participants/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Interactions/{interaction_sid}/Channels/{channel_sid}/Participants/{sid}', self._solution)
 
     def update(self, status):
         """
@@ -259,6 +392,27 @@ class InteractionChannelParticipantContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, status):
+        """
+        Asynchronous coroutine that updates the InteractionChannelParticipantInstance
+
+        :param InteractionChannelParticipantInstance.Status status: The Participant's status.
+
+        :returns: The updated InteractionChannelParticipantInstance
+        :rtype: twilio.rest.flex_api.v1.interaction.interaction_channel.interaction_channel_participant.InteractionChannelParticipantInstance
+        """
+        data = values.of({'Status': status, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return InteractionChannelParticipantInstance(
+            self._version,
+            payload,
+            interaction_sid=self._solution['interaction_sid'],
+            channel_sid=self._solution['channel_sid'],
+            sid=self._solution['sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -284,6 +438,17 @@ class InteractionChannelParticipantInstance(InstanceResource):
         AGENT = "agent"
         UNKNOWN = "unknown"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'type': 'type',
+        'interaction_sid': 'interaction_sid',
+        'channel_sid': 'channel_sid',
+        'url': 'url',
+    })
+
     def __init__(self, version, payload, interaction_sid, channel_sid, sid=None):
         """
         Initialize the InteractionChannelParticipantInstance
@@ -294,13 +459,7 @@ class InteractionChannelParticipantInstance(InstanceResource):
         super(InteractionChannelParticipantInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'type': payload.get('type'),
-            'interaction_sid': payload.get('interaction_sid'),
-            'channel_sid': payload.get('channel_sid'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -379,6 +538,17 @@ class InteractionChannelParticipantInstance(InstanceResource):
         """
         return self._proxy.update(status, )
 
+    async def update_async(self, status):
+        """
+        Asynchronous coroutine that updates the InteractionChannelParticipantInstance
+
+        :param InteractionChannelParticipantInstance.Status status: The Participant's status.
+
+        :returns: The updated InteractionChannelParticipantInstance
+        :rtype: twilio.rest.flex_api.v1.interaction.interaction_channel.interaction_channel_participant.InteractionChannelParticipantInstance
+        """
+        return await self._proxy.update_async(status, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -29,9 +29,9 @@ class WebChannelList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/WebChannels'.format(**self._solution)
+        self._uri = values.ResourceUri('/WebChannels', self._solution)
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams WebChannelInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -44,17 +44,57 @@ class WebChannelList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.flex_api.v1.web_channel.WebChannelInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams WebChannelInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.flex_api.v1.web_channel.WebChannelInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists WebChannelInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -66,11 +106,42 @@ class WebChannelList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.flex_api.v1.web_channel.WebChannelInstance]
+        """
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists WebChannelInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.flex_api.v1.web_channel.WebChannelInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -91,6 +162,25 @@ class WebChannelList(ListResource):
 
         return WebChannelPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of WebChannelInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of WebChannelInstance
+        :rtype: twilio.rest.flex_api.v1.web_channel.WebChannelPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return WebChannelPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of WebChannelInstance records from the API.
@@ -108,9 +198,26 @@ class WebChannelList(ListResource):
 
         return WebChannelPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of WebChannelInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of WebChannelInstance
+        :rtype: twilio.rest.flex_api.v1.web_channel.WebChannelPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return WebChannelPage(self._version, response, self._solution)
+
     def create(self, flex_flow_sid, identity, customer_friendly_name,
                chat_friendly_name, chat_unique_name=values.unset,
-               pre_engagement_data=values.unset):
+               pre_engagement_data=values.unset, deadline=None):
         """
         Create the WebChannelInstance
 
@@ -120,6 +227,8 @@ class WebChannelList(ListResource):
         :param unicode chat_friendly_name: The chat channel's friendly name
         :param unicode chat_unique_name: The chat channel's unique name
         :param unicode pre_engagement_data: The pre-engagement data
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created WebChannelInstance
         :rtype: twilio.rest.flex_api.v1.web_channel.WebChannelInstance
@@ -133,7 +242,38 @@ class WebChannelList(ListResource):
             'PreEngagementData': pre_engagement_data,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return WebChannelInstance(self._version, payload, )
+
+    async def create_async(self, flex_flow_sid, identity, customer_friendly_name,
+                           chat_friendly_name, chat_unique_name=values.unset,
+                           pre_engagement_data=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the WebChannelInstance
+
+        :param unicode flex_flow_sid: The SID of the Flex Flow
+        :param unicode identity: The chat identity
+        :param unicode customer_friendly_name: The chat participant's friendly name
+        :param unicode chat_friendly_name: The chat channel's friendly name
+        :param unicode chat_unique_name: The chat channel's unique name
+        :param unicode pre_engagement_data: The pre-engagement data
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created WebChannelInstance
+        :rtype: twilio.rest.flex_api.v1.web_channel.WebChannelInstance
+        """
+        data = values.of({
+            'FlexFlowSid': flex_flow_sid,
+            'Identity': identity,
+            'CustomerFriendlyName': customer_friendly_name,
+            'ChatFriendlyName': chat_friendly_name,
+            'ChatUniqueName': chat_unique_name,
+            'PreEngagementData': pre_engagement_data,
+        })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return WebChannelInstance(self._version, payload, )
 
@@ -223,7 +363,7 @@ class WebChannelContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/WebChannels/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/WebChannels/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -236,6 +376,17 @@ class WebChannelContext(InstanceContext):
 
         return WebChannelInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the WebChannelInstance
+
+        :returns: The fetched WebChannelInstance
+        :rtype: twilio.rest.flex_api.v1.web_channel.WebChannelInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return WebChannelInstance(self._version, payload, sid=self._solution['sid'], )
+
     def update(self, chat_status=values.unset, post_engagement_data=values.unset):
         """
         Update the WebChannelInstance
@@ -252,6 +403,22 @@ class WebChannelContext(InstanceContext):
 
         return WebChannelInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def update_async(self, chat_status=values.unset, post_engagement_data=values.unset):
+        """
+        Asynchronous coroutine that updates the WebChannelInstance
+
+        :param WebChannelInstance.ChatStatus chat_status: The chat status
+        :param unicode post_engagement_data: The post-engagement data
+
+        :returns: The updated WebChannelInstance
+        :rtype: twilio.rest.flex_api.v1.web_channel.WebChannelInstance
+        """
+        data = values.of({'ChatStatus': chat_status, 'PostEngagementData': post_engagement_data, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return WebChannelInstance(self._version, payload, sid=self._solution['sid'], )
+
     def delete(self):
         """
         Deletes the WebChannelInstance
@@ -261,6 +428,15 @@ class WebChannelContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the WebChannelInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -277,6 +453,24 @@ class WebChannelInstance(InstanceResource):
     class ChatStatus(object):
         INACTIVE = "inactive"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'flex_flow_sid': 'flex_flow_sid',
+        'sid': 'sid',
+        'url': 'url',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the WebChannelInstance
@@ -287,14 +481,7 @@ class WebChannelInstance(InstanceResource):
         super(WebChannelInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'flex_flow_sid': payload.get('flex_flow_sid'),
-            'sid': payload.get('sid'),
-            'url': payload.get('url'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -370,6 +557,15 @@ class WebChannelInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the WebChannelInstance
+
+        :returns: The fetched WebChannelInstance
+        :rtype: twilio.rest.flex_api.v1.web_channel.WebChannelInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, chat_status=values.unset, post_engagement_data=values.unset):
         """
         Update the WebChannelInstance
@@ -382,6 +578,18 @@ class WebChannelInstance(InstanceResource):
         """
         return self._proxy.update(chat_status=chat_status, post_engagement_data=post_engagement_data, )
 
+    async def update_async(self, chat_status=values.unset, post_engagement_data=values.unset):
+        """
+        Asynchronous coroutine that updates the WebChannelInstance
+
+        :param WebChannelInstance.ChatStatus chat_status: The chat status
+        :param unicode post_engagement_data: The post-engagement data
+
+        :returns: The updated WebChannelInstance
+        :rtype: twilio.rest.flex_api.v1.web_channel.WebChannelInstance
+        """
+        return await self._proxy.update_async(chat_status=chat_status, post_engagement_data=post_engagement_data, )
+
     def delete(self):
         """
         Deletes the WebChannelInstance
@@ -391,6 +599,15 @@ class WebChannelInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the WebChannelInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -6,8 +6,9 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base.version import Version
-from twilio.rest.frontline_api.v1.user import UserList
 
 
 class V1(Version):
@@ -29,6 +30,7 @@ class V1(Version):
         :rtype: twilio.rest.frontline_api.v1.user.UserList
         """
         if self._users is None:
+            from twilio.rest.frontline_api.v1.user import UserList
             self._users = UserList(self)
         return self._users
 
@@ -40,3 +42,19 @@ class V1(Version):
         :rtype: str
         """
         return '<Twilio.FrontlineApi.V1>'
+
+
+_LAZY_IMPORTS = {
+    'UserList': 'twilio.rest.frontline_api.v1.user',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -6,6 +6,7 @@ This code was generated by
       /       /
 """
 
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
@@ -121,7 +122,7 @@ class UserContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/Users/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Users/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -134,6 +135,17 @@ class UserContext(InstanceContext):
 
         return UserInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the UserInstance
+
+        :returns: The fetched UserInstance
+        :rtype: twilio.rest.frontline_api.v1.user.UserInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return UserInstance(self._version, payload, sid=self._solution['sid'], )
+
     def update(self, friendly_name=values.unset, avatar=values.unset,
                state=values.unset, is_available=values.unset):
         """
@@ -158,6 +170,30 @@ class UserContext(InstanceContext):
 
         return UserInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def update_async(self, friendly_name=values.unset, avatar=values.unset,
+                           state=values.unset, is_available=values.unset):
+        """
+        Asynchronous coroutine that updates the UserInstance
+
+        :param unicode friendly_name: The string that you assigned to describe the User
+        :param unicode avatar: The avatar URL which will be shown in Frontline application
+        :param UserInstance.StateType state: Current state of this user
+        :param bool is_available: Whether the User is available for new conversations
+
+        :returns: The updated UserInstance
+        :rtype: twilio.rest.frontline_api.v1.user.UserInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'Avatar': avatar,
+            'State': state,
+            'IsAvailable': is_available,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return UserInstance(self._version, payload, sid=self._solution['sid'], )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -177,6 +213,19 @@ class UserInstance(InstanceResource):
         ACTIVE = "active"
         DEACTIVATED = "deactivated"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'identity': 'identity',
+        'friendly_name': 'friendly_name',
+        'avatar': 'avatar',
+        'state': 'state',
+        'is_available': 'is_available',
+        'url': 'url',
+    })
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the UserInstance
@@ -187,15 +236,7 @@ class UserInstance(InstanceResource):
         super(UserInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'identity': payload.get('identity'),
-            'friendly_name': payload.get('friendly_name'),
-            'avatar': payload.get('avatar'),
-            'state': payload.get('state'),
-            'is_available': payload.get('is_available'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -279,6 +320,15 @@ class UserInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the UserInstance
+
+        :returns: The fetched UserInstance
+        :rtype: twilio.rest.frontline_api.v1.user.UserInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, friendly_name=values.unset, avatar=values.unset,
                state=values.unset, is_available=values.unset):
         """
@@ -299,6 +349,26 @@ class UserInstance(InstanceResource):
             is_available=is_available,
         )
 
+    async def update_async(self, friendly_name=values.unset, avatar=values.unset,
+                           state=values.unset, is_available=values.unset):
+        """
+        Asynchronous coroutine that updates the UserInstance
+
+        :param unicode friendly_name: The string that you assigned to describe the User
+        :param unicode avatar: The avatar URL which will be shown in Frontline application
+        :param UserInstance.StateType state: Current state of this user
+        :param bool is_available: Whether the User is available for new conversations
+
+        :returns: The updated UserInstance
+        :rtype: twilio.rest.frontline_api.v1.user.UserInstance
+        """
+        return await self._proxy.update_async(
+            friendly_name=friendly_name,
+            avatar=avatar,
+            state=state,
+            is_available=is_available,
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
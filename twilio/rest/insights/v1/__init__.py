@@ -6,13 +6,9 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base.version import Version
-from twilio.rest.insights.v1.annotation import AnnotationList
-from twilio.rest.insights.v1.call import CallList
-from twilio.rest.insights.v1.call_summaries import CallSummariesList
-from twilio.rest.insights.v1.conference import ConferenceList
-from twilio.rest.insights.v1.room import RoomList
-from twilio.rest.insights.v1.setting import SettingList
 
 
 class V1(Version):
@@ -39,6 +35,7 @@ class V1(Version):
         :rtype: twilio.rest.insights.v1.setting.SettingList
         """
         if self._settings is None:
+            from twilio.rest.insights.v1.setting import SettingList
             self._settings = SettingList(self)
         return self._settings
 
@@ -48,6 +45,7 @@ class V1(Version):
         :rtype: twilio.rest.insights.v1.annotation.AnnotationList
         """
         if self._annotation is None:
+            from twilio.rest.insights.v1.annotation import AnnotationList
             self._annotation = AnnotationList(self)
         return self._annotation
 
@@ -57,6 +55,7 @@ class V1(Version):
         :rtype: twilio.rest.insights.v1.call.CallList
         """
         if self._calls is None:
+            from twilio.rest.insights.v1.call import CallList
             self._calls = CallList(self)
         return self._calls
 
@@ -66,6 +65,7 @@ class V1(Version):
         :rtype: twilio.rest.insights.v1.call_summaries.CallSummariesList
         """
         if self._call_summaries is None:
+            from twilio.rest.insights.v1.call_summaries import CallSummariesList
             self._call_summaries = CallSummariesList(self)
         return self._call_summaries
 
@@ -75,6 +75,7 @@ class V1(Version):
         :rtype: twilio.rest.insights.v1.conference.ConferenceList
         """
         if self._conferences is None:
+            from twilio.rest.insights.v1.conference import ConferenceList
             self._conferences = ConferenceList(self)
         return self._conferences
 
@@ -84,6 +85,7 @@ class V1(Version):
         :rtype: twilio.rest.insights.v1.room.RoomList
         """
         if self._rooms is None:
+            from twilio.rest.insights.v1.room import RoomList
             self._rooms = RoomList(self)
         return self._rooms
 
@@ -95,3 +97,24 @@ class V1(Version):
         :rtype: str
         """
         return '<Twilio.Insights.V1>'
+
+
+_LAZY_IMPORTS = {
+    'AnnotationList': 'twilio.rest.insights.v1.annotation',
+    'CallList': 'twilio.rest.insights.v1.call',
+    'CallSummariesList': 'twilio.rest.insights.v1.call_summaries',
+    'ConferenceList': 'twilio.rest.insights.v1.conference',
+    'RoomList': 'twilio.rest.insights.v1.room',
+    'SettingList': 'twilio.rest.insights.v1.setting',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -116,7 +116,7 @@ class AnnotationContext(InstanceContext):
 
         # Path Solution
         self._solution = {'call_sid': call_sid, }
-        self._uri = '/Voice/{call_sid}/Annotation'.format(**self._solution)
+        self._uri = values.ResourceUri('/Voice/{call_sid}/Annotation', self._solution)
 
     def update(self, answered_by=values.unset, connectivity_issue=values.unset,
                quality_issues=values.unset, spam=values.unset,
@@ -150,6 +150,38 @@ class AnnotationContext(InstanceContext):
 
         return AnnotationInstance(self._version, payload, call_sid=self._solution['call_sid'], )
 
+    async def update_async(self, answered_by=values.unset, connectivity_issue=values.unset,
+                           quality_issues=values.unset, spam=values.unset,
+                           call_score=values.unset, comment=values.unset,
+                           incident=values.unset):
+        """
+        Asynchronous coroutine that updates the AnnotationInstance
+
+        :param AnnotationInstance.AnsweredBy answered_by: The answered_by
+        :param AnnotationInstance.ConnectivityIssue connectivity_issue: The connectivity_issue
+        :param unicode quality_issues: The quality_issues
+        :param bool spam: The spam
+        :param unicode call_score: The call_score
+        :param unicode comment: The comment
+        :param unicode incident: The incident
+
+        :returns: The updated AnnotationInstance
+        :rtype: twilio.rest.insights.v1.annotation.AnnotationInstance
+        """
+        data = values.of({
+            'AnsweredBy': answered_by,
+            'ConnectivityIssue': connectivity_issue,
+            'QualityIssues': quality_issues,
+            'Spam': spam,
+            'CallScore': call_score,
+            'Comment': comment,
+            'Incident': incident,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return AnnotationInstance(self._version, payload, call_sid=self._solution['call_sid'], )
+
     def fetch(self):
         """
         Fetch the AnnotationInstance
@@ -161,6 +193,17 @@ class AnnotationContext(InstanceContext):
 
         return AnnotationInstance(self._version, payload, call_sid=self._solution['call_sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the AnnotationInstance
+
+        :returns: The fetched AnnotationInstance
+        :rtype: twilio.rest.insights.v1.annotation.AnnotationInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return AnnotationInstance(self._version, payload, call_sid=self._solution['call_sid'], )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -198,6 +241,27 @@ class AnnotationInstance(InstanceResource):
         OWA = "owa"
         STATIC_NOISE = "static_noise"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'call_score': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'call_sid': 'call_sid',
+        'account_sid': 'account_sid',
+        'answered_by': 'answered_by',
+        'connectivity_issue': 'connectivity_issue',
+        'quality_issues': 'quality_issues',
+        'spam': 'spam',
+        'call_score': 'call_score',
+        'comment': 'comment',
+        'incident': 'incident',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload, call_sid=None):
         """
         Initialize the AnnotationInstance
@@ -208,18 +272,7 @@ class AnnotationInstance(InstanceResource):
         super(AnnotationInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'call_sid': payload.get('call_sid'),
-            'account_sid': payload.get('account_sid'),
-            'answered_by': payload.get('answered_by'),
-            'connectivity_issue': payload.get('connectivity_issue'),
-            'quality_issues': payload.get('quality_issues'),
-            'spam': payload.get('spam'),
-            'call_score': deserialize.integer(payload.get('call_score')),
-            'comment': payload.get('comment'),
-            'incident': payload.get('incident'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -346,6 +399,34 @@ class AnnotationInstance(InstanceResource):
             incident=incident,
         )
 
+    async def update_async(self, answered_by=values.unset, connectivity_issue=values.unset,
+                           quality_issues=values.unset, spam=values.unset,
+                           call_score=values.unset, comment=values.unset,
+                           incident=values.unset):
+        """
+        Asynchronous coroutine that updates the AnnotationInstance
+
+        :param AnnotationInstance.AnsweredBy answered_by: The answered_by
+        :param AnnotationInstance.ConnectivityIssue connectivity_issue: The connectivity_issue
+        :param unicode quality_issues: The quality_issues
+        :param bool spam: The spam
+        :param unicode call_score: The call_score
+        :param unicode comment: The comment
+        :param unicode incident: The incident
+
+        :returns: The updated AnnotationInstance
+        :rtype: twilio.rest.insights.v1.annotation.AnnotationInstance
+        """
+        return await self._proxy.update_async(
+            answered_by=answered_by,
+            connectivity_issue=connectivity_issue,
+            quality_issues=quality_issues,
+            spam=spam,
+            call_score=call_score,
+            comment=comment,
+            incident=incident,
+        )
+
     def fetch(self):
         """
         Fetch the AnnotationInstance
@@ -355,6 +436,15 @@ class AnnotationInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the AnnotationInstance
+
+        :returns: The fetched AnnotationInstance
+        :rtype: twilio.rest.insights.v1.annotation.AnnotationInstance
+        """
+        return await self._proxy.fetch_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -6,14 +6,14 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.insights.v1.call.event import EventList
-from twilio.rest.insights.v1.call.metric import MetricList
-from twilio.rest.insights.v1.call.summary import CallSummaryList
 
 
 class CallList(ListResource):
@@ -127,7 +127,7 @@ class CallContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/Voice/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Voice/{sid}', self._solution)
 
         # Dependents
         self._events = None
@@ -145,6 +145,17 @@ class CallContext(InstanceContext):
 
         return CallInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the CallInstance
+
+        :returns: The fetched CallInstance
+        :rtype: twilio.rest.insights.v1.call.CallInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return CallInstance(self._version, payload, sid=self._solution['sid'], )
+
     @property
     def events(self):
         """
@@ -154,6 +165,7 @@ class CallContext(InstanceContext):
         :rtype: twilio.rest.insights.v1.call.event.EventList
         """
         if self._events is None:
+            from twilio.rest.insights.v1.call.event import EventList
             self._events = EventList(self._version, call_sid=self._solution['sid'], )
         return self._events
 
@@ -166,6 +178,7 @@ class CallContext(InstanceContext):
         :rtype: twilio.rest.insights.v1.call.metric.MetricList
         """
         if self._metrics is None:
+            from twilio.rest.insights.v1.call.metric import MetricList
             self._metrics = MetricList(self._version, call_sid=self._solution['sid'], )
         return self._metrics
 
@@ -178,6 +191,7 @@ class CallContext(InstanceContext):
         :rtype: twilio.rest.insights.v1.call.summary.CallSummaryList
         """
         if self._summary is None:
+            from twilio.rest.insights.v1.call.summary import CallSummaryList
             self._summary = CallSummaryList(self._version, call_sid=self._solution['sid'], )
         return self._summary
 
@@ -197,6 +211,15 @@ class CallInstance(InstanceResource):
     to change. Use them with caution. If you currently do not have developer
     preview access, please contact help@twilio.com. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'url': 'url',
+        'links': 'links',
+    })
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the CallInstance
@@ -207,11 +230,7 @@ class CallInstance(InstanceResource):
         super(CallInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -263,6 +282,15 @@ class CallInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the CallInstance
+
+        :returns: The fetched CallInstance
+        :rtype: twilio.rest.insights.v1.call.CallInstance
+        """
+        return await self._proxy.fetch_async()
+
     @property
     def events(self):
         """
@@ -302,3 +330,21 @@ class CallInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Insights.V1.CallInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'CallSummaryList': 'twilio.rest.insights.v1.call.summary',
+    'EventList': 'twilio.rest.insights.v1.call.event',
+    'MetricList': 'twilio.rest.insights.v1.call.metric',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
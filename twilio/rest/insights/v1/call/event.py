@@ -6,6 +6,7 @@ This code was generated by
       /       /
 """
 
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
@@ -31,9 +32,10 @@ class EventList(ListResource):
 
         # Path Solution
         self._solution = {'call_sid': call_sid, }
-        self._uri = '/Voice/{call_sid}/Events'.format(**self._solution)
+        self._uri = values.ResourceUri('/Voice/{call_sid}/Events', self._solution)
 
-    def stream(self, edge=values.unset, limit=None, page_size=None):
+    def stream(self, edge=values.unset, limit=None, page_size=None,
+               prefetch=None, raw=False, deadline=None):
         """
         Streams EventInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -47,17 +49,59 @@ class EventList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.insights.v1.call.event.EventInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(edge=edge, page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(edge=edge, page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, edge=values.unset, limit=None, page_size=None):
+    async def stream_async(self, edge=values.unset, limit=None, page_size=None,
+                           prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams EventInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param EventInstance.TwilioEdge edge: The edge
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.insights.v1.call.event.EventInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(edge=edge, page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, edge=values.unset, limit=None, page_size=None,
+             prefetch=None, raw=False, deadline=None):
         """
         Lists EventInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -70,11 +114,43 @@ class EventList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.insights.v1.call.event.EventInstance]
         """
-        return list(self.stream(edge=edge, limit=limit, page_size=page_size, ))
+        return list(self.stream(edge=edge, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, edge=values.unset, limit=None, page_size=None,
+                         prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists EventInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param EventInstance.TwilioEdge edge: The edge
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.insights.v1.call.event.EventInstance]
+        """
+        return [record async for record in await self.stream_async(edge=edge, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, edge=values.unset, page_token=values.unset,
              page_number=values.unset, page_size=values.unset):
@@ -101,6 +177,31 @@ class EventList(ListResource):
 
         return EventPage(self._version, response, self._solution)
 
+    async def page_async(self, edge=values.unset, page_token=values.unset,
+                         page_number=values.unset, page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of EventInstance records from the API.
+        Request is executed immediately
+
+        :param EventInstance.TwilioEdge edge: The edge
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of EventInstance
+        :rtype: twilio.rest.insights.v1.call.event.EventPage
+        """
+        data = values.of({
+            'Edge': edge,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return EventPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of EventInstance records from the API.
@@ -118,6 +219,23 @@ class EventList(ListResource):
 
         return EventPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of EventInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of EventInstance
+        :rtype: twilio.rest.insights.v1.call.event.EventPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return EventPage(self._version, response, self._solution)
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -189,6 +307,23 @@ class EventInstance(InstanceResource):
         WARNING = "WARNING"
         ERROR = "ERROR"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'timestamp': 'timestamp',
+        'call_sid': 'call_sid',
+        'account_sid': 'account_sid',
+        'edge': 'edge',
+        'group': 'group',
+        'level': 'level',
+        'name': 'name',
+        'carrier_edge': 'carrier_edge',
+        'sip_edge': 'sip_edge',
+        'sdk_edge': 'sdk_edge',
+        'client_edge': 'client_edge',
+    })
+
     def __init__(self, version, payload, call_sid):
         """
         Initialize the EventInstance
@@ -199,19 +334,7 @@ class EventInstance(InstanceResource):
         super(EventInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'timestamp': payload.get('timestamp'),
-            'call_sid': payload.get('call_sid'),
-            'account_sid': payload.get('account_sid'),
-            'edge': payload.get('edge'),
-            'group': payload.get('group'),
-            'level': payload.get('level'),
-            'name': payload.get('name'),
-            'carrier_edge': payload.get('carrier_edge'),
-            'sip_edge': payload.get('sip_edge'),
-            'sdk_edge': payload.get('sdk_edge'),
-            'client_edge': payload.get('client_edge'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
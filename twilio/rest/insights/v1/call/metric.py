@@ -6,6 +6,7 @@ This code was generated by
       /       /
 """
 
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
@@ -31,10 +32,10 @@ class MetricList(ListResource):
 
         # Path Solution
         self._solution = {'call_sid': call_sid, }
-        self._uri = '/Voice/{call_sid}/Metrics'.format(**self._solution)
+        self._uri = values.ResourceUri('/Voice/{call_sid}/Metrics', self._solution)
 
     def stream(self, edge=values.unset, direction=values.unset, limit=None,
-               page_size=None):
+               page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams MetricInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -49,18 +50,60 @@ class MetricList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.insights.v1.call.metric.MetricInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(edge=edge, direction=direction, page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(edge=edge, direction=direction, page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, edge=values.unset, direction=values.unset, limit=None,
+                           page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams MetricInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param MetricInstance.TwilioEdge edge: The edge
+        :param MetricInstance.StreamDirection direction: The direction
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.insights.v1.call.metric.MetricInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(edge=edge, direction=direction, page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, edge=values.unset, direction=values.unset, limit=None,
-             page_size=None):
+             page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists MetricInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -74,11 +117,44 @@ class MetricList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.insights.v1.call.metric.MetricInstance]
         """
-        return list(self.stream(edge=edge, direction=direction, limit=limit, page_size=page_size, ))
+        return list(self.stream(edge=edge, direction=direction, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, edge=values.unset, direction=values.unset, limit=None,
+                         page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists MetricInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param MetricInstance.TwilioEdge edge: The edge
+        :param MetricInstance.StreamDirection direction: The direction
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.insights.v1.call.metric.MetricInstance]
+        """
+        return [record async for record in await self.stream_async(edge=edge, direction=direction, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, edge=values.unset, direction=values.unset,
              page_token=values.unset, page_number=values.unset,
@@ -108,6 +184,34 @@ class MetricList(ListResource):
 
         return MetricPage(self._version, response, self._solution)
 
+    async def page_async(self, edge=values.unset, direction=values.unset,
+                         page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of MetricInstance records from the API.
+        Request is executed immediately
+
+        :param MetricInstance.TwilioEdge edge: The edge
+        :param MetricInstance.StreamDirection direction: The direction
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of MetricInstance
+        :rtype: twilio.rest.insights.v1.call.metric.MetricPage
+        """
+        data = values.of({
+            'Edge': edge,
+            'Direction': direction,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return MetricPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of MetricInstance records from the API.
@@ -125,6 +229,23 @@ class MetricList(ListResource):
 
         return MetricPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of MetricInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of MetricInstance
+        :rtype: twilio.rest.insights.v1.call.metric.MetricPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return MetricPage(self._version, response, self._solution)
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -195,6 +316,21 @@ class MetricInstance(InstanceResource):
         OUTBOUND = "outbound"
         BOTH = "both"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'timestamp': 'timestamp',
+        'call_sid': 'call_sid',
+        'account_sid': 'account_sid',
+        'edge': 'edge',
+        'direction': 'direction',
+        'carrier_edge': 'carrier_edge',
+        'sip_edge': 'sip_edge',
+        'sdk_edge': 'sdk_edge',
+        'client_edge': 'client_edge',
+    })
+
     def __init__(self, version, payload, call_sid):
         """
         Initialize the MetricInstance
@@ -205,17 +341,7 @@ class MetricInstance(InstanceResource):
         super(MetricInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'timestamp': payload.get('timestamp'),
-            'call_sid': payload.get('call_sid'),
-            'account_sid': payload.get('account_sid'),
-            'edge': payload.get('edge'),
-            'direction': payload.get('direction'),
-            'carrier_edge': payload.get('carrier_edge'),
-            'sip_edge': payload.get('sip_edge'),
-            'sdk_edge': payload.get('sdk_edge'),
-            'client_edge': payload.get('client_edge'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
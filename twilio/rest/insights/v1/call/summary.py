@@ -114,7 +114,7 @@ class CallSummaryContext(InstanceContext):
 
         # Path Solution
         self._solution = {'call_sid': call_sid, }
-        self._uri = '/Voice/{call_sid}/Summary'.format(**self._solution)
+        self._uri = values.ResourceUri('/Voice/{call_sid}/Summary', self._solution)
 
     def fetch(self, processing_state=values.unset):
         """
@@ -131,6 +131,21 @@ class CallSummaryContext(InstanceContext):
 
         return CallSummaryInstance(self._version, payload, call_sid=self._solution['call_sid'], )
 
+    async def fetch_async(self, processing_state=values.unset):
+        """
+        Asynchronous coroutine that fetches the CallSummaryInstance
+
+        :param CallSummaryInstance.ProcessingState processing_state: The processing_state
+
+        :returns: The fetched CallSummaryInstance
+        :rtype: twilio.rest.insights.v1.call.summary.CallSummaryInstance
+        """
+        data = values.of({'ProcessingState': processing_state, })
+
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, params=data, )
+
+        return CallSummaryInstance(self._version, payload, call_sid=self._solution['call_sid'], )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -164,6 +179,42 @@ class CallSummaryInstance(InstanceResource):
         COMPLETE = "complete"
         PARTIAL = "partial"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'created_time': deserialize.iso8601_datetime,
+        'start_time': deserialize.iso8601_datetime,
+        'end_time': deserialize.iso8601_datetime,
+        'duration': deserialize.integer,
+        'connect_duration': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'call_sid': 'call_sid',
+        'call_type': 'call_type',
+        'call_state': 'call_state',
+        'processing_state': 'processing_state',
+        'created_time': 'created_time',
+        'start_time': 'start_time',
+        'end_time': 'end_time',
+        'duration': 'duration',
+        'connect_duration': 'connect_duration',
+        'from_': 'from',
+        'to': 'to',
+        'carrier_edge': 'carrier_edge',
+        'client_edge': 'client_edge',
+        'sdk_edge': 'sdk_edge',
+        'sip_edge': 'sip_edge',
+        'tags': 'tags',
+        'url': 'url',
+        'attributes': 'attributes',
+        'properties': 'properties',
+        'trust': 'trust',
+    }, _deserializers)
+
     def __init__(self, version, payload, call_sid):
         """
         Initialize the CallSummaryInstance
@@ -174,29 +225,7 @@ class CallSummaryInstance(InstanceResource):
         super(CallSummaryInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'call_sid': payload.get('call_sid'),
-            'call_type': payload.get('call_type'),
-            'call_state': payload.get('call_state'),
-            'processing_state': payload.get('processing_state'),
-            'created_time': deserialize.iso8601_datetime(payload.get('created_time')),
-            'start_time': deserialize.iso8601_datetime(payload.get('start_time')),
-            'end_time': deserialize.iso8601_datetime(payload.get('end_time')),
-            'duration': deserialize.integer(payload.get('duration')),
-            'connect_duration': deserialize.integer(payload.get('connect_duration')),
-            'from_': payload.get('from'),
-            'to': payload.get('to'),
-            'carrier_edge': payload.get('carrier_edge'),
-            'client_edge': payload.get('client_edge'),
-            'sdk_edge': payload.get('sdk_edge'),
-            'sip_edge': payload.get('sip_edge'),
-            'tags': payload.get('tags'),
-            'url': payload.get('url'),
-            'attributes': payload.get('attributes'),
-            'properties': payload.get('properties'),
-            'trust': payload.get('trust'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -394,6 +423,17 @@ class CallSummaryInstance(InstanceResource):
         """
         return self._proxy.fetch(processing_state=processing_state, )
 
+    async def fetch_async(self, processing_state=values.unset):
+        """
+        Asynchronous coroutine that fetches the CallSummaryInstance
+
+        :param CallSummaryInstance.ProcessingState processing_state: The processing_state
+
+        :returns: The fetched CallSummaryInstance
+        :rtype: twilio.rest.insights.v1.call.summary.CallSummaryInstance
+        """
+        return await self._proxy.fetch_async(processing_state=processing_state, )
+
     def __repr__(self):
         """
         Provide a friendly representation
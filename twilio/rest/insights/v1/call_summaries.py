@@ -28,7 +28,7 @@ class CallSummariesList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Voice/Summaries'.format(**self._solution)
+        self._uri = values.ResourceUri('/Voice/Summaries', self._solution)
 
     def stream(self, from_=values.unset, to=values.unset, from_carrier=values.unset,
                to_carrier=values.unset, from_country_code=values.unset,
@@ -38,7 +38,8 @@ class CallSummariesList(ListResource):
                call_type=values.unset, call_state=values.unset,
                direction=values.unset, processing_state=values.unset,
                sort_by=values.unset, subaccount=values.unset,
-               abnormal_session=values.unset, limit=None, page_size=None):
+               abnormal_session=values.unset, limit=None, page_size=None,
+               prefetch=None, raw=False, deadline=None):
         """
         Streams CallSummariesInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -69,13 +70,171 @@ class CallSummariesList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.insights.v1.call_summaries.CallSummariesInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                from_=from_,
+                to=to,
+                from_carrier=from_carrier,
+                to_carrier=to_carrier,
+                from_country_code=from_country_code,
+                to_country_code=to_country_code,
+                branded=branded,
+                verified_caller=verified_caller,
+                has_tag=has_tag,
+                start_time=start_time,
+                end_time=end_time,
+                call_type=call_type,
+                call_state=call_state,
+                direction=direction,
+                processing_state=processing_state,
+                sort_by=sort_by,
+                subaccount=subaccount,
+                abnormal_session=abnormal_session,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, from_=values.unset, to=values.unset, from_carrier=values.unset,
+                           to_carrier=values.unset, from_country_code=values.unset,
+                           to_country_code=values.unset, branded=values.unset,
+                           verified_caller=values.unset, has_tag=values.unset,
+                           start_time=values.unset, end_time=values.unset,
+                           call_type=values.unset, call_state=values.unset,
+                           direction=values.unset, processing_state=values.unset,
+                           sort_by=values.unset, subaccount=values.unset,
+                           abnormal_session=values.unset, limit=None, page_size=None,
+                           prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams CallSummariesInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param unicode from_: The from
+        :param unicode to: The to
+        :param unicode from_carrier: The from_carrier
+        :param unicode to_carrier: The to_carrier
+        :param unicode from_country_code: The from_country_code
+        :param unicode to_country_code: The to_country_code
+        :param bool branded: The branded
+        :param bool verified_caller: The verified_caller
+        :param bool has_tag: The has_tag
+        :param unicode start_time: The start_time
+        :param unicode end_time: The end_time
+        :param unicode call_type: The call_type
+        :param unicode call_state: The call_state
+        :param unicode direction: The direction
+        :param CallSummariesInstance.ProcessingStateRequest processing_state: The processing_state
+        :param CallSummariesInstance.SortBy sort_by: The sort_by
+        :param unicode subaccount: The subaccount
+        :param bool abnormal_session: The abnormal_session
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.insights.v1.call_summaries.CallSummariesInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                from_=from_,
+                to=to,
+                from_carrier=from_carrier,
+                to_carrier=to_carrier,
+                from_country_code=from_country_code,
+                to_country_code=to_country_code,
+                branded=branded,
+                verified_caller=verified_caller,
+                has_tag=has_tag,
+                start_time=start_time,
+                end_time=end_time,
+                call_type=call_type,
+                call_state=call_state,
+                direction=direction,
+                processing_state=processing_state,
+                sort_by=sort_by,
+                subaccount=subaccount,
+                abnormal_session=abnormal_session,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, from_=values.unset, to=values.unset, from_carrier=values.unset,
+             to_carrier=values.unset, from_country_code=values.unset,
+             to_country_code=values.unset, branded=values.unset,
+             verified_caller=values.unset, has_tag=values.unset,
+             start_time=values.unset, end_time=values.unset, call_type=values.unset,
+             call_state=values.unset, direction=values.unset,
+             processing_state=values.unset, sort_by=values.unset,
+             subaccount=values.unset, abnormal_session=values.unset, limit=None,
+             page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Lists CallSummariesInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param unicode from_: The from
+        :param unicode to: The to
+        :param unicode from_carrier: The from_carrier
+        :param unicode to_carrier: The to_carrier
+        :param unicode from_country_code: The from_country_code
+        :param unicode to_country_code: The to_country_code
+        :param bool branded: The branded
+        :param bool verified_caller: The verified_caller
+        :param bool has_tag: The has_tag
+        :param unicode start_time: The start_time
+        :param unicode end_time: The end_time
+        :param unicode call_type: The call_type
+        :param unicode call_state: The call_state
+        :param unicode direction: The direction
+        :param CallSummariesInstance.ProcessingStateRequest processing_state: The processing_state
+        :param CallSummariesInstance.SortBy sort_by: The sort_by
+        :param unicode subaccount: The subaccount
+        :param bool abnormal_session: The abnormal_session
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.insights.v1.call_summaries.CallSummariesInstance]
+        """
+        return list(self.stream(
             from_=from_,
             to=to,
             from_carrier=from_carrier,
@@ -94,22 +253,24 @@ class CallSummariesList(ListResource):
             sort_by=sort_by,
             subaccount=subaccount,
             abnormal_session=abnormal_session,
-            page_size=limits['page_size'],
-        )
-
-        return self._version.stream(page, limits['limit'])
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        ))
 
-    def list(self, from_=values.unset, to=values.unset, from_carrier=values.unset,
-             to_carrier=values.unset, from_country_code=values.unset,
-             to_country_code=values.unset, branded=values.unset,
-             verified_caller=values.unset, has_tag=values.unset,
-             start_time=values.unset, end_time=values.unset, call_type=values.unset,
-             call_state=values.unset, direction=values.unset,
-             processing_state=values.unset, sort_by=values.unset,
-             subaccount=values.unset, abnormal_session=values.unset, limit=None,
-             page_size=None):
-        """
-        Lists CallSummariesInstance records from the API as a list.
+    async def list_async(self, from_=values.unset, to=values.unset, from_carrier=values.unset,
+                         to_carrier=values.unset, from_country_code=values.unset,
+                         to_country_code=values.unset, branded=values.unset,
+                         verified_caller=values.unset, has_tag=values.unset,
+                         start_time=values.unset, end_time=values.unset, call_type=values.unset,
+                         call_state=values.unset, direction=values.unset,
+                         processing_state=values.unset, sort_by=values.unset,
+                         subaccount=values.unset, abnormal_session=values.unset, limit=None,
+                         page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists CallSummariesInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
         memory before returning.
 
@@ -137,11 +298,17 @@ class CallSummariesList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.insights.v1.call_summaries.CallSummariesInstance]
         """
-        return list(self.stream(
+        return [record async for record in await self.stream_async(
             from_=from_,
             to=to,
             from_carrier=from_carrier,
@@ -162,7 +329,10 @@ class CallSummariesList(ListResource):
             abnormal_session=abnormal_session,
             limit=limit,
             page_size=page_size,
-        ))
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
 
     def page(self, from_=values.unset, to=values.unset, from_carrier=values.unset,
              to_carrier=values.unset, from_country_code=values.unset,
@@ -231,6 +401,73 @@ class CallSummariesList(ListResource):
 
         return CallSummariesPage(self._version, response, self._solution)
 
+    async def page_async(self, from_=values.unset, to=values.unset, from_carrier=values.unset,
+                         to_carrier=values.unset, from_country_code=values.unset,
+                         to_country_code=values.unset, branded=values.unset,
+                         verified_caller=values.unset, has_tag=values.unset,
+                         start_time=values.unset, end_time=values.unset, call_type=values.unset,
+                         call_state=values.unset, direction=values.unset,
+                         processing_state=values.unset, sort_by=values.unset,
+                         subaccount=values.unset, abnormal_session=values.unset,
+                         page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of CallSummariesInstance records from the API.
+        Request is executed immediately
+
+        :param unicode from_: The from
+        :param unicode to: The to
+        :param unicode from_carrier: The from_carrier
+        :param unicode to_carrier: The to_carrier
+        :param unicode from_country_code: The from_country_code
+        :param unicode to_country_code: The to_country_code
+        :param bool branded: The branded
+        :param bool verified_caller: The verified_caller
+        :param bool has_tag: The has_tag
+        :param unicode start_time: The start_time
+        :param unicode end_time: The end_time
+        :param unicode call_type: The call_type
+        :param unicode call_state: The call_state
+        :param unicode direction: The direction
+        :param CallSummariesInstance.ProcessingStateRequest processing_state: The processing_state
+        :param CallSummariesInstance.SortBy sort_by: The sort_by
+        :param unicode subaccount: The subaccount
+        :param bool abnormal_session: The abnormal_session
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of CallSummariesInstance
+        :rtype: twilio.rest.insights.v1.call_summaries.CallSummariesPage
+        """
+        data = values.of({
+            'From': from_,
+            'To': to,
+            'FromCarrier': from_carrier,
+            'ToCarrier': to_carrier,
+            'FromCountryCode': from_country_code,
+            'ToCountryCode': to_country_code,
+            'Branded': branded,
+            'VerifiedCaller': verified_caller,
+            'HasTag': has_tag,
+            'StartTime': start_time,
+            'EndTime': end_time,
+            'CallType': call_type,
+            'CallState': call_state,
+            'Direction': direction,
+            'ProcessingState': processing_state,
+            'SortBy': sort_by,
+            'Subaccount': subaccount,
+            'AbnormalSession': abnormal_session,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return CallSummariesPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of CallSummariesInstance records from the API.
@@ -248,6 +485,23 @@ class CallSummariesList(ListResource):
 
         return CallSummariesPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of CallSummariesInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of CallSummariesInstance
+        :rtype: twilio.rest.insights.v1.call_summaries.CallSummariesPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return CallSummariesPage(self._version, response, self._solution)
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -335,6 +589,42 @@ class CallSummariesInstance(InstanceResource):
         PARTIAL = "partial"
         ALL = "all"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'created_time': deserialize.iso8601_datetime,
+        'start_time': deserialize.iso8601_datetime,
+        'end_time': deserialize.iso8601_datetime,
+        'duration': deserialize.integer,
+        'connect_duration': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'call_sid': 'call_sid',
+        'call_type': 'call_type',
+        'call_state': 'call_state',
+        'processing_state': 'processing_state',
+        'created_time': 'created_time',
+        'start_time': 'start_time',
+        'end_time': 'end_time',
+        'duration': 'duration',
+        'connect_duration': 'connect_duration',
+        'from_': 'from',
+        'to': 'to',
+        'carrier_edge': 'carrier_edge',
+        'client_edge': 'client_edge',
+        'sdk_edge': 'sdk_edge',
+        'sip_edge': 'sip_edge',
+        'tags': 'tags',
+        'url': 'url',
+        'attributes': 'attributes',
+        'properties': 'properties',
+        'trust': 'trust',
+    }, _deserializers)
+
     def __init__(self, version, payload):
         """
         Initialize the CallSummariesInstance
@@ -345,29 +635,7 @@ class CallSummariesInstance(InstanceResource):
         super(CallSummariesInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'call_sid': payload.get('call_sid'),
-            'call_type': payload.get('call_type'),
-            'call_state': payload.get('call_state'),
-            'processing_state': payload.get('processing_state'),
-            'created_time': deserialize.iso8601_datetime(payload.get('created_time')),
-            'start_time': deserialize.iso8601_datetime(payload.get('start_time')),
-            'end_time': deserialize.iso8601_datetime(payload.get('end_time')),
-            'duration': deserialize.integer(payload.get('duration')),
-            'connect_duration': deserialize.integer(payload.get('connect_duration')),
-            'from_': payload.get('from'),
-            'to': payload.get('to'),
-            'carrier_edge': payload.get('carrier_edge'),
-            'client_edge': payload.get('client_edge'),
-            'sdk_edge': payload.get('sdk_edge'),
-            'sip_edge': payload.get('sip_edge'),
-            'tags': payload.get('tags'),
-            'url': payload.get('url'),
-            'attributes': payload.get('attributes'),
-            'properties': payload.get('properties'),
-            'trust': payload.get('trust'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -6,13 +6,14 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.insights.v1.conference.conference_participant import ConferenceParticipantList
 
 
 class ConferenceList(ListResource):
@@ -30,14 +31,14 @@ class ConferenceList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Conferences'.format(**self._solution)
+        self._uri = values.ResourceUri('/Conferences', self._solution)
 
     def stream(self, conference_sid=values.unset, friendly_name=values.unset,
                status=values.unset, created_after=values.unset,
                created_before=values.unset, mixer_region=values.unset,
                tags=values.unset, subaccount=values.unset,
                detected_issues=values.unset, end_reason=values.unset, limit=None,
-               page_size=None):
+               page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams ConferenceInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -60,13 +61,132 @@ class ConferenceList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.insights.v1.conference.ConferenceInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                conference_sid=conference_sid,
+                friendly_name=friendly_name,
+                status=status,
+                created_after=created_after,
+                created_before=created_before,
+                mixer_region=mixer_region,
+                tags=tags,
+                subaccount=subaccount,
+                detected_issues=detected_issues,
+                end_reason=end_reason,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, conference_sid=values.unset, friendly_name=values.unset,
+                           status=values.unset, created_after=values.unset,
+                           created_before=values.unset, mixer_region=values.unset,
+                           tags=values.unset, subaccount=values.unset,
+                           detected_issues=values.unset, end_reason=values.unset, limit=None,
+                           page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams ConferenceInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param unicode conference_sid: The SID of the conference.
+        :param unicode friendly_name: Custom label for the conference.
+        :param unicode status: Conference status.
+        :param unicode created_after: Conferences created after timestamp.
+        :param unicode created_before: Conferences created before timestamp.
+        :param unicode mixer_region: Region where the conference was mixed.
+        :param unicode tags: Tags applied by Twilio for common issues.
+        :param unicode subaccount: Account SID for the subaccount.
+        :param unicode detected_issues: Potential issues detected during the conference.
+        :param unicode end_reason: Conference end reason.
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.insights.v1.conference.ConferenceInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                conference_sid=conference_sid,
+                friendly_name=friendly_name,
+                status=status,
+                created_after=created_after,
+                created_before=created_before,
+                mixer_region=mixer_region,
+                tags=tags,
+                subaccount=subaccount,
+                detected_issues=detected_issues,
+                end_reason=end_reason,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, conference_sid=values.unset, friendly_name=values.unset,
+             status=values.unset, created_after=values.unset,
+             created_before=values.unset, mixer_region=values.unset,
+             tags=values.unset, subaccount=values.unset,
+             detected_issues=values.unset, end_reason=values.unset, limit=None,
+             page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Lists ConferenceInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param unicode conference_sid: The SID of the conference.
+        :param unicode friendly_name: Custom label for the conference.
+        :param unicode status: Conference status.
+        :param unicode created_after: Conferences created after timestamp.
+        :param unicode created_before: Conferences created before timestamp.
+        :param unicode mixer_region: Region where the conference was mixed.
+        :param unicode tags: Tags applied by Twilio for common issues.
+        :param unicode subaccount: Account SID for the subaccount.
+        :param unicode detected_issues: Potential issues detected during the conference.
+        :param unicode end_reason: Conference end reason.
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.insights.v1.conference.ConferenceInstance]
+        """
+        return list(self.stream(
             conference_sid=conference_sid,
             friendly_name=friendly_name,
             status=status,
@@ -77,19 +197,21 @@ class ConferenceList(ListResource):
             subaccount=subaccount,
             detected_issues=detected_issues,
             end_reason=end_reason,
-            page_size=limits['page_size'],
-        )
-
-        return self._version.stream(page, limits['limit'])
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        ))
 
-    def list(self, conference_sid=values.unset, friendly_name=values.unset,
-             status=values.unset, created_after=values.unset,
-             created_before=values.unset, mixer_region=values.unset,
-             tags=values.unset, subaccount=values.unset,
-             detected_issues=values.unset, end_reason=values.unset, limit=None,
-             page_size=None):
+    async def list_async(self, conference_sid=values.unset, friendly_name=values.unset,
+                         status=values.unset, created_after=values.unset,
+                         created_before=values.unset, mixer_region=values.unset,
+                         tags=values.unset, subaccount=values.unset,
+                         detected_issues=values.unset, end_reason=values.unset, limit=None,
+                         page_size=None, prefetch=None, raw=False, deadline=None):
         """
-        Lists ConferenceInstance records from the API as a list.
+        Asynchronously lists ConferenceInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
         memory before returning.
 
@@ -109,11 +231,17 @@ class ConferenceList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.insights.v1.conference.ConferenceInstance]
         """
-        return list(self.stream(
+        return [record async for record in await self.stream_async(
             conference_sid=conference_sid,
             friendly_name=friendly_name,
             status=status,
@@ -126,7 +254,10 @@ class ConferenceList(ListResource):
             end_reason=end_reason,
             limit=limit,
             page_size=page_size,
-        ))
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
 
     def page(self, conference_sid=values.unset, friendly_name=values.unset,
              status=values.unset, created_after=values.unset,
@@ -176,6 +307,54 @@ class ConferenceList(ListResource):
 
         return ConferencePage(self._version, response, self._solution)
 
+    async def page_async(self, conference_sid=values.unset, friendly_name=values.unset,
+                         status=values.unset, created_after=values.unset,
+                         created_before=values.unset, mixer_region=values.unset,
+                         tags=values.unset, subaccount=values.unset,
+                         detected_issues=values.unset, end_reason=values.unset,
+                         page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of ConferenceInstance records from the API.
+        Request is executed immediately
+
+        :param unicode conference_sid: The SID of the conference.
+        :param unicode friendly_name: Custom label for the conference.
+        :param unicode status: Conference status.
+        :param unicode created_after: Conferences created after timestamp.
+        :param unicode created_before: Conferences created before timestamp.
+        :param unicode mixer_region: Region where the conference was mixed.
+        :param unicode tags: Tags applied by Twilio for common issues.
+        :param unicode subaccount: Account SID for the subaccount.
+        :param unicode detected_issues: Potential issues detected during the conference.
+        :param unicode end_reason: Conference end reason.
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of ConferenceInstance
+        :rtype: twilio.rest.insights.v1.conference.ConferencePage
+        """
+        data = values.of({
+            'ConferenceSid': conference_sid,
+            'FriendlyName': friendly_name,
+            'Status': status,
+            'CreatedAfter': created_after,
+            'CreatedBefore': created_before,
+            'MixerRegion': mixer_region,
+            'Tags': tags,
+            'Subaccount': subaccount,
+            'DetectedIssues': detected_issues,
+            'EndReason': end_reason,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return ConferencePage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of ConferenceInstance records from the API.
@@ -193,6 +372,23 @@ class ConferenceList(ListResource):
 
         return ConferencePage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of ConferenceInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of ConferenceInstance
+        :rtype: twilio.rest.insights.v1.conference.ConferencePage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return ConferencePage(self._version, response, self._solution)
+
     def get(self, conference_sid):
         """
         Constructs a ConferenceContext
@@ -279,7 +475,7 @@ class ConferenceContext(InstanceContext):
 
         # Path Solution
         self._solution = {'conference_sid': conference_sid, }
-        self._uri = '/Conferences/{conference_sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Conferences/{conference_sid}', self._solution)
 
         # Dependents
         self._conference_participants = None
@@ -295,6 +491,17 @@ class ConferenceContext(InstanceContext):
 
         return ConferenceInstance(self._version, payload, conference_sid=self._solution['conference_sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ConferenceInstance
+
+        :returns: The fetched ConferenceInstance
+        :rtype: twilio.rest.insights.v1.conference.ConferenceInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return ConferenceInstance(self._version, payload, conference_sid=self._solution['conference_sid'], )
+
     @property
     def conference_participants(self):
         """
@@ -304,6 +511,7 @@ class ConferenceContext(InstanceContext):
         :rtype: twilio.rest.insights.v1.conference.conference_participant.ConferenceParticipantList
         """
         if self._conference_participants is None:
+            from twilio.rest.insights.v1.conference.conference_participant import ConferenceParticipantList
             self._conference_participants = ConferenceParticipantList(
                 self._version,
                 conference_sid=self._solution['conference_sid'],
@@ -363,6 +571,47 @@ class ConferenceInstance(InstanceResource):
         IN_PROGRESS = "in_progress"
         TIMEOUT = "timeout"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'create_time': deserialize.iso8601_datetime,
+        'start_time': deserialize.iso8601_datetime,
+        'end_time': deserialize.iso8601_datetime,
+        'duration_seconds': deserialize.integer,
+        'connect_duration_seconds': deserialize.integer,
+        'max_participants': deserialize.integer,
+        'max_concurrent_participants': deserialize.integer,
+        'unique_participants': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'conference_sid': 'conference_sid',
+        'account_sid': 'account_sid',
+        'friendly_name': 'friendly_name',
+        'create_time': 'create_time',
+        'start_time': 'start_time',
+        'end_time': 'end_time',
+        'duration_seconds': 'duration_seconds',
+        'connect_duration_seconds': 'connect_duration_seconds',
+        'status': 'status',
+        'max_participants': 'max_participants',
+        'max_concurrent_participants': 'max_concurrent_participants',
+        'unique_participants': 'unique_participants',
+        'end_reason': 'end_reason',
+        'ended_by': 'ended_by',
+        'mixer_region': 'mixer_region',
+        'mixer_region_requested': 'mixer_region_requested',
+        'recording_enabled': 'recording_enabled',
+        'detected_issues': 'detected_issues',
+        'tags': 'tags',
+        'tag_info': 'tag_info',
+        'processing_state': 'processing_state',
+        'url': 'url',
+        'links': 'links',
+    }, _deserializers)
+
     def __init__(self, version, payload, conference_sid=None):
         """
         Initialize the ConferenceInstance
@@ -373,31 +622,7 @@ class ConferenceInstance(InstanceResource):
         super(ConferenceInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'conference_sid': payload.get('conference_sid'),
-            'account_sid': payload.get('account_sid'),
-            'friendly_name': payload.get('friendly_name'),
-            'create_time': deserialize.iso8601_datetime(payload.get('create_time')),
-            'start_time': deserialize.iso8601_datetime(payload.get('start_time')),
-            'end_time': deserialize.iso8601_datetime(payload.get('end_time')),
-            'duration_seconds': deserialize.integer(payload.get('duration_seconds')),
-            'connect_duration_seconds': deserialize.integer(payload.get('connect_duration_seconds')),
-            'status': payload.get('status'),
-            'max_participants': deserialize.integer(payload.get('max_participants')),
-            'max_concurrent_participants': deserialize.integer(payload.get('max_concurrent_participants')),
-            'unique_participants': deserialize.integer(payload.get('unique_participants')),
-            'end_reason': payload.get('end_reason'),
-            'ended_by': payload.get('ended_by'),
-            'mixer_region': payload.get('mixer_region'),
-            'mixer_region_requested': payload.get('mixer_region_requested'),
-            'recording_enabled': payload.get('recording_enabled'),
-            'detected_issues': payload.get('detected_issues'),
-            'tags': payload.get('tags'),
-            'tag_info': payload.get('tag_info'),
-            'processing_state': payload.get('processing_state'),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -609,6 +834,15 @@ class ConferenceInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ConferenceInstance
+
+        :returns: The fetched ConferenceInstance
+        :rtype: twilio.rest.insights.v1.conference.ConferenceInstance
+        """
+        return await self._proxy.fetch_async()
+
     @property
     def conference_participants(self):
         """
@@ -628,3 +862,19 @@ class ConferenceInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Insights.V1.ConferenceInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'ConferenceParticipantList': 'twilio.rest.insights.v1.conference.conference_participant',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
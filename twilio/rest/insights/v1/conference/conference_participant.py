@@ -30,10 +30,11 @@ class ConferenceParticipantList(ListResource):
 
         # Path Solution
         self._solution = {'conference_sid': conference_sid, }
-        self._uri = '/Conferences/{conference_sid}/Participants'.format(**self._solution)
+        self._uri = values.ResourceUri('/Conferences/{conference_sid}/Participants', self._solution)
 
     def stream(self, participant_sid=values.unset, label=values.unset,
-               events=values.unset, limit=None, page_size=None):
+               events=values.unset, limit=None, page_size=None, prefetch=None,
+               raw=False, deadline=None):
         """
         Streams ConferenceParticipantInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -49,23 +50,73 @@ class ConferenceParticipantList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.insights.v1.conference.conference_participant.ConferenceParticipantInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
-            participant_sid=participant_sid,
-            label=label,
-            events=events,
-            page_size=limits['page_size'],
-        )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                participant_sid=participant_sid,
+                label=label,
+                events=events,
+                page_size=limits['page_size'],
+            )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, participant_sid=values.unset, label=values.unset,
+                           events=values.unset, limit=None, page_size=None,
+                           prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams ConferenceParticipantInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param unicode participant_sid: Participant SID.
+        :param unicode label: User-specified label for a participant.
+        :param unicode events: Conference events generated by application or participant activity.
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.insights.v1.conference.conference_participant.ConferenceParticipantInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                participant_sid=participant_sid,
+                label=label,
+                events=events,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, participant_sid=values.unset, label=values.unset,
-             events=values.unset, limit=None, page_size=None):
+             events=values.unset, limit=None, page_size=None, prefetch=None,
+             raw=False, deadline=None):
         """
         Lists ConferenceParticipantInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -80,6 +131,12 @@ class ConferenceParticipantList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.insights.v1.conference.conference_participant.ConferenceParticipantInstance]
@@ -90,8 +147,49 @@ class ConferenceParticipantList(ListResource):
             events=events,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, participant_sid=values.unset, label=values.unset,
+                         events=values.unset, limit=None, page_size=None,
+                         prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists ConferenceParticipantInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param unicode participant_sid: Participant SID.
+        :param unicode label: User-specified label for a participant.
+        :param unicode events: Conference events generated by application or participant activity.
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.insights.v1.conference.conference_participant.ConferenceParticipantInstance]
+        """
+        return [record async for record in await self.stream_async(
+            participant_sid=participant_sid,
+            label=label,
+            events=events,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, participant_sid=values.unset, label=values.unset,
              events=values.unset, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -122,6 +220,36 @@ class ConferenceParticipantList(ListResource):
 
         return ConferenceParticipantPage(self._version, response, self._solution)
 
+    async def page_async(self, participant_sid=values.unset, label=values.unset,
+                         events=values.unset, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of ConferenceParticipantInstance records from the API.
+        Request is executed immediately
+
+        :param unicode participant_sid: Participant SID.
+        :param unicode label: User-specified label for a participant.
+        :param unicode events: Conference events generated by application or participant activity.
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of ConferenceParticipantInstance
+        :rtype: twilio.rest.insights.v1.conference.conference_participant.ConferenceParticipantPage
+        """
+        data = values.of({
+            'ParticipantSid': participant_sid,
+            'Label': label,
+            'Events': events,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return ConferenceParticipantPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of ConferenceParticipantInstance records from the API.
@@ -139,6 +267,23 @@ class ConferenceParticipantList(ListResource):
 
         return ConferenceParticipantPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of ConferenceParticipantInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of ConferenceParticipantInstance
+        :rtype: twilio.rest.insights.v1.conference.conference_participant.ConferenceParticipantPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return ConferenceParticipantPage(self._version, response, self._solution)
+
     def get(self, participant_sid):
         """
         Constructs a ConferenceParticipantContext
@@ -239,7 +384,7 @@ class ConferenceParticipantContext(InstanceContext):
 
         # Path Solution
         self._solution = {'conference_sid': conference_sid, 'participant_sid': participant_sid, }
-        self._uri = '/Conferences/{conference_sid}/Participants/{participant_sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Conferences/{conference_sid}/Participants/{participant_sid}', self._solution)
 
     def fetch(self, events=values.unset, metrics=values.unset):
         """
@@ -262,6 +407,27 @@ class ConferenceParticipantContext(InstanceContext):
             participant_sid=self._solution['participant_sid'],
         )
 
+    async def fetch_async(self, events=values.unset, metrics=values.unset):
+        """
+        Asynchronous coroutine that fetches the ConferenceParticipantInstance
+
+        :param unicode events: Conference events generated by application or participant activity.
+        :param unicode metrics: Object. Contains call quality metrics.
+
+        :returns: The fetched ConferenceParticipantInstance
+        :rtype: twilio.rest.insights.v1.conference.conference_participant.ConferenceParticipantInstance
+        """
+        data = values.of({'Events': events, 'Metrics': metrics, })
+
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, params=data, )
+
+        return ConferenceParticipantInstance(
+            self._version,
+            payload,
+            conference_sid=self._solution['conference_sid'],
+            participant_sid=self._solution['participant_sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -314,6 +480,48 @@ class ConferenceParticipantInstance(InstanceResource):
         IN_PROGRESS = "in_progress"
         TIMEOUT = "timeout"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'join_time': deserialize.iso8601_datetime,
+        'leave_time': deserialize.iso8601_datetime,
+        'duration_seconds': deserialize.integer,
+        'outbound_queue_length': deserialize.integer,
+        'outbound_time_in_queue': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'participant_sid': 'participant_sid',
+        'label': 'label',
+        'conference_sid': 'conference_sid',
+        'call_sid': 'call_sid',
+        'account_sid': 'account_sid',
+        'call_direction': 'call_direction',
+        'from_': 'from',
+        'to': 'to',
+        'call_status': 'call_status',
+        'country_code': 'country_code',
+        'is_moderator': 'is_moderator',
+        'join_time': 'join_time',
+        'leave_time': 'leave_time',
+        'duration_seconds': 'duration_seconds',
+        'outbound_queue_length': 'outbound_queue_length',
+        'outbound_time_in_queue': 'outbound_time_in_queue',
+        'jitter_buffer_size': 'jitter_buffer_size',
+        'is_coach': 'is_coach',
+        'coached_participants': 'coached_participants',
+        'participant_region': 'participant_region',
+        'conference_region': 'conference_region',
+        'call_type': 'call_type',
+        'processing_state': 'processing_state',
+        'properties': 'properties',
+        'events': 'events',
+        'metrics': 'metrics',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload, conference_sid, participant_sid=None):
         """
         Initialize the ConferenceParticipantInstance
@@ -324,35 +532,7 @@ class ConferenceParticipantInstance(InstanceResource):
         super(ConferenceParticipantInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'participant_sid': payload.get('participant_sid'),
-            'label': payload.get('label'),
-            'conference_sid': payload.get('conference_sid'),
-            'call_sid': payload.get('call_sid'),
-            'account_sid': payload.get('account_sid'),
-            'call_direction': payload.get('call_direction'),
-            'from_': payload.get('from'),
-            'to': payload.get('to'),
-            'call_status': payload.get('call_status'),
-            'country_code': payload.get('country_code'),
-            'is_moderator': payload.get('is_moderator'),
-            'join_time': deserialize.iso8601_datetime(payload.get('join_time')),
-            'leave_time': deserialize.iso8601_datetime(payload.get('leave_time')),
-            'duration_seconds': deserialize.integer(payload.get('duration_seconds')),
-            'outbound_queue_length': deserialize.integer(payload.get('outbound_queue_length')),
-            'outbound_time_in_queue': deserialize.integer(payload.get('outbound_time_in_queue')),
-            'jitter_buffer_size': payload.get('jitter_buffer_size'),
-            'is_coach': payload.get('is_coach'),
-            'coached_participants': payload.get('coached_participants'),
-            'participant_region': payload.get('participant_region'),
-            'conference_region': payload.get('conference_region'),
-            'call_type': payload.get('call_type'),
-            'processing_state': payload.get('processing_state'),
-            'properties': payload.get('properties'),
-            'events': payload.get('events'),
-            'metrics': payload.get('metrics'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -606,6 +786,18 @@ class ConferenceParticipantInstance(InstanceResource):
         """
         return self._proxy.fetch(events=events, metrics=metrics, )
 
+    async def fetch_async(self, events=values.unset, metrics=values.unset):
+        """
+        Asynchronous coroutine that fetches the ConferenceParticipantInstance
+
+        :param unicode events: Conference events generated by application or participant activity.
+        :param unicode metrics: Object. Contains call quality metrics.
+
+        :returns: The fetched ConferenceParticipantInstance
+        :rtype: twilio.rest.insights.v1.conference.conference_participant.ConferenceParticipantInstance
+        """
+        return await self._proxy.fetch_async(events=events, metrics=metrics, )
+
     def __repr__(self):
         """
         Provide a friendly representation
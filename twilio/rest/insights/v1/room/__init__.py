@@ -6,6 +6,8 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import serialize
 from twilio.base import values
@@ -13,7 +15,6 @@ from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.insights.v1.room.participant import ParticipantList
 
 
 class RoomList(ListResource):
@@ -33,11 +34,12 @@ class RoomList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Video/Rooms'.format(**self._solution)
+        self._uri = values.ResourceUri('/Video/Rooms', self._solution)
 
     def stream(self, room_type=values.unset, codec=values.unset,
                room_name=values.unset, created_after=values.unset,
-               created_before=values.unset, limit=None, page_size=None):
+               created_before=values.unset, limit=None, page_size=None,
+               prefetch=None, raw=False, deadline=None):
         """
         Streams RoomInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -55,26 +57,81 @@ class RoomList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.insights.v1.room.RoomInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
-            room_type=room_type,
-            codec=codec,
-            room_name=room_name,
-            created_after=created_after,
-            created_before=created_before,
-            page_size=limits['page_size'],
-        )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                room_type=room_type,
+                codec=codec,
+                room_name=room_name,
+                created_after=created_after,
+                created_before=created_before,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, room_type=values.unset, codec=values.unset,
+                           room_name=values.unset, created_after=values.unset,
+                           created_before=values.unset, limit=None, page_size=None,
+                           prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams RoomInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
 
-        return self._version.stream(page, limits['limit'])
+        :param list[RoomInstance.RoomType] room_type: Type of room.
+        :param list[RoomInstance.Codec] codec: Codecs used by participants in the room.
+        :param unicode room_name: Room friendly name.
+        :param datetime created_after: Only read rooms that started on or after this ISO 8601 timestamp.
+        :param datetime created_before: Only read rooms that started before this ISO 8601 timestamp.
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.insights.v1.room.RoomInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                room_type=room_type,
+                codec=codec,
+                room_name=room_name,
+                created_after=created_after,
+                created_before=created_before,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, room_type=values.unset, codec=values.unset,
              room_name=values.unset, created_after=values.unset,
-             created_before=values.unset, limit=None, page_size=None):
+             created_before=values.unset, limit=None, page_size=None,
+             prefetch=None, raw=False, deadline=None):
         """
         Lists RoomInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -91,6 +148,12 @@ class RoomList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.insights.v1.room.RoomInstance]
@@ -103,8 +166,54 @@ class RoomList(ListResource):
             created_before=created_before,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, room_type=values.unset, codec=values.unset,
+                         room_name=values.unset, created_after=values.unset,
+                         created_before=values.unset, limit=None, page_size=None,
+                         prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists RoomInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param list[RoomInstance.RoomType] room_type: Type of room.
+        :param list[RoomInstance.Codec] codec: Codecs used by participants in the room.
+        :param unicode room_name: Room friendly name.
+        :param datetime created_after: Only read rooms that started on or after this ISO 8601 timestamp.
+        :param datetime created_before: Only read rooms that started before this ISO 8601 timestamp.
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.insights.v1.room.RoomInstance]
+        """
+        return [record async for record in await self.stream_async(
+            room_type=room_type,
+            codec=codec,
+            room_name=room_name,
+            created_after=created_after,
+            created_before=created_before,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, room_type=values.unset, codec=values.unset,
              room_name=values.unset, created_after=values.unset,
              created_before=values.unset, page_token=values.unset,
@@ -140,6 +249,41 @@ class RoomList(ListResource):
 
         return RoomPage(self._version, response, self._solution)
 
+    async def page_async(self, room_type=values.unset, codec=values.unset,
+                         room_name=values.unset, created_after=values.unset,
+                         created_before=values.unset, page_token=values.unset,
+                         page_number=values.unset, page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of RoomInstance records from the API.
+        Request is executed immediately
+
+        :param list[RoomInstance.RoomType] room_type: Type of room.
+        :param list[RoomInstance.Codec] codec: Codecs used by participants in the room.
+        :param unicode room_name: Room friendly name.
+        :param datetime created_after: Only read rooms that started on or after this ISO 8601 timestamp.
+        :param datetime created_before: Only read rooms that started before this ISO 8601 timestamp.
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of RoomInstance
+        :rtype: twilio.rest.insights.v1.room.RoomPage
+        """
+        data = values.of({
+            'RoomType': serialize.map(room_type, lambda e: e),
+            'Codec': serialize.map(codec, lambda e: e),
+            'RoomName': room_name,
+            'CreatedAfter': serialize.iso8601_datetime(created_after),
+            'CreatedBefore': serialize.iso8601_datetime(created_before),
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return RoomPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of RoomInstance records from the API.
@@ -157,6 +301,23 @@ class RoomList(ListResource):
 
         return RoomPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of RoomInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of RoomInstance
+        :rtype: twilio.rest.insights.v1.room.RoomPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return RoomPage(self._version, response, self._solution)
+
     def get(self, room_sid):
         """
         Constructs a RoomContext
@@ -247,7 +408,7 @@ class RoomContext(InstanceContext):
 
         # Path Solution
         self._solution = {'room_sid': room_sid, }
-        self._uri = '/Video/Rooms/{room_sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Video/Rooms/{room_sid}', self._solution)
 
         # Dependents
         self._participants = None
@@ -263,6 +424,17 @@ class RoomContext(InstanceContext):
 
         return RoomInstance(self._version, payload, room_sid=self._solution['room_sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the RoomInstance
+
+        :returns: The fetched RoomInstance
+        :rtype: twilio.rest.insights.v1.room.RoomInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return RoomInstance(self._version, payload, room_sid=self._solution['room_sid'], )
+
     @property
     def participants(self):
         """
@@ -272,6 +444,7 @@ class RoomContext(InstanceContext):
         :rtype: twilio.rest.insights.v1.room.participant.ParticipantList
         """
         if self._participants is None:
+            from twilio.rest.insights.v1.room.participant import ParticipantList
             self._participants = ParticipantList(self._version, room_sid=self._solution['room_sid'], )
         return self._participants
 
@@ -341,6 +514,52 @@ class RoomInstance(InstanceResource):
         UMATILLA = "umatilla"
         TOKYO = "tokyo"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'create_time': deserialize.iso8601_datetime,
+        'end_time': deserialize.iso8601_datetime,
+        'max_participants': deserialize.integer,
+        'unique_participants': deserialize.integer,
+        'unique_participant_identities': deserialize.integer,
+        'concurrent_participants': deserialize.integer,
+        'max_concurrent_participants': deserialize.integer,
+        'duration_sec': deserialize.integer,
+        'total_participant_duration_sec': deserialize.integer,
+        'total_recording_duration_sec': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'room_sid': 'room_sid',
+        'room_name': 'room_name',
+        'create_time': 'create_time',
+        'end_time': 'end_time',
+        'room_type': 'room_type',
+        'room_status': 'room_status',
+        'status_callback': 'status_callback',
+        'status_callback_method': 'status_callback_method',
+        'created_method': 'created_method',
+        'end_reason': 'end_reason',
+        'max_participants': 'max_participants',
+        'unique_participants': 'unique_participants',
+        'unique_participant_identities': 'unique_participant_identities',
+        'concurrent_participants': 'concurrent_participants',
+        'max_concurrent_participants': 'max_concurrent_participants',
+        'codecs': 'codecs',
+        'media_region': 'media_region',
+        'duration_sec': 'duration_sec',
+        'total_participant_duration_sec': 'total_participant_duration_sec',
+        'total_recording_duration_sec': 'total_recording_duration_sec',
+        'processing_state': 'processing_state',
+        'recording_enabled': 'recording_enabled',
+        'edge_location': 'edge_location',
+        'url': 'url',
+        'links': 'links',
+    }, _deserializers)
+
     def __init__(self, version, payload, room_sid=None):
         """
         Initialize the RoomInstance
@@ -351,34 +570,7 @@ class RoomInstance(InstanceResource):
         super(RoomInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'room_sid': payload.get('room_sid'),
-            'room_name': payload.get('room_name'),
-            'create_time': deserialize.iso8601_datetime(payload.get('create_time')),
-            'end_time': deserialize.iso8601_datetime(payload.get('end_time')),
-            'room_type': payload.get('room_type'),
-            'room_status': payload.get('room_status'),
-            'status_callback': payload.get('status_callback'),
-            'status_callback_method': payload.get('status_callback_method'),
-            'created_method': payload.get('created_method'),
-            'end_reason': payload.get('end_reason'),
-            'max_participants': deserialize.integer(payload.get('max_participants')),
-            'unique_participants': deserialize.integer(payload.get('unique_participants')),
-            'unique_participant_identities': deserialize.integer(payload.get('unique_participant_identities')),
-            'concurrent_participants': deserialize.integer(payload.get('concurrent_participants')),
-            'max_concurrent_participants': deserialize.integer(payload.get('max_concurrent_participants')),
-            'codecs': payload.get('codecs'),
-            'media_region': payload.get('media_region'),
-            'duration_sec': deserialize.integer(payload.get('duration_sec')),
-            'total_participant_duration_sec': deserialize.integer(payload.get('total_participant_duration_sec')),
-            'total_recording_duration_sec': deserialize.integer(payload.get('total_recording_duration_sec')),
-            'processing_state': payload.get('processing_state'),
-            'recording_enabled': payload.get('recording_enabled'),
-            'edge_location': payload.get('edge_location'),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -614,6 +806,15 @@ class RoomInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the RoomInstance
+
+        :returns: The fetched RoomInstance
+        :rtype: twilio.rest.insights.v1.room.RoomInstance
+        """
+        return await self._proxy.fetch_async()
+
     @property
     def participants(self):
         """
@@ -633,3 +834,19 @@ class RoomInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Insights.V1.RoomInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'ParticipantList': 'twilio.rest.insights.v1.room.participant',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -32,9 +32,9 @@ class ParticipantList(ListResource):
 
         # Path Solution
         self._solution = {'room_sid': room_sid, }
-        self._uri = '/Video/Rooms/{room_sid}/Participants'.format(**self._solution)
+        self._uri = values.ResourceUri('/Video/Rooms/{room_sid}/Participants', self._solution)
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams ParticipantInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -47,17 +47,57 @@ class ParticipantList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.insights.v1.room.participant.ParticipantInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams ParticipantInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.insights.v1.room.participant.ParticipantInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists ParticipantInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -69,11 +109,42 @@ class ParticipantList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.insights.v1.room.participant.ParticipantInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists ParticipantInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.insights.v1.room.participant.ParticipantInstance]
+        """
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -94,6 +165,25 @@ class ParticipantList(ListResource):
 
         return ParticipantPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of ParticipantInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of ParticipantInstance
+        :rtype: twilio.rest.insights.v1.room.participant.ParticipantPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return ParticipantPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of ParticipantInstance records from the API.
@@ -111,6 +201,23 @@ class ParticipantList(ListResource):
 
         return ParticipantPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of ParticipantInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of ParticipantInstance
+        :rtype: twilio.rest.insights.v1.room.participant.ParticipantPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return ParticipantPage(self._version, response, self._solution)
+
     def get(self, participant_sid):
         """
         Constructs a ParticipantContext
@@ -211,7 +318,7 @@ class ParticipantContext(InstanceContext):
 
         # Path Solution
         self._solution = {'room_sid': room_sid, 'participant_sid': participant_sid, }
-        self._uri = '/Video/Rooms/{room_sid}/Participants/{participant_sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Video/Rooms/{room_sid}/Participants/{participant_sid}', self._solution)
 
     def fetch(self):
         """
@@ -229,6 +336,22 @@ class ParticipantContext(InstanceContext):
             participant_sid=self._solution['participant_sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ParticipantInstance
+
+        :returns: The fetched ParticipantInstance
+        :rtype: twilio.rest.insights.v1.room.participant.ParticipantInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return ParticipantInstance(
+            self._version,
+            payload,
+            room_sid=self._solution['room_sid'],
+            participant_sid=self._solution['participant_sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -276,6 +399,37 @@ class ParticipantInstance(InstanceResource):
         UMATILLA = "umatilla"
         TOKYO = "tokyo"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'join_time': deserialize.iso8601_datetime,
+        'leave_time': deserialize.iso8601_datetime,
+        'duration_sec': deserialize.integer,
+        'error_code': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'participant_sid': 'participant_sid',
+        'participant_identity': 'participant_identity',
+        'join_time': 'join_time',
+        'leave_time': 'leave_time',
+        'duration_sec': 'duration_sec',
+        'account_sid': 'account_sid',
+        'room_sid': 'room_sid',
+        'status': 'status',
+        'codecs': 'codecs',
+        'end_reason': 'end_reason',
+        'error_code': 'error_code',
+        'error_code_url': 'error_code_url',
+        'media_region': 'media_region',
+        'properties': 'properties',
+        'edge_location': 'edge_location',
+        'publisher_info': 'publisher_info',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload, room_sid, participant_sid=None):
         """
         Initialize the ParticipantInstance
@@ -286,25 +440,7 @@ class ParticipantInstance(InstanceResource):
         super(ParticipantInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'participant_sid': payload.get('participant_sid'),
-            'participant_identity': payload.get('participant_identity'),
-            'join_time': deserialize.iso8601_datetime(payload.get('join_time')),
-            'leave_time': deserialize.iso8601_datetime(payload.get('leave_time')),
-            'duration_sec': deserialize.integer(payload.get('duration_sec')),
-            'account_sid': payload.get('account_sid'),
-            'room_sid': payload.get('room_sid'),
-            'status': payload.get('status'),
-            'codecs': payload.get('codecs'),
-            'end_reason': payload.get('end_reason'),
-            'error_code': deserialize.integer(payload.get('error_code')),
-            'error_code_url': payload.get('error_code_url'),
-            'media_region': payload.get('media_region'),
-            'properties': payload.get('properties'),
-            'edge_location': payload.get('edge_location'),
-            'publisher_info': payload.get('publisher_info'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -475,6 +611,15 @@ class ParticipantInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ParticipantInstance
+
+        :returns: The fetched ParticipantInstance
+        :rtype: twilio.rest.insights.v1.room.participant.ParticipantInstance
+        """
+        return await self._proxy.fetch_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
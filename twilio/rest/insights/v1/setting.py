@@ -6,6 +6,7 @@ This code was generated by
       /       /
 """
 
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
@@ -110,7 +111,7 @@ class SettingContext(InstanceContext):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Voice/Settings'.format(**self._solution)
+        self._uri = values.ResourceUri('/Voice/Settings', self._solution)
 
     def fetch(self, subaccount_sid=values.unset):
         """
@@ -127,6 +128,21 @@ class SettingContext(InstanceContext):
 
         return SettingInstance(self._version, payload, )
 
+    async def fetch_async(self, subaccount_sid=values.unset):
+        """
+        Asynchronous coroutine that fetches the SettingInstance
+
+        :param unicode subaccount_sid: The subaccount_sid
+
+        :returns: The fetched SettingInstance
+        :rtype: twilio.rest.insights.v1.setting.SettingInstance
+        """
+        data = values.of({'SubaccountSid': subaccount_sid, })
+
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, params=data, )
+
+        return SettingInstance(self._version, payload, )
+
     def update(self, advanced_features=values.unset, voice_trace=values.unset,
                subaccount_sid=values.unset):
         """
@@ -149,6 +165,28 @@ class SettingContext(InstanceContext):
 
         return SettingInstance(self._version, payload, )
 
+    async def update_async(self, advanced_features=values.unset, voice_trace=values.unset,
+                           subaccount_sid=values.unset):
+        """
+        Asynchronous coroutine that updates the SettingInstance
+
+        :param bool advanced_features: The advanced_features
+        :param bool voice_trace: The voice_trace
+        :param unicode subaccount_sid: The subaccount_sid
+
+        :returns: The updated SettingInstance
+        :rtype: twilio.rest.insights.v1.setting.SettingInstance
+        """
+        data = values.of({
+            'AdvancedFeatures': advanced_features,
+            'VoiceTrace': voice_trace,
+            'SubaccountSid': subaccount_sid,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return SettingInstance(self._version, payload, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -162,6 +200,16 @@ class SettingContext(InstanceContext):
 
 class SettingInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'advanced_features': 'advanced_features',
+        'voice_trace': 'voice_trace',
+        'url': 'url',
+    })
+
     def __init__(self, version, payload):
         """
         Initialize the SettingInstance
@@ -172,12 +220,7 @@ class SettingInstance(InstanceResource):
         super(SettingInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'advanced_features': payload.get('advanced_features'),
-            'voice_trace': payload.get('voice_trace'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -239,6 +282,17 @@ class SettingInstance(InstanceResource):
         """
         return self._proxy.fetch(subaccount_sid=subaccount_sid, )
 
+    async def fetch_async(self, subaccount_sid=values.unset):
+        """
+        Asynchronous coroutine that fetches the SettingInstance
+
+        :param unicode subaccount_sid: The subaccount_sid
+
+        :returns: The fetched SettingInstance
+        :rtype: twilio.rest.insights.v1.setting.SettingInstance
+        """
+        return await self._proxy.fetch_async(subaccount_sid=subaccount_sid, )
+
     def update(self, advanced_features=values.unset, voice_trace=values.unset,
                subaccount_sid=values.unset):
         """
@@ -257,6 +311,24 @@ class SettingInstance(InstanceResource):
             subaccount_sid=subaccount_sid,
         )
 
+    async def update_async(self, advanced_features=values.unset, voice_trace=values.unset,
+                           subaccount_sid=values.unset):
+        """
+        Asynchronous coroutine that updates the SettingInstance
+
+        :param bool advanced_features: The advanced_features
+        :param bool voice_trace: The voice_trace
+        :param unicode subaccount_sid: The subaccount_sid
+
+        :returns: The updated SettingInstance
+        :rtype: twilio.rest.insights.v1.setting.SettingInstance
+        """
+        return await self._proxy.update_async(
+            advanced_features=advanced_features,
+            voice_trace=voice_trace,
+            subaccount_sid=subaccount_sid,
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -6,9 +6,9 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base.version import Version
-from twilio.rest.ip_messaging.v1.credential import CredentialList
-from twilio.rest.ip_messaging.v1.service import ServiceList
 
 
 class V1(Version):
@@ -31,6 +31,7 @@ class V1(Version):
         :rtype: twilio.rest.ip_messaging.v1.credential.CredentialList
         """
         if self._credentials is None:
+            from twilio.rest.ip_messaging.v1.credential import CredentialList
             self._credentials = CredentialList(self)
         return self._credentials
 
@@ -40,6 +41,7 @@ class V1(Version):
         :rtype: twilio.rest.ip_messaging.v1.service.ServiceList
         """
         if self._services is None:
+            from twilio.rest.ip_messaging.v1.service import ServiceList
             self._services = ServiceList(self)
         return self._services
 
@@ -51,3 +53,20 @@ class V1(Version):
         :rtype: str
         """
         return '<Twilio.IpMessaging.V1>'
+
+
+_LAZY_IMPORTS = {
+    'CredentialList': 'twilio.rest.ip_messaging.v1.credential',
+    'ServiceList': 'twilio.rest.ip_messaging.v1.service',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -6,13 +6,14 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.ip_messaging.v1.service.user.user_channel import UserChannelList
 
 
 class UserList(ListResource):
@@ -31,10 +32,10 @@ class UserList(ListResource):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, }
-        self._uri = '/Services/{service_sid}/Users'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/Users', self._solution)
 
     def create(self, identity, role_sid=values.unset, attributes=values.unset,
-               friendly_name=values.unset):
+               friendly_name=values.unset, deadline=None):
         """
         Create the UserInstance
 
@@ -42,6 +43,8 @@ class UserList(ListResource):
         :param unicode role_sid: The role_sid
         :param unicode attributes: The attributes
         :param unicode friendly_name: The friendly_name
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created UserInstance
         :rtype: twilio.rest.ip_messaging.v1.service.user.UserInstance
@@ -53,11 +56,37 @@ class UserList(ListResource):
             'FriendlyName': friendly_name,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return UserInstance(self._version, payload, service_sid=self._solution['service_sid'], )
 
-    def stream(self, limit=None, page_size=None):
+    async def create_async(self, identity, role_sid=values.unset, attributes=values.unset,
+                           friendly_name=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the UserInstance
+
+        :param unicode identity: The identity
+        :param unicode role_sid: The role_sid
+        :param unicode attributes: The attributes
+        :param unicode friendly_name: The friendly_name
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created UserInstance
+        :rtype: twilio.rest.ip_messaging.v1.service.user.UserInstance
+        """
+        data = values.of({
+            'Identity': identity,
+            'RoleSid': role_sid,
+            'Attributes': attributes,
+            'FriendlyName': friendly_name,
+        })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return UserInstance(self._version, payload, service_sid=self._solution['service_sid'], )
+
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams UserInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -70,17 +99,57 @@ class UserList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.ip_messaging.v1.service.user.UserInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams UserInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.ip_messaging.v1.service.user.UserInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists UserInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -92,11 +161,42 @@ class UserList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.ip_messaging.v1.service.user.UserInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists UserInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.ip_messaging.v1.service.user.UserInstance]
+        """
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -117,6 +217,25 @@ class UserList(ListResource):
 
         return UserPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of UserInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of UserInstance
+        :rtype: twilio.rest.ip_messaging.v1.service.user.UserPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return UserPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of UserInstance records from the API.
@@ -134,6 +253,23 @@ class UserList(ListResource):
 
         return UserPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of UserInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of UserInstance
+        :rtype: twilio.rest.ip_messaging.v1.service.user.UserPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return UserPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a UserContext
@@ -222,7 +358,7 @@ class UserContext(InstanceContext):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, 'sid': sid, }
-        self._uri = '/Services/{service_sid}/Users/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/Users/{sid}', self._solution)
 
         # Dependents
         self._user_channels = None
@@ -243,6 +379,22 @@ class UserContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the UserInstance
+
+        :returns: The fetched UserInstance
+        :rtype: twilio.rest.ip_messaging.v1.service.user.UserInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return UserInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self):
         """
         Deletes the UserInstance
@@ -252,6 +404,15 @@ class UserContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the UserInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def update(self, role_sid=values.unset, attributes=values.unset,
                friendly_name=values.unset):
         """
@@ -275,6 +436,29 @@ class UserContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, role_sid=values.unset, attributes=values.unset,
+                           friendly_name=values.unset):
+        """
+        Asynchronous coroutine that updates the UserInstance
+
+        :param unicode role_sid: The role_sid
+        :param unicode attributes: The attributes
+        :param unicode friendly_name: The friendly_name
+
+        :returns: The updated UserInstance
+        :rtype: twilio.rest.ip_messaging.v1.service.user.UserInstance
+        """
+        data = values.of({'RoleSid': role_sid, 'Attributes': attributes, 'FriendlyName': friendly_name, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return UserInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            sid=self._solution['sid'],
+        )
+
     @property
     def user_channels(self):
         """
@@ -284,6 +468,7 @@ class UserContext(InstanceContext):
         :rtype: twilio.rest.ip_messaging.v1.service.user.user_channel.UserChannelList
         """
         if self._user_channels is None:
+            from twilio.rest.ip_messaging.v1.service.user.user_channel import UserChannelList
             self._user_channels = UserChannelList(
                 self._version,
                 service_sid=self._solution['service_sid'],
@@ -304,6 +489,33 @@ class UserContext(InstanceContext):
 
 class UserInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+        'joined_channels_count': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'service_sid': 'service_sid',
+        'attributes': 'attributes',
+        'friendly_name': 'friendly_name',
+        'role_sid': 'role_sid',
+        'identity': 'identity',
+        'is_online': 'is_online',
+        'is_notifiable': 'is_notifiable',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'joined_channels_count': 'joined_channels_count',
+        'links': 'links',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload, service_sid, sid=None):
         """
         Initialize the UserInstance
@@ -314,22 +526,7 @@ class UserInstance(InstanceResource):
         super(UserInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'service_sid': payload.get('service_sid'),
-            'attributes': payload.get('attributes'),
-            'friendly_name': payload.get('friendly_name'),
-            'role_sid': payload.get('role_sid'),
-            'identity': payload.get('identity'),
-            'is_online': payload.get('is_online'),
-            'is_notifiable': payload.get('is_notifiable'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'joined_channels_count': deserialize.integer(payload.get('joined_channels_count')),
-            'links': payload.get('links'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -473,6 +670,15 @@ class UserInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the UserInstance
+
+        :returns: The fetched UserInstance
+        :rtype: twilio.rest.ip_messaging.v1.service.user.UserInstance
+        """
+        return await self._proxy.fetch_async()
+
     def delete(self):
         """
         Deletes the UserInstance
@@ -482,6 +688,15 @@ class UserInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the UserInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def update(self, role_sid=values.unset, attributes=values.unset,
                friendly_name=values.unset):
         """
@@ -496,6 +711,20 @@ class UserInstance(InstanceResource):
         """
         return self._proxy.update(role_sid=role_sid, attributes=attributes, friendly_name=friendly_name, )
 
+    async def update_async(self, role_sid=values.unset, attributes=values.unset,
+                           friendly_name=values.unset):
+        """
+        Asynchronous coroutine that updates the UserInstance
+
+        :param unicode role_sid: The role_sid
+        :param unicode attributes: The attributes
+        :param unicode friendly_name: The friendly_name
+
+        :returns: The updated UserInstance
+        :rtype: twilio.rest.ip_messaging.v1.service.user.UserInstance
+        """
+        return await self._proxy.update_async(role_sid=role_sid, attributes=attributes, friendly_name=friendly_name, )
+
     @property
     def user_channels(self):
         """
@@ -515,3 +744,19 @@ class UserInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.IpMessaging.V1.UserInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'UserChannelList': 'twilio.rest.ip_messaging.v1.service.user.user_channel',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
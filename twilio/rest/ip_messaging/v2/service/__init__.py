@@ -6,6 +6,8 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import serialize
 from twilio.base import values
@@ -13,10 +15,6 @@ from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.ip_messaging.v2.service.binding import BindingList
-from twilio.rest.ip_messaging.v2.service.channel import ChannelList
-from twilio.rest.ip_messaging.v2.service.role import RoleList
-from twilio.rest.ip_messaging.v2.service.user import UserList
 
 
 class ServiceList(ListResource):
@@ -34,24 +32,43 @@ class ServiceList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Services'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services', self._solution)
 
-    def create(self, friendly_name):
+    def create(self, friendly_name, deadline=None):
         """
         Create the ServiceInstance
 
         :param unicode friendly_name: The friendly_name
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created ServiceInstance
+        :rtype: twilio.rest.ip_messaging.v2.service.ServiceInstance
+        """
+        data = values.of({'FriendlyName': friendly_name, })
+
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return ServiceInstance(self._version, payload, )
+
+    async def create_async(self, friendly_name, deadline=None):
+        """
+        Asynchronous coroutine that creates the ServiceInstance
+
+        :param unicode friendly_name: The friendly_name
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created ServiceInstance
         :rtype: twilio.rest.ip_messaging.v2.service.ServiceInstance
         """
         data = values.of({'FriendlyName': friendly_name, })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return ServiceInstance(self._version, payload, )
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams ServiceInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -64,17 +81,57 @@ class ServiceList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.ip_messaging.v2.service.ServiceInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams ServiceInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.ip_messaging.v2.service.ServiceInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists ServiceInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -86,11 +143,42 @@ class ServiceList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.ip_messaging.v2.service.ServiceInstance]
+        """
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists ServiceInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.ip_messaging.v2.service.ServiceInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -111,6 +199,25 @@ class ServiceList(ListResource):
 
         return ServicePage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of ServiceInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of ServiceInstance
+        :rtype: twilio.rest.ip_messaging.v2.service.ServicePage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return ServicePage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of ServiceInstance records from the API.
@@ -128,6 +235,23 @@ class ServiceList(ListResource):
 
         return ServicePage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of ServiceInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of ServiceInstance
+        :rtype: twilio.rest.ip_messaging.v2.service.ServicePage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return ServicePage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a ServiceContext
@@ -214,7 +338,7 @@ class ServiceContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/Services/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{sid}', self._solution)
 
         # Dependents
         self._channels = None
@@ -233,6 +357,17 @@ class ServiceContext(InstanceContext):
 
         return ServiceInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ServiceInstance
+
+        :returns: The fetched ServiceInstance
+        :rtype: twilio.rest.ip_messaging.v2.service.ServiceInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return ServiceInstance(self._version, payload, sid=self._solution['sid'], )
+
     def delete(self):
         """
         Deletes the ServiceInstance
@@ -242,6 +377,15 @@ class ServiceContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the ServiceInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def update(self, friendly_name=values.unset,
                default_service_role_sid=values.unset,
                default_channel_role_sid=values.unset,
@@ -346,6 +490,110 @@ class ServiceContext(InstanceContext):
 
         return ServiceInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def update_async(self, friendly_name=values.unset,
+                           default_service_role_sid=values.unset,
+                           default_channel_role_sid=values.unset,
+                           default_channel_creator_role_sid=values.unset,
+                           read_status_enabled=values.unset, reachability_enabled=values.unset,
+                           typing_indicator_timeout=values.unset,
+                           consumption_report_interval=values.unset,
+                           notifications_new_message_enabled=values.unset,
+                           notifications_new_message_template=values.unset,
+                           notifications_new_message_sound=values.unset,
+                           notifications_new_message_badge_count_enabled=values.unset,
+                           notifications_added_to_channel_enabled=values.unset,
+                           notifications_added_to_channel_template=values.unset,
+                           notifications_added_to_channel_sound=values.unset,
+                           notifications_removed_from_channel_enabled=values.unset,
+                           notifications_removed_from_channel_template=values.unset,
+                           notifications_removed_from_channel_sound=values.unset,
+                           notifications_invited_to_channel_enabled=values.unset,
+                           notifications_invited_to_channel_template=values.unset,
+                           notifications_invited_to_channel_sound=values.unset,
+                           pre_webhook_url=values.unset, post_webhook_url=values.unset,
+                           webhook_method=values.unset, webhook_filters=values.unset,
+                           limits_channel_members=values.unset,
+                           limits_user_channels=values.unset,
+                           media_compatibility_message=values.unset,
+                           pre_webhook_retry_count=values.unset,
+                           post_webhook_retry_count=values.unset,
+                           notifications_log_enabled=values.unset):
+        """
+        Asynchronous coroutine that updates the ServiceInstance
+
+        :param unicode friendly_name: The friendly_name
+        :param unicode default_service_role_sid: The default_service_role_sid
+        :param unicode default_channel_role_sid: The default_channel_role_sid
+        :param unicode default_channel_creator_role_sid: The default_channel_creator_role_sid
+        :param bool read_status_enabled: The read_status_enabled
+        :param bool reachability_enabled: The reachability_enabled
+        :param unicode typing_indicator_timeout: The typing_indicator_timeout
+        :param unicode consumption_report_interval: The consumption_report_interval
+        :param bool notifications_new_message_enabled: The notifications.new_message.enabled
+        :param unicode notifications_new_message_template: The notifications.new_message.template
+        :param unicode notifications_new_message_sound: The notifications.new_message.sound
+        :param bool notifications_new_message_badge_count_enabled: The notifications.new_message.badge_count_enabled
+        :param bool notifications_added_to_channel_enabled: The notifications.added_to_channel.enabled
+        :param unicode notifications_added_to_channel_template: The notifications.added_to_channel.template
+        :param unicode notifications_added_to_channel_sound: The notifications.added_to_channel.sound
+        :param bool notifications_removed_from_channel_enabled: The notifications.removed_from_channel.enabled
+        :param unicode notifications_removed_from_channel_template: The notifications.removed_from_channel.template
+        :param unicode notifications_removed_from_channel_sound: The notifications.removed_from_channel.sound
+        :param bool notifications_invited_to_channel_enabled: The notifications.invited_to_channel.enabled
+        :param unicode notifications_invited_to_channel_template: The notifications.invited_to_channel.template
+        :param unicode notifications_invited_to_channel_sound: The notifications.invited_to_channel.sound
+        :param unicode pre_webhook_url: The pre_webhook_url
+        :param unicode post_webhook_url: The post_webhook_url
+        :param unicode webhook_method: The webhook_method
+        :param list[unicode] webhook_filters: The webhook_filters
+        :param unicode limits_channel_members: The limits.channel_members
+        :param unicode limits_user_channels: The limits.user_channels
+        :param unicode media_compatibility_message: The media.compatibility_message
+        :param unicode pre_webhook_retry_count: The pre_webhook_retry_count
+        :param unicode post_webhook_retry_count: The post_webhook_retry_count
+        :param bool notifications_log_enabled: The notifications.log_enabled
+
+        :returns: The updated ServiceInstance
+        :rtype: twilio.rest.ip_messaging.v2.service.ServiceInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'DefaultServiceRoleSid': default_service_role_sid,
+            'DefaultChannelRoleSid': default_channel_role_sid,
+            'DefaultChannelCreatorRoleSid': default_channel_creator_role_sid,
+            'ReadStatusEnabled': read_status_enabled,
+            'ReachabilityEnabled': reachability_enabled,
+            'TypingIndicatorTimeout': typing_indicator_timeout,
+            'ConsumptionReportInterval': consumption_report_interval,
+            'Notifications.NewMessage.Enabled': notifications_new_message_enabled,
+            'Notifications.NewMessage.Template': notifications_new_message_template,
+            'Notifications.NewMessage.Sound': notifications_new_message_sound,
+            'Notifications.NewMessage.BadgeCountEnabled': notifications_new_message_badge_count_enabled,
+            'Notifications.AddedToChannel.Enabled': notifications_added_to_channel_enabled,
+            'Notifications.AddedToChannel.Template': notifications_added_to_channel_template,
+            'Notifications.AddedToChannel.Sound': notifications_added_to_channel_sound,
+            'Notifications.RemovedFromChannel.Enabled': notifications_removed_from_channel_enabled,
+            'Notifications.RemovedFromChannel.Template': notifications_removed_from_channel_template,
+            'Notifications.RemovedFromChannel.Sound': notifications_removed_from_channel_sound,
+            'Notifications.InvitedToChannel.Enabled': notifications_invited_to_channel_enabled,
+            'Notifications.InvitedToChannel.Template': notifications_invited_to_channel_template,
+            'Notifications.InvitedToChannel.Sound': notifications_invited_to_channel_sound,
+            'PreWebhookUrl': pre_webhook_url,
+            'PostWebhookUrl': post_webhook_url,
+            'WebhookMethod': webhook_method,
+            'WebhookFilters': serialize.map(webhook_filters, lambda e: e),
+            'Limits.ChannelMembers': limits_channel_members,
+            'Limits.UserChannels': limits_user_channels,
+            'Media.CompatibilityMessage': media_compatibility_message,
+            'PreWebhookRetryCount': pre_webhook_retry_count,
+            'PostWebhookRetryCount': post_webhook_retry_count,
+            'Notifications.LogEnabled': notifications_log_enabled,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return ServiceInstance(self._version, payload, sid=self._solution['sid'], )
+
     @property
     def channels(self):
         """
@@ -355,6 +603,7 @@ class ServiceContext(InstanceContext):
         :rtype: twilio.rest.ip_messaging.v2.service.channel.ChannelList
         """
         if self._channels is None:
+            from twilio.rest.ip_messaging.v2.service.channel import ChannelList
             self._channels = ChannelList(self._version, service_sid=self._solution['sid'], )
         return self._channels
 
@@ -367,6 +616,7 @@ class ServiceContext(InstanceContext):
         :rtype: twilio.rest.ip_messaging.v2.service.role.RoleList
         """
         if self._roles is None:
+            from twilio.rest.ip_messaging.v2.service.role import RoleList
             self._roles = RoleList(self._version, service_sid=self._solution['sid'], )
         return self._roles
 
@@ -379,6 +629,7 @@ class ServiceContext(InstanceContext):
         :rtype: twilio.rest.ip_messaging.v2.service.user.UserList
         """
         if self._users is None:
+            from twilio.rest.ip_messaging.v2.service.user import UserList
             self._users = UserList(self._version, service_sid=self._solution['sid'], )
         return self._users
 
@@ -391,6 +642,7 @@ class ServiceContext(InstanceContext):
         :rtype: twilio.rest.ip_messaging.v2.service.binding.BindingList
         """
         if self._bindings is None:
+            from twilio.rest.ip_messaging.v2.service.binding import BindingList
             self._bindings = BindingList(self._version, service_sid=self._solution['sid'], )
         return self._bindings
 
@@ -407,6 +659,45 @@ class ServiceContext(InstanceContext):
 
 class ServiceInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+        'typing_indicator_timeout': deserialize.integer,
+        'consumption_report_interval': deserialize.integer,
+        'pre_webhook_retry_count': deserialize.integer,
+        'post_webhook_retry_count': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'friendly_name': 'friendly_name',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'default_service_role_sid': 'default_service_role_sid',
+        'default_channel_role_sid': 'default_channel_role_sid',
+        'default_channel_creator_role_sid': 'default_channel_creator_role_sid',
+        'read_status_enabled': 'read_status_enabled',
+        'reachability_enabled': 'reachability_enabled',
+        'typing_indicator_timeout': 'typing_indicator_timeout',
+        'consumption_report_interval': 'consumption_report_interval',
+        'limits': 'limits',
+        'pre_webhook_url': 'pre_webhook_url',
+        'post_webhook_url': 'post_webhook_url',
+        'webhook_method': 'webhook_method',
+        'webhook_filters': 'webhook_filters',
+        'pre_webhook_retry_count': 'pre_webhook_retry_count',
+        'post_webhook_retry_count': 'post_webhook_retry_count',
+        'notifications': 'notifications',
+        'media': 'media',
+        'url': 'url',
+        'links': 'links',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the ServiceInstance
@@ -417,31 +708,7 @@ class ServiceInstance(InstanceResource):
         super(ServiceInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'friendly_name': payload.get('friendly_name'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'default_service_role_sid': payload.get('default_service_role_sid'),
-            'default_channel_role_sid': payload.get('default_channel_role_sid'),
-            'default_channel_creator_role_sid': payload.get('default_channel_creator_role_sid'),
-            'read_status_enabled': payload.get('read_status_enabled'),
-            'reachability_enabled': payload.get('reachability_enabled'),
-            'typing_indicator_timeout': deserialize.integer(payload.get('typing_indicator_timeout')),
-            'consumption_report_interval': deserialize.integer(payload.get('consumption_report_interval')),
-            'limits': payload.get('limits'),
-            'pre_webhook_url': payload.get('pre_webhook_url'),
-            'post_webhook_url': payload.get('post_webhook_url'),
-            'webhook_method': payload.get('webhook_method'),
-            'webhook_filters': payload.get('webhook_filters'),
-            'pre_webhook_retry_count': deserialize.integer(payload.get('pre_webhook_retry_count')),
-            'post_webhook_retry_count': deserialize.integer(payload.get('post_webhook_retry_count')),
-            'notifications': payload.get('notifications'),
-            'media': payload.get('media'),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -653,6 +920,15 @@ class ServiceInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ServiceInstance
+
+        :returns: The fetched ServiceInstance
+        :rtype: twilio.rest.ip_messaging.v2.service.ServiceInstance
+        """
+        return await self._proxy.fetch_async()
+
     def delete(self):
         """
         Deletes the ServiceInstance
@@ -662,6 +938,15 @@ class ServiceInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the ServiceInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def update(self, friendly_name=values.unset,
                default_service_role_sid=values.unset,
                default_channel_role_sid=values.unset,
@@ -762,6 +1047,106 @@ class ServiceInstance(InstanceResource):
             notifications_log_enabled=notifications_log_enabled,
         )
 
+    async def update_async(self, friendly_name=values.unset,
+                           default_service_role_sid=values.unset,
+                           default_channel_role_sid=values.unset,
+                           default_channel_creator_role_sid=values.unset,
+                           read_status_enabled=values.unset, reachability_enabled=values.unset,
+                           typing_indicator_timeout=values.unset,
+                           consumption_report_interval=values.unset,
+                           notifications_new_message_enabled=values.unset,
+                           notifications_new_message_template=values.unset,
+                           notifications_new_message_sound=values.unset,
+                           notifications_new_message_badge_count_enabled=values.unset,
+                           notifications_added_to_channel_enabled=values.unset,
+                           notifications_added_to_channel_template=values.unset,
+                           notifications_added_to_channel_sound=values.unset,
+                           notifications_removed_from_channel_enabled=values.unset,
+                           notifications_removed_from_channel_template=values.unset,
+                           notifications_removed_from_channel_sound=values.unset,
+                           notifications_invited_to_channel_enabled=values.unset,
+                           notifications_invited_to_channel_template=values.unset,
+                           notifications_invited_to_channel_sound=values.unset,
+                           pre_webhook_url=values.unset, post_webhook_url=values.unset,
+                           webhook_method=values.unset, webhook_filters=values.unset,
+                           limits_channel_members=values.unset,
+                           limits_user_channels=values.unset,
+                           media_compatibility_message=values.unset,
+                           pre_webhook_retry_count=values.unset,
+                           post_webhook_retry_count=values.unset,
+                           notifications_log_enabled=values.unset):
+        """
+        Asynchronous coroutine that updates the ServiceInstance
+
+        :param unicode friendly_name: The friendly_name
+        :param unicode default_service_role_sid: The default_service_role_sid
+        :param unicode default_channel_role_sid: The default_channel_role_sid
+        :param unicode default_channel_creator_role_sid: The default_channel_creator_role_sid
+        :param bool read_status_enabled: The read_status_enabled
+        :param bool reachability_enabled: The reachability_enabled
+        :param unicode typing_indicator_timeout: The typing_indicator_timeout
+        :param unicode consumption_report_interval: The consumption_report_interval
+        :param bool notifications_new_message_enabled: The notifications.new_message.enabled
+        :param unicode notifications_new_message_template: The notifications.new_message.template
+        :param unicode notifications_new_message_sound: The notifications.new_message.sound
+        :param bool notifications_new_message_badge_count_enabled: The notifications.new_message.badge_count_enabled
+        :param bool notifications_added_to_channel_enabled: The notifications.added_to_channel.enabled
+        :param unicode notifications_added_to_channel_template: The notifications.added_to_channel.template
+        :param unicode notifications_added_to_channel_sound: The notifications.added_to_channel.sound
+        :param bool notifications_removed_from_channel_enabled: The notifications.removed_from_channel.enabled
+        :param unicode notifications_removed_from_channel_template: The notifications.removed_from_channel.template
+        :param unicode notifications_removed_from_channel_sound: The notifications.removed_from_channel.sound
+        :param bool notifications_invited_to_channel_enabled: The notifications.invited_to_channel.enabled
+        :param unicode notifications_invited_to_channel_template: The notifications.invited_to_channel.template
+        :param unicode notifications_invited_to_channel_sound: The notifications.invited_to_channel.sound
+        :param unicode pre_webhook_url: The pre_webhook_url
+        :param unicode post_webhook_url: The post_webhook_url
+        :param unicode webhook_method: The webhook_method
+        :param list[unicode] webhook_filters: The webhook_filters
+        :param unicode limits_channel_members: The limits.channel_members
+        :param unicode limits_user_channels: The limits.user_channels
+        :param unicode media_compatibility_message: The media.compatibility_message
+        :param unicode pre_webhook_retry_count: The pre_webhook_retry_count
+        :param unicode post_webhook_retry_count: The post_webhook_retry_count
+        :param bool notifications_log_enabled: The notifications.log_enabled
+
+        :returns: The updated ServiceInstance
+        :rtype: twilio.rest.ip_messaging.v2.service.ServiceInstance
+        """
+        return await self._proxy.update_async(
+            friendly_name=friendly_name,
+            default_service_role_sid=default_service_role_sid,
+            default_channel_role_sid=default_channel_role_sid,
+            default_channel_creator_role_sid=default_channel_creator_role_sid,
+            read_status_enabled=read_status_enabled,
+            reachability_enabled=reachability_enabled,
+            typing_indicator_timeout=typing_indicator_timeout,
+            consumption_report_interval=consumption_report_interval,
+            notifications_new_message_enabled=notifications_new_message_enabled,
+            notifications_new_message_template=notifications_new_message_template,
+            notifications_new_message_sound=notifications_new_message_sound,
+            notifications_new_message_badge_count_enabled=notifications_new_message_badge_count_enabled,
+            notifications_added_to_channel_enabled=notifications_added_to_channel_enabled,
+            notifications_added_to_channel_template=notifications_added_to_channel_template,
+            notifications_added_to_channel_sound=notifications_added_to_channel_sound,
+            notifications_removed_from_channel_enabled=notifications_removed_from_channel_enabled,
+            notifications_removed_from_channel_template=notifications_removed_from_channel_template,
+            notifications_removed_from_channel_sound=notifications_removed_from_channel_sound,
+            notifications_invited_to_channel_enabled=notifications_invited_to_channel_enabled,
+            notifications_invited_to_channel_template=notifications_invited_to_channel_template,
+            notifications_invited_to_channel_sound=notifications_invited_to_channel_sound,
+            pre_webhook_url=pre_webhook_url,
+            post_webhook_url=post_webhook_url,
+            webhook_method=webhook_method,
+            webhook_filters=webhook_filters,
+            limits_channel_members=limits_channel_members,
+            limits_user_channels=limits_user_channels,
+            media_compatibility_message=media_compatibility_message,
+            pre_webhook_retry_count=pre_webhook_retry_count,
+            post_webhook_retry_count=post_webhook_retry_count,
+            notifications_log_enabled=notifications_log_enabled,
+        )
+
     @property
     def channels(self):
         """
@@ -811,3 +1196,22 @@ class ServiceInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.IpMessaging.V2.ServiceInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'BindingList': 'twilio.rest.ip_messaging.v2.service.binding',
+    'ChannelList': 'twilio.rest.ip_messaging.v2.service.channel',
+    'RoleList': 'twilio.rest.ip_messaging.v2.service.role',
+    'UserList': 'twilio.rest.ip_messaging.v2.service.user',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -6,6 +6,8 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import serialize
 from twilio.base import values
@@ -13,10 +15,6 @@ from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.ip_messaging.v2.service.channel.invite import InviteList
-from twilio.rest.ip_messaging.v2.service.channel.member import MemberList
-from twilio.rest.ip_messaging.v2.service.channel.message import MessageList
-from twilio.rest.ip_messaging.v2.service.channel.webhook import WebhookList
 
 
 class ChannelList(ListResource):
@@ -35,12 +33,12 @@ class ChannelList(ListResource):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, }
-        self._uri = '/Services/{service_sid}/Channels'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/Channels', self._solution)
 
     def create(self, friendly_name=values.unset, unique_name=values.unset,
                attributes=values.unset, type=values.unset,
                date_created=values.unset, date_updated=values.unset,
-               created_by=values.unset, x_twilio_webhook_enabled=values.unset):
+               created_by=values.unset, x_twilio_webhook_enabled=values.unset, deadline=None):
         """
         Create the ChannelInstance
 
@@ -52,6 +50,45 @@ class ChannelList(ListResource):
         :param datetime date_updated: The date_updated
         :param unicode created_by: The created_by
         :param ChannelInstance.WebhookEnabledType x_twilio_webhook_enabled: The X-Twilio-Webhook-Enabled HTTP request header
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created ChannelInstance
+        :rtype: twilio.rest.ip_messaging.v2.service.channel.ChannelInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'UniqueName': unique_name,
+            'Attributes': attributes,
+            'Type': type,
+            'DateCreated': serialize.iso8601_datetime(date_created),
+            'DateUpdated': serialize.iso8601_datetime(date_updated),
+            'CreatedBy': created_by,
+        })
+        headers = values.of({'X-Twilio-Webhook-Enabled': x_twilio_webhook_enabled, })
+
+        payload = self._version.create(method='POST', uri=self._uri, data=data, headers=headers, deadline=deadline, )
+
+        return ChannelInstance(self._version, payload, service_sid=self._solution['service_sid'], )
+
+    async def create_async(self, friendly_name=values.unset, unique_name=values.unset,
+                           attributes=values.unset, type=values.unset,
+                           date_created=values.unset, date_updated=values.unset,
+                           created_by=values.unset, x_twilio_webhook_enabled=values.unset,
+                           deadline=None):
+        """
+        Asynchronous coroutine that creates the ChannelInstance
+
+        :param unicode friendly_name: The friendly_name
+        :param unicode unique_name: The unique_name
+        :param unicode attributes: The attributes
+        :param ChannelInstance.ChannelType type: The type
+        :param datetime date_created: The date_created
+        :param datetime date_updated: The date_updated
+        :param unicode created_by: The created_by
+        :param ChannelInstance.WebhookEnabledType x_twilio_webhook_enabled: The X-Twilio-Webhook-Enabled HTTP request header
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created ChannelInstance
         :rtype: twilio.rest.ip_messaging.v2.service.channel.ChannelInstance
@@ -67,11 +104,12 @@ class ChannelList(ListResource):
         })
         headers = values.of({'X-Twilio-Webhook-Enabled': x_twilio_webhook_enabled, })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, headers=headers, )
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, headers=headers, deadline=deadline, )
 
         return ChannelInstance(self._version, payload, service_sid=self._solution['service_sid'], )
 
-    def stream(self, type=values.unset, limit=None, page_size=None):
+    def stream(self, type=values.unset, limit=None, page_size=None,
+               prefetch=None, raw=False, deadline=None):
         """
         Streams ChannelInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -85,17 +123,59 @@ class ChannelList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.ip_messaging.v2.service.channel.ChannelInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(type=type, page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(type=type, page_size=limits['page_size'], )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, type=values.unset, limit=None, page_size=None,
+                           prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams ChannelInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param list[ChannelInstance.ChannelType] type: The type
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.ip_messaging.v2.service.channel.ChannelInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(type=type, page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, type=values.unset, limit=None, page_size=None):
+    def list(self, type=values.unset, limit=None, page_size=None,
+             prefetch=None, raw=False, deadline=None):
         """
         Lists ChannelInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -108,11 +188,43 @@ class ChannelList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.ip_messaging.v2.service.channel.ChannelInstance]
+        """
+        return list(self.stream(type=type, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, type=values.unset, limit=None, page_size=None,
+                         prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists ChannelInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param list[ChannelInstance.ChannelType] type: The type
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.ip_messaging.v2.service.channel.ChannelInstance]
         """
-        return list(self.stream(type=type, limit=limit, page_size=page_size, ))
+        return [record async for record in await self.stream_async(type=type, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, type=values.unset, page_token=values.unset,
              page_number=values.unset, page_size=values.unset):
@@ -139,6 +251,31 @@ class ChannelList(ListResource):
 
         return ChannelPage(self._version, response, self._solution)
 
+    async def page_async(self, type=values.unset, page_token=values.unset,
+                         page_number=values.unset, page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of ChannelInstance records from the API.
+        Request is executed immediately
+
+        :param list[ChannelInstance.ChannelType] type: The type
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of ChannelInstance
+        :rtype: twilio.rest.ip_messaging.v2.service.channel.ChannelPage
+        """
+        data = values.of({
+            'Type': serialize.map(type, lambda e: e),
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return ChannelPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of ChannelInstance records from the API.
@@ -156,6 +293,23 @@ class ChannelList(ListResource):
 
         return ChannelPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of ChannelInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of ChannelInstance
+        :rtype: twilio.rest.ip_messaging.v2.service.channel.ChannelPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return ChannelPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a ChannelContext
@@ -244,7 +398,7 @@ class ChannelContext(InstanceContext):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, 'sid': sid, }
-        self._uri = '/Services/{service_sid}/Channels/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/Channels/{sid}', self._solution)
 
         # Dependents
         self._members = None
@@ -268,6 +422,22 @@ class ChannelContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ChannelInstance
+
+        :returns: The fetched ChannelInstance
+        :rtype: twilio.rest.ip_messaging.v2.service.channel.ChannelInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return ChannelInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self, x_twilio_webhook_enabled=values.unset):
         """
         Deletes the ChannelInstance
@@ -281,6 +451,19 @@ class ChannelContext(InstanceContext):
 
         return self._version.delete(method='DELETE', uri=self._uri, headers=headers, )
 
+    async def delete_async(self, x_twilio_webhook_enabled=values.unset):
+        """
+        Asynchronous coroutine that deletes the ChannelInstance
+
+        :param ChannelInstance.WebhookEnabledType x_twilio_webhook_enabled: The X-Twilio-Webhook-Enabled HTTP request header
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        headers = values.of({'X-Twilio-Webhook-Enabled': x_twilio_webhook_enabled, })
+
+        return await self._version.delete_async(method='DELETE', uri=self._uri, headers=headers, )
+
     def update(self, friendly_name=values.unset, unique_name=values.unset,
                attributes=values.unset, date_created=values.unset,
                date_updated=values.unset, created_by=values.unset,
@@ -318,6 +501,43 @@ class ChannelContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, friendly_name=values.unset, unique_name=values.unset,
+                           attributes=values.unset, date_created=values.unset,
+                           date_updated=values.unset, created_by=values.unset,
+                           x_twilio_webhook_enabled=values.unset):
+        """
+        Asynchronous coroutine that updates the ChannelInstance
+
+        :param unicode friendly_name: The friendly_name
+        :param unicode unique_name: The unique_name
+        :param unicode attributes: The attributes
+        :param datetime date_created: The date_created
+        :param datetime date_updated: The date_updated
+        :param unicode created_by: The created_by
+        :param ChannelInstance.WebhookEnabledType x_twilio_webhook_enabled: The X-Twilio-Webhook-Enabled HTTP request header
+
+        :returns: The updated ChannelInstance
+        :rtype: twilio.rest.ip_messaging.v2.service.channel.ChannelInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'UniqueName': unique_name,
+            'Attributes': attributes,
+            'DateCreated': serialize.iso8601_datetime(date_created),
+            'DateUpdated': serialize.iso8601_datetime(date_updated),
+            'CreatedBy': created_by,
+        })
+        headers = values.of({'X-Twilio-Webhook-Enabled': x_twilio_webhook_enabled, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, headers=headers, )
+
+        return ChannelInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            sid=self._solution['sid'],
+        )
+
     @property
     def members(self):
         """
@@ -327,6 +547,7 @@ class ChannelContext(InstanceContext):
         :rtype: twilio.rest.ip_messaging.v2.service.channel.member.MemberList
         """
         if self._members is None:
+            from twilio.rest.ip_messaging.v2.service.channel.member import MemberList
             self._members = MemberList(
                 self._version,
                 service_sid=self._solution['service_sid'],
@@ -343,6 +564,7 @@ class ChannelContext(InstanceContext):
         :rtype: twilio.rest.ip_messaging.v2.service.channel.message.MessageList
         """
         if self._messages is None:
+            from twilio.rest.ip_messaging.v2.service.channel.message import MessageList
             self._messages = MessageList(
                 self._version,
                 service_sid=self._solution['service_sid'],
@@ -359,6 +581,7 @@ class ChannelContext(InstanceContext):
         :rtype: twilio.rest.ip_messaging.v2.service.channel.invite.InviteList
         """
         if self._invites is None:
+            from twilio.rest.ip_messaging.v2.service.channel.invite import InviteList
             self._invites = InviteList(
                 self._version,
                 service_sid=self._solution['service_sid'],
@@ -375,6 +598,7 @@ class ChannelContext(InstanceContext):
         :rtype: twilio.rest.ip_messaging.v2.service.channel.webhook.WebhookList
         """
         if self._webhooks is None:
+            from twilio.rest.ip_messaging.v2.service.channel.webhook import WebhookList
             self._webhooks = WebhookList(
                 self._version,
                 service_sid=self._solution['service_sid'],
@@ -403,6 +627,34 @@ class ChannelInstance(InstanceResource):
         TRUE = "true"
         FALSE = "false"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+        'members_count': deserialize.integer,
+        'messages_count': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'service_sid': 'service_sid',
+        'friendly_name': 'friendly_name',
+        'unique_name': 'unique_name',
+        'attributes': 'attributes',
+        'type': 'type',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'created_by': 'created_by',
+        'members_count': 'members_count',
+        'messages_count': 'messages_count',
+        'url': 'url',
+        'links': 'links',
+    }, _deserializers)
+
     def __init__(self, version, payload, service_sid, sid=None):
         """
         Initialize the ChannelInstance
@@ -413,22 +665,7 @@ class ChannelInstance(InstanceResource):
         super(ChannelInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'service_sid': payload.get('service_sid'),
-            'friendly_name': payload.get('friendly_name'),
-            'unique_name': payload.get('unique_name'),
-            'attributes': payload.get('attributes'),
-            'type': payload.get('type'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'created_by': payload.get('created_by'),
-            'members_count': deserialize.integer(payload.get('members_count')),
-            'messages_count': deserialize.integer(payload.get('messages_count')),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -572,6 +809,15 @@ class ChannelInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ChannelInstance
+
+        :returns: The fetched ChannelInstance
+        :rtype: twilio.rest.ip_messaging.v2.service.channel.ChannelInstance
+        """
+        return await self._proxy.fetch_async()
+
     def delete(self, x_twilio_webhook_enabled=values.unset):
         """
         Deletes the ChannelInstance
@@ -583,6 +829,17 @@ class ChannelInstance(InstanceResource):
         """
         return self._proxy.delete(x_twilio_webhook_enabled=x_twilio_webhook_enabled, )
 
+    async def delete_async(self, x_twilio_webhook_enabled=values.unset):
+        """
+        Asynchronous coroutine that deletes the ChannelInstance
+
+        :param ChannelInstance.WebhookEnabledType x_twilio_webhook_enabled: The X-Twilio-Webhook-Enabled HTTP request header
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async(x_twilio_webhook_enabled=x_twilio_webhook_enabled, )
+
     def update(self, friendly_name=values.unset, unique_name=values.unset,
                attributes=values.unset, date_created=values.unset,
                date_updated=values.unset, created_by=values.unset,
@@ -611,6 +868,34 @@ class ChannelInstance(InstanceResource):
             x_twilio_webhook_enabled=x_twilio_webhook_enabled,
         )
 
+    async def update_async(self, friendly_name=values.unset, unique_name=values.unset,
+                           attributes=values.unset, date_created=values.unset,
+                           date_updated=values.unset, created_by=values.unset,
+                           x_twilio_webhook_enabled=values.unset):
+        """
+        Asynchronous coroutine that updates the ChannelInstance
+
+        :param unicode friendly_name: The friendly_name
+        :param unicode unique_name: The unique_name
+        :param unicode attributes: The attributes
+        :param datetime date_created: The date_created
+        :param datetime date_updated: The date_updated
+        :param unicode created_by: The created_by
+        :param ChannelInstance.WebhookEnabledType x_twilio_webhook_enabled: The X-Twilio-Webhook-Enabled HTTP request header
+
+        :returns: The updated ChannelInstance
+        :rtype: twilio.rest.ip_messaging.v2.service.channel.ChannelInstance
+        """
+        return await self._proxy.update_async(
+            friendly_name=friendly_name,
+            unique_name=unique_name,
+            attributes=attributes,
+            date_created=date_created,
+            date_updated=date_updated,
+            created_by=created_by,
+            x_twilio_webhook_enabled=x_twilio_webhook_enabled,
+        )
+
     @property
     def members(self):
         """
@@ -660,3 +945,22 @@ class ChannelInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.IpMessaging.V2.ChannelInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'InviteList': 'twilio.rest.ip_messaging.v2.service.channel.invite',
+    'MemberList': 'twilio.rest.ip_messaging.v2.service.channel.member',
+    'MessageList': 'twilio.rest.ip_messaging.v2.service.channel.message',
+    'WebhookList': 'twilio.rest.ip_messaging.v2.service.channel.webhook',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
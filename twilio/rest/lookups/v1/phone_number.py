@@ -7,6 +7,7 @@ This code was generated by
 """
 
 from twilio.base import serialize
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
@@ -116,7 +117,7 @@ class PhoneNumberContext(InstanceContext):
 
         # Path Solution
         self._solution = {'phone_number': phone_number, }
-        self._uri = '/PhoneNumbers/{phone_number}'.format(**self._solution)
+        self._uri = values.ResourceUri('/PhoneNumbers/{phone_number}', self._solution)
 
     def fetch(self, country_code=values.unset, type=values.unset,
               add_ons=values.unset, add_ons_data=values.unset):
@@ -142,6 +143,30 @@ class PhoneNumberContext(InstanceContext):
 
         return PhoneNumberInstance(self._version, payload, phone_number=self._solution['phone_number'], )
 
+    async def fetch_async(self, country_code=values.unset, type=values.unset,
+                          add_ons=values.unset, add_ons_data=values.unset):
+        """
+        Asynchronous coroutine that fetches the PhoneNumberInstance
+
+        :param unicode country_code: The ISO country code of the phone number
+        :param list[unicode] type: The type of information to return
+        :param list[unicode] add_ons: The unique_name of an Add-on you would like to invoke
+        :param dict add_ons_data: Data specific to the add-on you would like to invoke
+
+        :returns: The fetched PhoneNumberInstance
+        :rtype: twilio.rest.lookups.v1.phone_number.PhoneNumberInstance
+        """
+        data = values.of({
+            'CountryCode': country_code,
+            'Type': serialize.map(type, lambda e: e),
+            'AddOns': serialize.map(add_ons, lambda e: e),
+        })
+        data.update(serialize.prefixed_collapsible_map(add_ons_data, 'AddOns'))
+
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, params=data, )
+
+        return PhoneNumberInstance(self._version, payload, phone_number=self._solution['phone_number'], )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -160,6 +185,19 @@ class PhoneNumberInstance(InstanceResource):
         MOBILE = "mobile"
         VOIP = "voip"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'caller_name': 'caller_name',
+        'country_code': 'country_code',
+        'phone_number': 'phone_number',
+        'national_format': 'national_format',
+        'carrier': 'carrier',
+        'add_ons': 'add_ons',
+        'url': 'url',
+    })
+
     def __init__(self, version, payload, phone_number=None):
         """
         Initialize the PhoneNumberInstance
@@ -170,15 +208,7 @@ class PhoneNumberInstance(InstanceResource):
         super(PhoneNumberInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'caller_name': payload.get('caller_name'),
-            'country_code': payload.get('country_code'),
-            'phone_number': payload.get('phone_number'),
-            'national_format': payload.get('national_format'),
-            'carrier': payload.get('carrier'),
-            'add_ons': payload.get('add_ons'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -273,6 +303,26 @@ class PhoneNumberInstance(InstanceResource):
             add_ons_data=add_ons_data,
         )
 
+    async def fetch_async(self, country_code=values.unset, type=values.unset,
+                          add_ons=values.unset, add_ons_data=values.unset):
+        """
+        Asynchronous coroutine that fetches the PhoneNumberInstance
+
+        :param unicode country_code: The ISO country code of the phone number
+        :param list[unicode] type: The type of information to return
+        :param list[unicode] add_ons: The unique_name of an Add-on you would like to invoke
+        :param dict add_ons_data: Data specific to the add-on you would like to invoke
+
+        :returns: The fetched PhoneNumberInstance
+        :rtype: twilio.rest.lookups.v1.phone_number.PhoneNumberInstance
+        """
+        return await self._proxy.fetch_async(
+            country_code=country_code,
+            type=type,
+            add_ons=add_ons,
+            add_ons_data=add_ons_data,
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -6,10 +6,9 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base.version import Version
-from twilio.rest.media.v1.media_processor import MediaProcessorList
-from twilio.rest.media.v1.media_recording import MediaRecordingList
-from twilio.rest.media.v1.player_streamer import PlayerStreamerList
 
 
 class V1(Version):
@@ -33,6 +32,7 @@ class V1(Version):
         :rtype: twilio.rest.media.v1.media_processor.MediaProcessorList
         """
         if self._media_processor is None:
+            from twilio.rest.media.v1.media_processor import MediaProcessorList
             self._media_processor = MediaProcessorList(self)
         return self._media_processor
 
@@ -42,6 +42,7 @@ class V1(Version):
         :rtype: twilio.rest.media.v1.media_recording.MediaRecordingList
         """
         if self._media_recording is None:
+            from twilio.rest.media.v1.media_recording import MediaRecordingList
             self._media_recording = MediaRecordingList(self)
         return self._media_recording
 
@@ -51,6 +52,7 @@ class V1(Version):
         :rtype: twilio.rest.media.v1.player_streamer.PlayerStreamerList
         """
         if self._player_streamer is None:
+            from twilio.rest.media.v1.player_streamer import PlayerStreamerList
             self._player_streamer = PlayerStreamerList(self)
         return self._player_streamer
 
@@ -62,3 +64,21 @@ class V1(Version):
         :rtype: str
         """
         return '<Twilio.Media.V1>'
+
+
+_LAZY_IMPORTS = {
+    'MediaProcessorList': 'twilio.rest.media.v1.media_processor',
+    'MediaRecordingList': 'twilio.rest.media.v1.media_recording',
+    'PlayerStreamerList': 'twilio.rest.media.v1.player_streamer',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
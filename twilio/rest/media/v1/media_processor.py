@@ -30,11 +30,11 @@ class MediaProcessorList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/MediaProcessors'.format(**self._solution)
+        self._uri = values.ResourceUri('/MediaProcessors', self._solution)
 
     def create(self, extension, extension_context,
                extension_environment=values.unset, status_callback=values.unset,
-               status_callback_method=values.unset, max_duration=values.unset):
+               status_callback_method=values.unset, max_duration=values.unset, deadline=None):
         """
         Create the MediaProcessorInstance
 
@@ -44,6 +44,8 @@ class MediaProcessorList(ListResource):
         :param unicode status_callback: The URL to send MediaProcessor event updates to your application
         :param unicode status_callback_method: The HTTP method Twilio should use to call the `status_callback` URL
         :param unicode max_duration: Maximum MediaProcessor duration in minutes
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created MediaProcessorInstance
         :rtype: twilio.rest.media.v1.media_processor.MediaProcessorInstance
@@ -57,12 +59,44 @@ class MediaProcessorList(ListResource):
             'MaxDuration': max_duration,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return MediaProcessorInstance(self._version, payload, )
+
+    async def create_async(self, extension, extension_context,
+                           extension_environment=values.unset, status_callback=values.unset,
+                           status_callback_method=values.unset, max_duration=values.unset,
+                           deadline=None):
+        """
+        Asynchronous coroutine that creates the MediaProcessorInstance
+
+        :param unicode extension: The Media Extension name or URL
+        :param unicode extension_context: The Media Extension context
+        :param dict extension_environment: The Media Extension environment
+        :param unicode status_callback: The URL to send MediaProcessor event updates to your application
+        :param unicode status_callback_method: The HTTP method Twilio should use to call the `status_callback` URL
+        :param unicode max_duration: Maximum MediaProcessor duration in minutes
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created MediaProcessorInstance
+        :rtype: twilio.rest.media.v1.media_processor.MediaProcessorInstance
+        """
+        data = values.of({
+            'Extension': extension,
+            'ExtensionContext': extension_context,
+            'ExtensionEnvironment': serialize.object(extension_environment),
+            'StatusCallback': status_callback,
+            'StatusCallbackMethod': status_callback_method,
+            'MaxDuration': max_duration,
+        })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return MediaProcessorInstance(self._version, payload, )
 
     def stream(self, order=values.unset, status=values.unset, limit=None,
-               page_size=None):
+               page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams MediaProcessorInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -77,18 +111,60 @@ class MediaProcessorList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.media.v1.media_processor.MediaProcessorInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(order=order, status=status, page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(order=order, status=status, page_size=limits['page_size'], )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, order=values.unset, status=values.unset, limit=None,
+                           page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams MediaProcessorInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param MediaProcessorInstance.Order order: The sort order of the list
+        :param MediaProcessorInstance.Status status: Status to filter by
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.media.v1.media_processor.MediaProcessorInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(order=order, status=status, page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, order=values.unset, status=values.unset, limit=None,
-             page_size=None):
+             page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists MediaProcessorInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -102,11 +178,44 @@ class MediaProcessorList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.media.v1.media_processor.MediaProcessorInstance]
         """
-        return list(self.stream(order=order, status=status, limit=limit, page_size=page_size, ))
+        return list(self.stream(order=order, status=status, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, order=values.unset, status=values.unset, limit=None,
+                         page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists MediaProcessorInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param MediaProcessorInstance.Order order: The sort order of the list
+        :param MediaProcessorInstance.Status status: Status to filter by
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.media.v1.media_processor.MediaProcessorInstance]
+        """
+        return [record async for record in await self.stream_async(order=order, status=status, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, order=values.unset, status=values.unset, page_token=values.unset,
              page_number=values.unset, page_size=values.unset):
@@ -135,6 +244,33 @@ class MediaProcessorList(ListResource):
 
         return MediaProcessorPage(self._version, response, self._solution)
 
+    async def page_async(self, order=values.unset, status=values.unset, page_token=values.unset,
+                         page_number=values.unset, page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of MediaProcessorInstance records from the API.
+        Request is executed immediately
+
+        :param MediaProcessorInstance.Order order: The sort order of the list
+        :param MediaProcessorInstance.Status status: Status to filter by
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of MediaProcessorInstance
+        :rtype: twilio.rest.media.v1.media_processor.MediaProcessorPage
+        """
+        data = values.of({
+            'Order': order,
+            'Status': status,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return MediaProcessorPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of MediaProcessorInstance records from the API.
@@ -152,6 +288,23 @@ class MediaProcessorList(ListResource):
 
         return MediaProcessorPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of MediaProcessorInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of MediaProcessorInstance
+        :rtype: twilio.rest.media.v1.media_processor.MediaProcessorPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return MediaProcessorPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a MediaProcessorContext
@@ -238,7 +391,7 @@ class MediaProcessorContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/MediaProcessors/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/MediaProcessors/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -251,6 +404,17 @@ class MediaProcessorContext(InstanceContext):
 
         return MediaProcessorInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the MediaProcessorInstance
+
+        :returns: The fetched MediaProcessorInstance
+        :rtype: twilio.rest.media.v1.media_processor.MediaProcessorInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return MediaProcessorInstance(self._version, payload, sid=self._solution['sid'], )
+
     def update(self, status):
         """
         Update the MediaProcessorInstance
@@ -266,6 +430,21 @@ class MediaProcessorContext(InstanceContext):
 
         return MediaProcessorInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def update_async(self, status):
+        """
+        Asynchronous coroutine that updates the MediaProcessorInstance
+
+        :param MediaProcessorInstance.UpdateStatus status: The status of the MediaProcessor
+
+        :returns: The updated MediaProcessorInstance
+        :rtype: twilio.rest.media.v1.media_processor.MediaProcessorInstance
+        """
+        data = values.of({'Status': status, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return MediaProcessorInstance(self._version, payload, sid=self._solution['sid'], )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -291,6 +470,31 @@ class MediaProcessorInstance(InstanceResource):
         ASC = "asc"
         DESC = "desc"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+        'max_duration': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'sid': 'sid',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'extension': 'extension',
+        'extension_context': 'extension_context',
+        'status': 'status',
+        'url': 'url',
+        'ended_reason': 'ended_reason',
+        'status_callback': 'status_callback',
+        'status_callback_method': 'status_callback_method',
+        'max_duration': 'max_duration',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the MediaProcessorInstance
@@ -301,20 +505,7 @@ class MediaProcessorInstance(InstanceResource):
         super(MediaProcessorInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'sid': payload.get('sid'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'extension': payload.get('extension'),
-            'extension_context': payload.get('extension_context'),
-            'status': payload.get('status'),
-            'url': payload.get('url'),
-            'ended_reason': payload.get('ended_reason'),
-            'status_callback': payload.get('status_callback'),
-            'status_callback_method': payload.get('status_callback_method'),
-            'max_duration': deserialize.integer(payload.get('max_duration')),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -438,6 +629,15 @@ class MediaProcessorInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the MediaProcessorInstance
+
+        :returns: The fetched MediaProcessorInstance
+        :rtype: twilio.rest.media.v1.media_processor.MediaProcessorInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, status):
         """
         Update the MediaProcessorInstance
@@ -449,6 +649,17 @@ class MediaProcessorInstance(InstanceResource):
         """
         return self._proxy.update(status, )
 
+    async def update_async(self, status):
+        """
+        Asynchronous coroutine that updates the MediaProcessorInstance
+
+        :param MediaProcessorInstance.UpdateStatus status: The status of the MediaProcessor
+
+        :returns: The updated MediaProcessorInstance
+        :rtype: twilio.rest.media.v1.media_processor.MediaProcessorInstance
+        """
+        return await self._proxy.update_async(status, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -32,11 +32,11 @@ class MediaRecordingList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/MediaRecordings'.format(**self._solution)
+        self._uri = values.ResourceUri('/MediaRecordings', self._solution)
 
     def stream(self, order=values.unset, status=values.unset,
                processor_sid=values.unset, source_sid=values.unset, limit=None,
-               page_size=None):
+               page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams MediaRecordingInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -53,25 +53,76 @@ class MediaRecordingList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.media.v1.media_recording.MediaRecordingInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
-            order=order,
-            status=status,
-            processor_sid=processor_sid,
-            source_sid=source_sid,
-            page_size=limits['page_size'],
-        )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                order=order,
+                status=status,
+                processor_sid=processor_sid,
+                source_sid=source_sid,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, order=values.unset, status=values.unset,
+                           processor_sid=values.unset, source_sid=values.unset, limit=None,
+                           page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams MediaRecordingInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param MediaRecordingInstance.Order order: The sort order of the list
+        :param MediaRecordingInstance.Status status: Status to filter by
+        :param unicode processor_sid: MediaProcessor to filter by
+        :param unicode source_sid: Source SID to filter by
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.media.v1.media_recording.MediaRecordingInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                order=order,
+                status=status,
+                processor_sid=processor_sid,
+                source_sid=source_sid,
+                page_size=limits['page_size'],
+            )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, order=values.unset, status=values.unset,
              processor_sid=values.unset, source_sid=values.unset, limit=None,
-             page_size=None):
+             page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists MediaRecordingInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -87,6 +138,12 @@ class MediaRecordingList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.media.v1.media_recording.MediaRecordingInstance]
@@ -98,8 +155,51 @@ class MediaRecordingList(ListResource):
             source_sid=source_sid,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, order=values.unset, status=values.unset,
+                         processor_sid=values.unset, source_sid=values.unset, limit=None,
+                         page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists MediaRecordingInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param MediaRecordingInstance.Order order: The sort order of the list
+        :param MediaRecordingInstance.Status status: Status to filter by
+        :param unicode processor_sid: MediaProcessor to filter by
+        :param unicode source_sid: Source SID to filter by
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.media.v1.media_recording.MediaRecordingInstance]
+        """
+        return [record async for record in await self.stream_async(
+            order=order,
+            status=status,
+            processor_sid=processor_sid,
+            source_sid=source_sid,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, order=values.unset, status=values.unset,
              processor_sid=values.unset, source_sid=values.unset,
              page_token=values.unset, page_number=values.unset,
@@ -133,6 +233,39 @@ class MediaRecordingList(ListResource):
 
         return MediaRecordingPage(self._version, response, self._solution)
 
+    async def page_async(self, order=values.unset, status=values.unset,
+                         processor_sid=values.unset, source_sid=values.unset,
+                         page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of MediaRecordingInstance records from the API.
+        Request is executed immediately
+
+        :param MediaRecordingInstance.Order order: The sort order of the list
+        :param MediaRecordingInstance.Status status: Status to filter by
+        :param unicode processor_sid: MediaProcessor to filter by
+        :param unicode source_sid: Source SID to filter by
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of MediaRecordingInstance
+        :rtype: twilio.rest.media.v1.media_recording.MediaRecordingPage
+        """
+        data = values.of({
+            'Order': order,
+            'Status': status,
+            'ProcessorSid': processor_sid,
+            'SourceSid': source_sid,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return MediaRecordingPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of MediaRecordingInstance records from the API.
@@ -150,6 +283,23 @@ class MediaRecordingList(ListResource):
 
         return MediaRecordingPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of MediaRecordingInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of MediaRecordingInstance
+        :rtype: twilio.rest.media.v1.media_recording.MediaRecordingPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return MediaRecordingPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a MediaRecordingContext
@@ -242,7 +392,7 @@ class MediaRecordingContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/MediaRecordings/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/MediaRecordings/{sid}', self._solution)
 
     def delete(self):
         """
@@ -253,6 +403,15 @@ class MediaRecordingContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the MediaRecordingInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def fetch(self):
         """
         Fetch the MediaRecordingInstance
@@ -264,6 +423,17 @@ class MediaRecordingContext(InstanceContext):
 
         return MediaRecordingInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the MediaRecordingInstance
+
+        :returns: The fetched MediaRecordingInstance
+        :rtype: twilio.rest.media.v1.media_recording.MediaRecordingInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return MediaRecordingInstance(self._version, payload, sid=self._solution['sid'], )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -294,6 +464,37 @@ class MediaRecordingInstance(InstanceResource):
         DELETED = "deleted"
         FAILED = "failed"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'bitrate': deserialize.integer,
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+        'duration': deserialize.integer,
+        'size': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'bitrate': 'bitrate',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'duration': 'duration',
+        'format': 'format',
+        'links': 'links',
+        'processor_sid': 'processor_sid',
+        'resolution': 'resolution',
+        'source_sid': 'source_sid',
+        'sid': 'sid',
+        'size': 'size',
+        'status': 'status',
+        'status_callback': 'status_callback',
+        'status_callback_method': 'status_callback_method',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the MediaRecordingInstance
@@ -304,24 +505,7 @@ class MediaRecordingInstance(InstanceResource):
         super(MediaRecordingInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'bitrate': deserialize.integer(payload.get('bitrate')),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'duration': deserialize.integer(payload.get('duration')),
-            'format': payload.get('format'),
-            'links': payload.get('links'),
-            'processor_sid': payload.get('processor_sid'),
-            'resolution': payload.get('resolution'),
-            'source_sid': payload.get('source_sid'),
-            'sid': payload.get('sid'),
-            'size': deserialize.integer(payload.get('size')),
-            'status': payload.get('status'),
-            'status_callback': payload.get('status_callback'),
-            'status_callback_method': payload.get('status_callback_method'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -477,6 +661,15 @@ class MediaRecordingInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the MediaRecordingInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def fetch(self):
         """
         Fetch the MediaRecordingInstance
@@ -486,6 +679,15 @@ class MediaRecordingInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the MediaRecordingInstance
+
+        :returns: The fetched MediaRecordingInstance
+        :rtype: twilio.rest.media.v1.media_recording.MediaRecordingInstance
+        """
+        return await self._proxy.fetch_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -6,13 +6,14 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.media.v1.player_streamer.playback_grant import PlaybackGrantList
 
 
 class PlayerStreamerList(ListResource):
@@ -30,10 +31,10 @@ class PlayerStreamerList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/PlayerStreamers'.format(**self._solution)
+        self._uri = values.ResourceUri('/PlayerStreamers', self._solution)
 
     def create(self, video=values.unset, status_callback=values.unset,
-               status_callback_method=values.unset, max_duration=values.unset):
+               status_callback_method=values.unset, max_duration=values.unset, deadline=None):
         """
         Create the PlayerStreamerInstance
 
@@ -41,6 +42,8 @@ class PlayerStreamerList(ListResource):
         :param unicode status_callback: The URL to which Twilio will send PlayerStreamer event updates
         :param unicode status_callback_method: The HTTP method Twilio should use to call the `status_callback` URL
         :param unicode max_duration: Maximum PlayerStreamer duration in seconds
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created PlayerStreamerInstance
         :rtype: twilio.rest.media.v1.player_streamer.PlayerStreamerInstance
@@ -52,12 +55,39 @@ class PlayerStreamerList(ListResource):
             'MaxDuration': max_duration,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return PlayerStreamerInstance(self._version, payload, )
+
+    async def create_async(self, video=values.unset, status_callback=values.unset,
+                           status_callback_method=values.unset, max_duration=values.unset,
+                           deadline=None):
+        """
+        Asynchronous coroutine that creates the PlayerStreamerInstance
+
+        :param bool video: Whether the PlayerStreamer is configured to stream video
+        :param unicode status_callback: The URL to which Twilio will send PlayerStreamer event updates
+        :param unicode status_callback_method: The HTTP method Twilio should use to call the `status_callback` URL
+        :param unicode max_duration: Maximum PlayerStreamer duration in seconds
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created PlayerStreamerInstance
+        :rtype: twilio.rest.media.v1.player_streamer.PlayerStreamerInstance
+        """
+        data = values.of({
+            'Video': video,
+            'StatusCallback': status_callback,
+            'StatusCallbackMethod': status_callback_method,
+            'MaxDuration': max_duration,
+        })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return PlayerStreamerInstance(self._version, payload, )
 
     def stream(self, order=values.unset, status=values.unset, limit=None,
-               page_size=None):
+               page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams PlayerStreamerInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -72,18 +102,60 @@ class PlayerStreamerList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.media.v1.player_streamer.PlayerStreamerInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(order=order, status=status, page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(order=order, status=status, page_size=limits['page_size'], )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, order=values.unset, status=values.unset, limit=None,
+                           page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams PlayerStreamerInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param PlayerStreamerInstance.Order order: The sort order of the list
+        :param PlayerStreamerInstance.Status status: Status to filter by
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.media.v1.player_streamer.PlayerStreamerInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(order=order, status=status, page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, order=values.unset, status=values.unset, limit=None,
-             page_size=None):
+             page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists PlayerStreamerInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -97,11 +169,44 @@ class PlayerStreamerList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.media.v1.player_streamer.PlayerStreamerInstance]
         """
-        return list(self.stream(order=order, status=status, limit=limit, page_size=page_size, ))
+        return list(self.stream(order=order, status=status, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, order=values.unset, status=values.unset, limit=None,
+                         page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists PlayerStreamerInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param PlayerStreamerInstance.Order order: The sort order of the list
+        :param PlayerStreamerInstance.Status status: Status to filter by
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.media.v1.player_streamer.PlayerStreamerInstance]
+        """
+        return [record async for record in await self.stream_async(order=order, status=status, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, order=values.unset, status=values.unset, page_token=values.unset,
              page_number=values.unset, page_size=values.unset):
@@ -130,6 +235,33 @@ class PlayerStreamerList(ListResource):
 
         return PlayerStreamerPage(self._version, response, self._solution)
 
+    async def page_async(self, order=values.unset, status=values.unset, page_token=values.unset,
+                         page_number=values.unset, page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of PlayerStreamerInstance records from the API.
+        Request is executed immediately
+
+        :param PlayerStreamerInstance.Order order: The sort order of the list
+        :param PlayerStreamerInstance.Status status: Status to filter by
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of PlayerStreamerInstance
+        :rtype: twilio.rest.media.v1.player_streamer.PlayerStreamerPage
+        """
+        data = values.of({
+            'Order': order,
+            'Status': status,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return PlayerStreamerPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of PlayerStreamerInstance records from the API.
@@ -147,6 +279,23 @@ class PlayerStreamerList(ListResource):
 
         return PlayerStreamerPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of PlayerStreamerInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of PlayerStreamerInstance
+        :rtype: twilio.rest.media.v1.player_streamer.PlayerStreamerPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return PlayerStreamerPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a PlayerStreamerContext
@@ -233,7 +382,7 @@ class PlayerStreamerContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/PlayerStreamers/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/PlayerStreamers/{sid}', self._solution)
 
         # Dependents
         self._playback_grant = None
@@ -249,6 +398,17 @@ class PlayerStreamerContext(InstanceContext):
 
         return PlayerStreamerInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the PlayerStreamerInstance
+
+        :returns: The fetched PlayerStreamerInstance
+        :rtype: twilio.rest.media.v1.player_streamer.PlayerStreamerInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return PlayerStreamerInstance(self._version, payload, sid=self._solution['sid'], )
+
     def update(self, status):
         """
         Update the PlayerStreamerInstance
@@ -264,6 +424,21 @@ class PlayerStreamerContext(InstanceContext):
 
         return PlayerStreamerInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def update_async(self, status):
+        """
+        Asynchronous coroutine that updates the PlayerStreamerInstance
+
+        :param PlayerStreamerInstance.UpdateStatus status: The status the PlayerStreamer should be transitioned to
+
+        :returns: The updated PlayerStreamerInstance
+        :rtype: twilio.rest.media.v1.player_streamer.PlayerStreamerInstance
+        """
+        data = values.of({'Status': status, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return PlayerStreamerInstance(self._version, payload, sid=self._solution['sid'], )
+
     @property
     def playback_grant(self):
         """
@@ -273,6 +448,7 @@ class PlayerStreamerContext(InstanceContext):
         :rtype: twilio.rest.media.v1.player_streamer.playback_grant.PlaybackGrantList
         """
         if self._playback_grant is None:
+            from twilio.rest.media.v1.player_streamer.playback_grant import PlaybackGrantList
             self._playback_grant = PlaybackGrantList(self._version, sid=self._solution['sid'], )
         return self._playback_grant
 
@@ -308,6 +484,31 @@ class PlayerStreamerInstance(InstanceResource):
         STREAM_DISCONNECTED_BY_SOURCE = "stream-disconnected-by-source"
         UNEXPECTED_FAILURE = "unexpected-failure"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+        'max_duration': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'video': 'video',
+        'links': 'links',
+        'sid': 'sid',
+        'status': 'status',
+        'url': 'url',
+        'status_callback': 'status_callback',
+        'status_callback_method': 'status_callback_method',
+        'ended_reason': 'ended_reason',
+        'max_duration': 'max_duration',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the PlayerStreamerInstance
@@ -318,20 +519,7 @@ class PlayerStreamerInstance(InstanceResource):
         super(PlayerStreamerInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'video': payload.get('video'),
-            'links': payload.get('links'),
-            'sid': payload.get('sid'),
-            'status': payload.get('status'),
-            'url': payload.get('url'),
-            'status_callback': payload.get('status_callback'),
-            'status_callback_method': payload.get('status_callback_method'),
-            'ended_reason': payload.get('ended_reason'),
-            'max_duration': deserialize.integer(payload.get('max_duration')),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -455,6 +643,15 @@ class PlayerStreamerInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the PlayerStreamerInstance
+
+        :returns: The fetched PlayerStreamerInstance
+        :rtype: twilio.rest.media.v1.player_streamer.PlayerStreamerInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, status):
         """
         Update the PlayerStreamerInstance
@@ -466,6 +663,17 @@ class PlayerStreamerInstance(InstanceResource):
         """
         return self._proxy.update(status, )
 
+    async def update_async(self, status):
+        """
+        Asynchronous coroutine that updates the PlayerStreamerInstance
+
+        :param PlayerStreamerInstance.UpdateStatus status: The status the PlayerStreamer should be transitioned to
+
+        :returns: The updated PlayerStreamerInstance
+        :rtype: twilio.rest.media.v1.player_streamer.PlayerStreamerInstance
+        """
+        return await self._proxy.update_async(status, )
+
     @property
     def playback_grant(self):
         """
@@ -485,3 +693,19 @@ class PlayerStreamerInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Media.V1.PlayerStreamerInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'PlaybackGrantList': 'twilio.rest.media.v1.player_streamer.playback_grant',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
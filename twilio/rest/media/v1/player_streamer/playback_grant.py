@@ -114,21 +114,42 @@ class PlaybackGrantContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/PlayerStreamers/{sid}/PlaybackGrant'.format(**self._solution)
+        self._uri = values.ResourceUri('/PlayerStreamers/{sid}/PlaybackGrant', self._solution)
 
-    def create(self, ttl=values.unset, access_control_allow_origin=values.unset):
+    def create(self, ttl=values.unset, access_control_allow_origin=values.unset, deadline=None):
         """
         Create the PlaybackGrantInstance
 
         :param unicode ttl: The time to live of the PlaybackGrant
         :param unicode access_control_allow_origin: The full URL that is authorized to play back the livestream
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created PlaybackGrantInstance
         :rtype: twilio.rest.media.v1.player_streamer.playback_grant.PlaybackGrantInstance
         """
         data = values.of({'Ttl': ttl, 'AccessControlAllowOrigin': access_control_allow_origin, })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return PlaybackGrantInstance(self._version, payload, sid=self._solution['sid'], )
+
+    async def create_async(self, ttl=values.unset, access_control_allow_origin=values.unset,
+                           deadline=None):
+        """
+        Asynchronous coroutine that creates the PlaybackGrantInstance
+
+        :param unicode ttl: The time to live of the PlaybackGrant
+        :param unicode access_control_allow_origin: The full URL that is authorized to play back the livestream
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created PlaybackGrantInstance
+        :rtype: twilio.rest.media.v1.player_streamer.playback_grant.PlaybackGrantInstance
+        """
+        data = values.of({'Ttl': ttl, 'AccessControlAllowOrigin': access_control_allow_origin, })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return PlaybackGrantInstance(self._version, payload, sid=self._solution['sid'], )
 
@@ -143,6 +164,17 @@ class PlaybackGrantContext(InstanceContext):
 
         return PlaybackGrantInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the PlaybackGrantInstance
+
+        :returns: The fetched PlaybackGrantInstance
+        :rtype: twilio.rest.media.v1.player_streamer.playback_grant.PlaybackGrantInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return PlaybackGrantInstance(self._version, payload, sid=self._solution['sid'], )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -156,6 +188,22 @@ class PlaybackGrantContext(InstanceContext):
 
 class PlaybackGrantInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'url': 'url',
+        'account_sid': 'account_sid',
+        'date_created': 'date_created',
+        'grant': 'grant',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid):
         """
         Initialize the PlaybackGrantInstance
@@ -166,13 +214,7 @@ class PlaybackGrantInstance(InstanceResource):
         super(PlaybackGrantInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'url': payload.get('url'),
-            'account_sid': payload.get('account_sid'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'grant': payload.get('grant'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -231,17 +273,34 @@ class PlaybackGrantInstance(InstanceResource):
         """
         return self._properties['grant']
 
-    def create(self, ttl=values.unset, access_control_allow_origin=values.unset):
+    def create(self, ttl=values.unset, access_control_allow_origin=values.unset, deadline=None):
         """
         Create the PlaybackGrantInstance
 
         :param unicode ttl: The time to live of the PlaybackGrant
         :param unicode access_control_allow_origin: The full URL that is authorized to play back the livestream
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created PlaybackGrantInstance
         :rtype: twilio.rest.media.v1.player_streamer.playback_grant.PlaybackGrantInstance
         """
-        return self._proxy.create(ttl=ttl, access_control_allow_origin=access_control_allow_origin, )
+        return self._proxy.create(ttl=ttl, access_control_allow_origin=access_control_allow_origin, deadline=deadline, )
+
+    async def create_async(self, ttl=values.unset, access_control_allow_origin=values.unset,
+                           deadline=None):
+        """
+        Asynchronous coroutine that creates the PlaybackGrantInstance
+
+        :param unicode ttl: The time to live of the PlaybackGrant
+        :param unicode access_control_allow_origin: The full URL that is authorized to play back the livestream
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created PlaybackGrantInstance
+        :rtype: twilio.rest.media.v1.player_streamer.playback_grant.PlaybackGrantInstance
+        """
+        return await self._proxy.create_async(ttl=ttl, access_control_allow_origin=access_control_allow_origin, deadline=deadline, )
 
     def fetch(self):
         """
@@ -252,6 +311,15 @@ class PlaybackGrantInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the PlaybackGrantInstance
+
+        :returns: The fetched PlaybackGrantInstance
+        :rtype: twilio.rest.media.v1.player_streamer.playback_grant.PlaybackGrantInstance
+        """
+        return await self._proxy.fetch_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -6,12 +6,9 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base.version import Version
-from twilio.rest.messaging.v1.brand_registration import BrandRegistrationList
-from twilio.rest.messaging.v1.deactivation import DeactivationsList
-from twilio.rest.messaging.v1.external_campaign import ExternalCampaignList
-from twilio.rest.messaging.v1.service import ServiceList
-from twilio.rest.messaging.v1.usecase import UsecaseList
 
 
 class V1(Version):
@@ -37,6 +34,7 @@ class V1(Version):
         :rtype: twilio.rest.messaging.v1.brand_registration.BrandRegistrationList
         """
         if self._brand_registrations is None:
+            from twilio.rest.messaging.v1.brand_registration import BrandRegistrationList
             self._brand_registrations = BrandRegistrationList(self)
         return self._brand_registrations
 
@@ -46,6 +44,7 @@ class V1(Version):
         :rtype: twilio.rest.messaging.v1.deactivation.DeactivationsList
         """
         if self._deactivations is None:
+            from twilio.rest.messaging.v1.deactivation import DeactivationsList
             self._deactivations = DeactivationsList(self)
         return self._deactivations
 
@@ -55,6 +54,7 @@ class V1(Version):
         :rtype: twilio.rest.messaging.v1.external_campaign.ExternalCampaignList
         """
         if self._external_campaign is None:
+            from twilio.rest.messaging.v1.external_campaign import ExternalCampaignList
             self._external_campaign = ExternalCampaignList(self)
         return self._external_campaign
 
@@ -64,6 +64,7 @@ class V1(Version):
         :rtype: twilio.rest.messaging.v1.service.ServiceList
         """
         if self._services is None:
+            from twilio.rest.messaging.v1.service import ServiceList
             self._services = ServiceList(self)
         return self._services
 
@@ -73,6 +74,7 @@ class V1(Version):
         :rtype: twilio.rest.messaging.v1.usecase.UsecaseList
         """
         if self._usecases is None:
+            from twilio.rest.messaging.v1.usecase import UsecaseList
             self._usecases = UsecaseList(self)
         return self._usecases
 
@@ -84,3 +86,23 @@ class V1(Version):
         :rtype: str
         """
         return '<Twilio.Messaging.V1>'
+
+
+_LAZY_IMPORTS = {
+    'BrandRegistrationList': 'twilio.rest.messaging.v1.brand_registration',
+    'DeactivationsList': 'twilio.rest.messaging.v1.deactivation',
+    'ExternalCampaignList': 'twilio.rest.messaging.v1.external_campaign',
+    'ServiceList': 'twilio.rest.messaging.v1.service',
+    'UsecaseList': 'twilio.rest.messaging.v1.usecase',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -6,13 +6,14 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.messaging.v1.brand_registration.brand_vetting import BrandVettingList
 
 
 class BrandRegistrationList(ListResource):
@@ -32,9 +33,9 @@ class BrandRegistrationList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/a2p/BrandRegistrations'.format(**self._solution)
+        self._uri = values.ResourceUri('/a2p/BrandRegistrations', self._solution)
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams BrandRegistrationInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -47,17 +48,57 @@ class BrandRegistrationList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.messaging.v1.brand_registration.BrandRegistrationInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams BrandRegistrationInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.messaging.v1.brand_registration.BrandRegistrationInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists BrandRegistrationInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -69,11 +110,42 @@ class BrandRegistrationList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.messaging.v1.brand_registration.BrandRegistrationInstance]
+        """
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists BrandRegistrationInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.messaging.v1.brand_registration.BrandRegistrationInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -94,6 +166,25 @@ class BrandRegistrationList(ListResource):
 
         return BrandRegistrationPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of BrandRegistrationInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of BrandRegistrationInstance
+        :rtype: twilio.rest.messaging.v1.brand_registration.BrandRegistrationPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return BrandRegistrationPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of BrandRegistrationInstance records from the API.
@@ -111,9 +202,26 @@ class BrandRegistrationList(ListResource):
 
         return BrandRegistrationPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of BrandRegistrationInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of BrandRegistrationInstance
+        :rtype: twilio.rest.messaging.v1.brand_registration.BrandRegistrationPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return BrandRegistrationPage(self._version, response, self._solution)
+
     def create(self, customer_profile_bundle_sid, a2p_profile_bundle_sid,
                brand_type=values.unset, mock=values.unset,
-               skip_automatic_sec_vet=values.unset):
+               skip_automatic_sec_vet=values.unset, deadline=None):
         """
         Create the BrandRegistrationInstance
 
@@ -122,6 +230,8 @@ class BrandRegistrationList(ListResource):
         :param unicode brand_type: Type of brand being created. One of: "STANDARD", "STARTER".
         :param bool mock: A boolean that specifies whether brand should be a mock or not. If true, brand will be registered as a mock brand. Defaults to false if no value is provided.
         :param bool skip_automatic_sec_vet: Skip Automatic Secondary Vetting
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created BrandRegistrationInstance
         :rtype: twilio.rest.messaging.v1.brand_registration.BrandRegistrationInstance
@@ -134,7 +244,36 @@ class BrandRegistrationList(ListResource):
             'SkipAutomaticSecVet': skip_automatic_sec_vet,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return BrandRegistrationInstance(self._version, payload, )
+
+    async def create_async(self, customer_profile_bundle_sid, a2p_profile_bundle_sid,
+                           brand_type=values.unset, mock=values.unset,
+                           skip_automatic_sec_vet=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the BrandRegistrationInstance
+
+        :param unicode customer_profile_bundle_sid: Customer Profile Bundle Sid
+        :param unicode a2p_profile_bundle_sid: A2P Messaging Profile Bundle Sid
+        :param unicode brand_type: Type of brand being created. One of: "STANDARD", "STARTER".
+        :param bool mock: A boolean that specifies whether brand should be a mock or not. If true, brand will be registered as a mock brand. Defaults to false if no value is provided.
+        :param bool skip_automatic_sec_vet: Skip Automatic Secondary Vetting
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created BrandRegistrationInstance
+        :rtype: twilio.rest.messaging.v1.brand_registration.BrandRegistrationInstance
+        """
+        data = values.of({
+            'CustomerProfileBundleSid': customer_profile_bundle_sid,
+            'A2PProfileBundleSid': a2p_profile_bundle_sid,
+            'BrandType': brand_type,
+            'Mock': mock,
+            'SkipAutomaticSecVet': skip_automatic_sec_vet,
+        })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return BrandRegistrationInstance(self._version, payload, )
 
@@ -228,7 +367,7 @@ class BrandRegistrationContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/a2p/BrandRegistrations/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/a2p/BrandRegistrations/{sid}', self._solution)
 
         # Dependents
         self._brand_vettings = None
@@ -244,6 +383,17 @@ class BrandRegistrationContext(InstanceContext):
 
         return BrandRegistrationInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the BrandRegistrationInstance
+
+        :returns: The fetched BrandRegistrationInstance
+        :rtype: twilio.rest.messaging.v1.brand_registration.BrandRegistrationInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return BrandRegistrationInstance(self._version, payload, sid=self._solution['sid'], )
+
     def update(self):
         """
         Update the BrandRegistrationInstance
@@ -255,6 +405,17 @@ class BrandRegistrationContext(InstanceContext):
 
         return BrandRegistrationInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def update_async(self):
+        """
+        Asynchronous coroutine that updates the BrandRegistrationInstance
+
+        :returns: The updated BrandRegistrationInstance
+        :rtype: twilio.rest.messaging.v1.brand_registration.BrandRegistrationInstance
+        """
+        payload = await self._version.update_async(method='POST', uri=self._uri, )
+
+        return BrandRegistrationInstance(self._version, payload, sid=self._solution['sid'], )
+
     @property
     def brand_vettings(self):
         """
@@ -264,6 +425,7 @@ class BrandRegistrationContext(InstanceContext):
         :rtype: twilio.rest.messaging.v1.brand_registration.brand_vetting.BrandVettingList
         """
         if self._brand_vettings is None:
+            from twilio.rest.messaging.v1.brand_registration.brand_vetting import BrandVettingList
             self._brand_vettings = BrandVettingList(self._version, brand_sid=self._solution['sid'], )
         return self._brand_vettings
 
@@ -302,6 +464,39 @@ class BrandRegistrationInstance(InstanceResource):
         GOVERNMENT_ENTITY = "GOVERNMENT_ENTITY"
         OTHERS = "OTHERS"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+        'brand_score': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'customer_profile_bundle_sid': 'customer_profile_bundle_sid',
+        'a2p_profile_bundle_sid': 'a2p_profile_bundle_sid',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'brand_type': 'brand_type',
+        'status': 'status',
+        'tcr_id': 'tcr_id',
+        'failure_reason': 'failure_reason',
+        'url': 'url',
+        'brand_score': 'brand_score',
+        'brand_feedback': 'brand_feedback',
+        'identity_status': 'identity_status',
+        'russell_3000': 'russell_3000',
+        'government_entity': 'government_entity',
+        'tax_exempt_status': 'tax_exempt_status',
+        'skip_automatic_sec_vet': 'skip_automatic_sec_vet',
+        'mock': 'mock',
+        'links': 'links',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the BrandRegistrationInstance
@@ -312,28 +507,7 @@ class BrandRegistrationInstance(InstanceResource):
         super(BrandRegistrationInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'customer_profile_bundle_sid': payload.get('customer_profile_bundle_sid'),
-            'a2p_profile_bundle_sid': payload.get('a2p_profile_bundle_sid'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'brand_type': payload.get('brand_type'),
-            'status': payload.get('status'),
-            'tcr_id': payload.get('tcr_id'),
-            'failure_reason': payload.get('failure_reason'),
-            'url': payload.get('url'),
-            'brand_score': deserialize.integer(payload.get('brand_score')),
-            'brand_feedback': payload.get('brand_feedback'),
-            'identity_status': payload.get('identity_status'),
-            'russell_3000': payload.get('russell_3000'),
-            'government_entity': payload.get('government_entity'),
-            'tax_exempt_status': payload.get('tax_exempt_status'),
-            'skip_automatic_sec_vet': payload.get('skip_automatic_sec_vet'),
-            'mock': payload.get('mock'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -521,6 +695,15 @@ class BrandRegistrationInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the BrandRegistrationInstance
+
+        :returns: The fetched BrandRegistrationInstance
+        :rtype: twilio.rest.messaging.v1.brand_registration.BrandRegistrationInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self):
         """
         Update the BrandRegistrationInstance
@@ -530,6 +713,15 @@ class BrandRegistrationInstance(InstanceResource):
         """
         return self._proxy.update()
 
+    async def update_async(self):
+        """
+        Asynchronous coroutine that updates the BrandRegistrationInstance
+
+        :returns: The updated BrandRegistrationInstance
+        :rtype: twilio.rest.messaging.v1.brand_registration.BrandRegistrationInstance
+        """
+        return await self._proxy.update_async()
+
     @property
     def brand_vettings(self):
         """
@@ -549,3 +741,19 @@ class BrandRegistrationInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Messaging.V1.BrandRegistrationInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'BrandVettingList': 'twilio.rest.messaging.v1.brand_registration.brand_vetting',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
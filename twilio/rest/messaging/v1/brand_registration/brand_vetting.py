@@ -32,25 +32,46 @@ class BrandVettingList(ListResource):
 
         # Path Solution
         self._solution = {'brand_sid': brand_sid, }
-        self._uri = '/a2p/BrandRegistrations/{brand_sid}/Vettings'.format(**self._solution)
+        self._uri = values.ResourceUri('/a2p/BrandRegistrations/{brand_sid}/Vettings', self._solution)
 
-    def create(self, vetting_provider, vetting_id=values.unset):
+    def create(self, vetting_provider, vetting_id=values.unset, deadline=None):
         """
         Create the BrandVettingInstance
 
         :param BrandVettingInstance.VettingProvider vetting_provider: Third-party provider of the vettings to create
         :param unicode vetting_id: The unique ID of the vetting
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created BrandVettingInstance
         :rtype: twilio.rest.messaging.v1.brand_registration.brand_vetting.BrandVettingInstance
         """
         data = values.of({'VettingProvider': vetting_provider, 'VettingId': vetting_id, })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return BrandVettingInstance(self._version, payload, brand_sid=self._solution['brand_sid'], )
 
-    def stream(self, vetting_provider=values.unset, limit=None, page_size=None):
+    async def create_async(self, vetting_provider, vetting_id=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the BrandVettingInstance
+
+        :param BrandVettingInstance.VettingProvider vetting_provider: Third-party provider of the vettings to create
+        :param unicode vetting_id: The unique ID of the vetting
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created BrandVettingInstance
+        :rtype: twilio.rest.messaging.v1.brand_registration.brand_vetting.BrandVettingInstance
+        """
+        data = values.of({'VettingProvider': vetting_provider, 'VettingId': vetting_id, })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return BrandVettingInstance(self._version, payload, brand_sid=self._solution['brand_sid'], )
+
+    def stream(self, vetting_provider=values.unset, limit=None, page_size=None,
+               prefetch=None, raw=False, deadline=None):
         """
         Streams BrandVettingInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -64,17 +85,59 @@ class BrandVettingList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.messaging.v1.brand_registration.brand_vetting.BrandVettingInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(vetting_provider=vetting_provider, page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(vetting_provider=vetting_provider, page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, vetting_provider=values.unset, limit=None, page_size=None):
+    async def stream_async(self, vetting_provider=values.unset, limit=None, page_size=None,
+                           prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams BrandVettingInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param BrandVettingInstance.VettingProvider vetting_provider: Third-party provider of the vettings to create
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.messaging.v1.brand_registration.brand_vetting.BrandVettingInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(vetting_provider=vetting_provider, page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, vetting_provider=values.unset, limit=None, page_size=None,
+             prefetch=None, raw=False, deadline=None):
         """
         Lists BrandVettingInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -87,11 +150,43 @@ class BrandVettingList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.messaging.v1.brand_registration.brand_vetting.BrandVettingInstance]
         """
-        return list(self.stream(vetting_provider=vetting_provider, limit=limit, page_size=page_size, ))
+        return list(self.stream(vetting_provider=vetting_provider, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, vetting_provider=values.unset, limit=None, page_size=None,
+                         prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists BrandVettingInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param BrandVettingInstance.VettingProvider vetting_provider: Third-party provider of the vettings to create
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.messaging.v1.brand_registration.brand_vetting.BrandVettingInstance]
+        """
+        return [record async for record in await self.stream_async(vetting_provider=vetting_provider, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, vetting_provider=values.unset, page_token=values.unset,
              page_number=values.unset, page_size=values.unset):
@@ -118,6 +213,31 @@ class BrandVettingList(ListResource):
 
         return BrandVettingPage(self._version, response, self._solution)
 
+    async def page_async(self, vetting_provider=values.unset, page_token=values.unset,
+                         page_number=values.unset, page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of BrandVettingInstance records from the API.
+        Request is executed immediately
+
+        :param BrandVettingInstance.VettingProvider vetting_provider: Third-party provider of the vettings to create
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of BrandVettingInstance
+        :rtype: twilio.rest.messaging.v1.brand_registration.brand_vetting.BrandVettingPage
+        """
+        data = values.of({
+            'VettingProvider': vetting_provider,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return BrandVettingPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of BrandVettingInstance records from the API.
@@ -135,6 +255,23 @@ class BrandVettingList(ListResource):
 
         return BrandVettingPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of BrandVettingInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of BrandVettingInstance
+        :rtype: twilio.rest.messaging.v1.brand_registration.brand_vetting.BrandVettingPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return BrandVettingPage(self._version, response, self._solution)
+
     def get(self, brand_vetting_sid):
         """
         Constructs a BrandVettingContext
@@ -235,7 +372,7 @@ class BrandVettingContext(InstanceContext):
 
         # Path Solution
         self._solution = {'brand_sid': brand_sid, 'brand_vetting_sid': brand_vetting_sid, }
-        self._uri = '/a2p/BrandRegistrations/{brand_sid}/Vettings/{brand_vetting_sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/a2p/BrandRegistrations/{brand_sid}/Vettings/{brand_vetting_sid}', self._solution)
 
     def fetch(self):
         """
@@ -253,6 +390,22 @@ class BrandVettingContext(InstanceContext):
             brand_vetting_sid=self._solution['brand_vetting_sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the BrandVettingInstance
+
+        :returns: The fetched BrandVettingInstance
+        :rtype: twilio.rest.messaging.v1.brand_registration.brand_vetting.BrandVettingInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return BrandVettingInstance(
+            self._version,
+            payload,
+            brand_sid=self._solution['brand_sid'],
+            brand_vetting_sid=self._solution['brand_vetting_sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -271,6 +424,28 @@ class BrandVettingInstance(InstanceResource):
     class VettingProvider(object):
         CAMPAIGN_VERIFY = "campaign-verify"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_updated': deserialize.iso8601_datetime,
+        'date_created': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'brand_sid': 'brand_sid',
+        'brand_vetting_sid': 'brand_vetting_sid',
+        'date_updated': 'date_updated',
+        'date_created': 'date_created',
+        'vetting_id': 'vetting_id',
+        'vetting_class': 'vetting_class',
+        'vetting_status': 'vetting_status',
+        'vetting_provider': 'vetting_provider',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload, brand_sid, brand_vetting_sid=None):
         """
         Initialize the BrandVettingInstance
@@ -281,18 +456,7 @@ class BrandVettingInstance(InstanceResource):
         super(BrandVettingInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'brand_sid': payload.get('brand_sid'),
-            'brand_vetting_sid': payload.get('brand_vetting_sid'),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'vetting_id': payload.get('vetting_id'),
-            'vetting_class': payload.get('vetting_class'),
-            'vetting_status': payload.get('vetting_status'),
-            'vetting_provider': payload.get('vetting_provider'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -407,6 +571,15 @@ class BrandVettingInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the BrandVettingInstance
+
+        :returns: The fetched BrandVettingInstance
+        :rtype: twilio.rest.messaging.v1.brand_registration.brand_vetting.BrandVettingInstance
+        """
+        return await self._proxy.fetch_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -7,6 +7,7 @@ This code was generated by
 """
 
 from twilio.base import serialize
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
@@ -111,7 +112,7 @@ class DeactivationsContext(InstanceContext):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Deactivations'.format(**self._solution)
+        self._uri = values.ResourceUri('/Deactivations', self._solution)
 
     def fetch(self, date=values.unset):
         """
@@ -128,6 +129,21 @@ class DeactivationsContext(InstanceContext):
 
         return DeactivationsInstance(self._version, payload, )
 
+    async def fetch_async(self, date=values.unset):
+        """
+        Asynchronous coroutine that fetches the DeactivationsInstance
+
+        :param date date: The date to retrieve deactivated numbers for.
+
+        :returns: The fetched DeactivationsInstance
+        :rtype: twilio.rest.messaging.v1.deactivation.DeactivationsInstance
+        """
+        data = values.of({'Date': serialize.iso8601_date(date), })
+
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, params=data, )
+
+        return DeactivationsInstance(self._version, payload, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -141,6 +157,13 @@ class DeactivationsContext(InstanceContext):
 
 class DeactivationsInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'redirect_to': 'redirect_to',
+    })
+
     def __init__(self, version, payload):
         """
         Initialize the DeactivationsInstance
@@ -151,7 +174,7 @@ class DeactivationsInstance(InstanceResource):
         super(DeactivationsInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {'redirect_to': payload.get('redirect_to'), }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -189,6 +212,17 @@ class DeactivationsInstance(InstanceResource):
         """
         return self._proxy.fetch(date=date, )
 
+    async def fetch_async(self, date=values.unset):
+        """
+        Asynchronous coroutine that fetches the DeactivationsInstance
+
+        :param date date: The date to retrieve deactivated numbers for.
+
+        :returns: The fetched DeactivationsInstance
+        :rtype: twilio.rest.messaging.v1.deactivation.DeactivationsInstance
+        """
+        return await self._proxy.fetch_async(date=date, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -30,21 +30,41 @@ class ExternalCampaignList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Services/PreregisteredUsa2p'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/PreregisteredUsa2p', self._solution)
 
-    def create(self, campaign_id, messaging_service_sid):
+    def create(self, campaign_id, messaging_service_sid, deadline=None):
         """
         Create the ExternalCampaignInstance
 
         :param unicode campaign_id: ID of the preregistered campaign.
         :param unicode messaging_service_sid: The SID of the Messaging Service the resource is associated with
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created ExternalCampaignInstance
         :rtype: twilio.rest.messaging.v1.external_campaign.ExternalCampaignInstance
         """
         data = values.of({'CampaignId': campaign_id, 'MessagingServiceSid': messaging_service_sid, })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return ExternalCampaignInstance(self._version, payload, )
+
+    async def create_async(self, campaign_id, messaging_service_sid, deadline=None):
+        """
+        Asynchronous coroutine that creates the ExternalCampaignInstance
+
+        :param unicode campaign_id: ID of the preregistered campaign.
+        :param unicode messaging_service_sid: The SID of the Messaging Service the resource is associated with
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created ExternalCampaignInstance
+        :rtype: twilio.rest.messaging.v1.external_campaign.ExternalCampaignInstance
+        """
+        data = values.of({'CampaignId': campaign_id, 'MessagingServiceSid': messaging_service_sid, })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return ExternalCampaignInstance(self._version, payload, )
 
@@ -102,6 +122,22 @@ class ExternalCampaignInstance(InstanceResource):
     """ PLEASE NOTE that this class contains beta products that are subject to
     change. Use them with caution. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'campaign_id': 'campaign_id',
+        'messaging_service_sid': 'messaging_service_sid',
+        'date_created': 'date_created',
+    }, _deserializers)
+
     def __init__(self, version, payload):
         """
         Initialize the ExternalCampaignInstance
@@ -112,13 +148,7 @@ class ExternalCampaignInstance(InstanceResource):
         super(ExternalCampaignInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'campaign_id': payload.get('campaign_id'),
-            'messaging_service_sid': payload.get('messaging_service_sid'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -6,17 +6,14 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.messaging.v1.service.alpha_sender import AlphaSenderList
-from twilio.rest.messaging.v1.service.phone_number import PhoneNumberList
-from twilio.rest.messaging.v1.service.short_code import ShortCodeList
-from twilio.rest.messaging.v1.service.us_app_to_person import UsAppToPersonList
-from twilio.rest.messaging.v1.service.us_app_to_person_usecase import UsAppToPersonUsecaseList
 
 
 class ServiceList(ListResource):
@@ -36,7 +33,7 @@ class ServiceList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Services'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services', self._solution)
 
     def create(self, friendly_name, inbound_request_url=values.unset,
                inbound_method=values.unset, fallback_url=values.unset,
@@ -45,7 +42,7 @@ class ServiceList(ListResource):
                smart_encoding=values.unset, scan_message_content=values.unset,
                fallback_to_long_code=values.unset, area_code_geomatch=values.unset,
                validity_period=values.unset, synchronous_validation=values.unset,
-               usecase=values.unset, use_inbound_webhook_on_number=values.unset):
+               usecase=values.unset, use_inbound_webhook_on_number=values.unset, deadline=None):
         """
         Create the ServiceInstance
 
@@ -65,6 +62,8 @@ class ServiceList(ListResource):
         :param bool synchronous_validation: Reserved
         :param unicode usecase: A string describing the scenario in which the Messaging Service will be used
         :param bool use_inbound_webhook_on_number: If enabled, the webhook url configured on the phone number will be used and will override the `inbound_request_url`/`fallback_url` url called when an inbound message is received.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created ServiceInstance
         :rtype: twilio.rest.messaging.v1.service.ServiceInstance
@@ -88,11 +87,68 @@ class ServiceList(ListResource):
             'UseInboundWebhookOnNumber': use_inbound_webhook_on_number,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return ServiceInstance(self._version, payload, )
 
-    def stream(self, limit=None, page_size=None):
+    async def create_async(self, friendly_name, inbound_request_url=values.unset,
+                           inbound_method=values.unset, fallback_url=values.unset,
+                           fallback_method=values.unset, status_callback=values.unset,
+                           sticky_sender=values.unset, mms_converter=values.unset,
+                           smart_encoding=values.unset, scan_message_content=values.unset,
+                           fallback_to_long_code=values.unset, area_code_geomatch=values.unset,
+                           validity_period=values.unset, synchronous_validation=values.unset,
+                           usecase=values.unset, use_inbound_webhook_on_number=values.unset,
+                           deadline=None):
+        """
+        Asynchronous coroutine that creates the ServiceInstance
+
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode inbound_request_url: The URL we call using inbound_method when a message is received by any phone number or short code in the Service. This field will be overridden if the `use_inbound_webhook_on_number` field is enabled.
+        :param unicode inbound_method: The HTTP method we should use to call inbound_request_url
+        :param unicode fallback_url: The URL that we call using fallback_method if an error occurs while retrieving or executing the TwiML from the Inbound Request URL. This field will be overridden if the `use_inbound_webhook_on_number` field is enabled.
+        :param unicode fallback_method: The HTTP method we should use to call fallback_url
+        :param unicode status_callback: The URL we should call to pass status updates about message delivery
+        :param bool sticky_sender: Whether to enable Sticky Sender on the Service instance
+        :param bool mms_converter: Whether to enable the MMS Converter for messages sent through the Service instance
+        :param bool smart_encoding: Whether to enable Encoding for messages sent through the Service instance
+        :param ServiceInstance.ScanMessageContent scan_message_content: Reserved
+        :param bool fallback_to_long_code: Whether to enable Fallback to Long Code for messages sent through the Service instance
+        :param bool area_code_geomatch: Whether to enable Area Code Geomatch on the Service Instance
+        :param unicode validity_period: How long, in seconds, messages sent from the Service are valid
+        :param bool synchronous_validation: Reserved
+        :param unicode usecase: A string describing the scenario in which the Messaging Service will be used
+        :param bool use_inbound_webhook_on_number: If enabled, the webhook url configured on the phone number will be used and will override the `inbound_request_url`/`fallback_url` url called when an inbound message is received.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created ServiceInstance
+        :rtype: twilio.rest.messaging.v1.service.ServiceInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'InboundRequestUrl': inbound_request_url,
+            'InboundMethod': inbound_method,
+            'FallbackUrl': fallback_url,
+            'FallbackMethod': fallback_method,
+            'StatusCallback': status_callback,
+            'StickySender': sticky_sender,
+            'MmsConverter': mms_converter,
+            'SmartEncoding': smart_encoding,
+            'ScanMessageContent': scan_message_content,
+            'FallbackToLongCode': fallback_to_long_code,
+            'AreaCodeGeomatch': area_code_geomatch,
+            'ValidityPeriod': validity_period,
+            'SynchronousValidation': synchronous_validation,
+            'Usecase': usecase,
+            'UseInboundWebhookOnNumber': use_inbound_webhook_on_number,
+        })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return ServiceInstance(self._version, payload, )
+
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams ServiceInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -105,17 +161,57 @@ class ServiceList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.messaging.v1.service.ServiceInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams ServiceInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.messaging.v1.service.ServiceInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists ServiceInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -127,11 +223,42 @@ class ServiceList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.messaging.v1.service.ServiceInstance]
+        """
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists ServiceInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.messaging.v1.service.ServiceInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -152,6 +279,25 @@ class ServiceList(ListResource):
 
         return ServicePage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of ServiceInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of ServiceInstance
+        :rtype: twilio.rest.messaging.v1.service.ServicePage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return ServicePage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of ServiceInstance records from the API.
@@ -169,6 +315,23 @@ class ServiceList(ListResource):
 
         return ServicePage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of ServiceInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of ServiceInstance
+        :rtype: twilio.rest.messaging.v1.service.ServicePage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return ServicePage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a ServiceContext
@@ -259,7 +422,7 @@ class ServiceContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/Services/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{sid}', self._solution)
 
         # Dependents
         self._phone_numbers = None
@@ -322,6 +485,60 @@ class ServiceContext(InstanceContext):
 
         return ServiceInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def update_async(self, friendly_name=values.unset, inbound_request_url=values.unset,
+                           inbound_method=values.unset, fallback_url=values.unset,
+                           fallback_method=values.unset, status_callback=values.unset,
+                           sticky_sender=values.unset, mms_converter=values.unset,
+                           smart_encoding=values.unset, scan_message_content=values.unset,
+                           fallback_to_long_code=values.unset, area_code_geomatch=values.unset,
+                           validity_period=values.unset, synchronous_validation=values.unset,
+                           usecase=values.unset, use_inbound_webhook_on_number=values.unset):
+        """
+        Asynchronous coroutine that updates the ServiceInstance
+
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode inbound_request_url: The URL we call using inbound_method when a message is received by any phone number or short code in the Service. This field will be overridden if the `use_inbound_webhook_on_number` field is enabled.
+        :param unicode inbound_method: The HTTP method we should use to call inbound_request_url
+        :param unicode fallback_url: The URL that we call using fallback_method if an error occurs while retrieving or executing the TwiML from the Inbound Request URL. This field will be overridden if the `use_inbound_webhook_on_number` field is enabled.
+        :param unicode fallback_method: The HTTP method we should use to call fallback_url
+        :param unicode status_callback: The URL we should call to pass status updates about message delivery
+        :param bool sticky_sender: Whether to enable Sticky Sender on the Service instance
+        :param bool mms_converter: Whether to enable the MMS Converter for messages sent through the Service instance
+        :param bool smart_encoding: Whether to enable Encoding for messages sent through the Service instance
+        :param ServiceInstance.ScanMessageContent scan_message_content: Reserved
+        :param bool fallback_to_long_code: Whether to enable Fallback to Long Code for messages sent through the Service instance
+        :param bool area_code_geomatch: Whether to enable Area Code Geomatch on the Service Instance
+        :param unicode validity_period: How long, in seconds, messages sent from the Service are valid
+        :param bool synchronous_validation: Reserved
+        :param unicode usecase: A string describing the scenario in which the Messaging Service will be used
+        :param bool use_inbound_webhook_on_number: If enabled, the webhook url configured on the phone number will be used and will override the `inbound_request_url`/`fallback_url` url called when an inbound message is received.
+
+        :returns: The updated ServiceInstance
+        :rtype: twilio.rest.messaging.v1.service.ServiceInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'InboundRequestUrl': inbound_request_url,
+            'InboundMethod': inbound_method,
+            'FallbackUrl': fallback_url,
+            'FallbackMethod': fallback_method,
+            'StatusCallback': status_callback,
+            'StickySender': sticky_sender,
+            'MmsConverter': mms_converter,
+            'SmartEncoding': smart_encoding,
+            'ScanMessageContent': scan_message_content,
+            'FallbackToLongCode': fallback_to_long_code,
+            'AreaCodeGeomatch': area_code_geomatch,
+            'ValidityPeriod': validity_period,
+            'SynchronousValidation': synchronous_validation,
+            'Usecase': usecase,
+            'UseInboundWebhookOnNumber': use_inbound_webhook_on_number,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return ServiceInstance(self._version, payload, sid=self._solution['sid'], )
+
     def fetch(self):
         """
         Fetch the ServiceInstance
@@ -333,6 +550,17 @@ class ServiceContext(InstanceContext):
 
         return ServiceInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ServiceInstance
+
+        :returns: The fetched ServiceInstance
+        :rtype: twilio.rest.messaging.v1.service.ServiceInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return ServiceInstance(self._version, payload, sid=self._solution['sid'], )
+
     def delete(self):
         """
         Deletes the ServiceInstance
@@ -342,6 +570,15 @@ class ServiceContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the ServiceInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     @property
     def phone_numbers(self):
         """
@@ -351,6 +588,7 @@ class ServiceContext(InstanceContext):
         :rtype: twilio.rest.messaging.v1.service.phone_number.PhoneNumberList
         """
         if self._phone_numbers is None:
+            from twilio.rest.messaging.v1.service.phone_number import PhoneNumberList
             self._phone_numbers = PhoneNumberList(self._version, service_sid=self._solution['sid'], )
         return self._phone_numbers
 
@@ -363,6 +601,7 @@ class ServiceContext(InstanceContext):
         :rtype: twilio.rest.messaging.v1.service.short_code.ShortCodeList
         """
         if self._short_codes is None:
+            from twilio.rest.messaging.v1.service.short_code import ShortCodeList
             self._short_codes = ShortCodeList(self._version, service_sid=self._solution['sid'], )
         return self._short_codes
 
@@ -375,6 +614,7 @@ class ServiceContext(InstanceContext):
         :rtype: twilio.rest.messaging.v1.service.alpha_sender.AlphaSenderList
         """
         if self._alpha_senders is None:
+            from twilio.rest.messaging.v1.service.alpha_sender import AlphaSenderList
             self._alpha_senders = AlphaSenderList(self._version, service_sid=self._solution['sid'], )
         return self._alpha_senders
 
@@ -387,6 +627,7 @@ class ServiceContext(InstanceContext):
         :rtype: twilio.rest.messaging.v1.service.us_app_to_person.UsAppToPersonList
         """
         if self._us_app_to_person is None:
+            from twilio.rest.messaging.v1.service.us_app_to_person import UsAppToPersonList
             self._us_app_to_person = UsAppToPersonList(
                 self._version,
                 messaging_service_sid=self._solution['sid'],
@@ -402,6 +643,7 @@ class ServiceContext(InstanceContext):
         :rtype: twilio.rest.messaging.v1.service.us_app_to_person_usecase.UsAppToPersonUsecaseList
         """
         if self._us_app_to_person_usecases is None:
+            from twilio.rest.messaging.v1.service.us_app_to_person_usecase import UsAppToPersonUsecaseList
             self._us_app_to_person_usecases = UsAppToPersonUsecaseList(
                 self._version,
                 messaging_service_sid=self._solution['sid'],
@@ -428,6 +670,42 @@ class ServiceInstance(InstanceResource):
         ENABLE = "enable"
         DISABLE = "disable"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+        'validity_period': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'friendly_name': 'friendly_name',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'inbound_request_url': 'inbound_request_url',
+        'inbound_method': 'inbound_method',
+        'fallback_url': 'fallback_url',
+        'fallback_method': 'fallback_method',
+        'status_callback': 'status_callback',
+        'sticky_sender': 'sticky_sender',
+        'mms_converter': 'mms_converter',
+        'smart_encoding': 'smart_encoding',
+        'scan_message_content': 'scan_message_content',
+        'fallback_to_long_code': 'fallback_to_long_code',
+        'area_code_geomatch': 'area_code_geomatch',
+        'synchronous_validation': 'synchronous_validation',
+        'validity_period': 'validity_period',
+        'url': 'url',
+        'links': 'links',
+        'usecase': 'usecase',
+        'us_app_to_person_registered': 'us_app_to_person_registered',
+        'use_inbound_webhook_on_number': 'use_inbound_webhook_on_number',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the ServiceInstance
@@ -438,31 +716,7 @@ class ServiceInstance(InstanceResource):
         super(ServiceInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'friendly_name': payload.get('friendly_name'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'inbound_request_url': payload.get('inbound_request_url'),
-            'inbound_method': payload.get('inbound_method'),
-            'fallback_url': payload.get('fallback_url'),
-            'fallback_method': payload.get('fallback_method'),
-            'status_callback': payload.get('status_callback'),
-            'sticky_sender': payload.get('sticky_sender'),
-            'mms_converter': payload.get('mms_converter'),
-            'smart_encoding': payload.get('smart_encoding'),
-            'scan_message_content': payload.get('scan_message_content'),
-            'fallback_to_long_code': payload.get('fallback_to_long_code'),
-            'area_code_geomatch': payload.get('area_code_geomatch'),
-            'synchronous_validation': payload.get('synchronous_validation'),
-            'validity_period': deserialize.integer(payload.get('validity_period')),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-            'usecase': payload.get('usecase'),
-            'us_app_to_person_registered': payload.get('us_app_to_person_registered'),
-            'use_inbound_webhook_on_number': payload.get('use_inbound_webhook_on_number'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -715,6 +969,56 @@ class ServiceInstance(InstanceResource):
             use_inbound_webhook_on_number=use_inbound_webhook_on_number,
         )
 
+    async def update_async(self, friendly_name=values.unset, inbound_request_url=values.unset,
+                           inbound_method=values.unset, fallback_url=values.unset,
+                           fallback_method=values.unset, status_callback=values.unset,
+                           sticky_sender=values.unset, mms_converter=values.unset,
+                           smart_encoding=values.unset, scan_message_content=values.unset,
+                           fallback_to_long_code=values.unset, area_code_geomatch=values.unset,
+                           validity_period=values.unset, synchronous_validation=values.unset,
+                           usecase=values.unset, use_inbound_webhook_on_number=values.unset):
+        """
+        Asynchronous coroutine that updates the ServiceInstance
+
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode inbound_request_url: The URL we call using inbound_method when a message is received by any phone number or short code in the Service. This field will be overridden if the `use_inbound_webhook_on_number` field is enabled.
+        :param unicode inbound_method: The HTTP method we should use to call inbound_request_url
+        :param unicode fallback_url: The URL that we call using fallback_method if an error occurs while retrieving or executing the TwiML from the Inbound Request URL. This field will be overridden if the `use_inbound_webhook_on_number` field is enabled.
+        :param unicode fallback_method: The HTTP method we should use to call fallback_url
+        :param unicode status_callback: The URL we should call to pass status updates about message delivery
+        :param bool sticky_sender: Whether to enable Sticky Sender on the Service instance
+        :param bool mms_converter: Whether to enable the MMS Converter for messages sent through the Service instance
+        :param bool smart_encoding: Whether to enable Encoding for messages sent through the Service instance
+        :param ServiceInstance.ScanMessageContent scan_message_content: Reserved
+        :param bool fallback_to_long_code: Whether to enable Fallback to Long Code for messages sent through the Service instance
+        :param bool area_code_geomatch: Whether to enable Area Code Geomatch on the Service Instance
+        :param unicode validity_period: How long, in seconds, messages sent from the Service are valid
+        :param bool synchronous_validation: Reserved
+        :param unicode usecase: A string describing the scenario in which the Messaging Service will be used
+        :param bool use_inbound_webhook_on_number: If enabled, the webhook url configured on the phone number will be used and will override the `inbound_request_url`/`fallback_url` url called when an inbound message is received.
+
+        :returns: The updated ServiceInstance
+        :rtype: twilio.rest.messaging.v1.service.ServiceInstance
+        """
+        return await self._proxy.update_async(
+            friendly_name=friendly_name,
+            inbound_request_url=inbound_request_url,
+            inbound_method=inbound_method,
+            fallback_url=fallback_url,
+            fallback_method=fallback_method,
+            status_callback=status_callback,
+            sticky_sender=sticky_sender,
+            mms_converter=mms_converter,
+            smart_encoding=smart_encoding,
+            scan_message_content=scan_message_content,
+            fallback_to_long_code=fallback_to_long_code,
+            area_code_geomatch=area_code_geomatch,
+            validity_period=validity_period,
+            synchronous_validation=synchronous_validation,
+            usecase=usecase,
+            use_inbound_webhook_on_number=use_inbound_webhook_on_number,
+        )
+
     def fetch(self):
         """
         Fetch the ServiceInstance
@@ -724,6 +1028,15 @@ class ServiceInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ServiceInstance
+
+        :returns: The fetched ServiceInstance
+        :rtype: twilio.rest.messaging.v1.service.ServiceInstance
+        """
+        return await self._proxy.fetch_async()
+
     def delete(self):
         """
         Deletes the ServiceInstance
@@ -733,6 +1046,15 @@ class ServiceInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the ServiceInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     @property
     def phone_numbers(self):
         """
@@ -792,3 +1114,23 @@ class ServiceInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Messaging.V1.ServiceInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'AlphaSenderList': 'twilio.rest.messaging.v1.service.alpha_sender',
+    'PhoneNumberList': 'twilio.rest.messaging.v1.service.phone_number',
+    'ShortCodeList': 'twilio.rest.messaging.v1.service.short_code',
+    'UsAppToPersonList': 'twilio.rest.messaging.v1.service.us_app_to_person',
+    'UsAppToPersonUsecaseList': 'twilio.rest.messaging.v1.service.us_app_to_person_usecase',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
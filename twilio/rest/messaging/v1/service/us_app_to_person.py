@@ -33,10 +33,10 @@ class UsAppToPersonList(ListResource):
 
         # Path Solution
         self._solution = {'messaging_service_sid': messaging_service_sid, }
-        self._uri = '/Services/{messaging_service_sid}/Compliance/Usa2p'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{messaging_service_sid}/Compliance/Usa2p', self._solution)
 
     def create(self, brand_registration_sid, description, message_samples,
-               us_app_to_person_usecase, has_embedded_links, has_embedded_phone):
+               us_app_to_person_usecase, has_embedded_links, has_embedded_phone, deadline=None):
         """
         Create the UsAppToPersonInstance
 
@@ -46,6 +46,8 @@ class UsAppToPersonList(ListResource):
         :param unicode us_app_to_person_usecase: A2P Campaign Use Case.
         :param bool has_embedded_links: Indicates that this SMS campaign will send messages that contain links
         :param bool has_embedded_phone: Indicates that this SMS campaign will send messages that contain phone numbers
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created UsAppToPersonInstance
         :rtype: twilio.rest.messaging.v1.service.us_app_to_person.UsAppToPersonInstance
@@ -59,7 +61,7 @@ class UsAppToPersonList(ListResource):
             'HasEmbeddedPhone': has_embedded_phone,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return UsAppToPersonInstance(
             self._version,
@@ -67,7 +69,42 @@ class UsAppToPersonList(ListResource):
             messaging_service_sid=self._solution['messaging_service_sid'],
         )
 
-    def stream(self, limit=None, page_size=None):
+    async def create_async(self, brand_registration_sid, description, message_samples,
+                           us_app_to_person_usecase, has_embedded_links, has_embedded_phone,
+                           deadline=None):
+        """
+        Asynchronous coroutine that creates the UsAppToPersonInstance
+
+        :param unicode brand_registration_sid: A2P Brand Registration SID
+        :param unicode description: A short description of what this SMS campaign does
+        :param list[unicode] message_samples: Message samples
+        :param unicode us_app_to_person_usecase: A2P Campaign Use Case.
+        :param bool has_embedded_links: Indicates that this SMS campaign will send messages that contain links
+        :param bool has_embedded_phone: Indicates that this SMS campaign will send messages that contain phone numbers
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created UsAppToPersonInstance
+        :rtype: twilio.rest.messaging.v1.service.us_app_to_person.UsAppToPersonInstance
+        """
+        data = values.of({
+            'BrandRegistrationSid': brand_registration_sid,
+            'Description': description,
+            'MessageSamples': serialize.map(message_samples, lambda e: e),
+            'UsAppToPersonUsecase': us_app_to_person_usecase,
+            'HasEmbeddedLinks': has_embedded_links,
+            'HasEmbeddedPhone': has_embedded_phone,
+        })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return UsAppToPersonInstance(
+            self._version,
+            payload,
+            messaging_service_sid=self._solution['messaging_service_sid'],
+        )
+
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams UsAppToPersonInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -80,17 +117,57 @@ class UsAppToPersonList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.messaging.v1.service.us_app_to_person.UsAppToPersonInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams UsAppToPersonInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.messaging.v1.service.us_app_to_person.UsAppToPersonInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists UsAppToPersonInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -102,11 +179,42 @@ class UsAppToPersonList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.messaging.v1.service.us_app_to_person.UsAppToPersonInstance]
+        """
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists UsAppToPersonInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.messaging.v1.service.us_app_to_person.UsAppToPersonInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -127,6 +235,25 @@ class UsAppToPersonList(ListResource):
 
         return UsAppToPersonPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of UsAppToPersonInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of UsAppToPersonInstance
+        :rtype: twilio.rest.messaging.v1.service.us_app_to_person.UsAppToPersonPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return UsAppToPersonPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of UsAppToPersonInstance records from the API.
@@ -144,6 +271,23 @@ class UsAppToPersonList(ListResource):
 
         return UsAppToPersonPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of UsAppToPersonInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of UsAppToPersonInstance
+        :rtype: twilio.rest.messaging.v1.service.us_app_to_person.UsAppToPersonPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return UsAppToPersonPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a UsAppToPersonContext
@@ -248,7 +392,7 @@ class UsAppToPersonContext(InstanceContext):
 
         # Path Solution
         self._solution = {'messaging_service_sid': messaging_service_sid, 'sid': sid, }
-        self._uri = '/Services/{messaging_service_sid}/Compliance/Usa2p/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{messaging_service_sid}/Compliance/Usa2p/{sid}', self._solution)
 
     def delete(self):
         """
@@ -259,6 +403,15 @@ class UsAppToPersonContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the UsAppToPersonInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def fetch(self):
         """
         Fetch the UsAppToPersonInstance
@@ -275,6 +428,22 @@ class UsAppToPersonContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the UsAppToPersonInstance
+
+        :returns: The fetched UsAppToPersonInstance
+        :rtype: twilio.rest.messaging.v1.service.us_app_to_person.UsAppToPersonInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return UsAppToPersonInstance(
+            self._version,
+            payload,
+            messaging_service_sid=self._solution['messaging_service_sid'],
+            sid=self._solution['sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -290,6 +459,35 @@ class UsAppToPersonInstance(InstanceResource):
     """ PLEASE NOTE that this class contains beta products that are subject to
     change. Use them with caution. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'brand_registration_sid': 'brand_registration_sid',
+        'messaging_service_sid': 'messaging_service_sid',
+        'description': 'description',
+        'message_samples': 'message_samples',
+        'us_app_to_person_usecase': 'us_app_to_person_usecase',
+        'has_embedded_links': 'has_embedded_links',
+        'has_embedded_phone': 'has_embedded_phone',
+        'campaign_status': 'campaign_status',
+        'campaign_id': 'campaign_id',
+        'is_externally_registered': 'is_externally_registered',
+        'rate_limits': 'rate_limits',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'url': 'url',
+        'mock': 'mock',
+    }, _deserializers)
+
     def __init__(self, version, payload, messaging_service_sid, sid=None):
         """
         Initialize the UsAppToPersonInstance
@@ -300,25 +498,7 @@ class UsAppToPersonInstance(InstanceResource):
         super(UsAppToPersonInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'brand_registration_sid': payload.get('brand_registration_sid'),
-            'messaging_service_sid': payload.get('messaging_service_sid'),
-            'description': payload.get('description'),
-            'message_samples': payload.get('message_samples'),
-            'us_app_to_person_usecase': payload.get('us_app_to_person_usecase'),
-            'has_embedded_links': payload.get('has_embedded_links'),
-            'has_embedded_phone': payload.get('has_embedded_phone'),
-            'campaign_status': payload.get('campaign_status'),
-            'campaign_id': payload.get('campaign_id'),
-            'is_externally_registered': payload.get('is_externally_registered'),
-            'rate_limits': payload.get('rate_limits'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'url': payload.get('url'),
-            'mock': payload.get('mock'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -489,6 +669,15 @@ class UsAppToPersonInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the UsAppToPersonInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def fetch(self):
         """
         Fetch the UsAppToPersonInstance
@@ -498,6 +687,15 @@ class UsAppToPersonInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the UsAppToPersonInstance
+
+        :returns: The fetched UsAppToPersonInstance
+        :rtype: twilio.rest.messaging.v1.service.us_app_to_person.UsAppToPersonInstance
+        """
+        return await self._proxy.fetch_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
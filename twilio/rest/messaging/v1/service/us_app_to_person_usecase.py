@@ -6,6 +6,7 @@ This code was generated by
       /       /
 """
 
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
@@ -30,7 +31,7 @@ class UsAppToPersonUsecaseList(ListResource):
 
         # Path Solution
         self._solution = {'messaging_service_sid': messaging_service_sid, }
-        self._uri = '/Services/{messaging_service_sid}/Compliance/Usa2p/Usecases'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{messaging_service_sid}/Compliance/Usa2p/Usecases', self._solution)
 
     def fetch(self, brand_registration_sid=values.unset):
         """
@@ -51,6 +52,25 @@ class UsAppToPersonUsecaseList(ListResource):
             messaging_service_sid=self._solution['messaging_service_sid'],
         )
 
+    async def fetch_async(self, brand_registration_sid=values.unset):
+        """
+        Asynchronous coroutine that fetches the UsAppToPersonUsecaseInstance
+
+        :param unicode brand_registration_sid: A2P Brand Registration SID
+
+        :returns: The fetched UsAppToPersonUsecaseInstance
+        :rtype: twilio.rest.messaging.v1.service.us_app_to_person_usecase.UsAppToPersonUsecaseInstance
+        """
+        data = values.of({'BrandRegistrationSid': brand_registration_sid, })
+
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, params=data, )
+
+        return UsAppToPersonUsecaseInstance(
+            self._version,
+            payload,
+            messaging_service_sid=self._solution['messaging_service_sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -110,6 +130,13 @@ class UsAppToPersonUsecaseInstance(InstanceResource):
     """ PLEASE NOTE that this class contains beta products that are subject to
     change. Use them with caution. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'us_app_to_person_usecases': 'us_app_to_person_usecases',
+    })
+
     def __init__(self, version, payload, messaging_service_sid):
         """
         Initialize the UsAppToPersonUsecaseInstance
@@ -120,7 +147,7 @@ class UsAppToPersonUsecaseInstance(InstanceResource):
         super(UsAppToPersonUsecaseInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {'us_app_to_person_usecases': payload.get('us_app_to_person_usecases'), }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -6,6 +6,7 @@ This code was generated by
       /       /
 """
 
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
@@ -29,7 +30,7 @@ class UsecaseList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Services/Usecases'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/Usecases', self._solution)
 
     def fetch(self):
         """
@@ -42,6 +43,17 @@ class UsecaseList(ListResource):
 
         return UsecaseInstance(self._version, payload, )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the UsecaseInstance
+
+        :returns: The fetched UsecaseInstance
+        :rtype: twilio.rest.messaging.v1.usecase.UsecaseInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return UsecaseInstance(self._version, payload, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -96,6 +108,13 @@ class UsecaseInstance(InstanceResource):
     """ PLEASE NOTE that this class contains beta products that are subject to
     change. Use them with caution. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'usecases': 'usecases',
+    })
+
     def __init__(self, version, payload):
         """
         Initialize the UsecaseInstance
@@ -106,7 +125,7 @@ class UsecaseInstance(InstanceResource):
         super(UsecaseInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {'usecases': payload.get('usecases'), }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -6,9 +6,9 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base.version import Version
-from twilio.rest.monitor.v1.alert import AlertList
-from twilio.rest.monitor.v1.event import EventList
 
 
 class V1(Version):
@@ -31,6 +31,7 @@ class V1(Version):
         :rtype: twilio.rest.monitor.v1.alert.AlertList
         """
         if self._alerts is None:
+            from twilio.rest.monitor.v1.alert import AlertList
             self._alerts = AlertList(self)
         return self._alerts
 
@@ -40,6 +41,7 @@ class V1(Version):
         :rtype: twilio.rest.monitor.v1.event.EventList
         """
         if self._events is None:
+            from twilio.rest.monitor.v1.event import EventList
             self._events = EventList(self)
         return self._events
 
@@ -51,3 +53,20 @@ class V1(Version):
         :rtype: str
         """
         return '<Twilio.Monitor.V1>'
+
+
+_LAZY_IMPORTS = {
+    'AlertList': 'twilio.rest.monitor.v1.alert',
+    'EventList': 'twilio.rest.monitor.v1.event',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
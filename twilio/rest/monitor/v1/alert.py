@@ -30,10 +30,11 @@ class AlertList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Alerts'.format(**self._solution)
+        self._uri = values.ResourceUri('/Alerts', self._solution)
 
     def stream(self, log_level=values.unset, start_date=values.unset,
-               end_date=values.unset, limit=None, page_size=None):
+               end_date=values.unset, limit=None, page_size=None,
+               prefetch=None, raw=False, deadline=None):
         """
         Streams AlertInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -49,23 +50,73 @@ class AlertList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.monitor.v1.alert.AlertInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
-            log_level=log_level,
-            start_date=start_date,
-            end_date=end_date,
-            page_size=limits['page_size'],
-        )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                log_level=log_level,
+                start_date=start_date,
+                end_date=end_date,
+                page_size=limits['page_size'],
+            )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, log_level=values.unset, start_date=values.unset,
+                           end_date=values.unset, limit=None, page_size=None,
+                           prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams AlertInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param unicode log_level: Only show alerts for this log-level
+        :param datetime start_date: Only include alerts that occurred on or after this date and time
+        :param datetime end_date: Only include alerts that occurred on or before this date and time
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.monitor.v1.alert.AlertInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                log_level=log_level,
+                start_date=start_date,
+                end_date=end_date,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, log_level=values.unset, start_date=values.unset,
-             end_date=values.unset, limit=None, page_size=None):
+             end_date=values.unset, limit=None, page_size=None, prefetch=None,
+             raw=False, deadline=None):
         """
         Lists AlertInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -80,6 +131,12 @@ class AlertList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.monitor.v1.alert.AlertInstance]
@@ -90,8 +147,49 @@ class AlertList(ListResource):
             end_date=end_date,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, log_level=values.unset, start_date=values.unset,
+                         end_date=values.unset, limit=None, page_size=None,
+                         prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists AlertInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param unicode log_level: Only show alerts for this log-level
+        :param datetime start_date: Only include alerts that occurred on or after this date and time
+        :param datetime end_date: Only include alerts that occurred on or before this date and time
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.monitor.v1.alert.AlertInstance]
+        """
+        return [record async for record in await self.stream_async(
+            log_level=log_level,
+            start_date=start_date,
+            end_date=end_date,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, log_level=values.unset, start_date=values.unset,
              end_date=values.unset, page_token=values.unset,
              page_number=values.unset, page_size=values.unset):
@@ -122,6 +220,36 @@ class AlertList(ListResource):
 
         return AlertPage(self._version, response, self._solution)
 
+    async def page_async(self, log_level=values.unset, start_date=values.unset,
+                         end_date=values.unset, page_token=values.unset,
+                         page_number=values.unset, page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of AlertInstance records from the API.
+        Request is executed immediately
+
+        :param unicode log_level: Only show alerts for this log-level
+        :param datetime start_date: Only include alerts that occurred on or after this date and time
+        :param datetime end_date: Only include alerts that occurred on or before this date and time
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of AlertInstance
+        :rtype: twilio.rest.monitor.v1.alert.AlertPage
+        """
+        data = values.of({
+            'LogLevel': log_level,
+            'StartDate': serialize.iso8601_datetime(start_date),
+            'EndDate': serialize.iso8601_datetime(end_date),
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return AlertPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of AlertInstance records from the API.
@@ -139,6 +267,23 @@ class AlertList(ListResource):
 
         return AlertPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of AlertInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of AlertInstance
+        :rtype: twilio.rest.monitor.v1.alert.AlertPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return AlertPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a AlertContext
@@ -225,7 +370,7 @@ class AlertContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/Alerts/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Alerts/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -238,6 +383,17 @@ class AlertContext(InstanceContext):
 
         return AlertInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the AlertInstance
+
+        :returns: The fetched AlertInstance
+        :rtype: twilio.rest.monitor.v1.alert.AlertInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return AlertInstance(self._version, payload, sid=self._solution['sid'], )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -251,6 +407,38 @@ class AlertContext(InstanceContext):
 
 class AlertInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_generated': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'alert_text': 'alert_text',
+        'api_version': 'api_version',
+        'date_created': 'date_created',
+        'date_generated': 'date_generated',
+        'date_updated': 'date_updated',
+        'error_code': 'error_code',
+        'log_level': 'log_level',
+        'more_info': 'more_info',
+        'request_method': 'request_method',
+        'request_url': 'request_url',
+        'request_variables': 'request_variables',
+        'resource_sid': 'resource_sid',
+        'response_body': 'response_body',
+        'response_headers': 'response_headers',
+        'sid': 'sid',
+        'url': 'url',
+        'request_headers': 'request_headers',
+        'service_sid': 'service_sid',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the AlertInstance
@@ -261,27 +449,7 @@ class AlertInstance(InstanceResource):
         super(AlertInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'alert_text': payload.get('alert_text'),
-            'api_version': payload.get('api_version'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_generated': deserialize.iso8601_datetime(payload.get('date_generated')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'error_code': payload.get('error_code'),
-            'log_level': payload.get('log_level'),
-            'more_info': payload.get('more_info'),
-            'request_method': payload.get('request_method'),
-            'request_url': payload.get('request_url'),
-            'request_variables': payload.get('request_variables'),
-            'resource_sid': payload.get('resource_sid'),
-            'response_body': payload.get('response_body'),
-            'response_headers': payload.get('response_headers'),
-            'sid': payload.get('sid'),
-            'url': payload.get('url'),
-            'request_headers': payload.get('request_headers'),
-            'service_sid': payload.get('service_sid'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -461,6 +629,15 @@ class AlertInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the AlertInstance
+
+        :returns: The fetched AlertInstance
+        :rtype: twilio.rest.monitor.v1.alert.AlertInstance
+        """
+        return await self._proxy.fetch_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -30,12 +30,12 @@ class EventList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Events'.format(**self._solution)
+        self._uri = values.ResourceUri('/Events', self._solution)
 
     def stream(self, actor_sid=values.unset, event_type=values.unset,
                resource_sid=values.unset, source_ip_address=values.unset,
                start_date=values.unset, end_date=values.unset, limit=None,
-               page_size=None):
+               page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams EventInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -54,28 +54,84 @@ class EventList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.monitor.v1.event.EventInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
-            actor_sid=actor_sid,
-            event_type=event_type,
-            resource_sid=resource_sid,
-            source_ip_address=source_ip_address,
-            start_date=start_date,
-            end_date=end_date,
-            page_size=limits['page_size'],
-        )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                actor_sid=actor_sid,
+                event_type=event_type,
+                resource_sid=resource_sid,
+                source_ip_address=source_ip_address,
+                start_date=start_date,
+                end_date=end_date,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, actor_sid=values.unset, event_type=values.unset,
+                           resource_sid=values.unset, source_ip_address=values.unset,
+                           start_date=values.unset, end_date=values.unset, limit=None,
+                           page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams EventInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
 
-        return self._version.stream(page, limits['limit'])
+        :param unicode actor_sid: Only include events initiated by this Actor
+        :param unicode event_type: Only include events of this Event Type
+        :param unicode resource_sid: Only include events that refer to this resource
+        :param unicode source_ip_address: Only include events that originated from this IP address
+        :param datetime start_date: Only include events that occurred on or after this date
+        :param datetime end_date: Only include events that occurred on or before this date
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.monitor.v1.event.EventInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                actor_sid=actor_sid,
+                event_type=event_type,
+                resource_sid=resource_sid,
+                source_ip_address=source_ip_address,
+                start_date=start_date,
+                end_date=end_date,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, actor_sid=values.unset, event_type=values.unset,
              resource_sid=values.unset, source_ip_address=values.unset,
              start_date=values.unset, end_date=values.unset, limit=None,
-             page_size=None):
+             page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists EventInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -93,6 +149,12 @@ class EventList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.monitor.v1.event.EventInstance]
@@ -106,8 +168,56 @@ class EventList(ListResource):
             end_date=end_date,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, actor_sid=values.unset, event_type=values.unset,
+                         resource_sid=values.unset, source_ip_address=values.unset,
+                         start_date=values.unset, end_date=values.unset, limit=None,
+                         page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists EventInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param unicode actor_sid: Only include events initiated by this Actor
+        :param unicode event_type: Only include events of this Event Type
+        :param unicode resource_sid: Only include events that refer to this resource
+        :param unicode source_ip_address: Only include events that originated from this IP address
+        :param datetime start_date: Only include events that occurred on or after this date
+        :param datetime end_date: Only include events that occurred on or before this date
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.monitor.v1.event.EventInstance]
+        """
+        return [record async for record in await self.stream_async(
+            actor_sid=actor_sid,
+            event_type=event_type,
+            resource_sid=resource_sid,
+            source_ip_address=source_ip_address,
+            start_date=start_date,
+            end_date=end_date,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, actor_sid=values.unset, event_type=values.unset,
              resource_sid=values.unset, source_ip_address=values.unset,
              start_date=values.unset, end_date=values.unset,
@@ -146,6 +256,44 @@ class EventList(ListResource):
 
         return EventPage(self._version, response, self._solution)
 
+    async def page_async(self, actor_sid=values.unset, event_type=values.unset,
+                         resource_sid=values.unset, source_ip_address=values.unset,
+                         start_date=values.unset, end_date=values.unset,
+                         page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of EventInstance records from the API.
+        Request is executed immediately
+
+        :param unicode actor_sid: Only include events initiated by this Actor
+        :param unicode event_type: Only include events of this Event Type
+        :param unicode resource_sid: Only include events that refer to this resource
+        :param unicode source_ip_address: Only include events that originated from this IP address
+        :param datetime start_date: Only include events that occurred on or after this date
+        :param datetime end_date: Only include events that occurred on or before this date
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of EventInstance
+        :rtype: twilio.rest.monitor.v1.event.EventPage
+        """
+        data = values.of({
+            'ActorSid': actor_sid,
+            'EventType': event_type,
+            'ResourceSid': resource_sid,
+            'SourceIpAddress': source_ip_address,
+            'StartDate': serialize.iso8601_datetime(start_date),
+            'EndDate': serialize.iso8601_datetime(end_date),
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return EventPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of EventInstance records from the API.
@@ -163,6 +311,23 @@ class EventList(ListResource):
 
         return EventPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of EventInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of EventInstance
+        :rtype: twilio.rest.monitor.v1.event.EventPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return EventPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a EventContext
@@ -249,7 +414,7 @@ class EventContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/Events/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Events/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -262,6 +427,17 @@ class EventContext(InstanceContext):
 
         return EventInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the EventInstance
+
+        :returns: The fetched EventInstance
+        :rtype: twilio.rest.monitor.v1.event.EventInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return EventInstance(self._version, payload, sid=self._solution['sid'], )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -275,6 +451,31 @@ class EventContext(InstanceContext):
 
 class EventInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'event_date': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'actor_sid': 'actor_sid',
+        'actor_type': 'actor_type',
+        'description': 'description',
+        'event_data': 'event_data',
+        'event_date': 'event_date',
+        'event_type': 'event_type',
+        'resource_sid': 'resource_sid',
+        'resource_type': 'resource_type',
+        'sid': 'sid',
+        'source': 'source',
+        'source_ip_address': 'source_ip_address',
+        'url': 'url',
+        'links': 'links',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the EventInstance
@@ -285,22 +486,7 @@ class EventInstance(InstanceResource):
         super(EventInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'actor_sid': payload.get('actor_sid'),
-            'actor_type': payload.get('actor_type'),
-            'description': payload.get('description'),
-            'event_data': payload.get('event_data'),
-            'event_date': deserialize.iso8601_datetime(payload.get('event_date')),
-            'event_type': payload.get('event_type'),
-            'resource_sid': payload.get('resource_sid'),
-            'resource_type': payload.get('resource_type'),
-            'sid': payload.get('sid'),
-            'source': payload.get('source'),
-            'source_ip_address': payload.get('source_ip_address'),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -440,6 +626,15 @@ class EventInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the EventInstance
+
+        :returns: The fetched EventInstance
+        :rtype: twilio.rest.monitor.v1.event.EventInstance
+        """
+        return await self._proxy.fetch_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -6,14 +6,14 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.notify.v1.service.binding import BindingList
-from twilio.rest.notify.v1.service.notification import NotificationList
 
 
 class ServiceList(ListResource):
@@ -33,7 +33,7 @@ class ServiceList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Services'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services', self._solution)
 
     def create(self, friendly_name=values.unset, apn_credential_sid=values.unset,
                gcm_credential_sid=values.unset, messaging_service_sid=values.unset,
@@ -45,7 +45,7 @@ class ServiceList(ListResource):
                log_enabled=values.unset, alexa_skill_id=values.unset,
                default_alexa_notification_protocol_version=values.unset,
                delivery_callback_url=values.unset,
-               delivery_callback_enabled=values.unset):
+               delivery_callback_enabled=values.unset, deadline=None):
         """
         Create the ServiceInstance
 
@@ -63,6 +63,8 @@ class ServiceList(ListResource):
         :param unicode default_alexa_notification_protocol_version: Deprecated
         :param unicode delivery_callback_url: Webhook URL
         :param bool delivery_callback_enabled: Enable delivery callbacks
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created ServiceInstance
         :rtype: twilio.rest.notify.v1.service.ServiceInstance
@@ -84,11 +86,67 @@ class ServiceList(ListResource):
             'DeliveryCallbackEnabled': delivery_callback_enabled,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return ServiceInstance(self._version, payload, )
 
-    def stream(self, friendly_name=values.unset, limit=None, page_size=None):
+    async def create_async(self, friendly_name=values.unset, apn_credential_sid=values.unset,
+                           gcm_credential_sid=values.unset, messaging_service_sid=values.unset,
+                           facebook_messenger_page_id=values.unset,
+                           default_apn_notification_protocol_version=values.unset,
+                           default_gcm_notification_protocol_version=values.unset,
+                           fcm_credential_sid=values.unset,
+                           default_fcm_notification_protocol_version=values.unset,
+                           log_enabled=values.unset, alexa_skill_id=values.unset,
+                           default_alexa_notification_protocol_version=values.unset,
+                           delivery_callback_url=values.unset,
+                           delivery_callback_enabled=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the ServiceInstance
+
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode apn_credential_sid: The SID of the Credential to use for APN Bindings
+        :param unicode gcm_credential_sid: The SID of the Credential to use for GCM Bindings
+        :param unicode messaging_service_sid: The SID of the Messaging Service to use for SMS Bindings
+        :param unicode facebook_messenger_page_id: Deprecated
+        :param unicode default_apn_notification_protocol_version: The protocol version to use for sending APNS notifications
+        :param unicode default_gcm_notification_protocol_version: The protocol version to use for sending GCM notifications
+        :param unicode fcm_credential_sid: The SID of the Credential to use for FCM Bindings
+        :param unicode default_fcm_notification_protocol_version: The protocol version to use for sending FCM notifications
+        :param bool log_enabled: Whether to log notifications
+        :param unicode alexa_skill_id: Deprecated
+        :param unicode default_alexa_notification_protocol_version: Deprecated
+        :param unicode delivery_callback_url: Webhook URL
+        :param bool delivery_callback_enabled: Enable delivery callbacks
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created ServiceInstance
+        :rtype: twilio.rest.notify.v1.service.ServiceInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'ApnCredentialSid': apn_credential_sid,
+            'GcmCredentialSid': gcm_credential_sid,
+            'MessagingServiceSid': messaging_service_sid,
+            'FacebookMessengerPageId': facebook_messenger_page_id,
+            'DefaultApnNotificationProtocolVersion': default_apn_notification_protocol_version,
+            'DefaultGcmNotificationProtocolVersion': default_gcm_notification_protocol_version,
+            'FcmCredentialSid': fcm_credential_sid,
+            'DefaultFcmNotificationProtocolVersion': default_fcm_notification_protocol_version,
+            'LogEnabled': log_enabled,
+            'AlexaSkillId': alexa_skill_id,
+            'DefaultAlexaNotificationProtocolVersion': default_alexa_notification_protocol_version,
+            'DeliveryCallbackUrl': delivery_callback_url,
+            'DeliveryCallbackEnabled': delivery_callback_enabled,
+        })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return ServiceInstance(self._version, payload, )
+
+    def stream(self, friendly_name=values.unset, limit=None, page_size=None,
+               prefetch=None, raw=False, deadline=None):
         """
         Streams ServiceInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -102,17 +160,59 @@ class ServiceList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.notify.v1.service.ServiceInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(friendly_name=friendly_name, page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(friendly_name=friendly_name, page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, friendly_name=values.unset, limit=None, page_size=None):
+    async def stream_async(self, friendly_name=values.unset, limit=None, page_size=None,
+                           prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams ServiceInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param unicode friendly_name: The string that identifies the Service resources to read
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.notify.v1.service.ServiceInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(friendly_name=friendly_name, page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, friendly_name=values.unset, limit=None, page_size=None,
+             prefetch=None, raw=False, deadline=None):
         """
         Lists ServiceInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -125,11 +225,43 @@ class ServiceList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.notify.v1.service.ServiceInstance]
         """
-        return list(self.stream(friendly_name=friendly_name, limit=limit, page_size=page_size, ))
+        return list(self.stream(friendly_name=friendly_name, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, friendly_name=values.unset, limit=None, page_size=None,
+                         prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists ServiceInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param unicode friendly_name: The string that identifies the Service resources to read
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.notify.v1.service.ServiceInstance]
+        """
+        return [record async for record in await self.stream_async(friendly_name=friendly_name, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, friendly_name=values.unset, page_token=values.unset,
              page_number=values.unset, page_size=values.unset):
@@ -156,6 +288,31 @@ class ServiceList(ListResource):
 
         return ServicePage(self._version, response, self._solution)
 
+    async def page_async(self, friendly_name=values.unset, page_token=values.unset,
+                         page_number=values.unset, page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of ServiceInstance records from the API.
+        Request is executed immediately
+
+        :param unicode friendly_name: The string that identifies the Service resources to read
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of ServiceInstance
+        :rtype: twilio.rest.notify.v1.service.ServicePage
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return ServicePage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of ServiceInstance records from the API.
@@ -173,6 +330,23 @@ class ServiceList(ListResource):
 
         return ServicePage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of ServiceInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of ServiceInstance
+        :rtype: twilio.rest.notify.v1.service.ServicePage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return ServicePage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a ServiceContext
@@ -263,7 +437,7 @@ class ServiceContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/Services/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{sid}', self._solution)
 
         # Dependents
         self._bindings = None
@@ -278,6 +452,15 @@ class ServiceContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the ServiceInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def fetch(self):
         """
         Fetch the ServiceInstance
@@ -289,6 +472,17 @@ class ServiceContext(InstanceContext):
 
         return ServiceInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ServiceInstance
+
+        :returns: The fetched ServiceInstance
+        :rtype: twilio.rest.notify.v1.service.ServiceInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return ServiceInstance(self._version, payload, sid=self._solution['sid'], )
+
     def update(self, friendly_name=values.unset, apn_credential_sid=values.unset,
                gcm_credential_sid=values.unset, messaging_service_sid=values.unset,
                facebook_messenger_page_id=values.unset,
@@ -342,6 +536,59 @@ class ServiceContext(InstanceContext):
 
         return ServiceInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def update_async(self, friendly_name=values.unset, apn_credential_sid=values.unset,
+                           gcm_credential_sid=values.unset, messaging_service_sid=values.unset,
+                           facebook_messenger_page_id=values.unset,
+                           default_apn_notification_protocol_version=values.unset,
+                           default_gcm_notification_protocol_version=values.unset,
+                           fcm_credential_sid=values.unset,
+                           default_fcm_notification_protocol_version=values.unset,
+                           log_enabled=values.unset, alexa_skill_id=values.unset,
+                           default_alexa_notification_protocol_version=values.unset,
+                           delivery_callback_url=values.unset,
+                           delivery_callback_enabled=values.unset):
+        """
+        Asynchronous coroutine that updates the ServiceInstance
+
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode apn_credential_sid: The SID of the Credential to use for APN Bindings
+        :param unicode gcm_credential_sid: The SID of the Credential to use for GCM Bindings
+        :param unicode messaging_service_sid: The SID of the Messaging Service to use for SMS Bindings
+        :param unicode facebook_messenger_page_id: Deprecated
+        :param unicode default_apn_notification_protocol_version: The protocol version to use for sending APNS notifications
+        :param unicode default_gcm_notification_protocol_version: The protocol version to use for sending GCM notifications
+        :param unicode fcm_credential_sid: The SID of the Credential to use for FCM Bindings
+        :param unicode default_fcm_notification_protocol_version: The protocol version to use for sending FCM notifications
+        :param bool log_enabled: Whether to log notifications
+        :param unicode alexa_skill_id: Deprecated
+        :param unicode default_alexa_notification_protocol_version: Deprecated
+        :param unicode delivery_callback_url: Webhook URL
+        :param bool delivery_callback_enabled: Enable delivery callbacks
+
+        :returns: The updated ServiceInstance
+        :rtype: twilio.rest.notify.v1.service.ServiceInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'ApnCredentialSid': apn_credential_sid,
+            'GcmCredentialSid': gcm_credential_sid,
+            'MessagingServiceSid': messaging_service_sid,
+            'FacebookMessengerPageId': facebook_messenger_page_id,
+            'DefaultApnNotificationProtocolVersion': default_apn_notification_protocol_version,
+            'DefaultGcmNotificationProtocolVersion': default_gcm_notification_protocol_version,
+            'FcmCredentialSid': fcm_credential_sid,
+            'DefaultFcmNotificationProtocolVersion': default_fcm_notification_protocol_version,
+            'LogEnabled': log_enabled,
+            'AlexaSkillId': alexa_skill_id,
+            'DefaultAlexaNotificationProtocolVersion': default_alexa_notification_protocol_version,
+            'DeliveryCallbackUrl': delivery_callback_url,
+            'DeliveryCallbackEnabled': delivery_callback_enabled,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return ServiceInstance(self._version, payload, sid=self._solution['sid'], )
+
     @property
     def bindings(self):
         """
@@ -351,6 +598,7 @@ class ServiceContext(InstanceContext):
         :rtype: twilio.rest.notify.v1.service.binding.BindingList
         """
         if self._bindings is None:
+            from twilio.rest.notify.v1.service.binding import BindingList
             self._bindings = BindingList(self._version, service_sid=self._solution['sid'], )
         return self._bindings
 
@@ -363,6 +611,7 @@ class ServiceContext(InstanceContext):
         :rtype: twilio.rest.notify.v1.service.notification.NotificationList
         """
         if self._notifications is None:
+            from twilio.rest.notify.v1.service.notification import NotificationList
             self._notifications = NotificationList(self._version, service_sid=self._solution['sid'], )
         return self._notifications
 
@@ -381,6 +630,38 @@ class ServiceInstance(InstanceResource):
     """ PLEASE NOTE that this class contains beta products that are subject to
     change. Use them with caution. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'friendly_name': 'friendly_name',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'apn_credential_sid': 'apn_credential_sid',
+        'gcm_credential_sid': 'gcm_credential_sid',
+        'fcm_credential_sid': 'fcm_credential_sid',
+        'messaging_service_sid': 'messaging_service_sid',
+        'facebook_messenger_page_id': 'facebook_messenger_page_id',
+        'default_apn_notification_protocol_version': 'default_apn_notification_protocol_version',
+        'default_gcm_notification_protocol_version': 'default_gcm_notification_protocol_version',
+        'default_fcm_notification_protocol_version': 'default_fcm_notification_protocol_version',
+        'log_enabled': 'log_enabled',
+        'url': 'url',
+        'links': 'links',
+        'alexa_skill_id': 'alexa_skill_id',
+        'default_alexa_notification_protocol_version': 'default_alexa_notification_protocol_version',
+        'delivery_callback_url': 'delivery_callback_url',
+        'delivery_callback_enabled': 'delivery_callback_enabled',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the ServiceInstance
@@ -391,28 +672,7 @@ class ServiceInstance(InstanceResource):
         super(ServiceInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'friendly_name': payload.get('friendly_name'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'apn_credential_sid': payload.get('apn_credential_sid'),
-            'gcm_credential_sid': payload.get('gcm_credential_sid'),
-            'fcm_credential_sid': payload.get('fcm_credential_sid'),
-            'messaging_service_sid': payload.get('messaging_service_sid'),
-            'facebook_messenger_page_id': payload.get('facebook_messenger_page_id'),
-            'default_apn_notification_protocol_version': payload.get('default_apn_notification_protocol_version'),
-            'default_gcm_notification_protocol_version': payload.get('default_gcm_notification_protocol_version'),
-            'default_fcm_notification_protocol_version': payload.get('default_fcm_notification_protocol_version'),
-            'log_enabled': payload.get('log_enabled'),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-            'alexa_skill_id': payload.get('alexa_skill_id'),
-            'default_alexa_notification_protocol_version': payload.get('default_alexa_notification_protocol_version'),
-            'delivery_callback_url': payload.get('delivery_callback_url'),
-            'delivery_callback_enabled': payload.get('delivery_callback_enabled'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -600,6 +860,15 @@ class ServiceInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the ServiceInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def fetch(self):
         """
         Fetch the ServiceInstance
@@ -609,6 +878,15 @@ class ServiceInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ServiceInstance
+
+        :returns: The fetched ServiceInstance
+        :rtype: twilio.rest.notify.v1.service.ServiceInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, friendly_name=values.unset, apn_credential_sid=values.unset,
                gcm_credential_sid=values.unset, messaging_service_sid=values.unset,
                facebook_messenger_page_id=values.unset,
@@ -658,6 +936,55 @@ class ServiceInstance(InstanceResource):
             delivery_callback_enabled=delivery_callback_enabled,
         )
 
+    async def update_async(self, friendly_name=values.unset, apn_credential_sid=values.unset,
+                           gcm_credential_sid=values.unset, messaging_service_sid=values.unset,
+                           facebook_messenger_page_id=values.unset,
+                           default_apn_notification_protocol_version=values.unset,
+                           default_gcm_notification_protocol_version=values.unset,
+                           fcm_credential_sid=values.unset,
+                           default_fcm_notification_protocol_version=values.unset,
+                           log_enabled=values.unset, alexa_skill_id=values.unset,
+                           default_alexa_notification_protocol_version=values.unset,
+                           delivery_callback_url=values.unset,
+                           delivery_callback_enabled=values.unset):
+        """
+        Asynchronous coroutine that updates the ServiceInstance
+
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode apn_credential_sid: The SID of the Credential to use for APN Bindings
+        :param unicode gcm_credential_sid: The SID of the Credential to use for GCM Bindings
+        :param unicode messaging_service_sid: The SID of the Messaging Service to use for SMS Bindings
+        :param unicode facebook_messenger_page_id: Deprecated
+        :param unicode default_apn_notification_protocol_version: The protocol version to use for sending APNS notifications
+        :param unicode default_gcm_notification_protocol_version: The protocol version to use for sending GCM notifications
+        :param unicode fcm_credential_sid: The SID of the Credential to use for FCM Bindings
+        :param unicode default_fcm_notification_protocol_version: The protocol version to use for sending FCM notifications
+        :param bool log_enabled: Whether to log notifications
+        :param unicode alexa_skill_id: Deprecated
+        :param unicode default_alexa_notification_protocol_version: Deprecated
+        :param unicode delivery_callback_url: Webhook URL
+        :param bool delivery_callback_enabled: Enable delivery callbacks
+
+        :returns: The updated ServiceInstance
+        :rtype: twilio.rest.notify.v1.service.ServiceInstance
+        """
+        return await self._proxy.update_async(
+            friendly_name=friendly_name,
+            apn_credential_sid=apn_credential_sid,
+            gcm_credential_sid=gcm_credential_sid,
+            messaging_service_sid=messaging_service_sid,
+            facebook_messenger_page_id=facebook_messenger_page_id,
+            default_apn_notification_protocol_version=default_apn_notification_protocol_version,
+            default_gcm_notification_protocol_version=default_gcm_notification_protocol_version,
+            fcm_credential_sid=fcm_credential_sid,
+            default_fcm_notification_protocol_version=default_fcm_notification_protocol_version,
+            log_enabled=log_enabled,
+            alexa_skill_id=alexa_skill_id,
+            default_alexa_notification_protocol_version=default_alexa_notification_protocol_version,
+            delivery_callback_url=delivery_callback_url,
+            delivery_callback_enabled=delivery_callback_enabled,
+        )
+
     @property
     def bindings(self):
         """
@@ -687,3 +1014,20 @@ class ServiceInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Notify.V1.ServiceInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'BindingList': 'twilio.rest.notify.v1.service.binding',
+    'NotificationList': 'twilio.rest.notify.v1.service.notification',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
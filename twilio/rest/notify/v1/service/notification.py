@@ -32,7 +32,7 @@ class NotificationList(ListResource):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, }
-        self._uri = '/Services/{service_sid}/Notifications'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/Notifications', self._solution)
 
     def create(self, body=values.unset, priority=values.unset, ttl=values.unset,
                title=values.unset, sound=values.unset, action=values.unset,
@@ -40,7 +40,7 @@ class NotificationList(ListResource):
                sms=values.unset, facebook_messenger=values.unset, fcm=values.unset,
                segment=values.unset, alexa=values.unset, to_binding=values.unset,
                delivery_callback_url=values.unset, identity=values.unset,
-               tag=values.unset):
+               tag=values.unset, deadline=None):
         """
         Create the NotificationInstance
 
@@ -62,6 +62,8 @@ class NotificationList(ListResource):
         :param unicode delivery_callback_url: URL to send webhooks
         :param list[unicode] identity: The `identity` value that identifies the new resource's User
         :param list[unicode] tag: A tag that selects the Bindings to notify
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created NotificationInstance
         :rtype: twilio.rest.notify.v1.service.notification.NotificationInstance
@@ -87,7 +89,66 @@ class NotificationList(ListResource):
             'DeliveryCallbackUrl': delivery_callback_url,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return NotificationInstance(self._version, payload, service_sid=self._solution['service_sid'], )
+
+    async def create_async(self, body=values.unset, priority=values.unset, ttl=values.unset,
+                           title=values.unset, sound=values.unset, action=values.unset,
+                           data=values.unset, apn=values.unset, gcm=values.unset,
+                           sms=values.unset, facebook_messenger=values.unset, fcm=values.unset,
+                           segment=values.unset, alexa=values.unset, to_binding=values.unset,
+                           delivery_callback_url=values.unset, identity=values.unset,
+                           tag=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the NotificationInstance
+
+        :param unicode body: The notification body text
+        :param NotificationInstance.Priority priority: The priority of the notification
+        :param unicode ttl: How long, in seconds, the notification is valid
+        :param unicode title: The notification title
+        :param unicode sound: The name of the sound to be played for the notification
+        :param unicode action: The actions to display for the notification
+        :param dict data: The custom key-value pairs of the notification's payload
+        :param dict apn: The APNS-specific payload that overrides corresponding attributes in a generic payload for APNS Bindings
+        :param dict gcm: The GCM-specific payload that overrides corresponding attributes in generic payload for GCM Bindings
+        :param dict sms: The SMS-specific payload that overrides corresponding attributes in generic payload for SMS Bindings
+        :param dict facebook_messenger: Deprecated
+        :param dict fcm: The FCM-specific payload that overrides corresponding attributes in generic payload for FCM Bindings
+        :param list[unicode] segment: A Segment to notify
+        :param dict alexa: Deprecated
+        :param list[unicode] to_binding: The destination address specified as a JSON string
+        :param unicode delivery_callback_url: URL to send webhooks
+        :param list[unicode] identity: The `identity` value that identifies the new resource's User
+        :param list[unicode] tag: A tag that selects the Bindings to notify
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created NotificationInstance
+        :rtype: twilio.rest.notify.v1.service.notification.NotificationInstance
+        """
+        data = values.of({
+            'Identity': serialize.map(identity, lambda e: e),
+            'Tag': serialize.map(tag, lambda e: e),
+            'Body': body,
+            'Priority': priority,
+            'Ttl': ttl,
+            'Title': title,
+            'Sound': sound,
+            'Action': action,
+            'Data': serialize.object(data),
+            'Apn': serialize.object(apn),
+            'Gcm': serialize.object(gcm),
+            'Sms': serialize.object(sms),
+            'FacebookMessenger': serialize.object(facebook_messenger),
+            'Fcm': serialize.object(fcm),
+            'Segment': serialize.map(segment, lambda e: e),
+            'Alexa': serialize.object(alexa),
+            'ToBinding': serialize.map(to_binding, lambda e: e),
+            'DeliveryCallbackUrl': delivery_callback_url,
+        })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return NotificationInstance(self._version, payload, service_sid=self._solution['service_sid'], )
 
@@ -150,6 +211,38 @@ class NotificationInstance(InstanceResource):
         HIGH = "high"
         LOW = "low"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'ttl': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'service_sid': 'service_sid',
+        'date_created': 'date_created',
+        'identities': 'identities',
+        'tags': 'tags',
+        'segments': 'segments',
+        'priority': 'priority',
+        'ttl': 'ttl',
+        'title': 'title',
+        'body': 'body',
+        'sound': 'sound',
+        'action': 'action',
+        'data': 'data',
+        'apn': 'apn',
+        'gcm': 'gcm',
+        'fcm': 'fcm',
+        'sms': 'sms',
+        'facebook_messenger': 'facebook_messenger',
+        'alexa': 'alexa',
+    }, _deserializers)
+
     def __init__(self, version, payload, service_sid):
         """
         Initialize the NotificationInstance
@@ -160,28 +253,7 @@ class NotificationInstance(InstanceResource):
         super(NotificationInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'service_sid': payload.get('service_sid'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'identities': payload.get('identities'),
-            'tags': payload.get('tags'),
-            'segments': payload.get('segments'),
-            'priority': payload.get('priority'),
-            'ttl': deserialize.integer(payload.get('ttl')),
-            'title': payload.get('title'),
-            'body': payload.get('body'),
-            'sound': payload.get('sound'),
-            'action': payload.get('action'),
-            'data': payload.get('data'),
-            'apn': payload.get('apn'),
-            'gcm': payload.get('gcm'),
-            'fcm': payload.get('fcm'),
-            'sms': payload.get('sms'),
-            'facebook_messenger': payload.get('facebook_messenger'),
-            'alexa': payload.get('alexa'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -6,8 +6,9 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base.version import Version
-from twilio.rest.numbers.v2.regulatory_compliance import RegulatoryComplianceList
 
 
 class V2(Version):
@@ -29,6 +30,7 @@ class V2(Version):
         :rtype: twilio.rest.numbers.v2.regulatory_compliance.RegulatoryComplianceList
         """
         if self._regulatory_compliance is None:
+            from twilio.rest.numbers.v2.regulatory_compliance import RegulatoryComplianceList
             self._regulatory_compliance = RegulatoryComplianceList(self)
         return self._regulatory_compliance
 
@@ -40,3 +42,19 @@ class V2(Version):
         :rtype: str
         """
         return '<Twilio.Numbers.V2>'
+
+
+_LAZY_IMPORTS = {
+    'RegulatoryComplianceList': 'twilio.rest.numbers.v2.regulatory_compliance',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
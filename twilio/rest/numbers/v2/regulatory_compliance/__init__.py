@@ -6,15 +6,11 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.numbers.v2.regulatory_compliance.bundle import BundleList
-from twilio.rest.numbers.v2.regulatory_compliance.end_user import EndUserList
-from twilio.rest.numbers.v2.regulatory_compliance.end_user_type import EndUserTypeList
-from twilio.rest.numbers.v2.regulatory_compliance.regulation import RegulationList
-from twilio.rest.numbers.v2.regulatory_compliance.supporting_document import SupportingDocumentList
-from twilio.rest.numbers.v2.regulatory_compliance.supporting_document_type import SupportingDocumentTypeList
 
 
 class RegulatoryComplianceList(ListResource):
@@ -50,6 +46,7 @@ class RegulatoryComplianceList(ListResource):
         :rtype: twilio.rest.numbers.v2.regulatory_compliance.bundle.BundleList
         """
         if self._bundles is None:
+            from twilio.rest.numbers.v2.regulatory_compliance.bundle import BundleList
             self._bundles = BundleList(self._version, )
         return self._bundles
 
@@ -62,6 +59,7 @@ class RegulatoryComplianceList(ListResource):
         :rtype: twilio.rest.numbers.v2.regulatory_compliance.end_user.EndUserList
         """
         if self._end_users is None:
+            from twilio.rest.numbers.v2.regulatory_compliance.end_user import EndUserList
             self._end_users = EndUserList(self._version, )
         return self._end_users
 
@@ -74,6 +72,7 @@ class RegulatoryComplianceList(ListResource):
         :rtype: twilio.rest.numbers.v2.regulatory_compliance.end_user_type.EndUserTypeList
         """
         if self._end_user_types is None:
+            from twilio.rest.numbers.v2.regulatory_compliance.end_user_type import EndUserTypeList
             self._end_user_types = EndUserTypeList(self._version, )
         return self._end_user_types
 
@@ -86,6 +85,7 @@ class RegulatoryComplianceList(ListResource):
         :rtype: twilio.rest.numbers.v2.regulatory_compliance.regulation.RegulationList
         """
         if self._regulations is None:
+            from twilio.rest.numbers.v2.regulatory_compliance.regulation import RegulationList
             self._regulations = RegulationList(self._version, )
         return self._regulations
 
@@ -98,6 +98,7 @@ class RegulatoryComplianceList(ListResource):
         :rtype: twilio.rest.numbers.v2.regulatory_compliance.supporting_document.SupportingDocumentList
         """
         if self._supporting_documents is None:
+            from twilio.rest.numbers.v2.regulatory_compliance.supporting_document import SupportingDocumentList
             self._supporting_documents = SupportingDocumentList(self._version, )
         return self._supporting_documents
 
@@ -110,6 +111,7 @@ class RegulatoryComplianceList(ListResource):
         :rtype: twilio.rest.numbers.v2.regulatory_compliance.supporting_document_type.SupportingDocumentTypeList
         """
         if self._supporting_document_types is None:
+            from twilio.rest.numbers.v2.regulatory_compliance.supporting_document_type import SupportingDocumentTypeList
             self._supporting_document_types = SupportingDocumentTypeList(self._version, )
         return self._supporting_document_types
 
@@ -163,6 +165,8 @@ class RegulatoryCompliancePage(Page):
 
 class RegulatoryComplianceInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
     def __init__(self, version, payload):
         """
         Initialize the RegulatoryComplianceInstance
@@ -184,3 +188,24 @@ class RegulatoryComplianceInstance(InstanceResource):
         :rtype: str
         """
         return '<Twilio.Numbers.V2.RegulatoryComplianceInstance>'
+
+
+_LAZY_IMPORTS = {
+    'BundleList': 'twilio.rest.numbers.v2.regulatory_compliance.bundle',
+    'EndUserList': 'twilio.rest.numbers.v2.regulatory_compliance.end_user',
+    'EndUserTypeList': 'twilio.rest.numbers.v2.regulatory_compliance.end_user_type',
+    'RegulationList': 'twilio.rest.numbers.v2.regulatory_compliance.regulation',
+    'SupportingDocumentList': 'twilio.rest.numbers.v2.regulatory_compliance.supporting_document',
+    'SupportingDocumentTypeList': 'twilio.rest.numbers.v2.regulatory_compliance.supporting_document_type',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
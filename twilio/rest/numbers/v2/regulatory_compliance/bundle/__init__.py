@@ -6,6 +6,8 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import serialize
 from twilio.base import values
@@ -13,10 +15,6 @@ from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.numbers.v2.regulatory_compliance.bundle.bundle_copy import BundleCopyList
-from twilio.rest.numbers.v2.regulatory_compliance.bundle.evaluation import EvaluationList
-from twilio.rest.numbers.v2.regulatory_compliance.bundle.item_assignment import ItemAssignmentList
-from twilio.rest.numbers.v2.regulatory_compliance.bundle.replace_items import ReplaceItemsList
 
 
 class BundleList(ListResource):
@@ -34,11 +32,11 @@ class BundleList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/RegulatoryCompliance/Bundles'.format(**self._solution)
+        self._uri = values.ResourceUri('/RegulatoryCompliance/Bundles', self._solution)
 
     def create(self, friendly_name, email, status_callback=values.unset,
                regulation_sid=values.unset, iso_country=values.unset,
-               end_user_type=values.unset, number_type=values.unset):
+               end_user_type=values.unset, number_type=values.unset, deadline=None):
         """
         Create the BundleInstance
 
@@ -49,6 +47,41 @@ class BundleList(ListResource):
         :param unicode iso_country: The ISO country code of the country
         :param BundleInstance.EndUserType end_user_type: The type of End User of the Bundle resource
         :param unicode number_type: The type of phone number
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created BundleInstance
+        :rtype: twilio.rest.numbers.v2.regulatory_compliance.bundle.BundleInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'Email': email,
+            'StatusCallback': status_callback,
+            'RegulationSid': regulation_sid,
+            'IsoCountry': iso_country,
+            'EndUserType': end_user_type,
+            'NumberType': number_type,
+        })
+
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return BundleInstance(self._version, payload, )
+
+    async def create_async(self, friendly_name, email, status_callback=values.unset,
+                           regulation_sid=values.unset, iso_country=values.unset,
+                           end_user_type=values.unset, number_type=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the BundleInstance
+
+        :param unicode friendly_name: The string that you assigned to describe the resource
+        :param unicode email: The email address
+        :param unicode status_callback: The URL we call to inform your application of status changes.
+        :param unicode regulation_sid: The unique string of a regulation.
+        :param unicode iso_country: The ISO country code of the country
+        :param BundleInstance.EndUserType end_user_type: The type of End User of the Bundle resource
+        :param unicode number_type: The type of phone number
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created BundleInstance
         :rtype: twilio.rest.numbers.v2.regulatory_compliance.bundle.BundleInstance
@@ -63,7 +96,7 @@ class BundleList(ListResource):
             'NumberType': number_type,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return BundleInstance(self._version, payload, )
 
@@ -72,7 +105,8 @@ class BundleList(ListResource):
                number_type=values.unset, has_valid_until_date=values.unset,
                sort_by=values.unset, sort_direction=values.unset,
                valid_until_date_before=values.unset, valid_until_date=values.unset,
-               valid_until_date_after=values.unset, limit=None, page_size=None):
+               valid_until_date_after=values.unset, limit=None, page_size=None,
+               prefetch=None, raw=False, deadline=None):
         """
         Streams BundleInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -96,13 +130,138 @@ class BundleList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.numbers.v2.regulatory_compliance.bundle.BundleInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                status=status,
+                friendly_name=friendly_name,
+                regulation_sid=regulation_sid,
+                iso_country=iso_country,
+                number_type=number_type,
+                has_valid_until_date=has_valid_until_date,
+                sort_by=sort_by,
+                sort_direction=sort_direction,
+                valid_until_date_before=valid_until_date_before,
+                valid_until_date=valid_until_date,
+                valid_until_date_after=valid_until_date_after,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, status=values.unset, friendly_name=values.unset,
+                           regulation_sid=values.unset, iso_country=values.unset,
+                           number_type=values.unset, has_valid_until_date=values.unset,
+                           sort_by=values.unset, sort_direction=values.unset,
+                           valid_until_date_before=values.unset, valid_until_date=values.unset,
+                           valid_until_date_after=values.unset, limit=None, page_size=None,
+                           prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams BundleInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param BundleInstance.Status status: The verification status of the Bundle resource
+        :param unicode friendly_name: The string that you assigned to describe the resource
+        :param unicode regulation_sid: The unique string of a regulation.
+        :param unicode iso_country: The ISO country code of the country
+        :param unicode number_type: The type of phone number
+        :param bool has_valid_until_date: Indicates that the Bundle is a valid Bundle until a specified expiration date.
+        :param BundleInstance.SortBy sort_by: Can be `valid-until` or `date-updated`. Defaults to `date-created`.
+        :param BundleInstance.SortDirection sort_direction: Default is `DESC`. Can be `ASC` or `DESC`.
+        :param datetime valid_until_date_before: Date to filter Bundles having their `valid_until_date` before or after the specified date. Can be `ValidUntilDate>=` or `ValidUntilDate<=`. Both can be used in conjunction as well.
+        :param datetime valid_until_date: Date to filter Bundles having their `valid_until_date` before or after the specified date. Can be `ValidUntilDate>=` or `ValidUntilDate<=`. Both can be used in conjunction as well.
+        :param datetime valid_until_date_after: Date to filter Bundles having their `valid_until_date` before or after the specified date. Can be `ValidUntilDate>=` or `ValidUntilDate<=`. Both can be used in conjunction as well.
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.numbers.v2.regulatory_compliance.bundle.BundleInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                status=status,
+                friendly_name=friendly_name,
+                regulation_sid=regulation_sid,
+                iso_country=iso_country,
+                number_type=number_type,
+                has_valid_until_date=has_valid_until_date,
+                sort_by=sort_by,
+                sort_direction=sort_direction,
+                valid_until_date_before=valid_until_date_before,
+                valid_until_date=valid_until_date,
+                valid_until_date_after=valid_until_date_after,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, status=values.unset, friendly_name=values.unset,
+             regulation_sid=values.unset, iso_country=values.unset,
+             number_type=values.unset, has_valid_until_date=values.unset,
+             sort_by=values.unset, sort_direction=values.unset,
+             valid_until_date_before=values.unset, valid_until_date=values.unset,
+             valid_until_date_after=values.unset, limit=None, page_size=None,
+             prefetch=None, raw=False, deadline=None):
+        """
+        Lists BundleInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param BundleInstance.Status status: The verification status of the Bundle resource
+        :param unicode friendly_name: The string that you assigned to describe the resource
+        :param unicode regulation_sid: The unique string of a regulation.
+        :param unicode iso_country: The ISO country code of the country
+        :param unicode number_type: The type of phone number
+        :param bool has_valid_until_date: Indicates that the Bundle is a valid Bundle until a specified expiration date.
+        :param BundleInstance.SortBy sort_by: Can be `valid-until` or `date-updated`. Defaults to `date-created`.
+        :param BundleInstance.SortDirection sort_direction: Default is `DESC`. Can be `ASC` or `DESC`.
+        :param datetime valid_until_date_before: Date to filter Bundles having their `valid_until_date` before or after the specified date. Can be `ValidUntilDate>=` or `ValidUntilDate<=`. Both can be used in conjunction as well.
+        :param datetime valid_until_date: Date to filter Bundles having their `valid_until_date` before or after the specified date. Can be `ValidUntilDate>=` or `ValidUntilDate<=`. Both can be used in conjunction as well.
+        :param datetime valid_until_date_after: Date to filter Bundles having their `valid_until_date` before or after the specified date. Can be `ValidUntilDate>=` or `ValidUntilDate<=`. Both can be used in conjunction as well.
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.numbers.v2.regulatory_compliance.bundle.BundleInstance]
+        """
+        return list(self.stream(
             status=status,
             friendly_name=friendly_name,
             regulation_sid=regulation_sid,
@@ -114,19 +273,22 @@ class BundleList(ListResource):
             valid_until_date_before=valid_until_date_before,
             valid_until_date=valid_until_date,
             valid_until_date_after=valid_until_date_after,
-            page_size=limits['page_size'],
-        )
-
-        return self._version.stream(page, limits['limit'])
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        ))
 
-    def list(self, status=values.unset, friendly_name=values.unset,
-             regulation_sid=values.unset, iso_country=values.unset,
-             number_type=values.unset, has_valid_until_date=values.unset,
-             sort_by=values.unset, sort_direction=values.unset,
-             valid_until_date_before=values.unset, valid_until_date=values.unset,
-             valid_until_date_after=values.unset, limit=None, page_size=None):
+    async def list_async(self, status=values.unset, friendly_name=values.unset,
+                         regulation_sid=values.unset, iso_country=values.unset,
+                         number_type=values.unset, has_valid_until_date=values.unset,
+                         sort_by=values.unset, sort_direction=values.unset,
+                         valid_until_date_before=values.unset, valid_until_date=values.unset,
+                         valid_until_date_after=values.unset, limit=None, page_size=None,
+                         prefetch=None, raw=False, deadline=None):
         """
-        Lists BundleInstance records from the API as a list.
+        Asynchronously lists BundleInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
         memory before returning.
 
@@ -147,11 +309,17 @@ class BundleList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.numbers.v2.regulatory_compliance.bundle.BundleInstance]
         """
-        return list(self.stream(
+        return [record async for record in await self.stream_async(
             status=status,
             friendly_name=friendly_name,
             regulation_sid=regulation_sid,
@@ -165,7 +333,10 @@ class BundleList(ListResource):
             valid_until_date_after=valid_until_date_after,
             limit=limit,
             page_size=page_size,
-        ))
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
 
     def page(self, status=values.unset, friendly_name=values.unset,
              regulation_sid=values.unset, iso_country=values.unset,
@@ -217,6 +388,56 @@ class BundleList(ListResource):
 
         return BundlePage(self._version, response, self._solution)
 
+    async def page_async(self, status=values.unset, friendly_name=values.unset,
+                         regulation_sid=values.unset, iso_country=values.unset,
+                         number_type=values.unset, has_valid_until_date=values.unset,
+                         sort_by=values.unset, sort_direction=values.unset,
+                         valid_until_date_before=values.unset, valid_until_date=values.unset,
+                         valid_until_date_after=values.unset, page_token=values.unset,
+                         page_number=values.unset, page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of BundleInstance records from the API.
+        Request is executed immediately
+
+        :param BundleInstance.Status status: The verification status of the Bundle resource
+        :param unicode friendly_name: The string that you assigned to describe the resource
+        :param unicode regulation_sid: The unique string of a regulation.
+        :param unicode iso_country: The ISO country code of the country
+        :param unicode number_type: The type of phone number
+        :param bool has_valid_until_date: Indicates that the Bundle is a valid Bundle until a specified expiration date.
+        :param BundleInstance.SortBy sort_by: Can be `valid-until` or `date-updated`. Defaults to `date-created`.
+        :param BundleInstance.SortDirection sort_direction: Default is `DESC`. Can be `ASC` or `DESC`.
+        :param datetime valid_until_date_before: Date to filter Bundles having their `valid_until_date` before or after the specified date. Can be `ValidUntilDate>=` or `ValidUntilDate<=`. Both can be used in conjunction as well.
+        :param datetime valid_until_date: Date to filter Bundles having their `valid_until_date` before or after the specified date. Can be `ValidUntilDate>=` or `ValidUntilDate<=`. Both can be used in conjunction as well.
+        :param datetime valid_until_date_after: Date to filter Bundles having their `valid_until_date` before or after the specified date. Can be `ValidUntilDate>=` or `ValidUntilDate<=`. Both can be used in conjunction as well.
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of BundleInstance
+        :rtype: twilio.rest.numbers.v2.regulatory_compliance.bundle.BundlePage
+        """
+        data = values.of({
+            'Status': status,
+            'FriendlyName': friendly_name,
+            'RegulationSid': regulation_sid,
+            'IsoCountry': iso_country,
+            'NumberType': number_type,
+            'HasValidUntilDate': has_valid_until_date,
+            'SortBy': sort_by,
+            'SortDirection': sort_direction,
+            'ValidUntilDate<': serialize.iso8601_datetime(valid_until_date_before),
+            'ValidUntilDate': serialize.iso8601_datetime(valid_until_date),
+            'ValidUntilDate>': serialize.iso8601_datetime(valid_until_date_after),
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return BundlePage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of BundleInstance records from the API.
@@ -234,6 +455,23 @@ class BundleList(ListResource):
 
         return BundlePage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of BundleInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of BundleInstance
+        :rtype: twilio.rest.numbers.v2.regulatory_compliance.bundle.BundlePage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return BundlePage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a BundleContext
@@ -320,7 +558,7 @@ class BundleContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/RegulatoryCompliance/Bundles/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/RegulatoryCompliance/Bundles/{sid}', self._solution)
 
         # Dependents
         self._evaluations = None
@@ -339,6 +577,17 @@ class BundleContext(InstanceContext):
 
         return BundleInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the BundleInstance
+
+        :returns: The fetched BundleInstance
+        :rtype: twilio.rest.numbers.v2.regulatory_compliance.bundle.BundleInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return BundleInstance(self._version, payload, sid=self._solution['sid'], )
+
     def update(self, status=values.unset, status_callback=values.unset,
                friendly_name=values.unset, email=values.unset):
         """
@@ -363,6 +612,30 @@ class BundleContext(InstanceContext):
 
         return BundleInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def update_async(self, status=values.unset, status_callback=values.unset,
+                           friendly_name=values.unset, email=values.unset):
+        """
+        Asynchronous coroutine that updates the BundleInstance
+
+        :param BundleInstance.Status status: The verification status of the Bundle resource
+        :param unicode status_callback: The URL we call to inform your application of status changes.
+        :param unicode friendly_name: The string that you assigned to describe the resource
+        :param unicode email: The email address
+
+        :returns: The updated BundleInstance
+        :rtype: twilio.rest.numbers.v2.regulatory_compliance.bundle.BundleInstance
+        """
+        data = values.of({
+            'Status': status,
+            'StatusCallback': status_callback,
+            'FriendlyName': friendly_name,
+            'Email': email,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return BundleInstance(self._version, payload, sid=self._solution['sid'], )
+
     def delete(self):
         """
         Deletes the BundleInstance
@@ -372,6 +645,15 @@ class BundleContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the BundleInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     @property
     def evaluations(self):
         """
@@ -381,6 +663,7 @@ class BundleContext(InstanceContext):
         :rtype: twilio.rest.numbers.v2.regulatory_compliance.bundle.evaluation.EvaluationList
         """
         if self._evaluations is None:
+            from twilio.rest.numbers.v2.regulatory_compliance.bundle.evaluation import EvaluationList
             self._evaluations = EvaluationList(self._version, bundle_sid=self._solution['sid'], )
         return self._evaluations
 
@@ -393,6 +676,7 @@ class BundleContext(InstanceContext):
         :rtype: twilio.rest.numbers.v2.regulatory_compliance.bundle.item_assignment.ItemAssignmentList
         """
         if self._item_assignments is None:
+            from twilio.rest.numbers.v2.regulatory_compliance.bundle.item_assignment import ItemAssignmentList
             self._item_assignments = ItemAssignmentList(self._version, bundle_sid=self._solution['sid'], )
         return self._item_assignments
 
@@ -405,6 +689,7 @@ class BundleContext(InstanceContext):
         :rtype: twilio.rest.numbers.v2.regulatory_compliance.bundle.bundle_copy.BundleCopyList
         """
         if self._bundle_copies is None:
+            from twilio.rest.numbers.v2.regulatory_compliance.bundle.bundle_copy import BundleCopyList
             self._bundle_copies = BundleCopyList(self._version, bundle_sid=self._solution['sid'], )
         return self._bundle_copies
 
@@ -417,6 +702,7 @@ class BundleContext(InstanceContext):
         :rtype: twilio.rest.numbers.v2.regulatory_compliance.bundle.replace_items.ReplaceItemsList
         """
         if self._replace_items is None:
+            from twilio.rest.numbers.v2.regulatory_compliance.bundle.replace_items import ReplaceItemsList
             self._replace_items = ReplaceItemsList(self._version, bundle_sid=self._solution['sid'], )
         return self._replace_items
 
@@ -453,6 +739,31 @@ class BundleInstance(InstanceResource):
         ASC = "ASC"
         DESC = "DESC"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'valid_until': deserialize.iso8601_datetime,
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'regulation_sid': 'regulation_sid',
+        'friendly_name': 'friendly_name',
+        'status': 'status',
+        'valid_until': 'valid_until',
+        'email': 'email',
+        'status_callback': 'status_callback',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'url': 'url',
+        'links': 'links',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the BundleInstance
@@ -463,20 +774,7 @@ class BundleInstance(InstanceResource):
         super(BundleInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'regulation_sid': payload.get('regulation_sid'),
-            'friendly_name': payload.get('friendly_name'),
-            'status': payload.get('status'),
-            'valid_until': deserialize.iso8601_datetime(payload.get('valid_until')),
-            'email': payload.get('email'),
-            'status_callback': payload.get('status_callback'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -600,6 +898,15 @@ class BundleInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the BundleInstance
+
+        :returns: The fetched BundleInstance
+        :rtype: twilio.rest.numbers.v2.regulatory_compliance.bundle.BundleInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, status=values.unset, status_callback=values.unset,
                friendly_name=values.unset, email=values.unset):
         """
@@ -620,6 +927,26 @@ class BundleInstance(InstanceResource):
             email=email,
         )
 
+    async def update_async(self, status=values.unset, status_callback=values.unset,
+                           friendly_name=values.unset, email=values.unset):
+        """
+        Asynchronous coroutine that updates the BundleInstance
+
+        :param BundleInstance.Status status: The verification status of the Bundle resource
+        :param unicode status_callback: The URL we call to inform your application of status changes.
+        :param unicode friendly_name: The string that you assigned to describe the resource
+        :param unicode email: The email address
+
+        :returns: The updated BundleInstance
+        :rtype: twilio.rest.numbers.v2.regulatory_compliance.bundle.BundleInstance
+        """
+        return await self._proxy.update_async(
+            status=status,
+            status_callback=status_callback,
+            friendly_name=friendly_name,
+            email=email,
+        )
+
     def delete(self):
         """
         Deletes the BundleInstance
@@ -629,6 +956,15 @@ class BundleInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the BundleInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     @property
     def evaluations(self):
         """
@@ -678,3 +1014,22 @@ class BundleInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Numbers.V2.BundleInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'BundleCopyList': 'twilio.rest.numbers.v2.regulatory_compliance.bundle.bundle_copy',
+    'EvaluationList': 'twilio.rest.numbers.v2.regulatory_compliance.bundle.evaluation',
+    'ItemAssignmentList': 'twilio.rest.numbers.v2.regulatory_compliance.bundle.item_assignment',
+    'ReplaceItemsList': 'twilio.rest.numbers.v2.regulatory_compliance.bundle.replace_items',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
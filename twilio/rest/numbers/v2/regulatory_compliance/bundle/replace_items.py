@@ -31,20 +31,39 @@ class ReplaceItemsList(ListResource):
 
         # Path Solution
         self._solution = {'bundle_sid': bundle_sid, }
-        self._uri = '/RegulatoryCompliance/Bundles/{bundle_sid}/ReplaceItems'.format(**self._solution)
+        self._uri = values.ResourceUri('/RegulatoryCompliance/Bundles/{bundle_sid}/ReplaceItems', self._solution)
 
-    def create(self, from_bundle_sid):
+    def create(self, from_bundle_sid, deadline=None):
         """
         Create the ReplaceItemsInstance
 
         :param unicode from_bundle_sid: The source bundle sid to copy the item assignments from
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created ReplaceItemsInstance
         :rtype: twilio.rest.numbers.v2.regulatory_compliance.bundle.replace_items.ReplaceItemsInstance
         """
         data = values.of({'FromBundleSid': from_bundle_sid, })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return ReplaceItemsInstance(self._version, payload, bundle_sid=self._solution['bundle_sid'], )
+
+    async def create_async(self, from_bundle_sid, deadline=None):
+        """
+        Asynchronous coroutine that creates the ReplaceItemsInstance
+
+        :param unicode from_bundle_sid: The source bundle sid to copy the item assignments from
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created ReplaceItemsInstance
+        :rtype: twilio.rest.numbers.v2.regulatory_compliance.bundle.replace_items.ReplaceItemsInstance
+        """
+        data = values.of({'FromBundleSid': from_bundle_sid, })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return ReplaceItemsInstance(self._version, payload, bundle_sid=self._solution['bundle_sid'], )
 
@@ -115,6 +134,29 @@ class ReplaceItemsInstance(InstanceResource):
         INDIVIDUAL = "individual"
         BUSINESS = "business"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'valid_until': deserialize.iso8601_datetime,
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'regulation_sid': 'regulation_sid',
+        'friendly_name': 'friendly_name',
+        'status': 'status',
+        'valid_until': 'valid_until',
+        'email': 'email',
+        'status_callback': 'status_callback',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+    }, _deserializers)
+
     def __init__(self, version, payload, bundle_sid):
         """
         Initialize the ReplaceItemsInstance
@@ -125,18 +167,7 @@ class ReplaceItemsInstance(InstanceResource):
         super(ReplaceItemsInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'regulation_sid': payload.get('regulation_sid'),
-            'friendly_name': payload.get('friendly_name'),
-            'status': payload.get('status'),
-            'valid_until': deserialize.iso8601_datetime(payload.get('valid_until')),
-            'email': payload.get('email'),
-            'status_callback': payload.get('status_callback'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -6,6 +6,7 @@ This code was generated by
       /       /
 """
 
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
@@ -28,10 +29,11 @@ class RegulationList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/RegulatoryCompliance/Regulations'.format(**self._solution)
+        self._uri = values.ResourceUri('/RegulatoryCompliance/Regulations', self._solution)
 
     def stream(self, end_user_type=values.unset, iso_country=values.unset,
-               number_type=values.unset, limit=None, page_size=None):
+               number_type=values.unset, limit=None, page_size=None,
+               prefetch=None, raw=False, deadline=None):
         """
         Streams RegulationInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -47,23 +49,73 @@ class RegulationList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.numbers.v2.regulatory_compliance.regulation.RegulationInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
-            end_user_type=end_user_type,
-            iso_country=iso_country,
-            number_type=number_type,
-            page_size=limits['page_size'],
-        )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                end_user_type=end_user_type,
+                iso_country=iso_country,
+                number_type=number_type,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, end_user_type=values.unset, iso_country=values.unset,
+                           number_type=values.unset, limit=None, page_size=None,
+                           prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams RegulationInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param RegulationInstance.EndUserType end_user_type: The type of End User of the Regulation resource
+        :param unicode iso_country: The ISO country code of the phone number's country
+        :param unicode number_type: The type of phone number being regulated
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.numbers.v2.regulatory_compliance.regulation.RegulationInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                end_user_type=end_user_type,
+                iso_country=iso_country,
+                number_type=number_type,
+                page_size=limits['page_size'],
+            )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, end_user_type=values.unset, iso_country=values.unset,
-             number_type=values.unset, limit=None, page_size=None):
+             number_type=values.unset, limit=None, page_size=None,
+             prefetch=None, raw=False, deadline=None):
         """
         Lists RegulationInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -78,6 +130,12 @@ class RegulationList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.numbers.v2.regulatory_compliance.regulation.RegulationInstance]
@@ -88,8 +146,49 @@ class RegulationList(ListResource):
             number_type=number_type,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, end_user_type=values.unset, iso_country=values.unset,
+                         number_type=values.unset, limit=None, page_size=None,
+                         prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists RegulationInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param RegulationInstance.EndUserType end_user_type: The type of End User of the Regulation resource
+        :param unicode iso_country: The ISO country code of the phone number's country
+        :param unicode number_type: The type of phone number being regulated
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.numbers.v2.regulatory_compliance.regulation.RegulationInstance]
+        """
+        return [record async for record in await self.stream_async(
+            end_user_type=end_user_type,
+            iso_country=iso_country,
+            number_type=number_type,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, end_user_type=values.unset, iso_country=values.unset,
              number_type=values.unset, page_token=values.unset,
              page_number=values.unset, page_size=values.unset):
@@ -120,6 +219,36 @@ class RegulationList(ListResource):
 
         return RegulationPage(self._version, response, self._solution)
 
+    async def page_async(self, end_user_type=values.unset, iso_country=values.unset,
+                         number_type=values.unset, page_token=values.unset,
+                         page_number=values.unset, page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of RegulationInstance records from the API.
+        Request is executed immediately
+
+        :param RegulationInstance.EndUserType end_user_type: The type of End User of the Regulation resource
+        :param unicode iso_country: The ISO country code of the phone number's country
+        :param unicode number_type: The type of phone number being regulated
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of RegulationInstance
+        :rtype: twilio.rest.numbers.v2.regulatory_compliance.regulation.RegulationPage
+        """
+        data = values.of({
+            'EndUserType': end_user_type,
+            'IsoCountry': iso_country,
+            'NumberType': number_type,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return RegulationPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of RegulationInstance records from the API.
@@ -137,6 +266,23 @@ class RegulationList(ListResource):
 
         return RegulationPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of RegulationInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of RegulationInstance
+        :rtype: twilio.rest.numbers.v2.regulatory_compliance.regulation.RegulationPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return RegulationPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a RegulationContext
@@ -223,7 +369,7 @@ class RegulationContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/RegulatoryCompliance/Regulations/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/RegulatoryCompliance/Regulations/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -236,6 +382,17 @@ class RegulationContext(InstanceContext):
 
         return RegulationInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the RegulationInstance
+
+        :returns: The fetched RegulationInstance
+        :rtype: twilio.rest.numbers.v2.regulatory_compliance.regulation.RegulationInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return RegulationInstance(self._version, payload, sid=self._solution['sid'], )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -253,6 +410,19 @@ class RegulationInstance(InstanceResource):
         INDIVIDUAL = "individual"
         BUSINESS = "business"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'friendly_name': 'friendly_name',
+        'iso_country': 'iso_country',
+        'number_type': 'number_type',
+        'end_user_type': 'end_user_type',
+        'requirements': 'requirements',
+        'url': 'url',
+    })
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the RegulationInstance
@@ -263,15 +433,7 @@ class RegulationInstance(InstanceResource):
         super(RegulationInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'friendly_name': payload.get('friendly_name'),
-            'iso_country': payload.get('iso_country'),
-            'number_type': payload.get('number_type'),
-            'end_user_type': payload.get('end_user_type'),
-            'requirements': payload.get('requirements'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -355,6 +517,15 @@ class RegulationInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the RegulationInstance
+
+        :returns: The fetched RegulationInstance
+        :rtype: twilio.rest.numbers.v2.regulatory_compliance.regulation.RegulationInstance
+        """
+        return await self._proxy.fetch_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -6,15 +6,9 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base.domain import Domain
-from twilio.rest.preview.bulk_exports import BulkExports
-from twilio.rest.preview.deployed_devices import DeployedDevices
-from twilio.rest.preview.hosted_numbers import HostedNumbers
-from twilio.rest.preview.marketplace import Marketplace
-from twilio.rest.preview.sync import Sync
-from twilio.rest.preview.trusted_comms import TrustedComms
-from twilio.rest.preview.understand import Understand
-from twilio.rest.preview.wireless import Wireless
 
 
 class Preview(Domain):
@@ -47,6 +41,7 @@ class Preview(Domain):
         :rtype: twilio.rest.preview.bulk_exports.BulkExports
         """
         if self._bulk_exports is None:
+            from twilio.rest.preview.bulk_exports import BulkExports
             self._bulk_exports = BulkExports(self)
         return self._bulk_exports
 
@@ -57,6 +52,7 @@ class Preview(Domain):
         :rtype: twilio.rest.preview.deployed_devices.DeployedDevices
         """
         if self._deployed_devices is None:
+            from twilio.rest.preview.deployed_devices import DeployedDevices
             self._deployed_devices = DeployedDevices(self)
         return self._deployed_devices
 
@@ -67,6 +63,7 @@ class Preview(Domain):
         :rtype: twilio.rest.preview.hosted_numbers.HostedNumbers
         """
         if self._hosted_numbers is None:
+            from twilio.rest.preview.hosted_numbers import HostedNumbers
             self._hosted_numbers = HostedNumbers(self)
         return self._hosted_numbers
 
@@ -77,6 +74,7 @@ class Preview(Domain):
         :rtype: twilio.rest.preview.marketplace.Marketplace
         """
         if self._marketplace is None:
+            from twilio.rest.preview.marketplace import Marketplace
             self._marketplace = Marketplace(self)
         return self._marketplace
 
@@ -87,6 +85,7 @@ class Preview(Domain):
         :rtype: twilio.rest.preview.sync.Sync
         """
         if self._sync is None:
+            from twilio.rest.preview.sync import Sync
             self._sync = Sync(self)
         return self._sync
 
@@ -97,6 +96,7 @@ class Preview(Domain):
         :rtype: twilio.rest.preview.understand.Understand
         """
         if self._understand is None:
+            from twilio.rest.preview.understand import Understand
             self._understand = Understand(self)
         return self._understand
 
@@ -107,6 +107,7 @@ class Preview(Domain):
         :rtype: twilio.rest.preview.wireless.Wireless
         """
         if self._wireless is None:
+            from twilio.rest.preview.wireless import Wireless
             self._wireless = Wireless(self)
         return self._wireless
 
@@ -117,6 +118,7 @@ class Preview(Domain):
         :rtype: twilio.rest.preview.trusted_comms.TrustedComms
         """
         if self._trusted_comms is None:
+            from twilio.rest.preview.trusted_comms import TrustedComms
             self._trusted_comms = TrustedComms(self)
         return self._trusted_comms
 
@@ -240,3 +242,26 @@ class Preview(Domain):
         :rtype: str
         """
         return '<Twilio.Preview>'
+
+
+_LAZY_IMPORTS = {
+    'BulkExports': 'twilio.rest.preview.bulk_exports',
+    'DeployedDevices': 'twilio.rest.preview.deployed_devices',
+    'HostedNumbers': 'twilio.rest.preview.hosted_numbers',
+    'Marketplace': 'twilio.rest.preview.marketplace',
+    'Sync': 'twilio.rest.preview.sync',
+    'TrustedComms': 'twilio.rest.preview.trusted_comms',
+    'Understand': 'twilio.rest.preview.understand',
+    'Wireless': 'twilio.rest.preview.wireless',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -6,14 +6,14 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.preview.bulk_exports.export.day import DayList
-from twilio.rest.preview.bulk_exports.export.export_custom_job import ExportCustomJobList
-from twilio.rest.preview.bulk_exports.export.job import JobList
 
 
 class ExportList(ListResource):
@@ -47,6 +47,7 @@ class ExportList(ListResource):
         :rtype: twilio.rest.preview.bulk_exports.export.job.JobList
         """
         if self._jobs is None:
+            from twilio.rest.preview.bulk_exports.export.job import JobList
             self._jobs = JobList(self._version, )
         return self._jobs
 
@@ -142,7 +143,7 @@ class ExportContext(InstanceContext):
 
         # Path Solution
         self._solution = {'resource_type': resource_type, }
-        self._uri = '/Exports/{resource_type}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Exports/{resource_type}', self._solution)
 
         # Dependents
         self._days = None
@@ -159,6 +160,17 @@ class ExportContext(InstanceContext):
 
         return ExportInstance(self._version, payload, resource_type=self._solution['resource_type'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ExportInstance
+
+        :returns: The fetched ExportInstance
+        :rtype: twilio.rest.preview.bulk_exports.export.ExportInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return ExportInstance(self._version, payload, resource_type=self._solution['resource_type'], )
+
     @property
     def days(self):
         """
@@ -168,6 +180,7 @@ class ExportContext(InstanceContext):
         :rtype: twilio.rest.preview.bulk_exports.export.day.DayList
         """
         if self._days is None:
+            from twilio.rest.preview.bulk_exports.export.day import DayList
             self._days = DayList(self._version, resource_type=self._solution['resource_type'], )
         return self._days
 
@@ -180,6 +193,7 @@ class ExportContext(InstanceContext):
         :rtype: twilio.rest.preview.bulk_exports.export.export_custom_job.ExportCustomJobList
         """
         if self._export_custom_jobs is None:
+            from twilio.rest.preview.bulk_exports.export.export_custom_job import ExportCustomJobList
             self._export_custom_jobs = ExportCustomJobList(
                 self._version,
                 resource_type=self._solution['resource_type'],
@@ -202,6 +216,15 @@ class ExportInstance(InstanceResource):
     to change. Use them with caution. If you currently do not have developer
     preview access, please contact help@twilio.com. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'resource_type': 'resource_type',
+        'url': 'url',
+        'links': 'links',
+    })
+
     def __init__(self, version, payload, resource_type=None):
         """
         Initialize the ExportInstance
@@ -212,11 +235,7 @@ class ExportInstance(InstanceResource):
         super(ExportInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'resource_type': payload.get('resource_type'),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -268,6 +287,15 @@ class ExportInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ExportInstance
+
+        :returns: The fetched ExportInstance
+        :rtype: twilio.rest.preview.bulk_exports.export.ExportInstance
+        """
+        return await self._proxy.fetch_async()
+
     @property
     def days(self):
         """
@@ -297,3 +325,21 @@ class ExportInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Preview.BulkExports.ExportInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'DayList': 'twilio.rest.preview.bulk_exports.export.day',
+    'ExportCustomJobList': 'twilio.rest.preview.bulk_exports.export.export_custom_job',
+    'JobList': 'twilio.rest.preview.bulk_exports.export.job',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
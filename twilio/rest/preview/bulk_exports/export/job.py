@@ -6,6 +6,7 @@ This code was generated by
       /       /
 """
 
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
@@ -124,7 +125,7 @@ class JobContext(InstanceContext):
 
         # Path Solution
         self._solution = {'job_sid': job_sid, }
-        self._uri = '/Exports/Jobs/{job_sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Exports/Jobs/{job_sid}', self._solution)
 
     def fetch(self):
         """
@@ -137,6 +138,17 @@ class JobContext(InstanceContext):
 
         return JobInstance(self._version, payload, job_sid=self._solution['job_sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the JobInstance
+
+        :returns: The fetched JobInstance
+        :rtype: twilio.rest.preview.bulk_exports.export.job.JobInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return JobInstance(self._version, payload, job_sid=self._solution['job_sid'], )
+
     def delete(self):
         """
         Deletes the JobInstance
@@ -146,6 +158,15 @@ class JobContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the JobInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -162,6 +183,22 @@ class JobInstance(InstanceResource):
     to change. Use them with caution. If you currently do not have developer
     preview access, please contact help@twilio.com. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'resource_type': 'resource_type',
+        'friendly_name': 'friendly_name',
+        'details': 'details',
+        'start_day': 'start_day',
+        'end_day': 'end_day',
+        'job_sid': 'job_sid',
+        'webhook_url': 'webhook_url',
+        'webhook_method': 'webhook_method',
+        'email': 'email',
+        'url': 'url',
+    })
+
     def __init__(self, version, payload, job_sid=None):
         """
         Initialize the JobInstance
@@ -172,18 +209,7 @@ class JobInstance(InstanceResource):
         super(JobInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'resource_type': payload.get('resource_type'),
-            'friendly_name': payload.get('friendly_name'),
-            'details': payload.get('details'),
-            'start_day': payload.get('start_day'),
-            'end_day': payload.get('end_day'),
-            'job_sid': payload.get('job_sid'),
-            'webhook_url': payload.get('webhook_url'),
-            'webhook_method': payload.get('webhook_method'),
-            'email': payload.get('email'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -291,6 +317,15 @@ class JobInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the JobInstance
+
+        :returns: The fetched JobInstance
+        :rtype: twilio.rest.preview.bulk_exports.export.job.JobInstance
+        """
+        return await self._proxy.fetch_async()
+
     def delete(self):
         """
         Deletes the JobInstance
@@ -300,6 +335,15 @@ class JobInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the JobInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
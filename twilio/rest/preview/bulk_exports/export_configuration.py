@@ -6,6 +6,7 @@ This code was generated by
       /       /
 """
 
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
@@ -124,7 +125,7 @@ class ExportConfigurationContext(InstanceContext):
 
         # Path Solution
         self._solution = {'resource_type': resource_type, }
-        self._uri = '/Exports/{resource_type}/Configuration'.format(**self._solution)
+        self._uri = values.ResourceUri('/Exports/{resource_type}/Configuration', self._solution)
 
     def fetch(self):
         """
@@ -141,6 +142,21 @@ class ExportConfigurationContext(InstanceContext):
             resource_type=self._solution['resource_type'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ExportConfigurationInstance
+
+        :returns: The fetched ExportConfigurationInstance
+        :rtype: twilio.rest.preview.bulk_exports.export_configuration.ExportConfigurationInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return ExportConfigurationInstance(
+            self._version,
+            payload,
+            resource_type=self._solution['resource_type'],
+        )
+
     def update(self, enabled=values.unset, webhook_url=values.unset,
                webhook_method=values.unset):
         """
@@ -163,6 +179,28 @@ class ExportConfigurationContext(InstanceContext):
             resource_type=self._solution['resource_type'],
         )
 
+    async def update_async(self, enabled=values.unset, webhook_url=values.unset,
+                           webhook_method=values.unset):
+        """
+        Asynchronous coroutine that updates the ExportConfigurationInstance
+
+        :param bool enabled: Whether files are automatically generated
+        :param unicode webhook_url: URL targeted at export
+        :param unicode webhook_method: Whether to GET or POST to the webhook url
+
+        :returns: The updated ExportConfigurationInstance
+        :rtype: twilio.rest.preview.bulk_exports.export_configuration.ExportConfigurationInstance
+        """
+        data = values.of({'Enabled': enabled, 'WebhookUrl': webhook_url, 'WebhookMethod': webhook_method, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return ExportConfigurationInstance(
+            self._version,
+            payload,
+            resource_type=self._solution['resource_type'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -179,6 +217,17 @@ class ExportConfigurationInstance(InstanceResource):
     to change. Use them with caution. If you currently do not have developer
     preview access, please contact help@twilio.com. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'enabled': 'enabled',
+        'webhook_url': 'webhook_url',
+        'webhook_method': 'webhook_method',
+        'resource_type': 'resource_type',
+        'url': 'url',
+    })
+
     def __init__(self, version, payload, resource_type=None):
         """
         Initialize the ExportConfigurationInstance
@@ -189,13 +238,7 @@ class ExportConfigurationInstance(InstanceResource):
         super(ExportConfigurationInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'enabled': payload.get('enabled'),
-            'webhook_url': payload.get('webhook_url'),
-            'webhook_method': payload.get('webhook_method'),
-            'resource_type': payload.get('resource_type'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -266,6 +309,15 @@ class ExportConfigurationInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ExportConfigurationInstance
+
+        :returns: The fetched ExportConfigurationInstance
+        :rtype: twilio.rest.preview.bulk_exports.export_configuration.ExportConfigurationInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, enabled=values.unset, webhook_url=values.unset,
                webhook_method=values.unset):
         """
@@ -280,6 +332,20 @@ class ExportConfigurationInstance(InstanceResource):
         """
         return self._proxy.update(enabled=enabled, webhook_url=webhook_url, webhook_method=webhook_method, )
 
+    async def update_async(self, enabled=values.unset, webhook_url=values.unset,
+                           webhook_method=values.unset):
+        """
+        Asynchronous coroutine that updates the ExportConfigurationInstance
+
+        :param bool enabled: Whether files are automatically generated
+        :param unicode webhook_url: URL targeted at export
+        :param unicode webhook_method: Whether to GET or POST to the webhook url
+
+        :returns: The updated ExportConfigurationInstance
+        :rtype: twilio.rest.preview.bulk_exports.export_configuration.ExportConfigurationInstance
+        """
+        return await self._proxy.update_async(enabled=enabled, webhook_url=webhook_url, webhook_method=webhook_method, )
+
     def __repr__(self):
         """
         Provide a friendly representation
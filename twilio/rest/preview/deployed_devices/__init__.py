@@ -6,8 +6,9 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base.version import Version
-from twilio.rest.preview.deployed_devices.fleet import FleetList
 
 
 class DeployedDevices(Version):
@@ -29,6 +30,7 @@ class DeployedDevices(Version):
         :rtype: twilio.rest.preview.deployed_devices.fleet.FleetList
         """
         if self._fleets is None:
+            from twilio.rest.preview.deployed_devices.fleet import FleetList
             self._fleets = FleetList(self)
         return self._fleets
 
@@ -40,3 +42,19 @@ class DeployedDevices(Version):
         :rtype: str
         """
         return '<Twilio.Preview.DeployedDevices>'
+
+
+_LAZY_IMPORTS = {
+    'FleetList': 'twilio.rest.preview.deployed_devices.fleet',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
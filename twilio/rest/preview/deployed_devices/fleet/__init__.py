@@ -6,16 +6,14 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.preview.deployed_devices.fleet.certificate import CertificateList
-from twilio.rest.preview.deployed_devices.fleet.deployment import DeploymentList
-from twilio.rest.preview.deployed_devices.fleet.device import DeviceList
-from twilio.rest.preview.deployed_devices.fleet.key import KeyList
 
 
 class FleetList(ListResource):
@@ -36,24 +34,43 @@ class FleetList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Fleets'.format(**self._solution)
+        self._uri = values.ResourceUri('/Fleets', self._solution)
 
-    def create(self, friendly_name=values.unset):
+    def create(self, friendly_name=values.unset, deadline=None):
         """
         Create the FleetInstance
 
         :param unicode friendly_name: A human readable description for this Fleet.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created FleetInstance
         :rtype: twilio.rest.preview.deployed_devices.fleet.FleetInstance
         """
         data = values.of({'FriendlyName': friendly_name, })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return FleetInstance(self._version, payload, )
 
-    def stream(self, limit=None, page_size=None):
+    async def create_async(self, friendly_name=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the FleetInstance
+
+        :param unicode friendly_name: A human readable description for this Fleet.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created FleetInstance
+        :rtype: twilio.rest.preview.deployed_devices.fleet.FleetInstance
+        """
+        data = values.of({'FriendlyName': friendly_name, })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return FleetInstance(self._version, payload, )
+
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams FleetInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -66,17 +83,57 @@ class FleetList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.preview.deployed_devices.fleet.FleetInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams FleetInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.preview.deployed_devices.fleet.FleetInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists FleetInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -88,11 +145,42 @@ class FleetList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.preview.deployed_devices.fleet.FleetInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists FleetInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.preview.deployed_devices.fleet.FleetInstance]
+        """
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -113,6 +201,25 @@ class FleetList(ListResource):
 
         return FleetPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of FleetInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of FleetInstance
+        :rtype: twilio.rest.preview.deployed_devices.fleet.FleetPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return FleetPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of FleetInstance records from the API.
@@ -130,6 +237,23 @@ class FleetList(ListResource):
 
         return FleetPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of FleetInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of FleetInstance
+        :rtype: twilio.rest.preview.deployed_devices.fleet.FleetPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return FleetPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a FleetContext
@@ -222,7 +346,7 @@ class FleetContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/Fleets/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Fleets/{sid}', self._solution)
 
         # Dependents
         self._devices = None
@@ -241,6 +365,17 @@ class FleetContext(InstanceContext):
 
         return FleetInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the FleetInstance
+
+        :returns: The fetched FleetInstance
+        :rtype: twilio.rest.preview.deployed_devices.fleet.FleetInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return FleetInstance(self._version, payload, sid=self._solution['sid'], )
+
     def delete(self):
         """
         Deletes the FleetInstance
@@ -250,6 +385,15 @@ class FleetContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the FleetInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def update(self, friendly_name=values.unset,
                default_deployment_sid=values.unset):
         """
@@ -267,6 +411,23 @@ class FleetContext(InstanceContext):
 
         return FleetInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def update_async(self, friendly_name=values.unset,
+                           default_deployment_sid=values.unset):
+        """
+        Asynchronous coroutine that updates the FleetInstance
+
+        :param unicode friendly_name: A human readable description for this Fleet.
+        :param unicode default_deployment_sid: A default Deployment SID.
+
+        :returns: The updated FleetInstance
+        :rtype: twilio.rest.preview.deployed_devices.fleet.FleetInstance
+        """
+        data = values.of({'FriendlyName': friendly_name, 'DefaultDeploymentSid': default_deployment_sid, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return FleetInstance(self._version, payload, sid=self._solution['sid'], )
+
     @property
     def devices(self):
         """
@@ -276,6 +437,7 @@ class FleetContext(InstanceContext):
         :rtype: twilio.rest.preview.deployed_devices.fleet.device.DeviceList
         """
         if self._devices is None:
+            from twilio.rest.preview.deployed_devices.fleet.device import DeviceList
             self._devices = DeviceList(self._version, fleet_sid=self._solution['sid'], )
         return self._devices
 
@@ -288,6 +450,7 @@ class FleetContext(InstanceContext):
         :rtype: twilio.rest.preview.deployed_devices.fleet.deployment.DeploymentList
         """
         if self._deployments is None:
+            from twilio.rest.preview.deployed_devices.fleet.deployment import DeploymentList
             self._deployments = DeploymentList(self._version, fleet_sid=self._solution['sid'], )
         return self._deployments
 
@@ -300,6 +463,7 @@ class FleetContext(InstanceContext):
         :rtype: twilio.rest.preview.deployed_devices.fleet.certificate.CertificateList
         """
         if self._certificates is None:
+            from twilio.rest.preview.deployed_devices.fleet.certificate import CertificateList
             self._certificates = CertificateList(self._version, fleet_sid=self._solution['sid'], )
         return self._certificates
 
@@ -312,6 +476,7 @@ class FleetContext(InstanceContext):
         :rtype: twilio.rest.preview.deployed_devices.fleet.key.KeyList
         """
         if self._keys is None:
+            from twilio.rest.preview.deployed_devices.fleet.key import KeyList
             self._keys = KeyList(self._version, fleet_sid=self._solution['sid'], )
         return self._keys
 
@@ -331,6 +496,27 @@ class FleetInstance(InstanceResource):
     to change. Use them with caution. If you currently do not have developer
     preview access, please contact help@twilio.com. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'url': 'url',
+        'unique_name': 'unique_name',
+        'friendly_name': 'friendly_name',
+        'account_sid': 'account_sid',
+        'default_deployment_sid': 'default_deployment_sid',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'links': 'links',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the FleetInstance
@@ -341,17 +527,7 @@ class FleetInstance(InstanceResource):
         super(FleetInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'url': payload.get('url'),
-            'unique_name': payload.get('unique_name'),
-            'friendly_name': payload.get('friendly_name'),
-            'account_sid': payload.get('account_sid'),
-            'default_deployment_sid': payload.get('default_deployment_sid'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -451,6 +627,15 @@ class FleetInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the FleetInstance
+
+        :returns: The fetched FleetInstance
+        :rtype: twilio.rest.preview.deployed_devices.fleet.FleetInstance
+        """
+        return await self._proxy.fetch_async()
+
     def delete(self):
         """
         Deletes the FleetInstance
@@ -460,6 +645,15 @@ class FleetInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the FleetInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def update(self, friendly_name=values.unset,
                default_deployment_sid=values.unset):
         """
@@ -476,6 +670,22 @@ class FleetInstance(InstanceResource):
             default_deployment_sid=default_deployment_sid,
         )
 
+    async def update_async(self, friendly_name=values.unset,
+                           default_deployment_sid=values.unset):
+        """
+        Asynchronous coroutine that updates the FleetInstance
+
+        :param unicode friendly_name: A human readable description for this Fleet.
+        :param unicode default_deployment_sid: A default Deployment SID.
+
+        :returns: The updated FleetInstance
+        :rtype: twilio.rest.preview.deployed_devices.fleet.FleetInstance
+        """
+        return await self._proxy.update_async(
+            friendly_name=friendly_name,
+            default_deployment_sid=default_deployment_sid,
+        )
+
     @property
     def devices(self):
         """
@@ -525,3 +735,22 @@ class FleetInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Preview.DeployedDevices.FleetInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'CertificateList': 'twilio.rest.preview.deployed_devices.fleet.certificate',
+    'DeploymentList': 'twilio.rest.preview.deployed_devices.fleet.deployment',
+    'DeviceList': 'twilio.rest.preview.deployed_devices.fleet.device',
+    'KeyList': 'twilio.rest.preview.deployed_devices.fleet.key',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
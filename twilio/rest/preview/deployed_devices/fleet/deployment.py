@@ -33,25 +33,46 @@ class DeploymentList(ListResource):
 
         # Path Solution
         self._solution = {'fleet_sid': fleet_sid, }
-        self._uri = '/Fleets/{fleet_sid}/Deployments'.format(**self._solution)
+        self._uri = values.ResourceUri('/Fleets/{fleet_sid}/Deployments', self._solution)
 
-    def create(self, friendly_name=values.unset, sync_service_sid=values.unset):
+    def create(self, friendly_name=values.unset, sync_service_sid=values.unset, deadline=None):
         """
         Create the DeploymentInstance
 
         :param unicode friendly_name: A human readable description for this Deployment.
         :param unicode sync_service_sid: The unique identifier of the Sync service instance.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created DeploymentInstance
         :rtype: twilio.rest.preview.deployed_devices.fleet.deployment.DeploymentInstance
         """
         data = values.of({'FriendlyName': friendly_name, 'SyncServiceSid': sync_service_sid, })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return DeploymentInstance(self._version, payload, fleet_sid=self._solution['fleet_sid'], )
 
-    def stream(self, limit=None, page_size=None):
+    async def create_async(self, friendly_name=values.unset, sync_service_sid=values.unset,
+                           deadline=None):
+        """
+        Asynchronous coroutine that creates the DeploymentInstance
+
+        :param unicode friendly_name: A human readable description for this Deployment.
+        :param unicode sync_service_sid: The unique identifier of the Sync service instance.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created DeploymentInstance
+        :rtype: twilio.rest.preview.deployed_devices.fleet.deployment.DeploymentInstance
+        """
+        data = values.of({'FriendlyName': friendly_name, 'SyncServiceSid': sync_service_sid, })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return DeploymentInstance(self._version, payload, fleet_sid=self._solution['fleet_sid'], )
+
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams DeploymentInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -64,17 +85,57 @@ class DeploymentList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.preview.deployed_devices.fleet.deployment.DeploymentInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams DeploymentInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.preview.deployed_devices.fleet.deployment.DeploymentInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists DeploymentInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -86,11 +147,42 @@ class DeploymentList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.preview.deployed_devices.fleet.deployment.DeploymentInstance]
+        """
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists DeploymentInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.preview.deployed_devices.fleet.deployment.DeploymentInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -111,6 +203,25 @@ class DeploymentList(ListResource):
 
         return DeploymentPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of DeploymentInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of DeploymentInstance
+        :rtype: twilio.rest.preview.deployed_devices.fleet.deployment.DeploymentPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return DeploymentPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of DeploymentInstance records from the API.
@@ -128,6 +239,23 @@ class DeploymentList(ListResource):
 
         return DeploymentPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of DeploymentInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of DeploymentInstance
+        :rtype: twilio.rest.preview.deployed_devices.fleet.deployment.DeploymentPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return DeploymentPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a DeploymentContext
@@ -222,7 +350,7 @@ class DeploymentContext(InstanceContext):
 
         # Path Solution
         self._solution = {'fleet_sid': fleet_sid, 'sid': sid, }
-        self._uri = '/Fleets/{fleet_sid}/Deployments/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Fleets/{fleet_sid}/Deployments/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -240,6 +368,22 @@ class DeploymentContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the DeploymentInstance
+
+        :returns: The fetched DeploymentInstance
+        :rtype: twilio.rest.preview.deployed_devices.fleet.deployment.DeploymentInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return DeploymentInstance(
+            self._version,
+            payload,
+            fleet_sid=self._solution['fleet_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self):
         """
         Deletes the DeploymentInstance
@@ -249,6 +393,15 @@ class DeploymentContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the DeploymentInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def update(self, friendly_name=values.unset, sync_service_sid=values.unset):
         """
         Update the DeploymentInstance
@@ -270,6 +423,27 @@ class DeploymentContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, friendly_name=values.unset, sync_service_sid=values.unset):
+        """
+        Asynchronous coroutine that updates the DeploymentInstance
+
+        :param unicode friendly_name: A human readable description for this Deployment.
+        :param unicode sync_service_sid: The unique identifier of the Sync service instance.
+
+        :returns: The updated DeploymentInstance
+        :rtype: twilio.rest.preview.deployed_devices.fleet.deployment.DeploymentInstance
+        """
+        data = values.of({'FriendlyName': friendly_name, 'SyncServiceSid': sync_service_sid, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return DeploymentInstance(
+            self._version,
+            payload,
+            fleet_sid=self._solution['fleet_sid'],
+            sid=self._solution['sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -286,6 +460,26 @@ class DeploymentInstance(InstanceResource):
     to change. Use them with caution. If you currently do not have developer
     preview access, please contact help@twilio.com. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'url': 'url',
+        'friendly_name': 'friendly_name',
+        'fleet_sid': 'fleet_sid',
+        'account_sid': 'account_sid',
+        'sync_service_sid': 'sync_service_sid',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+    }, _deserializers)
+
     def __init__(self, version, payload, fleet_sid, sid=None):
         """
         Initialize the DeploymentInstance
@@ -296,16 +490,7 @@ class DeploymentInstance(InstanceResource):
         super(DeploymentInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'url': payload.get('url'),
-            'friendly_name': payload.get('friendly_name'),
-            'fleet_sid': payload.get('fleet_sid'),
-            'account_sid': payload.get('account_sid'),
-            'sync_service_sid': payload.get('sync_service_sid'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -401,6 +586,15 @@ class DeploymentInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the DeploymentInstance
+
+        :returns: The fetched DeploymentInstance
+        :rtype: twilio.rest.preview.deployed_devices.fleet.deployment.DeploymentInstance
+        """
+        return await self._proxy.fetch_async()
+
     def delete(self):
         """
         Deletes the DeploymentInstance
@@ -410,6 +604,15 @@ class DeploymentInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the DeploymentInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def update(self, friendly_name=values.unset, sync_service_sid=values.unset):
         """
         Update the DeploymentInstance
@@ -422,6 +625,18 @@ class DeploymentInstance(InstanceResource):
         """
         return self._proxy.update(friendly_name=friendly_name, sync_service_sid=sync_service_sid, )
 
+    async def update_async(self, friendly_name=values.unset, sync_service_sid=values.unset):
+        """
+        Asynchronous coroutine that updates the DeploymentInstance
+
+        :param unicode friendly_name: A human readable description for this Deployment.
+        :param unicode sync_service_sid: The unique identifier of the Sync service instance.
+
+        :returns: The updated DeploymentInstance
+        :rtype: twilio.rest.preview.deployed_devices.fleet.deployment.DeploymentInstance
+        """
+        return await self._proxy.update_async(friendly_name=friendly_name, sync_service_sid=sync_service_sid, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -33,11 +33,11 @@ class DeviceList(ListResource):
 
         # Path Solution
         self._solution = {'fleet_sid': fleet_sid, }
-        self._uri = '/Fleets/{fleet_sid}/Devices'.format(**self._solution)
+        self._uri = values.ResourceUri('/Fleets/{fleet_sid}/Devices', self._solution)
 
     def create(self, unique_name=values.unset, friendly_name=values.unset,
                identity=values.unset, deployment_sid=values.unset,
-               enabled=values.unset):
+               enabled=values.unset, deadline=None):
         """
         Create the DeviceInstance
 
@@ -46,6 +46,8 @@ class DeviceList(ListResource):
         :param unicode identity: An identifier of the Device user.
         :param unicode deployment_sid: The unique SID of the Deployment group.
         :param bool enabled: The enabled
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created DeviceInstance
         :rtype: twilio.rest.preview.deployed_devices.fleet.device.DeviceInstance
@@ -58,11 +60,41 @@ class DeviceList(ListResource):
             'Enabled': enabled,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return DeviceInstance(self._version, payload, fleet_sid=self._solution['fleet_sid'], )
 
-    def stream(self, deployment_sid=values.unset, limit=None, page_size=None):
+    async def create_async(self, unique_name=values.unset, friendly_name=values.unset,
+                           identity=values.unset, deployment_sid=values.unset,
+                           enabled=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the DeviceInstance
+
+        :param unicode unique_name: A unique, addressable name of this Device.
+        :param unicode friendly_name: A human readable description for this Device.
+        :param unicode identity: An identifier of the Device user.
+        :param unicode deployment_sid: The unique SID of the Deployment group.
+        :param bool enabled: The enabled
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created DeviceInstance
+        :rtype: twilio.rest.preview.deployed_devices.fleet.device.DeviceInstance
+        """
+        data = values.of({
+            'UniqueName': unique_name,
+            'FriendlyName': friendly_name,
+            'Identity': identity,
+            'DeploymentSid': deployment_sid,
+            'Enabled': enabled,
+        })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return DeviceInstance(self._version, payload, fleet_sid=self._solution['fleet_sid'], )
+
+    def stream(self, deployment_sid=values.unset, limit=None, page_size=None,
+               prefetch=None, raw=False, deadline=None):
         """
         Streams DeviceInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -76,17 +108,59 @@ class DeviceList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.preview.deployed_devices.fleet.device.DeviceInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(deployment_sid=deployment_sid, page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(deployment_sid=deployment_sid, page_size=limits['page_size'], )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, deployment_sid=values.unset, limit=None, page_size=None,
+                           prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams DeviceInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param unicode deployment_sid: Find all Devices grouped under the specified Deployment.
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.preview.deployed_devices.fleet.device.DeviceInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(deployment_sid=deployment_sid, page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, deployment_sid=values.unset, limit=None, page_size=None):
+    def list(self, deployment_sid=values.unset, limit=None, page_size=None,
+             prefetch=None, raw=False, deadline=None):
         """
         Lists DeviceInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -99,11 +173,43 @@ class DeviceList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.preview.deployed_devices.fleet.device.DeviceInstance]
+        """
+        return list(self.stream(deployment_sid=deployment_sid, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, deployment_sid=values.unset, limit=None, page_size=None,
+                         prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists DeviceInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param unicode deployment_sid: Find all Devices grouped under the specified Deployment.
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.preview.deployed_devices.fleet.device.DeviceInstance]
         """
-        return list(self.stream(deployment_sid=deployment_sid, limit=limit, page_size=page_size, ))
+        return [record async for record in await self.stream_async(deployment_sid=deployment_sid, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, deployment_sid=values.unset, page_token=values.unset,
              page_number=values.unset, page_size=values.unset):
@@ -130,6 +236,31 @@ class DeviceList(ListResource):
 
         return DevicePage(self._version, response, self._solution)
 
+    async def page_async(self, deployment_sid=values.unset, page_token=values.unset,
+                         page_number=values.unset, page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of DeviceInstance records from the API.
+        Request is executed immediately
+
+        :param unicode deployment_sid: Find all Devices grouped under the specified Deployment.
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of DeviceInstance
+        :rtype: twilio.rest.preview.deployed_devices.fleet.device.DevicePage
+        """
+        data = values.of({
+            'DeploymentSid': deployment_sid,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return DevicePage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of DeviceInstance records from the API.
@@ -147,6 +278,23 @@ class DeviceList(ListResource):
 
         return DevicePage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of DeviceInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of DeviceInstance
+        :rtype: twilio.rest.preview.deployed_devices.fleet.device.DevicePage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return DevicePage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a DeviceContext
@@ -241,7 +389,7 @@ class DeviceContext(InstanceContext):
 
         # Path Solution
         self._solution = {'fleet_sid': fleet_sid, 'sid': sid, }
-        self._uri = '/Fleets/{fleet_sid}/Devices/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Fleets/{fleet_sid}/Devices/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -259,6 +407,22 @@ class DeviceContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the DeviceInstance
+
+        :returns: The fetched DeviceInstance
+        :rtype: twilio.rest.preview.deployed_devices.fleet.device.DeviceInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return DeviceInstance(
+            self._version,
+            payload,
+            fleet_sid=self._solution['fleet_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self):
         """
         Deletes the DeviceInstance
@@ -268,6 +432,15 @@ class DeviceContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the DeviceInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def update(self, friendly_name=values.unset, identity=values.unset,
                deployment_sid=values.unset, enabled=values.unset):
         """
@@ -297,6 +470,35 @@ class DeviceContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, friendly_name=values.unset, identity=values.unset,
+                           deployment_sid=values.unset, enabled=values.unset):
+        """
+        Asynchronous coroutine that updates the DeviceInstance
+
+        :param unicode friendly_name: A human readable description for this Device.
+        :param unicode identity: An identifier of the Device user.
+        :param unicode deployment_sid: The unique SID of the Deployment group.
+        :param bool enabled: The enabled
+
+        :returns: The updated DeviceInstance
+        :rtype: twilio.rest.preview.deployed_devices.fleet.device.DeviceInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'Identity': identity,
+            'DeploymentSid': deployment_sid,
+            'Enabled': enabled,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return DeviceInstance(
+            self._version,
+            payload,
+            fleet_sid=self._solution['fleet_sid'],
+            sid=self._solution['sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -313,6 +515,31 @@ class DeviceInstance(InstanceResource):
     to change. Use them with caution. If you currently do not have developer
     preview access, please contact help@twilio.com. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+        'date_authenticated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'url': 'url',
+        'unique_name': 'unique_name',
+        'friendly_name': 'friendly_name',
+        'fleet_sid': 'fleet_sid',
+        'enabled': 'enabled',
+        'account_sid': 'account_sid',
+        'identity': 'identity',
+        'deployment_sid': 'deployment_sid',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'date_authenticated': 'date_authenticated',
+    }, _deserializers)
+
     def __init__(self, version, payload, fleet_sid, sid=None):
         """
         Initialize the DeviceInstance
@@ -323,20 +550,7 @@ class DeviceInstance(InstanceResource):
         super(DeviceInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'url': payload.get('url'),
-            'unique_name': payload.get('unique_name'),
-            'friendly_name': payload.get('friendly_name'),
-            'fleet_sid': payload.get('fleet_sid'),
-            'enabled': payload.get('enabled'),
-            'account_sid': payload.get('account_sid'),
-            'identity': payload.get('identity'),
-            'deployment_sid': payload.get('deployment_sid'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'date_authenticated': deserialize.iso8601_datetime(payload.get('date_authenticated')),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -464,6 +678,15 @@ class DeviceInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the DeviceInstance
+
+        :returns: The fetched DeviceInstance
+        :rtype: twilio.rest.preview.deployed_devices.fleet.device.DeviceInstance
+        """
+        return await self._proxy.fetch_async()
+
     def delete(self):
         """
         Deletes the DeviceInstance
@@ -473,6 +696,15 @@ class DeviceInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the DeviceInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def update(self, friendly_name=values.unset, identity=values.unset,
                deployment_sid=values.unset, enabled=values.unset):
         """
@@ -493,6 +725,26 @@ class DeviceInstance(InstanceResource):
             enabled=enabled,
         )
 
+    async def update_async(self, friendly_name=values.unset, identity=values.unset,
+                           deployment_sid=values.unset, enabled=values.unset):
+        """
+        Asynchronous coroutine that updates the DeviceInstance
+
+        :param unicode friendly_name: A human readable description for this Device.
+        :param unicode identity: An identifier of the Device user.
+        :param unicode deployment_sid: The unique SID of the Deployment group.
+        :param bool enabled: The enabled
+
+        :returns: The updated DeviceInstance
+        :rtype: twilio.rest.preview.deployed_devices.fleet.device.DeviceInstance
+        """
+        return await self._proxy.update_async(
+            friendly_name=friendly_name,
+            identity=identity,
+            deployment_sid=deployment_sid,
+            enabled=enabled,
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -33,25 +33,47 @@ class KeyList(ListResource):
 
         # Path Solution
         self._solution = {'fleet_sid': fleet_sid, }
-        self._uri = '/Fleets/{fleet_sid}/Keys'.format(**self._solution)
+        self._uri = values.ResourceUri('/Fleets/{fleet_sid}/Keys', self._solution)
 
-    def create(self, friendly_name=values.unset, device_sid=values.unset):
+    def create(self, friendly_name=values.unset, device_sid=values.unset, deadline=None):
         """
         Create the KeyInstance
 
         :param unicode friendly_name: The human readable description for this Key.
         :param unicode device_sid: The unique identifier of a Key to be authenticated.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created KeyInstance
         :rtype: twilio.rest.preview.deployed_devices.fleet.key.KeyInstance
         """
         data = values.of({'FriendlyName': friendly_name, 'DeviceSid': device_sid, })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return KeyInstance(self._version, payload, fleet_sid=self._solution['fleet_sid'], )
 
-    def stream(self, device_sid=values.unset, limit=None, page_size=None):
+    async def create_async(self, friendly_name=values.unset, device_sid=values.unset,
+                           deadline=None):
+        """
+        Asynchronous coroutine that creates the KeyInstance
+
+        :param unicode friendly_name: The human readable description for this Key.
+        :param unicode device_sid: The unique identifier of a Key to be authenticated.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created KeyInstance
+        :rtype: twilio.rest.preview.deployed_devices.fleet.key.KeyInstance
+        """
+        data = values.of({'FriendlyName': friendly_name, 'DeviceSid': device_sid, })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return KeyInstance(self._version, payload, fleet_sid=self._solution['fleet_sid'], )
+
+    def stream(self, device_sid=values.unset, limit=None, page_size=None,
+               prefetch=None, raw=False, deadline=None):
         """
         Streams KeyInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -65,17 +87,59 @@ class KeyList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.preview.deployed_devices.fleet.key.KeyInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(device_sid=device_sid, page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(device_sid=device_sid, page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, device_sid=values.unset, limit=None, page_size=None):
+    async def stream_async(self, device_sid=values.unset, limit=None, page_size=None,
+                           prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams KeyInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param unicode device_sid: Find all Keys authenticating specified Device.
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.preview.deployed_devices.fleet.key.KeyInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(device_sid=device_sid, page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, device_sid=values.unset, limit=None, page_size=None,
+             prefetch=None, raw=False, deadline=None):
         """
         Lists KeyInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -88,11 +152,43 @@ class KeyList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.preview.deployed_devices.fleet.key.KeyInstance]
+        """
+        return list(self.stream(device_sid=device_sid, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, device_sid=values.unset, limit=None, page_size=None,
+                         prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists KeyInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param unicode device_sid: Find all Keys authenticating specified Device.
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.preview.deployed_devices.fleet.key.KeyInstance]
         """
-        return list(self.stream(device_sid=device_sid, limit=limit, page_size=page_size, ))
+        return [record async for record in await self.stream_async(device_sid=device_sid, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, device_sid=values.unset, page_token=values.unset,
              page_number=values.unset, page_size=values.unset):
@@ -119,6 +215,31 @@ class KeyList(ListResource):
 
         return KeyPage(self._version, response, self._solution)
 
+    async def page_async(self, device_sid=values.unset, page_token=values.unset,
+                         page_number=values.unset, page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of KeyInstance records from the API.
+        Request is executed immediately
+
+        :param unicode device_sid: Find all Keys authenticating specified Device.
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of KeyInstance
+        :rtype: twilio.rest.preview.deployed_devices.fleet.key.KeyPage
+        """
+        data = values.of({
+            'DeviceSid': device_sid,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return KeyPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of KeyInstance records from the API.
@@ -136,6 +257,23 @@ class KeyList(ListResource):
 
         return KeyPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of KeyInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of KeyInstance
+        :rtype: twilio.rest.preview.deployed_devices.fleet.key.KeyPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return KeyPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a KeyContext
@@ -230,7 +368,7 @@ class KeyContext(InstanceContext):
 
         # Path Solution
         self._solution = {'fleet_sid': fleet_sid, 'sid': sid, }
-        self._uri = '/Fleets/{fleet_sid}/Keys/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Fleets/{fleet_sid}/Keys/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -248,6 +386,22 @@ class KeyContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the KeyInstance
+
+        :returns: The fetched KeyInstance
+        :rtype: twilio.rest.preview.deployed_devices.fleet.key.KeyInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return KeyInstance(
+            self._version,
+            payload,
+            fleet_sid=self._solution['fleet_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self):
         """
         Deletes the KeyInstance
@@ -257,6 +411,15 @@ class KeyContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the KeyInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def update(self, friendly_name=values.unset, device_sid=values.unset):
         """
         Update the KeyInstance
@@ -278,6 +441,27 @@ class KeyContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, friendly_name=values.unset, device_sid=values.unset):
+        """
+        Asynchronous coroutine that updates the KeyInstance
+
+        :param unicode friendly_name: The human readable description for this Key.
+        :param unicode device_sid: The unique identifier of a Key to be authenticated.
+
+        :returns: The updated KeyInstance
+        :rtype: twilio.rest.preview.deployed_devices.fleet.key.KeyInstance
+        """
+        data = values.of({'FriendlyName': friendly_name, 'DeviceSid': device_sid, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return KeyInstance(
+            self._version,
+            payload,
+            fleet_sid=self._solution['fleet_sid'],
+            sid=self._solution['sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -294,6 +478,27 @@ class KeyInstance(InstanceResource):
     to change. Use them with caution. If you currently do not have developer
     preview access, please contact help@twilio.com. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'url': 'url',
+        'friendly_name': 'friendly_name',
+        'fleet_sid': 'fleet_sid',
+        'account_sid': 'account_sid',
+        'device_sid': 'device_sid',
+        'secret': 'secret',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+    }, _deserializers)
+
     def __init__(self, version, payload, fleet_sid, sid=None):
         """
         Initialize the KeyInstance
@@ -304,17 +509,7 @@ class KeyInstance(InstanceResource):
         super(KeyInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'url': payload.get('url'),
-            'friendly_name': payload.get('friendly_name'),
-            'fleet_sid': payload.get('fleet_sid'),
-            'account_sid': payload.get('account_sid'),
-            'device_sid': payload.get('device_sid'),
-            'secret': payload.get('secret'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -418,6 +613,15 @@ class KeyInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the KeyInstance
+
+        :returns: The fetched KeyInstance
+        :rtype: twilio.rest.preview.deployed_devices.fleet.key.KeyInstance
+        """
+        return await self._proxy.fetch_async()
+
     def delete(self):
         """
         Deletes the KeyInstance
@@ -427,6 +631,15 @@ class KeyInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the KeyInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def update(self, friendly_name=values.unset, device_sid=values.unset):
         """
         Update the KeyInstance
@@ -439,6 +652,18 @@ class KeyInstance(InstanceResource):
         """
         return self._proxy.update(friendly_name=friendly_name, device_sid=device_sid, )
 
+    async def update_async(self, friendly_name=values.unset, device_sid=values.unset):
+        """
+        Asynchronous coroutine that updates the KeyInstance
+
+        :param unicode friendly_name: The human readable description for this Key.
+        :param unicode device_sid: The unique identifier of a Key to be authenticated.
+
+        :returns: The updated KeyInstance
+        :rtype: twilio.rest.preview.deployed_devices.fleet.key.KeyInstance
+        """
+        return await self._proxy.update_async(friendly_name=friendly_name, device_sid=device_sid, )
+
     def __repr__(self):
         """
         Provide a friendly representation
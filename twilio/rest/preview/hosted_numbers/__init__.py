@@ -6,9 +6,9 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base.version import Version
-from twilio.rest.preview.hosted_numbers.authorization_document import AuthorizationDocumentList
-from twilio.rest.preview.hosted_numbers.hosted_number_order import HostedNumberOrderList
 
 
 class HostedNumbers(Version):
@@ -31,6 +31,7 @@ class HostedNumbers(Version):
         :rtype: twilio.rest.preview.hosted_numbers.authorization_document.AuthorizationDocumentList
         """
         if self._authorization_documents is None:
+            from twilio.rest.preview.hosted_numbers.authorization_document import AuthorizationDocumentList
             self._authorization_documents = AuthorizationDocumentList(self)
         return self._authorization_documents
 
@@ -40,6 +41,7 @@ class HostedNumbers(Version):
         :rtype: twilio.rest.preview.hosted_numbers.hosted_number_order.HostedNumberOrderList
         """
         if self._hosted_number_orders is None:
+            from twilio.rest.preview.hosted_numbers.hosted_number_order import HostedNumberOrderList
             self._hosted_number_orders = HostedNumberOrderList(self)
         return self._hosted_number_orders
 
@@ -51,3 +53,20 @@ class HostedNumbers(Version):
         :rtype: str
         """
         return '<Twilio.Preview.HostedNumbers>'
+
+
+_LAZY_IMPORTS = {
+    'AuthorizationDocumentList': 'twilio.rest.preview.hosted_numbers.authorization_document',
+    'HostedNumberOrderList': 'twilio.rest.preview.hosted_numbers.hosted_number_order',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
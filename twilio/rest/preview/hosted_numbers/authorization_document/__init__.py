@@ -6,6 +6,8 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import serialize
 from twilio.base import values
@@ -13,7 +15,6 @@ from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.preview.hosted_numbers.authorization_document.dependent_hosted_number_order import DependentHostedNumberOrderList
 
 
 class AuthorizationDocumentList(ListResource):
@@ -34,10 +35,10 @@ class AuthorizationDocumentList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/AuthorizationDocuments'.format(**self._solution)
+        self._uri = values.ResourceUri('/AuthorizationDocuments', self._solution)
 
     def stream(self, email=values.unset, status=values.unset, limit=None,
-               page_size=None):
+               page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams AuthorizationDocumentInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -52,18 +53,60 @@ class AuthorizationDocumentList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.preview.hosted_numbers.authorization_document.AuthorizationDocumentInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(email=email, status=status, page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(email=email, status=status, page_size=limits['page_size'], )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-        return self._version.stream(page, limits['limit'])
+    async def stream_async(self, email=values.unset, status=values.unset, limit=None,
+                           page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams AuthorizationDocumentInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param unicode email: Email.
+        :param AuthorizationDocumentInstance.Status status: The Status of this AuthorizationDocument.
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.preview.hosted_numbers.authorization_document.AuthorizationDocumentInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(email=email, status=status, page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, email=values.unset, status=values.unset, limit=None,
-             page_size=None):
+             page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists AuthorizationDocumentInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -77,11 +120,44 @@ class AuthorizationDocumentList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.preview.hosted_numbers.authorization_document.AuthorizationDocumentInstance]
         """
-        return list(self.stream(email=email, status=status, limit=limit, page_size=page_size, ))
+        return list(self.stream(email=email, status=status, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, email=values.unset, status=values.unset, limit=None,
+                         page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists AuthorizationDocumentInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param unicode email: Email.
+        :param AuthorizationDocumentInstance.Status status: The Status of this AuthorizationDocument.
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.preview.hosted_numbers.authorization_document.AuthorizationDocumentInstance]
+        """
+        return [record async for record in await self.stream_async(email=email, status=status, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, email=values.unset, status=values.unset, page_token=values.unset,
              page_number=values.unset, page_size=values.unset):
@@ -110,6 +186,33 @@ class AuthorizationDocumentList(ListResource):
 
         return AuthorizationDocumentPage(self._version, response, self._solution)
 
+    async def page_async(self, email=values.unset, status=values.unset, page_token=values.unset,
+                         page_number=values.unset, page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of AuthorizationDocumentInstance records from the API.
+        Request is executed immediately
+
+        :param unicode email: Email.
+        :param AuthorizationDocumentInstance.Status status: The Status of this AuthorizationDocument.
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of AuthorizationDocumentInstance
+        :rtype: twilio.rest.preview.hosted_numbers.authorization_document.AuthorizationDocumentPage
+        """
+        data = values.of({
+            'Email': email,
+            'Status': status,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return AuthorizationDocumentPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of AuthorizationDocumentInstance records from the API.
@@ -127,8 +230,25 @@ class AuthorizationDocumentList(ListResource):
 
         return AuthorizationDocumentPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of AuthorizationDocumentInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of AuthorizationDocumentInstance
+        :rtype: twilio.rest.preview.hosted_numbers.authorization_document.AuthorizationDocumentPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return AuthorizationDocumentPage(self._version, response, self._solution)
+
     def create(self, hosted_number_order_sids, address_sid, email, contact_title,
-               contact_phone_number, cc_emails=values.unset):
+               contact_phone_number, cc_emails=values.unset, deadline=None):
         """
         Create the AuthorizationDocumentInstance
 
@@ -138,6 +258,38 @@ class AuthorizationDocumentList(ListResource):
         :param unicode contact_title: Title of signee of this Authorization Document.
         :param unicode contact_phone_number: Authorization Document's signee's phone number.
         :param list[unicode] cc_emails: A list of emails.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created AuthorizationDocumentInstance
+        :rtype: twilio.rest.preview.hosted_numbers.authorization_document.AuthorizationDocumentInstance
+        """
+        data = values.of({
+            'HostedNumberOrderSids': serialize.map(hosted_number_order_sids, lambda e: e),
+            'AddressSid': address_sid,
+            'Email': email,
+            'ContactTitle': contact_title,
+            'ContactPhoneNumber': contact_phone_number,
+            'CcEmails': serialize.map(cc_emails, lambda e: e),
+        })
+
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return AuthorizationDocumentInstance(self._version, payload, )
+
+    async def create_async(self, hosted_number_order_sids, address_sid, email, contact_title,
+                           contact_phone_number, cc_emails=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the AuthorizationDocumentInstance
+
+        :param list[unicode] hosted_number_order_sids: A list of HostedNumberOrder sids.
+        :param unicode address_sid: Address sid.
+        :param unicode email: Email.
+        :param unicode contact_title: Title of signee of this Authorization Document.
+        :param unicode contact_phone_number: Authorization Document's signee's phone number.
+        :param list[unicode] cc_emails: A list of emails.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created AuthorizationDocumentInstance
         :rtype: twilio.rest.preview.hosted_numbers.authorization_document.AuthorizationDocumentInstance
@@ -151,7 +303,7 @@ class AuthorizationDocumentList(ListResource):
             'CcEmails': serialize.map(cc_emails, lambda e: e),
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return AuthorizationDocumentInstance(self._version, payload, )
 
@@ -247,7 +399,7 @@ class AuthorizationDocumentContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/AuthorizationDocuments/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/AuthorizationDocuments/{sid}', self._solution)
 
         # Dependents
         self._dependent_hosted_number_orders = None
@@ -263,6 +415,17 @@ class AuthorizationDocumentContext(InstanceContext):
 
         return AuthorizationDocumentInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the AuthorizationDocumentInstance
+
+        :returns: The fetched AuthorizationDocumentInstance
+        :rtype: twilio.rest.preview.hosted_numbers.authorization_document.AuthorizationDocumentInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return AuthorizationDocumentInstance(self._version, payload, sid=self._solution['sid'], )
+
     def update(self, hosted_number_order_sids=values.unset,
                address_sid=values.unset, email=values.unset, cc_emails=values.unset,
                status=values.unset, contact_title=values.unset,
@@ -295,6 +458,38 @@ class AuthorizationDocumentContext(InstanceContext):
 
         return AuthorizationDocumentInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def update_async(self, hosted_number_order_sids=values.unset,
+                           address_sid=values.unset, email=values.unset, cc_emails=values.unset,
+                           status=values.unset, contact_title=values.unset,
+                           contact_phone_number=values.unset):
+        """
+        Asynchronous coroutine that updates the AuthorizationDocumentInstance
+
+        :param list[unicode] hosted_number_order_sids: A list of HostedNumberOrder sids.
+        :param unicode address_sid: Address sid.
+        :param unicode email: Email.
+        :param list[unicode] cc_emails: A list of emails.
+        :param AuthorizationDocumentInstance.Status status: The Status of this AuthorizationDocument.
+        :param unicode contact_title: Title of signee of this Authorization Document.
+        :param unicode contact_phone_number: Authorization Document's signee's phone number.
+
+        :returns: The updated AuthorizationDocumentInstance
+        :rtype: twilio.rest.preview.hosted_numbers.authorization_document.AuthorizationDocumentInstance
+        """
+        data = values.of({
+            'HostedNumberOrderSids': serialize.map(hosted_number_order_sids, lambda e: e),
+            'AddressSid': address_sid,
+            'Email': email,
+            'CcEmails': serialize.map(cc_emails, lambda e: e),
+            'Status': status,
+            'ContactTitle': contact_title,
+            'ContactPhoneNumber': contact_phone_number,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return AuthorizationDocumentInstance(self._version, payload, sid=self._solution['sid'], )
+
     @property
     def dependent_hosted_number_orders(self):
         """
@@ -304,6 +499,7 @@ class AuthorizationDocumentContext(InstanceContext):
         :rtype: twilio.rest.preview.hosted_numbers.authorization_document.dependent_hosted_number_order.DependentHostedNumberOrderList
         """
         if self._dependent_hosted_number_orders is None:
+            from twilio.rest.preview.hosted_numbers.authorization_document.dependent_hosted_number_order import DependentHostedNumberOrderList
             self._dependent_hosted_number_orders = DependentHostedNumberOrderList(
                 self._version,
                 signing_document_sid=self._solution['sid'],
@@ -333,6 +529,27 @@ class AuthorizationDocumentInstance(InstanceResource):
         CANCELED = "canceled"
         FAILED = "failed"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'address_sid': 'address_sid',
+        'status': 'status',
+        'email': 'email',
+        'cc_emails': 'cc_emails',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'url': 'url',
+        'links': 'links',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the AuthorizationDocumentInstance
@@ -343,17 +560,7 @@ class AuthorizationDocumentInstance(InstanceResource):
         super(AuthorizationDocumentInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'address_sid': payload.get('address_sid'),
-            'status': payload.get('status'),
-            'email': payload.get('email'),
-            'cc_emails': payload.get('cc_emails'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -453,6 +660,15 @@ class AuthorizationDocumentInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the AuthorizationDocumentInstance
+
+        :returns: The fetched AuthorizationDocumentInstance
+        :rtype: twilio.rest.preview.hosted_numbers.authorization_document.AuthorizationDocumentInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, hosted_number_order_sids=values.unset,
                address_sid=values.unset, email=values.unset, cc_emails=values.unset,
                status=values.unset, contact_title=values.unset,
@@ -481,6 +697,34 @@ class AuthorizationDocumentInstance(InstanceResource):
             contact_phone_number=contact_phone_number,
         )
 
+    async def update_async(self, hosted_number_order_sids=values.unset,
+                           address_sid=values.unset, email=values.unset, cc_emails=values.unset,
+                           status=values.unset, contact_title=values.unset,
+                           contact_phone_number=values.unset):
+        """
+        Asynchronous coroutine that updates the AuthorizationDocumentInstance
+
+        :param list[unicode] hosted_number_order_sids: A list of HostedNumberOrder sids.
+        :param unicode address_sid: Address sid.
+        :param unicode email: Email.
+        :param list[unicode] cc_emails: A list of emails.
+        :param AuthorizationDocumentInstance.Status status: The Status of this AuthorizationDocument.
+        :param unicode contact_title: Title of signee of this Authorization Document.
+        :param unicode contact_phone_number: Authorization Document's signee's phone number.
+
+        :returns: The updated AuthorizationDocumentInstance
+        :rtype: twilio.rest.preview.hosted_numbers.authorization_document.AuthorizationDocumentInstance
+        """
+        return await self._proxy.update_async(
+            hosted_number_order_sids=hosted_number_order_sids,
+            address_sid=address_sid,
+            email=email,
+            cc_emails=cc_emails,
+            status=status,
+            contact_title=contact_title,
+            contact_phone_number=contact_phone_number,
+        )
+
     @property
     def dependent_hosted_number_orders(self):
         """
@@ -500,3 +744,19 @@ class AuthorizationDocumentInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Preview.HostedNumbers.AuthorizationDocumentInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'DependentHostedNumberOrderList': 'twilio.rest.preview.hosted_numbers.authorization_document.dependent_hosted_number_order',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
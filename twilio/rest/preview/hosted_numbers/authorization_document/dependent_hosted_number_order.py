@@ -32,11 +32,12 @@ class DependentHostedNumberOrderList(ListResource):
 
         # Path Solution
         self._solution = {'signing_document_sid': signing_document_sid, }
-        self._uri = '/AuthorizationDocuments/{signing_document_sid}/DependentHostedNumberOrders'.format(**self._solution)
+        self._uri = values.ResourceUri('/AuthorizationDocuments/{signing_document_sid}/DependentHostedNumberOrders', self._solution)
 
     def stream(self, status=values.unset, phone_number=values.unset,
                incoming_phone_number_sid=values.unset, friendly_name=values.unset,
-               unique_name=values.unset, limit=None, page_size=None):
+               unique_name=values.unset, limit=None, page_size=None,
+               prefetch=None, raw=False, deadline=None):
         """
         Streams DependentHostedNumberOrderInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -54,26 +55,81 @@ class DependentHostedNumberOrderList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.preview.hosted_numbers.authorization_document.dependent_hosted_number_order.DependentHostedNumberOrderInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
-            status=status,
-            phone_number=phone_number,
-            incoming_phone_number_sid=incoming_phone_number_sid,
-            friendly_name=friendly_name,
-            unique_name=unique_name,
-            page_size=limits['page_size'],
-        )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                status=status,
+                phone_number=phone_number,
+                incoming_phone_number_sid=incoming_phone_number_sid,
+                friendly_name=friendly_name,
+                unique_name=unique_name,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, status=values.unset, phone_number=values.unset,
+                           incoming_phone_number_sid=values.unset, friendly_name=values.unset,
+                           unique_name=values.unset, limit=None, page_size=None,
+                           prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams DependentHostedNumberOrderInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param DependentHostedNumberOrderInstance.Status status: The Status of this HostedNumberOrder.
+        :param unicode phone_number: An E164 formatted phone number.
+        :param unicode incoming_phone_number_sid: IncomingPhoneNumber sid.
+        :param unicode friendly_name: A human readable description of this resource.
+        :param unicode unique_name: A unique, developer assigned name of this HostedNumberOrder.
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.preview.hosted_numbers.authorization_document.dependent_hosted_number_order.DependentHostedNumberOrderInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                status=status,
+                phone_number=phone_number,
+                incoming_phone_number_sid=incoming_phone_number_sid,
+                friendly_name=friendly_name,
+                unique_name=unique_name,
+                page_size=limits['page_size'],
+            )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, status=values.unset, phone_number=values.unset,
              incoming_phone_number_sid=values.unset, friendly_name=values.unset,
-             unique_name=values.unset, limit=None, page_size=None):
+             unique_name=values.unset, limit=None, page_size=None,
+             prefetch=None, raw=False, deadline=None):
         """
         Lists DependentHostedNumberOrderInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -90,6 +146,12 @@ class DependentHostedNumberOrderList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.preview.hosted_numbers.authorization_document.dependent_hosted_number_order.DependentHostedNumberOrderInstance]
@@ -102,8 +164,54 @@ class DependentHostedNumberOrderList(ListResource):
             unique_name=unique_name,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, status=values.unset, phone_number=values.unset,
+                         incoming_phone_number_sid=values.unset, friendly_name=values.unset,
+                         unique_name=values.unset, limit=None, page_size=None,
+                         prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists DependentHostedNumberOrderInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param DependentHostedNumberOrderInstance.Status status: The Status of this HostedNumberOrder.
+        :param unicode phone_number: An E164 formatted phone number.
+        :param unicode incoming_phone_number_sid: IncomingPhoneNumber sid.
+        :param unicode friendly_name: A human readable description of this resource.
+        :param unicode unique_name: A unique, developer assigned name of this HostedNumberOrder.
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.preview.hosted_numbers.authorization_document.dependent_hosted_number_order.DependentHostedNumberOrderInstance]
+        """
+        return [record async for record in await self.stream_async(
+            status=status,
+            phone_number=phone_number,
+            incoming_phone_number_sid=incoming_phone_number_sid,
+            friendly_name=friendly_name,
+            unique_name=unique_name,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, status=values.unset, phone_number=values.unset,
              incoming_phone_number_sid=values.unset, friendly_name=values.unset,
              unique_name=values.unset, page_token=values.unset,
@@ -139,6 +247,41 @@ class DependentHostedNumberOrderList(ListResource):
 
         return DependentHostedNumberOrderPage(self._version, response, self._solution)
 
+    async def page_async(self, status=values.unset, phone_number=values.unset,
+                         incoming_phone_number_sid=values.unset, friendly_name=values.unset,
+                         unique_name=values.unset, page_token=values.unset,
+                         page_number=values.unset, page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of DependentHostedNumberOrderInstance records from the API.
+        Request is executed immediately
+
+        :param DependentHostedNumberOrderInstance.Status status: The Status of this HostedNumberOrder.
+        :param unicode phone_number: An E164 formatted phone number.
+        :param unicode incoming_phone_number_sid: IncomingPhoneNumber sid.
+        :param unicode friendly_name: A human readable description of this resource.
+        :param unicode unique_name: A unique, developer assigned name of this HostedNumberOrder.
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of DependentHostedNumberOrderInstance
+        :rtype: twilio.rest.preview.hosted_numbers.authorization_document.dependent_hosted_number_order.DependentHostedNumberOrderPage
+        """
+        data = values.of({
+            'Status': status,
+            'PhoneNumber': phone_number,
+            'IncomingPhoneNumberSid': incoming_phone_number_sid,
+            'FriendlyName': friendly_name,
+            'UniqueName': unique_name,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return DependentHostedNumberOrderPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of DependentHostedNumberOrderInstance records from the API.
@@ -156,6 +299,23 @@ class DependentHostedNumberOrderList(ListResource):
 
         return DependentHostedNumberOrderPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of DependentHostedNumberOrderInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of DependentHostedNumberOrderInstance
+        :rtype: twilio.rest.preview.hosted_numbers.authorization_document.dependent_hosted_number_order.DependentHostedNumberOrderPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return DependentHostedNumberOrderPage(self._version, response, self._solution)
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -232,6 +392,42 @@ class DependentHostedNumberOrderInstance(InstanceResource):
         PHONE_CALL = "phone-call"
         PHONE_BILL = "phone-bill"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+        'verification_attempts': deserialize.integer,
+        'call_delay': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'incoming_phone_number_sid': 'incoming_phone_number_sid',
+        'address_sid': 'address_sid',
+        'signing_document_sid': 'signing_document_sid',
+        'phone_number': 'phone_number',
+        'capabilities': 'capabilities',
+        'friendly_name': 'friendly_name',
+        'unique_name': 'unique_name',
+        'status': 'status',
+        'failure_reason': 'failure_reason',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'verification_attempts': 'verification_attempts',
+        'email': 'email',
+        'cc_emails': 'cc_emails',
+        'verification_type': 'verification_type',
+        'verification_document_sid': 'verification_document_sid',
+        'extension': 'extension',
+        'call_delay': 'call_delay',
+        'verification_code': 'verification_code',
+        'verification_call_sids': 'verification_call_sids',
+    }, _deserializers)
+
     def __init__(self, version, payload, signing_document_sid):
         """
         Initialize the DependentHostedNumberOrderInstance
@@ -242,30 +438,7 @@ class DependentHostedNumberOrderInstance(InstanceResource):
         super(DependentHostedNumberOrderInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'incoming_phone_number_sid': payload.get('incoming_phone_number_sid'),
-            'address_sid': payload.get('address_sid'),
-            'signing_document_sid': payload.get('signing_document_sid'),
-            'phone_number': payload.get('phone_number'),
-            'capabilities': payload.get('capabilities'),
-            'friendly_name': payload.get('friendly_name'),
-            'unique_name': payload.get('unique_name'),
-            'status': payload.get('status'),
-            'failure_reason': payload.get('failure_reason'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'verification_attempts': deserialize.integer(payload.get('verification_attempts')),
-            'email': payload.get('email'),
-            'cc_emails': payload.get('cc_emails'),
-            'verification_type': payload.get('verification_type'),
-            'verification_document_sid': payload.get('verification_document_sid'),
-            'extension': payload.get('extension'),
-            'call_delay': deserialize.integer(payload.get('call_delay')),
-            'verification_code': payload.get('verification_code'),
-            'verification_call_sids': payload.get('verification_call_sids'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -33,11 +33,12 @@ class HostedNumberOrderList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/HostedNumberOrders'.format(**self._solution)
+        self._uri = values.ResourceUri('/HostedNumberOrders', self._solution)
 
     def stream(self, status=values.unset, phone_number=values.unset,
                incoming_phone_number_sid=values.unset, friendly_name=values.unset,
-               unique_name=values.unset, limit=None, page_size=None):
+               unique_name=values.unset, limit=None, page_size=None,
+               prefetch=None, raw=False, deadline=None):
         """
         Streams HostedNumberOrderInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -55,26 +56,81 @@ class HostedNumberOrderList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.preview.hosted_numbers.hosted_number_order.HostedNumberOrderInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
-            status=status,
-            phone_number=phone_number,
-            incoming_phone_number_sid=incoming_phone_number_sid,
-            friendly_name=friendly_name,
-            unique_name=unique_name,
-            page_size=limits['page_size'],
-        )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                status=status,
+                phone_number=phone_number,
+                incoming_phone_number_sid=incoming_phone_number_sid,
+                friendly_name=friendly_name,
+                unique_name=unique_name,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, status=values.unset, phone_number=values.unset,
+                           incoming_phone_number_sid=values.unset, friendly_name=values.unset,
+                           unique_name=values.unset, limit=None, page_size=None,
+                           prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams HostedNumberOrderInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
 
-        return self._version.stream(page, limits['limit'])
+        :param HostedNumberOrderInstance.Status status: The Status of this HostedNumberOrder.
+        :param unicode phone_number: An E164 formatted phone number.
+        :param unicode incoming_phone_number_sid: IncomingPhoneNumber sid.
+        :param unicode friendly_name: A human readable description of this resource.
+        :param unicode unique_name: A unique, developer assigned name of this HostedNumberOrder.
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.preview.hosted_numbers.hosted_number_order.HostedNumberOrderInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                status=status,
+                phone_number=phone_number,
+                incoming_phone_number_sid=incoming_phone_number_sid,
+                friendly_name=friendly_name,
+                unique_name=unique_name,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, status=values.unset, phone_number=values.unset,
              incoming_phone_number_sid=values.unset, friendly_name=values.unset,
-             unique_name=values.unset, limit=None, page_size=None):
+             unique_name=values.unset, limit=None, page_size=None,
+             prefetch=None, raw=False, deadline=None):
         """
         Lists HostedNumberOrderInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -91,6 +147,12 @@ class HostedNumberOrderList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.preview.hosted_numbers.hosted_number_order.HostedNumberOrderInstance]
@@ -103,8 +165,54 @@ class HostedNumberOrderList(ListResource):
             unique_name=unique_name,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, status=values.unset, phone_number=values.unset,
+                         incoming_phone_number_sid=values.unset, friendly_name=values.unset,
+                         unique_name=values.unset, limit=None, page_size=None,
+                         prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists HostedNumberOrderInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param HostedNumberOrderInstance.Status status: The Status of this HostedNumberOrder.
+        :param unicode phone_number: An E164 formatted phone number.
+        :param unicode incoming_phone_number_sid: IncomingPhoneNumber sid.
+        :param unicode friendly_name: A human readable description of this resource.
+        :param unicode unique_name: A unique, developer assigned name of this HostedNumberOrder.
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.preview.hosted_numbers.hosted_number_order.HostedNumberOrderInstance]
+        """
+        return [record async for record in await self.stream_async(
+            status=status,
+            phone_number=phone_number,
+            incoming_phone_number_sid=incoming_phone_number_sid,
+            friendly_name=friendly_name,
+            unique_name=unique_name,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, status=values.unset, phone_number=values.unset,
              incoming_phone_number_sid=values.unset, friendly_name=values.unset,
              unique_name=values.unset, page_token=values.unset,
@@ -140,6 +248,41 @@ class HostedNumberOrderList(ListResource):
 
         return HostedNumberOrderPage(self._version, response, self._solution)
 
+    async def page_async(self, status=values.unset, phone_number=values.unset,
+                         incoming_phone_number_sid=values.unset, friendly_name=values.unset,
+                         unique_name=values.unset, page_token=values.unset,
+                         page_number=values.unset, page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of HostedNumberOrderInstance records from the API.
+        Request is executed immediately
+
+        :param HostedNumberOrderInstance.Status status: The Status of this HostedNumberOrder.
+        :param unicode phone_number: An E164 formatted phone number.
+        :param unicode incoming_phone_number_sid: IncomingPhoneNumber sid.
+        :param unicode friendly_name: A human readable description of this resource.
+        :param unicode unique_name: A unique, developer assigned name of this HostedNumberOrder.
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of HostedNumberOrderInstance
+        :rtype: twilio.rest.preview.hosted_numbers.hosted_number_order.HostedNumberOrderPage
+        """
+        data = values.of({
+            'Status': status,
+            'PhoneNumber': phone_number,
+            'IncomingPhoneNumberSid': incoming_phone_number_sid,
+            'FriendlyName': friendly_name,
+            'UniqueName': unique_name,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return HostedNumberOrderPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of HostedNumberOrderInstance records from the API.
@@ -157,6 +300,23 @@ class HostedNumberOrderList(ListResource):
 
         return HostedNumberOrderPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of HostedNumberOrderInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of HostedNumberOrderInstance
+        :rtype: twilio.rest.preview.hosted_numbers.hosted_number_order.HostedNumberOrderPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return HostedNumberOrderPage(self._version, response, self._solution)
+
     def create(self, phone_number, sms_capability, account_sid=values.unset,
                friendly_name=values.unset, unique_name=values.unset,
                cc_emails=values.unset, sms_url=values.unset,
@@ -165,7 +325,7 @@ class HostedNumberOrderList(ListResource):
                status_callback_method=values.unset,
                sms_application_sid=values.unset, address_sid=values.unset,
                email=values.unset, verification_type=values.unset,
-               verification_document_sid=values.unset):
+               verification_document_sid=values.unset, deadline=None):
         """
         Create the HostedNumberOrderInstance
 
@@ -186,6 +346,8 @@ class HostedNumberOrderList(ListResource):
         :param unicode email: Email.
         :param HostedNumberOrderInstance.VerificationType verification_type: Verification Type.
         :param unicode verification_document_sid: Verification Document Sid
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created HostedNumberOrderInstance
         :rtype: twilio.rest.preview.hosted_numbers.hosted_number_order.HostedNumberOrderInstance
@@ -210,7 +372,66 @@ class HostedNumberOrderList(ListResource):
             'VerificationDocumentSid': verification_document_sid,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return HostedNumberOrderInstance(self._version, payload, )
+
+    async def create_async(self, phone_number, sms_capability, account_sid=values.unset,
+                           friendly_name=values.unset, unique_name=values.unset,
+                           cc_emails=values.unset, sms_url=values.unset,
+                           sms_method=values.unset, sms_fallback_url=values.unset,
+                           sms_fallback_method=values.unset, status_callback_url=values.unset,
+                           status_callback_method=values.unset,
+                           sms_application_sid=values.unset, address_sid=values.unset,
+                           email=values.unset, verification_type=values.unset,
+                           verification_document_sid=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the HostedNumberOrderInstance
+
+        :param unicode phone_number: An E164 formatted phone number.
+        :param bool sms_capability: Specify SMS capability to host.
+        :param unicode account_sid: Account Sid.
+        :param unicode friendly_name: A human readable description of this resource.
+        :param unicode unique_name: A unique, developer assigned name of this HostedNumberOrder.
+        :param list[unicode] cc_emails: A list of emails.
+        :param unicode sms_url: SMS URL.
+        :param unicode sms_method: SMS Method.
+        :param unicode sms_fallback_url: SMS Fallback URL.
+        :param unicode sms_fallback_method: SMS Fallback Method.
+        :param unicode status_callback_url: Status Callback URL.
+        :param unicode status_callback_method: Status Callback Method.
+        :param unicode sms_application_sid: SMS Application Sid.
+        :param unicode address_sid: Address sid.
+        :param unicode email: Email.
+        :param HostedNumberOrderInstance.VerificationType verification_type: Verification Type.
+        :param unicode verification_document_sid: Verification Document Sid
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created HostedNumberOrderInstance
+        :rtype: twilio.rest.preview.hosted_numbers.hosted_number_order.HostedNumberOrderInstance
+        """
+        data = values.of({
+            'PhoneNumber': phone_number,
+            'SmsCapability': sms_capability,
+            'AccountSid': account_sid,
+            'FriendlyName': friendly_name,
+            'UniqueName': unique_name,
+            'CcEmails': serialize.map(cc_emails, lambda e: e),
+            'SmsUrl': sms_url,
+            'SmsMethod': sms_method,
+            'SmsFallbackUrl': sms_fallback_url,
+            'SmsFallbackMethod': sms_fallback_method,
+            'StatusCallbackUrl': status_callback_url,
+            'StatusCallbackMethod': status_callback_method,
+            'SmsApplicationSid': sms_application_sid,
+            'AddressSid': address_sid,
+            'Email': email,
+            'VerificationType': verification_type,
+            'VerificationDocumentSid': verification_document_sid,
+        })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return HostedNumberOrderInstance(self._version, payload, )
 
@@ -306,7 +527,7 @@ class HostedNumberOrderContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/HostedNumberOrders/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/HostedNumberOrders/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -319,6 +540,17 @@ class HostedNumberOrderContext(InstanceContext):
 
         return HostedNumberOrderInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the HostedNumberOrderInstance
+
+        :returns: The fetched HostedNumberOrderInstance
+        :rtype: twilio.rest.preview.hosted_numbers.hosted_number_order.HostedNumberOrderInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return HostedNumberOrderInstance(self._version, payload, sid=self._solution['sid'], )
+
     def delete(self):
         """
         Deletes the HostedNumberOrderInstance
@@ -328,6 +560,15 @@ class HostedNumberOrderContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the HostedNumberOrderInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def update(self, friendly_name=values.unset, unique_name=values.unset,
                email=values.unset, cc_emails=values.unset, status=values.unset,
                verification_code=values.unset, verification_type=values.unset,
@@ -367,6 +608,45 @@ class HostedNumberOrderContext(InstanceContext):
 
         return HostedNumberOrderInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def update_async(self, friendly_name=values.unset, unique_name=values.unset,
+                           email=values.unset, cc_emails=values.unset, status=values.unset,
+                           verification_code=values.unset, verification_type=values.unset,
+                           verification_document_sid=values.unset, extension=values.unset,
+                           call_delay=values.unset):
+        """
+        Asynchronous coroutine that updates the HostedNumberOrderInstance
+
+        :param unicode friendly_name: A human readable description of this resource.
+        :param unicode unique_name: A unique, developer assigned name of this HostedNumberOrder.
+        :param unicode email: Email.
+        :param list[unicode] cc_emails: A list of emails.
+        :param HostedNumberOrderInstance.Status status: The Status of this HostedNumberOrder.
+        :param unicode verification_code: A verification code.
+        :param HostedNumberOrderInstance.VerificationType verification_type: Verification Type.
+        :param unicode verification_document_sid: Verification Document Sid
+        :param unicode extension: Digits to dial after connecting the verification call.
+        :param unicode call_delay: The number of seconds, between 0 and 60, to delay before initiating the verification call.
+
+        :returns: The updated HostedNumberOrderInstance
+        :rtype: twilio.rest.preview.hosted_numbers.hosted_number_order.HostedNumberOrderInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'UniqueName': unique_name,
+            'Email': email,
+            'CcEmails': serialize.map(cc_emails, lambda e: e),
+            'Status': status,
+            'VerificationCode': verification_code,
+            'VerificationType': verification_type,
+            'VerificationDocumentSid': verification_document_sid,
+            'Extension': extension,
+            'CallDelay': call_delay,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return HostedNumberOrderInstance(self._version, payload, sid=self._solution['sid'], )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -398,6 +678,43 @@ class HostedNumberOrderInstance(InstanceResource):
         PHONE_CALL = "phone-call"
         PHONE_BILL = "phone-bill"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+        'verification_attempts': deserialize.integer,
+        'call_delay': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'incoming_phone_number_sid': 'incoming_phone_number_sid',
+        'address_sid': 'address_sid',
+        'signing_document_sid': 'signing_document_sid',
+        'phone_number': 'phone_number',
+        'capabilities': 'capabilities',
+        'friendly_name': 'friendly_name',
+        'unique_name': 'unique_name',
+        'status': 'status',
+        'failure_reason': 'failure_reason',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'verification_attempts': 'verification_attempts',
+        'email': 'email',
+        'cc_emails': 'cc_emails',
+        'url': 'url',
+        'verification_type': 'verification_type',
+        'verification_document_sid': 'verification_document_sid',
+        'extension': 'extension',
+        'call_delay': 'call_delay',
+        'verification_code': 'verification_code',
+        'verification_call_sids': 'verification_call_sids',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the HostedNumberOrderInstance
@@ -408,31 +725,7 @@ class HostedNumberOrderInstance(InstanceResource):
         super(HostedNumberOrderInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'incoming_phone_number_sid': payload.get('incoming_phone_number_sid'),
-            'address_sid': payload.get('address_sid'),
-            'signing_document_sid': payload.get('signing_document_sid'),
-            'phone_number': payload.get('phone_number'),
-            'capabilities': payload.get('capabilities'),
-            'friendly_name': payload.get('friendly_name'),
-            'unique_name': payload.get('unique_name'),
-            'status': payload.get('status'),
-            'failure_reason': payload.get('failure_reason'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'verification_attempts': deserialize.integer(payload.get('verification_attempts')),
-            'email': payload.get('email'),
-            'cc_emails': payload.get('cc_emails'),
-            'url': payload.get('url'),
-            'verification_type': payload.get('verification_type'),
-            'verification_document_sid': payload.get('verification_document_sid'),
-            'extension': payload.get('extension'),
-            'call_delay': deserialize.integer(payload.get('call_delay')),
-            'verification_code': payload.get('verification_code'),
-            'verification_call_sids': payload.get('verification_call_sids'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -644,6 +937,15 @@ class HostedNumberOrderInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the HostedNumberOrderInstance
+
+        :returns: The fetched HostedNumberOrderInstance
+        :rtype: twilio.rest.preview.hosted_numbers.hosted_number_order.HostedNumberOrderInstance
+        """
+        return await self._proxy.fetch_async()
+
     def delete(self):
         """
         Deletes the HostedNumberOrderInstance
@@ -653,6 +955,15 @@ class HostedNumberOrderInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the HostedNumberOrderInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def update(self, friendly_name=values.unset, unique_name=values.unset,
                email=values.unset, cc_emails=values.unset, status=values.unset,
                verification_code=values.unset, verification_type=values.unset,
@@ -688,6 +999,41 @@ class HostedNumberOrderInstance(InstanceResource):
             call_delay=call_delay,
         )
 
+    async def update_async(self, friendly_name=values.unset, unique_name=values.unset,
+                           email=values.unset, cc_emails=values.unset, status=values.unset,
+                           verification_code=values.unset, verification_type=values.unset,
+                           verification_document_sid=values.unset, extension=values.unset,
+                           call_delay=values.unset):
+        """
+        Asynchronous coroutine that updates the HostedNumberOrderInstance
+
+        :param unicode friendly_name: A human readable description of this resource.
+        :param unicode unique_name: A unique, developer assigned name of this HostedNumberOrder.
+        :param unicode email: Email.
+        :param list[unicode] cc_emails: A list of emails.
+        :param HostedNumberOrderInstance.Status status: The Status of this HostedNumberOrder.
+        :param unicode verification_code: A verification code.
+        :param HostedNumberOrderInstance.VerificationType verification_type: Verification Type.
+        :param unicode verification_document_sid: Verification Document Sid
+        :param unicode extension: Digits to dial after connecting the verification call.
+        :param unicode call_delay: The number of seconds, between 0 and 60, to delay before initiating the verification call.
+
+        :returns: The updated HostedNumberOrderInstance
+        :rtype: twilio.rest.preview.hosted_numbers.hosted_number_order.HostedNumberOrderInstance
+        """
+        return await self._proxy.update_async(
+            friendly_name=friendly_name,
+            unique_name=unique_name,
+            email=email,
+            cc_emails=cc_emails,
+            status=status,
+            verification_code=verification_code,
+            verification_type=verification_type,
+            verification_document_sid=verification_document_sid,
+            extension=extension,
+            call_delay=call_delay,
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
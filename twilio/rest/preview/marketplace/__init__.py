@@ -6,9 +6,9 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base.version import Version
-from twilio.rest.preview.marketplace.available_add_on import AvailableAddOnList
-from twilio.rest.preview.marketplace.installed_add_on import InstalledAddOnList
 
 
 class Marketplace(Version):
@@ -31,6 +31,7 @@ class Marketplace(Version):
         :rtype: twilio.rest.preview.marketplace.available_add_on.AvailableAddOnList
         """
         if self._available_add_ons is None:
+            from twilio.rest.preview.marketplace.available_add_on import AvailableAddOnList
             self._available_add_ons = AvailableAddOnList(self)
         return self._available_add_ons
 
@@ -40,6 +41,7 @@ class Marketplace(Version):
         :rtype: twilio.rest.preview.marketplace.installed_add_on.InstalledAddOnList
         """
         if self._installed_add_ons is None:
+            from twilio.rest.preview.marketplace.installed_add_on import InstalledAddOnList
             self._installed_add_ons = InstalledAddOnList(self)
         return self._installed_add_ons
 
@@ -51,3 +53,20 @@ class Marketplace(Version):
         :rtype: str
         """
         return '<Twilio.Preview.Marketplace>'
+
+
+_LAZY_IMPORTS = {
+    'AvailableAddOnList': 'twilio.rest.preview.marketplace.available_add_on',
+    'InstalledAddOnList': 'twilio.rest.preview.marketplace.installed_add_on',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
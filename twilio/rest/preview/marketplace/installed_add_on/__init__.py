@@ -6,6 +6,8 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import serialize
 from twilio.base import values
@@ -13,7 +15,6 @@ from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.preview.marketplace.installed_add_on.installed_add_on_extension import InstalledAddOnExtensionList
 
 
 class InstalledAddOnList(ListResource):
@@ -34,10 +35,10 @@ class InstalledAddOnList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/InstalledAddOns'.format(**self._solution)
+        self._uri = values.ResourceUri('/InstalledAddOns', self._solution)
 
     def create(self, available_add_on_sid, accept_terms_of_service,
-               configuration=values.unset, unique_name=values.unset):
+               configuration=values.unset, unique_name=values.unset, deadline=None):
         """
         Create the InstalledAddOnInstance
 
@@ -45,6 +46,34 @@ class InstalledAddOnList(ListResource):
         :param bool accept_terms_of_service: Whether the Terms of Service were accepted
         :param dict configuration: The JSON object representing the configuration
         :param unicode unique_name: An application-defined string that uniquely identifies the resource
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created InstalledAddOnInstance
+        :rtype: twilio.rest.preview.marketplace.installed_add_on.InstalledAddOnInstance
+        """
+        data = values.of({
+            'AvailableAddOnSid': available_add_on_sid,
+            'AcceptTermsOfService': accept_terms_of_service,
+            'Configuration': serialize.object(configuration),
+            'UniqueName': unique_name,
+        })
+
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return InstalledAddOnInstance(self._version, payload, )
+
+    async def create_async(self, available_add_on_sid, accept_terms_of_service,
+                           configuration=values.unset, unique_name=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the InstalledAddOnInstance
+
+        :param unicode available_add_on_sid: The SID of the AvaliableAddOn to install
+        :param bool accept_terms_of_service: Whether the Terms of Service were accepted
+        :param dict configuration: The JSON object representing the configuration
+        :param unicode unique_name: An application-defined string that uniquely identifies the resource
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created InstalledAddOnInstance
         :rtype: twilio.rest.preview.marketplace.installed_add_on.InstalledAddOnInstance
@@ -56,11 +85,11 @@ class InstalledAddOnList(ListResource):
             'UniqueName': unique_name,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return InstalledAddOnInstance(self._version, payload, )
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams InstalledAddOnInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -73,17 +102,57 @@ class InstalledAddOnList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.preview.marketplace.installed_add_on.InstalledAddOnInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams InstalledAddOnInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.preview.marketplace.installed_add_on.InstalledAddOnInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists InstalledAddOnInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -95,11 +164,42 @@ class InstalledAddOnList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.preview.marketplace.installed_add_on.InstalledAddOnInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists InstalledAddOnInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.preview.marketplace.installed_add_on.InstalledAddOnInstance]
+        """
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -120,6 +220,25 @@ class InstalledAddOnList(ListResource):
 
         return InstalledAddOnPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of InstalledAddOnInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of InstalledAddOnInstance
+        :rtype: twilio.rest.preview.marketplace.installed_add_on.InstalledAddOnPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return InstalledAddOnPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of InstalledAddOnInstance records from the API.
@@ -137,6 +256,23 @@ class InstalledAddOnList(ListResource):
 
         return InstalledAddOnPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of InstalledAddOnInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of InstalledAddOnInstance
+        :rtype: twilio.rest.preview.marketplace.installed_add_on.InstalledAddOnPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return InstalledAddOnPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a InstalledAddOnContext
@@ -229,7 +365,7 @@ class InstalledAddOnContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/InstalledAddOns/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/InstalledAddOns/{sid}', self._solution)
 
         # Dependents
         self._extensions = None
@@ -243,6 +379,15 @@ class InstalledAddOnContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the InstalledAddOnInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def fetch(self):
         """
         Fetch the InstalledAddOnInstance
@@ -254,6 +399,17 @@ class InstalledAddOnContext(InstanceContext):
 
         return InstalledAddOnInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the InstalledAddOnInstance
+
+        :returns: The fetched InstalledAddOnInstance
+        :rtype: twilio.rest.preview.marketplace.installed_add_on.InstalledAddOnInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return InstalledAddOnInstance(self._version, payload, sid=self._solution['sid'], )
+
     def update(self, configuration=values.unset, unique_name=values.unset):
         """
         Update the InstalledAddOnInstance
@@ -270,6 +426,22 @@ class InstalledAddOnContext(InstanceContext):
 
         return InstalledAddOnInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def update_async(self, configuration=values.unset, unique_name=values.unset):
+        """
+        Asynchronous coroutine that updates the InstalledAddOnInstance
+
+        :param dict configuration: The JSON object representing the configuration
+        :param unicode unique_name: An application-defined string that uniquely identifies the resource
+
+        :returns: The updated InstalledAddOnInstance
+        :rtype: twilio.rest.preview.marketplace.installed_add_on.InstalledAddOnInstance
+        """
+        data = values.of({'Configuration': serialize.object(configuration), 'UniqueName': unique_name, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return InstalledAddOnInstance(self._version, payload, sid=self._solution['sid'], )
+
     @property
     def extensions(self):
         """
@@ -279,6 +451,7 @@ class InstalledAddOnContext(InstanceContext):
         :rtype: twilio.rest.preview.marketplace.installed_add_on.installed_add_on_extension.InstalledAddOnExtensionList
         """
         if self._extensions is None:
+            from twilio.rest.preview.marketplace.installed_add_on.installed_add_on_extension import InstalledAddOnExtensionList
             self._extensions = InstalledAddOnExtensionList(
                 self._version,
                 installed_add_on_sid=self._solution['sid'],
@@ -301,6 +474,28 @@ class InstalledAddOnInstance(InstanceResource):
     to change. Use them with caution. If you currently do not have developer
     preview access, please contact help@twilio.com. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'friendly_name': 'friendly_name',
+        'description': 'description',
+        'configuration': 'configuration',
+        'unique_name': 'unique_name',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'url': 'url',
+        'links': 'links',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the InstalledAddOnInstance
@@ -311,18 +506,7 @@ class InstalledAddOnInstance(InstanceResource):
         super(InstalledAddOnInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'friendly_name': payload.get('friendly_name'),
-            'description': payload.get('description'),
-            'configuration': payload.get('configuration'),
-            'unique_name': payload.get('unique_name'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -430,6 +614,15 @@ class InstalledAddOnInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the InstalledAddOnInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def fetch(self):
         """
         Fetch the InstalledAddOnInstance
@@ -439,6 +632,15 @@ class InstalledAddOnInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the InstalledAddOnInstance
+
+        :returns: The fetched InstalledAddOnInstance
+        :rtype: twilio.rest.preview.marketplace.installed_add_on.InstalledAddOnInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, configuration=values.unset, unique_name=values.unset):
         """
         Update the InstalledAddOnInstance
@@ -451,6 +653,18 @@ class InstalledAddOnInstance(InstanceResource):
         """
         return self._proxy.update(configuration=configuration, unique_name=unique_name, )
 
+    async def update_async(self, configuration=values.unset, unique_name=values.unset):
+        """
+        Asynchronous coroutine that updates the InstalledAddOnInstance
+
+        :param dict configuration: The JSON object representing the configuration
+        :param unicode unique_name: An application-defined string that uniquely identifies the resource
+
+        :returns: The updated InstalledAddOnInstance
+        :rtype: twilio.rest.preview.marketplace.installed_add_on.InstalledAddOnInstance
+        """
+        return await self._proxy.update_async(configuration=configuration, unique_name=unique_name, )
+
     @property
     def extensions(self):
         """
@@ -470,3 +684,19 @@ class InstalledAddOnInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Preview.Marketplace.InstalledAddOnInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'InstalledAddOnExtensionList': 'twilio.rest.preview.marketplace.installed_add_on.installed_add_on_extension',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
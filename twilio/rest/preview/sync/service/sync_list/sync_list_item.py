@@ -35,20 +35,44 @@ class SyncListItemList(ListResource):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, 'list_sid': list_sid, }
-        self._uri = '/Services/{service_sid}/Lists/{list_sid}/Items'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/Lists/{list_sid}/Items', self._solution)
 
-    def create(self, data):
+    def create(self, data, deadline=None):
         """
         Create the SyncListItemInstance
 
         :param dict data: The data
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created SyncListItemInstance
         :rtype: twilio.rest.preview.sync.service.sync_list.sync_list_item.SyncListItemInstance
         """
         data = values.of({'Data': serialize.object(data), })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return SyncListItemInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            list_sid=self._solution['list_sid'],
+        )
+
+    async def create_async(self, data, deadline=None):
+        """
+        Asynchronous coroutine that creates the SyncListItemInstance
+
+        :param dict data: The data
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created SyncListItemInstance
+        :rtype: twilio.rest.preview.sync.service.sync_list.sync_list_item.SyncListItemInstance
+        """
+        data = values.of({'Data': serialize.object(data), })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return SyncListItemInstance(
             self._version,
@@ -58,7 +82,7 @@ class SyncListItemList(ListResource):
         )
 
     def stream(self, order=values.unset, from_=values.unset, bounds=values.unset,
-               limit=None, page_size=None):
+               limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams SyncListItemInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -74,18 +98,62 @@ class SyncListItemList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.preview.sync.service.sync_list.sync_list_item.SyncListItemInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(order=order, from_=from_, bounds=bounds, page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(order=order, from_=from_, bounds=bounds, page_size=limits['page_size'], )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-        return self._version.stream(page, limits['limit'])
+    async def stream_async(self, order=values.unset, from_=values.unset, bounds=values.unset,
+                           limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams SyncListItemInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param SyncListItemInstance.QueryResultOrder order: The order
+        :param unicode from_: The from
+        :param SyncListItemInstance.QueryFromBoundType bounds: The bounds
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.preview.sync.service.sync_list.sync_list_item.SyncListItemInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(order=order, from_=from_, bounds=bounds, page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, order=values.unset, from_=values.unset, bounds=values.unset,
-             limit=None, page_size=None):
+             limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists SyncListItemInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -100,11 +168,45 @@ class SyncListItemList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.preview.sync.service.sync_list.sync_list_item.SyncListItemInstance]
         """
-        return list(self.stream(order=order, from_=from_, bounds=bounds, limit=limit, page_size=page_size, ))
+        return list(self.stream(order=order, from_=from_, bounds=bounds, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, order=values.unset, from_=values.unset, bounds=values.unset,
+                         limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists SyncListItemInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param SyncListItemInstance.QueryResultOrder order: The order
+        :param unicode from_: The from
+        :param SyncListItemInstance.QueryFromBoundType bounds: The bounds
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.preview.sync.service.sync_list.sync_list_item.SyncListItemInstance]
+        """
+        return [record async for record in await self.stream_async(order=order, from_=from_, bounds=bounds, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, order=values.unset, from_=values.unset, bounds=values.unset,
              page_token=values.unset, page_number=values.unset,
@@ -136,6 +238,36 @@ class SyncListItemList(ListResource):
 
         return SyncListItemPage(self._version, response, self._solution)
 
+    async def page_async(self, order=values.unset, from_=values.unset, bounds=values.unset,
+                         page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of SyncListItemInstance records from the API.
+        Request is executed immediately
+
+        :param SyncListItemInstance.QueryResultOrder order: The order
+        :param unicode from_: The from
+        :param SyncListItemInstance.QueryFromBoundType bounds: The bounds
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of SyncListItemInstance
+        :rtype: twilio.rest.preview.sync.service.sync_list.sync_list_item.SyncListItemPage
+        """
+        data = values.of({
+            'Order': order,
+            'From': from_,
+            'Bounds': bounds,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return SyncListItemPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of SyncListItemInstance records from the API.
@@ -153,6 +285,23 @@ class SyncListItemList(ListResource):
 
         return SyncListItemPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of SyncListItemInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of SyncListItemInstance
+        :rtype: twilio.rest.preview.sync.service.sync_list.sync_list_item.SyncListItemPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return SyncListItemPage(self._version, response, self._solution)
+
     def get(self, index):
         """
         Constructs a SyncListItemContext
@@ -264,7 +413,7 @@ class SyncListItemContext(InstanceContext):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, 'list_sid': list_sid, 'index': index, }
-        self._uri = '/Services/{service_sid}/Lists/{list_sid}/Items/{index}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/Lists/{list_sid}/Items/{index}', self._solution)
 
     def fetch(self):
         """
@@ -283,6 +432,23 @@ class SyncListItemContext(InstanceContext):
             index=self._solution['index'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the SyncListItemInstance
+
+        :returns: The fetched SyncListItemInstance
+        :rtype: twilio.rest.preview.sync.service.sync_list.sync_list_item.SyncListItemInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return SyncListItemInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            list_sid=self._solution['list_sid'],
+            index=self._solution['index'],
+        )
+
     def delete(self, if_match=values.unset):
         """
         Deletes the SyncListItemInstance
@@ -296,6 +462,19 @@ class SyncListItemContext(InstanceContext):
 
         return self._version.delete(method='DELETE', uri=self._uri, headers=headers, )
 
+    async def delete_async(self, if_match=values.unset):
+        """
+        Asynchronous coroutine that deletes the SyncListItemInstance
+
+        :param unicode if_match: The If-Match HTTP request header
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        headers = values.of({'If-Match': if_match, })
+
+        return await self._version.delete_async(method='DELETE', uri=self._uri, headers=headers, )
+
     def update(self, data, if_match=values.unset):
         """
         Update the SyncListItemInstance
@@ -319,6 +498,29 @@ class SyncListItemContext(InstanceContext):
             index=self._solution['index'],
         )
 
+    async def update_async(self, data, if_match=values.unset):
+        """
+        Asynchronous coroutine that updates the SyncListItemInstance
+
+        :param dict data: The data
+        :param unicode if_match: The If-Match HTTP request header
+
+        :returns: The updated SyncListItemInstance
+        :rtype: twilio.rest.preview.sync.service.sync_list.sync_list_item.SyncListItemInstance
+        """
+        data = values.of({'Data': serialize.object(data), })
+        headers = values.of({'If-Match': if_match, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, headers=headers, )
+
+        return SyncListItemInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            list_sid=self._solution['list_sid'],
+            index=self._solution['index'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -343,6 +545,29 @@ class SyncListItemInstance(InstanceResource):
         INCLUSIVE = "inclusive"
         EXCLUSIVE = "exclusive"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'index': deserialize.integer,
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'index': 'index',
+        'account_sid': 'account_sid',
+        'service_sid': 'service_sid',
+        'list_sid': 'list_sid',
+        'url': 'url',
+        'revision': 'revision',
+        'data': 'data',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'created_by': 'created_by',
+    }, _deserializers)
+
     def __init__(self, version, payload, service_sid, list_sid, index=None):
         """
         Initialize the SyncListItemInstance
@@ -353,18 +578,7 @@ class SyncListItemInstance(InstanceResource):
         super(SyncListItemInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'index': deserialize.integer(payload.get('index')),
-            'account_sid': payload.get('account_sid'),
-            'service_sid': payload.get('service_sid'),
-            'list_sid': payload.get('list_sid'),
-            'url': payload.get('url'),
-            'revision': payload.get('revision'),
-            'data': payload.get('data'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'created_by': payload.get('created_by'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -481,6 +695,15 @@ class SyncListItemInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the SyncListItemInstance
+
+        :returns: The fetched SyncListItemInstance
+        :rtype: twilio.rest.preview.sync.service.sync_list.sync_list_item.SyncListItemInstance
+        """
+        return await self._proxy.fetch_async()
+
     def delete(self, if_match=values.unset):
         """
         Deletes the SyncListItemInstance
@@ -492,6 +715,17 @@ class SyncListItemInstance(InstanceResource):
         """
         return self._proxy.delete(if_match=if_match, )
 
+    async def delete_async(self, if_match=values.unset):
+        """
+        Asynchronous coroutine that deletes the SyncListItemInstance
+
+        :param unicode if_match: The If-Match HTTP request header
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async(if_match=if_match, )
+
     def update(self, data, if_match=values.unset):
         """
         Update the SyncListItemInstance
@@ -504,6 +738,18 @@ class SyncListItemInstance(InstanceResource):
         """
         return self._proxy.update(data, if_match=if_match, )
 
+    async def update_async(self, data, if_match=values.unset):
+        """
+        Asynchronous coroutine that updates the SyncListItemInstance
+
+        :param dict data: The data
+        :param unicode if_match: The If-Match HTTP request header
+
+        :returns: The updated SyncListItemInstance
+        :rtype: twilio.rest.preview.sync.service.sync_list.sync_list_item.SyncListItemInstance
+        """
+        return await self._proxy.update_async(data, if_match=if_match, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -6,11 +6,9 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base.version import Version
-from twilio.rest.preview.trusted_comms.branded_channel import BrandedChannelList
-from twilio.rest.preview.trusted_comms.brands_information import BrandsInformationList
-from twilio.rest.preview.trusted_comms.cps import CpsList
-from twilio.rest.preview.trusted_comms.current_call import CurrentCallList
 
 
 class TrustedComms(Version):
@@ -35,6 +33,7 @@ class TrustedComms(Version):
         :rtype: twilio.rest.preview.trusted_comms.branded_channel.BrandedChannelList
         """
         if self._branded_channels is None:
+            from twilio.rest.preview.trusted_comms.branded_channel import BrandedChannelList
             self._branded_channels = BrandedChannelList(self)
         return self._branded_channels
 
@@ -44,6 +43,7 @@ class TrustedComms(Version):
         :rtype: twilio.rest.preview.trusted_comms.brands_information.BrandsInformationList
         """
         if self._brands_information is None:
+            from twilio.rest.preview.trusted_comms.brands_information import BrandsInformationList
             self._brands_information = BrandsInformationList(self)
         return self._brands_information
 
@@ -53,6 +53,7 @@ class TrustedComms(Version):
         :rtype: twilio.rest.preview.trusted_comms.cps.CpsList
         """
         if self._cps is None:
+            from twilio.rest.preview.trusted_comms.cps import CpsList
             self._cps = CpsList(self)
         return self._cps
 
@@ -62,6 +63,7 @@ class TrustedComms(Version):
         :rtype: twilio.rest.preview.trusted_comms.current_call.CurrentCallList
         """
         if self._current_calls is None:
+            from twilio.rest.preview.trusted_comms.current_call import CurrentCallList
             self._current_calls = CurrentCallList(self)
         return self._current_calls
 
@@ -73,3 +75,22 @@ class TrustedComms(Version):
         :rtype: str
         """
         return '<Twilio.Preview.TrustedComms>'
+
+
+_LAZY_IMPORTS = {
+    'BrandedChannelList': 'twilio.rest.preview.trusted_comms.branded_channel',
+    'BrandsInformationList': 'twilio.rest.preview.trusted_comms.brands_information',
+    'CpsList': 'twilio.rest.preview.trusted_comms.cps',
+    'CurrentCallList': 'twilio.rest.preview.trusted_comms.current_call',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
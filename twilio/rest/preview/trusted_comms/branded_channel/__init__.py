@@ -6,12 +6,14 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.preview.trusted_comms.branded_channel.channel import ChannelList
 
 
 class BrandedChannelList(ListResource):
@@ -125,7 +127,7 @@ class BrandedChannelContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/BrandedChannels/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/BrandedChannels/{sid}', self._solution)
 
         # Dependents
         self._channels = None
@@ -141,6 +143,17 @@ class BrandedChannelContext(InstanceContext):
 
         return BrandedChannelInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the BrandedChannelInstance
+
+        :returns: The fetched BrandedChannelInstance
+        :rtype: twilio.rest.preview.trusted_comms.branded_channel.BrandedChannelInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return BrandedChannelInstance(self._version, payload, sid=self._solution['sid'], )
+
     @property
     def channels(self):
         """
@@ -150,6 +163,7 @@ class BrandedChannelContext(InstanceContext):
         :rtype: twilio.rest.preview.trusted_comms.branded_channel.channel.ChannelList
         """
         if self._channels is None:
+            from twilio.rest.preview.trusted_comms.branded_channel.channel import ChannelList
             self._channels = ChannelList(self._version, branded_channel_sid=self._solution['sid'], )
         return self._channels
 
@@ -169,6 +183,18 @@ class BrandedChannelInstance(InstanceResource):
     to change. Use them with caution. If you currently do not have developer
     preview access, please contact help@twilio.com. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'business_sid': 'business_sid',
+        'brand_sid': 'brand_sid',
+        'sid': 'sid',
+        'links': 'links',
+        'url': 'url',
+    })
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the BrandedChannelInstance
@@ -179,14 +205,7 @@ class BrandedChannelInstance(InstanceResource):
         super(BrandedChannelInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'business_sid': payload.get('business_sid'),
-            'brand_sid': payload.get('brand_sid'),
-            'sid': payload.get('sid'),
-            'links': payload.get('links'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -262,6 +281,15 @@ class BrandedChannelInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the BrandedChannelInstance
+
+        :returns: The fetched BrandedChannelInstance
+        :rtype: twilio.rest.preview.trusted_comms.branded_channel.BrandedChannelInstance
+        """
+        return await self._proxy.fetch_async()
+
     @property
     def channels(self):
         """
@@ -281,3 +309,19 @@ class BrandedChannelInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Preview.TrustedComms.BrandedChannelInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'ChannelList': 'twilio.rest.preview.trusted_comms.branded_channel.channel',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
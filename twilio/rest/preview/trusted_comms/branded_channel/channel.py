@@ -6,6 +6,7 @@ This code was generated by
       /       /
 """
 
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
@@ -31,20 +32,43 @@ class ChannelList(ListResource):
 
         # Path Solution
         self._solution = {'branded_channel_sid': branded_channel_sid, }
-        self._uri = '/BrandedChannels/{branded_channel_sid}/Channels'.format(**self._solution)
+        self._uri = values.ResourceUri('/BrandedChannels/{branded_channel_sid}/Channels', self._solution)
 
-    def create(self, phone_number_sid):
+    def create(self, phone_number_sid, deadline=None):
         """
         Create the ChannelInstance
 
         :param unicode phone_number_sid: Phone Number Sid to be branded.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created ChannelInstance
         :rtype: twilio.rest.preview.trusted_comms.branded_channel.channel.ChannelInstance
         """
         data = values.of({'PhoneNumberSid': phone_number_sid, })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return ChannelInstance(
+            self._version,
+            payload,
+            branded_channel_sid=self._solution['branded_channel_sid'],
+        )
+
+    async def create_async(self, phone_number_sid, deadline=None):
+        """
+        Asynchronous coroutine that creates the ChannelInstance
+
+        :param unicode phone_number_sid: Phone Number Sid to be branded.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created ChannelInstance
+        :rtype: twilio.rest.preview.trusted_comms.branded_channel.channel.ChannelInstance
+        """
+        data = values.of({'PhoneNumberSid': phone_number_sid, })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return ChannelInstance(
             self._version,
@@ -113,6 +137,19 @@ class ChannelInstance(InstanceResource):
     to change. Use them with caution. If you currently do not have developer
     preview access, please contact help@twilio.com. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'business_sid': 'business_sid',
+        'brand_sid': 'brand_sid',
+        'branded_channel_sid': 'branded_channel_sid',
+        'phone_number_sid': 'phone_number_sid',
+        'phone_number': 'phone_number',
+        'url': 'url',
+    })
+
     def __init__(self, version, payload, branded_channel_sid):
         """
         Initialize the ChannelInstance
@@ -123,15 +160,7 @@ class ChannelInstance(InstanceResource):
         super(ChannelInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'business_sid': payload.get('business_sid'),
-            'brand_sid': payload.get('brand_sid'),
-            'branded_channel_sid': payload.get('branded_channel_sid'),
-            'phone_number_sid': payload.get('phone_number_sid'),
-            'phone_number': payload.get('phone_number'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
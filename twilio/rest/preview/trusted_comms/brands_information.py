@@ -120,7 +120,7 @@ class BrandsInformationContext(InstanceContext):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/BrandsInformation'.format(**self._solution)
+        self._uri = values.ResourceUri('/BrandsInformation', self._solution)
 
     def fetch(self, if_none_match=values.unset):
         """
@@ -137,6 +137,21 @@ class BrandsInformationContext(InstanceContext):
 
         return BrandsInformationInstance(self._version, payload, )
 
+    async def fetch_async(self, if_none_match=values.unset):
+        """
+        Asynchronous coroutine that fetches the BrandsInformationInstance
+
+        :param unicode if_none_match: Standard `If-None-Match` HTTP header
+
+        :returns: The fetched BrandsInformationInstance
+        :rtype: twilio.rest.preview.trusted_comms.brands_information.BrandsInformationInstance
+        """
+        headers = values.of({'If-None-Match': if_none_match, })
+
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, headers=headers, )
+
+        return BrandsInformationInstance(self._version, payload, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -153,6 +168,21 @@ class BrandsInformationInstance(InstanceResource):
     to change. Use them with caution. If you currently do not have developer
     preview access, please contact help@twilio.com. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'update_time': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'update_time': 'update_time',
+        'file_link': 'file_link',
+        'file_link_ttl_in_seconds': 'file_link_ttl_in_seconds',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload):
         """
         Initialize the BrandsInformationInstance
@@ -163,12 +193,7 @@ class BrandsInformationInstance(InstanceResource):
         super(BrandsInformationInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'update_time': deserialize.iso8601_datetime(payload.get('update_time')),
-            'file_link': payload.get('file_link'),
-            'file_link_ttl_in_seconds': payload.get('file_link_ttl_in_seconds'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -230,6 +255,17 @@ class BrandsInformationInstance(InstanceResource):
         """
         return self._proxy.fetch(if_none_match=if_none_match, )
 
+    async def fetch_async(self, if_none_match=values.unset):
+        """
+        Asynchronous coroutine that fetches the BrandsInformationInstance
+
+        :param unicode if_none_match: Standard `If-None-Match` HTTP header
+
+        :returns: The fetched BrandsInformationInstance
+        :rtype: twilio.rest.preview.trusted_comms.brands_information.BrandsInformationInstance
+        """
+        return await self._proxy.fetch_async(if_none_match=if_none_match, )
+
     def __repr__(self):
         """
         Provide a friendly representation
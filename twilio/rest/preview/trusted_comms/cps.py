@@ -6,6 +6,7 @@ This code was generated by
       /       /
 """
 
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
@@ -119,7 +120,7 @@ class CpsContext(InstanceContext):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/CPS'.format(**self._solution)
+        self._uri = values.ResourceUri('/CPS', self._solution)
 
     def fetch(self, x_xcnam_sensitive_phone_number=values.unset):
         """
@@ -136,6 +137,21 @@ class CpsContext(InstanceContext):
 
         return CpsInstance(self._version, payload, )
 
+    async def fetch_async(self, x_xcnam_sensitive_phone_number=values.unset):
+        """
+        Asynchronous coroutine that fetches the CpsInstance
+
+        :param unicode x_xcnam_sensitive_phone_number: Phone number to retrieve CPS.
+
+        :returns: The fetched CpsInstance
+        :rtype: twilio.rest.preview.trusted_comms.cps.CpsInstance
+        """
+        headers = values.of({'X-Xcnam-Sensitive-Phone-Number': x_xcnam_sensitive_phone_number, })
+
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, headers=headers, )
+
+        return CpsInstance(self._version, payload, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -152,6 +168,15 @@ class CpsInstance(InstanceResource):
     to change. Use them with caution. If you currently do not have developer
     preview access, please contact help@twilio.com. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'cps_url': 'cps_url',
+        'phone_number': 'phone_number',
+        'url': 'url',
+    })
+
     def __init__(self, version, payload):
         """
         Initialize the CpsInstance
@@ -162,11 +187,7 @@ class CpsInstance(InstanceResource):
         super(CpsInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'cps_url': payload.get('cps_url'),
-            'phone_number': payload.get('phone_number'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -220,6 +241,17 @@ class CpsInstance(InstanceResource):
         """
         return self._proxy.fetch(x_xcnam_sensitive_phone_number=x_xcnam_sensitive_phone_number, )
 
+    async def fetch_async(self, x_xcnam_sensitive_phone_number=values.unset):
+        """
+        Asynchronous coroutine that fetches the CpsInstance
+
+        :param unicode x_xcnam_sensitive_phone_number: Phone number to retrieve CPS.
+
+        :returns: The fetched CpsInstance
+        :rtype: twilio.rest.preview.trusted_comms.cps.CpsInstance
+        """
+        return await self._proxy.fetch_async(x_xcnam_sensitive_phone_number=x_xcnam_sensitive_phone_number, )
+
     def __repr__(self):
         """
         Provide a friendly representation
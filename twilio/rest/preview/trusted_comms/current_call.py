@@ -120,7 +120,7 @@ class CurrentCallContext(InstanceContext):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/CurrentCall'.format(**self._solution)
+        self._uri = values.ResourceUri('/CurrentCall', self._solution)
 
     def fetch(self, x_xcnam_sensitive_phone_number_from=values.unset,
               x_xcnam_sensitive_phone_number_to=values.unset):
@@ -142,6 +142,26 @@ class CurrentCallContext(InstanceContext):
 
         return CurrentCallInstance(self._version, payload, )
 
+    async def fetch_async(self, x_xcnam_sensitive_phone_number_from=values.unset,
+                          x_xcnam_sensitive_phone_number_to=values.unset):
+        """
+        Asynchronous coroutine that fetches the CurrentCallInstance
+
+        :param unicode x_xcnam_sensitive_phone_number_from: The originating Phone Number
+        :param unicode x_xcnam_sensitive_phone_number_to: The terminating Phone Number
+
+        :returns: The fetched CurrentCallInstance
+        :rtype: twilio.rest.preview.trusted_comms.current_call.CurrentCallInstance
+        """
+        headers = values.of({
+            'X-Xcnam-Sensitive-Phone-Number-From': x_xcnam_sensitive_phone_number_from,
+            'X-Xcnam-Sensitive-Phone-Number-To': x_xcnam_sensitive_phone_number_to,
+        })
+
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, headers=headers, )
+
+        return CurrentCallInstance(self._version, payload, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -158,6 +178,31 @@ class CurrentCallInstance(InstanceResource):
     to change. Use them with caution. If you currently do not have developer
     preview access, please contact help@twilio.com. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'created_at': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'bg_color': 'bg_color',
+        'caller': 'caller',
+        'created_at': 'created_at',
+        'font_color': 'font_color',
+        'from_': 'from',
+        'logo': 'logo',
+        'manager': 'manager',
+        'reason': 'reason',
+        'shield_img': 'shield_img',
+        'sid': 'sid',
+        'status': 'status',
+        'to': 'to',
+        'url': 'url',
+        'use_case': 'use_case',
+    }, _deserializers)
+
     def __init__(self, version, payload):
         """
         Initialize the CurrentCallInstance
@@ -168,22 +213,7 @@ class CurrentCallInstance(InstanceResource):
         super(CurrentCallInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'bg_color': payload.get('bg_color'),
-            'caller': payload.get('caller'),
-            'created_at': deserialize.iso8601_datetime(payload.get('created_at')),
-            'font_color': payload.get('font_color'),
-            'from_': payload.get('from'),
-            'logo': payload.get('logo'),
-            'manager': payload.get('manager'),
-            'reason': payload.get('reason'),
-            'shield_img': payload.get('shield_img'),
-            'sid': payload.get('sid'),
-            'status': payload.get('status'),
-            'to': payload.get('to'),
-            'url': payload.get('url'),
-            'use_case': payload.get('use_case'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -330,6 +360,22 @@ class CurrentCallInstance(InstanceResource):
             x_xcnam_sensitive_phone_number_to=x_xcnam_sensitive_phone_number_to,
         )
 
+    async def fetch_async(self, x_xcnam_sensitive_phone_number_from=values.unset,
+                          x_xcnam_sensitive_phone_number_to=values.unset):
+        """
+        Asynchronous coroutine that fetches the CurrentCallInstance
+
+        :param unicode x_xcnam_sensitive_phone_number_from: The originating Phone Number
+        :param unicode x_xcnam_sensitive_phone_number_to: The terminating Phone Number
+
+        :returns: The fetched CurrentCallInstance
+        :rtype: twilio.rest.preview.trusted_comms.current_call.CurrentCallInstance
+        """
+        return await self._proxy.fetch_async(
+            x_xcnam_sensitive_phone_number_from=x_xcnam_sensitive_phone_number_from,
+            x_xcnam_sensitive_phone_number_to=x_xcnam_sensitive_phone_number_to,
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
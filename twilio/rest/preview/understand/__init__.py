@@ -6,8 +6,9 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base.version import Version
-from twilio.rest.preview.understand.assistant import AssistantList
 
 
 class Understand(Version):
@@ -29,6 +30,7 @@ class Understand(Version):
         :rtype: twilio.rest.preview.understand.assistant.AssistantList
         """
         if self._assistants is None:
+            from twilio.rest.preview.understand.assistant import AssistantList
             self._assistants = AssistantList(self)
         return self._assistants
 
@@ -40,3 +42,19 @@ class Understand(Version):
         :rtype: str
         """
         return '<Twilio.Preview.Understand>'
+
+
+_LAZY_IMPORTS = {
+    'AssistantList': 'twilio.rest.preview.understand.assistant',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
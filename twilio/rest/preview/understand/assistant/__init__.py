@@ -6,6 +6,8 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import serialize
 from twilio.base import values
@@ -13,14 +15,6 @@ from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.preview.understand.assistant.assistant_fallback_actions import AssistantFallbackActionsList
-from twilio.rest.preview.understand.assistant.assistant_initiation_actions import AssistantInitiationActionsList
-from twilio.rest.preview.understand.assistant.dialogue import DialogueList
-from twilio.rest.preview.understand.assistant.field_type import FieldTypeList
-from twilio.rest.preview.understand.assistant.model_build import ModelBuildList
-from twilio.rest.preview.understand.assistant.query import QueryList
-from twilio.rest.preview.understand.assistant.style_sheet import StyleSheetList
-from twilio.rest.preview.understand.assistant.task import TaskList
 
 
 class AssistantList(ListResource):
@@ -41,9 +35,9 @@ class AssistantList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Assistants'.format(**self._solution)
+        self._uri = values.ResourceUri('/Assistants', self._solution)
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams AssistantInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -56,17 +50,57 @@ class AssistantList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.preview.understand.assistant.AssistantInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams AssistantInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.preview.understand.assistant.AssistantInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists AssistantInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -78,11 +112,42 @@ class AssistantList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.preview.understand.assistant.AssistantInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists AssistantInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.preview.understand.assistant.AssistantInstance]
+        """
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -103,6 +168,25 @@ class AssistantList(ListResource):
 
         return AssistantPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of AssistantInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of AssistantInstance
+        :rtype: twilio.rest.preview.understand.assistant.AssistantPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return AssistantPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of AssistantInstance records from the API.
@@ -120,10 +204,27 @@ class AssistantList(ListResource):
 
         return AssistantPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of AssistantInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of AssistantInstance
+        :rtype: twilio.rest.preview.understand.assistant.AssistantPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return AssistantPage(self._version, response, self._solution)
+
     def create(self, friendly_name=values.unset, log_queries=values.unset,
                unique_name=values.unset, callback_url=values.unset,
                callback_events=values.unset, fallback_actions=values.unset,
-               initiation_actions=values.unset, style_sheet=values.unset):
+               initiation_actions=values.unset, style_sheet=values.unset, deadline=None):
         """
         Create the AssistantInstance
 
@@ -135,6 +236,8 @@ class AssistantList(ListResource):
         :param dict fallback_actions: The JSON actions to be executed when the user's input is not recognized as matching any Task.
         :param dict initiation_actions: The JSON actions to be executed on inbound phone calls when the Assistant has to say something first.
         :param dict style_sheet: The JSON object that holds the style sheet for the assistant
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created AssistantInstance
         :rtype: twilio.rest.preview.understand.assistant.AssistantInstance
@@ -150,7 +253,44 @@ class AssistantList(ListResource):
             'StyleSheet': serialize.object(style_sheet),
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return AssistantInstance(self._version, payload, )
+
+    async def create_async(self, friendly_name=values.unset, log_queries=values.unset,
+                           unique_name=values.unset, callback_url=values.unset,
+                           callback_events=values.unset, fallback_actions=values.unset,
+                           initiation_actions=values.unset, style_sheet=values.unset,
+                           deadline=None):
+        """
+        Asynchronous coroutine that creates the AssistantInstance
+
+        :param unicode friendly_name: A text description for the Assistant. It is non-unique and can up to 255 characters long.
+        :param bool log_queries: A boolean that specifies whether queries should be logged for 30 days further training. If false, no queries will be stored, if true, queries will be stored for 30 days and deleted thereafter. Defaults to true if no value is provided.
+        :param unicode unique_name: A user-provided string that uniquely identifies this resource as an alternative to the sid. Unique up to 64 characters long.
+        :param unicode callback_url: A user-provided URL to send event callbacks to.
+        :param unicode callback_events: Space-separated list of callback events that will trigger callbacks.
+        :param dict fallback_actions: The JSON actions to be executed when the user's input is not recognized as matching any Task.
+        :param dict initiation_actions: The JSON actions to be executed on inbound phone calls when the Assistant has to say something first.
+        :param dict style_sheet: The JSON object that holds the style sheet for the assistant
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created AssistantInstance
+        :rtype: twilio.rest.preview.understand.assistant.AssistantInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'LogQueries': log_queries,
+            'UniqueName': unique_name,
+            'CallbackUrl': callback_url,
+            'CallbackEvents': callback_events,
+            'FallbackActions': serialize.object(fallback_actions),
+            'InitiationActions': serialize.object(initiation_actions),
+            'StyleSheet': serialize.object(style_sheet),
+        })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return AssistantInstance(self._version, payload, )
 
@@ -246,7 +386,7 @@ class AssistantContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/Assistants/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Assistants/{sid}', self._solution)
 
         # Dependents
         self._field_types = None
@@ -269,6 +409,17 @@ class AssistantContext(InstanceContext):
 
         return AssistantInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the AssistantInstance
+
+        :returns: The fetched AssistantInstance
+        :rtype: twilio.rest.preview.understand.assistant.AssistantInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return AssistantInstance(self._version, payload, sid=self._solution['sid'], )
+
     def update(self, friendly_name=values.unset, log_queries=values.unset,
                unique_name=values.unset, callback_url=values.unset,
                callback_events=values.unset, fallback_actions=values.unset,
@@ -303,6 +454,40 @@ class AssistantContext(InstanceContext):
 
         return AssistantInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def update_async(self, friendly_name=values.unset, log_queries=values.unset,
+                           unique_name=values.unset, callback_url=values.unset,
+                           callback_events=values.unset, fallback_actions=values.unset,
+                           initiation_actions=values.unset, style_sheet=values.unset):
+        """
+        Asynchronous coroutine that updates the AssistantInstance
+
+        :param unicode friendly_name: A text description for the Assistant. It is non-unique and can up to 255 characters long.
+        :param bool log_queries: A boolean that specifies whether queries should be logged for 30 days further training. If false, no queries will be stored, if true, queries will be stored for 30 days and deleted thereafter. Defaults to true if no value is provided.
+        :param unicode unique_name: A user-provided string that uniquely identifies this resource as an alternative to the sid. Unique up to 64 characters long.
+        :param unicode callback_url: A user-provided URL to send event callbacks to.
+        :param unicode callback_events: Space-separated list of callback events that will trigger callbacks.
+        :param dict fallback_actions: The JSON actions to be executed when the user's input is not recognized as matching any Task.
+        :param dict initiation_actions: The JSON actions to be executed on inbound phone calls when the Assistant has to say something first.
+        :param dict style_sheet: The JSON object that holds the style sheet for the assistant
+
+        :returns: The updated AssistantInstance
+        :rtype: twilio.rest.preview.understand.assistant.AssistantInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'LogQueries': log_queries,
+            'UniqueName': unique_name,
+            'CallbackUrl': callback_url,
+            'CallbackEvents': callback_events,
+            'FallbackActions': serialize.object(fallback_actions),
+            'InitiationActions': serialize.object(initiation_actions),
+            'StyleSheet': serialize.object(style_sheet),
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return AssistantInstance(self._version, payload, sid=self._solution['sid'], )
+
     def delete(self):
         """
         Deletes the AssistantInstance
@@ -312,6 +497,15 @@ class AssistantContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the AssistantInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     @property
     def field_types(self):
         """
@@ -321,6 +515,7 @@ class AssistantContext(InstanceContext):
         :rtype: twilio.rest.preview.understand.assistant.field_type.FieldTypeList
         """
         if self._field_types is None:
+            from twilio.rest.preview.understand.assistant.field_type import FieldTypeList
             self._field_types = FieldTypeList(self._version, assistant_sid=self._solution['sid'], )
         return self._field_types
 
@@ -333,6 +528,7 @@ class AssistantContext(InstanceContext):
         :rtype: twilio.rest.preview.understand.assistant.task.TaskList
         """
         if self._tasks is None:
+            from twilio.rest.preview.understand.assistant.task import TaskList
             self._tasks = TaskList(self._version, assistant_sid=self._solution['sid'], )
         return self._tasks
 
@@ -345,6 +541,7 @@ class AssistantContext(InstanceContext):
         :rtype: twilio.rest.preview.understand.assistant.model_build.ModelBuildList
         """
         if self._model_builds is None:
+            from twilio.rest.preview.understand.assistant.model_build import ModelBuildList
             self._model_builds = ModelBuildList(self._version, assistant_sid=self._solution['sid'], )
         return self._model_builds
 
@@ -357,6 +554,7 @@ class AssistantContext(InstanceContext):
         :rtype: twilio.rest.preview.understand.assistant.query.QueryList
         """
         if self._queries is None:
+            from twilio.rest.preview.understand.assistant.query import QueryList
             self._queries = QueryList(self._version, assistant_sid=self._solution['sid'], )
         return self._queries
 
@@ -369,6 +567,7 @@ class AssistantContext(InstanceContext):
         :rtype: twilio.rest.preview.understand.assistant.assistant_fallback_actions.AssistantFallbackActionsList
         """
         if self._assistant_fallback_actions is None:
+            from twilio.rest.preview.understand.assistant.assistant_fallback_actions import AssistantFallbackActionsList
             self._assistant_fallback_actions = AssistantFallbackActionsList(
                 self._version,
                 assistant_sid=self._solution['sid'],
@@ -384,6 +583,7 @@ class AssistantContext(InstanceContext):
         :rtype: twilio.rest.preview.understand.assistant.assistant_initiation_actions.AssistantInitiationActionsList
         """
         if self._assistant_initiation_actions is None:
+            from twilio.rest.preview.understand.assistant.assistant_initiation_actions import AssistantInitiationActionsList
             self._assistant_initiation_actions = AssistantInitiationActionsList(
                 self._version,
                 assistant_sid=self._solution['sid'],
@@ -399,6 +599,7 @@ class AssistantContext(InstanceContext):
         :rtype: twilio.rest.preview.understand.assistant.dialogue.DialogueList
         """
         if self._dialogues is None:
+            from twilio.rest.preview.understand.assistant.dialogue import DialogueList
             self._dialogues = DialogueList(self._version, assistant_sid=self._solution['sid'], )
         return self._dialogues
 
@@ -411,6 +612,7 @@ class AssistantContext(InstanceContext):
         :rtype: twilio.rest.preview.understand.assistant.style_sheet.StyleSheetList
         """
         if self._style_sheet is None:
+            from twilio.rest.preview.understand.assistant.style_sheet import StyleSheetList
             self._style_sheet = StyleSheetList(self._version, assistant_sid=self._solution['sid'], )
         return self._style_sheet
 
@@ -430,6 +632,30 @@ class AssistantInstance(InstanceResource):
     to change. Use them with caution. If you currently do not have developer
     preview access, please contact help@twilio.com. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'friendly_name': 'friendly_name',
+        'latest_model_build_sid': 'latest_model_build_sid',
+        'links': 'links',
+        'log_queries': 'log_queries',
+        'sid': 'sid',
+        'unique_name': 'unique_name',
+        'url': 'url',
+        'callback_url': 'callback_url',
+        'callback_events': 'callback_events',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the AssistantInstance
@@ -440,20 +666,7 @@ class AssistantInstance(InstanceResource):
         super(AssistantInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'friendly_name': payload.get('friendly_name'),
-            'latest_model_build_sid': payload.get('latest_model_build_sid'),
-            'links': payload.get('links'),
-            'log_queries': payload.get('log_queries'),
-            'sid': payload.get('sid'),
-            'unique_name': payload.get('unique_name'),
-            'url': payload.get('url'),
-            'callback_url': payload.get('callback_url'),
-            'callback_events': payload.get('callback_events'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -577,6 +790,15 @@ class AssistantInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the AssistantInstance
+
+        :returns: The fetched AssistantInstance
+        :rtype: twilio.rest.preview.understand.assistant.AssistantInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, friendly_name=values.unset, log_queries=values.unset,
                unique_name=values.unset, callback_url=values.unset,
                callback_events=values.unset, fallback_actions=values.unset,
@@ -607,6 +829,36 @@ class AssistantInstance(InstanceResource):
             style_sheet=style_sheet,
         )
 
+    async def update_async(self, friendly_name=values.unset, log_queries=values.unset,
+                           unique_name=values.unset, callback_url=values.unset,
+                           callback_events=values.unset, fallback_actions=values.unset,
+                           initiation_actions=values.unset, style_sheet=values.unset):
+        """
+        Asynchronous coroutine that updates the AssistantInstance
+
+        :param unicode friendly_name: A text description for the Assistant. It is non-unique and can up to 255 characters long.
+        :param bool log_queries: A boolean that specifies whether queries should be logged for 30 days further training. If false, no queries will be stored, if true, queries will be stored for 30 days and deleted thereafter. Defaults to true if no value is provided.
+        :param unicode unique_name: A user-provided string that uniquely identifies this resource as an alternative to the sid. Unique up to 64 characters long.
+        :param unicode callback_url: A user-provided URL to send event callbacks to.
+        :param unicode callback_events: Space-separated list of callback events that will trigger callbacks.
+        :param dict fallback_actions: The JSON actions to be executed when the user's input is not recognized as matching any Task.
+        :param dict initiation_actions: The JSON actions to be executed on inbound phone calls when the Assistant has to say something first.
+        :param dict style_sheet: The JSON object that holds the style sheet for the assistant
+
+        :returns: The updated AssistantInstance
+        :rtype: twilio.rest.preview.understand.assistant.AssistantInstance
+        """
+        return await self._proxy.update_async(
+            friendly_name=friendly_name,
+            log_queries=log_queries,
+            unique_name=unique_name,
+            callback_url=callback_url,
+            callback_events=callback_events,
+            fallback_actions=fallback_actions,
+            initiation_actions=initiation_actions,
+            style_sheet=style_sheet,
+        )
+
     def delete(self):
         """
         Deletes the AssistantInstance
@@ -616,6 +868,15 @@ class AssistantInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the AssistantInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     @property
     def field_types(self):
         """
@@ -705,3 +966,26 @@ class AssistantInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Preview.Understand.AssistantInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'AssistantFallbackActionsList': 'twilio.rest.preview.understand.assistant.assistant_fallback_actions',
+    'AssistantInitiationActionsList': 'twilio.rest.preview.understand.assistant.assistant_initiation_actions',
+    'DialogueList': 'twilio.rest.preview.understand.assistant.dialogue',
+    'FieldTypeList': 'twilio.rest.preview.understand.assistant.field_type',
+    'ModelBuildList': 'twilio.rest.preview.understand.assistant.model_build',
+    'QueryList': 'twilio.rest.preview.understand.assistant.query',
+    'StyleSheetList': 'twilio.rest.preview.understand.assistant.style_sheet',
+    'TaskList': 'twilio.rest.preview.understand.assistant.task',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -7,6 +7,7 @@ This code was generated by
 """
 
 from twilio.base import serialize
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
@@ -127,7 +128,7 @@ class AssistantFallbackActionsContext(InstanceContext):
 
         # Path Solution
         self._solution = {'assistant_sid': assistant_sid, }
-        self._uri = '/Assistants/{assistant_sid}/FallbackActions'.format(**self._solution)
+        self._uri = values.ResourceUri('/Assistants/{assistant_sid}/FallbackActions', self._solution)
 
     def fetch(self):
         """
@@ -144,6 +145,21 @@ class AssistantFallbackActionsContext(InstanceContext):
             assistant_sid=self._solution['assistant_sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the AssistantFallbackActionsInstance
+
+        :returns: The fetched AssistantFallbackActionsInstance
+        :rtype: twilio.rest.preview.understand.assistant.assistant_fallback_actions.AssistantFallbackActionsInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return AssistantFallbackActionsInstance(
+            self._version,
+            payload,
+            assistant_sid=self._solution['assistant_sid'],
+        )
+
     def update(self, fallback_actions=values.unset):
         """
         Update the AssistantFallbackActionsInstance
@@ -163,6 +179,25 @@ class AssistantFallbackActionsContext(InstanceContext):
             assistant_sid=self._solution['assistant_sid'],
         )
 
+    async def update_async(self, fallback_actions=values.unset):
+        """
+        Asynchronous coroutine that updates the AssistantFallbackActionsInstance
+
+        :param dict fallback_actions: The fallback_actions
+
+        :returns: The updated AssistantFallbackActionsInstance
+        :rtype: twilio.rest.preview.understand.assistant.assistant_fallback_actions.AssistantFallbackActionsInstance
+        """
+        data = values.of({'FallbackActions': serialize.object(fallback_actions), })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return AssistantFallbackActionsInstance(
+            self._version,
+            payload,
+            assistant_sid=self._solution['assistant_sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -179,6 +214,16 @@ class AssistantFallbackActionsInstance(InstanceResource):
     to change. Use them with caution. If you currently do not have developer
     preview access, please contact help@twilio.com. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'assistant_sid': 'assistant_sid',
+        'url': 'url',
+        'data': 'data',
+    })
+
     def __init__(self, version, payload, assistant_sid):
         """
         Initialize the AssistantFallbackActionsInstance
@@ -189,12 +234,7 @@ class AssistantFallbackActionsInstance(InstanceResource):
         super(AssistantFallbackActionsInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'assistant_sid': payload.get('assistant_sid'),
-            'url': payload.get('url'),
-            'data': payload.get('data'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -257,6 +297,15 @@ class AssistantFallbackActionsInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the AssistantFallbackActionsInstance
+
+        :returns: The fetched AssistantFallbackActionsInstance
+        :rtype: twilio.rest.preview.understand.assistant.assistant_fallback_actions.AssistantFallbackActionsInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, fallback_actions=values.unset):
         """
         Update the AssistantFallbackActionsInstance
@@ -268,6 +317,17 @@ class AssistantFallbackActionsInstance(InstanceResource):
         """
         return self._proxy.update(fallback_actions=fallback_actions, )
 
+    async def update_async(self, fallback_actions=values.unset):
+        """
+        Asynchronous coroutine that updates the AssistantFallbackActionsInstance
+
+        :param dict fallback_actions: The fallback_actions
+
+        :returns: The updated AssistantFallbackActionsInstance
+        :rtype: twilio.rest.preview.understand.assistant.assistant_fallback_actions.AssistantFallbackActionsInstance
+        """
+        return await self._proxy.update_async(fallback_actions=fallback_actions, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -7,6 +7,7 @@ This code was generated by
 """
 
 from twilio.base import serialize
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
@@ -133,7 +134,7 @@ class AssistantInitiationActionsContext(InstanceContext):
 
         # Path Solution
         self._solution = {'assistant_sid': assistant_sid, }
-        self._uri = '/Assistants/{assistant_sid}/InitiationActions'.format(**self._solution)
+        self._uri = values.ResourceUri('/Assistants/{assistant_sid}/InitiationActions', self._solution)
 
     def fetch(self):
         """
@@ -150,6 +151,21 @@ class AssistantInitiationActionsContext(InstanceContext):
             assistant_sid=self._solution['assistant_sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the AssistantInitiationActionsInstance
+
+        :returns: The fetched AssistantInitiationActionsInstance
+        :rtype: twilio.rest.preview.understand.assistant.assistant_initiation_actions.AssistantInitiationActionsInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return AssistantInitiationActionsInstance(
+            self._version,
+            payload,
+            assistant_sid=self._solution['assistant_sid'],
+        )
+
     def update(self, initiation_actions=values.unset):
         """
         Update the AssistantInitiationActionsInstance
@@ -169,6 +185,25 @@ class AssistantInitiationActionsContext(InstanceContext):
             assistant_sid=self._solution['assistant_sid'],
         )
 
+    async def update_async(self, initiation_actions=values.unset):
+        """
+        Asynchronous coroutine that updates the AssistantInitiationActionsInstance
+
+        :param dict initiation_actions: The initiation_actions
+
+        :returns: The updated AssistantInitiationActionsInstance
+        :rtype: twilio.rest.preview.understand.assistant.assistant_initiation_actions.AssistantInitiationActionsInstance
+        """
+        data = values.of({'InitiationActions': serialize.object(initiation_actions), })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return AssistantInitiationActionsInstance(
+            self._version,
+            payload,
+            assistant_sid=self._solution['assistant_sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -185,6 +220,16 @@ class AssistantInitiationActionsInstance(InstanceResource):
     to change. Use them with caution. If you currently do not have developer
     preview access, please contact help@twilio.com. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'assistant_sid': 'assistant_sid',
+        'url': 'url',
+        'data': 'data',
+    })
+
     def __init__(self, version, payload, assistant_sid):
         """
         Initialize the AssistantInitiationActionsInstance
@@ -195,12 +240,7 @@ class AssistantInitiationActionsInstance(InstanceResource):
         super(AssistantInitiationActionsInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'assistant_sid': payload.get('assistant_sid'),
-            'url': payload.get('url'),
-            'data': payload.get('data'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -263,6 +303,15 @@ class AssistantInitiationActionsInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the AssistantInitiationActionsInstance
+
+        :returns: The fetched AssistantInitiationActionsInstance
+        :rtype: twilio.rest.preview.understand.assistant.assistant_initiation_actions.AssistantInitiationActionsInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, initiation_actions=values.unset):
         """
         Update the AssistantInitiationActionsInstance
@@ -274,6 +323,17 @@ class AssistantInitiationActionsInstance(InstanceResource):
         """
         return self._proxy.update(initiation_actions=initiation_actions, )
 
+    async def update_async(self, initiation_actions=values.unset):
+        """
+        Asynchronous coroutine that updates the AssistantInitiationActionsInstance
+
+        :param dict initiation_actions: The initiation_actions
+
+        :returns: The updated AssistantInitiationActionsInstance
+        :rtype: twilio.rest.preview.understand.assistant.assistant_initiation_actions.AssistantInitiationActionsInstance
+        """
+        return await self._proxy.update_async(initiation_actions=initiation_actions, )
+
     def __repr__(self):
         """
         Provide a friendly representation
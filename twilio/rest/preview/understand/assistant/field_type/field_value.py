@@ -34,9 +34,10 @@ class FieldValueList(ListResource):
 
         # Path Solution
         self._solution = {'assistant_sid': assistant_sid, 'field_type_sid': field_type_sid, }
-        self._uri = '/Assistants/{assistant_sid}/FieldTypes/{field_type_sid}/FieldValues'.format(**self._solution)
+        self._uri = values.ResourceUri('/Assistants/{assistant_sid}/FieldTypes/{field_type_sid}/FieldValues', self._solution)
 
-    def stream(self, language=values.unset, limit=None, page_size=None):
+    def stream(self, language=values.unset, limit=None, page_size=None,
+               prefetch=None, raw=False, deadline=None):
         """
         Streams FieldValueInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -50,17 +51,59 @@ class FieldValueList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.preview.understand.assistant.field_type.field_value.FieldValueInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(language=language, page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(language=language, page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, language=values.unset, limit=None, page_size=None):
+    async def stream_async(self, language=values.unset, limit=None, page_size=None,
+                           prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams FieldValueInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param unicode language: An ISO language-country string of the value. For example: en-US
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.preview.understand.assistant.field_type.field_value.FieldValueInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(language=language, page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, language=values.unset, limit=None, page_size=None,
+             prefetch=None, raw=False, deadline=None):
         """
         Lists FieldValueInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -73,11 +116,43 @@ class FieldValueList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.preview.understand.assistant.field_type.field_value.FieldValueInstance]
         """
-        return list(self.stream(language=language, limit=limit, page_size=page_size, ))
+        return list(self.stream(language=language, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, language=values.unset, limit=None, page_size=None,
+                         prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists FieldValueInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param unicode language: An ISO language-country string of the value. For example: en-US
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.preview.understand.assistant.field_type.field_value.FieldValueInstance]
+        """
+        return [record async for record in await self.stream_async(language=language, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, language=values.unset, page_token=values.unset,
              page_number=values.unset, page_size=values.unset):
@@ -104,6 +179,31 @@ class FieldValueList(ListResource):
 
         return FieldValuePage(self._version, response, self._solution)
 
+    async def page_async(self, language=values.unset, page_token=values.unset,
+                         page_number=values.unset, page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of FieldValueInstance records from the API.
+        Request is executed immediately
+
+        :param unicode language: An ISO language-country string of the value. For example: en-US
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of FieldValueInstance
+        :rtype: twilio.rest.preview.understand.assistant.field_type.field_value.FieldValuePage
+        """
+        data = values.of({
+            'Language': language,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return FieldValuePage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of FieldValueInstance records from the API.
@@ -121,20 +221,63 @@ class FieldValueList(ListResource):
 
         return FieldValuePage(self._version, response, self._solution)
 
-    def create(self, language, value, synonym_of=values.unset):
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of FieldValueInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of FieldValueInstance
+        :rtype: twilio.rest.preview.understand.assistant.field_type.field_value.FieldValuePage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return FieldValuePage(self._version, response, self._solution)
+
+    def create(self, language, value, synonym_of=values.unset, deadline=None):
         """
         Create the FieldValueInstance
 
         :param unicode language: An ISO language-country string of the value.
         :param unicode value: A user-provided string that uniquely identifies this resource as an alternative to the sid. Unique up to 64 characters long.
         :param unicode synonym_of: A value that indicates this field value is a synonym of. Empty if the value is not a synonym.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created FieldValueInstance
+        :rtype: twilio.rest.preview.understand.assistant.field_type.field_value.FieldValueInstance
+        """
+        data = values.of({'Language': language, 'Value': value, 'SynonymOf': synonym_of, })
+
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return FieldValueInstance(
+            self._version,
+            payload,
+            assistant_sid=self._solution['assistant_sid'],
+            field_type_sid=self._solution['field_type_sid'],
+        )
+
+    async def create_async(self, language, value, synonym_of=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the FieldValueInstance
+
+        :param unicode language: An ISO language-country string of the value.
+        :param unicode value: A user-provided string that uniquely identifies this resource as an alternative to the sid. Unique up to 64 characters long.
+        :param unicode synonym_of: A value that indicates this field value is a synonym of. Empty if the value is not a synonym.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created FieldValueInstance
         :rtype: twilio.rest.preview.understand.assistant.field_type.field_value.FieldValueInstance
         """
         data = values.of({'Language': language, 'Value': value, 'SynonymOf': synonym_of, })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return FieldValueInstance(
             self._version,
@@ -254,7 +397,7 @@ class FieldValueContext(InstanceContext):
 
         # Path Solution
         self._solution = {'assistant_sid': assistant_sid, 'field_type_sid': field_type_sid, 'sid': sid, }
-        self._uri = '/Assistants/{assistant_sid}/FieldTypes/{field_type_sid}/FieldValues/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Assistants/{assistant_sid}/FieldTypes/{field_type_sid}/FieldValues/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -273,6 +416,23 @@ class FieldValueContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the FieldValueInstance
+
+        :returns: The fetched FieldValueInstance
+        :rtype: twilio.rest.preview.understand.assistant.field_type.field_value.FieldValueInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return FieldValueInstance(
+            self._version,
+            payload,
+            assistant_sid=self._solution['assistant_sid'],
+            field_type_sid=self._solution['field_type_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self):
         """
         Deletes the FieldValueInstance
@@ -282,6 +442,15 @@ class FieldValueContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the FieldValueInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -298,6 +467,28 @@ class FieldValueInstance(InstanceResource):
     to change. Use them with caution. If you currently do not have developer
     preview access, please contact help@twilio.com. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'field_type_sid': 'field_type_sid',
+        'language': 'language',
+        'assistant_sid': 'assistant_sid',
+        'sid': 'sid',
+        'value': 'value',
+        'url': 'url',
+        'synonym_of': 'synonym_of',
+    }, _deserializers)
+
     def __init__(self, version, payload, assistant_sid, field_type_sid, sid=None):
         """
         Initialize the FieldValueInstance
@@ -308,18 +499,7 @@ class FieldValueInstance(InstanceResource):
         super(FieldValueInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'field_type_sid': payload.get('field_type_sid'),
-            'language': payload.get('language'),
-            'assistant_sid': payload.get('assistant_sid'),
-            'sid': payload.get('sid'),
-            'value': payload.get('value'),
-            'url': payload.get('url'),
-            'synonym_of': payload.get('synonym_of'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -436,6 +616,15 @@ class FieldValueInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the FieldValueInstance
+
+        :returns: The fetched FieldValueInstance
+        :rtype: twilio.rest.preview.understand.assistant.field_type.field_value.FieldValueInstance
+        """
+        return await self._proxy.fetch_async()
+
     def delete(self):
         """
         Deletes the FieldValueInstance
@@ -445,6 +634,15 @@ class FieldValueInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the FieldValueInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
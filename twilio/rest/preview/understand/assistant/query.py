@@ -33,10 +33,11 @@ class QueryList(ListResource):
 
         # Path Solution
         self._solution = {'assistant_sid': assistant_sid, }
-        self._uri = '/Assistants/{assistant_sid}/Queries'.format(**self._solution)
+        self._uri = values.ResourceUri('/Assistants/{assistant_sid}/Queries', self._solution)
 
     def stream(self, language=values.unset, model_build=values.unset,
-               status=values.unset, limit=None, page_size=None):
+               status=values.unset, limit=None, page_size=None, prefetch=None,
+               raw=False, deadline=None):
         """
         Streams QueryInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -52,23 +53,73 @@ class QueryList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.preview.understand.assistant.query.QueryInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
-            language=language,
-            model_build=model_build,
-            status=status,
-            page_size=limits['page_size'],
-        )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                language=language,
+                model_build=model_build,
+                status=status,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, language=values.unset, model_build=values.unset,
+                           status=values.unset, limit=None, page_size=None,
+                           prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams QueryInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param unicode language: An ISO language-country string of the sample.
+        :param unicode model_build: The Model Build Sid or unique name of the Model Build to be queried.
+        :param unicode status: A string that described the query status. The values can be: pending_review, reviewed, discarded
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.preview.understand.assistant.query.QueryInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                language=language,
+                model_build=model_build,
+                status=status,
+                page_size=limits['page_size'],
+            )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, language=values.unset, model_build=values.unset,
-             status=values.unset, limit=None, page_size=None):
+             status=values.unset, limit=None, page_size=None, prefetch=None,
+             raw=False, deadline=None):
         """
         Lists QueryInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -83,6 +134,12 @@ class QueryList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.preview.understand.assistant.query.QueryInstance]
@@ -93,8 +150,49 @@ class QueryList(ListResource):
             status=status,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, language=values.unset, model_build=values.unset,
+                         status=values.unset, limit=None, page_size=None,
+                         prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists QueryInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param unicode language: An ISO language-country string of the sample.
+        :param unicode model_build: The Model Build Sid or unique name of the Model Build to be queried.
+        :param unicode status: A string that described the query status. The values can be: pending_review, reviewed, discarded
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.preview.understand.assistant.query.QueryInstance]
+        """
+        return [record async for record in await self.stream_async(
+            language=language,
+            model_build=model_build,
+            status=status,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, language=values.unset, model_build=values.unset,
              status=values.unset, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -125,6 +223,36 @@ class QueryList(ListResource):
 
         return QueryPage(self._version, response, self._solution)
 
+    async def page_async(self, language=values.unset, model_build=values.unset,
+                         status=values.unset, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of QueryInstance records from the API.
+        Request is executed immediately
+
+        :param unicode language: An ISO language-country string of the sample.
+        :param unicode model_build: The Model Build Sid or unique name of the Model Build to be queried.
+        :param unicode status: A string that described the query status. The values can be: pending_review, reviewed, discarded
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of QueryInstance
+        :rtype: twilio.rest.preview.understand.assistant.query.QueryPage
+        """
+        data = values.of({
+            'Language': language,
+            'ModelBuild': model_build,
+            'Status': status,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return QueryPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of QueryInstance records from the API.
@@ -142,8 +270,25 @@ class QueryList(ListResource):
 
         return QueryPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of QueryInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of QueryInstance
+        :rtype: twilio.rest.preview.understand.assistant.query.QueryPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return QueryPage(self._version, response, self._solution)
+
     def create(self, language, query, tasks=values.unset, model_build=values.unset,
-               field=values.unset):
+               field=values.unset, deadline=None):
         """
         Create the QueryInstance
 
@@ -152,6 +297,36 @@ class QueryList(ListResource):
         :param unicode tasks: Constraints the query to a set of tasks. Useful when you need to constrain the paths the user can take. Tasks should be comma separated task-unique-name-1, task-unique-name-2
         :param unicode model_build: The Model Build Sid or unique name of the Model Build to be queried.
         :param unicode field: Constraints the query to a given Field with an task. Useful when you know the Field you are expecting. It accepts one field in the format task-unique-name-1:field-unique-name
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created QueryInstance
+        :rtype: twilio.rest.preview.understand.assistant.query.QueryInstance
+        """
+        data = values.of({
+            'Language': language,
+            'Query': query,
+            'Tasks': tasks,
+            'ModelBuild': model_build,
+            'Field': field,
+        })
+
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return QueryInstance(self._version, payload, assistant_sid=self._solution['assistant_sid'], )
+
+    async def create_async(self, language, query, tasks=values.unset, model_build=values.unset,
+                           field=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the QueryInstance
+
+        :param unicode language: An ISO language-country string of the sample.
+        :param unicode query: A user-provided string that uniquely identifies this resource as an alternative to the sid. It can be up to 2048 characters long.
+        :param unicode tasks: Constraints the query to a set of tasks. Useful when you need to constrain the paths the user can take. Tasks should be comma separated task-unique-name-1, task-unique-name-2
+        :param unicode model_build: The Model Build Sid or unique name of the Model Build to be queried.
+        :param unicode field: Constraints the query to a given Field with an task. Useful when you know the Field you are expecting. It accepts one field in the format task-unique-name-1:field-unique-name
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created QueryInstance
         :rtype: twilio.rest.preview.understand.assistant.query.QueryInstance
@@ -164,7 +339,7 @@ class QueryList(ListResource):
             'Field': field,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return QueryInstance(self._version, payload, assistant_sid=self._solution['assistant_sid'], )
 
@@ -262,7 +437,7 @@ class QueryContext(InstanceContext):
 
         # Path Solution
         self._solution = {'assistant_sid': assistant_sid, 'sid': sid, }
-        self._uri = '/Assistants/{assistant_sid}/Queries/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Assistants/{assistant_sid}/Queries/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -280,6 +455,22 @@ class QueryContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the QueryInstance
+
+        :returns: The fetched QueryInstance
+        :rtype: twilio.rest.preview.understand.assistant.query.QueryInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return QueryInstance(
+            self._version,
+            payload,
+            assistant_sid=self._solution['assistant_sid'],
+            sid=self._solution['sid'],
+        )
+
     def update(self, sample_sid=values.unset, status=values.unset):
         """
         Update the QueryInstance
@@ -301,6 +492,27 @@ class QueryContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, sample_sid=values.unset, status=values.unset):
+        """
+        Asynchronous coroutine that updates the QueryInstance
+
+        :param unicode sample_sid: An optional reference to the Sample created from this query.
+        :param unicode status: A string that described the query status. The values can be: pending_review, reviewed, discarded
+
+        :returns: The updated QueryInstance
+        :rtype: twilio.rest.preview.understand.assistant.query.QueryInstance
+        """
+        data = values.of({'SampleSid': sample_sid, 'Status': status, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return QueryInstance(
+            self._version,
+            payload,
+            assistant_sid=self._solution['assistant_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self):
         """
         Deletes the QueryInstance
@@ -310,6 +522,15 @@ class QueryContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the QueryInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -326,6 +547,31 @@ class QueryInstance(InstanceResource):
     to change. Use them with caution. If you currently do not have developer
     preview access, please contact help@twilio.com. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'results': 'results',
+        'language': 'language',
+        'model_build_sid': 'model_build_sid',
+        'query': 'query',
+        'sample_sid': 'sample_sid',
+        'assistant_sid': 'assistant_sid',
+        'sid': 'sid',
+        'status': 'status',
+        'url': 'url',
+        'source_channel': 'source_channel',
+    }, _deserializers)
+
     def __init__(self, version, payload, assistant_sid, sid=None):
         """
         Initialize the QueryInstance
@@ -336,21 +582,7 @@ class QueryInstance(InstanceResource):
         super(QueryInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'results': payload.get('results'),
-            'language': payload.get('language'),
-            'model_build_sid': payload.get('model_build_sid'),
-            'query': payload.get('query'),
-            'sample_sid': payload.get('sample_sid'),
-            'assistant_sid': payload.get('assistant_sid'),
-            'sid': payload.get('sid'),
-            'status': payload.get('status'),
-            'url': payload.get('url'),
-            'source_channel': payload.get('source_channel'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -486,6 +718,15 @@ class QueryInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the QueryInstance
+
+        :returns: The fetched QueryInstance
+        :rtype: twilio.rest.preview.understand.assistant.query.QueryInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, sample_sid=values.unset, status=values.unset):
         """
         Update the QueryInstance
@@ -498,6 +739,18 @@ class QueryInstance(InstanceResource):
         """
         return self._proxy.update(sample_sid=sample_sid, status=status, )
 
+    async def update_async(self, sample_sid=values.unset, status=values.unset):
+        """
+        Asynchronous coroutine that updates the QueryInstance
+
+        :param unicode sample_sid: An optional reference to the Sample created from this query.
+        :param unicode status: A string that described the query status. The values can be: pending_review, reviewed, discarded
+
+        :returns: The updated QueryInstance
+        :rtype: twilio.rest.preview.understand.assistant.query.QueryInstance
+        """
+        return await self._proxy.update_async(sample_sid=sample_sid, status=status, )
+
     def delete(self):
         """
         Deletes the QueryInstance
@@ -507,6 +760,15 @@ class QueryInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the QueryInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -34,9 +34,10 @@ class SampleList(ListResource):
 
         # Path Solution
         self._solution = {'assistant_sid': assistant_sid, 'task_sid': task_sid, }
-        self._uri = '/Assistants/{assistant_sid}/Tasks/{task_sid}/Samples'.format(**self._solution)
+        self._uri = values.ResourceUri('/Assistants/{assistant_sid}/Tasks/{task_sid}/Samples', self._solution)
 
-    def stream(self, language=values.unset, limit=None, page_size=None):
+    def stream(self, language=values.unset, limit=None, page_size=None,
+               prefetch=None, raw=False, deadline=None):
         """
         Streams SampleInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -50,17 +51,59 @@ class SampleList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.preview.understand.assistant.task.sample.SampleInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(language=language, page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(language=language, page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, language=values.unset, limit=None, page_size=None):
+    async def stream_async(self, language=values.unset, limit=None, page_size=None,
+                           prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams SampleInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param unicode language: An ISO language-country string of the sample.
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.preview.understand.assistant.task.sample.SampleInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(language=language, page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, language=values.unset, limit=None, page_size=None,
+             prefetch=None, raw=False, deadline=None):
         """
         Lists SampleInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -73,11 +116,43 @@ class SampleList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.preview.understand.assistant.task.sample.SampleInstance]
+        """
+        return list(self.stream(language=language, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, language=values.unset, limit=None, page_size=None,
+                         prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists SampleInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param unicode language: An ISO language-country string of the sample.
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.preview.understand.assistant.task.sample.SampleInstance]
         """
-        return list(self.stream(language=language, limit=limit, page_size=page_size, ))
+        return [record async for record in await self.stream_async(language=language, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, language=values.unset, page_token=values.unset,
              page_number=values.unset, page_size=values.unset):
@@ -104,6 +179,31 @@ class SampleList(ListResource):
 
         return SamplePage(self._version, response, self._solution)
 
+    async def page_async(self, language=values.unset, page_token=values.unset,
+                         page_number=values.unset, page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of SampleInstance records from the API.
+        Request is executed immediately
+
+        :param unicode language: An ISO language-country string of the sample.
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of SampleInstance
+        :rtype: twilio.rest.preview.understand.assistant.task.sample.SamplePage
+        """
+        data = values.of({
+            'Language': language,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return SamplePage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of SampleInstance records from the API.
@@ -121,20 +221,63 @@ class SampleList(ListResource):
 
         return SamplePage(self._version, response, self._solution)
 
-    def create(self, language, tagged_text, source_channel=values.unset):
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of SampleInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of SampleInstance
+        :rtype: twilio.rest.preview.understand.assistant.task.sample.SamplePage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return SamplePage(self._version, response, self._solution)
+
+    def create(self, language, tagged_text, source_channel=values.unset, deadline=None):
         """
         Create the SampleInstance
 
         :param unicode language: An ISO language-country string of the sample.
         :param unicode tagged_text: The text example of how end-users may express this task. The sample may contain Field tag blocks.
         :param unicode source_channel: The communication channel the sample was captured. It can be: voice, sms, chat, alexa, google-assistant, or slack. If not included the value will be null
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created SampleInstance
         :rtype: twilio.rest.preview.understand.assistant.task.sample.SampleInstance
         """
         data = values.of({'Language': language, 'TaggedText': tagged_text, 'SourceChannel': source_channel, })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return SampleInstance(
+            self._version,
+            payload,
+            assistant_sid=self._solution['assistant_sid'],
+            task_sid=self._solution['task_sid'],
+        )
+
+    async def create_async(self, language, tagged_text, source_channel=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the SampleInstance
+
+        :param unicode language: An ISO language-country string of the sample.
+        :param unicode tagged_text: The text example of how end-users may express this task. The sample may contain Field tag blocks.
+        :param unicode source_channel: The communication channel the sample was captured. It can be: voice, sms, chat, alexa, google-assistant, or slack. If not included the value will be null
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created SampleInstance
+        :rtype: twilio.rest.preview.understand.assistant.task.sample.SampleInstance
+        """
+        data = values.of({'Language': language, 'TaggedText': tagged_text, 'SourceChannel': source_channel, })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return SampleInstance(
             self._version,
@@ -254,7 +397,7 @@ class SampleContext(InstanceContext):
 
         # Path Solution
         self._solution = {'assistant_sid': assistant_sid, 'task_sid': task_sid, 'sid': sid, }
-        self._uri = '/Assistants/{assistant_sid}/Tasks/{task_sid}/Samples/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Assistants/{assistant_sid}/Tasks/{task_sid}/Samples/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -273,6 +416,23 @@ class SampleContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the SampleInstance
+
+        :returns: The fetched SampleInstance
+        :rtype: twilio.rest.preview.understand.assistant.task.sample.SampleInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return SampleInstance(
+            self._version,
+            payload,
+            assistant_sid=self._solution['assistant_sid'],
+            task_sid=self._solution['task_sid'],
+            sid=self._solution['sid'],
+        )
+
     def update(self, language=values.unset, tagged_text=values.unset,
                source_channel=values.unset):
         """
@@ -297,6 +457,30 @@ class SampleContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, language=values.unset, tagged_text=values.unset,
+                           source_channel=values.unset):
+        """
+        Asynchronous coroutine that updates the SampleInstance
+
+        :param unicode language: An ISO language-country string of the sample.
+        :param unicode tagged_text: The text example of how end-users may express this task. The sample may contain Field tag blocks.
+        :param unicode source_channel: The communication channel the sample was captured. It can be: voice, sms, chat, alexa, google-assistant, or slack. If not included the value will be null
+
+        :returns: The updated SampleInstance
+        :rtype: twilio.rest.preview.understand.assistant.task.sample.SampleInstance
+        """
+        data = values.of({'Language': language, 'TaggedText': tagged_text, 'SourceChannel': source_channel, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return SampleInstance(
+            self._version,
+            payload,
+            assistant_sid=self._solution['assistant_sid'],
+            task_sid=self._solution['task_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self):
         """
         Deletes the SampleInstance
@@ -306,6 +490,15 @@ class SampleContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the SampleInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -322,6 +515,28 @@ class SampleInstance(InstanceResource):
     to change. Use them with caution. If you currently do not have developer
     preview access, please contact help@twilio.com. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'task_sid': 'task_sid',
+        'language': 'language',
+        'assistant_sid': 'assistant_sid',
+        'sid': 'sid',
+        'tagged_text': 'tagged_text',
+        'url': 'url',
+        'source_channel': 'source_channel',
+    }, _deserializers)
+
     def __init__(self, version, payload, assistant_sid, task_sid, sid=None):
         """
         Initialize the SampleInstance
@@ -332,18 +547,7 @@ class SampleInstance(InstanceResource):
         super(SampleInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'task_sid': payload.get('task_sid'),
-            'language': payload.get('language'),
-            'assistant_sid': payload.get('assistant_sid'),
-            'sid': payload.get('sid'),
-            'tagged_text': payload.get('tagged_text'),
-            'url': payload.get('url'),
-            'source_channel': payload.get('source_channel'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -460,6 +664,15 @@ class SampleInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the SampleInstance
+
+        :returns: The fetched SampleInstance
+        :rtype: twilio.rest.preview.understand.assistant.task.sample.SampleInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, language=values.unset, tagged_text=values.unset,
                source_channel=values.unset):
         """
@@ -474,6 +687,20 @@ class SampleInstance(InstanceResource):
         """
         return self._proxy.update(language=language, tagged_text=tagged_text, source_channel=source_channel, )
 
+    async def update_async(self, language=values.unset, tagged_text=values.unset,
+                           source_channel=values.unset):
+        """
+        Asynchronous coroutine that updates the SampleInstance
+
+        :param unicode language: An ISO language-country string of the sample.
+        :param unicode tagged_text: The text example of how end-users may express this task. The sample may contain Field tag blocks.
+        :param unicode source_channel: The communication channel the sample was captured. It can be: voice, sms, chat, alexa, google-assistant, or slack. If not included the value will be null
+
+        :returns: The updated SampleInstance
+        :rtype: twilio.rest.preview.understand.assistant.task.sample.SampleInstance
+        """
+        return await self._proxy.update_async(language=language, tagged_text=tagged_text, source_channel=source_channel, )
+
     def delete(self):
         """
         Deletes the SampleInstance
@@ -483,6 +710,15 @@ class SampleInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the SampleInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -139,7 +139,7 @@ class TaskStatisticsContext(InstanceContext):
 
         # Path Solution
         self._solution = {'assistant_sid': assistant_sid, 'task_sid': task_sid, }
-        self._uri = '/Assistants/{assistant_sid}/Tasks/{task_sid}/Statistics'.format(**self._solution)
+        self._uri = values.ResourceUri('/Assistants/{assistant_sid}/Tasks/{task_sid}/Statistics', self._solution)
 
     def fetch(self):
         """
@@ -157,6 +157,22 @@ class TaskStatisticsContext(InstanceContext):
             task_sid=self._solution['task_sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the TaskStatisticsInstance
+
+        :returns: The fetched TaskStatisticsInstance
+        :rtype: twilio.rest.preview.understand.assistant.task.task_statistics.TaskStatisticsInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return TaskStatisticsInstance(
+            self._version,
+            payload,
+            assistant_sid=self._solution['assistant_sid'],
+            task_sid=self._solution['task_sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -173,6 +189,24 @@ class TaskStatisticsInstance(InstanceResource):
     to change. Use them with caution. If you currently do not have developer
     preview access, please contact help@twilio.com. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'samples_count': deserialize.integer,
+        'fields_count': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'assistant_sid': 'assistant_sid',
+        'task_sid': 'task_sid',
+        'samples_count': 'samples_count',
+        'fields_count': 'fields_count',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload, assistant_sid, task_sid):
         """
         Initialize the TaskStatisticsInstance
@@ -183,14 +217,7 @@ class TaskStatisticsInstance(InstanceResource):
         super(TaskStatisticsInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'assistant_sid': payload.get('assistant_sid'),
-            'task_sid': payload.get('task_sid'),
-            'samples_count': deserialize.integer(payload.get('samples_count')),
-            'fields_count': deserialize.integer(payload.get('fields_count')),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -270,6 +297,15 @@ class TaskStatisticsInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the TaskStatisticsInstance
+
+        :returns: The fetched TaskStatisticsInstance
+        :rtype: twilio.rest.preview.understand.assistant.task.task_statistics.TaskStatisticsInstance
+        """
+        return await self._proxy.fetch_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
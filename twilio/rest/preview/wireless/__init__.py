@@ -6,10 +6,9 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base.version import Version
-from twilio.rest.preview.wireless.command import CommandList
-from twilio.rest.preview.wireless.rate_plan import RatePlanList
-from twilio.rest.preview.wireless.sim import SimList
 
 
 class Wireless(Version):
@@ -33,6 +32,7 @@ class Wireless(Version):
         :rtype: twilio.rest.preview.wireless.command.CommandList
         """
         if self._commands is None:
+            from twilio.rest.preview.wireless.command import CommandList
             self._commands = CommandList(self)
         return self._commands
 
@@ -42,6 +42,7 @@ class Wireless(Version):
         :rtype: twilio.rest.preview.wireless.rate_plan.RatePlanList
         """
         if self._rate_plans is None:
+            from twilio.rest.preview.wireless.rate_plan import RatePlanList
             self._rate_plans = RatePlanList(self)
         return self._rate_plans
 
@@ -51,6 +52,7 @@ class Wireless(Version):
         :rtype: twilio.rest.preview.wireless.sim.SimList
         """
         if self._sims is None:
+            from twilio.rest.preview.wireless.sim import SimList
             self._sims = SimList(self)
         return self._sims
 
@@ -62,3 +64,21 @@ class Wireless(Version):
         :rtype: str
         """
         return '<Twilio.Preview.Wireless>'
+
+
+_LAZY_IMPORTS = {
+    'CommandList': 'twilio.rest.preview.wireless.command',
+    'RatePlanList': 'twilio.rest.preview.wireless.rate_plan',
+    'SimList': 'twilio.rest.preview.wireless.sim',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
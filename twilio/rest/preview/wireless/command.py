@@ -32,10 +32,11 @@ class CommandList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Commands'.format(**self._solution)
+        self._uri = values.ResourceUri('/Commands', self._solution)
 
     def stream(self, device=values.unset, sim=values.unset, status=values.unset,
-               direction=values.unset, limit=None, page_size=None):
+               direction=values.unset, limit=None, page_size=None,
+               prefetch=None, raw=False, deadline=None):
         """
         Streams CommandInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -52,24 +53,76 @@ class CommandList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.preview.wireless.command.CommandInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
-            device=device,
-            sim=sim,
-            status=status,
-            direction=direction,
-            page_size=limits['page_size'],
-        )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                device=device,
+                sim=sim,
+                status=status,
+                direction=direction,
+                page_size=limits['page_size'],
+            )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, device=values.unset, sim=values.unset, status=values.unset,
+                           direction=values.unset, limit=None, page_size=None,
+                           prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams CommandInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param unicode device: The device
+        :param unicode sim: The sim
+        :param unicode status: The status
+        :param unicode direction: The direction
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.preview.wireless.command.CommandInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                device=device,
+                sim=sim,
+                status=status,
+                direction=direction,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, device=values.unset, sim=values.unset, status=values.unset,
-             direction=values.unset, limit=None, page_size=None):
+             direction=values.unset, limit=None, page_size=None, prefetch=None,
+             raw=False, deadline=None):
         """
         Lists CommandInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -85,6 +138,12 @@ class CommandList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.preview.wireless.command.CommandInstance]
@@ -96,8 +155,51 @@ class CommandList(ListResource):
             direction=direction,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, device=values.unset, sim=values.unset, status=values.unset,
+                         direction=values.unset, limit=None, page_size=None,
+                         prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists CommandInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param unicode device: The device
+        :param unicode sim: The sim
+        :param unicode status: The status
+        :param unicode direction: The direction
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.preview.wireless.command.CommandInstance]
+        """
+        return [record async for record in await self.stream_async(
+            device=device,
+            sim=sim,
+            status=status,
+            direction=direction,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, device=values.unset, sim=values.unset, status=values.unset,
              direction=values.unset, page_token=values.unset,
              page_number=values.unset, page_size=values.unset):
@@ -130,6 +232,38 @@ class CommandList(ListResource):
 
         return CommandPage(self._version, response, self._solution)
 
+    async def page_async(self, device=values.unset, sim=values.unset, status=values.unset,
+                         direction=values.unset, page_token=values.unset,
+                         page_number=values.unset, page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of CommandInstance records from the API.
+        Request is executed immediately
+
+        :param unicode device: The device
+        :param unicode sim: The sim
+        :param unicode status: The status
+        :param unicode direction: The direction
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of CommandInstance
+        :rtype: twilio.rest.preview.wireless.command.CommandPage
+        """
+        data = values.of({
+            'Device': device,
+            'Sim': sim,
+            'Status': status,
+            'Direction': direction,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return CommandPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of CommandInstance records from the API.
@@ -147,9 +281,26 @@ class CommandList(ListResource):
 
         return CommandPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of CommandInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of CommandInstance
+        :rtype: twilio.rest.preview.wireless.command.CommandPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return CommandPage(self._version, response, self._solution)
+
     def create(self, command, device=values.unset, sim=values.unset,
                callback_method=values.unset, callback_url=values.unset,
-               command_mode=values.unset, include_sid=values.unset):
+               command_mode=values.unset, include_sid=values.unset, deadline=None):
         """
         Create the CommandInstance
 
@@ -160,6 +311,41 @@ class CommandList(ListResource):
         :param unicode callback_url: The callback_url
         :param unicode command_mode: The command_mode
         :param unicode include_sid: The include_sid
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created CommandInstance
+        :rtype: twilio.rest.preview.wireless.command.CommandInstance
+        """
+        data = values.of({
+            'Command': command,
+            'Device': device,
+            'Sim': sim,
+            'CallbackMethod': callback_method,
+            'CallbackUrl': callback_url,
+            'CommandMode': command_mode,
+            'IncludeSid': include_sid,
+        })
+
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return CommandInstance(self._version, payload, )
+
+    async def create_async(self, command, device=values.unset, sim=values.unset,
+                           callback_method=values.unset, callback_url=values.unset,
+                           command_mode=values.unset, include_sid=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the CommandInstance
+
+        :param unicode command: The command
+        :param unicode device: The device
+        :param unicode sim: The sim
+        :param unicode callback_method: The callback_method
+        :param unicode callback_url: The callback_url
+        :param unicode command_mode: The command_mode
+        :param unicode include_sid: The include_sid
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created CommandInstance
         :rtype: twilio.rest.preview.wireless.command.CommandInstance
@@ -174,7 +360,7 @@ class CommandList(ListResource):
             'IncludeSid': include_sid,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return CommandInstance(self._version, payload, )
 
@@ -270,7 +456,7 @@ class CommandContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/Commands/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Commands/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -283,6 +469,17 @@ class CommandContext(InstanceContext):
 
         return CommandInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the CommandInstance
+
+        :returns: The fetched CommandInstance
+        :rtype: twilio.rest.preview.wireless.command.CommandInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return CommandInstance(self._version, payload, sid=self._solution['sid'], )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -299,6 +496,29 @@ class CommandInstance(InstanceResource):
     to change. Use them with caution. If you currently do not have developer
     preview access, please contact help@twilio.com. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'device_sid': 'device_sid',
+        'sim_sid': 'sim_sid',
+        'command': 'command',
+        'command_mode': 'command_mode',
+        'status': 'status',
+        'direction': 'direction',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the CommandInstance
@@ -309,19 +529,7 @@ class CommandInstance(InstanceResource):
         super(CommandInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'device_sid': payload.get('device_sid'),
-            'sim_sid': payload.get('sim_sid'),
-            'command': payload.get('command'),
-            'command_mode': payload.get('command_mode'),
-            'status': payload.get('status'),
-            'direction': payload.get('direction'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -437,6 +645,15 @@ class CommandInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the CommandInstance
+
+        :returns: The fetched CommandInstance
+        :rtype: twilio.rest.preview.wireless.command.CommandInstance
+        """
+        return await self._proxy.fetch_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -33,9 +33,9 @@ class RatePlanList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/RatePlans'.format(**self._solution)
+        self._uri = values.ResourceUri('/RatePlans', self._solution)
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams RatePlanInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -48,17 +48,57 @@ class RatePlanList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.preview.wireless.rate_plan.RatePlanInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams RatePlanInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.preview.wireless.rate_plan.RatePlanInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists RatePlanInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -70,11 +110,42 @@ class RatePlanList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.preview.wireless.rate_plan.RatePlanInstance]
+        """
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists RatePlanInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.preview.wireless.rate_plan.RatePlanInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -95,6 +166,25 @@ class RatePlanList(ListResource):
 
         return RatePlanPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of RatePlanInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of RatePlanInstance
+        :rtype: twilio.rest.preview.wireless.rate_plan.RatePlanPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return RatePlanPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of RatePlanInstance records from the API.
@@ -112,12 +202,29 @@ class RatePlanList(ListResource):
 
         return RatePlanPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of RatePlanInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of RatePlanInstance
+        :rtype: twilio.rest.preview.wireless.rate_plan.RatePlanPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return RatePlanPage(self._version, response, self._solution)
+
     def create(self, unique_name=values.unset, friendly_name=values.unset,
                data_enabled=values.unset, data_limit=values.unset,
                data_metering=values.unset, messaging_enabled=values.unset,
                voice_enabled=values.unset, commands_enabled=values.unset,
                national_roaming_enabled=values.unset,
-               international_roaming=values.unset):
+               international_roaming=values.unset, deadline=None):
         """
         Create the RatePlanInstance
 
@@ -131,6 +238,8 @@ class RatePlanList(ListResource):
         :param bool commands_enabled: The commands_enabled
         :param bool national_roaming_enabled: The national_roaming_enabled
         :param list[unicode] international_roaming: The international_roaming
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created RatePlanInstance
         :rtype: twilio.rest.preview.wireless.rate_plan.RatePlanInstance
@@ -148,7 +257,49 @@ class RatePlanList(ListResource):
             'InternationalRoaming': serialize.map(international_roaming, lambda e: e),
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return RatePlanInstance(self._version, payload, )
+
+    async def create_async(self, unique_name=values.unset, friendly_name=values.unset,
+                           data_enabled=values.unset, data_limit=values.unset,
+                           data_metering=values.unset, messaging_enabled=values.unset,
+                           voice_enabled=values.unset, commands_enabled=values.unset,
+                           national_roaming_enabled=values.unset,
+                           international_roaming=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the RatePlanInstance
+
+        :param unicode unique_name: The unique_name
+        :param unicode friendly_name: The friendly_name
+        :param bool data_enabled: The data_enabled
+        :param unicode data_limit: The data_limit
+        :param unicode data_metering: The data_metering
+        :param bool messaging_enabled: The messaging_enabled
+        :param bool voice_enabled: The voice_enabled
+        :param bool commands_enabled: The commands_enabled
+        :param bool national_roaming_enabled: The national_roaming_enabled
+        :param list[unicode] international_roaming: The international_roaming
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created RatePlanInstance
+        :rtype: twilio.rest.preview.wireless.rate_plan.RatePlanInstance
+        """
+        data = values.of({
+            'UniqueName': unique_name,
+            'FriendlyName': friendly_name,
+            'DataEnabled': data_enabled,
+            'DataLimit': data_limit,
+            'DataMetering': data_metering,
+            'MessagingEnabled': messaging_enabled,
+            'VoiceEnabled': voice_enabled,
+            'CommandsEnabled': commands_enabled,
+            'NationalRoamingEnabled': national_roaming_enabled,
+            'InternationalRoaming': serialize.map(international_roaming, lambda e: e),
+        })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return RatePlanInstance(self._version, payload, )
 
@@ -244,7 +395,7 @@ class RatePlanContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/RatePlans/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/RatePlans/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -257,6 +408,17 @@ class RatePlanContext(InstanceContext):
 
         return RatePlanInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the RatePlanInstance
+
+        :returns: The fetched RatePlanInstance
+        :rtype: twilio.rest.preview.wireless.rate_plan.RatePlanInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return RatePlanInstance(self._version, payload, sid=self._solution['sid'], )
+
     def update(self, unique_name=values.unset, friendly_name=values.unset):
         """
         Update the RatePlanInstance
@@ -273,6 +435,22 @@ class RatePlanContext(InstanceContext):
 
         return RatePlanInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def update_async(self, unique_name=values.unset, friendly_name=values.unset):
+        """
+        Asynchronous coroutine that updates the RatePlanInstance
+
+        :param unicode unique_name: The unique_name
+        :param unicode friendly_name: The friendly_name
+
+        :returns: The updated RatePlanInstance
+        :rtype: twilio.rest.preview.wireless.rate_plan.RatePlanInstance
+        """
+        data = values.of({'UniqueName': unique_name, 'FriendlyName': friendly_name, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return RatePlanInstance(self._version, payload, sid=self._solution['sid'], )
+
     def delete(self):
         """
         Deletes the RatePlanInstance
@@ -282,6 +460,15 @@ class RatePlanContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the RatePlanInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -298,6 +485,33 @@ class RatePlanInstance(InstanceResource):
     to change. Use them with caution. If you currently do not have developer
     preview access, please contact help@twilio.com. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'data_limit': deserialize.integer,
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'unique_name': 'unique_name',
+        'account_sid': 'account_sid',
+        'friendly_name': 'friendly_name',
+        'data_enabled': 'data_enabled',
+        'data_metering': 'data_metering',
+        'data_limit': 'data_limit',
+        'messaging_enabled': 'messaging_enabled',
+        'voice_enabled': 'voice_enabled',
+        'national_roaming_enabled': 'national_roaming_enabled',
+        'international_roaming': 'international_roaming',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the RatePlanInstance
@@ -308,22 +522,7 @@ class RatePlanInstance(InstanceResource):
         super(RatePlanInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'unique_name': payload.get('unique_name'),
-            'account_sid': payload.get('account_sid'),
-            'friendly_name': payload.get('friendly_name'),
-            'data_enabled': payload.get('data_enabled'),
-            'data_metering': payload.get('data_metering'),
-            'data_limit': deserialize.integer(payload.get('data_limit')),
-            'messaging_enabled': payload.get('messaging_enabled'),
-            'voice_enabled': payload.get('voice_enabled'),
-            'national_roaming_enabled': payload.get('national_roaming_enabled'),
-            'international_roaming': payload.get('international_roaming'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -463,6 +662,15 @@ class RatePlanInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the RatePlanInstance
+
+        :returns: The fetched RatePlanInstance
+        :rtype: twilio.rest.preview.wireless.rate_plan.RatePlanInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, unique_name=values.unset, friendly_name=values.unset):
         """
         Update the RatePlanInstance
@@ -475,6 +683,18 @@ class RatePlanInstance(InstanceResource):
         """
         return self._proxy.update(unique_name=unique_name, friendly_name=friendly_name, )
 
+    async def update_async(self, unique_name=values.unset, friendly_name=values.unset):
+        """
+        Asynchronous coroutine that updates the RatePlanInstance
+
+        :param unicode unique_name: The unique_name
+        :param unicode friendly_name: The friendly_name
+
+        :returns: The updated RatePlanInstance
+        :rtype: twilio.rest.preview.wireless.rate_plan.RatePlanInstance
+        """
+        return await self._proxy.update_async(unique_name=unique_name, friendly_name=friendly_name, )
+
     def delete(self):
         """
         Deletes the RatePlanInstance
@@ -484,6 +704,15 @@ class RatePlanInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the RatePlanInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -6,13 +6,14 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.preview.wireless.sim.usage import UsageList
 
 
 class SimList(ListResource):
@@ -33,11 +34,12 @@ class SimList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Sims'.format(**self._solution)
+        self._uri = values.ResourceUri('/Sims', self._solution)
 
     def stream(self, status=values.unset, iccid=values.unset,
                rate_plan=values.unset, e_id=values.unset,
-               sim_registration_code=values.unset, limit=None, page_size=None):
+               sim_registration_code=values.unset, limit=None, page_size=None,
+               prefetch=None, raw=False, deadline=None):
         """
         Streams SimInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -55,26 +57,80 @@ class SimList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.preview.wireless.sim.SimInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
-            status=status,
-            iccid=iccid,
-            rate_plan=rate_plan,
-            e_id=e_id,
-            sim_registration_code=sim_registration_code,
-            page_size=limits['page_size'],
-        )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                status=status,
+                iccid=iccid,
+                rate_plan=rate_plan,
+                e_id=e_id,
+                sim_registration_code=sim_registration_code,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, status=values.unset, iccid=values.unset,
+                           rate_plan=values.unset, e_id=values.unset,
+                           sim_registration_code=values.unset, limit=None, page_size=None,
+                           prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams SimInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param unicode status: The status
+        :param unicode iccid: The iccid
+        :param unicode rate_plan: The rate_plan
+        :param unicode e_id: The e_id
+        :param unicode sim_registration_code: The sim_registration_code
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.preview.wireless.sim.SimInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                status=status,
+                iccid=iccid,
+                rate_plan=rate_plan,
+                e_id=e_id,
+                sim_registration_code=sim_registration_code,
+                page_size=limits['page_size'],
+            )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, status=values.unset, iccid=values.unset, rate_plan=values.unset,
              e_id=values.unset, sim_registration_code=values.unset, limit=None,
-             page_size=None):
+             page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists SimInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -91,6 +147,12 @@ class SimList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.preview.wireless.sim.SimInstance]
@@ -103,8 +165,53 @@ class SimList(ListResource):
             sim_registration_code=sim_registration_code,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, status=values.unset, iccid=values.unset, rate_plan=values.unset,
+                         e_id=values.unset, sim_registration_code=values.unset, limit=None,
+                         page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists SimInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param unicode status: The status
+        :param unicode iccid: The iccid
+        :param unicode rate_plan: The rate_plan
+        :param unicode e_id: The e_id
+        :param unicode sim_registration_code: The sim_registration_code
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.preview.wireless.sim.SimInstance]
+        """
+        return [record async for record in await self.stream_async(
+            status=status,
+            iccid=iccid,
+            rate_plan=rate_plan,
+            e_id=e_id,
+            sim_registration_code=sim_registration_code,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, status=values.unset, iccid=values.unset, rate_plan=values.unset,
              e_id=values.unset, sim_registration_code=values.unset,
              page_token=values.unset, page_number=values.unset,
@@ -140,6 +247,41 @@ class SimList(ListResource):
 
         return SimPage(self._version, response, self._solution)
 
+    async def page_async(self, status=values.unset, iccid=values.unset, rate_plan=values.unset,
+                         e_id=values.unset, sim_registration_code=values.unset,
+                         page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of SimInstance records from the API.
+        Request is executed immediately
+
+        :param unicode status: The status
+        :param unicode iccid: The iccid
+        :param unicode rate_plan: The rate_plan
+        :param unicode e_id: The e_id
+        :param unicode sim_registration_code: The sim_registration_code
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of SimInstance
+        :rtype: twilio.rest.preview.wireless.sim.SimPage
+        """
+        data = values.of({
+            'Status': status,
+            'Iccid': iccid,
+            'RatePlan': rate_plan,
+            'EId': e_id,
+            'SimRegistrationCode': sim_registration_code,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return SimPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of SimInstance records from the API.
@@ -157,6 +299,23 @@ class SimList(ListResource):
 
         return SimPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of SimInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of SimInstance
+        :rtype: twilio.rest.preview.wireless.sim.SimPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return SimPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a SimContext
@@ -249,7 +408,7 @@ class SimContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/Sims/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Sims/{sid}', self._solution)
 
         # Dependents
         self._usage = None
@@ -265,6 +424,17 @@ class SimContext(InstanceContext):
 
         return SimInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the SimInstance
+
+        :returns: The fetched SimInstance
+        :rtype: twilio.rest.preview.wireless.sim.SimInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return SimInstance(self._version, payload, sid=self._solution['sid'], )
+
     def update(self, unique_name=values.unset, callback_method=values.unset,
                callback_url=values.unset, friendly_name=values.unset,
                rate_plan=values.unset, status=values.unset,
@@ -320,6 +490,61 @@ class SimContext(InstanceContext):
 
         return SimInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def update_async(self, unique_name=values.unset, callback_method=values.unset,
+                           callback_url=values.unset, friendly_name=values.unset,
+                           rate_plan=values.unset, status=values.unset,
+                           commands_callback_method=values.unset,
+                           commands_callback_url=values.unset, sms_fallback_method=values.unset,
+                           sms_fallback_url=values.unset, sms_method=values.unset,
+                           sms_url=values.unset, voice_fallback_method=values.unset,
+                           voice_fallback_url=values.unset, voice_method=values.unset,
+                           voice_url=values.unset):
+        """
+        Asynchronous coroutine that updates the SimInstance
+
+        :param unicode unique_name: The unique_name
+        :param unicode callback_method: The callback_method
+        :param unicode callback_url: The callback_url
+        :param unicode friendly_name: The friendly_name
+        :param unicode rate_plan: The rate_plan
+        :param unicode status: The status
+        :param unicode commands_callback_method: The commands_callback_method
+        :param unicode commands_callback_url: The commands_callback_url
+        :param unicode sms_fallback_method: The sms_fallback_method
+        :param unicode sms_fallback_url: The sms_fallback_url
+        :param unicode sms_method: The sms_method
+        :param unicode sms_url: The sms_url
+        :param unicode voice_fallback_method: The voice_fallback_method
+        :param unicode voice_fallback_url: The voice_fallback_url
+        :param unicode voice_method: The voice_method
+        :param unicode voice_url: The voice_url
+
+        :returns: The updated SimInstance
+        :rtype: twilio.rest.preview.wireless.sim.SimInstance
+        """
+        data = values.of({
+            'UniqueName': unique_name,
+            'CallbackMethod': callback_method,
+            'CallbackUrl': callback_url,
+            'FriendlyName': friendly_name,
+            'RatePlan': rate_plan,
+            'Status': status,
+            'CommandsCallbackMethod': commands_callback_method,
+            'CommandsCallbackUrl': commands_callback_url,
+            'SmsFallbackMethod': sms_fallback_method,
+            'SmsFallbackUrl': sms_fallback_url,
+            'SmsMethod': sms_method,
+            'SmsUrl': sms_url,
+            'VoiceFallbackMethod': voice_fallback_method,
+            'VoiceFallbackUrl': voice_fallback_url,
+            'VoiceMethod': voice_method,
+            'VoiceUrl': voice_url,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return SimInstance(self._version, payload, sid=self._solution['sid'], )
+
     @property
     def usage(self):
         """
@@ -329,6 +554,7 @@ class SimContext(InstanceContext):
         :rtype: twilio.rest.preview.wireless.sim.usage.UsageList
         """
         if self._usage is None:
+            from twilio.rest.preview.wireless.sim.usage import UsageList
             self._usage = UsageList(self._version, sim_sid=self._solution['sid'], )
         return self._usage
 
@@ -348,6 +574,40 @@ class SimInstance(InstanceResource):
     to change. Use them with caution. If you currently do not have developer
     preview access, please contact help@twilio.com. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'unique_name': 'unique_name',
+        'account_sid': 'account_sid',
+        'rate_plan_sid': 'rate_plan_sid',
+        'friendly_name': 'friendly_name',
+        'iccid': 'iccid',
+        'e_id': 'e_id',
+        'status': 'status',
+        'commands_callback_url': 'commands_callback_url',
+        'commands_callback_method': 'commands_callback_method',
+        'sms_fallback_method': 'sms_fallback_method',
+        'sms_fallback_url': 'sms_fallback_url',
+        'sms_method': 'sms_method',
+        'sms_url': 'sms_url',
+        'voice_fallback_method': 'voice_fallback_method',
+        'voice_fallback_url': 'voice_fallback_url',
+        'voice_method': 'voice_method',
+        'voice_url': 'voice_url',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'url': 'url',
+        'links': 'links',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the SimInstance
@@ -358,30 +618,7 @@ class SimInstance(InstanceResource):
         super(SimInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'unique_name': payload.get('unique_name'),
-            'account_sid': payload.get('account_sid'),
-            'rate_plan_sid': payload.get('rate_plan_sid'),
-            'friendly_name': payload.get('friendly_name'),
-            'iccid': payload.get('iccid'),
-            'e_id': payload.get('e_id'),
-            'status': payload.get('status'),
-            'commands_callback_url': payload.get('commands_callback_url'),
-            'commands_callback_method': payload.get('commands_callback_method'),
-            'sms_fallback_method': payload.get('sms_fallback_method'),
-            'sms_fallback_url': payload.get('sms_fallback_url'),
-            'sms_method': payload.get('sms_method'),
-            'sms_url': payload.get('sms_url'),
-            'voice_fallback_method': payload.get('voice_fallback_method'),
-            'voice_fallback_url': payload.get('voice_fallback_url'),
-            'voice_method': payload.get('voice_method'),
-            'voice_url': payload.get('voice_url'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -585,6 +822,15 @@ class SimInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the SimInstance
+
+        :returns: The fetched SimInstance
+        :rtype: twilio.rest.preview.wireless.sim.SimInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, unique_name=values.unset, callback_method=values.unset,
                callback_url=values.unset, friendly_name=values.unset,
                rate_plan=values.unset, status=values.unset,
@@ -636,6 +882,57 @@ class SimInstance(InstanceResource):
             voice_url=voice_url,
         )
 
+    async def update_async(self, unique_name=values.unset, callback_method=values.unset,
+                           callback_url=values.unset, friendly_name=values.unset,
+                           rate_plan=values.unset, status=values.unset,
+                           commands_callback_method=values.unset,
+                           commands_callback_url=values.unset, sms_fallback_method=values.unset,
+                           sms_fallback_url=values.unset, sms_method=values.unset,
+                           sms_url=values.unset, voice_fallback_method=values.unset,
+                           voice_fallback_url=values.unset, voice_method=values.unset,
+                           voice_url=values.unset):
+        """
+        Asynchronous coroutine that updates the SimInstance
+
+        :param unicode unique_name: The unique_name
+        :param unicode callback_method: The callback_method
+        :param unicode callback_url: The callback_url
+        :param unicode friendly_name: The friendly_name
+        :param unicode rate_plan: The rate_plan
+        :param unicode status: The status
+        :param unicode commands_callback_method: The commands_callback_method
+        :param unicode commands_callback_url: The commands_callback_url
+        :param unicode sms_fallback_method: The sms_fallback_method
+        :param unicode sms_fallback_url: The sms_fallback_url
+        :param unicode sms_method: The sms_method
+        :param unicode sms_url: The sms_url
+        :param unicode voice_fallback_method: The voice_fallback_method
+        :param unicode voice_fallback_url: The voice_fallback_url
+        :param unicode voice_method: The voice_method
+        :param unicode voice_url: The voice_url
+
+        :returns: The updated SimInstance
+        :rtype: twilio.rest.preview.wireless.sim.SimInstance
+        """
+        return await self._proxy.update_async(
+            unique_name=unique_name,
+            callback_method=callback_method,
+            callback_url=callback_url,
+            friendly_name=friendly_name,
+            rate_plan=rate_plan,
+            status=status,
+            commands_callback_method=commands_callback_method,
+            commands_callback_url=commands_callback_url,
+            sms_fallback_method=sms_fallback_method,
+            sms_fallback_url=sms_fallback_url,
+            sms_method=sms_method,
+            sms_url=sms_url,
+            voice_fallback_method=voice_fallback_method,
+            voice_fallback_url=voice_fallback_url,
+            voice_method=voice_method,
+            voice_url=voice_url,
+        )
+
     @property
     def usage(self):
         """
@@ -655,3 +952,19 @@ class SimInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Preview.Wireless.SimInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'UsageList': 'twilio.rest.preview.wireless.sim.usage',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -6,6 +6,7 @@ This code was generated by
       /       /
 """
 
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
@@ -122,7 +123,7 @@ class UsageContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sim_sid': sim_sid, }
-        self._uri = '/Sims/{sim_sid}/Usage'.format(**self._solution)
+        self._uri = values.ResourceUri('/Sims/{sim_sid}/Usage', self._solution)
 
     def fetch(self, end=values.unset, start=values.unset):
         """
@@ -140,6 +141,22 @@ class UsageContext(InstanceContext):
 
         return UsageInstance(self._version, payload, sim_sid=self._solution['sim_sid'], )
 
+    async def fetch_async(self, end=values.unset, start=values.unset):
+        """
+        Asynchronous coroutine that fetches the UsageInstance
+
+        :param unicode end: The end
+        :param unicode start: The start
+
+        :returns: The fetched UsageInstance
+        :rtype: twilio.rest.preview.wireless.sim.usage.UsageInstance
+        """
+        data = values.of({'End': end, 'Start': start, })
+
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, params=data, )
+
+        return UsageInstance(self._version, payload, sim_sid=self._solution['sim_sid'], )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -156,6 +173,21 @@ class UsageInstance(InstanceResource):
     to change. Use them with caution. If you currently do not have developer
     preview access, please contact help@twilio.com. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sim_sid': 'sim_sid',
+        'sim_unique_name': 'sim_unique_name',
+        'account_sid': 'account_sid',
+        'period': 'period',
+        'commands_usage': 'commands_usage',
+        'commands_costs': 'commands_costs',
+        'data_usage': 'data_usage',
+        'data_costs': 'data_costs',
+        'url': 'url',
+    })
+
     def __init__(self, version, payload, sim_sid):
         """
         Initialize the UsageInstance
@@ -166,17 +198,7 @@ class UsageInstance(InstanceResource):
         super(UsageInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sim_sid': payload.get('sim_sid'),
-            'sim_unique_name': payload.get('sim_unique_name'),
-            'account_sid': payload.get('account_sid'),
-            'period': payload.get('period'),
-            'commands_usage': payload.get('commands_usage'),
-            'commands_costs': payload.get('commands_costs'),
-            'data_usage': payload.get('data_usage'),
-            'data_costs': payload.get('data_costs'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -279,6 +301,18 @@ class UsageInstance(InstanceResource):
         """
         return self._proxy.fetch(end=end, start=start, )
 
+    async def fetch_async(self, end=values.unset, start=values.unset):
+        """
+        Asynchronous coroutine that fetches the UsageInstance
+
+        :param unicode end: The end
+        :param unicode start: The start
+
+        :returns: The fetched UsageInstance
+        :rtype: twilio.rest.preview.wireless.sim.usage.UsageInstance
+        """
+        return await self._proxy.fetch_async(end=end, start=start, )
+
     def __repr__(self):
         """
         Provide a friendly representation
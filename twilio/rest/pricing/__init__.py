@@ -6,9 +6,9 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base.domain import Domain
-from twilio.rest.pricing.v1 import V1
-from twilio.rest.pricing.v2 import V2
 
 
 class Pricing(Domain):
@@ -35,6 +35,7 @@ class Pricing(Domain):
         :rtype: twilio.rest.pricing.v1.V1
         """
         if self._v1 is None:
+            from twilio.rest.pricing.v1 import V1
             self._v1 = V1(self)
         return self._v1
 
@@ -45,6 +46,7 @@ class Pricing(Domain):
         :rtype: twilio.rest.pricing.v2.V2
         """
         if self._v2 is None:
+            from twilio.rest.pricing.v2 import V2
             self._v2 = V2(self)
         return self._v2
 
@@ -91,3 +93,20 @@ class Pricing(Domain):
         :rtype: str
         """
         return '<Twilio.Pricing>'
+
+
+_LAZY_IMPORTS = {
+    'V1': 'twilio.rest.pricing.v1',
+    'V2': 'twilio.rest.pricing.v2',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -6,10 +6,9 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base.version import Version
-from twilio.rest.pricing.v1.messaging import MessagingList
-from twilio.rest.pricing.v1.phone_number import PhoneNumberList
-from twilio.rest.pricing.v1.voice import VoiceList
 
 
 class V1(Version):
@@ -33,6 +32,7 @@ class V1(Version):
         :rtype: twilio.rest.pricing.v1.messaging.MessagingList
         """
         if self._messaging is None:
+            from twilio.rest.pricing.v1.messaging import MessagingList
             self._messaging = MessagingList(self)
         return self._messaging
 
@@ -42,6 +42,7 @@ class V1(Version):
         :rtype: twilio.rest.pricing.v1.phone_number.PhoneNumberList
         """
         if self._phone_numbers is None:
+            from twilio.rest.pricing.v1.phone_number import PhoneNumberList
             self._phone_numbers = PhoneNumberList(self)
         return self._phone_numbers
 
@@ -51,6 +52,7 @@ class V1(Version):
         :rtype: twilio.rest.pricing.v1.voice.VoiceList
         """
         if self._voice is None:
+            from twilio.rest.pricing.v1.voice import VoiceList
             self._voice = VoiceList(self)
         return self._voice
 
@@ -62,3 +64,21 @@ class V1(Version):
         :rtype: str
         """
         return '<Twilio.Pricing.V1>'
+
+
+_LAZY_IMPORTS = {
+    'MessagingList': 'twilio.rest.pricing.v1.messaging',
+    'PhoneNumberList': 'twilio.rest.pricing.v1.phone_number',
+    'VoiceList': 'twilio.rest.pricing.v1.voice',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -6,6 +6,7 @@ This code was generated by
       /       /
 """
 
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
@@ -28,9 +29,9 @@ class CountryList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Messaging/Countries'.format(**self._solution)
+        self._uri = values.ResourceUri('/Messaging/Countries', self._solution)
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams CountryInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -43,17 +44,57 @@ class CountryList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.pricing.v1.messaging.country.CountryInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams CountryInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.pricing.v1.messaging.country.CountryInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists CountryInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -65,11 +106,42 @@ class CountryList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.pricing.v1.messaging.country.CountryInstance]
+        """
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists CountryInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.pricing.v1.messaging.country.CountryInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -90,6 +162,25 @@ class CountryList(ListResource):
 
         return CountryPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of CountryInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of CountryInstance
+        :rtype: twilio.rest.pricing.v1.messaging.country.CountryPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return CountryPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of CountryInstance records from the API.
@@ -107,6 +198,23 @@ class CountryList(ListResource):
 
         return CountryPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of CountryInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of CountryInstance
+        :rtype: twilio.rest.pricing.v1.messaging.country.CountryPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return CountryPage(self._version, response, self._solution)
+
     def get(self, iso_country):
         """
         Constructs a CountryContext
@@ -193,7 +301,7 @@ class CountryContext(InstanceContext):
 
         # Path Solution
         self._solution = {'iso_country': iso_country, }
-        self._uri = '/Messaging/Countries/{iso_country}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Messaging/Countries/{iso_country}', self._solution)
 
     def fetch(self):
         """
@@ -206,6 +314,17 @@ class CountryContext(InstanceContext):
 
         return CountryInstance(self._version, payload, iso_country=self._solution['iso_country'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the CountryInstance
+
+        :returns: The fetched CountryInstance
+        :rtype: twilio.rest.pricing.v1.messaging.country.CountryInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return CountryInstance(self._version, payload, iso_country=self._solution['iso_country'], )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -219,6 +338,18 @@ class CountryContext(InstanceContext):
 
 class CountryInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'country': 'country',
+        'iso_country': 'iso_country',
+        'outbound_sms_prices': 'outbound_sms_prices',
+        'inbound_sms_prices': 'inbound_sms_prices',
+        'price_unit': 'price_unit',
+        'url': 'url',
+    })
+
     def __init__(self, version, payload, iso_country=None):
         """
         Initialize the CountryInstance
@@ -229,14 +360,7 @@ class CountryInstance(InstanceResource):
         super(CountryInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'country': payload.get('country'),
-            'iso_country': payload.get('iso_country'),
-            'outbound_sms_prices': payload.get('outbound_sms_prices'),
-            'inbound_sms_prices': payload.get('inbound_sms_prices'),
-            'price_unit': payload.get('price_unit'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -312,6 +436,15 @@ class CountryInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the CountryInstance
+
+        :returns: The fetched CountryInstance
+        :rtype: twilio.rest.pricing.v1.messaging.country.CountryInstance
+        """
+        return await self._proxy.fetch_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -6,10 +6,12 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
+from twilio.base import deserialize
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.pricing.v1.phone_number.country import CountryList
 
 
 class PhoneNumberList(ListResource):
@@ -40,6 +42,7 @@ class PhoneNumberList(ListResource):
         :rtype: twilio.rest.pricing.v1.phone_number.country.CountryList
         """
         if self._countries is None:
+            from twilio.rest.pricing.v1.phone_number.country import CountryList
             self._countries = CountryList(self._version, )
         return self._countries
 
@@ -93,6 +96,15 @@ class PhoneNumberPage(Page):
 
 class PhoneNumberInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'name': 'name',
+        'url': 'url',
+        'links': 'links',
+    })
+
     def __init__(self, version, payload):
         """
         Initialize the PhoneNumberInstance
@@ -103,11 +115,7 @@ class PhoneNumberInstance(InstanceResource):
         super(PhoneNumberInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'name': payload.get('name'),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -145,3 +153,19 @@ class PhoneNumberInstance(InstanceResource):
         :rtype: str
         """
         return '<Twilio.Pricing.V1.PhoneNumberInstance>'
+
+
+_LAZY_IMPORTS = {
+    'CountryList': 'twilio.rest.pricing.v1.phone_number.country',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -6,11 +6,12 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
+from twilio.base import deserialize
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.pricing.v1.voice.country import CountryList
-from twilio.rest.pricing.v1.voice.number import NumberList
 
 
 class VoiceList(ListResource):
@@ -42,6 +43,7 @@ class VoiceList(ListResource):
         :rtype: twilio.rest.pricing.v1.voice.number.NumberList
         """
         if self._numbers is None:
+            from twilio.rest.pricing.v1.voice.number import NumberList
             self._numbers = NumberList(self._version, )
         return self._numbers
 
@@ -54,6 +56,7 @@ class VoiceList(ListResource):
         :rtype: twilio.rest.pricing.v1.voice.country.CountryList
         """
         if self._countries is None:
+            from twilio.rest.pricing.v1.voice.country import CountryList
             self._countries = CountryList(self._version, )
         return self._countries
 
@@ -107,6 +110,15 @@ class VoicePage(Page):
 
 class VoiceInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'name': 'name',
+        'url': 'url',
+        'links': 'links',
+    })
+
     def __init__(self, version, payload):
         """
         Initialize the VoiceInstance
@@ -117,11 +129,7 @@ class VoiceInstance(InstanceResource):
         super(VoiceInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'name': payload.get('name'),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -159,3 +167,20 @@ class VoiceInstance(InstanceResource):
         :rtype: str
         """
         return '<Twilio.Pricing.V1.VoiceInstance>'
+
+
+_LAZY_IMPORTS = {
+    'CountryList': 'twilio.rest.pricing.v1.voice.country',
+    'NumberList': 'twilio.rest.pricing.v1.voice.number',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -6,6 +6,7 @@ This code was generated by
       /       /
 """
 
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
@@ -115,7 +116,7 @@ class NumberContext(InstanceContext):
 
         # Path Solution
         self._solution = {'number': number, }
-        self._uri = '/Voice/Numbers/{number}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Voice/Numbers/{number}', self._solution)
 
     def fetch(self):
         """
@@ -128,6 +129,17 @@ class NumberContext(InstanceContext):
 
         return NumberInstance(self._version, payload, number=self._solution['number'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the NumberInstance
+
+        :returns: The fetched NumberInstance
+        :rtype: twilio.rest.pricing.v1.voice.number.NumberInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return NumberInstance(self._version, payload, number=self._solution['number'], )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -141,6 +153,19 @@ class NumberContext(InstanceContext):
 
 class NumberInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'number': 'number',
+        'country': 'country',
+        'iso_country': 'iso_country',
+        'outbound_call_price': 'outbound_call_price',
+        'inbound_call_price': 'inbound_call_price',
+        'price_unit': 'price_unit',
+        'url': 'url',
+    })
+
     def __init__(self, version, payload, number=None):
         """
         Initialize the NumberInstance
@@ -151,15 +176,7 @@ class NumberInstance(InstanceResource):
         super(NumberInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'number': payload.get('number'),
-            'country': payload.get('country'),
-            'iso_country': payload.get('iso_country'),
-            'outbound_call_price': payload.get('outbound_call_price'),
-            'inbound_call_price': payload.get('inbound_call_price'),
-            'price_unit': payload.get('price_unit'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -243,6 +260,15 @@ class NumberInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the NumberInstance
+
+        :returns: The fetched NumberInstance
+        :rtype: twilio.rest.pricing.v1.voice.number.NumberInstance
+        """
+        return await self._proxy.fetch_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
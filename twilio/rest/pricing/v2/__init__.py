@@ -6,10 +6,9 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base.version import Version
-from twilio.rest.pricing.v2.country import CountryList
-from twilio.rest.pricing.v2.number import NumberList
-from twilio.rest.pricing.v2.voice import VoiceList
 
 
 class V2(Version):
@@ -33,6 +32,7 @@ class V2(Version):
         :rtype: twilio.rest.pricing.v2.country.CountryList
         """
         if self._countries is None:
+            from twilio.rest.pricing.v2.country import CountryList
             self._countries = CountryList(self)
         return self._countries
 
@@ -42,6 +42,7 @@ class V2(Version):
         :rtype: twilio.rest.pricing.v2.number.NumberList
         """
         if self._numbers is None:
+            from twilio.rest.pricing.v2.number import NumberList
             self._numbers = NumberList(self)
         return self._numbers
 
@@ -51,6 +52,7 @@ class V2(Version):
         :rtype: twilio.rest.pricing.v2.voice.VoiceList
         """
         if self._voice is None:
+            from twilio.rest.pricing.v2.voice import VoiceList
             self._voice = VoiceList(self)
         return self._voice
 
@@ -62,3 +64,21 @@ class V2(Version):
         :rtype: str
         """
         return '<Twilio.Pricing.V2>'
+
+
+_LAZY_IMPORTS = {
+    'CountryList': 'twilio.rest.pricing.v2.country',
+    'NumberList': 'twilio.rest.pricing.v2.number',
+    'VoiceList': 'twilio.rest.pricing.v2.voice',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -6,6 +6,7 @@ This code was generated by
       /       /
 """
 
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
@@ -115,7 +116,7 @@ class NumberContext(InstanceContext):
 
         # Path Solution
         self._solution = {'destination_number': destination_number, }
-        self._uri = '/Voice/Numbers/{destination_number}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Voice/Numbers/{destination_number}', self._solution)
 
     def fetch(self, origination_number=values.unset):
         """
@@ -136,6 +137,25 @@ class NumberContext(InstanceContext):
             destination_number=self._solution['destination_number'],
         )
 
+    async def fetch_async(self, origination_number=values.unset):
+        """
+        Asynchronous coroutine that fetches the NumberInstance
+
+        :param unicode origination_number: The origination number for which to fetch pricing information
+
+        :returns: The fetched NumberInstance
+        :rtype: twilio.rest.pricing.v2.voice.number.NumberInstance
+        """
+        data = values.of({'OriginationNumber': origination_number, })
+
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, params=data, )
+
+        return NumberInstance(
+            self._version,
+            payload,
+            destination_number=self._solution['destination_number'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -149,6 +169,20 @@ class NumberContext(InstanceContext):
 
 class NumberInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'destination_number': 'destination_number',
+        'origination_number': 'origination_number',
+        'country': 'country',
+        'iso_country': 'iso_country',
+        'outbound_call_prices': 'outbound_call_prices',
+        'inbound_call_price': 'inbound_call_price',
+        'price_unit': 'price_unit',
+        'url': 'url',
+    })
+
     def __init__(self, version, payload, destination_number=None):
         """
         Initialize the NumberInstance
@@ -159,16 +193,7 @@ class NumberInstance(InstanceResource):
         super(NumberInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'destination_number': payload.get('destination_number'),
-            'origination_number': payload.get('origination_number'),
-            'country': payload.get('country'),
-            'iso_country': payload.get('iso_country'),
-            'outbound_call_prices': payload.get('outbound_call_prices'),
-            'inbound_call_price': payload.get('inbound_call_price'),
-            'price_unit': payload.get('price_unit'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -267,6 +292,17 @@ class NumberInstance(InstanceResource):
         """
         return self._proxy.fetch(origination_number=origination_number, )
 
+    async def fetch_async(self, origination_number=values.unset):
+        """
+        Asynchronous coroutine that fetches the NumberInstance
+
+        :param unicode origination_number: The origination number for which to fetch pricing information
+
+        :returns: The fetched NumberInstance
+        :rtype: twilio.rest.pricing.v2.voice.number.NumberInstance
+        """
+        return await self._proxy.fetch_async(origination_number=origination_number, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -6,15 +6,14 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.proxy.v1.service.phone_number import PhoneNumberList
-from twilio.rest.proxy.v1.service.session import SessionList
-from twilio.rest.proxy.v1.service.short_code import ShortCodeList
 
 
 class ServiceList(ListResource):
@@ -34,9 +33,9 @@ class ServiceList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Services'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services', self._solution)
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams ServiceInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -49,17 +48,57 @@ class ServiceList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.proxy.v1.service.ServiceInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams ServiceInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.proxy.v1.service.ServiceInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists ServiceInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -71,11 +110,42 @@ class ServiceList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.proxy.v1.service.ServiceInstance]
+        """
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists ServiceInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.proxy.v1.service.ServiceInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -96,6 +166,25 @@ class ServiceList(ListResource):
 
         return ServicePage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of ServiceInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of ServiceInstance
+        :rtype: twilio.rest.proxy.v1.service.ServicePage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return ServicePage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of ServiceInstance records from the API.
@@ -113,12 +202,29 @@ class ServiceList(ListResource):
 
         return ServicePage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of ServiceInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of ServiceInstance
+        :rtype: twilio.rest.proxy.v1.service.ServicePage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return ServicePage(self._version, response, self._solution)
+
     def create(self, unique_name, default_ttl=values.unset,
                callback_url=values.unset, geo_match_level=values.unset,
                number_selection_behavior=values.unset,
                intercept_callback_url=values.unset,
                out_of_session_callback_url=values.unset,
-               chat_instance_sid=values.unset):
+               chat_instance_sid=values.unset, deadline=None):
         """
         Create the ServiceInstance
 
@@ -130,6 +236,8 @@ class ServiceList(ListResource):
         :param unicode intercept_callback_url: The URL we call on each interaction
         :param unicode out_of_session_callback_url: The URL we call when an inbound call or SMS action occurs on a closed or non-existent Session
         :param unicode chat_instance_sid: The SID of the Chat Service Instance
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created ServiceInstance
         :rtype: twilio.rest.proxy.v1.service.ServiceInstance
@@ -145,7 +253,45 @@ class ServiceList(ListResource):
             'ChatInstanceSid': chat_instance_sid,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return ServiceInstance(self._version, payload, )
+
+    async def create_async(self, unique_name, default_ttl=values.unset,
+                           callback_url=values.unset, geo_match_level=values.unset,
+                           number_selection_behavior=values.unset,
+                           intercept_callback_url=values.unset,
+                           out_of_session_callback_url=values.unset,
+                           chat_instance_sid=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the ServiceInstance
+
+        :param unicode unique_name: An application-defined string that uniquely identifies the resource
+        :param unicode default_ttl: Default TTL for a Session, in seconds
+        :param unicode callback_url: The URL we should call when the interaction status changes
+        :param ServiceInstance.GeoMatchLevel geo_match_level: Where a proxy number must be located relative to the participant identifier
+        :param ServiceInstance.NumberSelectionBehavior number_selection_behavior: The preference for Proxy Number selection for the Service instance
+        :param unicode intercept_callback_url: The URL we call on each interaction
+        :param unicode out_of_session_callback_url: The URL we call when an inbound call or SMS action occurs on a closed or non-existent Session
+        :param unicode chat_instance_sid: The SID of the Chat Service Instance
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created ServiceInstance
+        :rtype: twilio.rest.proxy.v1.service.ServiceInstance
+        """
+        data = values.of({
+            'UniqueName': unique_name,
+            'DefaultTtl': default_ttl,
+            'CallbackUrl': callback_url,
+            'GeoMatchLevel': geo_match_level,
+            'NumberSelectionBehavior': number_selection_behavior,
+            'InterceptCallbackUrl': intercept_callback_url,
+            'OutOfSessionCallbackUrl': out_of_session_callback_url,
+            'ChatInstanceSid': chat_instance_sid,
+        })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return ServiceInstance(self._version, payload, )
 
@@ -239,7 +385,7 @@ class ServiceContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/Services/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{sid}', self._solution)
 
         # Dependents
         self._sessions = None
@@ -257,6 +403,17 @@ class ServiceContext(InstanceContext):
 
         return ServiceInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ServiceInstance
+
+        :returns: The fetched ServiceInstance
+        :rtype: twilio.rest.proxy.v1.service.ServiceInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return ServiceInstance(self._version, payload, sid=self._solution['sid'], )
+
     def delete(self):
         """
         Deletes the ServiceInstance
@@ -266,6 +423,15 @@ class ServiceContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the ServiceInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def update(self, unique_name=values.unset, default_ttl=values.unset,
                callback_url=values.unset, geo_match_level=values.unset,
                number_selection_behavior=values.unset,
@@ -302,6 +468,42 @@ class ServiceContext(InstanceContext):
 
         return ServiceInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def update_async(self, unique_name=values.unset, default_ttl=values.unset,
+                           callback_url=values.unset, geo_match_level=values.unset,
+                           number_selection_behavior=values.unset,
+                           intercept_callback_url=values.unset,
+                           out_of_session_callback_url=values.unset,
+                           chat_instance_sid=values.unset):
+        """
+        Asynchronous coroutine that updates the ServiceInstance
+
+        :param unicode unique_name: An application-defined string that uniquely identifies the resource
+        :param unicode default_ttl: Default TTL for a Session, in seconds
+        :param unicode callback_url: The URL we should call when the interaction status changes
+        :param ServiceInstance.GeoMatchLevel geo_match_level: Where a proxy number must be located relative to the participant identifier
+        :param ServiceInstance.NumberSelectionBehavior number_selection_behavior: The preference for Proxy Number selection for the Service instance
+        :param unicode intercept_callback_url: The URL we call on each interaction
+        :param unicode out_of_session_callback_url: The URL we call when an inbound call or SMS action occurs on a closed or non-existent Session
+        :param unicode chat_instance_sid: The SID of the Chat Service Instance
+
+        :returns: The updated ServiceInstance
+        :rtype: twilio.rest.proxy.v1.service.ServiceInstance
+        """
+        data = values.of({
+            'UniqueName': unique_name,
+            'DefaultTtl': default_ttl,
+            'CallbackUrl': callback_url,
+            'GeoMatchLevel': geo_match_level,
+            'NumberSelectionBehavior': number_selection_behavior,
+            'InterceptCallbackUrl': intercept_callback_url,
+            'OutOfSessionCallbackUrl': out_of_session_callback_url,
+            'ChatInstanceSid': chat_instance_sid,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return ServiceInstance(self._version, payload, sid=self._solution['sid'], )
+
     @property
     def sessions(self):
         """
@@ -311,6 +513,7 @@ class ServiceContext(InstanceContext):
         :rtype: twilio.rest.proxy.v1.service.session.SessionList
         """
         if self._sessions is None:
+            from twilio.rest.proxy.v1.service.session import SessionList
             self._sessions = SessionList(self._version, service_sid=self._solution['sid'], )
         return self._sessions
 
@@ -323,6 +526,7 @@ class ServiceContext(InstanceContext):
         :rtype: twilio.rest.proxy.v1.service.phone_number.PhoneNumberList
         """
         if self._phone_numbers is None:
+            from twilio.rest.proxy.v1.service.phone_number import PhoneNumberList
             self._phone_numbers = PhoneNumberList(self._version, service_sid=self._solution['sid'], )
         return self._phone_numbers
 
@@ -335,6 +539,7 @@ class ServiceContext(InstanceContext):
         :rtype: twilio.rest.proxy.v1.service.short_code.ShortCodeList
         """
         if self._short_codes is None:
+            from twilio.rest.proxy.v1.service.short_code import ShortCodeList
             self._short_codes = ShortCodeList(self._version, service_sid=self._solution['sid'], )
         return self._short_codes
 
@@ -363,6 +568,33 @@ class ServiceInstance(InstanceResource):
         AVOID_STICKY = "avoid-sticky"
         PREFER_STICKY = "prefer-sticky"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'default_ttl': deserialize.integer,
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'unique_name': 'unique_name',
+        'account_sid': 'account_sid',
+        'chat_instance_sid': 'chat_instance_sid',
+        'callback_url': 'callback_url',
+        'default_ttl': 'default_ttl',
+        'number_selection_behavior': 'number_selection_behavior',
+        'geo_match_level': 'geo_match_level',
+        'intercept_callback_url': 'intercept_callback_url',
+        'out_of_session_callback_url': 'out_of_session_callback_url',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'url': 'url',
+        'links': 'links',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the ServiceInstance
@@ -373,22 +605,7 @@ class ServiceInstance(InstanceResource):
         super(ServiceInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'unique_name': payload.get('unique_name'),
-            'account_sid': payload.get('account_sid'),
-            'chat_instance_sid': payload.get('chat_instance_sid'),
-            'callback_url': payload.get('callback_url'),
-            'default_ttl': deserialize.integer(payload.get('default_ttl')),
-            'number_selection_behavior': payload.get('number_selection_behavior'),
-            'geo_match_level': payload.get('geo_match_level'),
-            'intercept_callback_url': payload.get('intercept_callback_url'),
-            'out_of_session_callback_url': payload.get('out_of_session_callback_url'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -528,6 +745,15 @@ class ServiceInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ServiceInstance
+
+        :returns: The fetched ServiceInstance
+        :rtype: twilio.rest.proxy.v1.service.ServiceInstance
+        """
+        return await self._proxy.fetch_async()
+
     def delete(self):
         """
         Deletes the ServiceInstance
@@ -537,6 +763,15 @@ class ServiceInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the ServiceInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def update(self, unique_name=values.unset, default_ttl=values.unset,
                callback_url=values.unset, geo_match_level=values.unset,
                number_selection_behavior=values.unset,
@@ -569,6 +804,38 @@ class ServiceInstance(InstanceResource):
             chat_instance_sid=chat_instance_sid,
         )
 
+    async def update_async(self, unique_name=values.unset, default_ttl=values.unset,
+                           callback_url=values.unset, geo_match_level=values.unset,
+                           number_selection_behavior=values.unset,
+                           intercept_callback_url=values.unset,
+                           out_of_session_callback_url=values.unset,
+                           chat_instance_sid=values.unset):
+        """
+        Asynchronous coroutine that updates the ServiceInstance
+
+        :param unicode unique_name: An application-defined string that uniquely identifies the resource
+        :param unicode default_ttl: Default TTL for a Session, in seconds
+        :param unicode callback_url: The URL we should call when the interaction status changes
+        :param ServiceInstance.GeoMatchLevel geo_match_level: Where a proxy number must be located relative to the participant identifier
+        :param ServiceInstance.NumberSelectionBehavior number_selection_behavior: The preference for Proxy Number selection for the Service instance
+        :param unicode intercept_callback_url: The URL we call on each interaction
+        :param unicode out_of_session_callback_url: The URL we call when an inbound call or SMS action occurs on a closed or non-existent Session
+        :param unicode chat_instance_sid: The SID of the Chat Service Instance
+
+        :returns: The updated ServiceInstance
+        :rtype: twilio.rest.proxy.v1.service.ServiceInstance
+        """
+        return await self._proxy.update_async(
+            unique_name=unique_name,
+            default_ttl=default_ttl,
+            callback_url=callback_url,
+            geo_match_level=geo_match_level,
+            number_selection_behavior=number_selection_behavior,
+            intercept_callback_url=intercept_callback_url,
+            out_of_session_callback_url=out_of_session_callback_url,
+            chat_instance_sid=chat_instance_sid,
+        )
+
     @property
     def sessions(self):
         """
@@ -608,3 +875,21 @@ class ServiceInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Proxy.V1.ServiceInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'PhoneNumberList': 'twilio.rest.proxy.v1.service.phone_number',
+    'SessionList': 'twilio.rest.proxy.v1.service.session',
+    'ShortCodeList': 'twilio.rest.proxy.v1.service.short_code',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
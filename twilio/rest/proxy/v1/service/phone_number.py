@@ -32,27 +32,49 @@ class PhoneNumberList(ListResource):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, }
-        self._uri = '/Services/{service_sid}/PhoneNumbers'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/PhoneNumbers', self._solution)
 
     def create(self, sid=values.unset, phone_number=values.unset,
-               is_reserved=values.unset):
+               is_reserved=values.unset, deadline=None):
         """
         Create the PhoneNumberInstance
 
         :param unicode sid: The SID of a Twilio IncomingPhoneNumber resource
         :param unicode phone_number: The phone number in E.164 format
         :param bool is_reserved: Whether the new phone number should be reserved
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created PhoneNumberInstance
         :rtype: twilio.rest.proxy.v1.service.phone_number.PhoneNumberInstance
         """
         data = values.of({'Sid': sid, 'PhoneNumber': phone_number, 'IsReserved': is_reserved, })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return PhoneNumberInstance(self._version, payload, service_sid=self._solution['service_sid'], )
 
-    def stream(self, limit=None, page_size=None):
+    async def create_async(self, sid=values.unset, phone_number=values.unset,
+                           is_reserved=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the PhoneNumberInstance
+
+        :param unicode sid: The SID of a Twilio IncomingPhoneNumber resource
+        :param unicode phone_number: The phone number in E.164 format
+        :param bool is_reserved: Whether the new phone number should be reserved
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created PhoneNumberInstance
+        :rtype: twilio.rest.proxy.v1.service.phone_number.PhoneNumberInstance
+        """
+        data = values.of({'Sid': sid, 'PhoneNumber': phone_number, 'IsReserved': is_reserved, })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return PhoneNumberInstance(self._version, payload, service_sid=self._solution['service_sid'], )
+
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams PhoneNumberInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -65,17 +87,57 @@ class PhoneNumberList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.proxy.v1.service.phone_number.PhoneNumberInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams PhoneNumberInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.proxy.v1.service.phone_number.PhoneNumberInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists PhoneNumberInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -87,11 +149,42 @@ class PhoneNumberList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.proxy.v1.service.phone_number.PhoneNumberInstance]
+        """
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists PhoneNumberInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.proxy.v1.service.phone_number.PhoneNumberInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -112,6 +205,25 @@ class PhoneNumberList(ListResource):
 
         return PhoneNumberPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of PhoneNumberInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of PhoneNumberInstance
+        :rtype: twilio.rest.proxy.v1.service.phone_number.PhoneNumberPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return PhoneNumberPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of PhoneNumberInstance records from the API.
@@ -129,6 +241,23 @@ class PhoneNumberList(ListResource):
 
         return PhoneNumberPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of PhoneNumberInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of PhoneNumberInstance
+        :rtype: twilio.rest.proxy.v1.service.phone_number.PhoneNumberPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return PhoneNumberPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a PhoneNumberContext
@@ -221,7 +350,7 @@ class PhoneNumberContext(InstanceContext):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, 'sid': sid, }
-        self._uri = '/Services/{service_sid}/PhoneNumbers/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/PhoneNumbers/{sid}', self._solution)
 
     def delete(self):
         """
@@ -232,6 +361,15 @@ class PhoneNumberContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the PhoneNumberInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def fetch(self):
         """
         Fetch the PhoneNumberInstance
@@ -248,6 +386,22 @@ class PhoneNumberContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the PhoneNumberInstance
+
+        :returns: The fetched PhoneNumberInstance
+        :rtype: twilio.rest.proxy.v1.service.phone_number.PhoneNumberInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return PhoneNumberInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            sid=self._solution['sid'],
+        )
+
     def update(self, is_reserved=values.unset):
         """
         Update the PhoneNumberInstance
@@ -268,6 +422,26 @@ class PhoneNumberContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, is_reserved=values.unset):
+        """
+        Asynchronous coroutine that updates the PhoneNumberInstance
+
+        :param bool is_reserved: Whether the new phone number should be reserved
+
+        :returns: The updated PhoneNumberInstance
+        :rtype: twilio.rest.proxy.v1.service.phone_number.PhoneNumberInstance
+        """
+        data = values.of({'IsReserved': is_reserved, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return PhoneNumberInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            sid=self._solution['sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -283,6 +457,31 @@ class PhoneNumberInstance(InstanceResource):
     """ PLEASE NOTE that this class contains beta products that are subject to
     change. Use them with caution. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+        'in_use': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'service_sid': 'service_sid',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'phone_number': 'phone_number',
+        'friendly_name': 'friendly_name',
+        'iso_country': 'iso_country',
+        'capabilities': 'capabilities',
+        'url': 'url',
+        'is_reserved': 'is_reserved',
+        'in_use': 'in_use',
+    }, _deserializers)
+
     def __init__(self, version, payload, service_sid, sid=None):
         """
         Initialize the PhoneNumberInstance
@@ -293,20 +492,7 @@ class PhoneNumberInstance(InstanceResource):
         super(PhoneNumberInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'service_sid': payload.get('service_sid'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'phone_number': payload.get('phone_number'),
-            'friendly_name': payload.get('friendly_name'),
-            'iso_country': payload.get('iso_country'),
-            'capabilities': payload.get('capabilities'),
-            'url': payload.get('url'),
-            'is_reserved': payload.get('is_reserved'),
-            'in_use': deserialize.integer(payload.get('in_use')),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -434,6 +620,15 @@ class PhoneNumberInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the PhoneNumberInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def fetch(self):
         """
         Fetch the PhoneNumberInstance
@@ -443,6 +638,15 @@ class PhoneNumberInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the PhoneNumberInstance
+
+        :returns: The fetched PhoneNumberInstance
+        :rtype: twilio.rest.proxy.v1.service.phone_number.PhoneNumberInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, is_reserved=values.unset):
         """
         Update the PhoneNumberInstance
@@ -454,6 +658,17 @@ class PhoneNumberInstance(InstanceResource):
         """
         return self._proxy.update(is_reserved=is_reserved, )
 
+    async def update_async(self, is_reserved=values.unset):
+        """
+        Asynchronous coroutine that updates the PhoneNumberInstance
+
+        :param bool is_reserved: Whether the new phone number should be reserved
+
+        :returns: The updated PhoneNumberInstance
+        :rtype: twilio.rest.proxy.v1.service.phone_number.PhoneNumberInstance
+        """
+        return await self._proxy.update_async(is_reserved=is_reserved, )
+
     def __repr__(self):
         """
         Provide a friendly representation
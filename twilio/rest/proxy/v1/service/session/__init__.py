@@ -6,6 +6,8 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import serialize
 from twilio.base import values
@@ -13,8 +15,6 @@ from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.proxy.v1.service.session.interaction import InteractionList
-from twilio.rest.proxy.v1.service.session.participant import ParticipantList
 
 
 class SessionList(ListResource):
@@ -35,9 +35,9 @@ class SessionList(ListResource):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, }
-        self._uri = '/Services/{service_sid}/Sessions'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/Sessions', self._solution)
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams SessionInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -50,17 +50,57 @@ class SessionList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.proxy.v1.service.session.SessionInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams SessionInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.proxy.v1.service.session.SessionInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists SessionInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -72,11 +112,42 @@ class SessionList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.proxy.v1.service.session.SessionInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists SessionInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.proxy.v1.service.session.SessionInstance]
+        """
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -97,6 +168,25 @@ class SessionList(ListResource):
 
         return SessionPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of SessionInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of SessionInstance
+        :rtype: twilio.rest.proxy.v1.service.session.SessionPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return SessionPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of SessionInstance records from the API.
@@ -114,10 +204,27 @@ class SessionList(ListResource):
 
         return SessionPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of SessionInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of SessionInstance
+        :rtype: twilio.rest.proxy.v1.service.session.SessionPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return SessionPage(self._version, response, self._solution)
+
     def create(self, unique_name=values.unset, date_expiry=values.unset,
                ttl=values.unset, mode=values.unset, status=values.unset,
                participants=values.unset,
-               fail_on_participant_conflict=values.unset):
+               fail_on_participant_conflict=values.unset, deadline=None):
         """
         Create the SessionInstance
 
@@ -128,6 +235,42 @@ class SessionList(ListResource):
         :param SessionInstance.Status status: Session status
         :param list[dict] participants: The Participant objects to include in the new session
         :param bool fail_on_participant_conflict: An experimental parameter to override the ProxyAllowParticipantConflict account flag on a per-request basis.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created SessionInstance
+        :rtype: twilio.rest.proxy.v1.service.session.SessionInstance
+        """
+        data = values.of({
+            'UniqueName': unique_name,
+            'DateExpiry': serialize.iso8601_datetime(date_expiry),
+            'Ttl': ttl,
+            'Mode': mode,
+            'Status': status,
+            'Participants': serialize.map(participants, lambda e: serialize.object(e)),
+            'FailOnParticipantConflict': fail_on_participant_conflict,
+        })
+
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return SessionInstance(self._version, payload, service_sid=self._solution['service_sid'], )
+
+    async def create_async(self, unique_name=values.unset, date_expiry=values.unset,
+                           ttl=values.unset, mode=values.unset, status=values.unset,
+                           participants=values.unset,
+                           fail_on_participant_conflict=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the SessionInstance
+
+        :param unicode unique_name: An application-defined string that uniquely identifies the resource
+        :param datetime date_expiry: The ISO 8601 date when the Session should expire
+        :param unicode ttl: When the session will expire
+        :param SessionInstance.Mode mode: The Mode of the Session
+        :param SessionInstance.Status status: Session status
+        :param list[dict] participants: The Participant objects to include in the new session
+        :param bool fail_on_participant_conflict: An experimental parameter to override the ProxyAllowParticipantConflict account flag on a per-request basis.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created SessionInstance
         :rtype: twilio.rest.proxy.v1.service.session.SessionInstance
@@ -142,7 +285,7 @@ class SessionList(ListResource):
             'FailOnParticipantConflict': fail_on_participant_conflict,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return SessionInstance(self._version, payload, service_sid=self._solution['service_sid'], )
 
@@ -238,7 +381,7 @@ class SessionContext(InstanceContext):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, 'sid': sid, }
-        self._uri = '/Services/{service_sid}/Sessions/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/Sessions/{sid}', self._solution)
 
         # Dependents
         self._interactions = None
@@ -260,6 +403,22 @@ class SessionContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the SessionInstance
+
+        :returns: The fetched SessionInstance
+        :rtype: twilio.rest.proxy.v1.service.session.SessionInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return SessionInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self):
         """
         Deletes the SessionInstance
@@ -269,6 +428,15 @@ class SessionContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the SessionInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def update(self, date_expiry=values.unset, ttl=values.unset,
                status=values.unset, fail_on_participant_conflict=values.unset):
         """
@@ -298,6 +466,35 @@ class SessionContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, date_expiry=values.unset, ttl=values.unset,
+                           status=values.unset, fail_on_participant_conflict=values.unset):
+        """
+        Asynchronous coroutine that updates the SessionInstance
+
+        :param datetime date_expiry: The ISO 8601 date when the Session should expire
+        :param unicode ttl: When the session will expire
+        :param SessionInstance.Status status: The new status of the resource
+        :param bool fail_on_participant_conflict: An experimental parameter to override the ProxyAllowParticipantConflict account flag on a per-request basis.
+
+        :returns: The updated SessionInstance
+        :rtype: twilio.rest.proxy.v1.service.session.SessionInstance
+        """
+        data = values.of({
+            'DateExpiry': serialize.iso8601_datetime(date_expiry),
+            'Ttl': ttl,
+            'Status': status,
+            'FailOnParticipantConflict': fail_on_participant_conflict,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return SessionInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            sid=self._solution['sid'],
+        )
+
     @property
     def interactions(self):
         """
@@ -307,6 +504,7 @@ class SessionContext(InstanceContext):
         :rtype: twilio.rest.proxy.v1.service.session.interaction.InteractionList
         """
         if self._interactions is None:
+            from twilio.rest.proxy.v1.service.session.interaction import InteractionList
             self._interactions = InteractionList(
                 self._version,
                 service_sid=self._solution['service_sid'],
@@ -323,6 +521,7 @@ class SessionContext(InstanceContext):
         :rtype: twilio.rest.proxy.v1.service.session.participant.ParticipantList
         """
         if self._participants is None:
+            from twilio.rest.proxy.v1.service.session.participant import ParticipantList
             self._participants = ParticipantList(
                 self._version,
                 service_sid=self._solution['service_sid'],
@@ -357,6 +556,39 @@ class SessionInstance(InstanceResource):
         VOICE_ONLY = "voice-only"
         VOICE_AND_MESSAGE = "voice-and-message"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_started': deserialize.iso8601_datetime,
+        'date_ended': deserialize.iso8601_datetime,
+        'date_last_interaction': deserialize.iso8601_datetime,
+        'date_expiry': deserialize.iso8601_datetime,
+        'ttl': deserialize.integer,
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'service_sid': 'service_sid',
+        'account_sid': 'account_sid',
+        'date_started': 'date_started',
+        'date_ended': 'date_ended',
+        'date_last_interaction': 'date_last_interaction',
+        'date_expiry': 'date_expiry',
+        'unique_name': 'unique_name',
+        'status': 'status',
+        'closed_reason': 'closed_reason',
+        'ttl': 'ttl',
+        'mode': 'mode',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'url': 'url',
+        'links': 'links',
+    }, _deserializers)
+
     def __init__(self, version, payload, service_sid, sid=None):
         """
         Initialize the SessionInstance
@@ -367,24 +599,7 @@ class SessionInstance(InstanceResource):
         super(SessionInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'service_sid': payload.get('service_sid'),
-            'account_sid': payload.get('account_sid'),
-            'date_started': deserialize.iso8601_datetime(payload.get('date_started')),
-            'date_ended': deserialize.iso8601_datetime(payload.get('date_ended')),
-            'date_last_interaction': deserialize.iso8601_datetime(payload.get('date_last_interaction')),
-            'date_expiry': deserialize.iso8601_datetime(payload.get('date_expiry')),
-            'unique_name': payload.get('unique_name'),
-            'status': payload.get('status'),
-            'closed_reason': payload.get('closed_reason'),
-            'ttl': deserialize.integer(payload.get('ttl')),
-            'mode': payload.get('mode'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -544,6 +759,15 @@ class SessionInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the SessionInstance
+
+        :returns: The fetched SessionInstance
+        :rtype: twilio.rest.proxy.v1.service.session.SessionInstance
+        """
+        return await self._proxy.fetch_async()
+
     def delete(self):
         """
         Deletes the SessionInstance
@@ -553,6 +777,15 @@ class SessionInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the SessionInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def update(self, date_expiry=values.unset, ttl=values.unset,
                status=values.unset, fail_on_participant_conflict=values.unset):
         """
@@ -573,6 +806,26 @@ class SessionInstance(InstanceResource):
             fail_on_participant_conflict=fail_on_participant_conflict,
         )
 
+    async def update_async(self, date_expiry=values.unset, ttl=values.unset,
+                           status=values.unset, fail_on_participant_conflict=values.unset):
+        """
+        Asynchronous coroutine that updates the SessionInstance
+
+        :param datetime date_expiry: The ISO 8601 date when the Session should expire
+        :param unicode ttl: When the session will expire
+        :param SessionInstance.Status status: The new status of the resource
+        :param bool fail_on_participant_conflict: An experimental parameter to override the ProxyAllowParticipantConflict account flag on a per-request basis.
+
+        :returns: The updated SessionInstance
+        :rtype: twilio.rest.proxy.v1.service.session.SessionInstance
+        """
+        return await self._proxy.update_async(
+            date_expiry=date_expiry,
+            ttl=ttl,
+            status=status,
+            fail_on_participant_conflict=fail_on_participant_conflict,
+        )
+
     @property
     def interactions(self):
         """
@@ -602,3 +855,20 @@ class SessionInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Proxy.V1.SessionInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'InteractionList': 'twilio.rest.proxy.v1.service.session.interaction',
+    'ParticipantList': 'twilio.rest.proxy.v1.service.session.participant',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
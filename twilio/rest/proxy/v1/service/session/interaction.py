@@ -33,9 +33,9 @@ class InteractionList(ListResource):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, 'session_sid': session_sid, }
-        self._uri = '/Services/{service_sid}/Sessions/{session_sid}/Interactions'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/Sessions/{session_sid}/Interactions', self._solution)
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams InteractionInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -48,17 +48,57 @@ class InteractionList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.proxy.v1.service.session.interaction.InteractionInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams InteractionInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.proxy.v1.service.session.interaction.InteractionInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists InteractionInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -70,11 +110,42 @@ class InteractionList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.proxy.v1.service.session.interaction.InteractionInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists InteractionInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.proxy.v1.service.session.interaction.InteractionInstance]
+        """
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -95,6 +166,25 @@ class InteractionList(ListResource):
 
         return InteractionPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of InteractionInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of InteractionInstance
+        :rtype: twilio.rest.proxy.v1.service.session.interaction.InteractionPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return InteractionPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of InteractionInstance records from the API.
@@ -112,6 +202,23 @@ class InteractionList(ListResource):
 
         return InteractionPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of InteractionInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of InteractionInstance
+        :rtype: twilio.rest.proxy.v1.service.session.interaction.InteractionPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return InteractionPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a InteractionContext
@@ -221,7 +328,7 @@ class InteractionContext(InstanceContext):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, 'session_sid': session_sid, 'sid': sid, }
-        self._uri = '/Services/{service_sid}/Sessions/{session_sid}/Interactions/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/Sessions/{session_sid}/Interactions/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -240,6 +347,23 @@ class InteractionContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the InteractionInstance
+
+        :returns: The fetched InteractionInstance
+        :rtype: twilio.rest.proxy.v1.service.session.interaction.InteractionInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return InteractionInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            session_sid=self._solution['session_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self):
         """
         Deletes the InteractionInstance
@@ -249,6 +373,15 @@ class InteractionContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the InteractionInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -292,6 +425,37 @@ class InteractionInstance(InstanceResource):
         UNDELIVERED = "undelivered"
         UNKNOWN = "unknown"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'session_sid': 'session_sid',
+        'service_sid': 'service_sid',
+        'account_sid': 'account_sid',
+        'data': 'data',
+        'type': 'type',
+        'inbound_participant_sid': 'inbound_participant_sid',
+        'inbound_resource_sid': 'inbound_resource_sid',
+        'inbound_resource_status': 'inbound_resource_status',
+        'inbound_resource_type': 'inbound_resource_type',
+        'inbound_resource_url': 'inbound_resource_url',
+        'outbound_participant_sid': 'outbound_participant_sid',
+        'outbound_resource_sid': 'outbound_resource_sid',
+        'outbound_resource_status': 'outbound_resource_status',
+        'outbound_resource_type': 'outbound_resource_type',
+        'outbound_resource_url': 'outbound_resource_url',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload, service_sid, session_sid, sid=None):
         """
         Initialize the InteractionInstance
@@ -302,27 +466,7 @@ class InteractionInstance(InstanceResource):
         super(InteractionInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'session_sid': payload.get('session_sid'),
-            'service_sid': payload.get('service_sid'),
-            'account_sid': payload.get('account_sid'),
-            'data': payload.get('data'),
-            'type': payload.get('type'),
-            'inbound_participant_sid': payload.get('inbound_participant_sid'),
-            'inbound_resource_sid': payload.get('inbound_resource_sid'),
-            'inbound_resource_status': payload.get('inbound_resource_status'),
-            'inbound_resource_type': payload.get('inbound_resource_type'),
-            'inbound_resource_url': payload.get('inbound_resource_url'),
-            'outbound_participant_sid': payload.get('outbound_participant_sid'),
-            'outbound_resource_sid': payload.get('outbound_resource_sid'),
-            'outbound_resource_status': payload.get('outbound_resource_status'),
-            'outbound_resource_type': payload.get('outbound_resource_type'),
-            'outbound_resource_url': payload.get('outbound_resource_url'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -511,6 +655,15 @@ class InteractionInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the InteractionInstance
+
+        :returns: The fetched InteractionInstance
+        :rtype: twilio.rest.proxy.v1.service.session.interaction.InteractionInstance
+        """
+        return await self._proxy.fetch_async()
+
     def delete(self):
         """
         Deletes the InteractionInstance
@@ -520,6 +673,15 @@ class InteractionInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the InteractionInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -32,24 +32,43 @@ class ShortCodeList(ListResource):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, }
-        self._uri = '/Services/{service_sid}/ShortCodes'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/ShortCodes', self._solution)
 
-    def create(self, sid):
+    def create(self, sid, deadline=None):
         """
         Create the ShortCodeInstance
 
         :param unicode sid: The SID of a Twilio ShortCode resource
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created ShortCodeInstance
         :rtype: twilio.rest.proxy.v1.service.short_code.ShortCodeInstance
         """
         data = values.of({'Sid': sid, })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return ShortCodeInstance(self._version, payload, service_sid=self._solution['service_sid'], )
 
-    def stream(self, limit=None, page_size=None):
+    async def create_async(self, sid, deadline=None):
+        """
+        Asynchronous coroutine that creates the ShortCodeInstance
+
+        :param unicode sid: The SID of a Twilio ShortCode resource
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created ShortCodeInstance
+        :rtype: twilio.rest.proxy.v1.service.short_code.ShortCodeInstance
+        """
+        data = values.of({'Sid': sid, })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return ShortCodeInstance(self._version, payload, service_sid=self._solution['service_sid'], )
+
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams ShortCodeInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -62,17 +81,57 @@ class ShortCodeList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.proxy.v1.service.short_code.ShortCodeInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams ShortCodeInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.proxy.v1.service.short_code.ShortCodeInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists ShortCodeInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -84,11 +143,42 @@ class ShortCodeList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.proxy.v1.service.short_code.ShortCodeInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists ShortCodeInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.proxy.v1.service.short_code.ShortCodeInstance]
+        """
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -109,6 +199,25 @@ class ShortCodeList(ListResource):
 
         return ShortCodePage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of ShortCodeInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of ShortCodeInstance
+        :rtype: twilio.rest.proxy.v1.service.short_code.ShortCodePage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return ShortCodePage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of ShortCodeInstance records from the API.
@@ -126,6 +235,23 @@ class ShortCodeList(ListResource):
 
         return ShortCodePage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of ShortCodeInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of ShortCodeInstance
+        :rtype: twilio.rest.proxy.v1.service.short_code.ShortCodePage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return ShortCodePage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a ShortCodeContext
@@ -218,7 +344,7 @@ class ShortCodeContext(InstanceContext):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, 'sid': sid, }
-        self._uri = '/Services/{service_sid}/ShortCodes/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/ShortCodes/{sid}', self._solution)
 
     def delete(self):
         """
@@ -229,6 +355,15 @@ class ShortCodeContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the ShortCodeInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def fetch(self):
         """
         Fetch the ShortCodeInstance
@@ -245,6 +380,22 @@ class ShortCodeContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ShortCodeInstance
+
+        :returns: The fetched ShortCodeInstance
+        :rtype: twilio.rest.proxy.v1.service.short_code.ShortCodeInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return ShortCodeInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            sid=self._solution['sid'],
+        )
+
     def update(self, is_reserved=values.unset):
         """
         Update the ShortCodeInstance
@@ -265,6 +416,26 @@ class ShortCodeContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, is_reserved=values.unset):
+        """
+        Asynchronous coroutine that updates the ShortCodeInstance
+
+        :param bool is_reserved: Whether the short code should be reserved for manual assignment to participants only
+
+        :returns: The updated ShortCodeInstance
+        :rtype: twilio.rest.proxy.v1.service.short_code.ShortCodeInstance
+        """
+        data = values.of({'IsReserved': is_reserved, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return ShortCodeInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            sid=self._solution['sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -280,6 +451,28 @@ class ShortCodeInstance(InstanceResource):
     """ PLEASE NOTE that this class contains beta products that are subject to
     change. Use them with caution. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'service_sid': 'service_sid',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'short_code': 'short_code',
+        'iso_country': 'iso_country',
+        'capabilities': 'capabilities',
+        'url': 'url',
+        'is_reserved': 'is_reserved',
+    }, _deserializers)
+
     def __init__(self, version, payload, service_sid, sid=None):
         """
         Initialize the ShortCodeInstance
@@ -290,18 +483,7 @@ class ShortCodeInstance(InstanceResource):
         super(ShortCodeInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'service_sid': payload.get('service_sid'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'short_code': payload.get('short_code'),
-            'iso_country': payload.get('iso_country'),
-            'capabilities': payload.get('capabilities'),
-            'url': payload.get('url'),
-            'is_reserved': payload.get('is_reserved'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -413,6 +595,15 @@ class ShortCodeInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the ShortCodeInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def fetch(self):
         """
         Fetch the ShortCodeInstance
@@ -422,6 +613,15 @@ class ShortCodeInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ShortCodeInstance
+
+        :returns: The fetched ShortCodeInstance
+        :rtype: twilio.rest.proxy.v1.service.short_code.ShortCodeInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, is_reserved=values.unset):
         """
         Update the ShortCodeInstance
@@ -433,6 +633,17 @@ class ShortCodeInstance(InstanceResource):
         """
         return self._proxy.update(is_reserved=is_reserved, )
 
+    async def update_async(self, is_reserved=values.unset):
+        """
+        Asynchronous coroutine that updates the ShortCodeInstance
+
+        :param bool is_reserved: Whether the short code should be reserved for manual assignment to participants only
+
+        :returns: The updated ShortCodeInstance
+        :rtype: twilio.rest.proxy.v1.service.short_code.ShortCodeInstance
+        """
+        return await self._proxy.update_async(is_reserved=is_reserved, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -6,16 +6,14 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.serverless.v1.service.asset import AssetList
-from twilio.rest.serverless.v1.service.build import BuildList
-from twilio.rest.serverless.v1.service.environment import EnvironmentList
-from twilio.rest.serverless.v1.service.function import FunctionList
 
 
 class ServiceList(ListResource):
@@ -35,9 +33,9 @@ class ServiceList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Services'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services', self._solution)
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams ServiceInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -50,17 +48,57 @@ class ServiceList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.serverless.v1.service.ServiceInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams ServiceInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.serverless.v1.service.ServiceInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists ServiceInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -72,11 +110,42 @@ class ServiceList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.serverless.v1.service.ServiceInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists ServiceInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.serverless.v1.service.ServiceInstance]
+        """
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -97,6 +166,25 @@ class ServiceList(ListResource):
 
         return ServicePage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of ServiceInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of ServiceInstance
+        :rtype: twilio.rest.serverless.v1.service.ServicePage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return ServicePage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of ServiceInstance records from the API.
@@ -114,8 +202,25 @@ class ServiceList(ListResource):
 
         return ServicePage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of ServiceInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of ServiceInstance
+        :rtype: twilio.rest.serverless.v1.service.ServicePage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return ServicePage(self._version, response, self._solution)
+
     def create(self, unique_name, friendly_name, include_credentials=values.unset,
-               ui_editable=values.unset):
+               ui_editable=values.unset, deadline=None):
         """
         Create the ServiceInstance
 
@@ -123,6 +228,8 @@ class ServiceList(ListResource):
         :param unicode friendly_name: A string to describe the Service resource
         :param bool include_credentials: Whether to inject Account credentials into a function invocation context
         :param bool ui_editable: Whether the Service's properties and subresources can be edited via the UI
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created ServiceInstance
         :rtype: twilio.rest.serverless.v1.service.ServiceInstance
@@ -134,7 +241,33 @@ class ServiceList(ListResource):
             'UiEditable': ui_editable,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return ServiceInstance(self._version, payload, )
+
+    async def create_async(self, unique_name, friendly_name, include_credentials=values.unset,
+                           ui_editable=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the ServiceInstance
+
+        :param unicode unique_name: A user-defined string that uniquely identifies the Service resource
+        :param unicode friendly_name: A string to describe the Service resource
+        :param bool include_credentials: Whether to inject Account credentials into a function invocation context
+        :param bool ui_editable: Whether the Service's properties and subresources can be edited via the UI
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created ServiceInstance
+        :rtype: twilio.rest.serverless.v1.service.ServiceInstance
+        """
+        data = values.of({
+            'UniqueName': unique_name,
+            'FriendlyName': friendly_name,
+            'IncludeCredentials': include_credentials,
+            'UiEditable': ui_editable,
+        })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return ServiceInstance(self._version, payload, )
 
@@ -228,7 +361,7 @@ class ServiceContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/Services/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{sid}', self._solution)
 
         # Dependents
         self._environments = None
@@ -247,6 +380,17 @@ class ServiceContext(InstanceContext):
 
         return ServiceInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ServiceInstance
+
+        :returns: The fetched ServiceInstance
+        :rtype: twilio.rest.serverless.v1.service.ServiceInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return ServiceInstance(self._version, payload, sid=self._solution['sid'], )
+
     def delete(self):
         """
         Deletes the ServiceInstance
@@ -256,6 +400,15 @@ class ServiceContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the ServiceInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def update(self, include_credentials=values.unset, friendly_name=values.unset,
                ui_editable=values.unset):
         """
@@ -278,6 +431,28 @@ class ServiceContext(InstanceContext):
 
         return ServiceInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def update_async(self, include_credentials=values.unset, friendly_name=values.unset,
+                           ui_editable=values.unset):
+        """
+        Asynchronous coroutine that updates the ServiceInstance
+
+        :param bool include_credentials: Whether to inject Account credentials into a function invocation context
+        :param unicode friendly_name: A string to describe the Service resource
+        :param bool ui_editable: Whether the Service resource's properties and subresources can be edited via the UI
+
+        :returns: The updated ServiceInstance
+        :rtype: twilio.rest.serverless.v1.service.ServiceInstance
+        """
+        data = values.of({
+            'IncludeCredentials': include_credentials,
+            'FriendlyName': friendly_name,
+            'UiEditable': ui_editable,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return ServiceInstance(self._version, payload, sid=self._solution['sid'], )
+
     @property
     def environments(self):
         """
@@ -287,6 +462,7 @@ class ServiceContext(InstanceContext):
         :rtype: twilio.rest.serverless.v1.service.environment.EnvironmentList
         """
         if self._environments is None:
+            from twilio.rest.serverless.v1.service.environment import EnvironmentList
             self._environments = EnvironmentList(self._version, service_sid=self._solution['sid'], )
         return self._environments
 
@@ -299,6 +475,7 @@ class ServiceContext(InstanceContext):
         :rtype: twilio.rest.serverless.v1.service.function.FunctionList
         """
         if self._functions is None:
+            from twilio.rest.serverless.v1.service.function import FunctionList
             self._functions = FunctionList(self._version, service_sid=self._solution['sid'], )
         return self._functions
 
@@ -311,6 +488,7 @@ class ServiceContext(InstanceContext):
         :rtype: twilio.rest.serverless.v1.service.asset.AssetList
         """
         if self._assets is None:
+            from twilio.rest.serverless.v1.service.asset import AssetList
             self._assets = AssetList(self._version, service_sid=self._solution['sid'], )
         return self._assets
 
@@ -323,6 +501,7 @@ class ServiceContext(InstanceContext):
         :rtype: twilio.rest.serverless.v1.service.build.BuildList
         """
         if self._builds is None:
+            from twilio.rest.serverless.v1.service.build import BuildList
             self._builds = BuildList(self._version, service_sid=self._solution['sid'], )
         return self._builds
 
@@ -341,6 +520,29 @@ class ServiceInstance(InstanceResource):
     """ PLEASE NOTE that this class contains beta products that are subject to
     change. Use them with caution. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'friendly_name': 'friendly_name',
+        'unique_name': 'unique_name',
+        'include_credentials': 'include_credentials',
+        'ui_editable': 'ui_editable',
+        'domain_base': 'domain_base',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'url': 'url',
+        'links': 'links',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the ServiceInstance
@@ -351,19 +553,7 @@ class ServiceInstance(InstanceResource):
         super(ServiceInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'friendly_name': payload.get('friendly_name'),
-            'unique_name': payload.get('unique_name'),
-            'include_credentials': payload.get('include_credentials'),
-            'ui_editable': payload.get('ui_editable'),
-            'domain_base': payload.get('domain_base'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -479,6 +669,15 @@ class ServiceInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ServiceInstance
+
+        :returns: The fetched ServiceInstance
+        :rtype: twilio.rest.serverless.v1.service.ServiceInstance
+        """
+        return await self._proxy.fetch_async()
+
     def delete(self):
         """
         Deletes the ServiceInstance
@@ -488,6 +687,15 @@ class ServiceInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the ServiceInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def update(self, include_credentials=values.unset, friendly_name=values.unset,
                ui_editable=values.unset):
         """
@@ -506,6 +714,24 @@ class ServiceInstance(InstanceResource):
             ui_editable=ui_editable,
         )
 
+    async def update_async(self, include_credentials=values.unset, friendly_name=values.unset,
+                           ui_editable=values.unset):
+        """
+        Asynchronous coroutine that updates the ServiceInstance
+
+        :param bool include_credentials: Whether to inject Account credentials into a function invocation context
+        :param unicode friendly_name: A string to describe the Service resource
+        :param bool ui_editable: Whether the Service resource's properties and subresources can be edited via the UI
+
+        :returns: The updated ServiceInstance
+        :rtype: twilio.rest.serverless.v1.service.ServiceInstance
+        """
+        return await self._proxy.update_async(
+            include_credentials=include_credentials,
+            friendly_name=friendly_name,
+            ui_editable=ui_editable,
+        )
+
     @property
     def environments(self):
         """
@@ -555,3 +781,22 @@ class ServiceInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Serverless.V1.ServiceInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'AssetList': 'twilio.rest.serverless.v1.service.asset',
+    'BuildList': 'twilio.rest.serverless.v1.service.build',
+    'EnvironmentList': 'twilio.rest.serverless.v1.service.environment',
+    'FunctionList': 'twilio.rest.serverless.v1.service.function',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -6,6 +6,8 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import serialize
 from twilio.base import values
@@ -13,7 +15,6 @@ from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.serverless.v1.service.build.build_status import BuildStatusList
 
 
 class BuildList(ListResource):
@@ -34,9 +35,9 @@ class BuildList(ListResource):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, }
-        self._uri = '/Services/{service_sid}/Builds'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/Builds', self._solution)
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams BuildInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -49,17 +50,57 @@ class BuildList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.serverless.v1.service.build.BuildInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams BuildInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.serverless.v1.service.build.BuildInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists BuildInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -71,11 +112,42 @@ class BuildList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.serverless.v1.service.build.BuildInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists BuildInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.serverless.v1.service.build.BuildInstance]
+        """
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -96,6 +168,25 @@ class BuildList(ListResource):
 
         return BuildPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of BuildInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of BuildInstance
+        :rtype: twilio.rest.serverless.v1.service.build.BuildPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return BuildPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of BuildInstance records from the API.
@@ -113,8 +204,25 @@ class BuildList(ListResource):
 
         return BuildPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of BuildInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of BuildInstance
+        :rtype: twilio.rest.serverless.v1.service.build.BuildPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return BuildPage(self._version, response, self._solution)
+
     def create(self, asset_versions=values.unset, function_versions=values.unset,
-               dependencies=values.unset, runtime=values.unset):
+               dependencies=values.unset, runtime=values.unset, deadline=None):
         """
         Create the BuildInstance
 
@@ -122,6 +230,8 @@ class BuildList(ListResource):
         :param list[unicode] function_versions: The list of the Function Version resource SIDs to include in the Build
         :param unicode dependencies: A list of objects that describe the Dependencies included in the Build
         :param unicode runtime: The Runtime version that will be used to run the Build.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created BuildInstance
         :rtype: twilio.rest.serverless.v1.service.build.BuildInstance
@@ -133,7 +243,33 @@ class BuildList(ListResource):
             'Runtime': runtime,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return BuildInstance(self._version, payload, service_sid=self._solution['service_sid'], )
+
+    async def create_async(self, asset_versions=values.unset, function_versions=values.unset,
+                           dependencies=values.unset, runtime=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the BuildInstance
+
+        :param list[unicode] asset_versions: The list of Asset Version resource SIDs to include in the Build
+        :param list[unicode] function_versions: The list of the Function Version resource SIDs to include in the Build
+        :param unicode dependencies: A list of objects that describe the Dependencies included in the Build
+        :param unicode runtime: The Runtime version that will be used to run the Build.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created BuildInstance
+        :rtype: twilio.rest.serverless.v1.service.build.BuildInstance
+        """
+        data = values.of({
+            'AssetVersions': serialize.map(asset_versions, lambda e: e),
+            'FunctionVersions': serialize.map(function_versions, lambda e: e),
+            'Dependencies': dependencies,
+            'Runtime': runtime,
+        })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return BuildInstance(self._version, payload, service_sid=self._solution['service_sid'], )
 
@@ -229,7 +365,7 @@ class BuildContext(InstanceContext):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, 'sid': sid, }
-        self._uri = '/Services/{service_sid}/Builds/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/Builds/{sid}', self._solution)
 
         # Dependents
         self._build_status = None
@@ -250,6 +386,22 @@ class BuildContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the BuildInstance
+
+        :returns: The fetched BuildInstance
+        :rtype: twilio.rest.serverless.v1.service.build.BuildInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return BuildInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self):
         """
         Deletes the BuildInstance
@@ -259,6 +411,15 @@ class BuildContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the BuildInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     @property
     def build_status(self):
         """
@@ -268,6 +429,7 @@ class BuildContext(InstanceContext):
         :rtype: twilio.rest.serverless.v1.service.build.build_status.BuildStatusList
         """
         if self._build_status is None:
+            from twilio.rest.serverless.v1.service.build.build_status import BuildStatusList
             self._build_status = BuildStatusList(
                 self._version,
                 service_sid=self._solution['service_sid'],
@@ -301,6 +463,30 @@ class BuildInstance(InstanceResource):
         NODE12 = "node12"
         NODE14 = "node14"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'service_sid': 'service_sid',
+        'status': 'status',
+        'asset_versions': 'asset_versions',
+        'function_versions': 'function_versions',
+        'dependencies': 'dependencies',
+        'runtime': 'runtime',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'url': 'url',
+        'links': 'links',
+    }, _deserializers)
+
     def __init__(self, version, payload, service_sid, sid=None):
         """
         Initialize the BuildInstance
@@ -311,20 +497,7 @@ class BuildInstance(InstanceResource):
         super(BuildInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'service_sid': payload.get('service_sid'),
-            'status': payload.get('status'),
-            'asset_versions': payload.get('asset_versions'),
-            'function_versions': payload.get('function_versions'),
-            'dependencies': payload.get('dependencies'),
-            'runtime': payload.get('runtime'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -452,6 +625,15 @@ class BuildInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the BuildInstance
+
+        :returns: The fetched BuildInstance
+        :rtype: twilio.rest.serverless.v1.service.build.BuildInstance
+        """
+        return await self._proxy.fetch_async()
+
     def delete(self):
         """
         Deletes the BuildInstance
@@ -461,6 +643,15 @@ class BuildInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the BuildInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     @property
     def build_status(self):
         """
@@ -480,3 +671,19 @@ class BuildInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Serverless.V1.BuildInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'BuildStatusList': 'twilio.rest.serverless.v1.service.build.build_status',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
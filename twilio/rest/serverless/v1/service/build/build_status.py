@@ -6,6 +6,7 @@ This code was generated by
       /       /
 """
 
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
@@ -135,7 +136,7 @@ class BuildStatusContext(InstanceContext):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, 'sid': sid, }
-        self._uri = '/Services/{service_sid}/Builds/{sid}/Status'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/Builds/{sid}/Status', self._solution)
 
     def fetch(self):
         """
@@ -153,6 +154,22 @@ class BuildStatusContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the BuildStatusInstance
+
+        :returns: The fetched BuildStatusInstance
+        :rtype: twilio.rest.serverless.v1.service.build.build_status.BuildStatusInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return BuildStatusInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            sid=self._solution['sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -173,6 +190,17 @@ class BuildStatusInstance(InstanceResource):
         COMPLETED = "completed"
         FAILED = "failed"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'service_sid': 'service_sid',
+        'status': 'status',
+        'url': 'url',
+    })
+
     def __init__(self, version, payload, service_sid, sid):
         """
         Initialize the BuildStatusInstance
@@ -183,13 +211,7 @@ class BuildStatusInstance(InstanceResource):
         super(BuildStatusInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'service_sid': payload.get('service_sid'),
-            'status': payload.get('status'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -261,6 +283,15 @@ class BuildStatusInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the BuildStatusInstance
+
+        :returns: The fetched BuildStatusInstance
+        :rtype: twilio.rest.serverless.v1.service.build.build_status.BuildStatusInstance
+        """
+        return await self._proxy.fetch_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
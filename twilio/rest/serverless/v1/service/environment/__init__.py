@@ -6,15 +6,14 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.serverless.v1.service.environment.deployment import DeploymentList
-from twilio.rest.serverless.v1.service.environment.log import LogList
-from twilio.rest.serverless.v1.service.environment.variable import VariableList
 
 
 class EnvironmentList(ListResource):
@@ -35,9 +34,9 @@ class EnvironmentList(ListResource):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, }
-        self._uri = '/Services/{service_sid}/Environments'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/Environments', self._solution)
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams EnvironmentInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -50,17 +49,57 @@ class EnvironmentList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.serverless.v1.service.environment.EnvironmentInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams EnvironmentInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.serverless.v1.service.environment.EnvironmentInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists EnvironmentInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -72,11 +111,42 @@ class EnvironmentList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.serverless.v1.service.environment.EnvironmentInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists EnvironmentInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.serverless.v1.service.environment.EnvironmentInstance]
+        """
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -97,6 +167,25 @@ class EnvironmentList(ListResource):
 
         return EnvironmentPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of EnvironmentInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of EnvironmentInstance
+        :rtype: twilio.rest.serverless.v1.service.environment.EnvironmentPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return EnvironmentPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of EnvironmentInstance records from the API.
@@ -114,19 +203,56 @@ class EnvironmentList(ListResource):
 
         return EnvironmentPage(self._version, response, self._solution)
 
-    def create(self, unique_name, domain_suffix=values.unset):
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of EnvironmentInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of EnvironmentInstance
+        :rtype: twilio.rest.serverless.v1.service.environment.EnvironmentPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return EnvironmentPage(self._version, response, self._solution)
+
+    def create(self, unique_name, domain_suffix=values.unset, deadline=None):
         """
         Create the EnvironmentInstance
 
         :param unicode unique_name: A user-defined string that uniquely identifies the Environment resource
         :param unicode domain_suffix: A URL-friendly name that represents the environment
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created EnvironmentInstance
+        :rtype: twilio.rest.serverless.v1.service.environment.EnvironmentInstance
+        """
+        data = values.of({'UniqueName': unique_name, 'DomainSuffix': domain_suffix, })
+
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return EnvironmentInstance(self._version, payload, service_sid=self._solution['service_sid'], )
+
+    async def create_async(self, unique_name, domain_suffix=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the EnvironmentInstance
+
+        :param unicode unique_name: A user-defined string that uniquely identifies the Environment resource
+        :param unicode domain_suffix: A URL-friendly name that represents the environment
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created EnvironmentInstance
         :rtype: twilio.rest.serverless.v1.service.environment.EnvironmentInstance
         """
         data = values.of({'UniqueName': unique_name, 'DomainSuffix': domain_suffix, })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return EnvironmentInstance(self._version, payload, service_sid=self._solution['service_sid'], )
 
@@ -222,7 +348,7 @@ class EnvironmentContext(InstanceContext):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, 'sid': sid, }
-        self._uri = '/Services/{service_sid}/Environments/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/Environments/{sid}', self._solution)
 
         # Dependents
         self._variables = None
@@ -245,6 +371,22 @@ class EnvironmentContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the EnvironmentInstance
+
+        :returns: The fetched EnvironmentInstance
+        :rtype: twilio.rest.serverless.v1.service.environment.EnvironmentInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return EnvironmentInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self):
         """
         Deletes the EnvironmentInstance
@@ -254,6 +396,15 @@ class EnvironmentContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the EnvironmentInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     @property
     def variables(self):
         """
@@ -263,6 +414,7 @@ class EnvironmentContext(InstanceContext):
         :rtype: twilio.rest.serverless.v1.service.environment.variable.VariableList
         """
         if self._variables is None:
+            from twilio.rest.serverless.v1.service.environment.variable import VariableList
             self._variables = VariableList(
                 self._version,
                 service_sid=self._solution['service_sid'],
@@ -279,6 +431,7 @@ class EnvironmentContext(InstanceContext):
         :rtype: twilio.rest.serverless.v1.service.environment.deployment.DeploymentList
         """
         if self._deployments is None:
+            from twilio.rest.serverless.v1.service.environment.deployment import DeploymentList
             self._deployments = DeploymentList(
                 self._version,
                 service_sid=self._solution['service_sid'],
@@ -295,6 +448,7 @@ class EnvironmentContext(InstanceContext):
         :rtype: twilio.rest.serverless.v1.service.environment.log.LogList
         """
         if self._logs is None:
+            from twilio.rest.serverless.v1.service.environment.log import LogList
             self._logs = LogList(
                 self._version,
                 service_sid=self._solution['service_sid'],
@@ -317,6 +471,29 @@ class EnvironmentInstance(InstanceResource):
     """ PLEASE NOTE that this class contains beta products that are subject to
     change. Use them with caution. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'service_sid': 'service_sid',
+        'build_sid': 'build_sid',
+        'unique_name': 'unique_name',
+        'domain_suffix': 'domain_suffix',
+        'domain_name': 'domain_name',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'url': 'url',
+        'links': 'links',
+    }, _deserializers)
+
     def __init__(self, version, payload, service_sid, sid=None):
         """
         Initialize the EnvironmentInstance
@@ -327,19 +504,7 @@ class EnvironmentInstance(InstanceResource):
         super(EnvironmentInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'service_sid': payload.get('service_sid'),
-            'build_sid': payload.get('build_sid'),
-            'unique_name': payload.get('unique_name'),
-            'domain_suffix': payload.get('domain_suffix'),
-            'domain_name': payload.get('domain_name'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -459,6 +624,15 @@ class EnvironmentInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the EnvironmentInstance
+
+        :returns: The fetched EnvironmentInstance
+        :rtype: twilio.rest.serverless.v1.service.environment.EnvironmentInstance
+        """
+        return await self._proxy.fetch_async()
+
     def delete(self):
         """
         Deletes the EnvironmentInstance
@@ -468,6 +642,15 @@ class EnvironmentInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the EnvironmentInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     @property
     def variables(self):
         """
@@ -507,3 +690,21 @@ class EnvironmentInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Serverless.V1.EnvironmentInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'DeploymentList': 'twilio.rest.serverless.v1.service.environment.deployment',
+    'LogList': 'twilio.rest.serverless.v1.service.environment.log',
+    'VariableList': 'twilio.rest.serverless.v1.service.environment.variable',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
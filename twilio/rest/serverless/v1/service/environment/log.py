@@ -34,10 +34,11 @@ class LogList(ListResource):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, 'environment_sid': environment_sid, }
-        self._uri = '/Services/{service_sid}/Environments/{environment_sid}/Logs'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/Environments/{environment_sid}/Logs', self._solution)
 
     def stream(self, function_sid=values.unset, start_date=values.unset,
-               end_date=values.unset, limit=None, page_size=None):
+               end_date=values.unset, limit=None, page_size=None,
+               prefetch=None, raw=False, deadline=None):
         """
         Streams LogInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -53,23 +54,73 @@ class LogList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.serverless.v1.service.environment.log.LogInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
-            function_sid=function_sid,
-            start_date=start_date,
-            end_date=end_date,
-            page_size=limits['page_size'],
-        )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                function_sid=function_sid,
+                start_date=start_date,
+                end_date=end_date,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, function_sid=values.unset, start_date=values.unset,
+                           end_date=values.unset, limit=None, page_size=None,
+                           prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams LogInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param unicode function_sid: The SID of the function whose invocation produced the Log resources to read
+        :param datetime start_date: The date and time after which the Log resources must have been created.
+        :param datetime end_date: The date and time before which the Log resource must have been created.
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.serverless.v1.service.environment.log.LogInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                function_sid=function_sid,
+                start_date=start_date,
+                end_date=end_date,
+                page_size=limits['page_size'],
+            )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, function_sid=values.unset, start_date=values.unset,
-             end_date=values.unset, limit=None, page_size=None):
+             end_date=values.unset, limit=None, page_size=None, prefetch=None,
+             raw=False, deadline=None):
         """
         Lists LogInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -84,6 +135,12 @@ class LogList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.serverless.v1.service.environment.log.LogInstance]
@@ -94,8 +151,49 @@ class LogList(ListResource):
             end_date=end_date,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, function_sid=values.unset, start_date=values.unset,
+                         end_date=values.unset, limit=None, page_size=None,
+                         prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists LogInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param unicode function_sid: The SID of the function whose invocation produced the Log resources to read
+        :param datetime start_date: The date and time after which the Log resources must have been created.
+        :param datetime end_date: The date and time before which the Log resource must have been created.
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.serverless.v1.service.environment.log.LogInstance]
+        """
+        return [record async for record in await self.stream_async(
+            function_sid=function_sid,
+            start_date=start_date,
+            end_date=end_date,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, function_sid=values.unset, start_date=values.unset,
              end_date=values.unset, page_token=values.unset,
              page_number=values.unset, page_size=values.unset):
@@ -126,6 +224,36 @@ class LogList(ListResource):
 
         return LogPage(self._version, response, self._solution)
 
+    async def page_async(self, function_sid=values.unset, start_date=values.unset,
+                         end_date=values.unset, page_token=values.unset,
+                         page_number=values.unset, page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of LogInstance records from the API.
+        Request is executed immediately
+
+        :param unicode function_sid: The SID of the function whose invocation produced the Log resources to read
+        :param datetime start_date: The date and time after which the Log resources must have been created.
+        :param datetime end_date: The date and time before which the Log resource must have been created.
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of LogInstance
+        :rtype: twilio.rest.serverless.v1.service.environment.log.LogPage
+        """
+        data = values.of({
+            'FunctionSid': function_sid,
+            'StartDate': serialize.iso8601_datetime(start_date),
+            'EndDate': serialize.iso8601_datetime(end_date),
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return LogPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of LogInstance records from the API.
@@ -143,6 +271,23 @@ class LogList(ListResource):
 
         return LogPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of LogInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of LogInstance
+        :rtype: twilio.rest.serverless.v1.service.environment.log.LogPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return LogPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a LogContext
@@ -252,7 +397,7 @@ class LogContext(InstanceContext):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, 'environment_sid': environment_sid, 'sid': sid, }
-        self._uri = '/Services/{service_sid}/Environments/{environment_sid}/Logs/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/Environments/{environment_sid}/Logs/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -271,6 +416,23 @@ class LogContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the LogInstance
+
+        :returns: The fetched LogInstance
+        :rtype: twilio.rest.serverless.v1.service.environment.log.LogInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return LogInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            environment_sid=self._solution['environment_sid'],
+            sid=self._solution['sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -291,6 +453,29 @@ class LogInstance(InstanceResource):
         WARN = "warn"
         ERROR = "error"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'service_sid': 'service_sid',
+        'environment_sid': 'environment_sid',
+        'build_sid': 'build_sid',
+        'deployment_sid': 'deployment_sid',
+        'function_sid': 'function_sid',
+        'request_sid': 'request_sid',
+        'level': 'level',
+        'message': 'message',
+        'date_created': 'date_created',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload, service_sid, environment_sid, sid=None):
         """
         Initialize the LogInstance
@@ -301,20 +486,7 @@ class LogInstance(InstanceResource):
         super(LogInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'service_sid': payload.get('service_sid'),
-            'environment_sid': payload.get('environment_sid'),
-            'build_sid': payload.get('build_sid'),
-            'deployment_sid': payload.get('deployment_sid'),
-            'function_sid': payload.get('function_sid'),
-            'request_sid': payload.get('request_sid'),
-            'level': payload.get('level'),
-            'message': payload.get('message'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -447,6 +619,15 @@ class LogInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the LogInstance
+
+        :returns: The fetched LogInstance
+        :rtype: twilio.rest.serverless.v1.service.environment.log.LogInstance
+        """
+        return await self._proxy.fetch_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
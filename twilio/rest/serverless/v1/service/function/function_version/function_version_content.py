@@ -6,6 +6,7 @@ This code was generated by
       /       /
 """
 
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
@@ -141,7 +142,7 @@ class FunctionVersionContentContext(InstanceContext):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, 'function_sid': function_sid, 'sid': sid, }
-        self._uri = '/Services/{service_sid}/Functions/{function_sid}/Versions/{sid}/Content'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/Functions/{function_sid}/Versions/{sid}/Content', self._solution)
 
     def fetch(self):
         """
@@ -160,6 +161,23 @@ class FunctionVersionContentContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the FunctionVersionContentInstance
+
+        :returns: The fetched FunctionVersionContentInstance
+        :rtype: twilio.rest.serverless.v1.service.function.function_version.function_version_content.FunctionVersionContentInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return FunctionVersionContentInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            function_sid=self._solution['function_sid'],
+            sid=self._solution['sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -175,6 +193,18 @@ class FunctionVersionContentInstance(InstanceResource):
     """ PLEASE NOTE that this class contains beta products that are subject to
     change. Use them with caution. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'service_sid': 'service_sid',
+        'function_sid': 'function_sid',
+        'content': 'content',
+        'url': 'url',
+    })
+
     def __init__(self, version, payload, service_sid, function_sid, sid):
         """
         Initialize the FunctionVersionContentInstance
@@ -185,14 +215,7 @@ class FunctionVersionContentInstance(InstanceResource):
         super(FunctionVersionContentInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'service_sid': payload.get('service_sid'),
-            'function_sid': payload.get('function_sid'),
-            'content': payload.get('content'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -273,6 +296,15 @@ class FunctionVersionContentInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the FunctionVersionContentInstance
+
+        :returns: The fetched FunctionVersionContentInstance
+        :rtype: twilio.rest.serverless.v1.service.function.function_version.function_version_content.FunctionVersionContentInstance
+        """
+        return await self._proxy.fetch_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
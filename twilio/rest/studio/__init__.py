@@ -6,9 +6,9 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base.domain import Domain
-from twilio.rest.studio.v1 import V1
-from twilio.rest.studio.v2 import V2
 
 
 class Studio(Domain):
@@ -35,6 +35,7 @@ class Studio(Domain):
         :rtype: twilio.rest.studio.v1.V1
         """
         if self._v1 is None:
+            from twilio.rest.studio.v1 import V1
             self._v1 = V1(self)
         return self._v1
 
@@ -45,6 +46,7 @@ class Studio(Domain):
         :rtype: twilio.rest.studio.v2.V2
         """
         if self._v2 is None:
+            from twilio.rest.studio.v2 import V2
             self._v2 = V2(self)
         return self._v2
 
@@ -70,3 +72,20 @@ class Studio(Domain):
         :rtype: str
         """
         return '<Twilio.Studio>'
+
+
+_LAZY_IMPORTS = {
+    'V1': 'twilio.rest.studio.v1',
+    'V2': 'twilio.rest.studio.v2',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -6,6 +6,8 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import serialize
 from twilio.base import values
@@ -13,8 +15,6 @@ from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.studio.v1.flow.engagement.engagement_context import EngagementContextList
-from twilio.rest.studio.v1.flow.engagement.step import StepList
 
 
 class EngagementList(ListResource):
@@ -33,9 +33,9 @@ class EngagementList(ListResource):
 
         # Path Solution
         self._solution = {'flow_sid': flow_sid, }
-        self._uri = '/Flows/{flow_sid}/Engagements'.format(**self._solution)
+        self._uri = values.ResourceUri('/Flows/{flow_sid}/Engagements', self._solution)
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams EngagementInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -48,17 +48,57 @@ class EngagementList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.studio.v1.flow.engagement.EngagementInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams EngagementInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.studio.v1.flow.engagement.EngagementInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists EngagementInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -70,11 +110,42 @@ class EngagementList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.studio.v1.flow.engagement.EngagementInstance]
+        """
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists EngagementInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.studio.v1.flow.engagement.EngagementInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -95,6 +166,25 @@ class EngagementList(ListResource):
 
         return EngagementPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of EngagementInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of EngagementInstance
+        :rtype: twilio.rest.studio.v1.flow.engagement.EngagementPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return EngagementPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of EngagementInstance records from the API.
@@ -112,20 +202,58 @@ class EngagementList(ListResource):
 
         return EngagementPage(self._version, response, self._solution)
 
-    def create(self, to, from_, parameters=values.unset):
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of EngagementInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of EngagementInstance
+        :rtype: twilio.rest.studio.v1.flow.engagement.EngagementPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return EngagementPage(self._version, response, self._solution)
+
+    def create(self, to, from_, parameters=values.unset, deadline=None):
         """
         Create the EngagementInstance
 
         :param unicode to: The Contact phone number to start a Studio Flow Engagement
         :param unicode from_: The Twilio phone number to send messages or initiate calls from during the Flow Engagement
         :param dict parameters: A JSON string we will add to your flow's context and that you can access as variables inside your flow
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created EngagementInstance
+        :rtype: twilio.rest.studio.v1.flow.engagement.EngagementInstance
+        """
+        data = values.of({'To': to, 'From': from_, 'Parameters': serialize.object(parameters), })
+
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return EngagementInstance(self._version, payload, flow_sid=self._solution['flow_sid'], )
+
+    async def create_async(self, to, from_, parameters=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the EngagementInstance
+
+        :param unicode to: The Contact phone number to start a Studio Flow Engagement
+        :param unicode from_: The Twilio phone number to send messages or initiate calls from during the Flow Engagement
+        :param dict parameters: A JSON string we will add to your flow's context and that you can access as variables inside your flow
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created EngagementInstance
         :rtype: twilio.rest.studio.v1.flow.engagement.EngagementInstance
         """
         data = values.of({'To': to, 'From': from_, 'Parameters': serialize.object(parameters), })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return EngagementInstance(self._version, payload, flow_sid=self._solution['flow_sid'], )
 
@@ -217,7 +345,7 @@ class EngagementContext(InstanceContext):
 
         # Path Solution
         self._solution = {'flow_sid': flow_sid, 'sid': sid, }
-        self._uri = '/Flows/{flow_sid}/Engagements/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Flows/{flow_sid}/Engagements/{sid}', self._solution)
 
         # Dependents
         self._steps = None
@@ -239,6 +367,22 @@ class EngagementContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the EngagementInstance
+
+        :returns: The fetched EngagementInstance
+        :rtype: twilio.rest.studio.v1.flow.engagement.EngagementInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return EngagementInstance(
+            self._version,
+            payload,
+            flow_sid=self._solution['flow_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self):
         """
         Deletes the EngagementInstance
@@ -248,6 +392,15 @@ class EngagementContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the EngagementInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     @property
     def steps(self):
         """
@@ -257,6 +410,7 @@ class EngagementContext(InstanceContext):
         :rtype: twilio.rest.studio.v1.flow.engagement.step.StepList
         """
         if self._steps is None:
+            from twilio.rest.studio.v1.flow.engagement.step import StepList
             self._steps = StepList(
                 self._version,
                 flow_sid=self._solution['flow_sid'],
@@ -273,6 +427,7 @@ class EngagementContext(InstanceContext):
         :rtype: twilio.rest.studio.v1.flow.engagement.engagement_context.EngagementContextList
         """
         if self._engagement_context is None:
+            from twilio.rest.studio.v1.flow.engagement.engagement_context import EngagementContextList
             self._engagement_context = EngagementContextList(
                 self._version,
                 flow_sid=self._solution['flow_sid'],
@@ -297,6 +452,29 @@ class EngagementInstance(InstanceResource):
         ACTIVE = "active"
         ENDED = "ended"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'flow_sid': 'flow_sid',
+        'contact_sid': 'contact_sid',
+        'contact_channel_address': 'contact_channel_address',
+        'context': 'context',
+        'status': 'status',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'url': 'url',
+        'links': 'links',
+    }, _deserializers)
+
     def __init__(self, version, payload, flow_sid, sid=None):
         """
         Initialize the EngagementInstance
@@ -307,19 +485,7 @@ class EngagementInstance(InstanceResource):
         super(EngagementInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'flow_sid': payload.get('flow_sid'),
-            'contact_sid': payload.get('contact_sid'),
-            'contact_channel_address': payload.get('contact_channel_address'),
-            'context': payload.get('context'),
-            'status': payload.get('status'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -439,6 +605,15 @@ class EngagementInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the EngagementInstance
+
+        :returns: The fetched EngagementInstance
+        :rtype: twilio.rest.studio.v1.flow.engagement.EngagementInstance
+        """
+        return await self._proxy.fetch_async()
+
     def delete(self):
         """
         Deletes the EngagementInstance
@@ -448,6 +623,15 @@ class EngagementInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the EngagementInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     @property
     def steps(self):
         """
@@ -477,3 +661,20 @@ class EngagementInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Studio.V1.EngagementInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'EngagementContextList': 'twilio.rest.studio.v1.flow.engagement.engagement_context',
+    'StepList': 'twilio.rest.studio.v1.flow.engagement.step',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -6,6 +6,7 @@ This code was generated by
       /       /
 """
 
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
@@ -129,7 +130,7 @@ class EngagementContextContext(InstanceContext):
 
         # Path Solution
         self._solution = {'flow_sid': flow_sid, 'engagement_sid': engagement_sid, }
-        self._uri = '/Flows/{flow_sid}/Engagements/{engagement_sid}/Context'.format(**self._solution)
+        self._uri = values.ResourceUri('/Flows/{flow_sid}/Engagements/{engagement_sid}/Context', self._solution)
 
     def fetch(self):
         """
@@ -147,6 +148,22 @@ class EngagementContextContext(InstanceContext):
             engagement_sid=self._solution['engagement_sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the EngagementContextInstance
+
+        :returns: The fetched EngagementContextInstance
+        :rtype: twilio.rest.studio.v1.flow.engagement.engagement_context.EngagementContextInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return EngagementContextInstance(
+            self._version,
+            payload,
+            flow_sid=self._solution['flow_sid'],
+            engagement_sid=self._solution['engagement_sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -160,6 +177,17 @@ class EngagementContextContext(InstanceContext):
 
 class EngagementContextInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'context': 'context',
+        'engagement_sid': 'engagement_sid',
+        'flow_sid': 'flow_sid',
+        'url': 'url',
+    })
+
     def __init__(self, version, payload, flow_sid, engagement_sid):
         """
         Initialize the EngagementContextInstance
@@ -170,13 +198,7 @@ class EngagementContextInstance(InstanceResource):
         super(EngagementContextInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'context': payload.get('context'),
-            'engagement_sid': payload.get('engagement_sid'),
-            'flow_sid': payload.get('flow_sid'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -248,6 +270,15 @@ class EngagementContextInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the EngagementContextInstance
+
+        :returns: The fetched EngagementContextInstance
+        :rtype: twilio.rest.studio.v1.flow.engagement.engagement_context.EngagementContextInstance
+        """
+        return await self._proxy.fetch_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -6,6 +6,7 @@ This code was generated by
       /       /
 """
 
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
@@ -135,7 +136,7 @@ class StepContextContext(InstanceContext):
 
         # Path Solution
         self._solution = {'flow_sid': flow_sid, 'engagement_sid': engagement_sid, 'step_sid': step_sid, }
-        self._uri = '/Flows/{flow_sid}/Engagements/{engagement_sid}/Steps/{step_sid}/Context'.format(**self._solution)
+        self._uri = values.ResourceUri('/Flows/{flow_sid}/Engagements/{engagement_sid}/Steps/{step_sid}/Context', self._solution)
 
     def fetch(self):
         """
@@ -154,6 +155,23 @@ class StepContextContext(InstanceContext):
             step_sid=self._solution['step_sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the StepContextInstance
+
+        :returns: The fetched StepContextInstance
+        :rtype: twilio.rest.studio.v1.flow.engagement.step.step_context.StepContextInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return StepContextInstance(
+            self._version,
+            payload,
+            flow_sid=self._solution['flow_sid'],
+            engagement_sid=self._solution['engagement_sid'],
+            step_sid=self._solution['step_sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -167,6 +185,18 @@ class StepContextContext(InstanceContext):
 
 class StepContextInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'context': 'context',
+        'engagement_sid': 'engagement_sid',
+        'flow_sid': 'flow_sid',
+        'step_sid': 'step_sid',
+        'url': 'url',
+    })
+
     def __init__(self, version, payload, flow_sid, engagement_sid, step_sid):
         """
         Initialize the StepContextInstance
@@ -177,14 +207,7 @@ class StepContextInstance(InstanceResource):
         super(StepContextInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'context': payload.get('context'),
-            'engagement_sid': payload.get('engagement_sid'),
-            'flow_sid': payload.get('flow_sid'),
-            'step_sid': payload.get('step_sid'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -265,6 +288,15 @@ class StepContextInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the StepContextInstance
+
+        :returns: The fetched StepContextInstance
+        :rtype: twilio.rest.studio.v1.flow.engagement.step.step_context.StepContextInstance
+        """
+        return await self._proxy.fetch_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
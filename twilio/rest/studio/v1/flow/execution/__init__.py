@@ -6,6 +6,8 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import serialize
 from twilio.base import values
@@ -13,8 +15,6 @@ from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.studio.v1.flow.execution.execution_context import ExecutionContextList
-from twilio.rest.studio.v1.flow.execution.execution_step import ExecutionStepList
 
 
 class ExecutionList(ListResource):
@@ -33,10 +33,10 @@ class ExecutionList(ListResource):
 
         # Path Solution
         self._solution = {'flow_sid': flow_sid, }
-        self._uri = '/Flows/{flow_sid}/Executions'.format(**self._solution)
+        self._uri = values.ResourceUri('/Flows/{flow_sid}/Executions', self._solution)
 
     def stream(self, date_created_from=values.unset, date_created_to=values.unset,
-               limit=None, page_size=None):
+               limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams ExecutionInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -51,22 +51,69 @@ class ExecutionList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.studio.v1.flow.execution.ExecutionInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
-            date_created_from=date_created_from,
-            date_created_to=date_created_to,
-            page_size=limits['page_size'],
-        )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                date_created_from=date_created_from,
+                date_created_to=date_created_to,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, date_created_from=values.unset, date_created_to=values.unset,
+                           limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams ExecutionInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param datetime date_created_from: Only show Executions that started on or after this ISO 8601 date-time
+        :param datetime date_created_to: Only show Executions that started before this ISO 8601 date-time
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.studio.v1.flow.execution.ExecutionInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
 
-        return self._version.stream(page, limits['limit'])
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                date_created_from=date_created_from,
+                date_created_to=date_created_to,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, date_created_from=values.unset, date_created_to=values.unset,
-             limit=None, page_size=None):
+             limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists ExecutionInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -80,6 +127,12 @@ class ExecutionList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.studio.v1.flow.execution.ExecutionInstance]
@@ -89,8 +142,46 @@ class ExecutionList(ListResource):
             date_created_to=date_created_to,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, date_created_from=values.unset, date_created_to=values.unset,
+                         limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists ExecutionInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param datetime date_created_from: Only show Executions that started on or after this ISO 8601 date-time
+        :param datetime date_created_to: Only show Executions that started before this ISO 8601 date-time
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.studio.v1.flow.execution.ExecutionInstance]
+        """
+        return [record async for record in await self.stream_async(
+            date_created_from=date_created_from,
+            date_created_to=date_created_to,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, date_created_from=values.unset, date_created_to=values.unset,
              page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -119,6 +210,34 @@ class ExecutionList(ListResource):
 
         return ExecutionPage(self._version, response, self._solution)
 
+    async def page_async(self, date_created_from=values.unset, date_created_to=values.unset,
+                         page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of ExecutionInstance records from the API.
+        Request is executed immediately
+
+        :param datetime date_created_from: Only show Executions that started on or after this ISO 8601 date-time
+        :param datetime date_created_to: Only show Executions that started before this ISO 8601 date-time
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of ExecutionInstance
+        :rtype: twilio.rest.studio.v1.flow.execution.ExecutionPage
+        """
+        data = values.of({
+            'DateCreatedFrom': serialize.iso8601_datetime(date_created_from),
+            'DateCreatedTo': serialize.iso8601_datetime(date_created_to),
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return ExecutionPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of ExecutionInstance records from the API.
@@ -136,20 +255,58 @@ class ExecutionList(ListResource):
 
         return ExecutionPage(self._version, response, self._solution)
 
-    def create(self, to, from_, parameters=values.unset):
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of ExecutionInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of ExecutionInstance
+        :rtype: twilio.rest.studio.v1.flow.execution.ExecutionPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return ExecutionPage(self._version, response, self._solution)
+
+    def create(self, to, from_, parameters=values.unset, deadline=None):
         """
         Create the ExecutionInstance
 
         :param unicode to: The Contact phone number to start a Studio Flow Execution
         :param unicode from_: The Twilio phone number or Messaging Service SID to send messages or initiate calls from during the Flow Execution
         :param dict parameters: JSON data that will be added to the Flow's context
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created ExecutionInstance
+        :rtype: twilio.rest.studio.v1.flow.execution.ExecutionInstance
+        """
+        data = values.of({'To': to, 'From': from_, 'Parameters': serialize.object(parameters), })
+
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return ExecutionInstance(self._version, payload, flow_sid=self._solution['flow_sid'], )
+
+    async def create_async(self, to, from_, parameters=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the ExecutionInstance
+
+        :param unicode to: The Contact phone number to start a Studio Flow Execution
+        :param unicode from_: The Twilio phone number or Messaging Service SID to send messages or initiate calls from during the Flow Execution
+        :param dict parameters: JSON data that will be added to the Flow's context
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created ExecutionInstance
         :rtype: twilio.rest.studio.v1.flow.execution.ExecutionInstance
         """
         data = values.of({'To': to, 'From': from_, 'Parameters': serialize.object(parameters), })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return ExecutionInstance(self._version, payload, flow_sid=self._solution['flow_sid'], )
 
@@ -241,7 +398,7 @@ class ExecutionContext(InstanceContext):
 
         # Path Solution
         self._solution = {'flow_sid': flow_sid, 'sid': sid, }
-        self._uri = '/Flows/{flow_sid}/Executions/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Flows/{flow_sid}/Executions/{sid}', self._solution)
 
         # Dependents
         self._steps = None
@@ -263,6 +420,22 @@ class ExecutionContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ExecutionInstance
+
+        :returns: The fetched ExecutionInstance
+        :rtype: twilio.rest.studio.v1.flow.execution.ExecutionInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return ExecutionInstance(
+            self._version,
+            payload,
+            flow_sid=self._solution['flow_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self):
         """
         Deletes the ExecutionInstance
@@ -272,6 +445,15 @@ class ExecutionContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the ExecutionInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def update(self, status):
         """
         Update the ExecutionInstance
@@ -292,6 +474,26 @@ class ExecutionContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, status):
+        """
+        Asynchronous coroutine that updates the ExecutionInstance
+
+        :param ExecutionInstance.Status status: The status of the Execution
+
+        :returns: The updated ExecutionInstance
+        :rtype: twilio.rest.studio.v1.flow.execution.ExecutionInstance
+        """
+        data = values.of({'Status': status, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return ExecutionInstance(
+            self._version,
+            payload,
+            flow_sid=self._solution['flow_sid'],
+            sid=self._solution['sid'],
+        )
+
     @property
     def steps(self):
         """
@@ -301,6 +503,7 @@ class ExecutionContext(InstanceContext):
         :rtype: twilio.rest.studio.v1.flow.execution.execution_step.ExecutionStepList
         """
         if self._steps is None:
+            from twilio.rest.studio.v1.flow.execution.execution_step import ExecutionStepList
             self._steps = ExecutionStepList(
                 self._version,
                 flow_sid=self._solution['flow_sid'],
@@ -317,6 +520,7 @@ class ExecutionContext(InstanceContext):
         :rtype: twilio.rest.studio.v1.flow.execution.execution_context.ExecutionContextList
         """
         if self._execution_context is None:
+            from twilio.rest.studio.v1.flow.execution.execution_context import ExecutionContextList
             self._execution_context = ExecutionContextList(
                 self._version,
                 flow_sid=self._solution['flow_sid'],
@@ -341,6 +545,29 @@ class ExecutionInstance(InstanceResource):
         ACTIVE = "active"
         ENDED = "ended"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'flow_sid': 'flow_sid',
+        'contact_sid': 'contact_sid',
+        'contact_channel_address': 'contact_channel_address',
+        'context': 'context',
+        'status': 'status',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'url': 'url',
+        'links': 'links',
+    }, _deserializers)
+
     def __init__(self, version, payload, flow_sid, sid=None):
         """
         Initialize the ExecutionInstance
@@ -351,19 +578,7 @@ class ExecutionInstance(InstanceResource):
         super(ExecutionInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'flow_sid': payload.get('flow_sid'),
-            'contact_sid': payload.get('contact_sid'),
-            'contact_channel_address': payload.get('contact_channel_address'),
-            'context': payload.get('context'),
-            'status': payload.get('status'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -483,6 +698,15 @@ class ExecutionInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ExecutionInstance
+
+        :returns: The fetched ExecutionInstance
+        :rtype: twilio.rest.studio.v1.flow.execution.ExecutionInstance
+        """
+        return await self._proxy.fetch_async()
+
     def delete(self):
         """
         Deletes the ExecutionInstance
@@ -492,6 +716,15 @@ class ExecutionInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the ExecutionInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def update(self, status):
         """
         Update the ExecutionInstance
@@ -503,6 +736,17 @@ class ExecutionInstance(InstanceResource):
         """
         return self._proxy.update(status, )
 
+    async def update_async(self, status):
+        """
+        Asynchronous coroutine that updates the ExecutionInstance
+
+        :param ExecutionInstance.Status status: The status of the Execution
+
+        :returns: The updated ExecutionInstance
+        :rtype: twilio.rest.studio.v1.flow.execution.ExecutionInstance
+        """
+        return await self._proxy.update_async(status, )
+
     @property
     def steps(self):
         """
@@ -532,3 +776,20 @@ class ExecutionInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Studio.V1.ExecutionInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'ExecutionContextList': 'twilio.rest.studio.v1.flow.execution.execution_context',
+    'ExecutionStepList': 'twilio.rest.studio.v1.flow.execution.execution_step',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
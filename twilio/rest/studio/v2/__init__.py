@@ -6,9 +6,9 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base.version import Version
-from twilio.rest.studio.v2.flow import FlowList
-from twilio.rest.studio.v2.flow_validate import FlowValidateList
 
 
 class V2(Version):
@@ -31,6 +31,7 @@ class V2(Version):
         :rtype: twilio.rest.studio.v2.flow.FlowList
         """
         if self._flows is None:
+            from twilio.rest.studio.v2.flow import FlowList
             self._flows = FlowList(self)
         return self._flows
 
@@ -40,6 +41,7 @@ class V2(Version):
         :rtype: twilio.rest.studio.v2.flow_validate.FlowValidateList
         """
         if self._flow_validate is None:
+            from twilio.rest.studio.v2.flow_validate import FlowValidateList
             self._flow_validate = FlowValidateList(self)
         return self._flow_validate
 
@@ -51,3 +53,20 @@ class V2(Version):
         :rtype: str
         """
         return '<Twilio.Studio.V2>'
+
+
+_LAZY_IMPORTS = {
+    'FlowList': 'twilio.rest.studio.v2.flow',
+    'FlowValidateList': 'twilio.rest.studio.v2.flow_validate',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
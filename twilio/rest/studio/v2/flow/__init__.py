@@ -6,6 +6,8 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import serialize
 from twilio.base import values
@@ -13,9 +15,6 @@ from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.studio.v2.flow.execution import ExecutionList
-from twilio.rest.studio.v2.flow.flow_revision import FlowRevisionList
-from twilio.rest.studio.v2.flow.test_user import FlowTestUserList
 
 
 class FlowList(ListResource):
@@ -33,10 +32,10 @@ class FlowList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Flows'.format(**self._solution)
+        self._uri = values.ResourceUri('/Flows', self._solution)
 
     def create(self, friendly_name, status, definition,
-               commit_message=values.unset):
+               commit_message=values.unset, deadline=None):
         """
         Create the FlowInstance
 
@@ -44,6 +43,34 @@ class FlowList(ListResource):
         :param FlowInstance.Status status: The status of the Flow
         :param dict definition: JSON representation of flow definition
         :param unicode commit_message: Description of change made in the revision
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created FlowInstance
+        :rtype: twilio.rest.studio.v2.flow.FlowInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'Status': status,
+            'Definition': serialize.object(definition),
+            'CommitMessage': commit_message,
+        })
+
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return FlowInstance(self._version, payload, )
+
+    async def create_async(self, friendly_name, status, definition,
+                           commit_message=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the FlowInstance
+
+        :param unicode friendly_name: The string that you assigned to describe the Flow
+        :param FlowInstance.Status status: The status of the Flow
+        :param dict definition: JSON representation of flow definition
+        :param unicode commit_message: Description of change made in the revision
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created FlowInstance
         :rtype: twilio.rest.studio.v2.flow.FlowInstance
@@ -55,11 +82,11 @@ class FlowList(ListResource):
             'CommitMessage': commit_message,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return FlowInstance(self._version, payload, )
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams FlowInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -72,17 +99,57 @@ class FlowList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.studio.v2.flow.FlowInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams FlowInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.studio.v2.flow.FlowInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists FlowInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -94,11 +161,42 @@ class FlowList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.studio.v2.flow.FlowInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists FlowInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.studio.v2.flow.FlowInstance]
+        """
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -119,6 +217,25 @@ class FlowList(ListResource):
 
         return FlowPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of FlowInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of FlowInstance
+        :rtype: twilio.rest.studio.v2.flow.FlowPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return FlowPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of FlowInstance records from the API.
@@ -136,6 +253,23 @@ class FlowList(ListResource):
 
         return FlowPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of FlowInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of FlowInstance
+        :rtype: twilio.rest.studio.v2.flow.FlowPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return FlowPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a FlowContext
@@ -222,7 +356,7 @@ class FlowContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/Flows/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Flows/{sid}', self._solution)
 
         # Dependents
         self._revisions = None
@@ -253,6 +387,30 @@ class FlowContext(InstanceContext):
 
         return FlowInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def update_async(self, status, friendly_name=values.unset, definition=values.unset,
+                           commit_message=values.unset):
+        """
+        Asynchronous coroutine that updates the FlowInstance
+
+        :param FlowInstance.Status status: The status of the Flow
+        :param unicode friendly_name: The string that you assigned to describe the Flow
+        :param dict definition: JSON representation of flow definition
+        :param unicode commit_message: Description of change made in the revision
+
+        :returns: The updated FlowInstance
+        :rtype: twilio.rest.studio.v2.flow.FlowInstance
+        """
+        data = values.of({
+            'Status': status,
+            'FriendlyName': friendly_name,
+            'Definition': serialize.object(definition),
+            'CommitMessage': commit_message,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return FlowInstance(self._version, payload, sid=self._solution['sid'], )
+
     def fetch(self):
         """
         Fetch the FlowInstance
@@ -264,6 +422,17 @@ class FlowContext(InstanceContext):
 
         return FlowInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the FlowInstance
+
+        :returns: The fetched FlowInstance
+        :rtype: twilio.rest.studio.v2.flow.FlowInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return FlowInstance(self._version, payload, sid=self._solution['sid'], )
+
     def delete(self):
         """
         Deletes the FlowInstance
@@ -273,6 +442,15 @@ class FlowContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the FlowInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     @property
     def revisions(self):
         """
@@ -282,6 +460,7 @@ class FlowContext(InstanceContext):
         :rtype: twilio.rest.studio.v2.flow.flow_revision.FlowRevisionList
         """
         if self._revisions is None:
+            from twilio.rest.studio.v2.flow.flow_revision import FlowRevisionList
             self._revisions = FlowRevisionList(self._version, sid=self._solution['sid'], )
         return self._revisions
 
@@ -294,6 +473,7 @@ class FlowContext(InstanceContext):
         :rtype: twilio.rest.studio.v2.flow.test_user.FlowTestUserList
         """
         if self._test_users is None:
+            from twilio.rest.studio.v2.flow.test_user import FlowTestUserList
             self._test_users = FlowTestUserList(self._version, sid=self._solution['sid'], )
         return self._test_users
 
@@ -306,6 +486,7 @@ class FlowContext(InstanceContext):
         :rtype: twilio.rest.studio.v2.flow.execution.ExecutionList
         """
         if self._executions is None:
+            from twilio.rest.studio.v2.flow.execution import ExecutionList
             self._executions = ExecutionList(self._version, flow_sid=self._solution['sid'], )
         return self._executions
 
@@ -326,6 +507,34 @@ class FlowInstance(InstanceResource):
         DRAFT = "draft"
         PUBLISHED = "published"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'revision': deserialize.integer,
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'friendly_name': 'friendly_name',
+        'definition': 'definition',
+        'status': 'status',
+        'revision': 'revision',
+        'commit_message': 'commit_message',
+        'valid': 'valid',
+        'errors': 'errors',
+        'warnings': 'warnings',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'webhook_url': 'webhook_url',
+        'url': 'url',
+        'links': 'links',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the FlowInstance
@@ -336,23 +545,7 @@ class FlowInstance(InstanceResource):
         super(FlowInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'friendly_name': payload.get('friendly_name'),
-            'definition': payload.get('definition'),
-            'status': payload.get('status'),
-            'revision': deserialize.integer(payload.get('revision')),
-            'commit_message': payload.get('commit_message'),
-            'valid': payload.get('valid'),
-            'errors': payload.get('errors'),
-            'warnings': payload.get('warnings'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'webhook_url': payload.get('webhook_url'),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -511,6 +704,26 @@ class FlowInstance(InstanceResource):
             commit_message=commit_message,
         )
 
+    async def update_async(self, status, friendly_name=values.unset, definition=values.unset,
+                           commit_message=values.unset):
+        """
+        Asynchronous coroutine that updates the FlowInstance
+
+        :param FlowInstance.Status status: The status of the Flow
+        :param unicode friendly_name: The string that you assigned to describe the Flow
+        :param dict definition: JSON representation of flow definition
+        :param unicode commit_message: Description of change made in the revision
+
+        :returns: The updated FlowInstance
+        :rtype: twilio.rest.studio.v2.flow.FlowInstance
+        """
+        return await self._proxy.update_async(
+            status,
+            friendly_name=friendly_name,
+            definition=definition,
+            commit_message=commit_message,
+        )
+
     def fetch(self):
         """
         Fetch the FlowInstance
@@ -520,6 +733,15 @@ class FlowInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the FlowInstance
+
+        :returns: The fetched FlowInstance
+        :rtype: twilio.rest.studio.v2.flow.FlowInstance
+        """
+        return await self._proxy.fetch_async()
+
     def delete(self):
         """
         Deletes the FlowInstance
@@ -529,6 +751,15 @@ class FlowInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the FlowInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     @property
     def revisions(self):
         """
@@ -568,3 +799,21 @@ class FlowInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Studio.V2.FlowInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'ExecutionList': 'twilio.rest.studio.v2.flow.execution',
+    'FlowRevisionList': 'twilio.rest.studio.v2.flow.flow_revision',
+    'FlowTestUserList': 'twilio.rest.studio.v2.flow.test_user',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
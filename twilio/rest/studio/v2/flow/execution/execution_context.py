@@ -6,6 +6,7 @@ This code was generated by
       /       /
 """
 
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
@@ -129,7 +130,7 @@ class ExecutionContextContext(InstanceContext):
 
         # Path Solution
         self._solution = {'flow_sid': flow_sid, 'execution_sid': execution_sid, }
-        self._uri = '/Flows/{flow_sid}/Executions/{execution_sid}/Context'.format(**self._solution)
+        self._uri = values.ResourceUri('/Flows/{flow_sid}/Executions/{execution_sid}/Context', self._solution)
 
     def fetch(self):
         """
@@ -147,6 +148,22 @@ class ExecutionContextContext(InstanceContext):
             execution_sid=self._solution['execution_sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ExecutionContextInstance
+
+        :returns: The fetched ExecutionContextInstance
+        :rtype: twilio.rest.studio.v2.flow.execution.execution_context.ExecutionContextInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return ExecutionContextInstance(
+            self._version,
+            payload,
+            flow_sid=self._solution['flow_sid'],
+            execution_sid=self._solution['execution_sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -160,6 +177,17 @@ class ExecutionContextContext(InstanceContext):
 
 class ExecutionContextInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'context': 'context',
+        'flow_sid': 'flow_sid',
+        'execution_sid': 'execution_sid',
+        'url': 'url',
+    })
+
     def __init__(self, version, payload, flow_sid, execution_sid):
         """
         Initialize the ExecutionContextInstance
@@ -170,13 +198,7 @@ class ExecutionContextInstance(InstanceResource):
         super(ExecutionContextInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'context': payload.get('context'),
-            'flow_sid': payload.get('flow_sid'),
-            'execution_sid': payload.get('execution_sid'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -248,6 +270,15 @@ class ExecutionContextInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ExecutionContextInstance
+
+        :returns: The fetched ExecutionContextInstance
+        :rtype: twilio.rest.studio.v2.flow.execution.execution_context.ExecutionContextInstance
+        """
+        return await self._proxy.fetch_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
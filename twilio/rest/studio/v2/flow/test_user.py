@@ -7,6 +7,7 @@ This code was generated by
 """
 
 from twilio.base import serialize
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
@@ -114,7 +115,7 @@ class FlowTestUserContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/Flows/{sid}/TestUsers'.format(**self._solution)
+        self._uri = values.ResourceUri('/Flows/{sid}/TestUsers', self._solution)
 
     def fetch(self):
         """
@@ -127,6 +128,17 @@ class FlowTestUserContext(InstanceContext):
 
         return FlowTestUserInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the FlowTestUserInstance
+
+        :returns: The fetched FlowTestUserInstance
+        :rtype: twilio.rest.studio.v2.flow.test_user.FlowTestUserInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return FlowTestUserInstance(self._version, payload, sid=self._solution['sid'], )
+
     def update(self, test_users):
         """
         Update the FlowTestUserInstance
@@ -142,6 +154,21 @@ class FlowTestUserContext(InstanceContext):
 
         return FlowTestUserInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def update_async(self, test_users):
+        """
+        Asynchronous coroutine that updates the FlowTestUserInstance
+
+        :param list[unicode] test_users: List of test user identities that can test draft versions of the flow.
+
+        :returns: The updated FlowTestUserInstance
+        :rtype: twilio.rest.studio.v2.flow.test_user.FlowTestUserInstance
+        """
+        data = values.of({'TestUsers': serialize.map(test_users, lambda e: e), })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return FlowTestUserInstance(self._version, payload, sid=self._solution['sid'], )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -155,6 +182,15 @@ class FlowTestUserContext(InstanceContext):
 
 class FlowTestUserInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'test_users': 'test_users',
+        'url': 'url',
+    })
+
     def __init__(self, version, payload, sid):
         """
         Initialize the FlowTestUserInstance
@@ -165,11 +201,7 @@ class FlowTestUserInstance(InstanceResource):
         super(FlowTestUserInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'test_users': payload.get('test_users'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -221,6 +253,15 @@ class FlowTestUserInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the FlowTestUserInstance
+
+        :returns: The fetched FlowTestUserInstance
+        :rtype: twilio.rest.studio.v2.flow.test_user.FlowTestUserInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, test_users):
         """
         Update the FlowTestUserInstance
@@ -232,6 +273,17 @@ class FlowTestUserInstance(InstanceResource):
         """
         return self._proxy.update(test_users, )
 
+    async def update_async(self, test_users):
+        """
+        Asynchronous coroutine that updates the FlowTestUserInstance
+
+        :param list[unicode] test_users: List of test user identities that can test draft versions of the flow.
+
+        :returns: The updated FlowTestUserInstance
+        :rtype: twilio.rest.studio.v2.flow.test_user.FlowTestUserInstance
+        """
+        return await self._proxy.update_async(test_users, )
+
     def __repr__(self):
         """
         Provide a friendly representation
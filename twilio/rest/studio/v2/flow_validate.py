@@ -7,6 +7,7 @@ This code was generated by
 """
 
 from twilio.base import serialize
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
@@ -28,7 +29,7 @@ class FlowValidateList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Flows/Validate'.format(**self._solution)
+        self._uri = values.ResourceUri('/Flows/Validate', self._solution)
 
     def update(self, friendly_name, status, definition,
                commit_message=values.unset):
@@ -54,6 +55,30 @@ class FlowValidateList(ListResource):
 
         return FlowValidateInstance(self._version, payload, )
 
+    async def update_async(self, friendly_name, status, definition,
+                           commit_message=values.unset):
+        """
+        Asynchronous coroutine that updates the FlowValidateInstance
+
+        :param unicode friendly_name: The string that you assigned to describe the Flow
+        :param FlowValidateInstance.Status status: The status of the Flow
+        :param dict definition: JSON representation of flow definition
+        :param unicode commit_message: Description of change made in the revision
+
+        :returns: The updated FlowValidateInstance
+        :rtype: twilio.rest.studio.v2.flow_validate.FlowValidateInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'Status': status,
+            'Definition': serialize.object(definition),
+            'CommitMessage': commit_message,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return FlowValidateInstance(self._version, payload, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -108,6 +133,13 @@ class FlowValidateInstance(InstanceResource):
         DRAFT = "draft"
         PUBLISHED = "published"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'valid': 'valid',
+    })
+
     def __init__(self, version, payload):
         """
         Initialize the FlowValidateInstance
@@ -118,7 +150,7 @@ class FlowValidateInstance(InstanceResource):
         super(FlowValidateInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {'valid': payload.get('valid'), }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
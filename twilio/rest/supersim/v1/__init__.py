@@ -6,15 +6,9 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base.version import Version
-from twilio.rest.supersim.v1.esim_profile import EsimProfileList
-from twilio.rest.supersim.v1.fleet import FleetList
-from twilio.rest.supersim.v1.ip_command import IpCommandList
-from twilio.rest.supersim.v1.network import NetworkList
-from twilio.rest.supersim.v1.network_access_profile import NetworkAccessProfileList
-from twilio.rest.supersim.v1.sim import SimList
-from twilio.rest.supersim.v1.sms_command import SmsCommandList
-from twilio.rest.supersim.v1.usage_record import UsageRecordList
 
 
 class V1(Version):
@@ -43,6 +37,7 @@ class V1(Version):
         :rtype: twilio.rest.supersim.v1.esim_profile.EsimProfileList
         """
         if self._esim_profiles is None:
+            from twilio.rest.supersim.v1.esim_profile import EsimProfileList
             self._esim_profiles = EsimProfileList(self)
         return self._esim_profiles
 
@@ -52,6 +47,7 @@ class V1(Version):
         :rtype: twilio.rest.supersim.v1.fleet.FleetList
         """
         if self._fleets is None:
+            from twilio.rest.supersim.v1.fleet import FleetList
             self._fleets = FleetList(self)
         return self._fleets
 
@@ -61,6 +57,7 @@ class V1(Version):
         :rtype: twilio.rest.supersim.v1.ip_command.IpCommandList
         """
         if self._ip_commands is None:
+            from twilio.rest.supersim.v1.ip_command import IpCommandList
             self._ip_commands = IpCommandList(self)
         return self._ip_commands
 
@@ -70,6 +67,7 @@ class V1(Version):
         :rtype: twilio.rest.supersim.v1.network.NetworkList
         """
         if self._networks is None:
+            from twilio.rest.supersim.v1.network import NetworkList
             self._networks = NetworkList(self)
         return self._networks
 
@@ -79,6 +77,7 @@ class V1(Version):
         :rtype: twilio.rest.supersim.v1.network_access_profile.NetworkAccessProfileList
         """
         if self._network_access_profiles is None:
+            from twilio.rest.supersim.v1.network_access_profile import NetworkAccessProfileList
             self._network_access_profiles = NetworkAccessProfileList(self)
         return self._network_access_profiles
 
@@ -88,6 +87,7 @@ class V1(Version):
         :rtype: twilio.rest.supersim.v1.sim.SimList
         """
         if self._sims is None:
+            from twilio.rest.supersim.v1.sim import SimList
             self._sims = SimList(self)
         return self._sims
 
@@ -97,6 +97,7 @@ class V1(Version):
         :rtype: twilio.rest.supersim.v1.sms_command.SmsCommandList
         """
         if self._sms_commands is None:
+            from twilio.rest.supersim.v1.sms_command import SmsCommandList
             self._sms_commands = SmsCommandList(self)
         return self._sms_commands
 
@@ -106,6 +107,7 @@ class V1(Version):
         :rtype: twilio.rest.supersim.v1.usage_record.UsageRecordList
         """
         if self._usage_records is None:
+            from twilio.rest.supersim.v1.usage_record import UsageRecordList
             self._usage_records = UsageRecordList(self)
         return self._usage_records
 
@@ -117,3 +119,26 @@ class V1(Version):
         :rtype: str
         """
         return '<Twilio.Supersim.V1>'
+
+
+_LAZY_IMPORTS = {
+    'EsimProfileList': 'twilio.rest.supersim.v1.esim_profile',
+    'FleetList': 'twilio.rest.supersim.v1.fleet',
+    'IpCommandList': 'twilio.rest.supersim.v1.ip_command',
+    'NetworkAccessProfileList': 'twilio.rest.supersim.v1.network_access_profile',
+    'NetworkList': 'twilio.rest.supersim.v1.network',
+    'SimList': 'twilio.rest.supersim.v1.sim',
+    'SmsCommandList': 'twilio.rest.supersim.v1.sms_command',
+    'UsageRecordList': 'twilio.rest.supersim.v1.usage_record',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -31,27 +31,49 @@ class EsimProfileList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/ESimProfiles'.format(**self._solution)
+        self._uri = values.ResourceUri('/ESimProfiles', self._solution)
 
-    def create(self, eid, callback_url=values.unset, callback_method=values.unset):
+    def create(self, eid, callback_url=values.unset, callback_method=values.unset, deadline=None):
         """
         Create the EsimProfileInstance
 
         :param unicode eid: Identifier of the eUICC that will claim the eSIM Profile
         :param unicode callback_url: The URL we should call after we have sent when the status of the eSIM Profile changes
         :param unicode callback_method: The HTTP method we should use to call callback_url
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created EsimProfileInstance
         :rtype: twilio.rest.supersim.v1.esim_profile.EsimProfileInstance
         """
         data = values.of({'Eid': eid, 'CallbackUrl': callback_url, 'CallbackMethod': callback_method, })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return EsimProfileInstance(self._version, payload, )
+
+    async def create_async(self, eid, callback_url=values.unset, callback_method=values.unset,
+                           deadline=None):
+        """
+        Asynchronous coroutine that creates the EsimProfileInstance
+
+        :param unicode eid: Identifier of the eUICC that will claim the eSIM Profile
+        :param unicode callback_url: The URL we should call after we have sent when the status of the eSIM Profile changes
+        :param unicode callback_method: The HTTP method we should use to call callback_url
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created EsimProfileInstance
+        :rtype: twilio.rest.supersim.v1.esim_profile.EsimProfileInstance
+        """
+        data = values.of({'Eid': eid, 'CallbackUrl': callback_url, 'CallbackMethod': callback_method, })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return EsimProfileInstance(self._version, payload, )
 
     def stream(self, eid=values.unset, sim_sid=values.unset, status=values.unset,
-               limit=None, page_size=None):
+               limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams EsimProfileInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -67,18 +89,62 @@ class EsimProfileList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.supersim.v1.esim_profile.EsimProfileInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(eid=eid, sim_sid=sim_sid, status=status, page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(eid=eid, sim_sid=sim_sid, status=status, page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, eid=values.unset, sim_sid=values.unset, status=values.unset,
+                           limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams EsimProfileInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param unicode eid: List the eSIM Profiles that have been associated with an EId
+        :param unicode sim_sid: Find the eSIM Profile resource related to a Sim resource by providing the SIM SID
+        :param EsimProfileInstance.Status status: List the eSIM Profiles that are in a given status
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.supersim.v1.esim_profile.EsimProfileInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(eid=eid, sim_sid=sim_sid, status=status, page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, eid=values.unset, sim_sid=values.unset, status=values.unset,
-             limit=None, page_size=None):
+             limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists EsimProfileInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -93,11 +159,45 @@ class EsimProfileList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.supersim.v1.esim_profile.EsimProfileInstance]
+        """
+        return list(self.stream(eid=eid, sim_sid=sim_sid, status=status, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, eid=values.unset, sim_sid=values.unset, status=values.unset,
+                         limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists EsimProfileInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param unicode eid: List the eSIM Profiles that have been associated with an EId
+        :param unicode sim_sid: Find the eSIM Profile resource related to a Sim resource by providing the SIM SID
+        :param EsimProfileInstance.Status status: List the eSIM Profiles that are in a given status
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.supersim.v1.esim_profile.EsimProfileInstance]
         """
-        return list(self.stream(eid=eid, sim_sid=sim_sid, status=status, limit=limit, page_size=page_size, ))
+        return [record async for record in await self.stream_async(eid=eid, sim_sid=sim_sid, status=status, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, eid=values.unset, sim_sid=values.unset, status=values.unset,
              page_token=values.unset, page_number=values.unset,
@@ -129,6 +229,36 @@ class EsimProfileList(ListResource):
 
         return EsimProfilePage(self._version, response, self._solution)
 
+    async def page_async(self, eid=values.unset, sim_sid=values.unset, status=values.unset,
+                         page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of EsimProfileInstance records from the API.
+        Request is executed immediately
+
+        :param unicode eid: List the eSIM Profiles that have been associated with an EId
+        :param unicode sim_sid: Find the eSIM Profile resource related to a Sim resource by providing the SIM SID
+        :param EsimProfileInstance.Status status: List the eSIM Profiles that are in a given status
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of EsimProfileInstance
+        :rtype: twilio.rest.supersim.v1.esim_profile.EsimProfilePage
+        """
+        data = values.of({
+            'Eid': eid,
+            'SimSid': sim_sid,
+            'Status': status,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return EsimProfilePage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of EsimProfileInstance records from the API.
@@ -146,6 +276,23 @@ class EsimProfileList(ListResource):
 
         return EsimProfilePage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of EsimProfileInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of EsimProfileInstance
+        :rtype: twilio.rest.supersim.v1.esim_profile.EsimProfilePage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return EsimProfilePage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a EsimProfileContext
@@ -236,7 +383,7 @@ class EsimProfileContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/ESimProfiles/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/ESimProfiles/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -249,6 +396,17 @@ class EsimProfileContext(InstanceContext):
 
         return EsimProfileInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the EsimProfileInstance
+
+        :returns: The fetched EsimProfileInstance
+        :rtype: twilio.rest.supersim.v1.esim_profile.EsimProfileInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return EsimProfileInstance(self._version, payload, sid=self._solution['sid'], )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -272,6 +430,30 @@ class EsimProfileInstance(InstanceResource):
         INSTALLED = "installed"
         FAILED = "failed"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'iccid': 'iccid',
+        'sim_sid': 'sim_sid',
+        'status': 'status',
+        'eid': 'eid',
+        'smdp_plus_address': 'smdp_plus_address',
+        'error_code': 'error_code',
+        'error_message': 'error_message',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the EsimProfileInstance
@@ -282,20 +464,7 @@ class EsimProfileInstance(InstanceResource):
         super(EsimProfileInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'iccid': payload.get('iccid'),
-            'sim_sid': payload.get('sim_sid'),
-            'status': payload.get('status'),
-            'eid': payload.get('eid'),
-            'smdp_plus_address': payload.get('smdp_plus_address'),
-            'error_code': payload.get('error_code'),
-            'error_message': payload.get('error_message'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -419,6 +588,15 @@ class EsimProfileInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the EsimProfileInstance
+
+        :returns: The fetched EsimProfileInstance
+        :rtype: twilio.rest.supersim.v1.esim_profile.EsimProfileInstance
+        """
+        return await self._proxy.fetch_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -31,13 +31,13 @@ class FleetList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Fleets'.format(**self._solution)
+        self._uri = values.ResourceUri('/Fleets', self._solution)
 
     def create(self, network_access_profile, unique_name=values.unset,
                data_enabled=values.unset, data_limit=values.unset,
                ip_commands_url=values.unset, ip_commands_method=values.unset,
                sms_commands_enabled=values.unset, sms_commands_url=values.unset,
-               sms_commands_method=values.unset):
+               sms_commands_method=values.unset, deadline=None):
         """
         Create the FleetInstance
 
@@ -50,6 +50,8 @@ class FleetList(ListResource):
         :param bool sms_commands_enabled: Defines whether SIMs in the Fleet are capable of sending and receiving machine-to-machine SMS via Commands
         :param unicode sms_commands_url: The URL that will receive a webhook when a Super SIM in the Fleet is used to send an SMS from your device to the SMS Commands number
         :param unicode sms_commands_method: A string representing the HTTP method to use when making a request to `sms_commands_url`
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created FleetInstance
         :rtype: twilio.rest.supersim.v1.fleet.FleetInstance
@@ -66,12 +68,51 @@ class FleetList(ListResource):
             'SmsCommandsMethod': sms_commands_method,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return FleetInstance(self._version, payload, )
+
+    async def create_async(self, network_access_profile, unique_name=values.unset,
+                           data_enabled=values.unset, data_limit=values.unset,
+                           ip_commands_url=values.unset, ip_commands_method=values.unset,
+                           sms_commands_enabled=values.unset, sms_commands_url=values.unset,
+                           sms_commands_method=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the FleetInstance
+
+        :param unicode network_access_profile: The SID or unique name of the Network Access Profile of the Fleet
+        :param unicode unique_name: An application-defined string that uniquely identifies the resource
+        :param bool data_enabled: Defines whether SIMs in the Fleet are capable of using data connectivity
+        :param unicode data_limit: The total data usage (download and upload combined) in Megabytes that each Sim resource assigned to the Fleet resource can consume
+        :param unicode ip_commands_url: The URL that will receive a webhook when a Super SIM in the Fleet is used to send an IP Command from your device
+        :param unicode ip_commands_method: A string representing the HTTP method to use when making a request to `ip_commands_url`
+        :param bool sms_commands_enabled: Defines whether SIMs in the Fleet are capable of sending and receiving machine-to-machine SMS via Commands
+        :param unicode sms_commands_url: The URL that will receive a webhook when a Super SIM in the Fleet is used to send an SMS from your device to the SMS Commands number
+        :param unicode sms_commands_method: A string representing the HTTP method to use when making a request to `sms_commands_url`
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created FleetInstance
+        :rtype: twilio.rest.supersim.v1.fleet.FleetInstance
+        """
+        data = values.of({
+            'NetworkAccessProfile': network_access_profile,
+            'UniqueName': unique_name,
+            'DataEnabled': data_enabled,
+            'DataLimit': data_limit,
+            'IpCommandsUrl': ip_commands_url,
+            'IpCommandsMethod': ip_commands_method,
+            'SmsCommandsEnabled': sms_commands_enabled,
+            'SmsCommandsUrl': sms_commands_url,
+            'SmsCommandsMethod': sms_commands_method,
+        })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return FleetInstance(self._version, payload, )
 
     def stream(self, network_access_profile=values.unset, limit=None,
-               page_size=None):
+               page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams FleetInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -85,17 +126,59 @@ class FleetList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.supersim.v1.fleet.FleetInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(network_access_profile=network_access_profile, page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(network_access_profile=network_access_profile, page_size=limits['page_size'], )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, network_access_profile=values.unset, limit=None,
+                           page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams FleetInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param unicode network_access_profile: The SID or unique name of the Network Access Profile of the Fleet
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.supersim.v1.fleet.FleetInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(network_access_profile=network_access_profile, page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, network_access_profile=values.unset, limit=None, page_size=None):
+    def list(self, network_access_profile=values.unset, limit=None, page_size=None,
+             prefetch=None, raw=False, deadline=None):
         """
         Lists FleetInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -108,6 +191,12 @@ class FleetList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.supersim.v1.fleet.FleetInstance]
@@ -116,8 +205,44 @@ class FleetList(ListResource):
             network_access_profile=network_access_profile,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, network_access_profile=values.unset, limit=None, page_size=None,
+                         prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists FleetInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param unicode network_access_profile: The SID or unique name of the Network Access Profile of the Fleet
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.supersim.v1.fleet.FleetInstance]
+        """
+        return [record async for record in await self.stream_async(
+            network_access_profile=network_access_profile,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, network_access_profile=values.unset, page_token=values.unset,
              page_number=values.unset, page_size=values.unset):
         """
@@ -143,6 +268,31 @@ class FleetList(ListResource):
 
         return FleetPage(self._version, response, self._solution)
 
+    async def page_async(self, network_access_profile=values.unset, page_token=values.unset,
+                         page_number=values.unset, page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of FleetInstance records from the API.
+        Request is executed immediately
+
+        :param unicode network_access_profile: The SID or unique name of the Network Access Profile of the Fleet
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of FleetInstance
+        :rtype: twilio.rest.supersim.v1.fleet.FleetPage
+        """
+        data = values.of({
+            'NetworkAccessProfile': network_access_profile,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return FleetPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of FleetInstance records from the API.
@@ -160,6 +310,23 @@ class FleetList(ListResource):
 
         return FleetPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of FleetInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of FleetInstance
+        :rtype: twilio.rest.supersim.v1.fleet.FleetPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return FleetPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a FleetContext
@@ -250,7 +417,7 @@ class FleetContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/Fleets/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Fleets/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -263,6 +430,17 @@ class FleetContext(InstanceContext):
 
         return FleetInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the FleetInstance
+
+        :returns: The fetched FleetInstance
+        :rtype: twilio.rest.supersim.v1.fleet.FleetInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return FleetInstance(self._version, payload, sid=self._solution['sid'], )
+
     def update(self, unique_name=values.unset, network_access_profile=values.unset,
                ip_commands_url=values.unset, ip_commands_method=values.unset,
                sms_commands_url=values.unset, sms_commands_method=values.unset):
@@ -292,6 +470,35 @@ class FleetContext(InstanceContext):
 
         return FleetInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def update_async(self, unique_name=values.unset, network_access_profile=values.unset,
+                           ip_commands_url=values.unset, ip_commands_method=values.unset,
+                           sms_commands_url=values.unset, sms_commands_method=values.unset):
+        """
+        Asynchronous coroutine that updates the FleetInstance
+
+        :param unicode unique_name: An application-defined string that uniquely identifies the resource
+        :param unicode network_access_profile: The SID or unique name of the Network Access Profile of the Fleet
+        :param unicode ip_commands_url: The URL that will receive a webhook when a Super SIM in the Fleet is used to send an IP Command from your device
+        :param unicode ip_commands_method: A string representing the HTTP method to use when making a request to `ip_commands_url`
+        :param unicode sms_commands_url: The URL that will receive a webhook when a Super SIM in the Fleet is used to send an SMS from your device to the SMS Commands number
+        :param unicode sms_commands_method: A string representing the HTTP method to use when making a request to `sms_commands_url`
+
+        :returns: The updated FleetInstance
+        :rtype: twilio.rest.supersim.v1.fleet.FleetInstance
+        """
+        data = values.of({
+            'UniqueName': unique_name,
+            'NetworkAccessProfile': network_access_profile,
+            'IpCommandsUrl': ip_commands_url,
+            'IpCommandsMethod': ip_commands_method,
+            'SmsCommandsUrl': sms_commands_url,
+            'SmsCommandsMethod': sms_commands_method,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return FleetInstance(self._version, payload, sid=self._solution['sid'], )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -310,6 +517,34 @@ class FleetInstance(InstanceResource):
     class DataMetering(object):
         PAYG = "payg"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+        'data_limit': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'sid': 'sid',
+        'unique_name': 'unique_name',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'url': 'url',
+        'data_enabled': 'data_enabled',
+        'data_limit': 'data_limit',
+        'data_metering': 'data_metering',
+        'sms_commands_enabled': 'sms_commands_enabled',
+        'sms_commands_url': 'sms_commands_url',
+        'sms_commands_method': 'sms_commands_method',
+        'network_access_profile_sid': 'network_access_profile_sid',
+        'ip_commands_url': 'ip_commands_url',
+        'ip_commands_method': 'ip_commands_method',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the FleetInstance
@@ -320,23 +555,7 @@ class FleetInstance(InstanceResource):
         super(FleetInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'sid': payload.get('sid'),
-            'unique_name': payload.get('unique_name'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'url': payload.get('url'),
-            'data_enabled': payload.get('data_enabled'),
-            'data_limit': deserialize.integer(payload.get('data_limit')),
-            'data_metering': payload.get('data_metering'),
-            'sms_commands_enabled': payload.get('sms_commands_enabled'),
-            'sms_commands_url': payload.get('sms_commands_url'),
-            'sms_commands_method': payload.get('sms_commands_method'),
-            'network_access_profile_sid': payload.get('network_access_profile_sid'),
-            'ip_commands_url': payload.get('ip_commands_url'),
-            'ip_commands_method': payload.get('ip_commands_method'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -484,6 +703,15 @@ class FleetInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the FleetInstance
+
+        :returns: The fetched FleetInstance
+        :rtype: twilio.rest.supersim.v1.fleet.FleetInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, unique_name=values.unset, network_access_profile=values.unset,
                ip_commands_url=values.unset, ip_commands_method=values.unset,
                sms_commands_url=values.unset, sms_commands_method=values.unset):
@@ -509,6 +737,31 @@ class FleetInstance(InstanceResource):
             sms_commands_method=sms_commands_method,
         )
 
+    async def update_async(self, unique_name=values.unset, network_access_profile=values.unset,
+                           ip_commands_url=values.unset, ip_commands_method=values.unset,
+                           sms_commands_url=values.unset, sms_commands_method=values.unset):
+        """
+        Asynchronous coroutine that updates the FleetInstance
+
+        :param unicode unique_name: An application-defined string that uniquely identifies the resource
+        :param unicode network_access_profile: The SID or unique name of the Network Access Profile of the Fleet
+        :param unicode ip_commands_url: The URL that will receive a webhook when a Super SIM in the Fleet is used to send an IP Command from your device
+        :param unicode ip_commands_method: A string representing the HTTP method to use when making a request to `ip_commands_url`
+        :param unicode sms_commands_url: The URL that will receive a webhook when a Super SIM in the Fleet is used to send an SMS from your device to the SMS Commands number
+        :param unicode sms_commands_method: A string representing the HTTP method to use when making a request to `sms_commands_url`
+
+        :returns: The updated FleetInstance
+        :rtype: twilio.rest.supersim.v1.fleet.FleetInstance
+        """
+        return await self._proxy.update_async(
+            unique_name=unique_name,
+            network_access_profile=network_access_profile,
+            ip_commands_url=ip_commands_url,
+            ip_commands_method=ip_commands_method,
+            sms_commands_url=sms_commands_url,
+            sms_commands_method=sms_commands_method,
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
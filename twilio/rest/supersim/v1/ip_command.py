@@ -31,10 +31,10 @@ class IpCommandList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/IpCommands'.format(**self._solution)
+        self._uri = values.ResourceUri('/IpCommands', self._solution)
 
     def create(self, sim, payload, device_port, payload_type=values.unset,
-               callback_url=values.unset, callback_method=values.unset):
+               callback_url=values.unset, callback_method=values.unset, deadline=None):
         """
         Create the IpCommandInstance
 
@@ -44,6 +44,8 @@ class IpCommandList(ListResource):
         :param IpCommandInstance.PayloadType payload_type: Indicates how the payload is encoded
         :param unicode callback_url: The URL we should call after we have sent the IP Command
         :param unicode callback_method: The HTTP method we should use to call callback_url
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created IpCommandInstance
         :rtype: twilio.rest.supersim.v1.ip_command.IpCommandInstance
@@ -57,12 +59,43 @@ class IpCommandList(ListResource):
             'CallbackMethod': callback_method,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return IpCommandInstance(self._version, payload, )
+
+    async def create_async(self, sim, payload, device_port, payload_type=values.unset,
+                           callback_url=values.unset, callback_method=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the IpCommandInstance
+
+        :param unicode sim: The sid or unique_name of the Super SIM to send the IP Command to
+        :param unicode payload: The payload to be delivered to the device
+        :param unicode device_port: The device port to which the IP Command will be sent
+        :param IpCommandInstance.PayloadType payload_type: Indicates how the payload is encoded
+        :param unicode callback_url: The URL we should call after we have sent the IP Command
+        :param unicode callback_method: The HTTP method we should use to call callback_url
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created IpCommandInstance
+        :rtype: twilio.rest.supersim.v1.ip_command.IpCommandInstance
+        """
+        data = values.of({
+            'Sim': sim,
+            'Payload': payload,
+            'DevicePort': device_port,
+            'PayloadType': payload_type,
+            'CallbackUrl': callback_url,
+            'CallbackMethod': callback_method,
+        })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return IpCommandInstance(self._version, payload, )
 
     def stream(self, sim=values.unset, sim_iccid=values.unset, status=values.unset,
-               direction=values.unset, limit=None, page_size=None):
+               direction=values.unset, limit=None, page_size=None,
+               prefetch=None, raw=False, deadline=None):
         """
         Streams IpCommandInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -79,24 +112,76 @@ class IpCommandList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.supersim.v1.ip_command.IpCommandInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
-            sim=sim,
-            sim_iccid=sim_iccid,
-            status=status,
-            direction=direction,
-            page_size=limits['page_size'],
-        )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                sim=sim,
+                sim_iccid=sim_iccid,
+                status=status,
+                direction=direction,
+                page_size=limits['page_size'],
+            )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, sim=values.unset, sim_iccid=values.unset, status=values.unset,
+                           direction=values.unset, limit=None, page_size=None,
+                           prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams IpCommandInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param unicode sim: The SID or unique name of the Sim resource that IP Command was sent to or from.
+        :param unicode sim_iccid: The ICCID of the Sim resource that IP Command was sent to or from.
+        :param IpCommandInstance.Status status: The status of the IP Command
+        :param IpCommandInstance.Direction direction: The direction of the IP Command
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.supersim.v1.ip_command.IpCommandInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                sim=sim,
+                sim_iccid=sim_iccid,
+                status=status,
+                direction=direction,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, sim=values.unset, sim_iccid=values.unset, status=values.unset,
-             direction=values.unset, limit=None, page_size=None):
+             direction=values.unset, limit=None, page_size=None, prefetch=None,
+             raw=False, deadline=None):
         """
         Lists IpCommandInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -112,6 +197,12 @@ class IpCommandList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.supersim.v1.ip_command.IpCommandInstance]
@@ -123,8 +214,51 @@ class IpCommandList(ListResource):
             direction=direction,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, sim=values.unset, sim_iccid=values.unset, status=values.unset,
+                         direction=values.unset, limit=None, page_size=None,
+                         prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists IpCommandInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param unicode sim: The SID or unique name of the Sim resource that IP Command was sent to or from.
+        :param unicode sim_iccid: The ICCID of the Sim resource that IP Command was sent to or from.
+        :param IpCommandInstance.Status status: The status of the IP Command
+        :param IpCommandInstance.Direction direction: The direction of the IP Command
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.supersim.v1.ip_command.IpCommandInstance]
+        """
+        return [record async for record in await self.stream_async(
+            sim=sim,
+            sim_iccid=sim_iccid,
+            status=status,
+            direction=direction,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, sim=values.unset, sim_iccid=values.unset, status=values.unset,
              direction=values.unset, page_token=values.unset,
              page_number=values.unset, page_size=values.unset):
@@ -157,6 +291,38 @@ class IpCommandList(ListResource):
 
         return IpCommandPage(self._version, response, self._solution)
 
+    async def page_async(self, sim=values.unset, sim_iccid=values.unset, status=values.unset,
+                         direction=values.unset, page_token=values.unset,
+                         page_number=values.unset, page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of IpCommandInstance records from the API.
+        Request is executed immediately
+
+        :param unicode sim: The SID or unique name of the Sim resource that IP Command was sent to or from.
+        :param unicode sim_iccid: The ICCID of the Sim resource that IP Command was sent to or from.
+        :param IpCommandInstance.Status status: The status of the IP Command
+        :param IpCommandInstance.Direction direction: The direction of the IP Command
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of IpCommandInstance
+        :rtype: twilio.rest.supersim.v1.ip_command.IpCommandPage
+        """
+        data = values.of({
+            'Sim': sim,
+            'SimIccid': sim_iccid,
+            'Status': status,
+            'Direction': direction,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return IpCommandPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of IpCommandInstance records from the API.
@@ -174,6 +340,23 @@ class IpCommandList(ListResource):
 
         return IpCommandPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of IpCommandInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of IpCommandInstance
+        :rtype: twilio.rest.supersim.v1.ip_command.IpCommandPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return IpCommandPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a IpCommandContext
@@ -264,7 +447,7 @@ class IpCommandContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/IpCommands/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/IpCommands/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -277,6 +460,17 @@ class IpCommandContext(InstanceContext):
 
         return IpCommandInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the IpCommandInstance
+
+        :returns: The fetched IpCommandInstance
+        :rtype: twilio.rest.supersim.v1.ip_command.IpCommandInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return IpCommandInstance(self._version, payload, sid=self._solution['sid'], )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -306,6 +500,32 @@ class IpCommandInstance(InstanceResource):
         TEXT = "text"
         BINARY = "binary"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'device_port': deserialize.integer,
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'sim_sid': 'sim_sid',
+        'sim_iccid': 'sim_iccid',
+        'status': 'status',
+        'direction': 'direction',
+        'device_ip': 'device_ip',
+        'device_port': 'device_port',
+        'payload_type': 'payload_type',
+        'payload': 'payload',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the IpCommandInstance
@@ -316,21 +536,7 @@ class IpCommandInstance(InstanceResource):
         super(IpCommandInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'sim_sid': payload.get('sim_sid'),
-            'sim_iccid': payload.get('sim_iccid'),
-            'status': payload.get('status'),
-            'direction': payload.get('direction'),
-            'device_ip': payload.get('device_ip'),
-            'device_port': deserialize.integer(payload.get('device_port')),
-            'payload_type': payload.get('payload_type'),
-            'payload': payload.get('payload'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -462,6 +668,15 @@ class IpCommandInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the IpCommandInstance
+
+        :returns: The fetched IpCommandInstance
+        :rtype: twilio.rest.supersim.v1.ip_command.IpCommandInstance
+        """
+        return await self._proxy.fetch_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -6,6 +6,7 @@ This code was generated by
       /       /
 """
 
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
@@ -30,10 +31,10 @@ class NetworkList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Networks'.format(**self._solution)
+        self._uri = values.ResourceUri('/Networks', self._solution)
 
     def stream(self, iso_country=values.unset, mcc=values.unset, mnc=values.unset,
-               limit=None, page_size=None):
+               limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams NetworkInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -49,18 +50,62 @@ class NetworkList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.supersim.v1.network.NetworkInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(iso_country=iso_country, mcc=mcc, mnc=mnc, page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(iso_country=iso_country, mcc=mcc, mnc=mnc, page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, iso_country=values.unset, mcc=values.unset, mnc=values.unset,
+                           limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams NetworkInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param unicode iso_country: The ISO country code of the Network resources to read
+        :param unicode mcc: The MCC of Network resource identifiers to be read
+        :param unicode mnc: The MNC of Network resource identifiers to be read
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.supersim.v1.network.NetworkInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(iso_country=iso_country, mcc=mcc, mnc=mnc, page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, iso_country=values.unset, mcc=values.unset, mnc=values.unset,
-             limit=None, page_size=None):
+             limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists NetworkInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -75,6 +120,12 @@ class NetworkList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.supersim.v1.network.NetworkInstance]
@@ -85,8 +136,48 @@ class NetworkList(ListResource):
             mnc=mnc,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, iso_country=values.unset, mcc=values.unset, mnc=values.unset,
+                         limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists NetworkInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param unicode iso_country: The ISO country code of the Network resources to read
+        :param unicode mcc: The MCC of Network resource identifiers to be read
+        :param unicode mnc: The MNC of Network resource identifiers to be read
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.supersim.v1.network.NetworkInstance]
+        """
+        return [record async for record in await self.stream_async(
+            iso_country=iso_country,
+            mcc=mcc,
+            mnc=mnc,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, iso_country=values.unset, mcc=values.unset, mnc=values.unset,
              page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -117,6 +208,36 @@ class NetworkList(ListResource):
 
         return NetworkPage(self._version, response, self._solution)
 
+    async def page_async(self, iso_country=values.unset, mcc=values.unset, mnc=values.unset,
+                         page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of NetworkInstance records from the API.
+        Request is executed immediately
+
+        :param unicode iso_country: The ISO country code of the Network resources to read
+        :param unicode mcc: The MCC of Network resource identifiers to be read
+        :param unicode mnc: The MNC of Network resource identifiers to be read
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of NetworkInstance
+        :rtype: twilio.rest.supersim.v1.network.NetworkPage
+        """
+        data = values.of({
+            'IsoCountry': iso_country,
+            'Mcc': mcc,
+            'Mnc': mnc,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return NetworkPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of NetworkInstance records from the API.
@@ -134,6 +255,23 @@ class NetworkList(ListResource):
 
         return NetworkPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of NetworkInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of NetworkInstance
+        :rtype: twilio.rest.supersim.v1.network.NetworkPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return NetworkPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a NetworkContext
@@ -224,7 +362,7 @@ class NetworkContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/Networks/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Networks/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -237,6 +375,17 @@ class NetworkContext(InstanceContext):
 
         return NetworkInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the NetworkInstance
+
+        :returns: The fetched NetworkInstance
+        :rtype: twilio.rest.supersim.v1.network.NetworkInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return NetworkInstance(self._version, payload, sid=self._solution['sid'], )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -252,6 +401,17 @@ class NetworkInstance(InstanceResource):
     """ PLEASE NOTE that this class contains beta products that are subject to
     change. Use them with caution. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'friendly_name': 'friendly_name',
+        'url': 'url',
+        'iso_country': 'iso_country',
+        'identifiers': 'identifiers',
+    })
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the NetworkInstance
@@ -262,13 +422,7 @@ class NetworkInstance(InstanceResource):
         super(NetworkInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'friendly_name': payload.get('friendly_name'),
-            'url': payload.get('url'),
-            'iso_country': payload.get('iso_country'),
-            'identifiers': payload.get('identifiers'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -336,6 +490,15 @@ class NetworkInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the NetworkInstance
+
+        :returns: The fetched NetworkInstance
+        :rtype: twilio.rest.supersim.v1.network.NetworkInstance
+        """
+        return await self._proxy.fetch_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
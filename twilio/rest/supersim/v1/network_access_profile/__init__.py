@@ -6,6 +6,8 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import serialize
 from twilio.base import values
@@ -13,7 +15,6 @@ from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.supersim.v1.network_access_profile.network_access_profile_network import NetworkAccessProfileNetworkList
 
 
 class NetworkAccessProfileList(ListResource):
@@ -33,25 +34,45 @@ class NetworkAccessProfileList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/NetworkAccessProfiles'.format(**self._solution)
+        self._uri = values.ResourceUri('/NetworkAccessProfiles', self._solution)
 
-    def create(self, unique_name=values.unset, networks=values.unset):
+    def create(self, unique_name=values.unset, networks=values.unset, deadline=None):
         """
         Create the NetworkAccessProfileInstance
 
         :param unicode unique_name: An application-defined string that uniquely identifies the resource
         :param list[unicode] networks: List of Network SIDs that this Network Access Profile will allow connections to
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created NetworkAccessProfileInstance
         :rtype: twilio.rest.supersim.v1.network_access_profile.NetworkAccessProfileInstance
         """
         data = values.of({'UniqueName': unique_name, 'Networks': serialize.map(networks, lambda e: e), })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return NetworkAccessProfileInstance(self._version, payload, )
 
-    def stream(self, limit=None, page_size=None):
+    async def create_async(self, unique_name=values.unset, networks=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the NetworkAccessProfileInstance
+
+        :param unicode unique_name: An application-defined string that uniquely identifies the resource
+        :param list[unicode] networks: List of Network SIDs that this Network Access Profile will allow connections to
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created NetworkAccessProfileInstance
+        :rtype: twilio.rest.supersim.v1.network_access_profile.NetworkAccessProfileInstance
+        """
+        data = values.of({'UniqueName': unique_name, 'Networks': serialize.map(networks, lambda e: e), })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return NetworkAccessProfileInstance(self._version, payload, )
+
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams NetworkAccessProfileInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -64,17 +85,57 @@ class NetworkAccessProfileList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.supersim.v1.network_access_profile.NetworkAccessProfileInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams NetworkAccessProfileInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.supersim.v1.network_access_profile.NetworkAccessProfileInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists NetworkAccessProfileInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -86,11 +147,42 @@ class NetworkAccessProfileList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.supersim.v1.network_access_profile.NetworkAccessProfileInstance]
+        """
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists NetworkAccessProfileInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.supersim.v1.network_access_profile.NetworkAccessProfileInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -111,6 +203,25 @@ class NetworkAccessProfileList(ListResource):
 
         return NetworkAccessProfilePage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of NetworkAccessProfileInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of NetworkAccessProfileInstance
+        :rtype: twilio.rest.supersim.v1.network_access_profile.NetworkAccessProfilePage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return NetworkAccessProfilePage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of NetworkAccessProfileInstance records from the API.
@@ -128,6 +239,23 @@ class NetworkAccessProfileList(ListResource):
 
         return NetworkAccessProfilePage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of NetworkAccessProfileInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of NetworkAccessProfileInstance
+        :rtype: twilio.rest.supersim.v1.network_access_profile.NetworkAccessProfilePage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return NetworkAccessProfilePage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a NetworkAccessProfileContext
@@ -218,7 +346,7 @@ class NetworkAccessProfileContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/NetworkAccessProfiles/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/NetworkAccessProfiles/{sid}', self._solution)
 
         # Dependents
         self._networks = None
@@ -234,6 +362,17 @@ class NetworkAccessProfileContext(InstanceContext):
 
         return NetworkAccessProfileInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the NetworkAccessProfileInstance
+
+        :returns: The fetched NetworkAccessProfileInstance
+        :rtype: twilio.rest.supersim.v1.network_access_profile.NetworkAccessProfileInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return NetworkAccessProfileInstance(self._version, payload, sid=self._solution['sid'], )
+
     def update(self, unique_name=values.unset):
         """
         Update the NetworkAccessProfileInstance
@@ -249,6 +388,21 @@ class NetworkAccessProfileContext(InstanceContext):
 
         return NetworkAccessProfileInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def update_async(self, unique_name=values.unset):
+        """
+        Asynchronous coroutine that updates the NetworkAccessProfileInstance
+
+        :param unicode unique_name: The new unique name of the resource
+
+        :returns: The updated NetworkAccessProfileInstance
+        :rtype: twilio.rest.supersim.v1.network_access_profile.NetworkAccessProfileInstance
+        """
+        data = values.of({'UniqueName': unique_name, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return NetworkAccessProfileInstance(self._version, payload, sid=self._solution['sid'], )
+
     @property
     def networks(self):
         """
@@ -258,6 +412,7 @@ class NetworkAccessProfileContext(InstanceContext):
         :rtype: twilio.rest.supersim.v1.network_access_profile.network_access_profile_network.NetworkAccessProfileNetworkList
         """
         if self._networks is None:
+            from twilio.rest.supersim.v1.network_access_profile.network_access_profile_network import NetworkAccessProfileNetworkList
             self._networks = NetworkAccessProfileNetworkList(
                 self._version,
                 network_access_profile_sid=self._solution['sid'],
@@ -279,6 +434,25 @@ class NetworkAccessProfileInstance(InstanceResource):
     """ PLEASE NOTE that this class contains beta products that are subject to
     change. Use them with caution. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'unique_name': 'unique_name',
+        'account_sid': 'account_sid',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'url': 'url',
+        'links': 'links',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the NetworkAccessProfileInstance
@@ -289,15 +463,7 @@ class NetworkAccessProfileInstance(InstanceResource):
         super(NetworkAccessProfileInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'unique_name': payload.get('unique_name'),
-            'account_sid': payload.get('account_sid'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -381,6 +547,15 @@ class NetworkAccessProfileInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the NetworkAccessProfileInstance
+
+        :returns: The fetched NetworkAccessProfileInstance
+        :rtype: twilio.rest.supersim.v1.network_access_profile.NetworkAccessProfileInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, unique_name=values.unset):
         """
         Update the NetworkAccessProfileInstance
@@ -392,6 +567,17 @@ class NetworkAccessProfileInstance(InstanceResource):
         """
         return self._proxy.update(unique_name=unique_name, )
 
+    async def update_async(self, unique_name=values.unset):
+        """
+        Asynchronous coroutine that updates the NetworkAccessProfileInstance
+
+        :param unicode unique_name: The new unique name of the resource
+
+        :returns: The updated NetworkAccessProfileInstance
+        :rtype: twilio.rest.supersim.v1.network_access_profile.NetworkAccessProfileInstance
+        """
+        return await self._proxy.update_async(unique_name=unique_name, )
+
     @property
     def networks(self):
         """
@@ -411,3 +597,19 @@ class NetworkAccessProfileInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Supersim.V1.NetworkAccessProfileInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'NetworkAccessProfileNetworkList': 'twilio.rest.supersim.v1.network_access_profile.network_access_profile_network',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
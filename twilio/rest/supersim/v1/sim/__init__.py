@@ -6,13 +6,14 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.supersim.v1.sim.billing_period import BillingPeriodList
 
 
 class SimList(ListResource):
@@ -32,26 +33,46 @@ class SimList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Sims'.format(**self._solution)
+        self._uri = values.ResourceUri('/Sims', self._solution)
 
-    def create(self, iccid, registration_code):
+    def create(self, iccid, registration_code, deadline=None):
         """
         Create the SimInstance
 
         :param unicode iccid: The `ICCID <https://en.wikipedia.org/wiki/Subscriber_identity_module#ICCID>`_ of the Super SIM to be added to your Account
         :param unicode registration_code: The 10-digit code required to claim the Super SIM for your Account
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created SimInstance
+        :rtype: twilio.rest.supersim.v1.sim.SimInstance
+        """
+        data = values.of({'Iccid': iccid, 'RegistrationCode': registration_code, })
+
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return SimInstance(self._version, payload, )
+
+    async def create_async(self, iccid, registration_code, deadline=None):
+        """
+        Asynchronous coroutine that creates the SimInstance
+
+        :param unicode iccid: The `ICCID <https://en.wikipedia.org/wiki/Subscriber_identity_module#ICCID>`_ of the Super SIM to be added to your Account
+        :param unicode registration_code: The 10-digit code required to claim the Super SIM for your Account
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created SimInstance
         :rtype: twilio.rest.supersim.v1.sim.SimInstance
         """
         data = values.of({'Iccid': iccid, 'RegistrationCode': registration_code, })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return SimInstance(self._version, payload, )
 
     def stream(self, status=values.unset, fleet=values.unset, iccid=values.unset,
-               limit=None, page_size=None):
+               limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams SimInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -67,18 +88,62 @@ class SimList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.supersim.v1.sim.SimInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(status=status, fleet=fleet, iccid=iccid, page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(status=status, fleet=fleet, iccid=iccid, page_size=limits['page_size'], )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-        return self._version.stream(page, limits['limit'])
+    async def stream_async(self, status=values.unset, fleet=values.unset, iccid=values.unset,
+                           limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams SimInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param SimInstance.Status status: The status of the Sim resources to read
+        :param unicode fleet: The SID or unique name of the Fleet to which a list of Sims are assigned
+        :param unicode iccid: The ICCID associated with a Super SIM to filter the list by
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.supersim.v1.sim.SimInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(status=status, fleet=fleet, iccid=iccid, page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, status=values.unset, fleet=values.unset, iccid=values.unset,
-             limit=None, page_size=None):
+             limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists SimInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -93,11 +158,45 @@ class SimList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.supersim.v1.sim.SimInstance]
         """
-        return list(self.stream(status=status, fleet=fleet, iccid=iccid, limit=limit, page_size=page_size, ))
+        return list(self.stream(status=status, fleet=fleet, iccid=iccid, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, status=values.unset, fleet=values.unset, iccid=values.unset,
+                         limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists SimInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param SimInstance.Status status: The status of the Sim resources to read
+        :param unicode fleet: The SID or unique name of the Fleet to which a list of Sims are assigned
+        :param unicode iccid: The ICCID associated with a Super SIM to filter the list by
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.supersim.v1.sim.SimInstance]
+        """
+        return [record async for record in await self.stream_async(status=status, fleet=fleet, iccid=iccid, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, status=values.unset, fleet=values.unset, iccid=values.unset,
              page_token=values.unset, page_number=values.unset,
@@ -129,6 +228,36 @@ class SimList(ListResource):
 
         return SimPage(self._version, response, self._solution)
 
+    async def page_async(self, status=values.unset, fleet=values.unset, iccid=values.unset,
+                         page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of SimInstance records from the API.
+        Request is executed immediately
+
+        :param SimInstance.Status status: The status of the Sim resources to read
+        :param unicode fleet: The SID or unique name of the Fleet to which a list of Sims are assigned
+        :param unicode iccid: The ICCID associated with a Super SIM to filter the list by
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of SimInstance
+        :rtype: twilio.rest.supersim.v1.sim.SimPage
+        """
+        data = values.of({
+            'Status': status,
+            'Fleet': fleet,
+            'Iccid': iccid,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return SimPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of SimInstance records from the API.
@@ -146,6 +275,23 @@ class SimList(ListResource):
 
         return SimPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of SimInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of SimInstance
+        :rtype: twilio.rest.supersim.v1.sim.SimPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return SimPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a SimContext
@@ -236,7 +382,7 @@ class SimContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/Sims/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Sims/{sid}', self._solution)
 
         # Dependents
         self._billing_periods = None
@@ -252,6 +398,17 @@ class SimContext(InstanceContext):
 
         return SimInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the SimInstance
+
+        :returns: The fetched SimInstance
+        :rtype: twilio.rest.supersim.v1.sim.SimInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return SimInstance(self._version, payload, sid=self._solution['sid'], )
+
     def update(self, unique_name=values.unset, status=values.unset,
                fleet=values.unset, callback_url=values.unset,
                callback_method=values.unset, account_sid=values.unset):
@@ -281,6 +438,35 @@ class SimContext(InstanceContext):
 
         return SimInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def update_async(self, unique_name=values.unset, status=values.unset,
+                           fleet=values.unset, callback_url=values.unset,
+                           callback_method=values.unset, account_sid=values.unset):
+        """
+        Asynchronous coroutine that updates the SimInstance
+
+        :param unicode unique_name: An application-defined string that uniquely identifies the resource
+        :param SimInstance.StatusUpdate status: The new status of the Super SIM
+        :param unicode fleet: The SID or unique name of the Fleet to which the SIM resource should be assigned
+        :param unicode callback_url: The URL we should call after the update has finished
+        :param unicode callback_method: The HTTP method we should use to call callback_url
+        :param unicode account_sid: The SID of the Account to which the Sim resource should belong
+
+        :returns: The updated SimInstance
+        :rtype: twilio.rest.supersim.v1.sim.SimInstance
+        """
+        data = values.of({
+            'UniqueName': unique_name,
+            'Status': status,
+            'Fleet': fleet,
+            'CallbackUrl': callback_url,
+            'CallbackMethod': callback_method,
+            'AccountSid': account_sid,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return SimInstance(self._version, payload, sid=self._solution['sid'], )
+
     @property
     def billing_periods(self):
         """
@@ -290,6 +476,7 @@ class SimContext(InstanceContext):
         :rtype: twilio.rest.supersim.v1.sim.billing_period.BillingPeriodList
         """
         if self._billing_periods is None:
+            from twilio.rest.supersim.v1.sim.billing_period import BillingPeriodList
             self._billing_periods = BillingPeriodList(self._version, sim_sid=self._solution['sid'], )
         return self._billing_periods
 
@@ -320,6 +507,28 @@ class SimInstance(InstanceResource):
         ACTIVE = "active"
         INACTIVE = "inactive"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'unique_name': 'unique_name',
+        'account_sid': 'account_sid',
+        'iccid': 'iccid',
+        'status': 'status',
+        'fleet_sid': 'fleet_sid',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'url': 'url',
+        'links': 'links',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the SimInstance
@@ -330,18 +539,7 @@ class SimInstance(InstanceResource):
         super(SimInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'unique_name': payload.get('unique_name'),
-            'account_sid': payload.get('account_sid'),
-            'iccid': payload.get('iccid'),
-            'status': payload.get('status'),
-            'fleet_sid': payload.get('fleet_sid'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -449,6 +647,15 @@ class SimInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the SimInstance
+
+        :returns: The fetched SimInstance
+        :rtype: twilio.rest.supersim.v1.sim.SimInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, unique_name=values.unset, status=values.unset,
                fleet=values.unset, callback_url=values.unset,
                callback_method=values.unset, account_sid=values.unset):
@@ -474,6 +681,31 @@ class SimInstance(InstanceResource):
             account_sid=account_sid,
         )
 
+    async def update_async(self, unique_name=values.unset, status=values.unset,
+                           fleet=values.unset, callback_url=values.unset,
+                           callback_method=values.unset, account_sid=values.unset):
+        """
+        Asynchronous coroutine that updates the SimInstance
+
+        :param unicode unique_name: An application-defined string that uniquely identifies the resource
+        :param SimInstance.StatusUpdate status: The new status of the Super SIM
+        :param unicode fleet: The SID or unique name of the Fleet to which the SIM resource should be assigned
+        :param unicode callback_url: The URL we should call after the update has finished
+        :param unicode callback_method: The HTTP method we should use to call callback_url
+        :param unicode account_sid: The SID of the Account to which the Sim resource should belong
+
+        :returns: The updated SimInstance
+        :rtype: twilio.rest.supersim.v1.sim.SimInstance
+        """
+        return await self._proxy.update_async(
+            unique_name=unique_name,
+            status=status,
+            fleet=fleet,
+            callback_url=callback_url,
+            callback_method=callback_method,
+            account_sid=account_sid,
+        )
+
     @property
     def billing_periods(self):
         """
@@ -493,3 +725,19 @@ class SimInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Supersim.V1.SimInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'BillingPeriodList': 'twilio.rest.supersim.v1.sim.billing_period',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -31,10 +31,10 @@ class SmsCommandList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/SmsCommands'.format(**self._solution)
+        self._uri = values.ResourceUri('/SmsCommands', self._solution)
 
     def create(self, sim, payload, callback_method=values.unset,
-               callback_url=values.unset):
+               callback_url=values.unset, deadline=None):
         """
         Create the SmsCommandInstance
 
@@ -42,6 +42,8 @@ class SmsCommandList(ListResource):
         :param unicode payload: The message body of the SMS Command
         :param unicode callback_method: The HTTP method we should use to call callback_url
         :param unicode callback_url: The URL we should call after we have sent the command
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created SmsCommandInstance
         :rtype: twilio.rest.supersim.v1.sms_command.SmsCommandInstance
@@ -53,12 +55,38 @@ class SmsCommandList(ListResource):
             'CallbackUrl': callback_url,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return SmsCommandInstance(self._version, payload, )
+
+    async def create_async(self, sim, payload, callback_method=values.unset,
+                           callback_url=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the SmsCommandInstance
+
+        :param unicode sim: The sid or unique_name of the SIM to send the SMS Command to
+        :param unicode payload: The message body of the SMS Command
+        :param unicode callback_method: The HTTP method we should use to call callback_url
+        :param unicode callback_url: The URL we should call after we have sent the command
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created SmsCommandInstance
+        :rtype: twilio.rest.supersim.v1.sms_command.SmsCommandInstance
+        """
+        data = values.of({
+            'Sim': sim,
+            'Payload': payload,
+            'CallbackMethod': callback_method,
+            'CallbackUrl': callback_url,
+        })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return SmsCommandInstance(self._version, payload, )
 
     def stream(self, sim=values.unset, status=values.unset, direction=values.unset,
-               limit=None, page_size=None):
+               limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams SmsCommandInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -74,18 +102,62 @@ class SmsCommandList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.supersim.v1.sms_command.SmsCommandInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(sim=sim, status=status, direction=direction, page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(sim=sim, status=status, direction=direction, page_size=limits['page_size'], )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, sim=values.unset, status=values.unset, direction=values.unset,
+                           limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams SmsCommandInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param unicode sim: The SID or unique name of the Sim resource that SMS Command was sent to or from.
+        :param SmsCommandInstance.Status status: The status of the SMS Command
+        :param SmsCommandInstance.Direction direction: The direction of the SMS Command
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.supersim.v1.sms_command.SmsCommandInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(sim=sim, status=status, direction=direction, page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, sim=values.unset, status=values.unset, direction=values.unset,
-             limit=None, page_size=None):
+             limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists SmsCommandInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -100,6 +172,12 @@ class SmsCommandList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.supersim.v1.sms_command.SmsCommandInstance]
@@ -110,8 +188,48 @@ class SmsCommandList(ListResource):
             direction=direction,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, sim=values.unset, status=values.unset, direction=values.unset,
+                         limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists SmsCommandInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param unicode sim: The SID or unique name of the Sim resource that SMS Command was sent to or from.
+        :param SmsCommandInstance.Status status: The status of the SMS Command
+        :param SmsCommandInstance.Direction direction: The direction of the SMS Command
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.supersim.v1.sms_command.SmsCommandInstance]
+        """
+        return [record async for record in await self.stream_async(
+            sim=sim,
+            status=status,
+            direction=direction,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, sim=values.unset, status=values.unset, direction=values.unset,
              page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -142,6 +260,36 @@ class SmsCommandList(ListResource):
 
         return SmsCommandPage(self._version, response, self._solution)
 
+    async def page_async(self, sim=values.unset, status=values.unset, direction=values.unset,
+                         page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of SmsCommandInstance records from the API.
+        Request is executed immediately
+
+        :param unicode sim: The SID or unique name of the Sim resource that SMS Command was sent to or from.
+        :param SmsCommandInstance.Status status: The status of the SMS Command
+        :param SmsCommandInstance.Direction direction: The direction of the SMS Command
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of SmsCommandInstance
+        :rtype: twilio.rest.supersim.v1.sms_command.SmsCommandPage
+        """
+        data = values.of({
+            'Sim': sim,
+            'Status': status,
+            'Direction': direction,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return SmsCommandPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of SmsCommandInstance records from the API.
@@ -159,6 +307,23 @@ class SmsCommandList(ListResource):
 
         return SmsCommandPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of SmsCommandInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of SmsCommandInstance
+        :rtype: twilio.rest.supersim.v1.sms_command.SmsCommandPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return SmsCommandPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a SmsCommandContext
@@ -249,7 +414,7 @@ class SmsCommandContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/SmsCommands/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/SmsCommands/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -262,6 +427,17 @@ class SmsCommandContext(InstanceContext):
 
         return SmsCommandInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the SmsCommandInstance
+
+        :returns: The fetched SmsCommandInstance
+        :rtype: twilio.rest.supersim.v1.sms_command.SmsCommandInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return SmsCommandInstance(self._version, payload, sid=self._solution['sid'], )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -288,6 +464,27 @@ class SmsCommandInstance(InstanceResource):
         TO_SIM = "to_sim"
         FROM_SIM = "from_sim"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'sim_sid': 'sim_sid',
+        'payload': 'payload',
+        'status': 'status',
+        'direction': 'direction',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the SmsCommandInstance
@@ -298,17 +495,7 @@ class SmsCommandInstance(InstanceResource):
         super(SmsCommandInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'sim_sid': payload.get('sim_sid'),
-            'payload': payload.get('payload'),
-            'status': payload.get('status'),
-            'direction': payload.get('direction'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -408,6 +595,15 @@ class SmsCommandInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the SmsCommandInstance
+
+        :returns: The fetched SmsCommandInstance
+        :rtype: twilio.rest.supersim.v1.sms_command.SmsCommandInstance
+        """
+        return await self._proxy.fetch_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
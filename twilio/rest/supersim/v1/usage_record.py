@@ -31,12 +31,13 @@ class UsageRecordList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/UsageRecords'.format(**self._solution)
+        self._uri = values.ResourceUri('/UsageRecords', self._solution)
 
     def stream(self, sim=values.unset, fleet=values.unset, network=values.unset,
                iso_country=values.unset, group=values.unset,
                granularity=values.unset, start_time=values.unset,
-               end_time=values.unset, limit=None, page_size=None):
+               end_time=values.unset, limit=None, page_size=None,
+               prefetch=None, raw=False, deadline=None):
         """
         Streams UsageRecordInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -57,13 +58,121 @@ class UsageRecordList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.supersim.v1.usage_record.UsageRecordInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                sim=sim,
+                fleet=fleet,
+                network=network,
+                iso_country=iso_country,
+                group=group,
+                granularity=granularity,
+                start_time=start_time,
+                end_time=end_time,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, sim=values.unset, fleet=values.unset, network=values.unset,
+                           iso_country=values.unset, group=values.unset,
+                           granularity=values.unset, start_time=values.unset,
+                           end_time=values.unset, limit=None, page_size=None,
+                           prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams UsageRecordInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param unicode sim: SID or unique name of a Sim resource. Only show UsageRecords representing usage incurred by this Super SIM.
+        :param unicode fleet: SID or unique name of a Fleet resource. Only show UsageRecords representing usage for Super SIMs belonging to this Fleet resource at the time the usage occurred.
+        :param unicode network: SID of a Network resource. Only show UsageRecords representing usage on this network.
+        :param unicode iso_country: Alpha-2 ISO Country Code. Only show UsageRecords representing usage in this country.
+        :param UsageRecordInstance.Group group: Dimension over which to aggregate usage records.
+        :param UsageRecordInstance.Granularity granularity: Time-based grouping that UsageRecords should be aggregated by. Can be: `hour`, `day`, or `all`. Default is `all`.
+        :param datetime start_time: Only include usage that occurred at or after this time.
+        :param datetime end_time: Only include usage that occurred before this time (exclusive).
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.supersim.v1.usage_record.UsageRecordInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                sim=sim,
+                fleet=fleet,
+                network=network,
+                iso_country=iso_country,
+                group=group,
+                granularity=granularity,
+                start_time=start_time,
+                end_time=end_time,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, sim=values.unset, fleet=values.unset, network=values.unset,
+             iso_country=values.unset, group=values.unset, granularity=values.unset,
+             start_time=values.unset, end_time=values.unset, limit=None,
+             page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Lists UsageRecordInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param unicode sim: SID or unique name of a Sim resource. Only show UsageRecords representing usage incurred by this Super SIM.
+        :param unicode fleet: SID or unique name of a Fleet resource. Only show UsageRecords representing usage for Super SIMs belonging to this Fleet resource at the time the usage occurred.
+        :param unicode network: SID of a Network resource. Only show UsageRecords representing usage on this network.
+        :param unicode iso_country: Alpha-2 ISO Country Code. Only show UsageRecords representing usage in this country.
+        :param UsageRecordInstance.Group group: Dimension over which to aggregate usage records.
+        :param UsageRecordInstance.Granularity granularity: Time-based grouping that UsageRecords should be aggregated by. Can be: `hour`, `day`, or `all`. Default is `all`.
+        :param datetime start_time: Only include usage that occurred at or after this time.
+        :param datetime end_time: Only include usage that occurred before this time (exclusive).
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.supersim.v1.usage_record.UsageRecordInstance]
+        """
+        return list(self.stream(
             sim=sim,
             fleet=fleet,
             network=network,
@@ -72,17 +181,19 @@ class UsageRecordList(ListResource):
             granularity=granularity,
             start_time=start_time,
             end_time=end_time,
-            page_size=limits['page_size'],
-        )
-
-        return self._version.stream(page, limits['limit'])
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        ))
 
-    def list(self, sim=values.unset, fleet=values.unset, network=values.unset,
-             iso_country=values.unset, group=values.unset, granularity=values.unset,
-             start_time=values.unset, end_time=values.unset, limit=None,
-             page_size=None):
+    async def list_async(self, sim=values.unset, fleet=values.unset, network=values.unset,
+                         iso_country=values.unset, group=values.unset, granularity=values.unset,
+                         start_time=values.unset, end_time=values.unset, limit=None,
+                         page_size=None, prefetch=None, raw=False, deadline=None):
         """
-        Lists UsageRecordInstance records from the API as a list.
+        Asynchronously lists UsageRecordInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
         memory before returning.
 
@@ -100,11 +211,17 @@ class UsageRecordList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.supersim.v1.usage_record.UsageRecordInstance]
         """
-        return list(self.stream(
+        return [record async for record in await self.stream_async(
             sim=sim,
             fleet=fleet,
             network=network,
@@ -115,7 +232,10 @@ class UsageRecordList(ListResource):
             end_time=end_time,
             limit=limit,
             page_size=page_size,
-        ))
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
 
     def page(self, sim=values.unset, fleet=values.unset, network=values.unset,
              iso_country=values.unset, group=values.unset, granularity=values.unset,
@@ -159,6 +279,48 @@ class UsageRecordList(ListResource):
 
         return UsageRecordPage(self._version, response, self._solution)
 
+    async def page_async(self, sim=values.unset, fleet=values.unset, network=values.unset,
+                         iso_country=values.unset, group=values.unset, granularity=values.unset,
+                         start_time=values.unset, end_time=values.unset,
+                         page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of UsageRecordInstance records from the API.
+        Request is executed immediately
+
+        :param unicode sim: SID or unique name of a Sim resource. Only show UsageRecords representing usage incurred by this Super SIM.
+        :param unicode fleet: SID or unique name of a Fleet resource. Only show UsageRecords representing usage for Super SIMs belonging to this Fleet resource at the time the usage occurred.
+        :param unicode network: SID of a Network resource. Only show UsageRecords representing usage on this network.
+        :param unicode iso_country: Alpha-2 ISO Country Code. Only show UsageRecords representing usage in this country.
+        :param UsageRecordInstance.Group group: Dimension over which to aggregate usage records.
+        :param UsageRecordInstance.Granularity granularity: Time-based grouping that UsageRecords should be aggregated by. Can be: `hour`, `day`, or `all`. Default is `all`.
+        :param datetime start_time: Only include usage that occurred at or after this time.
+        :param datetime end_time: Only include usage that occurred before this time (exclusive).
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of UsageRecordInstance
+        :rtype: twilio.rest.supersim.v1.usage_record.UsageRecordPage
+        """
+        data = values.of({
+            'Sim': sim,
+            'Fleet': fleet,
+            'Network': network,
+            'IsoCountry': iso_country,
+            'Group': group,
+            'Granularity': granularity,
+            'StartTime': serialize.iso8601_datetime(start_time),
+            'EndTime': serialize.iso8601_datetime(end_time),
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return UsageRecordPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of UsageRecordInstance records from the API.
@@ -176,6 +338,23 @@ class UsageRecordList(ListResource):
 
         return UsageRecordPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of UsageRecordInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of UsageRecordInstance
+        :rtype: twilio.rest.supersim.v1.usage_record.UsageRecordPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return UsageRecordPage(self._version, response, self._solution)
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -244,6 +423,28 @@ class UsageRecordInstance(InstanceResource):
     class SortBy(object):
         TIME = "time"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'data_upload': deserialize.integer,
+        'data_download': deserialize.integer,
+        'data_total': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'sim_sid': 'sim_sid',
+        'network_sid': 'network_sid',
+        'fleet_sid': 'fleet_sid',
+        'iso_country': 'iso_country',
+        'period': 'period',
+        'data_upload': 'data_upload',
+        'data_download': 'data_download',
+        'data_total': 'data_total',
+    }, _deserializers)
+
     def __init__(self, version, payload):
         """
         Initialize the UsageRecordInstance
@@ -254,17 +455,7 @@ class UsageRecordInstance(InstanceResource):
         super(UsageRecordInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'sim_sid': payload.get('sim_sid'),
-            'network_sid': payload.get('network_sid'),
-            'fleet_sid': payload.get('fleet_sid'),
-            'iso_country': payload.get('iso_country'),
-            'period': payload.get('period'),
-            'data_upload': deserialize.integer(payload.get('data_upload')),
-            'data_download': deserialize.integer(payload.get('data_download')),
-            'data_total': deserialize.integer(payload.get('data_total')),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -6,16 +6,14 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.sync.v1.service.document import DocumentList
-from twilio.rest.sync.v1.service.sync_list import SyncListList
-from twilio.rest.sync.v1.service.sync_map import SyncMapList
-from twilio.rest.sync.v1.service.sync_stream import SyncStreamList
 
 
 class ServiceList(ListResource):
@@ -33,13 +31,13 @@ class ServiceList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Services'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services', self._solution)
 
     def create(self, friendly_name=values.unset, webhook_url=values.unset,
                reachability_webhooks_enabled=values.unset, acl_enabled=values.unset,
                reachability_debouncing_enabled=values.unset,
                reachability_debouncing_window=values.unset,
-               webhooks_from_rest_enabled=values.unset):
+               webhooks_from_rest_enabled=values.unset, deadline=None):
         """
         Create the ServiceInstance
 
@@ -50,6 +48,43 @@ class ServiceList(ListResource):
         :param bool reachability_debouncing_enabled: Whether every endpoint_disconnected event occurs after a configurable delay
         :param unicode reachability_debouncing_window: The reachability event delay in milliseconds
         :param bool webhooks_from_rest_enabled: Whether the Service instance should call webhook_url when the REST API is used to update Sync objects
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created ServiceInstance
+        :rtype: twilio.rest.sync.v1.service.ServiceInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'WebhookUrl': webhook_url,
+            'ReachabilityWebhooksEnabled': reachability_webhooks_enabled,
+            'AclEnabled': acl_enabled,
+            'ReachabilityDebouncingEnabled': reachability_debouncing_enabled,
+            'ReachabilityDebouncingWindow': reachability_debouncing_window,
+            'WebhooksFromRestEnabled': webhooks_from_rest_enabled,
+        })
+
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return ServiceInstance(self._version, payload, )
+
+    async def create_async(self, friendly_name=values.unset, webhook_url=values.unset,
+                           reachability_webhooks_enabled=values.unset, acl_enabled=values.unset,
+                           reachability_debouncing_enabled=values.unset,
+                           reachability_debouncing_window=values.unset,
+                           webhooks_from_rest_enabled=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the ServiceInstance
+
+        :param unicode friendly_name: A string that you assign to describe the resource
+        :param unicode webhook_url: The URL we should call when Sync objects are manipulated
+        :param bool reachability_webhooks_enabled: Whether the service instance should call webhook_url when client endpoints connect to Sync
+        :param bool acl_enabled: Whether token identities in the Service must be granted access to Sync objects by using the Permissions resource
+        :param bool reachability_debouncing_enabled: Whether every endpoint_disconnected event occurs after a configurable delay
+        :param unicode reachability_debouncing_window: The reachability event delay in milliseconds
+        :param bool webhooks_from_rest_enabled: Whether the Service instance should call webhook_url when the REST API is used to update Sync objects
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created ServiceInstance
         :rtype: twilio.rest.sync.v1.service.ServiceInstance
@@ -64,11 +99,11 @@ class ServiceList(ListResource):
             'WebhooksFromRestEnabled': webhooks_from_rest_enabled,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return ServiceInstance(self._version, payload, )
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams ServiceInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -81,17 +116,57 @@ class ServiceList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.sync.v1.service.ServiceInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams ServiceInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.sync.v1.service.ServiceInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists ServiceInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -103,11 +178,42 @@ class ServiceList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.sync.v1.service.ServiceInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists ServiceInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.sync.v1.service.ServiceInstance]
+        """
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -128,6 +234,25 @@ class ServiceList(ListResource):
 
         return ServicePage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of ServiceInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of ServiceInstance
+        :rtype: twilio.rest.sync.v1.service.ServicePage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return ServicePage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of ServiceInstance records from the API.
@@ -145,6 +270,23 @@ class ServiceList(ListResource):
 
         return ServicePage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of ServiceInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of ServiceInstance
+        :rtype: twilio.rest.sync.v1.service.ServicePage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return ServicePage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a ServiceContext
@@ -231,7 +373,7 @@ class ServiceContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/Services/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{sid}', self._solution)
 
         # Dependents
         self._documents = None
@@ -250,6 +392,17 @@ class ServiceContext(InstanceContext):
 
         return ServiceInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ServiceInstance
+
+        :returns: The fetched ServiceInstance
+        :rtype: twilio.rest.sync.v1.service.ServiceInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return ServiceInstance(self._version, payload, sid=self._solution['sid'], )
+
     def delete(self):
         """
         Deletes the ServiceInstance
@@ -259,6 +412,15 @@ class ServiceContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the ServiceInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def update(self, webhook_url=values.unset, friendly_name=values.unset,
                reachability_webhooks_enabled=values.unset, acl_enabled=values.unset,
                reachability_debouncing_enabled=values.unset,
@@ -292,6 +454,39 @@ class ServiceContext(InstanceContext):
 
         return ServiceInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def update_async(self, webhook_url=values.unset, friendly_name=values.unset,
+                           reachability_webhooks_enabled=values.unset, acl_enabled=values.unset,
+                           reachability_debouncing_enabled=values.unset,
+                           reachability_debouncing_window=values.unset,
+                           webhooks_from_rest_enabled=values.unset):
+        """
+        Asynchronous coroutine that updates the ServiceInstance
+
+        :param unicode webhook_url: The URL we should call when Sync objects are manipulated
+        :param unicode friendly_name: A string that you assign to describe the resource
+        :param bool reachability_webhooks_enabled: Whether the service instance should call webhook_url when client endpoints connect to Sync
+        :param bool acl_enabled: Whether token identities in the Service must be granted access to Sync objects by using the Permissions resource
+        :param bool reachability_debouncing_enabled: Whether every endpoint_disconnected event occurs after a configurable delay
+        :param unicode reachability_debouncing_window: The reachability event delay in milliseconds
+        :param bool webhooks_from_rest_enabled: Whether the Service instance should call webhook_url when the REST API is used to update Sync objects
+
+        :returns: The updated ServiceInstance
+        :rtype: twilio.rest.sync.v1.service.ServiceInstance
+        """
+        data = values.of({
+            'WebhookUrl': webhook_url,
+            'FriendlyName': friendly_name,
+            'ReachabilityWebhooksEnabled': reachability_webhooks_enabled,
+            'AclEnabled': acl_enabled,
+            'ReachabilityDebouncingEnabled': reachability_debouncing_enabled,
+            'ReachabilityDebouncingWindow': reachability_debouncing_window,
+            'WebhooksFromRestEnabled': webhooks_from_rest_enabled,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return ServiceInstance(self._version, payload, sid=self._solution['sid'], )
+
     @property
     def documents(self):
         """
@@ -301,6 +496,7 @@ class ServiceContext(InstanceContext):
         :rtype: twilio.rest.sync.v1.service.document.DocumentList
         """
         if self._documents is None:
+            from twilio.rest.sync.v1.service.document import DocumentList
             self._documents = DocumentList(self._version, service_sid=self._solution['sid'], )
         return self._documents
 
@@ -313,6 +509,7 @@ class ServiceContext(InstanceContext):
         :rtype: twilio.rest.sync.v1.service.sync_list.SyncListList
         """
         if self._sync_lists is None:
+            from twilio.rest.sync.v1.service.sync_list import SyncListList
             self._sync_lists = SyncListList(self._version, service_sid=self._solution['sid'], )
         return self._sync_lists
 
@@ -325,6 +522,7 @@ class ServiceContext(InstanceContext):
         :rtype: twilio.rest.sync.v1.service.sync_map.SyncMapList
         """
         if self._sync_maps is None:
+            from twilio.rest.sync.v1.service.sync_map import SyncMapList
             self._sync_maps = SyncMapList(self._version, service_sid=self._solution['sid'], )
         return self._sync_maps
 
@@ -337,6 +535,7 @@ class ServiceContext(InstanceContext):
         :rtype: twilio.rest.sync.v1.service.sync_stream.SyncStreamList
         """
         if self._sync_streams is None:
+            from twilio.rest.sync.v1.service.sync_stream import SyncStreamList
             self._sync_streams = SyncStreamList(self._version, service_sid=self._solution['sid'], )
         return self._sync_streams
 
@@ -353,6 +552,33 @@ class ServiceContext(InstanceContext):
 
 class ServiceInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+        'reachability_debouncing_window': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'unique_name': 'unique_name',
+        'account_sid': 'account_sid',
+        'friendly_name': 'friendly_name',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'url': 'url',
+        'webhook_url': 'webhook_url',
+        'webhooks_from_rest_enabled': 'webhooks_from_rest_enabled',
+        'reachability_webhooks_enabled': 'reachability_webhooks_enabled',
+        'acl_enabled': 'acl_enabled',
+        'reachability_debouncing_enabled': 'reachability_debouncing_enabled',
+        'reachability_debouncing_window': 'reachability_debouncing_window',
+        'links': 'links',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the ServiceInstance
@@ -363,22 +589,7 @@ class ServiceInstance(InstanceResource):
         super(ServiceInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'unique_name': payload.get('unique_name'),
-            'account_sid': payload.get('account_sid'),
-            'friendly_name': payload.get('friendly_name'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'url': payload.get('url'),
-            'webhook_url': payload.get('webhook_url'),
-            'webhooks_from_rest_enabled': payload.get('webhooks_from_rest_enabled'),
-            'reachability_webhooks_enabled': payload.get('reachability_webhooks_enabled'),
-            'acl_enabled': payload.get('acl_enabled'),
-            'reachability_debouncing_enabled': payload.get('reachability_debouncing_enabled'),
-            'reachability_debouncing_window': deserialize.integer(payload.get('reachability_debouncing_window')),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -518,6 +729,15 @@ class ServiceInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ServiceInstance
+
+        :returns: The fetched ServiceInstance
+        :rtype: twilio.rest.sync.v1.service.ServiceInstance
+        """
+        return await self._proxy.fetch_async()
+
     def delete(self):
         """
         Deletes the ServiceInstance
@@ -527,6 +747,15 @@ class ServiceInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the ServiceInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def update(self, webhook_url=values.unset, friendly_name=values.unset,
                reachability_webhooks_enabled=values.unset, acl_enabled=values.unset,
                reachability_debouncing_enabled=values.unset,
@@ -556,6 +785,35 @@ class ServiceInstance(InstanceResource):
             webhooks_from_rest_enabled=webhooks_from_rest_enabled,
         )
 
+    async def update_async(self, webhook_url=values.unset, friendly_name=values.unset,
+                           reachability_webhooks_enabled=values.unset, acl_enabled=values.unset,
+                           reachability_debouncing_enabled=values.unset,
+                           reachability_debouncing_window=values.unset,
+                           webhooks_from_rest_enabled=values.unset):
+        """
+        Asynchronous coroutine that updates the ServiceInstance
+
+        :param unicode webhook_url: The URL we should call when Sync objects are manipulated
+        :param unicode friendly_name: A string that you assign to describe the resource
+        :param bool reachability_webhooks_enabled: Whether the service instance should call webhook_url when client endpoints connect to Sync
+        :param bool acl_enabled: Whether token identities in the Service must be granted access to Sync objects by using the Permissions resource
+        :param bool reachability_debouncing_enabled: Whether every endpoint_disconnected event occurs after a configurable delay
+        :param unicode reachability_debouncing_window: The reachability event delay in milliseconds
+        :param bool webhooks_from_rest_enabled: Whether the Service instance should call webhook_url when the REST API is used to update Sync objects
+
+        :returns: The updated ServiceInstance
+        :rtype: twilio.rest.sync.v1.service.ServiceInstance
+        """
+        return await self._proxy.update_async(
+            webhook_url=webhook_url,
+            friendly_name=friendly_name,
+            reachability_webhooks_enabled=reachability_webhooks_enabled,
+            acl_enabled=acl_enabled,
+            reachability_debouncing_enabled=reachability_debouncing_enabled,
+            reachability_debouncing_window=reachability_debouncing_window,
+            webhooks_from_rest_enabled=webhooks_from_rest_enabled,
+        )
+
     @property
     def documents(self):
         """
@@ -605,3 +863,22 @@ class ServiceInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Sync.V1.ServiceInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'DocumentList': 'twilio.rest.sync.v1.service.document',
+    'SyncListList': 'twilio.rest.sync.v1.service.sync_list',
+    'SyncMapList': 'twilio.rest.sync.v1.service.sync_map',
+    'SyncStreamList': 'twilio.rest.sync.v1.service.sync_stream',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -6,14 +6,14 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.sync.v1.service.sync_list.sync_list_item import SyncListItemList
-from twilio.rest.sync.v1.service.sync_list.sync_list_permission import SyncListPermissionList
 
 
 class SyncListList(ListResource):
@@ -32,27 +32,49 @@ class SyncListList(ListResource):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, }
-        self._uri = '/Services/{service_sid}/Lists'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/Lists', self._solution)
 
     def create(self, unique_name=values.unset, ttl=values.unset,
-               collection_ttl=values.unset):
+               collection_ttl=values.unset, deadline=None):
         """
         Create the SyncListInstance
 
         :param unicode unique_name: An application-defined string that uniquely identifies the resource
         :param unicode ttl: Alias for collection_ttl
         :param unicode collection_ttl: How long, in seconds, before the Sync List expires and is deleted
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created SyncListInstance
+        :rtype: twilio.rest.sync.v1.service.sync_list.SyncListInstance
+        """
+        data = values.of({'UniqueName': unique_name, 'Ttl': ttl, 'CollectionTtl': collection_ttl, })
+
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return SyncListInstance(self._version, payload, service_sid=self._solution['service_sid'], )
+
+    async def create_async(self, unique_name=values.unset, ttl=values.unset,
+                           collection_ttl=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the SyncListInstance
+
+        :param unicode unique_name: An application-defined string that uniquely identifies the resource
+        :param unicode ttl: Alias for collection_ttl
+        :param unicode collection_ttl: How long, in seconds, before the Sync List expires and is deleted
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created SyncListInstance
         :rtype: twilio.rest.sync.v1.service.sync_list.SyncListInstance
         """
         data = values.of({'UniqueName': unique_name, 'Ttl': ttl, 'CollectionTtl': collection_ttl, })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return SyncListInstance(self._version, payload, service_sid=self._solution['service_sid'], )
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams SyncListInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -65,17 +87,57 @@ class SyncListList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.sync.v1.service.sync_list.SyncListInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams SyncListInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.sync.v1.service.sync_list.SyncListInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists SyncListInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -87,11 +149,42 @@ class SyncListList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.sync.v1.service.sync_list.SyncListInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists SyncListInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.sync.v1.service.sync_list.SyncListInstance]
+        """
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -112,6 +205,25 @@ class SyncListList(ListResource):
 
         return SyncListPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of SyncListInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of SyncListInstance
+        :rtype: twilio.rest.sync.v1.service.sync_list.SyncListPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return SyncListPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of SyncListInstance records from the API.
@@ -129,6 +241,23 @@ class SyncListList(ListResource):
 
         return SyncListPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of SyncListInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of SyncListInstance
+        :rtype: twilio.rest.sync.v1.service.sync_list.SyncListPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return SyncListPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a SyncListContext
@@ -217,7 +346,7 @@ class SyncListContext(InstanceContext):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, 'sid': sid, }
-        self._uri = '/Services/{service_sid}/Lists/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/Lists/{sid}', self._solution)
 
         # Dependents
         self._sync_list_items = None
@@ -239,6 +368,22 @@ class SyncListContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the SyncListInstance
+
+        :returns: The fetched SyncListInstance
+        :rtype: twilio.rest.sync.v1.service.sync_list.SyncListInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return SyncListInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self):
         """
         Deletes the SyncListInstance
@@ -248,6 +393,15 @@ class SyncListContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the SyncListInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def update(self, ttl=values.unset, collection_ttl=values.unset):
         """
         Update the SyncListInstance
@@ -269,6 +423,27 @@ class SyncListContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, ttl=values.unset, collection_ttl=values.unset):
+        """
+        Asynchronous coroutine that updates the SyncListInstance
+
+        :param unicode ttl: An alias for collection_ttl
+        :param unicode collection_ttl: How long, in seconds, before the Sync List expires and is deleted
+
+        :returns: The updated SyncListInstance
+        :rtype: twilio.rest.sync.v1.service.sync_list.SyncListInstance
+        """
+        data = values.of({'Ttl': ttl, 'CollectionTtl': collection_ttl, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return SyncListInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            sid=self._solution['sid'],
+        )
+
     @property
     def sync_list_items(self):
         """
@@ -278,6 +453,7 @@ class SyncListContext(InstanceContext):
         :rtype: twilio.rest.sync.v1.service.sync_list.sync_list_item.SyncListItemList
         """
         if self._sync_list_items is None:
+            from twilio.rest.sync.v1.service.sync_list.sync_list_item import SyncListItemList
             self._sync_list_items = SyncListItemList(
                 self._version,
                 service_sid=self._solution['service_sid'],
@@ -294,6 +470,7 @@ class SyncListContext(InstanceContext):
         :rtype: twilio.rest.sync.v1.service.sync_list.sync_list_permission.SyncListPermissionList
         """
         if self._sync_list_permissions is None:
+            from twilio.rest.sync.v1.service.sync_list.sync_list_permission import SyncListPermissionList
             self._sync_list_permissions = SyncListPermissionList(
                 self._version,
                 service_sid=self._solution['service_sid'],
@@ -314,6 +491,30 @@ class SyncListContext(InstanceContext):
 
 class SyncListInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_expires': deserialize.iso8601_datetime,
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'unique_name': 'unique_name',
+        'account_sid': 'account_sid',
+        'service_sid': 'service_sid',
+        'url': 'url',
+        'links': 'links',
+        'revision': 'revision',
+        'date_expires': 'date_expires',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'created_by': 'created_by',
+    }, _deserializers)
+
     def __init__(self, version, payload, service_sid, sid=None):
         """
         Initialize the SyncListInstance
@@ -324,19 +525,7 @@ class SyncListInstance(InstanceResource):
         super(SyncListInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'unique_name': payload.get('unique_name'),
-            'account_sid': payload.get('account_sid'),
-            'service_sid': payload.get('service_sid'),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-            'revision': payload.get('revision'),
-            'date_expires': deserialize.iso8601_datetime(payload.get('date_expires')),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'created_by': payload.get('created_by'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -456,6 +645,15 @@ class SyncListInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the SyncListInstance
+
+        :returns: The fetched SyncListInstance
+        :rtype: twilio.rest.sync.v1.service.sync_list.SyncListInstance
+        """
+        return await self._proxy.fetch_async()
+
     def delete(self):
         """
         Deletes the SyncListInstance
@@ -465,6 +663,15 @@ class SyncListInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the SyncListInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def update(self, ttl=values.unset, collection_ttl=values.unset):
         """
         Update the SyncListInstance
@@ -477,6 +684,18 @@ class SyncListInstance(InstanceResource):
         """
         return self._proxy.update(ttl=ttl, collection_ttl=collection_ttl, )
 
+    async def update_async(self, ttl=values.unset, collection_ttl=values.unset):
+        """
+        Asynchronous coroutine that updates the SyncListInstance
+
+        :param unicode ttl: An alias for collection_ttl
+        :param unicode collection_ttl: How long, in seconds, before the Sync List expires and is deleted
+
+        :returns: The updated SyncListInstance
+        :rtype: twilio.rest.sync.v1.service.sync_list.SyncListInstance
+        """
+        return await self._proxy.update_async(ttl=ttl, collection_ttl=collection_ttl, )
+
     @property
     def sync_list_items(self):
         """
@@ -506,3 +725,20 @@ class SyncListInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Sync.V1.SyncListInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'SyncListItemList': 'twilio.rest.sync.v1.service.sync_list.sync_list_item',
+    'SyncListPermissionList': 'twilio.rest.sync.v1.service.sync_list.sync_list_permission',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -6,6 +6,7 @@ This code was generated by
       /       /
 """
 
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
@@ -30,9 +31,9 @@ class SyncListPermissionList(ListResource):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, 'list_sid': list_sid, }
-        self._uri = '/Services/{service_sid}/Lists/{list_sid}/Permissions'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/Lists/{list_sid}/Permissions', self._solution)
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams SyncListPermissionInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -45,17 +46,57 @@ class SyncListPermissionList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.sync.v1.service.sync_list.sync_list_permission.SyncListPermissionInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams SyncListPermissionInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.sync.v1.service.sync_list.sync_list_permission.SyncListPermissionInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists SyncListPermissionInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -67,11 +108,42 @@ class SyncListPermissionList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.sync.v1.service.sync_list.sync_list_permission.SyncListPermissionInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists SyncListPermissionInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.sync.v1.service.sync_list.sync_list_permission.SyncListPermissionInstance]
+        """
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -92,6 +164,25 @@ class SyncListPermissionList(ListResource):
 
         return SyncListPermissionPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of SyncListPermissionInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of SyncListPermissionInstance
+        :rtype: twilio.rest.sync.v1.service.sync_list.sync_list_permission.SyncListPermissionPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return SyncListPermissionPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of SyncListPermissionInstance records from the API.
@@ -109,6 +200,23 @@ class SyncListPermissionList(ListResource):
 
         return SyncListPermissionPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of SyncListPermissionInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of SyncListPermissionInstance
+        :rtype: twilio.rest.sync.v1.service.sync_list.sync_list_permission.SyncListPermissionPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return SyncListPermissionPage(self._version, response, self._solution)
+
     def get(self, identity):
         """
         Constructs a SyncListPermissionContext
@@ -214,7 +322,7 @@ class SyncListPermissionContext(InstanceContext):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, 'list_sid': list_sid, 'identity': identity, }
-        self._uri = '/Services/{service_sid}/Lists/{list_sid}/Permissions/{identity}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/Lists/{list_sid}/Permissions/{identity}', self._solution)
 
     def fetch(self):
         """
@@ -233,6 +341,23 @@ class SyncListPermissionContext(InstanceContext):
             identity=self._solution['identity'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the SyncListPermissionInstance
+
+        :returns: The fetched SyncListPermissionInstance
+        :rtype: twilio.rest.sync.v1.service.sync_list.sync_list_permission.SyncListPermissionInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return SyncListPermissionInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            list_sid=self._solution['list_sid'],
+            identity=self._solution['identity'],
+        )
+
     def delete(self):
         """
         Deletes the SyncListPermissionInstance
@@ -242,6 +367,15 @@ class SyncListPermissionContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the SyncListPermissionInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def update(self, read, write, manage):
         """
         Update the SyncListPermissionInstance
@@ -265,6 +399,29 @@ class SyncListPermissionContext(InstanceContext):
             identity=self._solution['identity'],
         )
 
+    async def update_async(self, read, write, manage):
+        """
+        Asynchronous coroutine that updates the SyncListPermissionInstance
+
+        :param bool read: Read access
+        :param bool write: Write access
+        :param bool manage: Manage access
+
+        :returns: The updated SyncListPermissionInstance
+        :rtype: twilio.rest.sync.v1.service.sync_list.sync_list_permission.SyncListPermissionInstance
+        """
+        data = values.of({'Read': read, 'Write': write, 'Manage': manage, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return SyncListPermissionInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            list_sid=self._solution['list_sid'],
+            identity=self._solution['identity'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -278,6 +435,20 @@ class SyncListPermissionContext(InstanceContext):
 
 class SyncListPermissionInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'service_sid': 'service_sid',
+        'list_sid': 'list_sid',
+        'identity': 'identity',
+        'read': 'read',
+        'write': 'write',
+        'manage': 'manage',
+        'url': 'url',
+    })
+
     def __init__(self, version, payload, service_sid, list_sid, identity=None):
         """
         Initialize the SyncListPermissionInstance
@@ -288,16 +459,7 @@ class SyncListPermissionInstance(InstanceResource):
         super(SyncListPermissionInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'service_sid': payload.get('service_sid'),
-            'list_sid': payload.get('list_sid'),
-            'identity': payload.get('identity'),
-            'read': payload.get('read'),
-            'write': payload.get('write'),
-            'manage': payload.get('manage'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -398,6 +560,15 @@ class SyncListPermissionInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the SyncListPermissionInstance
+
+        :returns: The fetched SyncListPermissionInstance
+        :rtype: twilio.rest.sync.v1.service.sync_list.sync_list_permission.SyncListPermissionInstance
+        """
+        return await self._proxy.fetch_async()
+
     def delete(self):
         """
         Deletes the SyncListPermissionInstance
@@ -407,6 +578,15 @@ class SyncListPermissionInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the SyncListPermissionInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def update(self, read, write, manage):
         """
         Update the SyncListPermissionInstance
@@ -420,6 +600,19 @@ class SyncListPermissionInstance(InstanceResource):
         """
         return self._proxy.update(read, write, manage, )
 
+    async def update_async(self, read, write, manage):
+        """
+        Asynchronous coroutine that updates the SyncListPermissionInstance
+
+        :param bool read: Read access
+        :param bool write: Write access
+        :param bool manage: Manage access
+
+        :returns: The updated SyncListPermissionInstance
+        :rtype: twilio.rest.sync.v1.service.sync_list.sync_list_permission.SyncListPermissionInstance
+        """
+        return await self._proxy.update_async(read, write, manage, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -7,6 +7,7 @@ This code was generated by
 """
 
 from twilio.base import serialize
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
@@ -30,20 +31,44 @@ class StreamMessageList(ListResource):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, 'stream_sid': stream_sid, }
-        self._uri = '/Services/{service_sid}/Streams/{stream_sid}/Messages'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/Streams/{stream_sid}/Messages', self._solution)
 
-    def create(self, data):
+    def create(self, data, deadline=None):
         """
         Create the StreamMessageInstance
 
         :param dict data: A JSON string that represents an arbitrary, schema-less object that makes up the Stream Message body
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created StreamMessageInstance
         :rtype: twilio.rest.sync.v1.service.sync_stream.stream_message.StreamMessageInstance
         """
         data = values.of({'Data': serialize.object(data), })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return StreamMessageInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            stream_sid=self._solution['stream_sid'],
+        )
+
+    async def create_async(self, data, deadline=None):
+        """
+        Asynchronous coroutine that creates the StreamMessageInstance
+
+        :param dict data: A JSON string that represents an arbitrary, schema-less object that makes up the Stream Message body
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created StreamMessageInstance
+        :rtype: twilio.rest.sync.v1.service.sync_stream.stream_message.StreamMessageInstance
+        """
+        data = values.of({'Data': serialize.object(data), })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return StreamMessageInstance(
             self._version,
@@ -109,6 +134,14 @@ class StreamMessagePage(Page):
 
 class StreamMessageInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'data': 'data',
+    })
+
     def __init__(self, version, payload, service_sid, stream_sid):
         """
         Initialize the StreamMessageInstance
@@ -119,7 +152,7 @@ class StreamMessageInstance(InstanceResource):
         super(StreamMessageInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {'sid': payload.get('sid'), 'data': payload.get('data'), }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
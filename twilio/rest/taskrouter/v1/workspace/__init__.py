@@ -6,22 +6,14 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.taskrouter.v1.workspace.activity import ActivityList
-from twilio.rest.taskrouter.v1.workspace.event import EventList
-from twilio.rest.taskrouter.v1.workspace.task import TaskList
-from twilio.rest.taskrouter.v1.workspace.task_channel import TaskChannelList
-from twilio.rest.taskrouter.v1.workspace.task_queue import TaskQueueList
-from twilio.rest.taskrouter.v1.workspace.worker import WorkerList
-from twilio.rest.taskrouter.v1.workspace.workflow import WorkflowList
-from twilio.rest.taskrouter.v1.workspace.workspace_cumulative_statistics import WorkspaceCumulativeStatisticsList
-from twilio.rest.taskrouter.v1.workspace.workspace_real_time_statistics import WorkspaceRealTimeStatisticsList
-from twilio.rest.taskrouter.v1.workspace.workspace_statistics import WorkspaceStatisticsList
 
 
 class WorkspaceList(ListResource):
@@ -39,9 +31,10 @@ class WorkspaceList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Workspaces'.format(**self._solution)
+        self._uri = values.ResourceUri('/Workspaces', self._solution)
 
-    def stream(self, friendly_name=values.unset, limit=None, page_size=None):
+    def stream(self, friendly_name=values.unset, limit=None, page_size=None,
+               prefetch=None, raw=False, deadline=None):
         """
         Streams WorkspaceInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -55,17 +48,59 @@ class WorkspaceList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.taskrouter.v1.workspace.WorkspaceInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(friendly_name=friendly_name, page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(friendly_name=friendly_name, page_size=limits['page_size'], )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, friendly_name=values.unset, limit=None, page_size=None,
+                           prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams WorkspaceInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param unicode friendly_name: The friendly_name of the Workspace resources to read
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.taskrouter.v1.workspace.WorkspaceInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(friendly_name=friendly_name, page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, friendly_name=values.unset, limit=None, page_size=None):
+    def list(self, friendly_name=values.unset, limit=None, page_size=None,
+             prefetch=None, raw=False, deadline=None):
         """
         Lists WorkspaceInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -78,11 +113,43 @@ class WorkspaceList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.taskrouter.v1.workspace.WorkspaceInstance]
         """
-        return list(self.stream(friendly_name=friendly_name, limit=limit, page_size=page_size, ))
+        return list(self.stream(friendly_name=friendly_name, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, friendly_name=values.unset, limit=None, page_size=None,
+                         prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists WorkspaceInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param unicode friendly_name: The friendly_name of the Workspace resources to read
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.taskrouter.v1.workspace.WorkspaceInstance]
+        """
+        return [record async for record in await self.stream_async(friendly_name=friendly_name, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, friendly_name=values.unset, page_token=values.unset,
              page_number=values.unset, page_size=values.unset):
@@ -109,6 +176,31 @@ class WorkspaceList(ListResource):
 
         return WorkspacePage(self._version, response, self._solution)
 
+    async def page_async(self, friendly_name=values.unset, page_token=values.unset,
+                         page_number=values.unset, page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of WorkspaceInstance records from the API.
+        Request is executed immediately
+
+        :param unicode friendly_name: The friendly_name of the Workspace resources to read
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of WorkspaceInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.WorkspacePage
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return WorkspacePage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of WorkspaceInstance records from the API.
@@ -126,9 +218,26 @@ class WorkspaceList(ListResource):
 
         return WorkspacePage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of WorkspaceInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of WorkspaceInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.WorkspacePage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return WorkspacePage(self._version, response, self._solution)
+
     def create(self, friendly_name, event_callback_url=values.unset,
                events_filter=values.unset, multi_task_enabled=values.unset,
-               template=values.unset, prioritize_queue_order=values.unset):
+               template=values.unset, prioritize_queue_order=values.unset, deadline=None):
         """
         Create the WorkspaceInstance
 
@@ -138,6 +247,40 @@ class WorkspaceList(ListResource):
         :param bool multi_task_enabled: Whether multi-tasking is enabled
         :param unicode template: An available template name
         :param WorkspaceInstance.QueueOrder prioritize_queue_order: The type of TaskQueue to prioritize when Workers are receiving Tasks from both types of TaskQueues
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created WorkspaceInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.WorkspaceInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'EventCallbackUrl': event_callback_url,
+            'EventsFilter': events_filter,
+            'MultiTaskEnabled': multi_task_enabled,
+            'Template': template,
+            'PrioritizeQueueOrder': prioritize_queue_order,
+        })
+
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return WorkspaceInstance(self._version, payload, )
+
+    async def create_async(self, friendly_name, event_callback_url=values.unset,
+                           events_filter=values.unset, multi_task_enabled=values.unset,
+                           template=values.unset, prioritize_queue_order=values.unset,
+                           deadline=None):
+        """
+        Asynchronous coroutine that creates the WorkspaceInstance
+
+        :param unicode friendly_name: A string to describe the Workspace resource
+        :param unicode event_callback_url: The URL we should call when an event occurs
+        :param unicode events_filter: The list of Workspace events for which to call event_callback_url
+        :param bool multi_task_enabled: Whether multi-tasking is enabled
+        :param unicode template: An available template name
+        :param WorkspaceInstance.QueueOrder prioritize_queue_order: The type of TaskQueue to prioritize when Workers are receiving Tasks from both types of TaskQueues
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created WorkspaceInstance
         :rtype: twilio.rest.taskrouter.v1.workspace.WorkspaceInstance
@@ -151,7 +294,7 @@ class WorkspaceList(ListResource):
             'PrioritizeQueueOrder': prioritize_queue_order,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return WorkspaceInstance(self._version, payload, )
 
@@ -241,7 +384,7 @@ class WorkspaceContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/Workspaces/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Workspaces/{sid}', self._solution)
 
         # Dependents
         self._activities = None
@@ -266,6 +409,17 @@ class WorkspaceContext(InstanceContext):
 
         return WorkspaceInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the WorkspaceInstance
+
+        :returns: The fetched WorkspaceInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.WorkspaceInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return WorkspaceInstance(self._version, payload, sid=self._solution['sid'], )
+
     def update(self, default_activity_sid=values.unset,
                event_callback_url=values.unset, events_filter=values.unset,
                friendly_name=values.unset, multi_task_enabled=values.unset,
@@ -299,6 +453,39 @@ class WorkspaceContext(InstanceContext):
 
         return WorkspaceInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def update_async(self, default_activity_sid=values.unset,
+                           event_callback_url=values.unset, events_filter=values.unset,
+                           friendly_name=values.unset, multi_task_enabled=values.unset,
+                           timeout_activity_sid=values.unset,
+                           prioritize_queue_order=values.unset):
+        """
+        Asynchronous coroutine that updates the WorkspaceInstance
+
+        :param unicode default_activity_sid: The SID of the Activity that will be used when new Workers are created in the Workspace
+        :param unicode event_callback_url: The URL we should call when an event occurs
+        :param unicode events_filter: The list of Workspace events for which to call event_callback_url
+        :param unicode friendly_name: A string to describe the Workspace resource
+        :param bool multi_task_enabled: Whether multi-tasking is enabled
+        :param unicode timeout_activity_sid: The SID of the Activity that will be assigned to a Worker when a Task reservation times out without a response
+        :param WorkspaceInstance.QueueOrder prioritize_queue_order: The type of TaskQueue to prioritize when Workers are receiving Tasks from both types of TaskQueues
+
+        :returns: The updated WorkspaceInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.WorkspaceInstance
+        """
+        data = values.of({
+            'DefaultActivitySid': default_activity_sid,
+            'EventCallbackUrl': event_callback_url,
+            'EventsFilter': events_filter,
+            'FriendlyName': friendly_name,
+            'MultiTaskEnabled': multi_task_enabled,
+            'TimeoutActivitySid': timeout_activity_sid,
+            'PrioritizeQueueOrder': prioritize_queue_order,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return WorkspaceInstance(self._version, payload, sid=self._solution['sid'], )
+
     def delete(self):
         """
         Deletes the WorkspaceInstance
@@ -308,6 +495,15 @@ class WorkspaceContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the WorkspaceInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     @property
     def activities(self):
         """
@@ -317,6 +513,7 @@ class WorkspaceContext(InstanceContext):
         :rtype: twilio.rest.taskrouter.v1.workspace.activity.ActivityList
         """
         if self._activities is None:
+            from twilio.rest.taskrouter.v1.workspace.activity import ActivityList
             self._activities = ActivityList(self._version, workspace_sid=self._solution['sid'], )
         return self._activities
 
@@ -329,6 +526,7 @@ class WorkspaceContext(InstanceContext):
         :rtype: twilio.rest.taskrouter.v1.workspace.event.EventList
         """
         if self._events is None:
+            from twilio.rest.taskrouter.v1.workspace.event import EventList
             self._events = EventList(self._version, workspace_sid=self._solution['sid'], )
         return self._events
 
@@ -341,6 +539,7 @@ class WorkspaceContext(InstanceContext):
         :rtype: twilio.rest.taskrouter.v1.workspace.task.TaskList
         """
         if self._tasks is None:
+            from twilio.rest.taskrouter.v1.workspace.task import TaskList
             self._tasks = TaskList(self._version, workspace_sid=self._solution['sid'], )
         return self._tasks
 
@@ -353,6 +552,7 @@ class WorkspaceContext(InstanceContext):
         :rtype: twilio.rest.taskrouter.v1.workspace.task_queue.TaskQueueList
         """
         if self._task_queues is None:
+            from twilio.rest.taskrouter.v1.workspace.task_queue import TaskQueueList
             self._task_queues = TaskQueueList(self._version, workspace_sid=self._solution['sid'], )
         return self._task_queues
 
@@ -365,6 +565,7 @@ class WorkspaceContext(InstanceContext):
         :rtype: twilio.rest.taskrouter.v1.workspace.worker.WorkerList
         """
         if self._workers is None:
+            from twilio.rest.taskrouter.v1.workspace.worker import WorkerList
             self._workers = WorkerList(self._version, workspace_sid=self._solution['sid'], )
         return self._workers
 
@@ -377,6 +578,7 @@ class WorkspaceContext(InstanceContext):
         :rtype: twilio.rest.taskrouter.v1.workspace.workflow.WorkflowList
         """
         if self._workflows is None:
+            from twilio.rest.taskrouter.v1.workspace.workflow import WorkflowList
             self._workflows = WorkflowList(self._version, workspace_sid=self._solution['sid'], )
         return self._workflows
 
@@ -389,6 +591,7 @@ class WorkspaceContext(InstanceContext):
         :rtype: twilio.rest.taskrouter.v1.workspace.workspace_statistics.WorkspaceStatisticsList
         """
         if self._statistics is None:
+            from twilio.rest.taskrouter.v1.workspace.workspace_statistics import WorkspaceStatisticsList
             self._statistics = WorkspaceStatisticsList(self._version, workspace_sid=self._solution['sid'], )
         return self._statistics
 
@@ -401,6 +604,7 @@ class WorkspaceContext(InstanceContext):
         :rtype: twilio.rest.taskrouter.v1.workspace.workspace_real_time_statistics.WorkspaceRealTimeStatisticsList
         """
         if self._real_time_statistics is None:
+            from twilio.rest.taskrouter.v1.workspace.workspace_real_time_statistics import WorkspaceRealTimeStatisticsList
             self._real_time_statistics = WorkspaceRealTimeStatisticsList(
                 self._version,
                 workspace_sid=self._solution['sid'],
@@ -416,6 +620,7 @@ class WorkspaceContext(InstanceContext):
         :rtype: twilio.rest.taskrouter.v1.workspace.workspace_cumulative_statistics.WorkspaceCumulativeStatisticsList
         """
         if self._cumulative_statistics is None:
+            from twilio.rest.taskrouter.v1.workspace.workspace_cumulative_statistics import WorkspaceCumulativeStatisticsList
             self._cumulative_statistics = WorkspaceCumulativeStatisticsList(
                 self._version,
                 workspace_sid=self._solution['sid'],
@@ -431,6 +636,7 @@ class WorkspaceContext(InstanceContext):
         :rtype: twilio.rest.taskrouter.v1.workspace.task_channel.TaskChannelList
         """
         if self._task_channels is None:
+            from twilio.rest.taskrouter.v1.workspace.task_channel import TaskChannelList
             self._task_channels = TaskChannelList(self._version, workspace_sid=self._solution['sid'], )
         return self._task_channels
 
@@ -451,6 +657,33 @@ class WorkspaceInstance(InstanceResource):
         FIFO = "FIFO"
         LIFO = "LIFO"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'default_activity_name': 'default_activity_name',
+        'default_activity_sid': 'default_activity_sid',
+        'event_callback_url': 'event_callback_url',
+        'events_filter': 'events_filter',
+        'friendly_name': 'friendly_name',
+        'multi_task_enabled': 'multi_task_enabled',
+        'sid': 'sid',
+        'timeout_activity_name': 'timeout_activity_name',
+        'timeout_activity_sid': 'timeout_activity_sid',
+        'prioritize_queue_order': 'prioritize_queue_order',
+        'url': 'url',
+        'links': 'links',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the WorkspaceInstance
@@ -461,23 +694,7 @@ class WorkspaceInstance(InstanceResource):
         super(WorkspaceInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'default_activity_name': payload.get('default_activity_name'),
-            'default_activity_sid': payload.get('default_activity_sid'),
-            'event_callback_url': payload.get('event_callback_url'),
-            'events_filter': payload.get('events_filter'),
-            'friendly_name': payload.get('friendly_name'),
-            'multi_task_enabled': payload.get('multi_task_enabled'),
-            'sid': payload.get('sid'),
-            'timeout_activity_name': payload.get('timeout_activity_name'),
-            'timeout_activity_sid': payload.get('timeout_activity_sid'),
-            'prioritize_queue_order': payload.get('prioritize_queue_order'),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -625,6 +842,15 @@ class WorkspaceInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the WorkspaceInstance
+
+        :returns: The fetched WorkspaceInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.WorkspaceInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, default_activity_sid=values.unset,
                event_callback_url=values.unset, events_filter=values.unset,
                friendly_name=values.unset, multi_task_enabled=values.unset,
@@ -654,6 +880,35 @@ class WorkspaceInstance(InstanceResource):
             prioritize_queue_order=prioritize_queue_order,
         )
 
+    async def update_async(self, default_activity_sid=values.unset,
+                           event_callback_url=values.unset, events_filter=values.unset,
+                           friendly_name=values.unset, multi_task_enabled=values.unset,
+                           timeout_activity_sid=values.unset,
+                           prioritize_queue_order=values.unset):
+        """
+        Asynchronous coroutine that updates the WorkspaceInstance
+
+        :param unicode default_activity_sid: The SID of the Activity that will be used when new Workers are created in the Workspace
+        :param unicode event_callback_url: The URL we should call when an event occurs
+        :param unicode events_filter: The list of Workspace events for which to call event_callback_url
+        :param unicode friendly_name: A string to describe the Workspace resource
+        :param bool multi_task_enabled: Whether multi-tasking is enabled
+        :param unicode timeout_activity_sid: The SID of the Activity that will be assigned to a Worker when a Task reservation times out without a response
+        :param WorkspaceInstance.QueueOrder prioritize_queue_order: The type of TaskQueue to prioritize when Workers are receiving Tasks from both types of TaskQueues
+
+        :returns: The updated WorkspaceInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.WorkspaceInstance
+        """
+        return await self._proxy.update_async(
+            default_activity_sid=default_activity_sid,
+            event_callback_url=event_callback_url,
+            events_filter=events_filter,
+            friendly_name=friendly_name,
+            multi_task_enabled=multi_task_enabled,
+            timeout_activity_sid=timeout_activity_sid,
+            prioritize_queue_order=prioritize_queue_order,
+        )
+
     def delete(self):
         """
         Deletes the WorkspaceInstance
@@ -663,6 +918,15 @@ class WorkspaceInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the WorkspaceInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     @property
     def activities(self):
         """
@@ -772,3 +1036,28 @@ class WorkspaceInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Taskrouter.V1.WorkspaceInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'ActivityList': 'twilio.rest.taskrouter.v1.workspace.activity',
+    'EventList': 'twilio.rest.taskrouter.v1.workspace.event',
+    'TaskChannelList': 'twilio.rest.taskrouter.v1.workspace.task_channel',
+    'TaskList': 'twilio.rest.taskrouter.v1.workspace.task',
+    'TaskQueueList': 'twilio.rest.taskrouter.v1.workspace.task_queue',
+    'WorkerList': 'twilio.rest.taskrouter.v1.workspace.worker',
+    'WorkflowList': 'twilio.rest.taskrouter.v1.workspace.workflow',
+    'WorkspaceCumulativeStatisticsList': 'twilio.rest.taskrouter.v1.workspace.workspace_cumulative_statistics',
+    'WorkspaceRealTimeStatisticsList': 'twilio.rest.taskrouter.v1.workspace.workspace_real_time_statistics',
+    'WorkspaceStatisticsList': 'twilio.rest.taskrouter.v1.workspace.workspace_statistics',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -30,10 +30,10 @@ class ActivityList(ListResource):
 
         # Path Solution
         self._solution = {'workspace_sid': workspace_sid, }
-        self._uri = '/Workspaces/{workspace_sid}/Activities'.format(**self._solution)
+        self._uri = values.ResourceUri('/Workspaces/{workspace_sid}/Activities', self._solution)
 
     def stream(self, friendly_name=values.unset, available=values.unset, limit=None,
-               page_size=None):
+               page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams ActivityInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -48,18 +48,60 @@ class ActivityList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.taskrouter.v1.workspace.activity.ActivityInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(friendly_name=friendly_name, available=available, page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(friendly_name=friendly_name, available=available, page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, friendly_name=values.unset, available=values.unset, limit=None,
+                           page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams ActivityInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param unicode friendly_name: The friendly_name of the Activity resources to read
+        :param unicode available: Whether to return activities that are available or unavailable
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.taskrouter.v1.workspace.activity.ActivityInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(friendly_name=friendly_name, available=available, page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, friendly_name=values.unset, available=values.unset, limit=None,
-             page_size=None):
+             page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists ActivityInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -73,6 +115,12 @@ class ActivityList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.taskrouter.v1.workspace.activity.ActivityInstance]
@@ -82,8 +130,46 @@ class ActivityList(ListResource):
             available=available,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, friendly_name=values.unset, available=values.unset, limit=None,
+                         page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists ActivityInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param unicode friendly_name: The friendly_name of the Activity resources to read
+        :param unicode available: Whether to return activities that are available or unavailable
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.taskrouter.v1.workspace.activity.ActivityInstance]
+        """
+        return [record async for record in await self.stream_async(
+            friendly_name=friendly_name,
+            available=available,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, friendly_name=values.unset, available=values.unset,
              page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -112,6 +198,34 @@ class ActivityList(ListResource):
 
         return ActivityPage(self._version, response, self._solution)
 
+    async def page_async(self, friendly_name=values.unset, available=values.unset,
+                         page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of ActivityInstance records from the API.
+        Request is executed immediately
+
+        :param unicode friendly_name: The friendly_name of the Activity resources to read
+        :param unicode available: Whether to return activities that are available or unavailable
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of ActivityInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.activity.ActivityPage
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'Available': available,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return ActivityPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of ActivityInstance records from the API.
@@ -129,19 +243,56 @@ class ActivityList(ListResource):
 
         return ActivityPage(self._version, response, self._solution)
 
-    def create(self, friendly_name, available=values.unset):
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of ActivityInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of ActivityInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.activity.ActivityPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return ActivityPage(self._version, response, self._solution)
+
+    def create(self, friendly_name, available=values.unset, deadline=None):
         """
         Create the ActivityInstance
 
         :param unicode friendly_name: A string to describe the Activity resource
         :param bool available: Whether the Worker should be eligible to receive a Task when it occupies the Activity
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created ActivityInstance
         :rtype: twilio.rest.taskrouter.v1.workspace.activity.ActivityInstance
         """
         data = values.of({'FriendlyName': friendly_name, 'Available': available, })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return ActivityInstance(self._version, payload, workspace_sid=self._solution['workspace_sid'], )
+
+    async def create_async(self, friendly_name, available=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the ActivityInstance
+
+        :param unicode friendly_name: A string to describe the Activity resource
+        :param bool available: Whether the Worker should be eligible to receive a Task when it occupies the Activity
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created ActivityInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.activity.ActivityInstance
+        """
+        data = values.of({'FriendlyName': friendly_name, 'Available': available, })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return ActivityInstance(self._version, payload, workspace_sid=self._solution['workspace_sid'], )
 
@@ -233,7 +384,7 @@ class ActivityContext(InstanceContext):
 
         # Path Solution
         self._solution = {'workspace_sid': workspace_sid, 'sid': sid, }
-        self._uri = '/Workspaces/{workspace_sid}/Activities/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Workspaces/{workspace_sid}/Activities/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -251,6 +402,22 @@ class ActivityContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ActivityInstance
+
+        :returns: The fetched ActivityInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.activity.ActivityInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return ActivityInstance(
+            self._version,
+            payload,
+            workspace_sid=self._solution['workspace_sid'],
+            sid=self._solution['sid'],
+        )
+
     def update(self, friendly_name=values.unset):
         """
         Update the ActivityInstance
@@ -271,6 +438,26 @@ class ActivityContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, friendly_name=values.unset):
+        """
+        Asynchronous coroutine that updates the ActivityInstance
+
+        :param unicode friendly_name: A string to describe the Activity resource
+
+        :returns: The updated ActivityInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.activity.ActivityInstance
+        """
+        data = values.of({'FriendlyName': friendly_name, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return ActivityInstance(
+            self._version,
+            payload,
+            workspace_sid=self._solution['workspace_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self):
         """
         Deletes the ActivityInstance
@@ -280,6 +467,15 @@ class ActivityContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the ActivityInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -293,6 +489,27 @@ class ActivityContext(InstanceContext):
 
 class ActivityInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'available': 'available',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'friendly_name': 'friendly_name',
+        'sid': 'sid',
+        'workspace_sid': 'workspace_sid',
+        'url': 'url',
+        'links': 'links',
+    }, _deserializers)
+
     def __init__(self, version, payload, workspace_sid, sid=None):
         """
         Initialize the ActivityInstance
@@ -303,17 +520,7 @@ class ActivityInstance(InstanceResource):
         super(ActivityInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'available': payload.get('available'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'friendly_name': payload.get('friendly_name'),
-            'sid': payload.get('sid'),
-            'workspace_sid': payload.get('workspace_sid'),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -417,6 +624,15 @@ class ActivityInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ActivityInstance
+
+        :returns: The fetched ActivityInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.activity.ActivityInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, friendly_name=values.unset):
         """
         Update the ActivityInstance
@@ -428,6 +644,17 @@ class ActivityInstance(InstanceResource):
         """
         return self._proxy.update(friendly_name=friendly_name, )
 
+    async def update_async(self, friendly_name=values.unset):
+        """
+        Asynchronous coroutine that updates the ActivityInstance
+
+        :param unicode friendly_name: A string to describe the Activity resource
+
+        :returns: The updated ActivityInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.activity.ActivityInstance
+        """
+        return await self._proxy.update_async(friendly_name=friendly_name, )
+
     def delete(self):
         """
         Deletes the ActivityInstance
@@ -437,6 +664,15 @@ class ActivityInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the ActivityInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
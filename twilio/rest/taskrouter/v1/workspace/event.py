@@ -31,14 +31,15 @@ class EventList(ListResource):
 
         # Path Solution
         self._solution = {'workspace_sid': workspace_sid, }
-        self._uri = '/Workspaces/{workspace_sid}/Events'.format(**self._solution)
+        self._uri = values.ResourceUri('/Workspaces/{workspace_sid}/Events', self._solution)
 
     def stream(self, end_date=values.unset, event_type=values.unset,
                minutes=values.unset, reservation_sid=values.unset,
                start_date=values.unset, task_queue_sid=values.unset,
                task_sid=values.unset, worker_sid=values.unset,
                workflow_sid=values.unset, task_channel=values.unset,
-               sid=values.unset, limit=None, page_size=None):
+               sid=values.unset, limit=None, page_size=None, prefetch=None,
+               raw=False, deadline=None):
         """
         Streams EventInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -62,13 +63,137 @@ class EventList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.taskrouter.v1.workspace.event.EventInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                end_date=end_date,
+                event_type=event_type,
+                minutes=minutes,
+                reservation_sid=reservation_sid,
+                start_date=start_date,
+                task_queue_sid=task_queue_sid,
+                task_sid=task_sid,
+                worker_sid=worker_sid,
+                workflow_sid=workflow_sid,
+                task_channel=task_channel,
+                sid=sid,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, end_date=values.unset, event_type=values.unset,
+                           minutes=values.unset, reservation_sid=values.unset,
+                           start_date=values.unset, task_queue_sid=values.unset,
+                           task_sid=values.unset, worker_sid=values.unset,
+                           workflow_sid=values.unset, task_channel=values.unset,
+                           sid=values.unset, limit=None, page_size=None,
+                           prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams EventInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param datetime end_date: Only include usage that occurred on or before this date
+        :param unicode event_type: The type of Events to read
+        :param unicode minutes: The period of events to read in minutes
+        :param unicode reservation_sid: The SID of the Reservation with the Events to read
+        :param datetime start_date: Only include Events from on or after this date
+        :param unicode task_queue_sid: The SID of the TaskQueue with the Events to read
+        :param unicode task_sid: The SID of the Task with the Events to read
+        :param unicode worker_sid: The SID of the Worker with the Events to read
+        :param unicode workflow_sid: The SID of the Worker with the Events to read
+        :param unicode task_channel: The TaskChannel with the Events to read
+        :param unicode sid: The unique string that identifies the resource
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.taskrouter.v1.workspace.event.EventInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                end_date=end_date,
+                event_type=event_type,
+                minutes=minutes,
+                reservation_sid=reservation_sid,
+                start_date=start_date,
+                task_queue_sid=task_queue_sid,
+                task_sid=task_sid,
+                worker_sid=worker_sid,
+                workflow_sid=workflow_sid,
+                task_channel=task_channel,
+                sid=sid,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, end_date=values.unset, event_type=values.unset,
+             minutes=values.unset, reservation_sid=values.unset,
+             start_date=values.unset, task_queue_sid=values.unset,
+             task_sid=values.unset, worker_sid=values.unset,
+             workflow_sid=values.unset, task_channel=values.unset, sid=values.unset,
+             limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Lists EventInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param datetime end_date: Only include usage that occurred on or before this date
+        :param unicode event_type: The type of Events to read
+        :param unicode minutes: The period of events to read in minutes
+        :param unicode reservation_sid: The SID of the Reservation with the Events to read
+        :param datetime start_date: Only include Events from on or after this date
+        :param unicode task_queue_sid: The SID of the TaskQueue with the Events to read
+        :param unicode task_sid: The SID of the Task with the Events to read
+        :param unicode worker_sid: The SID of the Worker with the Events to read
+        :param unicode workflow_sid: The SID of the Worker with the Events to read
+        :param unicode task_channel: The TaskChannel with the Events to read
+        :param unicode sid: The unique string that identifies the resource
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.taskrouter.v1.workspace.event.EventInstance]
+        """
+        return list(self.stream(
             end_date=end_date,
             event_type=event_type,
             minutes=minutes,
@@ -80,19 +205,21 @@ class EventList(ListResource):
             workflow_sid=workflow_sid,
             task_channel=task_channel,
             sid=sid,
-            page_size=limits['page_size'],
-        )
-
-        return self._version.stream(page, limits['limit'])
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        ))
 
-    def list(self, end_date=values.unset, event_type=values.unset,
-             minutes=values.unset, reservation_sid=values.unset,
-             start_date=values.unset, task_queue_sid=values.unset,
-             task_sid=values.unset, worker_sid=values.unset,
-             workflow_sid=values.unset, task_channel=values.unset, sid=values.unset,
-             limit=None, page_size=None):
+    async def list_async(self, end_date=values.unset, event_type=values.unset,
+                         minutes=values.unset, reservation_sid=values.unset,
+                         start_date=values.unset, task_queue_sid=values.unset,
+                         task_sid=values.unset, worker_sid=values.unset,
+                         workflow_sid=values.unset, task_channel=values.unset, sid=values.unset,
+                         limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
-        Lists EventInstance records from the API as a list.
+        Asynchronously lists EventInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
         memory before returning.
 
@@ -113,11 +240,17 @@ class EventList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.taskrouter.v1.workspace.event.EventInstance]
         """
-        return list(self.stream(
+        return [record async for record in await self.stream_async(
             end_date=end_date,
             event_type=event_type,
             minutes=minutes,
@@ -131,7 +264,10 @@ class EventList(ListResource):
             sid=sid,
             limit=limit,
             page_size=page_size,
-        ))
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
 
     def page(self, end_date=values.unset, event_type=values.unset,
              minutes=values.unset, reservation_sid=values.unset,
@@ -183,6 +319,56 @@ class EventList(ListResource):
 
         return EventPage(self._version, response, self._solution)
 
+    async def page_async(self, end_date=values.unset, event_type=values.unset,
+                         minutes=values.unset, reservation_sid=values.unset,
+                         start_date=values.unset, task_queue_sid=values.unset,
+                         task_sid=values.unset, worker_sid=values.unset,
+                         workflow_sid=values.unset, task_channel=values.unset, sid=values.unset,
+                         page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of EventInstance records from the API.
+        Request is executed immediately
+
+        :param datetime end_date: Only include usage that occurred on or before this date
+        :param unicode event_type: The type of Events to read
+        :param unicode minutes: The period of events to read in minutes
+        :param unicode reservation_sid: The SID of the Reservation with the Events to read
+        :param datetime start_date: Only include Events from on or after this date
+        :param unicode task_queue_sid: The SID of the TaskQueue with the Events to read
+        :param unicode task_sid: The SID of the Task with the Events to read
+        :param unicode worker_sid: The SID of the Worker with the Events to read
+        :param unicode workflow_sid: The SID of the Worker with the Events to read
+        :param unicode task_channel: The TaskChannel with the Events to read
+        :param unicode sid: The unique string that identifies the resource
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of EventInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.event.EventPage
+        """
+        data = values.of({
+            'EndDate': serialize.iso8601_datetime(end_date),
+            'EventType': event_type,
+            'Minutes': minutes,
+            'ReservationSid': reservation_sid,
+            'StartDate': serialize.iso8601_datetime(start_date),
+            'TaskQueueSid': task_queue_sid,
+            'TaskSid': task_sid,
+            'WorkerSid': worker_sid,
+            'WorkflowSid': workflow_sid,
+            'TaskChannel': task_channel,
+            'Sid': sid,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return EventPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of EventInstance records from the API.
@@ -200,6 +386,23 @@ class EventList(ListResource):
 
         return EventPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of EventInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of EventInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.event.EventPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return EventPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a EventContext
@@ -288,7 +491,7 @@ class EventContext(InstanceContext):
 
         # Path Solution
         self._solution = {'workspace_sid': workspace_sid, 'sid': sid, }
-        self._uri = '/Workspaces/{workspace_sid}/Events/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Workspaces/{workspace_sid}/Events/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -306,6 +509,22 @@ class EventContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the EventInstance
+
+        :returns: The fetched EventInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.event.EventInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return EventInstance(
+            self._version,
+            payload,
+            workspace_sid=self._solution['workspace_sid'],
+            sid=self._solution['sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -319,6 +538,35 @@ class EventContext(InstanceContext):
 
 class EventInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'event_date': deserialize.iso8601_datetime,
+        'event_date_ms': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'actor_sid': 'actor_sid',
+        'actor_type': 'actor_type',
+        'actor_url': 'actor_url',
+        'description': 'description',
+        'event_data': 'event_data',
+        'event_date': 'event_date',
+        'event_date_ms': 'event_date_ms',
+        'event_type': 'event_type',
+        'resource_sid': 'resource_sid',
+        'resource_type': 'resource_type',
+        'resource_url': 'resource_url',
+        'sid': 'sid',
+        'source': 'source',
+        'source_ip_address': 'source_ip_address',
+        'url': 'url',
+        'workspace_sid': 'workspace_sid',
+    }, _deserializers)
+
     def __init__(self, version, payload, workspace_sid, sid=None):
         """
         Initialize the EventInstance
@@ -329,25 +577,7 @@ class EventInstance(InstanceResource):
         super(EventInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'actor_sid': payload.get('actor_sid'),
-            'actor_type': payload.get('actor_type'),
-            'actor_url': payload.get('actor_url'),
-            'description': payload.get('description'),
-            'event_data': payload.get('event_data'),
-            'event_date': deserialize.iso8601_datetime(payload.get('event_date')),
-            'event_date_ms': deserialize.integer(payload.get('event_date_ms')),
-            'event_type': payload.get('event_type'),
-            'resource_sid': payload.get('resource_sid'),
-            'resource_type': payload.get('resource_type'),
-            'resource_url': payload.get('resource_url'),
-            'sid': payload.get('sid'),
-            'source': payload.get('source'),
-            'source_ip_address': payload.get('source_ip_address'),
-            'url': payload.get('url'),
-            'workspace_sid': payload.get('workspace_sid'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -515,6 +745,15 @@ class EventInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the EventInstance
+
+        :returns: The fetched EventInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.event.EventInstance
+        """
+        return await self._proxy.fetch_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
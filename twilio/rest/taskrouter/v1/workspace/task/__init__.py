@@ -6,6 +6,8 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import serialize
 from twilio.base import values
@@ -13,7 +15,6 @@ from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.taskrouter.v1.workspace.task.reservation import ReservationList
 
 
 class TaskList(ListResource):
@@ -32,13 +33,14 @@ class TaskList(ListResource):
 
         # Path Solution
         self._solution = {'workspace_sid': workspace_sid, }
-        self._uri = '/Workspaces/{workspace_sid}/Tasks'.format(**self._solution)
+        self._uri = values.ResourceUri('/Workspaces/{workspace_sid}/Tasks', self._solution)
 
     def stream(self, priority=values.unset, assignment_status=values.unset,
                workflow_sid=values.unset, workflow_name=values.unset,
                task_queue_sid=values.unset, task_queue_name=values.unset,
                evaluate_task_attributes=values.unset, ordering=values.unset,
-               has_addons=values.unset, limit=None, page_size=None):
+               has_addons=values.unset, limit=None, page_size=None,
+               prefetch=None, raw=False, deadline=None):
         """
         Streams TaskInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -60,13 +62,128 @@ class TaskList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.taskrouter.v1.workspace.task.TaskInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                priority=priority,
+                assignment_status=assignment_status,
+                workflow_sid=workflow_sid,
+                workflow_name=workflow_name,
+                task_queue_sid=task_queue_sid,
+                task_queue_name=task_queue_name,
+                evaluate_task_attributes=evaluate_task_attributes,
+                ordering=ordering,
+                has_addons=has_addons,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, priority=values.unset, assignment_status=values.unset,
+                           workflow_sid=values.unset, workflow_name=values.unset,
+                           task_queue_sid=values.unset, task_queue_name=values.unset,
+                           evaluate_task_attributes=values.unset, ordering=values.unset,
+                           has_addons=values.unset, limit=None, page_size=None,
+                           prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams TaskInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param unicode priority: The priority value of the Tasks to read
+        :param list[unicode] assignment_status: Returns the list of all Tasks in the Workspace with the specified assignment_status
+        :param unicode workflow_sid: The SID of the Workflow with the Tasks to read
+        :param unicode workflow_name: The friendly name of the Workflow with the Tasks to read
+        :param unicode task_queue_sid: The SID of the TaskQueue with the Tasks to read
+        :param unicode task_queue_name: The friendly_name of the TaskQueue with the Tasks to read
+        :param unicode evaluate_task_attributes: The task attributes of the Tasks to read
+        :param unicode ordering: Controls the order of the Tasks returned
+        :param bool has_addons: Whether to read Tasks with addons
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.taskrouter.v1.workspace.task.TaskInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                priority=priority,
+                assignment_status=assignment_status,
+                workflow_sid=workflow_sid,
+                workflow_name=workflow_name,
+                task_queue_sid=task_queue_sid,
+                task_queue_name=task_queue_name,
+                evaluate_task_attributes=evaluate_task_attributes,
+                ordering=ordering,
+                has_addons=has_addons,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, priority=values.unset, assignment_status=values.unset,
+             workflow_sid=values.unset, workflow_name=values.unset,
+             task_queue_sid=values.unset, task_queue_name=values.unset,
+             evaluate_task_attributes=values.unset, ordering=values.unset,
+             has_addons=values.unset, limit=None, page_size=None,
+             prefetch=None, raw=False, deadline=None):
+        """
+        Lists TaskInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param unicode priority: The priority value of the Tasks to read
+        :param list[unicode] assignment_status: Returns the list of all Tasks in the Workspace with the specified assignment_status
+        :param unicode workflow_sid: The SID of the Workflow with the Tasks to read
+        :param unicode workflow_name: The friendly name of the Workflow with the Tasks to read
+        :param unicode task_queue_sid: The SID of the TaskQueue with the Tasks to read
+        :param unicode task_queue_name: The friendly_name of the TaskQueue with the Tasks to read
+        :param unicode evaluate_task_attributes: The task attributes of the Tasks to read
+        :param unicode ordering: Controls the order of the Tasks returned
+        :param bool has_addons: Whether to read Tasks with addons
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.taskrouter.v1.workspace.task.TaskInstance]
+        """
+        return list(self.stream(
             priority=priority,
             assignment_status=assignment_status,
             workflow_sid=workflow_sid,
@@ -76,18 +193,21 @@ class TaskList(ListResource):
             evaluate_task_attributes=evaluate_task_attributes,
             ordering=ordering,
             has_addons=has_addons,
-            page_size=limits['page_size'],
-        )
-
-        return self._version.stream(page, limits['limit'])
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        ))
 
-    def list(self, priority=values.unset, assignment_status=values.unset,
-             workflow_sid=values.unset, workflow_name=values.unset,
-             task_queue_sid=values.unset, task_queue_name=values.unset,
-             evaluate_task_attributes=values.unset, ordering=values.unset,
-             has_addons=values.unset, limit=None, page_size=None):
+    async def list_async(self, priority=values.unset, assignment_status=values.unset,
+                         workflow_sid=values.unset, workflow_name=values.unset,
+                         task_queue_sid=values.unset, task_queue_name=values.unset,
+                         evaluate_task_attributes=values.unset, ordering=values.unset,
+                         has_addons=values.unset, limit=None, page_size=None,
+                         prefetch=None, raw=False, deadline=None):
         """
-        Lists TaskInstance records from the API as a list.
+        Asynchronously lists TaskInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
         memory before returning.
 
@@ -106,11 +226,17 @@ class TaskList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.taskrouter.v1.workspace.task.TaskInstance]
         """
-        return list(self.stream(
+        return [record async for record in await self.stream_async(
             priority=priority,
             assignment_status=assignment_status,
             workflow_sid=workflow_sid,
@@ -122,7 +248,10 @@ class TaskList(ListResource):
             has_addons=has_addons,
             limit=limit,
             page_size=page_size,
-        ))
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
 
     def page(self, priority=values.unset, assignment_status=values.unset,
              workflow_sid=values.unset, workflow_name=values.unset,
@@ -169,6 +298,51 @@ class TaskList(ListResource):
 
         return TaskPage(self._version, response, self._solution)
 
+    async def page_async(self, priority=values.unset, assignment_status=values.unset,
+                         workflow_sid=values.unset, workflow_name=values.unset,
+                         task_queue_sid=values.unset, task_queue_name=values.unset,
+                         evaluate_task_attributes=values.unset, ordering=values.unset,
+                         has_addons=values.unset, page_token=values.unset,
+                         page_number=values.unset, page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of TaskInstance records from the API.
+        Request is executed immediately
+
+        :param unicode priority: The priority value of the Tasks to read
+        :param list[unicode] assignment_status: Returns the list of all Tasks in the Workspace with the specified assignment_status
+        :param unicode workflow_sid: The SID of the Workflow with the Tasks to read
+        :param unicode workflow_name: The friendly name of the Workflow with the Tasks to read
+        :param unicode task_queue_sid: The SID of the TaskQueue with the Tasks to read
+        :param unicode task_queue_name: The friendly_name of the TaskQueue with the Tasks to read
+        :param unicode evaluate_task_attributes: The task attributes of the Tasks to read
+        :param unicode ordering: Controls the order of the Tasks returned
+        :param bool has_addons: Whether to read Tasks with addons
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of TaskInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.task.TaskPage
+        """
+        data = values.of({
+            'Priority': priority,
+            'AssignmentStatus': serialize.map(assignment_status, lambda e: e),
+            'WorkflowSid': workflow_sid,
+            'WorkflowName': workflow_name,
+            'TaskQueueSid': task_queue_sid,
+            'TaskQueueName': task_queue_name,
+            'EvaluateTaskAttributes': evaluate_task_attributes,
+            'Ordering': ordering,
+            'HasAddons': has_addons,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return TaskPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of TaskInstance records from the API.
@@ -186,9 +360,26 @@ class TaskList(ListResource):
 
         return TaskPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of TaskInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of TaskInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.task.TaskPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return TaskPage(self._version, response, self._solution)
+
     def create(self, timeout=values.unset, priority=values.unset,
                task_channel=values.unset, workflow_sid=values.unset,
-               attributes=values.unset):
+               attributes=values.unset, deadline=None):
         """
         Create the TaskInstance
 
@@ -197,6 +388,37 @@ class TaskList(ListResource):
         :param unicode task_channel: When MultiTasking is enabled specify the TaskChannel by passing either its unique_name or SID
         :param unicode workflow_sid: The SID of the Workflow that you would like to handle routing for the new Task
         :param unicode attributes: A URL-encoded JSON string describing the attributes of the task
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created TaskInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.task.TaskInstance
+        """
+        data = values.of({
+            'Timeout': timeout,
+            'Priority': priority,
+            'TaskChannel': task_channel,
+            'WorkflowSid': workflow_sid,
+            'Attributes': attributes,
+        })
+
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return TaskInstance(self._version, payload, workspace_sid=self._solution['workspace_sid'], )
+
+    async def create_async(self, timeout=values.unset, priority=values.unset,
+                           task_channel=values.unset, workflow_sid=values.unset,
+                           attributes=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the TaskInstance
+
+        :param unicode timeout: The amount of time in seconds the task can live before being assigned
+        :param unicode priority: The priority to assign the new task and override the default
+        :param unicode task_channel: When MultiTasking is enabled specify the TaskChannel by passing either its unique_name or SID
+        :param unicode workflow_sid: The SID of the Workflow that you would like to handle routing for the new Task
+        :param unicode attributes: A URL-encoded JSON string describing the attributes of the task
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created TaskInstance
         :rtype: twilio.rest.taskrouter.v1.workspace.task.TaskInstance
@@ -209,7 +431,7 @@ class TaskList(ListResource):
             'Attributes': attributes,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return TaskInstance(self._version, payload, workspace_sid=self._solution['workspace_sid'], )
 
@@ -301,7 +523,7 @@ class TaskContext(InstanceContext):
 
         # Path Solution
         self._solution = {'workspace_sid': workspace_sid, 'sid': sid, }
-        self._uri = '/Workspaces/{workspace_sid}/Tasks/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Workspaces/{workspace_sid}/Tasks/{sid}', self._solution)
 
         # Dependents
         self._reservations = None
@@ -322,6 +544,22 @@ class TaskContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the TaskInstance
+
+        :returns: The fetched TaskInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.task.TaskInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return TaskInstance(
+            self._version,
+            payload,
+            workspace_sid=self._solution['workspace_sid'],
+            sid=self._solution['sid'],
+        )
+
     def update(self, attributes=values.unset, assignment_status=values.unset,
                reason=values.unset, priority=values.unset,
                task_channel=values.unset, if_match=values.unset):
@@ -356,6 +594,40 @@ class TaskContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, attributes=values.unset, assignment_status=values.unset,
+                           reason=values.unset, priority=values.unset,
+                           task_channel=values.unset, if_match=values.unset):
+        """
+        Asynchronous coroutine that updates the TaskInstance
+
+        :param unicode attributes: The JSON string that describes the custom attributes of the task
+        :param TaskInstance.Status assignment_status: The new status of the task
+        :param unicode reason: The reason that the Task was canceled or complete
+        :param unicode priority: The Task's new priority value
+        :param unicode task_channel: When MultiTasking is enabled, specify the TaskChannel with the task to update
+        :param unicode if_match: The If-Match HTTP request header
+
+        :returns: The updated TaskInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.task.TaskInstance
+        """
+        data = values.of({
+            'Attributes': attributes,
+            'AssignmentStatus': assignment_status,
+            'Reason': reason,
+            'Priority': priority,
+            'TaskChannel': task_channel,
+        })
+        headers = values.of({'If-Match': if_match, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, headers=headers, )
+
+        return TaskInstance(
+            self._version,
+            payload,
+            workspace_sid=self._solution['workspace_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self, if_match=values.unset):
         """
         Deletes the TaskInstance
@@ -369,6 +641,19 @@ class TaskContext(InstanceContext):
 
         return self._version.delete(method='DELETE', uri=self._uri, headers=headers, )
 
+    async def delete_async(self, if_match=values.unset):
+        """
+        Asynchronous coroutine that deletes the TaskInstance
+
+        :param unicode if_match: The If-Match HTTP request header
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        headers = values.of({'If-Match': if_match, })
+
+        return await self._version.delete_async(method='DELETE', uri=self._uri, headers=headers, )
+
     @property
     def reservations(self):
         """
@@ -378,6 +663,7 @@ class TaskContext(InstanceContext):
         :rtype: twilio.rest.taskrouter.v1.workspace.task.reservation.ReservationList
         """
         if self._reservations is None:
+            from twilio.rest.taskrouter.v1.workspace.task.reservation import ReservationList
             self._reservations = ReservationList(
                 self._version,
                 workspace_sid=self._solution['workspace_sid'],
@@ -406,6 +692,43 @@ class TaskInstance(InstanceResource):
         COMPLETED = "completed"
         WRAPPING = "wrapping"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'age': deserialize.integer,
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+        'task_queue_entered_date': deserialize.iso8601_datetime,
+        'priority': deserialize.integer,
+        'timeout': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'age': 'age',
+        'assignment_status': 'assignment_status',
+        'attributes': 'attributes',
+        'addons': 'addons',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'task_queue_entered_date': 'task_queue_entered_date',
+        'priority': 'priority',
+        'reason': 'reason',
+        'sid': 'sid',
+        'task_queue_sid': 'task_queue_sid',
+        'task_queue_friendly_name': 'task_queue_friendly_name',
+        'task_channel_sid': 'task_channel_sid',
+        'task_channel_unique_name': 'task_channel_unique_name',
+        'timeout': 'timeout',
+        'workflow_sid': 'workflow_sid',
+        'workflow_friendly_name': 'workflow_friendly_name',
+        'workspace_sid': 'workspace_sid',
+        'url': 'url',
+        'links': 'links',
+    }, _deserializers)
+
     def __init__(self, version, payload, workspace_sid, sid=None):
         """
         Initialize the TaskInstance
@@ -416,29 +739,7 @@ class TaskInstance(InstanceResource):
         super(TaskInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'age': deserialize.integer(payload.get('age')),
-            'assignment_status': payload.get('assignment_status'),
-            'attributes': payload.get('attributes'),
-            'addons': payload.get('addons'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'task_queue_entered_date': deserialize.iso8601_datetime(payload.get('task_queue_entered_date')),
-            'priority': deserialize.integer(payload.get('priority')),
-            'reason': payload.get('reason'),
-            'sid': payload.get('sid'),
-            'task_queue_sid': payload.get('task_queue_sid'),
-            'task_queue_friendly_name': payload.get('task_queue_friendly_name'),
-            'task_channel_sid': payload.get('task_channel_sid'),
-            'task_channel_unique_name': payload.get('task_channel_unique_name'),
-            'timeout': deserialize.integer(payload.get('timeout')),
-            'workflow_sid': payload.get('workflow_sid'),
-            'workflow_friendly_name': payload.get('workflow_friendly_name'),
-            'workspace_sid': payload.get('workspace_sid'),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -638,6 +939,15 @@ class TaskInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the TaskInstance
+
+        :returns: The fetched TaskInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.task.TaskInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, attributes=values.unset, assignment_status=values.unset,
                reason=values.unset, priority=values.unset,
                task_channel=values.unset, if_match=values.unset):
@@ -663,6 +973,31 @@ class TaskInstance(InstanceResource):
             if_match=if_match,
         )
 
+    async def update_async(self, attributes=values.unset, assignment_status=values.unset,
+                           reason=values.unset, priority=values.unset,
+                           task_channel=values.unset, if_match=values.unset):
+        """
+        Asynchronous coroutine that updates the TaskInstance
+
+        :param unicode attributes: The JSON string that describes the custom attributes of the task
+        :param TaskInstance.Status assignment_status: The new status of the task
+        :param unicode reason: The reason that the Task was canceled or complete
+        :param unicode priority: The Task's new priority value
+        :param unicode task_channel: When MultiTasking is enabled, specify the TaskChannel with the task to update
+        :param unicode if_match: The If-Match HTTP request header
+
+        :returns: The updated TaskInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.task.TaskInstance
+        """
+        return await self._proxy.update_async(
+            attributes=attributes,
+            assignment_status=assignment_status,
+            reason=reason,
+            priority=priority,
+            task_channel=task_channel,
+            if_match=if_match,
+        )
+
     def delete(self, if_match=values.unset):
         """
         Deletes the TaskInstance
@@ -674,6 +1009,17 @@ class TaskInstance(InstanceResource):
         """
         return self._proxy.delete(if_match=if_match, )
 
+    async def delete_async(self, if_match=values.unset):
+        """
+        Asynchronous coroutine that deletes the TaskInstance
+
+        :param unicode if_match: The If-Match HTTP request header
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async(if_match=if_match, )
+
     @property
     def reservations(self):
         """
@@ -693,3 +1039,19 @@ class TaskInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Taskrouter.V1.TaskInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'ReservationList': 'twilio.rest.taskrouter.v1.workspace.task.reservation',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -6,16 +6,14 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.taskrouter.v1.workspace.task_queue.task_queue_cumulative_statistics import TaskQueueCumulativeStatisticsList
-from twilio.rest.taskrouter.v1.workspace.task_queue.task_queue_real_time_statistics import TaskQueueRealTimeStatisticsList
-from twilio.rest.taskrouter.v1.workspace.task_queue.task_queue_statistics import TaskQueueStatisticsList
-from twilio.rest.taskrouter.v1.workspace.task_queue.task_queues_statistics import TaskQueuesStatisticsList
 
 
 class TaskQueueList(ListResource):
@@ -34,14 +32,14 @@ class TaskQueueList(ListResource):
 
         # Path Solution
         self._solution = {'workspace_sid': workspace_sid, }
-        self._uri = '/Workspaces/{workspace_sid}/TaskQueues'.format(**self._solution)
+        self._uri = values.ResourceUri('/Workspaces/{workspace_sid}/TaskQueues', self._solution)
 
         # Components
         self._statistics = None
 
     def stream(self, friendly_name=values.unset,
                evaluate_worker_attributes=values.unset, worker_sid=values.unset,
-               limit=None, page_size=None):
+               limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams TaskQueueInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -57,24 +55,74 @@ class TaskQueueList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.taskrouter.v1.workspace.task_queue.TaskQueueInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
-            friendly_name=friendly_name,
-            evaluate_worker_attributes=evaluate_worker_attributes,
-            worker_sid=worker_sid,
-            page_size=limits['page_size'],
-        )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                friendly_name=friendly_name,
+                evaluate_worker_attributes=evaluate_worker_attributes,
+                worker_sid=worker_sid,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, friendly_name=values.unset,
+                           evaluate_worker_attributes=values.unset, worker_sid=values.unset,
+                           limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams TaskQueueInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param unicode friendly_name: The friendly_name of the TaskQueue resources to read
+        :param unicode evaluate_worker_attributes: The attributes of the Workers to read
+        :param unicode worker_sid: The SID of the Worker with the TaskQueue resources to read
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.taskrouter.v1.workspace.task_queue.TaskQueueInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                friendly_name=friendly_name,
+                evaluate_worker_attributes=evaluate_worker_attributes,
+                worker_sid=worker_sid,
+                page_size=limits['page_size'],
+            )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, friendly_name=values.unset,
              evaluate_worker_attributes=values.unset, worker_sid=values.unset,
-             limit=None, page_size=None):
+             limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists TaskQueueInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -89,6 +137,12 @@ class TaskQueueList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.taskrouter.v1.workspace.task_queue.TaskQueueInstance]
@@ -99,8 +153,49 @@ class TaskQueueList(ListResource):
             worker_sid=worker_sid,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, friendly_name=values.unset,
+                         evaluate_worker_attributes=values.unset, worker_sid=values.unset,
+                         limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists TaskQueueInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param unicode friendly_name: The friendly_name of the TaskQueue resources to read
+        :param unicode evaluate_worker_attributes: The attributes of the Workers to read
+        :param unicode worker_sid: The SID of the Worker with the TaskQueue resources to read
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.taskrouter.v1.workspace.task_queue.TaskQueueInstance]
+        """
+        return [record async for record in await self.stream_async(
+            friendly_name=friendly_name,
+            evaluate_worker_attributes=evaluate_worker_attributes,
+            worker_sid=worker_sid,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, friendly_name=values.unset,
              evaluate_worker_attributes=values.unset, worker_sid=values.unset,
              page_token=values.unset, page_number=values.unset,
@@ -132,6 +227,37 @@ class TaskQueueList(ListResource):
 
         return TaskQueuePage(self._version, response, self._solution)
 
+    async def page_async(self, friendly_name=values.unset,
+                         evaluate_worker_attributes=values.unset, worker_sid=values.unset,
+                         page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of TaskQueueInstance records from the API.
+        Request is executed immediately
+
+        :param unicode friendly_name: The friendly_name of the TaskQueue resources to read
+        :param unicode evaluate_worker_attributes: The attributes of the Workers to read
+        :param unicode worker_sid: The SID of the Worker with the TaskQueue resources to read
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of TaskQueueInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.task_queue.TaskQueuePage
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'EvaluateWorkerAttributes': evaluate_worker_attributes,
+            'WorkerSid': worker_sid,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return TaskQueuePage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of TaskQueueInstance records from the API.
@@ -149,10 +275,27 @@ class TaskQueueList(ListResource):
 
         return TaskQueuePage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of TaskQueueInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of TaskQueueInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.task_queue.TaskQueuePage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return TaskQueuePage(self._version, response, self._solution)
+
     def create(self, friendly_name, target_workers=values.unset,
                max_reserved_workers=values.unset, task_order=values.unset,
                reservation_activity_sid=values.unset,
-               assignment_activity_sid=values.unset):
+               assignment_activity_sid=values.unset, deadline=None):
         """
         Create the TaskQueueInstance
 
@@ -162,6 +305,8 @@ class TaskQueueList(ListResource):
         :param TaskQueueInstance.TaskOrder task_order: How Tasks will be assigned to Workers
         :param unicode reservation_activity_sid: The SID of the Activity to assign Workers when a task is reserved for them
         :param unicode assignment_activity_sid: The SID of the Activity to assign Workers once a task is assigned to them
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created TaskQueueInstance
         :rtype: twilio.rest.taskrouter.v1.workspace.task_queue.TaskQueueInstance
@@ -175,7 +320,39 @@ class TaskQueueList(ListResource):
             'AssignmentActivitySid': assignment_activity_sid,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return TaskQueueInstance(self._version, payload, workspace_sid=self._solution['workspace_sid'], )
+
+    async def create_async(self, friendly_name, target_workers=values.unset,
+                           max_reserved_workers=values.unset, task_order=values.unset,
+                           reservation_activity_sid=values.unset,
+                           assignment_activity_sid=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the TaskQueueInstance
+
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode target_workers: A string describing the Worker selection criteria for any Tasks that enter the TaskQueue
+        :param unicode max_reserved_workers: The maximum number of Workers to reserve
+        :param TaskQueueInstance.TaskOrder task_order: How Tasks will be assigned to Workers
+        :param unicode reservation_activity_sid: The SID of the Activity to assign Workers when a task is reserved for them
+        :param unicode assignment_activity_sid: The SID of the Activity to assign Workers once a task is assigned to them
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created TaskQueueInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.task_queue.TaskQueueInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'TargetWorkers': target_workers,
+            'MaxReservedWorkers': max_reserved_workers,
+            'TaskOrder': task_order,
+            'ReservationActivitySid': reservation_activity_sid,
+            'AssignmentActivitySid': assignment_activity_sid,
+        })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return TaskQueueInstance(self._version, payload, workspace_sid=self._solution['workspace_sid'], )
 
@@ -188,6 +365,7 @@ class TaskQueueList(ListResource):
         :rtype: twilio.rest.taskrouter.v1.workspace.task_queue.task_queues_statistics.TaskQueuesStatisticsList
         """
         if self._statistics is None:
+            from twilio.rest.taskrouter.v1.workspace.task_queue.task_queues_statistics import TaskQueuesStatisticsList
             self._statistics = TaskQueuesStatisticsList(
                 self._version,
                 workspace_sid=self._solution['workspace_sid'],
@@ -282,7 +460,7 @@ class TaskQueueContext(InstanceContext):
 
         # Path Solution
         self._solution = {'workspace_sid': workspace_sid, 'sid': sid, }
-        self._uri = '/Workspaces/{workspace_sid}/TaskQueues/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Workspaces/{workspace_sid}/TaskQueues/{sid}', self._solution)
 
         # Dependents
         self._statistics = None
@@ -305,6 +483,22 @@ class TaskQueueContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the TaskQueueInstance
+
+        :returns: The fetched TaskQueueInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.task_queue.TaskQueueInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return TaskQueueInstance(
+            self._version,
+            payload,
+            workspace_sid=self._solution['workspace_sid'],
+            sid=self._solution['sid'],
+        )
+
     def update(self, friendly_name=values.unset, target_workers=values.unset,
                reservation_activity_sid=values.unset,
                assignment_activity_sid=values.unset,
@@ -340,6 +534,41 @@ class TaskQueueContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, friendly_name=values.unset, target_workers=values.unset,
+                           reservation_activity_sid=values.unset,
+                           assignment_activity_sid=values.unset,
+                           max_reserved_workers=values.unset, task_order=values.unset):
+        """
+        Asynchronous coroutine that updates the TaskQueueInstance
+
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode target_workers: A string describing the Worker selection criteria for any Tasks that enter the TaskQueue
+        :param unicode reservation_activity_sid: The SID of the Activity to assign Workers when a task is reserved for them
+        :param unicode assignment_activity_sid: The SID of the Activity to assign Workers when a task is assigned for them
+        :param unicode max_reserved_workers: The maximum number of Workers to create reservations for the assignment of a task while in the queue
+        :param TaskQueueInstance.TaskOrder task_order: How Tasks will be assigned to Workers
+
+        :returns: The updated TaskQueueInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.task_queue.TaskQueueInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'TargetWorkers': target_workers,
+            'ReservationActivitySid': reservation_activity_sid,
+            'AssignmentActivitySid': assignment_activity_sid,
+            'MaxReservedWorkers': max_reserved_workers,
+            'TaskOrder': task_order,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return TaskQueueInstance(
+            self._version,
+            payload,
+            workspace_sid=self._solution['workspace_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self):
         """
         Deletes the TaskQueueInstance
@@ -349,6 +578,15 @@ class TaskQueueContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the TaskQueueInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     @property
     def statistics(self):
         """
@@ -358,6 +596,7 @@ class TaskQueueContext(InstanceContext):
         :rtype: twilio.rest.taskrouter.v1.workspace.task_queue.task_queue_statistics.TaskQueueStatisticsList
         """
         if self._statistics is None:
+            from twilio.rest.taskrouter.v1.workspace.task_queue.task_queue_statistics import TaskQueueStatisticsList
             self._statistics = TaskQueueStatisticsList(
                 self._version,
                 workspace_sid=self._solution['workspace_sid'],
@@ -374,6 +613,7 @@ class TaskQueueContext(InstanceContext):
         :rtype: twilio.rest.taskrouter.v1.workspace.task_queue.task_queue_real_time_statistics.TaskQueueRealTimeStatisticsList
         """
         if self._real_time_statistics is None:
+            from twilio.rest.taskrouter.v1.workspace.task_queue.task_queue_real_time_statistics import TaskQueueRealTimeStatisticsList
             self._real_time_statistics = TaskQueueRealTimeStatisticsList(
                 self._version,
                 workspace_sid=self._solution['workspace_sid'],
@@ -390,6 +630,7 @@ class TaskQueueContext(InstanceContext):
         :rtype: twilio.rest.taskrouter.v1.workspace.task_queue.task_queue_cumulative_statistics.TaskQueueCumulativeStatisticsList
         """
         if self._cumulative_statistics is None:
+            from twilio.rest.taskrouter.v1.workspace.task_queue.task_queue_cumulative_statistics import TaskQueueCumulativeStatisticsList
             self._cumulative_statistics = TaskQueueCumulativeStatisticsList(
                 self._version,
                 workspace_sid=self._solution['workspace_sid'],
@@ -414,6 +655,34 @@ class TaskQueueInstance(InstanceResource):
         FIFO = "FIFO"
         LIFO = "LIFO"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+        'max_reserved_workers': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'assignment_activity_sid': 'assignment_activity_sid',
+        'assignment_activity_name': 'assignment_activity_name',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'friendly_name': 'friendly_name',
+        'max_reserved_workers': 'max_reserved_workers',
+        'reservation_activity_sid': 'reservation_activity_sid',
+        'reservation_activity_name': 'reservation_activity_name',
+        'sid': 'sid',
+        'target_workers': 'target_workers',
+        'task_order': 'task_order',
+        'url': 'url',
+        'workspace_sid': 'workspace_sid',
+        'links': 'links',
+    }, _deserializers)
+
     def __init__(self, version, payload, workspace_sid, sid=None):
         """
         Initialize the TaskQueueInstance
@@ -424,23 +693,7 @@ class TaskQueueInstance(InstanceResource):
         super(TaskQueueInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'assignment_activity_sid': payload.get('assignment_activity_sid'),
-            'assignment_activity_name': payload.get('assignment_activity_name'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'friendly_name': payload.get('friendly_name'),
-            'max_reserved_workers': deserialize.integer(payload.get('max_reserved_workers')),
-            'reservation_activity_sid': payload.get('reservation_activity_sid'),
-            'reservation_activity_name': payload.get('reservation_activity_name'),
-            'sid': payload.get('sid'),
-            'target_workers': payload.get('target_workers'),
-            'task_order': payload.get('task_order'),
-            'url': payload.get('url'),
-            'workspace_sid': payload.get('workspace_sid'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -592,6 +845,15 @@ class TaskQueueInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the TaskQueueInstance
+
+        :returns: The fetched TaskQueueInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.task_queue.TaskQueueInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, friendly_name=values.unset, target_workers=values.unset,
                reservation_activity_sid=values.unset,
                assignment_activity_sid=values.unset,
@@ -618,6 +880,32 @@ class TaskQueueInstance(InstanceResource):
             task_order=task_order,
         )
 
+    async def update_async(self, friendly_name=values.unset, target_workers=values.unset,
+                           reservation_activity_sid=values.unset,
+                           assignment_activity_sid=values.unset,
+                           max_reserved_workers=values.unset, task_order=values.unset):
+        """
+        Asynchronous coroutine that updates the TaskQueueInstance
+
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode target_workers: A string describing the Worker selection criteria for any Tasks that enter the TaskQueue
+        :param unicode reservation_activity_sid: The SID of the Activity to assign Workers when a task is reserved for them
+        :param unicode assignment_activity_sid: The SID of the Activity to assign Workers when a task is assigned for them
+        :param unicode max_reserved_workers: The maximum number of Workers to create reservations for the assignment of a task while in the queue
+        :param TaskQueueInstance.TaskOrder task_order: How Tasks will be assigned to Workers
+
+        :returns: The updated TaskQueueInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.task_queue.TaskQueueInstance
+        """
+        return await self._proxy.update_async(
+            friendly_name=friendly_name,
+            target_workers=target_workers,
+            reservation_activity_sid=reservation_activity_sid,
+            assignment_activity_sid=assignment_activity_sid,
+            max_reserved_workers=max_reserved_workers,
+            task_order=task_order,
+        )
+
     def delete(self):
         """
         Deletes the TaskQueueInstance
@@ -627,6 +915,15 @@ class TaskQueueInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the TaskQueueInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     @property
     def statistics(self):
         """
@@ -666,3 +963,22 @@ class TaskQueueInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Taskrouter.V1.TaskQueueInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'TaskQueueCumulativeStatisticsList': 'twilio.rest.taskrouter.v1.workspace.task_queue.task_queue_cumulative_statistics',
+    'TaskQueueRealTimeStatisticsList': 'twilio.rest.taskrouter.v1.workspace.task_queue.task_queue_real_time_statistics',
+    'TaskQueueStatisticsList': 'twilio.rest.taskrouter.v1.workspace.task_queue.task_queue_statistics',
+    'TaskQueuesStatisticsList': 'twilio.rest.taskrouter.v1.workspace.task_queue.task_queues_statistics',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -131,7 +131,7 @@ class TaskQueueCumulativeStatisticsContext(InstanceContext):
 
         # Path Solution
         self._solution = {'workspace_sid': workspace_sid, 'task_queue_sid': task_queue_sid, }
-        self._uri = '/Workspaces/{workspace_sid}/TaskQueues/{task_queue_sid}/CumulativeStatistics'.format(**self._solution)
+        self._uri = values.ResourceUri('/Workspaces/{workspace_sid}/TaskQueues/{task_queue_sid}/CumulativeStatistics', self._solution)
 
     def fetch(self, end_date=values.unset, minutes=values.unset,
               start_date=values.unset, task_channel=values.unset,
@@ -165,6 +165,38 @@ class TaskQueueCumulativeStatisticsContext(InstanceContext):
             task_queue_sid=self._solution['task_queue_sid'],
         )
 
+    async def fetch_async(self, end_date=values.unset, minutes=values.unset,
+                          start_date=values.unset, task_channel=values.unset,
+                          split_by_wait_time=values.unset):
+        """
+        Asynchronous coroutine that fetches the TaskQueueCumulativeStatisticsInstance
+
+        :param datetime end_date: Only calculate statistics from on or before this date
+        :param unicode minutes: Only calculate statistics since this many minutes in the past
+        :param datetime start_date: Only calculate statistics from on or after this date
+        :param unicode task_channel: Only calculate cumulative statistics on this TaskChannel
+        :param unicode split_by_wait_time: A comma separated list of values that describes the thresholds, in seconds, to calculate statistics on
+
+        :returns: The fetched TaskQueueCumulativeStatisticsInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.task_queue.task_queue_cumulative_statistics.TaskQueueCumulativeStatisticsInstance
+        """
+        data = values.of({
+            'EndDate': serialize.iso8601_datetime(end_date),
+            'Minutes': minutes,
+            'StartDate': serialize.iso8601_datetime(start_date),
+            'TaskChannel': task_channel,
+            'SplitByWaitTime': split_by_wait_time,
+        })
+
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, params=data, )
+
+        return TaskQueueCumulativeStatisticsInstance(
+            self._version,
+            payload,
+            workspace_sid=self._solution['workspace_sid'],
+            task_queue_sid=self._solution['task_queue_sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -178,6 +210,52 @@ class TaskQueueCumulativeStatisticsContext(InstanceContext):
 
 class TaskQueueCumulativeStatisticsInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'avg_task_acceptance_time': deserialize.integer,
+        'start_time': deserialize.iso8601_datetime,
+        'end_time': deserialize.iso8601_datetime,
+        'reservations_created': deserialize.integer,
+        'reservations_accepted': deserialize.integer,
+        'reservations_rejected': deserialize.integer,
+        'reservations_timed_out': deserialize.integer,
+        'reservations_canceled': deserialize.integer,
+        'reservations_rescinded': deserialize.integer,
+        'tasks_canceled': deserialize.integer,
+        'tasks_completed': deserialize.integer,
+        'tasks_deleted': deserialize.integer,
+        'tasks_entered': deserialize.integer,
+        'tasks_moved': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'avg_task_acceptance_time': 'avg_task_acceptance_time',
+        'start_time': 'start_time',
+        'end_time': 'end_time',
+        'reservations_created': 'reservations_created',
+        'reservations_accepted': 'reservations_accepted',
+        'reservations_rejected': 'reservations_rejected',
+        'reservations_timed_out': 'reservations_timed_out',
+        'reservations_canceled': 'reservations_canceled',
+        'reservations_rescinded': 'reservations_rescinded',
+        'split_by_wait_time': 'split_by_wait_time',
+        'task_queue_sid': 'task_queue_sid',
+        'wait_duration_until_accepted': 'wait_duration_until_accepted',
+        'wait_duration_until_canceled': 'wait_duration_until_canceled',
+        'wait_duration_in_queue_until_accepted': 'wait_duration_in_queue_until_accepted',
+        'tasks_canceled': 'tasks_canceled',
+        'tasks_completed': 'tasks_completed',
+        'tasks_deleted': 'tasks_deleted',
+        'tasks_entered': 'tasks_entered',
+        'tasks_moved': 'tasks_moved',
+        'workspace_sid': 'workspace_sid',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload, workspace_sid, task_queue_sid):
         """
         Initialize the TaskQueueCumulativeStatisticsInstance
@@ -188,30 +266,7 @@ class TaskQueueCumulativeStatisticsInstance(InstanceResource):
         super(TaskQueueCumulativeStatisticsInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'avg_task_acceptance_time': deserialize.integer(payload.get('avg_task_acceptance_time')),
-            'start_time': deserialize.iso8601_datetime(payload.get('start_time')),
-            'end_time': deserialize.iso8601_datetime(payload.get('end_time')),
-            'reservations_created': deserialize.integer(payload.get('reservations_created')),
-            'reservations_accepted': deserialize.integer(payload.get('reservations_accepted')),
-            'reservations_rejected': deserialize.integer(payload.get('reservations_rejected')),
-            'reservations_timed_out': deserialize.integer(payload.get('reservations_timed_out')),
-            'reservations_canceled': deserialize.integer(payload.get('reservations_canceled')),
-            'reservations_rescinded': deserialize.integer(payload.get('reservations_rescinded')),
-            'split_by_wait_time': payload.get('split_by_wait_time'),
-            'task_queue_sid': payload.get('task_queue_sid'),
-            'wait_duration_until_accepted': payload.get('wait_duration_until_accepted'),
-            'wait_duration_until_canceled': payload.get('wait_duration_until_canceled'),
-            'wait_duration_in_queue_until_accepted': payload.get('wait_duration_in_queue_until_accepted'),
-            'tasks_canceled': deserialize.integer(payload.get('tasks_canceled')),
-            'tasks_completed': deserialize.integer(payload.get('tasks_completed')),
-            'tasks_deleted': deserialize.integer(payload.get('tasks_deleted')),
-            'tasks_entered': deserialize.integer(payload.get('tasks_entered')),
-            'tasks_moved': deserialize.integer(payload.get('tasks_moved')),
-            'workspace_sid': payload.get('workspace_sid'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -433,6 +488,29 @@ class TaskQueueCumulativeStatisticsInstance(InstanceResource):
             split_by_wait_time=split_by_wait_time,
         )
 
+    async def fetch_async(self, end_date=values.unset, minutes=values.unset,
+                          start_date=values.unset, task_channel=values.unset,
+                          split_by_wait_time=values.unset):
+        """
+        Asynchronous coroutine that fetches the TaskQueueCumulativeStatisticsInstance
+
+        :param datetime end_date: Only calculate statistics from on or before this date
+        :param unicode minutes: Only calculate statistics since this many minutes in the past
+        :param datetime start_date: Only calculate statistics from on or after this date
+        :param unicode task_channel: Only calculate cumulative statistics on this TaskChannel
+        :param unicode split_by_wait_time: A comma separated list of values that describes the thresholds, in seconds, to calculate statistics on
+
+        :returns: The fetched TaskQueueCumulativeStatisticsInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.task_queue.task_queue_cumulative_statistics.TaskQueueCumulativeStatisticsInstance
+        """
+        return await self._proxy.fetch_async(
+            end_date=end_date,
+            minutes=minutes,
+            start_date=start_date,
+            task_channel=task_channel,
+            split_by_wait_time=split_by_wait_time,
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -130,7 +130,7 @@ class TaskQueueRealTimeStatisticsContext(InstanceContext):
 
         # Path Solution
         self._solution = {'workspace_sid': workspace_sid, 'task_queue_sid': task_queue_sid, }
-        self._uri = '/Workspaces/{workspace_sid}/TaskQueues/{task_queue_sid}/RealTimeStatistics'.format(**self._solution)
+        self._uri = values.ResourceUri('/Workspaces/{workspace_sid}/TaskQueues/{task_queue_sid}/RealTimeStatistics', self._solution)
 
     def fetch(self, task_channel=values.unset):
         """
@@ -152,6 +152,26 @@ class TaskQueueRealTimeStatisticsContext(InstanceContext):
             task_queue_sid=self._solution['task_queue_sid'],
         )
 
+    async def fetch_async(self, task_channel=values.unset):
+        """
+        Asynchronous coroutine that fetches the TaskQueueRealTimeStatisticsInstance
+
+        :param unicode task_channel: The TaskChannel for which to fetch statistics
+
+        :returns: The fetched TaskQueueRealTimeStatisticsInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.task_queue.task_queue_real_time_statistics.TaskQueueRealTimeStatisticsInstance
+        """
+        data = values.of({'TaskChannel': task_channel, })
+
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, params=data, )
+
+        return TaskQueueRealTimeStatisticsInstance(
+            self._version,
+            payload,
+            workspace_sid=self._solution['workspace_sid'],
+            task_queue_sid=self._solution['task_queue_sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -165,6 +185,35 @@ class TaskQueueRealTimeStatisticsContext(InstanceContext):
 
 class TaskQueueRealTimeStatisticsInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'longest_task_waiting_age': deserialize.integer,
+        'longest_relative_task_age_in_queue': deserialize.integer,
+        'total_available_workers': deserialize.integer,
+        'total_eligible_workers': deserialize.integer,
+        'total_tasks': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'activity_statistics': 'activity_statistics',
+        'longest_task_waiting_age': 'longest_task_waiting_age',
+        'longest_task_waiting_sid': 'longest_task_waiting_sid',
+        'longest_relative_task_age_in_queue': 'longest_relative_task_age_in_queue',
+        'longest_relative_task_sid_in_queue': 'longest_relative_task_sid_in_queue',
+        'task_queue_sid': 'task_queue_sid',
+        'tasks_by_priority': 'tasks_by_priority',
+        'tasks_by_status': 'tasks_by_status',
+        'total_available_workers': 'total_available_workers',
+        'total_eligible_workers': 'total_eligible_workers',
+        'total_tasks': 'total_tasks',
+        'workspace_sid': 'workspace_sid',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload, workspace_sid, task_queue_sid):
         """
         Initialize the TaskQueueRealTimeStatisticsInstance
@@ -175,22 +224,7 @@ class TaskQueueRealTimeStatisticsInstance(InstanceResource):
         super(TaskQueueRealTimeStatisticsInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'activity_statistics': payload.get('activity_statistics'),
-            'longest_task_waiting_age': deserialize.integer(payload.get('longest_task_waiting_age')),
-            'longest_task_waiting_sid': payload.get('longest_task_waiting_sid'),
-            'longest_relative_task_age_in_queue': deserialize.integer(payload.get('longest_relative_task_age_in_queue')),
-            'longest_relative_task_sid_in_queue': payload.get('longest_relative_task_sid_in_queue'),
-            'task_queue_sid': payload.get('task_queue_sid'),
-            'tasks_by_priority': payload.get('tasks_by_priority'),
-            'tasks_by_status': payload.get('tasks_by_status'),
-            'total_available_workers': deserialize.integer(payload.get('total_available_workers')),
-            'total_eligible_workers': deserialize.integer(payload.get('total_eligible_workers')),
-            'total_tasks': deserialize.integer(payload.get('total_tasks')),
-            'workspace_sid': payload.get('workspace_sid'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -336,6 +370,17 @@ class TaskQueueRealTimeStatisticsInstance(InstanceResource):
         """
         return self._proxy.fetch(task_channel=task_channel, )
 
+    async def fetch_async(self, task_channel=values.unset):
+        """
+        Asynchronous coroutine that fetches the TaskQueueRealTimeStatisticsInstance
+
+        :param unicode task_channel: The TaskChannel for which to fetch statistics
+
+        :returns: The fetched TaskQueueRealTimeStatisticsInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.task_queue.task_queue_real_time_statistics.TaskQueueRealTimeStatisticsInstance
+        """
+        return await self._proxy.fetch_async(task_channel=task_channel, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -7,6 +7,7 @@ This code was generated by
 """
 
 from twilio.base import serialize
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
@@ -130,7 +131,7 @@ class TaskQueueStatisticsContext(InstanceContext):
 
         # Path Solution
         self._solution = {'workspace_sid': workspace_sid, 'task_queue_sid': task_queue_sid, }
-        self._uri = '/Workspaces/{workspace_sid}/TaskQueues/{task_queue_sid}/Statistics'.format(**self._solution)
+        self._uri = values.ResourceUri('/Workspaces/{workspace_sid}/TaskQueues/{task_queue_sid}/Statistics', self._solution)
 
     def fetch(self, end_date=values.unset, minutes=values.unset,
               start_date=values.unset, task_channel=values.unset,
@@ -164,6 +165,38 @@ class TaskQueueStatisticsContext(InstanceContext):
             task_queue_sid=self._solution['task_queue_sid'],
         )
 
+    async def fetch_async(self, end_date=values.unset, minutes=values.unset,
+                          start_date=values.unset, task_channel=values.unset,
+                          split_by_wait_time=values.unset):
+        """
+        Asynchronous coroutine that fetches the TaskQueueStatisticsInstance
+
+        :param datetime end_date: Only calculate statistics from on or before this date
+        :param unicode minutes: Only calculate statistics since this many minutes in the past
+        :param datetime start_date: Only calculate statistics from on or after this date
+        :param unicode task_channel: Only calculate real-time and cumulative statistics for the specified TaskChannel
+        :param unicode split_by_wait_time: A comma separated list of values that describes the thresholds to calculate statistics on
+
+        :returns: The fetched TaskQueueStatisticsInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.task_queue.task_queue_statistics.TaskQueueStatisticsInstance
+        """
+        data = values.of({
+            'EndDate': serialize.iso8601_datetime(end_date),
+            'Minutes': minutes,
+            'StartDate': serialize.iso8601_datetime(start_date),
+            'TaskChannel': task_channel,
+            'SplitByWaitTime': split_by_wait_time,
+        })
+
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, params=data, )
+
+        return TaskQueueStatisticsInstance(
+            self._version,
+            payload,
+            workspace_sid=self._solution['workspace_sid'],
+            task_queue_sid=self._solution['task_queue_sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -177,6 +210,18 @@ class TaskQueueStatisticsContext(InstanceContext):
 
 class TaskQueueStatisticsInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'cumulative': 'cumulative',
+        'realtime': 'realtime',
+        'task_queue_sid': 'task_queue_sid',
+        'workspace_sid': 'workspace_sid',
+        'url': 'url',
+    })
+
     def __init__(self, version, payload, workspace_sid, task_queue_sid):
         """
         Initialize the TaskQueueStatisticsInstance
@@ -187,14 +232,7 @@ class TaskQueueStatisticsInstance(InstanceResource):
         super(TaskQueueStatisticsInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'cumulative': payload.get('cumulative'),
-            'realtime': payload.get('realtime'),
-            'task_queue_sid': payload.get('task_queue_sid'),
-            'workspace_sid': payload.get('workspace_sid'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -288,6 +326,29 @@ class TaskQueueStatisticsInstance(InstanceResource):
             split_by_wait_time=split_by_wait_time,
         )
 
+    async def fetch_async(self, end_date=values.unset, minutes=values.unset,
+                          start_date=values.unset, task_channel=values.unset,
+                          split_by_wait_time=values.unset):
+        """
+        Asynchronous coroutine that fetches the TaskQueueStatisticsInstance
+
+        :param datetime end_date: Only calculate statistics from on or before this date
+        :param unicode minutes: Only calculate statistics since this many minutes in the past
+        :param datetime start_date: Only calculate statistics from on or after this date
+        :param unicode task_channel: Only calculate real-time and cumulative statistics for the specified TaskChannel
+        :param unicode split_by_wait_time: A comma separated list of values that describes the thresholds to calculate statistics on
+
+        :returns: The fetched TaskQueueStatisticsInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.task_queue.task_queue_statistics.TaskQueueStatisticsInstance
+        """
+        return await self._proxy.fetch_async(
+            end_date=end_date,
+            minutes=minutes,
+            start_date=start_date,
+            task_channel=task_channel,
+            split_by_wait_time=split_by_wait_time,
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -7,6 +7,7 @@ This code was generated by
 """
 
 from twilio.base import serialize
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
@@ -29,12 +30,12 @@ class TaskQueuesStatisticsList(ListResource):
 
         # Path Solution
         self._solution = {'workspace_sid': workspace_sid, }
-        self._uri = '/Workspaces/{workspace_sid}/TaskQueues/Statistics'.format(**self._solution)
+        self._uri = values.ResourceUri('/Workspaces/{workspace_sid}/TaskQueues/Statistics', self._solution)
 
     def stream(self, end_date=values.unset, friendly_name=values.unset,
                minutes=values.unset, start_date=values.unset,
                task_channel=values.unset, split_by_wait_time=values.unset,
-               limit=None, page_size=None):
+               limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams TaskQueuesStatisticsInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -53,28 +54,85 @@ class TaskQueuesStatisticsList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.taskrouter.v1.workspace.task_queue.task_queues_statistics.TaskQueuesStatisticsInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
-            end_date=end_date,
-            friendly_name=friendly_name,
-            minutes=minutes,
-            start_date=start_date,
-            task_channel=task_channel,
-            split_by_wait_time=split_by_wait_time,
-            page_size=limits['page_size'],
-        )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                end_date=end_date,
+                friendly_name=friendly_name,
+                minutes=minutes,
+                start_date=start_date,
+                task_channel=task_channel,
+                split_by_wait_time=split_by_wait_time,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, end_date=values.unset, friendly_name=values.unset,
+                           minutes=values.unset, start_date=values.unset,
+                           task_channel=values.unset, split_by_wait_time=values.unset,
+                           limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams TaskQueuesStatisticsInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param datetime end_date: Only calculate statistics from on or before this date
+        :param unicode friendly_name: The friendly_name of the TaskQueue statistics to read
+        :param unicode minutes: Only calculate statistics since this many minutes in the past
+        :param datetime start_date: Only calculate statistics from on or after this date
+        :param unicode task_channel: Only calculate statistics on this TaskChannel.
+        :param unicode split_by_wait_time: A comma separated list of values that describes the thresholds to calculate statistics on
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.taskrouter.v1.workspace.task_queue.task_queues_statistics.TaskQueuesStatisticsInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                end_date=end_date,
+                friendly_name=friendly_name,
+                minutes=minutes,
+                start_date=start_date,
+                task_channel=task_channel,
+                split_by_wait_time=split_by_wait_time,
+                page_size=limits['page_size'],
+            )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, end_date=values.unset, friendly_name=values.unset,
              minutes=values.unset, start_date=values.unset,
              task_channel=values.unset, split_by_wait_time=values.unset, limit=None,
-             page_size=None):
+             page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists TaskQueuesStatisticsInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -92,6 +150,12 @@ class TaskQueuesStatisticsList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.taskrouter.v1.workspace.task_queue.task_queues_statistics.TaskQueuesStatisticsInstance]
@@ -105,8 +169,56 @@ class TaskQueuesStatisticsList(ListResource):
             split_by_wait_time=split_by_wait_time,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, end_date=values.unset, friendly_name=values.unset,
+                         minutes=values.unset, start_date=values.unset,
+                         task_channel=values.unset, split_by_wait_time=values.unset, limit=None,
+                         page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists TaskQueuesStatisticsInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param datetime end_date: Only calculate statistics from on or before this date
+        :param unicode friendly_name: The friendly_name of the TaskQueue statistics to read
+        :param unicode minutes: Only calculate statistics since this many minutes in the past
+        :param datetime start_date: Only calculate statistics from on or after this date
+        :param unicode task_channel: Only calculate statistics on this TaskChannel.
+        :param unicode split_by_wait_time: A comma separated list of values that describes the thresholds to calculate statistics on
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.taskrouter.v1.workspace.task_queue.task_queues_statistics.TaskQueuesStatisticsInstance]
+        """
+        return [record async for record in await self.stream_async(
+            end_date=end_date,
+            friendly_name=friendly_name,
+            minutes=minutes,
+            start_date=start_date,
+            task_channel=task_channel,
+            split_by_wait_time=split_by_wait_time,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, end_date=values.unset, friendly_name=values.unset,
              minutes=values.unset, start_date=values.unset,
              task_channel=values.unset, split_by_wait_time=values.unset,
@@ -145,6 +257,44 @@ class TaskQueuesStatisticsList(ListResource):
 
         return TaskQueuesStatisticsPage(self._version, response, self._solution)
 
+    async def page_async(self, end_date=values.unset, friendly_name=values.unset,
+                         minutes=values.unset, start_date=values.unset,
+                         task_channel=values.unset, split_by_wait_time=values.unset,
+                         page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of TaskQueuesStatisticsInstance records from the API.
+        Request is executed immediately
+
+        :param datetime end_date: Only calculate statistics from on or before this date
+        :param unicode friendly_name: The friendly_name of the TaskQueue statistics to read
+        :param unicode minutes: Only calculate statistics since this many minutes in the past
+        :param datetime start_date: Only calculate statistics from on or after this date
+        :param unicode task_channel: Only calculate statistics on this TaskChannel.
+        :param unicode split_by_wait_time: A comma separated list of values that describes the thresholds to calculate statistics on
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of TaskQueuesStatisticsInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.task_queue.task_queues_statistics.TaskQueuesStatisticsPage
+        """
+        data = values.of({
+            'EndDate': serialize.iso8601_datetime(end_date),
+            'FriendlyName': friendly_name,
+            'Minutes': minutes,
+            'StartDate': serialize.iso8601_datetime(start_date),
+            'TaskChannel': task_channel,
+            'SplitByWaitTime': split_by_wait_time,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return TaskQueuesStatisticsPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of TaskQueuesStatisticsInstance records from the API.
@@ -162,6 +312,23 @@ class TaskQueuesStatisticsList(ListResource):
 
         return TaskQueuesStatisticsPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of TaskQueuesStatisticsInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of TaskQueuesStatisticsInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.task_queue.task_queues_statistics.TaskQueuesStatisticsPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return TaskQueuesStatisticsPage(self._version, response, self._solution)
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -217,6 +384,17 @@ class TaskQueuesStatisticsPage(Page):
 
 class TaskQueuesStatisticsInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'cumulative': 'cumulative',
+        'realtime': 'realtime',
+        'task_queue_sid': 'task_queue_sid',
+        'workspace_sid': 'workspace_sid',
+    })
+
     def __init__(self, version, payload, workspace_sid):
         """
         Initialize the TaskQueuesStatisticsInstance
@@ -227,13 +405,7 @@ class TaskQueuesStatisticsInstance(InstanceResource):
         super(TaskQueuesStatisticsInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'cumulative': payload.get('cumulative'),
-            'realtime': payload.get('realtime'),
-            'task_queue_sid': payload.get('task_queue_sid'),
-            'workspace_sid': payload.get('workspace_sid'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -6,18 +6,14 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.taskrouter.v1.workspace.worker.reservation import ReservationList
-from twilio.rest.taskrouter.v1.workspace.worker.worker_channel import WorkerChannelList
-from twilio.rest.taskrouter.v1.workspace.worker.worker_statistics import WorkerStatisticsList
-from twilio.rest.taskrouter.v1.workspace.worker.workers_cumulative_statistics import WorkersCumulativeStatisticsList
-from twilio.rest.taskrouter.v1.workspace.worker.workers_real_time_statistics import WorkersRealTimeStatisticsList
-from twilio.rest.taskrouter.v1.workspace.worker.workers_statistics import WorkersStatisticsList
 
 
 class WorkerList(ListResource):
@@ -36,7 +32,7 @@ class WorkerList(ListResource):
 
         # Path Solution
         self._solution = {'workspace_sid': workspace_sid, }
-        self._uri = '/Workspaces/{workspace_sid}/Workers'.format(**self._solution)
+        self._uri = values.ResourceUri('/Workspaces/{workspace_sid}/Workers', self._solution)
 
         # Components
         self._statistics = None
@@ -44,7 +40,8 @@ class WorkerList(ListResource):
     def stream(self, activity_name=values.unset, activity_sid=values.unset,
                available=values.unset, friendly_name=values.unset,
                target_workers_expression=values.unset, task_queue_name=values.unset,
-               task_queue_sid=values.unset, limit=None, page_size=None):
+               task_queue_sid=values.unset, limit=None, page_size=None,
+               prefetch=None, raw=False, deadline=None):
         """
         Streams WorkerInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -64,29 +61,89 @@ class WorkerList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.taskrouter.v1.workspace.worker.WorkerInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
-            activity_name=activity_name,
-            activity_sid=activity_sid,
-            available=available,
-            friendly_name=friendly_name,
-            target_workers_expression=target_workers_expression,
-            task_queue_name=task_queue_name,
-            task_queue_sid=task_queue_sid,
-            page_size=limits['page_size'],
-        )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                activity_name=activity_name,
+                activity_sid=activity_sid,
+                available=available,
+                friendly_name=friendly_name,
+                target_workers_expression=target_workers_expression,
+                task_queue_name=task_queue_name,
+                task_queue_sid=task_queue_sid,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, activity_name=values.unset, activity_sid=values.unset,
+                           available=values.unset, friendly_name=values.unset,
+                           target_workers_expression=values.unset, task_queue_name=values.unset,
+                           task_queue_sid=values.unset, limit=None, page_size=None,
+                           prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams WorkerInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param unicode activity_name: The activity_name of the Worker resources to read
+        :param unicode activity_sid: The activity_sid of the Worker resources to read
+        :param unicode available: Whether to return Worker resources that are available or unavailable
+        :param unicode friendly_name: The friendly_name of the Worker resources to read
+        :param unicode target_workers_expression: Filter by Workers that would match an expression on a TaskQueue
+        :param unicode task_queue_name: The friendly_name of the TaskQueue that the Workers to read are eligible for
+        :param unicode task_queue_sid: The SID of the TaskQueue that the Workers to read are eligible for
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.taskrouter.v1.workspace.worker.WorkerInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                activity_name=activity_name,
+                activity_sid=activity_sid,
+                available=available,
+                friendly_name=friendly_name,
+                target_workers_expression=target_workers_expression,
+                task_queue_name=task_queue_name,
+                task_queue_sid=task_queue_sid,
+                page_size=limits['page_size'],
+            )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, activity_name=values.unset, activity_sid=values.unset,
              available=values.unset, friendly_name=values.unset,
              target_workers_expression=values.unset, task_queue_name=values.unset,
-             task_queue_sid=values.unset, limit=None, page_size=None):
+             task_queue_sid=values.unset, limit=None, page_size=None,
+             prefetch=None, raw=False, deadline=None):
         """
         Lists WorkerInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -105,6 +162,12 @@ class WorkerList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.taskrouter.v1.workspace.worker.WorkerInstance]
@@ -119,8 +182,59 @@ class WorkerList(ListResource):
             task_queue_sid=task_queue_sid,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, activity_name=values.unset, activity_sid=values.unset,
+                         available=values.unset, friendly_name=values.unset,
+                         target_workers_expression=values.unset, task_queue_name=values.unset,
+                         task_queue_sid=values.unset, limit=None, page_size=None,
+                         prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists WorkerInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param unicode activity_name: The activity_name of the Worker resources to read
+        :param unicode activity_sid: The activity_sid of the Worker resources to read
+        :param unicode available: Whether to return Worker resources that are available or unavailable
+        :param unicode friendly_name: The friendly_name of the Worker resources to read
+        :param unicode target_workers_expression: Filter by Workers that would match an expression on a TaskQueue
+        :param unicode task_queue_name: The friendly_name of the TaskQueue that the Workers to read are eligible for
+        :param unicode task_queue_sid: The SID of the TaskQueue that the Workers to read are eligible for
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.taskrouter.v1.workspace.worker.WorkerInstance]
+        """
+        return [record async for record in await self.stream_async(
+            activity_name=activity_name,
+            activity_sid=activity_sid,
+            available=available,
+            friendly_name=friendly_name,
+            target_workers_expression=target_workers_expression,
+            task_queue_name=task_queue_name,
+            task_queue_sid=task_queue_sid,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, activity_name=values.unset, activity_sid=values.unset,
              available=values.unset, friendly_name=values.unset,
              target_workers_expression=values.unset, task_queue_name=values.unset,
@@ -161,6 +275,46 @@ class WorkerList(ListResource):
 
         return WorkerPage(self._version, response, self._solution)
 
+    async def page_async(self, activity_name=values.unset, activity_sid=values.unset,
+                         available=values.unset, friendly_name=values.unset,
+                         target_workers_expression=values.unset, task_queue_name=values.unset,
+                         task_queue_sid=values.unset, page_token=values.unset,
+                         page_number=values.unset, page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of WorkerInstance records from the API.
+        Request is executed immediately
+
+        :param unicode activity_name: The activity_name of the Worker resources to read
+        :param unicode activity_sid: The activity_sid of the Worker resources to read
+        :param unicode available: Whether to return Worker resources that are available or unavailable
+        :param unicode friendly_name: The friendly_name of the Worker resources to read
+        :param unicode target_workers_expression: Filter by Workers that would match an expression on a TaskQueue
+        :param unicode task_queue_name: The friendly_name of the TaskQueue that the Workers to read are eligible for
+        :param unicode task_queue_sid: The SID of the TaskQueue that the Workers to read are eligible for
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of WorkerInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.worker.WorkerPage
+        """
+        data = values.of({
+            'ActivityName': activity_name,
+            'ActivitySid': activity_sid,
+            'Available': available,
+            'FriendlyName': friendly_name,
+            'TargetWorkersExpression': target_workers_expression,
+            'TaskQueueName': task_queue_name,
+            'TaskQueueSid': task_queue_sid,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return WorkerPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of WorkerInstance records from the API.
@@ -178,14 +332,33 @@ class WorkerList(ListResource):
 
         return WorkerPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of WorkerInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of WorkerInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.worker.WorkerPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return WorkerPage(self._version, response, self._solution)
+
     def create(self, friendly_name, activity_sid=values.unset,
-               attributes=values.unset):
+               attributes=values.unset, deadline=None):
         """
         Create the WorkerInstance
 
         :param unicode friendly_name: A string to describe the resource
         :param unicode activity_sid: The SID of a valid Activity that describes the new Worker's initial state
         :param unicode attributes: A valid JSON string that describes the new Worker
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created WorkerInstance
         :rtype: twilio.rest.taskrouter.v1.workspace.worker.WorkerInstance
@@ -196,7 +369,31 @@ class WorkerList(ListResource):
             'Attributes': attributes,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return WorkerInstance(self._version, payload, workspace_sid=self._solution['workspace_sid'], )
+
+    async def create_async(self, friendly_name, activity_sid=values.unset,
+                           attributes=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the WorkerInstance
+
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode activity_sid: The SID of a valid Activity that describes the new Worker's initial state
+        :param unicode attributes: A valid JSON string that describes the new Worker
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created WorkerInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.worker.WorkerInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'ActivitySid': activity_sid,
+            'Attributes': attributes,
+        })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return WorkerInstance(self._version, payload, workspace_sid=self._solution['workspace_sid'], )
 
@@ -209,6 +406,7 @@ class WorkerList(ListResource):
         :rtype: twilio.rest.taskrouter.v1.workspace.worker.workers_statistics.WorkersStatisticsList
         """
         if self._statistics is None:
+            from twilio.rest.taskrouter.v1.workspace.worker.workers_statistics import WorkersStatisticsList
             self._statistics = WorkersStatisticsList(
                 self._version,
                 workspace_sid=self._solution['workspace_sid'],
@@ -303,7 +501,7 @@ class WorkerContext(InstanceContext):
 
         # Path Solution
         self._solution = {'workspace_sid': workspace_sid, 'sid': sid, }
-        self._uri = '/Workspaces/{workspace_sid}/Workers/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Workspaces/{workspace_sid}/Workers/{sid}', self._solution)
 
         # Dependents
         self._real_time_statistics = None
@@ -328,6 +526,22 @@ class WorkerContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the WorkerInstance
+
+        :returns: The fetched WorkerInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.worker.WorkerInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return WorkerInstance(
+            self._version,
+            payload,
+            workspace_sid=self._solution['workspace_sid'],
+            sid=self._solution['sid'],
+        )
+
     def update(self, activity_sid=values.unset, attributes=values.unset,
                friendly_name=values.unset, reject_pending_reservations=values.unset,
                if_match=values.unset):
@@ -360,6 +574,38 @@ class WorkerContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, activity_sid=values.unset, attributes=values.unset,
+                           friendly_name=values.unset, reject_pending_reservations=values.unset,
+                           if_match=values.unset):
+        """
+        Asynchronous coroutine that updates the WorkerInstance
+
+        :param unicode activity_sid: The SID of the Activity that describes the Worker's initial state
+        :param unicode attributes: The JSON string that describes the Worker
+        :param unicode friendly_name: A string to describe the Worker
+        :param bool reject_pending_reservations: Whether to reject the Worker's pending reservations
+        :param unicode if_match: The If-Match HTTP request header
+
+        :returns: The updated WorkerInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.worker.WorkerInstance
+        """
+        data = values.of({
+            'ActivitySid': activity_sid,
+            'Attributes': attributes,
+            'FriendlyName': friendly_name,
+            'RejectPendingReservations': reject_pending_reservations,
+        })
+        headers = values.of({'If-Match': if_match, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, headers=headers, )
+
+        return WorkerInstance(
+            self._version,
+            payload,
+            workspace_sid=self._solution['workspace_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self, if_match=values.unset):
         """
         Deletes the WorkerInstance
@@ -373,6 +619,19 @@ class WorkerContext(InstanceContext):
 
         return self._version.delete(method='DELETE', uri=self._uri, headers=headers, )
 
+    async def delete_async(self, if_match=values.unset):
+        """
+        Asynchronous coroutine that deletes the WorkerInstance
+
+        :param unicode if_match: The If-Match HTTP request header
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        headers = values.of({'If-Match': if_match, })
+
+        return await self._version.delete_async(method='DELETE', uri=self._uri, headers=headers, )
+
     @property
     def real_time_statistics(self):
         """
@@ -382,6 +641,7 @@ class WorkerContext(InstanceContext):
         :rtype: twilio.rest.taskrouter.v1.workspace.worker.workers_real_time_statistics.WorkersRealTimeStatisticsList
         """
         if self._real_time_statistics is None:
+            from twilio.rest.taskrouter.v1.workspace.worker.workers_real_time_statistics import WorkersRealTimeStatisticsList
             self._real_time_statistics = WorkersRealTimeStatisticsList(
                 self._version,
                 workspace_sid=self._solution['workspace_sid'],
@@ -397,6 +657,7 @@ class WorkerContext(InstanceContext):
         :rtype: twilio.rest.taskrouter.v1.workspace.worker.workers_cumulative_statistics.WorkersCumulativeStatisticsList
         """
         if self._cumulative_statistics is None:
+            from twilio.rest.taskrouter.v1.workspace.worker.workers_cumulative_statistics import WorkersCumulativeStatisticsList
             self._cumulative_statistics = WorkersCumulativeStatisticsList(
                 self._version,
                 workspace_sid=self._solution['workspace_sid'],
@@ -412,6 +673,7 @@ class WorkerContext(InstanceContext):
         :rtype: twilio.rest.taskrouter.v1.workspace.worker.worker_statistics.WorkerStatisticsList
         """
         if self._statistics is None:
+            from twilio.rest.taskrouter.v1.workspace.worker.worker_statistics import WorkerStatisticsList
             self._statistics = WorkerStatisticsList(
                 self._version,
                 workspace_sid=self._solution['workspace_sid'],
@@ -428,6 +690,7 @@ class WorkerContext(InstanceContext):
         :rtype: twilio.rest.taskrouter.v1.workspace.worker.reservation.ReservationList
         """
         if self._reservations is None:
+            from twilio.rest.taskrouter.v1.workspace.worker.reservation import ReservationList
             self._reservations = ReservationList(
                 self._version,
                 workspace_sid=self._solution['workspace_sid'],
@@ -444,6 +707,7 @@ class WorkerContext(InstanceContext):
         :rtype: twilio.rest.taskrouter.v1.workspace.worker.worker_channel.WorkerChannelList
         """
         if self._worker_channels is None:
+            from twilio.rest.taskrouter.v1.workspace.worker.worker_channel import WorkerChannelList
             self._worker_channels = WorkerChannelList(
                 self._version,
                 workspace_sid=self._solution['workspace_sid'],
@@ -464,6 +728,32 @@ class WorkerContext(InstanceContext):
 
 class WorkerInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_status_changed': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'activity_name': 'activity_name',
+        'activity_sid': 'activity_sid',
+        'attributes': 'attributes',
+        'available': 'available',
+        'date_created': 'date_created',
+        'date_status_changed': 'date_status_changed',
+        'date_updated': 'date_updated',
+        'friendly_name': 'friendly_name',
+        'sid': 'sid',
+        'workspace_sid': 'workspace_sid',
+        'url': 'url',
+        'links': 'links',
+    }, _deserializers)
+
     def __init__(self, version, payload, workspace_sid, sid=None):
         """
         Initialize the WorkerInstance
@@ -474,21 +764,7 @@ class WorkerInstance(InstanceResource):
         super(WorkerInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'activity_name': payload.get('activity_name'),
-            'activity_sid': payload.get('activity_sid'),
-            'attributes': payload.get('attributes'),
-            'available': payload.get('available'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_status_changed': deserialize.iso8601_datetime(payload.get('date_status_changed')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'friendly_name': payload.get('friendly_name'),
-            'sid': payload.get('sid'),
-            'workspace_sid': payload.get('workspace_sid'),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -624,6 +900,15 @@ class WorkerInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the WorkerInstance
+
+        :returns: The fetched WorkerInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.worker.WorkerInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, activity_sid=values.unset, attributes=values.unset,
                friendly_name=values.unset, reject_pending_reservations=values.unset,
                if_match=values.unset):
@@ -647,6 +932,29 @@ class WorkerInstance(InstanceResource):
             if_match=if_match,
         )
 
+    async def update_async(self, activity_sid=values.unset, attributes=values.unset,
+                           friendly_name=values.unset, reject_pending_reservations=values.unset,
+                           if_match=values.unset):
+        """
+        Asynchronous coroutine that updates the WorkerInstance
+
+        :param unicode activity_sid: The SID of the Activity that describes the Worker's initial state
+        :param unicode attributes: The JSON string that describes the Worker
+        :param unicode friendly_name: A string to describe the Worker
+        :param bool reject_pending_reservations: Whether to reject the Worker's pending reservations
+        :param unicode if_match: The If-Match HTTP request header
+
+        :returns: The updated WorkerInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.worker.WorkerInstance
+        """
+        return await self._proxy.update_async(
+            activity_sid=activity_sid,
+            attributes=attributes,
+            friendly_name=friendly_name,
+            reject_pending_reservations=reject_pending_reservations,
+            if_match=if_match,
+        )
+
     def delete(self, if_match=values.unset):
         """
         Deletes the WorkerInstance
@@ -658,6 +966,17 @@ class WorkerInstance(InstanceResource):
         """
         return self._proxy.delete(if_match=if_match, )
 
+    async def delete_async(self, if_match=values.unset):
+        """
+        Asynchronous coroutine that deletes the WorkerInstance
+
+        :param unicode if_match: The If-Match HTTP request header
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async(if_match=if_match, )
+
     @property
     def real_time_statistics(self):
         """
@@ -717,3 +1036,24 @@ class WorkerInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Taskrouter.V1.WorkerInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'ReservationList': 'twilio.rest.taskrouter.v1.workspace.worker.reservation',
+    'WorkerChannelList': 'twilio.rest.taskrouter.v1.workspace.worker.worker_channel',
+    'WorkerStatisticsList': 'twilio.rest.taskrouter.v1.workspace.worker.worker_statistics',
+    'WorkersCumulativeStatisticsList': 'twilio.rest.taskrouter.v1.workspace.worker.workers_cumulative_statistics',
+    'WorkersRealTimeStatisticsList': 'twilio.rest.taskrouter.v1.workspace.worker.workers_real_time_statistics',
+    'WorkersStatisticsList': 'twilio.rest.taskrouter.v1.workspace.worker.workers_statistics',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
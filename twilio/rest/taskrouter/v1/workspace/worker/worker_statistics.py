@@ -7,6 +7,7 @@ This code was generated by
 """
 
 from twilio.base import serialize
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
@@ -130,7 +131,7 @@ class WorkerStatisticsContext(InstanceContext):
 
         # Path Solution
         self._solution = {'workspace_sid': workspace_sid, 'worker_sid': worker_sid, }
-        self._uri = '/Workspaces/{workspace_sid}/Workers/{worker_sid}/Statistics'.format(**self._solution)
+        self._uri = values.ResourceUri('/Workspaces/{workspace_sid}/Workers/{worker_sid}/Statistics', self._solution)
 
     def fetch(self, minutes=values.unset, start_date=values.unset,
               end_date=values.unset, task_channel=values.unset):
@@ -161,6 +162,35 @@ class WorkerStatisticsContext(InstanceContext):
             worker_sid=self._solution['worker_sid'],
         )
 
+    async def fetch_async(self, minutes=values.unset, start_date=values.unset,
+                          end_date=values.unset, task_channel=values.unset):
+        """
+        Asynchronous coroutine that fetches the WorkerStatisticsInstance
+
+        :param unicode minutes: Only calculate statistics since this many minutes in the past
+        :param datetime start_date: Only calculate statistics from on or after this date
+        :param datetime end_date: Only include usage that occurred on or before this date
+        :param unicode task_channel: Only calculate statistics on this TaskChannel
+
+        :returns: The fetched WorkerStatisticsInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.worker.worker_statistics.WorkerStatisticsInstance
+        """
+        data = values.of({
+            'Minutes': minutes,
+            'StartDate': serialize.iso8601_datetime(start_date),
+            'EndDate': serialize.iso8601_datetime(end_date),
+            'TaskChannel': task_channel,
+        })
+
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, params=data, )
+
+        return WorkerStatisticsInstance(
+            self._version,
+            payload,
+            workspace_sid=self._solution['workspace_sid'],
+            worker_sid=self._solution['worker_sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -174,6 +204,17 @@ class WorkerStatisticsContext(InstanceContext):
 
 class WorkerStatisticsInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'cumulative': 'cumulative',
+        'worker_sid': 'worker_sid',
+        'workspace_sid': 'workspace_sid',
+        'url': 'url',
+    })
+
     def __init__(self, version, payload, workspace_sid, worker_sid):
         """
         Initialize the WorkerStatisticsInstance
@@ -184,13 +225,7 @@ class WorkerStatisticsInstance(InstanceResource):
         super(WorkerStatisticsInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'cumulative': payload.get('cumulative'),
-            'worker_sid': payload.get('worker_sid'),
-            'workspace_sid': payload.get('workspace_sid'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -273,6 +308,26 @@ class WorkerStatisticsInstance(InstanceResource):
             task_channel=task_channel,
         )
 
+    async def fetch_async(self, minutes=values.unset, start_date=values.unset,
+                          end_date=values.unset, task_channel=values.unset):
+        """
+        Asynchronous coroutine that fetches the WorkerStatisticsInstance
+
+        :param unicode minutes: Only calculate statistics since this many minutes in the past
+        :param datetime start_date: Only calculate statistics from on or after this date
+        :param datetime end_date: Only include usage that occurred on or before this date
+        :param unicode task_channel: Only calculate statistics on this TaskChannel
+
+        :returns: The fetched WorkerStatisticsInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.worker.worker_statistics.WorkerStatisticsInstance
+        """
+        return await self._proxy.fetch_async(
+            minutes=minutes,
+            start_date=start_date,
+            end_date=end_date,
+            task_channel=task_channel,
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
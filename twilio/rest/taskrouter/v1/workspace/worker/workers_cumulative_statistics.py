@@ -125,7 +125,7 @@ class WorkersCumulativeStatisticsContext(InstanceContext):
 
         # Path Solution
         self._solution = {'workspace_sid': workspace_sid, }
-        self._uri = '/Workspaces/{workspace_sid}/Workers/CumulativeStatistics'.format(**self._solution)
+        self._uri = values.ResourceUri('/Workspaces/{workspace_sid}/Workers/CumulativeStatistics', self._solution)
 
     def fetch(self, end_date=values.unset, minutes=values.unset,
               start_date=values.unset, task_channel=values.unset):
@@ -155,6 +155,34 @@ class WorkersCumulativeStatisticsContext(InstanceContext):
             workspace_sid=self._solution['workspace_sid'],
         )
 
+    async def fetch_async(self, end_date=values.unset, minutes=values.unset,
+                          start_date=values.unset, task_channel=values.unset):
+        """
+        Asynchronous coroutine that fetches the WorkersCumulativeStatisticsInstance
+
+        :param datetime end_date: Only calculate statistics from on or before this date
+        :param unicode minutes: Only calculate statistics since this many minutes in the past
+        :param datetime start_date: Only calculate statistics from on or after this date
+        :param unicode task_channel: Only calculate cumulative statistics on this TaskChannel
+
+        :returns: The fetched WorkersCumulativeStatisticsInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.worker.workers_cumulative_statistics.WorkersCumulativeStatisticsInstance
+        """
+        data = values.of({
+            'EndDate': serialize.iso8601_datetime(end_date),
+            'Minutes': minutes,
+            'StartDate': serialize.iso8601_datetime(start_date),
+            'TaskChannel': task_channel,
+        })
+
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, params=data, )
+
+        return WorkersCumulativeStatisticsInstance(
+            self._version,
+            payload,
+            workspace_sid=self._solution['workspace_sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -168,6 +196,36 @@ class WorkersCumulativeStatisticsContext(InstanceContext):
 
 class WorkersCumulativeStatisticsInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'start_time': deserialize.iso8601_datetime,
+        'end_time': deserialize.iso8601_datetime,
+        'reservations_created': deserialize.integer,
+        'reservations_accepted': deserialize.integer,
+        'reservations_rejected': deserialize.integer,
+        'reservations_timed_out': deserialize.integer,
+        'reservations_canceled': deserialize.integer,
+        'reservations_rescinded': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'start_time': 'start_time',
+        'end_time': 'end_time',
+        'activity_durations': 'activity_durations',
+        'reservations_created': 'reservations_created',
+        'reservations_accepted': 'reservations_accepted',
+        'reservations_rejected': 'reservations_rejected',
+        'reservations_timed_out': 'reservations_timed_out',
+        'reservations_canceled': 'reservations_canceled',
+        'reservations_rescinded': 'reservations_rescinded',
+        'workspace_sid': 'workspace_sid',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload, workspace_sid):
         """
         Initialize the WorkersCumulativeStatisticsInstance
@@ -178,20 +236,7 @@ class WorkersCumulativeStatisticsInstance(InstanceResource):
         super(WorkersCumulativeStatisticsInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'start_time': deserialize.iso8601_datetime(payload.get('start_time')),
-            'end_time': deserialize.iso8601_datetime(payload.get('end_time')),
-            'activity_durations': payload.get('activity_durations'),
-            'reservations_created': deserialize.integer(payload.get('reservations_created')),
-            'reservations_accepted': deserialize.integer(payload.get('reservations_accepted')),
-            'reservations_rejected': deserialize.integer(payload.get('reservations_rejected')),
-            'reservations_timed_out': deserialize.integer(payload.get('reservations_timed_out')),
-            'reservations_canceled': deserialize.integer(payload.get('reservations_canceled')),
-            'reservations_rescinded': deserialize.integer(payload.get('reservations_rescinded')),
-            'workspace_sid': payload.get('workspace_sid'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -329,6 +374,26 @@ class WorkersCumulativeStatisticsInstance(InstanceResource):
             task_channel=task_channel,
         )
 
+    async def fetch_async(self, end_date=values.unset, minutes=values.unset,
+                          start_date=values.unset, task_channel=values.unset):
+        """
+        Asynchronous coroutine that fetches the WorkersCumulativeStatisticsInstance
+
+        :param datetime end_date: Only calculate statistics from on or before this date
+        :param unicode minutes: Only calculate statistics since this many minutes in the past
+        :param datetime start_date: Only calculate statistics from on or after this date
+        :param unicode task_channel: Only calculate cumulative statistics on this TaskChannel
+
+        :returns: The fetched WorkersCumulativeStatisticsInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.worker.workers_cumulative_statistics.WorkersCumulativeStatisticsInstance
+        """
+        return await self._proxy.fetch_async(
+            end_date=end_date,
+            minutes=minutes,
+            start_date=start_date,
+            task_channel=task_channel,
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
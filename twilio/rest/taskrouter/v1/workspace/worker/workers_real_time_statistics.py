@@ -124,7 +124,7 @@ class WorkersRealTimeStatisticsContext(InstanceContext):
 
         # Path Solution
         self._solution = {'workspace_sid': workspace_sid, }
-        self._uri = '/Workspaces/{workspace_sid}/Workers/RealTimeStatistics'.format(**self._solution)
+        self._uri = values.ResourceUri('/Workspaces/{workspace_sid}/Workers/RealTimeStatistics', self._solution)
 
     def fetch(self, task_channel=values.unset):
         """
@@ -145,6 +145,25 @@ class WorkersRealTimeStatisticsContext(InstanceContext):
             workspace_sid=self._solution['workspace_sid'],
         )
 
+    async def fetch_async(self, task_channel=values.unset):
+        """
+        Asynchronous coroutine that fetches the WorkersRealTimeStatisticsInstance
+
+        :param unicode task_channel: Only calculate real-time statistics on this TaskChannel
+
+        :returns: The fetched WorkersRealTimeStatisticsInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.worker.workers_real_time_statistics.WorkersRealTimeStatisticsInstance
+        """
+        data = values.of({'TaskChannel': task_channel, })
+
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, params=data, )
+
+        return WorkersRealTimeStatisticsInstance(
+            self._version,
+            payload,
+            workspace_sid=self._solution['workspace_sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -158,6 +177,22 @@ class WorkersRealTimeStatisticsContext(InstanceContext):
 
 class WorkersRealTimeStatisticsInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'total_workers': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'activity_statistics': 'activity_statistics',
+        'total_workers': 'total_workers',
+        'workspace_sid': 'workspace_sid',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload, workspace_sid):
         """
         Initialize the WorkersRealTimeStatisticsInstance
@@ -168,13 +203,7 @@ class WorkersRealTimeStatisticsInstance(InstanceResource):
         super(WorkersRealTimeStatisticsInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'activity_statistics': payload.get('activity_statistics'),
-            'total_workers': deserialize.integer(payload.get('total_workers')),
-            'workspace_sid': payload.get('workspace_sid'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -247,6 +276,17 @@ class WorkersRealTimeStatisticsInstance(InstanceResource):
         """
         return self._proxy.fetch(task_channel=task_channel, )
 
+    async def fetch_async(self, task_channel=values.unset):
+        """
+        Asynchronous coroutine that fetches the WorkersRealTimeStatisticsInstance
+
+        :param unicode task_channel: Only calculate real-time statistics on this TaskChannel
+
+        :returns: The fetched WorkersRealTimeStatisticsInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.worker.workers_real_time_statistics.WorkersRealTimeStatisticsInstance
+        """
+        return await self._proxy.fetch_async(task_channel=task_channel, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -7,6 +7,7 @@ This code was generated by
 """
 
 from twilio.base import serialize
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
@@ -118,7 +119,7 @@ class WorkersStatisticsContext(InstanceContext):
 
         # Path Solution
         self._solution = {'workspace_sid': workspace_sid, }
-        self._uri = '/Workspaces/{workspace_sid}/Workers/Statistics'.format(**self._solution)
+        self._uri = values.ResourceUri('/Workspaces/{workspace_sid}/Workers/Statistics', self._solution)
 
     def fetch(self, minutes=values.unset, start_date=values.unset,
               end_date=values.unset, task_queue_sid=values.unset,
@@ -156,6 +157,42 @@ class WorkersStatisticsContext(InstanceContext):
             workspace_sid=self._solution['workspace_sid'],
         )
 
+    async def fetch_async(self, minutes=values.unset, start_date=values.unset,
+                          end_date=values.unset, task_queue_sid=values.unset,
+                          task_queue_name=values.unset, friendly_name=values.unset,
+                          task_channel=values.unset):
+        """
+        Asynchronous coroutine that fetches the WorkersStatisticsInstance
+
+        :param unicode minutes: Only calculate statistics since this many minutes in the past
+        :param datetime start_date: Only calculate statistics from on or after this date
+        :param datetime end_date: Only calculate statistics from this date and time and earlier
+        :param unicode task_queue_sid: The SID of the TaskQueue for which to fetch Worker statistics
+        :param unicode task_queue_name: The friendly_name of the TaskQueue for which to fetch Worker statistics
+        :param unicode friendly_name: Only include Workers with `friendly_name` values that match this parameter
+        :param unicode task_channel: Only calculate statistics on this TaskChannel
+
+        :returns: The fetched WorkersStatisticsInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.worker.workers_statistics.WorkersStatisticsInstance
+        """
+        data = values.of({
+            'Minutes': minutes,
+            'StartDate': serialize.iso8601_datetime(start_date),
+            'EndDate': serialize.iso8601_datetime(end_date),
+            'TaskQueueSid': task_queue_sid,
+            'TaskQueueName': task_queue_name,
+            'FriendlyName': friendly_name,
+            'TaskChannel': task_channel,
+        })
+
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, params=data, )
+
+        return WorkersStatisticsInstance(
+            self._version,
+            payload,
+            workspace_sid=self._solution['workspace_sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -169,6 +206,17 @@ class WorkersStatisticsContext(InstanceContext):
 
 class WorkersStatisticsInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'realtime': 'realtime',
+        'cumulative': 'cumulative',
+        'account_sid': 'account_sid',
+        'workspace_sid': 'workspace_sid',
+        'url': 'url',
+    })
+
     def __init__(self, version, payload, workspace_sid):
         """
         Initialize the WorkersStatisticsInstance
@@ -179,13 +227,7 @@ class WorkersStatisticsInstance(InstanceResource):
         super(WorkersStatisticsInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'realtime': payload.get('realtime'),
-            'cumulative': payload.get('cumulative'),
-            'account_sid': payload.get('account_sid'),
-            'workspace_sid': payload.get('workspace_sid'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -275,6 +317,34 @@ class WorkersStatisticsInstance(InstanceResource):
             task_channel=task_channel,
         )
 
+    async def fetch_async(self, minutes=values.unset, start_date=values.unset,
+                          end_date=values.unset, task_queue_sid=values.unset,
+                          task_queue_name=values.unset, friendly_name=values.unset,
+                          task_channel=values.unset):
+        """
+        Asynchronous coroutine that fetches the WorkersStatisticsInstance
+
+        :param unicode minutes: Only calculate statistics since this many minutes in the past
+        :param datetime start_date: Only calculate statistics from on or after this date
+        :param datetime end_date: Only calculate statistics from this date and time and earlier
+        :param unicode task_queue_sid: The SID of the TaskQueue for which to fetch Worker statistics
+        :param unicode task_queue_name: The friendly_name of the TaskQueue for which to fetch Worker statistics
+        :param unicode friendly_name: Only include Workers with `friendly_name` values that match this parameter
+        :param unicode task_channel: Only calculate statistics on this TaskChannel
+
+        :returns: The fetched WorkersStatisticsInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.worker.workers_statistics.WorkersStatisticsInstance
+        """
+        return await self._proxy.fetch_async(
+            minutes=minutes,
+            start_date=start_date,
+            end_date=end_date,
+            task_queue_sid=task_queue_sid,
+            task_queue_name=task_queue_name,
+            friendly_name=friendly_name,
+            task_channel=task_channel,
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -6,15 +6,14 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.taskrouter.v1.workspace.workflow.workflow_cumulative_statistics import WorkflowCumulativeStatisticsList
-from twilio.rest.taskrouter.v1.workspace.workflow.workflow_real_time_statistics import WorkflowRealTimeStatisticsList
-from twilio.rest.taskrouter.v1.workspace.workflow.workflow_statistics import WorkflowStatisticsList
 
 
 class WorkflowList(ListResource):
@@ -33,9 +32,10 @@ class WorkflowList(ListResource):
 
         # Path Solution
         self._solution = {'workspace_sid': workspace_sid, }
-        self._uri = '/Workspaces/{workspace_sid}/Workflows'.format(**self._solution)
+        self._uri = values.ResourceUri('/Workspaces/{workspace_sid}/Workflows', self._solution)
 
-    def stream(self, friendly_name=values.unset, limit=None, page_size=None):
+    def stream(self, friendly_name=values.unset, limit=None, page_size=None,
+               prefetch=None, raw=False, deadline=None):
         """
         Streams WorkflowInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -49,17 +49,59 @@ class WorkflowList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.taskrouter.v1.workspace.workflow.WorkflowInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(friendly_name=friendly_name, page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(friendly_name=friendly_name, page_size=limits['page_size'], )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, friendly_name=values.unset, limit=None, page_size=None,
+                           prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams WorkflowInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param unicode friendly_name: The friendly_name of the Workflow resources to read
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.taskrouter.v1.workspace.workflow.WorkflowInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(friendly_name=friendly_name, page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, friendly_name=values.unset, limit=None, page_size=None):
+    def list(self, friendly_name=values.unset, limit=None, page_size=None,
+             prefetch=None, raw=False, deadline=None):
         """
         Lists WorkflowInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -72,11 +114,43 @@ class WorkflowList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.taskrouter.v1.workspace.workflow.WorkflowInstance]
+        """
+        return list(self.stream(friendly_name=friendly_name, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, friendly_name=values.unset, limit=None, page_size=None,
+                         prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists WorkflowInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param unicode friendly_name: The friendly_name of the Workflow resources to read
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.taskrouter.v1.workspace.workflow.WorkflowInstance]
         """
-        return list(self.stream(friendly_name=friendly_name, limit=limit, page_size=page_size, ))
+        return [record async for record in await self.stream_async(friendly_name=friendly_name, limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, friendly_name=values.unset, page_token=values.unset,
              page_number=values.unset, page_size=values.unset):
@@ -103,6 +177,31 @@ class WorkflowList(ListResource):
 
         return WorkflowPage(self._version, response, self._solution)
 
+    async def page_async(self, friendly_name=values.unset, page_token=values.unset,
+                         page_number=values.unset, page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of WorkflowInstance records from the API.
+        Request is executed immediately
+
+        :param unicode friendly_name: The friendly_name of the Workflow resources to read
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of WorkflowInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.workflow.WorkflowPage
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return WorkflowPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of WorkflowInstance records from the API.
@@ -120,10 +219,27 @@ class WorkflowList(ListResource):
 
         return WorkflowPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of WorkflowInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of WorkflowInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.workflow.WorkflowPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return WorkflowPage(self._version, response, self._solution)
+
     def create(self, friendly_name, configuration,
                assignment_callback_url=values.unset,
                fallback_assignment_callback_url=values.unset,
-               task_reservation_timeout=values.unset):
+               task_reservation_timeout=values.unset, deadline=None):
         """
         Create the WorkflowInstance
 
@@ -132,6 +248,38 @@ class WorkflowList(ListResource):
         :param unicode assignment_callback_url: The URL from your application that will process task assignment events
         :param unicode fallback_assignment_callback_url: The URL that we should call when a call to the `assignment_callback_url` fails
         :param unicode task_reservation_timeout: How long TaskRouter will wait for a confirmation response from your application after it assigns a Task to a Worker
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created WorkflowInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.workflow.WorkflowInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'Configuration': configuration,
+            'AssignmentCallbackUrl': assignment_callback_url,
+            'FallbackAssignmentCallbackUrl': fallback_assignment_callback_url,
+            'TaskReservationTimeout': task_reservation_timeout,
+        })
+
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return WorkflowInstance(self._version, payload, workspace_sid=self._solution['workspace_sid'], )
+
+    async def create_async(self, friendly_name, configuration,
+                           assignment_callback_url=values.unset,
+                           fallback_assignment_callback_url=values.unset,
+                           task_reservation_timeout=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the WorkflowInstance
+
+        :param unicode friendly_name:  descriptive string that you create to describe the Workflow resource
+        :param unicode configuration: A JSON string that contains the rules to apply to the Workflow
+        :param unicode assignment_callback_url: The URL from your application that will process task assignment events
+        :param unicode fallback_assignment_callback_url: The URL that we should call when a call to the `assignment_callback_url` fails
+        :param unicode task_reservation_timeout: How long TaskRouter will wait for a confirmation response from your application after it assigns a Task to a Worker
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created WorkflowInstance
         :rtype: twilio.rest.taskrouter.v1.workspace.workflow.WorkflowInstance
@@ -144,7 +292,7 @@ class WorkflowList(ListResource):
             'TaskReservationTimeout': task_reservation_timeout,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return WorkflowInstance(self._version, payload, workspace_sid=self._solution['workspace_sid'], )
 
@@ -236,7 +384,7 @@ class WorkflowContext(InstanceContext):
 
         # Path Solution
         self._solution = {'workspace_sid': workspace_sid, 'sid': sid, }
-        self._uri = '/Workspaces/{workspace_sid}/Workflows/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Workspaces/{workspace_sid}/Workflows/{sid}', self._solution)
 
         # Dependents
         self._statistics = None
@@ -259,6 +407,22 @@ class WorkflowContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the WorkflowInstance
+
+        :returns: The fetched WorkflowInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.workflow.WorkflowInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return WorkflowInstance(
+            self._version,
+            payload,
+            workspace_sid=self._solution['workspace_sid'],
+            sid=self._solution['sid'],
+        )
+
     def update(self, friendly_name=values.unset,
                assignment_callback_url=values.unset,
                fallback_assignment_callback_url=values.unset,
@@ -295,6 +459,42 @@ class WorkflowContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, friendly_name=values.unset,
+                           assignment_callback_url=values.unset,
+                           fallback_assignment_callback_url=values.unset,
+                           configuration=values.unset, task_reservation_timeout=values.unset,
+                           re_evaluate_tasks=values.unset):
+        """
+        Asynchronous coroutine that updates the WorkflowInstance
+
+        :param unicode friendly_name:  descriptive string that you create to describe the Workflow resource
+        :param unicode assignment_callback_url: The URL from your application that will process task assignment events
+        :param unicode fallback_assignment_callback_url: The URL that we should call when a call to the `assignment_callback_url` fails
+        :param unicode configuration: A JSON string that contains the rules to apply to the Workflow
+        :param unicode task_reservation_timeout: How long TaskRouter will wait for a confirmation response from your application after it assigns a Task to a Worker
+        :param unicode re_evaluate_tasks: Whether or not to re-evaluate Tasks
+
+        :returns: The updated WorkflowInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.workflow.WorkflowInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'AssignmentCallbackUrl': assignment_callback_url,
+            'FallbackAssignmentCallbackUrl': fallback_assignment_callback_url,
+            'Configuration': configuration,
+            'TaskReservationTimeout': task_reservation_timeout,
+            'ReEvaluateTasks': re_evaluate_tasks,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return WorkflowInstance(
+            self._version,
+            payload,
+            workspace_sid=self._solution['workspace_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self):
         """
         Deletes the WorkflowInstance
@@ -304,6 +504,15 @@ class WorkflowContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the WorkflowInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     @property
     def statistics(self):
         """
@@ -313,6 +522,7 @@ class WorkflowContext(InstanceContext):
         :rtype: twilio.rest.taskrouter.v1.workspace.workflow.workflow_statistics.WorkflowStatisticsList
         """
         if self._statistics is None:
+            from twilio.rest.taskrouter.v1.workspace.workflow.workflow_statistics import WorkflowStatisticsList
             self._statistics = WorkflowStatisticsList(
                 self._version,
                 workspace_sid=self._solution['workspace_sid'],
@@ -329,6 +539,7 @@ class WorkflowContext(InstanceContext):
         :rtype: twilio.rest.taskrouter.v1.workspace.workflow.workflow_real_time_statistics.WorkflowRealTimeStatisticsList
         """
         if self._real_time_statistics is None:
+            from twilio.rest.taskrouter.v1.workspace.workflow.workflow_real_time_statistics import WorkflowRealTimeStatisticsList
             self._real_time_statistics = WorkflowRealTimeStatisticsList(
                 self._version,
                 workspace_sid=self._solution['workspace_sid'],
@@ -345,6 +556,7 @@ class WorkflowContext(InstanceContext):
         :rtype: twilio.rest.taskrouter.v1.workspace.workflow.workflow_cumulative_statistics.WorkflowCumulativeStatisticsList
         """
         if self._cumulative_statistics is None:
+            from twilio.rest.taskrouter.v1.workspace.workflow.workflow_cumulative_statistics import WorkflowCumulativeStatisticsList
             self._cumulative_statistics = WorkflowCumulativeStatisticsList(
                 self._version,
                 workspace_sid=self._solution['workspace_sid'],
@@ -365,6 +577,32 @@ class WorkflowContext(InstanceContext):
 
 class WorkflowInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+        'task_reservation_timeout': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'assignment_callback_url': 'assignment_callback_url',
+        'configuration': 'configuration',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'document_content_type': 'document_content_type',
+        'fallback_assignment_callback_url': 'fallback_assignment_callback_url',
+        'friendly_name': 'friendly_name',
+        'sid': 'sid',
+        'task_reservation_timeout': 'task_reservation_timeout',
+        'workspace_sid': 'workspace_sid',
+        'url': 'url',
+        'links': 'links',
+    }, _deserializers)
+
     def __init__(self, version, payload, workspace_sid, sid=None):
         """
         Initialize the WorkflowInstance
@@ -375,21 +613,7 @@ class WorkflowInstance(InstanceResource):
         super(WorkflowInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'assignment_callback_url': payload.get('assignment_callback_url'),
-            'configuration': payload.get('configuration'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'document_content_type': payload.get('document_content_type'),
-            'fallback_assignment_callback_url': payload.get('fallback_assignment_callback_url'),
-            'friendly_name': payload.get('friendly_name'),
-            'sid': payload.get('sid'),
-            'task_reservation_timeout': deserialize.integer(payload.get('task_reservation_timeout')),
-            'workspace_sid': payload.get('workspace_sid'),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -525,6 +749,15 @@ class WorkflowInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the WorkflowInstance
+
+        :returns: The fetched WorkflowInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.workflow.WorkflowInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, friendly_name=values.unset,
                assignment_callback_url=values.unset,
                fallback_assignment_callback_url=values.unset,
@@ -552,6 +785,33 @@ class WorkflowInstance(InstanceResource):
             re_evaluate_tasks=re_evaluate_tasks,
         )
 
+    async def update_async(self, friendly_name=values.unset,
+                           assignment_callback_url=values.unset,
+                           fallback_assignment_callback_url=values.unset,
+                           configuration=values.unset, task_reservation_timeout=values.unset,
+                           re_evaluate_tasks=values.unset):
+        """
+        Asynchronous coroutine that updates the WorkflowInstance
+
+        :param unicode friendly_name:  descriptive string that you create to describe the Workflow resource
+        :param unicode assignment_callback_url: The URL from your application that will process task assignment events
+        :param unicode fallback_assignment_callback_url: The URL that we should call when a call to the `assignment_callback_url` fails
+        :param unicode configuration: A JSON string that contains the rules to apply to the Workflow
+        :param unicode task_reservation_timeout: How long TaskRouter will wait for a confirmation response from your application after it assigns a Task to a Worker
+        :param unicode re_evaluate_tasks: Whether or not to re-evaluate Tasks
+
+        :returns: The updated WorkflowInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.workflow.WorkflowInstance
+        """
+        return await self._proxy.update_async(
+            friendly_name=friendly_name,
+            assignment_callback_url=assignment_callback_url,
+            fallback_assignment_callback_url=fallback_assignment_callback_url,
+            configuration=configuration,
+            task_reservation_timeout=task_reservation_timeout,
+            re_evaluate_tasks=re_evaluate_tasks,
+        )
+
     def delete(self):
         """
         Deletes the WorkflowInstance
@@ -561,6 +821,15 @@ class WorkflowInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the WorkflowInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     @property
     def statistics(self):
         """
@@ -600,3 +869,21 @@ class WorkflowInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Taskrouter.V1.WorkflowInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'WorkflowCumulativeStatisticsList': 'twilio.rest.taskrouter.v1.workspace.workflow.workflow_cumulative_statistics',
+    'WorkflowRealTimeStatisticsList': 'twilio.rest.taskrouter.v1.workspace.workflow.workflow_real_time_statistics',
+    'WorkflowStatisticsList': 'twilio.rest.taskrouter.v1.workspace.workflow.workflow_statistics',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
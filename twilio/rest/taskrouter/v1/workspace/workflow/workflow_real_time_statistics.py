@@ -130,7 +130,7 @@ class WorkflowRealTimeStatisticsContext(InstanceContext):
 
         # Path Solution
         self._solution = {'workspace_sid': workspace_sid, 'workflow_sid': workflow_sid, }
-        self._uri = '/Workspaces/{workspace_sid}/Workflows/{workflow_sid}/RealTimeStatistics'.format(**self._solution)
+        self._uri = values.ResourceUri('/Workspaces/{workspace_sid}/Workflows/{workflow_sid}/RealTimeStatistics', self._solution)
 
     def fetch(self, task_channel=values.unset):
         """
@@ -152,6 +152,26 @@ class WorkflowRealTimeStatisticsContext(InstanceContext):
             workflow_sid=self._solution['workflow_sid'],
         )
 
+    async def fetch_async(self, task_channel=values.unset):
+        """
+        Asynchronous coroutine that fetches the WorkflowRealTimeStatisticsInstance
+
+        :param unicode task_channel: Only calculate real-time statistics on this TaskChannel
+
+        :returns: The fetched WorkflowRealTimeStatisticsInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.workflow.workflow_real_time_statistics.WorkflowRealTimeStatisticsInstance
+        """
+        data = values.of({'TaskChannel': task_channel, })
+
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, params=data, )
+
+        return WorkflowRealTimeStatisticsInstance(
+            self._version,
+            payload,
+            workspace_sid=self._solution['workspace_sid'],
+            workflow_sid=self._solution['workflow_sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -165,6 +185,27 @@ class WorkflowRealTimeStatisticsContext(InstanceContext):
 
 class WorkflowRealTimeStatisticsInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'longest_task_waiting_age': deserialize.integer,
+        'total_tasks': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'longest_task_waiting_age': 'longest_task_waiting_age',
+        'longest_task_waiting_sid': 'longest_task_waiting_sid',
+        'tasks_by_priority': 'tasks_by_priority',
+        'tasks_by_status': 'tasks_by_status',
+        'total_tasks': 'total_tasks',
+        'workflow_sid': 'workflow_sid',
+        'workspace_sid': 'workspace_sid',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload, workspace_sid, workflow_sid):
         """
         Initialize the WorkflowRealTimeStatisticsInstance
@@ -175,17 +216,7 @@ class WorkflowRealTimeStatisticsInstance(InstanceResource):
         super(WorkflowRealTimeStatisticsInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'longest_task_waiting_age': deserialize.integer(payload.get('longest_task_waiting_age')),
-            'longest_task_waiting_sid': payload.get('longest_task_waiting_sid'),
-            'tasks_by_priority': payload.get('tasks_by_priority'),
-            'tasks_by_status': payload.get('tasks_by_status'),
-            'total_tasks': deserialize.integer(payload.get('total_tasks')),
-            'workflow_sid': payload.get('workflow_sid'),
-            'workspace_sid': payload.get('workspace_sid'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -291,6 +322,17 @@ class WorkflowRealTimeStatisticsInstance(InstanceResource):
         """
         return self._proxy.fetch(task_channel=task_channel, )
 
+    async def fetch_async(self, task_channel=values.unset):
+        """
+        Asynchronous coroutine that fetches the WorkflowRealTimeStatisticsInstance
+
+        :param unicode task_channel: Only calculate real-time statistics on this TaskChannel
+
+        :returns: The fetched WorkflowRealTimeStatisticsInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.workflow.workflow_real_time_statistics.WorkflowRealTimeStatisticsInstance
+        """
+        return await self._proxy.fetch_async(task_channel=task_channel, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -124,7 +124,7 @@ class WorkspaceRealTimeStatisticsContext(InstanceContext):
 
         # Path Solution
         self._solution = {'workspace_sid': workspace_sid, }
-        self._uri = '/Workspaces/{workspace_sid}/RealTimeStatistics'.format(**self._solution)
+        self._uri = values.ResourceUri('/Workspaces/{workspace_sid}/RealTimeStatistics', self._solution)
 
     def fetch(self, task_channel=values.unset):
         """
@@ -145,6 +145,25 @@ class WorkspaceRealTimeStatisticsContext(InstanceContext):
             workspace_sid=self._solution['workspace_sid'],
         )
 
+    async def fetch_async(self, task_channel=values.unset):
+        """
+        Asynchronous coroutine that fetches the WorkspaceRealTimeStatisticsInstance
+
+        :param unicode task_channel: Only calculate real-time statistics on this TaskChannel
+
+        :returns: The fetched WorkspaceRealTimeStatisticsInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.workspace_real_time_statistics.WorkspaceRealTimeStatisticsInstance
+        """
+        data = values.of({'TaskChannel': task_channel, })
+
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, params=data, )
+
+        return WorkspaceRealTimeStatisticsInstance(
+            self._version,
+            payload,
+            workspace_sid=self._solution['workspace_sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -158,6 +177,29 @@ class WorkspaceRealTimeStatisticsContext(InstanceContext):
 
 class WorkspaceRealTimeStatisticsInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'longest_task_waiting_age': deserialize.integer,
+        'total_tasks': deserialize.integer,
+        'total_workers': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'activity_statistics': 'activity_statistics',
+        'longest_task_waiting_age': 'longest_task_waiting_age',
+        'longest_task_waiting_sid': 'longest_task_waiting_sid',
+        'tasks_by_priority': 'tasks_by_priority',
+        'tasks_by_status': 'tasks_by_status',
+        'total_tasks': 'total_tasks',
+        'total_workers': 'total_workers',
+        'workspace_sid': 'workspace_sid',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload, workspace_sid):
         """
         Initialize the WorkspaceRealTimeStatisticsInstance
@@ -168,18 +210,7 @@ class WorkspaceRealTimeStatisticsInstance(InstanceResource):
         super(WorkspaceRealTimeStatisticsInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'activity_statistics': payload.get('activity_statistics'),
-            'longest_task_waiting_age': deserialize.integer(payload.get('longest_task_waiting_age')),
-            'longest_task_waiting_sid': payload.get('longest_task_waiting_sid'),
-            'tasks_by_priority': payload.get('tasks_by_priority'),
-            'tasks_by_status': payload.get('tasks_by_status'),
-            'total_tasks': deserialize.integer(payload.get('total_tasks')),
-            'total_workers': deserialize.integer(payload.get('total_workers')),
-            'workspace_sid': payload.get('workspace_sid'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -292,6 +323,17 @@ class WorkspaceRealTimeStatisticsInstance(InstanceResource):
         """
         return self._proxy.fetch(task_channel=task_channel, )
 
+    async def fetch_async(self, task_channel=values.unset):
+        """
+        Asynchronous coroutine that fetches the WorkspaceRealTimeStatisticsInstance
+
+        :param unicode task_channel: Only calculate real-time statistics on this TaskChannel
+
+        :returns: The fetched WorkspaceRealTimeStatisticsInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.workspace_real_time_statistics.WorkspaceRealTimeStatisticsInstance
+        """
+        return await self._proxy.fetch_async(task_channel=task_channel, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -7,6 +7,7 @@ This code was generated by
 """
 
 from twilio.base import serialize
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
@@ -118,7 +119,7 @@ class WorkspaceStatisticsContext(InstanceContext):
 
         # Path Solution
         self._solution = {'workspace_sid': workspace_sid, }
-        self._uri = '/Workspaces/{workspace_sid}/Statistics'.format(**self._solution)
+        self._uri = values.ResourceUri('/Workspaces/{workspace_sid}/Statistics', self._solution)
 
     def fetch(self, minutes=values.unset, start_date=values.unset,
               end_date=values.unset, task_channel=values.unset,
@@ -151,6 +152,37 @@ class WorkspaceStatisticsContext(InstanceContext):
             workspace_sid=self._solution['workspace_sid'],
         )
 
+    async def fetch_async(self, minutes=values.unset, start_date=values.unset,
+                          end_date=values.unset, task_channel=values.unset,
+                          split_by_wait_time=values.unset):
+        """
+        Asynchronous coroutine that fetches the WorkspaceStatisticsInstance
+
+        :param unicode minutes: Only calculate statistics since this many minutes in the past
+        :param datetime start_date: Only calculate statistics from on or after this date
+        :param datetime end_date: Only calculate statistics from this date and time and earlier
+        :param unicode task_channel: Only calculate statistics on this TaskChannel.
+        :param unicode split_by_wait_time: A comma separated list of values that describes the thresholds to calculate statistics on
+
+        :returns: The fetched WorkspaceStatisticsInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.workspace_statistics.WorkspaceStatisticsInstance
+        """
+        data = values.of({
+            'Minutes': minutes,
+            'StartDate': serialize.iso8601_datetime(start_date),
+            'EndDate': serialize.iso8601_datetime(end_date),
+            'TaskChannel': task_channel,
+            'SplitByWaitTime': split_by_wait_time,
+        })
+
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, params=data, )
+
+        return WorkspaceStatisticsInstance(
+            self._version,
+            payload,
+            workspace_sid=self._solution['workspace_sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -164,6 +196,17 @@ class WorkspaceStatisticsContext(InstanceContext):
 
 class WorkspaceStatisticsInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'realtime': 'realtime',
+        'cumulative': 'cumulative',
+        'account_sid': 'account_sid',
+        'workspace_sid': 'workspace_sid',
+        'url': 'url',
+    })
+
     def __init__(self, version, payload, workspace_sid):
         """
         Initialize the WorkspaceStatisticsInstance
@@ -174,13 +217,7 @@ class WorkspaceStatisticsInstance(InstanceResource):
         super(WorkspaceStatisticsInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'realtime': payload.get('realtime'),
-            'cumulative': payload.get('cumulative'),
-            'account_sid': payload.get('account_sid'),
-            'workspace_sid': payload.get('workspace_sid'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -265,6 +302,29 @@ class WorkspaceStatisticsInstance(InstanceResource):
             split_by_wait_time=split_by_wait_time,
         )
 
+    async def fetch_async(self, minutes=values.unset, start_date=values.unset,
+                          end_date=values.unset, task_channel=values.unset,
+                          split_by_wait_time=values.unset):
+        """
+        Asynchronous coroutine that fetches the WorkspaceStatisticsInstance
+
+        :param unicode minutes: Only calculate statistics since this many minutes in the past
+        :param datetime start_date: Only calculate statistics from on or after this date
+        :param datetime end_date: Only calculate statistics from this date and time and earlier
+        :param unicode task_channel: Only calculate statistics on this TaskChannel.
+        :param unicode split_by_wait_time: A comma separated list of values that describes the thresholds to calculate statistics on
+
+        :returns: The fetched WorkspaceStatisticsInstance
+        :rtype: twilio.rest.taskrouter.v1.workspace.workspace_statistics.WorkspaceStatisticsInstance
+        """
+        return await self._proxy.fetch_async(
+            minutes=minutes,
+            start_date=start_date,
+            end_date=end_date,
+            task_channel=task_channel,
+            split_by_wait_time=split_by_wait_time,
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -6,8 +6,9 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base.domain import Domain
-from twilio.rest.trunking.v1 import V1
 
 
 class Trunking(Domain):
@@ -33,6 +34,7 @@ class Trunking(Domain):
         :rtype: twilio.rest.trunking.v1.V1
         """
         if self._v1 is None:
+            from twilio.rest.trunking.v1 import V1
             self._v1 = V1(self)
         return self._v1
 
@@ -51,3 +53,19 @@ class Trunking(Domain):
         :rtype: str
         """
         return '<Twilio.Trunking>'
+
+
+_LAZY_IMPORTS = {
+    'V1': 'twilio.rest.trunking.v1',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
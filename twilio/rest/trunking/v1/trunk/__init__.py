@@ -6,17 +6,14 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.trunking.v1.trunk.credential_list import CredentialListList
-from twilio.rest.trunking.v1.trunk.ip_access_control_list import IpAccessControlListList
-from twilio.rest.trunking.v1.trunk.origination_url import OriginationUrlList
-from twilio.rest.trunking.v1.trunk.phone_number import PhoneNumberList
-from twilio.rest.trunking.v1.trunk.recording import RecordingList
 
 
 class TrunkList(ListResource):
@@ -34,13 +31,13 @@ class TrunkList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Trunks'.format(**self._solution)
+        self._uri = values.ResourceUri('/Trunks', self._solution)
 
     def create(self, friendly_name=values.unset, domain_name=values.unset,
                disaster_recovery_url=values.unset,
                disaster_recovery_method=values.unset, transfer_mode=values.unset,
                secure=values.unset, cnam_lookup_enabled=values.unset,
-               transfer_caller_id=values.unset):
+               transfer_caller_id=values.unset, deadline=None):
         """
         Create the TrunkInstance
 
@@ -52,6 +49,8 @@ class TrunkList(ListResource):
         :param bool secure: Whether Secure Trunking is enabled for the trunk
         :param bool cnam_lookup_enabled: Whether Caller ID Name (CNAM) lookup should be enabled for the trunk
         :param TrunkInstance.TransferCallerId transfer_caller_id: Caller Id for transfer target
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created TrunkInstance
         :rtype: twilio.rest.trunking.v1.trunk.TrunkInstance
@@ -67,11 +66,48 @@ class TrunkList(ListResource):
             'TransferCallerId': transfer_caller_id,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return TrunkInstance(self._version, payload, )
 
-    def stream(self, limit=None, page_size=None):
+    async def create_async(self, friendly_name=values.unset, domain_name=values.unset,
+                           disaster_recovery_url=values.unset,
+                           disaster_recovery_method=values.unset, transfer_mode=values.unset,
+                           secure=values.unset, cnam_lookup_enabled=values.unset,
+                           transfer_caller_id=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the TrunkInstance
+
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode domain_name: The unique address you reserve on Twilio to which you route your SIP traffic
+        :param unicode disaster_recovery_url: The HTTP URL that we should call if an error occurs while sending SIP traffic towards your configured Origination URL
+        :param unicode disaster_recovery_method: The HTTP method we should use to call the disaster_recovery_url
+        :param TrunkInstance.TransferSetting transfer_mode: The call transfer settings for the trunk
+        :param bool secure: Whether Secure Trunking is enabled for the trunk
+        :param bool cnam_lookup_enabled: Whether Caller ID Name (CNAM) lookup should be enabled for the trunk
+        :param TrunkInstance.TransferCallerId transfer_caller_id: Caller Id for transfer target
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created TrunkInstance
+        :rtype: twilio.rest.trunking.v1.trunk.TrunkInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'DomainName': domain_name,
+            'DisasterRecoveryUrl': disaster_recovery_url,
+            'DisasterRecoveryMethod': disaster_recovery_method,
+            'TransferMode': transfer_mode,
+            'Secure': secure,
+            'CnamLookupEnabled': cnam_lookup_enabled,
+            'TransferCallerId': transfer_caller_id,
+        })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return TrunkInstance(self._version, payload, )
+
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams TrunkInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -84,17 +120,57 @@ class TrunkList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.trunking.v1.trunk.TrunkInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams TrunkInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.trunking.v1.trunk.TrunkInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists TrunkInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -106,11 +182,42 @@ class TrunkList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.trunking.v1.trunk.TrunkInstance]
+        """
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists TrunkInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.trunking.v1.trunk.TrunkInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -131,6 +238,25 @@ class TrunkList(ListResource):
 
         return TrunkPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of TrunkInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of TrunkInstance
+        :rtype: twilio.rest.trunking.v1.trunk.TrunkPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return TrunkPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of TrunkInstance records from the API.
@@ -148,6 +274,23 @@ class TrunkList(ListResource):
 
         return TrunkPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of TrunkInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of TrunkInstance
+        :rtype: twilio.rest.trunking.v1.trunk.TrunkPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return TrunkPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a TrunkContext
@@ -234,7 +377,7 @@ class TrunkContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/Trunks/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Trunks/{sid}', self._solution)
 
         # Dependents
         self._origination_urls = None
@@ -254,6 +397,17 @@ class TrunkContext(InstanceContext):
 
         return TrunkInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the TrunkInstance
+
+        :returns: The fetched TrunkInstance
+        :rtype: twilio.rest.trunking.v1.trunk.TrunkInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return TrunkInstance(self._version, payload, sid=self._solution['sid'], )
+
     def delete(self):
         """
         Deletes the TrunkInstance
@@ -263,6 +417,15 @@ class TrunkContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the TrunkInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def update(self, friendly_name=values.unset, domain_name=values.unset,
                disaster_recovery_url=values.unset,
                disaster_recovery_method=values.unset, transfer_mode=values.unset,
@@ -298,6 +461,41 @@ class TrunkContext(InstanceContext):
 
         return TrunkInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def update_async(self, friendly_name=values.unset, domain_name=values.unset,
+                           disaster_recovery_url=values.unset,
+                           disaster_recovery_method=values.unset, transfer_mode=values.unset,
+                           secure=values.unset, cnam_lookup_enabled=values.unset,
+                           transfer_caller_id=values.unset):
+        """
+        Asynchronous coroutine that updates the TrunkInstance
+
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode domain_name: The unique address you reserve on Twilio to which you route your SIP traffic
+        :param unicode disaster_recovery_url: The HTTP URL that we should call if an error occurs while sending SIP traffic towards your configured Origination URL
+        :param unicode disaster_recovery_method: The HTTP method we should use to call the disaster_recovery_url
+        :param TrunkInstance.TransferSetting transfer_mode: The call transfer settings for the trunk
+        :param bool secure: Whether Secure Trunking is enabled for the trunk
+        :param bool cnam_lookup_enabled: Whether Caller ID Name (CNAM) lookup should be enabled for the trunk
+        :param TrunkInstance.TransferCallerId transfer_caller_id: Caller Id for transfer target
+
+        :returns: The updated TrunkInstance
+        :rtype: twilio.rest.trunking.v1.trunk.TrunkInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'DomainName': domain_name,
+            'DisasterRecoveryUrl': disaster_recovery_url,
+            'DisasterRecoveryMethod': disaster_recovery_method,
+            'TransferMode': transfer_mode,
+            'Secure': secure,
+            'CnamLookupEnabled': cnam_lookup_enabled,
+            'TransferCallerId': transfer_caller_id,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return TrunkInstance(self._version, payload, sid=self._solution['sid'], )
+
     @property
     def origination_urls(self):
         """
@@ -307,6 +505,7 @@ class TrunkContext(InstanceContext):
         :rtype: twilio.rest.trunking.v1.trunk.origination_url.OriginationUrlList
         """
         if self._origination_urls is None:
+            from twilio.rest.trunking.v1.trunk.origination_url import OriginationUrlList
             self._origination_urls = OriginationUrlList(self._version, trunk_sid=self._solution['sid'], )
         return self._origination_urls
 
@@ -319,6 +518,7 @@ class TrunkContext(InstanceContext):
         :rtype: twilio.rest.trunking.v1.trunk.credential_list.CredentialListList
         """
         if self._credentials_lists is None:
+            from twilio.rest.trunking.v1.trunk.credential_list import CredentialListList
             self._credentials_lists = CredentialListList(self._version, trunk_sid=self._solution['sid'], )
         return self._credentials_lists
 
@@ -331,6 +531,7 @@ class TrunkContext(InstanceContext):
         :rtype: twilio.rest.trunking.v1.trunk.ip_access_control_list.IpAccessControlListList
         """
         if self._ip_access_control_lists is None:
+            from twilio.rest.trunking.v1.trunk.ip_access_control_list import IpAccessControlListList
             self._ip_access_control_lists = IpAccessControlListList(
                 self._version,
                 trunk_sid=self._solution['sid'],
@@ -346,6 +547,7 @@ class TrunkContext(InstanceContext):
         :rtype: twilio.rest.trunking.v1.trunk.phone_number.PhoneNumberList
         """
         if self._phone_numbers is None:
+            from twilio.rest.trunking.v1.trunk.phone_number import PhoneNumberList
             self._phone_numbers = PhoneNumberList(self._version, trunk_sid=self._solution['sid'], )
         return self._phone_numbers
 
@@ -358,6 +560,7 @@ class TrunkContext(InstanceContext):
         :rtype: twilio.rest.trunking.v1.trunk.recording.RecordingList
         """
         if self._recordings is None:
+            from twilio.rest.trunking.v1.trunk.recording import RecordingList
             self._recordings = RecordingList(self._version, trunk_sid=self._solution['sid'], )
         return self._recordings
 
@@ -383,6 +586,35 @@ class TrunkInstance(InstanceResource):
         FROM_TRANSFEREE = "from-transferee"
         FROM_TRANSFEROR = "from-transferor"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'domain_name': 'domain_name',
+        'disaster_recovery_method': 'disaster_recovery_method',
+        'disaster_recovery_url': 'disaster_recovery_url',
+        'friendly_name': 'friendly_name',
+        'secure': 'secure',
+        'recording': 'recording',
+        'transfer_mode': 'transfer_mode',
+        'transfer_caller_id': 'transfer_caller_id',
+        'cnam_lookup_enabled': 'cnam_lookup_enabled',
+        'auth_type': 'auth_type',
+        'auth_type_set': 'auth_type_set',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'sid': 'sid',
+        'url': 'url',
+        'links': 'links',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the TrunkInstance
@@ -393,25 +625,7 @@ class TrunkInstance(InstanceResource):
         super(TrunkInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'domain_name': payload.get('domain_name'),
-            'disaster_recovery_method': payload.get('disaster_recovery_method'),
-            'disaster_recovery_url': payload.get('disaster_recovery_url'),
-            'friendly_name': payload.get('friendly_name'),
-            'secure': payload.get('secure'),
-            'recording': payload.get('recording'),
-            'transfer_mode': payload.get('transfer_mode'),
-            'transfer_caller_id': payload.get('transfer_caller_id'),
-            'cnam_lookup_enabled': payload.get('cnam_lookup_enabled'),
-            'auth_type': payload.get('auth_type'),
-            'auth_type_set': payload.get('auth_type_set'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'sid': payload.get('sid'),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -575,6 +789,15 @@ class TrunkInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the TrunkInstance
+
+        :returns: The fetched TrunkInstance
+        :rtype: twilio.rest.trunking.v1.trunk.TrunkInstance
+        """
+        return await self._proxy.fetch_async()
+
     def delete(self):
         """
         Deletes the TrunkInstance
@@ -584,6 +807,15 @@ class TrunkInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the TrunkInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def update(self, friendly_name=values.unset, domain_name=values.unset,
                disaster_recovery_url=values.unset,
                disaster_recovery_method=values.unset, transfer_mode=values.unset,
@@ -615,6 +847,37 @@ class TrunkInstance(InstanceResource):
             transfer_caller_id=transfer_caller_id,
         )
 
+    async def update_async(self, friendly_name=values.unset, domain_name=values.unset,
+                           disaster_recovery_url=values.unset,
+                           disaster_recovery_method=values.unset, transfer_mode=values.unset,
+                           secure=values.unset, cnam_lookup_enabled=values.unset,
+                           transfer_caller_id=values.unset):
+        """
+        Asynchronous coroutine that updates the TrunkInstance
+
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode domain_name: The unique address you reserve on Twilio to which you route your SIP traffic
+        :param unicode disaster_recovery_url: The HTTP URL that we should call if an error occurs while sending SIP traffic towards your configured Origination URL
+        :param unicode disaster_recovery_method: The HTTP method we should use to call the disaster_recovery_url
+        :param TrunkInstance.TransferSetting transfer_mode: The call transfer settings for the trunk
+        :param bool secure: Whether Secure Trunking is enabled for the trunk
+        :param bool cnam_lookup_enabled: Whether Caller ID Name (CNAM) lookup should be enabled for the trunk
+        :param TrunkInstance.TransferCallerId transfer_caller_id: Caller Id for transfer target
+
+        :returns: The updated TrunkInstance
+        :rtype: twilio.rest.trunking.v1.trunk.TrunkInstance
+        """
+        return await self._proxy.update_async(
+            friendly_name=friendly_name,
+            domain_name=domain_name,
+            disaster_recovery_url=disaster_recovery_url,
+            disaster_recovery_method=disaster_recovery_method,
+            transfer_mode=transfer_mode,
+            secure=secure,
+            cnam_lookup_enabled=cnam_lookup_enabled,
+            transfer_caller_id=transfer_caller_id,
+        )
+
     @property
     def origination_urls(self):
         """
@@ -674,3 +937,23 @@ class TrunkInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Trunking.V1.TrunkInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'CredentialListList': 'twilio.rest.trunking.v1.trunk.credential_list',
+    'IpAccessControlListList': 'twilio.rest.trunking.v1.trunk.ip_access_control_list',
+    'OriginationUrlList': 'twilio.rest.trunking.v1.trunk.origination_url',
+    'PhoneNumberList': 'twilio.rest.trunking.v1.trunk.phone_number',
+    'RecordingList': 'twilio.rest.trunking.v1.trunk.recording',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
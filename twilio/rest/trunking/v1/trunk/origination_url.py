@@ -30,9 +30,9 @@ class OriginationUrlList(ListResource):
 
         # Path Solution
         self._solution = {'trunk_sid': trunk_sid, }
-        self._uri = '/Trunks/{trunk_sid}/OriginationUrls'.format(**self._solution)
+        self._uri = values.ResourceUri('/Trunks/{trunk_sid}/OriginationUrls', self._solution)
 
-    def create(self, weight, priority, enabled, friendly_name, sip_url):
+    def create(self, weight, priority, enabled, friendly_name, sip_url, deadline=None):
         """
         Create the OriginationUrlInstance
 
@@ -41,6 +41,8 @@ class OriginationUrlList(ListResource):
         :param bool enabled: Whether the URL is enabled
         :param unicode friendly_name: A string to describe the resource
         :param unicode sip_url: The SIP address you want Twilio to route your Origination calls to
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created OriginationUrlInstance
         :rtype: twilio.rest.trunking.v1.trunk.origination_url.OriginationUrlInstance
@@ -53,11 +55,38 @@ class OriginationUrlList(ListResource):
             'SipUrl': sip_url,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return OriginationUrlInstance(self._version, payload, trunk_sid=self._solution['trunk_sid'], )
 
-    def stream(self, limit=None, page_size=None):
+    async def create_async(self, weight, priority, enabled, friendly_name, sip_url, deadline=None):
+        """
+        Asynchronous coroutine that creates the OriginationUrlInstance
+
+        :param unicode weight: The value that determines the relative load the URI should receive compared to others with the same priority
+        :param unicode priority: The relative importance of the URI
+        :param bool enabled: Whether the URL is enabled
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode sip_url: The SIP address you want Twilio to route your Origination calls to
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created OriginationUrlInstance
+        :rtype: twilio.rest.trunking.v1.trunk.origination_url.OriginationUrlInstance
+        """
+        data = values.of({
+            'Weight': weight,
+            'Priority': priority,
+            'Enabled': enabled,
+            'FriendlyName': friendly_name,
+            'SipUrl': sip_url,
+        })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return OriginationUrlInstance(self._version, payload, trunk_sid=self._solution['trunk_sid'], )
+
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams OriginationUrlInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -70,17 +99,57 @@ class OriginationUrlList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.trunking.v1.trunk.origination_url.OriginationUrlInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams OriginationUrlInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.trunking.v1.trunk.origination_url.OriginationUrlInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists OriginationUrlInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -92,11 +161,42 @@ class OriginationUrlList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.trunking.v1.trunk.origination_url.OriginationUrlInstance]
+        """
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists OriginationUrlInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.trunking.v1.trunk.origination_url.OriginationUrlInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -117,6 +217,25 @@ class OriginationUrlList(ListResource):
 
         return OriginationUrlPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of OriginationUrlInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of OriginationUrlInstance
+        :rtype: twilio.rest.trunking.v1.trunk.origination_url.OriginationUrlPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return OriginationUrlPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of OriginationUrlInstance records from the API.
@@ -134,6 +253,23 @@ class OriginationUrlList(ListResource):
 
         return OriginationUrlPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of OriginationUrlInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of OriginationUrlInstance
+        :rtype: twilio.rest.trunking.v1.trunk.origination_url.OriginationUrlPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return OriginationUrlPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a OriginationUrlContext
@@ -222,7 +358,7 @@ class OriginationUrlContext(InstanceContext):
 
         # Path Solution
         self._solution = {'trunk_sid': trunk_sid, 'sid': sid, }
-        self._uri = '/Trunks/{trunk_sid}/OriginationUrls/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Trunks/{trunk_sid}/OriginationUrls/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -240,6 +376,22 @@ class OriginationUrlContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the OriginationUrlInstance
+
+        :returns: The fetched OriginationUrlInstance
+        :rtype: twilio.rest.trunking.v1.trunk.origination_url.OriginationUrlInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return OriginationUrlInstance(
+            self._version,
+            payload,
+            trunk_sid=self._solution['trunk_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self):
         """
         Deletes the OriginationUrlInstance
@@ -249,6 +401,15 @@ class OriginationUrlContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the OriginationUrlInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def update(self, weight=values.unset, priority=values.unset,
                enabled=values.unset, friendly_name=values.unset,
                sip_url=values.unset):
@@ -281,6 +442,38 @@ class OriginationUrlContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, weight=values.unset, priority=values.unset,
+                           enabled=values.unset, friendly_name=values.unset,
+                           sip_url=values.unset):
+        """
+        Asynchronous coroutine that updates the OriginationUrlInstance
+
+        :param unicode weight: The value that determines the relative load the URI should receive compared to others with the same priority
+        :param unicode priority: The relative importance of the URI
+        :param bool enabled: Whether the URL is enabled
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode sip_url: The SIP address you want Twilio to route your Origination calls to
+
+        :returns: The updated OriginationUrlInstance
+        :rtype: twilio.rest.trunking.v1.trunk.origination_url.OriginationUrlInstance
+        """
+        data = values.of({
+            'Weight': weight,
+            'Priority': priority,
+            'Enabled': enabled,
+            'FriendlyName': friendly_name,
+            'SipUrl': sip_url,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return OriginationUrlInstance(
+            self._version,
+            payload,
+            trunk_sid=self._solution['trunk_sid'],
+            sid=self._solution['sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -294,6 +487,31 @@ class OriginationUrlContext(InstanceContext):
 
 class OriginationUrlInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'weight': deserialize.integer,
+        'priority': deserialize.integer,
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'sid': 'sid',
+        'trunk_sid': 'trunk_sid',
+        'weight': 'weight',
+        'enabled': 'enabled',
+        'sip_url': 'sip_url',
+        'friendly_name': 'friendly_name',
+        'priority': 'priority',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload, trunk_sid, sid=None):
         """
         Initialize the OriginationUrlInstance
@@ -304,19 +522,7 @@ class OriginationUrlInstance(InstanceResource):
         super(OriginationUrlInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'sid': payload.get('sid'),
-            'trunk_sid': payload.get('trunk_sid'),
-            'weight': deserialize.integer(payload.get('weight')),
-            'enabled': payload.get('enabled'),
-            'sip_url': payload.get('sip_url'),
-            'friendly_name': payload.get('friendly_name'),
-            'priority': deserialize.integer(payload.get('priority')),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -436,6 +642,15 @@ class OriginationUrlInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the OriginationUrlInstance
+
+        :returns: The fetched OriginationUrlInstance
+        :rtype: twilio.rest.trunking.v1.trunk.origination_url.OriginationUrlInstance
+        """
+        return await self._proxy.fetch_async()
+
     def delete(self):
         """
         Deletes the OriginationUrlInstance
@@ -445,6 +660,15 @@ class OriginationUrlInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the OriginationUrlInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def update(self, weight=values.unset, priority=values.unset,
                enabled=values.unset, friendly_name=values.unset,
                sip_url=values.unset):
@@ -468,6 +692,29 @@ class OriginationUrlInstance(InstanceResource):
             sip_url=sip_url,
         )
 
+    async def update_async(self, weight=values.unset, priority=values.unset,
+                           enabled=values.unset, friendly_name=values.unset,
+                           sip_url=values.unset):
+        """
+        Asynchronous coroutine that updates the OriginationUrlInstance
+
+        :param unicode weight: The value that determines the relative load the URI should receive compared to others with the same priority
+        :param unicode priority: The relative importance of the URI
+        :param bool enabled: Whether the URL is enabled
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode sip_url: The SIP address you want Twilio to route your Origination calls to
+
+        :returns: The updated OriginationUrlInstance
+        :rtype: twilio.rest.trunking.v1.trunk.origination_url.OriginationUrlInstance
+        """
+        return await self._proxy.update_async(
+            weight=weight,
+            priority=priority,
+            enabled=enabled,
+            friendly_name=friendly_name,
+            sip_url=sip_url,
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
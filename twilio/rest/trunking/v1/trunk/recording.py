@@ -6,6 +6,7 @@ This code was generated by
       /       /
 """
 
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
@@ -113,7 +114,7 @@ class RecordingContext(InstanceContext):
 
         # Path Solution
         self._solution = {'trunk_sid': trunk_sid, }
-        self._uri = '/Trunks/{trunk_sid}/Recording'.format(**self._solution)
+        self._uri = values.ResourceUri('/Trunks/{trunk_sid}/Recording', self._solution)
 
     def fetch(self):
         """
@@ -126,6 +127,17 @@ class RecordingContext(InstanceContext):
 
         return RecordingInstance(self._version, payload, trunk_sid=self._solution['trunk_sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the RecordingInstance
+
+        :returns: The fetched RecordingInstance
+        :rtype: twilio.rest.trunking.v1.trunk.recording.RecordingInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return RecordingInstance(self._version, payload, trunk_sid=self._solution['trunk_sid'], )
+
     def update(self, mode=values.unset, trim=values.unset):
         """
         Update the RecordingInstance
@@ -142,6 +154,22 @@ class RecordingContext(InstanceContext):
 
         return RecordingInstance(self._version, payload, trunk_sid=self._solution['trunk_sid'], )
 
+    async def update_async(self, mode=values.unset, trim=values.unset):
+        """
+        Asynchronous coroutine that updates the RecordingInstance
+
+        :param RecordingInstance.RecordingMode mode: The recording mode for the trunk.
+        :param RecordingInstance.RecordingTrim trim: The recording trim setting for the trunk.
+
+        :returns: The updated RecordingInstance
+        :rtype: twilio.rest.trunking.v1.trunk.recording.RecordingInstance
+        """
+        data = values.of({'Mode': mode, 'Trim': trim, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return RecordingInstance(self._version, payload, trunk_sid=self._solution['trunk_sid'], )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -166,6 +194,14 @@ class RecordingInstance(InstanceResource):
         TRIM_SILENCE = "trim-silence"
         DO_NOT_TRIM = "do-not-trim"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'mode': 'mode',
+        'trim': 'trim',
+    })
+
     def __init__(self, version, payload, trunk_sid):
         """
         Initialize the RecordingInstance
@@ -176,7 +212,7 @@ class RecordingInstance(InstanceResource):
         super(RecordingInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {'mode': payload.get('mode'), 'trim': payload.get('trim'), }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -220,6 +256,15 @@ class RecordingInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the RecordingInstance
+
+        :returns: The fetched RecordingInstance
+        :rtype: twilio.rest.trunking.v1.trunk.recording.RecordingInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, mode=values.unset, trim=values.unset):
         """
         Update the RecordingInstance
@@ -232,6 +277,18 @@ class RecordingInstance(InstanceResource):
         """
         return self._proxy.update(mode=mode, trim=trim, )
 
+    async def update_async(self, mode=values.unset, trim=values.unset):
+        """
+        Asynchronous coroutine that updates the RecordingInstance
+
+        :param RecordingInstance.RecordingMode mode: The recording mode for the trunk.
+        :param RecordingInstance.RecordingTrim trim: The recording trim setting for the trunk.
+
+        :returns: The updated RecordingInstance
+        :rtype: twilio.rest.trunking.v1.trunk.recording.RecordingInstance
+        """
+        return await self._proxy.update_async(mode=mode, trim=trim, )
+
     def __repr__(self):
         """
         Provide a friendly representation
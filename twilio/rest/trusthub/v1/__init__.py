@@ -6,14 +6,9 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base.version import Version
-from twilio.rest.trusthub.v1.customer_profiles import CustomerProfilesList
-from twilio.rest.trusthub.v1.end_user import EndUserList
-from twilio.rest.trusthub.v1.end_user_type import EndUserTypeList
-from twilio.rest.trusthub.v1.policies import PoliciesList
-from twilio.rest.trusthub.v1.supporting_document import SupportingDocumentList
-from twilio.rest.trusthub.v1.supporting_document_type import SupportingDocumentTypeList
-from twilio.rest.trusthub.v1.trust_products import TrustProductsList
 
 
 class V1(Version):
@@ -41,6 +36,7 @@ class V1(Version):
         :rtype: twilio.rest.trusthub.v1.customer_profiles.CustomerProfilesList
         """
         if self._customer_profiles is None:
+            from twilio.rest.trusthub.v1.customer_profiles import CustomerProfilesList
             self._customer_profiles = CustomerProfilesList(self)
         return self._customer_profiles
 
@@ -50,6 +46,7 @@ class V1(Version):
         :rtype: twilio.rest.trusthub.v1.end_user.EndUserList
         """
         if self._end_users is None:
+            from twilio.rest.trusthub.v1.end_user import EndUserList
             self._end_users = EndUserList(self)
         return self._end_users
 
@@ -59,6 +56,7 @@ class V1(Version):
         :rtype: twilio.rest.trusthub.v1.end_user_type.EndUserTypeList
         """
         if self._end_user_types is None:
+            from twilio.rest.trusthub.v1.end_user_type import EndUserTypeList
             self._end_user_types = EndUserTypeList(self)
         return self._end_user_types
 
@@ -68,6 +66,7 @@ class V1(Version):
         :rtype: twilio.rest.trusthub.v1.policies.PoliciesList
         """
         if self._policies is None:
+            from twilio.rest.trusthub.v1.policies import PoliciesList
             self._policies = PoliciesList(self)
         return self._policies
 
@@ -77,6 +76,7 @@ class V1(Version):
         :rtype: twilio.rest.trusthub.v1.supporting_document.SupportingDocumentList
         """
         if self._supporting_documents is None:
+            from twilio.rest.trusthub.v1.supporting_document import SupportingDocumentList
             self._supporting_documents = SupportingDocumentList(self)
         return self._supporting_documents
 
@@ -86,6 +86,7 @@ class V1(Version):
         :rtype: twilio.rest.trusthub.v1.supporting_document_type.SupportingDocumentTypeList
         """
         if self._supporting_document_types is None:
+            from twilio.rest.trusthub.v1.supporting_document_type import SupportingDocumentTypeList
             self._supporting_document_types = SupportingDocumentTypeList(self)
         return self._supporting_document_types
 
@@ -95,6 +96,7 @@ class V1(Version):
         :rtype: twilio.rest.trusthub.v1.trust_products.TrustProductsList
         """
         if self._trust_products is None:
+            from twilio.rest.trusthub.v1.trust_products import TrustProductsList
             self._trust_products = TrustProductsList(self)
         return self._trust_products
 
@@ -106,3 +108,25 @@ class V1(Version):
         :rtype: str
         """
         return '<Twilio.Trusthub.V1>'
+
+
+_LAZY_IMPORTS = {
+    'CustomerProfilesList': 'twilio.rest.trusthub.v1.customer_profiles',
+    'EndUserList': 'twilio.rest.trusthub.v1.end_user',
+    'EndUserTypeList': 'twilio.rest.trusthub.v1.end_user_type',
+    'PoliciesList': 'twilio.rest.trusthub.v1.policies',
+    'SupportingDocumentList': 'twilio.rest.trusthub.v1.supporting_document',
+    'SupportingDocumentTypeList': 'twilio.rest.trusthub.v1.supporting_document_type',
+    'TrustProductsList': 'twilio.rest.trusthub.v1.trust_products',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -6,15 +6,14 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.trusthub.v1.customer_profiles.customer_profiles_channel_endpoint_assignment import CustomerProfilesChannelEndpointAssignmentList
-from twilio.rest.trusthub.v1.customer_profiles.customer_profiles_entity_assignments import CustomerProfilesEntityAssignmentsList
-from twilio.rest.trusthub.v1.customer_profiles.customer_profiles_evaluations import CustomerProfilesEvaluationsList
 
 
 class CustomerProfilesList(ListResource):
@@ -32,10 +31,10 @@ class CustomerProfilesList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/CustomerProfiles'.format(**self._solution)
+        self._uri = values.ResourceUri('/CustomerProfiles', self._solution)
 
     def create(self, friendly_name, email, policy_sid,
-               status_callback=values.unset):
+               status_callback=values.unset, deadline=None):
         """
         Create the CustomerProfilesInstance
 
@@ -43,6 +42,34 @@ class CustomerProfilesList(ListResource):
         :param unicode email: The email address
         :param unicode policy_sid: The unique string of a policy.
         :param unicode status_callback: The URL we call to inform your application of status changes.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created CustomerProfilesInstance
+        :rtype: twilio.rest.trusthub.v1.customer_profiles.CustomerProfilesInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'Email': email,
+            'PolicySid': policy_sid,
+            'StatusCallback': status_callback,
+        })
+
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return CustomerProfilesInstance(self._version, payload, )
+
+    async def create_async(self, friendly_name, email, policy_sid,
+                           status_callback=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the CustomerProfilesInstance
+
+        :param unicode friendly_name: The string that you assigned to describe the resource
+        :param unicode email: The email address
+        :param unicode policy_sid: The unique string of a policy.
+        :param unicode status_callback: The URL we call to inform your application of status changes.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created CustomerProfilesInstance
         :rtype: twilio.rest.trusthub.v1.customer_profiles.CustomerProfilesInstance
@@ -54,12 +81,13 @@ class CustomerProfilesList(ListResource):
             'StatusCallback': status_callback,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return CustomerProfilesInstance(self._version, payload, )
 
     def stream(self, status=values.unset, friendly_name=values.unset,
-               policy_sid=values.unset, limit=None, page_size=None):
+               policy_sid=values.unset, limit=None, page_size=None,
+               prefetch=None, raw=False, deadline=None):
         """
         Streams CustomerProfilesInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -75,23 +103,73 @@ class CustomerProfilesList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.trusthub.v1.customer_profiles.CustomerProfilesInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
-            status=status,
-            friendly_name=friendly_name,
-            policy_sid=policy_sid,
-            page_size=limits['page_size'],
-        )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                status=status,
+                friendly_name=friendly_name,
+                policy_sid=policy_sid,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, status=values.unset, friendly_name=values.unset,
+                           policy_sid=values.unset, limit=None, page_size=None,
+                           prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams CustomerProfilesInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param CustomerProfilesInstance.Status status: The verification status of the Customer-Profile resource
+        :param unicode friendly_name: The string that you assigned to describe the resource
+        :param unicode policy_sid: The unique string of a policy.
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.trusthub.v1.customer_profiles.CustomerProfilesInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
 
-        return self._version.stream(page, limits['limit'])
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                status=status,
+                friendly_name=friendly_name,
+                policy_sid=policy_sid,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, status=values.unset, friendly_name=values.unset,
-             policy_sid=values.unset, limit=None, page_size=None):
+             policy_sid=values.unset, limit=None, page_size=None,
+             prefetch=None, raw=False, deadline=None):
         """
         Lists CustomerProfilesInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -106,6 +184,12 @@ class CustomerProfilesList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.trusthub.v1.customer_profiles.CustomerProfilesInstance]
@@ -116,8 +200,49 @@ class CustomerProfilesList(ListResource):
             policy_sid=policy_sid,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, status=values.unset, friendly_name=values.unset,
+                         policy_sid=values.unset, limit=None, page_size=None,
+                         prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists CustomerProfilesInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param CustomerProfilesInstance.Status status: The verification status of the Customer-Profile resource
+        :param unicode friendly_name: The string that you assigned to describe the resource
+        :param unicode policy_sid: The unique string of a policy.
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.trusthub.v1.customer_profiles.CustomerProfilesInstance]
+        """
+        return [record async for record in await self.stream_async(
+            status=status,
+            friendly_name=friendly_name,
+            policy_sid=policy_sid,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, status=values.unset, friendly_name=values.unset,
              policy_sid=values.unset, page_token=values.unset,
              page_number=values.unset, page_size=values.unset):
@@ -148,6 +273,36 @@ class CustomerProfilesList(ListResource):
 
         return CustomerProfilesPage(self._version, response, self._solution)
 
+    async def page_async(self, status=values.unset, friendly_name=values.unset,
+                         policy_sid=values.unset, page_token=values.unset,
+                         page_number=values.unset, page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of CustomerProfilesInstance records from the API.
+        Request is executed immediately
+
+        :param CustomerProfilesInstance.Status status: The verification status of the Customer-Profile resource
+        :param unicode friendly_name: The string that you assigned to describe the resource
+        :param unicode policy_sid: The unique string of a policy.
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of CustomerProfilesInstance
+        :rtype: twilio.rest.trusthub.v1.customer_profiles.CustomerProfilesPage
+        """
+        data = values.of({
+            'Status': status,
+            'FriendlyName': friendly_name,
+            'PolicySid': policy_sid,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return CustomerProfilesPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of CustomerProfilesInstance records from the API.
@@ -165,6 +320,23 @@ class CustomerProfilesList(ListResource):
 
         return CustomerProfilesPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of CustomerProfilesInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of CustomerProfilesInstance
+        :rtype: twilio.rest.trusthub.v1.customer_profiles.CustomerProfilesPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return CustomerProfilesPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a CustomerProfilesContext
@@ -251,7 +423,7 @@ class CustomerProfilesContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/CustomerProfiles/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/CustomerProfiles/{sid}', self._solution)
 
         # Dependents
         self._customer_profiles_entity_assignments = None
@@ -269,6 +441,17 @@ class CustomerProfilesContext(InstanceContext):
 
         return CustomerProfilesInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the CustomerProfilesInstance
+
+        :returns: The fetched CustomerProfilesInstance
+        :rtype: twilio.rest.trusthub.v1.customer_profiles.CustomerProfilesInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return CustomerProfilesInstance(self._version, payload, sid=self._solution['sid'], )
+
     def update(self, status=values.unset, status_callback=values.unset,
                friendly_name=values.unset, email=values.unset):
         """
@@ -293,6 +476,30 @@ class CustomerProfilesContext(InstanceContext):
 
         return CustomerProfilesInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def update_async(self, status=values.unset, status_callback=values.unset,
+                           friendly_name=values.unset, email=values.unset):
+        """
+        Asynchronous coroutine that updates the CustomerProfilesInstance
+
+        :param CustomerProfilesInstance.Status status: The verification status of the Customer-Profile resource
+        :param unicode status_callback: The URL we call to inform your application of status changes.
+        :param unicode friendly_name: The string that you assigned to describe the resource
+        :param unicode email: The email address
+
+        :returns: The updated CustomerProfilesInstance
+        :rtype: twilio.rest.trusthub.v1.customer_profiles.CustomerProfilesInstance
+        """
+        data = values.of({
+            'Status': status,
+            'StatusCallback': status_callback,
+            'FriendlyName': friendly_name,
+            'Email': email,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return CustomerProfilesInstance(self._version, payload, sid=self._solution['sid'], )
+
     def delete(self):
         """
         Deletes the CustomerProfilesInstance
@@ -302,6 +509,15 @@ class CustomerProfilesContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the CustomerProfilesInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     @property
     def customer_profiles_entity_assignments(self):
         """
@@ -311,6 +527,7 @@ class CustomerProfilesContext(InstanceContext):
         :rtype: twilio.rest.trusthub.v1.customer_profiles.customer_profiles_entity_assignments.CustomerProfilesEntityAssignmentsList
         """
         if self._customer_profiles_entity_assignments is None:
+            from twilio.rest.trusthub.v1.customer_profiles.customer_profiles_entity_assignments import CustomerProfilesEntityAssignmentsList
             self._customer_profiles_entity_assignments = CustomerProfilesEntityAssignmentsList(
                 self._version,
                 customer_profile_sid=self._solution['sid'],
@@ -326,6 +543,7 @@ class CustomerProfilesContext(InstanceContext):
         :rtype: twilio.rest.trusthub.v1.customer_profiles.customer_profiles_evaluations.CustomerProfilesEvaluationsList
         """
         if self._customer_profiles_evaluations is None:
+            from twilio.rest.trusthub.v1.customer_profiles.customer_profiles_evaluations import CustomerProfilesEvaluationsList
             self._customer_profiles_evaluations = CustomerProfilesEvaluationsList(
                 self._version,
                 customer_profile_sid=self._solution['sid'],
@@ -341,6 +559,7 @@ class CustomerProfilesContext(InstanceContext):
         :rtype: twilio.rest.trusthub.v1.customer_profiles.customer_profiles_channel_endpoint_assignment.CustomerProfilesChannelEndpointAssignmentList
         """
         if self._customer_profiles_channel_endpoint_assignment is None:
+            from twilio.rest.trusthub.v1.customer_profiles.customer_profiles_channel_endpoint_assignment import CustomerProfilesChannelEndpointAssignmentList
             self._customer_profiles_channel_endpoint_assignment = CustomerProfilesChannelEndpointAssignmentList(
                 self._version,
                 customer_profile_sid=self._solution['sid'],
@@ -371,6 +590,31 @@ class CustomerProfilesInstance(InstanceResource):
         INDIVIDUAL = "individual"
         BUSINESS = "business"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'valid_until': deserialize.iso8601_datetime,
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'policy_sid': 'policy_sid',
+        'friendly_name': 'friendly_name',
+        'status': 'status',
+        'valid_until': 'valid_until',
+        'email': 'email',
+        'status_callback': 'status_callback',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'url': 'url',
+        'links': 'links',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the CustomerProfilesInstance
@@ -381,20 +625,7 @@ class CustomerProfilesInstance(InstanceResource):
         super(CustomerProfilesInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'policy_sid': payload.get('policy_sid'),
-            'friendly_name': payload.get('friendly_name'),
-            'status': payload.get('status'),
-            'valid_until': deserialize.iso8601_datetime(payload.get('valid_until')),
-            'email': payload.get('email'),
-            'status_callback': payload.get('status_callback'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -518,6 +749,15 @@ class CustomerProfilesInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the CustomerProfilesInstance
+
+        :returns: The fetched CustomerProfilesInstance
+        :rtype: twilio.rest.trusthub.v1.customer_profiles.CustomerProfilesInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, status=values.unset, status_callback=values.unset,
                friendly_name=values.unset, email=values.unset):
         """
@@ -538,6 +778,26 @@ class CustomerProfilesInstance(InstanceResource):
             email=email,
         )
 
+    async def update_async(self, status=values.unset, status_callback=values.unset,
+                           friendly_name=values.unset, email=values.unset):
+        """
+        Asynchronous coroutine that updates the CustomerProfilesInstance
+
+        :param CustomerProfilesInstance.Status status: The verification status of the Customer-Profile resource
+        :param unicode status_callback: The URL we call to inform your application of status changes.
+        :param unicode friendly_name: The string that you assigned to describe the resource
+        :param unicode email: The email address
+
+        :returns: The updated CustomerProfilesInstance
+        :rtype: twilio.rest.trusthub.v1.customer_profiles.CustomerProfilesInstance
+        """
+        return await self._proxy.update_async(
+            status=status,
+            status_callback=status_callback,
+            friendly_name=friendly_name,
+            email=email,
+        )
+
     def delete(self):
         """
         Deletes the CustomerProfilesInstance
@@ -547,6 +807,15 @@ class CustomerProfilesInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the CustomerProfilesInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     @property
     def customer_profiles_entity_assignments(self):
         """
@@ -586,3 +855,21 @@ class CustomerProfilesInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Trusthub.V1.CustomerProfilesInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'CustomerProfilesChannelEndpointAssignmentList': 'twilio.rest.trusthub.v1.customer_profiles.customer_profiles_channel_endpoint_assignment',
+    'CustomerProfilesEntityAssignmentsList': 'twilio.rest.trusthub.v1.customer_profiles.customer_profiles_entity_assignments',
+    'CustomerProfilesEvaluationsList': 'twilio.rest.trusthub.v1.customer_profiles.customer_profiles_evaluations',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -30,14 +30,16 @@ class CustomerProfilesChannelEndpointAssignmentList(ListResource):
 
         # Path Solution
         self._solution = {'customer_profile_sid': customer_profile_sid, }
-        self._uri = '/CustomerProfiles/{customer_profile_sid}/ChannelEndpointAssignments'.format(**self._solution)
+        self._uri = values.ResourceUri('/CustomerProfiles/{customer_profile_sid}/ChannelEndpointAssignments', self._solution)
 
-    def create(self, channel_endpoint_type, channel_endpoint_sid):
+    def create(self, channel_endpoint_type, channel_endpoint_sid, deadline=None):
         """
         Create the CustomerProfilesChannelEndpointAssignmentInstance
 
         :param unicode channel_endpoint_type: The type of channel endpoint
         :param unicode channel_endpoint_sid: The sid of an channel endpoint
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created CustomerProfilesChannelEndpointAssignmentInstance
         :rtype: twilio.rest.trusthub.v1.customer_profiles.customer_profiles_channel_endpoint_assignment.CustomerProfilesChannelEndpointAssignmentInstance
@@ -47,7 +49,32 @@ class CustomerProfilesChannelEndpointAssignmentList(ListResource):
             'ChannelEndpointSid': channel_endpoint_sid,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return CustomerProfilesChannelEndpointAssignmentInstance(
+            self._version,
+            payload,
+            customer_profile_sid=self._solution['customer_profile_sid'],
+        )
+
+    async def create_async(self, channel_endpoint_type, channel_endpoint_sid, deadline=None):
+        """
+        Asynchronous coroutine that creates the CustomerProfilesChannelEndpointAssignmentInstance
+
+        :param unicode channel_endpoint_type: The type of channel endpoint
+        :param unicode channel_endpoint_sid: The sid of an channel endpoint
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created CustomerProfilesChannelEndpointAssignmentInstance
+        :rtype: twilio.rest.trusthub.v1.customer_profiles.customer_profiles_channel_endpoint_assignment.CustomerProfilesChannelEndpointAssignmentInstance
+        """
+        data = values.of({
+            'ChannelEndpointType': channel_endpoint_type,
+            'ChannelEndpointSid': channel_endpoint_sid,
+        })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return CustomerProfilesChannelEndpointAssignmentInstance(
             self._version,
@@ -56,7 +83,8 @@ class CustomerProfilesChannelEndpointAssignmentList(ListResource):
         )
 
     def stream(self, channel_endpoint_sid=values.unset,
-               channel_endpoint_sids=values.unset, limit=None, page_size=None):
+               channel_endpoint_sids=values.unset, limit=None, page_size=None,
+               prefetch=None, raw=False, deadline=None):
         """
         Streams CustomerProfilesChannelEndpointAssignmentInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -71,22 +99,70 @@ class CustomerProfilesChannelEndpointAssignmentList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.trusthub.v1.customer_profiles.customer_profiles_channel_endpoint_assignment.CustomerProfilesChannelEndpointAssignmentInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
-            channel_endpoint_sid=channel_endpoint_sid,
-            channel_endpoint_sids=channel_endpoint_sids,
-            page_size=limits['page_size'],
-        )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                channel_endpoint_sid=channel_endpoint_sid,
+                channel_endpoint_sids=channel_endpoint_sids,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, channel_endpoint_sid=values.unset,
+                           channel_endpoint_sids=values.unset, limit=None, page_size=None,
+                           prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams CustomerProfilesChannelEndpointAssignmentInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param unicode channel_endpoint_sid: The sid of an channel endpoint
+        :param unicode channel_endpoint_sids: comma separated list of channel endpoint sids
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.trusthub.v1.customer_profiles.customer_profiles_channel_endpoint_assignment.CustomerProfilesChannelEndpointAssignmentInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                channel_endpoint_sid=channel_endpoint_sid,
+                channel_endpoint_sids=channel_endpoint_sids,
+                page_size=limits['page_size'],
+            )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, channel_endpoint_sid=values.unset,
-             channel_endpoint_sids=values.unset, limit=None, page_size=None):
+             channel_endpoint_sids=values.unset, limit=None, page_size=None,
+             prefetch=None, raw=False, deadline=None):
         """
         Lists CustomerProfilesChannelEndpointAssignmentInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -100,6 +176,12 @@ class CustomerProfilesChannelEndpointAssignmentList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.trusthub.v1.customer_profiles.customer_profiles_channel_endpoint_assignment.CustomerProfilesChannelEndpointAssignmentInstance]
@@ -109,8 +191,47 @@ class CustomerProfilesChannelEndpointAssignmentList(ListResource):
             channel_endpoint_sids=channel_endpoint_sids,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, channel_endpoint_sid=values.unset,
+                         channel_endpoint_sids=values.unset, limit=None, page_size=None,
+                         prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists CustomerProfilesChannelEndpointAssignmentInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param unicode channel_endpoint_sid: The sid of an channel endpoint
+        :param unicode channel_endpoint_sids: comma separated list of channel endpoint sids
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.trusthub.v1.customer_profiles.customer_profiles_channel_endpoint_assignment.CustomerProfilesChannelEndpointAssignmentInstance]
+        """
+        return [record async for record in await self.stream_async(
+            channel_endpoint_sid=channel_endpoint_sid,
+            channel_endpoint_sids=channel_endpoint_sids,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, channel_endpoint_sid=values.unset,
              channel_endpoint_sids=values.unset, page_token=values.unset,
              page_number=values.unset, page_size=values.unset):
@@ -139,6 +260,34 @@ class CustomerProfilesChannelEndpointAssignmentList(ListResource):
 
         return CustomerProfilesChannelEndpointAssignmentPage(self._version, response, self._solution)
 
+    async def page_async(self, channel_endpoint_sid=values.unset,
+                         channel_endpoint_sids=values.unset, page_token=values.unset,
+                         page_number=values.unset, page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of CustomerProfilesChannelEndpointAssignmentInstance records from the API.
+        Request is executed immediately
+
+        :param unicode channel_endpoint_sid: The sid of an channel endpoint
+        :param unicode channel_endpoint_sids: comma separated list of channel endpoint sids
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of CustomerProfilesChannelEndpointAssignmentInstance
+        :rtype: twilio.rest.trusthub.v1.customer_profiles.customer_profiles_channel_endpoint_assignment.CustomerProfilesChannelEndpointAssignmentPage
+        """
+        data = values.of({
+            'ChannelEndpointSid': channel_endpoint_sid,
+            'ChannelEndpointSids': channel_endpoint_sids,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return CustomerProfilesChannelEndpointAssignmentPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of CustomerProfilesChannelEndpointAssignmentInstance records from the API.
@@ -156,6 +305,23 @@ class CustomerProfilesChannelEndpointAssignmentList(ListResource):
 
         return CustomerProfilesChannelEndpointAssignmentPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of CustomerProfilesChannelEndpointAssignmentInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of CustomerProfilesChannelEndpointAssignmentInstance
+        :rtype: twilio.rest.trusthub.v1.customer_profiles.customer_profiles_channel_endpoint_assignment.CustomerProfilesChannelEndpointAssignmentPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return CustomerProfilesChannelEndpointAssignmentPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a CustomerProfilesChannelEndpointAssignmentContext
@@ -256,7 +422,7 @@ class CustomerProfilesChannelEndpointAssignmentContext(InstanceContext):
 
         # Path Solution
         self._solution = {'customer_profile_sid': customer_profile_sid, 'sid': sid, }
-        self._uri = '/CustomerProfiles/{customer_profile_sid}/ChannelEndpointAssignments/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/CustomerProfiles/{customer_profile_sid}/ChannelEndpointAssignments/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -274,6 +440,22 @@ class CustomerProfilesChannelEndpointAssignmentContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the CustomerProfilesChannelEndpointAssignmentInstance
+
+        :returns: The fetched CustomerProfilesChannelEndpointAssignmentInstance
+        :rtype: twilio.rest.trusthub.v1.customer_profiles.customer_profiles_channel_endpoint_assignment.CustomerProfilesChannelEndpointAssignmentInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return CustomerProfilesChannelEndpointAssignmentInstance(
+            self._version,
+            payload,
+            customer_profile_sid=self._solution['customer_profile_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self):
         """
         Deletes the CustomerProfilesChannelEndpointAssignmentInstance
@@ -283,6 +465,15 @@ class CustomerProfilesChannelEndpointAssignmentContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the CustomerProfilesChannelEndpointAssignmentInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -296,6 +487,24 @@ class CustomerProfilesChannelEndpointAssignmentContext(InstanceContext):
 
 class CustomerProfilesChannelEndpointAssignmentInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'customer_profile_sid': 'customer_profile_sid',
+        'account_sid': 'account_sid',
+        'channel_endpoint_type': 'channel_endpoint_type',
+        'channel_endpoint_sid': 'channel_endpoint_sid',
+        'date_created': 'date_created',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload, customer_profile_sid, sid=None):
         """
         Initialize the CustomerProfilesChannelEndpointAssignmentInstance
@@ -306,15 +515,7 @@ class CustomerProfilesChannelEndpointAssignmentInstance(InstanceResource):
         super(CustomerProfilesChannelEndpointAssignmentInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'customer_profile_sid': payload.get('customer_profile_sid'),
-            'account_sid': payload.get('account_sid'),
-            'channel_endpoint_type': payload.get('channel_endpoint_type'),
-            'channel_endpoint_sid': payload.get('channel_endpoint_sid'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -405,6 +606,15 @@ class CustomerProfilesChannelEndpointAssignmentInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the CustomerProfilesChannelEndpointAssignmentInstance
+
+        :returns: The fetched CustomerProfilesChannelEndpointAssignmentInstance
+        :rtype: twilio.rest.trusthub.v1.customer_profiles.customer_profiles_channel_endpoint_assignment.CustomerProfilesChannelEndpointAssignmentInstance
+        """
+        return await self._proxy.fetch_async()
+
     def delete(self):
         """
         Deletes the CustomerProfilesChannelEndpointAssignmentInstance
@@ -414,6 +624,15 @@ class CustomerProfilesChannelEndpointAssignmentInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the CustomerProfilesChannelEndpointAssignmentInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
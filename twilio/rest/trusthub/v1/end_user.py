@@ -30,15 +30,17 @@ class EndUserList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/EndUsers'.format(**self._solution)
+        self._uri = values.ResourceUri('/EndUsers', self._solution)
 
-    def create(self, friendly_name, type, attributes=values.unset):
+    def create(self, friendly_name, type, attributes=values.unset, deadline=None):
         """
         Create the EndUserInstance
 
         :param unicode friendly_name: The string that you assigned to describe the resource
         :param unicode type: The type of end user of the Bundle resource
         :param dict attributes: The set of parameters that compose the End User resource
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created EndUserInstance
         :rtype: twilio.rest.trusthub.v1.end_user.EndUserInstance
@@ -49,11 +51,34 @@ class EndUserList(ListResource):
             'Attributes': serialize.object(attributes),
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return EndUserInstance(self._version, payload, )
 
-    def stream(self, limit=None, page_size=None):
+    async def create_async(self, friendly_name, type, attributes=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the EndUserInstance
+
+        :param unicode friendly_name: The string that you assigned to describe the resource
+        :param unicode type: The type of end user of the Bundle resource
+        :param dict attributes: The set of parameters that compose the End User resource
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created EndUserInstance
+        :rtype: twilio.rest.trusthub.v1.end_user.EndUserInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'Type': type,
+            'Attributes': serialize.object(attributes),
+        })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return EndUserInstance(self._version, payload, )
+
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams EndUserInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -66,17 +91,57 @@ class EndUserList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.trusthub.v1.end_user.EndUserInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams EndUserInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.trusthub.v1.end_user.EndUserInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists EndUserInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -88,11 +153,42 @@ class EndUserList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.trusthub.v1.end_user.EndUserInstance]
+        """
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists EndUserInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.trusthub.v1.end_user.EndUserInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -113,6 +209,25 @@ class EndUserList(ListResource):
 
         return EndUserPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of EndUserInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of EndUserInstance
+        :rtype: twilio.rest.trusthub.v1.end_user.EndUserPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return EndUserPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of EndUserInstance records from the API.
@@ -130,6 +245,23 @@ class EndUserList(ListResource):
 
         return EndUserPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of EndUserInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of EndUserInstance
+        :rtype: twilio.rest.trusthub.v1.end_user.EndUserPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return EndUserPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a EndUserContext
@@ -216,7 +348,7 @@ class EndUserContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/EndUsers/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/EndUsers/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -229,6 +361,17 @@ class EndUserContext(InstanceContext):
 
         return EndUserInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the EndUserInstance
+
+        :returns: The fetched EndUserInstance
+        :rtype: twilio.rest.trusthub.v1.end_user.EndUserInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return EndUserInstance(self._version, payload, sid=self._solution['sid'], )
+
     def update(self, friendly_name=values.unset, attributes=values.unset):
         """
         Update the EndUserInstance
@@ -245,6 +388,22 @@ class EndUserContext(InstanceContext):
 
         return EndUserInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def update_async(self, friendly_name=values.unset, attributes=values.unset):
+        """
+        Asynchronous coroutine that updates the EndUserInstance
+
+        :param unicode friendly_name: The string that you assigned to describe the resource
+        :param dict attributes: The set of parameters that compose the End User resource
+
+        :returns: The updated EndUserInstance
+        :rtype: twilio.rest.trusthub.v1.end_user.EndUserInstance
+        """
+        data = values.of({'FriendlyName': friendly_name, 'Attributes': serialize.object(attributes), })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return EndUserInstance(self._version, payload, sid=self._solution['sid'], )
+
     def delete(self):
         """
         Deletes the EndUserInstance
@@ -254,6 +413,15 @@ class EndUserContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the EndUserInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -267,6 +435,26 @@ class EndUserContext(InstanceContext):
 
 class EndUserInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'friendly_name': 'friendly_name',
+        'type': 'type',
+        'attributes': 'attributes',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the EndUserInstance
@@ -277,16 +465,7 @@ class EndUserInstance(InstanceResource):
         super(EndUserInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'friendly_name': payload.get('friendly_name'),
-            'type': payload.get('type'),
-            'attributes': payload.get('attributes'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -378,6 +557,15 @@ class EndUserInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the EndUserInstance
+
+        :returns: The fetched EndUserInstance
+        :rtype: twilio.rest.trusthub.v1.end_user.EndUserInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, friendly_name=values.unset, attributes=values.unset):
         """
         Update the EndUserInstance
@@ -390,6 +578,18 @@ class EndUserInstance(InstanceResource):
         """
         return self._proxy.update(friendly_name=friendly_name, attributes=attributes, )
 
+    async def update_async(self, friendly_name=values.unset, attributes=values.unset):
+        """
+        Asynchronous coroutine that updates the EndUserInstance
+
+        :param unicode friendly_name: The string that you assigned to describe the resource
+        :param dict attributes: The set of parameters that compose the End User resource
+
+        :returns: The updated EndUserInstance
+        :rtype: twilio.rest.trusthub.v1.end_user.EndUserInstance
+        """
+        return await self._proxy.update_async(friendly_name=friendly_name, attributes=attributes, )
+
     def delete(self):
         """
         Deletes the EndUserInstance
@@ -399,6 +599,15 @@ class EndUserInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the EndUserInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -6,15 +6,14 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.trusthub.v1.trust_products.trust_products_channel_endpoint_assignment import TrustProductsChannelEndpointAssignmentList
-from twilio.rest.trusthub.v1.trust_products.trust_products_entity_assignments import TrustProductsEntityAssignmentsList
-from twilio.rest.trusthub.v1.trust_products.trust_products_evaluations import TrustProductsEvaluationsList
 
 
 class TrustProductsList(ListResource):
@@ -32,10 +31,10 @@ class TrustProductsList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/TrustProducts'.format(**self._solution)
+        self._uri = values.ResourceUri('/TrustProducts', self._solution)
 
     def create(self, friendly_name, email, policy_sid,
-               status_callback=values.unset):
+               status_callback=values.unset, deadline=None):
         """
         Create the TrustProductsInstance
 
@@ -43,6 +42,34 @@ class TrustProductsList(ListResource):
         :param unicode email: The email address
         :param unicode policy_sid: The unique string of a policy.
         :param unicode status_callback: The URL we call to inform your application of status changes.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created TrustProductsInstance
+        :rtype: twilio.rest.trusthub.v1.trust_products.TrustProductsInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'Email': email,
+            'PolicySid': policy_sid,
+            'StatusCallback': status_callback,
+        })
+
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return TrustProductsInstance(self._version, payload, )
+
+    async def create_async(self, friendly_name, email, policy_sid,
+                           status_callback=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the TrustProductsInstance
+
+        :param unicode friendly_name: The string that you assigned to describe the resource
+        :param unicode email: The email address
+        :param unicode policy_sid: The unique string of a policy.
+        :param unicode status_callback: The URL we call to inform your application of status changes.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created TrustProductsInstance
         :rtype: twilio.rest.trusthub.v1.trust_products.TrustProductsInstance
@@ -54,12 +81,13 @@ class TrustProductsList(ListResource):
             'StatusCallback': status_callback,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return TrustProductsInstance(self._version, payload, )
 
     def stream(self, status=values.unset, friendly_name=values.unset,
-               policy_sid=values.unset, limit=None, page_size=None):
+               policy_sid=values.unset, limit=None, page_size=None,
+               prefetch=None, raw=False, deadline=None):
         """
         Streams TrustProductsInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -75,23 +103,73 @@ class TrustProductsList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.trusthub.v1.trust_products.TrustProductsInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
-            status=status,
-            friendly_name=friendly_name,
-            policy_sid=policy_sid,
-            page_size=limits['page_size'],
-        )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                status=status,
+                friendly_name=friendly_name,
+                policy_sid=policy_sid,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, status=values.unset, friendly_name=values.unset,
+                           policy_sid=values.unset, limit=None, page_size=None,
+                           prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams TrustProductsInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param TrustProductsInstance.Status status: The verification status of the Customer-Profile resource
+        :param unicode friendly_name: The string that you assigned to describe the resource
+        :param unicode policy_sid: The unique string of a policy.
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.trusthub.v1.trust_products.TrustProductsInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
 
-        return self._version.stream(page, limits['limit'])
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                status=status,
+                friendly_name=friendly_name,
+                policy_sid=policy_sid,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, status=values.unset, friendly_name=values.unset,
-             policy_sid=values.unset, limit=None, page_size=None):
+             policy_sid=values.unset, limit=None, page_size=None,
+             prefetch=None, raw=False, deadline=None):
         """
         Lists TrustProductsInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -106,6 +184,12 @@ class TrustProductsList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.trusthub.v1.trust_products.TrustProductsInstance]
@@ -116,8 +200,49 @@ class TrustProductsList(ListResource):
             policy_sid=policy_sid,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, status=values.unset, friendly_name=values.unset,
+                         policy_sid=values.unset, limit=None, page_size=None,
+                         prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists TrustProductsInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param TrustProductsInstance.Status status: The verification status of the Customer-Profile resource
+        :param unicode friendly_name: The string that you assigned to describe the resource
+        :param unicode policy_sid: The unique string of a policy.
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.trusthub.v1.trust_products.TrustProductsInstance]
+        """
+        return [record async for record in await self.stream_async(
+            status=status,
+            friendly_name=friendly_name,
+            policy_sid=policy_sid,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, status=values.unset, friendly_name=values.unset,
              policy_sid=values.unset, page_token=values.unset,
              page_number=values.unset, page_size=values.unset):
@@ -148,6 +273,36 @@ class TrustProductsList(ListResource):
 
         return TrustProductsPage(self._version, response, self._solution)
 
+    async def page_async(self, status=values.unset, friendly_name=values.unset,
+                         policy_sid=values.unset, page_token=values.unset,
+                         page_number=values.unset, page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of TrustProductsInstance records from the API.
+        Request is executed immediately
+
+        :param TrustProductsInstance.Status status: The verification status of the Customer-Profile resource
+        :param unicode friendly_name: The string that you assigned to describe the resource
+        :param unicode policy_sid: The unique string of a policy.
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of TrustProductsInstance
+        :rtype: twilio.rest.trusthub.v1.trust_products.TrustProductsPage
+        """
+        data = values.of({
+            'Status': status,
+            'FriendlyName': friendly_name,
+            'PolicySid': policy_sid,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return TrustProductsPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of TrustProductsInstance records from the API.
@@ -165,6 +320,23 @@ class TrustProductsList(ListResource):
 
         return TrustProductsPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of TrustProductsInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of TrustProductsInstance
+        :rtype: twilio.rest.trusthub.v1.trust_products.TrustProductsPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return TrustProductsPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a TrustProductsContext
@@ -251,7 +423,7 @@ class TrustProductsContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/TrustProducts/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/TrustProducts/{sid}', self._solution)
 
         # Dependents
         self._trust_products_entity_assignments = None
@@ -269,6 +441,17 @@ class TrustProductsContext(InstanceContext):
 
         return TrustProductsInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the TrustProductsInstance
+
+        :returns: The fetched TrustProductsInstance
+        :rtype: twilio.rest.trusthub.v1.trust_products.TrustProductsInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return TrustProductsInstance(self._version, payload, sid=self._solution['sid'], )
+
     def update(self, status=values.unset, status_callback=values.unset,
                friendly_name=values.unset, email=values.unset):
         """
@@ -293,6 +476,30 @@ class TrustProductsContext(InstanceContext):
 
         return TrustProductsInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def update_async(self, status=values.unset, status_callback=values.unset,
+                           friendly_name=values.unset, email=values.unset):
+        """
+        Asynchronous coroutine that updates the TrustProductsInstance
+
+        :param TrustProductsInstance.Status status: The verification status of the Customer-Profile resource
+        :param unicode status_callback: The URL we call to inform your application of status changes.
+        :param unicode friendly_name: The string that you assigned to describe the resource
+        :param unicode email: The email address
+
+        :returns: The updated TrustProductsInstance
+        :rtype: twilio.rest.trusthub.v1.trust_products.TrustProductsInstance
+        """
+        data = values.of({
+            'Status': status,
+            'StatusCallback': status_callback,
+            'FriendlyName': friendly_name,
+            'Email': email,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return TrustProductsInstance(self._version, payload, sid=self._solution['sid'], )
+
     def delete(self):
         """
         Deletes the TrustProductsInstance
@@ -302,6 +509,15 @@ class TrustProductsContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the TrustProductsInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     @property
     def trust_products_entity_assignments(self):
         """
@@ -311,6 +527,7 @@ class TrustProductsContext(InstanceContext):
         :rtype: twilio.rest.trusthub.v1.trust_products.trust_products_entity_assignments.TrustProductsEntityAssignmentsList
         """
         if self._trust_products_entity_assignments is None:
+            from twilio.rest.trusthub.v1.trust_products.trust_products_entity_assignments import TrustProductsEntityAssignmentsList
             self._trust_products_entity_assignments = TrustProductsEntityAssignmentsList(
                 self._version,
                 trust_product_sid=self._solution['sid'],
@@ -326,6 +543,7 @@ class TrustProductsContext(InstanceContext):
         :rtype: twilio.rest.trusthub.v1.trust_products.trust_products_evaluations.TrustProductsEvaluationsList
         """
         if self._trust_products_evaluations is None:
+            from twilio.rest.trusthub.v1.trust_products.trust_products_evaluations import TrustProductsEvaluationsList
             self._trust_products_evaluations = TrustProductsEvaluationsList(
                 self._version,
                 trust_product_sid=self._solution['sid'],
@@ -341,6 +559,7 @@ class TrustProductsContext(InstanceContext):
         :rtype: twilio.rest.trusthub.v1.trust_products.trust_products_channel_endpoint_assignment.TrustProductsChannelEndpointAssignmentList
         """
         if self._trust_products_channel_endpoint_assignment is None:
+            from twilio.rest.trusthub.v1.trust_products.trust_products_channel_endpoint_assignment import TrustProductsChannelEndpointAssignmentList
             self._trust_products_channel_endpoint_assignment = TrustProductsChannelEndpointAssignmentList(
                 self._version,
                 trust_product_sid=self._solution['sid'],
@@ -371,6 +590,31 @@ class TrustProductsInstance(InstanceResource):
         INDIVIDUAL = "individual"
         BUSINESS = "business"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'valid_until': deserialize.iso8601_datetime,
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'policy_sid': 'policy_sid',
+        'friendly_name': 'friendly_name',
+        'status': 'status',
+        'valid_until': 'valid_until',
+        'email': 'email',
+        'status_callback': 'status_callback',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'url': 'url',
+        'links': 'links',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the TrustProductsInstance
@@ -381,20 +625,7 @@ class TrustProductsInstance(InstanceResource):
         super(TrustProductsInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'policy_sid': payload.get('policy_sid'),
-            'friendly_name': payload.get('friendly_name'),
-            'status': payload.get('status'),
-            'valid_until': deserialize.iso8601_datetime(payload.get('valid_until')),
-            'email': payload.get('email'),
-            'status_callback': payload.get('status_callback'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -518,6 +749,15 @@ class TrustProductsInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the TrustProductsInstance
+
+        :returns: The fetched TrustProductsInstance
+        :rtype: twilio.rest.trusthub.v1.trust_products.TrustProductsInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, status=values.unset, status_callback=values.unset,
                friendly_name=values.unset, email=values.unset):
         """
@@ -538,6 +778,26 @@ class TrustProductsInstance(InstanceResource):
             email=email,
         )
 
+    async def update_async(self, status=values.unset, status_callback=values.unset,
+                           friendly_name=values.unset, email=values.unset):
+        """
+        Asynchronous coroutine that updates the TrustProductsInstance
+
+        :param TrustProductsInstance.Status status: The verification status of the Customer-Profile resource
+        :param unicode status_callback: The URL we call to inform your application of status changes.
+        :param unicode friendly_name: The string that you assigned to describe the resource
+        :param unicode email: The email address
+
+        :returns: The updated TrustProductsInstance
+        :rtype: twilio.rest.trusthub.v1.trust_products.TrustProductsInstance
+        """
+        return await self._proxy.update_async(
+            status=status,
+            status_callback=status_callback,
+            friendly_name=friendly_name,
+            email=email,
+        )
+
     def delete(self):
         """
         Deletes the TrustProductsInstance
@@ -547,6 +807,15 @@ class TrustProductsInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the TrustProductsInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     @property
     def trust_products_entity_assignments(self):
         """
@@ -586,3 +855,21 @@ class TrustProductsInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Trusthub.V1.TrustProductsInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'TrustProductsChannelEndpointAssignmentList': 'twilio.rest.trusthub.v1.trust_products.trust_products_channel_endpoint_assignment',
+    'TrustProductsEntityAssignmentsList': 'twilio.rest.trusthub.v1.trust_products.trust_products_entity_assignments',
+    'TrustProductsEvaluationsList': 'twilio.rest.trusthub.v1.trust_products.trust_products_evaluations',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -6,8 +6,9 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base.domain import Domain
-from twilio.rest.verify.v2 import V2
 
 
 class Verify(Domain):
@@ -33,6 +34,7 @@ class Verify(Domain):
         :rtype: twilio.rest.verify.v2.V2
         """
         if self._v2 is None:
+            from twilio.rest.verify.v2 import V2
             self._v2 = V2(self)
         return self._v2
 
@@ -79,3 +81,19 @@ class Verify(Domain):
         :rtype: str
         """
         return '<Twilio.Verify>'
+
+
+_LAZY_IMPORTS = {
+    'V2': 'twilio.rest.verify.v2',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -6,12 +6,9 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base.version import Version
-from twilio.rest.verify.v2.form import FormList
-from twilio.rest.verify.v2.service import ServiceList
-from twilio.rest.verify.v2.template import TemplateList
-from twilio.rest.verify.v2.verification_attempt import VerificationAttemptList
-from twilio.rest.verify.v2.verification_attempts_summary import VerificationAttemptsSummaryList
 
 
 class V2(Version):
@@ -37,6 +34,7 @@ class V2(Version):
         :rtype: twilio.rest.verify.v2.form.FormList
         """
         if self._forms is None:
+            from twilio.rest.verify.v2.form import FormList
             self._forms = FormList(self)
         return self._forms
 
@@ -46,6 +44,7 @@ class V2(Version):
         :rtype: twilio.rest.verify.v2.service.ServiceList
         """
         if self._services is None:
+            from twilio.rest.verify.v2.service import ServiceList
             self._services = ServiceList(self)
         return self._services
 
@@ -55,6 +54,7 @@ class V2(Version):
         :rtype: twilio.rest.verify.v2.verification_attempt.VerificationAttemptList
         """
         if self._verification_attempts is None:
+            from twilio.rest.verify.v2.verification_attempt import VerificationAttemptList
             self._verification_attempts = VerificationAttemptList(self)
         return self._verification_attempts
 
@@ -64,6 +64,7 @@ class V2(Version):
         :rtype: twilio.rest.verify.v2.verification_attempts_summary.VerificationAttemptsSummaryList
         """
         if self._verification_attempts_summary is None:
+            from twilio.rest.verify.v2.verification_attempts_summary import VerificationAttemptsSummaryList
             self._verification_attempts_summary = VerificationAttemptsSummaryList(self)
         return self._verification_attempts_summary
 
@@ -73,6 +74,7 @@ class V2(Version):
         :rtype: twilio.rest.verify.v2.template.TemplateList
         """
         if self._templates is None:
+            from twilio.rest.verify.v2.template import TemplateList
             self._templates = TemplateList(self)
         return self._templates
 
@@ -84,3 +86,23 @@ class V2(Version):
         :rtype: str
         """
         return '<Twilio.Verify.V2>'
+
+
+_LAZY_IMPORTS = {
+    'FormList': 'twilio.rest.verify.v2.form',
+    'ServiceList': 'twilio.rest.verify.v2.service',
+    'TemplateList': 'twilio.rest.verify.v2.template',
+    'VerificationAttemptList': 'twilio.rest.verify.v2.verification_attempt',
+    'VerificationAttemptsSummaryList': 'twilio.rest.verify.v2.verification_attempts_summary',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -6,6 +6,7 @@ This code was generated by
       /       /
 """
 
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
@@ -121,7 +122,7 @@ class FormContext(InstanceContext):
 
         # Path Solution
         self._solution = {'form_type': form_type, }
-        self._uri = '/Forms/{form_type}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Forms/{form_type}', self._solution)
 
     def fetch(self):
         """
@@ -134,6 +135,17 @@ class FormContext(InstanceContext):
 
         return FormInstance(self._version, payload, form_type=self._solution['form_type'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the FormInstance
+
+        :returns: The fetched FormInstance
+        :rtype: twilio.rest.verify.v2.form.FormInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return FormInstance(self._version, payload, form_type=self._solution['form_type'], )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -152,6 +164,16 @@ class FormInstance(InstanceResource):
     class FormTypes(object):
         FORM_PUSH = "form-push"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'form_type': 'form_type',
+        'forms': 'forms',
+        'form_meta': 'form_meta',
+        'url': 'url',
+    })
+
     def __init__(self, version, payload, form_type=None):
         """
         Initialize the FormInstance
@@ -162,12 +184,7 @@ class FormInstance(InstanceResource):
         super(FormInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'form_type': payload.get('form_type'),
-            'forms': payload.get('forms'),
-            'form_meta': payload.get('form_meta'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -227,6 +244,15 @@ class FormInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the FormInstance
+
+        :returns: The fetched FormInstance
+        :rtype: twilio.rest.verify.v2.form.FormInstance
+        """
+        return await self._proxy.fetch_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -6,19 +6,14 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.verify.v2.service.access_token import AccessTokenList
-from twilio.rest.verify.v2.service.entity import EntityList
-from twilio.rest.verify.v2.service.messaging_configuration import MessagingConfigurationList
-from twilio.rest.verify.v2.service.rate_limit import RateLimitList
-from twilio.rest.verify.v2.service.verification import VerificationList
-from twilio.rest.verify.v2.service.verification_check import VerificationCheckList
-from twilio.rest.verify.v2.service.webhook import WebhookList
 
 
 class ServiceList(ListResource):
@@ -36,7 +31,7 @@ class ServiceList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Services'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services', self._solution)
 
     def create(self, friendly_name, code_length=values.unset,
                lookup_enabled=values.unset, skip_sms_to_landlines=values.unset,
@@ -46,7 +41,7 @@ class ServiceList(ListResource):
                push_apn_credential_sid=values.unset,
                push_fcm_credential_sid=values.unset, totp_issuer=values.unset,
                totp_time_step=values.unset, totp_code_length=values.unset,
-               totp_skew=values.unset, default_template_sid=values.unset):
+               totp_skew=values.unset, default_template_sid=values.unset, deadline=None):
         """
         Create the ServiceInstance
 
@@ -67,6 +62,8 @@ class ServiceList(ListResource):
         :param unicode totp_code_length: Optional. Number of digits for generated TOTP codes
         :param unicode totp_skew: Optional. The number of past and future time-steps valid at a given time
         :param unicode default_template_sid: The verification template SMS messages.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created ServiceInstance
         :rtype: twilio.rest.verify.v2.service.ServiceInstance
@@ -91,11 +88,71 @@ class ServiceList(ListResource):
             'DefaultTemplateSid': default_template_sid,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return ServiceInstance(self._version, payload, )
 
-    def stream(self, limit=None, page_size=None):
+    async def create_async(self, friendly_name, code_length=values.unset,
+                           lookup_enabled=values.unset, skip_sms_to_landlines=values.unset,
+                           dtmf_input_required=values.unset, tts_name=values.unset,
+                           psd2_enabled=values.unset, do_not_share_warning_enabled=values.unset,
+                           custom_code_enabled=values.unset, push_include_date=values.unset,
+                           push_apn_credential_sid=values.unset,
+                           push_fcm_credential_sid=values.unset, totp_issuer=values.unset,
+                           totp_time_step=values.unset, totp_code_length=values.unset,
+                           totp_skew=values.unset, default_template_sid=values.unset,
+                           deadline=None):
+        """
+        Asynchronous coroutine that creates the ServiceInstance
+
+        :param unicode friendly_name: A string to describe the verification service
+        :param unicode code_length: The length of the verification code to generate
+        :param bool lookup_enabled: Whether to perform a lookup with each verification
+        :param bool skip_sms_to_landlines: Whether to skip sending SMS verifications to landlines
+        :param bool dtmf_input_required: Whether to ask the user to press a number before delivering the verify code in a phone call
+        :param unicode tts_name: The name of an alternative text-to-speech service to use in phone calls
+        :param bool psd2_enabled: Whether to pass PSD2 transaction parameters when starting a verification
+        :param bool do_not_share_warning_enabled: Whether to add a security warning at the end of an SMS.
+        :param bool custom_code_enabled: Whether to allow sending verifications with a custom code.
+        :param bool push_include_date: Optional. Include the date in the Challenge's reponse. Default: true
+        :param unicode push_apn_credential_sid: Optional. Set APN Credential for this service.
+        :param unicode push_fcm_credential_sid: Optional. Set FCM Credential for this service.
+        :param unicode totp_issuer: Optional. Set TOTP Issuer for this service.
+        :param unicode totp_time_step: Optional. How often, in seconds, are TOTP codes generated
+        :param unicode totp_code_length: Optional. Number of digits for generated TOTP codes
+        :param unicode totp_skew: Optional. The number of past and future time-steps valid at a given time
+        :param unicode default_template_sid: The verification template SMS messages.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created ServiceInstance
+        :rtype: twilio.rest.verify.v2.service.ServiceInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'CodeLength': code_length,
+            'LookupEnabled': lookup_enabled,
+            'SkipSmsToLandlines': skip_sms_to_landlines,
+            'DtmfInputRequired': dtmf_input_required,
+            'TtsName': tts_name,
+            'Psd2Enabled': psd2_enabled,
+            'DoNotShareWarningEnabled': do_not_share_warning_enabled,
+            'CustomCodeEnabled': custom_code_enabled,
+            'Push.IncludeDate': push_include_date,
+            'Push.ApnCredentialSid': push_apn_credential_sid,
+            'Push.FcmCredentialSid': push_fcm_credential_sid,
+            'Totp.Issuer': totp_issuer,
+            'Totp.TimeStep': totp_time_step,
+            'Totp.CodeLength': totp_code_length,
+            'Totp.Skew': totp_skew,
+            'DefaultTemplateSid': default_template_sid,
+        })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return ServiceInstance(self._version, payload, )
+
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams ServiceInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -108,17 +165,57 @@ class ServiceList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.verify.v2.service.ServiceInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams ServiceInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.verify.v2.service.ServiceInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists ServiceInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -130,11 +227,42 @@ class ServiceList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.verify.v2.service.ServiceInstance]
+        """
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists ServiceInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.verify.v2.service.ServiceInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -155,6 +283,25 @@ class ServiceList(ListResource):
 
         return ServicePage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of ServiceInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of ServiceInstance
+        :rtype: twilio.rest.verify.v2.service.ServicePage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return ServicePage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of ServiceInstance records from the API.
@@ -172,6 +319,23 @@ class ServiceList(ListResource):
 
         return ServicePage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of ServiceInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of ServiceInstance
+        :rtype: twilio.rest.verify.v2.service.ServicePage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return ServicePage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a ServiceContext
@@ -258,7 +422,7 @@ class ServiceContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/Services/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{sid}', self._solution)
 
         # Dependents
         self._verifications = None
@@ -280,6 +444,17 @@ class ServiceContext(InstanceContext):
 
         return ServiceInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ServiceInstance
+
+        :returns: The fetched ServiceInstance
+        :rtype: twilio.rest.verify.v2.service.ServiceInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return ServiceInstance(self._version, payload, sid=self._solution['sid'], )
+
     def delete(self):
         """
         Deletes the ServiceInstance
@@ -289,6 +464,15 @@ class ServiceContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the ServiceInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def update(self, friendly_name=values.unset, code_length=values.unset,
                lookup_enabled=values.unset, skip_sms_to_landlines=values.unset,
                dtmf_input_required=values.unset, tts_name=values.unset,
@@ -346,6 +530,63 @@ class ServiceContext(InstanceContext):
 
         return ServiceInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def update_async(self, friendly_name=values.unset, code_length=values.unset,
+                           lookup_enabled=values.unset, skip_sms_to_landlines=values.unset,
+                           dtmf_input_required=values.unset, tts_name=values.unset,
+                           psd2_enabled=values.unset, do_not_share_warning_enabled=values.unset,
+                           custom_code_enabled=values.unset, push_include_date=values.unset,
+                           push_apn_credential_sid=values.unset,
+                           push_fcm_credential_sid=values.unset, totp_issuer=values.unset,
+                           totp_time_step=values.unset, totp_code_length=values.unset,
+                           totp_skew=values.unset, default_template_sid=values.unset):
+        """
+        Asynchronous coroutine that updates the ServiceInstance
+
+        :param unicode friendly_name: A string to describe the verification service
+        :param unicode code_length: The length of the verification code to generate
+        :param bool lookup_enabled: Whether to perform a lookup with each verification
+        :param bool skip_sms_to_landlines: Whether to skip sending SMS verifications to landlines
+        :param bool dtmf_input_required: Whether to ask the user to press a number before delivering the verify code in a phone call
+        :param unicode tts_name: The name of an alternative text-to-speech service to use in phone calls
+        :param bool psd2_enabled: Whether to pass PSD2 transaction parameters when starting a verification
+        :param bool do_not_share_warning_enabled: Whether to add a privacy warning at the end of an SMS.
+        :param bool custom_code_enabled: Whether to allow sending verifications with a custom code.
+        :param bool push_include_date: Optional. Include the date in the Challenge's reponse. Default: true
+        :param unicode push_apn_credential_sid: Optional. Set APN Credential for this service.
+        :param unicode push_fcm_credential_sid: Optional. Set FCM Credential for this service.
+        :param unicode totp_issuer: Optional. Set TOTP Issuer for this service.
+        :param unicode totp_time_step: Optional. How often, in seconds, are TOTP codes generated
+        :param unicode totp_code_length: Optional. Number of digits for generated TOTP codes
+        :param unicode totp_skew: Optional. The number of past and future time-steps valid at a given time
+        :param unicode default_template_sid: The verification template SMS messages.
+
+        :returns: The updated ServiceInstance
+        :rtype: twilio.rest.verify.v2.service.ServiceInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'CodeLength': code_length,
+            'LookupEnabled': lookup_enabled,
+            'SkipSmsToLandlines': skip_sms_to_landlines,
+            'DtmfInputRequired': dtmf_input_required,
+            'TtsName': tts_name,
+            'Psd2Enabled': psd2_enabled,
+            'DoNotShareWarningEnabled': do_not_share_warning_enabled,
+            'CustomCodeEnabled': custom_code_enabled,
+            'Push.IncludeDate': push_include_date,
+            'Push.ApnCredentialSid': push_apn_credential_sid,
+            'Push.FcmCredentialSid': push_fcm_credential_sid,
+            'Totp.Issuer': totp_issuer,
+            'Totp.TimeStep': totp_time_step,
+            'Totp.CodeLength': totp_code_length,
+            'Totp.Skew': totp_skew,
+            'DefaultTemplateSid': default_template_sid,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return ServiceInstance(self._version, payload, sid=self._solution['sid'], )
+
     @property
     def verifications(self):
         """
@@ -355,6 +596,7 @@ class ServiceContext(InstanceContext):
         :rtype: twilio.rest.verify.v2.service.verification.VerificationList
         """
         if self._verifications is None:
+            from twilio.rest.verify.v2.service.verification import VerificationList
             self._verifications = VerificationList(self._version, service_sid=self._solution['sid'], )
         return self._verifications
 
@@ -367,6 +609,7 @@ class ServiceContext(InstanceContext):
         :rtype: twilio.rest.verify.v2.service.verification_check.VerificationCheckList
         """
         if self._verification_checks is None:
+            from twilio.rest.verify.v2.service.verification_check import VerificationCheckList
             self._verification_checks = VerificationCheckList(self._version, service_sid=self._solution['sid'], )
         return self._verification_checks
 
@@ -379,6 +622,7 @@ class ServiceContext(InstanceContext):
         :rtype: twilio.rest.verify.v2.service.rate_limit.RateLimitList
         """
         if self._rate_limits is None:
+            from twilio.rest.verify.v2.service.rate_limit import RateLimitList
             self._rate_limits = RateLimitList(self._version, service_sid=self._solution['sid'], )
         return self._rate_limits
 
@@ -391,6 +635,7 @@ class ServiceContext(InstanceContext):
         :rtype: twilio.rest.verify.v2.service.messaging_configuration.MessagingConfigurationList
         """
         if self._messaging_configurations is None:
+            from twilio.rest.verify.v2.service.messaging_configuration import MessagingConfigurationList
             self._messaging_configurations = MessagingConfigurationList(
                 self._version,
                 service_sid=self._solution['sid'],
@@ -406,6 +651,7 @@ class ServiceContext(InstanceContext):
         :rtype: twilio.rest.verify.v2.service.entity.EntityList
         """
         if self._entities is None:
+            from twilio.rest.verify.v2.service.entity import EntityList
             self._entities = EntityList(self._version, service_sid=self._solution['sid'], )
         return self._entities
 
@@ -418,6 +664,7 @@ class ServiceContext(InstanceContext):
         :rtype: twilio.rest.verify.v2.service.webhook.WebhookList
         """
         if self._webhooks is None:
+            from twilio.rest.verify.v2.service.webhook import WebhookList
             self._webhooks = WebhookList(self._version, service_sid=self._solution['sid'], )
         return self._webhooks
 
@@ -430,6 +677,7 @@ class ServiceContext(InstanceContext):
         :rtype: twilio.rest.verify.v2.service.access_token.AccessTokenList
         """
         if self._access_tokens is None:
+            from twilio.rest.verify.v2.service.access_token import AccessTokenList
             self._access_tokens = AccessTokenList(self._version, service_sid=self._solution['sid'], )
         return self._access_tokens
 
@@ -446,6 +694,37 @@ class ServiceContext(InstanceContext):
 
 class ServiceInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'code_length': deserialize.integer,
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'friendly_name': 'friendly_name',
+        'code_length': 'code_length',
+        'lookup_enabled': 'lookup_enabled',
+        'psd2_enabled': 'psd2_enabled',
+        'skip_sms_to_landlines': 'skip_sms_to_landlines',
+        'dtmf_input_required': 'dtmf_input_required',
+        'tts_name': 'tts_name',
+        'do_not_share_warning_enabled': 'do_not_share_warning_enabled',
+        'custom_code_enabled': 'custom_code_enabled',
+        'push': 'push',
+        'totp': 'totp',
+        'default_template_sid': 'default_template_sid',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'url': 'url',
+        'links': 'links',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the ServiceInstance
@@ -456,26 +735,7 @@ class ServiceInstance(InstanceResource):
         super(ServiceInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'friendly_name': payload.get('friendly_name'),
-            'code_length': deserialize.integer(payload.get('code_length')),
-            'lookup_enabled': payload.get('lookup_enabled'),
-            'psd2_enabled': payload.get('psd2_enabled'),
-            'skip_sms_to_landlines': payload.get('skip_sms_to_landlines'),
-            'dtmf_input_required': payload.get('dtmf_input_required'),
-            'tts_name': payload.get('tts_name'),
-            'do_not_share_warning_enabled': payload.get('do_not_share_warning_enabled'),
-            'custom_code_enabled': payload.get('custom_code_enabled'),
-            'push': payload.get('push'),
-            'totp': payload.get('totp'),
-            'default_template_sid': payload.get('default_template_sid'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -647,6 +907,15 @@ class ServiceInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ServiceInstance
+
+        :returns: The fetched ServiceInstance
+        :rtype: twilio.rest.verify.v2.service.ServiceInstance
+        """
+        return await self._proxy.fetch_async()
+
     def delete(self):
         """
         Deletes the ServiceInstance
@@ -656,6 +925,15 @@ class ServiceInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the ServiceInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def update(self, friendly_name=values.unset, code_length=values.unset,
                lookup_enabled=values.unset, skip_sms_to_landlines=values.unset,
                dtmf_input_required=values.unset, tts_name=values.unset,
@@ -709,6 +987,59 @@ class ServiceInstance(InstanceResource):
             default_template_sid=default_template_sid,
         )
 
+    async def update_async(self, friendly_name=values.unset, code_length=values.unset,
+                           lookup_enabled=values.unset, skip_sms_to_landlines=values.unset,
+                           dtmf_input_required=values.unset, tts_name=values.unset,
+                           psd2_enabled=values.unset, do_not_share_warning_enabled=values.unset,
+                           custom_code_enabled=values.unset, push_include_date=values.unset,
+                           push_apn_credential_sid=values.unset,
+                           push_fcm_credential_sid=values.unset, totp_issuer=values.unset,
+                           totp_time_step=values.unset, totp_code_length=values.unset,
+                           totp_skew=values.unset, default_template_sid=values.unset):
+        """
+        Asynchronous coroutine that updates the ServiceInstance
+
+        :param unicode friendly_name: A string to describe the verification service
+        :param unicode code_length: The length of the verification code to generate
+        :param bool lookup_enabled: Whether to perform a lookup with each verification
+        :param bool skip_sms_to_landlines: Whether to skip sending SMS verifications to landlines
+        :param bool dtmf_input_required: Whether to ask the user to press a number before delivering the verify code in a phone call
+        :param unicode tts_name: The name of an alternative text-to-speech service to use in phone calls
+        :param bool psd2_enabled: Whether to pass PSD2 transaction parameters when starting a verification
+        :param bool do_not_share_warning_enabled: Whether to add a privacy warning at the end of an SMS.
+        :param bool custom_code_enabled: Whether to allow sending verifications with a custom code.
+        :param bool push_include_date: Optional. Include the date in the Challenge's reponse. Default: true
+        :param unicode push_apn_credential_sid: Optional. Set APN Credential for this service.
+        :param unicode push_fcm_credential_sid: Optional. Set FCM Credential for this service.
+        :param unicode totp_issuer: Optional. Set TOTP Issuer for this service.
+        :param unicode totp_time_step: Optional. How often, in seconds, are TOTP codes generated
+        :param unicode totp_code_length: Optional. Number of digits for generated TOTP codes
+        :param unicode totp_skew: Optional. The number of past and future time-steps valid at a given time
+        :param unicode default_template_sid: The verification template SMS messages.
+
+        :returns: The updated ServiceInstance
+        :rtype: twilio.rest.verify.v2.service.ServiceInstance
+        """
+        return await self._proxy.update_async(
+            friendly_name=friendly_name,
+            code_length=code_length,
+            lookup_enabled=lookup_enabled,
+            skip_sms_to_landlines=skip_sms_to_landlines,
+            dtmf_input_required=dtmf_input_required,
+            tts_name=tts_name,
+            psd2_enabled=psd2_enabled,
+            do_not_share_warning_enabled=do_not_share_warning_enabled,
+            custom_code_enabled=custom_code_enabled,
+            push_include_date=push_include_date,
+            push_apn_credential_sid=push_apn_credential_sid,
+            push_fcm_credential_sid=push_fcm_credential_sid,
+            totp_issuer=totp_issuer,
+            totp_time_step=totp_time_step,
+            totp_code_length=totp_code_length,
+            totp_skew=totp_skew,
+            default_template_sid=default_template_sid,
+        )
+
     @property
     def verifications(self):
         """
@@ -788,3 +1119,25 @@ class ServiceInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Verify.V2.ServiceInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'AccessTokenList': 'twilio.rest.verify.v2.service.access_token',
+    'EntityList': 'twilio.rest.verify.v2.service.entity',
+    'MessagingConfigurationList': 'twilio.rest.verify.v2.service.messaging_configuration',
+    'RateLimitList': 'twilio.rest.verify.v2.service.rate_limit',
+    'VerificationCheckList': 'twilio.rest.verify.v2.service.verification_check',
+    'VerificationList': 'twilio.rest.verify.v2.service.verification',
+    'WebhookList': 'twilio.rest.verify.v2.service.webhook',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
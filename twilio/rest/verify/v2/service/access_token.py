@@ -32,10 +32,10 @@ class AccessTokenList(ListResource):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, }
-        self._uri = '/Services/{service_sid}/AccessTokens'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/AccessTokens', self._solution)
 
     def create(self, identity, factor_type, factor_friendly_name=values.unset,
-               ttl=values.unset):
+               ttl=values.unset, deadline=None):
         """
         Create the AccessTokenInstance
 
@@ -43,6 +43,8 @@ class AccessTokenList(ListResource):
         :param AccessTokenInstance.FactorTypes factor_type: The Type of this Factor
         :param unicode factor_friendly_name: The factor friendly name
         :param unicode ttl: How long, in seconds, the access token is valid.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created AccessTokenInstance
         :rtype: twilio.rest.verify.v2.service.access_token.AccessTokenInstance
@@ -54,7 +56,33 @@ class AccessTokenList(ListResource):
             'Ttl': ttl,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return AccessTokenInstance(self._version, payload, service_sid=self._solution['service_sid'], )
+
+    async def create_async(self, identity, factor_type, factor_friendly_name=values.unset,
+                           ttl=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the AccessTokenInstance
+
+        :param unicode identity: Unique external identifier of the Entity
+        :param AccessTokenInstance.FactorTypes factor_type: The Type of this Factor
+        :param unicode factor_friendly_name: The factor friendly name
+        :param unicode ttl: How long, in seconds, the access token is valid.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created AccessTokenInstance
+        :rtype: twilio.rest.verify.v2.service.access_token.AccessTokenInstance
+        """
+        data = values.of({
+            'Identity': identity,
+            'FactorType': factor_type,
+            'FactorFriendlyName': factor_friendly_name,
+            'Ttl': ttl,
+        })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return AccessTokenInstance(self._version, payload, service_sid=self._solution['service_sid'], )
 
@@ -150,7 +178,7 @@ class AccessTokenContext(InstanceContext):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, 'sid': sid, }
-        self._uri = '/Services/{service_sid}/AccessTokens/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/AccessTokens/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -168,6 +196,22 @@ class AccessTokenContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the AccessTokenInstance
+
+        :returns: The fetched AccessTokenInstance
+        :rtype: twilio.rest.verify.v2.service.access_token.AccessTokenInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return AccessTokenInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            sid=self._solution['sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -186,6 +230,28 @@ class AccessTokenInstance(InstanceResource):
     class FactorTypes(object):
         PUSH = "push"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'ttl': deserialize.integer,
+        'date_created': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'service_sid': 'service_sid',
+        'entity_identity': 'entity_identity',
+        'factor_type': 'factor_type',
+        'factor_friendly_name': 'factor_friendly_name',
+        'token': 'token',
+        'url': 'url',
+        'ttl': 'ttl',
+        'date_created': 'date_created',
+    }, _deserializers)
+
     def __init__(self, version, payload, service_sid, sid=None):
         """
         Initialize the AccessTokenInstance
@@ -196,18 +262,7 @@ class AccessTokenInstance(InstanceResource):
         super(AccessTokenInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'service_sid': payload.get('service_sid'),
-            'entity_identity': payload.get('entity_identity'),
-            'factor_type': payload.get('factor_type'),
-            'factor_friendly_name': payload.get('factor_friendly_name'),
-            'token': payload.get('token'),
-            'url': payload.get('url'),
-            'ttl': deserialize.integer(payload.get('ttl')),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -319,6 +374,15 @@ class AccessTokenInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the AccessTokenInstance
+
+        :returns: The fetched AccessTokenInstance
+        :rtype: twilio.rest.verify.v2.service.access_token.AccessTokenInstance
+        """
+        return await self._proxy.fetch_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -6,15 +6,14 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.verify.v2.service.entity.challenge import ChallengeList
-from twilio.rest.verify.v2.service.entity.factor import FactorList
-from twilio.rest.verify.v2.service.entity.new_factor import NewFactorList
 
 
 class EntityList(ListResource):
@@ -35,24 +34,43 @@ class EntityList(ListResource):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, }
-        self._uri = '/Services/{service_sid}/Entities'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/Entities', self._solution)
 
-    def create(self, identity):
+    def create(self, identity, deadline=None):
         """
         Create the EntityInstance
 
         :param unicode identity: Unique external identifier of the Entity
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created EntityInstance
+        :rtype: twilio.rest.verify.v2.service.entity.EntityInstance
+        """
+        data = values.of({'Identity': identity, })
+
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return EntityInstance(self._version, payload, service_sid=self._solution['service_sid'], )
+
+    async def create_async(self, identity, deadline=None):
+        """
+        Asynchronous coroutine that creates the EntityInstance
+
+        :param unicode identity: Unique external identifier of the Entity
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created EntityInstance
         :rtype: twilio.rest.verify.v2.service.entity.EntityInstance
         """
         data = values.of({'Identity': identity, })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return EntityInstance(self._version, payload, service_sid=self._solution['service_sid'], )
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams EntityInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -65,17 +83,57 @@ class EntityList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.verify.v2.service.entity.EntityInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-        return self._version.stream(page, limits['limit'])
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams EntityInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
 
-    def list(self, limit=None, page_size=None):
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.verify.v2.service.entity.EntityInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists EntityInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -87,11 +145,42 @@ class EntityList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.verify.v2.service.entity.EntityInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists EntityInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.verify.v2.service.entity.EntityInstance]
+        """
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -112,6 +201,25 @@ class EntityList(ListResource):
 
         return EntityPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of EntityInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of EntityInstance
+        :rtype: twilio.rest.verify.v2.service.entity.EntityPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return EntityPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of EntityInstance records from the API.
@@ -129,6 +237,23 @@ class EntityList(ListResource):
 
         return EntityPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of EntityInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of EntityInstance
+        :rtype: twilio.rest.verify.v2.service.entity.EntityPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return EntityPage(self._version, response, self._solution)
+
     def get(self, identity):
         """
         Constructs a EntityContext
@@ -221,7 +346,7 @@ class EntityContext(InstanceContext):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, 'identity': identity, }
-        self._uri = '/Services/{service_sid}/Entities/{identity}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/Entities/{identity}', self._solution)
 
         # Dependents
         self._factors = None
@@ -237,6 +362,15 @@ class EntityContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the EntityInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def fetch(self):
         """
         Fetch the EntityInstance
@@ -253,6 +387,22 @@ class EntityContext(InstanceContext):
             identity=self._solution['identity'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the EntityInstance
+
+        :returns: The fetched EntityInstance
+        :rtype: twilio.rest.verify.v2.service.entity.EntityInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return EntityInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            identity=self._solution['identity'],
+        )
+
     @property
     def factors(self):
         """
@@ -262,6 +412,7 @@ class EntityContext(InstanceContext):
         :rtype: twilio.rest.verify.v2.service.entity.factor.FactorList
         """
         if self._factors is None:
+            from twilio.rest.verify.v2.service.entity.factor import FactorList
             self._factors = FactorList(
                 self._version,
                 service_sid=self._solution['service_sid'],
@@ -278,6 +429,7 @@ class EntityContext(InstanceContext):
         :rtype: twilio.rest.verify.v2.service.entity.new_factor.NewFactorList
         """
         if self._new_factors is None:
+            from twilio.rest.verify.v2.service.entity.new_factor import NewFactorList
             self._new_factors = NewFactorList(
                 self._version,
                 service_sid=self._solution['service_sid'],
@@ -294,6 +446,7 @@ class EntityContext(InstanceContext):
         :rtype: twilio.rest.verify.v2.service.entity.challenge.ChallengeList
         """
         if self._challenges is None:
+            from twilio.rest.verify.v2.service.entity.challenge import ChallengeList
             self._challenges = ChallengeList(
                 self._version,
                 service_sid=self._solution['service_sid'],
@@ -316,6 +469,26 @@ class EntityInstance(InstanceResource):
     """ PLEASE NOTE that this class contains beta products that are subject to
     change. Use them with caution. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'identity': 'identity',
+        'account_sid': 'account_sid',
+        'service_sid': 'service_sid',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'url': 'url',
+        'links': 'links',
+    }, _deserializers)
+
     def __init__(self, version, payload, service_sid, identity=None):
         """
         Initialize the EntityInstance
@@ -326,16 +499,7 @@ class EntityInstance(InstanceResource):
         super(EntityInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'identity': payload.get('identity'),
-            'account_sid': payload.get('account_sid'),
-            'service_sid': payload.get('service_sid'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -431,6 +595,15 @@ class EntityInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the EntityInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def fetch(self):
         """
         Fetch the EntityInstance
@@ -440,6 +613,15 @@ class EntityInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the EntityInstance
+
+        :returns: The fetched EntityInstance
+        :rtype: twilio.rest.verify.v2.service.entity.EntityInstance
+        """
+        return await self._proxy.fetch_async()
+
     @property
     def factors(self):
         """
@@ -479,3 +661,21 @@ class EntityInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Verify.V2.EntityInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'ChallengeList': 'twilio.rest.verify.v2.service.entity.challenge',
+    'FactorList': 'twilio.rest.verify.v2.service.entity.factor',
+    'NewFactorList': 'twilio.rest.verify.v2.service.entity.new_factor',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -6,6 +6,8 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import serialize
 from twilio.base import values
@@ -13,7 +15,6 @@ from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.verify.v2.service.entity.challenge.notification import NotificationList
 
 
 class ChallengeList(ListResource):
@@ -35,11 +36,11 @@ class ChallengeList(ListResource):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, 'identity': identity, }
-        self._uri = '/Services/{service_sid}/Entities/{identity}/Challenges'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/Entities/{identity}/Challenges', self._solution)
 
     def create(self, factor_sid, expiration_date=values.unset,
                details_message=values.unset, details_fields=values.unset,
-               hidden_details=values.unset, auth_payload=values.unset):
+               hidden_details=values.unset, auth_payload=values.unset, deadline=None):
         """
         Create the ChallengeInstance
 
@@ -49,6 +50,44 @@ class ChallengeList(ListResource):
         :param list[dict] details_fields: A list of objects that describe the Fields included in the Challenge
         :param dict hidden_details: Hidden details provided to contextualize the Challenge
         :param unicode auth_payload: Optional payload to verify the Challenge
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created ChallengeInstance
+        :rtype: twilio.rest.verify.v2.service.entity.challenge.ChallengeInstance
+        """
+        data = values.of({
+            'FactorSid': factor_sid,
+            'ExpirationDate': serialize.iso8601_datetime(expiration_date),
+            'Details.Message': details_message,
+            'Details.Fields': serialize.map(details_fields, lambda e: serialize.object(e)),
+            'HiddenDetails': serialize.object(hidden_details),
+            'AuthPayload': auth_payload,
+        })
+
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return ChallengeInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            identity=self._solution['identity'],
+        )
+
+    async def create_async(self, factor_sid, expiration_date=values.unset,
+                           details_message=values.unset, details_fields=values.unset,
+                           hidden_details=values.unset, auth_payload=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the ChallengeInstance
+
+        :param unicode factor_sid: Factor Sid.
+        :param datetime expiration_date: The date-time when this Challenge expires
+        :param unicode details_message: Shown to the user when the push notification arrives
+        :param list[dict] details_fields: A list of objects that describe the Fields included in the Challenge
+        :param dict hidden_details: Hidden details provided to contextualize the Challenge
+        :param unicode auth_payload: Optional payload to verify the Challenge
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created ChallengeInstance
         :rtype: twilio.rest.verify.v2.service.entity.challenge.ChallengeInstance
@@ -62,7 +101,7 @@ class ChallengeList(ListResource):
             'AuthPayload': auth_payload,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return ChallengeInstance(
             self._version,
@@ -72,7 +111,8 @@ class ChallengeList(ListResource):
         )
 
     def stream(self, factor_sid=values.unset, status=values.unset,
-               order=values.unset, limit=None, page_size=None):
+               order=values.unset, limit=None, page_size=None, prefetch=None,
+               raw=False, deadline=None):
         """
         Streams ChallengeInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -88,18 +128,62 @@ class ChallengeList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.verify.v2.service.entity.challenge.ChallengeInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(factor_sid=factor_sid, status=status, order=order, page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(factor_sid=factor_sid, status=status, order=order, page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, factor_sid=values.unset, status=values.unset,
+                           order=values.unset, limit=None, page_size=None,
+                           prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams ChallengeInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param unicode factor_sid: Factor Sid.
+        :param ChallengeInstance.ChallengeStatuses status: The Status of theChallenges to fetch
+        :param ChallengeInstance.ListOrders order: The sort order of the Challenges list
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.verify.v2.service.entity.challenge.ChallengeInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(factor_sid=factor_sid, status=status, order=order, page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, factor_sid=values.unset, status=values.unset, order=values.unset,
-             limit=None, page_size=None):
+             limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists ChallengeInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -114,6 +198,12 @@ class ChallengeList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.verify.v2.service.entity.challenge.ChallengeInstance]
@@ -124,8 +214,48 @@ class ChallengeList(ListResource):
             order=order,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, factor_sid=values.unset, status=values.unset, order=values.unset,
+                         limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists ChallengeInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param unicode factor_sid: Factor Sid.
+        :param ChallengeInstance.ChallengeStatuses status: The Status of theChallenges to fetch
+        :param ChallengeInstance.ListOrders order: The sort order of the Challenges list
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.verify.v2.service.entity.challenge.ChallengeInstance]
+        """
+        return [record async for record in await self.stream_async(
+            factor_sid=factor_sid,
+            status=status,
+            order=order,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, factor_sid=values.unset, status=values.unset, order=values.unset,
              page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -156,6 +286,36 @@ class ChallengeList(ListResource):
 
         return ChallengePage(self._version, response, self._solution)
 
+    async def page_async(self, factor_sid=values.unset, status=values.unset, order=values.unset,
+                         page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of ChallengeInstance records from the API.
+        Request is executed immediately
+
+        :param unicode factor_sid: Factor Sid.
+        :param ChallengeInstance.ChallengeStatuses status: The Status of theChallenges to fetch
+        :param ChallengeInstance.ListOrders order: The sort order of the Challenges list
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of ChallengeInstance
+        :rtype: twilio.rest.verify.v2.service.entity.challenge.ChallengePage
+        """
+        data = values.of({
+            'FactorSid': factor_sid,
+            'Status': status,
+            'Order': order,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return ChallengePage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of ChallengeInstance records from the API.
@@ -173,6 +333,23 @@ class ChallengeList(ListResource):
 
         return ChallengePage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of ChallengeInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of ChallengeInstance
+        :rtype: twilio.rest.verify.v2.service.entity.challenge.ChallengePage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return ChallengePage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a ChallengeContext
@@ -282,7 +459,7 @@ class ChallengeContext(InstanceContext):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, 'identity': identity, 'sid': sid, }
-        self._uri = '/Services/{service_sid}/Entities/{identity}/Challenges/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/Entities/{identity}/Challenges/{sid}', self._solution)
 
         # Dependents
         self._notifications = None
@@ -304,6 +481,23 @@ class ChallengeContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ChallengeInstance
+
+        :returns: The fetched ChallengeInstance
+        :rtype: twilio.rest.verify.v2.service.entity.challenge.ChallengeInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return ChallengeInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            identity=self._solution['identity'],
+            sid=self._solution['sid'],
+        )
+
     def update(self, auth_payload=values.unset, metadata=values.unset):
         """
         Update the ChallengeInstance
@@ -326,6 +520,28 @@ class ChallengeContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, auth_payload=values.unset, metadata=values.unset):
+        """
+        Asynchronous coroutine that updates the ChallengeInstance
+
+        :param unicode auth_payload: Optional payload to verify the Challenge
+        :param dict metadata: Metadata of the challenge.
+
+        :returns: The updated ChallengeInstance
+        :rtype: twilio.rest.verify.v2.service.entity.challenge.ChallengeInstance
+        """
+        data = values.of({'AuthPayload': auth_payload, 'Metadata': serialize.object(metadata), })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return ChallengeInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            identity=self._solution['identity'],
+            sid=self._solution['sid'],
+        )
+
     @property
     def notifications(self):
         """
@@ -335,6 +551,7 @@ class ChallengeContext(InstanceContext):
         :rtype: twilio.rest.verify.v2.service.entity.challenge.notification.NotificationList
         """
         if self._notifications is None:
+            from twilio.rest.verify.v2.service.entity.challenge.notification import NotificationList
             self._notifications = NotificationList(
                 self._version,
                 service_sid=self._solution['service_sid'],
@@ -377,6 +594,38 @@ class ChallengeInstance(InstanceResource):
         ASC = "asc"
         DESC = "desc"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+        'date_responded': deserialize.iso8601_datetime,
+        'expiration_date': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'service_sid': 'service_sid',
+        'entity_sid': 'entity_sid',
+        'identity': 'identity',
+        'factor_sid': 'factor_sid',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'date_responded': 'date_responded',
+        'expiration_date': 'expiration_date',
+        'status': 'status',
+        'responded_reason': 'responded_reason',
+        'details': 'details',
+        'hidden_details': 'hidden_details',
+        'metadata': 'metadata',
+        'factor_type': 'factor_type',
+        'url': 'url',
+        'links': 'links',
+    }, _deserializers)
+
     def __init__(self, version, payload, service_sid, identity, sid=None):
         """
         Initialize the ChallengeInstance
@@ -387,26 +636,7 @@ class ChallengeInstance(InstanceResource):
         super(ChallengeInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'service_sid': payload.get('service_sid'),
-            'entity_sid': payload.get('entity_sid'),
-            'identity': payload.get('identity'),
-            'factor_sid': payload.get('factor_sid'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'date_responded': deserialize.iso8601_datetime(payload.get('date_responded')),
-            'expiration_date': deserialize.iso8601_datetime(payload.get('expiration_date')),
-            'status': payload.get('status'),
-            'responded_reason': payload.get('responded_reason'),
-            'details': payload.get('details'),
-            'hidden_details': payload.get('hidden_details'),
-            'metadata': payload.get('metadata'),
-            'factor_type': payload.get('factor_type'),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -587,6 +817,15 @@ class ChallengeInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ChallengeInstance
+
+        :returns: The fetched ChallengeInstance
+        :rtype: twilio.rest.verify.v2.service.entity.challenge.ChallengeInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, auth_payload=values.unset, metadata=values.unset):
         """
         Update the ChallengeInstance
@@ -599,6 +838,18 @@ class ChallengeInstance(InstanceResource):
         """
         return self._proxy.update(auth_payload=auth_payload, metadata=metadata, )
 
+    async def update_async(self, auth_payload=values.unset, metadata=values.unset):
+        """
+        Asynchronous coroutine that updates the ChallengeInstance
+
+        :param unicode auth_payload: Optional payload to verify the Challenge
+        :param dict metadata: Metadata of the challenge.
+
+        :returns: The updated ChallengeInstance
+        :rtype: twilio.rest.verify.v2.service.entity.challenge.ChallengeInstance
+        """
+        return await self._proxy.update_async(auth_payload=auth_payload, metadata=metadata, )
+
     @property
     def notifications(self):
         """
@@ -618,3 +869,19 @@ class ChallengeInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Verify.V2.ChallengeInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'NotificationList': 'twilio.rest.verify.v2.service.entity.challenge.notification',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
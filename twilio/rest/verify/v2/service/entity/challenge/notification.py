@@ -33,20 +33,45 @@ class NotificationList(ListResource):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, 'identity': identity, 'challenge_sid': challenge_sid, }
-        self._uri = '/Services/{service_sid}/Entities/{identity}/Challenges/{challenge_sid}/Notifications'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/Entities/{identity}/Challenges/{challenge_sid}/Notifications', self._solution)
 
-    def create(self, ttl=values.unset):
+    def create(self, ttl=values.unset, deadline=None):
         """
         Create the NotificationInstance
 
         :param unicode ttl: How long, in seconds, the notification is valid.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created NotificationInstance
         :rtype: twilio.rest.verify.v2.service.entity.challenge.notification.NotificationInstance
         """
         data = values.of({'Ttl': ttl, })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return NotificationInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            identity=self._solution['identity'],
+            challenge_sid=self._solution['challenge_sid'],
+        )
+
+    async def create_async(self, ttl=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the NotificationInstance
+
+        :param unicode ttl: How long, in seconds, the notification is valid.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created NotificationInstance
+        :rtype: twilio.rest.verify.v2.service.entity.challenge.notification.NotificationInstance
+        """
+        data = values.of({'Ttl': ttl, })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return NotificationInstance(
             self._version,
@@ -119,6 +144,27 @@ class NotificationInstance(InstanceResource):
     """ PLEASE NOTE that this class contains beta products that are subject to
     change. Use them with caution. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'ttl': deserialize.integer,
+        'date_created': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'service_sid': 'service_sid',
+        'entity_sid': 'entity_sid',
+        'identity': 'identity',
+        'challenge_sid': 'challenge_sid',
+        'priority': 'priority',
+        'ttl': 'ttl',
+        'date_created': 'date_created',
+    }, _deserializers)
+
     def __init__(self, version, payload, service_sid, identity, challenge_sid):
         """
         Initialize the NotificationInstance
@@ -129,17 +175,7 @@ class NotificationInstance(InstanceResource):
         super(NotificationInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'service_sid': payload.get('service_sid'),
-            'entity_sid': payload.get('entity_sid'),
-            'identity': payload.get('identity'),
-            'challenge_sid': payload.get('challenge_sid'),
-            'priority': payload.get('priority'),
-            'ttl': deserialize.integer(payload.get('ttl')),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
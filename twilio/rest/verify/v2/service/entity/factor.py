@@ -33,9 +33,9 @@ class FactorList(ListResource):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, 'identity': identity, }
-        self._uri = '/Services/{service_sid}/Entities/{identity}/Factors'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/Entities/{identity}/Factors', self._solution)
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams FactorInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -48,17 +48,57 @@ class FactorList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.verify.v2.service.entity.factor.FactorInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams FactorInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.verify.v2.service.entity.factor.FactorInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists FactorInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -70,11 +110,42 @@ class FactorList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.verify.v2.service.entity.factor.FactorInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists FactorInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.verify.v2.service.entity.factor.FactorInstance]
+        """
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -95,6 +166,25 @@ class FactorList(ListResource):
 
         return FactorPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of FactorInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of FactorInstance
+        :rtype: twilio.rest.verify.v2.service.entity.factor.FactorPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return FactorPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of FactorInstance records from the API.
@@ -112,6 +202,23 @@ class FactorList(ListResource):
 
         return FactorPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of FactorInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of FactorInstance
+        :rtype: twilio.rest.verify.v2.service.entity.factor.FactorPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return FactorPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a FactorContext
@@ -221,7 +328,7 @@ class FactorContext(InstanceContext):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, 'identity': identity, 'sid': sid, }
-        self._uri = '/Services/{service_sid}/Entities/{identity}/Factors/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/Entities/{identity}/Factors/{sid}', self._solution)
 
     def delete(self):
         """
@@ -232,6 +339,15 @@ class FactorContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the FactorInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def fetch(self):
         """
         Fetch the FactorInstance
@@ -249,6 +365,23 @@ class FactorContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the FactorInstance
+
+        :returns: The fetched FactorInstance
+        :rtype: twilio.rest.verify.v2.service.entity.factor.FactorInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return FactorInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            identity=self._solution['identity'],
+            sid=self._solution['sid'],
+        )
+
     def update(self, auth_payload=values.unset, friendly_name=values.unset,
                config_notification_token=values.unset,
                config_sdk_version=values.unset, config_time_step=values.unset,
@@ -292,6 +425,49 @@ class FactorContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, auth_payload=values.unset, friendly_name=values.unset,
+                           config_notification_token=values.unset,
+                           config_sdk_version=values.unset, config_time_step=values.unset,
+                           config_skew=values.unset, config_code_length=values.unset,
+                           config_alg=values.unset, config_notification_platform=values.unset):
+        """
+        Asynchronous coroutine that updates the FactorInstance
+
+        :param unicode auth_payload: Optional payload to verify the Factor for the first time
+        :param unicode friendly_name: The friendly name of this Factor
+        :param unicode config_notification_token: For APN, the device token. For FCM, the registration token
+        :param unicode config_sdk_version: The Verify Push SDK version used to configure the factor
+        :param unicode config_time_step: How often, in seconds, are TOTP codes generated
+        :param unicode config_skew: The number of past and future time-steps valid at a given time
+        :param unicode config_code_length: Number of digits for generated TOTP codes
+        :param FactorInstance.TotpAlgorithms config_alg: The algorithm used to derive the TOTP codes
+        :param unicode config_notification_platform: The transport technology used to generate the Notification Token
+
+        :returns: The updated FactorInstance
+        :rtype: twilio.rest.verify.v2.service.entity.factor.FactorInstance
+        """
+        data = values.of({
+            'AuthPayload': auth_payload,
+            'FriendlyName': friendly_name,
+            'Config.NotificationToken': config_notification_token,
+            'Config.SdkVersion': config_sdk_version,
+            'Config.TimeStep': config_time_step,
+            'Config.Skew': config_skew,
+            'Config.CodeLength': config_code_length,
+            'Config.Alg': config_alg,
+            'Config.NotificationPlatform': config_notification_platform,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return FactorInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            identity=self._solution['identity'],
+            sid=self._solution['sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -325,6 +501,31 @@ class FactorInstance(InstanceResource):
         SHA256 = "sha256"
         SHA512 = "sha512"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'service_sid': 'service_sid',
+        'entity_sid': 'entity_sid',
+        'identity': 'identity',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'friendly_name': 'friendly_name',
+        'status': 'status',
+        'factor_type': 'factor_type',
+        'config': 'config',
+        'metadata': 'metadata',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload, service_sid, identity, sid=None):
         """
         Initialize the FactorInstance
@@ -335,21 +536,7 @@ class FactorInstance(InstanceResource):
         super(FactorInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'service_sid': payload.get('service_sid'),
-            'entity_sid': payload.get('entity_sid'),
-            'identity': payload.get('identity'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'friendly_name': payload.get('friendly_name'),
-            'status': payload.get('status'),
-            'factor_type': payload.get('factor_type'),
-            'config': payload.get('config'),
-            'metadata': payload.get('metadata'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -490,6 +677,15 @@ class FactorInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the FactorInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def fetch(self):
         """
         Fetch the FactorInstance
@@ -499,6 +695,15 @@ class FactorInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the FactorInstance
+
+        :returns: The fetched FactorInstance
+        :rtype: twilio.rest.verify.v2.service.entity.factor.FactorInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, auth_payload=values.unset, friendly_name=values.unset,
                config_notification_token=values.unset,
                config_sdk_version=values.unset, config_time_step=values.unset,
@@ -532,6 +737,39 @@ class FactorInstance(InstanceResource):
             config_notification_platform=config_notification_platform,
         )
 
+    async def update_async(self, auth_payload=values.unset, friendly_name=values.unset,
+                           config_notification_token=values.unset,
+                           config_sdk_version=values.unset, config_time_step=values.unset,
+                           config_skew=values.unset, config_code_length=values.unset,
+                           config_alg=values.unset, config_notification_platform=values.unset):
+        """
+        Asynchronous coroutine that updates the FactorInstance
+
+        :param unicode auth_payload: Optional payload to verify the Factor for the first time
+        :param unicode friendly_name: The friendly name of this Factor
+        :param unicode config_notification_token: For APN, the device token. For FCM, the registration token
+        :param unicode config_sdk_version: The Verify Push SDK version used to configure the factor
+        :param unicode config_time_step: How often, in seconds, are TOTP codes generated
+        :param unicode config_skew: The number of past and future time-steps valid at a given time
+        :param unicode config_code_length: Number of digits for generated TOTP codes
+        :param FactorInstance.TotpAlgorithms config_alg: The algorithm used to derive the TOTP codes
+        :param unicode config_notification_platform: The transport technology used to generate the Notification Token
+
+        :returns: The updated FactorInstance
+        :rtype: twilio.rest.verify.v2.service.entity.factor.FactorInstance
+        """
+        return await self._proxy.update_async(
+            auth_payload=auth_payload,
+            friendly_name=friendly_name,
+            config_notification_token=config_notification_token,
+            config_sdk_version=config_sdk_version,
+            config_time_step=config_time_step,
+            config_skew=config_skew,
+            config_code_length=config_code_length,
+            config_alg=config_alg,
+            config_notification_platform=config_notification_platform,
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -33,7 +33,7 @@ class NewFactorList(ListResource):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, 'identity': identity, }
-        self._uri = '/Services/{service_sid}/Entities/{identity}/Factors'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/Entities/{identity}/Factors', self._solution)
 
     def create(self, friendly_name, factor_type, binding_alg=values.unset,
                binding_public_key=values.unset, config_app_id=values.unset,
@@ -42,7 +42,7 @@ class NewFactorList(ListResource):
                config_sdk_version=values.unset, binding_secret=values.unset,
                config_time_step=values.unset, config_skew=values.unset,
                config_code_length=values.unset, config_alg=values.unset,
-               metadata=values.unset):
+               metadata=values.unset, deadline=None):
         """
         Create the NewFactorInstance
 
@@ -60,6 +60,8 @@ class NewFactorList(ListResource):
         :param unicode config_code_length: Number of digits for generated TOTP codes
         :param NewFactorInstance.TotpAlgorithms config_alg: The algorithm used to derive the TOTP codes
         :param dict metadata: Metadata of the factor.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created NewFactorInstance
         :rtype: twilio.rest.verify.v2.service.entity.new_factor.NewFactorInstance
@@ -81,7 +83,64 @@ class NewFactorList(ListResource):
             'Metadata': serialize.object(metadata),
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return NewFactorInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            identity=self._solution['identity'],
+        )
+
+    async def create_async(self, friendly_name, factor_type, binding_alg=values.unset,
+                           binding_public_key=values.unset, config_app_id=values.unset,
+                           config_notification_platform=values.unset,
+                           config_notification_token=values.unset,
+                           config_sdk_version=values.unset, binding_secret=values.unset,
+                           config_time_step=values.unset, config_skew=values.unset,
+                           config_code_length=values.unset, config_alg=values.unset,
+                           metadata=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the NewFactorInstance
+
+        :param unicode friendly_name: The friendly name of this Factor
+        :param NewFactorInstance.FactorTypes factor_type: The Type of this Factor
+        :param unicode binding_alg: The algorithm used when `factor_type` is `push`
+        :param unicode binding_public_key: The public key encoded in Base64
+        :param unicode config_app_id: The ID that uniquely identifies your app in the Google or Apple store
+        :param NewFactorInstance.NotificationPlatforms config_notification_platform: The transport technology used to generate the Notification Token
+        :param unicode config_notification_token: For APN, the device token. For FCM, the registration token
+        :param unicode config_sdk_version: The Verify Push SDK version used to configure the factor
+        :param unicode binding_secret: The shared secret in Base32
+        :param unicode config_time_step: How often, in seconds, are TOTP codes generated
+        :param unicode config_skew: The number of past and future time-steps valid at a given time
+        :param unicode config_code_length: Number of digits for generated TOTP codes
+        :param NewFactorInstance.TotpAlgorithms config_alg: The algorithm used to derive the TOTP codes
+        :param dict metadata: Metadata of the factor.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created NewFactorInstance
+        :rtype: twilio.rest.verify.v2.service.entity.new_factor.NewFactorInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'FactorType': factor_type,
+            'Binding.Alg': binding_alg,
+            'Binding.PublicKey': binding_public_key,
+            'Config.AppId': config_app_id,
+            'Config.NotificationPlatform': config_notification_platform,
+            'Config.NotificationToken': config_notification_token,
+            'Config.SdkVersion': config_sdk_version,
+            'Binding.Secret': binding_secret,
+            'Config.TimeStep': config_time_step,
+            'Config.Skew': config_skew,
+            'Config.CodeLength': config_code_length,
+            'Config.Alg': config_alg,
+            'Metadata': serialize.object(metadata),
+        })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return NewFactorInstance(
             self._version,
@@ -169,6 +228,32 @@ class NewFactorInstance(InstanceResource):
         SHA256 = "sha256"
         SHA512 = "sha512"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'service_sid': 'service_sid',
+        'entity_sid': 'entity_sid',
+        'identity': 'identity',
+        'binding': 'binding',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'friendly_name': 'friendly_name',
+        'status': 'status',
+        'factor_type': 'factor_type',
+        'config': 'config',
+        'metadata': 'metadata',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload, service_sid, identity):
         """
         Initialize the NewFactorInstance
@@ -179,22 +264,7 @@ class NewFactorInstance(InstanceResource):
         super(NewFactorInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'service_sid': payload.get('service_sid'),
-            'entity_sid': payload.get('entity_sid'),
-            'identity': payload.get('identity'),
-            'binding': payload.get('binding'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'friendly_name': payload.get('friendly_name'),
-            'status': payload.get('status'),
-            'factor_type': payload.get('factor_type'),
-            'config': payload.get('config'),
-            'metadata': payload.get('metadata'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
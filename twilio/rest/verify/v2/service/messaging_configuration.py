@@ -30,21 +30,23 @@ class MessagingConfigurationList(ListResource):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, }
-        self._uri = '/Services/{service_sid}/MessagingConfigurations'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/MessagingConfigurations', self._solution)
 
-    def create(self, country, messaging_service_sid):
+    def create(self, country, messaging_service_sid, deadline=None):
         """
         Create the MessagingConfigurationInstance
 
         :param unicode country: The ISO-3166-1 country code of the country or `all`.
         :param unicode messaging_service_sid: The SID of the Messaging Service used for this configuration.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created MessagingConfigurationInstance
         :rtype: twilio.rest.verify.v2.service.messaging_configuration.MessagingConfigurationInstance
         """
         data = values.of({'Country': country, 'MessagingServiceSid': messaging_service_sid, })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return MessagingConfigurationInstance(
             self._version,
@@ -52,7 +54,29 @@ class MessagingConfigurationList(ListResource):
             service_sid=self._solution['service_sid'],
         )
 
-    def stream(self, limit=None, page_size=None):
+    async def create_async(self, country, messaging_service_sid, deadline=None):
+        """
+        Asynchronous coroutine that creates the MessagingConfigurationInstance
+
+        :param unicode country: The ISO-3166-1 country code of the country or `all`.
+        :param unicode messaging_service_sid: The SID of the Messaging Service used for this configuration.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created MessagingConfigurationInstance
+        :rtype: twilio.rest.verify.v2.service.messaging_configuration.MessagingConfigurationInstance
+        """
+        data = values.of({'Country': country, 'MessagingServiceSid': messaging_service_sid, })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return MessagingConfigurationInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+        )
+
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams MessagingConfigurationInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -65,17 +89,57 @@ class MessagingConfigurationList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.verify.v2.service.messaging_configuration.MessagingConfigurationInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams MessagingConfigurationInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.verify.v2.service.messaging_configuration.MessagingConfigurationInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists MessagingConfigurationInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -87,11 +151,42 @@ class MessagingConfigurationList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.verify.v2.service.messaging_configuration.MessagingConfigurationInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists MessagingConfigurationInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.verify.v2.service.messaging_configuration.MessagingConfigurationInstance]
+        """
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -112,6 +207,25 @@ class MessagingConfigurationList(ListResource):
 
         return MessagingConfigurationPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of MessagingConfigurationInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of MessagingConfigurationInstance
+        :rtype: twilio.rest.verify.v2.service.messaging_configuration.MessagingConfigurationPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return MessagingConfigurationPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of MessagingConfigurationInstance records from the API.
@@ -129,6 +243,23 @@ class MessagingConfigurationList(ListResource):
 
         return MessagingConfigurationPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of MessagingConfigurationInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of MessagingConfigurationInstance
+        :rtype: twilio.rest.verify.v2.service.messaging_configuration.MessagingConfigurationPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return MessagingConfigurationPage(self._version, response, self._solution)
+
     def get(self, country):
         """
         Constructs a MessagingConfigurationContext
@@ -229,7 +360,7 @@ class MessagingConfigurationContext(InstanceContext):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, 'country': country, }
-        self._uri = '/Services/{service_sid}/MessagingConfigurations/{country}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/MessagingConfigurations/{country}', self._solution)
 
     def update(self, messaging_service_sid):
         """
@@ -251,6 +382,26 @@ class MessagingConfigurationContext(InstanceContext):
             country=self._solution['country'],
         )
 
+    async def update_async(self, messaging_service_sid):
+        """
+        Asynchronous coroutine that updates the MessagingConfigurationInstance
+
+        :param unicode messaging_service_sid: The SID of the Messaging Service used for this configuration.
+
+        :returns: The updated MessagingConfigurationInstance
+        :rtype: twilio.rest.verify.v2.service.messaging_configuration.MessagingConfigurationInstance
+        """
+        data = values.of({'MessagingServiceSid': messaging_service_sid, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return MessagingConfigurationInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            country=self._solution['country'],
+        )
+
     def fetch(self):
         """
         Fetch the MessagingConfigurationInstance
@@ -267,6 +418,22 @@ class MessagingConfigurationContext(InstanceContext):
             country=self._solution['country'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the MessagingConfigurationInstance
+
+        :returns: The fetched MessagingConfigurationInstance
+        :rtype: twilio.rest.verify.v2.service.messaging_configuration.MessagingConfigurationInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return MessagingConfigurationInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            country=self._solution['country'],
+        )
+
     def delete(self):
         """
         Deletes the MessagingConfigurationInstance
@@ -276,6 +443,15 @@ class MessagingConfigurationContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the MessagingConfigurationInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -289,6 +465,25 @@ class MessagingConfigurationContext(InstanceContext):
 
 class MessagingConfigurationInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'service_sid': 'service_sid',
+        'country': 'country',
+        'messaging_service_sid': 'messaging_service_sid',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload, service_sid, country=None):
         """
         Initialize the MessagingConfigurationInstance
@@ -299,15 +494,7 @@ class MessagingConfigurationInstance(InstanceResource):
         super(MessagingConfigurationInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'service_sid': payload.get('service_sid'),
-            'country': payload.get('country'),
-            'messaging_service_sid': payload.get('messaging_service_sid'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -397,6 +584,17 @@ class MessagingConfigurationInstance(InstanceResource):
         """
         return self._proxy.update(messaging_service_sid, )
 
+    async def update_async(self, messaging_service_sid):
+        """
+        Asynchronous coroutine that updates the MessagingConfigurationInstance
+
+        :param unicode messaging_service_sid: The SID of the Messaging Service used for this configuration.
+
+        :returns: The updated MessagingConfigurationInstance
+        :rtype: twilio.rest.verify.v2.service.messaging_configuration.MessagingConfigurationInstance
+        """
+        return await self._proxy.update_async(messaging_service_sid, )
+
     def fetch(self):
         """
         Fetch the MessagingConfigurationInstance
@@ -406,6 +604,15 @@ class MessagingConfigurationInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the MessagingConfigurationInstance
+
+        :returns: The fetched MessagingConfigurationInstance
+        :rtype: twilio.rest.verify.v2.service.messaging_configuration.MessagingConfigurationInstance
+        """
+        return await self._proxy.fetch_async()
+
     def delete(self):
         """
         Deletes the MessagingConfigurationInstance
@@ -415,6 +622,15 @@ class MessagingConfigurationInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the MessagingConfigurationInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
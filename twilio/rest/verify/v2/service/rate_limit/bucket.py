@@ -31,21 +31,23 @@ class BucketList(ListResource):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, 'rate_limit_sid': rate_limit_sid, }
-        self._uri = '/Services/{service_sid}/RateLimits/{rate_limit_sid}/Buckets'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/RateLimits/{rate_limit_sid}/Buckets', self._solution)
 
-    def create(self, max, interval):
+    def create(self, max, interval, deadline=None):
         """
         Create the BucketInstance
 
         :param unicode max: Max number of requests.
         :param unicode interval: Number of seconds that the rate limit will be enforced over.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created BucketInstance
         :rtype: twilio.rest.verify.v2.service.rate_limit.bucket.BucketInstance
         """
         data = values.of({'Max': max, 'Interval': interval, })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return BucketInstance(
             self._version,
@@ -54,7 +56,30 @@ class BucketList(ListResource):
             rate_limit_sid=self._solution['rate_limit_sid'],
         )
 
-    def stream(self, limit=None, page_size=None):
+    async def create_async(self, max, interval, deadline=None):
+        """
+        Asynchronous coroutine that creates the BucketInstance
+
+        :param unicode max: Max number of requests.
+        :param unicode interval: Number of seconds that the rate limit will be enforced over.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created BucketInstance
+        :rtype: twilio.rest.verify.v2.service.rate_limit.bucket.BucketInstance
+        """
+        data = values.of({'Max': max, 'Interval': interval, })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return BucketInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            rate_limit_sid=self._solution['rate_limit_sid'],
+        )
+
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams BucketInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -67,17 +92,57 @@ class BucketList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.verify.v2.service.rate_limit.bucket.BucketInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams BucketInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.verify.v2.service.rate_limit.bucket.BucketInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists BucketInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -89,11 +154,42 @@ class BucketList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.verify.v2.service.rate_limit.bucket.BucketInstance]
+        """
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists BucketInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.verify.v2.service.rate_limit.bucket.BucketInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -114,6 +210,25 @@ class BucketList(ListResource):
 
         return BucketPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of BucketInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of BucketInstance
+        :rtype: twilio.rest.verify.v2.service.rate_limit.bucket.BucketPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return BucketPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of BucketInstance records from the API.
@@ -131,6 +246,23 @@ class BucketList(ListResource):
 
         return BucketPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of BucketInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of BucketInstance
+        :rtype: twilio.rest.verify.v2.service.rate_limit.bucket.BucketPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return BucketPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a BucketContext
@@ -236,7 +368,7 @@ class BucketContext(InstanceContext):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, 'rate_limit_sid': rate_limit_sid, 'sid': sid, }
-        self._uri = '/Services/{service_sid}/RateLimits/{rate_limit_sid}/Buckets/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/RateLimits/{rate_limit_sid}/Buckets/{sid}', self._solution)
 
     def update(self, max=values.unset, interval=values.unset):
         """
@@ -260,6 +392,28 @@ class BucketContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, max=values.unset, interval=values.unset):
+        """
+        Asynchronous coroutine that updates the BucketInstance
+
+        :param unicode max: Max number of requests.
+        :param unicode interval: Number of seconds that the rate limit will be enforced over.
+
+        :returns: The updated BucketInstance
+        :rtype: twilio.rest.verify.v2.service.rate_limit.bucket.BucketInstance
+        """
+        data = values.of({'Max': max, 'Interval': interval, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return BucketInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            rate_limit_sid=self._solution['rate_limit_sid'],
+            sid=self._solution['sid'],
+        )
+
     def fetch(self):
         """
         Fetch the BucketInstance
@@ -277,6 +431,23 @@ class BucketContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the BucketInstance
+
+        :returns: The fetched BucketInstance
+        :rtype: twilio.rest.verify.v2.service.rate_limit.bucket.BucketInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return BucketInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            rate_limit_sid=self._solution['rate_limit_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self):
         """
         Deletes the BucketInstance
@@ -286,6 +457,15 @@ class BucketContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the BucketInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -299,6 +479,29 @@ class BucketContext(InstanceContext):
 
 class BucketInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'max': deserialize.integer,
+        'interval': deserialize.integer,
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'rate_limit_sid': 'rate_limit_sid',
+        'service_sid': 'service_sid',
+        'account_sid': 'account_sid',
+        'max': 'max',
+        'interval': 'interval',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload, service_sid, rate_limit_sid, sid=None):
         """
         Initialize the BucketInstance
@@ -309,17 +512,7 @@ class BucketInstance(InstanceResource):
         super(BucketInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'rate_limit_sid': payload.get('rate_limit_sid'),
-            'service_sid': payload.get('service_sid'),
-            'account_sid': payload.get('account_sid'),
-            'max': deserialize.integer(payload.get('max')),
-            'interval': deserialize.integer(payload.get('interval')),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -431,6 +624,18 @@ class BucketInstance(InstanceResource):
         """
         return self._proxy.update(max=max, interval=interval, )
 
+    async def update_async(self, max=values.unset, interval=values.unset):
+        """
+        Asynchronous coroutine that updates the BucketInstance
+
+        :param unicode max: Max number of requests.
+        :param unicode interval: Number of seconds that the rate limit will be enforced over.
+
+        :returns: The updated BucketInstance
+        :rtype: twilio.rest.verify.v2.service.rate_limit.bucket.BucketInstance
+        """
+        return await self._proxy.update_async(max=max, interval=interval, )
+
     def fetch(self):
         """
         Fetch the BucketInstance
@@ -440,6 +645,15 @@ class BucketInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the BucketInstance
+
+        :returns: The fetched BucketInstance
+        :rtype: twilio.rest.verify.v2.service.rate_limit.bucket.BucketInstance
+        """
+        return await self._proxy.fetch_async()
+
     def delete(self):
         """
         Deletes the BucketInstance
@@ -449,6 +663,15 @@ class BucketInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the BucketInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
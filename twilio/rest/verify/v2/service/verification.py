@@ -31,7 +31,7 @@ class VerificationList(ListResource):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, }
-        self._uri = '/Services/{service_sid}/Verifications'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/Verifications', self._solution)
 
     def create(self, to, channel, custom_friendly_name=values.unset,
                custom_message=values.unset, send_digits=values.unset,
@@ -39,7 +39,7 @@ class VerificationList(ListResource):
                payee=values.unset, rate_limits=values.unset,
                channel_configuration=values.unset, app_hash=values.unset,
                template_sid=values.unset,
-               template_custom_substitutions=values.unset):
+               template_custom_substitutions=values.unset, deadline=None):
         """
         Create the VerificationInstance
 
@@ -57,6 +57,8 @@ class VerificationList(ListResource):
         :param unicode app_hash: Your App Hash to be appended at the end of an SMS.
         :param unicode template_sid: The verification template SMS messages.
         :param unicode template_custom_substitutions: The values of the special variables declared on the message template.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created VerificationInstance
         :rtype: twilio.rest.verify.v2.service.verification.VerificationInstance
@@ -78,7 +80,58 @@ class VerificationList(ListResource):
             'TemplateCustomSubstitutions': template_custom_substitutions,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return VerificationInstance(self._version, payload, service_sid=self._solution['service_sid'], )
+
+    async def create_async(self, to, channel, custom_friendly_name=values.unset,
+                           custom_message=values.unset, send_digits=values.unset,
+                           locale=values.unset, custom_code=values.unset, amount=values.unset,
+                           payee=values.unset, rate_limits=values.unset,
+                           channel_configuration=values.unset, app_hash=values.unset,
+                           template_sid=values.unset,
+                           template_custom_substitutions=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the VerificationInstance
+
+        :param unicode to: The phone number or email to verify
+        :param unicode channel: The verification method to use
+        :param unicode custom_friendly_name: A custom user defined friendly name
+        :param unicode custom_message: The text of a custom message to use for the verification
+        :param unicode send_digits: The digits to send after a phone call is answered
+        :param unicode locale: The locale to use for the verification SMS, WhatsApp or call
+        :param unicode custom_code: A pre-generated code
+        :param unicode amount: The amount of the associated PSD2 compliant transaction.
+        :param unicode payee: The payee of the associated PSD2 compliant transaction
+        :param dict rate_limits: The custom key-value pairs of Programmable Rate Limits.
+        :param dict channel_configuration: Channel specific configuration in json format.
+        :param unicode app_hash: Your App Hash to be appended at the end of an SMS.
+        :param unicode template_sid: The verification template SMS messages.
+        :param unicode template_custom_substitutions: The values of the special variables declared on the message template.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created VerificationInstance
+        :rtype: twilio.rest.verify.v2.service.verification.VerificationInstance
+        """
+        data = values.of({
+            'To': to,
+            'Channel': channel,
+            'CustomFriendlyName': custom_friendly_name,
+            'CustomMessage': custom_message,
+            'SendDigits': send_digits,
+            'Locale': locale,
+            'CustomCode': custom_code,
+            'Amount': amount,
+            'Payee': payee,
+            'RateLimits': serialize.object(rate_limits),
+            'ChannelConfiguration': serialize.object(channel_configuration),
+            'AppHash': app_hash,
+            'TemplateSid': template_sid,
+            'TemplateCustomSubstitutions': template_custom_substitutions,
+        })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return VerificationInstance(self._version, payload, service_sid=self._solution['service_sid'], )
 
@@ -170,7 +223,7 @@ class VerificationContext(InstanceContext):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, 'sid': sid, }
-        self._uri = '/Services/{service_sid}/Verifications/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/Verifications/{sid}', self._solution)
 
     def update(self, status):
         """
@@ -192,6 +245,26 @@ class VerificationContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, status):
+        """
+        Asynchronous coroutine that updates the VerificationInstance
+
+        :param VerificationInstance.Status status: The new status of the resource
+
+        :returns: The updated VerificationInstance
+        :rtype: twilio.rest.verify.v2.service.verification.VerificationInstance
+        """
+        data = values.of({'Status': status, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return VerificationInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            sid=self._solution['sid'],
+        )
+
     def fetch(self):
         """
         Fetch the VerificationInstance
@@ -208,6 +281,22 @@ class VerificationContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the VerificationInstance
+
+        :returns: The fetched VerificationInstance
+        :rtype: twilio.rest.verify.v2.service.verification.VerificationInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return VerificationInstance(
+            self._version,
+            payload,
+            service_sid=self._solution['service_sid'],
+            sid=self._solution['sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -231,6 +320,32 @@ class VerificationInstance(InstanceResource):
         CANCELED = "canceled"
         APPROVED = "approved"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'service_sid': 'service_sid',
+        'account_sid': 'account_sid',
+        'to': 'to',
+        'channel': 'channel',
+        'status': 'status',
+        'valid': 'valid',
+        'lookup': 'lookup',
+        'amount': 'amount',
+        'payee': 'payee',
+        'send_code_attempts': 'send_code_attempts',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload, service_sid, sid=None):
         """
         Initialize the VerificationInstance
@@ -241,22 +356,7 @@ class VerificationInstance(InstanceResource):
         super(VerificationInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'service_sid': payload.get('service_sid'),
-            'account_sid': payload.get('account_sid'),
-            'to': payload.get('to'),
-            'channel': payload.get('channel'),
-            'status': payload.get('status'),
-            'valid': payload.get('valid'),
-            'lookup': payload.get('lookup'),
-            'amount': payload.get('amount'),
-            'payee': payload.get('payee'),
-            'send_code_attempts': payload.get('send_code_attempts'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -402,6 +502,17 @@ class VerificationInstance(InstanceResource):
         """
         return self._proxy.update(status, )
 
+    async def update_async(self, status):
+        """
+        Asynchronous coroutine that updates the VerificationInstance
+
+        :param VerificationInstance.Status status: The new status of the resource
+
+        :returns: The updated VerificationInstance
+        :rtype: twilio.rest.verify.v2.service.verification.VerificationInstance
+        """
+        return await self._proxy.update_async(status, )
+
     def fetch(self):
         """
         Fetch the VerificationInstance
@@ -411,6 +522,15 @@ class VerificationInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the VerificationInstance
+
+        :returns: The fetched VerificationInstance
+        :rtype: twilio.rest.verify.v2.service.verification.VerificationInstance
+        """
+        return await self._proxy.fetch_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
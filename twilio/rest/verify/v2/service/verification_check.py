@@ -29,10 +29,10 @@ class VerificationCheckList(ListResource):
 
         # Path Solution
         self._solution = {'service_sid': service_sid, }
-        self._uri = '/Services/{service_sid}/VerificationCheck'.format(**self._solution)
+        self._uri = values.ResourceUri('/Services/{service_sid}/VerificationCheck', self._solution)
 
     def create(self, code, to=values.unset, verification_sid=values.unset,
-               amount=values.unset, payee=values.unset):
+               amount=values.unset, payee=values.unset, deadline=None):
         """
         Create the VerificationCheckInstance
 
@@ -41,6 +41,8 @@ class VerificationCheckList(ListResource):
         :param unicode verification_sid: A SID that uniquely identifies the Verification Check
         :param unicode amount: The amount of the associated PSD2 compliant transaction.
         :param unicode payee: The payee of the associated PSD2 compliant transaction
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created VerificationCheckInstance
         :rtype: twilio.rest.verify.v2.service.verification_check.VerificationCheckInstance
@@ -53,7 +55,35 @@ class VerificationCheckList(ListResource):
             'Payee': payee,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return VerificationCheckInstance(self._version, payload, service_sid=self._solution['service_sid'], )
+
+    async def create_async(self, code, to=values.unset, verification_sid=values.unset,
+                           amount=values.unset, payee=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the VerificationCheckInstance
+
+        :param unicode code: The verification string
+        :param unicode to: The phone number or email to verify
+        :param unicode verification_sid: A SID that uniquely identifies the Verification Check
+        :param unicode amount: The amount of the associated PSD2 compliant transaction.
+        :param unicode payee: The payee of the associated PSD2 compliant transaction
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created VerificationCheckInstance
+        :rtype: twilio.rest.verify.v2.service.verification_check.VerificationCheckInstance
+        """
+        data = values.of({
+            'Code': code,
+            'To': to,
+            'VerificationSid': verification_sid,
+            'Amount': amount,
+            'Payee': payee,
+        })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return VerificationCheckInstance(self._version, payload, service_sid=self._solution['service_sid'], )
 
@@ -114,6 +144,29 @@ class VerificationCheckInstance(InstanceResource):
         EMAIL = "email"
         WHATSAPP = "whatsapp"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'service_sid': 'service_sid',
+        'account_sid': 'account_sid',
+        'to': 'to',
+        'channel': 'channel',
+        'status': 'status',
+        'valid': 'valid',
+        'amount': 'amount',
+        'payee': 'payee',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+    }, _deserializers)
+
     def __init__(self, version, payload, service_sid):
         """
         Initialize the VerificationCheckInstance
@@ -124,19 +177,7 @@ class VerificationCheckInstance(InstanceResource):
         super(VerificationCheckInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'service_sid': payload.get('service_sid'),
-            'account_sid': payload.get('account_sid'),
-            'to': payload.get('to'),
-            'channel': payload.get('channel'),
-            'status': payload.get('status'),
-            'valid': payload.get('valid'),
-            'amount': payload.get('amount'),
-            'payee': payload.get('payee'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -30,13 +30,14 @@ class VerificationAttemptList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Attempts'.format(**self._solution)
+        self._uri = values.ResourceUri('/Attempts', self._solution)
 
     def stream(self, date_created_after=values.unset,
                date_created_before=values.unset, channel_data_to=values.unset,
                country=values.unset, channel=values.unset,
                verify_service_sid=values.unset, verification_sid=values.unset,
-               status=values.unset, limit=None, page_size=None):
+               status=values.unset, limit=None, page_size=None, prefetch=None,
+               raw=False, deadline=None):
         """
         Streams VerificationAttemptInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -57,31 +58,94 @@ class VerificationAttemptList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.verify.v2.verification_attempt.VerificationAttemptInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
-            date_created_after=date_created_after,
-            date_created_before=date_created_before,
-            channel_data_to=channel_data_to,
-            country=country,
-            channel=channel,
-            verify_service_sid=verify_service_sid,
-            verification_sid=verification_sid,
-            status=status,
-            page_size=limits['page_size'],
-        )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                date_created_after=date_created_after,
+                date_created_before=date_created_before,
+                channel_data_to=channel_data_to,
+                country=country,
+                channel=channel,
+                verify_service_sid=verify_service_sid,
+                verification_sid=verification_sid,
+                status=status,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, date_created_after=values.unset,
+                           date_created_before=values.unset, channel_data_to=values.unset,
+                           country=values.unset, channel=values.unset,
+                           verify_service_sid=values.unset, verification_sid=values.unset,
+                           status=values.unset, limit=None, page_size=None,
+                           prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams VerificationAttemptInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param datetime date_created_after: Filter verification attempts after this date.
+        :param datetime date_created_before: Filter verification attempts before this date.
+        :param unicode channel_data_to: Filters by destination of the verification attempt.
+        :param unicode country: Filter verification attempts by destination country.
+        :param VerificationAttemptInstance.Channels channel: Filter verification attempts by communication channel.
+        :param unicode verify_service_sid: Filter verification attempts by verify service.
+        :param unicode verification_sid: Filter attempts by verification.
+        :param VerificationAttemptInstance.ConversionStatus status: Filter verification attempts by conversion status.
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.verify.v2.verification_attempt.VerificationAttemptInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
 
-        return self._version.stream(page, limits['limit'])
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                date_created_after=date_created_after,
+                date_created_before=date_created_before,
+                channel_data_to=channel_data_to,
+                country=country,
+                channel=channel,
+                verify_service_sid=verify_service_sid,
+                verification_sid=verification_sid,
+                status=status,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, date_created_after=values.unset,
              date_created_before=values.unset, channel_data_to=values.unset,
              country=values.unset, channel=values.unset,
              verify_service_sid=values.unset, verification_sid=values.unset,
-             status=values.unset, limit=None, page_size=None):
+             status=values.unset, limit=None, page_size=None, prefetch=None,
+             raw=False, deadline=None):
         """
         Lists VerificationAttemptInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -101,6 +165,12 @@ class VerificationAttemptList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.verify.v2.verification_attempt.VerificationAttemptInstance]
@@ -116,8 +186,62 @@ class VerificationAttemptList(ListResource):
             status=status,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, date_created_after=values.unset,
+                         date_created_before=values.unset, channel_data_to=values.unset,
+                         country=values.unset, channel=values.unset,
+                         verify_service_sid=values.unset, verification_sid=values.unset,
+                         status=values.unset, limit=None, page_size=None,
+                         prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists VerificationAttemptInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param datetime date_created_after: Filter verification attempts after this date.
+        :param datetime date_created_before: Filter verification attempts before this date.
+        :param unicode channel_data_to: Filters by destination of the verification attempt.
+        :param unicode country: Filter verification attempts by destination country.
+        :param VerificationAttemptInstance.Channels channel: Filter verification attempts by communication channel.
+        :param unicode verify_service_sid: Filter verification attempts by verify service.
+        :param unicode verification_sid: Filter attempts by verification.
+        :param VerificationAttemptInstance.ConversionStatus status: Filter verification attempts by conversion status.
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.verify.v2.verification_attempt.VerificationAttemptInstance]
+        """
+        return [record async for record in await self.stream_async(
+            date_created_after=date_created_after,
+            date_created_before=date_created_before,
+            channel_data_to=channel_data_to,
+            country=country,
+            channel=channel,
+            verify_service_sid=verify_service_sid,
+            verification_sid=verification_sid,
+            status=status,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, date_created_after=values.unset,
              date_created_before=values.unset, channel_data_to=values.unset,
              country=values.unset, channel=values.unset,
@@ -161,6 +285,49 @@ class VerificationAttemptList(ListResource):
 
         return VerificationAttemptPage(self._version, response, self._solution)
 
+    async def page_async(self, date_created_after=values.unset,
+                         date_created_before=values.unset, channel_data_to=values.unset,
+                         country=values.unset, channel=values.unset,
+                         verify_service_sid=values.unset, verification_sid=values.unset,
+                         status=values.unset, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of VerificationAttemptInstance records from the API.
+        Request is executed immediately
+
+        :param datetime date_created_after: Filter verification attempts after this date.
+        :param datetime date_created_before: Filter verification attempts before this date.
+        :param unicode channel_data_to: Filters by destination of the verification attempt.
+        :param unicode country: Filter verification attempts by destination country.
+        :param VerificationAttemptInstance.Channels channel: Filter verification attempts by communication channel.
+        :param unicode verify_service_sid: Filter verification attempts by verify service.
+        :param unicode verification_sid: Filter attempts by verification.
+        :param VerificationAttemptInstance.ConversionStatus status: Filter verification attempts by conversion status.
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of VerificationAttemptInstance
+        :rtype: twilio.rest.verify.v2.verification_attempt.VerificationAttemptPage
+        """
+        data = values.of({
+            'DateCreatedAfter': serialize.iso8601_datetime(date_created_after),
+            'DateCreatedBefore': serialize.iso8601_datetime(date_created_before),
+            'ChannelData.To': channel_data_to,
+            'Country': country,
+            'Channel': channel,
+            'VerifyServiceSid': verify_service_sid,
+            'VerificationSid': verification_sid,
+            'Status': status,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return VerificationAttemptPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of VerificationAttemptInstance records from the API.
@@ -178,6 +345,23 @@ class VerificationAttemptList(ListResource):
 
         return VerificationAttemptPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of VerificationAttemptInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of VerificationAttemptInstance
+        :rtype: twilio.rest.verify.v2.verification_attempt.VerificationAttemptPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return VerificationAttemptPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a VerificationAttemptContext
@@ -264,7 +448,7 @@ class VerificationAttemptContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/Attempts/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Attempts/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -277,6 +461,17 @@ class VerificationAttemptContext(InstanceContext):
 
         return VerificationAttemptInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the VerificationAttemptInstance
+
+        :returns: The fetched VerificationAttemptInstance
+        :rtype: twilio.rest.verify.v2.verification_attempt.VerificationAttemptInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return VerificationAttemptInstance(self._version, payload, sid=self._solution['sid'], )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -330,6 +525,29 @@ class VerificationAttemptInstance(InstanceResource):
         UNCONFIRMED = "unconfirmed"
         EXPIRED = "expired"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'service_sid': 'service_sid',
+        'verification_sid': 'verification_sid',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'conversion_status': 'conversion_status',
+        'channel': 'channel',
+        'price': 'price',
+        'channel_data': 'channel_data',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the VerificationAttemptInstance
@@ -340,19 +558,7 @@ class VerificationAttemptInstance(InstanceResource):
         super(VerificationAttemptInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'service_sid': payload.get('service_sid'),
-            'verification_sid': payload.get('verification_sid'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'conversion_status': payload.get('conversion_status'),
-            'channel': payload.get('channel'),
-            'price': payload.get('price'),
-            'channel_data': payload.get('channel_data'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -468,6 +674,15 @@ class VerificationAttemptInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the VerificationAttemptInstance
+
+        :returns: The fetched VerificationAttemptInstance
+        :rtype: twilio.rest.verify.v2.verification_attempt.VerificationAttemptInstance
+        """
+        return await self._proxy.fetch_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
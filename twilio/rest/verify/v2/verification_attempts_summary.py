@@ -112,7 +112,7 @@ class VerificationAttemptsSummaryContext(InstanceContext):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Attempts/Summary'.format(**self._solution)
+        self._uri = values.ResourceUri('/Attempts/Summary', self._solution)
 
     def fetch(self, verify_service_sid=values.unset,
               date_created_after=values.unset, date_created_before=values.unset,
@@ -144,6 +144,36 @@ class VerificationAttemptsSummaryContext(InstanceContext):
 
         return VerificationAttemptsSummaryInstance(self._version, payload, )
 
+    async def fetch_async(self, verify_service_sid=values.unset,
+                          date_created_after=values.unset, date_created_before=values.unset,
+                          country=values.unset, channel=values.unset,
+                          destination_prefix=values.unset):
+        """
+        Asynchronous coroutine that fetches the VerificationAttemptsSummaryInstance
+
+        :param unicode verify_service_sid: Filter the verification attempts considered on the summary by verify service.
+        :param datetime date_created_after: Consider verification attempts create after this date on the summary.
+        :param datetime date_created_before: Consider verification attempts created before this date on the summary.
+        :param unicode country: Filter verification attempts considered on the summary by destination country.
+        :param VerificationAttemptsSummaryInstance.Channels channel: Filter verification attempts considered on the summary by communication channel.
+        :param unicode destination_prefix: Filters the attempts considered on the summary by destination prefix.
+
+        :returns: The fetched VerificationAttemptsSummaryInstance
+        :rtype: twilio.rest.verify.v2.verification_attempts_summary.VerificationAttemptsSummaryInstance
+        """
+        data = values.of({
+            'VerifyServiceSid': verify_service_sid,
+            'DateCreatedAfter': serialize.iso8601_datetime(date_created_after),
+            'DateCreatedBefore': serialize.iso8601_datetime(date_created_before),
+            'Country': country,
+            'Channel': channel,
+            'DestinationPrefix': destination_prefix,
+        })
+
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, params=data, )
+
+        return VerificationAttemptsSummaryInstance(self._version, payload, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -163,6 +193,25 @@ class VerificationAttemptsSummaryInstance(InstanceResource):
         EMAIL = "email"
         WHATSAPP = "whatsapp"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'total_attempts': deserialize.integer,
+        'total_converted': deserialize.integer,
+        'total_unconverted': deserialize.integer,
+        'conversion_rate_percentage': deserialize.decimal,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'total_attempts': 'total_attempts',
+        'total_converted': 'total_converted',
+        'total_unconverted': 'total_unconverted',
+        'conversion_rate_percentage': 'conversion_rate_percentage',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload):
         """
         Initialize the VerificationAttemptsSummaryInstance
@@ -173,13 +222,7 @@ class VerificationAttemptsSummaryInstance(InstanceResource):
         super(VerificationAttemptsSummaryInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'total_attempts': deserialize.integer(payload.get('total_attempts')),
-            'total_converted': deserialize.integer(payload.get('total_converted')),
-            'total_unconverted': deserialize.integer(payload.get('total_unconverted')),
-            'conversion_rate_percentage': deserialize.decimal(payload.get('conversion_rate_percentage')),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -264,6 +307,32 @@ class VerificationAttemptsSummaryInstance(InstanceResource):
             destination_prefix=destination_prefix,
         )
 
+    async def fetch_async(self, verify_service_sid=values.unset,
+                          date_created_after=values.unset, date_created_before=values.unset,
+                          country=values.unset, channel=values.unset,
+                          destination_prefix=values.unset):
+        """
+        Asynchronous coroutine that fetches the VerificationAttemptsSummaryInstance
+
+        :param unicode verify_service_sid: Filter the verification attempts considered on the summary by verify service.
+        :param datetime date_created_after: Consider verification attempts create after this date on the summary.
+        :param datetime date_created_before: Consider verification attempts created before this date on the summary.
+        :param unicode country: Filter verification attempts considered on the summary by destination country.
+        :param VerificationAttemptsSummaryInstance.Channels channel: Filter verification attempts considered on the summary by communication channel.
+        :param unicode destination_prefix: Filters the attempts considered on the summary by destination prefix.
+
+        :returns: The fetched VerificationAttemptsSummaryInstance
+        :rtype: twilio.rest.verify.v2.verification_attempts_summary.VerificationAttemptsSummaryInstance
+        """
+        return await self._proxy.fetch_async(
+            verify_service_sid=verify_service_sid,
+            date_created_after=date_created_after,
+            date_created_before=date_created_before,
+            country=country,
+            channel=channel,
+            destination_prefix=destination_prefix,
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -6,13 +6,9 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base.version import Version
-from twilio.rest.video.v1.composition import CompositionList
-from twilio.rest.video.v1.composition_hook import CompositionHookList
-from twilio.rest.video.v1.composition_settings import CompositionSettingsList
-from twilio.rest.video.v1.recording import RecordingList
-from twilio.rest.video.v1.recording_settings import RecordingSettingsList
-from twilio.rest.video.v1.room import RoomList
 
 
 class V1(Version):
@@ -39,6 +35,7 @@ class V1(Version):
         :rtype: twilio.rest.video.v1.composition.CompositionList
         """
         if self._compositions is None:
+            from twilio.rest.video.v1.composition import CompositionList
             self._compositions = CompositionList(self)
         return self._compositions
 
@@ -48,6 +45,7 @@ class V1(Version):
         :rtype: twilio.rest.video.v1.composition_hook.CompositionHookList
         """
         if self._composition_hooks is None:
+            from twilio.rest.video.v1.composition_hook import CompositionHookList
             self._composition_hooks = CompositionHookList(self)
         return self._composition_hooks
 
@@ -57,6 +55,7 @@ class V1(Version):
         :rtype: twilio.rest.video.v1.composition_settings.CompositionSettingsList
         """
         if self._composition_settings is None:
+            from twilio.rest.video.v1.composition_settings import CompositionSettingsList
             self._composition_settings = CompositionSettingsList(self)
         return self._composition_settings
 
@@ -66,6 +65,7 @@ class V1(Version):
         :rtype: twilio.rest.video.v1.recording.RecordingList
         """
         if self._recordings is None:
+            from twilio.rest.video.v1.recording import RecordingList
             self._recordings = RecordingList(self)
         return self._recordings
 
@@ -75,6 +75,7 @@ class V1(Version):
         :rtype: twilio.rest.video.v1.recording_settings.RecordingSettingsList
         """
         if self._recording_settings is None:
+            from twilio.rest.video.v1.recording_settings import RecordingSettingsList
             self._recording_settings = RecordingSettingsList(self)
         return self._recording_settings
 
@@ -84,6 +85,7 @@ class V1(Version):
         :rtype: twilio.rest.video.v1.room.RoomList
         """
         if self._rooms is None:
+            from twilio.rest.video.v1.room import RoomList
             self._rooms = RoomList(self)
         return self._rooms
 
@@ -95,3 +97,24 @@ class V1(Version):
         :rtype: str
         """
         return '<Twilio.Video.V1>'
+
+
+_LAZY_IMPORTS = {
+    'CompositionHookList': 'twilio.rest.video.v1.composition_hook',
+    'CompositionList': 'twilio.rest.video.v1.composition',
+    'CompositionSettingsList': 'twilio.rest.video.v1.composition_settings',
+    'RecordingList': 'twilio.rest.video.v1.recording',
+    'RecordingSettingsList': 'twilio.rest.video.v1.recording_settings',
+    'RoomList': 'twilio.rest.video.v1.room',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
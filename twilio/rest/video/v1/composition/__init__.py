@@ -30,11 +30,11 @@ class CompositionList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Compositions'.format(**self._solution)
+        self._uri = values.ResourceUri('/Compositions', self._solution)
 
     def stream(self, status=values.unset, date_created_after=values.unset,
                date_created_before=values.unset, room_sid=values.unset, limit=None,
-               page_size=None):
+               page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams CompositionInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -51,25 +51,76 @@ class CompositionList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.video.v1.composition.CompositionInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
-            status=status,
-            date_created_after=date_created_after,
-            date_created_before=date_created_before,
-            room_sid=room_sid,
-            page_size=limits['page_size'],
-        )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                status=status,
+                date_created_after=date_created_after,
+                date_created_before=date_created_before,
+                room_sid=room_sid,
+                page_size=limits['page_size'],
+            )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, status=values.unset, date_created_after=values.unset,
+                           date_created_before=values.unset, room_sid=values.unset, limit=None,
+                           page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams CompositionInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param CompositionInstance.Status status: Read only Composition resources with this status
+        :param datetime date_created_after: Read only Composition resources created on or after this `ISO 8601 <https://en.wikipedia.org/wiki/ISO_8601>`_ date-time with time zone
+        :param datetime date_created_before: Read only Composition resources created before this ISO 8601 date-time with time zone
+        :param unicode room_sid: Read only Composition resources with this Room SID
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.video.v1.composition.CompositionInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                status=status,
+                date_created_after=date_created_after,
+                date_created_before=date_created_before,
+                room_sid=room_sid,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, status=values.unset, date_created_after=values.unset,
              date_created_before=values.unset, room_sid=values.unset, limit=None,
-             page_size=None):
+             page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists CompositionInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -85,6 +136,12 @@ class CompositionList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.video.v1.composition.CompositionInstance]
@@ -96,8 +153,51 @@ class CompositionList(ListResource):
             room_sid=room_sid,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, status=values.unset, date_created_after=values.unset,
+                         date_created_before=values.unset, room_sid=values.unset, limit=None,
+                         page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists CompositionInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param CompositionInstance.Status status: Read only Composition resources with this status
+        :param datetime date_created_after: Read only Composition resources created on or after this `ISO 8601 <https://en.wikipedia.org/wiki/ISO_8601>`_ date-time with time zone
+        :param datetime date_created_before: Read only Composition resources created before this ISO 8601 date-time with time zone
+        :param unicode room_sid: Read only Composition resources with this Room SID
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.video.v1.composition.CompositionInstance]
+        """
+        return [record async for record in await self.stream_async(
+            status=status,
+            date_created_after=date_created_after,
+            date_created_before=date_created_before,
+            room_sid=room_sid,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, status=values.unset, date_created_after=values.unset,
              date_created_before=values.unset, room_sid=values.unset,
              page_token=values.unset, page_number=values.unset,
@@ -131,6 +231,39 @@ class CompositionList(ListResource):
 
         return CompositionPage(self._version, response, self._solution)
 
+    async def page_async(self, status=values.unset, date_created_after=values.unset,
+                         date_created_before=values.unset, room_sid=values.unset,
+                         page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of CompositionInstance records from the API.
+        Request is executed immediately
+
+        :param CompositionInstance.Status status: Read only Composition resources with this status
+        :param datetime date_created_after: Read only Composition resources created on or after this `ISO 8601 <https://en.wikipedia.org/wiki/ISO_8601>`_ date-time with time zone
+        :param datetime date_created_before: Read only Composition resources created before this ISO 8601 date-time with time zone
+        :param unicode room_sid: Read only Composition resources with this Room SID
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of CompositionInstance
+        :rtype: twilio.rest.video.v1.composition.CompositionPage
+        """
+        data = values.of({
+            'Status': status,
+            'DateCreatedAfter': serialize.iso8601_datetime(date_created_after),
+            'DateCreatedBefore': serialize.iso8601_datetime(date_created_before),
+            'RoomSid': room_sid,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return CompositionPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of CompositionInstance records from the API.
@@ -148,11 +281,28 @@ class CompositionList(ListResource):
 
         return CompositionPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of CompositionInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of CompositionInstance
+        :rtype: twilio.rest.video.v1.composition.CompositionPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return CompositionPage(self._version, response, self._solution)
+
     def create(self, room_sid, video_layout=values.unset,
                audio_sources=values.unset, audio_sources_excluded=values.unset,
                resolution=values.unset, format=values.unset,
                status_callback=values.unset, status_callback_method=values.unset,
-               trim=values.unset):
+               trim=values.unset, deadline=None):
         """
         Create the CompositionInstance
 
@@ -165,6 +315,47 @@ class CompositionList(ListResource):
         :param unicode status_callback: The URL we should call to send status information to your application
         :param unicode status_callback_method: The HTTP method we should use to call status_callback
         :param bool trim: Whether to clip the intervals where there is no active media in the composition
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created CompositionInstance
+        :rtype: twilio.rest.video.v1.composition.CompositionInstance
+        """
+        data = values.of({
+            'RoomSid': room_sid,
+            'VideoLayout': serialize.object(video_layout),
+            'AudioSources': serialize.map(audio_sources, lambda e: e),
+            'AudioSourcesExcluded': serialize.map(audio_sources_excluded, lambda e: e),
+            'Resolution': resolution,
+            'Format': format,
+            'StatusCallback': status_callback,
+            'StatusCallbackMethod': status_callback_method,
+            'Trim': trim,
+        })
+
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return CompositionInstance(self._version, payload, )
+
+    async def create_async(self, room_sid, video_layout=values.unset,
+                           audio_sources=values.unset, audio_sources_excluded=values.unset,
+                           resolution=values.unset, format=values.unset,
+                           status_callback=values.unset, status_callback_method=values.unset,
+                           trim=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the CompositionInstance
+
+        :param unicode room_sid: The SID of the Group Room with the media tracks to be used as composition sources
+        :param dict video_layout: An object that describes the video layout of the composition
+        :param list[unicode] audio_sources: An array of track names from the same group room to merge
+        :param list[unicode] audio_sources_excluded: An array of track names to exclude
+        :param unicode resolution: A string that describes the columns (width) and rows (height) of the generated composed video in pixels
+        :param CompositionInstance.Format format: The container format of the composition's media files
+        :param unicode status_callback: The URL we should call to send status information to your application
+        :param unicode status_callback_method: The HTTP method we should use to call status_callback
+        :param bool trim: Whether to clip the intervals where there is no active media in the composition
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created CompositionInstance
         :rtype: twilio.rest.video.v1.composition.CompositionInstance
@@ -181,7 +372,7 @@ class CompositionList(ListResource):
             'Trim': trim,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return CompositionInstance(self._version, payload, )
 
@@ -271,7 +462,7 @@ class CompositionContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/Compositions/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Compositions/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -284,6 +475,17 @@ class CompositionContext(InstanceContext):
 
         return CompositionInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the CompositionInstance
+
+        :returns: The fetched CompositionInstance
+        :rtype: twilio.rest.video.v1.composition.CompositionInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return CompositionInstance(self._version, payload, sid=self._solution['sid'], )
+
     def delete(self):
         """
         Deletes the CompositionInstance
@@ -293,6 +495,15 @@ class CompositionContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the CompositionInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -317,6 +528,43 @@ class CompositionInstance(InstanceResource):
         MP4 = "mp4"
         WEBM = "webm"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_completed': deserialize.iso8601_datetime,
+        'date_deleted': deserialize.iso8601_datetime,
+        'bitrate': deserialize.integer,
+        'size': deserialize.integer,
+        'duration': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'status': 'status',
+        'date_created': 'date_created',
+        'date_completed': 'date_completed',
+        'date_deleted': 'date_deleted',
+        'sid': 'sid',
+        'room_sid': 'room_sid',
+        'audio_sources': 'audio_sources',
+        'audio_sources_excluded': 'audio_sources_excluded',
+        'video_layout': 'video_layout',
+        'resolution': 'resolution',
+        'trim': 'trim',
+        'format': 'format',
+        'bitrate': 'bitrate',
+        'size': 'size',
+        'duration': 'duration',
+        'media_external_location': 'media_external_location',
+        'status_callback': 'status_callback',
+        'status_callback_method': 'status_callback_method',
+        'url': 'url',
+        'links': 'links',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the CompositionInstance
@@ -327,29 +575,7 @@ class CompositionInstance(InstanceResource):
         super(CompositionInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'status': payload.get('status'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_completed': deserialize.iso8601_datetime(payload.get('date_completed')),
-            'date_deleted': deserialize.iso8601_datetime(payload.get('date_deleted')),
-            'sid': payload.get('sid'),
-            'room_sid': payload.get('room_sid'),
-            'audio_sources': payload.get('audio_sources'),
-            'audio_sources_excluded': payload.get('audio_sources_excluded'),
-            'video_layout': payload.get('video_layout'),
-            'resolution': payload.get('resolution'),
-            'trim': payload.get('trim'),
-            'format': payload.get('format'),
-            'bitrate': deserialize.integer(payload.get('bitrate')),
-            'size': deserialize.integer(payload.get('size')),
-            'duration': deserialize.integer(payload.get('duration')),
-            'media_external_location': payload.get('media_external_location'),
-            'status_callback': payload.get('status_callback'),
-            'status_callback_method': payload.get('status_callback_method'),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -545,6 +771,15 @@ class CompositionInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the CompositionInstance
+
+        :returns: The fetched CompositionInstance
+        :rtype: twilio.rest.video.v1.composition.CompositionInstance
+        """
+        return await self._proxy.fetch_async()
+
     def delete(self):
         """
         Deletes the CompositionInstance
@@ -554,6 +789,15 @@ class CompositionInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the CompositionInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -30,11 +30,11 @@ class CompositionHookList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/CompositionHooks'.format(**self._solution)
+        self._uri = values.ResourceUri('/CompositionHooks', self._solution)
 
     def stream(self, enabled=values.unset, date_created_after=values.unset,
                date_created_before=values.unset, friendly_name=values.unset,
-               limit=None, page_size=None):
+               limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams CompositionHookInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -51,25 +51,77 @@ class CompositionHookList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.video.v1.composition_hook.CompositionHookInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
-            enabled=enabled,
-            date_created_after=date_created_after,
-            date_created_before=date_created_before,
-            friendly_name=friendly_name,
-            page_size=limits['page_size'],
-        )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                enabled=enabled,
+                date_created_after=date_created_after,
+                date_created_before=date_created_before,
+                friendly_name=friendly_name,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-        return self._version.stream(page, limits['limit'])
+    async def stream_async(self, enabled=values.unset, date_created_after=values.unset,
+                           date_created_before=values.unset, friendly_name=values.unset,
+                           limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams CompositionHookInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param bool enabled: Read only CompositionHook resources with an enabled value that matches this parameter
+        :param datetime date_created_after: Read only CompositionHook resources created on or after this ISO 8601 datetime with time zone
+        :param datetime date_created_before: Read only CompositionHook resources created before this ISO 8601 datetime with time zone
+        :param unicode friendly_name: Read only CompositionHook resources with friendly names that match this string
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.video.v1.composition_hook.CompositionHookInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                enabled=enabled,
+                date_created_after=date_created_after,
+                date_created_before=date_created_before,
+                friendly_name=friendly_name,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, enabled=values.unset, date_created_after=values.unset,
              date_created_before=values.unset, friendly_name=values.unset,
-             limit=None, page_size=None):
+             limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists CompositionHookInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -85,6 +137,12 @@ class CompositionHookList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.video.v1.composition_hook.CompositionHookInstance]
@@ -96,8 +154,51 @@ class CompositionHookList(ListResource):
             friendly_name=friendly_name,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, enabled=values.unset, date_created_after=values.unset,
+                         date_created_before=values.unset, friendly_name=values.unset,
+                         limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists CompositionHookInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param bool enabled: Read only CompositionHook resources with an enabled value that matches this parameter
+        :param datetime date_created_after: Read only CompositionHook resources created on or after this ISO 8601 datetime with time zone
+        :param datetime date_created_before: Read only CompositionHook resources created before this ISO 8601 datetime with time zone
+        :param unicode friendly_name: Read only CompositionHook resources with friendly names that match this string
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.video.v1.composition_hook.CompositionHookInstance]
+        """
+        return [record async for record in await self.stream_async(
+            enabled=enabled,
+            date_created_after=date_created_after,
+            date_created_before=date_created_before,
+            friendly_name=friendly_name,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, enabled=values.unset, date_created_after=values.unset,
              date_created_before=values.unset, friendly_name=values.unset,
              page_token=values.unset, page_number=values.unset,
@@ -131,6 +232,39 @@ class CompositionHookList(ListResource):
 
         return CompositionHookPage(self._version, response, self._solution)
 
+    async def page_async(self, enabled=values.unset, date_created_after=values.unset,
+                         date_created_before=values.unset, friendly_name=values.unset,
+                         page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of CompositionHookInstance records from the API.
+        Request is executed immediately
+
+        :param bool enabled: Read only CompositionHook resources with an enabled value that matches this parameter
+        :param datetime date_created_after: Read only CompositionHook resources created on or after this ISO 8601 datetime with time zone
+        :param datetime date_created_before: Read only CompositionHook resources created before this ISO 8601 datetime with time zone
+        :param unicode friendly_name: Read only CompositionHook resources with friendly names that match this string
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of CompositionHookInstance
+        :rtype: twilio.rest.video.v1.composition_hook.CompositionHookPage
+        """
+        data = values.of({
+            'Enabled': enabled,
+            'DateCreatedAfter': serialize.iso8601_datetime(date_created_after),
+            'DateCreatedBefore': serialize.iso8601_datetime(date_created_before),
+            'FriendlyName': friendly_name,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return CompositionHookPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of CompositionHookInstance records from the API.
@@ -148,11 +282,28 @@ class CompositionHookList(ListResource):
 
         return CompositionHookPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of CompositionHookInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of CompositionHookInstance
+        :rtype: twilio.rest.video.v1.composition_hook.CompositionHookPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return CompositionHookPage(self._version, response, self._solution)
+
     def create(self, friendly_name, enabled=values.unset, video_layout=values.unset,
                audio_sources=values.unset, audio_sources_excluded=values.unset,
                resolution=values.unset, format=values.unset,
                status_callback=values.unset, status_callback_method=values.unset,
-               trim=values.unset):
+               trim=values.unset, deadline=None):
         """
         Create the CompositionHookInstance
 
@@ -166,6 +317,49 @@ class CompositionHookList(ListResource):
         :param unicode status_callback: The URL we should call to send status information to your application
         :param unicode status_callback_method: The HTTP method we should use to call status_callback
         :param bool trim: Whether to clip the intervals where there is no active media in the Compositions triggered by the composition hook
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created CompositionHookInstance
+        :rtype: twilio.rest.video.v1.composition_hook.CompositionHookInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'Enabled': enabled,
+            'VideoLayout': serialize.object(video_layout),
+            'AudioSources': serialize.map(audio_sources, lambda e: e),
+            'AudioSourcesExcluded': serialize.map(audio_sources_excluded, lambda e: e),
+            'Resolution': resolution,
+            'Format': format,
+            'StatusCallback': status_callback,
+            'StatusCallbackMethod': status_callback_method,
+            'Trim': trim,
+        })
+
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return CompositionHookInstance(self._version, payload, )
+
+    async def create_async(self, friendly_name, enabled=values.unset, video_layout=values.unset,
+                           audio_sources=values.unset, audio_sources_excluded=values.unset,
+                           resolution=values.unset, format=values.unset,
+                           status_callback=values.unset, status_callback_method=values.unset,
+                           trim=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the CompositionHookInstance
+
+        :param unicode friendly_name: A unique string to describe the resource
+        :param bool enabled: Whether the composition hook is active
+        :param dict video_layout: An object that describes the video layout of the composition hook
+        :param list[unicode] audio_sources: An array of track names from the same group room to merge
+        :param list[unicode] audio_sources_excluded: An array of track names to exclude
+        :param unicode resolution: A string that describes the rows (width) and columns (height) of the generated composed video in pixels
+        :param CompositionHookInstance.Format format: The container format of the media files used by the compositions created by the composition hook
+        :param unicode status_callback: The URL we should call to send status information to your application
+        :param unicode status_callback_method: The HTTP method we should use to call status_callback
+        :param bool trim: Whether to clip the intervals where there is no active media in the Compositions triggered by the composition hook
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created CompositionHookInstance
         :rtype: twilio.rest.video.v1.composition_hook.CompositionHookInstance
@@ -183,7 +377,7 @@ class CompositionHookList(ListResource):
             'Trim': trim,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return CompositionHookInstance(self._version, payload, )
 
@@ -273,7 +467,7 @@ class CompositionHookContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/CompositionHooks/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/CompositionHooks/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -286,6 +480,17 @@ class CompositionHookContext(InstanceContext):
 
         return CompositionHookInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the CompositionHookInstance
+
+        :returns: The fetched CompositionHookInstance
+        :rtype: twilio.rest.video.v1.composition_hook.CompositionHookInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return CompositionHookInstance(self._version, payload, sid=self._solution['sid'], )
+
     def delete(self):
         """
         Deletes the CompositionHookInstance
@@ -295,6 +500,15 @@ class CompositionHookContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the CompositionHookInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def update(self, friendly_name, enabled=values.unset, video_layout=values.unset,
                audio_sources=values.unset, audio_sources_excluded=values.unset,
                trim=values.unset, format=values.unset, resolution=values.unset,
@@ -333,6 +547,44 @@ class CompositionHookContext(InstanceContext):
 
         return CompositionHookInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def update_async(self, friendly_name, enabled=values.unset, video_layout=values.unset,
+                           audio_sources=values.unset, audio_sources_excluded=values.unset,
+                           trim=values.unset, format=values.unset, resolution=values.unset,
+                           status_callback=values.unset, status_callback_method=values.unset):
+        """
+        Asynchronous coroutine that updates the CompositionHookInstance
+
+        :param unicode friendly_name: A unique string to describe the resource
+        :param bool enabled: Whether the composition hook is active
+        :param dict video_layout: A JSON object that describes the video layout of the composition hook
+        :param list[unicode] audio_sources: An array of track names from the same group room to merge
+        :param list[unicode] audio_sources_excluded: An array of track names to exclude
+        :param bool trim: Whether to clip the intervals where there is no active media in the Compositions triggered by the composition hook
+        :param CompositionHookInstance.Format format: The container format of the media files used by the compositions created by the composition hook
+        :param unicode resolution: A string that describes the columns (width) and rows (height) of the generated composed video in pixels
+        :param unicode status_callback: The URL we should call to send status information to your application
+        :param unicode status_callback_method: The HTTP method we should use to call status_callback
+
+        :returns: The updated CompositionHookInstance
+        :rtype: twilio.rest.video.v1.composition_hook.CompositionHookInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'Enabled': enabled,
+            'VideoLayout': serialize.object(video_layout),
+            'AudioSources': serialize.map(audio_sources, lambda e: e),
+            'AudioSourcesExcluded': serialize.map(audio_sources_excluded, lambda e: e),
+            'Trim': trim,
+            'Format': format,
+            'Resolution': resolution,
+            'StatusCallback': status_callback,
+            'StatusCallbackMethod': status_callback_method,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return CompositionHookInstance(self._version, payload, sid=self._solution['sid'], )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -350,6 +602,33 @@ class CompositionHookInstance(InstanceResource):
         MP4 = "mp4"
         WEBM = "webm"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'friendly_name': 'friendly_name',
+        'enabled': 'enabled',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'sid': 'sid',
+        'audio_sources': 'audio_sources',
+        'audio_sources_excluded': 'audio_sources_excluded',
+        'video_layout': 'video_layout',
+        'resolution': 'resolution',
+        'trim': 'trim',
+        'format': 'format',
+        'status_callback': 'status_callback',
+        'status_callback_method': 'status_callback_method',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the CompositionHookInstance
@@ -360,23 +639,7 @@ class CompositionHookInstance(InstanceResource):
         super(CompositionHookInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'friendly_name': payload.get('friendly_name'),
-            'enabled': payload.get('enabled'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'sid': payload.get('sid'),
-            'audio_sources': payload.get('audio_sources'),
-            'audio_sources_excluded': payload.get('audio_sources_excluded'),
-            'video_layout': payload.get('video_layout'),
-            'resolution': payload.get('resolution'),
-            'trim': payload.get('trim'),
-            'format': payload.get('format'),
-            'status_callback': payload.get('status_callback'),
-            'status_callback_method': payload.get('status_callback_method'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -524,6 +787,15 @@ class CompositionHookInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the CompositionHookInstance
+
+        :returns: The fetched CompositionHookInstance
+        :rtype: twilio.rest.video.v1.composition_hook.CompositionHookInstance
+        """
+        return await self._proxy.fetch_async()
+
     def delete(self):
         """
         Deletes the CompositionHookInstance
@@ -533,6 +805,15 @@ class CompositionHookInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the CompositionHookInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def update(self, friendly_name, enabled=values.unset, video_layout=values.unset,
                audio_sources=values.unset, audio_sources_excluded=values.unset,
                trim=values.unset, format=values.unset, resolution=values.unset,
@@ -567,6 +848,40 @@ class CompositionHookInstance(InstanceResource):
             status_callback_method=status_callback_method,
         )
 
+    async def update_async(self, friendly_name, enabled=values.unset, video_layout=values.unset,
+                           audio_sources=values.unset, audio_sources_excluded=values.unset,
+                           trim=values.unset, format=values.unset, resolution=values.unset,
+                           status_callback=values.unset, status_callback_method=values.unset):
+        """
+        Asynchronous coroutine that updates the CompositionHookInstance
+
+        :param unicode friendly_name: A unique string to describe the resource
+        :param bool enabled: Whether the composition hook is active
+        :param dict video_layout: A JSON object that describes the video layout of the composition hook
+        :param list[unicode] audio_sources: An array of track names from the same group room to merge
+        :param list[unicode] audio_sources_excluded: An array of track names to exclude
+        :param bool trim: Whether to clip the intervals where there is no active media in the Compositions triggered by the composition hook
+        :param CompositionHookInstance.Format format: The container format of the media files used by the compositions created by the composition hook
+        :param unicode resolution: A string that describes the columns (width) and rows (height) of the generated composed video in pixels
+        :param unicode status_callback: The URL we should call to send status information to your application
+        :param unicode status_callback_method: The HTTP method we should use to call status_callback
+
+        :returns: The updated CompositionHookInstance
+        :rtype: twilio.rest.video.v1.composition_hook.CompositionHookInstance
+        """
+        return await self._proxy.update_async(
+            friendly_name,
+            enabled=enabled,
+            video_layout=video_layout,
+            audio_sources=audio_sources,
+            audio_sources_excluded=audio_sources_excluded,
+            trim=trim,
+            format=format,
+            resolution=resolution,
+            status_callback=status_callback,
+            status_callback_method=status_callback_method,
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
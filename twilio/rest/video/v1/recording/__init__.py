@@ -30,12 +30,12 @@ class RecordingList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Recordings'.format(**self._solution)
+        self._uri = values.ResourceUri('/Recordings', self._solution)
 
     def stream(self, status=values.unset, source_sid=values.unset,
                grouping_sid=values.unset, date_created_after=values.unset,
                date_created_before=values.unset, media_type=values.unset,
-               limit=None, page_size=None):
+               limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams RecordingInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -54,28 +54,85 @@ class RecordingList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.video.v1.recording.RecordingInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
-            status=status,
-            source_sid=source_sid,
-            grouping_sid=grouping_sid,
-            date_created_after=date_created_after,
-            date_created_before=date_created_before,
-            media_type=media_type,
-            page_size=limits['page_size'],
-        )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                status=status,
+                source_sid=source_sid,
+                grouping_sid=grouping_sid,
+                date_created_after=date_created_after,
+                date_created_before=date_created_before,
+                media_type=media_type,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, status=values.unset, source_sid=values.unset,
+                           grouping_sid=values.unset, date_created_after=values.unset,
+                           date_created_before=values.unset, media_type=values.unset,
+                           limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams RecordingInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param RecordingInstance.Status status: Read only the recordings that have this status
+        :param unicode source_sid: Read only the recordings that have this source_sid
+        :param list[unicode] grouping_sid: Read only recordings that have this grouping_sid
+        :param datetime date_created_after: Read only recordings that started on or after this `ISO 8601 <https://en.wikipedia.org/wiki/ISO_8601>`_ date-time with time zone
+        :param datetime date_created_before: Read only recordings that started before this `ISO 8601 <https://en.wikipedia.org/wiki/ISO_8601>`_ date-time with time zone
+        :param RecordingInstance.Type media_type: Read only recordings that have this media type
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.video.v1.recording.RecordingInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                status=status,
+                source_sid=source_sid,
+                grouping_sid=grouping_sid,
+                date_created_after=date_created_after,
+                date_created_before=date_created_before,
+                media_type=media_type,
+                page_size=limits['page_size'],
+            )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, status=values.unset, source_sid=values.unset,
              grouping_sid=values.unset, date_created_after=values.unset,
              date_created_before=values.unset, media_type=values.unset, limit=None,
-             page_size=None):
+             page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists RecordingInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -93,6 +150,12 @@ class RecordingList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.video.v1.recording.RecordingInstance]
@@ -106,8 +169,56 @@ class RecordingList(ListResource):
             media_type=media_type,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, status=values.unset, source_sid=values.unset,
+                         grouping_sid=values.unset, date_created_after=values.unset,
+                         date_created_before=values.unset, media_type=values.unset, limit=None,
+                         page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists RecordingInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param RecordingInstance.Status status: Read only the recordings that have this status
+        :param unicode source_sid: Read only the recordings that have this source_sid
+        :param list[unicode] grouping_sid: Read only recordings that have this grouping_sid
+        :param datetime date_created_after: Read only recordings that started on or after this `ISO 8601 <https://en.wikipedia.org/wiki/ISO_8601>`_ date-time with time zone
+        :param datetime date_created_before: Read only recordings that started before this `ISO 8601 <https://en.wikipedia.org/wiki/ISO_8601>`_ date-time with time zone
+        :param RecordingInstance.Type media_type: Read only recordings that have this media type
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.video.v1.recording.RecordingInstance]
+        """
+        return [record async for record in await self.stream_async(
+            status=status,
+            source_sid=source_sid,
+            grouping_sid=grouping_sid,
+            date_created_after=date_created_after,
+            date_created_before=date_created_before,
+            media_type=media_type,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, status=values.unset, source_sid=values.unset,
              grouping_sid=values.unset, date_created_after=values.unset,
              date_created_before=values.unset, media_type=values.unset,
@@ -146,6 +257,44 @@ class RecordingList(ListResource):
 
         return RecordingPage(self._version, response, self._solution)
 
+    async def page_async(self, status=values.unset, source_sid=values.unset,
+                         grouping_sid=values.unset, date_created_after=values.unset,
+                         date_created_before=values.unset, media_type=values.unset,
+                         page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of RecordingInstance records from the API.
+        Request is executed immediately
+
+        :param RecordingInstance.Status status: Read only the recordings that have this status
+        :param unicode source_sid: Read only the recordings that have this source_sid
+        :param list[unicode] grouping_sid: Read only recordings that have this grouping_sid
+        :param datetime date_created_after: Read only recordings that started on or after this `ISO 8601 <https://en.wikipedia.org/wiki/ISO_8601>`_ date-time with time zone
+        :param datetime date_created_before: Read only recordings that started before this `ISO 8601 <https://en.wikipedia.org/wiki/ISO_8601>`_ date-time with time zone
+        :param RecordingInstance.Type media_type: Read only recordings that have this media type
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of RecordingInstance
+        :rtype: twilio.rest.video.v1.recording.RecordingPage
+        """
+        data = values.of({
+            'Status': status,
+            'SourceSid': source_sid,
+            'GroupingSid': serialize.map(grouping_sid, lambda e: e),
+            'DateCreatedAfter': serialize.iso8601_datetime(date_created_after),
+            'DateCreatedBefore': serialize.iso8601_datetime(date_created_before),
+            'MediaType': media_type,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return RecordingPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of RecordingInstance records from the API.
@@ -163,6 +312,23 @@ class RecordingList(ListResource):
 
         return RecordingPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of RecordingInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of RecordingInstance
+        :rtype: twilio.rest.video.v1.recording.RecordingPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return RecordingPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a RecordingContext
@@ -249,7 +415,7 @@ class RecordingContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/Recordings/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Recordings/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -262,6 +428,17 @@ class RecordingContext(InstanceContext):
 
         return RecordingInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the RecordingInstance
+
+        :returns: The fetched RecordingInstance
+        :rtype: twilio.rest.video.v1.recording.RecordingInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return RecordingInstance(self._version, payload, sid=self._solution['sid'], )
+
     def delete(self):
         """
         Deletes the RecordingInstance
@@ -271,6 +448,15 @@ class RecordingContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the RecordingInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -305,6 +491,38 @@ class RecordingInstance(InstanceResource):
         OPUS = "OPUS"
         PCMU = "PCMU"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'size': deserialize.integer,
+        'duration': deserialize.integer,
+        'offset': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'status': 'status',
+        'date_created': 'date_created',
+        'sid': 'sid',
+        'source_sid': 'source_sid',
+        'size': 'size',
+        'url': 'url',
+        'type': 'type',
+        'duration': 'duration',
+        'container_format': 'container_format',
+        'codec': 'codec',
+        'grouping_sids': 'grouping_sids',
+        'track_name': 'track_name',
+        'offset': 'offset',
+        'media_external_location': 'media_external_location',
+        'status_callback': 'status_callback',
+        'status_callback_method': 'status_callback_method',
+        'links': 'links',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the RecordingInstance
@@ -315,26 +533,7 @@ class RecordingInstance(InstanceResource):
         super(RecordingInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'status': payload.get('status'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'sid': payload.get('sid'),
-            'source_sid': payload.get('source_sid'),
-            'size': deserialize.integer(payload.get('size')),
-            'url': payload.get('url'),
-            'type': payload.get('type'),
-            'duration': deserialize.integer(payload.get('duration')),
-            'container_format': payload.get('container_format'),
-            'codec': payload.get('codec'),
-            'grouping_sids': payload.get('grouping_sids'),
-            'track_name': payload.get('track_name'),
-            'offset': deserialize.integer(payload.get('offset')),
-            'media_external_location': payload.get('media_external_location'),
-            'status_callback': payload.get('status_callback'),
-            'status_callback_method': payload.get('status_callback_method'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -506,6 +705,15 @@ class RecordingInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the RecordingInstance
+
+        :returns: The fetched RecordingInstance
+        :rtype: twilio.rest.video.v1.recording.RecordingInstance
+        """
+        return await self._proxy.fetch_async()
+
     def delete(self):
         """
         Deletes the RecordingInstance
@@ -515,6 +723,15 @@ class RecordingInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the RecordingInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
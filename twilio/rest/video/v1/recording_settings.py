@@ -6,6 +6,7 @@ This code was generated by
       /       /
 """
 
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
@@ -110,7 +111,7 @@ class RecordingSettingsContext(InstanceContext):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/RecordingSettings/Default'.format(**self._solution)
+        self._uri = values.ResourceUri('/RecordingSettings/Default', self._solution)
 
     def fetch(self):
         """
@@ -123,9 +124,20 @@ class RecordingSettingsContext(InstanceContext):
 
         return RecordingSettingsInstance(self._version, payload, )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the RecordingSettingsInstance
+
+        :returns: The fetched RecordingSettingsInstance
+        :rtype: twilio.rest.video.v1.recording_settings.RecordingSettingsInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return RecordingSettingsInstance(self._version, payload, )
+
     def create(self, friendly_name, aws_credentials_sid=values.unset,
                encryption_key_sid=values.unset, aws_s3_url=values.unset,
-               aws_storage_enabled=values.unset, encryption_enabled=values.unset):
+               aws_storage_enabled=values.unset, encryption_enabled=values.unset, deadline=None):
         """
         Create the RecordingSettingsInstance
 
@@ -135,6 +147,40 @@ class RecordingSettingsContext(InstanceContext):
         :param unicode aws_s3_url: The URL of the AWS S3 bucket where the recordings should be stored
         :param bool aws_storage_enabled: Whether all recordings should be written to the aws_s3_url
         :param bool encryption_enabled: Whether all recordings should be stored in an encrypted form
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created RecordingSettingsInstance
+        :rtype: twilio.rest.video.v1.recording_settings.RecordingSettingsInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'AwsCredentialsSid': aws_credentials_sid,
+            'EncryptionKeySid': encryption_key_sid,
+            'AwsS3Url': aws_s3_url,
+            'AwsStorageEnabled': aws_storage_enabled,
+            'EncryptionEnabled': encryption_enabled,
+        })
+
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return RecordingSettingsInstance(self._version, payload, )
+
+    async def create_async(self, friendly_name, aws_credentials_sid=values.unset,
+                           encryption_key_sid=values.unset, aws_s3_url=values.unset,
+                           aws_storage_enabled=values.unset, encryption_enabled=values.unset,
+                           deadline=None):
+        """
+        Asynchronous coroutine that creates the RecordingSettingsInstance
+
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode aws_credentials_sid: The SID of the stored Credential resource
+        :param unicode encryption_key_sid: The SID of the Public Key resource to use for encryption
+        :param unicode aws_s3_url: The URL of the AWS S3 bucket where the recordings should be stored
+        :param bool aws_storage_enabled: Whether all recordings should be written to the aws_s3_url
+        :param bool encryption_enabled: Whether all recordings should be stored in an encrypted form
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created RecordingSettingsInstance
         :rtype: twilio.rest.video.v1.recording_settings.RecordingSettingsInstance
@@ -148,7 +194,7 @@ class RecordingSettingsContext(InstanceContext):
             'EncryptionEnabled': encryption_enabled,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return RecordingSettingsInstance(self._version, payload, )
 
@@ -165,6 +211,20 @@ class RecordingSettingsContext(InstanceContext):
 
 class RecordingSettingsInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'friendly_name': 'friendly_name',
+        'aws_credentials_sid': 'aws_credentials_sid',
+        'aws_s3_url': 'aws_s3_url',
+        'aws_storage_enabled': 'aws_storage_enabled',
+        'encryption_key_sid': 'encryption_key_sid',
+        'encryption_enabled': 'encryption_enabled',
+        'url': 'url',
+    })
+
     def __init__(self, version, payload):
         """
         Initialize the RecordingSettingsInstance
@@ -175,16 +235,7 @@ class RecordingSettingsInstance(InstanceResource):
         super(RecordingSettingsInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'friendly_name': payload.get('friendly_name'),
-            'aws_credentials_sid': payload.get('aws_credentials_sid'),
-            'aws_s3_url': payload.get('aws_s3_url'),
-            'aws_storage_enabled': payload.get('aws_storage_enabled'),
-            'encryption_key_sid': payload.get('encryption_key_sid'),
-            'encryption_enabled': payload.get('encryption_enabled'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -276,9 +327,18 @@ class RecordingSettingsInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the RecordingSettingsInstance
+
+        :returns: The fetched RecordingSettingsInstance
+        :rtype: twilio.rest.video.v1.recording_settings.RecordingSettingsInstance
+        """
+        return await self._proxy.fetch_async()
+
     def create(self, friendly_name, aws_credentials_sid=values.unset,
                encryption_key_sid=values.unset, aws_s3_url=values.unset,
-               aws_storage_enabled=values.unset, encryption_enabled=values.unset):
+               aws_storage_enabled=values.unset, encryption_enabled=values.unset, deadline=None):
         """
         Create the RecordingSettingsInstance
 
@@ -288,6 +348,8 @@ class RecordingSettingsInstance(InstanceResource):
         :param unicode aws_s3_url: The URL of the AWS S3 bucket where the recordings should be stored
         :param bool aws_storage_enabled: Whether all recordings should be written to the aws_s3_url
         :param bool encryption_enabled: Whether all recordings should be stored in an encrypted form
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created RecordingSettingsInstance
         :rtype: twilio.rest.video.v1.recording_settings.RecordingSettingsInstance
@@ -299,6 +361,36 @@ class RecordingSettingsInstance(InstanceResource):
             aws_s3_url=aws_s3_url,
             aws_storage_enabled=aws_storage_enabled,
             encryption_enabled=encryption_enabled,
+            deadline=deadline,
+        )
+
+    async def create_async(self, friendly_name, aws_credentials_sid=values.unset,
+                           encryption_key_sid=values.unset, aws_s3_url=values.unset,
+                           aws_storage_enabled=values.unset, encryption_enabled=values.unset,
+                           deadline=None):
+        """
+        Asynchronous coroutine that creates the RecordingSettingsInstance
+
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode aws_credentials_sid: The SID of the stored Credential resource
+        :param unicode encryption_key_sid: The SID of the Public Key resource to use for encryption
+        :param unicode aws_s3_url: The URL of the AWS S3 bucket where the recordings should be stored
+        :param bool aws_storage_enabled: Whether all recordings should be written to the aws_s3_url
+        :param bool encryption_enabled: Whether all recordings should be stored in an encrypted form
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created RecordingSettingsInstance
+        :rtype: twilio.rest.video.v1.recording_settings.RecordingSettingsInstance
+        """
+        return await self._proxy.create_async(
+            friendly_name,
+            aws_credentials_sid=aws_credentials_sid,
+            encryption_key_sid=encryption_key_sid,
+            aws_s3_url=aws_s3_url,
+            aws_storage_enabled=aws_storage_enabled,
+            encryption_enabled=encryption_enabled,
+            deadline=deadline,
         )
 
     def __repr__(self):
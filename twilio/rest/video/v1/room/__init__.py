@@ -6,6 +6,8 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import serialize
 from twilio.base import values
@@ -13,9 +15,6 @@ from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.video.v1.room.recording import RoomRecordingList
-from twilio.rest.video.v1.room.room_participant import ParticipantList
-from twilio.rest.video.v1.room.room_recording_rule import RecordingRulesList
 
 
 class RoomList(ListResource):
@@ -33,7 +32,7 @@ class RoomList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Rooms'.format(**self._solution)
+        self._uri = values.ResourceUri('/Rooms', self._solution)
 
     def create(self, enable_turn=values.unset, type=values.unset,
                unique_name=values.unset, status_callback=values.unset,
@@ -42,7 +41,7 @@ class RoomList(ListResource):
                video_codecs=values.unset, media_region=values.unset,
                recording_rules=values.unset, audio_only=values.unset,
                max_participant_duration=values.unset,
-               empty_room_timeout=values.unset, unused_room_timeout=values.unset):
+               empty_room_timeout=values.unset, unused_room_timeout=values.unset, deadline=None):
         """
         Create the RoomInstance
 
@@ -60,6 +59,8 @@ class RoomList(ListResource):
         :param unicode max_participant_duration: The maximum number of seconds a Participant can be connected to the room
         :param unicode empty_room_timeout: Configures the time a room will remain active after last participant leaves.
         :param unicode unused_room_timeout: Configures the time a room will remain active when no one joins.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created RoomInstance
         :rtype: twilio.rest.video.v1.room.RoomInstance
@@ -81,13 +82,66 @@ class RoomList(ListResource):
             'UnusedRoomTimeout': unused_room_timeout,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return RoomInstance(self._version, payload, )
+
+    async def create_async(self, enable_turn=values.unset, type=values.unset,
+                           unique_name=values.unset, status_callback=values.unset,
+                           status_callback_method=values.unset, max_participants=values.unset,
+                           record_participants_on_connect=values.unset,
+                           video_codecs=values.unset, media_region=values.unset,
+                           recording_rules=values.unset, audio_only=values.unset,
+                           max_participant_duration=values.unset,
+                           empty_room_timeout=values.unset, unused_room_timeout=values.unset,
+                           deadline=None):
+        """
+        Asynchronous coroutine that creates the RoomInstance
+
+        :param bool enable_turn: Enable Twilio's Network Traversal TURN service
+        :param RoomInstance.RoomType type: The type of room
+        :param unicode unique_name: An application-defined string that uniquely identifies the resource
+        :param unicode status_callback: The URL to send status information to your application
+        :param unicode status_callback_method: The HTTP method we should use to call status_callback
+        :param unicode max_participants: The maximum number of concurrent Participants allowed in the room
+        :param bool record_participants_on_connect: Whether to start recording when Participants connect
+        :param list[RoomInstance.VideoCodec] video_codecs: An array of the video codecs that are supported when publishing a track in the room
+        :param unicode media_region: The region for the media server in Group Rooms
+        :param dict recording_rules: A collection of Recording Rules
+        :param bool audio_only: Indicates whether the room will only contain audio track participants for group rooms.
+        :param unicode max_participant_duration: The maximum number of seconds a Participant can be connected to the room
+        :param unicode empty_room_timeout: Configures the time a room will remain active after last participant leaves.
+        :param unicode unused_room_timeout: Configures the time a room will remain active when no one joins.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created RoomInstance
+        :rtype: twilio.rest.video.v1.room.RoomInstance
+        """
+        data = values.of({
+            'EnableTurn': enable_turn,
+            'Type': type,
+            'UniqueName': unique_name,
+            'StatusCallback': status_callback,
+            'StatusCallbackMethod': status_callback_method,
+            'MaxParticipants': max_participants,
+            'RecordParticipantsOnConnect': record_participants_on_connect,
+            'VideoCodecs': serialize.map(video_codecs, lambda e: e),
+            'MediaRegion': media_region,
+            'RecordingRules': serialize.object(recording_rules),
+            'AudioOnly': audio_only,
+            'MaxParticipantDuration': max_participant_duration,
+            'EmptyRoomTimeout': empty_room_timeout,
+            'UnusedRoomTimeout': unused_room_timeout,
+        })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return RoomInstance(self._version, payload, )
 
     def stream(self, status=values.unset, unique_name=values.unset,
                date_created_after=values.unset, date_created_before=values.unset,
-               limit=None, page_size=None):
+               limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams RoomInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -104,25 +158,77 @@ class RoomList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.video.v1.room.RoomInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
-            status=status,
-            unique_name=unique_name,
-            date_created_after=date_created_after,
-            date_created_before=date_created_before,
-            page_size=limits['page_size'],
-        )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                status=status,
+                unique_name=unique_name,
+                date_created_after=date_created_after,
+                date_created_before=date_created_before,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, status=values.unset, unique_name=values.unset,
+                           date_created_after=values.unset, date_created_before=values.unset,
+                           limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams RoomInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param RoomInstance.RoomStatus status: Read only the rooms with this status
+        :param unicode unique_name: Read only rooms with this unique_name
+        :param datetime date_created_after: Read only rooms that started on or after this date, given as YYYY-MM-DD
+        :param datetime date_created_before: Read only rooms that started before this date, given as YYYY-MM-DD
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.video.v1.room.RoomInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
 
-        return self._version.stream(page, limits['limit'])
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                status=status,
+                unique_name=unique_name,
+                date_created_after=date_created_after,
+                date_created_before=date_created_before,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, status=values.unset, unique_name=values.unset,
              date_created_after=values.unset, date_created_before=values.unset,
-             limit=None, page_size=None):
+             limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists RoomInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -138,6 +244,12 @@ class RoomList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.video.v1.room.RoomInstance]
@@ -149,8 +261,51 @@ class RoomList(ListResource):
             date_created_before=date_created_before,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, status=values.unset, unique_name=values.unset,
+                         date_created_after=values.unset, date_created_before=values.unset,
+                         limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists RoomInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param RoomInstance.RoomStatus status: Read only the rooms with this status
+        :param unicode unique_name: Read only rooms with this unique_name
+        :param datetime date_created_after: Read only rooms that started on or after this date, given as YYYY-MM-DD
+        :param datetime date_created_before: Read only rooms that started before this date, given as YYYY-MM-DD
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.video.v1.room.RoomInstance]
+        """
+        return [record async for record in await self.stream_async(
+            status=status,
+            unique_name=unique_name,
+            date_created_after=date_created_after,
+            date_created_before=date_created_before,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, status=values.unset, unique_name=values.unset,
              date_created_after=values.unset, date_created_before=values.unset,
              page_token=values.unset, page_number=values.unset,
@@ -184,6 +339,39 @@ class RoomList(ListResource):
 
         return RoomPage(self._version, response, self._solution)
 
+    async def page_async(self, status=values.unset, unique_name=values.unset,
+                         date_created_after=values.unset, date_created_before=values.unset,
+                         page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of RoomInstance records from the API.
+        Request is executed immediately
+
+        :param RoomInstance.RoomStatus status: Read only the rooms with this status
+        :param unicode unique_name: Read only rooms with this unique_name
+        :param datetime date_created_after: Read only rooms that started on or after this date, given as YYYY-MM-DD
+        :param datetime date_created_before: Read only rooms that started before this date, given as YYYY-MM-DD
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of RoomInstance
+        :rtype: twilio.rest.video.v1.room.RoomPage
+        """
+        data = values.of({
+            'Status': status,
+            'UniqueName': unique_name,
+            'DateCreatedAfter': serialize.iso8601_datetime(date_created_after),
+            'DateCreatedBefore': serialize.iso8601_datetime(date_created_before),
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return RoomPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of RoomInstance records from the API.
@@ -201,6 +389,23 @@ class RoomList(ListResource):
 
         return RoomPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of RoomInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of RoomInstance
+        :rtype: twilio.rest.video.v1.room.RoomPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return RoomPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a RoomContext
@@ -287,7 +492,7 @@ class RoomContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/Rooms/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Rooms/{sid}', self._solution)
 
         # Dependents
         self._recordings = None
@@ -305,6 +510,17 @@ class RoomContext(InstanceContext):
 
         return RoomInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the RoomInstance
+
+        :returns: The fetched RoomInstance
+        :rtype: twilio.rest.video.v1.room.RoomInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return RoomInstance(self._version, payload, sid=self._solution['sid'], )
+
     def update(self, status):
         """
         Update the RoomInstance
@@ -320,6 +536,21 @@ class RoomContext(InstanceContext):
 
         return RoomInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def update_async(self, status):
+        """
+        Asynchronous coroutine that updates the RoomInstance
+
+        :param RoomInstance.RoomStatus status: The new status of the resource
+
+        :returns: The updated RoomInstance
+        :rtype: twilio.rest.video.v1.room.RoomInstance
+        """
+        data = values.of({'Status': status, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return RoomInstance(self._version, payload, sid=self._solution['sid'], )
+
     @property
     def recordings(self):
         """
@@ -329,6 +560,7 @@ class RoomContext(InstanceContext):
         :rtype: twilio.rest.video.v1.room.recording.RoomRecordingList
         """
         if self._recordings is None:
+            from twilio.rest.video.v1.room.recording import RoomRecordingList
             self._recordings = RoomRecordingList(self._version, room_sid=self._solution['sid'], )
         return self._recordings
 
@@ -341,6 +573,7 @@ class RoomContext(InstanceContext):
         :rtype: twilio.rest.video.v1.room.room_participant.ParticipantList
         """
         if self._participants is None:
+            from twilio.rest.video.v1.room.room_participant import ParticipantList
             self._participants = ParticipantList(self._version, room_sid=self._solution['sid'], )
         return self._participants
 
@@ -353,6 +586,7 @@ class RoomContext(InstanceContext):
         :rtype: twilio.rest.video.v1.room.room_recording_rule.RecordingRulesList
         """
         if self._recording_rules is None:
+            from twilio.rest.video.v1.room.room_recording_rule import RecordingRulesList
             self._recording_rules = RecordingRulesList(self._version, room_sid=self._solution['sid'], )
         return self._recording_rules
 
@@ -384,6 +618,48 @@ class RoomInstance(InstanceResource):
         VP8 = "VP8"
         H264 = "H264"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+        'end_time': deserialize.iso8601_datetime,
+        'duration': deserialize.integer,
+        'max_participants': deserialize.integer,
+        'max_participant_duration': deserialize.integer,
+        'max_concurrent_published_tracks': deserialize.integer,
+        'empty_room_timeout': deserialize.integer,
+        'unused_room_timeout': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'status': 'status',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'account_sid': 'account_sid',
+        'enable_turn': 'enable_turn',
+        'unique_name': 'unique_name',
+        'status_callback': 'status_callback',
+        'status_callback_method': 'status_callback_method',
+        'end_time': 'end_time',
+        'duration': 'duration',
+        'type': 'type',
+        'max_participants': 'max_participants',
+        'max_participant_duration': 'max_participant_duration',
+        'max_concurrent_published_tracks': 'max_concurrent_published_tracks',
+        'record_participants_on_connect': 'record_participants_on_connect',
+        'video_codecs': 'video_codecs',
+        'media_region': 'media_region',
+        'audio_only': 'audio_only',
+        'empty_room_timeout': 'empty_room_timeout',
+        'unused_room_timeout': 'unused_room_timeout',
+        'url': 'url',
+        'links': 'links',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the RoomInstance
@@ -394,31 +670,7 @@ class RoomInstance(InstanceResource):
         super(RoomInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'status': payload.get('status'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'account_sid': payload.get('account_sid'),
-            'enable_turn': payload.get('enable_turn'),
-            'unique_name': payload.get('unique_name'),
-            'status_callback': payload.get('status_callback'),
-            'status_callback_method': payload.get('status_callback_method'),
-            'end_time': deserialize.iso8601_datetime(payload.get('end_time')),
-            'duration': deserialize.integer(payload.get('duration')),
-            'type': payload.get('type'),
-            'max_participants': deserialize.integer(payload.get('max_participants')),
-            'max_participant_duration': deserialize.integer(payload.get('max_participant_duration')),
-            'max_concurrent_published_tracks': deserialize.integer(payload.get('max_concurrent_published_tracks')),
-            'record_participants_on_connect': payload.get('record_participants_on_connect'),
-            'video_codecs': payload.get('video_codecs'),
-            'media_region': payload.get('media_region'),
-            'audio_only': payload.get('audio_only'),
-            'empty_room_timeout': deserialize.integer(payload.get('empty_room_timeout')),
-            'unused_room_timeout': deserialize.integer(payload.get('unused_room_timeout')),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -630,6 +882,15 @@ class RoomInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the RoomInstance
+
+        :returns: The fetched RoomInstance
+        :rtype: twilio.rest.video.v1.room.RoomInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, status):
         """
         Update the RoomInstance
@@ -641,6 +902,17 @@ class RoomInstance(InstanceResource):
         """
         return self._proxy.update(status, )
 
+    async def update_async(self, status):
+        """
+        Asynchronous coroutine that updates the RoomInstance
+
+        :param RoomInstance.RoomStatus status: The new status of the resource
+
+        :returns: The updated RoomInstance
+        :rtype: twilio.rest.video.v1.room.RoomInstance
+        """
+        return await self._proxy.update_async(status, )
+
     @property
     def recordings(self):
         """
@@ -680,3 +952,21 @@ class RoomInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Video.V1.RoomInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'ParticipantList': 'twilio.rest.video.v1.room.room_participant',
+    'RecordingRulesList': 'twilio.rest.video.v1.room.room_recording_rule',
+    'RoomRecordingList': 'twilio.rest.video.v1.room.recording',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -31,11 +31,11 @@ class RoomRecordingList(ListResource):
 
         # Path Solution
         self._solution = {'room_sid': room_sid, }
-        self._uri = '/Rooms/{room_sid}/Recordings'.format(**self._solution)
+        self._uri = values.ResourceUri('/Rooms/{room_sid}/Recordings', self._solution)
 
     def stream(self, status=values.unset, source_sid=values.unset,
                date_created_after=values.unset, date_created_before=values.unset,
-               limit=None, page_size=None):
+               limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams RoomRecordingInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -52,25 +52,77 @@ class RoomRecordingList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.video.v1.room.recording.RoomRecordingInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
-            status=status,
-            source_sid=source_sid,
-            date_created_after=date_created_after,
-            date_created_before=date_created_before,
-            page_size=limits['page_size'],
-        )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                status=status,
+                source_sid=source_sid,
+                date_created_after=date_created_after,
+                date_created_before=date_created_before,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, status=values.unset, source_sid=values.unset,
+                           date_created_after=values.unset, date_created_before=values.unset,
+                           limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams RoomRecordingInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param RoomRecordingInstance.Status status: Read only the recordings with this status
+        :param unicode source_sid: Read only the recordings that have this source_sid
+        :param datetime date_created_after: Read only Recordings that started on or after this ISO 8601 datetime with time zone
+        :param datetime date_created_before: Read only Recordings that started before this ISO 8601 date-time with time zone
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.video.v1.room.recording.RoomRecordingInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                status=status,
+                source_sid=source_sid,
+                date_created_after=date_created_after,
+                date_created_before=date_created_before,
+                page_size=limits['page_size'],
+            )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, status=values.unset, source_sid=values.unset,
              date_created_after=values.unset, date_created_before=values.unset,
-             limit=None, page_size=None):
+             limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists RoomRecordingInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -86,6 +138,12 @@ class RoomRecordingList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.video.v1.room.recording.RoomRecordingInstance]
@@ -97,8 +155,51 @@ class RoomRecordingList(ListResource):
             date_created_before=date_created_before,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, status=values.unset, source_sid=values.unset,
+                         date_created_after=values.unset, date_created_before=values.unset,
+                         limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists RoomRecordingInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param RoomRecordingInstance.Status status: Read only the recordings with this status
+        :param unicode source_sid: Read only the recordings that have this source_sid
+        :param datetime date_created_after: Read only Recordings that started on or after this ISO 8601 datetime with time zone
+        :param datetime date_created_before: Read only Recordings that started before this ISO 8601 date-time with time zone
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.video.v1.room.recording.RoomRecordingInstance]
+        """
+        return [record async for record in await self.stream_async(
+            status=status,
+            source_sid=source_sid,
+            date_created_after=date_created_after,
+            date_created_before=date_created_before,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, status=values.unset, source_sid=values.unset,
              date_created_after=values.unset, date_created_before=values.unset,
              page_token=values.unset, page_number=values.unset,
@@ -132,6 +233,39 @@ class RoomRecordingList(ListResource):
 
         return RoomRecordingPage(self._version, response, self._solution)
 
+    async def page_async(self, status=values.unset, source_sid=values.unset,
+                         date_created_after=values.unset, date_created_before=values.unset,
+                         page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of RoomRecordingInstance records from the API.
+        Request is executed immediately
+
+        :param RoomRecordingInstance.Status status: Read only the recordings with this status
+        :param unicode source_sid: Read only the recordings that have this source_sid
+        :param datetime date_created_after: Read only Recordings that started on or after this ISO 8601 datetime with time zone
+        :param datetime date_created_before: Read only Recordings that started before this ISO 8601 date-time with time zone
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of RoomRecordingInstance
+        :rtype: twilio.rest.video.v1.room.recording.RoomRecordingPage
+        """
+        data = values.of({
+            'Status': status,
+            'SourceSid': source_sid,
+            'DateCreatedAfter': serialize.iso8601_datetime(date_created_after),
+            'DateCreatedBefore': serialize.iso8601_datetime(date_created_before),
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return RoomRecordingPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of RoomRecordingInstance records from the API.
@@ -149,6 +283,23 @@ class RoomRecordingList(ListResource):
 
         return RoomRecordingPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of RoomRecordingInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of RoomRecordingInstance
+        :rtype: twilio.rest.video.v1.room.recording.RoomRecordingPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return RoomRecordingPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a RoomRecordingContext
@@ -237,7 +388,7 @@ class RoomRecordingContext(InstanceContext):
 
         # Path Solution
         self._solution = {'room_sid': room_sid, 'sid': sid, }
-        self._uri = '/Rooms/{room_sid}/Recordings/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Rooms/{room_sid}/Recordings/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -255,6 +406,22 @@ class RoomRecordingContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the RoomRecordingInstance
+
+        :returns: The fetched RoomRecordingInstance
+        :rtype: twilio.rest.video.v1.room.recording.RoomRecordingInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return RoomRecordingInstance(
+            self._version,
+            payload,
+            room_sid=self._solution['room_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self):
         """
         Deletes the RoomRecordingInstance
@@ -264,6 +431,15 @@ class RoomRecordingContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the RoomRecordingInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -298,6 +474,37 @@ class RoomRecordingInstance(InstanceResource):
         OPUS = "OPUS"
         PCMU = "PCMU"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'size': deserialize.integer,
+        'duration': deserialize.integer,
+        'offset': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'status': 'status',
+        'date_created': 'date_created',
+        'sid': 'sid',
+        'source_sid': 'source_sid',
+        'size': 'size',
+        'url': 'url',
+        'type': 'type',
+        'duration': 'duration',
+        'container_format': 'container_format',
+        'codec': 'codec',
+        'grouping_sids': 'grouping_sids',
+        'track_name': 'track_name',
+        'offset': 'offset',
+        'media_external_location': 'media_external_location',
+        'room_sid': 'room_sid',
+        'links': 'links',
+    }, _deserializers)
+
     def __init__(self, version, payload, room_sid, sid=None):
         """
         Initialize the RoomRecordingInstance
@@ -308,25 +515,7 @@ class RoomRecordingInstance(InstanceResource):
         super(RoomRecordingInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'status': payload.get('status'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'sid': payload.get('sid'),
-            'source_sid': payload.get('source_sid'),
-            'size': deserialize.integer(payload.get('size')),
-            'url': payload.get('url'),
-            'type': payload.get('type'),
-            'duration': deserialize.integer(payload.get('duration')),
-            'container_format': payload.get('container_format'),
-            'codec': payload.get('codec'),
-            'grouping_sids': payload.get('grouping_sids'),
-            'track_name': payload.get('track_name'),
-            'offset': deserialize.integer(payload.get('offset')),
-            'media_external_location': payload.get('media_external_location'),
-            'room_sid': payload.get('room_sid'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -494,6 +683,15 @@ class RoomRecordingInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the RoomRecordingInstance
+
+        :returns: The fetched RoomRecordingInstance
+        :rtype: twilio.rest.video.v1.room.recording.RoomRecordingInstance
+        """
+        return await self._proxy.fetch_async()
+
     def delete(self):
         """
         Deletes the RoomRecordingInstance
@@ -503,6 +701,15 @@ class RoomRecordingInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the RoomRecordingInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
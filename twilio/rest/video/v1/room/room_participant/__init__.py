@@ -6,6 +6,8 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import serialize
 from twilio.base import values
@@ -13,9 +15,6 @@ from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.video.v1.room.room_participant.room_participant_published_track import PublishedTrackList
-from twilio.rest.video.v1.room.room_participant.room_participant_subscribe_rule import SubscribeRulesList
-from twilio.rest.video.v1.room.room_participant.room_participant_subscribed_track import SubscribedTrackList
 
 
 class ParticipantList(ListResource):
@@ -34,11 +33,11 @@ class ParticipantList(ListResource):
 
         # Path Solution
         self._solution = {'room_sid': room_sid, }
-        self._uri = '/Rooms/{room_sid}/Participants'.format(**self._solution)
+        self._uri = values.ResourceUri('/Rooms/{room_sid}/Participants', self._solution)
 
     def stream(self, status=values.unset, identity=values.unset,
                date_created_after=values.unset, date_created_before=values.unset,
-               limit=None, page_size=None):
+               limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams ParticipantInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -55,25 +54,77 @@ class ParticipantList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.video.v1.room.room_participant.ParticipantInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
-            status=status,
-            identity=identity,
-            date_created_after=date_created_after,
-            date_created_before=date_created_before,
-            page_size=limits['page_size'],
-        )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                status=status,
+                identity=identity,
+                date_created_after=date_created_after,
+                date_created_before=date_created_before,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, status=values.unset, identity=values.unset,
+                           date_created_after=values.unset, date_created_before=values.unset,
+                           limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams ParticipantInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param ParticipantInstance.Status status: Read only the participants with this status
+        :param unicode identity: Read only the Participants with this user identity value
+        :param datetime date_created_after: Read only Participants that started after this date in UTC ISO 8601 format
+        :param datetime date_created_before: Read only Participants that started before this date in ISO 8601 format
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.video.v1.room.room_participant.ParticipantInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                status=status,
+                identity=identity,
+                date_created_after=date_created_after,
+                date_created_before=date_created_before,
+                page_size=limits['page_size'],
+            )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, status=values.unset, identity=values.unset,
              date_created_after=values.unset, date_created_before=values.unset,
-             limit=None, page_size=None):
+             limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists ParticipantInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -89,6 +140,12 @@ class ParticipantList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.video.v1.room.room_participant.ParticipantInstance]
@@ -100,8 +157,51 @@ class ParticipantList(ListResource):
             date_created_before=date_created_before,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, status=values.unset, identity=values.unset,
+                         date_created_after=values.unset, date_created_before=values.unset,
+                         limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists ParticipantInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param ParticipantInstance.Status status: Read only the participants with this status
+        :param unicode identity: Read only the Participants with this user identity value
+        :param datetime date_created_after: Read only Participants that started after this date in UTC ISO 8601 format
+        :param datetime date_created_before: Read only Participants that started before this date in ISO 8601 format
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.video.v1.room.room_participant.ParticipantInstance]
+        """
+        return [record async for record in await self.stream_async(
+            status=status,
+            identity=identity,
+            date_created_after=date_created_after,
+            date_created_before=date_created_before,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, status=values.unset, identity=values.unset,
              date_created_after=values.unset, date_created_before=values.unset,
              page_token=values.unset, page_number=values.unset,
@@ -135,6 +235,39 @@ class ParticipantList(ListResource):
 
         return ParticipantPage(self._version, response, self._solution)
 
+    async def page_async(self, status=values.unset, identity=values.unset,
+                         date_created_after=values.unset, date_created_before=values.unset,
+                         page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of ParticipantInstance records from the API.
+        Request is executed immediately
+
+        :param ParticipantInstance.Status status: Read only the participants with this status
+        :param unicode identity: Read only the Participants with this user identity value
+        :param datetime date_created_after: Read only Participants that started after this date in UTC ISO 8601 format
+        :param datetime date_created_before: Read only Participants that started before this date in ISO 8601 format
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of ParticipantInstance
+        :rtype: twilio.rest.video.v1.room.room_participant.ParticipantPage
+        """
+        data = values.of({
+            'Status': status,
+            'Identity': identity,
+            'DateCreatedAfter': serialize.iso8601_datetime(date_created_after),
+            'DateCreatedBefore': serialize.iso8601_datetime(date_created_before),
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return ParticipantPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of ParticipantInstance records from the API.
@@ -152,6 +285,23 @@ class ParticipantList(ListResource):
 
         return ParticipantPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of ParticipantInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of ParticipantInstance
+        :rtype: twilio.rest.video.v1.room.room_participant.ParticipantPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return ParticipantPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a ParticipantContext
@@ -240,7 +390,7 @@ class ParticipantContext(InstanceContext):
 
         # Path Solution
         self._solution = {'room_sid': room_sid, 'sid': sid, }
-        self._uri = '/Rooms/{room_sid}/Participants/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Rooms/{room_sid}/Participants/{sid}', self._solution)
 
         # Dependents
         self._published_tracks = None
@@ -263,6 +413,22 @@ class ParticipantContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ParticipantInstance
+
+        :returns: The fetched ParticipantInstance
+        :rtype: twilio.rest.video.v1.room.room_participant.ParticipantInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return ParticipantInstance(
+            self._version,
+            payload,
+            room_sid=self._solution['room_sid'],
+            sid=self._solution['sid'],
+        )
+
     def update(self, status=values.unset):
         """
         Update the ParticipantInstance
@@ -283,6 +449,26 @@ class ParticipantContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, status=values.unset):
+        """
+        Asynchronous coroutine that updates the ParticipantInstance
+
+        :param ParticipantInstance.Status status: The new status of the resource
+
+        :returns: The updated ParticipantInstance
+        :rtype: twilio.rest.video.v1.room.room_participant.ParticipantInstance
+        """
+        data = values.of({'Status': status, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return ParticipantInstance(
+            self._version,
+            payload,
+            room_sid=self._solution['room_sid'],
+            sid=self._solution['sid'],
+        )
+
     @property
     def published_tracks(self):
         """
@@ -292,6 +478,7 @@ class ParticipantContext(InstanceContext):
         :rtype: twilio.rest.video.v1.room.room_participant.room_participant_published_track.PublishedTrackList
         """
         if self._published_tracks is None:
+            from twilio.rest.video.v1.room.room_participant.room_participant_published_track import PublishedTrackList
             self._published_tracks = PublishedTrackList(
                 self._version,
                 room_sid=self._solution['room_sid'],
@@ -308,6 +495,7 @@ class ParticipantContext(InstanceContext):
         :rtype: twilio.rest.video.v1.room.room_participant.room_participant_subscribed_track.SubscribedTrackList
         """
         if self._subscribed_tracks is None:
+            from twilio.rest.video.v1.room.room_participant.room_participant_subscribed_track import SubscribedTrackList
             self._subscribed_tracks = SubscribedTrackList(
                 self._version,
                 room_sid=self._solution['room_sid'],
@@ -324,6 +512,7 @@ class ParticipantContext(InstanceContext):
         :rtype: twilio.rest.video.v1.room.room_participant.room_participant_subscribe_rule.SubscribeRulesList
         """
         if self._subscribe_rules is None:
+            from twilio.rest.video.v1.room.room_participant.room_participant_subscribe_rule import SubscribeRulesList
             self._subscribe_rules = SubscribeRulesList(
                 self._version,
                 room_sid=self._solution['room_sid'],
@@ -348,6 +537,33 @@ class ParticipantInstance(InstanceResource):
         CONNECTED = "connected"
         DISCONNECTED = "disconnected"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+        'start_time': deserialize.iso8601_datetime,
+        'end_time': deserialize.iso8601_datetime,
+        'duration': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'room_sid': 'room_sid',
+        'account_sid': 'account_sid',
+        'status': 'status',
+        'identity': 'identity',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'start_time': 'start_time',
+        'end_time': 'end_time',
+        'duration': 'duration',
+        'url': 'url',
+        'links': 'links',
+    }, _deserializers)
+
     def __init__(self, version, payload, room_sid, sid=None):
         """
         Initialize the ParticipantInstance
@@ -358,20 +574,7 @@ class ParticipantInstance(InstanceResource):
         super(ParticipantInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'room_sid': payload.get('room_sid'),
-            'account_sid': payload.get('account_sid'),
-            'status': payload.get('status'),
-            'identity': payload.get('identity'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'start_time': deserialize.iso8601_datetime(payload.get('start_time')),
-            'end_time': deserialize.iso8601_datetime(payload.get('end_time')),
-            'duration': deserialize.integer(payload.get('duration')),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -499,6 +702,15 @@ class ParticipantInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ParticipantInstance
+
+        :returns: The fetched ParticipantInstance
+        :rtype: twilio.rest.video.v1.room.room_participant.ParticipantInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, status=values.unset):
         """
         Update the ParticipantInstance
@@ -510,6 +722,17 @@ class ParticipantInstance(InstanceResource):
         """
         return self._proxy.update(status=status, )
 
+    async def update_async(self, status=values.unset):
+        """
+        Asynchronous coroutine that updates the ParticipantInstance
+
+        :param ParticipantInstance.Status status: The new status of the resource
+
+        :returns: The updated ParticipantInstance
+        :rtype: twilio.rest.video.v1.room.room_participant.ParticipantInstance
+        """
+        return await self._proxy.update_async(status=status, )
+
     @property
     def published_tracks(self):
         """
@@ -549,3 +772,21 @@ class ParticipantInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Video.V1.ParticipantInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'PublishedTrackList': 'twilio.rest.video.v1.room.room_participant.room_participant_published_track',
+    'SubscribeRulesList': 'twilio.rest.video.v1.room.room_participant.room_participant_subscribe_rule',
+    'SubscribedTrackList': 'twilio.rest.video.v1.room.room_participant.room_participant_subscribed_track',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
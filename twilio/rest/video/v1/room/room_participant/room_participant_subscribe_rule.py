@@ -31,7 +31,7 @@ class SubscribeRulesList(ListResource):
 
         # Path Solution
         self._solution = {'room_sid': room_sid, 'participant_sid': participant_sid, }
-        self._uri = '/Rooms/{room_sid}/Participants/{participant_sid}/SubscribeRules'.format(**self._solution)
+        self._uri = values.ResourceUri('/Rooms/{room_sid}/Participants/{participant_sid}/SubscribeRules', self._solution)
 
     def fetch(self):
         """
@@ -49,6 +49,22 @@ class SubscribeRulesList(ListResource):
             participant_sid=self._solution['participant_sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the SubscribeRulesInstance
+
+        :returns: The fetched SubscribeRulesInstance
+        :rtype: twilio.rest.video.v1.room.room_participant.room_participant_subscribe_rule.SubscribeRulesInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return SubscribeRulesInstance(
+            self._version,
+            payload,
+            room_sid=self._solution['room_sid'],
+            participant_sid=self._solution['participant_sid'],
+        )
+
     def update(self, rules=values.unset):
         """
         Update the SubscribeRulesInstance
@@ -69,6 +85,26 @@ class SubscribeRulesList(ListResource):
             participant_sid=self._solution['participant_sid'],
         )
 
+    async def update_async(self, rules=values.unset):
+        """
+        Asynchronous coroutine that updates the SubscribeRulesInstance
+
+        :param dict rules: A JSON-encoded array of subscribe rules
+
+        :returns: The updated SubscribeRulesInstance
+        :rtype: twilio.rest.video.v1.room.room_participant.room_participant_subscribe_rule.SubscribeRulesInstance
+        """
+        data = values.of({'Rules': serialize.object(rules), })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return SubscribeRulesInstance(
+            self._version,
+            payload,
+            room_sid=self._solution['room_sid'],
+            participant_sid=self._solution['participant_sid'],
+        )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -126,6 +162,23 @@ class SubscribeRulesPage(Page):
 
 class SubscribeRulesInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'participant_sid': 'participant_sid',
+        'room_sid': 'room_sid',
+        'rules': 'rules',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+    }, _deserializers)
+
     def __init__(self, version, payload, room_sid, participant_sid):
         """
         Initialize the SubscribeRulesInstance
@@ -136,13 +189,7 @@ class SubscribeRulesInstance(InstanceResource):
         super(SubscribeRulesInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'participant_sid': payload.get('participant_sid'),
-            'room_sid': payload.get('room_sid'),
-            'rules': payload.get('rules'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -30,7 +30,7 @@ class RecordingRulesList(ListResource):
 
         # Path Solution
         self._solution = {'room_sid': room_sid, }
-        self._uri = '/Rooms/{room_sid}/RecordingRules'.format(**self._solution)
+        self._uri = values.ResourceUri('/Rooms/{room_sid}/RecordingRules', self._solution)
 
     def fetch(self):
         """
@@ -43,6 +43,17 @@ class RecordingRulesList(ListResource):
 
         return RecordingRulesInstance(self._version, payload, room_sid=self._solution['room_sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the RecordingRulesInstance
+
+        :returns: The fetched RecordingRulesInstance
+        :rtype: twilio.rest.video.v1.room.room_recording_rule.RecordingRulesInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return RecordingRulesInstance(self._version, payload, room_sid=self._solution['room_sid'], )
+
     def update(self, rules=values.unset):
         """
         Update the RecordingRulesInstance
@@ -58,6 +69,21 @@ class RecordingRulesList(ListResource):
 
         return RecordingRulesInstance(self._version, payload, room_sid=self._solution['room_sid'], )
 
+    async def update_async(self, rules=values.unset):
+        """
+        Asynchronous coroutine that updates the RecordingRulesInstance
+
+        :param dict rules: A JSON-encoded array of recording rules
+
+        :returns: The updated RecordingRulesInstance
+        :rtype: twilio.rest.video.v1.room.room_recording_rule.RecordingRulesInstance
+        """
+        data = values.of({'Rules': serialize.object(rules), })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return RecordingRulesInstance(self._version, payload, room_sid=self._solution['room_sid'], )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -109,6 +135,22 @@ class RecordingRulesPage(Page):
 
 class RecordingRulesInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'room_sid': 'room_sid',
+        'rules': 'rules',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+    }, _deserializers)
+
     def __init__(self, version, payload, room_sid):
         """
         Initialize the RecordingRulesInstance
@@ -119,12 +161,7 @@ class RecordingRulesInstance(InstanceResource):
         super(RecordingRulesInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'room_sid': payload.get('room_sid'),
-            'rules': payload.get('rules'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
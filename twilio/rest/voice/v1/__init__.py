@@ -6,13 +6,9 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base.version import Version
-from twilio.rest.voice.v1.archived_call import ArchivedCallList
-from twilio.rest.voice.v1.byoc_trunk import ByocTrunkList
-from twilio.rest.voice.v1.connection_policy import ConnectionPolicyList
-from twilio.rest.voice.v1.dialing_permissions import DialingPermissionsList
-from twilio.rest.voice.v1.ip_record import IpRecordList
-from twilio.rest.voice.v1.source_ip_mapping import SourceIpMappingList
 
 
 class V1(Version):
@@ -39,6 +35,7 @@ class V1(Version):
         :rtype: twilio.rest.voice.v1.archived_call.ArchivedCallList
         """
         if self._archived_calls is None:
+            from twilio.rest.voice.v1.archived_call import ArchivedCallList
             self._archived_calls = ArchivedCallList(self)
         return self._archived_calls
 
@@ -48,6 +45,7 @@ class V1(Version):
         :rtype: twilio.rest.voice.v1.byoc_trunk.ByocTrunkList
         """
         if self._byoc_trunks is None:
+            from twilio.rest.voice.v1.byoc_trunk import ByocTrunkList
             self._byoc_trunks = ByocTrunkList(self)
         return self._byoc_trunks
 
@@ -57,6 +55,7 @@ class V1(Version):
         :rtype: twilio.rest.voice.v1.connection_policy.ConnectionPolicyList
         """
         if self._connection_policies is None:
+            from twilio.rest.voice.v1.connection_policy import ConnectionPolicyList
             self._connection_policies = ConnectionPolicyList(self)
         return self._connection_policies
 
@@ -66,6 +65,7 @@ class V1(Version):
         :rtype: twilio.rest.voice.v1.dialing_permissions.DialingPermissionsList
         """
         if self._dialing_permissions is None:
+            from twilio.rest.voice.v1.dialing_permissions import DialingPermissionsList
             self._dialing_permissions = DialingPermissionsList(self)
         return self._dialing_permissions
 
@@ -75,6 +75,7 @@ class V1(Version):
         :rtype: twilio.rest.voice.v1.ip_record.IpRecordList
         """
         if self._ip_records is None:
+            from twilio.rest.voice.v1.ip_record import IpRecordList
             self._ip_records = IpRecordList(self)
         return self._ip_records
 
@@ -84,6 +85,7 @@ class V1(Version):
         :rtype: twilio.rest.voice.v1.source_ip_mapping.SourceIpMappingList
         """
         if self._source_ip_mappings is None:
+            from twilio.rest.voice.v1.source_ip_mapping import SourceIpMappingList
             self._source_ip_mappings = SourceIpMappingList(self)
         return self._source_ip_mappings
 
@@ -95,3 +97,24 @@ class V1(Version):
         :rtype: str
         """
         return '<Twilio.Voice.V1>'
+
+
+_LAZY_IMPORTS = {
+    'ArchivedCallList': 'twilio.rest.voice.v1.archived_call',
+    'ByocTrunkList': 'twilio.rest.voice.v1.byoc_trunk',
+    'ConnectionPolicyList': 'twilio.rest.voice.v1.connection_policy',
+    'DialingPermissionsList': 'twilio.rest.voice.v1.dialing_permissions',
+    'IpRecordList': 'twilio.rest.voice.v1.ip_record',
+    'SourceIpMappingList': 'twilio.rest.voice.v1.source_ip_mapping',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -6,7 +6,7 @@ This code was generated by
       /       /
 """
 
-from twilio.base import deserialize
+from twilio.base import deserialize, values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
@@ -124,7 +124,7 @@ class ArchivedCallContext(InstanceContext):
 
         # Path Solution
         self._solution = {'date': date, 'sid': sid, }
-        self._uri = '/Archives/{date}/Calls/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Archives/{date}/Calls/{sid}', self._solution)
 
     def delete(self):
         """
@@ -135,6 +135,15 @@ class ArchivedCallContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the ArchivedCallInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -150,6 +159,20 @@ class ArchivedCallInstance(InstanceResource):
     """ PLEASE NOTE that this class contains beta products that are subject to
     change. Use them with caution. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date': deserialize.iso8601_date,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'date': 'date',
+        'sid': 'sid',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload, date=None, sid=None):
         """
         Initialize the ArchivedCallInstance
@@ -160,11 +183,7 @@ class ArchivedCallInstance(InstanceResource):
         super(ArchivedCallInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'date': deserialize.iso8601_date(payload.get('date')),
-            'sid': payload.get('sid'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -220,6 +239,15 @@ class ArchivedCallInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the ArchivedCallInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
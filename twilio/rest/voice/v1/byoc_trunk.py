@@ -29,14 +29,14 @@ class ByocTrunkList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/ByocTrunks'.format(**self._solution)
+        self._uri = values.ResourceUri('/ByocTrunks', self._solution)
 
     def create(self, friendly_name=values.unset, voice_url=values.unset,
                voice_method=values.unset, voice_fallback_url=values.unset,
                voice_fallback_method=values.unset, status_callback_url=values.unset,
                status_callback_method=values.unset,
                cnam_lookup_enabled=values.unset, connection_policy_sid=values.unset,
-               from_domain_sid=values.unset):
+               from_domain_sid=values.unset, deadline=None):
         """
         Create the ByocTrunkInstance
 
@@ -50,6 +50,8 @@ class ByocTrunkList(ListResource):
         :param bool cnam_lookup_enabled: Whether Caller ID Name (CNAM) lookup is enabled for the trunk
         :param unicode connection_policy_sid: Origination Connection Policy (to your Carrier)
         :param unicode from_domain_sid: The SID of the SIP Domain that should be used in the `From` header of originating calls
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created ByocTrunkInstance
         :rtype: twilio.rest.voice.v1.byoc_trunk.ByocTrunkInstance
@@ -67,11 +69,53 @@ class ByocTrunkList(ListResource):
             'FromDomainSid': from_domain_sid,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return ByocTrunkInstance(self._version, payload, )
 
-    def stream(self, limit=None, page_size=None):
+    async def create_async(self, friendly_name=values.unset, voice_url=values.unset,
+                           voice_method=values.unset, voice_fallback_url=values.unset,
+                           voice_fallback_method=values.unset, status_callback_url=values.unset,
+                           status_callback_method=values.unset,
+                           cnam_lookup_enabled=values.unset, connection_policy_sid=values.unset,
+                           from_domain_sid=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the ByocTrunkInstance
+
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode voice_url: The URL we should call when receiving a call
+        :param unicode voice_method: The HTTP method to use with voice_url
+        :param unicode voice_fallback_url: The URL we should call when an error occurs in executing TwiML
+        :param unicode voice_fallback_method: The HTTP method to use with voice_fallback_url
+        :param unicode status_callback_url: The URL that we should call to pass status updates
+        :param unicode status_callback_method: The HTTP method we should use to call `status_callback_url`
+        :param bool cnam_lookup_enabled: Whether Caller ID Name (CNAM) lookup is enabled for the trunk
+        :param unicode connection_policy_sid: Origination Connection Policy (to your Carrier)
+        :param unicode from_domain_sid: The SID of the SIP Domain that should be used in the `From` header of originating calls
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created ByocTrunkInstance
+        :rtype: twilio.rest.voice.v1.byoc_trunk.ByocTrunkInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'VoiceUrl': voice_url,
+            'VoiceMethod': voice_method,
+            'VoiceFallbackUrl': voice_fallback_url,
+            'VoiceFallbackMethod': voice_fallback_method,
+            'StatusCallbackUrl': status_callback_url,
+            'StatusCallbackMethod': status_callback_method,
+            'CnamLookupEnabled': cnam_lookup_enabled,
+            'ConnectionPolicySid': connection_policy_sid,
+            'FromDomainSid': from_domain_sid,
+        })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return ByocTrunkInstance(self._version, payload, )
+
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams ByocTrunkInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -84,17 +128,57 @@ class ByocTrunkList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.voice.v1.byoc_trunk.ByocTrunkInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams ByocTrunkInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.voice.v1.byoc_trunk.ByocTrunkInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists ByocTrunkInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -106,11 +190,42 @@ class ByocTrunkList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.voice.v1.byoc_trunk.ByocTrunkInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists ByocTrunkInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.voice.v1.byoc_trunk.ByocTrunkInstance]
+        """
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -131,6 +246,25 @@ class ByocTrunkList(ListResource):
 
         return ByocTrunkPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of ByocTrunkInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of ByocTrunkInstance
+        :rtype: twilio.rest.voice.v1.byoc_trunk.ByocTrunkPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return ByocTrunkPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of ByocTrunkInstance records from the API.
@@ -148,6 +282,23 @@ class ByocTrunkList(ListResource):
 
         return ByocTrunkPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of ByocTrunkInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of ByocTrunkInstance
+        :rtype: twilio.rest.voice.v1.byoc_trunk.ByocTrunkPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return ByocTrunkPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a ByocTrunkContext
@@ -234,7 +385,7 @@ class ByocTrunkContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/ByocTrunks/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/ByocTrunks/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -247,6 +398,17 @@ class ByocTrunkContext(InstanceContext):
 
         return ByocTrunkInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ByocTrunkInstance
+
+        :returns: The fetched ByocTrunkInstance
+        :rtype: twilio.rest.voice.v1.byoc_trunk.ByocTrunkInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return ByocTrunkInstance(self._version, payload, sid=self._solution['sid'], )
+
     def update(self, friendly_name=values.unset, voice_url=values.unset,
                voice_method=values.unset, voice_fallback_url=values.unset,
                voice_fallback_method=values.unset, status_callback_url=values.unset,
@@ -287,6 +449,46 @@ class ByocTrunkContext(InstanceContext):
 
         return ByocTrunkInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def update_async(self, friendly_name=values.unset, voice_url=values.unset,
+                           voice_method=values.unset, voice_fallback_url=values.unset,
+                           voice_fallback_method=values.unset, status_callback_url=values.unset,
+                           status_callback_method=values.unset,
+                           cnam_lookup_enabled=values.unset, connection_policy_sid=values.unset,
+                           from_domain_sid=values.unset):
+        """
+        Asynchronous coroutine that updates the ByocTrunkInstance
+
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode voice_url: The URL we should call when receiving a call
+        :param unicode voice_method: The HTTP method we should use with voice_url
+        :param unicode voice_fallback_url: The URL we should call when an error occurs in executing TwiML
+        :param unicode voice_fallback_method: The HTTP method used with voice_fallback_url
+        :param unicode status_callback_url: The URL that we should call to pass status updates
+        :param unicode status_callback_method: The HTTP method we should use to call status_callback_url
+        :param bool cnam_lookup_enabled: Whether Caller ID Name (CNAM) lookup is enabled for the trunk
+        :param unicode connection_policy_sid: Origination Connection Policy (to your Carrier)
+        :param unicode from_domain_sid: The SID of the SIP Domain that should be used in the `From` header of originating calls
+
+        :returns: The updated ByocTrunkInstance
+        :rtype: twilio.rest.voice.v1.byoc_trunk.ByocTrunkInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'VoiceUrl': voice_url,
+            'VoiceMethod': voice_method,
+            'VoiceFallbackUrl': voice_fallback_url,
+            'VoiceFallbackMethod': voice_fallback_method,
+            'StatusCallbackUrl': status_callback_url,
+            'StatusCallbackMethod': status_callback_method,
+            'CnamLookupEnabled': cnam_lookup_enabled,
+            'ConnectionPolicySid': connection_policy_sid,
+            'FromDomainSid': from_domain_sid,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return ByocTrunkInstance(self._version, payload, sid=self._solution['sid'], )
+
     def delete(self):
         """
         Deletes the ByocTrunkInstance
@@ -296,6 +498,15 @@ class ByocTrunkContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the ByocTrunkInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -309,6 +520,33 @@ class ByocTrunkContext(InstanceContext):
 
 class ByocTrunkInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'sid': 'sid',
+        'friendly_name': 'friendly_name',
+        'voice_url': 'voice_url',
+        'voice_method': 'voice_method',
+        'voice_fallback_url': 'voice_fallback_url',
+        'voice_fallback_method': 'voice_fallback_method',
+        'status_callback_url': 'status_callback_url',
+        'status_callback_method': 'status_callback_method',
+        'cnam_lookup_enabled': 'cnam_lookup_enabled',
+        'connection_policy_sid': 'connection_policy_sid',
+        'from_domain_sid': 'from_domain_sid',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the ByocTrunkInstance
@@ -319,23 +557,7 @@ class ByocTrunkInstance(InstanceResource):
         super(ByocTrunkInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'sid': payload.get('sid'),
-            'friendly_name': payload.get('friendly_name'),
-            'voice_url': payload.get('voice_url'),
-            'voice_method': payload.get('voice_method'),
-            'voice_fallback_url': payload.get('voice_fallback_url'),
-            'voice_fallback_method': payload.get('voice_fallback_method'),
-            'status_callback_url': payload.get('status_callback_url'),
-            'status_callback_method': payload.get('status_callback_method'),
-            'cnam_lookup_enabled': payload.get('cnam_lookup_enabled'),
-            'connection_policy_sid': payload.get('connection_policy_sid'),
-            'from_domain_sid': payload.get('from_domain_sid'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -483,6 +705,15 @@ class ByocTrunkInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ByocTrunkInstance
+
+        :returns: The fetched ByocTrunkInstance
+        :rtype: twilio.rest.voice.v1.byoc_trunk.ByocTrunkInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, friendly_name=values.unset, voice_url=values.unset,
                voice_method=values.unset, voice_fallback_url=values.unset,
                voice_fallback_method=values.unset, status_callback_url=values.unset,
@@ -519,6 +750,42 @@ class ByocTrunkInstance(InstanceResource):
             from_domain_sid=from_domain_sid,
         )
 
+    async def update_async(self, friendly_name=values.unset, voice_url=values.unset,
+                           voice_method=values.unset, voice_fallback_url=values.unset,
+                           voice_fallback_method=values.unset, status_callback_url=values.unset,
+                           status_callback_method=values.unset,
+                           cnam_lookup_enabled=values.unset, connection_policy_sid=values.unset,
+                           from_domain_sid=values.unset):
+        """
+        Asynchronous coroutine that updates the ByocTrunkInstance
+
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode voice_url: The URL we should call when receiving a call
+        :param unicode voice_method: The HTTP method we should use with voice_url
+        :param unicode voice_fallback_url: The URL we should call when an error occurs in executing TwiML
+        :param unicode voice_fallback_method: The HTTP method used with voice_fallback_url
+        :param unicode status_callback_url: The URL that we should call to pass status updates
+        :param unicode status_callback_method: The HTTP method we should use to call status_callback_url
+        :param bool cnam_lookup_enabled: Whether Caller ID Name (CNAM) lookup is enabled for the trunk
+        :param unicode connection_policy_sid: Origination Connection Policy (to your Carrier)
+        :param unicode from_domain_sid: The SID of the SIP Domain that should be used in the `From` header of originating calls
+
+        :returns: The updated ByocTrunkInstance
+        :rtype: twilio.rest.voice.v1.byoc_trunk.ByocTrunkInstance
+        """
+        return await self._proxy.update_async(
+            friendly_name=friendly_name,
+            voice_url=voice_url,
+            voice_method=voice_method,
+            voice_fallback_url=voice_fallback_url,
+            voice_fallback_method=voice_fallback_method,
+            status_callback_url=status_callback_url,
+            status_callback_method=status_callback_method,
+            cnam_lookup_enabled=cnam_lookup_enabled,
+            connection_policy_sid=connection_policy_sid,
+            from_domain_sid=from_domain_sid,
+        )
+
     def delete(self):
         """
         Deletes the ByocTrunkInstance
@@ -528,6 +795,15 @@ class ByocTrunkInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the ByocTrunkInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
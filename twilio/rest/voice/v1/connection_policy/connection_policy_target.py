@@ -30,10 +30,10 @@ class ConnectionPolicyTargetList(ListResource):
 
         # Path Solution
         self._solution = {'connection_policy_sid': connection_policy_sid, }
-        self._uri = '/ConnectionPolicies/{connection_policy_sid}/Targets'.format(**self._solution)
+        self._uri = values.ResourceUri('/ConnectionPolicies/{connection_policy_sid}/Targets', self._solution)
 
     def create(self, target, friendly_name=values.unset, priority=values.unset,
-               weight=values.unset, enabled=values.unset):
+               weight=values.unset, enabled=values.unset, deadline=None):
         """
         Create the ConnectionPolicyTargetInstance
 
@@ -42,6 +42,8 @@ class ConnectionPolicyTargetList(ListResource):
         :param unicode priority: The relative importance of the target
         :param unicode weight: The value that determines the relative load the Target should receive compared to others with the same priority
         :param bool enabled: Whether the Target is enabled
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created ConnectionPolicyTargetInstance
         :rtype: twilio.rest.voice.v1.connection_policy.connection_policy_target.ConnectionPolicyTargetInstance
@@ -54,7 +56,7 @@ class ConnectionPolicyTargetList(ListResource):
             'Enabled': enabled,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return ConnectionPolicyTargetInstance(
             self._version,
@@ -62,7 +64,39 @@ class ConnectionPolicyTargetList(ListResource):
             connection_policy_sid=self._solution['connection_policy_sid'],
         )
 
-    def stream(self, limit=None, page_size=None):
+    async def create_async(self, target, friendly_name=values.unset, priority=values.unset,
+                           weight=values.unset, enabled=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the ConnectionPolicyTargetInstance
+
+        :param unicode target: The SIP address you want Twilio to route your calls to
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode priority: The relative importance of the target
+        :param unicode weight: The value that determines the relative load the Target should receive compared to others with the same priority
+        :param bool enabled: Whether the Target is enabled
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created ConnectionPolicyTargetInstance
+        :rtype: twilio.rest.voice.v1.connection_policy.connection_policy_target.ConnectionPolicyTargetInstance
+        """
+        data = values.of({
+            'Target': target,
+            'FriendlyName': friendly_name,
+            'Priority': priority,
+            'Weight': weight,
+            'Enabled': enabled,
+        })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return ConnectionPolicyTargetInstance(
+            self._version,
+            payload,
+            connection_policy_sid=self._solution['connection_policy_sid'],
+        )
+
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams ConnectionPolicyTargetInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -75,17 +109,57 @@ class ConnectionPolicyTargetList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.voice.v1.connection_policy.connection_policy_target.ConnectionPolicyTargetInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams ConnectionPolicyTargetInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.voice.v1.connection_policy.connection_policy_target.ConnectionPolicyTargetInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists ConnectionPolicyTargetInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -97,11 +171,42 @@ class ConnectionPolicyTargetList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.voice.v1.connection_policy.connection_policy_target.ConnectionPolicyTargetInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists ConnectionPolicyTargetInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.voice.v1.connection_policy.connection_policy_target.ConnectionPolicyTargetInstance]
+        """
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -122,6 +227,25 @@ class ConnectionPolicyTargetList(ListResource):
 
         return ConnectionPolicyTargetPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of ConnectionPolicyTargetInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of ConnectionPolicyTargetInstance
+        :rtype: twilio.rest.voice.v1.connection_policy.connection_policy_target.ConnectionPolicyTargetPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return ConnectionPolicyTargetPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of ConnectionPolicyTargetInstance records from the API.
@@ -139,6 +263,23 @@ class ConnectionPolicyTargetList(ListResource):
 
         return ConnectionPolicyTargetPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of ConnectionPolicyTargetInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of ConnectionPolicyTargetInstance
+        :rtype: twilio.rest.voice.v1.connection_policy.connection_policy_target.ConnectionPolicyTargetPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return ConnectionPolicyTargetPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a ConnectionPolicyTargetContext
@@ -239,7 +380,7 @@ class ConnectionPolicyTargetContext(InstanceContext):
 
         # Path Solution
         self._solution = {'connection_policy_sid': connection_policy_sid, 'sid': sid, }
-        self._uri = '/ConnectionPolicies/{connection_policy_sid}/Targets/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/ConnectionPolicies/{connection_policy_sid}/Targets/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -257,6 +398,22 @@ class ConnectionPolicyTargetContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ConnectionPolicyTargetInstance
+
+        :returns: The fetched ConnectionPolicyTargetInstance
+        :rtype: twilio.rest.voice.v1.connection_policy.connection_policy_target.ConnectionPolicyTargetInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return ConnectionPolicyTargetInstance(
+            self._version,
+            payload,
+            connection_policy_sid=self._solution['connection_policy_sid'],
+            sid=self._solution['sid'],
+        )
+
     def update(self, friendly_name=values.unset, target=values.unset,
                priority=values.unset, weight=values.unset, enabled=values.unset):
         """
@@ -288,6 +445,37 @@ class ConnectionPolicyTargetContext(InstanceContext):
             sid=self._solution['sid'],
         )
 
+    async def update_async(self, friendly_name=values.unset, target=values.unset,
+                           priority=values.unset, weight=values.unset, enabled=values.unset):
+        """
+        Asynchronous coroutine that updates the ConnectionPolicyTargetInstance
+
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode target: The SIP address you want Twilio to route your calls to
+        :param unicode priority: The relative importance of the target
+        :param unicode weight: The value that determines the relative load the Target should receive compared to others with the same priority
+        :param bool enabled: Whether the Target is enabled
+
+        :returns: The updated ConnectionPolicyTargetInstance
+        :rtype: twilio.rest.voice.v1.connection_policy.connection_policy_target.ConnectionPolicyTargetInstance
+        """
+        data = values.of({
+            'FriendlyName': friendly_name,
+            'Target': target,
+            'Priority': priority,
+            'Weight': weight,
+            'Enabled': enabled,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return ConnectionPolicyTargetInstance(
+            self._version,
+            payload,
+            connection_policy_sid=self._solution['connection_policy_sid'],
+            sid=self._solution['sid'],
+        )
+
     def delete(self):
         """
         Deletes the ConnectionPolicyTargetInstance
@@ -297,6 +485,15 @@ class ConnectionPolicyTargetContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the ConnectionPolicyTargetInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -310,6 +507,31 @@ class ConnectionPolicyTargetContext(InstanceContext):
 
 class ConnectionPolicyTargetInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'priority': deserialize.integer,
+        'weight': deserialize.integer,
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'connection_policy_sid': 'connection_policy_sid',
+        'sid': 'sid',
+        'friendly_name': 'friendly_name',
+        'target': 'target',
+        'priority': 'priority',
+        'weight': 'weight',
+        'enabled': 'enabled',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload, connection_policy_sid, sid=None):
         """
         Initialize the ConnectionPolicyTargetInstance
@@ -320,19 +542,7 @@ class ConnectionPolicyTargetInstance(InstanceResource):
         super(ConnectionPolicyTargetInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'connection_policy_sid': payload.get('connection_policy_sid'),
-            'sid': payload.get('sid'),
-            'friendly_name': payload.get('friendly_name'),
-            'target': payload.get('target'),
-            'priority': deserialize.integer(payload.get('priority')),
-            'weight': deserialize.integer(payload.get('weight')),
-            'enabled': payload.get('enabled'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -455,6 +665,15 @@ class ConnectionPolicyTargetInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the ConnectionPolicyTargetInstance
+
+        :returns: The fetched ConnectionPolicyTargetInstance
+        :rtype: twilio.rest.voice.v1.connection_policy.connection_policy_target.ConnectionPolicyTargetInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, friendly_name=values.unset, target=values.unset,
                priority=values.unset, weight=values.unset, enabled=values.unset):
         """
@@ -477,6 +696,28 @@ class ConnectionPolicyTargetInstance(InstanceResource):
             enabled=enabled,
         )
 
+    async def update_async(self, friendly_name=values.unset, target=values.unset,
+                           priority=values.unset, weight=values.unset, enabled=values.unset):
+        """
+        Asynchronous coroutine that updates the ConnectionPolicyTargetInstance
+
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode target: The SIP address you want Twilio to route your calls to
+        :param unicode priority: The relative importance of the target
+        :param unicode weight: The value that determines the relative load the Target should receive compared to others with the same priority
+        :param bool enabled: Whether the Target is enabled
+
+        :returns: The updated ConnectionPolicyTargetInstance
+        :rtype: twilio.rest.voice.v1.connection_policy.connection_policy_target.ConnectionPolicyTargetInstance
+        """
+        return await self._proxy.update_async(
+            friendly_name=friendly_name,
+            target=target,
+            priority=priority,
+            weight=weight,
+            enabled=enabled,
+        )
+
     def delete(self):
         """
         Deletes the ConnectionPolicyTargetInstance
@@ -486,6 +727,15 @@ class ConnectionPolicyTargetInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the ConnectionPolicyTargetInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
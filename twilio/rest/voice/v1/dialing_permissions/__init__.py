@@ -6,12 +6,11 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.voice.v1.dialing_permissions.bulk_country_update import BulkCountryUpdateList
-from twilio.rest.voice.v1.dialing_permissions.country import CountryList
-from twilio.rest.voice.v1.dialing_permissions.settings import SettingsList
 
 
 class DialingPermissionsList(ListResource):
@@ -47,6 +46,7 @@ class DialingPermissionsList(ListResource):
         :rtype: twilio.rest.voice.v1.dialing_permissions.country.CountryList
         """
         if self._countries is None:
+            from twilio.rest.voice.v1.dialing_permissions.country import CountryList
             self._countries = CountryList(self._version, )
         return self._countries
 
@@ -59,6 +59,7 @@ class DialingPermissionsList(ListResource):
         :rtype: twilio.rest.voice.v1.dialing_permissions.settings.SettingsList
         """
         if self._settings is None:
+            from twilio.rest.voice.v1.dialing_permissions.settings import SettingsList
             self._settings = SettingsList(self._version, )
         return self._settings
 
@@ -71,6 +72,7 @@ class DialingPermissionsList(ListResource):
         :rtype: twilio.rest.voice.v1.dialing_permissions.bulk_country_update.BulkCountryUpdateList
         """
         if self._bulk_country_updates is None:
+            from twilio.rest.voice.v1.dialing_permissions.bulk_country_update import BulkCountryUpdateList
             self._bulk_country_updates = BulkCountryUpdateList(self._version, )
         return self._bulk_country_updates
 
@@ -130,6 +132,8 @@ class DialingPermissionsInstance(InstanceResource):
     to change. Use them with caution. If you currently do not have developer
     preview access, please contact help@twilio.com. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
     def __init__(self, version, payload):
         """
         Initialize the DialingPermissionsInstance
@@ -151,3 +155,21 @@ class DialingPermissionsInstance(InstanceResource):
         :rtype: str
         """
         return '<Twilio.Voice.V1.DialingPermissionsInstance>'
+
+
+_LAZY_IMPORTS = {
+    'BulkCountryUpdateList': 'twilio.rest.voice.v1.dialing_permissions.bulk_country_update',
+    'CountryList': 'twilio.rest.voice.v1.dialing_permissions.country',
+    'SettingsList': 'twilio.rest.voice.v1.dialing_permissions.settings',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -31,20 +31,39 @@ class BulkCountryUpdateList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/DialingPermissions/BulkCountryUpdates'.format(**self._solution)
+        self._uri = values.ResourceUri('/DialingPermissions/BulkCountryUpdates', self._solution)
 
-    def create(self, update_request):
+    def create(self, update_request, deadline=None):
         """
         Create the BulkCountryUpdateInstance
 
         :param unicode update_request: URL encoded JSON array of update objects
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created BulkCountryUpdateInstance
         :rtype: twilio.rest.voice.v1.dialing_permissions.bulk_country_update.BulkCountryUpdateInstance
         """
         data = values.of({'UpdateRequest': update_request, })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return BulkCountryUpdateInstance(self._version, payload, )
+
+    async def create_async(self, update_request, deadline=None):
+        """
+        Asynchronous coroutine that creates the BulkCountryUpdateInstance
+
+        :param unicode update_request: URL encoded JSON array of update objects
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created BulkCountryUpdateInstance
+        :rtype: twilio.rest.voice.v1.dialing_permissions.bulk_country_update.BulkCountryUpdateInstance
+        """
+        data = values.of({'UpdateRequest': update_request, })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return BulkCountryUpdateInstance(self._version, payload, )
 
@@ -104,6 +123,19 @@ class BulkCountryUpdateInstance(InstanceResource):
     to change. Use them with caution. If you currently do not have developer
     preview access, please contact help@twilio.com. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'update_count': deserialize.integer,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'update_count': 'update_count',
+        'update_request': 'update_request',
+    }, _deserializers)
+
     def __init__(self, version, payload):
         """
         Initialize the BulkCountryUpdateInstance
@@ -114,10 +146,7 @@ class BulkCountryUpdateInstance(InstanceResource):
         super(BulkCountryUpdateInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'update_count': deserialize.integer(payload.get('update_count')),
-            'update_request': payload.get('update_request'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
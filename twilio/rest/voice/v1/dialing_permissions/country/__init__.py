@@ -6,12 +6,14 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.voice.v1.dialing_permissions.country.highrisk_special_prefix import HighriskSpecialPrefixList
 
 
 class CountryList(ListResource):
@@ -32,13 +34,13 @@ class CountryList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/DialingPermissions/Countries'.format(**self._solution)
+        self._uri = values.ResourceUri('/DialingPermissions/Countries', self._solution)
 
     def stream(self, iso_code=values.unset, continent=values.unset,
                country_code=values.unset, low_risk_numbers_enabled=values.unset,
                high_risk_special_numbers_enabled=values.unset,
                high_risk_tollfraud_numbers_enabled=values.unset, limit=None,
-               page_size=None):
+               page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams CountryInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -57,29 +59,86 @@ class CountryList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.voice.v1.dialing_permissions.country.CountryInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
-            iso_code=iso_code,
-            continent=continent,
-            country_code=country_code,
-            low_risk_numbers_enabled=low_risk_numbers_enabled,
-            high_risk_special_numbers_enabled=high_risk_special_numbers_enabled,
-            high_risk_tollfraud_numbers_enabled=high_risk_tollfraud_numbers_enabled,
-            page_size=limits['page_size'],
-        )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                iso_code=iso_code,
+                continent=continent,
+                country_code=country_code,
+                low_risk_numbers_enabled=low_risk_numbers_enabled,
+                high_risk_special_numbers_enabled=high_risk_special_numbers_enabled,
+                high_risk_tollfraud_numbers_enabled=high_risk_tollfraud_numbers_enabled,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, iso_code=values.unset, continent=values.unset,
+                           country_code=values.unset, low_risk_numbers_enabled=values.unset,
+                           high_risk_special_numbers_enabled=values.unset,
+                           high_risk_tollfraud_numbers_enabled=values.unset, limit=None,
+                           page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams CountryInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param unicode iso_code: Filter to retrieve the country permissions by specifying the ISO country code
+        :param unicode continent: Filter to retrieve the country permissions by specifying the continent
+        :param unicode country_code: Country code filter
+        :param bool low_risk_numbers_enabled: Filter to retrieve the country permissions with dialing to low-risk numbers enabled
+        :param bool high_risk_special_numbers_enabled: Filter to retrieve the country permissions with dialing to high-risk special service numbers enabled
+        :param bool high_risk_tollfraud_numbers_enabled: Filter to retrieve the country permissions with dialing to high-risk toll fraud numbers enabled
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.voice.v1.dialing_permissions.country.CountryInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                iso_code=iso_code,
+                continent=continent,
+                country_code=country_code,
+                low_risk_numbers_enabled=low_risk_numbers_enabled,
+                high_risk_special_numbers_enabled=high_risk_special_numbers_enabled,
+                high_risk_tollfraud_numbers_enabled=high_risk_tollfraud_numbers_enabled,
+                page_size=limits['page_size'],
+            )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, iso_code=values.unset, continent=values.unset,
              country_code=values.unset, low_risk_numbers_enabled=values.unset,
              high_risk_special_numbers_enabled=values.unset,
              high_risk_tollfraud_numbers_enabled=values.unset, limit=None,
-             page_size=None):
+             page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists CountryInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -97,6 +156,12 @@ class CountryList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.voice.v1.dialing_permissions.country.CountryInstance]
@@ -110,8 +175,57 @@ class CountryList(ListResource):
             high_risk_tollfraud_numbers_enabled=high_risk_tollfraud_numbers_enabled,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, iso_code=values.unset, continent=values.unset,
+                         country_code=values.unset, low_risk_numbers_enabled=values.unset,
+                         high_risk_special_numbers_enabled=values.unset,
+                         high_risk_tollfraud_numbers_enabled=values.unset, limit=None,
+                         page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists CountryInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param unicode iso_code: Filter to retrieve the country permissions by specifying the ISO country code
+        :param unicode continent: Filter to retrieve the country permissions by specifying the continent
+        :param unicode country_code: Country code filter
+        :param bool low_risk_numbers_enabled: Filter to retrieve the country permissions with dialing to low-risk numbers enabled
+        :param bool high_risk_special_numbers_enabled: Filter to retrieve the country permissions with dialing to high-risk special service numbers enabled
+        :param bool high_risk_tollfraud_numbers_enabled: Filter to retrieve the country permissions with dialing to high-risk toll fraud numbers enabled
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.voice.v1.dialing_permissions.country.CountryInstance]
+        """
+        return [record async for record in await self.stream_async(
+            iso_code=iso_code,
+            continent=continent,
+            country_code=country_code,
+            low_risk_numbers_enabled=low_risk_numbers_enabled,
+            high_risk_special_numbers_enabled=high_risk_special_numbers_enabled,
+            high_risk_tollfraud_numbers_enabled=high_risk_tollfraud_numbers_enabled,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, iso_code=values.unset, continent=values.unset,
              country_code=values.unset, low_risk_numbers_enabled=values.unset,
              high_risk_special_numbers_enabled=values.unset,
@@ -151,6 +265,45 @@ class CountryList(ListResource):
 
         return CountryPage(self._version, response, self._solution)
 
+    async def page_async(self, iso_code=values.unset, continent=values.unset,
+                         country_code=values.unset, low_risk_numbers_enabled=values.unset,
+                         high_risk_special_numbers_enabled=values.unset,
+                         high_risk_tollfraud_numbers_enabled=values.unset,
+                         page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of CountryInstance records from the API.
+        Request is executed immediately
+
+        :param unicode iso_code: Filter to retrieve the country permissions by specifying the ISO country code
+        :param unicode continent: Filter to retrieve the country permissions by specifying the continent
+        :param unicode country_code: Country code filter
+        :param bool low_risk_numbers_enabled: Filter to retrieve the country permissions with dialing to low-risk numbers enabled
+        :param bool high_risk_special_numbers_enabled: Filter to retrieve the country permissions with dialing to high-risk special service numbers enabled
+        :param bool high_risk_tollfraud_numbers_enabled: Filter to retrieve the country permissions with dialing to high-risk toll fraud numbers enabled
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of CountryInstance
+        :rtype: twilio.rest.voice.v1.dialing_permissions.country.CountryPage
+        """
+        data = values.of({
+            'IsoCode': iso_code,
+            'Continent': continent,
+            'CountryCode': country_code,
+            'LowRiskNumbersEnabled': low_risk_numbers_enabled,
+            'HighRiskSpecialNumbersEnabled': high_risk_special_numbers_enabled,
+            'HighRiskTollfraudNumbersEnabled': high_risk_tollfraud_numbers_enabled,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return CountryPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of CountryInstance records from the API.
@@ -168,6 +321,23 @@ class CountryList(ListResource):
 
         return CountryPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of CountryInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of CountryInstance
+        :rtype: twilio.rest.voice.v1.dialing_permissions.country.CountryPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return CountryPage(self._version, response, self._solution)
+
     def get(self, iso_code):
         """
         Constructs a CountryContext
@@ -260,7 +430,7 @@ class CountryContext(InstanceContext):
 
         # Path Solution
         self._solution = {'iso_code': iso_code, }
-        self._uri = '/DialingPermissions/Countries/{iso_code}'.format(**self._solution)
+        self._uri = values.ResourceUri('/DialingPermissions/Countries/{iso_code}', self._solution)
 
         # Dependents
         self._highrisk_special_prefixes = None
@@ -276,6 +446,17 @@ class CountryContext(InstanceContext):
 
         return CountryInstance(self._version, payload, iso_code=self._solution['iso_code'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the CountryInstance
+
+        :returns: The fetched CountryInstance
+        :rtype: twilio.rest.voice.v1.dialing_permissions.country.CountryInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return CountryInstance(self._version, payload, iso_code=self._solution['iso_code'], )
+
     @property
     def highrisk_special_prefixes(self):
         """
@@ -285,6 +466,7 @@ class CountryContext(InstanceContext):
         :rtype: twilio.rest.voice.v1.dialing_permissions.country.highrisk_special_prefix.HighriskSpecialPrefixList
         """
         if self._highrisk_special_prefixes is None:
+            from twilio.rest.voice.v1.dialing_permissions.country.highrisk_special_prefix import HighriskSpecialPrefixList
             self._highrisk_special_prefixes = HighriskSpecialPrefixList(
                 self._version,
                 iso_code=self._solution['iso_code'],
@@ -307,6 +489,21 @@ class CountryInstance(InstanceResource):
     to change. Use them with caution. If you currently do not have developer
     preview access, please contact help@twilio.com. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'iso_code': 'iso_code',
+        'name': 'name',
+        'continent': 'continent',
+        'country_codes': 'country_codes',
+        'low_risk_numbers_enabled': 'low_risk_numbers_enabled',
+        'high_risk_special_numbers_enabled': 'high_risk_special_numbers_enabled',
+        'high_risk_tollfraud_numbers_enabled': 'high_risk_tollfraud_numbers_enabled',
+        'url': 'url',
+        'links': 'links',
+    })
+
     def __init__(self, version, payload, iso_code=None):
         """
         Initialize the CountryInstance
@@ -317,17 +514,7 @@ class CountryInstance(InstanceResource):
         super(CountryInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'iso_code': payload.get('iso_code'),
-            'name': payload.get('name'),
-            'continent': payload.get('continent'),
-            'country_codes': payload.get('country_codes'),
-            'low_risk_numbers_enabled': payload.get('low_risk_numbers_enabled'),
-            'high_risk_special_numbers_enabled': payload.get('high_risk_special_numbers_enabled'),
-            'high_risk_tollfraud_numbers_enabled': payload.get('high_risk_tollfraud_numbers_enabled'),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -427,6 +614,15 @@ class CountryInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the CountryInstance
+
+        :returns: The fetched CountryInstance
+        :rtype: twilio.rest.voice.v1.dialing_permissions.country.CountryInstance
+        """
+        return await self._proxy.fetch_async()
+
     @property
     def highrisk_special_prefixes(self):
         """
@@ -446,3 +642,19 @@ class CountryInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Voice.V1.CountryInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'HighriskSpecialPrefixList': 'twilio.rest.voice.v1.dialing_permissions.country.highrisk_special_prefix',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
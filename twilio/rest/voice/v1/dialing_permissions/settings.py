@@ -6,6 +6,7 @@ This code was generated by
       /       /
 """
 
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
@@ -119,7 +120,7 @@ class SettingsContext(InstanceContext):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Settings'.format(**self._solution)
+        self._uri = values.ResourceUri('/Settings', self._solution)
 
     def fetch(self):
         """
@@ -132,6 +133,17 @@ class SettingsContext(InstanceContext):
 
         return SettingsInstance(self._version, payload, )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the SettingsInstance
+
+        :returns: The fetched SettingsInstance
+        :rtype: twilio.rest.voice.v1.dialing_permissions.settings.SettingsInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return SettingsInstance(self._version, payload, )
+
     def update(self, dialing_permissions_inheritance=values.unset):
         """
         Update the SettingsInstance
@@ -147,6 +159,21 @@ class SettingsContext(InstanceContext):
 
         return SettingsInstance(self._version, payload, )
 
+    async def update_async(self, dialing_permissions_inheritance=values.unset):
+        """
+        Asynchronous coroutine that updates the SettingsInstance
+
+        :param bool dialing_permissions_inheritance: `true` for the sub-account to inherit voice dialing permissions from the Master Project; otherwise `false`
+
+        :returns: The updated SettingsInstance
+        :rtype: twilio.rest.voice.v1.dialing_permissions.settings.SettingsInstance
+        """
+        data = values.of({'DialingPermissionsInheritance': dialing_permissions_inheritance, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return SettingsInstance(self._version, payload, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -163,6 +190,14 @@ class SettingsInstance(InstanceResource):
     to change. Use them with caution. If you currently do not have developer
     preview access, please contact help@twilio.com. """
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'dialing_permissions_inheritance': 'dialing_permissions_inheritance',
+        'url': 'url',
+    })
+
     def __init__(self, version, payload):
         """
         Initialize the SettingsInstance
@@ -173,10 +208,7 @@ class SettingsInstance(InstanceResource):
         super(SettingsInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'dialing_permissions_inheritance': payload.get('dialing_permissions_inheritance'),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -220,6 +252,15 @@ class SettingsInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the SettingsInstance
+
+        :returns: The fetched SettingsInstance
+        :rtype: twilio.rest.voice.v1.dialing_permissions.settings.SettingsInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, dialing_permissions_inheritance=values.unset):
         """
         Update the SettingsInstance
@@ -231,6 +272,17 @@ class SettingsInstance(InstanceResource):
         """
         return self._proxy.update(dialing_permissions_inheritance=dialing_permissions_inheritance, )
 
+    async def update_async(self, dialing_permissions_inheritance=values.unset):
+        """
+        Asynchronous coroutine that updates the SettingsInstance
+
+        :param bool dialing_permissions_inheritance: `true` for the sub-account to inherit voice dialing permissions from the Master Project; otherwise `false`
+
+        :returns: The updated SettingsInstance
+        :rtype: twilio.rest.voice.v1.dialing_permissions.settings.SettingsInstance
+        """
+        return await self._proxy.update_async(dialing_permissions_inheritance=dialing_permissions_inheritance, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -29,16 +29,18 @@ class IpRecordList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/IpRecords'.format(**self._solution)
+        self._uri = values.ResourceUri('/IpRecords', self._solution)
 
     def create(self, ip_address, friendly_name=values.unset,
-               cidr_prefix_length=values.unset):
+               cidr_prefix_length=values.unset, deadline=None):
         """
         Create the IpRecordInstance
 
         :param unicode ip_address: An IP address in dotted decimal notation, IPv4 only.
         :param unicode friendly_name: A string to describe the resource
         :param unicode cidr_prefix_length: An integer representing the length of the `CIDR <https://tools.ietf.org/html/rfc4632>`_ prefix to use with this IP address. By default the entire IP address is used, which for IPv4 is value 32.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created IpRecordInstance
         :rtype: twilio.rest.voice.v1.ip_record.IpRecordInstance
@@ -49,11 +51,35 @@ class IpRecordList(ListResource):
             'CidrPrefixLength': cidr_prefix_length,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return IpRecordInstance(self._version, payload, )
 
-    def stream(self, limit=None, page_size=None):
+    async def create_async(self, ip_address, friendly_name=values.unset,
+                           cidr_prefix_length=values.unset, deadline=None):
+        """
+        Asynchronous coroutine that creates the IpRecordInstance
+
+        :param unicode ip_address: An IP address in dotted decimal notation, IPv4 only.
+        :param unicode friendly_name: A string to describe the resource
+        :param unicode cidr_prefix_length: An integer representing the length of the `CIDR <https://tools.ietf.org/html/rfc4632>`_ prefix to use with this IP address. By default the entire IP address is used, which for IPv4 is value 32.
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created IpRecordInstance
+        :rtype: twilio.rest.voice.v1.ip_record.IpRecordInstance
+        """
+        data = values.of({
+            'IpAddress': ip_address,
+            'FriendlyName': friendly_name,
+            'CidrPrefixLength': cidr_prefix_length,
+        })
+
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return IpRecordInstance(self._version, payload, )
+
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams IpRecordInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -66,17 +92,57 @@ class IpRecordList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.voice.v1.ip_record.IpRecordInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams IpRecordInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
 
-    def list(self, limit=None, page_size=None):
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.voice.v1.ip_record.IpRecordInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists IpRecordInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -88,11 +154,42 @@ class IpRecordList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.voice.v1.ip_record.IpRecordInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists IpRecordInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.voice.v1.ip_record.IpRecordInstance]
+        """
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -113,6 +210,25 @@ class IpRecordList(ListResource):
 
         return IpRecordPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of IpRecordInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of IpRecordInstance
+        :rtype: twilio.rest.voice.v1.ip_record.IpRecordPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return IpRecordPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of IpRecordInstance records from the API.
@@ -130,6 +246,23 @@ class IpRecordList(ListResource):
 
         return IpRecordPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of IpRecordInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of IpRecordInstance
+        :rtype: twilio.rest.voice.v1.ip_record.IpRecordPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return IpRecordPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a IpRecordContext
@@ -216,7 +349,7 @@ class IpRecordContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/IpRecords/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/IpRecords/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -229,6 +362,17 @@ class IpRecordContext(InstanceContext):
 
         return IpRecordInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the IpRecordInstance
+
+        :returns: The fetched IpRecordInstance
+        :rtype: twilio.rest.voice.v1.ip_record.IpRecordInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return IpRecordInstance(self._version, payload, sid=self._solution['sid'], )
+
     def update(self, friendly_name=values.unset):
         """
         Update the IpRecordInstance
@@ -244,6 +388,21 @@ class IpRecordContext(InstanceContext):
 
         return IpRecordInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def update_async(self, friendly_name=values.unset):
+        """
+        Asynchronous coroutine that updates the IpRecordInstance
+
+        :param unicode friendly_name: A string to describe the resource
+
+        :returns: The updated IpRecordInstance
+        :rtype: twilio.rest.voice.v1.ip_record.IpRecordInstance
+        """
+        data = values.of({'FriendlyName': friendly_name, })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return IpRecordInstance(self._version, payload, sid=self._solution['sid'], )
+
     def delete(self):
         """
         Deletes the IpRecordInstance
@@ -253,6 +412,15 @@ class IpRecordContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the IpRecordInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -266,6 +434,27 @@ class IpRecordContext(InstanceContext):
 
 class IpRecordInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'cidr_prefix_length': deserialize.integer,
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'sid': 'sid',
+        'friendly_name': 'friendly_name',
+        'ip_address': 'ip_address',
+        'cidr_prefix_length': 'cidr_prefix_length',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the IpRecordInstance
@@ -276,16 +465,7 @@ class IpRecordInstance(InstanceResource):
         super(IpRecordInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'sid': payload.get('sid'),
-            'friendly_name': payload.get('friendly_name'),
-            'ip_address': payload.get('ip_address'),
-            'cidr_prefix_length': deserialize.integer(payload.get('cidr_prefix_length')),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -377,6 +557,15 @@ class IpRecordInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the IpRecordInstance
+
+        :returns: The fetched IpRecordInstance
+        :rtype: twilio.rest.voice.v1.ip_record.IpRecordInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, friendly_name=values.unset):
         """
         Update the IpRecordInstance
@@ -388,6 +577,17 @@ class IpRecordInstance(InstanceResource):
         """
         return self._proxy.update(friendly_name=friendly_name, )
 
+    async def update_async(self, friendly_name=values.unset):
+        """
+        Asynchronous coroutine that updates the IpRecordInstance
+
+        :param unicode friendly_name: A string to describe the resource
+
+        :returns: The updated IpRecordInstance
+        :rtype: twilio.rest.voice.v1.ip_record.IpRecordInstance
+        """
+        return await self._proxy.update_async(friendly_name=friendly_name, )
+
     def delete(self):
         """
         Deletes the IpRecordInstance
@@ -397,6 +597,15 @@ class IpRecordInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the IpRecordInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
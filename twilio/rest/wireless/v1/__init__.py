@@ -6,11 +6,9 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base.version import Version
-from twilio.rest.wireless.v1.command import CommandList
-from twilio.rest.wireless.v1.rate_plan import RatePlanList
-from twilio.rest.wireless.v1.sim import SimList
-from twilio.rest.wireless.v1.usage_record import UsageRecordList
 
 
 class V1(Version):
@@ -35,6 +33,7 @@ class V1(Version):
         :rtype: twilio.rest.wireless.v1.usage_record.UsageRecordList
         """
         if self._usage_records is None:
+            from twilio.rest.wireless.v1.usage_record import UsageRecordList
             self._usage_records = UsageRecordList(self)
         return self._usage_records
 
@@ -44,6 +43,7 @@ class V1(Version):
         :rtype: twilio.rest.wireless.v1.command.CommandList
         """
         if self._commands is None:
+            from twilio.rest.wireless.v1.command import CommandList
             self._commands = CommandList(self)
         return self._commands
 
@@ -53,6 +53,7 @@ class V1(Version):
         :rtype: twilio.rest.wireless.v1.rate_plan.RatePlanList
         """
         if self._rate_plans is None:
+            from twilio.rest.wireless.v1.rate_plan import RatePlanList
             self._rate_plans = RatePlanList(self)
         return self._rate_plans
 
@@ -62,6 +63,7 @@ class V1(Version):
         :rtype: twilio.rest.wireless.v1.sim.SimList
         """
         if self._sims is None:
+            from twilio.rest.wireless.v1.sim import SimList
             self._sims = SimList(self)
         return self._sims
 
@@ -73,3 +75,22 @@ class V1(Version):
         :rtype: str
         """
         return '<Twilio.Wireless.V1>'
+
+
+_LAZY_IMPORTS = {
+    'CommandList': 'twilio.rest.wireless.v1.command',
+    'RatePlanList': 'twilio.rest.wireless.v1.rate_plan',
+    'SimList': 'twilio.rest.wireless.v1.sim',
+    'UsageRecordList': 'twilio.rest.wireless.v1.usage_record',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
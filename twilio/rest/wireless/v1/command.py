@@ -29,10 +29,11 @@ class CommandList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Commands'.format(**self._solution)
+        self._uri = values.ResourceUri('/Commands', self._solution)
 
     def stream(self, sim=values.unset, status=values.unset, direction=values.unset,
-               transport=values.unset, limit=None, page_size=None):
+               transport=values.unset, limit=None, page_size=None,
+               prefetch=None, raw=False, deadline=None):
         """
         Streams CommandInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -49,24 +50,76 @@ class CommandList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.wireless.v1.command.CommandInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
-            sim=sim,
-            status=status,
-            direction=direction,
-            transport=transport,
-            page_size=limits['page_size'],
-        )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                sim=sim,
+                status=status,
+                direction=direction,
+                transport=transport,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, sim=values.unset, status=values.unset, direction=values.unset,
+                           transport=values.unset, limit=None, page_size=None,
+                           prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams CommandInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param unicode sim: The sid or unique_name of the Sim resources to read
+        :param CommandInstance.Status status: The status of the resources to read
+        :param CommandInstance.Direction direction: Only return Commands with this direction value
+        :param CommandInstance.Transport transport: Only return Commands with this transport value
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.wireless.v1.command.CommandInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                sim=sim,
+                status=status,
+                direction=direction,
+                transport=transport,
+                page_size=limits['page_size'],
+            )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, sim=values.unset, status=values.unset, direction=values.unset,
-             transport=values.unset, limit=None, page_size=None):
+             transport=values.unset, limit=None, page_size=None, prefetch=None,
+             raw=False, deadline=None):
         """
         Lists CommandInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -82,6 +135,12 @@ class CommandList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.wireless.v1.command.CommandInstance]
@@ -93,8 +152,51 @@ class CommandList(ListResource):
             transport=transport,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, sim=values.unset, status=values.unset, direction=values.unset,
+                         transport=values.unset, limit=None, page_size=None,
+                         prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists CommandInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param unicode sim: The sid or unique_name of the Sim resources to read
+        :param CommandInstance.Status status: The status of the resources to read
+        :param CommandInstance.Direction direction: Only return Commands with this direction value
+        :param CommandInstance.Transport transport: Only return Commands with this transport value
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.wireless.v1.command.CommandInstance]
+        """
+        return [record async for record in await self.stream_async(
+            sim=sim,
+            status=status,
+            direction=direction,
+            transport=transport,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, sim=values.unset, status=values.unset, direction=values.unset,
              transport=values.unset, page_token=values.unset,
              page_number=values.unset, page_size=values.unset):
@@ -127,6 +229,38 @@ class CommandList(ListResource):
 
         return CommandPage(self._version, response, self._solution)
 
+    async def page_async(self, sim=values.unset, status=values.unset, direction=values.unset,
+                         transport=values.unset, page_token=values.unset,
+                         page_number=values.unset, page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of CommandInstance records from the API.
+        Request is executed immediately
+
+        :param unicode sim: The sid or unique_name of the Sim resources to read
+        :param CommandInstance.Status status: The status of the resources to read
+        :param CommandInstance.Direction direction: Only return Commands with this direction value
+        :param CommandInstance.Transport transport: Only return Commands with this transport value
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of CommandInstance
+        :rtype: twilio.rest.wireless.v1.command.CommandPage
+        """
+        data = values.of({
+            'Sim': sim,
+            'Status': status,
+            'Direction': direction,
+            'Transport': transport,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return CommandPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of CommandInstance records from the API.
@@ -144,9 +278,26 @@ class CommandList(ListResource):
 
         return CommandPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of CommandInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of CommandInstance
+        :rtype: twilio.rest.wireless.v1.command.CommandPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return CommandPage(self._version, response, self._solution)
+
     def create(self, command, sim=values.unset, callback_method=values.unset,
                callback_url=values.unset, command_mode=values.unset,
-               include_sid=values.unset, delivery_receipt_requested=values.unset):
+               include_sid=values.unset, delivery_receipt_requested=values.unset, deadline=None):
         """
         Create the CommandInstance
 
@@ -157,6 +308,42 @@ class CommandList(ListResource):
         :param CommandInstance.CommandMode command_mode: The mode to use when sending the SMS message
         :param unicode include_sid: Whether to include the SID of the command in the message body
         :param bool delivery_receipt_requested: Whether to request delivery receipt from the recipient
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
+
+        :returns: The created CommandInstance
+        :rtype: twilio.rest.wireless.v1.command.CommandInstance
+        """
+        data = values.of({
+            'Command': command,
+            'Sim': sim,
+            'CallbackMethod': callback_method,
+            'CallbackUrl': callback_url,
+            'CommandMode': command_mode,
+            'IncludeSid': include_sid,
+            'DeliveryReceiptRequested': delivery_receipt_requested,
+        })
+
+        payload = self._version.create(method='POST', uri=self._uri, data=data, deadline=deadline, )
+
+        return CommandInstance(self._version, payload, )
+
+    async def create_async(self, command, sim=values.unset, callback_method=values.unset,
+                           callback_url=values.unset, command_mode=values.unset,
+                           include_sid=values.unset, delivery_receipt_requested=values.unset,
+                           deadline=None):
+        """
+        Asynchronous coroutine that creates the CommandInstance
+
+        :param unicode command: The message body of the Command or a Base64 encoded byte string in binary mode
+        :param unicode sim: The sid or unique_name of the SIM to send the Command to
+        :param unicode callback_method: The HTTP method we use to call callback_url
+        :param unicode callback_url: he URL we call when the Command has finished sending
+        :param CommandInstance.CommandMode command_mode: The mode to use when sending the SMS message
+        :param unicode include_sid: Whether to include the SID of the command in the message body
+        :param bool delivery_receipt_requested: Whether to request delivery receipt from the recipient
+        :param float deadline: Seconds from now, or the datetime, by which the record must be
+                               created, retries included.  Default is no deadline
 
         :returns: The created CommandInstance
         :rtype: twilio.rest.wireless.v1.command.CommandInstance
@@ -171,7 +358,7 @@ class CommandList(ListResource):
             'DeliveryReceiptRequested': delivery_receipt_requested,
         })
 
-        payload = self._version.create(method='POST', uri=self._uri, data=data, )
+        payload = await self._version.create_async(method='POST', uri=self._uri, data=data, deadline=deadline, )
 
         return CommandInstance(self._version, payload, )
 
@@ -261,7 +448,7 @@ class CommandContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/Commands/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Commands/{sid}', self._solution)
 
     def fetch(self):
         """
@@ -274,6 +461,17 @@ class CommandContext(InstanceContext):
 
         return CommandInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the CommandInstance
+
+        :returns: The fetched CommandInstance
+        :rtype: twilio.rest.wireless.v1.command.CommandInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return CommandInstance(self._version, payload, sid=self._solution['sid'], )
+
     def delete(self):
         """
         Deletes the CommandInstance
@@ -283,6 +481,15 @@ class CommandContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the CommandInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -315,6 +522,30 @@ class CommandInstance(InstanceResource):
         SMS = "sms"
         IP = "ip"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'account_sid': 'account_sid',
+        'sim_sid': 'sim_sid',
+        'command': 'command',
+        'command_mode': 'command_mode',
+        'transport': 'transport',
+        'delivery_receipt_requested': 'delivery_receipt_requested',
+        'status': 'status',
+        'direction': 'direction',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'url': 'url',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the CommandInstance
@@ -325,20 +556,7 @@ class CommandInstance(InstanceResource):
         super(CommandInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'account_sid': payload.get('account_sid'),
-            'sim_sid': payload.get('sim_sid'),
-            'command': payload.get('command'),
-            'command_mode': payload.get('command_mode'),
-            'transport': payload.get('transport'),
-            'delivery_receipt_requested': payload.get('delivery_receipt_requested'),
-            'status': payload.get('status'),
-            'direction': payload.get('direction'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'url': payload.get('url'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -462,6 +680,15 @@ class CommandInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the CommandInstance
+
+        :returns: The fetched CommandInstance
+        :rtype: twilio.rest.wireless.v1.command.CommandInstance
+        """
+        return await self._proxy.fetch_async()
+
     def delete(self):
         """
         Deletes the CommandInstance
@@ -471,6 +698,15 @@ class CommandInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the CommandInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     def __repr__(self):
         """
         Provide a friendly representation
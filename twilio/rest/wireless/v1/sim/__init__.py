@@ -6,14 +6,14 @@ This code was generated by
       /       /
 """
 
+from importlib import import_module
+
 from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_context import InstanceContext
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
 from twilio.base.page import Page
-from twilio.rest.wireless.v1.sim.data_session import DataSessionList
-from twilio.rest.wireless.v1.sim.usage_record import UsageRecordList
 
 
 class SimList(ListResource):
@@ -31,11 +31,12 @@ class SimList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/Sims'.format(**self._solution)
+        self._uri = values.ResourceUri('/Sims', self._solution)
 
     def stream(self, status=values.unset, iccid=values.unset,
                rate_plan=values.unset, e_id=values.unset,
-               sim_registration_code=values.unset, limit=None, page_size=None):
+               sim_registration_code=values.unset, limit=None, page_size=None,
+               prefetch=None, raw=False, deadline=None):
         """
         Streams SimInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -53,26 +54,80 @@ class SimList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.wireless.v1.sim.SimInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(
-            status=status,
-            iccid=iccid,
-            rate_plan=rate_plan,
-            e_id=e_id,
-            sim_registration_code=sim_registration_code,
-            page_size=limits['page_size'],
-        )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(
+                status=status,
+                iccid=iccid,
+                rate_plan=rate_plan,
+                e_id=e_id,
+                sim_registration_code=sim_registration_code,
+                page_size=limits['page_size'],
+            )
+
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, status=values.unset, iccid=values.unset,
+                           rate_plan=values.unset, e_id=values.unset,
+                           sim_registration_code=values.unset, limit=None, page_size=None,
+                           prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously streams SimInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param SimInstance.Status status: Only return Sim resources with this status
+        :param unicode iccid: Only return Sim resources with this ICCID
+        :param unicode rate_plan: Only return Sim resources assigned to this RatePlan resource
+        :param unicode e_id: Deprecated
+        :param unicode sim_registration_code: Only return Sim resources with this registration code
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.wireless.v1.sim.SimInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(
+                status=status,
+                iccid=iccid,
+                rate_plan=rate_plan,
+                e_id=e_id,
+                sim_registration_code=sim_registration_code,
+                page_size=limits['page_size'],
+            )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, status=values.unset, iccid=values.unset, rate_plan=values.unset,
              e_id=values.unset, sim_registration_code=values.unset, limit=None,
-             page_size=None):
+             page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists SimInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -89,6 +144,12 @@ class SimList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.wireless.v1.sim.SimInstance]
@@ -101,8 +162,53 @@ class SimList(ListResource):
             sim_registration_code=sim_registration_code,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, status=values.unset, iccid=values.unset, rate_plan=values.unset,
+                         e_id=values.unset, sim_registration_code=values.unset, limit=None,
+                         page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists SimInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param SimInstance.Status status: Only return Sim resources with this status
+        :param unicode iccid: Only return Sim resources with this ICCID
+        :param unicode rate_plan: Only return Sim resources assigned to this RatePlan resource
+        :param unicode e_id: Deprecated
+        :param unicode sim_registration_code: Only return Sim resources with this registration code
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.wireless.v1.sim.SimInstance]
+        """
+        return [record async for record in await self.stream_async(
+            status=status,
+            iccid=iccid,
+            rate_plan=rate_plan,
+            e_id=e_id,
+            sim_registration_code=sim_registration_code,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, status=values.unset, iccid=values.unset, rate_plan=values.unset,
              e_id=values.unset, sim_registration_code=values.unset,
              page_token=values.unset, page_number=values.unset,
@@ -138,6 +244,41 @@ class SimList(ListResource):
 
         return SimPage(self._version, response, self._solution)
 
+    async def page_async(self, status=values.unset, iccid=values.unset, rate_plan=values.unset,
+                         e_id=values.unset, sim_registration_code=values.unset,
+                         page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of SimInstance records from the API.
+        Request is executed immediately
+
+        :param SimInstance.Status status: Only return Sim resources with this status
+        :param unicode iccid: Only return Sim resources with this ICCID
+        :param unicode rate_plan: Only return Sim resources assigned to this RatePlan resource
+        :param unicode e_id: Deprecated
+        :param unicode sim_registration_code: Only return Sim resources with this registration code
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of SimInstance
+        :rtype: twilio.rest.wireless.v1.sim.SimPage
+        """
+        data = values.of({
+            'Status': status,
+            'Iccid': iccid,
+            'RatePlan': rate_plan,
+            'EId': e_id,
+            'SimRegistrationCode': sim_registration_code,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return SimPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of SimInstance records from the API.
@@ -155,6 +296,23 @@ class SimList(ListResource):
 
         return SimPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of SimInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of SimInstance
+        :rtype: twilio.rest.wireless.v1.sim.SimPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return SimPage(self._version, response, self._solution)
+
     def get(self, sid):
         """
         Constructs a SimContext
@@ -241,7 +399,7 @@ class SimContext(InstanceContext):
 
         # Path Solution
         self._solution = {'sid': sid, }
-        self._uri = '/Sims/{sid}'.format(**self._solution)
+        self._uri = values.ResourceUri('/Sims/{sid}', self._solution)
 
         # Dependents
         self._usage_records = None
@@ -258,6 +416,17 @@ class SimContext(InstanceContext):
 
         return SimInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the SimInstance
+
+        :returns: The fetched SimInstance
+        :rtype: twilio.rest.wireless.v1.sim.SimInstance
+        """
+        payload = await self._version.fetch_async(method='GET', uri=self._uri, )
+
+        return SimInstance(self._version, payload, sid=self._solution['sid'], )
+
     def update(self, unique_name=values.unset, callback_method=values.unset,
                callback_url=values.unset, friendly_name=values.unset,
                rate_plan=values.unset, status=values.unset,
@@ -318,6 +487,66 @@ class SimContext(InstanceContext):
 
         return SimInstance(self._version, payload, sid=self._solution['sid'], )
 
+    async def update_async(self, unique_name=values.unset, callback_method=values.unset,
+                           callback_url=values.unset, friendly_name=values.unset,
+                           rate_plan=values.unset, status=values.unset,
+                           commands_callback_method=values.unset,
+                           commands_callback_url=values.unset, sms_fallback_method=values.unset,
+                           sms_fallback_url=values.unset, sms_method=values.unset,
+                           sms_url=values.unset, voice_fallback_method=values.unset,
+                           voice_fallback_url=values.unset, voice_method=values.unset,
+                           voice_url=values.unset, reset_status=values.unset,
+                           account_sid=values.unset):
+        """
+        Asynchronous coroutine that updates the SimInstance
+
+        :param unicode unique_name: An application-defined string that uniquely identifies the resource
+        :param unicode callback_method: The HTTP method we should use to call callback_url
+        :param unicode callback_url: The URL we should call when the Sim resource has finished updating
+        :param unicode friendly_name: A string to describe the Sim resource
+        :param unicode rate_plan: The SID or unique name of the RatePlan resource to which the Sim resource should be assigned
+        :param SimInstance.Status status: The new status of the Sim resource
+        :param unicode commands_callback_method: The HTTP method we should use to call commands_callback_url
+        :param unicode commands_callback_url: The URL we should call when the SIM sends a Command
+        :param unicode sms_fallback_method: The HTTP method we should use to call sms_fallback_url
+        :param unicode sms_fallback_url: The URL we should call when an error occurs while retrieving or executing the TwiML requested from sms_url
+        :param unicode sms_method: The HTTP method we should use to call sms_url
+        :param unicode sms_url: The URL we should call when the SIM-connected device sends an SMS message that is not a Command
+        :param unicode voice_fallback_method: Deprecated
+        :param unicode voice_fallback_url: Deprecated
+        :param unicode voice_method: Deprecated
+        :param unicode voice_url: Deprecated
+        :param SimInstance.ResetStatus reset_status: Initiate a connectivity reset on a SIM
+        :param unicode account_sid: The SID of the Account to which the Sim resource should belong
+
+        :returns: The updated SimInstance
+        :rtype: twilio.rest.wireless.v1.sim.SimInstance
+        """
+        data = values.of({
+            'UniqueName': unique_name,
+            'CallbackMethod': callback_method,
+            'CallbackUrl': callback_url,
+            'FriendlyName': friendly_name,
+            'RatePlan': rate_plan,
+            'Status': status,
+            'CommandsCallbackMethod': commands_callback_method,
+            'CommandsCallbackUrl': commands_callback_url,
+            'SmsFallbackMethod': sms_fallback_method,
+            'SmsFallbackUrl': sms_fallback_url,
+            'SmsMethod': sms_method,
+            'SmsUrl': sms_url,
+            'VoiceFallbackMethod': voice_fallback_method,
+            'VoiceFallbackUrl': voice_fallback_url,
+            'VoiceMethod': voice_method,
+            'VoiceUrl': voice_url,
+            'ResetStatus': reset_status,
+            'AccountSid': account_sid,
+        })
+
+        payload = await self._version.update_async(method='POST', uri=self._uri, data=data, )
+
+        return SimInstance(self._version, payload, sid=self._solution['sid'], )
+
     def delete(self):
         """
         Deletes the SimInstance
@@ -327,6 +556,15 @@ class SimContext(InstanceContext):
         """
         return self._version.delete(method='DELETE', uri=self._uri, )
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the SimInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._version.delete_async(method='DELETE', uri=self._uri, )
+
     @property
     def usage_records(self):
         """
@@ -336,6 +574,7 @@ class SimContext(InstanceContext):
         :rtype: twilio.rest.wireless.v1.sim.usage_record.UsageRecordList
         """
         if self._usage_records is None:
+            from twilio.rest.wireless.v1.sim.usage_record import UsageRecordList
             self._usage_records = UsageRecordList(self._version, sim_sid=self._solution['sid'], )
         return self._usage_records
 
@@ -348,6 +587,7 @@ class SimContext(InstanceContext):
         :rtype: twilio.rest.wireless.v1.sim.data_session.DataSessionList
         """
         if self._data_sessions is None:
+            from twilio.rest.wireless.v1.sim.data_session import DataSessionList
             self._data_sessions = DataSessionList(self._version, sim_sid=self._solution['sid'], )
         return self._data_sessions
 
@@ -377,6 +617,42 @@ class SimInstance(InstanceResource):
     class ResetStatus(object):
         RESETTING = "resetting"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'date_created': deserialize.iso8601_datetime,
+        'date_updated': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'unique_name': 'unique_name',
+        'account_sid': 'account_sid',
+        'rate_plan_sid': 'rate_plan_sid',
+        'friendly_name': 'friendly_name',
+        'iccid': 'iccid',
+        'e_id': 'e_id',
+        'status': 'status',
+        'reset_status': 'reset_status',
+        'commands_callback_url': 'commands_callback_url',
+        'commands_callback_method': 'commands_callback_method',
+        'sms_fallback_method': 'sms_fallback_method',
+        'sms_fallback_url': 'sms_fallback_url',
+        'sms_method': 'sms_method',
+        'sms_url': 'sms_url',
+        'voice_fallback_method': 'voice_fallback_method',
+        'voice_fallback_url': 'voice_fallback_url',
+        'voice_method': 'voice_method',
+        'voice_url': 'voice_url',
+        'date_created': 'date_created',
+        'date_updated': 'date_updated',
+        'url': 'url',
+        'links': 'links',
+        'ip_address': 'ip_address',
+    }, _deserializers)
+
     def __init__(self, version, payload, sid=None):
         """
         Initialize the SimInstance
@@ -387,32 +663,7 @@ class SimInstance(InstanceResource):
         super(SimInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'unique_name': payload.get('unique_name'),
-            'account_sid': payload.get('account_sid'),
-            'rate_plan_sid': payload.get('rate_plan_sid'),
-            'friendly_name': payload.get('friendly_name'),
-            'iccid': payload.get('iccid'),
-            'e_id': payload.get('e_id'),
-            'status': payload.get('status'),
-            'reset_status': payload.get('reset_status'),
-            'commands_callback_url': payload.get('commands_callback_url'),
-            'commands_callback_method': payload.get('commands_callback_method'),
-            'sms_fallback_method': payload.get('sms_fallback_method'),
-            'sms_fallback_url': payload.get('sms_fallback_url'),
-            'sms_method': payload.get('sms_method'),
-            'sms_url': payload.get('sms_url'),
-            'voice_fallback_method': payload.get('voice_fallback_method'),
-            'voice_fallback_url': payload.get('voice_fallback_url'),
-            'voice_method': payload.get('voice_method'),
-            'voice_url': payload.get('voice_url'),
-            'date_created': deserialize.iso8601_datetime(payload.get('date_created')),
-            'date_updated': deserialize.iso8601_datetime(payload.get('date_updated')),
-            'url': payload.get('url'),
-            'links': payload.get('links'),
-            'ip_address': payload.get('ip_address'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
@@ -632,6 +883,15 @@ class SimInstance(InstanceResource):
         """
         return self._proxy.fetch()
 
+    async def fetch_async(self):
+        """
+        Asynchronous coroutine that fetches the SimInstance
+
+        :returns: The fetched SimInstance
+        :rtype: twilio.rest.wireless.v1.sim.SimInstance
+        """
+        return await self._proxy.fetch_async()
+
     def update(self, unique_name=values.unset, callback_method=values.unset,
                callback_url=values.unset, friendly_name=values.unset,
                rate_plan=values.unset, status=values.unset,
@@ -688,6 +948,62 @@ class SimInstance(InstanceResource):
             account_sid=account_sid,
         )
 
+    async def update_async(self, unique_name=values.unset, callback_method=values.unset,
+                           callback_url=values.unset, friendly_name=values.unset,
+                           rate_plan=values.unset, status=values.unset,
+                           commands_callback_method=values.unset,
+                           commands_callback_url=values.unset, sms_fallback_method=values.unset,
+                           sms_fallback_url=values.unset, sms_method=values.unset,
+                           sms_url=values.unset, voice_fallback_method=values.unset,
+                           voice_fallback_url=values.unset, voice_method=values.unset,
+                           voice_url=values.unset, reset_status=values.unset,
+                           account_sid=values.unset):
+        """
+        Asynchronous coroutine that updates the SimInstance
+
+        :param unicode unique_name: An application-defined string that uniquely identifies the resource
+        :param unicode callback_method: The HTTP method we should use to call callback_url
+        :param unicode callback_url: The URL we should call when the Sim resource has finished updating
+        :param unicode friendly_name: A string to describe the Sim resource
+        :param unicode rate_plan: The SID or unique name of the RatePlan resource to which the Sim resource should be assigned
+        :param SimInstance.Status status: The new status of the Sim resource
+        :param unicode commands_callback_method: The HTTP method we should use to call commands_callback_url
+        :param unicode commands_callback_url: The URL we should call when the SIM sends a Command
+        :param unicode sms_fallback_method: The HTTP method we should use to call sms_fallback_url
+        :param unicode sms_fallback_url: The URL we should call when an error occurs while retrieving or executing the TwiML requested from sms_url
+        :param unicode sms_method: The HTTP method we should use to call sms_url
+        :param unicode sms_url: The URL we should call when the SIM-connected device sends an SMS message that is not a Command
+        :param unicode voice_fallback_method: Deprecated
+        :param unicode voice_fallback_url: Deprecated
+        :param unicode voice_method: Deprecated
+        :param unicode voice_url: Deprecated
+        :param SimInstance.ResetStatus reset_status: Initiate a connectivity reset on a SIM
+        :param unicode account_sid: The SID of the Account to which the Sim resource should belong
+
+        :returns: The updated SimInstance
+        :rtype: twilio.rest.wireless.v1.sim.SimInstance
+        """
+        return await self._proxy.update_async(
+            unique_name=unique_name,
+            callback_method=callback_method,
+            callback_url=callback_url,
+            friendly_name=friendly_name,
+            rate_plan=rate_plan,
+            status=status,
+            commands_callback_method=commands_callback_method,
+            commands_callback_url=commands_callback_url,
+            sms_fallback_method=sms_fallback_method,
+            sms_fallback_url=sms_fallback_url,
+            sms_method=sms_method,
+            sms_url=sms_url,
+            voice_fallback_method=voice_fallback_method,
+            voice_fallback_url=voice_fallback_url,
+            voice_method=voice_method,
+            voice_url=voice_url,
+            reset_status=reset_status,
+            account_sid=account_sid,
+        )
+
     def delete(self):
         """
         Deletes the SimInstance
@@ -697,6 +1013,15 @@ class SimInstance(InstanceResource):
         """
         return self._proxy.delete()
 
+    async def delete_async(self):
+        """
+        Asynchronous coroutine that deletes the SimInstance
+
+        :returns: True if delete succeeds, False otherwise
+        :rtype: bool
+        """
+        return await self._proxy.delete_async()
+
     @property
     def usage_records(self):
         """
@@ -726,3 +1051,20 @@ class SimInstance(InstanceResource):
         """
         context = ' '.join('{}={}'.format(k, v) for k, v in self._solution.items())
         return '<Twilio.Wireless.V1.SimInstance {}>'.format(context)
+
+
+_LAZY_IMPORTS = {
+    'DataSessionList': 'twilio.rest.wireless.v1.sim.data_session',
+    'UsageRecordList': 'twilio.rest.wireless.v1.sim.usage_record',
+}
+
+
+def __getattr__(name):
+    """
+    Imports the resources of the sub-modules on first use, so importing this module stays cheap
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -29,9 +29,9 @@ class DataSessionList(ListResource):
 
         # Path Solution
         self._solution = {'sim_sid': sim_sid, }
-        self._uri = '/Sims/{sim_sid}/DataSessions'.format(**self._solution)
+        self._uri = values.ResourceUri('/Sims/{sim_sid}/DataSessions', self._solution)
 
-    def stream(self, limit=None, page_size=None):
+    def stream(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams DataSessionInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -44,17 +44,57 @@ class DataSessionList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.wireless.v1.sim.data_session.DataSessionInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
-    def list(self, limit=None, page_size=None):
+    async def stream_async(self, limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams DataSessionInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.wireless.v1.sim.data_session.DataSessionInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    def list(self, limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists DataSessionInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -66,11 +106,42 @@ class DataSessionList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.wireless.v1.sim.data_session.DataSessionInstance]
+        """
+        return list(self.stream(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, ))
+
+    async def list_async(self, limit=None, page_size=None, prefetch=None,
+                         raw=False, deadline=None):
+        """
+        Asynchronously lists DataSessionInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.wireless.v1.sim.data_session.DataSessionInstance]
         """
-        return list(self.stream(limit=limit, page_size=page_size, ))
+        return [record async for record in await self.stream_async(limit=limit, page_size=page_size, prefetch=prefetch, raw=raw, deadline=deadline, )]
 
     def page(self, page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -91,6 +162,25 @@ class DataSessionList(ListResource):
 
         return DataSessionPage(self._version, response, self._solution)
 
+    async def page_async(self, page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of DataSessionInstance records from the API.
+        Request is executed immediately
+
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of DataSessionInstance
+        :rtype: twilio.rest.wireless.v1.sim.data_session.DataSessionPage
+        """
+        data = values.of({'PageToken': page_token, 'Page': page_number, 'PageSize': page_size, })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return DataSessionPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of DataSessionInstance records from the API.
@@ -108,6 +198,23 @@ class DataSessionList(ListResource):
 
         return DataSessionPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of DataSessionInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of DataSessionInstance
+        :rtype: twilio.rest.wireless.v1.sim.data_session.DataSessionPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return DataSessionPage(self._version, response, self._solution)
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -159,6 +266,37 @@ class DataSessionPage(Page):
 
 class DataSessionInstance(InstanceResource):
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Properties deserialized from the payload on first access
+    _deserializers = {
+        'packets_uploaded': deserialize.integer,
+        'packets_downloaded': deserialize.integer,
+        'last_updated': deserialize.iso8601_datetime,
+        'start': deserialize.iso8601_datetime,
+        'end': deserialize.iso8601_datetime,
+    }
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'sid': 'sid',
+        'sim_sid': 'sim_sid',
+        'account_sid': 'account_sid',
+        'radio_link': 'radio_link',
+        'operator_mcc': 'operator_mcc',
+        'operator_mnc': 'operator_mnc',
+        'operator_country': 'operator_country',
+        'operator_name': 'operator_name',
+        'cell_id': 'cell_id',
+        'cell_location_estimate': 'cell_location_estimate',
+        'packets_uploaded': 'packets_uploaded',
+        'packets_downloaded': 'packets_downloaded',
+        'last_updated': 'last_updated',
+        'start': 'start',
+        'end': 'end',
+        'imei': 'imei',
+    }, _deserializers)
+
     def __init__(self, version, payload, sim_sid):
         """
         Initialize the DataSessionInstance
@@ -169,24 +307,7 @@ class DataSessionInstance(InstanceResource):
         super(DataSessionInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'sid': payload.get('sid'),
-            'sim_sid': payload.get('sim_sid'),
-            'account_sid': payload.get('account_sid'),
-            'radio_link': payload.get('radio_link'),
-            'operator_mcc': payload.get('operator_mcc'),
-            'operator_mnc': payload.get('operator_mnc'),
-            'operator_country': payload.get('operator_country'),
-            'operator_name': payload.get('operator_name'),
-            'cell_id': payload.get('cell_id'),
-            'cell_location_estimate': payload.get('cell_location_estimate'),
-            'packets_uploaded': deserialize.integer(payload.get('packets_uploaded')),
-            'packets_downloaded': deserialize.integer(payload.get('packets_downloaded')),
-            'last_updated': deserialize.iso8601_datetime(payload.get('last_updated')),
-            'start': deserialize.iso8601_datetime(payload.get('start')),
-            'end': deserialize.iso8601_datetime(payload.get('end')),
-            'imei': payload.get('imei'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None
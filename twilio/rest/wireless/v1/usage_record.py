@@ -7,6 +7,7 @@ This code was generated by
 """
 
 from twilio.base import serialize
+from twilio.base import deserialize
 from twilio.base import values
 from twilio.base.instance_resource import InstanceResource
 from twilio.base.list_resource import ListResource
@@ -28,10 +29,10 @@ class UsageRecordList(ListResource):
 
         # Path Solution
         self._solution = {}
-        self._uri = '/UsageRecords'.format(**self._solution)
+        self._uri = values.ResourceUri('/UsageRecords', self._solution)
 
     def stream(self, end=values.unset, start=values.unset, granularity=values.unset,
-               limit=None, page_size=None):
+               limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Streams UsageRecordInstance records from the API as a generator stream.
         This operation lazily loads records as efficiently as possible until the limit
@@ -47,18 +48,62 @@ class UsageRecordList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, stream() will attempt to read the
                               limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.wireless.v1.usage_record.UsageRecordInstance]
         """
         limits = self._version.read_limits(limit, page_size)
 
-        page = self.page(end=end, start=start, granularity=granularity, page_size=limits['page_size'], )
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = self.page(end=end, start=start, granularity=granularity, page_size=limits['page_size'], )
 
-        return self._version.stream(page, limits['limit'])
+        return self._version.stream(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
+
+    async def stream_async(self, end=values.unset, start=values.unset, granularity=values.unset,
+                           limit=None, page_size=None, prefetch=None,
+                           raw=False, deadline=None):
+        """
+        Asynchronously streams UsageRecordInstance records from the API as an async generator stream.
+        This operation lazily loads records as efficiently as possible until the limit
+        is reached.
+        The results are returned as an async generator, so this operation is memory efficient.
+
+        :param datetime end: Only include usage that has occurred on or before this date
+        :param datetime start: Only include usage that has occurred on or after this date
+        :param UsageRecordInstance.Granularity granularity: The time-based grouping that results are aggregated by
+        :param int limit: Upper limit for the number of records to return. stream()
+                          guarantees to never return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, stream() will attempt to read the
+                              limit with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Async generator that will yield up to limit results
+        :rtype: list[twilio.rest.wireless.v1.usage_record.UsageRecordInstance]
+        """
+        limits = self._version.read_limits(limit, page_size)
+
+        deadline = self._version.read_deadline(deadline)
+        with deadline:
+            page = await self.page_async(end=end, start=start, granularity=granularity, page_size=limits['page_size'], )
+
+        return self._version.stream_async(page, limits['limit'], prefetch=prefetch, raw=raw, deadline=deadline)
 
     def list(self, end=values.unset, start=values.unset, granularity=values.unset,
-             limit=None, page_size=None):
+             limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
         """
         Lists UsageRecordInstance records from the API as a list.
         Unlike stream(), this operation is eager and will load `limit` records into
@@ -73,6 +118,12 @@ class UsageRecordList(ListResource):
                               the default value of 50 records.  If no page_size is defined
                               but a limit is defined, list() will attempt to read the limit
                               with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
 
         :returns: Generator that will yield up to limit results
         :rtype: list[twilio.rest.wireless.v1.usage_record.UsageRecordInstance]
@@ -83,8 +134,48 @@ class UsageRecordList(ListResource):
             granularity=granularity,
             limit=limit,
             page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
         ))
 
+    async def list_async(self, end=values.unset, start=values.unset, granularity=values.unset,
+                         limit=None, page_size=None, prefetch=None, raw=False, deadline=None):
+        """
+        Asynchronously lists UsageRecordInstance records from the API as a list.
+        Unlike stream(), this operation is eager and will load `limit` records into
+        memory before returning.
+
+        :param datetime end: Only include usage that has occurred on or before this date
+        :param datetime start: Only include usage that has occurred on or after this date
+        :param UsageRecordInstance.Granularity granularity: The time-based grouping that results are aggregated by
+        :param int limit: Upper limit for the number of records to return. list() guarantees
+                          never to return more than limit.  Default is no limit
+        :param int page_size: Number of records to fetch per request, when not set will use
+                              the default value of 50 records.  If no page_size is defined
+                              but a limit is defined, list() will attempt to read the limit
+                              with the most efficient page size, i.e. min(limit, 1000)
+        :param int prefetch: Number of pages to fetch ahead in the background while the
+                             current page is consumed.  Default is no prefetching
+        :param bool raw: Return the JSON-loaded records as dicts instead of instances,
+                         skipping instance construction and deserialization
+        :param float deadline: Seconds from now, or the datetime, by which every page must be
+                               fetched, retries included.  Default is no deadline
+
+        :returns: Generator that will yield up to limit results
+        :rtype: list[twilio.rest.wireless.v1.usage_record.UsageRecordInstance]
+        """
+        return [record async for record in await self.stream_async(
+            end=end,
+            start=start,
+            granularity=granularity,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+            raw=raw,
+            deadline=deadline,
+        )]
+
     def page(self, end=values.unset, start=values.unset, granularity=values.unset,
              page_token=values.unset, page_number=values.unset,
              page_size=values.unset):
@@ -115,6 +206,36 @@ class UsageRecordList(ListResource):
 
         return UsageRecordPage(self._version, response, self._solution)
 
+    async def page_async(self, end=values.unset, start=values.unset, granularity=values.unset,
+                         page_token=values.unset, page_number=values.unset,
+                         page_size=values.unset):
+        """
+        Asynchronously retrieve a single page of UsageRecordInstance records from the API.
+        Request is executed immediately
+
+        :param datetime end: Only include usage that has occurred on or before this date
+        :param datetime start: Only include usage that has occurred on or after this date
+        :param UsageRecordInstance.Granularity granularity: The time-based grouping that results are aggregated by
+        :param str page_token: PageToken provided by the API
+        :param int page_number: Page Number, this value is simply for client state
+        :param int page_size: Number of records to return, defaults to 50
+
+        :returns: Page of UsageRecordInstance
+        :rtype: twilio.rest.wireless.v1.usage_record.UsageRecordPage
+        """
+        data = values.of({
+            'End': serialize.iso8601_datetime(end),
+            'Start': serialize.iso8601_datetime(start),
+            'Granularity': granularity,
+            'PageToken': page_token,
+            'Page': page_number,
+            'PageSize': page_size,
+        })
+
+        response = await self._version.page_async(method='GET', uri=self._uri, params=data, )
+
+        return UsageRecordPage(self._version, response, self._solution)
+
     def get_page(self, target_url):
         """
         Retrieve a specific page of UsageRecordInstance records from the API.
@@ -132,6 +253,23 @@ class UsageRecordList(ListResource):
 
         return UsageRecordPage(self._version, response, self._solution)
 
+    async def get_page_async(self, target_url):
+        """
+        Asynchronously retrieve a specific page of UsageRecordInstance records from the API.
+        Request is executed immediately
+
+        :param str target_url: API-generated URL for the requested results page
+
+        :returns: Page of UsageRecordInstance
+        :rtype: twilio.rest.wireless.v1.usage_record.UsageRecordPage
+        """
+        response = await self._version.domain.twilio.request_async(
+            'GET',
+            target_url,
+        )
+
+        return UsageRecordPage(self._version, response, self._solution)
+
     def __repr__(self):
         """
         Provide a friendly representation
@@ -187,6 +325,16 @@ class UsageRecordInstance(InstanceResource):
         DAILY = "daily"
         ALL = "all"
 
+    __slots__ = ('_properties', '_context', '_solution')
+
+    # Marshaled Properties, mapped to their payload keys
+    _schema = deserialize.Schema({
+        'account_sid': 'account_sid',
+        'period': 'period',
+        'commands': 'commands',
+        'data': 'data',
+    })
+
     def __init__(self, version, payload):
         """
         Initialize the UsageRecordInstance
@@ -197,12 +345,7 @@ class UsageRecordInstance(InstanceResource):
         super(UsageRecordInstance, self).__init__(version)
 
         # Marshaled Properties
-        self._properties = {
-            'account_sid': payload.get('account_sid'),
-            'period': payload.get('period'),
-            'commands': payload.get('commands'),
-            'data': payload.get('data'),
-        }
+        self._properties = self._schema.load(payload)
 
         # Context
         self._context = None